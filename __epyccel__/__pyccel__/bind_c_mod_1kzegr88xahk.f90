@@ -0,0 +1,41 @@
+module bind_c_mod_1kzegr88xahk
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , i64 => C_INT64_T &
+        , f64 => C_DOUBLE , c_ptr
+  use mod_1kzegr88xahk
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_array_float_2d_1d_matmul_creation(bound_A, &
+        bound_A_shape_1, bound_A_shape_2, bound_A_stride_1, &
+        bound_A_stride_2, bound_x, bound_x_shape_1, bound_x_stride_1) &
+        bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    type(c_ptr), value :: bound_A
+    integer(i64), value :: bound_A_shape_1
+    integer(i64), value :: bound_A_shape_2
+    integer(i64), value :: bound_A_stride_1
+    integer(i64), value :: bound_A_stride_2
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    real(f64), pointer :: A(:, :)
+    real(f64), pointer :: x(:)
+
+    call C_F_Pointer(bound_A, A, [bound_A_shape_2 * bound_A_stride_2, &
+          bound_A_shape_1 * bound_A_stride_1])
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    Out_0001 = array_float_2d_1d_matmul_creation(A = A(1_i64:: &
+          bound_A_stride_2, 1_i64::bound_A_stride_1), x = x(1_i64:: &
+          bound_x_stride_1))
+
+  end function bind_c_array_float_2d_1d_matmul_creation
+  !........................................
+
+end module bind_c_mod_1kzegr88xahk
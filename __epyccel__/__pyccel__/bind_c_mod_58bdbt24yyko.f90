@@ -0,0 +1,43 @@
+module bind_c_mod_58bdbt24yyko
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , f64 => C_DOUBLE , &
+        C_F_Pointer , i64 => C_INT64_T
+  use mod_58bdbt24yyko
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_axpy(a, bound_x, bound_x_shape_1, bound_x_shape_2, &
+        bound_x_stride_1, bound_x_stride_2, bound_y, bound_y_shape_1, &
+        bound_y_shape_2, bound_y_stride_1, bound_y_stride_2) bind(c)
+
+    implicit none
+
+    real(f64), value :: a
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_shape_2
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: bound_x_stride_2
+    type(c_ptr), value :: bound_y
+    integer(i64), value :: bound_y_shape_1
+    integer(i64), value :: bound_y_shape_2
+    integer(i64), value :: bound_y_stride_1
+    integer(i64), value :: bound_y_stride_2
+    real(f64), pointer :: x(:, :)
+    real(f64), pointer :: y(:, :)
+
+    call C_F_Pointer(bound_x, x, [bound_x_stride_2,bound_x_shape_2])
+    call C_F_Pointer(bound_y, y, [bound_y_stride_2,bound_y_shape_2])
+    call axpy(a = a, x = x(1_i64:bound_x_shape_1 * bound_x_stride_1 + &
+          1_i64 - 1_i64:bound_x_stride_1, 1_i64:bound_x_shape_2 + 1_i64 &
+          - 1_i64), y = y(1_i64:bound_y_shape_1 * bound_y_stride_1 + &
+          1_i64 - 1_i64:bound_y_stride_1, 1_i64:bound_y_shape_2 + 1_i64 &
+          - 1_i64))
+
+  end subroutine bind_c_axpy
+  !........................................
+
+end module bind_c_mod_58bdbt24yyko
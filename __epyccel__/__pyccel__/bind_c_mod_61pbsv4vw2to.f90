@@ -0,0 +1,40 @@
+module bind_c_mod_61pbsv4vw2to
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c_ptr , &
+        C_F_Pointer , f64 => C_DOUBLE
+  use mod_61pbsv4vw2to
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_sqrt_step2(bound_t, bound_t_shape_1, &
+        bound_t_stride_1, bound_c, bound_c_shape_1, bound_c_stride_1, &
+        bound_u, bound_u_shape_1, bound_u_stride_1) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_t
+    integer(i64), value :: bound_t_shape_1
+    integer(i64), value :: bound_t_stride_1
+    type(c_ptr), value :: bound_c
+    integer(i64), value :: bound_c_shape_1
+    integer(i64), value :: bound_c_stride_1
+    type(c_ptr), value :: bound_u
+    integer(i64), value :: bound_u_shape_1
+    integer(i64), value :: bound_u_stride_1
+    real(f64), pointer :: t(:)
+    real(f64), pointer :: c(:)
+    real(f64), pointer :: u(:)
+
+    call C_F_Pointer(bound_t, t, [bound_t_shape_1 * bound_t_stride_1])
+    call C_F_Pointer(bound_c, c, [bound_c_shape_1 * bound_c_stride_1])
+    call C_F_Pointer(bound_u, u, [bound_u_shape_1 * bound_u_stride_1])
+    call sqrt_step2(t = t(1_i64::bound_t_stride_1), c = c(1_i64:: &
+          bound_c_stride_1), u = u(1_i64::bound_u_stride_1))
+
+  end subroutine bind_c_sqrt_step2
+  !........................................
+
+end module bind_c_mod_61pbsv4vw2to
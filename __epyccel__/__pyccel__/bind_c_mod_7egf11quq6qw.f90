@@ -0,0 +1,35 @@
+module bind_c_mod_7egf11quq6qw
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c_ptr , &
+        C_F_Pointer , f64 => C_DOUBLE
+  use mod_7egf11quq6qw
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_sqrt_step3(bound_u, bound_u_shape_1, &
+        bound_u_stride_1, bound_v, bound_v_shape_1, bound_v_stride_1) &
+        bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_u
+    integer(i64), value :: bound_u_shape_1
+    integer(i64), value :: bound_u_stride_1
+    type(c_ptr), value :: bound_v
+    integer(i64), value :: bound_v_shape_1
+    integer(i64), value :: bound_v_stride_1
+    real(f64), pointer :: u(:)
+    real(f64), pointer :: v(:)
+
+    call C_F_Pointer(bound_u, u, [bound_u_shape_1 * bound_u_stride_1])
+    call C_F_Pointer(bound_v, v, [bound_v_shape_1 * bound_v_stride_1])
+    call sqrt_step3(u = u(1_i64::bound_u_stride_1), v = v(1_i64:: &
+          bound_v_stride_1))
+
+  end subroutine bind_c_sqrt_step3
+  !........................................
+
+end module bind_c_mod_7egf11quq6qw
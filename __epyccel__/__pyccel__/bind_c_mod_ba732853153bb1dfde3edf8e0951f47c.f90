@@ -0,0 +1,23 @@
+module bind_c_mod_ba732853153bb1dfde3edf8e0951f47c
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_ba732853153bb1dfde3edf8e0951f47c
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_mul_three(x) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: x
+
+    Out_0001 = mul_three(x = x)
+
+  end function bind_c_mul_three
+  !........................................
+
+end module bind_c_mod_ba732853153bb1dfde3edf8e0951f47c
@@ -0,0 +1,44 @@
+module bind_c_mod_dw329zpvz2cf
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c_ptr , &
+        C_F_Pointer , f64 => C_DOUBLE
+  use mod_dw329zpvz2cf
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_axpby_fused(bound_x, bound_x_shape_1, &
+        bound_x_stride_1, bound_y, bound_y_shape_1, bound_y_stride_1, &
+        bound_z, bound_z_shape_1, bound_z_stride_1, alpha, beta) bind(c &
+        )
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    type(c_ptr), value :: bound_y
+    integer(i64), value :: bound_y_shape_1
+    integer(i64), value :: bound_y_stride_1
+    type(c_ptr), value :: bound_z
+    integer(i64), value :: bound_z_shape_1
+    integer(i64), value :: bound_z_stride_1
+    real(f64), value :: alpha
+    real(f64), value :: beta
+    real(f64), pointer :: x(:)
+    real(f64), pointer :: y(:)
+    real(f64), pointer :: z(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call C_F_Pointer(bound_y, y, [bound_y_shape_1 * bound_y_stride_1])
+    call C_F_Pointer(bound_z, z, [bound_z_shape_1 * bound_z_stride_1])
+    call axpby_fused(x = x(1_i64::bound_x_stride_1), y = y(1_i64:: &
+          bound_y_stride_1), z = z(1_i64::bound_z_stride_1), alpha = &
+          alpha, beta = beta)
+
+  end subroutine bind_c_axpby_fused
+  !........................................
+
+end module bind_c_mod_dw329zpvz2cf
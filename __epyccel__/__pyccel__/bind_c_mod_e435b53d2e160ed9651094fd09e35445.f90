@@ -0,0 +1,23 @@
+module bind_c_mod_e435b53d2e160ed9651094fd09e35445
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_e435b53d2e160ed9651094fd09e35445
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_add_one(x) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: x
+
+    Out_0001 = add_one(x = x)
+
+  end function bind_c_add_one
+  !........................................
+
+end module bind_c_mod_e435b53d2e160ed9651094fd09e35445
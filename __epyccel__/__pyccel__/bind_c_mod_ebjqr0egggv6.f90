@@ -0,0 +1,36 @@
+module bind_c_mod_ebjqr0egggv6
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c_ptr , &
+        C_F_Pointer , f64 => C_DOUBLE
+  use mod_ebjqr0egggv6
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_axpby_step1(bound_x, bound_x_shape_1, &
+        bound_x_stride_1, bound_t, bound_t_shape_1, bound_t_stride_1, &
+        alpha) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    type(c_ptr), value :: bound_t
+    integer(i64), value :: bound_t_shape_1
+    integer(i64), value :: bound_t_stride_1
+    real(f64), value :: alpha
+    real(f64), pointer :: x(:)
+    real(f64), pointer :: t(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call C_F_Pointer(bound_t, t, [bound_t_shape_1 * bound_t_stride_1])
+    call axpby_step1(x = x(1_i64::bound_x_stride_1), t = t(1_i64:: &
+          bound_t_stride_1), alpha = alpha)
+
+  end subroutine bind_c_axpby_step1
+  !........................................
+
+end module bind_c_mod_ebjqr0egggv6
@@ -0,0 +1,29 @@
+module bind_c_mod_h100fo3exsa9
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , C_F_Pointer &
+        , c_ptr , f64 => C_DOUBLE
+  use mod_h100fo3exsa9
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_first(bound_x, bound_x_shape_1, bound_x_stride_1) bind &
+        (c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    real(f64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    Out_0001 = first(x = x(1_i64::bound_x_stride_1))
+
+  end function bind_c_first
+  !........................................
+
+end module bind_c_mod_h100fo3exsa9
@@ -0,0 +1,45 @@
+module bind_c_mod_kwuay0uzl8jk
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , f64 => C_DOUBLE &
+        , c_ptr , i64 => C_INT64_T
+  use mod_kwuay0uzl8jk
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_matvec(bound_a, bound_a_shape_1, bound_a_shape_2, &
+        bound_a_stride_1, bound_a_stride_2, bound_x, bound_x_shape_1, &
+        bound_x_stride_1, bound_y, bound_y_shape_1, bound_y_stride_1) &
+        bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_shape_2
+    integer(i64), value :: bound_a_stride_1
+    integer(i64), value :: bound_a_stride_2
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    type(c_ptr), value :: bound_y
+    integer(i64), value :: bound_y_shape_1
+    integer(i64), value :: bound_y_stride_1
+    real(f64), pointer :: a(:, :)
+    real(f64), pointer :: x(:)
+    real(f64), pointer :: y(:)
+
+    call C_F_Pointer(bound_a, a, [bound_a_shape_1 * bound_a_stride_1, &
+          bound_a_shape_2 * bound_a_stride_2])
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call C_F_Pointer(bound_y, y, [bound_y_shape_1 * bound_y_stride_1])
+    call matvec(a = a(1_i64::bound_a_stride_1, 1_i64::bound_a_stride_2), &
+          x = x(1_i64::bound_x_stride_1), y = y(1_i64::bound_y_stride_1 &
+          ))
+
+  end subroutine bind_c_matvec
+  !........................................
+
+end module bind_c_mod_kwuay0uzl8jk
@@ -0,0 +1,40 @@
+module bind_c_mod_mppzdvwa69b0
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c_ptr , &
+        C_F_Pointer , f64 => C_DOUBLE
+  use mod_mppzdvwa69b0
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_sqrt_step1(bound_a, bound_a_shape_1, &
+        bound_a_stride_1, bound_b, bound_b_shape_1, bound_b_stride_1, &
+        bound_t, bound_t_shape_1, bound_t_stride_1) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_stride_1
+    type(c_ptr), value :: bound_b
+    integer(i64), value :: bound_b_shape_1
+    integer(i64), value :: bound_b_stride_1
+    type(c_ptr), value :: bound_t
+    integer(i64), value :: bound_t_shape_1
+    integer(i64), value :: bound_t_stride_1
+    real(f64), pointer :: a(:)
+    real(f64), pointer :: b(:)
+    real(f64), pointer :: t(:)
+
+    call C_F_Pointer(bound_a, a, [bound_a_shape_1 * bound_a_stride_1])
+    call C_F_Pointer(bound_b, b, [bound_b_shape_1 * bound_b_stride_1])
+    call C_F_Pointer(bound_t, t, [bound_t_shape_1 * bound_t_stride_1])
+    call sqrt_step1(a = a(1_i64::bound_a_stride_1), b = b(1_i64:: &
+          bound_b_stride_1), t = t(1_i64::bound_t_stride_1))
+
+  end subroutine bind_c_sqrt_step1
+  !........................................
+
+end module bind_c_mod_mppzdvwa69b0
@@ -0,0 +1,47 @@
+module bind_c_mod_rvu7p66bnbxf
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c_ptr , &
+        C_F_Pointer , f64 => C_DOUBLE
+  use mod_rvu7p66bnbxf
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_sqrt_fused(bound_a, bound_a_shape_1, &
+        bound_a_stride_1, bound_b, bound_b_shape_1, bound_b_stride_1, &
+        bound_c, bound_c_shape_1, bound_c_stride_1, bound_v, &
+        bound_v_shape_1, bound_v_stride_1) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_stride_1
+    type(c_ptr), value :: bound_b
+    integer(i64), value :: bound_b_shape_1
+    integer(i64), value :: bound_b_stride_1
+    type(c_ptr), value :: bound_c
+    integer(i64), value :: bound_c_shape_1
+    integer(i64), value :: bound_c_stride_1
+    type(c_ptr), value :: bound_v
+    integer(i64), value :: bound_v_shape_1
+    integer(i64), value :: bound_v_stride_1
+    real(f64), pointer :: a(:)
+    real(f64), pointer :: b(:)
+    real(f64), pointer :: c(:)
+    real(f64), pointer :: v(:)
+
+    call C_F_Pointer(bound_a, a, [bound_a_shape_1 * bound_a_stride_1])
+    call C_F_Pointer(bound_b, b, [bound_b_shape_1 * bound_b_stride_1])
+    call C_F_Pointer(bound_c, c, [bound_c_shape_1 * bound_c_stride_1])
+    call C_F_Pointer(bound_v, v, [bound_v_shape_1 * bound_v_stride_1])
+    call sqrt_fused(a = a(1_i64::bound_a_stride_1), b = b(1_i64:: &
+          bound_b_stride_1), c = c(1_i64::bound_c_stride_1), v = v( &
+          1_i64::bound_v_stride_1))
+
+  end subroutine bind_c_sqrt_fused
+  !........................................
+
+end module bind_c_mod_rvu7p66bnbxf
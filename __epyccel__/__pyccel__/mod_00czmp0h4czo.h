@@ -0,0 +1,12 @@
+#ifndef MOD_00CZMP0H4CZO_H
+#define MOD_00CZMP0H4CZO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int32_t create_ones_like_val_int32(void);
+#endif // mod_00czmp0h4czo_H
@@ -0,0 +1,11 @@
+#ifndef MOD_01E7T051Y9TW_H
+#define MOD_01E7T051Y9TW_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_01e7t051y9tw_H
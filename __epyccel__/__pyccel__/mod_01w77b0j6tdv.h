@@ -0,0 +1,11 @@
+#ifndef MOD_01W77B0J6TDV_H
+#define MOD_01W77B0J6TDV_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_ancestor_thread_num(void);
+#endif // mod_01w77b0j6tdv_H
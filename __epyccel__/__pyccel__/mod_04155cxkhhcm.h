@@ -0,0 +1,12 @@
+#ifndef MOD_04155CXKHHCM_H
+#define MOD_04155CXKHHCM_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t iterate_slice(int64_t i);
+#endif // mod_04155cxkhhcm_H
@@ -0,0 +1,11 @@
+#ifndef MOD_045RQOWTIQ3Q_H
+#define MOD_045RQOWTIQ3Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_045rqowtiq3q_H
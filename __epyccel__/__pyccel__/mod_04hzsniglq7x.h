@@ -0,0 +1,11 @@
+#ifndef MOD_04HZSNIGLQ7X_H
+#define MOD_04HZSNIGLQ7X_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void double_loop_on_2d_array_C(t_ndarray z);
+#endif // mod_04hzsniglq7x_H
@@ -0,0 +1,12 @@
+#ifndef MOD_04LHRCWY5282_H
+#define MOD_04LHRCWY5282_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuples_mul_homogeneous3(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_04lhrcwy5282_H
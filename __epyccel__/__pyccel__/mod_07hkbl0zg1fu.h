@@ -0,0 +1,11 @@
+#ifndef MOD_07HKBL0ZG1FU_H
+#define MOD_07HKBL0ZG1FU_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_07hkbl0zg1fu_H
@@ -0,0 +1,11 @@
+#ifndef MOD_08ZG7ILPBPNJ_H
+#define MOD_08ZG7ILPBPNJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_08zg7ilpbpnj_H
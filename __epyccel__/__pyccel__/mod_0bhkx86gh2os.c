@@ -0,0 +1,10 @@
+#include "mod_0bhkx86gh2os.h"
+
+
+/*........................................*/
+void f(void)
+{
+    printf("hidden\n");
+}
+/*........................................*/
+
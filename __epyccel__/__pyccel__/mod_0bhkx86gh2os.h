@@ -0,0 +1,11 @@
+#ifndef MOD_0BHKX86GH2OS_H
+#define MOD_0BHKX86GH2OS_H
+
+#include <inttypes.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+
+
+void f(void);
+#endif // mod_0bhkx86gh2os_H
@@ -0,0 +1,11 @@
+#ifndef MOD_0FCGEPFRQR6Y_H
+#define MOD_0FCGEPFRQR6Y_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray arr_tuple_slice_index(t_ndarray a);
+#endif // mod_0fcgepfrqr6y_H
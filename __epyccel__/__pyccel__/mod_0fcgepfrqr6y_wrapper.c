@@ -0,0 +1,93 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_0FCGEPFRQR6Y_WRAPPER
+
+#include "mod_0fcgepfrqr6y_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* arr_tuple_slice_index_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray r = {.raw_data = NULL};
+    PyObject* r_obj;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    r = arr_tuple_slice_index(a);
+    free_pointer(&a);
+    r_obj = ndarray_to_pyarray(r);
+    free_pointer(&r);
+    return r_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_0fcgepfrqr6y_methods[] = {
+    {
+        "arr_tuple_slice_index",
+        (PyCFunction)arr_tuple_slice_index_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_0fcgepfrqr6y_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_0fcgepfrqr6y",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_0fcgepfrqr6y_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_0fcgepfrqr6y(void)
+{
+    PyObject* mod;
+    static void* Pymod_0fcgepfrqr6y_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_0fcgepfrqr6y_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_0fcgepfrqr6y_API, "mod_0fcgepfrqr6y._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
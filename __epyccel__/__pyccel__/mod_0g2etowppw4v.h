@@ -0,0 +1,12 @@
+#ifndef MOD_0G2ETOWPPW4V_H
+#define MOD_0G2ETOWPPW4V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_like_shape_1d(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_0g2etowppw4v_H
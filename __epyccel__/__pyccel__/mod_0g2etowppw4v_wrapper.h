@@ -0,0 +1,40 @@
+#ifndef MOD_0G2ETOWPPW4V_WRAPPER_H
+#define MOD_0G2ETOWPPW4V_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_0g2etowppw4v.h"
+
+
+#ifdef MOD_0G2ETOWPPW4V_WRAPPER
+
+
+#else
+
+static void** Pymod_0g2etowppw4v_API;
+
+
+/*........................................*/
+static int mod_0g2etowppw4v_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_0g2etowppw4v_API = (void**)PyCapsule_Import("mod_0g2etowppw4v._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_0g2etowppw4v_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_0G2ETOWPPW4V_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_0HV3Q5L5MIQI_H
+#define MOD_0HV3Q5L5MIQI_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_flush(void);
+#endif // mod_0hv3q5l5miqi_H
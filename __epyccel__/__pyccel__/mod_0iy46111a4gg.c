@@ -0,0 +1,31 @@
+#include "mod_0iy46111a4gg.h"
+
+
+/*........................................*/
+int64_t f(bool b)
+{
+    int64_t array_dummy[INT64_C(3)];
+    t_ndarray x = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(3)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t Out_0001;
+    if (b)
+    {
+        int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+        memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 3 * x.type_size);
+    }
+    else
+    {
+        int64_t Dummy_0001[] = {INT64_C(4), INT64_C(5), INT64_C(6)};
+        memcpy(&x.nd_int64[INT64_C(0)], Dummy_0001, 3 * x.type_size);
+    }
+    Out_0001 = x.nd_int64[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+
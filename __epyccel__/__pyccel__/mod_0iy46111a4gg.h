@@ -0,0 +1,13 @@
+#ifndef MOD_0IY46111A4GG_H
+#define MOD_0IY46111A4GG_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t f(bool b);
+#endif // mod_0iy46111a4gg_H
@@ -0,0 +1,22 @@
+#include "mod_0jgx42uvf9ql.h"
+
+
+/*........................................*/
+void sqrt_fused(t_ndarray a, t_ndarray b, t_ndarray c, t_ndarray v)
+{
+    t_ndarray t = {.raw_data = NULL};
+    t_ndarray u = {.raw_data = NULL};
+    int64_t i;
+    double t_0001;
+    double u_0001;
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        t_0001 = GET_ELEMENT(a, nd_double, i) * GET_ELEMENT(b, nd_double, i);
+        u_0001 = t_0001 + GET_ELEMENT(c, nd_double, i);
+        GET_ELEMENT(v, nd_double, i) = sqrt(u_0001);
+    }
+    free_array(&t);
+    free_array(&u);
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_0JGX42UVF9QL_H
+#define MOD_0JGX42UVF9QL_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void sqrt_fused(t_ndarray a, t_ndarray b, t_ndarray c, t_ndarray v);
+#endif // mod_0jgx42uvf9ql_H
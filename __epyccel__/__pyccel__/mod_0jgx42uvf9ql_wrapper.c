@@ -0,0 +1,126 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_0JGX42UVF9QL_WRAPPER
+
+#include "mod_0jgx42uvf9ql_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* sqrt_fused_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    PyObject* c_obj;
+    PyObject* v_obj;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray v = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        "c",
+        "v",
+        NULL
+    };
+    static PyObject* kwlist_interned[5] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 4, 4, &a_obj, &b_obj, &c_obj, &v_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("b", b_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        b = pyarray_to_ndarray(b_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("c", c_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        c = pyarray_to_ndarray(c_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("v", v_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        v = pyarray_to_ndarray(v_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    sqrt_fused(a, b, c, v);
+    free_pointer(&a);
+    free_pointer(&b);
+    free_pointer(&c);
+    free_pointer(&v);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_0jgx42uvf9ql_methods[] = {
+    {
+        "sqrt_fused",
+        (PyCFunction)sqrt_fused_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_0jgx42uvf9ql_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_0jgx42uvf9ql",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_0jgx42uvf9ql_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_0jgx42uvf9ql(void)
+{
+    PyObject* mod;
+    static void* Pymod_0jgx42uvf9ql_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_0jgx42uvf9ql_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_0jgx42uvf9ql_API, "mod_0jgx42uvf9ql._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,13 @@
+#ifndef MOD_0K2AOGVQDEPW_H
+#define MOD_0K2AOGVQDEPW_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_mod(t_ndarray x, t_ndarray y);
+#endif // mod_0k2aogvqdepw_H
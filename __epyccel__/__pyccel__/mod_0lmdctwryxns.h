@@ -0,0 +1,11 @@
+#ifndef MOD_0LMDCTWRYXNS_H
+#define MOD_0LMDCTWRYXNS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_2(t_ndarray a, t_ndarray b);
+#endif // mod_0lmdctwryxns_H
@@ -0,0 +1,39 @@
+#include "mod_0lpyhrd4w5vy.h"
+
+
+/*........................................*/
+int64_t arrs_2d_different_shapes_0(int64_t* Out_0001, int64_t* Out_0002)
+{
+    t_ndarray pn = {.raw_data = NULL};
+    t_ndarray pm = {.raw_data = NULL};
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    pn = array_create(2, (int64_t[]){INT64_C(4), INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&pn.nd_int64[INT64_C(0)], Dummy_0000, 12 * pn.type_size);
+    pm = array_create(2, (int64_t[]){INT64_C(1), INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(1), INT64_C(1)};
+    memcpy(&pm.nd_int64[INT64_C(0)], Dummy_0001, 3 * pm.type_size);
+    x = array_create(2, (int64_t[]){INT64_C(4), INT64_C(3)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict pm_data = pm.nd_int64;
+        int64_t* restrict pn_data = pn.nd_int64;
+        int64_t* restrict x_data = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(4); i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < INT64_C(3); i_0001 += INT64_C(1))
+            {
+                x_data[i * x.shape[INT64_C(1)] + i_0001] = pn_data[i * pn.shape[INT64_C(1)] + i_0001] + pm_data[i_0001];
+            }
+        }
+    }
+    (*Out_0001) = INT64_C(4);
+    (*Out_0002) = INT64_C(3);
+    free_array(&pm);
+    free_array(&pn);
+    free_array(&x);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_0LPYHRD4W5VY_H
+#define MOD_0LPYHRD4W5VY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t arrs_2d_different_shapes_0(int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_0lpyhrd4w5vy_H
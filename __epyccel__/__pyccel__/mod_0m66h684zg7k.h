@@ -0,0 +1,11 @@
+#ifndef MOD_0M66H684ZG7K_H
+#define MOD_0M66H684ZG7K_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_0m66h684zg7k_H
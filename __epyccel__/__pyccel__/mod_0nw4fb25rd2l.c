@@ -0,0 +1,21 @@
+#include "mod_0nw4fb25rd2l.h"
+
+
+/*........................................*/
+float complex create_zeros_like_val_complex64_auto(void)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    float complex Out_0001;
+    arr = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    float complex Dummy_0000[] = {INT64_C(5), INT64_C(1), INT64_C(8), INT64_C(0), INT64_C(9)};
+    memcpy(&arr.nd_cfloat[INT64_C(0)], Dummy_0000, 5 * arr.type_size);
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    array_fill((float complex)(0.0f * _Complex_I), a);
+    Out_0001 = a.nd_cfloat[INT64_C(0)];
+    free_array(&a);
+    free_array(&arr);
+    return Out_0001;
+}
+/*........................................*/
+
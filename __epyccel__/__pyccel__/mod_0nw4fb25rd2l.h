@@ -0,0 +1,13 @@
+#ifndef MOD_0NW4FB25RD2L_H
+#define MOD_0NW4FB25RD2L_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float complex create_zeros_like_val_complex64_auto(void);
+#endif // mod_0nw4fb25rd2l_H
@@ -0,0 +1,46 @@
+#include "mod_0ou89fg9ni1x.h"
+
+
+/*........................................*/
+int64_t omp_sections(void)
+{
+    int64_t n;
+    int64_t sum1;
+    int64_t sum2;
+    int64_t sum3;
+    int64_t i;
+    n = INT64_C(8);
+    sum1 = INT64_C(0);
+    sum2 = INT64_C(0);
+    sum3 = INT64_C(0);
+    #pragma omp parallel num_threads(2)
+    {
+        #pragma omp sections
+        {
+            #pragma omp section
+            {
+                for (i = INT64_C(0); i < (int64_t)((double)(n) / 3.0); i += INT64_C(1))
+                {
+                    sum1 = sum1 + i;
+                }
+            }
+            #pragma omp section
+            {
+                for (i = INT64_C(0); i < (int64_t)((double)(n) / 2.0); i += INT64_C(1))
+                {
+                    sum2 = sum2 + i;
+                }
+            }
+            #pragma omp section
+            {
+                for (i = INT64_C(0); i < n; i += INT64_C(1))
+                {
+                    sum3 = sum3 + i;
+                }
+            }
+        }
+    }
+    return sum1 + sum2 + sum3;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_0OU89FG9NI1X_H
+#define MOD_0OU89FG9NI1X_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_sections(void);
+#endif // mod_0ou89fg9ni1x_H
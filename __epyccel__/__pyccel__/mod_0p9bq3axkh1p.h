@@ -0,0 +1,12 @@
+#ifndef MOD_0P9BQ3AXKH1P_H
+#define MOD_0P9BQ3AXKH1P_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_full_val(bool val, bool* Out_0001, bool* Out_0002, bool* Out_0003);
+#endif // mod_0p9bq3axkh1p_H
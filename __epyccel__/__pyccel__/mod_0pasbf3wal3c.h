@@ -0,0 +1,11 @@
+#ifndef MOD_0PASBF3WAL3C_H
+#define MOD_0PASBF3WAL3C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_0pasbf3wal3c_H
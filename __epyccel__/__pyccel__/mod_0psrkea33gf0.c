@@ -0,0 +1,40 @@
+#include "mod_0psrkea33gf0.h"
+
+
+/*........................................*/
+int64_t reassigned_pointer_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){INT64_C(10)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6), INT64_C(7), INT64_C(8), INT64_C(9), INT64_C(10)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 10 * a.type_size);
+    b = array_create(1, (int64_t[]){INT64_C(9)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6), INT64_C(7), INT64_C(8), INT64_C(9)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0001, 9 * b.type_size);
+    alias_assign(&c, a);
+    free_pointer(&c);
+    c = array_slicing(a, 1, new_slice(INT64_C(1), a.shape[INT64_C(0)], INT64_C(1), RANGE));
+    d = array_create(1, (int64_t[]){INT64_C(9)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict b_data = b.nd_int64;
+        int64_t* restrict d_data = d.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(9); i += INT64_C(1))
+        {
+            d_data[i] = c.nd_int64[i] * b_data[i];
+        }
+    }
+    (*Out_0001) = INT64_C(9);
+    (*Out_0002) = d.nd_int64[INT64_C(0)];
+    (*Out_0003) = d.nd_int64[INT64_C(5)];
+    free_pointer(&c);
+    free_array(&d);
+    free_array(&a);
+    free_array(&b);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_0PSRKEA33GF0_H
+#define MOD_0PSRKEA33GF0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t reassigned_pointer_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_0psrkea33gf0_H
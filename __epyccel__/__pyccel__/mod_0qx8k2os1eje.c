@@ -0,0 +1,28 @@
+#include "mod_0qx8k2os1eje.h"
+
+
+/*........................................*/
+int64_t multi_tmplt_1_0000(int64_t x, int64_t y, int64_t z)
+{
+    return x + y + z;
+}
+/*........................................*/
+/*........................................*/
+double multi_tmplt_1_0001(int64_t x, int64_t y, double z)
+{
+    return x + y + z;
+}
+/*........................................*/
+/*........................................*/
+double multi_tmplt_1_0002(double x, double y, int64_t z)
+{
+    return x + y + z;
+}
+/*........................................*/
+/*........................................*/
+double multi_tmplt_1_0003(double x, double y, double z)
+{
+    return x + y + z;
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_0QX8K2OS1EJE_H
+#define MOD_0QX8K2OS1EJE_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t multi_tmplt_1_0000(int64_t x, int64_t y, int64_t z);
+double multi_tmplt_1_0001(int64_t x, int64_t y, double z);
+double multi_tmplt_1_0002(double x, double y, int64_t z);
+double multi_tmplt_1_0003(double x, double y, double z);
+#endif // mod_0qx8k2os1eje_H
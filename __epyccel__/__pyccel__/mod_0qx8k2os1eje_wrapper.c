@@ -0,0 +1,223 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_0QX8K2OS1EJE_WRAPPER
+
+#include "mod_0qx8k2os1eje_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* multi_tmplt_1_0000_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    int64_t x;
+    int64_t y;
+    int64_t z;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt64_to_Int64(x_obj);
+    y = PyInt64_to_Int64(y_obj);
+    z = PyInt64_to_Int64(z_obj);
+    Out_0001 = multi_tmplt_1_0000(x, y, z);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* multi_tmplt_1_0001_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    int64_t x;
+    int64_t y;
+    double z;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt64_to_Int64(x_obj);
+    y = PyInt64_to_Int64(y_obj);
+    z = PyDouble_to_Double(z_obj);
+    Out_0001 = multi_tmplt_1_0001(x, y, z);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* multi_tmplt_1_0002_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    double x;
+    double y;
+    int64_t z;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyDouble_to_Double(x_obj);
+    y = PyDouble_to_Double(y_obj);
+    z = PyInt64_to_Int64(z_obj);
+    Out_0001 = multi_tmplt_1_0002(x, y, z);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* multi_tmplt_1_0003_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    double x;
+    double y;
+    double z;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyDouble_to_Double(x_obj);
+    y = PyDouble_to_Double(y_obj);
+    z = PyDouble_to_Double(z_obj);
+    Out_0001 = multi_tmplt_1_0003(x, y, z);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t multi_tmplt_1_type_check(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeInt(x_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeFloat(x_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    if (PyIs_NativeInt(y_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeFloat(y_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument y");
+        return -INT64_C(1);
+    }
+    if (PyIs_NativeInt(z_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeFloat(z_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument z");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* multi_tmplt_1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    PyObject* z_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        "z",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &x_obj, &y_obj, &z_obj))
+    {
+        return NULL;
+    }
+    type_indicator = multi_tmplt_1_type_check(x_obj, y_obj, z_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return multi_tmplt_1_0000_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return multi_tmplt_1_0001_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return multi_tmplt_1_0002_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(7))
+    {
+        return multi_tmplt_1_0003_wrapper(x_obj, y_obj, z_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_0qx8k2os1eje_methods[] = {
+    {
+        "multi_tmplt_1",
+        (PyCFunction)multi_tmplt_1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_0qx8k2os1eje_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_0qx8k2os1eje",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_0qx8k2os1eje_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_0qx8k2os1eje(void)
+{
+    PyObject* mod;
+    static void* Pymod_0qx8k2os1eje_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_0qx8k2os1eje_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_0qx8k2os1eje_API, "mod_0qx8k2os1eje._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
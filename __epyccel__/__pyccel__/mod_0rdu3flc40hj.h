@@ -0,0 +1,11 @@
+#ifndef MOD_0RDU3FLC40HJ_H
+#define MOD_0RDU3FLC40HJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_div(t_ndarray x, t_ndarray y);
+#endif // mod_0rdu3flc40hj_H
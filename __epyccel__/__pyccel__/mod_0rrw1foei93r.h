@@ -0,0 +1,11 @@
+#ifndef MOD_0RRW1FOEI93R_H
+#define MOD_0RRW1FOEI93R_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_div(t_ndarray x, t_ndarray y);
+#endif // mod_0rrw1foei93r_H
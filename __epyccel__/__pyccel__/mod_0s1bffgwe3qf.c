@@ -0,0 +1,35 @@
+#include "mod_0s1bffgwe3qf.h"
+
+
+/*........................................*/
+int64_t get_mod(t_ndarray arr1, t_ndarray arr2, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                a_data[i * a.shape[INT64_C(1)] + i_0001] = pyc_fmodulo(GET_ELEMENT(arr1, nd_double, i, i_0001), GET_ELEMENT(arr2, nd_double, i, i_0001));
+            }
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)], a.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0004) = a.nd_double[INT64_C(1)];
+    (*Out_0005) = a.nd_double[a.shape[INT64_C(1)]];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,14 @@
+#ifndef MOD_0S1BFFGWE3QF_H
+#define MOD_0S1BFFGWE3QF_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t get_mod(t_ndarray arr1, t_ndarray arr2, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005);
+#endif // mod_0s1bffgwe3qf_H
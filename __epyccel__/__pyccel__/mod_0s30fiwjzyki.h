@@ -0,0 +1,11 @@
+#ifndef MOD_0S30FIWJZYKI_H
+#define MOD_0S30FIWJZYKI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_div(t_ndarray x, double a);
+#endif // mod_0s30fiwjzyki_H
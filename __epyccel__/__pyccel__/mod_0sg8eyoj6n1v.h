@@ -0,0 +1,13 @@
+#ifndef MOD_0SG8EYOJ6N1V_H
+#define MOD_0SG8EYOJ6N1V_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_3_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_0sg8eyoj6n1v_H
@@ -0,0 +1,32 @@
+#include "mod_0tus86f5j3g9.h"
+
+
+/*........................................*/
+double multi_allocs(int64_t i)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray e = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, a);
+    b = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, b);
+    c = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, c);
+    d = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, d);
+    e = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, e);
+    Out_0001 = pyc_fmodulo((INT64_C(4) + INT64_C(5)) / (d.nd_double[INT64_C(0)] + e.nd_double[INT64_C(2)]) * c.nd_double[INT64_C(0)], (b.nd_double[INT64_C(2)] + a.nd_double[INT64_C(1)])) - INT64_C(4);
+    free_array(&b);
+    free_array(&d);
+    free_array(&e);
+    free_array(&a);
+    free_array(&c);
+    return Out_0001;
+}
+/*........................................*/
+
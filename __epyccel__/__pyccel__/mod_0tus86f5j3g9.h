@@ -0,0 +1,13 @@
+#ifndef MOD_0TUS86F5J3G9_H
+#define MOD_0TUS86F5J3G9_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double multi_allocs(int64_t i);
+#endif // mod_0tus86f5j3g9_H
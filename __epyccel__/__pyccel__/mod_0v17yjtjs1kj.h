@@ -0,0 +1,11 @@
+#ifndef MOD_0V17YJTJS1KJ_H
+#define MOD_0V17YJTJS1KJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_2(t_ndarray a);
+#endif // mod_0v17yjtjs1kj_H
@@ -0,0 +1,12 @@
+#ifndef MOD_0X1E7OW59DBG_H
+#define MOD_0X1E7OW59DBG_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_0x1e7ow59dbg_H
@@ -0,0 +1,22 @@
+#include "mod_0xn3qhq03wk6.h"
+
+
+/*........................................*/
+t_ndarray copy_c_to_c_0000(t_ndarray b)
+{
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(3, (int64_t[]){b.shape[INT64_C(0)], b.shape[INT64_C(1)], b.shape[INT64_C(2)]}, nd_double, false, order_c);
+    array_copy_data(&a, b, 0);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray copy_c_to_c_0001(t_ndarray b)
+{
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){b.shape[INT64_C(0)], b.shape[INT64_C(1)]}, nd_double, false, order_c);
+    array_copy_data(&a, b, 0);
+    return a;
+}
+/*........................................*/
+
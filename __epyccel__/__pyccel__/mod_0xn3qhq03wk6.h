@@ -0,0 +1,12 @@
+#ifndef MOD_0XN3QHQ03WK6_H
+#define MOD_0XN3QHQ03WK6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_c_to_c_0000(t_ndarray b);
+t_ndarray copy_c_to_c_0001(t_ndarray b);
+#endif // mod_0xn3qhq03wk6_H
@@ -0,0 +1,148 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_0XN3QHQ03WK6_WRAPPER
+
+#include "mod_0xn3qhq03wk6_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* copy_c_to_c_0000_wrapper(PyObject* b_obj)
+{
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = pyarray_to_ndarray(b_obj);
+    a = copy_c_to_c_0000(b);
+    free_pointer(&b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* copy_c_to_c_0001_wrapper(PyObject* b_obj)
+{
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = pyarray_to_ndarray(b_obj);
+    a = copy_c_to_c_0001(b);
+    free_pointer(&b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t copy_c_to_c_type_check(PyObject* b_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(b_obj, NPY_DOUBLE, INT64_C(3), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(b_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument b");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* copy_c_to_c_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* b_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &b_obj))
+    {
+        return NULL;
+    }
+    type_indicator = copy_c_to_c_type_check(b_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return copy_c_to_c_0000_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return copy_c_to_c_0001_wrapper(b_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_0xn3qhq03wk6_methods[] = {
+    {
+        "copy_c_to_c",
+        (PyCFunction)copy_c_to_c_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_0xn3qhq03wk6_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_0xn3qhq03wk6",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_0xn3qhq03wk6_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_0xn3qhq03wk6(void)
+{
+    PyObject* mod;
+    static void* Pymod_0xn3qhq03wk6_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_0xn3qhq03wk6_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_0xn3qhq03wk6_API, "mod_0xn3qhq03wk6._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,16 @@
+#include "mod_10mshxusbrs5.h"
+
+
+/*........................................*/
+int64_t square_0000(int64_t a)
+{
+    return a * a;
+}
+/*........................................*/
+/*........................................*/
+double square_0001(double a)
+{
+    return a * a;
+}
+/*........................................*/
+
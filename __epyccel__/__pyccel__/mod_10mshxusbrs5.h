@@ -0,0 +1,11 @@
+#ifndef MOD_10MSHXUSBRS5_H
+#define MOD_10MSHXUSBRS5_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t square_0000(int64_t a);
+double square_0001(double a);
+#endif // mod_10mshxusbrs5_H
@@ -0,0 +1,12 @@
+#ifndef MOD_11IEI8OL2SAR_H
+#define MOD_11IEI8OL2SAR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_ones_like_val_float64(void);
+#endif // mod_11iei8ol2sar_H
@@ -0,0 +1,11 @@
+#ifndef MOD_11UZC7EPTT2F_H
+#define MOD_11UZC7EPTT2F_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_sub(t_ndarray x, double a);
+#endif // mod_11uzc7eptt2f_H
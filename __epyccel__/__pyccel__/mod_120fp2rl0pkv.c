@@ -0,0 +1,26 @@
+#include "mod_120fp2rl0pkv.h"
+
+
+/*........................................*/
+int64_t tuple_inhomogeneous(int64_t* Out_0001, bool* Out_0002, double* Out_0003, int64_t* Out_0004)
+{
+    int64_t b_0;
+    bool b_1;
+    double b_2;
+    int64_t a_0;
+    bool a_1;
+    double a_2;
+    b_0 = INT64_C(42);
+    b_1 = 1;
+    b_2 = 3.14;
+    a_0 = b_0;
+    a_1 = b_1;
+    a_2 = b_2;
+    (*Out_0001) = a_0;
+    (*Out_0002) = a_1;
+    (*Out_0003) = a_2;
+    (*Out_0004) = INT64_C(3);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_120FP2RL0PKV_H
+#define MOD_120FP2RL0PKV_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_inhomogeneous(int64_t* Out_0001, bool* Out_0002, double* Out_0003, int64_t* Out_0004);
+#endif // mod_120fp2rl0pkv_H
@@ -0,0 +1,40 @@
+#ifndef MOD_120FP2RL0PKV_WRAPPER_H
+#define MOD_120FP2RL0PKV_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_120fp2rl0pkv.h"
+
+
+#ifdef MOD_120FP2RL0PKV_WRAPPER
+
+
+#else
+
+static void** Pymod_120fp2rl0pkv_API;
+
+
+/*........................................*/
+static int mod_120fp2rl0pkv_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_120fp2rl0pkv_API = (void**)PyCapsule_Import("mod_120fp2rl0pkv._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_120fp2rl0pkv_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_120FP2RL0PKV_WRAPPER_H
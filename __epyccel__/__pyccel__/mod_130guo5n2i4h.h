@@ -0,0 +1,11 @@
+#ifndef MOD_130GUO5N2I4H_H
+#define MOD_130GUO5N2I4H_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_F_slice_12(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_130guo5n2i4h_H
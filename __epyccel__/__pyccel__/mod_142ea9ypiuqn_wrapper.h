@@ -0,0 +1,40 @@
+#ifndef MOD_142EA9YPIUQN_WRAPPER_H
+#define MOD_142EA9YPIUQN_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_142ea9ypiuqn.h"
+
+
+#ifdef MOD_142EA9YPIUQN_WRAPPER
+
+
+#else
+
+static void** Pymod_142ea9ypiuqn_API;
+
+
+/*........................................*/
+static int mod_142ea9ypiuqn_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_142ea9ypiuqn_API = (void**)PyCapsule_Import("mod_142ea9ypiuqn._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_142ea9ypiuqn_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_142EA9YPIUQN_WRAPPER_H
@@ -0,0 +1,16 @@
+#include "mod_15w6tbmxgvoa.h"
+
+
+/*........................................*/
+int64_t default_var_4_0000(int64_t x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+double default_var_4_0001(double x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+
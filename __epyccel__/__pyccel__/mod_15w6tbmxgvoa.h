@@ -0,0 +1,11 @@
+#ifndef MOD_15W6TBMXGVOA_H
+#define MOD_15W6TBMXGVOA_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t default_var_4_0000(int64_t x, int64_t y);
+double default_var_4_0001(double x, int64_t y);
+#endif // mod_15w6tbmxgvoa_H
@@ -0,0 +1,40 @@
+#ifndef MOD_15W6TBMXGVOA_WRAPPER_H
+#define MOD_15W6TBMXGVOA_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_15w6tbmxgvoa.h"
+
+
+#ifdef MOD_15W6TBMXGVOA_WRAPPER
+
+
+#else
+
+static void** Pymod_15w6tbmxgvoa_API;
+
+
+/*........................................*/
+static int mod_15w6tbmxgvoa_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_15w6tbmxgvoa_API = (void**)PyCapsule_Import("mod_15w6tbmxgvoa._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_15w6tbmxgvoa_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_15W6TBMXGVOA_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_18GQY85M5G4S_H
+#define MOD_18GQY85M5G4S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_add(t_ndarray x, double a);
+#endif // mod_18gqy85m5g4s_H
@@ -0,0 +1,12 @@
+#include "mod_19xy7uncevv0.h"
+
+
+/*........................................*/
+int64_t sum_call(t_ndarray x)
+{
+    int64_t Out_0001;
+    Out_0001 = numpy_sum_int64(x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_19XY7UNCEVV0_H
+#define MOD_19XY7UNCEVV0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t sum_call(t_ndarray x);
+#endif // mod_19xy7uncevv0_H
@@ -0,0 +1,16 @@
+#include "mod_1btp1icqmnnw.h"
+
+
+/*........................................*/
+double create_ones_2_val(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(2, (int64_t[]){INT64_C(4), INT64_C(2)}, nd_double, false, order_c);
+    array_fill((double)1.0, a);
+    Out_0001 = a.nd_double[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
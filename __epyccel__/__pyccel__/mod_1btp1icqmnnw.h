@@ -0,0 +1,11 @@
+#ifndef MOD_1BTP1ICQMNNW_H
+#define MOD_1BTP1ICQMNNW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_ones_2_val(void);
+#endif // mod_1btp1icqmnnw_H
@@ -0,0 +1,12 @@
+#ifndef MOD_1BWRFFYVCJX4_H
+#define MOD_1BWRFFYVCJX4_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_1bwrffyvcjx4_H
@@ -0,0 +1,22 @@
+#ifndef MOD_1DPQ5SM8QQGM_H
+#define MOD_1DPQ5SM8QQGM_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+t_ndarray return_c_array_0000(int64_t b);
+t_ndarray return_c_array_0001(int8_t b);
+t_ndarray return_c_array_0002(int16_t b);
+t_ndarray return_c_array_0003(int32_t b);
+t_ndarray return_c_array_0004(int64_t b);
+t_ndarray return_c_array_0005(double b);
+t_ndarray return_c_array_0006(float b);
+t_ndarray return_c_array_0007(double b);
+t_ndarray return_c_array_0008(float complex b);
+t_ndarray return_c_array_0009(double complex b);
+#endif // mod_1dpq5sm8qqgm_H
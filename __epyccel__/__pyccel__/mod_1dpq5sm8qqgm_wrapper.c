@@ -0,0 +1,323 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_1DPQ5SM8QQGM_WRAPPER
+
+#include "mod_1dpq5sm8qqgm_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0000_wrapper(PyObject* b_obj)
+{
+    int64_t b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyInt64_to_Int64(b_obj);
+    a = return_c_array_0000(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0001_wrapper(PyObject* b_obj)
+{
+    int8_t b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyInt8_to_Int8(b_obj);
+    a = return_c_array_0001(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0002_wrapper(PyObject* b_obj)
+{
+    int16_t b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyInt16_to_Int16(b_obj);
+    a = return_c_array_0002(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0003_wrapper(PyObject* b_obj)
+{
+    int32_t b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyInt32_to_Int32(b_obj);
+    a = return_c_array_0003(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0004_wrapper(PyObject* b_obj)
+{
+    int64_t b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyInt64_to_Int64(b_obj);
+    a = return_c_array_0004(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0005_wrapper(PyObject* b_obj)
+{
+    double b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyDouble_to_Double(b_obj);
+    a = return_c_array_0005(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0006_wrapper(PyObject* b_obj)
+{
+    float b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyFloat_to_Float(b_obj);
+    a = return_c_array_0006(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0007_wrapper(PyObject* b_obj)
+{
+    double b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyDouble_to_Double(b_obj);
+    a = return_c_array_0007(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0008_wrapper(PyObject* b_obj)
+{
+    float complex b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyComplex_to_Complex64(b_obj);
+    a = return_c_array_0008(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_c_array_0009_wrapper(PyObject* b_obj)
+{
+    double complex b;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    b = PyComplex_to_Complex128(b_obj);
+    a = return_c_array_0009(b);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t return_c_array_type_check(PyObject* b_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeInt(b_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int8(b_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Int16(b_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Int32(b_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Int64(b_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_NativeFloat(b_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (PyIs_Float(b_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Double(b_obj))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (PyIs_Complex64(b_obj))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else if (PyIs_Complex128(b_obj))
+    {
+        type_indicator += INT64_C(9);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument b");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* return_c_array_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* b_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &b_obj))
+    {
+        return NULL;
+    }
+    type_indicator = return_c_array_type_check(b_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return return_c_array_0000_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return return_c_array_0001_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return return_c_array_0002_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return return_c_array_0003_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return return_c_array_0004_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return return_c_array_0005_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(6))
+    {
+        return return_c_array_0006_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(7))
+    {
+        return return_c_array_0007_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(8))
+    {
+        return return_c_array_0008_wrapper(b_obj);
+    }
+    else if (type_indicator == INT64_C(9))
+    {
+        return return_c_array_0009_wrapper(b_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_1dpq5sm8qqgm_methods[] = {
+    {
+        "return_c_array",
+        (PyCFunction)return_c_array_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_1dpq5sm8qqgm_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_1dpq5sm8qqgm",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_1dpq5sm8qqgm_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_1dpq5sm8qqgm(void)
+{
+    PyObject* mod;
+    static void* Pymod_1dpq5sm8qqgm_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_1dpq5sm8qqgm_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_1dpq5sm8qqgm_API, "mod_1dpq5sm8qqgm._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_1DUQXP1R0YUH_H
+#define MOD_1DUQXP1R0YUH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_1d_matmul_creation(t_ndarray A, t_ndarray x);
+#endif // mod_1duqxp1r0yuh_H
@@ -0,0 +1,12 @@
+#include "mod_1dwgj2xxlaxi.h"
+
+
+/*........................................*/
+bool min_call(t_ndarray x)
+{
+    bool Out_0001;
+    Out_0001 = numpy_amin_bool(x);
+    return Out_0001;
+}
+/*........................................*/
+
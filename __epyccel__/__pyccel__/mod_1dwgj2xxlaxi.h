@@ -0,0 +1,11 @@
+#ifndef MOD_1DWGJ2XXLAXI_H
+#define MOD_1DWGJ2XXLAXI_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool min_call(t_ndarray x);
+#endif // mod_1dwgj2xxlaxi_H
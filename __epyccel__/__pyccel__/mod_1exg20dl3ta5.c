@@ -0,0 +1,15 @@
+#include "mod_1exg20dl3ta5.h"
+
+
+/*........................................*/
+double create_empty_2_val(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(2, (int64_t[]){INT64_C(4), INT64_C(2)}, nd_double, false, order_c);
+    Out_0001 = a.nd_double[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
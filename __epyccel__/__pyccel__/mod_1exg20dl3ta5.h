@@ -0,0 +1,11 @@
+#ifndef MOD_1EXG20DL3TA5_H
+#define MOD_1EXG20DL3TA5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_empty_2_val(void);
+#endif // mod_1exg20dl3ta5_H
@@ -0,0 +1,10 @@
+#include "mod_1gbqb716r835.h"
+
+
+/*........................................*/
+bool numpy_isnan_expr_test(double x, double y)
+{
+    return isnan(x + y);
+}
+/*........................................*/
+
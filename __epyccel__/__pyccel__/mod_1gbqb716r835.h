@@ -0,0 +1,11 @@
+#ifndef MOD_1GBQB716R835_H
+#define MOD_1GBQB716R835_H
+
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool numpy_isnan_expr_test(double x, double y);
+#endif // mod_1gbqb716r835_H
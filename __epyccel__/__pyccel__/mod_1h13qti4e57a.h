@@ -0,0 +1,12 @@
+#ifndef MOD_1H13QTI4E57A_H
+#define MOD_1H13QTI4E57A_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_val_int_int_auto(int64_t val);
+#endif // mod_1h13qti4e57a_H
@@ -0,0 +1,12 @@
+#ifndef MOD_1HYE9YBKV9NC_H
+#define MOD_1HYE9YBKV9NC_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_1hye9ybkv9nc_H
@@ -0,0 +1,12 @@
+#include "mod_1i3r0bisxvx7.h"
+
+
+/*........................................*/
+double log_phrase(double x, double y)
+{
+    double a;
+    a = log(x) + log(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_1I3R0BISXVX7_H
+#define MOD_1I3R0BISXVX7_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log_phrase(double x, double y);
+#endif // mod_1i3r0bisxvx7_H
@@ -0,0 +1,30 @@
+#include "mod_1i6eem0mg2bj.h"
+
+
+/*........................................*/
+void array_float_2d_F_array_initialization(t_ndarray a)
+{
+    t_ndarray tmp = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    tmp = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_double, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_double, false, order_c);
+    double Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_double[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&tmp, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    {
+        double* restrict tmp_data = tmp.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                GET_ELEMENT(a, nd_double, i, i_0001) = tmp_data[i_0001 * tmp.shape[INT64_C(0)] + i];
+            }
+        }
+    }
+    free_array(&tmp);
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_1I6EEM0MG2BJ_H
+#define MOD_1I6EEM0MG2BJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_2d_F_array_initialization(t_ndarray a);
+#endif // mod_1i6eem0mg2bj_H
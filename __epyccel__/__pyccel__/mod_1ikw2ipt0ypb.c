@@ -0,0 +1,10 @@
+#include "mod_1ikw2ipt0ypb.h"
+
+
+/*........................................*/
+double complex acosh_call(double complex x)
+{
+    return cacosh(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_1IKW2IPT0YPB_H
+#define MOD_1IKW2IPT0YPB_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex acosh_call(double complex x);
+#endif // mod_1ikw2ipt0ypb_H
@@ -0,0 +1,11 @@
+#ifndef MOD_1JCU76RDR8QW_H
+#define MOD_1JCU76RDR8QW_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_set_get_dynamic(bool dynamic_theads);
+#endif // mod_1jcu76rdr8qw_H
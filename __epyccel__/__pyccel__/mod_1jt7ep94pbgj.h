@@ -0,0 +1,11 @@
+#ifndef MOD_1JT7EP94PBGJ_H
+#define MOD_1JT7EP94PBGJ_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_add_inhomogeneous_with_variables2(int64_t* Out_0001, bool* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, bool* Out_0006);
+#endif // mod_1jt7ep94pbgj_H
@@ -0,0 +1,31 @@
+module mod_1kzegr88xahk
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function array_float_2d_1d_matmul_creation(A, x) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), intent(in) :: A(0_i64:, 0_i64:)
+    real(f64), intent(in) :: x(0_i64:)
+    real(f64), allocatable :: out(:)
+
+    allocate(out(0:size(A, 2_i64, i64) - 1_i64))
+    out = matmul(x,A)
+    Out_0001 = sum(out)
+    if (allocated(out)) then
+      deallocate(out)
+    end if
+    return
+
+  end function array_float_2d_1d_matmul_creation
+  !........................................
+
+end module mod_1kzegr88xahk
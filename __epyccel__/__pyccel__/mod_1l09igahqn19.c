@@ -0,0 +1,12 @@
+#include "mod_1l09igahqn19.h"
+
+
+/*........................................*/
+int32_t get_max_threads(void)
+{
+    int32_t max_threads;
+    max_threads = omp_get_max_threads();
+    return max_threads;
+}
+/*........................................*/
+
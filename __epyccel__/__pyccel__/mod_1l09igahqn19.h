@@ -0,0 +1,11 @@
+#ifndef MOD_1L09IGAHQN19_H
+#define MOD_1L09IGAHQN19_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_max_threads(void);
+#endif // mod_1l09igahqn19_H
@@ -0,0 +1,22 @@
+#include "mod_1nw3h7xhssyc.h"
+
+
+/*........................................*/
+int64_t homogeneous_tuple_float(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005)
+{
+    t_ndarray ai = {.raw_data = NULL};
+    int64_t i;
+    ai = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    double Dummy_0000[] = {1.5, 4.3, 5.2, 7.2, 9.999};
+    memcpy(&ai.nd_double[INT64_C(0)], Dummy_0000, 5 * ai.type_size);
+    i = INT64_C(1);
+    (*Out_0001) = GET_ELEMENT(ai, nd_double, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(ai, nd_double, i);
+    (*Out_0003) = GET_ELEMENT(ai, nd_double, INT64_C(2));
+    (*Out_0004) = GET_ELEMENT(ai, nd_double, INT64_C(3));
+    (*Out_0005) = GET_ELEMENT(ai, nd_double, INT64_C(4));
+    free_array(&ai);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_1NW3H7XHSSYC_H
+#define MOD_1NW3H7XHSSYC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t homogeneous_tuple_float(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+#endif // mod_1nw3h7xhssyc_H
@@ -0,0 +1,98 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_1NW3H7XHSSYC_WRAPPER
+
+#include "mod_1nw3h7xhssyc_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* homogeneous_tuple_float_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* Out_0001_obj;
+    double Out_0001;
+    PyObject* Out_0002_obj;
+    double Out_0002;
+    PyObject* Out_0003_obj;
+    double Out_0003;
+    PyObject* Out_0004_obj;
+    double Out_0004;
+    PyObject* Out_0005_obj;
+    double Out_0005;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    homogeneous_tuple_float(&Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    Out_0002_obj = Double_to_PyDouble(&Out_0002);
+    Out_0003_obj = Double_to_PyDouble(&Out_0003);
+    Out_0004_obj = Double_to_PyDouble(&Out_0004);
+    Out_0005_obj = Double_to_PyDouble(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_1nw3h7xhssyc_methods[] = {
+    {
+        "homogeneous_tuple_float",
+        (PyCFunction)homogeneous_tuple_float_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_1nw3h7xhssyc_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_1nw3h7xhssyc",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_1nw3h7xhssyc_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_1nw3h7xhssyc(void)
+{
+    PyObject* mod;
+    static void* Pymod_1nw3h7xhssyc_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_1nw3h7xhssyc_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_1nw3h7xhssyc_API, "mod_1nw3h7xhssyc._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_1P03LSTSC018_H
+#define MOD_1P03LSTSC018_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(t_ndarray x, int64_t* n, int64_t* m, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_1p03lstsc018_H
@@ -0,0 +1,19 @@
+#include "mod_1s1r15ot3wk3.h"
+
+
+/*........................................*/
+int64_t factorial_while(int64_t n)
+{
+    int64_t i;
+    int64_t x;
+    x = INT64_C(1);
+    i = INT64_C(1);
+    while(i <= n)
+    {
+        x = i * x;
+        i = i + INT64_C(1);
+    }
+    return x;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_1S1R15OT3WK3_H
+#define MOD_1S1R15OT3WK3_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t factorial_while(int64_t n);
+#endif // mod_1s1r15ot3wk3_H
@@ -0,0 +1,48 @@
+#include "mod_1s7czuvjilxi.h"
+
+
+/*........................................*/
+int64_t tuple_multi_indexing_2(double* Out_0001, double* Out_0002, double* Out_0003)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t z;
+    int64_t y;
+    int64_t w;
+    t_ndarray idx = {.raw_data = NULL};
+    t_ndarray idx_2 = {.raw_data = NULL};
+    t_ndarray ai = {.raw_data = NULL};
+    x = array_create(3, (int64_t[]){INT64_C(2), INT64_C(3), INT64_C(2)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    {
+        double* restrict x_data = x.nd_double;
+        for (z = INT64_C(0); z < INT64_C(2); z += INT64_C(1))
+        {
+            for (y = INT64_C(0); y < INT64_C(3); y += INT64_C(1))
+            {
+                for (w = INT64_C(0); w < INT64_C(2); w += INT64_C(1))
+                {
+                    x_data[(z * x.shape[INT64_C(1)] + y) * x.shape[INT64_C(2)] + w] = w + y * INT64_C(2) + z * INT64_C(6);
+                }
+            }
+        }
+    }
+    idx = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(1), INT64_C(0)};
+    memcpy(&idx.nd_int64[INT64_C(0)], Dummy_0000, 3 * idx.type_size);
+    idx_2 = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(0), INT64_C(1), INT64_C(2)};
+    memcpy(&idx_2.nd_int64[INT64_C(0)], Dummy_0001, 3 * idx_2.type_size);
+    ai = array_create(1, (int64_t[]){INT64_C(3)}, nd_double, false, order_c);
+    double Dummy_0002[] = {x.nd_double[(GET_ELEMENT(idx, nd_int64, INT64_C(0)) * x.shape[INT64_C(1)] + GET_ELEMENT(idx_2, nd_int64, INT64_C(0))) * x.shape[INT64_C(2)] + INT64_C(1)], x.nd_double[(GET_ELEMENT(idx, nd_int64, INT64_C(1)) * x.shape[INT64_C(1)] + GET_ELEMENT(idx_2, nd_int64, INT64_C(1))) * x.shape[INT64_C(2)] + INT64_C(1)], x.nd_double[(GET_ELEMENT(idx, nd_int64, INT64_C(2)) * x.shape[INT64_C(1)] + GET_ELEMENT(idx_2, nd_int64, INT64_C(2))) * x.shape[INT64_C(2)] + INT64_C(1)]};
+    memcpy(&ai.nd_double[INT64_C(0)], Dummy_0002, 3 * ai.type_size);
+    (*Out_0001) = ai.nd_double[INT64_C(0)];
+    (*Out_0002) = ai.nd_double[INT64_C(1)];
+    (*Out_0003) = ai.nd_double[INT64_C(2)];
+    free_array(&ai);
+    free_array(&idx);
+    free_array(&idx_2);
+    free_array(&x);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_1S7CZUVJILXI_H
+#define MOD_1S7CZUVJILXI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_multi_indexing_2(double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_1s7czuvjilxi_H
@@ -0,0 +1,13 @@
+#ifndef MOD_1TC6DE5GP72W_H
+#define MOD_1TC6DE5GP72W_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_ones_like_val_complex(void);
+#endif // mod_1tc6de5gp72w_H
@@ -0,0 +1,25 @@
+#include "mod_1ub8lmiqib0c.h"
+
+
+/*........................................*/
+int64_t double_loop(int64_t n)
+{
+    int64_t x;
+    int64_t i;
+    int64_t y;
+    int64_t j;
+    int64_t z;
+    x = INT64_C(0);
+    for (i = INT64_C(3); i < INT64_C(10); i += INT64_C(1))
+    {
+        x += INT64_C(1);
+        y = n * x;
+        for (j = INT64_C(4); j < INT64_C(15); j += INT64_C(1))
+        {
+            z = x - y;
+        }
+    }
+    return z;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_1UB8LMIQIB0C_H
+#define MOD_1UB8LMIQIB0C_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t double_loop(int64_t n);
+#endif // mod_1ub8lmiqib0c_H
@@ -0,0 +1,11 @@
+#ifndef MOD_1USSEGOSC301_H
+#define MOD_1USSEGOSC301_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_mul(t_ndarray x, double a);
+#endif // mod_1ussegosc301_H
@@ -0,0 +1,12 @@
+#include "mod_1v4jytyu9rcu.h"
+
+
+/*........................................*/
+double gamma_phrase(double x, double y)
+{
+    double a;
+    a = tgamma(x) + tgamma(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_1V4JYTYU9RCU_H
+#define MOD_1V4JYTYU9RCU_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double gamma_phrase(double x, double y);
+#endif // mod_1v4jytyu9rcu_H
@@ -0,0 +1,10 @@
+#include "mod_1vqx1cazi2df.h"
+
+
+/*........................................*/
+int64_t return_expr(int64_t x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_1VQX1CAZI2DF_H
+#define MOD_1VQX1CAZI2DF_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t return_expr(int64_t x, int64_t y);
+#endif // mod_1vqx1cazi2df_H
@@ -0,0 +1,11 @@
+#ifndef MOD_1WMKHHSIGHF3_H
+#define MOD_1WMKHHSIGHF3_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_1wmkhhsighf3_H
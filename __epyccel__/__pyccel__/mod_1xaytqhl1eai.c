@@ -0,0 +1,39 @@
+#include "mod_1xaytqhl1eai.h"
+
+
+/*........................................*/
+void test_linspace2(t_ndarray start, int64_t stop, t_ndarray out, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    int64_t j;
+    int64_t i_0001;
+    int64_t i_0002;
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(2, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)]}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict a_data = a.nd_cdouble;
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(0)]; i_0001 += INT64_C(1))
+        {
+            for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(1)]; i_0002 += INT64_C(1))
+            {
+                a_data[i_0001 * a.shape[INT64_C(1)] + i_0002] = (GET_ELEMENT(start, nd_cdouble, i_0002) + i_0001*(stop - GET_ELEMENT(start, nd_cdouble, i_0002)) / (numberOfSamplesToGenerate - (int64_t)(endpoint)));
+                a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0002] = endpoint ? (double complex)stop : a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0002];
+            }
+        }
+    }
+    {
+        double complex* restrict a_data_0001 = a.nd_cdouble;
+        for (i = INT64_C(0); i < out.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (j = INT64_C(0); j < out.shape[INT64_C(1)]; j += INT64_C(1))
+            {
+                GET_ELEMENT(out, nd_cdouble, i, j) = a_data_0001[i * a.shape[INT64_C(1)] + j];
+            }
+        }
+    }
+    free_array(&a);
+}
+/*........................................*/
+
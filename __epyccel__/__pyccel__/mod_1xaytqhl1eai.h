@@ -0,0 +1,13 @@
+#ifndef MOD_1XAYTQHL1EAI_H
+#define MOD_1XAYTQHL1EAI_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void test_linspace2(t_ndarray start, int64_t stop, t_ndarray out, bool endpoint);
+#endif // mod_1xaytqhl1eai_H
@@ -0,0 +1,127 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_1XAYTQHL1EAI_WRAPPER
+
+#include "mod_1xaytqhl1eai_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* start_obj;
+    PyObject* stop_obj;
+    PyObject* out_obj;
+    PyObject* endpoint_obj;
+    t_ndarray start = {.raw_data = NULL};
+    int64_t stop;
+    t_ndarray out = {.raw_data = NULL};
+    bool endpoint;
+    static const char* const kwlist[] = {
+        "start",
+        "stop",
+        "out",
+        "endpoint",
+        NULL
+    };
+    static PyObject* kwlist_interned[5] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 4, 4, &start_obj, &stop_obj, &out_obj, &endpoint_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("start", start_obj, NPY_CDOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        start = pyarray_to_ndarray(start_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(stop_obj))
+    {
+        stop = PyInt64_to_Int64(stop_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument stop");
+        return NULL;
+    }
+    if (pyarray_check("out", out_obj, NPY_CDOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        out = pyarray_to_ndarray(out_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_Bool(endpoint_obj))
+    {
+        endpoint = PyBool_to_Bool(endpoint_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument endpoint");
+        return NULL;
+    }
+    test_linspace2(start, stop, out, endpoint);
+    free_pointer(&start);
+    free_pointer(&out);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_1xaytqhl1eai_methods[] = {
+    {
+        "test_linspace2",
+        (PyCFunction)test_linspace2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_1xaytqhl1eai_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_1xaytqhl1eai",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_1xaytqhl1eai_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_1xaytqhl1eai(void)
+{
+    PyObject* mod;
+    static void* Pymod_1xaytqhl1eai_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_1xaytqhl1eai_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_1xaytqhl1eai_API, "mod_1xaytqhl1eai._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
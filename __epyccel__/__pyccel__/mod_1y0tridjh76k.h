@@ -0,0 +1,12 @@
+#ifndef MOD_1Y0TRIDJH76K_H
+#define MOD_1Y0TRIDJH76K_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_2d_stack_array_1(void);
+#endif // mod_1y0tridjh76k_H
@@ -0,0 +1,186 @@
+#include "mod_1zb2u2l07l7h.h"
+
+
+/*........................................*/
+int64_t get_complex64_arr_1d_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict a_data = a.nd_cfloat;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = (float complex)(GET_ELEMENT(arr, nd_bool, i));
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_cfloat[INT64_C(0)];
+    (*Out_0004) = a.nd_cfloat[INT64_C(1)];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_complex64_arr_1d_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict a_data = a.nd_cfloat;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = (float complex)(GET_ELEMENT(arr, nd_int64, i));
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_cfloat[INT64_C(0)];
+    (*Out_0004) = a.nd_cfloat[INT64_C(1)];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_complex64_arr_1d_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict a_data = a.nd_cfloat;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = (float complex)(GET_ELEMENT(arr, nd_int8, i));
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_cfloat[INT64_C(0)];
+    (*Out_0004) = a.nd_cfloat[INT64_C(1)];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_complex64_arr_1d_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict a_data = a.nd_cfloat;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = (float complex)(GET_ELEMENT(arr, nd_int16, i));
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_cfloat[INT64_C(0)];
+    (*Out_0004) = a.nd_cfloat[INT64_C(1)];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_complex64_arr_1d_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict a_data = a.nd_cfloat;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = (float complex)(GET_ELEMENT(arr, nd_int32, i));
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_cfloat[INT64_C(0)];
+    (*Out_0004) = a.nd_cfloat[INT64_C(1)];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_complex64_arr_1d_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict a_data = a.nd_cfloat;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = (float complex)(GET_ELEMENT(arr, nd_double, i));
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_cfloat[INT64_C(0)];
+    (*Out_0004) = a.nd_cfloat[INT64_C(1)];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_complex64_arr_1d_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict a_data = a.nd_cfloat;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = (float complex)(GET_ELEMENT(arr, nd_float, i));
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_cfloat[INT64_C(0)];
+    (*Out_0004) = a.nd_cfloat[INT64_C(1)];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
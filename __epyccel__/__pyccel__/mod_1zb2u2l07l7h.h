@@ -0,0 +1,19 @@
+#ifndef MOD_1ZB2U2L07L7H_H
+#define MOD_1ZB2U2L07L7H_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t get_complex64_arr_1d_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004);
+int64_t get_complex64_arr_1d_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004);
+int64_t get_complex64_arr_1d_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004);
+int64_t get_complex64_arr_1d_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004);
+int64_t get_complex64_arr_1d_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004);
+int64_t get_complex64_arr_1d_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004);
+int64_t get_complex64_arr_1d_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004);
+#endif // mod_1zb2u2l07l7h_H
@@ -0,0 +1,12 @@
+#ifndef MOD_1ZHBH0VTK0TZ_H
+#define MOD_1ZHBH0VTK0TZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_ones_like_val_float64_auto(void);
+#endif // mod_1zhbh0vtk0tz_H
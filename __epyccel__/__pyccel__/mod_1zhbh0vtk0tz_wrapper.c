@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_1ZHBH0VTK0TZ_WRAPPER
+
+#include "mod_1zhbh0vtk0tz_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_ones_like_val_float64_auto_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = create_ones_like_val_float64_auto();
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_1zhbh0vtk0tz_methods[] = {
+    {
+        "create_ones_like_val_float64_auto",
+        (PyCFunction)create_ones_like_val_float64_auto_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_1zhbh0vtk0tz_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_1zhbh0vtk0tz",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_1zhbh0vtk0tz_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_1zhbh0vtk0tz(void)
+{
+    PyObject* mod;
+    static void* Pymod_1zhbh0vtk0tz_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_1zhbh0vtk0tz_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_1zhbh0vtk0tz_API, "mod_1zhbh0vtk0tz._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,13 @@
+#ifndef MOD_1ZNCK5OAP5BZ_H
+#define MOD_1ZNCK5OAP5BZ_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_ones_like_3_val(void);
+#endif // mod_1znck5oap5bz_H
@@ -0,0 +1,64 @@
+#include "mod_232a0xgw3tsk.h"
+
+
+/*........................................*/
+int64_t mix_types_2_0000(int64_t x, int64_t y)
+{
+    if (y != x)
+    {
+        return y - x;
+    }
+    return -x;
+}
+/*........................................*/
+/*........................................*/
+int32_t mix_types_2_0001(int32_t x, int32_t y)
+{
+    if (y != x)
+    {
+        return y - x;
+    }
+    return -x;
+}
+/*........................................*/
+/*........................................*/
+int16_t mix_types_2_0002(int16_t x, int16_t y)
+{
+    if (y != x)
+    {
+        return y - x;
+    }
+    return -x;
+}
+/*........................................*/
+/*........................................*/
+double mix_types_2_0003(double x, double y)
+{
+    if (y != x)
+    {
+        return y - x;
+    }
+    return -x;
+}
+/*........................................*/
+/*........................................*/
+double complex mix_types_2_0004(double complex x, double complex y)
+{
+    if (y != x)
+    {
+        return y - x;
+    }
+    return -x;
+}
+/*........................................*/
+/*........................................*/
+float mix_types_2_0005(float x, float y)
+{
+    if (y != x)
+    {
+        return y - x;
+    }
+    return -x;
+}
+/*........................................*/
+
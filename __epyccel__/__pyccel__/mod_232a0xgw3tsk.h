@@ -0,0 +1,16 @@
+#ifndef MOD_232A0XGW3TSK_H
+#define MOD_232A0XGW3TSK_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t mix_types_2_0000(int64_t x, int64_t y);
+int32_t mix_types_2_0001(int32_t x, int32_t y);
+int16_t mix_types_2_0002(int16_t x, int16_t y);
+double mix_types_2_0003(double x, double y);
+double complex mix_types_2_0004(double complex x, double complex y);
+float mix_types_2_0005(float x, float y);
+#endif // mod_232a0xgw3tsk_H
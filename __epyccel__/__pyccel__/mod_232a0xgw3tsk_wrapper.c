@@ -0,0 +1,271 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_232A0XGW3TSK_WRAPPER
+
+#include "mod_232a0xgw3tsk_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_2_0000_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    int64_t x;
+    int64_t y;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt64_to_Int64(x_obj);
+    y = PyInt64_to_Int64(y_obj);
+    Out_0001 = mix_types_2_0000(x, y);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_2_0001_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    int32_t x;
+    int32_t y;
+    int32_t Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt32_to_Int32(x_obj);
+    y = PyInt32_to_Int32(y_obj);
+    Out_0001 = mix_types_2_0001(x, y);
+    Out_0001_obj = Int32_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_2_0002_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    int16_t x;
+    int16_t y;
+    int16_t Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt16_to_Int16(x_obj);
+    y = PyInt16_to_Int16(y_obj);
+    Out_0001 = mix_types_2_0002(x, y);
+    Out_0001_obj = Int16_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_2_0003_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    double x;
+    double y;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyDouble_to_Double(x_obj);
+    y = PyDouble_to_Double(y_obj);
+    Out_0001 = mix_types_2_0003(x, y);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_2_0004_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    double complex x;
+    double complex y;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    y = PyComplex_to_Complex128(y_obj);
+    Out_0001 = mix_types_2_0004(x, y);
+    Out_0001_obj = Complex128_to_PyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_2_0005_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    float x;
+    float y;
+    float Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyFloat_to_Float(x_obj);
+    y = PyFloat_to_Float(y_obj);
+    Out_0001 = mix_types_2_0005(x, y);
+    Out_0001_obj = Float_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t mix_types_2_type_check(PyObject* x_obj, PyObject* y_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_Int64(x_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int32(x_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Int16(x_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_NativeFloat(x_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_NativeComplex(x_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_Float(x_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    if (PyIs_Int64(y_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int32(y_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Int16(y_obj))
+    {
+        type_indicator += INT64_C(12);
+    }
+    else if (PyIs_NativeFloat(y_obj))
+    {
+        type_indicator += INT64_C(18);
+    }
+    else if (PyIs_NativeComplex(y_obj))
+    {
+        type_indicator += INT64_C(24);
+    }
+    else if (PyIs_Float(y_obj))
+    {
+        type_indicator += INT64_C(30);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument y");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* mix_types_2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    type_indicator = mix_types_2_type_check(x_obj, y_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return mix_types_2_0000_wrapper(x_obj, y_obj);
+    }
+    else if (type_indicator == INT64_C(7))
+    {
+        return mix_types_2_0001_wrapper(x_obj, y_obj);
+    }
+    else if (type_indicator == INT64_C(14))
+    {
+        return mix_types_2_0002_wrapper(x_obj, y_obj);
+    }
+    else if (type_indicator == INT64_C(21))
+    {
+        return mix_types_2_0003_wrapper(x_obj, y_obj);
+    }
+    else if (type_indicator == INT64_C(28))
+    {
+        return mix_types_2_0004_wrapper(x_obj, y_obj);
+    }
+    else if (type_indicator == INT64_C(35))
+    {
+        return mix_types_2_0005_wrapper(x_obj, y_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_232a0xgw3tsk_methods[] = {
+    {
+        "mix_types_2",
+        (PyCFunction)mix_types_2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_232a0xgw3tsk_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_232a0xgw3tsk",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_232a0xgw3tsk_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_232a0xgw3tsk(void)
+{
+    PyObject* mod;
+    static void* Pymod_232a0xgw3tsk_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_232a0xgw3tsk_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_232a0xgw3tsk_API, "mod_232a0xgw3tsk._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
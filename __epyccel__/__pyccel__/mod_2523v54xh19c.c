@@ -0,0 +1,36 @@
+#include "mod_2523v54xh19c.h"
+
+
+/*........................................*/
+int64_t combined_for_simd(void)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    t_ndarray z = {.raw_data = NULL};
+    int64_t i;
+    int64_t func_result;
+    x = array_create(1, (int64_t[]){INT64_C(8)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2)};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 8 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(8)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1)};
+    memcpy(&y.nd_int64[INT64_C(0)], Dummy_0001, 8 * y.type_size);
+    z = array_create(1, (int64_t[]){INT64_C(8)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), z);
+    func_result = INT64_C(0);
+    #pragma omp parallel for simd
+    for (i = INT64_C(0); i < INT64_C(8); i += INT64_C(1))
+    {
+        GET_ELEMENT(z, nd_int64, i) = GET_ELEMENT(x, nd_int64, i) + GET_ELEMENT(y, nd_int64, i);
+    }
+    for (i = INT64_C(0); i < INT64_C(8); i += INT64_C(1))
+    {
+        func_result = func_result + GET_ELEMENT(z, nd_int64, i);
+    }
+    free_array(&y);
+    free_array(&z);
+    free_array(&x);
+    return func_result;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_2523V54XH19C_H
+#define MOD_2523V54XH19C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t combined_for_simd(void);
+#endif // mod_2523v54xh19c_H
@@ -0,0 +1,10 @@
+#include "mod_26e4iu7qcove.h"
+
+
+/*........................................*/
+double arcsin_call_r(double x)
+{
+    return asin(x);
+}
+/*........................................*/
+
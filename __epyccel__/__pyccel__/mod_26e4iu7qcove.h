@@ -0,0 +1,10 @@
+#ifndef MOD_26E4IU7QCOVE_H
+#define MOD_26E4IU7QCOVE_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double arcsin_call_r(double x);
+#endif // mod_26e4iu7qcove_H
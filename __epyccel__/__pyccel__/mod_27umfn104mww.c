@@ -0,0 +1,12 @@
+#include "mod_27umfn104mww.h"
+
+
+/*........................................*/
+double sin_phrase_r_i(double x, int64_t y)
+{
+    double a;
+    a = sin(x) + sin((double)(y));
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_27UMFN104MWW_H
+#define MOD_27UMFN104MWW_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double sin_phrase_r_i(double x, int64_t y);
+#endif // mod_27umfn104mww_H
@@ -0,0 +1,12 @@
+#ifndef MOD_28FIHWLIK2O0_H
+#define MOD_28FIHWLIK2O0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_like_val_int_auto(void);
+#endif // mod_28fihwlik2o0_H
@@ -0,0 +1,10 @@
+#ifndef MOD_29B066B59E97240B3E30F51DE5069BDA_H
+#define MOD_29B066B59E97240B3E30F51DE5069BDA_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t add_two(int64_t x);
+#endif // mod_29b066b59e97240b3e30f51de5069bda_H
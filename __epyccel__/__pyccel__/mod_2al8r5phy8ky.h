@@ -0,0 +1,12 @@
+#ifndef MOD_2AL8R5PHY8KY_H
+#define MOD_2AL8R5PHY8KY_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_4(int64_t* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_2al8r5phy8ky_H
@@ -0,0 +1,12 @@
+#ifndef MOD_2ASH61W9VK3W_H
+#define MOD_2ASH61W9VK3W_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_empty_like_val_float(void);
+#endif // mod_2ash61w9vk3w_H
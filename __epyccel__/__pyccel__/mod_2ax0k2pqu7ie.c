@@ -0,0 +1,12 @@
+#include "mod_2ax0k2pqu7ie.h"
+
+
+/*........................................*/
+double fabs_phrase_r_i(double x, int64_t y)
+{
+    double a;
+    a = fabs(x) * fabs((double)(y));
+    return a;
+}
+/*........................................*/
+
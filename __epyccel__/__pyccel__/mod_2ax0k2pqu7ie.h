@@ -0,0 +1,11 @@
+#ifndef MOD_2AX0K2PQU7IE_H
+#define MOD_2AX0K2PQU7IE_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double fabs_phrase_r_i(double x, int64_t y);
+#endif // mod_2ax0k2pqu7ie_H
@@ -0,0 +1,142 @@
+#include "mod_2bvbuvicyigw.h"
+
+
+/*........................................*/
+t_ndarray test_linspace_0000(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(2, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                a_data[i * a.shape[INT64_C(1)] + i_0001] = (GET_ELEMENT(start, nd_int64, i_0001) + i*(double)((stop - GET_ELEMENT(start, nd_int64, i_0001))) / (double)((numberOfSamplesToGenerate - (int64_t)(endpoint))));
+                a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001] = endpoint ? (double)stop : a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001];
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0001(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(2, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                a_data[i * a.shape[INT64_C(1)] + i_0001] = (GET_ELEMENT(start, nd_int8, i_0001) + i*(double)((stop - GET_ELEMENT(start, nd_int8, i_0001))) / (double)((numberOfSamplesToGenerate - (int64_t)(endpoint))));
+                a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001] = endpoint ? (double)stop : a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001];
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0002(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(2, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                a_data[i * a.shape[INT64_C(1)] + i_0001] = (GET_ELEMENT(start, nd_int16, i_0001) + i*(double)((stop - GET_ELEMENT(start, nd_int16, i_0001))) / (double)((numberOfSamplesToGenerate - (int64_t)(endpoint))));
+                a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001] = endpoint ? (double)stop : a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001];
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0003(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(2, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                a_data[i * a.shape[INT64_C(1)] + i_0001] = (GET_ELEMENT(start, nd_int32, i_0001) + i*(double)((stop - GET_ELEMENT(start, nd_int32, i_0001))) / (double)((numberOfSamplesToGenerate - (int64_t)(endpoint))));
+                a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001] = endpoint ? (double)stop : a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001];
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0004(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(2, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                a_data[i * a.shape[INT64_C(1)] + i_0001] = (GET_ELEMENT(start, nd_double, i_0001) + i*(stop - GET_ELEMENT(start, nd_double, i_0001)) / (numberOfSamplesToGenerate - (int64_t)(endpoint)));
+                a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001] = endpoint ? (double)stop : a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001];
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0005(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(2, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)]}, nd_float, false, order_c);
+    {
+        float* restrict a_data = a.nd_float;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                a_data[i * a.shape[INT64_C(1)] + i_0001] = (GET_ELEMENT(start, nd_float, i_0001) + i*(stop - GET_ELEMENT(start, nd_float, i_0001)) / (numberOfSamplesToGenerate - (int64_t)(endpoint)));
+                a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001] = endpoint ? (float)stop : a_data[(numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001];
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,17 @@
+#ifndef MOD_2BVBUVICYIGW_H
+#define MOD_2BVBUVICYIGW_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray test_linspace_0000(t_ndarray start, int64_t stop, bool endpoint);
+t_ndarray test_linspace_0001(t_ndarray start, int64_t stop, bool endpoint);
+t_ndarray test_linspace_0002(t_ndarray start, int64_t stop, bool endpoint);
+t_ndarray test_linspace_0003(t_ndarray start, int64_t stop, bool endpoint);
+t_ndarray test_linspace_0004(t_ndarray start, int64_t stop, bool endpoint);
+t_ndarray test_linspace_0005(t_ndarray start, int64_t stop, bool endpoint);
+#endif // mod_2bvbuvicyigw_H
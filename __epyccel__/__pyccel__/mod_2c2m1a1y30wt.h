@@ -0,0 +1,11 @@
+#ifndef MOD_2C2M1A1Y30WT_H
+#define MOD_2C2M1A1Y30WT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_C_slice_10(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_2c2m1a1y30wt_H
@@ -0,0 +1,11 @@
+#ifndef MOD_2D3HOQKULFNN_H
+#define MOD_2D3HOQKULFNN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_2d3hoqkulfnn_H
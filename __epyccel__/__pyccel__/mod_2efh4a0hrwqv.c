@@ -0,0 +1,12 @@
+#include "mod_2efh4a0hrwqv.h"
+
+
+/*........................................*/
+double sum_phrase(t_ndarray x, t_ndarray y)
+{
+    double a;
+    a = numpy_sum_float64(x) * numpy_sum_float64(y);
+    return a;
+}
+/*........................................*/
+
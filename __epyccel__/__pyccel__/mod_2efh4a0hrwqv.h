@@ -0,0 +1,10 @@
+#ifndef MOD_2EFH4A0HRWQV_H
+#define MOD_2EFH4A0HRWQV_H
+
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+double sum_phrase(t_ndarray x, t_ndarray y);
+#endif // mod_2efh4a0hrwqv_H
@@ -0,0 +1,11 @@
+#ifndef MOD_2EISZ7ULRBH7_H
+#define MOD_2EISZ7ULRBH7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_2eisz7ulrbh7_H
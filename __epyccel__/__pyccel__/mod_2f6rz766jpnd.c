@@ -0,0 +1,48 @@
+#include "mod_2f6rz766jpnd.h"
+
+
+/*........................................*/
+double multiple_np_linspace(void)
+{
+    int64_t linspace_index;
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    t_ndarray z = {.raw_data = NULL};
+    int64_t i;
+    double Out_0001;
+    linspace_index = INT64_C(5);
+    x = array_create(1, (int64_t[]){INT64_C(128)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(128); i += INT64_C(1))
+        {
+            x_data[i] = (INT64_C(0) + i*(double)((INT64_C(2) - INT64_C(0))) / 127.0);
+            x_data[INT64_C(127)] = (double)INT64_C(2);
+        }
+    }
+    y = array_create(1, (int64_t[]){INT64_C(128)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        for (i = INT64_C(0); i < INT64_C(128); i += INT64_C(1))
+        {
+            y_data[i] = (INT64_C(0) + i*(double)((INT64_C(4) - INT64_C(0))) / 127.0);
+            y_data[INT64_C(127)] = (double)INT64_C(4);
+        }
+    }
+    z = array_create(1, (int64_t[]){INT64_C(128)}, nd_double, false, order_c);
+    {
+        double* restrict z_data = z.nd_double;
+        for (i = INT64_C(0); i < INT64_C(128); i += INT64_C(1))
+        {
+            z_data[i] = (INT64_C(0) + i*(double)((INT64_C(8) - INT64_C(0))) / 127.0);
+            z_data[INT64_C(127)] = (double)INT64_C(8);
+        }
+    }
+    Out_0001 = x.nd_double[INT64_C(0)] + y.nd_double[INT64_C(1)] + z.nd_double[INT64_C(2)] + linspace_index;
+    free_array(&z);
+    free_array(&x);
+    free_array(&y);
+    return Out_0001;
+}
+/*........................................*/
+
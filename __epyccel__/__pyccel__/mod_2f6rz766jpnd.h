@@ -0,0 +1,11 @@
+#ifndef MOD_2F6RZ766JPND_H
+#define MOD_2F6RZ766JPND_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double multiple_np_linspace(void);
+#endif // mod_2f6rz766jpnd_H
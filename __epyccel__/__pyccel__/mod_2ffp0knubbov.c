@@ -0,0 +1,23 @@
+#include "mod_2ffp0knubbov.h"
+
+
+/*........................................*/
+int64_t f(double* Out_0001, double* Out_0002)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    int64_t Dummy_0000;
+    arr = array_create(1, (int64_t[]){INT64_C(4)}, nd_double, false, order_c);
+    {
+        double* restrict arr_data = arr.nd_double;
+        for (Dummy_0000 = INT64_C(0); Dummy_0000 < arr.shape[INT64_C(0)]; Dummy_0000 += INT64_C(1))
+        {
+            arr_data[Dummy_0000] = 3.14;
+        }
+    }
+    (*Out_0001) = arr.nd_double[INT64_C(0)];
+    (*Out_0002) = arr.nd_double[INT64_C(3)];
+    free_array(&arr);
+    return 0;
+}
+/*........................................*/
+
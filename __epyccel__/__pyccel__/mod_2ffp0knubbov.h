@@ -0,0 +1,11 @@
+#ifndef MOD_2FFP0KNUBBOV_H
+#define MOD_2FFP0KNUBBOV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(double* Out_0001, double* Out_0002);
+#endif // mod_2ffp0knubbov_H
@@ -0,0 +1,12 @@
+#include "mod_2fn84uyqowcr.h"
+
+
+/*........................................*/
+double f(void)
+{
+    double complex a;
+    a = (1.0 + 2.0 * _Complex_I);
+    return creal(a);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_2FN84UYQOWCR_H
+#define MOD_2FN84UYQOWCR_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double f(void);
+#endif // mod_2fn84uyqowcr_H
@@ -0,0 +1,60 @@
+#include "mod_2h8d2gguo943.h"
+
+
+/*........................................*/
+void mix_array_2_0000(t_ndarray x, t_ndarray y, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_cdouble, i) += a;
+    }
+    for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(y, nd_cdouble, i) -= a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_array_2_0001(t_ndarray x, t_ndarray y, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_cdouble, i) += a;
+    }
+    for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(y, nd_int64, i) -= a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_array_2_0002(t_ndarray x, t_ndarray y, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) += a;
+    }
+    for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(y, nd_cdouble, i) -= a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_array_2_0003(t_ndarray x, t_ndarray y, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) += a;
+    }
+    for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(y, nd_int64, i) -= a;
+    }
+}
+/*........................................*/
+
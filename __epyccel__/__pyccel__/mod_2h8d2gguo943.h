@@ -0,0 +1,14 @@
+#ifndef MOD_2H8D2GGUO943_H
+#define MOD_2H8D2GGUO943_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void mix_array_2_0000(t_ndarray x, t_ndarray y, int64_t a);
+void mix_array_2_0001(t_ndarray x, t_ndarray y, int64_t a);
+void mix_array_2_0002(t_ndarray x, t_ndarray y, int64_t a);
+void mix_array_2_0003(t_ndarray x, t_ndarray y, int64_t a);
+#endif // mod_2h8d2gguo943_H
@@ -0,0 +1,22 @@
+#include "mod_2k78gslve1p7.h"
+
+
+/*........................................*/
+int64_t test_multiple_negative_index(int64_t c, int64_t d, int64_t* x, int64_t* y)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(6)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 6 * a.type_size);
+    b = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0001, 3 * b.type_size);
+    (*x) = a.nd_int64[c < INT64_C(0) ? INT64_C(6) + c : c];
+    (*y) = b.nd_int64[d < INT64_C(0) ? INT64_C(3) + d : d];
+    free_array(&a);
+    free_array(&b);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_2K78GSLVE1P7_H
+#define MOD_2K78GSLVE1P7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_multiple_negative_index(int64_t c, int64_t d, int64_t* x, int64_t* y);
+#endif // mod_2k78gslve1p7_H
@@ -0,0 +1,110 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_2K78GSLVE1P7_WRAPPER
+
+#include "mod_2k78gslve1p7_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_multiple_negative_index_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* c_obj;
+    PyObject* d_obj;
+    int64_t c;
+    int64_t d;
+    PyObject* x_obj;
+    int64_t x;
+    PyObject* y_obj;
+    int64_t y;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "c",
+        "d",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &c_obj, &d_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(c_obj))
+    {
+        c = PyInt64_to_Int64(c_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument c");
+        return NULL;
+    }
+    if (PyIs_NativeInt(d_obj))
+    {
+        d = PyInt64_to_Int64(d_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument d");
+        return NULL;
+    }
+    test_multiple_negative_index(c, d, &x, &y);
+    x_obj = Int64_to_NumpyLong(&x);
+    y_obj = Int64_to_NumpyLong(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_2k78gslve1p7_methods[] = {
+    {
+        "test_multiple_negative_index",
+        (PyCFunction)test_multiple_negative_index_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_2k78gslve1p7_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_2k78gslve1p7",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_2k78gslve1p7_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_2k78gslve1p7(void)
+{
+    PyObject* mod;
+    static void* Pymod_2k78gslve1p7_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_2k78gslve1p7_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_2k78gslve1p7_API, "mod_2k78gslve1p7._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
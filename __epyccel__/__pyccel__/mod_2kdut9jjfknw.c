@@ -0,0 +1,18 @@
+#include "mod_2kdut9jjfknw.h"
+
+
+/*........................................*/
+void f1(t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    int64_t i_0001;
+    for (i = INT64_C(0); i < y.shape[INT64_C(1)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < y.shape[INT64_C(2)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(y, nd_int64, INT64_C(0), i, i_0001, INT64_C(0)) = GET_ELEMENT(x, nd_int64, i_0001, i);
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_2KDUT9JJFKNW_H
+#define MOD_2KDUT9JJFKNW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f1(t_ndarray x, t_ndarray y);
+#endif // mod_2kdut9jjfknw_H
@@ -0,0 +1,26 @@
+#include "mod_2kmo075ixjlb.h"
+
+
+/*........................................*/
+void stencil(t_ndarray u, t_ndarray out)
+{
+    int64_t n;
+    int64_t m;
+    int64_t i;
+    int64_t j;
+    n = u.shape[INT64_C(0)];
+    m = u.shape[INT64_C(1)];
+    {
+        double* restrict u_data = u.nd_double;
+        double* restrict out_data = out.nd_double;
+        for (i = INT64_C(1); i < n - INT64_C(1); i += INT64_C(1))
+        {
+            for (j = INT64_C(1); j < m - INT64_C(1); j += INT64_C(1))
+            {
+                out_data[i * out.shape[INT64_C(1)] + j] = 0.25 * (u_data[(i - INT64_C(1)) * u.shape[INT64_C(1)] + j] + u_data[(i + INT64_C(1)) * u.shape[INT64_C(1)] + j] + u_data[i * u.shape[INT64_C(1)] + (j - INT64_C(1))] + u_data[i * u.shape[INT64_C(1)] + (j + INT64_C(1))]);
+            }
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_2KMO075IXJLB_H
+#define MOD_2KMO075IXJLB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void stencil(t_ndarray u, t_ndarray out);
+#endif // mod_2kmo075ixjlb_H
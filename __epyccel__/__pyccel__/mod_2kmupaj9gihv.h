@@ -0,0 +1,11 @@
+#ifndef MOD_2KMUPAJ9GIHV_H
+#define MOD_2KMUPAJ9GIHV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_combined(t_ndarray x);
+#endif // mod_2kmupaj9gihv_H
@@ -0,0 +1,12 @@
+#ifndef MOD_2KOL4FJ1NQ10_H
+#define MOD_2KOL4FJ1NQ10_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_idiv(t_ndarray x, double a);
+#endif // mod_2kol4fj1nq10_H
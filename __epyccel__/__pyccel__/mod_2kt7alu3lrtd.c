@@ -0,0 +1,10 @@
+#include "mod_2kt7alu3lrtd.h"
+
+
+/*........................................*/
+bool one(void)
+{
+    return 1;
+}
+/*........................................*/
+
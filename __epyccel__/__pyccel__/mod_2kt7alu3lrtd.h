@@ -0,0 +1,10 @@
+#ifndef MOD_2KT7ALU3LRTD_H
+#define MOD_2KT7ALU3LRTD_H
+
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool one(void);
+#endif // mod_2kt7alu3lrtd_H
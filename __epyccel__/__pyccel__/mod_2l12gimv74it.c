@@ -0,0 +1,40 @@
+#include "mod_2l12gimv74it.h"
+
+
+/*........................................*/
+int64_t tuples_mul_homogeneous_2d(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009, int64_t* Out_0010, int64_t* Out_0011, int64_t* Out_0012)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    a = array_create(2, (int64_t[]){INT64_C(3), INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 6 * a.type_size);
+    b = array_create(2, (int64_t[]){INT64_C(6), INT64_C(2)}, nd_int64, false, order_c);
+    for (i = INT64_C(0); i < INT64_C(3); i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < INT64_C(2); i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(b, nd_int64, i, i_0001) = GET_ELEMENT(a, nd_int64, i, i_0001);
+            GET_ELEMENT(b, nd_int64, i + INT64_C(3), i_0001) = GET_ELEMENT(a, nd_int64, i, i_0001);
+        }
+    }
+    (*Out_0001) = GET_ELEMENT(b, nd_int64, INT64_C(0), INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(b, nd_int64, INT64_C(0), INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(b, nd_int64, INT64_C(1), INT64_C(0));
+    (*Out_0004) = GET_ELEMENT(b, nd_int64, INT64_C(1), INT64_C(1));
+    (*Out_0005) = GET_ELEMENT(b, nd_int64, INT64_C(2), INT64_C(0));
+    (*Out_0006) = GET_ELEMENT(b, nd_int64, INT64_C(2), INT64_C(1));
+    (*Out_0007) = GET_ELEMENT(b, nd_int64, INT64_C(3), INT64_C(0));
+    (*Out_0008) = GET_ELEMENT(b, nd_int64, INT64_C(3), INT64_C(1));
+    (*Out_0009) = GET_ELEMENT(b, nd_int64, INT64_C(4), INT64_C(0));
+    (*Out_0010) = GET_ELEMENT(b, nd_int64, INT64_C(4), INT64_C(1));
+    (*Out_0011) = GET_ELEMENT(b, nd_int64, INT64_C(5), INT64_C(0));
+    (*Out_0012) = GET_ELEMENT(b, nd_int64, INT64_C(5), INT64_C(1));
+    free_array(&a);
+    free_array(&b);
+    return 0;
+}
+/*........................................*/
+
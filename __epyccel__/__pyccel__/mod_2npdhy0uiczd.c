@@ -0,0 +1,24 @@
+#include "mod_2npdhy0uiczd.h"
+
+
+/*........................................*/
+t_ndarray annotated_return(t_ndarray b, t_ndarray c)
+{
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    Out_0001 = array_create(2, (int64_t[]){b.shape[INT64_C(0)], b.shape[INT64_C(1)]}, nd_double, false, order_c);
+    {
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < Out_0001.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < Out_0001.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                Out_0001_data[i * Out_0001.shape[INT64_C(1)] + i_0001] = GET_ELEMENT(b, nd_double, i, i_0001) + GET_ELEMENT(c, nd_double, i, i_0001);
+            }
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_2NPDHY0UICZD_H
+#define MOD_2NPDHY0UICZD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray annotated_return(t_ndarray b, t_ndarray c);
+#endif // mod_2npdhy0uiczd_H
@@ -0,0 +1,11 @@
+#ifndef MOD_2PFNOS1K52C8_H
+#define MOD_2PFNOS1K52C8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double return_arr_element(int64_t i);
+#endif // mod_2pfnos1k52c8_H
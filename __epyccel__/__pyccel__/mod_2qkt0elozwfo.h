@@ -0,0 +1,12 @@
+#ifndef MOD_2QKT0ELOZWFO_H
+#define MOD_2QKT0ELOZWFO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_multiple_negative_index_3(int64_t d, int64_t e, int64_t f, double* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_2qkt0elozwfo_H
@@ -0,0 +1,16 @@
+#include "mod_2r8wgs9kqyhj.h"
+
+
+/*........................................*/
+int64_t tmplt_1_0000(int64_t x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+double tmplt_1_0001(double x, double y)
+{
+    return x + y;
+}
+/*........................................*/
+
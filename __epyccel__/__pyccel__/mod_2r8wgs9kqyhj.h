@@ -0,0 +1,11 @@
+#ifndef MOD_2R8WGS9KQYHJ_H
+#define MOD_2R8WGS9KQYHJ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tmplt_1_0000(int64_t x, int64_t y);
+double tmplt_1_0001(double x, double y);
+#endif // mod_2r8wgs9kqyhj_H
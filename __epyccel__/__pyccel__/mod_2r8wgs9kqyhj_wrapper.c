@@ -0,0 +1,162 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_2R8WGS9KQYHJ_WRAPPER
+
+#include "mod_2r8wgs9kqyhj_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tmplt_1_0000_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    int64_t x;
+    int64_t y;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt64_to_Int64(x_obj);
+    y = PyInt64_to_Int64(y_obj);
+    Out_0001 = tmplt_1_0000(x, y);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* tmplt_1_0001_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    double x;
+    double y;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyDouble_to_Double(x_obj);
+    y = PyDouble_to_Double(y_obj);
+    Out_0001 = tmplt_1_0001(x, y);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t tmplt_1_type_check(PyObject* x_obj, PyObject* y_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeInt(x_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeFloat(x_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    if (PyIs_NativeInt(y_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeFloat(y_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument y");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* tmplt_1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    type_indicator = tmplt_1_type_check(x_obj, y_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return tmplt_1_0000_wrapper(x_obj, y_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return tmplt_1_0001_wrapper(x_obj, y_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_2r8wgs9kqyhj_methods[] = {
+    {
+        "tmplt_1",
+        (PyCFunction)tmplt_1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_2r8wgs9kqyhj_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_2r8wgs9kqyhj",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_2r8wgs9kqyhj_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_2r8wgs9kqyhj(void)
+{
+    PyObject* mod;
+    static void* Pymod_2r8wgs9kqyhj_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_2r8wgs9kqyhj_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_2r8wgs9kqyhj_API, "mod_2r8wgs9kqyhj._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_2RIDJD4XT1O8_H
+#define MOD_2RIDJD4XT1O8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_full_like_2_val(void);
+#endif // mod_2ridjd4xt1o8_H
@@ -0,0 +1,12 @@
+#include "mod_2rpucgwh8gzz.h"
+
+
+/*........................................*/
+double copysign_return_type(int64_t x, int64_t y)
+{
+    double a;
+    a = copysign((double)(x), (double)(y));
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_2RPUCGWH8GZZ_H
+#define MOD_2RPUCGWH8GZZ_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double copysign_return_type(int64_t x, int64_t y);
+#endif // mod_2rpucgwh8gzz_H
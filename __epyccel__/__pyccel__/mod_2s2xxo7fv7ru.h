@@ -0,0 +1,11 @@
+#ifndef MOD_2S2XXO7FV7RU_H
+#define MOD_2S2XXO7FV7RU_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_set_get_nested(bool nested);
+#endif // mod_2s2xxo7fv7ru_H
@@ -0,0 +1,11 @@
+#ifndef MOD_2T4LIA190A8Z_H
+#define MOD_2T4LIA190A8Z_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_3d_F_array_initialization_1(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_2t4lia190a8z_H
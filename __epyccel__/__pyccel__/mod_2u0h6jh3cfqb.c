@@ -0,0 +1,28 @@
+#include "mod_2u0h6jh3cfqb.h"
+
+
+/*........................................*/
+double f(void)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t array_dummy[INT64_C(4)];
+    t_ndarray y = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(2), INT64_C(2), INT64_C(1)},
+        .nd=3,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    double Out_0001;
+    x = array_create(2, (int64_t[]){INT64_C(2), INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)0.0, x);
+    array_fill((double)1.0, x);
+    array_fill((int64_t)INT64_C(0), y);
+    array_fill((int64_t)INT64_C(1), y);
+    Out_0001 = numpy_sum_float64(x) + numpy_sum_int64(y);
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_2U0H6JH3CFQB_H
+#define MOD_2U0H6JH3CFQB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f(void);
+#endif // mod_2u0h6jh3cfqb_H
@@ -0,0 +1,20 @@
+#include "mod_2uhzo6tu9zsb.h"
+
+
+/*........................................*/
+int64_t create_full_arg_names(int64_t val, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006)
+{
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int64, false, order_c);
+    array_fill(val, a);
+    (*Out_0001) = a.nd_int64[INT64_C(0)];
+    (*Out_0002) = a.nd_int64[INT64_C(1)];
+    (*Out_0003) = a.nd_int64[INT64_C(2)];
+    (*Out_0004) = a.nd_int64[a.shape[INT64_C(1)]];
+    (*Out_0005) = a.nd_int64[a.shape[INT64_C(1)] + INT64_C(1)];
+    (*Out_0006) = a.nd_int64[a.shape[INT64_C(1)] + INT64_C(2)];
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
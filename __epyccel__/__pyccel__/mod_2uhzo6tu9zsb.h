@@ -0,0 +1,11 @@
+#ifndef MOD_2UHZO6TU9ZSB_H
+#define MOD_2UHZO6TU9ZSB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_full_arg_names(int64_t val, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_2uhzo6tu9zsb_H
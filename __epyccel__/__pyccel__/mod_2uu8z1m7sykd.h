@@ -0,0 +1,12 @@
+#ifndef MOD_2UU8Z1M7SYKD_H
+#define MOD_2UU8Z1M7SYKD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuples_add_homogeneous_with_variables2(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_2uu8z1m7sykd_H
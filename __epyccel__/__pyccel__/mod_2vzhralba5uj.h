@@ -0,0 +1,11 @@
+#ifndef MOD_2VZHRALBA5UJ_H
+#define MOD_2VZHRALBA5UJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum(t_ndarray x);
+#endif // mod_2vzhralba5uj_H
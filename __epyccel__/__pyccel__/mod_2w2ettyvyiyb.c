@@ -0,0 +1,24 @@
+#include "mod_2w2ettyvyiyb.h"
+
+
+/*........................................*/
+void mix_complex_array_1_0000(t_ndarray x, double a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_cdouble, i) *= a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_complex_array_1_0001(t_ndarray x, double a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_cfloat, i) *= a;
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_2W2ETTYVYIYB_H
+#define MOD_2W2ETTYVYIYB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void mix_complex_array_1_0000(t_ndarray x, double a);
+void mix_complex_array_1_0001(t_ndarray x, double a);
+#endif // mod_2w2ettyvyiyb_H
@@ -0,0 +1,15 @@
+#include "mod_2xcxn1orvdx2.h"
+
+
+/*........................................*/
+int32_t create_empty_val_int32(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int32_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int32, false, order_c);
+    Out_0001 = a.nd_int32[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
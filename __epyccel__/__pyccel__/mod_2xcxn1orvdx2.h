@@ -0,0 +1,11 @@
+#ifndef MOD_2XCXN1ORVDX2_H
+#define MOD_2XCXN1ORVDX2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t create_empty_val_int32(void);
+#endif // mod_2xcxn1orvdx2_H
@@ -0,0 +1,10 @@
+#include "mod_2xq0t66ij2zi.h"
+
+
+/*........................................*/
+int64_t ceil_call(double x)
+{
+    return (int64_t)ceil(x);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_2XQ0T66IJ2ZI_H
+#define MOD_2XQ0T66IJ2ZI_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t ceil_call(double x);
+#endif // mod_2xq0t66ij2zi_H
@@ -0,0 +1,11 @@
+#include "mod_2yh6qxqpw44y.h"
+
+
+/*........................................*/
+bool test_omp_set_get_nested(bool nested)
+{
+    omp_set_nested(nested);
+    return omp_get_nested();
+}
+/*........................................*/
+
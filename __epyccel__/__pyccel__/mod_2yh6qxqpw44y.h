@@ -0,0 +1,11 @@
+#ifndef MOD_2YH6QXQPW44Y_H
+#define MOD_2YH6QXQPW44Y_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_set_get_nested(bool nested);
+#endif // mod_2yh6qxqpw44y_H
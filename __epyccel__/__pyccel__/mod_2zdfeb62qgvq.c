@@ -0,0 +1,12 @@
+#include "mod_2zdfeb62qgvq.h"
+
+
+/*........................................*/
+int64_t inhomogeneous_tuple_negative_slice(int64_t* a, bool* b)
+{
+    (*a) = INT64_C(1);
+    (*b) = 0;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_2ZDFEB62QGVQ_H
+#define MOD_2ZDFEB62QGVQ_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t inhomogeneous_tuple_negative_slice(int64_t* a, bool* b);
+#endif // mod_2zdfeb62qgvq_H
@@ -0,0 +1,4 @@
+
+def add_one(x : 'int'):
+    return x + 1
+
@@ -0,0 +1,11 @@
+#ifndef MOD_30YABODIYW6Z_H
+#define MOD_30YABODIYW6Z_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d, int64_t* x);
+#endif // mod_30yabodiyw6z_H
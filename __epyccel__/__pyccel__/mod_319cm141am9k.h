@@ -0,0 +1,12 @@
+#ifndef MOD_319CM141AM9K_H
+#define MOD_319CM141AM9K_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_like_1_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_319cm141am9k_H
@@ -0,0 +1,11 @@
+#ifndef MOD_31G5FEBD5GIE_H
+#define MOD_31G5FEBD5GIE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_31g5febd5gie_H
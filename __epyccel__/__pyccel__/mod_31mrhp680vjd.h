@@ -0,0 +1,11 @@
+#ifndef MOD_31MRHP680VJD_H
+#define MOD_31MRHP680VJD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_31mrhp680vjd_H
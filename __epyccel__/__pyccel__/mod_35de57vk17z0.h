@@ -0,0 +1,11 @@
+#ifndef MOD_35DE57VK17Z0_H
+#define MOD_35DE57VK17Z0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_35de57vk17z0_H
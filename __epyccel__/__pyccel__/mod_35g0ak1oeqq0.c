@@ -0,0 +1,23 @@
+#include "mod_35g0ak1oeqq0.h"
+
+
+/*........................................*/
+t_ndarray array_int_1d_initialization_4(void)
+{
+    int64_t i;
+    int64_t Dummy_0000;
+    t_ndarray b = {.raw_data = NULL};
+    b = array_create(1, (int64_t[]){INT64_C(10)}, nd_int64, false, order_c);
+    Dummy_0000 = INT64_C(0);
+    {
+        int64_t* restrict b_data = b.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(10); i += INT64_C(1))
+        {
+            b_data[Dummy_0000] = i * INT64_C(2);
+            Dummy_0000 = Dummy_0000 + INT64_C(1);
+        }
+    }
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_35G0AK1OEQQ0_H
+#define MOD_35G0AK1OEQQ0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_int_1d_initialization_4(void);
+#endif // mod_35g0ak1oeqq0_H
@@ -0,0 +1,40 @@
+#ifndef MOD_39A8834C7D65ED79217D1D52EC402B6D_WRAPPER_H
+#define MOD_39A8834C7D65ED79217D1D52EC402B6D_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_39a8834c7d65ed79217d1d52ec402b6d.h"
+
+
+#ifdef MOD_39A8834C7D65ED79217D1D52EC402B6D_WRAPPER
+
+
+#else
+
+static void** Pymod_39a8834c7d65ed79217d1d52ec402b6d_API;
+
+
+/*........................................*/
+static int mod_39a8834c7d65ed79217d1d52ec402b6d_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_39a8834c7d65ed79217d1d52ec402b6d_API = (void**)PyCapsule_Import("mod_39a8834c7d65ed79217d1d52ec402b6d._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_39a8834c7d65ed79217d1d52ec402b6d_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_39A8834C7D65ED79217D1D52EC402B6D_WRAPPER_H
@@ -0,0 +1,10 @@
+#include "mod_3bcgkm5nlugv.h"
+
+
+/*........................................*/
+double arctan_call_r(double x)
+{
+    return atan(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_3BCGKM5NLUGV_H
+#define MOD_3BCGKM5NLUGV_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double arctan_call_r(double x);
+#endif // mod_3bcgkm5nlugv_H
@@ -0,0 +1,11 @@
+#ifndef MOD_3CL1A519B1RC_H
+#define MOD_3CL1A519B1RC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_3cl1a519b1rc_H
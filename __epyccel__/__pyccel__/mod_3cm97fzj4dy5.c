@@ -0,0 +1,10 @@
+#include "mod_3cm97fzj4dy5.h"
+
+
+/*........................................*/
+double complex asin_call(double complex x)
+{
+    return casin(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_3CM97FZJ4DY5_H
+#define MOD_3CM97FZJ4DY5_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex asin_call(double complex x);
+#endif // mod_3cm97fzj4dy5_H
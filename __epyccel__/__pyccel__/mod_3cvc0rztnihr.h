@@ -0,0 +1,10 @@
+#ifndef MOD_3CVC0RZTNIHR_H
+#define MOD_3CVC0RZTNIHR_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_master(void);
+#endif // mod_3cvc0rztnihr_H
@@ -0,0 +1,10 @@
+#include "mod_3dzqqbkh598e.h"
+
+
+/*........................................*/
+double erfc_call(double x)
+{
+    return erfc(x);
+}
+/*........................................*/
+
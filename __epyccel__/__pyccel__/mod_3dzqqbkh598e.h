@@ -0,0 +1,10 @@
+#ifndef MOD_3DZQQBKH598E_H
+#define MOD_3DZQQBKH598E_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double erfc_call(double x);
+#endif // mod_3dzqqbkh598e_H
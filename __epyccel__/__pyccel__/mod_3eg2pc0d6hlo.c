@@ -0,0 +1,16 @@
+#include "mod_3eg2pc0d6hlo.h"
+
+
+/*........................................*/
+bool isfinite_call_0000(double x)
+{
+    return isfinite(x);
+}
+/*........................................*/
+/*........................................*/
+bool isfinite_call_0001(double complex x)
+{
+    return isfinite(cimag(x)) && isfinite(creal(x));
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_3EG2PC0D6HLO_H
+#define MOD_3EG2PC0D6HLO_H
+
+#include <complex.h>
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool isfinite_call_0000(double x);
+bool isfinite_call_0001(double complex x);
+#endif // mod_3eg2pc0d6hlo_H
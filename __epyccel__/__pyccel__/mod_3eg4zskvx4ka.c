@@ -0,0 +1,23 @@
+#include "mod_3eg4zskvx4ka.h"
+
+
+/*........................................*/
+int64_t tuple_multilevel_inhomogeneous(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    int64_t a_0;
+    int64_t a_1_0;
+    t_ndarray a_1_1 = {.raw_data = NULL};
+    a_1_1 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    a_0 = INT64_C(1);
+    a_1_0 = INT64_C(2);
+    int64_t Dummy_0000[] = {INT64_C(3), INT64_C(4)};
+    memcpy(&a_1_1.nd_int64[INT64_C(0)], Dummy_0000, 2 * a_1_1.type_size);
+    (*Out_0001) = a_0;
+    (*Out_0002) = a_1_0;
+    (*Out_0003) = GET_ELEMENT(a_1_1, nd_int64, INT64_C(0));
+    (*Out_0004) = GET_ELEMENT(a_1_1, nd_int64, INT64_C(1));
+    free_array(&a_1_1);
+    return 0;
+}
+/*........................................*/
+
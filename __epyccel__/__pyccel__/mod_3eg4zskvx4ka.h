@@ -0,0 +1,12 @@
+#ifndef MOD_3EG4ZSKVX4KA_H
+#define MOD_3EG4ZSKVX4KA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_multilevel_inhomogeneous(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_3eg4zskvx4ka_H
@@ -0,0 +1,42 @@
+#ifndef MOD_3HI9035O1X2H_WRAPPER_H
+#define MOD_3HI9035O1X2H_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_3hi9035o1x2h.h"
+
+
+#ifdef MOD_3HI9035O1X2H_WRAPPER
+
+
+#else
+
+static void** Pymod_3hi9035o1x2h_API;
+
+
+/*........................................*/
+static int mod_3hi9035o1x2h_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_3hi9035o1x2h_API = (void**)PyCapsule_Import("mod_3hi9035o1x2h._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_3hi9035o1x2h_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_3HI9035O1X2H_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_3HVDTXFQK3Q2_H
+#define MOD_3HVDTXFQK3Q2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_scalar_mul(t_ndarray x, int64_t a);
+#endif // mod_3hvdtxfqk3q2_H
@@ -0,0 +1,11 @@
+#ifndef MOD_3JWD6DO9XMRP_H
+#define MOD_3JWD6DO9XMRP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_nowait(t_ndarray x, t_ndarray y, t_ndarray z);
+#endif // mod_3jwd6do9xmrp_H
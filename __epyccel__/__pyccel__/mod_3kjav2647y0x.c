@@ -0,0 +1,12 @@
+#include "mod_3kjav2647y0x.h"
+
+
+/*........................................*/
+int64_t test_shape_2d(t_ndarray f, int64_t* a, int64_t* b)
+{
+    (*a) = f.shape[INT64_C(0)];
+    (*b) = f.shape[INT64_C(1)];
+    return 0;
+}
+/*........................................*/
+
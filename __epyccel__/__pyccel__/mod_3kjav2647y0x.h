@@ -0,0 +1,11 @@
+#ifndef MOD_3KJAV2647Y0X_H
+#define MOD_3KJAV2647Y0X_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_shape_2d(t_ndarray f, int64_t* a, int64_t* b);
+#endif // mod_3kjav2647y0x_H
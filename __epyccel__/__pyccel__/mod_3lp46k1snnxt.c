@@ -0,0 +1,28 @@
+#include "mod_3lp46k1snnxt.h"
+
+
+/*........................................*/
+int64_t arrs_different_shapes_0(void)
+{
+    int64_t i;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i_0001;
+    i = INT64_C(5);
+    a = array_create(1, (int64_t[]){INT64_C(10)}, nd_double, false, order_c);
+    array_fill((double)0.0, a);
+    b = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        double* restrict b_data = b.nd_double;
+        for (i_0001 = INT64_C(0); i_0001 < INT64_C(2); i_0001 += INT64_C(1))
+        {
+            b_data[i_0001] = a_data[i_0001 + INT64_C(2)] + a_data[i_0001 + INT64_C(4)];
+        }
+    }
+    free_array(&a);
+    free_array(&b);
+    return INT64_C(2);
+}
+/*........................................*/
+
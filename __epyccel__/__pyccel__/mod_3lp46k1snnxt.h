@@ -0,0 +1,11 @@
+#ifndef MOD_3LP46K1SNNXT_H
+#define MOD_3LP46K1SNNXT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_different_shapes_0(void);
+#endif // mod_3lp46k1snnxt_H
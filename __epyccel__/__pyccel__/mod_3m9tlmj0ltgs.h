@@ -0,0 +1,18 @@
+#ifndef MOD_3M9TLMJ0LTGS_H
+#define MOD_3M9TLMJ0LTGS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t get_double_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+int64_t get_double_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+int64_t get_double_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+int64_t get_double_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+int64_t get_double_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+int64_t get_double_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+int64_t get_double_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+#endif // mod_3m9tlmj0ltgs_H
@@ -0,0 +1,12 @@
+#ifndef MOD_3Q3Z2H2WEJQ3_H
+#define MOD_3Q3Z2H2WEJQ3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_sum(void);
+#endif // mod_3q3z2h2wejq3_H
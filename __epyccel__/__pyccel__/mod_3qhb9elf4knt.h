@@ -0,0 +1,11 @@
+#ifndef MOD_3QHB9ELF4KNT_H
+#define MOD_3QHB9ELF4KNT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_sub(t_ndarray x, t_ndarray y);
+#endif // mod_3qhb9elf4knt_H
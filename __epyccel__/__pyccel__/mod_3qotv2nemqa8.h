@@ -0,0 +1,11 @@
+#ifndef MOD_3QOTV2NEMQA8_H
+#define MOD_3QOTV2NEMQA8_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_3qotv2nemqa8_H
@@ -0,0 +1,10 @@
+#include "mod_3rlt4trqfbv0.h"
+
+
+/*........................................*/
+double exp_call_i(int64_t x)
+{
+    return exp((double)(x));
+}
+/*........................................*/
+
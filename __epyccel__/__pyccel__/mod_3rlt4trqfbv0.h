@@ -0,0 +1,11 @@
+#ifndef MOD_3RLT4TRQFBV0_H
+#define MOD_3RLT4TRQFBV0_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double exp_call_i(int64_t x);
+#endif // mod_3rlt4trqfbv0_H
@@ -0,0 +1,16 @@
+#include "mod_3rtqxk7578mt.h"
+
+
+/*........................................*/
+bool isinf_call_0000(double x)
+{
+    return isinf(x);
+}
+/*........................................*/
+/*........................................*/
+bool isinf_call_0001(double complex x)
+{
+    return isinf(cimag(x)) || isinf(creal(x));
+}
+/*........................................*/
+
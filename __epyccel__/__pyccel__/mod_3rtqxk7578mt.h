@@ -0,0 +1,13 @@
+#ifndef MOD_3RTQXK7578MT_H
+#define MOD_3RTQXK7578MT_H
+
+#include <complex.h>
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool isinf_call_0000(double x);
+bool isinf_call_0001(double complex x);
+#endif // mod_3rtqxk7578mt_H
@@ -0,0 +1,145 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_3RTQXK7578MT_WRAPPER
+
+#include "mod_3rtqxk7578mt_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* isinf_call_0000_wrapper(PyObject* x_obj)
+{
+    double x;
+    bool Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyDouble_to_Double(x_obj);
+    Out_0001 = isinf_call_0000(x);
+    Out_0001_obj = Bool_to_PyBool(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* isinf_call_0001_wrapper(PyObject* x_obj)
+{
+    double complex x;
+    bool Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    Out_0001 = isinf_call_0001(x);
+    Out_0001_obj = Bool_to_PyBool(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t isinf_call_type_check(PyObject* x_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeFloat(x_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeComplex(x_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* isinf_call_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    type_indicator = isinf_call_type_check(x_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return isinf_call_0000_wrapper(x_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return isinf_call_0001_wrapper(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_3rtqxk7578mt_methods[] = {
+    {
+        "isinf_call",
+        (PyCFunction)isinf_call_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_3rtqxk7578mt_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_3rtqxk7578mt",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_3rtqxk7578mt_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_3rtqxk7578mt(void)
+{
+    PyObject* mod;
+    static void* Pymod_3rtqxk7578mt_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_3rtqxk7578mt_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_3rtqxk7578mt_API, "mod_3rtqxk7578mt._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_3SVG9T0XCKZO_H
+#define MOD_3SVG9T0XCKZO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_mul(t_ndarray x, t_ndarray y);
+#endif // mod_3svg9t0xckzo_H
@@ -0,0 +1,13 @@
+#ifndef MOD_3TOE5TW7WDXE_H
+#define MOD_3TOE5TW7WDXE_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float complex create_full_like_val_real_complex64(double val);
+#endif // mod_3toe5tw7wdxe_H
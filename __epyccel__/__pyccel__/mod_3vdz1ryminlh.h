@@ -0,0 +1,10 @@
+#ifndef MOD_3VDZ1RYMINLH_H
+#define MOD_3VDZ1RYMINLH_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double cosh_phrase(double x, double y);
+#endif // mod_3vdz1ryminlh_H
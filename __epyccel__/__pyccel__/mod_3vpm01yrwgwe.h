@@ -0,0 +1,11 @@
+#ifndef MOD_3VPM01YRWGWE_H
+#define MOD_3VPM01YRWGWE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_barrier(void);
+#endif // mod_3vpm01yrwgwe_H
@@ -0,0 +1,11 @@
+#ifndef MOD_3W3NHSB5UUZX_H
+#define MOD_3W3NHSB5UUZX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_sub(t_ndarray x, int64_t a);
+#endif // mod_3w3nhsb5uuzx_H
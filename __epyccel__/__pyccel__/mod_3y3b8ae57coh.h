@@ -0,0 +1,11 @@
+#ifndef MOD_3Y3B8AE57COH_H
+#define MOD_3Y3B8AE57COH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_1D_2(t_ndarray a);
+#endif // mod_3y3b8ae57coh_H
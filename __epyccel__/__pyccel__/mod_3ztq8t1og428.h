@@ -0,0 +1,11 @@
+#ifndef MOD_3ZTQ8T1OG428_H
+#define MOD_3ZTQ8T1OG428_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_div_stack_array(void);
+#endif // mod_3ztq8t1og428_H
@@ -0,0 +1,27 @@
+#include "mod_3zwgh934tws9.h"
+
+
+/*........................................*/
+int64_t unpack_array_2D_of_known_size(double* Out_0001, double* Out_0002, double* Out_0003)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    t_ndarray z = {.raw_data = NULL};
+    arr = array_create(2, (int64_t[]){INT64_C(3), INT64_C(3)}, nd_double, false, order_c);
+    double Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6), INT64_C(7), INT64_C(8), INT64_C(9)};
+    memcpy(&arr.nd_double[INT64_C(0)], Dummy_0000, 9 * arr.type_size);
+    x = array_slicing(arr, 1, new_slice(INT64_C(0), INT64_C(1), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE));
+    y = array_slicing(arr, 1, new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE));
+    z = array_slicing(arr, 1, new_slice(INT64_C(2), INT64_C(3), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE));
+    (*Out_0001) = numpy_sum_float64(x);
+    (*Out_0002) = numpy_sum_float64(y);
+    (*Out_0003) = numpy_sum_float64(z);
+    free_pointer(&z);
+    free_pointer(&x);
+    free_array(&arr);
+    free_pointer(&y);
+    return 0;
+}
+/*........................................*/
+
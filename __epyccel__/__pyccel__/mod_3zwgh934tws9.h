@@ -0,0 +1,12 @@
+#ifndef MOD_3ZWGH934TWS9_H
+#define MOD_3ZWGH934TWS9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t unpack_array_2D_of_known_size(double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_3zwgh934tws9_H
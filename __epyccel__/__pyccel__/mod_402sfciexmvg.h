@@ -0,0 +1,10 @@
+#ifndef MOD_402SFCIEXMVG_H
+#define MOD_402SFCIEXMVG_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_sections(void);
+#endif // mod_402sfciexmvg_H
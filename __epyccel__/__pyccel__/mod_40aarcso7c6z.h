@@ -0,0 +1,13 @@
+#ifndef MOD_40AARCSO7C6Z_H
+#define MOD_40AARCSO7C6Z_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_3_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_40aarcso7c6z_H
@@ -0,0 +1,92 @@
+#include "mod_44ezcb9v090t.h"
+
+
+/*........................................*/
+int64_t get_imag_0000(bool a)
+{
+    int64_t b;
+    b = INT64_C(0);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_imag_0001(int64_t a)
+{
+    int64_t b;
+    b = INT64_C(0);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_imag_0002(int8_t a)
+{
+    int8_t b;
+    b = 0;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_imag_0003(int16_t a)
+{
+    int16_t b;
+    b = 0;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int32_t get_imag_0004(int32_t a)
+{
+    int32_t b;
+    b = 0;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_imag_0005(int64_t a)
+{
+    int64_t b;
+    b = INT64_C(0);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_imag_0006(double a)
+{
+    double b;
+    b = 0.0;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_imag_0007(float a)
+{
+    float b;
+    b = 0.0f;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_imag_0008(double a)
+{
+    double b;
+    b = 0.0;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_imag_0009(float complex a)
+{
+    float b;
+    b = cimag(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_imag_0010(double complex a)
+{
+    double b;
+    b = cimag(a);
+    return b;
+}
+/*........................................*/
+
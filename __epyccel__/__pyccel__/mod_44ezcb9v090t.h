@@ -0,0 +1,22 @@
+#ifndef MOD_44EZCB9V090T_H
+#define MOD_44EZCB9V090T_H
+
+#include <complex.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t get_imag_0000(bool a);
+int64_t get_imag_0001(int64_t a);
+int8_t get_imag_0002(int8_t a);
+int16_t get_imag_0003(int16_t a);
+int32_t get_imag_0004(int32_t a);
+int64_t get_imag_0005(int64_t a);
+double get_imag_0006(double a);
+float get_imag_0007(float a);
+double get_imag_0008(double a);
+float get_imag_0009(float complex a);
+double get_imag_0010(double complex a);
+#endif // mod_44ezcb9v090t_H
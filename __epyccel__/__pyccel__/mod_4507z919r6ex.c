@@ -0,0 +1,10 @@
+#include "mod_4507z919r6ex.h"
+
+
+/*........................................*/
+double remainder_call(double x, double y)
+{
+    return remainder(x, y);
+}
+/*........................................*/
+
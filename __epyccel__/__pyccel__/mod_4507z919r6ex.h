@@ -0,0 +1,10 @@
+#ifndef MOD_4507Z919R6EX_H
+#define MOD_4507Z919R6EX_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double remainder_call(double x, double y);
+#endif // mod_4507z919r6ex_H
@@ -0,0 +1,40 @@
+#ifndef MOD_4507Z919R6EX_WRAPPER_H
+#define MOD_4507Z919R6EX_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_4507z919r6ex.h"
+
+
+#ifdef MOD_4507Z919R6EX_WRAPPER
+
+
+#else
+
+static void** Pymod_4507z919r6ex_API;
+
+
+/*........................................*/
+static int mod_4507z919r6ex_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_4507z919r6ex_API = (void**)PyCapsule_Import("mod_4507z919r6ex._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_4507z919r6ex_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_4507Z919R6EX_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_45FFS1MGDTZY_H
+#define MOD_45FFS1MGDTZY_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_active_level(void);
+#endif // mod_45ffs1mgdtzy_H
@@ -0,0 +1,12 @@
+#ifndef MOD_45S55FW9XSOU_H
+#define MOD_45S55FW9XSOU_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_45s55fw9xsou_H
@@ -0,0 +1,12 @@
+#ifndef MOD_45X3WO0J4QFG_H
+#define MOD_45X3WO0J4QFG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float create_ones_like_val_float32(void);
+#endif // mod_45x3wo0j4qfg_H
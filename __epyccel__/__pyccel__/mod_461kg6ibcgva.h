@@ -0,0 +1,11 @@
+#ifndef MOD_461KG6IBCGVA_H
+#define MOD_461KG6IBCGVA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_mul(t_ndarray x, double a);
+#endif // mod_461kg6ibcgva_H
@@ -0,0 +1,14 @@
+#include "mod_491rrr8upanu.h"
+
+
+/*........................................*/
+void array_float_1d_mul(t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) *= GET_ELEMENT(y, nd_double, i);
+    }
+}
+/*........................................*/
+
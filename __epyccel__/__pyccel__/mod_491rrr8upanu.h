@@ -0,0 +1,11 @@
+#ifndef MOD_491RRR8UPANU_H
+#define MOD_491RRR8UPANU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_491rrr8upanu_H
@@ -0,0 +1,12 @@
+#ifndef MOD_49EZKJ22EKPR_H
+#define MOD_49EZKJ22EKPR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_2d_C_array_initialization(t_ndarray a);
+#endif // mod_49ezkj22ekpr_H
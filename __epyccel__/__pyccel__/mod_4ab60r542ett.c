@@ -0,0 +1,18 @@
+#include "mod_4ab60r542ett.h"
+
+
+/*........................................*/
+int64_t omp_tasks(int64_t x)
+{
+    int64_t m;
+    #pragma omp parallel
+    {
+        #pragma omp single
+        {
+            m = fib(x);
+        }
+    }
+    return m;
+}
+/*........................................*/
+
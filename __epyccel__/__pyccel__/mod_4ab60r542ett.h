@@ -0,0 +1,10 @@
+#ifndef MOD_4AB60R542ETT_H
+#define MOD_4AB60R542ETT_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_tasks(int64_t x);
+#endif // mod_4ab60r542ett_H
@@ -0,0 +1,14 @@
+#include "mod_4aoloyl7gqyy.h"
+
+
+/*........................................*/
+void axpy(double a, t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(y, nd_double, i) = a * GET_ELEMENT(x, nd_double, i) + GET_ELEMENT(y, nd_double, i);
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_4AOLOYL7GQYY_H
+#define MOD_4AOLOYL7GQYY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void axpy(double a, t_ndarray x, t_ndarray y);
+#endif // mod_4aoloyl7gqyy_H
@@ -0,0 +1,13 @@
+#ifndef MOD_4AWB1JC6RXLH_H
+#define MOD_4AWB1JC6RXLH_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_mod(t_ndarray x, t_ndarray y);
+#endif // mod_4awb1jc6rxlh_H
@@ -0,0 +1,54 @@
+#include "mod_4bda6yom3swu.h"
+
+
+/*........................................*/
+double multiple_stack_array_2(void)
+{
+    double array_dummy[INT64_C(5)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t array_dummy_0001[INT64_C(5)];
+    t_ndarray b = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    int64_t array_dummy_0002[INT64_C(5)];
+    t_ndarray c = (t_ndarray){
+        .nd_int64=array_dummy_0002,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&c);
+    int64_t i;
+    double s;
+    array_fill((double)1.0, a);
+    int64_t Dummy_0000[] = {INT64_C(2), INT64_C(4), INT64_C(6), INT64_C(8), INT64_C(10)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0000, 5 * b.type_size);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(3), INT64_C(5), INT64_C(7), INT64_C(9)};
+    memcpy(&c.nd_int64[INT64_C(0)], Dummy_0001, 5 * c.type_size);
+    s = 0.0;
+    {
+        int64_t* restrict c_data = c.nd_int64;
+        double* restrict a_data = a.nd_double;
+        int64_t* restrict b_data = b.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            s = s + b_data[i] - a_data[i] / c_data[i];
+        }
+    }
+    return s;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_4BDA6YOM3SWU_H
+#define MOD_4BDA6YOM3SWU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_2(void);
+#endif // mod_4bda6yom3swu_H
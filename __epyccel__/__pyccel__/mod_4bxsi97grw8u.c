@@ -0,0 +1,18 @@
+#include "mod_4bxsi97grw8u.h"
+
+
+/*........................................*/
+int64_t omp_tasks(int64_t x)
+{
+    int64_t m;
+    #pragma omp parallel
+    {
+        #pragma omp single
+        {
+            m = fib(x);
+        }
+    }
+    return m;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_4BXSI97GRW8U_H
+#define MOD_4BXSI97GRW8U_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_tasks(int64_t x);
+#endif // mod_4bxsi97grw8u_H
@@ -0,0 +1,12 @@
+#include "mod_4ciwufgf7kyu.h"
+
+
+/*........................................*/
+double complex sqrt_complex_abs(double complex x)
+{
+    double complex a;
+    a = (double complex)(cabs(x)) + (double complex)(cabs(x));
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_4CIWUFGF7KYU_H
+#define MOD_4CIWUFGF7KYU_H
+
+#include <complex.h>
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double complex sqrt_complex_abs(double complex x);
+#endif // mod_4ciwufgf7kyu_H
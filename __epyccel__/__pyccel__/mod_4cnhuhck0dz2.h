@@ -0,0 +1,11 @@
+#ifndef MOD_4CNHUHCK0DZ2_H
+#define MOD_4CNHUHCK0DZ2_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_4cnhuhck0dz2_H
@@ -0,0 +1,11 @@
+#ifndef MOD_4F9UXV97HIOX_H
+#define MOD_4F9UXV97HIOX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f2(t_ndarray x, int64_t* n, int64_t* m, int64_t* p, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_4f9uxv97hiox_H
@@ -0,0 +1,12 @@
+#ifndef MOD_4G1M3E756GMU_H
+#define MOD_4G1M3E756GMU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_ones_like_val_float(void);
+#endif // mod_4g1m3e756gmu_H
@@ -0,0 +1,10 @@
+#include "mod_4h795iq3s2dj.h"
+
+
+/*........................................*/
+double log2_call(double x)
+{
+    return log2(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_4H795IQ3S2DJ_H
+#define MOD_4H795IQ3S2DJ_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log2_call(double x);
+#endif // mod_4h795iq3s2dj_H
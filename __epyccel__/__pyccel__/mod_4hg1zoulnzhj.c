@@ -0,0 +1,263 @@
+#include "mod_4hg1zoulnzhj.h"
+
+
+/*........................................*/
+int64_t get_chosen_elements_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    Dummy_0000 = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    {
+        int64_t* restrict Dummy_0000_data = Dummy_0000.nd_int64;
+        for (i = INT64_C(0); i < Dummy_0000.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Dummy_0000_data[i] = GET_ELEMENT(arr, nd_bool, i) * INT64_C(2);
+        }
+    }
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    {
+        int64_t* restrict Dummy_0000_data_0001 = Dummy_0000.nd_int64;
+        int64_t* restrict a_data = a.nd_int64;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = GET_ELEMENT(arr, nd_bool, i) > INT64_C(5) ? GET_ELEMENT(arr, nd_bool, i) : Dummy_0000_data_0001[i];
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0001, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_int64[INT64_C(1)];
+    (*Out_0004) = a.nd_int64[INT64_C(0)];
+    free_array(&Dummy_0000);
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_chosen_elements_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    Dummy_0000 = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    {
+        int64_t* restrict Dummy_0000_data = Dummy_0000.nd_int64;
+        for (i = INT64_C(0); i < Dummy_0000.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Dummy_0000_data[i] = GET_ELEMENT(arr, nd_int64, i) * INT64_C(2);
+        }
+    }
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    {
+        int64_t* restrict Dummy_0000_data_0001 = Dummy_0000.nd_int64;
+        int64_t* restrict a_data = a.nd_int64;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = GET_ELEMENT(arr, nd_int64, i) > INT64_C(5) ? GET_ELEMENT(arr, nd_int64, i) : Dummy_0000_data_0001[i];
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0001, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_int64[INT64_C(1)];
+    (*Out_0004) = a.nd_int64[INT64_C(0)];
+    free_array(&Dummy_0000);
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_chosen_elements_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    Dummy_0000 = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int8, false, order_c);
+    {
+        int8_t* restrict Dummy_0000_data = Dummy_0000.nd_int8;
+        for (i = INT64_C(0); i < Dummy_0000.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Dummy_0000_data[i] = GET_ELEMENT(arr, nd_int8, i) * INT64_C(2);
+        }
+    }
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int8, false, order_c);
+    {
+        int8_t* restrict Dummy_0000_data_0001 = Dummy_0000.nd_int8;
+        int8_t* restrict a_data = a.nd_int8;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = GET_ELEMENT(arr, nd_int8, i) > INT64_C(5) ? GET_ELEMENT(arr, nd_int8, i) : Dummy_0000_data_0001[i];
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0001, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_int8[INT64_C(1)];
+    (*Out_0004) = a.nd_int8[INT64_C(0)];
+    free_array(&Dummy_0000);
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_chosen_elements_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    Dummy_0000 = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int16, false, order_c);
+    {
+        int16_t* restrict Dummy_0000_data = Dummy_0000.nd_int16;
+        for (i = INT64_C(0); i < Dummy_0000.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Dummy_0000_data[i] = GET_ELEMENT(arr, nd_int16, i) * INT64_C(2);
+        }
+    }
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int16, false, order_c);
+    {
+        int16_t* restrict Dummy_0000_data_0001 = Dummy_0000.nd_int16;
+        int16_t* restrict a_data = a.nd_int16;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = GET_ELEMENT(arr, nd_int16, i) > INT64_C(5) ? GET_ELEMENT(arr, nd_int16, i) : Dummy_0000_data_0001[i];
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0001, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_int16[INT64_C(1)];
+    (*Out_0004) = a.nd_int16[INT64_C(0)];
+    free_array(&Dummy_0000);
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_chosen_elements_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    Dummy_0000 = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int32, false, order_c);
+    {
+        int32_t* restrict Dummy_0000_data = Dummy_0000.nd_int32;
+        for (i = INT64_C(0); i < Dummy_0000.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Dummy_0000_data[i] = GET_ELEMENT(arr, nd_int32, i) * INT64_C(2);
+        }
+    }
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_int32, false, order_c);
+    {
+        int32_t* restrict Dummy_0000_data_0001 = Dummy_0000.nd_int32;
+        int32_t* restrict a_data = a.nd_int32;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = GET_ELEMENT(arr, nd_int32, i) > INT64_C(5) ? GET_ELEMENT(arr, nd_int32, i) : Dummy_0000_data_0001[i];
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0001, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_int32[INT64_C(1)];
+    (*Out_0004) = a.nd_int32[INT64_C(0)];
+    free_array(&Dummy_0000);
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_chosen_elements_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003, double* Out_0004)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    Dummy_0000 = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict Dummy_0000_data = Dummy_0000.nd_double;
+        for (i = INT64_C(0); i < Dummy_0000.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Dummy_0000_data[i] = GET_ELEMENT(arr, nd_double, i) * INT64_C(2);
+        }
+    }
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict Dummy_0000_data_0001 = Dummy_0000.nd_double;
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = GET_ELEMENT(arr, nd_double, i) > INT64_C(5) ? GET_ELEMENT(arr, nd_double, i) : Dummy_0000_data_0001[i];
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0001, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_double[INT64_C(1)];
+    (*Out_0004) = a.nd_double[INT64_C(0)];
+    free_array(&Dummy_0000);
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_chosen_elements_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float* Out_0003, float* Out_0004)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    Dummy_0000 = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_float, false, order_c);
+    {
+        float* restrict Dummy_0000_data = Dummy_0000.nd_float;
+        for (i = INT64_C(0); i < Dummy_0000.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Dummy_0000_data[i] = GET_ELEMENT(arr, nd_float, i) * INT64_C(2);
+        }
+    }
+    a = array_create(1, (int64_t[]){arr.shape[INT64_C(0)]}, nd_float, false, order_c);
+    {
+        float* restrict Dummy_0000_data_0001 = Dummy_0000.nd_float;
+        float* restrict a_data = a.nd_float;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = GET_ELEMENT(arr, nd_float, i) > INT64_C(5) ? GET_ELEMENT(arr, nd_float, i) : Dummy_0000_data_0001[i];
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0001, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_float[INT64_C(1)];
+    (*Out_0004) = a.nd_float[INT64_C(0)];
+    free_array(&Dummy_0000);
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
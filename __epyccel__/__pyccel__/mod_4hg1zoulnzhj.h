@@ -0,0 +1,18 @@
+#ifndef MOD_4HG1ZOULNZHJ_H
+#define MOD_4HG1ZOULNZHJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t get_chosen_elements_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+int64_t get_chosen_elements_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+int64_t get_chosen_elements_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004);
+int64_t get_chosen_elements_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004);
+int64_t get_chosen_elements_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004);
+int64_t get_chosen_elements_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003, double* Out_0004);
+int64_t get_chosen_elements_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float* Out_0003, float* Out_0004);
+#endif // mod_4hg1zoulnzhj_H
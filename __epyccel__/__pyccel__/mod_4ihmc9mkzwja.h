@@ -0,0 +1,11 @@
+#ifndef MOD_4IHMC9MKZWJA_H
+#define MOD_4IHMC9MKZWJA_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_4ihmc9mkzwja_H
@@ -0,0 +1,16 @@
+#include "mod_4jimphr12zhj.h"
+
+
+/*........................................*/
+int64_t multi_heads_1_0000(int64_t x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+double multi_heads_1_0001(int64_t x, double y)
+{
+    return x + y;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_4JIMPHR12ZHJ_H
+#define MOD_4JIMPHR12ZHJ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t multi_heads_1_0000(int64_t x, int64_t y);
+double multi_heads_1_0001(int64_t x, double y);
+#endif // mod_4jimphr12zhj_H
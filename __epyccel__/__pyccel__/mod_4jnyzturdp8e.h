@@ -0,0 +1,12 @@
+#ifndef MOD_4JNYZTURDP8E_H
+#define MOD_4JNYZTURDP8E_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_zeros_like_2_val(void);
+#endif // mod_4jnyzturdp8e_H
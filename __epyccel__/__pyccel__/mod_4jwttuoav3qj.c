@@ -0,0 +1,10 @@
+#include "mod_4jwttuoav3qj.h"
+
+
+/*........................................*/
+double complex cosh_call(double complex x)
+{
+    return ccosh(x);
+}
+/*........................................*/
+
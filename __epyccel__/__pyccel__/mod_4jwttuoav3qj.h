@@ -0,0 +1,10 @@
+#ifndef MOD_4JWTTUOAV3QJ_H
+#define MOD_4JWTTUOAV3QJ_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex cosh_call(double complex x);
+#endif // mod_4jwttuoav3qj_H
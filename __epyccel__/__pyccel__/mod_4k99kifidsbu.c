@@ -0,0 +1,12 @@
+#include "mod_4k99kifidsbu.h"
+
+
+/*........................................*/
+int64_t ceil_phrase(double x, double y)
+{
+    int64_t a;
+    a = (int64_t)ceil(x) * (int64_t)ceil(y);
+    return a;
+}
+/*........................................*/
+
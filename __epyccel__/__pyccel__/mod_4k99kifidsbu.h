@@ -0,0 +1,11 @@
+#ifndef MOD_4K99KIFIDSBU_H
+#define MOD_4K99KIFIDSBU_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t ceil_phrase(double x, double y);
+#endif // mod_4k99kifidsbu_H
@@ -0,0 +1,11 @@
+#ifndef MOD_4KM8OXIRAR15_H
+#define MOD_4KM8OXIRAR15_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_4km8oxirar15_H
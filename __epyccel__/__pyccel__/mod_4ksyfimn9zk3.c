@@ -0,0 +1,10 @@
+#include "mod_4ksyfimn9zk3.h"
+
+
+/*........................................*/
+bool isfinite_call(double x)
+{
+    return isfinite(x);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_4KSYFIMN9ZK3_H
+#define MOD_4KSYFIMN9ZK3_H
+
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool isfinite_call(double x);
+#endif // mod_4ksyfimn9zk3_H
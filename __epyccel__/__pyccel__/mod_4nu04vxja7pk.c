@@ -0,0 +1,28 @@
+#include "mod_4nu04vxja7pk.h"
+
+
+/*........................................*/
+int8_t mult_on_array_int8(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int8_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    array_fill((int8_t)1, a);
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    {
+        int8_t* restrict a_data = a.nd_int8;
+        int8_t* restrict b_data = b.nd_int8;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            b_data[i] = a_data[i] * INT64_C(2);
+        }
+    }
+    Out_0001 = b.nd_int8[INT64_C(0)];
+    free_array(&a);
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_4NU04VXJA7PK_H
+#define MOD_4NU04VXJA7PK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int8_t mult_on_array_int8(void);
+#endif // mod_4nu04vxja7pk_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4NU04VXJA7PK_WRAPPER
+
+#include "mod_4nu04vxja7pk_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* mult_on_array_int8_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int8_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = mult_on_array_int8();
+    Out_0001_obj = Int8_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4nu04vxja7pk_methods[] = {
+    {
+        "mult_on_array_int8",
+        (PyCFunction)mult_on_array_int8_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4nu04vxja7pk_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4nu04vxja7pk",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4nu04vxja7pk_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4nu04vxja7pk(void)
+{
+    PyObject* mod;
+    static void* Pymod_4nu04vxja7pk_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4nu04vxja7pk_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4nu04vxja7pk_API, "mod_4nu04vxja7pk._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
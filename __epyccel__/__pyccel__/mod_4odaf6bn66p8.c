@@ -0,0 +1,32 @@
+#include "mod_4odaf6bn66p8.h"
+
+
+/*........................................*/
+int64_t arrs_uncertain_shape_1(void)
+{
+    int64_t i;
+    int64_t j;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i_0001;
+    int64_t Out_0001;
+    i = INT64_C(4);
+    j = INT64_C(6);
+    a = array_create(1, (int64_t[]){INT64_C(10)}, nd_double, false, order_c);
+    array_fill((double)0.0, a);
+    b = array_create(1, (int64_t[]){i - INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        double* restrict b_data = b.nd_double;
+        for (i_0001 = INT64_C(0); i_0001 < b.shape[INT64_C(0)]; i_0001 += INT64_C(1))
+        {
+            b_data[i_0001] = a_data[i_0001 + INT64_C(2)] + a_data[i_0001 + INT64_C(4)];
+        }
+    }
+    Out_0001 = b.shape[INT64_C(0)];
+    free_array(&b);
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
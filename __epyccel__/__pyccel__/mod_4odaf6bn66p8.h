@@ -0,0 +1,11 @@
+#ifndef MOD_4ODAF6BN66P8_H
+#define MOD_4ODAF6BN66P8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_uncertain_shape_1(void);
+#endif // mod_4odaf6bn66p8_H
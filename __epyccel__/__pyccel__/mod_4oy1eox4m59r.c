@@ -0,0 +1,12 @@
+#include "mod_4oy1eox4m59r.h"
+
+
+/*........................................*/
+double floor_phrase(double x, double y)
+{
+    double a;
+    a = floor(x) * floor(y);
+    return a;
+}
+/*........................................*/
+
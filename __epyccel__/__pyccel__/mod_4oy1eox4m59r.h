@@ -0,0 +1,10 @@
+#ifndef MOD_4OY1EOX4M59R_H
+#define MOD_4OY1EOX4M59R_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double floor_phrase(double x, double y);
+#endif // mod_4oy1eox4m59r_H
@@ -0,0 +1,11 @@
+#ifndef MOD_4PAYOO9409LX_H
+#define MOD_4PAYOO9409LX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_empty_val_float64(void);
+#endif // mod_4payoo9409lx_H
@@ -0,0 +1,12 @@
+#ifndef MOD_4QL15LJ40JYJ_H
+#define MOD_4QL15LJ40JYJ_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+double my_sum_0000(t_ndarray v);
+double complex my_sum_0001(t_ndarray v);
+#endif // mod_4ql15lj40jyj_H
@@ -0,0 +1,38 @@
+#include "mod_4qtbem109if5.h"
+
+
+/*........................................*/
+int64_t f2(t_ndarray x, int64_t* n, int64_t* m, int64_t* p, double* Out_0001, double* Out_0002, double* Out_0003)
+{
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    (*n) = x.shape[INT64_C(0)];
+    (*m) = x.shape[INT64_C(1)];
+    (*p) = x.shape[INT64_C(2)];
+    y = array_create(3, (int64_t[]){(*p), (*m), (*n)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < y.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                for (i_0002 = INT64_C(0); i_0002 < y.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+                {
+                    y_data[(i * y.shape[INT64_C(1)] + i_0001) * y.shape[INT64_C(2)] + i_0002] = GET_ELEMENT(x, nd_int64, i_0002, i_0001, i);
+                }
+            }
+        }
+    }
+    (*n) = y.shape[INT64_C(0)];
+    (*m) = y.shape[INT64_C(1)];
+    (*p) = y.shape[INT64_C(2)];
+    (*Out_0001) = y.nd_double[(y.shape[INT64_C(1)] - INT64_C(1)) * y.shape[INT64_C(2)]];
+    (*Out_0002) = y.nd_double[y.shape[INT64_C(2)] - INT64_C(1)];
+    (*Out_0003) = y.nd_double[((y.shape[INT64_C(0)] - INT64_C(1)) * y.shape[INT64_C(1)] + (y.shape[INT64_C(1)] - INT64_C(1))) * y.shape[INT64_C(2)]];
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#include "mod_4t3t25lrfdrt.h"
+
+
+/*........................................*/
+double f1(void)
+{
+    double value;
+    value = pow((INT64_C(2) * M_PI), (3.0 / 2.0));
+    return value;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_4T3T25LRFDRT_H
+#define MOD_4T3T25LRFDRT_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f1(void);
+#endif // mod_4t3t25lrfdrt_H
@@ -0,0 +1,11 @@
+#ifndef MOD_4TNXOP7L1HCI_H
+#define MOD_4TNXOP7L1HCI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f3(t_ndarray x, t_ndarray y);
+#endif // mod_4tnxop7l1hci_H
@@ -0,0 +1,11 @@
+#ifndef MOD_4VDRQAWW4UPD_H
+#define MOD_4VDRQAWW4UPD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_4vdrqaww4upd_H
@@ -0,0 +1,12 @@
+#include "mod_4wnmg9is9fjo.h"
+
+
+/*........................................*/
+double complex sqrt_return_type_real(double complex x)
+{
+    double complex a;
+    a = csqrt(x);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_4WNMG9IS9FJO_H
+#define MOD_4WNMG9IS9FJO_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex sqrt_return_type_real(double complex x);
+#endif // mod_4wnmg9is9fjo_H
@@ -0,0 +1,10 @@
+#include "mod_4wtnilfeskgl.h"
+
+
+/*........................................*/
+double arctan2_call(int64_t x, int64_t y)
+{
+    return atan2((double)(x), (double)(y));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_4WTNILFESKGL_H
+#define MOD_4WTNILFESKGL_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arctan2_call(int64_t x, int64_t y);
+#endif // mod_4wtnilfeskgl_H
@@ -0,0 +1,13 @@
+#ifndef MOD_4X3XKDB5BEVJ_H
+#define MOD_4X3XKDB5BEVJ_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_homogeneous_math(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_4x3xkdb5bevj_H
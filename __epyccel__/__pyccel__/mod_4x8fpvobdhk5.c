@@ -0,0 +1,10 @@
+#include "mod_4x8fpvobdhk5.h"
+
+
+/*........................................*/
+double add(double a, double b)
+{
+    return a + b;
+}
+/*........................................*/
+
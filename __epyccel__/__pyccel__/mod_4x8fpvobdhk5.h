@@ -0,0 +1,9 @@
+#ifndef MOD_4X8FPVOBDHK5_H
+#define MOD_4X8FPVOBDHK5_H
+
+#include <stdlib.h>
+
+
+
+double add(double a, double b);
+#endif // mod_4x8fpvobdhk5_H
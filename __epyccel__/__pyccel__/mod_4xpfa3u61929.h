@@ -0,0 +1,11 @@
+#ifndef MOD_4XPFA3U61929_H
+#define MOD_4XPFA3U61929_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_3(t_ndarray a);
+#endif // mod_4xpfa3u61929_H
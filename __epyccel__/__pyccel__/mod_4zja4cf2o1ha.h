@@ -0,0 +1,20 @@
+#ifndef MOD_4ZJA4CF2O1HA_H
+#define MOD_4ZJA4CF2O1HA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t dtype_convert_to_int8_0000(t_ndarray arr, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005);
+int64_t dtype_convert_to_int8_0001(t_ndarray arr, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005);
+int64_t dtype_convert_to_int8_0002(t_ndarray arr, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005);
+int64_t dtype_convert_to_int8_0003(t_ndarray arr, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005);
+int64_t dtype_convert_to_int8_0004(t_ndarray arr, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005);
+int64_t dtype_convert_to_int8_0005(t_ndarray arr, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005);
+int64_t dtype_convert_to_int8_0006(t_ndarray arr, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005);
+int64_t dtype_convert_to_int8_0007(t_ndarray arr, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005);
+int64_t dtype_convert_to_int8_0008(t_ndarray arr, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005);
+#endif // mod_4zja4cf2o1ha_H
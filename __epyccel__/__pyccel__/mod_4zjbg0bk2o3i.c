@@ -0,0 +1,10 @@
+#include "mod_4zjbg0bk2o3i.h"
+
+
+/*........................................*/
+double cos_call(double x)
+{
+    return cos(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_4ZJBG0BK2O3I_H
+#define MOD_4ZJBG0BK2O3I_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double cos_call(double x);
+#endif // mod_4zjbg0bk2o3i_H
@@ -0,0 +1,40 @@
+#ifndef MOD_4ZJBG0BK2O3I_WRAPPER_H
+#define MOD_4ZJBG0BK2O3I_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_4zjbg0bk2o3i.h"
+
+
+#ifdef MOD_4ZJBG0BK2O3I_WRAPPER
+
+
+#else
+
+static void** Pymod_4zjbg0bk2o3i_API;
+
+
+/*........................................*/
+static int mod_4zjbg0bk2o3i_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_4zjbg0bk2o3i_API = (void**)PyCapsule_Import("mod_4zjbg0bk2o3i._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_4zjbg0bk2o3i_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_4ZJBG0BK2O3I_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_50MMIRPP3RTU_H
+#define MOD_50MMIRPP3RTU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_homogeneous_copies_have_pointers(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004);
+#endif // mod_50mmirpp3rtu_H
@@ -0,0 +1,11 @@
+#ifndef MOD_516ZTD4FNBWA_H
+#define MOD_516ZTD4FNBWA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_sub(t_ndarray x, t_ndarray y);
+#endif // mod_516ztd4fnbwa_H
@@ -0,0 +1,10 @@
+#include "mod_51trb0dqf9v9.h"
+
+
+/*........................................*/
+double floor_call(double x)
+{
+    return floor(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_51TRB0DQF9V9_H
+#define MOD_51TRB0DQF9V9_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double floor_call(double x);
+#endif // mod_51trb0dqf9v9_H
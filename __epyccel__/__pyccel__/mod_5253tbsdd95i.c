@@ -0,0 +1,25 @@
+#include "mod_5253tbsdd95i.h"
+
+
+/*........................................*/
+void array_float_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y)
+{
+    t_ndarray z = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    z = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int64, false, order_f);
+    array_fill((int64_t)INT64_C(5), z);
+    {
+        int64_t* restrict z_data = z.nd_int64;
+        for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < x.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                GET_ELEMENT(x, nd_double, i, i_0001) = floor(GET_ELEMENT(x, nd_double, i, i_0001) / GET_ELEMENT(y, nd_double, i, i_0001)) * GET_ELEMENT(x, nd_double, i, i_0001) + z_data[i_0001 * z.shape[INT64_C(0)] + i];
+            }
+        }
+    }
+    free_array(&z);
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_5253TBSDD95I_H
+#define MOD_5253TBSDD95I_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_5253tbsdd95i_H
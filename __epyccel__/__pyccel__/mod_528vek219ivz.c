@@ -0,0 +1,27 @@
+#include "mod_528vek219ivz.h"
+
+
+/*........................................*/
+int64_t test_linspace2(double complex start, double complex end, double complex* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict x_data = x.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            x_data[i] = (start + i*(end - start) / INT64_C(4));
+            x_data[INT64_C(4)] = end;
+        }
+    }
+    (*Out_0001) = x.nd_cdouble[INT64_C(0)];
+    (*Out_0002) = x.nd_cdouble[INT64_C(1)];
+    (*Out_0003) = x.nd_cdouble[INT64_C(2)];
+    (*Out_0004) = x.nd_cdouble[INT64_C(3)];
+    (*Out_0005) = x.nd_cdouble[INT64_C(4)];
+    free_array(&x);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_528VEK219IVZ_H
+#define MOD_528VEK219IVZ_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_linspace2(double complex start, double complex end, double complex* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+#endif // mod_528vek219ivz_H
@@ -0,0 +1,12 @@
+#ifndef MOD_53PF1LVKSP2V_H
+#define MOD_53PF1LVKSP2V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_f_to_f_0000(t_ndarray b);
+t_ndarray copy_f_to_f_0001(t_ndarray b);
+#endif // mod_53pf1lvksp2v_H
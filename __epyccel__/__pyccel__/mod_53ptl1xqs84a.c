@@ -0,0 +1,14 @@
+#include "mod_53ptl1xqs84a.h"
+
+
+/*........................................*/
+int64_t my_tuple(t_ndarray a, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004)
+{
+    (*Out_0001) = a.shape[INT64_C(0)];
+    (*Out_0002) = GET_ELEMENT(a, nd_cdouble, INT64_C(0));
+    (*Out_0003) = GET_ELEMENT(a, nd_cdouble, INT64_C(1));
+    (*Out_0004) = GET_ELEMENT(a, nd_cdouble, INT64_C(2));
+    return 0;
+}
+/*........................................*/
+
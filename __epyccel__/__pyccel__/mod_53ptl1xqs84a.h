@@ -0,0 +1,12 @@
+#ifndef MOD_53PTL1XQS84A_H
+#define MOD_53PTL1XQS84A_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t my_tuple(t_ndarray a, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004);
+#endif // mod_53ptl1xqs84a_H
@@ -0,0 +1,11 @@
+#ifndef MOD_54KHK7A44M27_H
+#define MOD_54KHK7A44M27_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_full_2_val(void);
+#endif // mod_54khk7a44m27_H
@@ -0,0 +1,27 @@
+#include "mod_56x2t2cxtzvd.h"
+
+
+/*........................................*/
+int64_t f(double c)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t Out_0001;
+    if (c > 0.5)
+    {
+        x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+        array_fill((int64_t)INT64_C(1), x);
+    }
+    else
+    {
+        x = array_create(1, (int64_t[]){INT64_C(7)}, nd_int64, false, order_c);
+        array_fill((int64_t)INT64_C(1), x);
+    }
+    y = array_slicing(x, 1, new_slice(INT64_C(1), x.shape[INT64_C(0)] - INT64_C(1), INT64_C(1), RANGE));
+    Out_0001 = numpy_sum_int64(y);
+    free_array(&x);
+    free_pointer(&y);
+    return Out_0001;
+}
+/*........................................*/
+
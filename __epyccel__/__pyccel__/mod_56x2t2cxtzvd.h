@@ -0,0 +1,11 @@
+#ifndef MOD_56X2T2CXTZVD_H
+#define MOD_56X2T2CXTZVD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(double c);
+#endif // mod_56x2t2cxtzvd_H
@@ -0,0 +1,19 @@
+#include "mod_575b7gjxcqk1.h"
+
+
+/*........................................*/
+int64_t enumerate_on_1d_array(t_ndarray z)
+{
+    int64_t i;
+    int64_t v;
+    int64_t res;
+    res = INT64_C(0);
+    for (i = INT64_C(0); i < z.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        v = GET_ELEMENT(z, nd_int64, i);
+        res += v * i;
+    }
+    return res;
+}
+/*........................................*/
+
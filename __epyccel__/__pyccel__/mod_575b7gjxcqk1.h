@@ -0,0 +1,11 @@
+#ifndef MOD_575B7GJXCQK1_H
+#define MOD_575B7GJXCQK1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t enumerate_on_1d_array(t_ndarray z);
+#endif // mod_575b7gjxcqk1_H
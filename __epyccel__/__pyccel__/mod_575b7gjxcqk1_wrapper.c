@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_575B7GJXCQK1_WRAPPER
+
+#include "mod_575b7gjxcqk1_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* enumerate_on_1d_array_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* z_obj;
+    t_ndarray z = {.raw_data = NULL};
+    int64_t res;
+    PyObject* res_obj;
+    static const char* const kwlist[] = {
+        "z",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &z_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("z", z_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        z = pyarray_to_ndarray(z_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    res = enumerate_on_1d_array(z);
+    free_pointer(&z);
+    res_obj = Int64_to_PyLong(&res);
+    return res_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_575b7gjxcqk1_methods[] = {
+    {
+        "enumerate_on_1d_array",
+        (PyCFunction)enumerate_on_1d_array_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_575b7gjxcqk1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_575b7gjxcqk1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_575b7gjxcqk1_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_575b7gjxcqk1(void)
+{
+    PyObject* mod;
+    static void* Pymod_575b7gjxcqk1_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_575b7gjxcqk1_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_575b7gjxcqk1_API, "mod_575b7gjxcqk1._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,24 @@
+module mod_58bdbt24yyko
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine axpy(a, x, y) 
+
+    implicit none
+
+    real(f64), value :: a
+    real(f64), intent(in) :: x(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: y(0_i64:, 0_i64:)
+
+    y(:, :) = a * x + y
+
+  end subroutine axpy
+  !........................................
+
+end module mod_58bdbt24yyko
@@ -0,0 +1,10 @@
+#ifndef MOD_59K1T7GK9JF7_H
+#define MOD_59K1T7GK9JF7_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_taskloop(int64_t n);
+#endif // mod_59k1t7gk9jf7_H
@@ -0,0 +1,11 @@
+#ifndef MOD_59NC5Q3FUF4Y_H
+#define MOD_59NC5Q3FUF4Y_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_team_size(void);
+#endif // mod_59nc5q3fuf4y_H
@@ -0,0 +1,12 @@
+#include "mod_5bodv6anhsrv.h"
+
+
+/*........................................*/
+bool test_omp_in_parallel1(void)
+{
+    bool in_parallel;
+    in_parallel = omp_in_parallel();
+    return in_parallel;
+}
+/*........................................*/
+
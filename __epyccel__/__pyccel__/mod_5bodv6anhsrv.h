@@ -0,0 +1,11 @@
+#ifndef MOD_5BODV6ANHSRV_H
+#define MOD_5BODV6ANHSRV_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_in_parallel1(void);
+#endif // mod_5bodv6anhsrv_H
@@ -0,0 +1,13 @@
+#ifndef MOD_5DZ3B2B1Z7Y6_H
+#define MOD_5DZ3B2B1Z7Y6_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_zeros_like_3_val(void);
+#endif // mod_5dz3b2b1z7y6_H
@@ -0,0 +1,16 @@
+#include "mod_5e0mqf3kiet9.h"
+
+
+/*........................................*/
+double complex create_full_val_real_complex128(double val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double complex Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_cdouble, false, order_c);
+    array_fill((double complex)(val), a);
+    Out_0001 = a.nd_cdouble[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
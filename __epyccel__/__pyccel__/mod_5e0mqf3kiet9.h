@@ -0,0 +1,12 @@
+#ifndef MOD_5E0MQF3KIET9_H
+#define MOD_5E0MQF3KIET9_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_full_val_real_complex128(double val);
+#endif // mod_5e0mqf3kiet9_H
@@ -0,0 +1,12 @@
+#ifndef MOD_5E6Z15EEL47E_H
+#define MOD_5E6Z15EEL47E_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void test_linspace_type2(int64_t start, int64_t end, t_ndarray result);
+#endif // mod_5e6z15eel47e_H
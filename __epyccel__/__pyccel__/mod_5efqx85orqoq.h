@@ -0,0 +1,12 @@
+#ifndef MOD_5EFQX85ORQOQ_H
+#define MOD_5EFQX85ORQOQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float create_ones_like_val_float32_auto(void);
+#endif // mod_5efqx85orqoq_H
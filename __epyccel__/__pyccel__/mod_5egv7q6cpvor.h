@@ -0,0 +1,10 @@
+#ifndef MOD_5EGV7Q6CPVOR_H
+#define MOD_5EGV7Q6CPVOR_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_taskloop(int64_t n);
+#endif // mod_5egv7q6cpvor_H
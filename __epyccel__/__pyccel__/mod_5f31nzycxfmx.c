@@ -0,0 +1,15 @@
+#include "mod_5f31nzycxfmx.h"
+
+
+/*........................................*/
+int32_t get_num_threads(void)
+{
+    int32_t n;
+    #pragma omp parallel
+    {
+        n = omp_get_num_threads();
+    }
+    return n;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_5F31NZYCXFMX_H
+#define MOD_5F31NZYCXFMX_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_num_threads(void);
+#endif // mod_5f31nzycxfmx_H
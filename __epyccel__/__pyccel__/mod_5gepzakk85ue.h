@@ -0,0 +1,10 @@
+#ifndef MOD_5GEPZAKK85UE_H
+#define MOD_5GEPZAKK85UE_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t for_loop2(void);
+#endif // mod_5gepzakk85ue_H
@@ -0,0 +1,11 @@
+#ifndef MOD_5IHULL7G52B8_H
+#define MOD_5IHULL7G52B8_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_5ihull7g52b8_H
@@ -0,0 +1,14 @@
+#include "mod_5jksmkqgjckw.h"
+
+
+/*........................................*/
+bool create_arr(int64_t i)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    Dummy_0000 = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, Dummy_0000);
+    free_array(&Dummy_0000);
+    return 1;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_5JKSMKQGJCKW_H
+#define MOD_5JKSMKQGJCKW_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+bool create_arr(int64_t i);
+#endif // mod_5jksmkqgjckw_H
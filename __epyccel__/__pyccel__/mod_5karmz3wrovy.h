@@ -0,0 +1,11 @@
+#ifndef MOD_5KARMZ3WROVY_H
+#define MOD_5KARMZ3WROVY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_5karmz3wrovy_H
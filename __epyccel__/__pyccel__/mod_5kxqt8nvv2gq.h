@@ -0,0 +1,12 @@
+#ifndef MOD_5KXQT8NVV2GQ_H
+#define MOD_5KXQT8NVV2GQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_full_like_val_int_float(int64_t val);
+#endif // mod_5kxqt8nvv2gq_H
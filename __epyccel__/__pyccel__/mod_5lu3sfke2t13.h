@@ -0,0 +1,10 @@
+#ifndef MOD_5LU3SFKE2T13_H
+#define MOD_5LU3SFKE2T13_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_tasks(int64_t x);
+#endif // mod_5lu3sfke2t13_H
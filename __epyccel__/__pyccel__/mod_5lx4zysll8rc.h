@@ -0,0 +1,12 @@
+#ifndef MOD_5LX4ZYSLL8RC_H
+#define MOD_5LX4ZYSLL8RC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_nested_F_array_initialization_3(t_ndarray a, t_ndarray e, t_ndarray x);
+#endif // mod_5lx4zysll8rc_H
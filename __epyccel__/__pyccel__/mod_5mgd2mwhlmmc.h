@@ -0,0 +1,11 @@
+#ifndef MOD_5MGD2MWHLMMC_H
+#define MOD_5MGD2MWHLMMC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_to_slice_issue_1218(int64_t n);
+#endif // mod_5mgd2mwhlmmc_H
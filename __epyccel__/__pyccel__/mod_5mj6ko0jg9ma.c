@@ -0,0 +1,20 @@
+#include "mod_5mj6ko0jg9ma.h"
+
+
+/*........................................*/
+t_ndarray f3(t_ndarray x)
+{
+    int64_t i;
+    t_ndarray y = {.raw_data = NULL};
+    y = array_create(1, (int64_t[]){x.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data = y.nd_int64;
+        for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            y_data[i] = GET_ELEMENT(x, nd_int64, i) - INT64_C(1);
+        }
+    }
+    return y;
+}
+/*........................................*/
+
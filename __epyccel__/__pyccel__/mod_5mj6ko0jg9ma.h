@@ -0,0 +1,11 @@
+#ifndef MOD_5MJ6KO0JG9MA_H
+#define MOD_5MJ6KO0JG9MA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray f3(t_ndarray x);
+#endif // mod_5mj6ko0jg9ma_H
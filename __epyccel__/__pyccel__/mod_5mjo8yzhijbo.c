@@ -0,0 +1,12 @@
+#include "mod_5mjo8yzhijbo.h"
+
+
+/*........................................*/
+int64_t floor_return_type_real(double x)
+{
+    int64_t a;
+    a = (int64_t)floor(x);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_5MJO8YZHIJBO_H
+#define MOD_5MJO8YZHIJBO_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t floor_return_type_real(double x);
+#endif // mod_5mjo8yzhijbo_H
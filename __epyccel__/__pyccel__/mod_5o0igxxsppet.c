@@ -0,0 +1,16 @@
+#include "mod_5o0igxxsppet.h"
+
+
+/*........................................*/
+double phase_call_0000(double x)
+{
+    return 0.0;
+}
+/*........................................*/
+/*........................................*/
+double phase_call_0001(double complex x)
+{
+    return atan2(cimag(x), creal(x));
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_5O0IGXXSPPET_H
+#define MOD_5O0IGXXSPPET_H
+
+#include <complex.h>
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double phase_call_0000(double x);
+double phase_call_0001(double complex x);
+#endif // mod_5o0igxxsppet_H
@@ -0,0 +1,13 @@
+#ifndef MOD_5OPS24M9HBJI_H
+#define MOD_5OPS24M9HBJI_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float complex create_zeros_like_val_complex64(void);
+#endif // mod_5ops24m9hbji_H
@@ -0,0 +1,11 @@
+#ifndef MOD_5P8VEZXP3AOZ_H
+#define MOD_5P8VEZXP3AOZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_5p8vezxp3aoz_H
@@ -0,0 +1,11 @@
+#ifndef MOD_5QXAYJG2QPIS_H
+#define MOD_5QXAYJG2QPIS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_mul(t_ndarray x, t_ndarray y);
+#endif // mod_5qxayjg2qpis_H
@@ -0,0 +1,12 @@
+#ifndef MOD_5UNAYHFZFVKL_H
+#define MOD_5UNAYHFZFVKL_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void divide_by(t_ndarray a, double b);
+#endif // mod_5unayhfzfvkl_H
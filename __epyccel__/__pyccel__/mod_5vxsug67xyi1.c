@@ -0,0 +1,12 @@
+#include "mod_5vxsug67xyi1.h"
+
+
+/*........................................*/
+double complex sin_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = csin(x) + csin(y);
+    return a;
+}
+/*........................................*/
+
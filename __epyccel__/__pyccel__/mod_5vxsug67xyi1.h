@@ -0,0 +1,10 @@
+#ifndef MOD_5VXSUG67XYI1_H
+#define MOD_5VXSUG67XYI1_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex sin_phrase(double complex x, double complex y);
+#endif // mod_5vxsug67xyi1_H
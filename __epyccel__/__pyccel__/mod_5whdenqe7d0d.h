@@ -0,0 +1,11 @@
+#ifndef MOD_5WHDENQE7D0D_H
+#define MOD_5WHDENQE7D0D_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_5whdenqe7d0d_H
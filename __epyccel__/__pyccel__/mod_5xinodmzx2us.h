@@ -0,0 +1,11 @@
+#ifndef MOD_5XINODMZX2US_H
+#define MOD_5XINODMZX2US_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_loopdiff(t_ndarray x, t_ndarray y, t_ndarray out);
+#endif // mod_5xinodmzx2us_H
@@ -0,0 +1,11 @@
+#ifndef MOD_5Y5XD3Y84TJ7_H
+#define MOD_5Y5XD3Y84TJ7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_sub(t_ndarray x, t_ndarray y);
+#endif // mod_5y5xd3y84tj7_H
@@ -0,0 +1,11 @@
+#ifndef MOD_5YF5IUTADTAC_H
+#define MOD_5YF5IUTADTAC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_5(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_5yf5iutadtac_H
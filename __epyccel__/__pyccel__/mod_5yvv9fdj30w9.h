@@ -0,0 +1,13 @@
+#ifndef MOD_5YVV9FDJ30W9_H
+#define MOD_5YVV9FDJ30W9_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_ones_like_val_complex128(void);
+#endif // mod_5yvv9fdj30w9_H
@@ -0,0 +1,11 @@
+#ifndef MOD_5YZY2L2FDP0Y_H
+#define MOD_5YZY2L2FDP0Y_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_5yzy2l2fdp0y_H
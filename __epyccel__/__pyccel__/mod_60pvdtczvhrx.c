@@ -0,0 +1,12 @@
+#include "mod_60pvdtczvhrx.h"
+
+
+/*........................................*/
+double complex f20(double complex a)
+{
+    double complex b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_60PVDTCZVHRX_H
+#define MOD_60PVDTCZVHRX_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex f20(double complex a);
+#endif // mod_60pvdtczvhrx_H
@@ -0,0 +1,24 @@
+module mod_61pbsv4vw2to
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine sqrt_step2(t, c, u) 
+
+    implicit none
+
+    real(f64), intent(in) :: t(0_i64:)
+    real(f64), intent(in) :: c(0_i64:)
+    real(f64), intent(inout) :: u(0_i64:)
+
+    u(:) = t + c
+
+  end subroutine sqrt_step2
+  !........................................
+
+end module mod_61pbsv4vw2to
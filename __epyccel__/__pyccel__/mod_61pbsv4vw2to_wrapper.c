@@ -0,0 +1,119 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_61PBSV4VW2TO_WRAPPER
+
+#include "mod_61pbsv4vw2to_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_sqrt_step2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* t_obj;
+    PyObject* c_obj;
+    PyObject* u_obj;
+    void* t_data = NULL;
+    int64_t t_shape[1];
+    int64_t t_strides[1];
+    void* c_data = NULL;
+    int64_t c_shape[1];
+    int64_t c_strides[1];
+    void* u_data = NULL;
+    int64_t u_shape[1];
+    int64_t u_strides[1];
+    static const char* const kwlist[] = {
+        "t",
+        "c",
+        "u",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &t_obj, &c_obj, &u_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("t", t_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        t_data = PyArray_DATA((PyArrayObject*)(t_obj));
+        get_strides_and_shape_from_numpy_array(t_obj, t_shape, t_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("c", c_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        c_data = PyArray_DATA((PyArrayObject*)(c_obj));
+        get_strides_and_shape_from_numpy_array(c_obj, c_shape, c_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("u", u_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        u_data = PyArray_DATA((PyArrayObject*)(u_obj));
+        get_strides_and_shape_from_numpy_array(u_obj, u_shape, u_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_sqrt_step2(t_data, t_shape[INT64_C(0)], t_strides[INT64_C(0)], c_data, c_shape[INT64_C(0)], c_strides[INT64_C(0)], u_data, u_shape[INT64_C(0)], u_strides[INT64_C(0)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_61pbsv4vw2to_methods[] = {
+    {
+        "sqrt_step2",
+        (PyCFunction)bind_c_sqrt_step2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_61pbsv4vw2to_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_61pbsv4vw2to",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_61pbsv4vw2to_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_61pbsv4vw2to(void)
+{
+    PyObject* mod;
+    static void* Pymod_61pbsv4vw2to_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_61pbsv4vw2to_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_61pbsv4vw2to_API, "mod_61pbsv4vw2to._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_61R64N3SSL9A_H
+#define MOD_61R64N3SSL9A_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_flush(void);
+#endif // mod_61r64n3ssl9a_H
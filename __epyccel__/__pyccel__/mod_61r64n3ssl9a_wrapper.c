@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_61R64N3SSL9A_WRAPPER
+
+#include "mod_61r64n3ssl9a_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* omp_flush_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int64_t flag;
+    PyObject* flag_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    flag = omp_flush();
+    flag_obj = Int64_to_PyLong(&flag);
+    return flag_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_61r64n3ssl9a_methods[] = {
+    {
+        "omp_flush",
+        (PyCFunction)omp_flush_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_61r64n3ssl9a_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_61r64n3ssl9a",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_61r64n3ssl9a_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_61r64n3ssl9a(void)
+{
+    PyObject* mod;
+    static void* Pymod_61r64n3ssl9a_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_61r64n3ssl9a_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_61r64n3ssl9a_API, "mod_61r64n3ssl9a._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
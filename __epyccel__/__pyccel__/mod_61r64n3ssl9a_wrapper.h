@@ -0,0 +1,40 @@
+#ifndef MOD_61R64N3SSL9A_WRAPPER_H
+#define MOD_61R64N3SSL9A_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_61r64n3ssl9a.h"
+
+
+#ifdef MOD_61R64N3SSL9A_WRAPPER
+
+
+#else
+
+static void** Pymod_61r64n3ssl9a_API;
+
+
+/*........................................*/
+static int mod_61r64n3ssl9a_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_61r64n3ssl9a_API = (void**)PyCapsule_Import("mod_61r64n3ssl9a._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_61r64n3ssl9a_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_61R64N3SSL9A_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_637EE004HRIW_H
+#define MOD_637EE004HRIW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double tuples_as_indexing_var(void);
+#endif // mod_637ee004hriw_H
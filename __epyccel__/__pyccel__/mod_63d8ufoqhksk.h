@@ -0,0 +1,11 @@
+#ifndef MOD_63D8UFOQHKSK_H
+#define MOD_63D8UFOQHKSK_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_63d8ufoqhksk_H
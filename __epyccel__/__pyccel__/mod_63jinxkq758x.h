@@ -0,0 +1,10 @@
+#ifndef MOD_63JINXKQ758X_H
+#define MOD_63JINXKQ758X_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t directive_in_else(int64_t x);
+#endif // mod_63jinxkq758x_H
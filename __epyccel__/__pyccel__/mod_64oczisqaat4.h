@@ -0,0 +1,11 @@
+#ifndef MOD_64OCZISQAAT4_H
+#define MOD_64OCZISQAAT4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_64oczisqaat4_H
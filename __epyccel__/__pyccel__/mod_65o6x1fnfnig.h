@@ -0,0 +1,12 @@
+#ifndef MOD_65O6X1FNFNIG_H
+#define MOD_65O6X1FNFNIG_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_65o6x1fnfnig_H
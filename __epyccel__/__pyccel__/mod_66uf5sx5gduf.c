@@ -0,0 +1,10 @@
+#include "mod_66uf5sx5gduf.h"
+
+
+/*........................................*/
+double asin_call(double x)
+{
+    return asin(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_66UF5SX5GDUF_H
+#define MOD_66UF5SX5GDUF_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double asin_call(double x);
+#endif // mod_66uf5sx5gduf_H
@@ -0,0 +1,11 @@
+#ifndef MOD_68NGLF3SDTAQ_H
+#define MOD_68NGLF3SDTAQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_sub(t_ndarray x, t_ndarray y);
+#endif // mod_68nglf3sdtaq_H
@@ -0,0 +1,100 @@
+#include "mod_68ql8sqy2t4c.h"
+
+
+/*........................................*/
+int64_t create_full_val_auto_0000(int64_t val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    array_fill(val, a);
+    Out_0001 = a.nd_int64[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double create_full_val_auto_0001(double val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_double, false, order_c);
+    array_fill(val, a);
+    Out_0001 = a.nd_double[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double complex create_full_val_auto_0002(double complex val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double complex Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_cdouble, false, order_c);
+    array_fill(val, a);
+    Out_0001 = a.nd_cdouble[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int32_t create_full_val_auto_0003(int32_t val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int32_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int32, false, order_c);
+    array_fill(val, a);
+    Out_0001 = a.nd_int32[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+float create_full_val_auto_0004(float val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    float Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_float, false, order_c);
+    array_fill(val, a);
+    Out_0001 = a.nd_float[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double create_full_val_auto_0005(double val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_double, false, order_c);
+    array_fill(val, a);
+    Out_0001 = a.nd_double[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+float complex create_full_val_auto_0006(float complex val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    float complex Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_cfloat, false, order_c);
+    array_fill(val, a);
+    Out_0001 = a.nd_cfloat[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double complex create_full_val_auto_0007(double complex val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double complex Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_cdouble, false, order_c);
+    array_fill(val, a);
+    Out_0001 = a.nd_cdouble[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
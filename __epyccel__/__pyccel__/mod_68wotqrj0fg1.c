@@ -0,0 +1,21 @@
+#include "mod_68wotqrj0fg1.h"
+
+
+/*........................................*/
+int64_t homogeneous_tuple_2_levels(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006)
+{
+    t_ndarray ai = {.raw_data = NULL};
+    ai = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(0), INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5)};
+    memcpy(&ai.nd_int64[INT64_C(0)], Dummy_0000, 6 * ai.type_size);
+    (*Out_0001) = GET_ELEMENT(ai, nd_int64, INT64_C(0), INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(ai, nd_int64, INT64_C(0), INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(ai, nd_int64, INT64_C(0), INT64_C(2));
+    (*Out_0004) = GET_ELEMENT(ai, nd_int64, INT64_C(1), INT64_C(0));
+    (*Out_0005) = GET_ELEMENT(ai, nd_int64, INT64_C(1), INT64_C(1));
+    (*Out_0006) = GET_ELEMENT(ai, nd_int64, INT64_C(1), INT64_C(2));
+    free_array(&ai);
+    return 0;
+}
+/*........................................*/
+
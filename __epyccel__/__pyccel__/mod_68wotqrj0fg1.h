@@ -0,0 +1,12 @@
+#ifndef MOD_68WOTQRJ0FG1_H
+#define MOD_68WOTQRJ0FG1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t homogeneous_tuple_2_levels(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_68wotqrj0fg1_H
@@ -0,0 +1,14 @@
+#include "mod_6adpg5tysf4r.h"
+
+
+/*........................................*/
+void sqrt_step2(t_ndarray t, t_ndarray c, t_ndarray u)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < u.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(u, nd_double, i) = GET_ELEMENT(t, nd_double, i) + GET_ELEMENT(c, nd_double, i);
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_6ADPG5TYSF4R_H
+#define MOD_6ADPG5TYSF4R_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void sqrt_step2(t_ndarray t, t_ndarray c, t_ndarray u);
+#endif // mod_6adpg5tysf4r_H
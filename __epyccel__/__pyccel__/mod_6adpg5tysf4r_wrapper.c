@@ -0,0 +1,114 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_6ADPG5TYSF4R_WRAPPER
+
+#include "mod_6adpg5tysf4r_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* sqrt_step2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* t_obj;
+    PyObject* c_obj;
+    PyObject* u_obj;
+    t_ndarray t = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray u = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "t",
+        "c",
+        "u",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &t_obj, &c_obj, &u_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("t", t_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        t = pyarray_to_ndarray(t_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("c", c_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        c = pyarray_to_ndarray(c_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("u", u_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        u = pyarray_to_ndarray(u_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    sqrt_step2(t, c, u);
+    free_pointer(&t);
+    free_pointer(&c);
+    free_pointer(&u);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_6adpg5tysf4r_methods[] = {
+    {
+        "sqrt_step2",
+        (PyCFunction)sqrt_step2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_6adpg5tysf4r_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_6adpg5tysf4r",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_6adpg5tysf4r_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_6adpg5tysf4r(void)
+{
+    PyObject* mod;
+    static void* Pymod_6adpg5tysf4r_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_6adpg5tysf4r_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_6adpg5tysf4r_API, "mod_6adpg5tysf4r._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
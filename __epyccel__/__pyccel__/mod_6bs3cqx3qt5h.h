@@ -0,0 +1,11 @@
+#ifndef MOD_6BS3CQX3QT5H_H
+#define MOD_6BS3CQX3QT5H_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_in_parallel2(void);
+#endif // mod_6bs3cqx3qt5h_H
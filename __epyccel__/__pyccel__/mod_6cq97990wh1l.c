@@ -0,0 +1,20 @@
+#include "mod_6cq97990wh1l.h"
+
+
+/*........................................*/
+int64_t homogeneous_tuple_int(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray ai = {.raw_data = NULL};
+    int64_t i;
+    ai = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(4), INT64_C(5)};
+    memcpy(&ai.nd_int64[INT64_C(0)], Dummy_0000, 3 * ai.type_size);
+    i = INT64_C(1);
+    (*Out_0001) = GET_ELEMENT(ai, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(ai, nd_int64, i);
+    (*Out_0003) = GET_ELEMENT(ai, nd_int64, INT64_C(2));
+    free_array(&ai);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_6CQ97990WH1L_H
+#define MOD_6CQ97990WH1L_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t homogeneous_tuple_int(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_6cq97990wh1l_H
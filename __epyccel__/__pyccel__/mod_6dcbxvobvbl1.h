@@ -0,0 +1,11 @@
+#ifndef MOD_6DCBXVOBVBL1_H
+#define MOD_6DCBXVOBVBL1_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_6dcbxvobvbl1_H
@@ -0,0 +1,11 @@
+#ifndef MOD_6F3SSJQX3K9V_H
+#define MOD_6F3SSJQX3K9V_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_6f3ssjqx3k9v_H
@@ -0,0 +1,76 @@
+#include "mod_6fkw36y2cb7k.h"
+
+
+/*........................................*/
+int64_t get_int64_0000(bool a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_int64_0001(int64_t a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_int64_0002(int8_t a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_int64_0003(int16_t a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_int64_0004(int32_t a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_int64_0005(int64_t a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_int64_0006(double a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_int64_0007(float a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_int64_0008(double a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+
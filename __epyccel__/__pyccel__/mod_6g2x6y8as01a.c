@@ -0,0 +1,44 @@
+#include "mod_6g2x6y8as01a.h"
+
+
+/*........................................*/
+void mix_int_array_1_0000(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int32, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_int_array_1_0001(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int8, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_int_array_1_0002(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int16, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_int_array_1_0003(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i) += a;
+    }
+}
+/*........................................*/
+
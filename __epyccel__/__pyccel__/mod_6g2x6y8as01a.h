@@ -0,0 +1,14 @@
+#ifndef MOD_6G2X6Y8AS01A_H
+#define MOD_6G2X6Y8AS01A_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void mix_int_array_1_0000(t_ndarray x, int64_t a);
+void mix_int_array_1_0001(t_ndarray x, int64_t a);
+void mix_int_array_1_0002(t_ndarray x, int64_t a);
+void mix_int_array_1_0003(t_ndarray x, int64_t a);
+#endif // mod_6g2x6y8as01a_H
@@ -0,0 +1,10 @@
+#ifndef MOD_6GUP11977KE1_H
+#define MOD_6GUP11977KE1_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_master(void);
+#endif // mod_6gup11977ke1_H
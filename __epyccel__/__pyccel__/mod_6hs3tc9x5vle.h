@@ -0,0 +1,12 @@
+#ifndef MOD_6HS3TC9X5VLE_H
+#define MOD_6HS3TC9X5VLE_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_full_val_int_complex(int64_t val);
+#endif // mod_6hs3tc9x5vle_H
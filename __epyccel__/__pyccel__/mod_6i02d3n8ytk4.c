@@ -0,0 +1,19 @@
+#include "mod_6i02d3n8ytk4.h"
+
+
+/*........................................*/
+int64_t f(void)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t Out_0001;
+    x = array_create(2, (int64_t[]){INT64_C(3), INT64_C(7)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), x);
+    free_array(&x);
+    x = array_create(2, (int64_t[]){INT64_C(4), INT64_C(5)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(1), x);
+    Out_0001 = numpy_sum_int64(x);
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_6I02D3N8YTK4_H
+#define MOD_6I02D3N8YTK4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(void);
+#endif // mod_6i02d3n8ytk4_H
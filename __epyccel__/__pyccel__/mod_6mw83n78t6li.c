@@ -0,0 +1,10 @@
+#include "mod_6mw83n78t6li.h"
+
+
+/*........................................*/
+bool numpy_isinf_test(double x)
+{
+    return isinf(x);
+}
+/*........................................*/
+
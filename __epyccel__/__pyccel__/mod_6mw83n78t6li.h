@@ -0,0 +1,11 @@
+#ifndef MOD_6MW83N78T6LI_H
+#define MOD_6MW83N78T6LI_H
+
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool numpy_isinf_test(double x);
+#endif // mod_6mw83n78t6li_H
@@ -0,0 +1,22 @@
+#include "mod_6nnnyounz3qf.h"
+
+
+/*........................................*/
+int32_t test_omp_get_max_task_priority(void)
+{
+    int32_t max_task_priority_var;
+    max_task_priority_var = 0;
+    #pragma omp parallel
+    {
+        #pragma omp single
+        {
+            #pragma omp task
+            {
+                max_task_priority_var = omp_get_max_task_priority();
+            }
+        }
+    }
+    return max_task_priority_var;
+}
+/*........................................*/
+
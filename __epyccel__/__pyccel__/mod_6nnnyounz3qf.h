@@ -0,0 +1,11 @@
+#ifndef MOD_6NNNYOUNZ3QF_H
+#define MOD_6NNNYOUNZ3QF_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_max_task_priority(void);
+#endif // mod_6nnnyounz3qf_H
@@ -0,0 +1,11 @@
+#ifndef MOD_6OGGMXFG71EC_H
+#define MOD_6OGGMXFG71EC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_mul_homogeneous5(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_6oggmxfg71ec_H
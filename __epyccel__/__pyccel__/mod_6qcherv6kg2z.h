@@ -0,0 +1,12 @@
+#ifndef MOD_6QCHERV6KG2Z_H
+#define MOD_6QCHERV6KG2Z_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex array_kwargs_ones(void);
+#endif // mod_6qcherv6kg2z_H
@@ -0,0 +1,22 @@
+#include "mod_6qw0wnc8e46d.h"
+
+
+/*........................................*/
+int64_t test_multiple_negative_index_2(int64_t c, int64_t d, double* x, int64_t* y)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(4)}, nd_double, false, order_c);
+    double Dummy_0000[] = {1.2, 2.2, 3.2, 4.2};
+    memcpy(&a.nd_double[INT64_C(0)], Dummy_0000, 4 * a.type_size);
+    b = array_create(1, (int64_t[]){INT64_C(4)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(5), INT64_C(9), INT64_C(13)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0001, 4 * b.type_size);
+    (*x) = a.nd_double[c < INT64_C(0) ? INT64_C(4) + c : c] * d;
+    (*y) = b.nd_int64[d < INT64_C(0) ? INT64_C(4) + d : d] * c;
+    free_array(&a);
+    free_array(&b);
+    return 0;
+}
+/*........................................*/
+
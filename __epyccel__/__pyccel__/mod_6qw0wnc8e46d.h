@@ -0,0 +1,12 @@
+#ifndef MOD_6QW0WNC8E46D_H
+#define MOD_6QW0WNC8E46D_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_multiple_negative_index_2(int64_t c, int64_t d, double* x, int64_t* y);
+#endif // mod_6qw0wnc8e46d_H
@@ -0,0 +1,10 @@
+#ifndef MOD_6QZ9TETXILGR_H
+#define MOD_6QZ9TETXILGR_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_range_sum_critical(int64_t x);
+#endif // mod_6qz9tetxilgr_H
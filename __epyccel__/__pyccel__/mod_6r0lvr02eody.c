@@ -0,0 +1,12 @@
+#include "mod_6r0lvr02eody.h"
+
+
+/*........................................*/
+int32_t test_omp_number_of_procs(void)
+{
+    int32_t procs_num;
+    procs_num = omp_get_num_procs();
+    return procs_num;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_6R0LVR02EODY_H
+#define MOD_6R0LVR02EODY_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_number_of_procs(void);
+#endif // mod_6r0lvr02eody_H
@@ -0,0 +1,10 @@
+#include "mod_6r589y0wjhxx.h"
+
+
+/*........................................*/
+int64_t floor_call(double x)
+{
+    return (int64_t)floor(x);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_6R589Y0WJHXX_H
+#define MOD_6R589Y0WJHXX_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t floor_call(double x);
+#endif // mod_6r589y0wjhxx_H
@@ -0,0 +1,270 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_6SCSGUSA8RRL_WRAPPER
+
+#include "mod_6scsgusa8rrl_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_val_auto_0000_wrapper(PyObject* val_obj)
+{
+    int64_t val;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    val = PyInt64_to_Int64(val_obj);
+    Out_0001 = create_full_val_auto_0000(val);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_val_auto_0001_wrapper(PyObject* val_obj)
+{
+    double val;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    val = PyDouble_to_Double(val_obj);
+    Out_0001 = create_full_val_auto_0001(val);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_val_auto_0002_wrapper(PyObject* val_obj)
+{
+    double complex val;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    val = PyComplex_to_Complex128(val_obj);
+    Out_0001 = create_full_val_auto_0002(val);
+    Out_0001_obj = Complex128_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_val_auto_0003_wrapper(PyObject* val_obj)
+{
+    int32_t val;
+    int32_t Out_0001;
+    PyObject* Out_0001_obj;
+    val = PyInt32_to_Int32(val_obj);
+    Out_0001 = create_full_val_auto_0003(val);
+    Out_0001_obj = Int32_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_val_auto_0004_wrapper(PyObject* val_obj)
+{
+    float val;
+    float Out_0001;
+    PyObject* Out_0001_obj;
+    val = PyFloat_to_Float(val_obj);
+    Out_0001 = create_full_val_auto_0004(val);
+    Out_0001_obj = Float_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_val_auto_0005_wrapper(PyObject* val_obj)
+{
+    double val;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    val = PyDouble_to_Double(val_obj);
+    Out_0001 = create_full_val_auto_0005(val);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_val_auto_0006_wrapper(PyObject* val_obj)
+{
+    float complex val;
+    float complex Out_0001;
+    PyObject* Out_0001_obj;
+    val = PyComplex_to_Complex64(val_obj);
+    Out_0001 = create_full_val_auto_0006(val);
+    Out_0001_obj = Complex64_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_val_auto_0007_wrapper(PyObject* val_obj)
+{
+    double complex val;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    val = PyComplex_to_Complex128(val_obj);
+    Out_0001 = create_full_val_auto_0007(val);
+    Out_0001_obj = Complex128_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t create_full_val_auto_type_check(PyObject* val_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeInt(val_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeFloat(val_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_NativeComplex(val_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Int32(val_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Float(val_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_Double(val_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (PyIs_Complex64(val_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Complex128(val_obj))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument val");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* create_full_val_auto_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* val_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "val",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &val_obj))
+    {
+        return NULL;
+    }
+    type_indicator = create_full_val_auto_type_check(val_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return create_full_val_auto_0000_wrapper(val_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return create_full_val_auto_0001_wrapper(val_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return create_full_val_auto_0002_wrapper(val_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return create_full_val_auto_0003_wrapper(val_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return create_full_val_auto_0004_wrapper(val_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return create_full_val_auto_0005_wrapper(val_obj);
+    }
+    else if (type_indicator == INT64_C(6))
+    {
+        return create_full_val_auto_0006_wrapper(val_obj);
+    }
+    else if (type_indicator == INT64_C(7))
+    {
+        return create_full_val_auto_0007_wrapper(val_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_6scsgusa8rrl_methods[] = {
+    {
+        "create_full_val_auto",
+        (PyCFunction)create_full_val_auto_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_6scsgusa8rrl_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_6scsgusa8rrl",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_6scsgusa8rrl_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_6scsgusa8rrl(void)
+{
+    PyObject* mod;
+    static void* Pymod_6scsgusa8rrl_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_6scsgusa8rrl_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_6scsgusa8rrl_API, "mod_6scsgusa8rrl._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
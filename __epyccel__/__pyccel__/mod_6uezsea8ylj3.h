@@ -0,0 +1,12 @@
+#ifndef MOD_6UEZSEA8YLJ3_H
+#define MOD_6UEZSEA8YLJ3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_1_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_6uezsea8ylj3_H
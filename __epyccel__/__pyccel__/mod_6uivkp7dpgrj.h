@@ -0,0 +1,11 @@
+#ifndef MOD_6UIVKP7DPGRJ_H
+#define MOD_6UIVKP7DPGRJ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_set_schedule(void);
+#endif // mod_6uivkp7dpgrj_H
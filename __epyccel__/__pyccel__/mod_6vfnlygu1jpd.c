@@ -0,0 +1,10 @@
+#include "mod_6vfnlygu1jpd.h"
+
+
+/*........................................*/
+double sinh_call(double x)
+{
+    return sinh(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_6VFNLYGU1JPD_H
+#define MOD_6VFNLYGU1JPD_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sinh_call(double x);
+#endif // mod_6vfnlygu1jpd_H
@@ -0,0 +1,12 @@
+#ifndef MOD_6W43WAKSEWBF_H
+#define MOD_6W43WAKSEWBF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_val(double val, double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_6w43waksewbf_H
@@ -0,0 +1,10 @@
+#ifndef MOD_6X4HYNUW6FWI_H
+#define MOD_6X4HYNUW6FWI_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_tasks(int64_t x);
+#endif // mod_6x4hynuw6fwi_H
@@ -0,0 +1,12 @@
+#ifndef MOD_6X78UKZS2P8O_H
+#define MOD_6X78UKZS2P8O_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_in_bool_out_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri);
+#endif // mod_6x78ukzs2p8o_H
@@ -0,0 +1,11 @@
+#ifndef MOD_6XM81BK1M3PU_H
+#define MOD_6XM81BK1M3PU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_6xm81bk1m3pu_H
@@ -0,0 +1,12 @@
+#include "mod_6y316foogfo9.h"
+
+
+/*........................................*/
+double asinh_phrase(double x, double y)
+{
+    double a;
+    a = asinh(x) + asinh(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_6Y316FOOGFO9_H
+#define MOD_6Y316FOOGFO9_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double asinh_phrase(double x, double y);
+#endif // mod_6y316foogfo9_H
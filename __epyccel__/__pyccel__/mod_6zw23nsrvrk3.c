@@ -0,0 +1,12 @@
+#include "mod_6zw23nsrvrk3.h"
+
+
+/*........................................*/
+int64_t test_size_1d(t_ndarray f)
+{
+    int64_t Out_0001;
+    Out_0001 = f.length;
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_6ZW23NSRVRK3_H
+#define MOD_6ZW23NSRVRK3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_size_1d(t_ndarray f);
+#endif // mod_6zw23nsrvrk3_H
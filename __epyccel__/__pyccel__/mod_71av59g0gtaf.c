@@ -0,0 +1,10 @@
+#include "mod_71av59g0gtaf.h"
+
+
+/*........................................*/
+double cos_call_i(int64_t x)
+{
+    return cos((double)(x));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_71AV59G0GTAF_H
+#define MOD_71AV59G0GTAF_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double cos_call_i(int64_t x);
+#endif // mod_71av59g0gtaf_H
@@ -0,0 +1,15 @@
+#include "mod_721r9a32v1t8.h"
+
+
+/*........................................*/
+double create_empty_val_float(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_double, false, order_c);
+    Out_0001 = a.nd_double[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_721R9A32V1T8_H
+#define MOD_721R9A32V1T8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_empty_val_float(void);
+#endif // mod_721r9a32v1t8_H
@@ -0,0 +1,40 @@
+#ifndef MOD_721R9A32V1T8_WRAPPER_H
+#define MOD_721R9A32V1T8_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_721r9a32v1t8.h"
+
+
+#ifdef MOD_721R9A32V1T8_WRAPPER
+
+
+#else
+
+static void** Pymod_721r9a32v1t8_API;
+
+
+/*........................................*/
+static int mod_721r9a32v1t8_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_721r9a32v1t8_API = (void**)PyCapsule_Import("mod_721r9a32v1t8._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_721r9a32v1t8_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_721R9A32V1T8_WRAPPER_H
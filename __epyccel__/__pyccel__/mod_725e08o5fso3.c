@@ -0,0 +1,15 @@
+#include "mod_725e08o5fso3.h"
+
+
+/*........................................*/
+int64_t create_empty_1_val(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t Out_0001;
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(1)}, nd_int64, false, order_f);
+    Out_0001 = a.nd_int64[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_725E08O5FSO3_H
+#define MOD_725E08O5FSO3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_empty_1_val(void);
+#endif // mod_725e08o5fso3_H
@@ -0,0 +1,11 @@
+#ifndef MOD_73Y3NW58WCM2_H
+#define MOD_73Y3NW58WCM2_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_active_level(void);
+#endif // mod_73y3nw58wcm2_H
@@ -0,0 +1,12 @@
+#include "mod_74gk8tya9y8p.h"
+
+
+/*........................................*/
+double f(void)
+{
+    double a;
+    a = 1.5;
+    return 0.0;
+}
+/*........................................*/
+
@@ -0,0 +1,9 @@
+#ifndef MOD_74GK8TYA9Y8P_H
+#define MOD_74GK8TYA9Y8P_H
+
+#include <stdlib.h>
+
+
+
+double f(void);
+#endif // mod_74gk8tya9y8p_H
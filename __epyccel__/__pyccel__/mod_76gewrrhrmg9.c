@@ -0,0 +1,15 @@
+#include "mod_76gewrrhrmg9.h"
+
+
+/*........................................*/
+double complex create_empty_val_complex128(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double complex Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_cdouble, false, order_c);
+    Out_0001 = a.nd_cdouble[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_76GEWRRHRMG9_H
+#define MOD_76GEWRRHRMG9_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_empty_val_complex128(void);
+#endif // mod_76gewrrhrmg9_H
@@ -0,0 +1,11 @@
+#ifndef MOD_76JAXQJI0L15_H
+#define MOD_76JAXQJI0L15_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_active_level(void);
+#endif // mod_76jaxqji0l15_H
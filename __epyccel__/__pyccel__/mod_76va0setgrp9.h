@@ -0,0 +1,12 @@
+#ifndef MOD_76VA0SETGRP9_H
+#define MOD_76VA0SETGRP9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_2d_stack_array_1(void);
+#endif // mod_76va0setgrp9_H
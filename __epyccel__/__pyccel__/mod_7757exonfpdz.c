@@ -0,0 +1,28 @@
+#include "mod_7757exonfpdz.h"
+
+
+/*........................................*/
+double mult_on_array_float64(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    double Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)1.0, a);
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            b_data[i] = a_data[i] * INT64_C(2);
+        }
+    }
+    Out_0001 = b.nd_double[INT64_C(0)];
+    free_array(&a);
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_7757EXONFPDZ_H
+#define MOD_7757EXONFPDZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double mult_on_array_float64(void);
+#endif // mod_7757exonfpdz_H
@@ -0,0 +1,12 @@
+#include "mod_77y630krwwdo.h"
+
+
+/*........................................*/
+int64_t p_lose(void)
+{
+    int64_t lose;
+    lose = -INT64_C(10);
+    return lose;
+}
+/*........................................*/
+
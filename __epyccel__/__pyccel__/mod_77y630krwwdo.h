@@ -0,0 +1,10 @@
+#ifndef MOD_77Y630KRWWDO_H
+#define MOD_77Y630KRWWDO_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t p_lose(void);
+#endif // mod_77y630krwwdo_H
@@ -0,0 +1,10 @@
+#include "mod_7aiu1mviu336.h"
+
+
+/*........................................*/
+double complex asinh_call(double complex x)
+{
+    return casinh(x);
+}
+/*........................................*/
+
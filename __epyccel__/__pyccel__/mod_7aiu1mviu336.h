@@ -0,0 +1,10 @@
+#ifndef MOD_7AIU1MVIU336_H
+#define MOD_7AIU1MVIU336_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex asinh_call(double complex x);
+#endif // mod_7aiu1mviu336_H
@@ -0,0 +1,21 @@
+#include "mod_7bnn1h0arg9p.h"
+
+
+/*........................................*/
+void array_int32_1d_complex_3d_expr(t_ndarray x, t_ndarray y)
+{
+    t_ndarray z = {.raw_data = NULL};
+    int64_t i;
+    z = array_create(1, (int64_t[]){INT64_C(3)}, nd_int32, false, order_c);
+    array_fill((int32_t)5, z);
+    {
+        int32_t* restrict z_data = z.nd_int32;
+        for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_int32, i) = (int32_t)floor((double)(GET_ELEMENT(x, nd_int32, i)) / (double)(GET_ELEMENT(y, nd_int32, i))) * GET_ELEMENT(x, nd_int32, i) + z_data[i];
+        }
+    }
+    free_array(&z);
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_7BNN1H0ARG9P_H
+#define MOD_7BNN1H0ARG9P_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_7bnn1h0arg9p_H
@@ -0,0 +1,15 @@
+#include "mod_7crg83jd7xr3.h"
+
+
+/*........................................*/
+int32_t get_num_threads(void)
+{
+    int32_t n;
+    #pragma omp parallel
+    {
+        n = omp_get_num_threads();
+    }
+    return n;
+}
+/*........................................*/
+
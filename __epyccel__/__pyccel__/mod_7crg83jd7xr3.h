@@ -0,0 +1,11 @@
+#ifndef MOD_7CRG83JD7XR3_H
+#define MOD_7CRG83JD7XR3_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_num_threads(void);
+#endif // mod_7crg83jd7xr3_H
@@ -0,0 +1,12 @@
+#include "mod_7dbwtvlipe4f.h"
+
+
+/*........................................*/
+int64_t multi_return_vars(int64_t a, int64_t b, int64_t* Out_0001, int64_t* Out_0002)
+{
+    (*Out_0001) = a;
+    (*Out_0002) = b;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_7DBWTVLIPE4F_H
+#define MOD_7DBWTVLIPE4F_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t multi_return_vars(int64_t a, int64_t b, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_7dbwtvlipe4f_H
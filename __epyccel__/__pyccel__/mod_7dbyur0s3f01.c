@@ -0,0 +1,12 @@
+#include "mod_7dbyur0s3f01.h"
+
+
+/*........................................*/
+double cosh_phrase(double x, double y)
+{
+    double a;
+    a = cosh(x) + cosh(y);
+    return a;
+}
+/*........................................*/
+
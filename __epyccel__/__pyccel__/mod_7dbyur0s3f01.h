@@ -0,0 +1,10 @@
+#ifndef MOD_7DBYUR0S3F01_H
+#define MOD_7DBYUR0S3F01_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double cosh_phrase(double x, double y);
+#endif // mod_7dbyur0s3f01_H
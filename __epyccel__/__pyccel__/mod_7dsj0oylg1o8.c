@@ -0,0 +1,12 @@
+#include "mod_7dsj0oylg1o8.h"
+
+
+/*........................................*/
+int64_t f2(t_ndarray x)
+{
+    int64_t y;
+    y = GET_ELEMENT(x, nd_int64, INT64_C(0)) - INT64_C(1);
+    return y;
+}
+/*........................................*/
+
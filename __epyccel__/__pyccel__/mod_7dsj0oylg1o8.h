@@ -0,0 +1,11 @@
+#ifndef MOD_7DSJ0OYLG1O8_H
+#define MOD_7DSJ0OYLG1O8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f2(t_ndarray x);
+#endif // mod_7dsj0oylg1o8_H
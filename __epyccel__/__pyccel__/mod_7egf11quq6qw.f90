@@ -0,0 +1,23 @@
+module mod_7egf11quq6qw
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine sqrt_step3(u, v) 
+
+    implicit none
+
+    real(f64), intent(in) :: u(0_i64:)
+    real(f64), intent(inout) :: v(0_i64:)
+
+    v(:) = sqrt(u)
+
+  end subroutine sqrt_step3
+  !........................................
+
+end module mod_7egf11quq6qw
@@ -0,0 +1,105 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_7EGF11QUQ6QW_WRAPPER
+
+#include "mod_7egf11quq6qw_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_sqrt_step3_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* u_obj;
+    PyObject* v_obj;
+    void* u_data = NULL;
+    int64_t u_shape[1];
+    int64_t u_strides[1];
+    void* v_data = NULL;
+    int64_t v_shape[1];
+    int64_t v_strides[1];
+    static const char* const kwlist[] = {
+        "u",
+        "v",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &u_obj, &v_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("u", u_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        u_data = PyArray_DATA((PyArrayObject*)(u_obj));
+        get_strides_and_shape_from_numpy_array(u_obj, u_shape, u_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("v", v_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        v_data = PyArray_DATA((PyArrayObject*)(v_obj));
+        get_strides_and_shape_from_numpy_array(v_obj, v_shape, v_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_sqrt_step3(u_data, u_shape[INT64_C(0)], u_strides[INT64_C(0)], v_data, v_shape[INT64_C(0)], v_strides[INT64_C(0)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_7egf11quq6qw_methods[] = {
+    {
+        "sqrt_step3",
+        (PyCFunction)bind_c_sqrt_step3_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_7egf11quq6qw_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_7egf11quq6qw",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_7egf11quq6qw_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_7egf11quq6qw(void)
+{
+    PyObject* mod;
+    static void* Pymod_7egf11quq6qw_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_7egf11quq6qw_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_7egf11quq6qw_API, "mod_7egf11quq6qw._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,76 @@
+#include "mod_7eot58wbc5w4.h"
+
+
+/*........................................*/
+int8_t get_mod_0000(bool a)
+{
+    int8_t b;
+    b = pyc_modulo((int64_t)(a), (int64_t)(a));
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_mod_0001(int64_t a)
+{
+    int64_t b;
+    b = pyc_modulo(a, a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_mod_0002(int8_t a)
+{
+    int8_t b;
+    b = pyc_modulo(a, a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_mod_0003(int16_t a)
+{
+    int16_t b;
+    b = pyc_modulo(a, a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int32_t get_mod_0004(int32_t a)
+{
+    int32_t b;
+    b = pyc_modulo(a, a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_mod_0005(int64_t a)
+{
+    int64_t b;
+    b = pyc_modulo(a, a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_mod_0006(double a)
+{
+    double b;
+    b = pyc_fmodulo(a, a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_mod_0007(float a)
+{
+    float b;
+    b = pyc_fmodulo(a, a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_mod_0008(double a)
+{
+    double b;
+    b = pyc_fmodulo(a, a);
+    return b;
+}
+/*........................................*/
+
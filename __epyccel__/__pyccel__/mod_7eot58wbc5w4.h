@@ -0,0 +1,21 @@
+#ifndef MOD_7EOT58WBC5W4_H
+#define MOD_7EOT58WBC5W4_H
+
+#include <math.h>
+#include "pyc_math_c.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int8_t get_mod_0000(bool a);
+int64_t get_mod_0001(int64_t a);
+int8_t get_mod_0002(int8_t a);
+int16_t get_mod_0003(int16_t a);
+int32_t get_mod_0004(int32_t a);
+int64_t get_mod_0005(int64_t a);
+double get_mod_0006(double a);
+float get_mod_0007(float a);
+double get_mod_0008(double a);
+#endif // mod_7eot58wbc5w4_H
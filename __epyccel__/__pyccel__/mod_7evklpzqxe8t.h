@@ -0,0 +1,12 @@
+#ifndef MOD_7EVKLPZQXE8T_H
+#define MOD_7EVKLPZQXE8T_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float create_empty_like_val_float32(void);
+#endif // mod_7evklpzqxe8t_H
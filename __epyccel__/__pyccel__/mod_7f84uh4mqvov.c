@@ -0,0 +1,25 @@
+#include "mod_7f84uh4mqvov.h"
+
+
+/*........................................*/
+int64_t reassigned_pointer(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(10)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6), INT64_C(7), INT64_C(8), INT64_C(9), INT64_C(10)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 10 * a.type_size);
+    c = array_slicing(a, 1, new_slice(INT64_C(1), a.shape[INT64_C(0)], INT64_C(1), RANGE));
+    c.nd_int64[INT64_C(1)] = INT64_C(0);
+    free_pointer(&c);
+    alias_assign(&c, a);
+    (*Out_0001) = c.nd_int64[INT64_C(0)];
+    (*Out_0002) = c.nd_int64[INT64_C(1)];
+    (*Out_0003) = c.nd_int64[INT64_C(2)];
+    (*Out_0004) = c.shape[INT64_C(0)];
+    free_pointer(&c);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_7F84UH4MQVOV_H
+#define MOD_7F84UH4MQVOV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t reassigned_pointer(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_7f84uh4mqvov_H
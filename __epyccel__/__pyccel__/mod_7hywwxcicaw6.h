@@ -0,0 +1,11 @@
+#ifndef MOD_7HYWWXCICAW6_H
+#define MOD_7HYWWXCICAW6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(t_ndarray x, int64_t* n, int64_t* m, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_7hywwxcicaw6_H
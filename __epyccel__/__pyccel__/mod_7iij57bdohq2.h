@@ -0,0 +1,11 @@
+#ifndef MOD_7IIJ57BDOHQ2_H
+#define MOD_7IIJ57BDOHQ2_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_set_get_nested(bool nested);
+#endif // mod_7iij57bdohq2_H
@@ -0,0 +1,16 @@
+#include "mod_7jcsy7kufz1s.h"
+
+
+/*........................................*/
+double complex type_comparison2(void)
+{
+    t_ndarray b = {.raw_data = NULL};
+    double complex Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    array_fill((double complex)(0.0 * _Complex_I), b);
+    Out_0001 = b.nd_cdouble[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_7JCSY7KUFZ1S_H
+#define MOD_7JCSY7KUFZ1S_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex type_comparison2(void);
+#endif // mod_7jcsy7kufz1s_H
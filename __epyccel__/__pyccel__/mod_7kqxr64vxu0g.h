@@ -0,0 +1,11 @@
+#ifndef MOD_7KQXR64VXU0G_H
+#define MOD_7KQXR64VXU0G_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t sum_call(t_ndarray x);
+#endif // mod_7kqxr64vxu0g_H
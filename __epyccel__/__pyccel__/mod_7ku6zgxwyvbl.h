@@ -0,0 +1,12 @@
+#ifndef MOD_7KU6ZGXWYVBL_H
+#define MOD_7KU6ZGXWYVBL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_f_to_c_0000(t_ndarray b);
+t_ndarray copy_f_to_c_0001(t_ndarray b);
+#endif // mod_7ku6zgxwyvbl_H
@@ -0,0 +1,10 @@
+#include "mod_7l85szrxtc30.h"
+
+
+/*........................................*/
+double log_call(double x)
+{
+    return log(x);
+}
+/*........................................*/
+
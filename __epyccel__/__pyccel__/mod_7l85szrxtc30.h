@@ -0,0 +1,10 @@
+#ifndef MOD_7L85SZRXTC30_H
+#define MOD_7L85SZRXTC30_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log_call(double x);
+#endif // mod_7l85szrxtc30_H
@@ -0,0 +1,11 @@
+#ifndef MOD_7MLIVUDJEZGT_H
+#define MOD_7MLIVUDJEZGT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_7mlivudjezgt_H
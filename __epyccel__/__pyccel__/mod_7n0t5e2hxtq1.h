@@ -0,0 +1,11 @@
+#ifndef MOD_7N0T5E2HXTQ1_H
+#define MOD_7N0T5E2HXTQ1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_mul(t_ndarray x, t_ndarray y);
+#endif // mod_7n0t5e2hxtq1_H
@@ -0,0 +1,17 @@
+#include "mod_7n6k1a0ko9pm.h"
+
+
+/*........................................*/
+int32_t test_omp_get_team_size(void)
+{
+    int32_t active_level;
+    int32_t team_size;
+    #pragma omp parallel
+    {
+        active_level = omp_get_active_level();
+        team_size = omp_get_team_size(active_level);
+    }
+    return team_size;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_7N6K1A0KO9PM_H
+#define MOD_7N6K1A0KO9PM_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_team_size(void);
+#endif // mod_7n6k1a0ko9pm_H
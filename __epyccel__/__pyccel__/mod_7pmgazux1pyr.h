@@ -0,0 +1,11 @@
+#ifndef MOD_7PMGAZUX1PYR_H
+#define MOD_7PMGAZUX1PYR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_sum_stack_array(void);
+#endif // mod_7pmgazux1pyr_H
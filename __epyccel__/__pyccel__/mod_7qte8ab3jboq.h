@@ -0,0 +1,11 @@
+#ifndef MOD_7QTE8AB3JBOQ_H
+#define MOD_7QTE8AB3JBOQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_7qte8ab3jboq_H
@@ -0,0 +1,46 @@
+#include "mod_7r9m8ds3yszz.h"
+
+
+/*........................................*/
+double for_expression(void)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    double ei;
+    int64_t i;
+    int64_t Dummy_0001;
+    double sum_e;
+    c = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    int64_t Dummy_0002[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5)};
+    memcpy(&c.nd_int64[INT64_C(0)], Dummy_0002, 5 * c.type_size);
+    d = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    double Dummy_0003[] = {2.0, 3.0, 1.0, 9.0, 11.0};
+    memcpy(&d.nd_double[INT64_C(0)], Dummy_0003, 5 * d.type_size);
+    sum_e = 0.0;
+    if (Dummy_0000.raw_data != NULL)
+    {
+        free_array(&Dummy_0000);
+    }
+    Dummy_0000 = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict d_data = d.nd_double;
+        int64_t* restrict c_data = c.nd_int64;
+        double* restrict Dummy_0000_data = Dummy_0000.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Dummy_0000_data[i] = c_data[i] + d_data[i];
+        }
+    }
+    for (Dummy_0001 = INT64_C(0); Dummy_0001 < INT64_C(5); Dummy_0001 += INT64_C(1))
+    {
+        ei = Dummy_0000.nd_double[Dummy_0001];
+        sum_e = ei;
+    }
+    free_array(&Dummy_0000);
+    free_array(&c);
+    free_array(&d);
+    return sum_e;
+}
+/*........................................*/
+
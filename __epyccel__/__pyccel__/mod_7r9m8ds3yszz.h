@@ -0,0 +1,12 @@
+#ifndef MOD_7R9M8DS3YSZZ_H
+#define MOD_7R9M8DS3YSZZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double for_expression(void);
+#endif // mod_7r9m8ds3yszz_H
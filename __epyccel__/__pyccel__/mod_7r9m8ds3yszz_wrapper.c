@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_7R9M8DS3YSZZ_WRAPPER
+
+#include "mod_7r9m8ds3yszz_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* for_expression_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double sum_e;
+    PyObject* sum_e_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    sum_e = for_expression();
+    sum_e_obj = Double_to_PyDouble(&sum_e);
+    return sum_e_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_7r9m8ds3yszz_methods[] = {
+    {
+        "for_expression",
+        (PyCFunction)for_expression_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_7r9m8ds3yszz_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_7r9m8ds3yszz",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_7r9m8ds3yszz_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_7r9m8ds3yszz(void)
+{
+    PyObject* mod;
+    static void* Pymod_7r9m8ds3yszz_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_7r9m8ds3yszz_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_7r9m8ds3yszz_API, "mod_7r9m8ds3yszz._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,17 @@
+#include "mod_7uul5jpbaqt3.h"
+
+
+/*........................................*/
+int64_t tuple_arg_unpacking(void)
+{
+    t_ndarray args = {.raw_data = NULL};
+    int64_t z;
+    args = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), INT64_C(4)};
+    memcpy(&args.nd_int64[INT64_C(0)], Dummy_0000, 2 * args.type_size);
+    z = add2(GET_ELEMENT(args, nd_int64, INT64_C(0)), GET_ELEMENT(args, nd_int64, INT64_C(1)));
+    free_array(&args);
+    return z;
+}
+/*........................................*/
+
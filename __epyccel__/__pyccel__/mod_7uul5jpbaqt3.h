@@ -0,0 +1,12 @@
+#ifndef MOD_7UUL5JPBAQT3_H
+#define MOD_7UUL5JPBAQT3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_arg_unpacking(void);
+#endif // mod_7uul5jpbaqt3_H
@@ -0,0 +1,16 @@
+#include "mod_7uvaujbiyy0f.h"
+
+
+/*........................................*/
+int64_t multi_tmplt_2_0000(int64_t y, int64_t z)
+{
+    return y + z;
+}
+/*........................................*/
+/*........................................*/
+double multi_tmplt_2_0001(int64_t y, double z)
+{
+    return y + z;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_7UVAUJBIYY0F_H
+#define MOD_7UVAUJBIYY0F_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t multi_tmplt_2_0000(int64_t y, int64_t z);
+double multi_tmplt_2_0001(int64_t y, double z);
+#endif // mod_7uvaujbiyy0f_H
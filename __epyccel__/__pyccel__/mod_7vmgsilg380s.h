@@ -0,0 +1,11 @@
+#ifndef MOD_7VMGSILG380S_H
+#define MOD_7VMGSILG380S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_7vmgsilg380s_H
@@ -0,0 +1,12 @@
+#ifndef MOD_7WC42M078JSF_H
+#define MOD_7WC42M078JSF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_shape_C(int64_t n, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_7wc42m078jsf_H
@@ -0,0 +1,23 @@
+#include "mod_80jcldxhw35x.h"
+
+
+/*........................................*/
+int64_t expr_negative_index(int64_t n, int64_t idx_1, int64_t idx_2)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    int64_t Out_0001;
+    a = array_create(1, (int64_t[]){n}, nd_int64, false, order_c);
+    {
+        int64_t* restrict a_data = a.nd_int64;
+        for (i = INT64_C(0); i < n; i += INT64_C(1))
+        {
+            a_data[i < INT64_C(0) ? a.shape[INT64_C(0)] + i : i] = i;
+        }
+    }
+    Out_0001 = a.nd_int64[idx_1 - idx_2 < INT64_C(0) ? a.shape[INT64_C(0)] + (idx_1 - idx_2) : idx_1 - idx_2];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
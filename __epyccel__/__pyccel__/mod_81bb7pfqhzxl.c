@@ -0,0 +1,10 @@
+#include "mod_81bb7pfqhzxl.h"
+
+
+/*........................................*/
+float complex f(float complex a, float complex b)
+{
+    return conj(a + b);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_81BB7PFQHZXL_H
+#define MOD_81BB7PFQHZXL_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+float complex f(float complex a, float complex b);
+#endif // mod_81bb7pfqhzxl_H
@@ -0,0 +1,13 @@
+#ifndef MOD_822JHPB8U0FU_H
+#define MOD_822JHPB8U0FU_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_mod(t_ndarray x, double a);
+#endif // mod_822jhpb8u0fu_H
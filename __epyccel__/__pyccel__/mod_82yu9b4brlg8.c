@@ -0,0 +1,10 @@
+#include "mod_82yu9b4brlg8.h"
+
+
+/*........................................*/
+double atanh_call(double x)
+{
+    return atanh(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_82YU9B4BRLG8_H
+#define MOD_82YU9B4BRLG8_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double atanh_call(double x);
+#endif // mod_82yu9b4brlg8_H
@@ -0,0 +1,22 @@
+module mod_858178it8h9z
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int_2d_C_add(x, y) 
+
+    implicit none
+
+    integer(i64), intent(inout) :: x(0_i64:, 0_i64:)
+    integer(i64), intent(in) :: y(0_i64:, 0_i64:)
+
+    x(:, :) = x(:, :) + y
+
+  end subroutine array_int_2d_C_add
+  !........................................
+
+end module mod_858178it8h9z
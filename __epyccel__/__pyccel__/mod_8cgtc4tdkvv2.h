@@ -0,0 +1,12 @@
+#ifndef MOD_8CGTC4TDKVV2_H
+#define MOD_8CGTC4TDKVV2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_scalar_add_0000(t_ndarray x, float a, int64_t d1, int64_t d2);
+void array_float_2d_scalar_add_0001(t_ndarray x, double a, int64_t d1, int64_t d2);
+#endif // mod_8cgtc4tdkvv2_H
@@ -0,0 +1,12 @@
+#ifndef MOD_8EO7TPSTH2X7_H
+#define MOD_8EO7TPSTH2X7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_shape_2d(int64_t n, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_8eo7tpsth2x7_H
@@ -0,0 +1,19 @@
+#include "mod_8fjzphy8uacy.h"
+
+
+/*........................................*/
+int64_t homogeneous_tuple_bool(bool* Out_0001, bool* Out_0002)
+{
+    t_ndarray ai = {.raw_data = NULL};
+    int64_t i;
+    ai = array_create(1, (int64_t[]){INT64_C(2)}, nd_bool, false, order_c);
+    bool Dummy_0000[] = {0, 1};
+    memcpy(&ai.nd_bool[INT64_C(0)], Dummy_0000, 2 * ai.type_size);
+    i = INT64_C(1);
+    (*Out_0001) = GET_ELEMENT(ai, nd_bool, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(ai, nd_bool, i);
+    free_array(&ai);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_8FJZPHY8UACY_H
+#define MOD_8FJZPHY8UACY_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t homogeneous_tuple_bool(bool* Out_0001, bool* Out_0002);
+#endif // mod_8fjzphy8uacy_H
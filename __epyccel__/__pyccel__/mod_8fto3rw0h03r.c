@@ -0,0 +1,33 @@
+#include "mod_8fto3rw0h03r.h"
+
+
+/*........................................*/
+int64_t tuples_add_homogeneous(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006)
+{
+    int64_t array_dummy[INT64_C(3) + INT64_C(3)];
+    t_ndarray a = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(3) + INT64_C(3)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t i;
+    GET_ELEMENT(a, nd_int64, INT64_C(0)) = INT64_C(1);
+    GET_ELEMENT(a, nd_int64, INT64_C(1)) = INT64_C(2);
+    GET_ELEMENT(a, nd_int64, INT64_C(2)) = INT64_C(3);
+    GET_ELEMENT(a, nd_int64, INT64_C(3)) = INT64_C(4);
+    GET_ELEMENT(a, nd_int64, INT64_C(4)) = INT64_C(5);
+    GET_ELEMENT(a, nd_int64, INT64_C(5)) = INT64_C(6);
+    i = INT64_C(1);
+    (*Out_0001) = GET_ELEMENT(a, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(a, nd_int64, i);
+    (*Out_0003) = GET_ELEMENT(a, nd_int64, INT64_C(2));
+    (*Out_0004) = GET_ELEMENT(a, nd_int64, INT64_C(3));
+    (*Out_0005) = GET_ELEMENT(a, nd_int64, INT64_C(4));
+    (*Out_0006) = GET_ELEMENT(a, nd_int64, INT64_C(5));
+    return 0;
+}
+/*........................................*/
+
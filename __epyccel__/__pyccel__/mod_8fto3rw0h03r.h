@@ -0,0 +1,11 @@
+#ifndef MOD_8FTO3RW0H03R_H
+#define MOD_8FTO3RW0H03R_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_add_homogeneous(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_8fto3rw0h03r_H
@@ -0,0 +1,11 @@
+#ifndef MOD_8G7WRGLZX8JV_H
+#define MOD_8G7WRGLZX8JV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_8g7wrglzx8jv_H
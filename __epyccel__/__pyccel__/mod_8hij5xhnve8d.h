@@ -0,0 +1,11 @@
+#ifndef MOD_8HIJ5XHNVE8D_H
+#define MOD_8HIJ5XHNVE8D_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_in_parallel2(void);
+#endif // mod_8hij5xhnve8d_H
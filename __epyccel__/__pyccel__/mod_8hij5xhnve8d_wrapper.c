@@ -0,0 +1,80 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_8HIJ5XHNVE8D_WRAPPER
+
+#include "mod_8hij5xhnve8d_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_in_parallel2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    bool in_parallel;
+    PyObject* in_parallel_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    in_parallel = test_omp_in_parallel2();
+    in_parallel_obj = Bool_to_PyBool(&in_parallel);
+    return in_parallel_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_8hij5xhnve8d_methods[] = {
+    {
+        "test_omp_in_parallel2",
+        (PyCFunction)test_omp_in_parallel2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_8hij5xhnve8d_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_8hij5xhnve8d",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_8hij5xhnve8d_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_8hij5xhnve8d(void)
+{
+    PyObject* mod;
+    static void* Pymod_8hij5xhnve8d_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_8hij5xhnve8d_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_8hij5xhnve8d_API, "mod_8hij5xhnve8d._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_8I86VDJTGDWQ_H
+#define MOD_8I86VDJTGDWQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_8i86vdjtgdwq_H
@@ -0,0 +1,10 @@
+#include "mod_8iqlz7xgq2w7.h"
+
+
+/*........................................*/
+double sinh_call_i(int64_t x)
+{
+    return sinh((double)(x));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_8IQLZ7XGQ2W7_H
+#define MOD_8IQLZ7XGQ2W7_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double sinh_call_i(int64_t x);
+#endif // mod_8iqlz7xgq2w7_H
@@ -0,0 +1,13 @@
+#include "mod_8jbeegxtf7dh.h"
+
+
+/*........................................*/
+int64_t get_complex128(double complex* compl, double* Out_0001, double* Out_0002)
+{
+    (*compl) = (3.0 + 4.0 * _Complex_I);
+    (*Out_0001) = creal((*compl));
+    (*Out_0002) = cimag((*compl));
+    return 0;
+}
+/*........................................*/
+
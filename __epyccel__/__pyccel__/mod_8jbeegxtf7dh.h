@@ -0,0 +1,11 @@
+#ifndef MOD_8JBEEGXTF7DH_H
+#define MOD_8JBEEGXTF7DH_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t get_complex128(double complex* compl, double* Out_0001, double* Out_0002);
+#endif // mod_8jbeegxtf7dh_H
@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_8JBEEGXTF7DH_WRAPPER
+
+#include "mod_8jbeegxtf7dh_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* compl_obj;
+    double complex compl;
+    PyObject* Out_0001_obj;
+    double Out_0001;
+    PyObject* Out_0002_obj;
+    double Out_0002;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    get_complex128(&compl, &Out_0001, &Out_0002);
+    compl_obj = Complex128_to_NumpyComplex(&compl);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    Out_0002_obj = Double_to_NumpyDouble(&Out_0002);
+    Out_obj = Py_BuildValue("OOO", compl_obj, Out_0001_obj, Out_0002_obj);
+    Py_DECREF(compl_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_8jbeegxtf7dh_methods[] = {
+    {
+        "get_complex128",
+        (PyCFunction)get_complex128_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_8jbeegxtf7dh_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_8jbeegxtf7dh",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_8jbeegxtf7dh_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_8jbeegxtf7dh(void)
+{
+    PyObject* mod;
+    static void* Pymod_8jbeegxtf7dh_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_8jbeegxtf7dh_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_8jbeegxtf7dh_API, "mod_8jbeegxtf7dh._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
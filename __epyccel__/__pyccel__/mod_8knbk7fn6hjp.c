@@ -0,0 +1,10 @@
+#include "mod_8knbk7fn6hjp.h"
+
+
+/*........................................*/
+double remainder_type(double x, double y)
+{
+    return remainder(x, y);
+}
+/*........................................*/
+
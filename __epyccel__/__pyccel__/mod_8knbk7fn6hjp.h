@@ -0,0 +1,10 @@
+#ifndef MOD_8KNBK7FN6HJP_H
+#define MOD_8KNBK7FN6HJP_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double remainder_type(double x, double y);
+#endif // mod_8knbk7fn6hjp_H
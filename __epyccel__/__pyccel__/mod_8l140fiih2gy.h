@@ -0,0 +1,13 @@
+#ifndef MOD_8L140FIIH2GY_H
+#define MOD_8L140FIIH2GY_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuples_add_mixed_homogeneous_with_variables(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, bool* Out_0005, int64_t* Out_0006);
+#endif // mod_8l140fiih2gy_H
@@ -0,0 +1,12 @@
+#include "mod_8l5pg66vva23.h"
+
+
+/*........................................*/
+double tanh_phrase(double x, double y)
+{
+    double a;
+    a = tanh(x) + tanh(y);
+    return a;
+}
+/*........................................*/
+
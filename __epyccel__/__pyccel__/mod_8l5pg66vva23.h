@@ -0,0 +1,10 @@
+#ifndef MOD_8L5PG66VVA23_H
+#define MOD_8L5PG66VVA23_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double tanh_phrase(double x, double y);
+#endif // mod_8l5pg66vva23_H
@@ -0,0 +1,12 @@
+#include "mod_8oe8f2qbprs1.h"
+
+
+/*........................................*/
+double max_phrase(t_ndarray x, t_ndarray y)
+{
+    double a;
+    a = numpy_amax_float64(x) * numpy_amax_float64(y);
+    return a;
+}
+/*........................................*/
+
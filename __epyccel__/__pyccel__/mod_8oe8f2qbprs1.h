@@ -0,0 +1,10 @@
+#ifndef MOD_8OE8F2QBPRS1_H
+#define MOD_8OE8F2QBPRS1_H
+
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+double max_phrase(t_ndarray x, t_ndarray y);
+#endif // mod_8oe8f2qbprs1_H
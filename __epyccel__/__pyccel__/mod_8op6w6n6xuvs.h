@@ -0,0 +1,11 @@
+#ifndef MOD_8OP6W6N6XUVS_H
+#define MOD_8OP6W6N6XUVS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_8op6w6n6xuvs_H
@@ -0,0 +1,12 @@
+#include "mod_8pidv8ucw3kf.h"
+
+
+/*........................................*/
+int64_t tuple_index(void)
+{
+    int64_t a;
+    a = INT64_C(3);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_8PIDV8UCW3KF_H
+#define MOD_8PIDV8UCW3KF_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_index(void);
+#endif // mod_8pidv8ucw3kf_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_8PIDV8UCW3KF_WRAPPER
+
+#include "mod_8pidv8ucw3kf_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tuple_index_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int64_t a;
+    PyObject* a_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    a = tuple_index();
+    a_obj = Int64_to_PyLong(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_8pidv8ucw3kf_methods[] = {
+    {
+        "tuple_index",
+        (PyCFunction)tuple_index_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_8pidv8ucw3kf_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_8pidv8ucw3kf",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_8pidv8ucw3kf_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_8pidv8ucw3kf(void)
+{
+    PyObject* mod;
+    static void* Pymod_8pidv8ucw3kf_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_8pidv8ucw3kf_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_8pidv8ucw3kf_API, "mod_8pidv8ucw3kf._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,10 @@
+#include "mod_8pw568q6sdij.h"
+
+
+/*........................................*/
+double tan_call(double x)
+{
+    return tan(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_8PW568Q6SDIJ_H
+#define MOD_8PW568Q6SDIJ_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double tan_call(double x);
+#endif // mod_8pw568q6sdij_H
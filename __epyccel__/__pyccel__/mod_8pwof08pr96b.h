@@ -0,0 +1,18 @@
+#ifndef MOD_8PWOF08PR96B_H
+#define MOD_8PWOF08PR96B_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t get_chosen_elements_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+int64_t get_chosen_elements_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+int64_t get_chosen_elements_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006);
+int64_t get_chosen_elements_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006);
+int64_t get_chosen_elements_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006);
+int64_t get_chosen_elements_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006);
+int64_t get_chosen_elements_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006);
+#endif // mod_8pwof08pr96b_H
@@ -0,0 +1,12 @@
+#ifndef MOD_8R9UO8OOUE1U_H
+#define MOD_8R9UO8OOUE1U_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_empty_like_2_val(void);
+#endif // mod_8r9uo8ooue1u_H
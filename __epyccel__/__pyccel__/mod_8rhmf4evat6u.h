@@ -0,0 +1,12 @@
+#ifndef MOD_8RHMF4EVAT6U_H
+#define MOD_8RHMF4EVAT6U_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_3d_C_array_initialization_2(t_ndarray a);
+#endif // mod_8rhmf4evat6u_H
@@ -0,0 +1,28 @@
+#include "mod_8rjwvvmitmeb.h"
+
+
+/*........................................*/
+int64_t arrs_1d_negative_step_positive_step(int64_t* Out_0001, double* Out_0002)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){INT64_C(10)}, nd_double, false, order_c);
+    array_fill((double)1.0, a);
+    b = array_create(1, (int64_t[]){(int64_t)ceil(8.0 / 3.0)}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = a_data[i * INT64_C(3) + INT64_C(1)] + a_data[i * INT64_C(3) + INT64_C(2)];
+        }
+    }
+    (*Out_0001) = b.shape[INT64_C(0)];
+    (*Out_0002) = numpy_sum_float64(b);
+    free_array(&b);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_8RJWVVMITMEB_H
+#define MOD_8RJWVVMITMEB_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_1d_negative_step_positive_step(int64_t* Out_0001, double* Out_0002);
+#endif // mod_8rjwvvmitmeb_H
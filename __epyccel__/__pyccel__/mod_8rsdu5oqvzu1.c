@@ -0,0 +1,10 @@
+#include "mod_8rsdu5oqvzu1.h"
+
+
+/*........................................*/
+double f(double complex a, double complex b)
+{
+    return cimag(a + b);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_8RSDU5OQVZU1_H
+#define MOD_8RSDU5OQVZU1_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double f(double complex a, double complex b);
+#endif // mod_8rsdu5oqvzu1_H
@@ -0,0 +1,12 @@
+#ifndef MOD_8SHEPSS9DJK3_H
+#define MOD_8SHEPSS9DJK3_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_4(t_ndarray a, t_ndarray b);
+#endif // mod_8shepss9djk3_H
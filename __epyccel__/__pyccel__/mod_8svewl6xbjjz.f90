@@ -0,0 +1,24 @@
+module mod_8svewl6xbjjz
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_float_2d_1d_matmul_order_F(A, x, out) 
+
+    implicit none
+
+    real(f64), intent(in) :: A(0_i64:, 0_i64:)
+    real(f64), intent(in) :: x(0_i64:)
+    real(f64), intent(inout) :: out(0_i64:)
+
+    out(:) = matmul(A,x)
+
+  end subroutine array_float_2d_1d_matmul_order_F
+  !........................................
+
+end module mod_8svewl6xbjjz
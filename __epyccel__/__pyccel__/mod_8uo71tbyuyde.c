@@ -0,0 +1,12 @@
+#include "mod_8uo71tbyuyde.h"
+
+
+/*........................................*/
+double acosh_phrase(double x, double y)
+{
+    double a;
+    a = acosh(x) + acosh(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_8UO71TBYUYDE_H
+#define MOD_8UO71TBYUYDE_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double acosh_phrase(double x, double y);
+#endif // mod_8uo71tbyuyde_H
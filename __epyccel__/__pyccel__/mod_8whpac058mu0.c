@@ -0,0 +1,12 @@
+#include "mod_8whpac058mu0.h"
+
+
+/*........................................*/
+double log2_phrase(double x, double y)
+{
+    double a;
+    a = log2(x) + log2(y);
+    return a;
+}
+/*........................................*/
+
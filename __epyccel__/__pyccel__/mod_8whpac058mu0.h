@@ -0,0 +1,10 @@
+#ifndef MOD_8WHPAC058MU0_H
+#define MOD_8WHPAC058MU0_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log2_phrase(double x, double y);
+#endif // mod_8whpac058mu0_H
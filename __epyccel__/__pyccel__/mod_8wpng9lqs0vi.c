@@ -0,0 +1,26 @@
+#include "mod_8wpng9lqs0vi.h"
+
+
+/*........................................*/
+int64_t double_while_sum(int64_t n, int64_t m)
+{
+    int64_t x;
+    int64_t y;
+    int64_t i;
+    x = INT64_C(0);
+    y = INT64_C(0);
+    i = INT64_C(0);
+    while(x <= n)
+    {
+        while(y <= m)
+        {
+            i += y;
+            y = y + INT64_C(1);
+        }
+        i += x;
+        x = x + INT64_C(1);
+    }
+    return i;
+}
+/*........................................*/
+
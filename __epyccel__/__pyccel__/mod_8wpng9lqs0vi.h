@@ -0,0 +1,10 @@
+#ifndef MOD_8WPNG9LQS0VI_H
+#define MOD_8WPNG9LQS0VI_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t double_while_sum(int64_t n, int64_t m);
+#endif // mod_8wpng9lqs0vi_H
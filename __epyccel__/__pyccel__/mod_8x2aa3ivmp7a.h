@@ -0,0 +1,12 @@
+#ifndef MOD_8X2AA3IVMP7A_H
+#define MOD_8X2AA3IVMP7A_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_8x2aa3ivmp7a_H
@@ -0,0 +1,12 @@
+#ifndef MOD_8YVM9LOATSCC_H
+#define MOD_8YVM9LOATSCC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_arg_names(double val, double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006);
+#endif // mod_8yvm9loatscc_H
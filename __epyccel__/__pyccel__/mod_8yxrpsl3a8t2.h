@@ -0,0 +1,12 @@
+#ifndef MOD_8YXRPSL3A8T2_H
+#define MOD_8YXRPSL3A8T2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_2_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_8yxrpsl3a8t2_H
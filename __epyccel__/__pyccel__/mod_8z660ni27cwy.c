@@ -0,0 +1,12 @@
+#include "mod_8z660ni27cwy.h"
+
+
+/*........................................*/
+double exp_phrase(double x, double y)
+{
+    double a;
+    a = exp(x) + exp(y);
+    return a;
+}
+/*........................................*/
+
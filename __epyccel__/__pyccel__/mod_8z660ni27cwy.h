@@ -0,0 +1,10 @@
+#ifndef MOD_8Z660NI27CWY_H
+#define MOD_8Z660NI27CWY_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double exp_phrase(double x, double y);
+#endif // mod_8z660ni27cwy_H
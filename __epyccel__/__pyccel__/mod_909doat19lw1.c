@@ -0,0 +1,12 @@
+#include "mod_909doat19lw1.h"
+
+
+/*........................................*/
+int64_t single_return_var_assign(void)
+{
+    int64_t y;
+    y = INT64_C(3);
+    return y;
+}
+/*........................................*/
+
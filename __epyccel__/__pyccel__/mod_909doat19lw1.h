@@ -0,0 +1,10 @@
+#ifndef MOD_909DOAT19LW1_H
+#define MOD_909DOAT19LW1_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t single_return_var_assign(void);
+#endif // mod_909doat19lw1_H
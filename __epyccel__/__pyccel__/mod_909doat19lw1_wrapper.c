@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_909DOAT19LW1_WRAPPER
+
+#include "mod_909doat19lw1_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* single_return_var_assign_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int64_t y;
+    PyObject* y_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    y = single_return_var_assign();
+    y_obj = Int64_to_PyLong(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_909doat19lw1_methods[] = {
+    {
+        "single_return_var_assign",
+        (PyCFunction)single_return_var_assign_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_909doat19lw1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_909doat19lw1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_909doat19lw1_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_909doat19lw1(void)
+{
+    PyObject* mod;
+    static void* Pymod_909doat19lw1_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_909doat19lw1_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_909doat19lw1_API, "mod_909doat19lw1._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_92OI0DT1Q1QT_H
+#define MOD_92OI0DT1Q1QT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_nested_C_array_initialization_3(t_ndarray a, t_ndarray e, t_ndarray x);
+#endif // mod_92oi0dt1q1qt_H
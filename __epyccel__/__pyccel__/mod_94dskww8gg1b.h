@@ -0,0 +1,11 @@
+#ifndef MOD_94DSKWW8GG1B_H
+#define MOD_94DSKWW8GG1B_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_94dskww8gg1b_H
@@ -0,0 +1,18 @@
+#include "mod_98hl3lwedr3o.h"
+
+
+/*........................................*/
+int64_t unpack_array_of_known_size(double* x, double* y, double* z)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    arr = array_create(1, (int64_t[]){INT64_C(3)}, nd_double, false, order_c);
+    double Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&arr.nd_double[INT64_C(0)], Dummy_0000, 3 * arr.type_size);
+    (*x) = arr.nd_double[INT64_C(0)];
+    (*y) = arr.nd_double[INT64_C(1)];
+    (*z) = arr.nd_double[INT64_C(2)];
+    free_array(&arr);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_98HL3LWEDR3O_H
+#define MOD_98HL3LWEDR3O_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t unpack_array_of_known_size(double* x, double* y, double* z);
+#endif // mod_98hl3lwedr3o_H
@@ -0,0 +1,10 @@
+#include "mod_9af7d07d15e4afc65231531cfc4b4d94.h"
+
+
+/*........................................*/
+int64_t mul_two(int64_t x)
+{
+    return x * INT64_C(2);
+}
+/*........................................*/
+
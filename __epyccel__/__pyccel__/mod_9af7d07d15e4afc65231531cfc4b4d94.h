@@ -0,0 +1,10 @@
+#ifndef MOD_9AF7D07D15E4AFC65231531CFC4B4D94_H
+#define MOD_9AF7D07D15E4AFC65231531CFC4B4D94_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t mul_two(int64_t x);
+#endif // mod_9af7d07d15e4afc65231531cfc4b4d94_H
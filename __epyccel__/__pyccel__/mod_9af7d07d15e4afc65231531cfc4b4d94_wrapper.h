@@ -0,0 +1,40 @@
+#ifndef MOD_9AF7D07D15E4AFC65231531CFC4B4D94_WRAPPER_H
+#define MOD_9AF7D07D15E4AFC65231531CFC4B4D94_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_9af7d07d15e4afc65231531cfc4b4d94.h"
+
+
+#ifdef MOD_9AF7D07D15E4AFC65231531CFC4B4D94_WRAPPER
+
+
+#else
+
+static void** Pymod_9af7d07d15e4afc65231531cfc4b4d94_API;
+
+
+/*........................................*/
+static int mod_9af7d07d15e4afc65231531cfc4b4d94_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_9af7d07d15e4afc65231531cfc4b4d94_API = (void**)PyCapsule_Import("mod_9af7d07d15e4afc65231531cfc4b4d94._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_9af7d07d15e4afc65231531cfc4b4d94_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_9AF7D07D15E4AFC65231531CFC4B4D94_WRAPPER_H
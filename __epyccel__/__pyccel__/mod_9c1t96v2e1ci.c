@@ -0,0 +1,10 @@
+#include "mod_9c1t96v2e1ci.h"
+
+
+/*........................................*/
+int64_t call_factorial(int64_t x)
+{
+    return (int64_t)pyc_factorial(x);
+}
+/*........................................*/
+
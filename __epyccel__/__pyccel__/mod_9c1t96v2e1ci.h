@@ -0,0 +1,11 @@
+#ifndef MOD_9C1T96V2E1CI_H
+#define MOD_9C1T96V2E1CI_H
+
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t call_factorial(int64_t x);
+#endif // mod_9c1t96v2e1ci_H
@@ -0,0 +1,14 @@
+#include "mod_9e6dw9j3ygwe.h"
+
+
+/*........................................*/
+void f9(t_ndarray x)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i) += INT64_C(1);
+    }
+}
+/*........................................*/
+
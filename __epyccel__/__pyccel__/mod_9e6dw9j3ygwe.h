@@ -0,0 +1,11 @@
+#ifndef MOD_9E6DW9J3YGWE_H
+#define MOD_9E6DW9J3YGWE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f9(t_ndarray x);
+#endif // mod_9e6dw9j3ygwe_H
@@ -0,0 +1,12 @@
+#include "mod_9ecj04n0w694.h"
+
+
+/*........................................*/
+int64_t test_size_axis_variable_2d(t_ndarray f, int64_t axis)
+{
+    int64_t Out_0001;
+    Out_0001 = f.shape[axis];
+    return Out_0001;
+}
+/*........................................*/
+
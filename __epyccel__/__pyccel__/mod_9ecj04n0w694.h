@@ -0,0 +1,11 @@
+#ifndef MOD_9ECJ04N0W694_H
+#define MOD_9ECJ04N0W694_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_size_axis_variable_2d(t_ndarray f, int64_t axis);
+#endif // mod_9ecj04n0w694_H
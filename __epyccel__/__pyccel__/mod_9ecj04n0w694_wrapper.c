@@ -0,0 +1,104 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9ECJ04N0W694_WRAPPER
+
+#include "mod_9ecj04n0w694_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_size_axis_variable_2d_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* f_obj;
+    PyObject* axis_obj;
+    t_ndarray f = {.raw_data = NULL};
+    int64_t axis;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "f",
+        "axis",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &f_obj, &axis_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("f", f_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        f = pyarray_to_ndarray(f_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(axis_obj))
+    {
+        axis = PyInt64_to_Int64(axis_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument axis");
+        return NULL;
+    }
+    Out_0001 = test_size_axis_variable_2d(f, axis);
+    free_pointer(&f);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9ecj04n0w694_methods[] = {
+    {
+        "test_size_axis_variable_2d",
+        (PyCFunction)test_size_axis_variable_2d_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9ecj04n0w694_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9ecj04n0w694",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9ecj04n0w694_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9ecj04n0w694(void)
+{
+    PyObject* mod;
+    static void* Pymod_9ecj04n0w694_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9ecj04n0w694_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9ecj04n0w694_API, "mod_9ecj04n0w694._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_9ER7FR5QVJRZ_H
+#define MOD_9ER7FR5QVJRZ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_9er7fr5qvjrz_H
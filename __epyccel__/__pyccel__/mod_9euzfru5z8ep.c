@@ -0,0 +1,12 @@
+#include "mod_9euzfru5z8ep.h"
+
+
+/*........................................*/
+double complex cosh_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = ccosh(x) + ccosh(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_9EUZFRU5Z8EP_H
+#define MOD_9EUZFRU5Z8EP_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex cosh_phrase(double complex x, double complex y);
+#endif // mod_9euzfru5z8ep_H
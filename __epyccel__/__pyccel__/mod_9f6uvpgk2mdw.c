@@ -0,0 +1,16 @@
+#include "mod_9f6uvpgk2mdw.h"
+
+
+/*........................................*/
+int32_t type_comparison(void)
+{
+    t_ndarray b = {.raw_data = NULL};
+    int32_t Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    array_fill((int32_t)0, b);
+    Out_0001 = b.nd_int32[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
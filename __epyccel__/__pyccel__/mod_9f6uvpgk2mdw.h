@@ -0,0 +1,11 @@
+#ifndef MOD_9F6UVPGK2MDW_H
+#define MOD_9F6UVPGK2MDW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t type_comparison(void);
+#endif // mod_9f6uvpgk2mdw_H
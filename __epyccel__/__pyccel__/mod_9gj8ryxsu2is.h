@@ -0,0 +1,12 @@
+#ifndef MOD_9GJ8RYXSU2IS_H
+#define MOD_9GJ8RYXSU2IS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t homogeneous_tuple_containing_var(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_9gj8ryxsu2is_H
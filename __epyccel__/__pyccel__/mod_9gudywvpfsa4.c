@@ -0,0 +1,10 @@
+#include "mod_9gudywvpfsa4.h"
+
+
+/*........................................*/
+double sqrt_call(double x)
+{
+    return sqrt(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_9GUDYWVPFSA4_H
+#define MOD_9GUDYWVPFSA4_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sqrt_call(double x);
+#endif // mod_9gudywvpfsa4_H
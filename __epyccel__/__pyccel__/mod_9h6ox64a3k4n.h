@@ -0,0 +1,11 @@
+#ifndef MOD_9H6OX64A3K4N_H
+#define MOD_9H6OX64A3K4N_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_C_slice_12(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_9h6ox64a3k4n_H
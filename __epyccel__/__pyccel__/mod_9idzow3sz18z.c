@@ -0,0 +1,14 @@
+#include "mod_9idzow3sz18z.h"
+
+
+/*........................................*/
+void array_int_1d_scalar_sub(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i) -= a;
+    }
+}
+/*........................................*/
+
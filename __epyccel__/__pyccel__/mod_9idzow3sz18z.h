@@ -0,0 +1,11 @@
+#ifndef MOD_9IDZOW3SZ18Z_H
+#define MOD_9IDZOW3SZ18Z_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_sub(t_ndarray x, int64_t a);
+#endif // mod_9idzow3sz18z_H
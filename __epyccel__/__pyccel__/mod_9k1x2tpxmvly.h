@@ -0,0 +1,11 @@
+#ifndef MOD_9K1X2TPXMVLY_H
+#define MOD_9K1X2TPXMVLY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_inhomogeneous_copies_have_pointers(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+#endif // mod_9k1x2tpxmvly_H
@@ -0,0 +1,22 @@
+#include "mod_9lzxojdnc3uf.h"
+
+
+/*........................................*/
+double absolute_call_c_0000(double complex x)
+{
+    return cabs(x);
+}
+/*........................................*/
+/*........................................*/
+float absolute_call_c_0001(float complex x)
+{
+    return cabs(x);
+}
+/*........................................*/
+/*........................................*/
+double absolute_call_c_0002(double complex x)
+{
+    return cabs(x);
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_9LZXOJDNC3UF_H
+#define MOD_9LZXOJDNC3UF_H
+
+#include <complex.h>
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double absolute_call_c_0000(double complex x);
+float absolute_call_c_0001(float complex x);
+double absolute_call_c_0002(double complex x);
+#endif // mod_9lzxojdnc3uf_H
@@ -0,0 +1,165 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9LZXOJDNC3UF_WRAPPER
+
+#include "mod_9lzxojdnc3uf_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* absolute_call_c_0000_wrapper(PyObject* x_obj)
+{
+    double complex x;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    Out_0001 = absolute_call_c_0000(x);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* absolute_call_c_0001_wrapper(PyObject* x_obj)
+{
+    float complex x;
+    float Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex64(x_obj);
+    Out_0001 = absolute_call_c_0001(x);
+    Out_0001_obj = Float_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* absolute_call_c_0002_wrapper(PyObject* x_obj)
+{
+    double complex x;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    Out_0001 = absolute_call_c_0002(x);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t absolute_call_c_type_check(PyObject* x_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeComplex(x_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Complex64(x_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Complex128(x_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* absolute_call_c_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    type_indicator = absolute_call_c_type_check(x_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return absolute_call_c_0000_wrapper(x_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return absolute_call_c_0001_wrapper(x_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return absolute_call_c_0002_wrapper(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9lzxojdnc3uf_methods[] = {
+    {
+        "absolute_call_c",
+        (PyCFunction)absolute_call_c_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9lzxojdnc3uf_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9lzxojdnc3uf",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9lzxojdnc3uf_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9lzxojdnc3uf(void)
+{
+    PyObject* mod;
+    static void* Pymod_9lzxojdnc3uf_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9lzxojdnc3uf_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9lzxojdnc3uf_API, "mod_9lzxojdnc3uf._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
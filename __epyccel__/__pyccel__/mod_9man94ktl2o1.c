@@ -0,0 +1,10 @@
+#include "mod_9man94ktl2o1.h"
+
+
+/*........................................*/
+void set_num_threads(int64_t n)
+{
+    omp_set_num_threads((int32_t)(n));
+}
+/*........................................*/
+
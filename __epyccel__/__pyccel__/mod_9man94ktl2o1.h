@@ -0,0 +1,11 @@
+#ifndef MOD_9MAN94KTL2O1_H
+#define MOD_9MAN94KTL2O1_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_9man94ktl2o1_H
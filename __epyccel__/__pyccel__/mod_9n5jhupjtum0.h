@@ -0,0 +1,11 @@
+#ifndef MOD_9N5JHUPJTUM0_H
+#define MOD_9N5JHUPJTUM0_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_level(void);
+#endif // mod_9n5jhupjtum0_H
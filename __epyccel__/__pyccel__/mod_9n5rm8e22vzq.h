@@ -0,0 +1,12 @@
+#ifndef MOD_9N5RM8E22VZQ_H
+#define MOD_9N5RM8E22VZQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_2_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_9n5rm8e22vzq_H
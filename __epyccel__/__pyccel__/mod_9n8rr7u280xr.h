@@ -0,0 +1,11 @@
+#ifndef MOD_9N8RR7U280XR_H
+#define MOD_9N8RR7U280XR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_full_val_int_int(int64_t val);
+#endif // mod_9n8rr7u280xr_H
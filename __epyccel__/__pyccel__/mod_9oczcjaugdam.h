@@ -0,0 +1,12 @@
+#ifndef MOD_9OCZCJAUGDAM_H
+#define MOD_9OCZCJAUGDAM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_shape_C(int64_t n, int64_t m, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_9oczcjaugdam_H
@@ -0,0 +1,11 @@
+#ifndef MOD_9OSJ7GCJQB6S_H
+#define MOD_9OSJ7GCJQB6S_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_9osj7gcjqb6s_H
@@ -0,0 +1,34 @@
+#include "mod_9q75tjnl5wyo.h"
+
+
+/*........................................*/
+double array_float_2d_div_stack_array(void)
+{
+    int64_t array_dummy[INT64_C(100)];
+    t_ndarray a = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(10), INT64_C(10)},
+        .nd=2,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t i;
+    int64_t j;
+    double s;
+    array_fill((int64_t)INT64_C(2), a);
+    s = 1.0;
+    {
+        int64_t* restrict a_data = a.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(10); i += INT64_C(1))
+        {
+            for (j = INT64_C(0); j < INT64_C(10); j += INT64_C(1))
+            {
+                s /= a_data[i * a.shape[INT64_C(1)] + j];
+            }
+        }
+    }
+    return s;
+}
+/*........................................*/
+
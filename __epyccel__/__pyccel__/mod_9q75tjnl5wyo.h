@@ -0,0 +1,11 @@
+#ifndef MOD_9Q75TJNL5WYO_H
+#define MOD_9Q75TJNL5WYO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_div_stack_array(void);
+#endif // mod_9q75tjnl5wyo_H
@@ -0,0 +1,18 @@
+#include "mod_9qxnxvni4qpl.h"
+
+
+/*........................................*/
+int64_t omp_arraysum_combined(t_ndarray x)
+{
+    int64_t i;
+    int64_t func_result;
+    func_result = INT64_C(0);
+    #pragma omp parallel for reduction(+: func_result)
+    for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+    {
+        func_result += GET_ELEMENT(x, nd_int64, i);
+    }
+    return func_result;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_9QXNXVNI4QPL_H
+#define MOD_9QXNXVNI4QPL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_combined(t_ndarray x);
+#endif // mod_9qxnxvni4qpl_H
@@ -0,0 +1,10 @@
+#include "mod_9ralfvmcfpdr.h"
+
+
+/*........................................*/
+double fabs_call_i(int64_t x)
+{
+    return fabs((double)(x));
+}
+/*........................................*/
+
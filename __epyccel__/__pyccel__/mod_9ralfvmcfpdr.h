@@ -0,0 +1,11 @@
+#ifndef MOD_9RALFVMCFPDR_H
+#define MOD_9RALFVMCFPDR_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double fabs_call_i(int64_t x);
+#endif // mod_9ralfvmcfpdr_H
@@ -0,0 +1,10 @@
+#include "mod_9rt85ip2temc.h"
+
+
+/*........................................*/
+double complex sqrt_call(double complex x)
+{
+    return csqrt(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_9RT85IP2TEMC_H
+#define MOD_9RT85IP2TEMC_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex sqrt_call(double complex x);
+#endif // mod_9rt85ip2temc_H
@@ -0,0 +1,11 @@
+#ifndef MOD_9TAX8KDSJ2WN_H
+#define MOD_9TAX8KDSJ2WN_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_get_cancellation(void);
+#endif // mod_9tax8kdsj2wn_H
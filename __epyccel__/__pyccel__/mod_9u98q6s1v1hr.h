@@ -0,0 +1,12 @@
+#ifndef MOD_9U98Q6S1V1HR_H
+#define MOD_9U98Q6S1V1HR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t array_int_1d_initialization_1(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_9u98q6s1v1hr_H
@@ -0,0 +1,11 @@
+#ifndef MOD_9V2BRMP119VO_H
+#define MOD_9V2BRMP119VO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_9v2brmp119vo_H
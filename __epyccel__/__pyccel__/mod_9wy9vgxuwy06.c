@@ -0,0 +1,76 @@
+#include "mod_9wy9vgxuwy06.h"
+
+
+/*........................................*/
+float get_float32_0000(bool a)
+{
+    float b;
+    b = (float)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_float32_0001(int64_t a)
+{
+    float b;
+    b = (float)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_float32_0002(int8_t a)
+{
+    float b;
+    b = (float)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_float32_0003(int16_t a)
+{
+    float b;
+    b = (float)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_float32_0004(int32_t a)
+{
+    float b;
+    b = (float)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_float32_0005(int64_t a)
+{
+    float b;
+    b = (float)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_float32_0006(double a)
+{
+    float b;
+    b = (float)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_float32_0007(float a)
+{
+    float b;
+    b = (float)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_float32_0008(double a)
+{
+    float b;
+    b = (float)(a);
+    return b;
+}
+/*........................................*/
+
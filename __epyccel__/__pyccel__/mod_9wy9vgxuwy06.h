@@ -0,0 +1,19 @@
+#ifndef MOD_9WY9VGXUWY06_H
+#define MOD_9WY9VGXUWY06_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float get_float32_0000(bool a);
+float get_float32_0001(int64_t a);
+float get_float32_0002(int8_t a);
+float get_float32_0003(int16_t a);
+float get_float32_0004(int32_t a);
+float get_float32_0005(int64_t a);
+float get_float32_0006(double a);
+float get_float32_0007(float a);
+float get_float32_0008(double a);
+#endif // mod_9wy9vgxuwy06_H
@@ -0,0 +1,291 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9WY9VGXUWY06_WRAPPER
+
+#include "mod_9wy9vgxuwy06_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_float32_0000_wrapper(PyObject* a_obj)
+{
+    bool a;
+    float b;
+    PyObject* b_obj;
+    a = PyBool_to_Bool(a_obj);
+    b = get_float32_0000(a);
+    b_obj = Float_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_float32_0001_wrapper(PyObject* a_obj)
+{
+    int64_t a;
+    float b;
+    PyObject* b_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = get_float32_0001(a);
+    b_obj = Float_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_float32_0002_wrapper(PyObject* a_obj)
+{
+    int8_t a;
+    float b;
+    PyObject* b_obj;
+    a = PyInt8_to_Int8(a_obj);
+    b = get_float32_0002(a);
+    b_obj = Float_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_float32_0003_wrapper(PyObject* a_obj)
+{
+    int16_t a;
+    float b;
+    PyObject* b_obj;
+    a = PyInt16_to_Int16(a_obj);
+    b = get_float32_0003(a);
+    b_obj = Float_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_float32_0004_wrapper(PyObject* a_obj)
+{
+    int32_t a;
+    float b;
+    PyObject* b_obj;
+    a = PyInt32_to_Int32(a_obj);
+    b = get_float32_0004(a);
+    b_obj = Float_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_float32_0005_wrapper(PyObject* a_obj)
+{
+    int64_t a;
+    float b;
+    PyObject* b_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = get_float32_0005(a);
+    b_obj = Float_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_float32_0006_wrapper(PyObject* a_obj)
+{
+    double a;
+    float b;
+    PyObject* b_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = get_float32_0006(a);
+    b_obj = Float_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_float32_0007_wrapper(PyObject* a_obj)
+{
+    float a;
+    float b;
+    PyObject* b_obj;
+    a = PyFloat_to_Float(a_obj);
+    b = get_float32_0007(a);
+    b_obj = Float_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_float32_0008_wrapper(PyObject* a_obj)
+{
+    double a;
+    float b;
+    PyObject* b_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = get_float32_0008(a);
+    b_obj = Float_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t get_float32_type_check(PyObject* a_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_Bool(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeInt(a_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Int8(a_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Int16(a_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Int32(a_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_Int64(a_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (PyIs_NativeFloat(a_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Float(a_obj))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (PyIs_Double(a_obj))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* get_float32_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    type_indicator = get_float32_type_check(a_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return get_float32_0000_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return get_float32_0001_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return get_float32_0002_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return get_float32_0003_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return get_float32_0004_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return get_float32_0005_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(6))
+    {
+        return get_float32_0006_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(7))
+    {
+        return get_float32_0007_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(8))
+    {
+        return get_float32_0008_wrapper(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9wy9vgxuwy06_methods[] = {
+    {
+        "get_float32",
+        (PyCFunction)get_float32_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9wy9vgxuwy06_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9wy9vgxuwy06",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9wy9vgxuwy06_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9wy9vgxuwy06(void)
+{
+    PyObject* mod;
+    static void* Pymod_9wy9vgxuwy06_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9wy9vgxuwy06_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9wy9vgxuwy06_API, "mod_9wy9vgxuwy06._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#include "mod_9x2wbmjd514f.h"
+
+
+/*........................................*/
+double complex cos_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = ccos(x) + ccos(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_9X2WBMJD514F_H
+#define MOD_9X2WBMJD514F_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex cos_phrase(double complex x, double complex y);
+#endif // mod_9x2wbmjd514f_H
@@ -0,0 +1,11 @@
+#ifndef MOD_9XO1R6S0H0G8_H
+#define MOD_9XO1R6S0H0G8_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_set_schedule(void);
+#endif // mod_9xo1r6s0h0g8_H
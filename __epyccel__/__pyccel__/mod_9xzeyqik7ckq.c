@@ -0,0 +1,12 @@
+#include "mod_9xzeyqik7ckq.h"
+
+
+/*........................................*/
+double tan_phrase_r_r(double x, double y)
+{
+    double a;
+    a = tan(x) + tan(y);
+    return a;
+}
+/*........................................*/
+
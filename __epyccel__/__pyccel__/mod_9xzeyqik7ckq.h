@@ -0,0 +1,10 @@
+#ifndef MOD_9XZEYQIK7CKQ_H
+#define MOD_9XZEYQIK7CKQ_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double tan_phrase_r_r(double x, double y);
+#endif // mod_9xzeyqik7ckq_H
@@ -0,0 +1,11 @@
+#ifndef MOD_9YGC830T43WS_H
+#define MOD_9YGC830T43WS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(t_ndarray x, int64_t* n, int64_t* m, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_9ygc830t43ws_H
@@ -0,0 +1,10 @@
+#include "mod_9ylm0ksk2dqw.h"
+
+
+/*........................................*/
+double log_call_r(double x)
+{
+    return log(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_9YLM0KSK2DQW_H
+#define MOD_9YLM0KSK2DQW_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log_call_r(double x);
+#endif // mod_9ylm0ksk2dqw_H
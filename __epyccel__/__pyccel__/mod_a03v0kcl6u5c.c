@@ -0,0 +1,12 @@
+#include "mod_a03v0kcl6u5c.h"
+
+
+/*........................................*/
+float sum_call(t_ndarray x)
+{
+    float Out_0001;
+    Out_0001 = numpy_sum_float32(x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_A03V0KCL6U5C_H
+#define MOD_A03V0KCL6U5C_H
+
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+float sum_call(t_ndarray x);
+#endif // mod_a03v0kcl6u5c_H
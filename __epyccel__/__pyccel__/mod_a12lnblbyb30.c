@@ -0,0 +1,10 @@
+#include "mod_a12lnblbyb30.h"
+
+
+/*........................................*/
+double complex tanh_call(double complex x)
+{
+    return ctanh(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_A12LNBLBYB30_H
+#define MOD_A12LNBLBYB30_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex tanh_call(double complex x);
+#endif // mod_a12lnblbyb30_H
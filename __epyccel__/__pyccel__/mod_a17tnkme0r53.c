@@ -0,0 +1,24 @@
+#include "mod_a17tnkme0r53.h"
+
+
+/*........................................*/
+double complex optional_var_2_0000(int64_t x, double complex* y)
+{
+    if (y == NULL)
+    {
+        return x + _Complex_I;
+    }
+    return x + (*y);
+}
+/*........................................*/
+/*........................................*/
+double complex optional_var_2_0001(double x, double complex* y)
+{
+    if (y == NULL)
+    {
+        return x + _Complex_I;
+    }
+    return x + (*y);
+}
+/*........................................*/
+
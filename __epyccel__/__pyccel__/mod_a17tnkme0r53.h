@@ -0,0 +1,12 @@
+#ifndef MOD_A17TNKME0R53_H
+#define MOD_A17TNKME0R53_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex optional_var_2_0000(int64_t x, double complex* y);
+double complex optional_var_2_0001(double x, double complex* y);
+#endif // mod_a17tnkme0r53_H
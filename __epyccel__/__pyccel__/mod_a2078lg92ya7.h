@@ -0,0 +1,11 @@
+#ifndef MOD_A2078LG92YA7_H
+#define MOD_A2078LG92YA7_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_a2078lg92ya7_H
@@ -0,0 +1,11 @@
+#ifndef MOD_A2X8CT5RQBT2_H
+#define MOD_A2X8CT5RQBT2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_a2x8ct5rqbt2_H
@@ -0,0 +1,12 @@
+#include "mod_a4lyotlmer4h.h"
+
+
+/*........................................*/
+double fabs_phrase_i_i(int64_t x, int64_t y)
+{
+    double a;
+    a = fabs((double)(x)) * fabs((double)(y));
+    return a;
+}
+/*........................................*/
+
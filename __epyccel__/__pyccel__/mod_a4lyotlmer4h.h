@@ -0,0 +1,11 @@
+#ifndef MOD_A4LYOTLMER4H_H
+#define MOD_A4LYOTLMER4H_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double fabs_phrase_i_i(int64_t x, int64_t y);
+#endif // mod_a4lyotlmer4h_H
@@ -0,0 +1,12 @@
+#include "mod_a4rb0tdhqfec.h"
+
+
+/*........................................*/
+double complex max_call(t_ndarray x)
+{
+    double complex Out_0001;
+    Out_0001 = numpy_amax_complex128(x);
+    return Out_0001;
+}
+/*........................................*/
+
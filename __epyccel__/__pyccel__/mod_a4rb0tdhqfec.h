@@ -0,0 +1,11 @@
+#ifndef MOD_A4RB0TDHQFEC_H
+#define MOD_A4RB0TDHQFEC_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+double complex max_call(t_ndarray x);
+#endif // mod_a4rb0tdhqfec_H
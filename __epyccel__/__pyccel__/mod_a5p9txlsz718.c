@@ -0,0 +1,34 @@
+#include "mod_a5p9txlsz718.h"
+
+
+/*........................................*/
+int64_t tuples_add_inhomogeneous_with_variables(int64_t* Out_0001, int64_t* Out_0002, bool* Out_0003, int64_t* Out_0004, bool* Out_0005, int64_t* Out_0006)
+{
+    int64_t a_0;
+    int64_t a_1;
+    bool a_2;
+    int64_t c_0;
+    int64_t c_1;
+    bool c_2;
+    int64_t c_3;
+    bool c_4;
+    int64_t c_5;
+    a_0 = INT64_C(1);
+    a_1 = INT64_C(2);
+    a_2 = 1;
+    c_0 = a_0;
+    c_1 = a_1;
+    c_2 = a_2;
+    c_3 = INT64_C(4);
+    c_4 = 0;
+    c_5 = INT64_C(6);
+    (*Out_0001) = c_0;
+    (*Out_0002) = c_1;
+    (*Out_0003) = c_2;
+    (*Out_0004) = c_3;
+    (*Out_0005) = c_4;
+    (*Out_0006) = c_5;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_A5P9TXLSZ718_H
+#define MOD_A5P9TXLSZ718_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_add_inhomogeneous_with_variables(int64_t* Out_0001, int64_t* Out_0002, bool* Out_0003, int64_t* Out_0004, bool* Out_0005, int64_t* Out_0006);
+#endif // mod_a5p9txlsz718_H
@@ -0,0 +1,12 @@
+#include "mod_a8yc16b1vrkr.h"
+
+
+/*........................................*/
+double f(void)
+{
+    double complex a;
+    a = (1.0 + 2.0 * _Complex_I);
+    return cimag(a);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_A8YC16B1VRKR_H
+#define MOD_A8YC16B1VRKR_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double f(void);
+#endif // mod_a8yc16b1vrkr_H
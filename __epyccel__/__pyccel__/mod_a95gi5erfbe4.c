@@ -0,0 +1,12 @@
+#include "mod_a95gi5erfbe4.h"
+
+
+/*........................................*/
+int64_t test_shape_1d_tuple(t_ndarray f)
+{
+    int64_t s;
+    s = f.shape[INT64_C(0)];
+    return s;
+}
+/*........................................*/
+
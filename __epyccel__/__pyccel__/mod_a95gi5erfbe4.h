@@ -0,0 +1,11 @@
+#ifndef MOD_A95GI5ERFBE4_H
+#define MOD_A95GI5ERFBE4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_shape_1d_tuple(t_ndarray f);
+#endif // mod_a95gi5erfbe4_H
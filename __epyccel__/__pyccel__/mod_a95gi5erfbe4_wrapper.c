@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_A95GI5ERFBE4_WRAPPER
+
+#include "mod_a95gi5erfbe4_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_shape_1d_tuple_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* f_obj;
+    t_ndarray f = {.raw_data = NULL};
+    int64_t s;
+    PyObject* s_obj;
+    static const char* const kwlist[] = {
+        "f",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &f_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("f", f_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        f = pyarray_to_ndarray(f_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    s = test_shape_1d_tuple(f);
+    free_pointer(&f);
+    s_obj = Int64_to_PyLong(&s);
+    return s_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_a95gi5erfbe4_methods[] = {
+    {
+        "test_shape_1d_tuple",
+        (PyCFunction)test_shape_1d_tuple_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_a95gi5erfbe4_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_a95gi5erfbe4",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_a95gi5erfbe4_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_a95gi5erfbe4(void)
+{
+    PyObject* mod;
+    static void* Pymod_a95gi5erfbe4_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_a95gi5erfbe4_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_a95gi5erfbe4_API, "mod_a95gi5erfbe4._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
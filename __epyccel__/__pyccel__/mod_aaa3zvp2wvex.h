@@ -0,0 +1,13 @@
+#ifndef MOD_AAA3ZVP2WVEX_H
+#define MOD_AAA3ZVP2WVEX_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_3_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_aaa3zvp2wvex_H
@@ -0,0 +1,11 @@
+#ifndef MOD_AADJKZ0DGECU_H
+#define MOD_AADJKZ0DGECU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_div(t_ndarray x, t_ndarray y);
+#endif // mod_aadjkz0dgecu_H
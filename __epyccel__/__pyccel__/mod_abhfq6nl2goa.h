@@ -0,0 +1,12 @@
+#ifndef MOD_ABHFQ6NL2GOA_H
+#define MOD_ABHFQ6NL2GOA_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_abhfq6nl2goa_H
@@ -0,0 +1,42 @@
+#include "mod_adavqm2x14kb.h"
+
+
+/*........................................*/
+int64_t arr_bool_sum(void)
+{
+    int64_t i;
+    vec_bool rows = {0};
+    int64_t Dummy_0000;
+    int64_t j;
+    vec_vec_bool mat = {0};
+    int64_t Dummy_0001;
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i_0001;
+    int64_t Out_0001;
+    vec_bool_resize(&rows, INT64_C(100), 0);
+    Dummy_0000 = INT64_C(0);
+    for (i = INT64_C(0); i < INT64_C(100); i += INT64_C(1))
+    {
+        (*vec_bool_at_mut(&rows,Dummy_0000)) = 1;
+        Dummy_0000 = Dummy_0000 + INT64_C(1);
+    }
+    vec_vec_bool_resize(&mat, INT64_C(100), 0);
+    Dummy_0001 = INT64_C(0);
+    for (j = INT64_C(0); j < INT64_C(100); j += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < vec_vec_bool_size(&mat); i_0001 += INT64_C(1))
+        {
+            (*vec_bool_at_mut(&(*vec_vec_bool_at_mut(&mat,Dummy_0001)),i_0001)) = (*vec_bool_at(&rows,i_0001));
+        }
+        Dummy_0001 = Dummy_0001 + INT64_C(1);
+    }
+    a = array_create(2, (int64_t[]){vec_vec_bool_size(&mat), vec_vec_bool_size(&mat)}, nd_bool, false, order_c);
+    array_copy_data(&a, mat, 0);
+    Out_0001 = numpy_sum_bool(a);
+    vec_bool_drop(&rows);
+    vec_vec_bool_drop(&mat);
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_AE80HBAH2QTL_H
+#define MOD_AE80HBAH2QTL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_ae80hbah2qtl_H
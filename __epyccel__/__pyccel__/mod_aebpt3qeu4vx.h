@@ -0,0 +1,11 @@
+#ifndef MOD_AEBPT3QEU4VX_H
+#define MOD_AEBPT3QEU4VX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double multiple_np_linspace(void);
+#endif // mod_aebpt3qeu4vx_H
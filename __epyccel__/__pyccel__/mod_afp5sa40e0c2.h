@@ -0,0 +1,12 @@
+#ifndef MOD_AFP5SA40E0C2_H
+#define MOD_AFP5SA40E0C2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_like_val_int_auto(void);
+#endif // mod_afp5sa40e0c2_H
@@ -0,0 +1,11 @@
+#ifndef MOD_AFQZOIRMAM1K_H
+#define MOD_AFQZOIRMAM1K_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_add(t_ndarray x, double a);
+#endif // mod_afqzoirmam1k_H
@@ -0,0 +1,13 @@
+#ifndef MOD_AGL6LFRZKKGY_H
+#define MOD_AGL6LFRZKKGY_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_mod(t_ndarray x, double a);
+#endif // mod_agl6lfrzkkgy_H
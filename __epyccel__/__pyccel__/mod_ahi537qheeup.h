@@ -0,0 +1,13 @@
+#ifndef MOD_AHI537QHEEUP_H
+#define MOD_AHI537QHEEUP_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_full_like_3_val(void);
+#endif // mod_ahi537qheeup_H
@@ -0,0 +1,16 @@
+#include "mod_ahycrdgieriy.h"
+
+
+/*........................................*/
+double pow_call_0000(double x, int64_t y)
+{
+    return pow(x, (double)(y));
+}
+/*........................................*/
+/*........................................*/
+double pow_call_0001(double x, double y)
+{
+    return pow(x, y);
+}
+/*........................................*/
+
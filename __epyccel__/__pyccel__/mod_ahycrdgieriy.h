@@ -0,0 +1,12 @@
+#ifndef MOD_AHYCRDGIERIY_H
+#define MOD_AHYCRDGIERIY_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double pow_call_0000(double x, int64_t y);
+double pow_call_0001(double x, double y);
+#endif // mod_ahycrdgieriy_H
@@ -0,0 +1,11 @@
+#ifndef MOD_AI2O9RSB9VT0_H
+#define MOD_AI2O9RSB9VT0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_ai2o9rsb9vt0_H
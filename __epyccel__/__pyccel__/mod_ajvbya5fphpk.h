@@ -0,0 +1,11 @@
+#ifndef MOD_AJVBYA5FPHPK_H
+#define MOD_AJVBYA5FPHPK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul(t_ndarray A, t_ndarray B, t_ndarray out);
+#endif // mod_ajvbya5fphpk_H
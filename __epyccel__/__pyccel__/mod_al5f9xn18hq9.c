@@ -0,0 +1,16 @@
+#include "mod_al5f9xn18hq9.h"
+
+
+/*........................................*/
+double return_add_arr_arg_element(int64_t i, t_ndarray arg)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, a);
+    Out_0001 = a.nd_double[INT64_C(0)] + GET_ELEMENT(arg, nd_double, INT64_C(0));
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
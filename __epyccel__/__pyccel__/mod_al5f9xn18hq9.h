@@ -0,0 +1,11 @@
+#ifndef MOD_AL5F9XN18HQ9_H
+#define MOD_AL5F9XN18HQ9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double return_add_arr_arg_element(int64_t i, t_ndarray arg);
+#endif // mod_al5f9xn18hq9_H
@@ -0,0 +1,10 @@
+#ifndef MOD_ALQG3JPKYFN5_H
+#define MOD_ALQG3JPKYFN5_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t for_loop1(int64_t start, int64_t stop, int64_t step);
+#endif // mod_alqg3jpkyfn5_H
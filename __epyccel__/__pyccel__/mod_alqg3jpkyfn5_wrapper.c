@@ -0,0 +1,115 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_ALQG3JPKYFN5_WRAPPER
+
+#include "mod_alqg3jpkyfn5_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* for_loop1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* start_obj;
+    PyObject* stop_obj;
+    PyObject* step_obj;
+    int64_t start;
+    int64_t stop;
+    int64_t step;
+    int64_t x;
+    PyObject* x_obj;
+    static const char* const kwlist[] = {
+        "start",
+        "stop",
+        "step",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &start_obj, &stop_obj, &step_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(start_obj))
+    {
+        start = PyInt64_to_Int64(start_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument start");
+        return NULL;
+    }
+    if (PyIs_NativeInt(stop_obj))
+    {
+        stop = PyInt64_to_Int64(stop_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument stop");
+        return NULL;
+    }
+    if (PyIs_NativeInt(step_obj))
+    {
+        step = PyInt64_to_Int64(step_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument step");
+        return NULL;
+    }
+    x = for_loop1(start, stop, step);
+    x_obj = Int64_to_PyLong(&x);
+    return x_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_alqg3jpkyfn5_methods[] = {
+    {
+        "for_loop1",
+        (PyCFunction)for_loop1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_alqg3jpkyfn5_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_alqg3jpkyfn5",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_alqg3jpkyfn5_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_alqg3jpkyfn5(void)
+{
+    PyObject* mod;
+    static void* Pymod_alqg3jpkyfn5_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_alqg3jpkyfn5_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_alqg3jpkyfn5_API, "mod_alqg3jpkyfn5._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,10 @@
+#ifndef MOD_ALSBB5PUTXMJ_H
+#define MOD_ALSBB5PUTXMJ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_range_sum_critical(int64_t x);
+#endif // mod_alsbb5putxmj_H
@@ -0,0 +1,13 @@
+#ifndef MOD_AM42BT8L11NK_H
+#define MOD_AM42BT8L11NK_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_zeros_like_val_complex128(void);
+#endif // mod_am42bt8l11nk_H
@@ -0,0 +1,21 @@
+#include "mod_ao5px00ym4eq.h"
+
+
+/*........................................*/
+int64_t tuple_homogeneous_int(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 3 * a.type_size);
+    i = INT64_C(1);
+    (*Out_0001) = GET_ELEMENT(a, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(a, nd_int64, i);
+    (*Out_0003) = GET_ELEMENT(a, nd_int64, INT64_C(2));
+    (*Out_0004) = INT64_C(3);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_AO5PX00YM4EQ_H
+#define MOD_AO5PX00YM4EQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_homogeneous_int(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_ao5px00ym4eq_H
@@ -0,0 +1,12 @@
+#include "mod_aoezqzjd39na.h"
+
+
+/*........................................*/
+double tanh_phrase(double x, double y)
+{
+    double a;
+    a = tanh(x) + tanh(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_AOEZQZJD39NA_H
+#define MOD_AOEZQZJD39NA_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double tanh_phrase(double x, double y);
+#endif // mod_aoezqzjd39na_H
@@ -0,0 +1,13 @@
+#include "mod_aoogdy77c110.h"
+
+
+/*........................................*/
+int32_t test_omp_get_set_max_active_levels(int64_t max_active_levels)
+{
+    int32_t max_active_levels_var;
+    omp_set_max_active_levels((int32_t)(max_active_levels));
+    max_active_levels_var = omp_get_max_active_levels();
+    return max_active_levels_var;
+}
+/*........................................*/
+
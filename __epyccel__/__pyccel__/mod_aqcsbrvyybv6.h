@@ -0,0 +1,12 @@
+#ifndef MOD_AQCSBRVYYBV6_H
+#define MOD_AQCSBRVYYBV6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_like_val_int_auto(void);
+#endif // mod_aqcsbrvyybv6_H
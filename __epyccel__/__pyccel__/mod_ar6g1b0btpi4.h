@@ -0,0 +1,11 @@
+#ifndef MOD_AR6G1B0BTPI4_H
+#define MOD_AR6G1B0BTPI4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double first(t_ndarray x);
+#endif // mod_ar6g1b0btpi4_H
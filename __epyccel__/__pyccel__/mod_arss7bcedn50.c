@@ -0,0 +1,30 @@
+#include "mod_arss7bcedn50.h"
+
+
+/*........................................*/
+int64_t tuple_indexing_2d(void)
+{
+    t_ndarray ai_0 = {.raw_data = NULL};
+    t_ndarray ai_1 = {.raw_data = NULL};
+    int64_t i;
+    int64_t z;
+    ai_0 = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    ai_1 = array_create(1, (int64_t[]){INT64_C(3)}, nd_bool, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(0), INT64_C(1), INT64_C(2)};
+    memcpy(&ai_0.nd_int64[INT64_C(0)], Dummy_0000, 3 * ai_0.type_size);
+    bool Dummy_0001[] = {1, 0, 1};
+    memcpy(&ai_1.nd_bool[INT64_C(0)], Dummy_0001, 3 * ai_1.type_size);
+    z = INT64_C(0);
+    for (i = INT64_C(0); i < INT64_C(3); i += INT64_C(1))
+    {
+        if (GET_ELEMENT(ai_1, nd_bool, i))
+        {
+            z += GET_ELEMENT(ai_0, nd_int64, i);
+        }
+    }
+    free_array(&ai_0);
+    free_array(&ai_1);
+    return z;
+}
+/*........................................*/
+
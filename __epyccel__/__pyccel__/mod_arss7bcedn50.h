@@ -0,0 +1,13 @@
+#ifndef MOD_ARSS7BCEDN50_H
+#define MOD_ARSS7BCEDN50_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_indexing_2d(void);
+#endif // mod_arss7bcedn50_H
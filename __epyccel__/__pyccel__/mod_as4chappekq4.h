@@ -0,0 +1,11 @@
+#ifndef MOD_AS4CHAPPEKQ4_H
+#define MOD_AS4CHAPPEKQ4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_1(t_ndarray a);
+#endif // mod_as4chappekq4_H
@@ -0,0 +1,11 @@
+#ifndef MOD_AS8Q1WL34WQ5_H
+#define MOD_AS8Q1WL34WQ5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_nowait(t_ndarray x, t_ndarray y, t_ndarray z);
+#endif // mod_as8q1wl34wq5_H
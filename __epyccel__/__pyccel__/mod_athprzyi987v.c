@@ -0,0 +1,10 @@
+#include "mod_athprzyi987v.h"
+
+
+/*........................................*/
+double arccos_call_i(int64_t x)
+{
+    return acos((double)(x));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_ATHPRZYI987V_H
+#define MOD_ATHPRZYI987V_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arccos_call_i(int64_t x);
+#endif // mod_athprzyi987v_H
@@ -0,0 +1,12 @@
+#ifndef MOD_ATYBKIN4VO0Q_H
+#define MOD_ATYBKIN4VO0Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_2d_F_array_initialization(t_ndarray a);
+#endif // mod_atybkin4vo0q_H
@@ -0,0 +1,114 @@
+#include "mod_au4308tpcpid.h"
+
+
+/*........................................*/
+t_ndarray return_array_0000(bool a, bool b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_bool, false, order_c);
+    bool Dummy_0000[] = {a, b};
+    memcpy(&x.nd_bool[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0001(int64_t a, int64_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0002(int8_t a, int8_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int8, false, order_c);
+    int8_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int8[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0003(int16_t a, int16_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int16, false, order_c);
+    int16_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int16[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0004(int32_t a, int32_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int32, false, order_c);
+    int32_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int32[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0005(int64_t a, int64_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0006(double a, double b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0007(float a, float b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_float, false, order_c);
+    float Dummy_0000[] = {a, b};
+    memcpy(&x.nd_float[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0008(double a, double b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0009(float complex a, float complex b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_cfloat, false, order_c);
+    float complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cfloat[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0010(double complex a, double complex b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_cdouble, false, order_c);
+    double complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cdouble[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    return x;
+}
+/*........................................*/
+
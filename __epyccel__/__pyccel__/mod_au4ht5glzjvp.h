@@ -0,0 +1,12 @@
+#ifndef MOD_AU4HT5GLZJVP_H
+#define MOD_AU4HT5GLZJVP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_like_shape_C(int64_t n, int64_t m, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_au4ht5glzjvp_H
@@ -0,0 +1,12 @@
+#include "mod_auhdy8zztnrq.h"
+
+
+/*........................................*/
+double complex atanh_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = catanh(x) + catanh(y);
+    return a;
+}
+/*........................................*/
+
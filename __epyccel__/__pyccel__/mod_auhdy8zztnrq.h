@@ -0,0 +1,10 @@
+#ifndef MOD_AUHDY8ZZTNRQ_H
+#define MOD_AUHDY8ZZTNRQ_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex atanh_phrase(double complex x, double complex y);
+#endif // mod_auhdy8zztnrq_H
@@ -0,0 +1,12 @@
+#ifndef MOD_AULO1UDBCTCN_H
+#define MOD_AULO1UDBCTCN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t unpack_array_of_known_size(double* x, double* y, double* z);
+#endif // mod_aulo1udbctcn_H
@@ -0,0 +1,90 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_AULO1UDBCTCN_WRAPPER
+
+#include "mod_aulo1udbctcn_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* unpack_array_of_known_size_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    double x;
+    PyObject* y_obj;
+    double y;
+    PyObject* z_obj;
+    double z;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    unpack_array_of_known_size(&x, &y, &z);
+    x_obj = Double_to_NumpyDouble(&x);
+    y_obj = Double_to_NumpyDouble(&y);
+    z_obj = Double_to_NumpyDouble(&z);
+    Out_obj = Py_BuildValue("OOO", x_obj, y_obj, z_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    Py_DECREF(z_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_aulo1udbctcn_methods[] = {
+    {
+        "unpack_array_of_known_size",
+        (PyCFunction)unpack_array_of_known_size_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_aulo1udbctcn_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_aulo1udbctcn",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_aulo1udbctcn_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_aulo1udbctcn(void)
+{
+    PyObject* mod;
+    static void* Pymod_aulo1udbctcn_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_aulo1udbctcn_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_aulo1udbctcn_API, "mod_aulo1udbctcn._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_AX07WMLSYGDM_H
+#define MOD_AX07WMLSYGDM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_arg_names(int64_t val, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_ax07wmlsygdm_H
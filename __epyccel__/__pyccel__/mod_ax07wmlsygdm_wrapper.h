@@ -0,0 +1,40 @@
+#ifndef MOD_AX07WMLSYGDM_WRAPPER_H
+#define MOD_AX07WMLSYGDM_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ax07wmlsygdm.h"
+
+
+#ifdef MOD_AX07WMLSYGDM_WRAPPER
+
+
+#else
+
+static void** Pymod_ax07wmlsygdm_API;
+
+
+/*........................................*/
+static int mod_ax07wmlsygdm_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ax07wmlsygdm_API = (void**)PyCapsule_Import("mod_ax07wmlsygdm._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ax07wmlsygdm_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_AX07WMLSYGDM_WRAPPER_H
@@ -0,0 +1,10 @@
+#ifndef MOD_AY2JRJ7072CT_H
+#define MOD_AY2JRJ7072CT_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t f18(int32_t a);
+#endif // mod_ay2jrj7072ct_H
@@ -0,0 +1,12 @@
+#ifndef MOD_B049Y5DEHS95_H
+#define MOD_B049Y5DEHS95_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_c_to_default_0000(t_ndarray b);
+t_ndarray copy_c_to_default_0001(t_ndarray b);
+#endif // mod_b049y5dehs95_H
@@ -0,0 +1,12 @@
+#ifndef MOD_B19BMT6MGGTN_H
+#define MOD_B19BMT6MGGTN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_like_1_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_b19bmt6mggtn_H
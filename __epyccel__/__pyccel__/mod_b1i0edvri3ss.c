@@ -0,0 +1,10 @@
+#include "mod_b1i0edvri3ss.h"
+
+
+/*........................................*/
+void set_num_threads(int64_t n)
+{
+    omp_set_num_threads((int32_t)(n));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_B1I0EDVRI3SS_H
+#define MOD_B1I0EDVRI3SS_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_b1i0edvri3ss_H
@@ -0,0 +1,12 @@
+#ifndef MOD_B1LTUV0PU8VM_H
+#define MOD_B1LTUV0PU8VM_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float complex create_ones_val_complex64(void);
+#endif // mod_b1ltuv0pu8vm_H
@@ -0,0 +1,11 @@
+#ifndef MOD_B32RXO0PJ1K1_H
+#define MOD_B32RXO0PJ1K1_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_set_get_dynamic(bool dynamic_theads);
+#endif // mod_b32rxo0pj1k1_H
@@ -0,0 +1,76 @@
+#include "mod_b3ttubnvaqwa.h"
+
+
+/*........................................*/
+double get_float64_0000(bool a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_float64_0001(int64_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_float64_0002(int8_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_float64_0003(int16_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_float64_0004(int32_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_float64_0005(int64_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_float64_0006(double a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_float64_0007(float a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_float64_0008(double a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+
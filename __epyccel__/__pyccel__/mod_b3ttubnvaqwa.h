@@ -0,0 +1,19 @@
+#ifndef MOD_B3TTUBNVAQWA_H
+#define MOD_B3TTUBNVAQWA_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double get_float64_0000(bool a);
+double get_float64_0001(int64_t a);
+double get_float64_0002(int8_t a);
+double get_float64_0003(int16_t a);
+double get_float64_0004(int32_t a);
+double get_float64_0005(int64_t a);
+double get_float64_0006(double a);
+double get_float64_0007(float a);
+double get_float64_0008(double a);
+#endif // mod_b3ttubnvaqwa_H
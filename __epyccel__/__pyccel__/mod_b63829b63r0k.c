@@ -0,0 +1,76 @@
+#include "mod_b63829b63r0k.h"
+
+
+/*........................................*/
+float complex get_complex64_0000(bool a)
+{
+    float complex b;
+    b = (float complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float complex get_complex64_0001(int64_t a)
+{
+    float complex b;
+    b = (float complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float complex get_complex64_0002(int8_t a)
+{
+    float complex b;
+    b = (float complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float complex get_complex64_0003(int16_t a)
+{
+    float complex b;
+    b = (float complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float complex get_complex64_0004(int32_t a)
+{
+    float complex b;
+    b = (float complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float complex get_complex64_0005(int64_t a)
+{
+    float complex b;
+    b = (float complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float complex get_complex64_0006(double a)
+{
+    float complex b;
+    b = (float complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float complex get_complex64_0007(float a)
+{
+    float complex b;
+    b = (float complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float complex get_complex64_0008(double a)
+{
+    float complex b;
+    b = (float complex)(a);
+    return b;
+}
+/*........................................*/
+
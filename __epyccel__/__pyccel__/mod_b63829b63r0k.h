@@ -0,0 +1,20 @@
+#ifndef MOD_B63829B63R0K_H
+#define MOD_B63829B63R0K_H
+
+#include <complex.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float complex get_complex64_0000(bool a);
+float complex get_complex64_0001(int64_t a);
+float complex get_complex64_0002(int8_t a);
+float complex get_complex64_0003(int16_t a);
+float complex get_complex64_0004(int32_t a);
+float complex get_complex64_0005(int64_t a);
+float complex get_complex64_0006(double a);
+float complex get_complex64_0007(float a);
+float complex get_complex64_0008(double a);
+#endif // mod_b63829b63r0k_H
@@ -0,0 +1,11 @@
+#ifndef MOD_B74Q5JOM0JCD_H
+#define MOD_B74Q5JOM0JCD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_ones_val_int(void);
+#endif // mod_b74q5jom0jcd_H
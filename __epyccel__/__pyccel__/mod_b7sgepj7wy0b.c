@@ -0,0 +1,46 @@
+#include "mod_b7sgepj7wy0b.h"
+
+
+/*........................................*/
+int64_t add_scalars_or_arrays_0000(int64_t a, int64_t b)
+{
+    return a + b + INT64_C(1);
+}
+/*........................................*/
+/*........................................*/
+t_ndarray add_scalars_or_arrays_0001(t_ndarray a, t_ndarray b)
+{
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    Out_0001 = array_create(1, (int64_t[]){a.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < Out_0001.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Out_0001_data[i] = GET_ELEMENT(a, nd_double, i) + GET_ELEMENT(b, nd_double, i) + INT64_C(1);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray add_scalars_or_arrays_0002(t_ndarray a, t_ndarray b)
+{
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    Out_0001 = array_create(2, (int64_t[]){a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict Out_0001_data = Out_0001.nd_cdouble;
+        for (i = INT64_C(0); i < Out_0001.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < Out_0001.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                Out_0001_data[i * Out_0001.shape[INT64_C(1)] + i_0001] = GET_ELEMENT(a, nd_cdouble, i, i_0001) + GET_ELEMENT(b, nd_cdouble, i, i_0001) + INT64_C(1);
+            }
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+
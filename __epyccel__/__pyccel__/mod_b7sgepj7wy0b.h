@@ -0,0 +1,14 @@
+#ifndef MOD_B7SGEPJ7WY0B_H
+#define MOD_B7SGEPJ7WY0B_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t add_scalars_or_arrays_0000(int64_t a, int64_t b);
+t_ndarray add_scalars_or_arrays_0001(t_ndarray a, t_ndarray b);
+t_ndarray add_scalars_or_arrays_0002(t_ndarray a, t_ndarray b);
+#endif // mod_b7sgepj7wy0b_H
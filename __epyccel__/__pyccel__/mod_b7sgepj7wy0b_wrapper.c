@@ -0,0 +1,196 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_B7SGEPJ7WY0B_WRAPPER
+
+#include "mod_b7sgepj7wy0b_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_scalars_or_arrays_0000_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t a;
+    int64_t b;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = PyInt64_to_Int64(b_obj);
+    Out_0001 = add_scalars_or_arrays_0000(a, b);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_scalars_or_arrays_0001_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    b = pyarray_to_ndarray(b_obj);
+    Out_0001 = add_scalars_or_arrays_0001(a, b);
+    free_pointer(&a);
+    free_pointer(&b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_scalars_or_arrays_0002_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    b = pyarray_to_ndarray(b_obj);
+    Out_0001 = add_scalars_or_arrays_0002(a, b);
+    free_pointer(&a);
+    free_pointer(&b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t add_scalars_or_arrays_type_check(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeInt(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(a_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(a_obj, NPY_CDOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    if (PyIs_NativeInt(b_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(b_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (is_numpy_array(b_obj, NPY_CDOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument b");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* add_scalars_or_arrays_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &a_obj, &b_obj))
+    {
+        return NULL;
+    }
+    type_indicator = add_scalars_or_arrays_type_check(a_obj, b_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return add_scalars_or_arrays_0000_wrapper(a_obj, b_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return add_scalars_or_arrays_0001_wrapper(a_obj, b_obj);
+    }
+    else if (type_indicator == INT64_C(8))
+    {
+        return add_scalars_or_arrays_0002_wrapper(a_obj, b_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_b7sgepj7wy0b_methods[] = {
+    {
+        "add_scalars_or_arrays",
+        (PyCFunction)add_scalars_or_arrays_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_b7sgepj7wy0b_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_b7sgepj7wy0b",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_b7sgepj7wy0b_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_b7sgepj7wy0b(void)
+{
+    PyObject* mod;
+    static void* Pymod_b7sgepj7wy0b_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_b7sgepj7wy0b_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_b7sgepj7wy0b_API, "mod_b7sgepj7wy0b._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
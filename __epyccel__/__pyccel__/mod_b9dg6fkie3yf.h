@@ -0,0 +1,11 @@
+#ifndef MOD_B9DG6FKIE3YF_H
+#define MOD_B9DG6FKIE3YF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f(t_ndarray x);
+#endif // mod_b9dg6fkie3yf_H
@@ -0,0 +1,23 @@
+module mod_ba732853153bb1dfde3edf8e0951f47c
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function mul_three(x) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: x
+
+    Out_0001 = x * 3_i64
+    return
+
+  end function mul_three
+  !........................................
+
+end module mod_ba732853153bb1dfde3edf8e0951f47c
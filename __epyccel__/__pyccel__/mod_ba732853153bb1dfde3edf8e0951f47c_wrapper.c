@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_BA732853153BB1DFDE3EDF8E0951F47C_WRAPPER
+
+#include "mod_ba732853153bb1dfde3edf8e0951f47c_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_mul_three_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    int64_t x;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(x_obj))
+    {
+        x = PyInt64_to_Int64(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument x");
+        return NULL;
+    }
+    Out_0001 = bind_c_mul_three(x);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ba732853153bb1dfde3edf8e0951f47c_methods[] = {
+    {
+        "mul_three",
+        (PyCFunction)bind_c_mul_three_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ba732853153bb1dfde3edf8e0951f47c_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ba732853153bb1dfde3edf8e0951f47c",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ba732853153bb1dfde3edf8e0951f47c_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ba732853153bb1dfde3edf8e0951f47c(void)
+{
+    PyObject* mod;
+    static void* Pymod_ba732853153bb1dfde3edf8e0951f47c_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ba732853153bb1dfde3edf8e0951f47c_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ba732853153bb1dfde3edf8e0951f47c_API, "mod_ba732853153bb1dfde3edf8e0951f47c._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
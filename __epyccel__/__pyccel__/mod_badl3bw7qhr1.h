@@ -0,0 +1,11 @@
+#ifndef MOD_BADL3BW7QHR1_H
+#define MOD_BADL3BW7QHR1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_ones_1_val(void);
+#endif // mod_badl3bw7qhr1_H
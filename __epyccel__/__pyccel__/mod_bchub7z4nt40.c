@@ -0,0 +1,24 @@
+#include "mod_bchub7z4nt40.h"
+
+
+/*........................................*/
+void array_complex_1d_scalar_add_0000(t_ndarray x, float complex a, int64_t x_len)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x_len; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_cfloat, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void array_complex_1d_scalar_add_0001(t_ndarray x, double complex a, int64_t x_len)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x_len; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_cdouble, i) += a;
+    }
+}
+/*........................................*/
+
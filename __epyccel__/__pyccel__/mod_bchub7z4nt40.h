@@ -0,0 +1,13 @@
+#ifndef MOD_BCHUB7Z4NT40_H
+#define MOD_BCHUB7Z4NT40_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_complex_1d_scalar_add_0000(t_ndarray x, float complex a, int64_t x_len);
+void array_complex_1d_scalar_add_0001(t_ndarray x, double complex a, int64_t x_len);
+#endif // mod_bchub7z4nt40_H
@@ -0,0 +1,11 @@
+#ifndef MOD_BCK6F9PSFLSE_H
+#define MOD_BCK6F9PSFLSE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_1D_1(t_ndarray a);
+#endif // mod_bck6f9psflse_H
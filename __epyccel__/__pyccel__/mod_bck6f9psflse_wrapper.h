@@ -0,0 +1,42 @@
+#ifndef MOD_BCK6F9PSFLSE_WRAPPER_H
+#define MOD_BCK6F9PSFLSE_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_bck6f9psflse.h"
+
+
+#ifdef MOD_BCK6F9PSFLSE_WRAPPER
+
+
+#else
+
+static void** Pymod_bck6f9psflse_API;
+
+
+/*........................................*/
+static int mod_bck6f9psflse_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_bck6f9psflse_API = (void**)PyCapsule_Import("mod_bck6f9psflse._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_bck6f9psflse_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BCK6F9PSFLSE_WRAPPER_H
@@ -0,0 +1,12 @@
+#include "mod_bcwbr481zoz8.h"
+
+
+/*........................................*/
+double arctan2_phrase(double x, double y, double z)
+{
+    double a;
+    a = atan2(x, y) + atan2(x, z);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_BCWBR481ZOZ8_H
+#define MOD_BCWBR481ZOZ8_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double arctan2_phrase(double x, double y, double z);
+#endif // mod_bcwbr481zoz8_H
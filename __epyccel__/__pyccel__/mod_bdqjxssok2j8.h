@@ -0,0 +1,12 @@
+#ifndef MOD_BDQJXSSOK2J8_H
+#define MOD_BDQJXSSOK2J8_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_idiv(t_ndarray x, int64_t a);
+#endif // mod_bdqjxssok2j8_H
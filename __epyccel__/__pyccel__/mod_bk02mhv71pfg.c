@@ -0,0 +1,166 @@
+#include "mod_bk02mhv71pfg.h"
+
+
+/*........................................*/
+t_ndarray test_linspace_0000(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(3, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)], start.shape[INT64_C(1)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+                {
+                    a_data[(i * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = (GET_ELEMENT(start, nd_int64, i_0001, i_0002) + i*(double)((stop - GET_ELEMENT(start, nd_int64, i_0001, i_0002))) / (double)((numberOfSamplesToGenerate - (int64_t)(endpoint))));
+                    a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = endpoint ? (double)stop : a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002];
+                }
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0001(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(3, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)], start.shape[INT64_C(1)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+                {
+                    a_data[(i * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = (GET_ELEMENT(start, nd_int8, i_0001, i_0002) + i*(double)((stop - GET_ELEMENT(start, nd_int8, i_0001, i_0002))) / (double)((numberOfSamplesToGenerate - (int64_t)(endpoint))));
+                    a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = endpoint ? (double)stop : a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002];
+                }
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0002(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(3, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)], start.shape[INT64_C(1)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+                {
+                    a_data[(i * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = (GET_ELEMENT(start, nd_int16, i_0001, i_0002) + i*(double)((stop - GET_ELEMENT(start, nd_int16, i_0001, i_0002))) / (double)((numberOfSamplesToGenerate - (int64_t)(endpoint))));
+                    a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = endpoint ? (double)stop : a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002];
+                }
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0003(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(3, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)], start.shape[INT64_C(1)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+                {
+                    a_data[(i * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = (GET_ELEMENT(start, nd_int32, i_0001, i_0002) + i*(double)((stop - GET_ELEMENT(start, nd_int32, i_0001, i_0002))) / (double)((numberOfSamplesToGenerate - (int64_t)(endpoint))));
+                    a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = endpoint ? (double)stop : a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002];
+                }
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0004(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(3, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)], start.shape[INT64_C(1)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+                {
+                    a_data[(i * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = (GET_ELEMENT(start, nd_double, i_0001, i_0002) + i*(stop - GET_ELEMENT(start, nd_double, i_0001, i_0002)) / (numberOfSamplesToGenerate - (int64_t)(endpoint)));
+                    a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = endpoint ? (double)stop : a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002];
+                }
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray test_linspace_0005(t_ndarray start, int64_t stop, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    t_ndarray a = {.raw_data = NULL};
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(3, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)], start.shape[INT64_C(1)]}, nd_float, false, order_c);
+    {
+        float* restrict a_data = a.nd_float;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+                {
+                    a_data[(i * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = (GET_ELEMENT(start, nd_float, i_0001, i_0002) + i*(stop - GET_ELEMENT(start, nd_float, i_0001, i_0002)) / (numberOfSamplesToGenerate - (int64_t)(endpoint)));
+                    a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002] = endpoint ? (float)stop : a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0001) * a.shape[INT64_C(2)] + i_0002];
+                }
+            }
+        }
+    }
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,269 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_BK02MHV71PFG_WRAPPER
+
+#include "mod_bk02mhv71pfg_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_0000_wrapper(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    t_ndarray start = {.raw_data = NULL};
+    int64_t stop;
+    bool endpoint;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    start = pyarray_to_ndarray(start_obj);
+    stop = PyInt64_to_Int64(stop_obj);
+    endpoint = PyBool_to_Bool(endpoint_obj);
+    a = test_linspace_0000(start, stop, endpoint);
+    free_pointer(&start);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_0001_wrapper(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    t_ndarray start = {.raw_data = NULL};
+    int64_t stop;
+    bool endpoint;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    start = pyarray_to_ndarray(start_obj);
+    stop = PyInt64_to_Int64(stop_obj);
+    endpoint = PyBool_to_Bool(endpoint_obj);
+    a = test_linspace_0001(start, stop, endpoint);
+    free_pointer(&start);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_0002_wrapper(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    t_ndarray start = {.raw_data = NULL};
+    int64_t stop;
+    bool endpoint;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    start = pyarray_to_ndarray(start_obj);
+    stop = PyInt64_to_Int64(stop_obj);
+    endpoint = PyBool_to_Bool(endpoint_obj);
+    a = test_linspace_0002(start, stop, endpoint);
+    free_pointer(&start);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_0003_wrapper(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    t_ndarray start = {.raw_data = NULL};
+    int64_t stop;
+    bool endpoint;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    start = pyarray_to_ndarray(start_obj);
+    stop = PyInt64_to_Int64(stop_obj);
+    endpoint = PyBool_to_Bool(endpoint_obj);
+    a = test_linspace_0003(start, stop, endpoint);
+    free_pointer(&start);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_0004_wrapper(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    t_ndarray start = {.raw_data = NULL};
+    int64_t stop;
+    bool endpoint;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    start = pyarray_to_ndarray(start_obj);
+    stop = PyInt64_to_Int64(stop_obj);
+    endpoint = PyBool_to_Bool(endpoint_obj);
+    a = test_linspace_0004(start, stop, endpoint);
+    free_pointer(&start);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_0005_wrapper(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    t_ndarray start = {.raw_data = NULL};
+    int64_t stop;
+    bool endpoint;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    start = pyarray_to_ndarray(start_obj);
+    stop = PyInt64_to_Int64(stop_obj);
+    endpoint = PyBool_to_Bool(endpoint_obj);
+    a = test_linspace_0005(start, stop, endpoint);
+    free_pointer(&start);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t test_linspace_type_check(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(start_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(start_obj, NPY_BYTE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(start_obj, NPY_SHORT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (is_numpy_array(start_obj, NPY_INT32, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (is_numpy_array(start_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (is_numpy_array(start_obj, NPY_FLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument start");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* test_linspace_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* start_obj;
+    PyObject* stop_obj;
+    PyObject* endpoint_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "start",
+        "stop",
+        "endpoint",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &start_obj, &stop_obj, &endpoint_obj))
+    {
+        return NULL;
+    }
+    type_indicator = test_linspace_type_check(start_obj, stop_obj, endpoint_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return test_linspace_0000_wrapper(start_obj, stop_obj, endpoint_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return test_linspace_0001_wrapper(start_obj, stop_obj, endpoint_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return test_linspace_0002_wrapper(start_obj, stop_obj, endpoint_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return test_linspace_0003_wrapper(start_obj, stop_obj, endpoint_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return test_linspace_0004_wrapper(start_obj, stop_obj, endpoint_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return test_linspace_0005_wrapper(start_obj, stop_obj, endpoint_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_bk02mhv71pfg_methods[] = {
+    {
+        "test_linspace",
+        (PyCFunction)test_linspace_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_bk02mhv71pfg_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_bk02mhv71pfg",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_bk02mhv71pfg_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_bk02mhv71pfg(void)
+{
+    PyObject* mod;
+    static void* Pymod_bk02mhv71pfg_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_bk02mhv71pfg_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_bk02mhv71pfg_API, "mod_bk02mhv71pfg._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
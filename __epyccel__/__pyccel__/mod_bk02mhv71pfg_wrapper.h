@@ -0,0 +1,42 @@
+#ifndef MOD_BK02MHV71PFG_WRAPPER_H
+#define MOD_BK02MHV71PFG_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_bk02mhv71pfg.h"
+
+
+#ifdef MOD_BK02MHV71PFG_WRAPPER
+
+
+#else
+
+static void** Pymod_bk02mhv71pfg_API;
+
+
+/*........................................*/
+static int mod_bk02mhv71pfg_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_bk02mhv71pfg_API = (void**)PyCapsule_Import("mod_bk02mhv71pfg._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_bk02mhv71pfg_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BK02MHV71PFG_WRAPPER_H
@@ -0,0 +1,17 @@
+#include "mod_bkdojbqwzt1q.h"
+
+
+/*........................................*/
+int64_t test_shape_1d(t_ndarray f)
+{
+    t_ndarray s = {.raw_data = NULL};
+    int64_t Out_0001;
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {f.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    Out_0001 = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    free_array(&s);
+    return Out_0001;
+}
+/*........................................*/
+
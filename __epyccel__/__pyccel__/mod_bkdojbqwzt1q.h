@@ -0,0 +1,12 @@
+#ifndef MOD_BKDOJBQWZT1Q_H
+#define MOD_BKDOJBQWZT1Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_shape_1d(t_ndarray f);
+#endif // mod_bkdojbqwzt1q_H
@@ -0,0 +1,11 @@
+#ifndef MOD_BL1ML2GD4WMT_H
+#define MOD_BL1ML2GD4WMT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_3(t_ndarray a);
+#endif // mod_bl1ml2gd4wmt_H
@@ -0,0 +1,12 @@
+#ifndef MOD_BLE47DW97XXQ_H
+#define MOD_BLE47DW97XXQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_1(void);
+#endif // mod_ble47dw97xxq_H
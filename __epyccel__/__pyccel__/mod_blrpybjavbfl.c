@@ -0,0 +1,29 @@
+#include "mod_blrpybjavbfl.h"
+
+
+/*........................................*/
+void test_linspace_type2(int64_t start, int64_t end, t_ndarray result)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    x = array_create(1, (int64_t[]){INT64_C(15)}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict x_data = x.nd_cdouble;
+        for (i_0001 = INT64_C(0); i_0001 < INT64_C(15); i_0001 += INT64_C(1))
+        {
+            x_data[i_0001] = (start + i_0001*(double)((end * INT64_C(2) - start)) / 14.0);
+            x_data[INT64_C(14)] = (double complex)end * INT64_C(2);
+        }
+    }
+    {
+        double complex* restrict x_data_0001 = x.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(15); i += INT64_C(1))
+        {
+            GET_ELEMENT(result, nd_cdouble, i) = x_data_0001[i];
+        }
+    }
+    free_array(&x);
+}
+/*........................................*/
+
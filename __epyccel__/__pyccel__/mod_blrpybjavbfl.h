@@ -0,0 +1,12 @@
+#ifndef MOD_BLRPYBJAVBFL_H
+#define MOD_BLRPYBJAVBFL_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void test_linspace_type2(int64_t start, int64_t end, t_ndarray result);
+#endif // mod_blrpybjavbfl_H
@@ -0,0 +1,114 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_BLRPYBJAVBFL_WRAPPER
+
+#include "mod_blrpybjavbfl_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_type2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* start_obj;
+    PyObject* end_obj;
+    PyObject* result_obj;
+    int64_t start;
+    int64_t end;
+    t_ndarray result = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "start",
+        "end",
+        "result",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &start_obj, &end_obj, &result_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(start_obj))
+    {
+        start = PyInt64_to_Int64(start_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument start");
+        return NULL;
+    }
+    if (PyIs_NativeInt(end_obj))
+    {
+        end = PyInt64_to_Int64(end_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument end");
+        return NULL;
+    }
+    if (pyarray_check("result", result_obj, NPY_CDOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        result = pyarray_to_ndarray(result_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    test_linspace_type2(start, end, result);
+    free_pointer(&result);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_blrpybjavbfl_methods[] = {
+    {
+        "test_linspace_type2",
+        (PyCFunction)test_linspace_type2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_blrpybjavbfl_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_blrpybjavbfl",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_blrpybjavbfl_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_blrpybjavbfl(void)
+{
+    PyObject* mod;
+    static void* Pymod_blrpybjavbfl_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_blrpybjavbfl_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_blrpybjavbfl_API, "mod_blrpybjavbfl._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,21 @@
+#include "mod_bma1fimpuv2c.h"
+
+
+/*........................................*/
+double complex create_zeros_like_val_complex_auto(void)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    double complex Out_0001;
+    arr = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    double complex Dummy_0000[] = {INT64_C(5), INT64_C(1), INT64_C(8), INT64_C(0), INT64_C(9)};
+    memcpy(&arr.nd_cdouble[INT64_C(0)], Dummy_0000, 5 * arr.type_size);
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    array_fill((double complex)(0.0 * _Complex_I), a);
+    Out_0001 = a.nd_cdouble[INT64_C(0)];
+    free_array(&a);
+    free_array(&arr);
+    return Out_0001;
+}
+/*........................................*/
+
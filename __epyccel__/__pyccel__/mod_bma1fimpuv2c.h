@@ -0,0 +1,13 @@
+#ifndef MOD_BMA1FIMPUV2C_H
+#define MOD_BMA1FIMPUV2C_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_zeros_like_val_complex_auto(void);
+#endif // mod_bma1fimpuv2c_H
@@ -0,0 +1,12 @@
+#ifndef MOD_BN1C5VNIZ6U0_H
+#define MOD_BN1C5VNIZ6U0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_like_val_int(void);
+#endif // mod_bn1c5vniz6u0_H
@@ -0,0 +1,29 @@
+#include "mod_bnsdx74d7m3s.h"
+
+
+/*........................................*/
+int64_t omp_simd(int64_t n)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    int64_t i;
+    int64_t func_result;
+    func_result = INT64_C(0);
+    arr = array_create(1, (int64_t[]){n}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), arr);
+    #pragma omp parallel num_threads(4)
+    {
+        #pragma omp simd
+        for (i = INT64_C(0); i < n; i += INT64_C(1))
+        {
+            GET_ELEMENT(arr, nd_int64, i) = i;
+        }
+    }
+    for (i = INT64_C(0); i < n; i += INT64_C(1))
+    {
+        func_result = func_result + GET_ELEMENT(arr, nd_int64, i);
+    }
+    free_array(&arr);
+    return func_result;
+}
+/*........................................*/
+
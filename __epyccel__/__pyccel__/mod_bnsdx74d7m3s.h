@@ -0,0 +1,11 @@
+#ifndef MOD_BNSDX74D7M3S_H
+#define MOD_BNSDX74D7M3S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_simd(int64_t n);
+#endif // mod_bnsdx74d7m3s_H
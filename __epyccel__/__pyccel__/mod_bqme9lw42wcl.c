@@ -0,0 +1,10 @@
+#include "mod_bqme9lw42wcl.h"
+
+
+/*........................................*/
+double complex atan_call(double complex x)
+{
+    return catan(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_BQME9LW42WCL_H
+#define MOD_BQME9LW42WCL_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex atan_call(double complex x);
+#endif // mod_bqme9lw42wcl_H
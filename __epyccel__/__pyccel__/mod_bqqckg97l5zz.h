@@ -0,0 +1,11 @@
+#ifndef MOD_BQQCKG97L5ZZ_H
+#define MOD_BQQCKG97L5ZZ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_bqqckg97l5zz_H
@@ -0,0 +1,12 @@
+#include "mod_braibdxcy35f.h"
+
+
+/*........................................*/
+int64_t min_call(t_ndarray x)
+{
+    int64_t Out_0001;
+    Out_0001 = numpy_amin_int64(x);
+    return Out_0001;
+}
+/*........................................*/
+
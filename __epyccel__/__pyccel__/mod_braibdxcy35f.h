@@ -0,0 +1,11 @@
+#ifndef MOD_BRAIBDXCY35F_H
+#define MOD_BRAIBDXCY35F_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t min_call(t_ndarray x);
+#endif // mod_braibdxcy35f_H
@@ -0,0 +1,10 @@
+#include "mod_brjy75mx3qrn.h"
+
+
+/*........................................*/
+double log1p_call(double x)
+{
+    return log1p(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_BRJY75MX3QRN_H
+#define MOD_BRJY75MX3QRN_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log1p_call(double x);
+#endif // mod_brjy75mx3qrn_H
@@ -0,0 +1,10 @@
+#include "mod_bsj8xvdq13de.h"
+
+
+/*........................................*/
+double sinh_call_r(double x)
+{
+    return sinh(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_BSJ8XVDQ13DE_H
+#define MOD_BSJ8XVDQ13DE_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sinh_call_r(double x);
+#endif // mod_bsj8xvdq13de_H
@@ -0,0 +1,10 @@
+#include "mod_bswaotztjvm2.h"
+
+
+/*........................................*/
+double complex rect_call(double r, double phi)
+{
+    return r * cos(phi) + r * sin(phi) * _Complex_I;
+}
+/*........................................*/
+
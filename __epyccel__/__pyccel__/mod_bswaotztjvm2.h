@@ -0,0 +1,11 @@
+#ifndef MOD_BSWAOTZTJVM2_H
+#define MOD_BSWAOTZTJVM2_H
+
+#include <complex.h>
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double complex rect_call(double r, double phi);
+#endif // mod_bswaotztjvm2_H
@@ -0,0 +1,104 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_BSWAOTZTJVM2_WRAPPER
+
+#include "mod_bswaotztjvm2_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* rect_call_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* r_obj;
+    PyObject* phi_obj;
+    double r;
+    double phi;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "r",
+        "phi",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &r_obj, &phi_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(r_obj))
+    {
+        r = PyDouble_to_Double(r_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument r");
+        return NULL;
+    }
+    if (PyIs_NativeFloat(phi_obj))
+    {
+        phi = PyDouble_to_Double(phi_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument phi");
+        return NULL;
+    }
+    Out_0001 = rect_call(r, phi);
+    Out_0001_obj = Complex128_to_PyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_bswaotztjvm2_methods[] = {
+    {
+        "rect_call",
+        (PyCFunction)rect_call_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_bswaotztjvm2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_bswaotztjvm2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_bswaotztjvm2_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_bswaotztjvm2(void)
+{
+    PyObject* mod;
+    static void* Pymod_bswaotztjvm2_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_bswaotztjvm2_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_bswaotztjvm2_API, "mod_bswaotztjvm2._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,15 @@
+#ifndef MOD_BTU9PVAOBGYK_H
+#define MOD_BTU9PVAOBGYK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_ndmin_4_0000(t_ndarray x);
+t_ndarray array_ndmin_4_0001(t_ndarray x);
+t_ndarray array_ndmin_4_0002(t_ndarray x);
+t_ndarray array_ndmin_4_0003(t_ndarray x);
+t_ndarray array_ndmin_4_0004(t_ndarray x);
+#endif // mod_btu9pvaobgyk_H
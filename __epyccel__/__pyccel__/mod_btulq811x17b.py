@@ -0,0 +1,12 @@
+from numpy import shape
+from pyccel.decorators import contiguous
+
+@contiguous('u', 'out')
+def stencil(u : 'float[::,::]', out : 'float[::,::]'):
+    from numpy import shape
+    n = shape(u)[0]
+    m = shape(u)[1]
+    for i in range(1, n - 1, 1):
+        for j in range(1, m - 1, 1):
+            out[i,j] = 0.25 * (u[i - 1,j] + u[i + 1,j] + u[i,j - 1] + u[i,j + 1])
+
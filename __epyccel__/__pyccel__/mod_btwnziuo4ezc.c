@@ -0,0 +1,18 @@
+#include "mod_btwnziuo4ezc.h"
+
+
+/*........................................*/
+int64_t tuple_unpacking_5(int64_t* a, int64_t* b, int64_t* c)
+{
+    t_ndarray ai = {.raw_data = NULL};
+    ai = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&ai.nd_int64[INT64_C(0)], Dummy_0000, 3 * ai.type_size);
+    (*a) = GET_ELEMENT(ai, nd_int64, INT64_C(0));
+    (*b) = GET_ELEMENT(ai, nd_int64, INT64_C(1));
+    (*c) = GET_ELEMENT(ai, nd_int64, INT64_C(2));
+    free_array(&ai);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_BTWNZIUO4EZC_H
+#define MOD_BTWNZIUO4EZC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_unpacking_5(int64_t* a, int64_t* b, int64_t* c);
+#endif // mod_btwnziuo4ezc_H
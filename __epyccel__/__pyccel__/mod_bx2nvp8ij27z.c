@@ -0,0 +1,92 @@
+#include "mod_bx2nvp8ij27z.h"
+
+
+/*........................................*/
+int64_t get_real_0000(bool a)
+{
+    int64_t b;
+    b = (int64_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_real_0001(int64_t a)
+{
+    int64_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_real_0002(int8_t a)
+{
+    int8_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_real_0003(int16_t a)
+{
+    int16_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int32_t get_real_0004(int32_t a)
+{
+    int32_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int64_t get_real_0005(int64_t a)
+{
+    int64_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_real_0006(double a)
+{
+    double b;
+    b = a;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_real_0007(float a)
+{
+    float b;
+    b = a;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_real_0008(double a)
+{
+    double b;
+    b = a;
+    return b;
+}
+/*........................................*/
+/*........................................*/
+float get_real_0009(float complex a)
+{
+    float b;
+    b = creal(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_real_0010(double complex a)
+{
+    double b;
+    b = creal(a);
+    return b;
+}
+/*........................................*/
+
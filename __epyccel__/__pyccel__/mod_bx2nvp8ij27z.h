@@ -0,0 +1,22 @@
+#ifndef MOD_BX2NVP8IJ27Z_H
+#define MOD_BX2NVP8IJ27Z_H
+
+#include <complex.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t get_real_0000(bool a);
+int64_t get_real_0001(int64_t a);
+int8_t get_real_0002(int8_t a);
+int16_t get_real_0003(int16_t a);
+int32_t get_real_0004(int32_t a);
+int64_t get_real_0005(int64_t a);
+double get_real_0006(double a);
+float get_real_0007(float a);
+double get_real_0008(double a);
+float get_real_0009(float complex a);
+double get_real_0010(double complex a);
+#endif // mod_bx2nvp8ij27z_H
@@ -0,0 +1,11 @@
+#ifndef MOD_BXX373DJ7908_H
+#define MOD_BXX373DJ7908_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_bxx373dj7908_H
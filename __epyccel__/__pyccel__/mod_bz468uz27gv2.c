@@ -0,0 +1,18 @@
+#include "mod_bz468uz27gv2.h"
+
+
+/*........................................*/
+int64_t fizzbuzz_search_with_breaks(int64_t fizz, int64_t buzz, int64_t max_val)
+{
+    int64_t i;
+    for (i = INT64_C(1); i < max_val + INT64_C(1); i += INT64_C(1))
+    {
+        if (pyc_modulo(i, fizz) == INT64_C(0) && pyc_modulo(i, buzz) == INT64_C(0))
+        {
+            break;
+        }
+    }
+    return i;
+}
+/*........................................*/
+
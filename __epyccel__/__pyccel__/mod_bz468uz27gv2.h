@@ -0,0 +1,12 @@
+#ifndef MOD_BZ468UZ27GV2_H
+#define MOD_BZ468UZ27GV2_H
+
+#include <math.h>
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t fizzbuzz_search_with_breaks(int64_t fizz, int64_t buzz, int64_t max_val);
+#endif // mod_bz468uz27gv2_H
@@ -0,0 +1,115 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_BZ468UZ27GV2_WRAPPER
+
+#include "mod_bz468uz27gv2_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* fizzbuzz_search_with_breaks_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* fizz_obj;
+    PyObject* buzz_obj;
+    PyObject* max_val_obj;
+    int64_t fizz;
+    int64_t buzz;
+    int64_t max_val;
+    int64_t i;
+    PyObject* i_obj;
+    static const char* const kwlist[] = {
+        "fizz",
+        "buzz",
+        "max_val",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &fizz_obj, &buzz_obj, &max_val_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(fizz_obj))
+    {
+        fizz = PyInt64_to_Int64(fizz_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument fizz");
+        return NULL;
+    }
+    if (PyIs_NativeInt(buzz_obj))
+    {
+        buzz = PyInt64_to_Int64(buzz_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument buzz");
+        return NULL;
+    }
+    if (PyIs_NativeInt(max_val_obj))
+    {
+        max_val = PyInt64_to_Int64(max_val_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument max_val");
+        return NULL;
+    }
+    i = fizzbuzz_search_with_breaks(fizz, buzz, max_val);
+    i_obj = Int64_to_PyLong(&i);
+    return i_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_bz468uz27gv2_methods[] = {
+    {
+        "fizzbuzz_search_with_breaks",
+        (PyCFunction)fizzbuzz_search_with_breaks_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_bz468uz27gv2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_bz468uz27gv2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_bz468uz27gv2_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_bz468uz27gv2(void)
+{
+    PyObject* mod;
+    static void* Pymod_bz468uz27gv2_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_bz468uz27gv2_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_bz468uz27gv2_API, "mod_bz468uz27gv2._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
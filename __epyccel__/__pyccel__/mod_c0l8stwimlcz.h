@@ -0,0 +1,11 @@
+#ifndef MOD_C0L8STWIMLCZ_H
+#define MOD_C0L8STWIMLCZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_1d_matmul_order_F(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_c0l8stwimlcz_H
@@ -0,0 +1,12 @@
+#include "mod_c4bmznc1srsk.h"
+
+
+/*........................................*/
+double copysign_return_type(int64_t x, double y)
+{
+    double a;
+    a = copysign((double)(x), y);
+    return a;
+}
+/*........................................*/
+
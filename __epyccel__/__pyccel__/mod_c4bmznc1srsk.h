@@ -0,0 +1,11 @@
+#ifndef MOD_C4BMZNC1SRSK_H
+#define MOD_C4BMZNC1SRSK_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double copysign_return_type(int64_t x, double y);
+#endif // mod_c4bmznc1srsk_H
@@ -0,0 +1,22 @@
+#include "mod_c7owk6o2c3s4.h"
+
+
+/*........................................*/
+t_ndarray copy_array_to_C_0000(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    b = array_create(2, (int64_t[]){a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_double, false, order_c);
+    array_copy_data(&b, a, 0);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray copy_array_to_C_0001(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    b = array_create(3, (int64_t[]){a.shape[INT64_C(0)], a.shape[INT64_C(1)], a.shape[INT64_C(2)]}, nd_cdouble, false, order_c);
+    array_copy_data(&b, a, 0);
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_C7OWK6O2C3S4_H
+#define MOD_C7OWK6O2C3S4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_array_to_C_0000(t_ndarray a);
+t_ndarray copy_array_to_C_0001(t_ndarray a);
+#endif // mod_c7owk6o2c3s4_H
@@ -0,0 +1,11 @@
+#ifndef MOD_C86I4OYL67Z5_H
+#define MOD_C86I4OYL67Z5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_stride_19(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_c86i4oyl67z5_H
@@ -0,0 +1,10 @@
+#ifndef MOD_C8ZNGUK8YGDA_H
+#define MOD_C8ZNGUK8YGDA_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_sections(void);
+#endif // mod_c8znguk8ygda_H
@@ -0,0 +1,22 @@
+#ifndef MOD_C9K3NLYVKYI8_H
+#define MOD_C9K3NLYVKYI8_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+t_ndarray return_array_0000(int64_t a, int64_t b);
+t_ndarray return_array_0001(int8_t a, int8_t b);
+t_ndarray return_array_0002(int16_t a, int16_t b);
+t_ndarray return_array_0003(int32_t a, int32_t b);
+t_ndarray return_array_0004(int64_t a, int64_t b);
+t_ndarray return_array_0005(double a, double b);
+t_ndarray return_array_0006(float a, float b);
+t_ndarray return_array_0007(double a, double b);
+t_ndarray return_array_0008(float complex a, float complex b);
+t_ndarray return_array_0009(double complex a, double complex b);
+#endif // mod_c9k3nlyvkyi8_H
@@ -0,0 +1,22 @@
+#include "mod_caspvw35vnva.h"
+
+
+/*........................................*/
+bool create_multi_arrs(int64_t i)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray Dummy_0001 = {.raw_data = NULL};
+    t_ndarray Dummy_0002 = {.raw_data = NULL};
+    Dummy_0000 = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, Dummy_0000);
+    Dummy_0001 = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)0.0, Dummy_0001);
+    Dummy_0002 = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)0.0, Dummy_0002);
+    free_array(&Dummy_0000);
+    free_array(&Dummy_0001);
+    free_array(&Dummy_0002);
+    return 1;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_CASPVW35VNVA_H
+#define MOD_CASPVW35VNVA_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+bool create_multi_arrs(int64_t i);
+#endif // mod_caspvw35vnva_H
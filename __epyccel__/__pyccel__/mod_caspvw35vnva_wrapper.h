@@ -0,0 +1,40 @@
+#ifndef MOD_CASPVW35VNVA_WRAPPER_H
+#define MOD_CASPVW35VNVA_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_caspvw35vnva.h"
+
+
+#ifdef MOD_CASPVW35VNVA_WRAPPER
+
+
+#else
+
+static void** Pymod_caspvw35vnva_API;
+
+
+/*........................................*/
+static int mod_caspvw35vnva_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_caspvw35vnva_API = (void**)PyCapsule_Import("mod_caspvw35vnva._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_caspvw35vnva_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_CASPVW35VNVA_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_CBHOEOTQ9UDG_H
+#define MOD_CBHOEOTQ9UDG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_like_1_val(void);
+#endif // mod_cbhoeotq9udg_H
@@ -0,0 +1,26 @@
+#include "mod_cdg5skqepx1p.h"
+
+
+/*........................................*/
+int64_t scalar_or_array_0000(int64_t a)
+{
+    return a + INT64_C(2);
+}
+/*........................................*/
+/*........................................*/
+t_ndarray scalar_or_array_0001(t_ndarray a)
+{
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    Out_0001 = array_create(1, (int64_t[]){a.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    {
+        int64_t* restrict Out_0001_data = Out_0001.nd_int64;
+        for (i = INT64_C(0); i < Out_0001.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Out_0001_data[i] = GET_ELEMENT(a, nd_int64, i) + INT64_C(2);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_CDG5SKQEPX1P_H
+#define MOD_CDG5SKQEPX1P_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t scalar_or_array_0000(int64_t a);
+t_ndarray scalar_or_array_0001(t_ndarray a);
+#endif // mod_cdg5skqepx1p_H
@@ -0,0 +1,18 @@
+#include "mod_cdwr6wa285xo.h"
+
+
+/*........................................*/
+int64_t inhomogeneous_tuple_var_negative_slice(int64_t* a, bool* b)
+{
+    int64_t c_0;
+    bool c_1;
+    int64_t c_2;
+    c_0 = INT64_C(1);
+    c_1 = 0;
+    c_2 = INT64_C(3);
+    (*a) = c_0;
+    (*b) = c_1;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_CDWR6WA285XO_H
+#define MOD_CDWR6WA285XO_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t inhomogeneous_tuple_var_negative_slice(int64_t* a, bool* b);
+#endif // mod_cdwr6wa285xo_H
@@ -0,0 +1,11 @@
+#ifndef MOD_CE9E3GTRK4K1_H
+#define MOD_CE9E3GTRK4K1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_stride_4(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_ce9e3gtrk4k1_H
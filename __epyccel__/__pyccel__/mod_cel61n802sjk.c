@@ -0,0 +1,27 @@
+#include "mod_cel61n802sjk.h"
+
+
+/*........................................*/
+int64_t tuple_variable_slice(void)
+{
+    int64_t a;
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int64_t Out_0001;
+    a = INT64_C(1);
+    Dummy_0000 = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&Dummy_0000.nd_int64[INT64_C(0)], Dummy_0001, 3 * Dummy_0000.type_size);
+    b = array_create(1, (int64_t[]){a}, nd_int64, false, order_c);
+    for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(b, nd_int64, i) = GET_ELEMENT(Dummy_0000, nd_int64, i);
+    }
+    Out_0001 = GET_ELEMENT(b, nd_int64, INT64_C(0));
+    free_array(&Dummy_0000);
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
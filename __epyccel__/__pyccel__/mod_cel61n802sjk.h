@@ -0,0 +1,12 @@
+#ifndef MOD_CEL61N802SJK_H
+#define MOD_CEL61N802SJK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_variable_slice(void);
+#endif // mod_cel61n802sjk_H
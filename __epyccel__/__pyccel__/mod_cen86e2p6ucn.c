@@ -0,0 +1,12 @@
+#include "mod_cen86e2p6ucn.h"
+
+
+/*........................................*/
+int64_t max_call(t_ndarray x)
+{
+    int64_t Out_0001;
+    Out_0001 = numpy_amax_int64(x);
+    return Out_0001;
+}
+/*........................................*/
+
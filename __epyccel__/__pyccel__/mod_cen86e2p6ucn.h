@@ -0,0 +1,11 @@
+#ifndef MOD_CEN86E2P6UCN_H
+#define MOD_CEN86E2P6UCN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t max_call(t_ndarray x);
+#endif // mod_cen86e2p6ucn_H
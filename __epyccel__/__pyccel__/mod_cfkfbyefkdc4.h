@@ -0,0 +1,12 @@
+#ifndef MOD_CFKFBYEFKDC4_H
+#define MOD_CFKFBYEFKDC4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_2d_stack_array_2(void);
+#endif // mod_cfkfbyefkdc4_H
@@ -0,0 +1,12 @@
+#ifndef MOD_CFQ1JNCTGFX6_H
+#define MOD_CFQ1JNCTGFX6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t unpack_array_2D_of_known_size(double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_cfq1jnctgfx6_H
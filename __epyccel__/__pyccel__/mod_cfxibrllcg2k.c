@@ -0,0 +1,10 @@
+#include "mod_cfxibrllcg2k.h"
+
+
+/*........................................*/
+void p_func(int64_t x)
+{
+    x *= INT64_C(2);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_CFXIBRLLCG2K_H
+#define MOD_CFXIBRLLCG2K_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void p_func(int64_t x);
+#endif // mod_cfxibrllcg2k_H
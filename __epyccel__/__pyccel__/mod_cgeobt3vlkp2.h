@@ -0,0 +1,11 @@
+#ifndef MOD_CGEOBT3VLKP2_H
+#define MOD_CGEOBT3VLKP2_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_cgeobt3vlkp2_H
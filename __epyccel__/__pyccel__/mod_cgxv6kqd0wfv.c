@@ -0,0 +1,12 @@
+#include "mod_cgxv6kqd0wfv.h"
+
+
+/*........................................*/
+double absolute_phrase_r_r(double x, double y)
+{
+    double a;
+    a = fabs(x) * fabs(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_CGXV6KQD0WFV_H
+#define MOD_CGXV6KQD0WFV_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double absolute_phrase_r_r(double x, double y);
+#endif // mod_cgxv6kqd0wfv_H
@@ -0,0 +1,13 @@
+#ifndef MOD_CHI253EG2AKK_H
+#define MOD_CHI253EG2AKK_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_full_like_val_int_complex(int64_t val);
+#endif // mod_chi253eg2akk_H
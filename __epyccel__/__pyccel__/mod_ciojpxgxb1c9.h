@@ -0,0 +1,11 @@
+#ifndef MOD_CIOJPXGXB1C9_H
+#define MOD_CIOJPXGXB1C9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_sub_augassign(t_ndarray x, t_ndarray y);
+#endif // mod_ciojpxgxb1c9_H
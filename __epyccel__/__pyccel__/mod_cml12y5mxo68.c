@@ -0,0 +1,10 @@
+#include "mod_cml12y5mxo68.h"
+
+
+/*........................................*/
+bool one(void)
+{
+    return 1;
+}
+/*........................................*/
+
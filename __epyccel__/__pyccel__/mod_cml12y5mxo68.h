@@ -0,0 +1,10 @@
+#ifndef MOD_CML12Y5MXO68_H
+#define MOD_CML12Y5MXO68_H
+
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool one(void);
+#endif // mod_cml12y5mxo68_H
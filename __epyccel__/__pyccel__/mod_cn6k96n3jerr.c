@@ -0,0 +1,10 @@
+#include "mod_cn6k96n3jerr.h"
+
+
+/*........................................*/
+int64_t ceil_call(int64_t x)
+{
+    return (int64_t)ceil((double)(x));
+}
+/*........................................*/
+
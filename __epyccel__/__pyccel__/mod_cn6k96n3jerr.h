@@ -0,0 +1,11 @@
+#ifndef MOD_CN6K96N3JERR_H
+#define MOD_CN6K96N3JERR_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t ceil_call(int64_t x);
+#endif // mod_cn6k96n3jerr_H
@@ -0,0 +1,11 @@
+#ifndef MOD_CNC15IGDJCPE_H
+#define MOD_CNC15IGDJCPE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_sub(t_ndarray x, double a);
+#endif // mod_cnc15igdjcpe_H
@@ -0,0 +1,12 @@
+#include "mod_cp27s1s80bzc.h"
+
+
+/*........................................*/
+double first(t_ndarray x)
+{
+    double Out_0001;
+    Out_0001 = x.nd_double[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_CP27S1S80BZC_H
+#define MOD_CP27S1S80BZC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double first(t_ndarray x);
+#endif // mod_cp27s1s80bzc_H
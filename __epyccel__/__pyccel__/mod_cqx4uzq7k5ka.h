@@ -0,0 +1,11 @@
+#ifndef MOD_CQX4UZQ7K5KA_H
+#define MOD_CQX4UZQ7K5KA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_add(t_ndarray x, double a);
+#endif // mod_cqx4uzq7k5ka_H
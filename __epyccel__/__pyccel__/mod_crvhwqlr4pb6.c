@@ -0,0 +1,24 @@
+#include "mod_crvhwqlr4pb6.h"
+
+
+/*........................................*/
+void array_float_1d_scalar_add_0000(t_ndarray x, float a, int64_t x_len)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x_len; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_float, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void array_float_1d_scalar_add_0001(t_ndarray x, double a, int64_t x_len)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x_len; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) += a;
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_CRVHWQLR4PB6_H
+#define MOD_CRVHWQLR4PB6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_add_0000(t_ndarray x, float a, int64_t x_len);
+void array_float_1d_scalar_add_0001(t_ndarray x, double a, int64_t x_len);
+#endif // mod_crvhwqlr4pb6_H
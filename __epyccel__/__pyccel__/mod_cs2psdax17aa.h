@@ -0,0 +1,11 @@
+#ifndef MOD_CS2PSDAX17AA_H
+#define MOD_CS2PSDAX17AA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_sub(t_ndarray x, t_ndarray y);
+#endif // mod_cs2psdax17aa_H
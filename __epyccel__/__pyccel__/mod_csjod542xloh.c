@@ -0,0 +1,24 @@
+#include "mod_csjod542xloh.h"
+
+
+/*........................................*/
+int64_t optional_var_1_0000(int64_t x, int64_t* y)
+{
+    if (y == NULL)
+    {
+        return x;
+    }
+    return x + (*y);
+}
+/*........................................*/
+/*........................................*/
+double optional_var_1_0001(double x, int64_t* y)
+{
+    if (y == NULL)
+    {
+        return x;
+    }
+    return x + (*y);
+}
+/*........................................*/
+
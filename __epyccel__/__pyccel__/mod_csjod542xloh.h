@@ -0,0 +1,11 @@
+#ifndef MOD_CSJOD542XLOH_H
+#define MOD_CSJOD542XLOH_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t optional_var_1_0000(int64_t x, int64_t* y);
+double optional_var_1_0001(double x, int64_t* y);
+#endif // mod_csjod542xloh_H
@@ -0,0 +1,12 @@
+#ifndef MOD_CUOT71NH5EPR_H
+#define MOD_CUOT71NH5EPR_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_cuot71nh5epr_H
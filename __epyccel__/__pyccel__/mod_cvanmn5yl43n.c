@@ -0,0 +1,17 @@
+#include "mod_cvanmn5yl43n.h"
+
+
+/*........................................*/
+int64_t sum_natural_numbers(int64_t n)
+{
+    int64_t i;
+    int64_t x;
+    x = INT64_C(0);
+    for (i = INT64_C(1); i < n + INT64_C(1); i += INT64_C(1))
+    {
+        x += i;
+    }
+    return x;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_CVANMN5YL43N_H
+#define MOD_CVANMN5YL43N_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t sum_natural_numbers(int64_t n);
+#endif // mod_cvanmn5yl43n_H
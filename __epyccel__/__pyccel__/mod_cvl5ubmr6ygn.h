@@ -0,0 +1,12 @@
+#ifndef MOD_CVL5UBMR6YGN_H
+#define MOD_CVL5UBMR6YGN_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_empty_val_complex(void);
+#endif // mod_cvl5ubmr6ygn_H
@@ -0,0 +1,84 @@
+#include "mod_cwyw2758fg20.h"
+
+
+/*........................................*/
+double complex mix_types_1_0000(double complex x, int64_t y, int16_t z)
+{
+    if ((z != 0))
+    {
+        return x + y;
+    }
+    return x - y;
+}
+/*........................................*/
+/*........................................*/
+double complex mix_types_1_0001(double complex x, int64_t y, bool z)
+{
+    if (z)
+    {
+        return x + y;
+    }
+    return x - y;
+}
+/*........................................*/
+/*........................................*/
+double complex mix_types_1_0002(double complex x, double y, int16_t z)
+{
+    if ((z != 0))
+    {
+        return x + y;
+    }
+    return x - y;
+}
+/*........................................*/
+/*........................................*/
+double complex mix_types_1_0003(double complex x, double y, bool z)
+{
+    if (z)
+    {
+        return x + y;
+    }
+    return x - y;
+}
+/*........................................*/
+/*........................................*/
+int64_t mix_types_1_0004(int64_t x, int64_t y, int16_t z)
+{
+    if ((z != 0))
+    {
+        return x + y;
+    }
+    return x - y;
+}
+/*........................................*/
+/*........................................*/
+int64_t mix_types_1_0005(int64_t x, int64_t y, bool z)
+{
+    if (z)
+    {
+        return x + y;
+    }
+    return x - y;
+}
+/*........................................*/
+/*........................................*/
+double mix_types_1_0006(int64_t x, double y, int16_t z)
+{
+    if ((z != 0))
+    {
+        return x + y;
+    }
+    return x - y;
+}
+/*........................................*/
+/*........................................*/
+double mix_types_1_0007(int64_t x, double y, bool z)
+{
+    if (z)
+    {
+        return x + y;
+    }
+    return x - y;
+}
+/*........................................*/
+
@@ -0,0 +1,19 @@
+#ifndef MOD_CWYW2758FG20_H
+#define MOD_CWYW2758FG20_H
+
+#include <complex.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex mix_types_1_0000(double complex x, int64_t y, int16_t z);
+double complex mix_types_1_0001(double complex x, int64_t y, bool z);
+double complex mix_types_1_0002(double complex x, double y, int16_t z);
+double complex mix_types_1_0003(double complex x, double y, bool z);
+int64_t mix_types_1_0004(int64_t x, int64_t y, int16_t z);
+int64_t mix_types_1_0005(int64_t x, int64_t y, bool z);
+double mix_types_1_0006(int64_t x, double y, int16_t z);
+double mix_types_1_0007(int64_t x, double y, bool z);
+#endif // mod_cwyw2758fg20_H
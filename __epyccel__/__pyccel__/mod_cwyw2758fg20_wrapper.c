@@ -0,0 +1,309 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_CWYW2758FG20_WRAPPER
+
+#include "mod_cwyw2758fg20_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_1_0000_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    double complex x;
+    int64_t y;
+    int16_t z;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    y = PyInt64_to_Int64(y_obj);
+    z = PyInt16_to_Int16(z_obj);
+    Out_0001 = mix_types_1_0000(x, y, z);
+    Out_0001_obj = Complex128_to_PyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_1_0001_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    double complex x;
+    int64_t y;
+    bool z;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    y = PyInt64_to_Int64(y_obj);
+    z = PyBool_to_Bool(z_obj);
+    Out_0001 = mix_types_1_0001(x, y, z);
+    Out_0001_obj = Complex128_to_PyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_1_0002_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    double complex x;
+    double y;
+    int16_t z;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    y = PyDouble_to_Double(y_obj);
+    z = PyInt16_to_Int16(z_obj);
+    Out_0001 = mix_types_1_0002(x, y, z);
+    Out_0001_obj = Complex128_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_1_0003_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    double complex x;
+    double y;
+    bool z;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    y = PyDouble_to_Double(y_obj);
+    z = PyBool_to_Bool(z_obj);
+    Out_0001 = mix_types_1_0003(x, y, z);
+    Out_0001_obj = Complex128_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_1_0004_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    int64_t x;
+    int64_t y;
+    int16_t z;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt64_to_Int64(x_obj);
+    y = PyInt64_to_Int64(y_obj);
+    z = PyInt16_to_Int16(z_obj);
+    Out_0001 = mix_types_1_0004(x, y, z);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_1_0005_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    int64_t x;
+    int64_t y;
+    bool z;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt64_to_Int64(x_obj);
+    y = PyInt64_to_Int64(y_obj);
+    z = PyBool_to_Bool(z_obj);
+    Out_0001 = mix_types_1_0005(x, y, z);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_1_0006_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    int64_t x;
+    double y;
+    int16_t z;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt64_to_Int64(x_obj);
+    y = PyDouble_to_Double(y_obj);
+    z = PyInt16_to_Int16(z_obj);
+    Out_0001 = mix_types_1_0006(x, y, z);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_types_1_0007_wrapper(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    int64_t x;
+    double y;
+    bool z;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt64_to_Int64(x_obj);
+    y = PyDouble_to_Double(y_obj);
+    z = PyBool_to_Bool(z_obj);
+    Out_0001 = mix_types_1_0007(x, y, z);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t mix_types_1_type_check(PyObject* x_obj, PyObject* y_obj, PyObject* z_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeComplex(x_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeInt(x_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    if (PyIs_NativeInt(y_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Double(y_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument y");
+        return -INT64_C(1);
+    }
+    if (PyIs_Int16(z_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Bool(z_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument z");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* mix_types_1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    PyObject* z_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        "z",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &x_obj, &y_obj, &z_obj))
+    {
+        return NULL;
+    }
+    type_indicator = mix_types_1_type_check(x_obj, y_obj, z_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return mix_types_1_0000_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return mix_types_1_0001_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return mix_types_1_0002_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(6))
+    {
+        return mix_types_1_0003_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return mix_types_1_0004_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return mix_types_1_0005_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return mix_types_1_0006_wrapper(x_obj, y_obj, z_obj);
+    }
+    else if (type_indicator == INT64_C(7))
+    {
+        return mix_types_1_0007_wrapper(x_obj, y_obj, z_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_cwyw2758fg20_methods[] = {
+    {
+        "mix_types_1",
+        (PyCFunction)mix_types_1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_cwyw2758fg20_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_cwyw2758fg20",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_cwyw2758fg20_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_cwyw2758fg20(void)
+{
+    PyObject* mod;
+    static void* Pymod_cwyw2758fg20_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_cwyw2758fg20_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_cwyw2758fg20_API, "mod_cwyw2758fg20._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_CY04DXR2K92T_H
+#define MOD_CY04DXR2K92T_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_cy04dxr2k92t_H
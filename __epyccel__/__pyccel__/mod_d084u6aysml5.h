@@ -0,0 +1,12 @@
+#ifndef MOD_D084U6AYSML5_H
+#define MOD_D084U6AYSML5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int32_t create_ones_like_val_int32_auto(void);
+#endif // mod_d084u6aysml5_H
@@ -0,0 +1,22 @@
+#include "mod_d0z6fx92gs04.h"
+
+
+/*........................................*/
+t_ndarray copy_array_to_F_0000(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    b = array_create(2, (int64_t[]){a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_double, false, order_f);
+    array_copy_data(&b, a, 0);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray copy_array_to_F_0001(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    b = array_create(3, (int64_t[]){a.shape[INT64_C(0)], a.shape[INT64_C(1)], a.shape[INT64_C(2)]}, nd_cdouble, false, order_f);
+    array_copy_data(&b, a, 0);
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_D0Z6FX92GS04_H
+#define MOD_D0Z6FX92GS04_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_array_to_F_0000(t_ndarray a);
+t_ndarray copy_array_to_F_0001(t_ndarray a);
+#endif // mod_d0z6fx92gs04_H
@@ -0,0 +1,12 @@
+#ifndef MOD_D10SCBO1GMNF_H
+#define MOD_D10SCBO1GMNF_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_full_3_val(void);
+#endif // mod_d10scbo1gmnf_H
@@ -0,0 +1,12 @@
+#ifndef MOD_D11DSTXJLR9S_H
+#define MOD_D11DSTXJLR9S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float create_full_like_val_real_float32(double val);
+#endif // mod_d11dstxjlr9s_H
@@ -0,0 +1,13 @@
+#ifndef MOD_D33MSBSK1ATC_H
+#define MOD_D33MSBSK1ATC_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_mod(t_ndarray x, t_ndarray y);
+#endif // mod_d33msbsk1atc_H
@@ -0,0 +1,11 @@
+#ifndef MOD_D3OJP56IF63V_H
+#define MOD_D3OJP56IF63V_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_proc_bind(void);
+#endif // mod_d3ojp56if63v_H
@@ -0,0 +1,12 @@
+#ifndef MOD_D69O6LMGNX13_H
+#define MOD_D69O6LMGNX13_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_1_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_d69o6lmgnx13_H
@@ -0,0 +1,24 @@
+#include "mod_dcfk6y771ekr.h"
+
+
+/*........................................*/
+t_ndarray return_arrays_in_expression(void)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    Dummy_0000 = single_return();
+    b = array_create(1, (int64_t[]){INT64_C(4)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict Dummy_0000_data = Dummy_0000.nd_int64;
+        int64_t* restrict b_data = b.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(4); i += INT64_C(1))
+        {
+            b_data[i] = Dummy_0000_data[i] + INT64_C(1);
+        }
+    }
+    free_array(&Dummy_0000);
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_DCFK6Y771EKR_H
+#define MOD_DCFK6Y771EKR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray return_arrays_in_expression(void);
+#endif // mod_dcfk6y771ekr_H
@@ -0,0 +1,12 @@
+#include "mod_dd5z4k3jgnea.h"
+
+
+/*........................................*/
+int64_t sum_call(t_ndarray x)
+{
+    int64_t Out_0001;
+    Out_0001 = numpy_sum_int64(x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_DD5Z4K3JGNEA_H
+#define MOD_DD5Z4K3JGNEA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t sum_call(t_ndarray x);
+#endif // mod_dd5z4k3jgnea_H
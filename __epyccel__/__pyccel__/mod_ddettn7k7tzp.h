@@ -0,0 +1,11 @@
+#ifndef MOD_DDETTN7K7TZP_H
+#define MOD_DDETTN7K7TZP_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_ddettn7k7tzp_H
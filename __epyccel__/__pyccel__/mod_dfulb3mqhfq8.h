@@ -0,0 +1,11 @@
+#ifndef MOD_DFULB3MQHFQ8_H
+#define MOD_DFULB3MQHFQ8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_div(t_ndarray x, t_ndarray y);
+#endif // mod_dfulb3mqhfq8_H
@@ -0,0 +1,24 @@
+module mod_dk1yuevbsjrs
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function add(a, b) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: a
+    real(f64), value :: b
+
+    Out_0001 = a + b
+    return
+
+  end function add
+  !........................................
+
+end module mod_dk1yuevbsjrs
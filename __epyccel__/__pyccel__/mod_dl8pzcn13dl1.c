@@ -0,0 +1,24 @@
+#include "mod_dl8pzcn13dl1.h"
+
+
+/*........................................*/
+int64_t my_tuple_0000(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    (*Out_0001) = a.shape[INT64_C(0)];
+    (*Out_0002) = GET_ELEMENT(a, nd_int64, INT64_C(0));
+    (*Out_0003) = GET_ELEMENT(a, nd_int64, INT64_C(1));
+    (*Out_0004) = GET_ELEMENT(a, nd_int64, INT64_C(2));
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t my_tuple_0001(t_ndarray a, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004)
+{
+    (*Out_0001) = a.shape[INT64_C(0)];
+    (*Out_0002) = GET_ELEMENT(a, nd_double, INT64_C(0));
+    (*Out_0003) = GET_ELEMENT(a, nd_double, INT64_C(1));
+    (*Out_0004) = GET_ELEMENT(a, nd_double, INT64_C(2));
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_DL8PZCN13DL1_H
+#define MOD_DL8PZCN13DL1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t my_tuple_0000(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+int64_t my_tuple_0001(t_ndarray a, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004);
+#endif // mod_dl8pzcn13dl1_H
@@ -0,0 +1,229 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_DL8PZCN13DL1_WRAPPER
+
+#include "mod_dl8pzcn13dl1_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* my_tuple_0000_wrapper(PyObject* a_obj)
+{
+    int64_t a_size_0001;
+    t_ndarray a = {.raw_data = NULL};
+    int Dummy_0000;
+    PyObject* Dummy_0001;
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_obj;
+    a_size_0001 = PyTuple_Size(a_obj);
+    a = array_create(1, (int64_t[]){a_size_0001}, nd_int64, false, order_c);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < a_size_0001; Dummy_0000 += INT64_C(1))
+    {
+        Dummy_0001 = PyTuple_GetItem(a_obj, Dummy_0000);
+        GET_ELEMENT(a, nd_int64, (int64_t)Dummy_0000) = PyInt64_to_Int64(Dummy_0001);
+    }
+    my_tuple_0000(a, &Out_0001, &Out_0002, &Out_0003, &Out_0004);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_PyLong(&Out_0004);
+    Out_obj = Py_BuildValue("OOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* my_tuple_0001_wrapper(PyObject* a_obj)
+{
+    int64_t a_size_0001;
+    t_ndarray a = {.raw_data = NULL};
+    int Dummy_0000;
+    PyObject* Dummy_0001;
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    double Out_0002;
+    PyObject* Out_0003_obj;
+    double Out_0003;
+    PyObject* Out_0004_obj;
+    double Out_0004;
+    PyObject* Out_obj;
+    a_size_0001 = PyTuple_Size(a_obj);
+    a = array_create(1, (int64_t[]){a_size_0001}, nd_double, false, order_c);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < a_size_0001; Dummy_0000 += INT64_C(1))
+    {
+        Dummy_0001 = PyTuple_GetItem(a_obj, Dummy_0000);
+        GET_ELEMENT(a, nd_double, (int64_t)Dummy_0000) = PyDouble_to_Double(Dummy_0001);
+    }
+    my_tuple_0001(a, &Out_0001, &Out_0002, &Out_0003, &Out_0004);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Double_to_PyDouble(&Out_0002);
+    Out_0003_obj = Double_to_PyDouble(&Out_0003);
+    Out_0004_obj = Double_to_PyDouble(&Out_0004);
+    Out_obj = Py_BuildValue("OOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t my_tuple_type_check(PyObject* a_obj)
+{
+    bool is_homog_tuple;
+    int64_t size;
+    int Dummy_0000;
+    PyObject* Dummy_0001;
+    bool is_homog_tuple_0001;
+    int64_t size_0001;
+    int Dummy_0002;
+    PyObject* Dummy_0003;
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyTuple_Check(a_obj))
+    {
+        size = PyTuple_Size(a_obj);
+        is_homog_tuple = 1;
+        for (Dummy_0000 = INT64_C(0); Dummy_0000 < size; Dummy_0000 += INT64_C(1))
+        {
+            Dummy_0001 = PyTuple_GetItem(a_obj, Dummy_0000);
+            is_homog_tuple = is_homog_tuple && PyIs_NativeInt(Dummy_0001);
+        }
+    }
+    else
+    {
+        is_homog_tuple = 0;
+    }
+    if (PyTuple_Check(a_obj))
+    {
+        size_0001 = PyTuple_Size(a_obj);
+        is_homog_tuple_0001 = 1;
+        for (Dummy_0002 = INT64_C(0); Dummy_0002 < size_0001; Dummy_0002 += INT64_C(1))
+        {
+            Dummy_0003 = PyTuple_GetItem(a_obj, Dummy_0002);
+            is_homog_tuple_0001 = is_homog_tuple_0001 && PyIs_NativeFloat(Dummy_0003);
+        }
+    }
+    else
+    {
+        is_homog_tuple_0001 = 0;
+    }
+    if (is_homog_tuple)
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_homog_tuple_0001)
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* my_tuple_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    type_indicator = my_tuple_type_check(a_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return my_tuple_0000_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return my_tuple_0001_wrapper(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_dl8pzcn13dl1_methods[] = {
+    {
+        "my_tuple",
+        (PyCFunction)my_tuple_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_dl8pzcn13dl1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_dl8pzcn13dl1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_dl8pzcn13dl1_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_dl8pzcn13dl1(void)
+{
+    PyObject* mod;
+    static void* Pymod_dl8pzcn13dl1_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_dl8pzcn13dl1_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_dl8pzcn13dl1_API, "mod_dl8pzcn13dl1._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
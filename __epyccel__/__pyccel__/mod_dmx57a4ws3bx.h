@@ -0,0 +1,11 @@
+#ifndef MOD_DMX57A4WS3BX_H
+#define MOD_DMX57A4WS3BX_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_add_inhomogeneous(int64_t* Out_0001, int64_t* Out_0002, bool* Out_0003, bool* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_dmx57a4ws3bx_H
@@ -0,0 +1,12 @@
+#ifndef MOD_DMZDI3ZA1ZS8_H
+#define MOD_DMZDI3ZA1ZS8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float create_empty_like_val_float32_auto(void);
+#endif // mod_dmzdi3za1zs8_H
@@ -0,0 +1,11 @@
+#ifndef MOD_DQ91UFBUS8F0_H
+#define MOD_DQ91UFBUS8F0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_1(t_ndarray a);
+#endif // mod_dq91ufbus8f0_H
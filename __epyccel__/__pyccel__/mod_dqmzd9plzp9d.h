@@ -0,0 +1,11 @@
+#ifndef MOD_DQMZD9PLZP9D_H
+#define MOD_DQMZD9PLZP9D_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_dqmzd9plzp9d_H
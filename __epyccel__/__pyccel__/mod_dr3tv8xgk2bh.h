@@ -0,0 +1,11 @@
+#ifndef MOD_DR3TV8XGK2BH_H
+#define MOD_DR3TV8XGK2BH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_1(void);
+#endif // mod_dr3tv8xgk2bh_H
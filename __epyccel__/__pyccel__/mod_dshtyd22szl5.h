@@ -0,0 +1,11 @@
+#ifndef MOD_DSHTYD22SZL5_H
+#define MOD_DSHTYD22SZL5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_int_1d_initialization_4(void);
+#endif // mod_dshtyd22szl5_H
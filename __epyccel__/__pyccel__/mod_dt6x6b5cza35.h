@@ -0,0 +1,12 @@
+#ifndef MOD_DT6X6B5CZA35_H
+#define MOD_DT6X6B5CZA35_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_2(void);
+#endif // mod_dt6x6b5cza35_H
@@ -0,0 +1,10 @@
+#include "mod_dv7h07klwtmi.h"
+
+
+/*........................................*/
+bool numpy_isnan_test(double x)
+{
+    return isnan(x);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_DV7H07KLWTMI_H
+#define MOD_DV7H07KLWTMI_H
+
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool numpy_isnan_test(double x);
+#endif // mod_dv7h07klwtmi_H
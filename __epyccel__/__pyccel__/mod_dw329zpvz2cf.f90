@@ -0,0 +1,41 @@
+module mod_dw329zpvz2cf
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine axpby_fused(x, y, z, alpha, beta) 
+
+    implicit none
+
+    real(f64), intent(in) :: x(0_i64:)
+    real(f64), intent(in) :: y(0_i64:)
+    real(f64), intent(inout) :: z(0_i64:)
+    real(f64), value :: alpha
+    real(f64), value :: beta
+    real(f64), allocatable :: t(:)
+    real(f64), allocatable :: u(:)
+    integer(i64) :: i
+    real(f64) :: u_0001
+
+    allocate(t(0:size(x, kind=i64) - 1_i64))
+    t = alpha * x
+    do i = 0_i64, size(y, kind=i64) - 1_i64
+      u_0001 = beta * y(i)
+      z(i) = t(i) + u_0001
+    end do
+    if (allocated(t)) then
+      deallocate(t)
+    end if
+    if (allocated(u)) then
+      deallocate(u)
+    end if
+
+  end subroutine axpby_fused
+  !........................................
+
+end module mod_dw329zpvz2cf
@@ -0,0 +1,12 @@
+#include "mod_dwyfnkyxmuev.h"
+
+
+/*........................................*/
+int32_t test_omp_get_proc_bind(void)
+{
+    int32_t bind_var;
+    bind_var = omp_get_proc_bind();
+    return bind_var;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_DWYFNKYXMUEV_H
+#define MOD_DWYFNKYXMUEV_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_proc_bind(void);
+#endif // mod_dwyfnkyxmuev_H
@@ -0,0 +1,11 @@
+#ifndef MOD_DWZ0JZLDSXER_H
+#define MOD_DWZ0JZLDSXER_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_thread_limit(void);
+#endif // mod_dwz0jzldsxer_H
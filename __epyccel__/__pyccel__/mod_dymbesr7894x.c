@@ -0,0 +1,214 @@
+#include "mod_dymbesr7894x.h"
+
+
+/*........................................*/
+t_ndarray return_array_scalar_op_0000(int8_t a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    array_fill((int8_t)1, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    {
+        int8_t* restrict x_data = x.nd_int8;
+        int8_t* restrict Out_0001_data = Out_0001.nd_int8;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_scalar_op_0001(int16_t a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    array_fill((int16_t)1, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    {
+        int16_t* restrict x_data = x.nd_int16;
+        int16_t* restrict Out_0001_data = Out_0001.nd_int16;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_scalar_op_0002(int32_t a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    array_fill((int32_t)1, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    {
+        int32_t* restrict x_data = x.nd_int32;
+        int32_t* restrict Out_0001_data = Out_0001.nd_int32;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_scalar_op_0003(int64_t a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(1), x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict x_data = x.nd_int64;
+        int64_t* restrict Out_0001_data = Out_0001.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_scalar_op_0004(int64_t a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(1), x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict x_data = x.nd_int64;
+        int64_t* restrict Out_0001_data = Out_0001.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_scalar_op_0005(float a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    array_fill((float)1.0f, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    {
+        float* restrict x_data = x.nd_float;
+        float* restrict Out_0001_data = Out_0001.nd_float;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_scalar_op_0006(double a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_scalar_op_0007(double a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_scalar_op_0008(float complex a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    array_fill((float complex)(1.0f + 0.0f * _Complex_I), x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict x_data = x.nd_cfloat;
+        float complex* restrict Out_0001_data = Out_0001.nd_cfloat;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_scalar_op_0009(double complex a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    array_fill((double complex)(1.0 + 0.0 * _Complex_I), x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict x_data = x.nd_cdouble;
+        double complex* restrict Out_0001_data = Out_0001.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * a;
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+
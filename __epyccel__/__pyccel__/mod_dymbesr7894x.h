@@ -0,0 +1,21 @@
+#ifndef MOD_DYMBESR7894X_H
+#define MOD_DYMBESR7894X_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray return_array_scalar_op_0000(int8_t a);
+t_ndarray return_array_scalar_op_0001(int16_t a);
+t_ndarray return_array_scalar_op_0002(int32_t a);
+t_ndarray return_array_scalar_op_0003(int64_t a);
+t_ndarray return_array_scalar_op_0004(int64_t a);
+t_ndarray return_array_scalar_op_0005(float a);
+t_ndarray return_array_scalar_op_0006(double a);
+t_ndarray return_array_scalar_op_0007(double a);
+t_ndarray return_array_scalar_op_0008(float complex a);
+t_ndarray return_array_scalar_op_0009(double complex a);
+#endif // mod_dymbesr7894x_H
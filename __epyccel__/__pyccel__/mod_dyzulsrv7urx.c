@@ -0,0 +1,12 @@
+#include "mod_dyzulsrv7urx.h"
+
+
+/*........................................*/
+int64_t multi_return_vars_expr(int64_t a, int64_t b, int64_t* Out_0001, int64_t* Out_0002)
+{
+    (*Out_0001) = a - b;
+    (*Out_0002) = a + b;
+    return 0;
+}
+/*........................................*/
+
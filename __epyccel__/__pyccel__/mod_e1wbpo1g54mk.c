@@ -0,0 +1,19 @@
+#include "mod_e1wbpo1g54mk.h"
+
+
+/*........................................*/
+int64_t inhomogeneous_tuple_3(int64_t* Out_0001, double* Out_0002, int64_t* Out_0003)
+{
+    int64_t ai_0;
+    double ai_1;
+    int64_t ai_2;
+    ai_0 = INT64_C(0);
+    ai_1 = 1.0;
+    ai_2 = INT64_C(3);
+    (*Out_0001) = ai_0;
+    (*Out_0002) = ai_1;
+    (*Out_0003) = ai_2;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_E1WBPO1G54MK_H
+#define MOD_E1WBPO1G54MK_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t inhomogeneous_tuple_3(int64_t* Out_0001, double* Out_0002, int64_t* Out_0003);
+#endif // mod_e1wbpo1g54mk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_E2ZIFZ5A8YRT_H
+#define MOD_E2ZIFZ5A8YRT_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_max_threads(void);
+#endif // mod_e2zifz5a8yrt_H
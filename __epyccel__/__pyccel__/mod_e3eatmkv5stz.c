@@ -0,0 +1,12 @@
+#include "mod_e3eatmkv5stz.h"
+
+
+/*........................................*/
+double complex atan_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = catan(x) + catan(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_E3EATMKV5STZ_H
+#define MOD_E3EATMKV5STZ_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex atan_phrase(double complex x, double complex y);
+#endif // mod_e3eatmkv5stz_H
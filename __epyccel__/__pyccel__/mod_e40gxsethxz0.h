@@ -0,0 +1,11 @@
+#ifndef MOD_E40GXSETHXZ0_H
+#define MOD_E40GXSETHXZ0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_sub(t_ndarray x, t_ndarray y);
+#endif // mod_e40gxsethxz0_H
@@ -0,0 +1,23 @@
+module mod_e435b53d2e160ed9651094fd09e35445
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function add_one(x) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: x
+
+    Out_0001 = x + 1_i64
+    return
+
+  end function add_one
+  !........................................
+
+end module mod_e435b53d2e160ed9651094fd09e35445
@@ -0,0 +1,40 @@
+#ifndef MOD_E435B53D2E160ED9651094FD09E35445_WRAPPER_H
+#define MOD_E435B53D2E160ED9651094FD09E35445_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_E435B53D2E160ED9651094FD09E35445_WRAPPER
+
+int64_t bind_c_add_one(int64_t);
+
+#else
+
+static void** Pymod_e435b53d2e160ed9651094fd09e35445_API;
+
+
+/*........................................*/
+static int mod_e435b53d2e160ed9651094fd09e35445_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_e435b53d2e160ed9651094fd09e35445_API = (void**)PyCapsule_Import("mod_e435b53d2e160ed9651094fd09e35445._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_e435b53d2e160ed9651094fd09e35445_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_E435B53D2E160ED9651094FD09E35445_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_E5S70TBKOBTD_H
+#define MOD_E5S70TBKOBTD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_empty_like_val_float64(void);
+#endif // mod_e5s70tbkobtd_H
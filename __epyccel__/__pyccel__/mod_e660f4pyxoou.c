@@ -0,0 +1,11 @@
+#include "mod_e660f4pyxoou.h"
+
+
+/*........................................*/
+bool test_omp_set_get_dynamic(bool dynamic_theads)
+{
+    omp_set_dynamic(dynamic_theads);
+    return omp_get_dynamic();
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_E660F4PYXOOU_H
+#define MOD_E660F4PYXOOU_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_set_get_dynamic(bool dynamic_theads);
+#endif // mod_e660f4pyxoou_H
@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_E660F4PYXOOU_WRAPPER
+
+#include "mod_e660f4pyxoou_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_set_get_dynamic_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* dynamic_theads_obj;
+    bool dynamic_theads;
+    bool Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "dynamic_theads",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &dynamic_theads_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Bool(dynamic_theads_obj))
+    {
+        dynamic_theads = PyBool_to_Bool(dynamic_theads_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument dynamic_theads");
+        return NULL;
+    }
+    Out_0001 = test_omp_set_get_dynamic(dynamic_theads);
+    Out_0001_obj = Bool_to_PyBool(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_e660f4pyxoou_methods[] = {
+    {
+        "test_omp_set_get_dynamic",
+        (PyCFunction)test_omp_set_get_dynamic_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_e660f4pyxoou_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_e660f4pyxoou",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_e660f4pyxoou_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_e660f4pyxoou(void)
+{
+    PyObject* mod;
+    static void* Pymod_e660f4pyxoou_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_e660f4pyxoou_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_e660f4pyxoou_API, "mod_e660f4pyxoou._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
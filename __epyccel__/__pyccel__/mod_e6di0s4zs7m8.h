@@ -0,0 +1,11 @@
+#ifndef MOD_E6DI0S4ZS7M8_H
+#define MOD_E6DI0S4ZS7M8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_1(t_ndarray a);
+#endif // mod_e6di0s4zs7m8_H
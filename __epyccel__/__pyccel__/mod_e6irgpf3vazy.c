@@ -0,0 +1,16 @@
+#include "mod_e6irgpf3vazy.h"
+
+
+/*........................................*/
+double complex default_var_2_0000(int64_t x, double complex y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+double complex default_var_2_0001(double x, double complex y)
+{
+    return x + y;
+}
+/*........................................*/
+
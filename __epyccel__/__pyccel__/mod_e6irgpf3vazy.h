@@ -0,0 +1,12 @@
+#ifndef MOD_E6IRGPF3VAZY_H
+#define MOD_E6IRGPF3VAZY_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex default_var_2_0000(int64_t x, double complex y);
+double complex default_var_2_0001(double x, double complex y);
+#endif // mod_e6irgpf3vazy_H
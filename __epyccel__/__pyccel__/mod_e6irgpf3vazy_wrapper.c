@@ -0,0 +1,175 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_E6IRGPF3VAZY_WRAPPER
+
+#include "mod_e6irgpf3vazy_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* default_var_2_0000_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    int64_t x;
+    double complex y;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyInt64_to_Int64(x_obj);
+    y = (5.0 * _Complex_I);
+    if (y_obj != Py_None)
+    {
+        if (PyIs_NativeComplex(y_obj))
+        {
+            y = PyComplex_to_Complex128(y_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type complex for argument y");
+            return NULL;
+        }
+    }
+    Out_0001 = default_var_2_0000(x, y);
+    Out_0001_obj = Complex128_to_PyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* default_var_2_0001_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    double x;
+    double complex y;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyDouble_to_Double(x_obj);
+    y = (5.0 * _Complex_I);
+    if (y_obj != Py_None)
+    {
+        if (PyIs_NativeComplex(y_obj))
+        {
+            y = PyComplex_to_Complex128(y_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type complex for argument y");
+            return NULL;
+        }
+    }
+    Out_0001 = default_var_2_0001(x, y);
+    Out_0001_obj = Complex128_to_PyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t default_var_2_type_check(PyObject* x_obj, PyObject* y_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeInt(x_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeFloat(x_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* default_var_2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    int64_t type_indicator;
+    y_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    type_indicator = default_var_2_type_check(x_obj, y_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return default_var_2_0000_wrapper(x_obj, y_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return default_var_2_0001_wrapper(x_obj, y_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_e6irgpf3vazy_methods[] = {
+    {
+        "default_var_2",
+        (PyCFunction)default_var_2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_e6irgpf3vazy_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_e6irgpf3vazy",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_e6irgpf3vazy_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_e6irgpf3vazy(void)
+{
+    PyObject* mod;
+    static void* Pymod_e6irgpf3vazy_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_e6irgpf3vazy_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_e6irgpf3vazy_API, "mod_e6irgpf3vazy._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
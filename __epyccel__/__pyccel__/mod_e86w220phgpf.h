@@ -0,0 +1,12 @@
+#ifndef MOD_E86W220PHGPF_H
+#define MOD_E86W220PHGPF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_full_like_val_real_float64(double val);
+#endif // mod_e86w220phgpf_H
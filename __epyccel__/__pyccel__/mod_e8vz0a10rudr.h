@@ -0,0 +1,11 @@
+#ifndef MOD_E8VZ0A10RUDR_H
+#define MOD_E8VZ0A10RUDR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_sub(t_ndarray x, double a);
+#endif // mod_e8vz0a10rudr_H
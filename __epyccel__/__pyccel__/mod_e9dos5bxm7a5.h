@@ -0,0 +1,12 @@
+#ifndef MOD_E9DOS5BXM7A5_H
+#define MOD_E9DOS5BXM7A5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_like_1_val(void);
+#endif // mod_e9dos5bxm7a5_H
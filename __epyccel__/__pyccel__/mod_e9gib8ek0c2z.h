@@ -0,0 +1,46 @@
+#ifndef MOD_E9GIB8EK0C2Z_H
+#define MOD_E9GIB8EK0C2Z_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t add_numpy_to_numpy_type_0000(int32_t np_s_l, int32_t np_s_r);
+int64_t add_numpy_to_numpy_type_0001(int32_t np_s_l, int64_t np_s_r);
+double add_numpy_to_numpy_type_0002(int32_t np_s_l, float np_s_r);
+double add_numpy_to_numpy_type_0003(int32_t np_s_l, double np_s_r);
+double complex add_numpy_to_numpy_type_0004(int32_t np_s_l, float complex np_s_r);
+double complex add_numpy_to_numpy_type_0005(int32_t np_s_l, double complex np_s_r);
+int64_t add_numpy_to_numpy_type_0006(int64_t np_s_l, int32_t np_s_r);
+int64_t add_numpy_to_numpy_type_0007(int64_t np_s_l, int64_t np_s_r);
+double add_numpy_to_numpy_type_0008(int64_t np_s_l, float np_s_r);
+double add_numpy_to_numpy_type_0009(int64_t np_s_l, double np_s_r);
+double complex add_numpy_to_numpy_type_0010(int64_t np_s_l, float complex np_s_r);
+double complex add_numpy_to_numpy_type_0011(int64_t np_s_l, double complex np_s_r);
+double add_numpy_to_numpy_type_0012(float np_s_l, int32_t np_s_r);
+double add_numpy_to_numpy_type_0013(float np_s_l, int64_t np_s_r);
+float add_numpy_to_numpy_type_0014(float np_s_l, float np_s_r);
+double add_numpy_to_numpy_type_0015(float np_s_l, double np_s_r);
+float complex add_numpy_to_numpy_type_0016(float np_s_l, float complex np_s_r);
+double complex add_numpy_to_numpy_type_0017(float np_s_l, double complex np_s_r);
+double add_numpy_to_numpy_type_0018(double np_s_l, int32_t np_s_r);
+double add_numpy_to_numpy_type_0019(double np_s_l, int64_t np_s_r);
+double add_numpy_to_numpy_type_0020(double np_s_l, float np_s_r);
+double add_numpy_to_numpy_type_0021(double np_s_l, double np_s_r);
+double complex add_numpy_to_numpy_type_0022(double np_s_l, float complex np_s_r);
+double complex add_numpy_to_numpy_type_0023(double np_s_l, double complex np_s_r);
+double complex add_numpy_to_numpy_type_0024(float complex np_s_l, int32_t np_s_r);
+double complex add_numpy_to_numpy_type_0025(float complex np_s_l, int64_t np_s_r);
+float complex add_numpy_to_numpy_type_0026(float complex np_s_l, float np_s_r);
+double complex add_numpy_to_numpy_type_0027(float complex np_s_l, double np_s_r);
+float complex add_numpy_to_numpy_type_0028(float complex np_s_l, float complex np_s_r);
+double complex add_numpy_to_numpy_type_0029(float complex np_s_l, double complex np_s_r);
+double complex add_numpy_to_numpy_type_0030(double complex np_s_l, int32_t np_s_r);
+double complex add_numpy_to_numpy_type_0031(double complex np_s_l, int64_t np_s_r);
+double complex add_numpy_to_numpy_type_0032(double complex np_s_l, float np_s_r);
+double complex add_numpy_to_numpy_type_0033(double complex np_s_l, double np_s_r);
+double complex add_numpy_to_numpy_type_0034(double complex np_s_l, float complex np_s_r);
+double complex add_numpy_to_numpy_type_0035(double complex np_s_l, double complex np_s_r);
+#endif // mod_e9gib8ek0c2z_H
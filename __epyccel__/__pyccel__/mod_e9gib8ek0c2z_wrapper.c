@@ -0,0 +1,841 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_E9GIB8EK0C2Z_WRAPPER
+
+#include "mod_e9gib8ek0c2z_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0000_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int32_t np_s_l;
+    int32_t np_s_r;
+    int32_t rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt32_to_Int32(np_s_l_obj);
+    np_s_r = PyInt32_to_Int32(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0000(np_s_l, np_s_r);
+    rs_obj = Int32_to_NumpyLong(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0001_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int32_t np_s_l;
+    int64_t np_s_r;
+    int64_t rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt32_to_Int32(np_s_l_obj);
+    np_s_r = PyInt64_to_Int64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0001(np_s_l, np_s_r);
+    rs_obj = Int64_to_NumpyLong(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0002_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int32_t np_s_l;
+    float np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt32_to_Int32(np_s_l_obj);
+    np_s_r = PyFloat_to_Float(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0002(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0003_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int32_t np_s_l;
+    double np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt32_to_Int32(np_s_l_obj);
+    np_s_r = PyDouble_to_Double(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0003(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0004_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int32_t np_s_l;
+    float complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt32_to_Int32(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0004(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0005_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int32_t np_s_l;
+    double complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt32_to_Int32(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex128(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0005(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0006_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int64_t np_s_l;
+    int32_t np_s_r;
+    int64_t rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt64_to_Int64(np_s_l_obj);
+    np_s_r = PyInt32_to_Int32(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0006(np_s_l, np_s_r);
+    rs_obj = Int64_to_NumpyLong(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0007_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int64_t np_s_l;
+    int64_t np_s_r;
+    int64_t rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt64_to_Int64(np_s_l_obj);
+    np_s_r = PyInt64_to_Int64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0007(np_s_l, np_s_r);
+    rs_obj = Int64_to_NumpyLong(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0008_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int64_t np_s_l;
+    float np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt64_to_Int64(np_s_l_obj);
+    np_s_r = PyFloat_to_Float(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0008(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0009_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int64_t np_s_l;
+    double np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt64_to_Int64(np_s_l_obj);
+    np_s_r = PyDouble_to_Double(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0009(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0010_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int64_t np_s_l;
+    float complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt64_to_Int64(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0010(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0011_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int64_t np_s_l;
+    double complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyInt64_to_Int64(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex128(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0011(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0012_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float np_s_l;
+    int32_t np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyFloat_to_Float(np_s_l_obj);
+    np_s_r = PyInt32_to_Int32(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0012(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0013_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float np_s_l;
+    int64_t np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyFloat_to_Float(np_s_l_obj);
+    np_s_r = PyInt64_to_Int64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0013(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0014_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float np_s_l;
+    float np_s_r;
+    float rs;
+    PyObject* rs_obj;
+    np_s_l = PyFloat_to_Float(np_s_l_obj);
+    np_s_r = PyFloat_to_Float(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0014(np_s_l, np_s_r);
+    rs_obj = Float_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0015_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float np_s_l;
+    double np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyFloat_to_Float(np_s_l_obj);
+    np_s_r = PyDouble_to_Double(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0015(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0016_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float np_s_l;
+    float complex np_s_r;
+    float complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyFloat_to_Float(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0016(np_s_l, np_s_r);
+    rs_obj = Complex64_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0017_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float np_s_l;
+    double complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyFloat_to_Float(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex128(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0017(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0018_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double np_s_l;
+    int32_t np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyDouble_to_Double(np_s_l_obj);
+    np_s_r = PyInt32_to_Int32(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0018(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0019_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double np_s_l;
+    int64_t np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyDouble_to_Double(np_s_l_obj);
+    np_s_r = PyInt64_to_Int64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0019(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0020_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double np_s_l;
+    float np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyDouble_to_Double(np_s_l_obj);
+    np_s_r = PyFloat_to_Float(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0020(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0021_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double np_s_l;
+    double np_s_r;
+    double rs;
+    PyObject* rs_obj;
+    np_s_l = PyDouble_to_Double(np_s_l_obj);
+    np_s_r = PyDouble_to_Double(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0021(np_s_l, np_s_r);
+    rs_obj = Double_to_NumpyDouble(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0022_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double np_s_l;
+    float complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyDouble_to_Double(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0022(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0023_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double np_s_l;
+    double complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyDouble_to_Double(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex128(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0023(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0024_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float complex np_s_l;
+    int32_t np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex64(np_s_l_obj);
+    np_s_r = PyInt32_to_Int32(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0024(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0025_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float complex np_s_l;
+    int64_t np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex64(np_s_l_obj);
+    np_s_r = PyInt64_to_Int64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0025(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0026_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float complex np_s_l;
+    float np_s_r;
+    float complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex64(np_s_l_obj);
+    np_s_r = PyFloat_to_Float(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0026(np_s_l, np_s_r);
+    rs_obj = Complex64_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0027_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float complex np_s_l;
+    double np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex64(np_s_l_obj);
+    np_s_r = PyDouble_to_Double(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0027(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0028_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float complex np_s_l;
+    float complex np_s_r;
+    float complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex64(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0028(np_s_l, np_s_r);
+    rs_obj = Complex64_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0029_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    float complex np_s_l;
+    double complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex64(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex128(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0029(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0030_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double complex np_s_l;
+    int32_t np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex128(np_s_l_obj);
+    np_s_r = PyInt32_to_Int32(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0030(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0031_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double complex np_s_l;
+    int64_t np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex128(np_s_l_obj);
+    np_s_r = PyInt64_to_Int64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0031(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0032_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double complex np_s_l;
+    float np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex128(np_s_l_obj);
+    np_s_r = PyFloat_to_Float(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0032(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0033_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double complex np_s_l;
+    double np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex128(np_s_l_obj);
+    np_s_r = PyDouble_to_Double(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0033(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0034_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double complex np_s_l;
+    float complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex128(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex64(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0034(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* add_numpy_to_numpy_type_0035_wrapper(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    double complex np_s_l;
+    double complex np_s_r;
+    double complex rs;
+    PyObject* rs_obj;
+    np_s_l = PyComplex_to_Complex128(np_s_l_obj);
+    np_s_r = PyComplex_to_Complex128(np_s_r_obj);
+    rs = add_numpy_to_numpy_type_0035(np_s_l, np_s_r);
+    rs_obj = Complex128_to_NumpyComplex(&rs);
+    return rs_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t add_numpy_to_numpy_type_type_check(PyObject* np_s_l_obj, PyObject* np_s_r_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_Int32(np_s_l_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int64(np_s_l_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Float(np_s_l_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Double(np_s_l_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Complex64(np_s_l_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_Complex128(np_s_l_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument np_s_l");
+        return -INT64_C(1);
+    }
+    if (PyIs_Int32(np_s_r_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int64(np_s_r_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Float(np_s_r_obj))
+    {
+        type_indicator += INT64_C(12);
+    }
+    else if (PyIs_Double(np_s_r_obj))
+    {
+        type_indicator += INT64_C(18);
+    }
+    else if (PyIs_Complex64(np_s_r_obj))
+    {
+        type_indicator += INT64_C(24);
+    }
+    else if (PyIs_Complex128(np_s_r_obj))
+    {
+        type_indicator += INT64_C(30);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument np_s_r");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* add_numpy_to_numpy_type_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* np_s_l_obj;
+    PyObject* np_s_r_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "np_s_l",
+        "np_s_r",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &np_s_l_obj, &np_s_r_obj))
+    {
+        return NULL;
+    }
+    type_indicator = add_numpy_to_numpy_type_type_check(np_s_l_obj, np_s_r_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return add_numpy_to_numpy_type_0000_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(6))
+    {
+        return add_numpy_to_numpy_type_0001_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(12))
+    {
+        return add_numpy_to_numpy_type_0002_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(18))
+    {
+        return add_numpy_to_numpy_type_0003_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(24))
+    {
+        return add_numpy_to_numpy_type_0004_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(30))
+    {
+        return add_numpy_to_numpy_type_0005_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return add_numpy_to_numpy_type_0006_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(7))
+    {
+        return add_numpy_to_numpy_type_0007_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(13))
+    {
+        return add_numpy_to_numpy_type_0008_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(19))
+    {
+        return add_numpy_to_numpy_type_0009_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(25))
+    {
+        return add_numpy_to_numpy_type_0010_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(31))
+    {
+        return add_numpy_to_numpy_type_0011_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return add_numpy_to_numpy_type_0012_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(8))
+    {
+        return add_numpy_to_numpy_type_0013_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(14))
+    {
+        return add_numpy_to_numpy_type_0014_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(20))
+    {
+        return add_numpy_to_numpy_type_0015_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(26))
+    {
+        return add_numpy_to_numpy_type_0016_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(32))
+    {
+        return add_numpy_to_numpy_type_0017_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return add_numpy_to_numpy_type_0018_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(9))
+    {
+        return add_numpy_to_numpy_type_0019_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(15))
+    {
+        return add_numpy_to_numpy_type_0020_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(21))
+    {
+        return add_numpy_to_numpy_type_0021_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(27))
+    {
+        return add_numpy_to_numpy_type_0022_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(33))
+    {
+        return add_numpy_to_numpy_type_0023_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return add_numpy_to_numpy_type_0024_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(10))
+    {
+        return add_numpy_to_numpy_type_0025_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(16))
+    {
+        return add_numpy_to_numpy_type_0026_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(22))
+    {
+        return add_numpy_to_numpy_type_0027_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(28))
+    {
+        return add_numpy_to_numpy_type_0028_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(34))
+    {
+        return add_numpy_to_numpy_type_0029_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return add_numpy_to_numpy_type_0030_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(11))
+    {
+        return add_numpy_to_numpy_type_0031_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(17))
+    {
+        return add_numpy_to_numpy_type_0032_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(23))
+    {
+        return add_numpy_to_numpy_type_0033_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(29))
+    {
+        return add_numpy_to_numpy_type_0034_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else if (type_indicator == INT64_C(35))
+    {
+        return add_numpy_to_numpy_type_0035_wrapper(np_s_l_obj, np_s_r_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_e9gib8ek0c2z_methods[] = {
+    {
+        "add_numpy_to_numpy_type",
+        (PyCFunction)add_numpy_to_numpy_type_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_e9gib8ek0c2z_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_e9gib8ek0c2z",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_e9gib8ek0c2z_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_e9gib8ek0c2z(void)
+{
+    PyObject* mod;
+    static void* Pymod_e9gib8ek0c2z_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_e9gib8ek0c2z_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_e9gib8ek0c2z_API, "mod_e9gib8ek0c2z._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
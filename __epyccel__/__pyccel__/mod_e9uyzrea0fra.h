@@ -0,0 +1,11 @@
+#ifndef MOD_E9UYZREA0FRA_H
+#define MOD_E9UYZREA0FRA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f10(t_ndarray x);
+#endif // mod_e9uyzrea0fra_H
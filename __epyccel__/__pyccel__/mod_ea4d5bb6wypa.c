@@ -0,0 +1,12 @@
+#include "mod_ea4d5bb6wypa.h"
+
+
+/*........................................*/
+double cos_phrase_i_r(int64_t x, double y)
+{
+    double a;
+    a = cos((double)(x)) + cos(y);
+    return a;
+}
+/*........................................*/
+
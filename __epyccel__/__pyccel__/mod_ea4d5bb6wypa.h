@@ -0,0 +1,11 @@
+#ifndef MOD_EA4D5BB6WYPA_H
+#define MOD_EA4D5BB6WYPA_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double cos_phrase_i_r(int64_t x, double y);
+#endif // mod_ea4d5bb6wypa_H
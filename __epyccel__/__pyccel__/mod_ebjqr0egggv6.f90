@@ -0,0 +1,24 @@
+module mod_ebjqr0egggv6
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine axpby_step1(x, t, alpha) 
+
+    implicit none
+
+    real(f64), intent(in) :: x(0_i64:)
+    real(f64), intent(inout) :: t(0_i64:)
+    real(f64), value :: alpha
+
+    t(:) = alpha * x
+
+  end subroutine axpby_step1
+  !........................................
+
+end module mod_ebjqr0egggv6
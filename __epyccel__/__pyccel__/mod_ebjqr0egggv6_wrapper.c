@@ -0,0 +1,117 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_EBJQR0EGGGV6_WRAPPER
+
+#include "mod_ebjqr0egggv6_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_axpby_step1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* t_obj;
+    PyObject* alpha_obj;
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    int64_t x_strides[1];
+    void* t_data = NULL;
+    int64_t t_shape[1];
+    int64_t t_strides[1];
+    double alpha;
+    static const char* const kwlist[] = {
+        "x",
+        "t",
+        "alpha",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &x_obj, &t_obj, &alpha_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("t", t_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        t_data = PyArray_DATA((PyArrayObject*)(t_obj));
+        get_strides_and_shape_from_numpy_array(t_obj, t_shape, t_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(alpha_obj))
+    {
+        alpha = PyDouble_to_Double(alpha_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument alpha");
+        return NULL;
+    }
+    bind_c_axpby_step1(x_data, x_shape[INT64_C(0)], x_strides[INT64_C(0)], t_data, t_shape[INT64_C(0)], t_strides[INT64_C(0)], alpha);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ebjqr0egggv6_methods[] = {
+    {
+        "axpby_step1",
+        (PyCFunction)bind_c_axpby_step1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ebjqr0egggv6_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ebjqr0egggv6",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ebjqr0egggv6_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ebjqr0egggv6(void)
+{
+    PyObject* mod;
+    static void* Pymod_ebjqr0egggv6_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ebjqr0egggv6_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ebjqr0egggv6_API, "mod_ebjqr0egggv6._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,42 @@
+#ifndef MOD_EBJQR0EGGGV6_WRAPPER_H
+#define MOD_EBJQR0EGGGV6_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_EBJQR0EGGGV6_WRAPPER
+
+void bind_c_axpby_step1(void*, int64_t, int64_t, void*, int64_t, int64_t, double);
+
+#else
+
+static void** Pymod_ebjqr0egggv6_API;
+
+
+/*........................................*/
+static int mod_ebjqr0egggv6_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ebjqr0egggv6_API = (void**)PyCapsule_Import("mod_ebjqr0egggv6._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ebjqr0egggv6_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_EBJQR0EGGGV6_WRAPPER_H
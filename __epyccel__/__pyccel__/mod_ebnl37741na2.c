@@ -0,0 +1,10 @@
+#include "mod_ebnl37741na2.h"
+
+
+/*........................................*/
+double lgamma_call(double x)
+{
+    return lgamma(x);
+}
+/*........................................*/
+
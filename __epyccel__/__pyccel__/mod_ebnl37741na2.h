@@ -0,0 +1,10 @@
+#ifndef MOD_EBNL37741NA2_H
+#define MOD_EBNL37741NA2_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double lgamma_call(double x);
+#endif // mod_ebnl37741na2_H
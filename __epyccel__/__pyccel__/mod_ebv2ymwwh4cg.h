@@ -0,0 +1,12 @@
+#ifndef MOD_EBV2YMWWH4CG_H
+#define MOD_EBV2YMWWH4CG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t combined_for_simd(void);
+#endif // mod_ebv2ymwwh4cg_H
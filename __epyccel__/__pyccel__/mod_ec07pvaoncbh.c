@@ -0,0 +1,20 @@
+#include "mod_ec07pvaoncbh.h"
+
+
+/*........................................*/
+int64_t tuple_inhomogeneous_3(int64_t* Out_0001, double* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    int64_t a_0;
+    double a_1;
+    int64_t a_2;
+    a_0 = INT64_C(0);
+    a_1 = 1.0;
+    a_2 = INT64_C(3);
+    (*Out_0001) = a_0;
+    (*Out_0002) = a_1;
+    (*Out_0003) = a_2;
+    (*Out_0004) = INT64_C(3);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_EC07PVAONCBH_H
+#define MOD_EC07PVAONCBH_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_inhomogeneous_3(int64_t* Out_0001, double* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_ec07pvaoncbh_H
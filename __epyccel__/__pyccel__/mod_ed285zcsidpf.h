@@ -0,0 +1,11 @@
+#ifndef MOD_ED285ZCSIDPF_H
+#define MOD_ED285ZCSIDPF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_sub(t_ndarray x, double a);
+#endif // mod_ed285zcsidpf_H
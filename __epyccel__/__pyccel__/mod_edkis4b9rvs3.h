@@ -0,0 +1,11 @@
+#ifndef MOD_EDKIS4B9RVS3_H
+#define MOD_EDKIS4B9RVS3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_sum_stack_array(void);
+#endif // mod_edkis4b9rvs3_H
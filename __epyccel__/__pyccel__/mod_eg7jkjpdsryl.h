@@ -0,0 +1,11 @@
+#ifndef MOD_EG7JKJPDSRYL_H
+#define MOD_EG7JKJPDSRYL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t var_negative_index(int64_t n, int64_t idx);
+#endif // mod_eg7jkjpdsryl_H
@@ -0,0 +1,12 @@
+#include "mod_eg7pda3jyh46.h"
+
+
+/*........................................*/
+bool test_omp_get_cancellation(void)
+{
+    bool cancel_var;
+    cancel_var = omp_get_cancellation();
+    return cancel_var;
+}
+/*........................................*/
+
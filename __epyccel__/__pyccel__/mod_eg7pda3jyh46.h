@@ -0,0 +1,11 @@
+#ifndef MOD_EG7PDA3JYH46_H
+#define MOD_EG7PDA3JYH46_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_get_cancellation(void);
+#endif // mod_eg7pda3jyh46_H
@@ -0,0 +1,10 @@
+#include "mod_eheg16mvbure.h"
+
+
+/*........................................*/
+double expm1_type(double x)
+{
+    return expm1(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_EHEG16MVBURE_H
+#define MOD_EHEG16MVBURE_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double expm1_type(double x);
+#endif // mod_eheg16mvbure_H
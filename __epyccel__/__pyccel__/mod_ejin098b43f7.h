@@ -0,0 +1,12 @@
+#ifndef MOD_EJIN098B43F7_H
+#define MOD_EJIN098B43F7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_val_int_int(int64_t val);
+#endif // mod_ejin098b43f7_H
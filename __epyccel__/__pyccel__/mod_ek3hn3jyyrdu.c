@@ -0,0 +1,314 @@
+#include "mod_ek3hn3jyyrdu.h"
+
+
+/*........................................*/
+int64_t return_multi_array_scalar_op_0000(int8_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    array_fill((int8_t)1, x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    array_fill((int8_t)1, y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    {
+        int8_t* restrict x_data = x.nd_int8;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int8[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    {
+        int8_t* restrict y_data = y.nd_int8;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int8[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0001(int16_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    array_fill((int16_t)1, x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    array_fill((int16_t)1, y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    {
+        int16_t* restrict x_data = x.nd_int16;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int16[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    {
+        int16_t* restrict y_data = y.nd_int16;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int16[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0002(int32_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    array_fill((int32_t)1, x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    array_fill((int32_t)1, y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    {
+        int32_t* restrict x_data = x.nd_int32;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int32[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    {
+        int32_t* restrict y_data = y.nd_int32;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int32[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0003(int64_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(1), x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(1), y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict x_data = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int64[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data = y.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int64[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0004(int64_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(1), x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(1), y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict x_data = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int64[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data = y.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int64[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0005(float a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    array_fill((float)1.0f, x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    array_fill((float)1.0f, y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    {
+        float* restrict x_data = x.nd_float;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_float[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    {
+        float* restrict y_data = y.nd_float;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_float[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0006(double a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)1.0, y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_double[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_double[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0007(double a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)1.0, y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_double[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_double[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0008(float complex a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    array_fill((float complex)(1.0f + 0.0f * _Complex_I), x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    array_fill((float complex)(1.0f + 0.0f * _Complex_I), y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict x_data = x.nd_cfloat;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_cfloat[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict y_data = y.nd_cfloat;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_cfloat[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0009(double complex a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    array_fill((double complex)(1.0 + 0.0 * _Complex_I), x);
+    y = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    array_fill((double complex)(1.0 + 0.0 * _Complex_I), y);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict x_data = x.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_cdouble[i] = x_data[i] * a;
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict y_data = y.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0002).nd_cdouble[i] = y_data[i] * a;
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+
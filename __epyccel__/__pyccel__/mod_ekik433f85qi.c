@@ -0,0 +1,12 @@
+#include "mod_ekik433f85qi.h"
+
+
+/*........................................*/
+double lgamma_phrase(double x, double y)
+{
+    double a;
+    a = lgamma(x) + lgamma(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_EKIK433F85QI_H
+#define MOD_EKIK433F85QI_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double lgamma_phrase(double x, double y);
+#endif // mod_ekik433f85qi_H
@@ -0,0 +1,20 @@
+#include "mod_elrsllf2dgnn.h"
+
+
+/*........................................*/
+int64_t scalare_multi_return_stmts(int64_t a)
+{
+    a = INT64_C(7);
+    if ((a != 0))
+    {
+        return INT64_C(1);
+    }
+    else
+    {
+        return INT64_C(2);
+    }
+    a = INT64_C(4);
+    return a;
+}
+/*........................................*/
+
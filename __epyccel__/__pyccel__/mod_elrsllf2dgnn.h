@@ -0,0 +1,10 @@
+#ifndef MOD_ELRSLLF2DGNN_H
+#define MOD_ELRSLLF2DGNN_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t scalare_multi_return_stmts(int64_t a);
+#endif // mod_elrsllf2dgnn_H
@@ -0,0 +1,12 @@
+#ifndef MOD_EMM79N7KXCGF_H
+#define MOD_EMM79N7KXCGF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_ones_like_2_val(void);
+#endif // mod_emm79n7kxcgf_H
@@ -0,0 +1,13 @@
+#ifndef MOD_EQPP1LRBOXJD_H
+#define MOD_EQPP1LRBOXJD_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_complex_2d_scalar_add_0000(t_ndarray x, float complex a, int64_t d1, int64_t d2);
+void array_complex_2d_scalar_add_0001(t_ndarray x, double complex a, int64_t d1, int64_t d2);
+#endif // mod_eqpp1lrboxjd_H
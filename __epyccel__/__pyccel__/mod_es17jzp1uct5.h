@@ -0,0 +1,11 @@
+#ifndef MOD_ES17JZP1UCT5_H
+#define MOD_ES17JZP1UCT5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float create_zeros_val_float32(void);
+#endif // mod_es17jzp1uct5_H
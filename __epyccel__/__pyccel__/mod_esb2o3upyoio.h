@@ -0,0 +1,11 @@
+#ifndef MOD_ESB2O3UPYOIO_H
+#define MOD_ESB2O3UPYOIO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_1d_negative_index_2(int64_t* Out_0001, double* Out_0002);
+#endif // mod_esb2o3upyoio_H
@@ -0,0 +1,12 @@
+#include "mod_eszpwvdn5rqw.h"
+
+
+/*........................................*/
+double log10_phrase(double x, double y)
+{
+    double a;
+    a = log10(x) + log10(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_ESZPWVDN5RQW_H
+#define MOD_ESZPWVDN5RQW_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log10_phrase(double x, double y);
+#endif // mod_eszpwvdn5rqw_H
@@ -0,0 +1,11 @@
+#ifndef MOD_ETFOYHCHSP20_H
+#define MOD_ETFOYHCHSP20_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_max_threads(void);
+#endif // mod_etfoyhchsp20_H
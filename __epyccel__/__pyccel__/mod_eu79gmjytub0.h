@@ -0,0 +1,11 @@
+#ifndef MOD_EU79GMJYTUB0_H
+#define MOD_EU79GMJYTUB0_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_eu79gmjytub0_H
@@ -0,0 +1,11 @@
+#ifndef MOD_EUOW9F8AC84M_H
+#define MOD_EUOW9F8AC84M_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_operator(t_ndarray A, t_ndarray B, t_ndarray out);
+#endif // mod_euow9f8ac84m_H
@@ -0,0 +1,12 @@
+#include "mod_ev4fphobnhf7.h"
+
+
+/*........................................*/
+double fabs_phrase(double x, double y)
+{
+    double a;
+    a = fabs(x) * fabs(y);
+    return a;
+}
+/*........................................*/
+
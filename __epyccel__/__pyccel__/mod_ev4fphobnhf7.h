@@ -0,0 +1,10 @@
+#ifndef MOD_EV4FPHOBNHF7_H
+#define MOD_EV4FPHOBNHF7_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double fabs_phrase(double x, double y);
+#endif // mod_ev4fphobnhf7_H
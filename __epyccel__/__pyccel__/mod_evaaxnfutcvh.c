@@ -0,0 +1,24 @@
+#include "mod_evaaxnfutcvh.h"
+
+
+/*........................................*/
+double complex optional_var_4_0000(double complex x, int64_t* y)
+{
+    if (y == NULL)
+    {
+        return x;
+    }
+    return x + (*y);
+}
+/*........................................*/
+/*........................................*/
+double optional_var_4_0001(double x, int64_t* y)
+{
+    if (y == NULL)
+    {
+        return x;
+    }
+    return x + (*y);
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_EVAAXNFUTCVH_H
+#define MOD_EVAAXNFUTCVH_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex optional_var_4_0000(double complex x, int64_t* y);
+double optional_var_4_0001(double x, int64_t* y);
+#endif // mod_evaaxnfutcvh_H
@@ -0,0 +1,30 @@
+#include "mod_ewrm5iq9kyst.h"
+
+
+/*........................................*/
+double array_float_1d_sum_stack_array(void)
+{
+    double array_dummy[INT64_C(10)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(10)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t i;
+    double s;
+    array_fill((double)0.0, a);
+    s = 0.0;
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < INT64_C(10); i += INT64_C(1))
+        {
+            s += a_data[i];
+        }
+    }
+    return s;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_EWRM5IQ9KYST_H
+#define MOD_EWRM5IQ9KYST_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_sum_stack_array(void);
+#endif // mod_ewrm5iq9kyst_H
@@ -0,0 +1,10 @@
+#include "mod_f0flmqptht5a.h"
+
+
+/*........................................*/
+double hypot_call(double x, double y)
+{
+    return hypot(x, y);
+}
+/*........................................*/
+
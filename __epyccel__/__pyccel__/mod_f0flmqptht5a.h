@@ -0,0 +1,10 @@
+#ifndef MOD_F0FLMQPTHT5A_H
+#define MOD_F0FLMQPTHT5A_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double hypot_call(double x, double y);
+#endif // mod_f0flmqptht5a_H
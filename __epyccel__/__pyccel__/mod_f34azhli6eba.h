@@ -0,0 +1,11 @@
+#ifndef MOD_F34AZHLI6EBA_H
+#define MOD_F34AZHLI6EBA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_scalar_add(t_ndarray x, int64_t a);
+#endif // mod_f34azhli6eba_H
@@ -0,0 +1,12 @@
+#ifndef MOD_F3EMIGFO0XVR_H
+#define MOD_F3EMIGFO0XVR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_array_list_val(void);
+#endif // mod_f3emigfo0xvr_H
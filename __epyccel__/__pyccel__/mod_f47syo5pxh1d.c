@@ -0,0 +1,14 @@
+#include "mod_f47syo5pxh1d.h"
+
+
+/*........................................*/
+void sqrt_step1(t_ndarray a, t_ndarray b, t_ndarray t)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < t.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(t, nd_double, i) = GET_ELEMENT(a, nd_double, i) * GET_ELEMENT(b, nd_double, i);
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_F47SYO5PXH1D_H
+#define MOD_F47SYO5PXH1D_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void sqrt_step1(t_ndarray a, t_ndarray b, t_ndarray t);
+#endif // mod_f47syo5pxh1d_H
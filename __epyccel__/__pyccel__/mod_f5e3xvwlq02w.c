@@ -0,0 +1,25 @@
+#include "mod_f5e3xvwlq02w.h"
+
+
+/*........................................*/
+int64_t tuple_homogeneous(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    b = array_create(1, (int64_t[]){INT64_C(4)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(10), INT64_C(20), INT64_C(30), INT64_C(40)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0000, 4 * b.type_size);
+    a = array_create(1, (int64_t[]){INT64_C(4)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {GET_ELEMENT(b, nd_int64, INT64_C(0)), GET_ELEMENT(b, nd_int64, INT64_C(1)), GET_ELEMENT(b, nd_int64, INT64_C(2)), GET_ELEMENT(b, nd_int64, INT64_C(3))};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0001, 4 * a.type_size);
+    (*Out_0001) = GET_ELEMENT(a, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(a, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(a, nd_int64, INT64_C(2));
+    (*Out_0004) = GET_ELEMENT(a, nd_int64, INT64_C(3));
+    (*Out_0005) = INT64_C(4);
+    free_array(&a);
+    free_array(&b);
+    return 0;
+}
+/*........................................*/
+
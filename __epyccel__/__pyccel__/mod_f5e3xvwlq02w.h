@@ -0,0 +1,12 @@
+#ifndef MOD_F5E3XVWLQ02W_H
+#define MOD_F5E3XVWLQ02W_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_homogeneous(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_f5e3xvwlq02w_H
@@ -0,0 +1,10 @@
+#ifndef MOD_F6VOLH28NOH4_H
+#define MOD_F6VOLH28NOH4_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int16_t f16(int16_t a);
+#endif // mod_f6volh28noh4_H
@@ -0,0 +1,11 @@
+#ifndef MOD_F8SI8FRGRONJ_H
+#define MOD_F8SI8FRGRONJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum(t_ndarray x);
+#endif // mod_f8si8frgronj_H
@@ -0,0 +1,10 @@
+#include "mod_f8wtqliiw36j.h"
+
+
+/*........................................*/
+double arcsin_call_i(int64_t x)
+{
+    return asin((double)(x));
+}
+/*........................................*/
+
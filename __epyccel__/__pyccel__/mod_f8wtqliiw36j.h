@@ -0,0 +1,11 @@
+#ifndef MOD_F8WTQLIIW36J_H
+#define MOD_F8WTQLIIW36J_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arcsin_call_i(int64_t x);
+#endif // mod_f8wtqliiw36j_H
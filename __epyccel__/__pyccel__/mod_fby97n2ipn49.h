@@ -0,0 +1,11 @@
+#ifndef MOD_FBY97N2IPN49_H
+#define MOD_FBY97N2IPN49_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_mul(t_ndarray x, int64_t a);
+#endif // mod_fby97n2ipn49_H
@@ -0,0 +1,11 @@
+#ifndef MOD_FC0Q8I4WQC7S_H
+#define MOD_FC0Q8I4WQC7S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_3(t_ndarray a, t_ndarray b);
+#endif // mod_fc0q8i4wqc7s_H
@@ -0,0 +1,11 @@
+#ifndef MOD_FCDZSQ3OOYP8_H
+#define MOD_FCDZSQ3OOYP8_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_fcdzsq3ooyp8_H
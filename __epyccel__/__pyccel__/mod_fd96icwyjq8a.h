@@ -0,0 +1,10 @@
+#ifndef MOD_FD96ICWYJQ8A_H
+#define MOD_FD96ICWYJQ8A_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_taskloop(int64_t n);
+#endif // mod_fd96icwyjq8a_H
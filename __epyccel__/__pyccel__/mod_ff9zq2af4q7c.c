@@ -0,0 +1,24 @@
+#include "mod_ff9zq2af4q7c.h"
+
+
+/*........................................*/
+double optional_var_3_0000(int64_t x, double* y)
+{
+    if (y == NULL)
+    {
+        return x / 2.0;
+    }
+    return x / (*y);
+}
+/*........................................*/
+/*........................................*/
+double optional_var_3_0001(double x, double* y)
+{
+    if (y == NULL)
+    {
+        return x / 2.0;
+    }
+    return x / (*y);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_FF9ZQ2AF4Q7C_H
+#define MOD_FF9ZQ2AF4Q7C_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double optional_var_3_0000(int64_t x, double* y);
+double optional_var_3_0001(double x, double* y);
+#endif // mod_ff9zq2af4q7c_H
@@ -0,0 +1,12 @@
+#ifndef MOD_FFZ3A66L8ZZ5_H
+#define MOD_FFZ3A66L8ZZ5_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_2(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_ffz3a66l8zz5_H
@@ -0,0 +1,21 @@
+#include "mod_fg9h9x8o5o00.h"
+
+
+/*........................................*/
+void A__init__(struct A* self)
+{
+    self->is_freed = 0;
+    // pass
+}
+/*........................................*/
+/*........................................*/
+void A__del__(struct A* self)
+{
+    if (!self->is_freed)
+    {
+        // pass
+        self->is_freed = 1;
+    }
+}
+/*........................................*/
+
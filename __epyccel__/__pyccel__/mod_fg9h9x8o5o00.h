@@ -0,0 +1,15 @@
+#ifndef MOD_FG9H9X8O5O00_H
+#define MOD_FG9H9X8O5O00_H
+
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+struct A {
+    bool is_freed;
+};
+
+void A__init__(struct A* self);
+void A__del__(struct A* self);
+
+#endif // mod_fg9h9x8o5o00_H
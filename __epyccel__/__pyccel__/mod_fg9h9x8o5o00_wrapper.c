@@ -0,0 +1,144 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_FG9H9X8O5O00_WRAPPER
+
+#include "mod_fg9h9x8o5o00_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+static PyMethodDef A_methods[] = {
+    { NULL, NULL, 0, NULL}
+};
+
+static PyNumberMethods A_number_methods = {
+};
+
+static PySequenceMethods A_sequence_methods = {
+};
+
+static PyMappingMethods A_mapping_methods = {
+};
+
+static PyGetSetDef A_properties[] = {
+    { NULL }
+};
+
+static PyTypeObject PyAType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "mod_fg9h9x8o5o00.A",
+    .tp_as_number = &A_number_methods,
+    .tp_as_sequence = &A_sequence_methods,
+    .tp_as_mapping = &A_mapping_methods,
+    .tp_doc = PyDoc_STR(""),
+    .tp_basicsize = sizeof(struct PyAObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_new = A__new___wrapper,
+    .tp_init = (initproc) A__init___wrapper,
+    .tp_dealloc = (destructor) A__del___wrapper,
+    .tp_methods = A_methods,
+    .tp_getset = A_properties,
+};
+
+/*........................................*/
+static int A__init___wrapper(struct PyAObject* self_0001, PyObject* args, PyObject* kwargs)
+{
+    struct A* self;
+    static char *kwlist[] = {
+        NULL
+    };
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "", kwlist))
+    {
+        return -1;
+    }
+    self = (struct A*)(self_0001->instance);
+    A__init__(self);
+    return 0;
+}
+/*........................................*/
+
+/*........................................*/
+static void A__del___wrapper(struct PyAObject* self_0001)
+{
+    if (!self_0001->is_alias)
+    {
+        A__del__(self_0001->instance);
+        free(self_0001->instance);
+    }
+    Py_DECREF(self_0001->referenced_objects);
+    PyAType.tp_free(self_0001);
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* A__new___wrapper(PyTypeObject* self, PyObject* args, PyObject* kwargs)
+{
+    struct PyAObject* result_obj;
+    result_obj = (struct PyAObject*)PyAType.tp_alloc(&PyAType, 0);
+    result_obj->referenced_objects = PyList_New(INT64_C(0));
+    result_obj->is_alias = 0;
+    result_obj->instance = malloc(sizeof(struct A));
+    return (PyObject*)(result_obj);
+}
+/*........................................*/
+
+/*........................................*/
+
+
+/*........................................*/
+
+static PyMethodDef mod_fg9h9x8o5o00_methods[] = {
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_fg9h9x8o5o00_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_fg9h9x8o5o00",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_fg9h9x8o5o00_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_fg9h9x8o5o00(void)
+{
+    PyObject* mod;
+    static void* Pymod_fg9h9x8o5o00_API[1];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_fg9h9x8o5o00_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    Pymod_fg9h9x8o5o00_API[INT64_C(0)] = (void*)(&PyAType);
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_fg9h9x8o5o00_API, "mod_fg9h9x8o5o00._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    if (PyType_Ready(&PyAType) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        Py_DECREF(c_api_object_0001);
+        return NULL;
+    }
+    if (PyModule_AddObject(mod, "A", (PyObject*) &PyAType) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        Py_DECREF(c_api_object_0001);
+        return NULL;
+    }
+    Py_INCREF(&PyAType);
+    return mod;
+}
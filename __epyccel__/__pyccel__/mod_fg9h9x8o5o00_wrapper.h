@@ -0,0 +1,51 @@
+#ifndef MOD_FG9H9X8O5O00_WRAPPER_H
+#define MOD_FG9H9X8O5O00_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_fg9h9x8o5o00.h"
+
+struct PyAObject {
+    PyObject_HEAD
+    void* instance;
+    PyObject* referenced_objects;
+    bool is_alias;
+};
+
+#ifdef MOD_FG9H9X8O5O00_WRAPPER
+
+
+static int A__init___wrapper(struct PyAObject* self_0001, PyObject* args, PyObject* kwargs);
+static void A__del___wrapper(struct PyAObject* self_0001);
+static PyObject* A__new___wrapper(PyTypeObject* self, PyObject* args, PyObject* kwargs);
+
+#else
+
+static void** Pymod_fg9h9x8o5o00_API;
+
+#define PyAType (*(PyTypeObject*)Pymod_fg9h9x8o5o00_API[0])
+
+/*........................................*/
+static int mod_fg9h9x8o5o00_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_fg9h9x8o5o00_API = (void**)PyCapsule_Import("mod_fg9h9x8o5o00._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_fg9h9x8o5o00_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_FG9H9X8O5O00_WRAPPER_H
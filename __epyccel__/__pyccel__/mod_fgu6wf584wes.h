@@ -0,0 +1,11 @@
+#ifndef MOD_FGU6WF584WES_H
+#define MOD_FGU6WF584WES_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_F_array_initialization(t_ndarray x, t_ndarray y, t_ndarray z, t_ndarray a);
+#endif // mod_fgu6wf584wes_H
@@ -0,0 +1,12 @@
+#ifndef MOD_FH00650MRIY4_H
+#define MOD_FH00650MRIY4_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_in_bool_out_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri);
+#endif // mod_fh00650mriy4_H
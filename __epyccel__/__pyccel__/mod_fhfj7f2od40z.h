@@ -0,0 +1,13 @@
+#ifndef MOD_FHFJ7F2OD40Z_H
+#define MOD_FHFJ7F2OD40Z_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray numpy_isfinite_array_test(t_ndarray x);
+#endif // mod_fhfj7f2od40z_H
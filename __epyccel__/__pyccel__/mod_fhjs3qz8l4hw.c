@@ -0,0 +1,24 @@
+#include "mod_fhjs3qz8l4hw.h"
+
+
+/*........................................*/
+int64_t mix_types_3_0000(int64_t x, int64_t y)
+{
+    if (y != x)
+    {
+        return y - x;
+    }
+    return -x;
+}
+/*........................................*/
+/*........................................*/
+int32_t mix_types_3_0001(int32_t x, int32_t y)
+{
+    if (y != x)
+    {
+        return y - x;
+    }
+    return -x;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_FHJS3QZ8L4HW_H
+#define MOD_FHJS3QZ8L4HW_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t mix_types_3_0000(int64_t x, int64_t y);
+int32_t mix_types_3_0001(int32_t x, int32_t y);
+#endif // mod_fhjs3qz8l4hw_H
@@ -0,0 +1,11 @@
+#ifndef MOD_FHVXCOCXHD58_H
+#define MOD_FHVXCOCXHD58_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t my_tuple(t_ndarray a, int64_t* Out_0001, int8_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004);
+#endif // mod_fhvxcocxhd58_H
@@ -0,0 +1,11 @@
+#ifndef MOD_FI38CMP4T84L_H
+#define MOD_FI38CMP4T84L_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_F_array_initialization_2(t_ndarray a, t_ndarray e, t_ndarray f, t_ndarray x);
+#endif // mod_fi38cmp4t84l_H
@@ -0,0 +1,42 @@
+#ifndef MOD_FI38CMP4T84L_WRAPPER_H
+#define MOD_FI38CMP4T84L_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_fi38cmp4t84l.h"
+
+
+#ifdef MOD_FI38CMP4T84L_WRAPPER
+
+
+#else
+
+static void** Pymod_fi38cmp4t84l_API;
+
+
+/*........................................*/
+static int mod_fi38cmp4t84l_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_fi38cmp4t84l_API = (void**)PyCapsule_Import("mod_fi38cmp4t84l._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_fi38cmp4t84l_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_FI38CMP4T84L_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_FIV5MPV3VG8E_H
+#define MOD_FIV5MPV3VG8E_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_1d_negative_step_positive_step(int64_t* Out_0001, double* Out_0002);
+#endif // mod_fiv5mpv3vg8e_H
@@ -0,0 +1,11 @@
+#ifndef MOD_FK5SKOXGFP97_H
+#define MOD_FK5SKOXGFP97_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_fk5skoxgfp97_H
@@ -0,0 +1,14 @@
+#include "mod_fmhbcyybjqv6.h"
+
+
+/*........................................*/
+void copy_to_slice_1(t_ndarray a, t_ndarray b)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)] - INT64_C(1) - INT64_C(1); i += INT64_C(1))
+    {
+        GET_ELEMENT(a, nd_double, i + INT64_C(1)) = GET_ELEMENT(b, nd_double, i);
+    }
+}
+/*........................................*/
+
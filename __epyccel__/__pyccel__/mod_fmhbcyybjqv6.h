@@ -0,0 +1,11 @@
+#ifndef MOD_FMHBCYYBJQV6_H
+#define MOD_FMHBCYYBJQV6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_1(t_ndarray a, t_ndarray b);
+#endif // mod_fmhbcyybjqv6_H
@@ -0,0 +1,12 @@
+#include "mod_fmqk3tphhxgs.h"
+
+
+/*........................................*/
+double complex f22(double complex a)
+{
+    double complex b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
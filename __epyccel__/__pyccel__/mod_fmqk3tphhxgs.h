@@ -0,0 +1,10 @@
+#ifndef MOD_FMQK3TPHHXGS_H
+#define MOD_FMQK3TPHHXGS_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex f22(double complex a);
+#endif // mod_fmqk3tphhxgs_H
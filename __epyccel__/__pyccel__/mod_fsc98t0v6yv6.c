@@ -0,0 +1,18 @@
+#include "mod_fsc98t0v6yv6.h"
+
+
+/*........................................*/
+void tuple_unpacking_4(t_ndarray x)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i, INT64_C(0)) = INT64_C(2);
+    }
+    for (i = INT64_C(0); i < x.shape[INT64_C(1)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, INT64_C(0), i) = INT64_C(3);
+    }
+}
+/*........................................*/
+
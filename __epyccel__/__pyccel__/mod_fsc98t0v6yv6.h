@@ -0,0 +1,11 @@
+#ifndef MOD_FSC98T0V6YV6_H
+#define MOD_FSC98T0V6YV6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void tuple_unpacking_4(t_ndarray x);
+#endif // mod_fsc98t0v6yv6_H
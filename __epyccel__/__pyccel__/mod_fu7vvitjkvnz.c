@@ -0,0 +1,18 @@
+#include "mod_fu7vvitjkvnz.h"
+
+
+/*........................................*/
+int64_t f1(t_ndarray x, int64_t* n, int64_t* m, int64_t* Out_0001, int64_t* Out_0002)
+{
+    t_ndarray y = {.raw_data = NULL};
+    transpose_alias_assign(&y, x);
+    GET_ELEMENT(x, nd_int64, INT64_C(0), x.shape[INT64_C(1)] - INT64_C(1)) += INT64_C(22);
+    (*n) = y.shape[INT64_C(0)];
+    (*m) = y.shape[INT64_C(1)];
+    (*Out_0001) = GET_ELEMENT(y, nd_int64, y.shape[INT64_C(0)] - INT64_C(1), INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(y, nd_int64, INT64_C(0), y.shape[INT64_C(1)] - INT64_C(1));
+    free_pointer(&y);
+    return 0;
+}
+/*........................................*/
+
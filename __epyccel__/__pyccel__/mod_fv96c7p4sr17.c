@@ -0,0 +1,37 @@
+#include "mod_fv96c7p4sr17.h"
+
+
+/*........................................*/
+double tuples_as_indexing_basic(void)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t z;
+    int64_t y;
+    int64_t w;
+    t_ndarray idx = {.raw_data = NULL};
+    double Out_0001;
+    x = array_create(3, (int64_t[]){INT64_C(2), INT64_C(3), INT64_C(2)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    {
+        double* restrict x_data = x.nd_double;
+        for (z = INT64_C(0); z < INT64_C(2); z += INT64_C(1))
+        {
+            for (y = INT64_C(0); y < INT64_C(3); y += INT64_C(1))
+            {
+                for (w = INT64_C(0); w < INT64_C(2); w += INT64_C(1))
+                {
+                    x_data[(z * x.shape[INT64_C(1)] + y) * x.shape[INT64_C(2)] + w] = w + y * INT64_C(2) + z * INT64_C(6);
+                }
+            }
+        }
+    }
+    idx = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(1), INT64_C(0)};
+    memcpy(&idx.nd_int64[INT64_C(0)], Dummy_0000, 3 * idx.type_size);
+    Out_0001 = x.nd_double[(GET_ELEMENT(idx, nd_int64, INT64_C(0)) * x.shape[INT64_C(1)] + GET_ELEMENT(idx, nd_int64, INT64_C(1))) * x.shape[INT64_C(2)] + GET_ELEMENT(idx, nd_int64, INT64_C(2))];
+    free_array(&idx);
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_FV96C7P4SR17_H
+#define MOD_FV96C7P4SR17_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double tuples_as_indexing_basic(void);
+#endif // mod_fv96c7p4sr17_H
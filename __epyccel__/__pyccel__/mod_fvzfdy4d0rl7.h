@@ -0,0 +1,12 @@
+#ifndef MOD_FVZFDY4D0RL7_H
+#define MOD_FVZFDY4D0RL7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_1_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_fvzfdy4d0rl7_H
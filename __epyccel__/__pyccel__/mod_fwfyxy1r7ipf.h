@@ -0,0 +1,10 @@
+#ifndef MOD_FWFYXY1R7IPF_H
+#define MOD_FWFYXY1R7IPF_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t directive_in_else(int64_t x);
+#endif // mod_fwfyxy1r7ipf_H
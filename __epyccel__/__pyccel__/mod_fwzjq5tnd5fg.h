@@ -0,0 +1,11 @@
+#ifndef MOD_FWZJQ5TND5FG_H
+#define MOD_FWZJQ5TND5FG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_fwzjq5tnd5fg_H
@@ -0,0 +1,42 @@
+#ifndef MOD_FWZJQ5TND5FG_WRAPPER_H
+#define MOD_FWZJQ5TND5FG_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_fwzjq5tnd5fg.h"
+
+
+#ifdef MOD_FWZJQ5TND5FG_WRAPPER
+
+
+#else
+
+static void** Pymod_fwzjq5tnd5fg_API;
+
+
+/*........................................*/
+static int mod_fwzjq5tnd5fg_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_fwzjq5tnd5fg_API = (void**)PyCapsule_Import("mod_fwzjq5tnd5fg._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_fwzjq5tnd5fg_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_FWZJQ5TND5FG_WRAPPER_H
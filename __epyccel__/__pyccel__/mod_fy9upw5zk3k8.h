@@ -0,0 +1,11 @@
+#ifndef MOD_FY9UPW5ZK3K8_H
+#define MOD_FY9UPW5ZK3K8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_fy9upw5zk3k8_H
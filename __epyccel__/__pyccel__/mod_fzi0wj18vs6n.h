@@ -0,0 +1,11 @@
+#ifndef MOD_FZI0WJ18VS6N_H
+#define MOD_FZI0WJ18VS6N_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_fzi0wj18vs6n_H
@@ -0,0 +1,11 @@
+#ifndef MOD_FZVWSI2E2PMN_H
+#define MOD_FZVWSI2E2PMN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_add(t_ndarray x, double a);
+#endif // mod_fzvwsi2e2pmn_H
@@ -0,0 +1,12 @@
+#ifndef MOD_G0UWTTNP1WZZ_H
+#define MOD_G0UWTTNP1WZZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_1_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_g0uwttnp1wzz_H
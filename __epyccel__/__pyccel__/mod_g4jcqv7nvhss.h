@@ -0,0 +1,13 @@
+#ifndef MOD_G4JCQV7NVHSS_H
+#define MOD_G4JCQV7NVHSS_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_full_like_val_int_complex_auto(int64_t val);
+#endif // mod_g4jcqv7nvhss_H
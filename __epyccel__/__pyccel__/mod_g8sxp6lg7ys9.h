@@ -0,0 +1,12 @@
+#ifndef MOD_G8SXP6LG7YS9_H
+#define MOD_G8SXP6LG7YS9_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void test_linspace_type2(int64_t start, int64_t end, t_ndarray result);
+#endif // mod_g8sxp6lg7ys9_H
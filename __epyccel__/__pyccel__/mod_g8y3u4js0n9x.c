@@ -0,0 +1,12 @@
+#include "mod_g8y3u4js0n9x.h"
+
+
+/*........................................*/
+bool test_omp_in_parallel1(void)
+{
+    bool in_parallel;
+    in_parallel = omp_in_parallel();
+    return in_parallel;
+}
+/*........................................*/
+
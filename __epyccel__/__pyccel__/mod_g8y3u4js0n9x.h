@@ -0,0 +1,11 @@
+#ifndef MOD_G8Y3U4JS0N9X_H
+#define MOD_G8Y3U4JS0N9X_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_in_parallel1(void);
+#endif // mod_g8y3u4js0n9x_H
@@ -0,0 +1,12 @@
+#ifndef MOD_GAKFZMFEQZ0H_H
+#define MOD_GAKFZMFEQZ0H_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_shape_2d(double n, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_gakfzmfeqz0h_H
@@ -0,0 +1,11 @@
+#ifndef MOD_GCF9WD03XZZR_H
+#define MOD_GCF9WD03XZZR_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_max_task_priority(void);
+#endif // mod_gcf9wd03xzzr_H
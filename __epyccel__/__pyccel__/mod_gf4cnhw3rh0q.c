@@ -0,0 +1,10 @@
+#include "mod_gf4cnhw3rh0q.h"
+
+
+/*........................................*/
+double log10_call(double x)
+{
+    return log10(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_GF4CNHW3RH0Q_H
+#define MOD_GF4CNHW3RH0Q_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log10_call(double x);
+#endif // mod_gf4cnhw3rh0q_H
@@ -0,0 +1,11 @@
+#ifndef MOD_GF60B5MRQ4RJ_H
+#define MOD_GF60B5MRQ4RJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_gf60b5mrq4rj_H
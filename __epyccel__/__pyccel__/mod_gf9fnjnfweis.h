@@ -0,0 +1,11 @@
+#ifndef MOD_GF9FNJNFWEIS_H
+#define MOD_GF9FNJNFWEIS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_4d_C_array_initialization(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_gf9fnjnfweis_H
@@ -0,0 +1,11 @@
+#ifndef MOD_GFE8OU7HWIBY_H
+#define MOD_GFE8OU7HWIBY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_div_stack_array(void);
+#endif // mod_gfe8ou7hwiby_H
@@ -0,0 +1,11 @@
+#ifndef MOD_GJLPO0XKEPFK_H
+#define MOD_GJLPO0XKEPFK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_F_F(t_ndarray A, t_ndarray B, t_ndarray out);
+#endif // mod_gjlpo0xkepfk_H
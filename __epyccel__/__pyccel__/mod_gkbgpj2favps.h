@@ -0,0 +1,11 @@
+#ifndef MOD_GKBGPJ2FAVPS_H
+#define MOD_GKBGPJ2FAVPS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_gkbgpj2favps_H
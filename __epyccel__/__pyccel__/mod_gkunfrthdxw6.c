@@ -0,0 +1,10 @@
+#include "mod_gkunfrthdxw6.h"
+
+
+/*........................................*/
+double tan_call_r(double x)
+{
+    return tan(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_GKUNFRTHDXW6_H
+#define MOD_GKUNFRTHDXW6_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double tan_call_r(double x);
+#endif // mod_gkunfrthdxw6_H
@@ -0,0 +1,20 @@
+#include "mod_gmr60ar106hr.h"
+
+
+/*........................................*/
+void divide_by(t_ndarray a, double b)
+{
+    int64_t i;
+    double ai;
+    if (fabs(b) < 0.1)
+    {
+        return;
+    }
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        ai = GET_ELEMENT(a, nd_double, i);
+        GET_ELEMENT(a, nd_double, i) = ai / b;
+    }
+}
+/*........................................*/
+
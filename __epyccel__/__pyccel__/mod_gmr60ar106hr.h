@@ -0,0 +1,12 @@
+#ifndef MOD_GMR60AR106HR_H
+#define MOD_GMR60AR106HR_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void divide_by(t_ndarray a, double b);
+#endif // mod_gmr60ar106hr_H
@@ -0,0 +1,11 @@
+#ifndef MOD_GMV5982ZQ4YV_H
+#define MOD_GMV5982ZQ4YV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_simd(int64_t n);
+#endif // mod_gmv5982zq4yv_H
@@ -0,0 +1,11 @@
+#ifndef MOD_GO4FBY60K7EC_H
+#define MOD_GO4FBY60K7EC_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_go4fby60k7ec_H
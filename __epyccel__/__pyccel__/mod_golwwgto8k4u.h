@@ -0,0 +1,12 @@
+#ifndef MOD_GOLWWGTO8K4U_H
+#define MOD_GOLWWGTO8K4U_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_1_val(void);
+#endif // mod_golwwgto8k4u_H
@@ -0,0 +1,11 @@
+#ifndef MOD_GPB3SKP7UL0C_H
+#define MOD_GPB3SKP7UL0C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_3(t_ndarray a);
+#endif // mod_gpb3skp7ul0c_H
@@ -0,0 +1,314 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_GQMKXF1LGGEN_WRAPPER
+
+#include "mod_gqmkxf1lggen_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_linspace_0000_wrapper(PyObject* start_obj, PyObject* steps_obj, PyObject* num_obj)
+{
+    int64_t start;
+    int64_t steps;
+    int64_t num;
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    start = PyInt64_to_Int64(start_obj);
+    steps = PyInt64_to_Int64(steps_obj);
+    num = PyInt64_to_Int64(num_obj);
+    b = get_linspace_0000(start, steps, num);
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_linspace_0001_wrapper(PyObject* start_obj, PyObject* steps_obj, PyObject* num_obj)
+{
+    int8_t start;
+    int64_t steps;
+    int64_t num;
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    start = PyInt8_to_Int8(start_obj);
+    steps = PyInt64_to_Int64(steps_obj);
+    num = PyInt64_to_Int64(num_obj);
+    b = get_linspace_0001(start, steps, num);
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_linspace_0002_wrapper(PyObject* start_obj, PyObject* steps_obj, PyObject* num_obj)
+{
+    int16_t start;
+    int64_t steps;
+    int64_t num;
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    start = PyInt16_to_Int16(start_obj);
+    steps = PyInt64_to_Int64(steps_obj);
+    num = PyInt64_to_Int64(num_obj);
+    b = get_linspace_0002(start, steps, num);
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_linspace_0003_wrapper(PyObject* start_obj, PyObject* steps_obj, PyObject* num_obj)
+{
+    int32_t start;
+    int64_t steps;
+    int64_t num;
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    start = PyInt32_to_Int32(start_obj);
+    steps = PyInt64_to_Int64(steps_obj);
+    num = PyInt64_to_Int64(num_obj);
+    b = get_linspace_0003(start, steps, num);
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_linspace_0004_wrapper(PyObject* start_obj, PyObject* steps_obj, PyObject* num_obj)
+{
+    int64_t start;
+    int64_t steps;
+    int64_t num;
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    start = PyInt64_to_Int64(start_obj);
+    steps = PyInt64_to_Int64(steps_obj);
+    num = PyInt64_to_Int64(num_obj);
+    b = get_linspace_0004(start, steps, num);
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_linspace_0005_wrapper(PyObject* start_obj, PyObject* steps_obj, PyObject* num_obj)
+{
+    double start;
+    int64_t steps;
+    int64_t num;
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    start = PyDouble_to_Double(start_obj);
+    steps = PyInt64_to_Int64(steps_obj);
+    num = PyInt64_to_Int64(num_obj);
+    b = get_linspace_0005(start, steps, num);
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_linspace_0006_wrapper(PyObject* start_obj, PyObject* steps_obj, PyObject* num_obj)
+{
+    float start;
+    int64_t steps;
+    int64_t num;
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    start = PyFloat_to_Float(start_obj);
+    steps = PyInt64_to_Int64(steps_obj);
+    num = PyInt64_to_Int64(num_obj);
+    b = get_linspace_0006(start, steps, num);
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_linspace_0007_wrapper(PyObject* start_obj, PyObject* steps_obj, PyObject* num_obj)
+{
+    double start;
+    int64_t steps;
+    int64_t num;
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    start = PyDouble_to_Double(start_obj);
+    steps = PyInt64_to_Int64(steps_obj);
+    num = PyInt64_to_Int64(num_obj);
+    b = get_linspace_0007(start, steps, num);
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t get_linspace_type_check(PyObject* start_obj, PyObject* steps_obj, PyObject* num_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeInt(start_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int8(start_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Int16(start_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Int32(start_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Int64(start_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_NativeFloat(start_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (PyIs_Float(start_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Double(start_obj))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument start");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* get_linspace_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* start_obj;
+    PyObject* steps_obj;
+    PyObject* num_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "start",
+        "steps",
+        "num",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &start_obj, &steps_obj, &num_obj))
+    {
+        return NULL;
+    }
+    type_indicator = get_linspace_type_check(start_obj, steps_obj, num_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return get_linspace_0000_wrapper(start_obj, steps_obj, num_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return get_linspace_0001_wrapper(start_obj, steps_obj, num_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return get_linspace_0002_wrapper(start_obj, steps_obj, num_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return get_linspace_0003_wrapper(start_obj, steps_obj, num_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return get_linspace_0004_wrapper(start_obj, steps_obj, num_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return get_linspace_0005_wrapper(start_obj, steps_obj, num_obj);
+    }
+    else if (type_indicator == INT64_C(6))
+    {
+        return get_linspace_0006_wrapper(start_obj, steps_obj, num_obj);
+    }
+    else if (type_indicator == INT64_C(7))
+    {
+        return get_linspace_0007_wrapper(start_obj, steps_obj, num_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_gqmkxf1lggen_methods[] = {
+    {
+        "get_linspace",
+        (PyCFunction)get_linspace_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_gqmkxf1lggen_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_gqmkxf1lggen",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_gqmkxf1lggen_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_gqmkxf1lggen(void)
+{
+    PyObject* mod;
+    static void* Pymod_gqmkxf1lggen_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_gqmkxf1lggen_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_gqmkxf1lggen_API, "mod_gqmkxf1lggen._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
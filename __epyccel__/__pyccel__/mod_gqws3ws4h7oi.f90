@@ -0,0 +1,24 @@
+module mod_gqws3ws4h7oi
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_float_2d_2d_matmul_F_F(A, B, out) 
+
+    implicit none
+
+    real(f64), intent(in) :: A(0_i64:, 0_i64:)
+    real(f64), intent(in) :: B(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: out(0_i64:, 0_i64:)
+
+    out(:, :) = matmul(A,B)
+
+  end subroutine array_float_2d_2d_matmul_F_F
+  !........................................
+
+end module mod_gqws3ws4h7oi
@@ -0,0 +1,11 @@
+#ifndef MOD_GR0V25ISHYB3_H
+#define MOD_GR0V25ISHYB3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_mul(t_ndarray x, t_ndarray y);
+#endif // mod_gr0v25ishyb3_H
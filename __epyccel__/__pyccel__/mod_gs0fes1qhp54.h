@@ -0,0 +1,11 @@
+#ifndef MOD_GS0FES1QHP54_H
+#define MOD_GS0FES1QHP54_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int64_index(void);
+#endif // mod_gs0fes1qhp54_H
@@ -0,0 +1,40 @@
+#ifndef MOD_GS0FES1QHP54_WRAPPER_H
+#define MOD_GS0FES1QHP54_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_gs0fes1qhp54.h"
+
+
+#ifdef MOD_GS0FES1QHP54_WRAPPER
+
+
+#else
+
+static void** Pymod_gs0fes1qhp54_API;
+
+
+/*........................................*/
+static int mod_gs0fes1qhp54_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_gs0fes1qhp54_API = (void**)PyCapsule_Import("mod_gs0fes1qhp54._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_gs0fes1qhp54_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_GS0FES1QHP54_WRAPPER_H
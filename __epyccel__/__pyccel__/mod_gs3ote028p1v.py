@@ -0,0 +1,5 @@
+
+def array_float_2d_2d_matmul_operator(A : 'float[::,::]', B : 'float[::,::]', out : 'float[::,::]'):
+    from numpy import matmul
+    out[::,::] = matmul(A, B)
+
@@ -0,0 +1,11 @@
+#include "mod_gtvrshqxl8i6.h"
+
+
+/*........................................*/
+bool test_omp_set_get_dynamic(bool dynamic_theads)
+{
+    omp_set_dynamic(dynamic_theads);
+    return omp_get_dynamic();
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_GTVRSHQXL8I6_H
+#define MOD_GTVRSHQXL8I6_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_set_get_dynamic(bool dynamic_theads);
+#endif // mod_gtvrshqxl8i6_H
@@ -0,0 +1,11 @@
+#ifndef MOD_GUJX1GBNAOTC_H
+#define MOD_GUJX1GBNAOTC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_nowait(t_ndarray x, t_ndarray y, t_ndarray z);
+#endif // mod_gujx1gbnaotc_H
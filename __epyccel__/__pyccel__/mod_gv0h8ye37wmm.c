@@ -0,0 +1,18 @@
+#include "mod_gv0h8ye37wmm.h"
+
+
+/*........................................*/
+bool less_than_100(int64_t n)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < INT64_C(100); i += INT64_C(1))
+    {
+        if (i > n)
+        {
+            return 1;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_GV0H8YE37WMM_H
+#define MOD_GV0H8YE37WMM_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+bool less_than_100(int64_t n);
+#endif // mod_gv0h8ye37wmm_H
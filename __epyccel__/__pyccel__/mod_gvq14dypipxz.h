@@ -0,0 +1,11 @@
+#ifndef MOD_GVQ14DYPIPXZ_H
+#define MOD_GVQ14DYPIPXZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_2(t_ndarray a);
+#endif // mod_gvq14dypipxz_H
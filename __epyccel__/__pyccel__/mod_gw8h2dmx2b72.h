@@ -0,0 +1,11 @@
+#ifndef MOD_GW8H2DMX2B72_H
+#define MOD_GW8H2DMX2B72_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_max_task_priority(void);
+#endif // mod_gw8h2dmx2b72_H
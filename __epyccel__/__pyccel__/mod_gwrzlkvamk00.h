@@ -0,0 +1,11 @@
+#ifndef MOD_GWRZLKVAMK00_H
+#define MOD_GWRZLKVAMK00_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void arr_arange_7(t_ndarray arr);
+#endif // mod_gwrzlkvamk00_H
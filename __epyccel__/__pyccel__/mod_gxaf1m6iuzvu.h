@@ -0,0 +1,11 @@
+#ifndef MOD_GXAF1M6IUZVU_H
+#define MOD_GXAF1M6IUZVU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_nowait(t_ndarray x, t_ndarray y, t_ndarray z);
+#endif // mod_gxaf1m6iuzvu_H
@@ -0,0 +1,10 @@
+#include "mod_gxcxntugtkqr.h"
+
+
+/*........................................*/
+double acosh_call(double x)
+{
+    return acosh(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_GXCXNTUGTKQR_H
+#define MOD_GXCXNTUGTKQR_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double acosh_call(double x);
+#endif // mod_gxcxntugtkqr_H
@@ -0,0 +1,13 @@
+#ifndef MOD_GXDKGOIQUR7D_H
+#define MOD_GXDKGOIQUR7D_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_ones_like_val_complex128_auto(void);
+#endif // mod_gxdkgoiqur7d_H
@@ -0,0 +1,12 @@
+#include "mod_gynlzxod27qm.h"
+
+
+/*........................................*/
+bool max_call(t_ndarray x)
+{
+    bool Out_0001;
+    Out_0001 = numpy_amax_bool(x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_GYNLZXOD27QM_H
+#define MOD_GYNLZXOD27QM_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool max_call(t_ndarray x);
+#endif // mod_gynlzxod27qm_H
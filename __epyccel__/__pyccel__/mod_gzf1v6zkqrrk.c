@@ -0,0 +1,10 @@
+#include "mod_gzf1v6zkqrrk.h"
+
+
+/*........................................*/
+double arctan_call_i(int64_t x)
+{
+    return atan((double)(x));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_GZF1V6ZKQRRK_H
+#define MOD_GZF1V6ZKQRRK_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arctan_call_i(int64_t x);
+#endif // mod_gzf1v6zkqrrk_H
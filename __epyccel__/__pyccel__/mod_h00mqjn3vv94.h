@@ -0,0 +1,11 @@
+#ifndef MOD_H00MQJN3VV94_H
+#define MOD_H00MQJN3VV94_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f6_1(int64_t m1, int64_t m2, t_ndarray x);
+#endif // mod_h00mqjn3vv94_H
@@ -0,0 +1,24 @@
+module mod_h100fo3exsa9
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function first(x) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), intent(in) :: x(0_i64:)
+
+    Out_0001 = x(0_i64)
+    return
+
+  end function first
+  !........................................
+
+end module mod_h100fo3exsa9
@@ -0,0 +1,10 @@
+#include "mod_h13rl8uc6dyz.h"
+
+
+/*........................................*/
+int32_t f(int32_t a, int32_t b)
+{
+    return a + b;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_H13RL8UC6DYZ_H
+#define MOD_H13RL8UC6DYZ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t f(int32_t a, int32_t b);
+#endif // mod_h13rl8uc6dyz_H
@@ -0,0 +1,11 @@
+#ifndef MOD_H2Z5K16S22QA_H
+#define MOD_H2Z5K16S22QA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(t_ndarray x, int64_t* n, int64_t* m, double* Out_0001, double* Out_0002);
+#endif // mod_h2z5k16s22qa_H
@@ -0,0 +1,12 @@
+#include "mod_h32jdih20xok.h"
+
+
+/*........................................*/
+double complex sinh_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = csinh(x) + csinh(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_H32JDIH20XOK_H
+#define MOD_H32JDIH20XOK_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex sinh_phrase(double complex x, double complex y);
+#endif // mod_h32jdih20xok_H
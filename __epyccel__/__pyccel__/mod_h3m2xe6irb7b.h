@@ -0,0 +1,11 @@
+#ifndef MOD_H3M2XE6IRB7B_H
+#define MOD_H3M2XE6IRB7B_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_stride_5(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_h3m2xe6irb7b_H
@@ -0,0 +1,11 @@
+#ifndef MOD_H4JHE7YL943B_H
+#define MOD_H4JHE7YL943B_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_size_1d(t_ndarray f);
+#endif // mod_h4jhe7yl943b_H
@@ -0,0 +1,14 @@
+#include "mod_h4jr1xi953at.h"
+
+
+/*........................................*/
+void sqrt_step3(t_ndarray u, t_ndarray v)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < v.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(v, nd_double, i) = sqrt(GET_ELEMENT(u, nd_double, i));
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_H4JR1XI953AT_H
+#define MOD_H4JR1XI953AT_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void sqrt_step3(t_ndarray u, t_ndarray v);
+#endif // mod_h4jr1xi953at_H
@@ -0,0 +1,102 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_H4JR1XI953AT_WRAPPER
+
+#include "mod_h4jr1xi953at_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* sqrt_step3_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* u_obj;
+    PyObject* v_obj;
+    t_ndarray u = {.raw_data = NULL};
+    t_ndarray v = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "u",
+        "v",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &u_obj, &v_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("u", u_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        u = pyarray_to_ndarray(u_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("v", v_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        v = pyarray_to_ndarray(v_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    sqrt_step3(u, v);
+    free_pointer(&u);
+    free_pointer(&v);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_h4jr1xi953at_methods[] = {
+    {
+        "sqrt_step3",
+        (PyCFunction)sqrt_step3_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_h4jr1xi953at_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_h4jr1xi953at",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_h4jr1xi953at_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_h4jr1xi953at(void)
+{
+    PyObject* mod;
+    static void* Pymod_h4jr1xi953at_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_h4jr1xi953at_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_h4jr1xi953at_API, "mod_h4jr1xi953at._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
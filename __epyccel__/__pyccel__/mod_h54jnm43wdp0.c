@@ -0,0 +1,10 @@
+#include "mod_h54jnm43wdp0.h"
+
+
+/*........................................*/
+double acos_call(double x)
+{
+    return acos(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_H54JNM43WDP0_H
+#define MOD_H54JNM43WDP0_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double acos_call(double x);
+#endif // mod_h54jnm43wdp0_H
@@ -0,0 +1,11 @@
+#ifndef MOD_H8Z4UUHNTMON_H
+#define MOD_H8Z4UUHNTMON_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_h8z4uuhntmon_H
@@ -0,0 +1,13 @@
+#ifndef MOD_H90PWYT70K9V_H
+#define MOD_H90PWYT70K9V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_array_0000(t_ndarray a);
+t_ndarray copy_array_0001(t_ndarray a);
+t_ndarray copy_array_0002(t_ndarray a);
+#endif // mod_h90pwyt70k9v_H
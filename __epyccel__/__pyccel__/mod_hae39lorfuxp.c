@@ -0,0 +1,10 @@
+#include "mod_hae39lorfuxp.h"
+
+
+/*........................................*/
+double log_call_i(int64_t x)
+{
+    return log((double)(x));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_HAE39LORFUXP_H
+#define MOD_HAE39LORFUXP_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double log_call_i(int64_t x);
+#endif // mod_hae39lorfuxp_H
@@ -0,0 +1,11 @@
+#ifndef MOD_HB14XW3ZAXMY_H
+#define MOD_HB14XW3ZAXMY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_hb14xw3zaxmy_H
@@ -0,0 +1,10 @@
+#ifndef MOD_HCPRMEQQMA83_H
+#define MOD_HCPRMEQQMA83_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_sections(void);
+#endif // mod_hcprmeqqma83_H
@@ -0,0 +1,11 @@
+#ifndef MOD_HE563B5V8T2G_H
+#define MOD_HE563B5V8T2G_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double return_op_arr_arg_element(int64_t i, t_ndarray arg);
+#endif // mod_he563b5v8t2g_H
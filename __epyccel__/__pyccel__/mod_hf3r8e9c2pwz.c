@@ -0,0 +1,10 @@
+#include "mod_hf3r8e9c2pwz.h"
+
+
+/*........................................*/
+int64_t floor_call(int64_t x)
+{
+    return floor((double)(x));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_HF3R8E9C2PWZ_H
+#define MOD_HF3R8E9C2PWZ_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t floor_call(int64_t x);
+#endif // mod_hf3r8e9c2pwz_H
@@ -0,0 +1,12 @@
+#ifndef MOD_HFLBZU6LOAO0_H
+#define MOD_HFLBZU6LOAO0_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_in_bool_out_1d_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri);
+#endif // mod_hflbzu6loao0_H
@@ -0,0 +1,11 @@
+#ifndef MOD_HGST9O6ZZ9H3_H
+#define MOD_HGST9O6ZZ9H3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void axpy(double a, t_ndarray x, t_ndarray y);
+#endif // mod_hgst9o6zz9h3_H
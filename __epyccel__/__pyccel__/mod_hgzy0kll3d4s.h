@@ -0,0 +1,14 @@
+#ifndef MOD_HGZY0KLL3D4S_H
+#define MOD_HGZY0KLL3D4S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_scalar_add_0000(t_ndarray x, int8_t a, int64_t d1, int64_t d2);
+void array_int_2d_scalar_add_0001(t_ndarray x, int16_t a, int64_t d1, int64_t d2);
+void array_int_2d_scalar_add_0002(t_ndarray x, int32_t a, int64_t d1, int64_t d2);
+void array_int_2d_scalar_add_0003(t_ndarray x, int64_t a, int64_t d1, int64_t d2);
+#endif // mod_hgzy0kll3d4s_H
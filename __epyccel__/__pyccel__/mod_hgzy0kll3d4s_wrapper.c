@@ -0,0 +1,233 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_HGZY0KLL3D4S_WRAPPER
+
+#include "mod_hgzy0kll3d4s_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_int_2d_scalar_add_0000_wrapper(PyObject* x_obj, PyObject* a_obj, PyObject* d1_obj, PyObject* d2_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int8_t a;
+    int64_t d1;
+    int64_t d2;
+    x = pyarray_to_ndarray(x_obj);
+    a = PyInt8_to_Int8(a_obj);
+    d1 = PyInt64_to_Int64(d1_obj);
+    d2 = PyInt64_to_Int64(d2_obj);
+    array_int_2d_scalar_add_0000(x, a, d1, d2);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_int_2d_scalar_add_0001_wrapper(PyObject* x_obj, PyObject* a_obj, PyObject* d1_obj, PyObject* d2_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int16_t a;
+    int64_t d1;
+    int64_t d2;
+    x = pyarray_to_ndarray(x_obj);
+    a = PyInt16_to_Int16(a_obj);
+    d1 = PyInt64_to_Int64(d1_obj);
+    d2 = PyInt64_to_Int64(d2_obj);
+    array_int_2d_scalar_add_0001(x, a, d1, d2);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_int_2d_scalar_add_0002_wrapper(PyObject* x_obj, PyObject* a_obj, PyObject* d1_obj, PyObject* d2_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int32_t a;
+    int64_t d1;
+    int64_t d2;
+    x = pyarray_to_ndarray(x_obj);
+    a = PyInt32_to_Int32(a_obj);
+    d1 = PyInt64_to_Int64(d1_obj);
+    d2 = PyInt64_to_Int64(d2_obj);
+    array_int_2d_scalar_add_0002(x, a, d1, d2);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_int_2d_scalar_add_0003_wrapper(PyObject* x_obj, PyObject* a_obj, PyObject* d1_obj, PyObject* d2_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t a;
+    int64_t d1;
+    int64_t d2;
+    x = pyarray_to_ndarray(x_obj);
+    a = PyInt64_to_Int64(a_obj);
+    d1 = PyInt64_to_Int64(d1_obj);
+    d2 = PyInt64_to_Int64(d2_obj);
+    array_int_2d_scalar_add_0003(x, a, d1, d2);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t array_int_2d_scalar_add_type_check(PyObject* x_obj, PyObject* a_obj, PyObject* d1_obj, PyObject* d2_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(x_obj, NPY_BYTE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(x_obj, NPY_SHORT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(x_obj, NPY_INT32, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (is_numpy_array(x_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    if (PyIs_Int8(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int16(a_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_Int32(a_obj))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else if (PyIs_Int64(a_obj))
+    {
+        type_indicator += INT64_C(12);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* array_int_2d_scalar_add_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* a_obj;
+    PyObject* d1_obj;
+    PyObject* d2_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        "a",
+        "d1",
+        "d2",
+        NULL
+    };
+    static PyObject* kwlist_interned[5] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 4, 4, &x_obj, &a_obj, &d1_obj, &d2_obj))
+    {
+        return NULL;
+    }
+    type_indicator = array_int_2d_scalar_add_type_check(x_obj, a_obj, d1_obj, d2_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return array_int_2d_scalar_add_0000_wrapper(x_obj, a_obj, d1_obj, d2_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return array_int_2d_scalar_add_0001_wrapper(x_obj, a_obj, d1_obj, d2_obj);
+    }
+    else if (type_indicator == INT64_C(10))
+    {
+        return array_int_2d_scalar_add_0002_wrapper(x_obj, a_obj, d1_obj, d2_obj);
+    }
+    else if (type_indicator == INT64_C(15))
+    {
+        return array_int_2d_scalar_add_0003_wrapper(x_obj, a_obj, d1_obj, d2_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_hgzy0kll3d4s_methods[] = {
+    {
+        "array_int_2d_scalar_add",
+        (PyCFunction)array_int_2d_scalar_add_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_hgzy0kll3d4s_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_hgzy0kll3d4s",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_hgzy0kll3d4s_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_hgzy0kll3d4s(void)
+{
+    PyObject* mod;
+    static void* Pymod_hgzy0kll3d4s_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_hgzy0kll3d4s_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_hgzy0kll3d4s_API, "mod_hgzy0kll3d4s._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#include "mod_himjwrk1dhim.h"
+
+
+/*........................................*/
+double fabs_phrase_r_i(int64_t x, double y)
+{
+    double a;
+    a = fabs((double)(x)) * fabs(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_HIMJWRK1DHIM_H
+#define MOD_HIMJWRK1DHIM_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double fabs_phrase_r_i(int64_t x, double y);
+#endif // mod_himjwrk1dhim_H
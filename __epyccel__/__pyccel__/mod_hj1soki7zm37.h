@@ -0,0 +1,12 @@
+#ifndef MOD_HJ1SOKI7ZM37_H
+#define MOD_HJ1SOKI7ZM37_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_shape_F(int64_t n, int64_t m, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_hj1soki7zm37_H
@@ -0,0 +1,24 @@
+#include "mod_hjg17qmceta0.h"
+
+
+/*........................................*/
+t_ndarray return_arrays_in_expression2(int64_t n)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    Dummy_0000 = single_return(n);
+    b = array_create(1, (int64_t[]){Dummy_0000.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict Dummy_0000_data = Dummy_0000.nd_double;
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = Dummy_0000_data[i] + INT64_C(1);
+        }
+    }
+    free_array(&Dummy_0000);
+    return b;
+}
+/*........................................*/
+
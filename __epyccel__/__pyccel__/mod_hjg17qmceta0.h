@@ -0,0 +1,11 @@
+#ifndef MOD_HJG17QMCETA0_H
+#define MOD_HJG17QMCETA0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray return_arrays_in_expression2(int64_t n);
+#endif // mod_hjg17qmceta0_H
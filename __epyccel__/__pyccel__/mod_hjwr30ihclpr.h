@@ -0,0 +1,12 @@
+#ifndef MOD_HJWR30IHCLPR_H
+#define MOD_HJWR30IHCLPR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_int_2d_C_initialization(t_ndarray a);
+#endif // mod_hjwr30ihclpr_H
@@ -0,0 +1,12 @@
+#include "mod_hkqcg3s31gzk.h"
+
+
+/*........................................*/
+double complex acos_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = cacos(x) + cacos(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_HKQCG3S31GZK_H
+#define MOD_HKQCG3S31GZK_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex acos_phrase(double complex x, double complex y);
+#endif // mod_hkqcg3s31gzk_H
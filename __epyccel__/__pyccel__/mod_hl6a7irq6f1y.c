@@ -0,0 +1,10 @@
+#include "mod_hl6a7irq6f1y.h"
+
+
+/*........................................*/
+double call_degrees_i(int64_t x)
+{
+    return pyc_degrees(x);
+}
+/*........................................*/
+
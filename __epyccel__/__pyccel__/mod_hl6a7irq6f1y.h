@@ -0,0 +1,11 @@
+#ifndef MOD_HL6A7IRQ6F1Y_H
+#define MOD_HL6A7IRQ6F1Y_H
+
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double call_degrees_i(int64_t x);
+#endif // mod_hl6a7irq6f1y_H
@@ -0,0 +1,12 @@
+#ifndef MOD_HLNGI9EDX2GE_H
+#define MOD_HLNGI9EDX2GE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_sum(void);
+#endif // mod_hlngi9edx2ge_H
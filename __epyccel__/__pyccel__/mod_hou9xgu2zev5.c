@@ -0,0 +1,10 @@
+#include "mod_hou9xgu2zev5.h"
+
+
+/*........................................*/
+double asinh_call(double x)
+{
+    return asinh(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_HOU9XGU2ZEV5_H
+#define MOD_HOU9XGU2ZEV5_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double asinh_call(double x);
+#endif // mod_hou9xgu2zev5_H
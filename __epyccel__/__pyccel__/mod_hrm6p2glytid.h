@@ -0,0 +1,11 @@
+#ifndef MOD_HRM6P2GLYTID_H
+#define MOD_HRM6P2GLYTID_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_hrm6p2glytid_H
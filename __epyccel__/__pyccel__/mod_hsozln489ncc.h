@@ -0,0 +1,12 @@
+#ifndef MOD_HSOZLN489NCC_H
+#define MOD_HSOZLN489NCC_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_ones_val_complex(void);
+#endif // mod_hsozln489ncc_H
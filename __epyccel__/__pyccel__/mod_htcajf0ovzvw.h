@@ -0,0 +1,12 @@
+#ifndef MOD_HTCAJF0OVZVW_H
+#define MOD_HTCAJF0OVZVW_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_htcajf0ovzvw_H
@@ -0,0 +1,42 @@
+#ifndef MOD_HTCAJF0OVZVW_WRAPPER_H
+#define MOD_HTCAJF0OVZVW_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_htcajf0ovzvw.h"
+
+
+#ifdef MOD_HTCAJF0OVZVW_WRAPPER
+
+
+#else
+
+static void** Pymod_htcajf0ovzvw_API;
+
+
+/*........................................*/
+static int mod_htcajf0ovzvw_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_htcajf0ovzvw_API = (void**)PyCapsule_Import("mod_htcajf0ovzvw._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_htcajf0ovzvw_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_HTCAJF0OVZVW_WRAPPER_H
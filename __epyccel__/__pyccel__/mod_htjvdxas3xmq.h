@@ -0,0 +1,11 @@
+#ifndef MOD_HTJVDXAS3XMQ_H
+#define MOD_HTJVDXAS3XMQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_div(t_ndarray x, double a);
+#endif // mod_htjvdxas3xmq_H
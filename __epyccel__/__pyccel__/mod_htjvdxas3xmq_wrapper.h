@@ -0,0 +1,42 @@
+#ifndef MOD_HTJVDXAS3XMQ_WRAPPER_H
+#define MOD_HTJVDXAS3XMQ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_htjvdxas3xmq.h"
+
+
+#ifdef MOD_HTJVDXAS3XMQ_WRAPPER
+
+
+#else
+
+static void** Pymod_htjvdxas3xmq_API;
+
+
+/*........................................*/
+static int mod_htjvdxas3xmq_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_htjvdxas3xmq_API = (void**)PyCapsule_Import("mod_htjvdxas3xmq._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_htjvdxas3xmq_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_HTJVDXAS3XMQ_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_HTVM1MOCA0GO_H
+#define MOD_HTVM1MOCA0GO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t create_zeros_val_int32(void);
+#endif // mod_htvm1moca0go_H
@@ -0,0 +1,40 @@
+#ifndef MOD_HTVM1MOCA0GO_WRAPPER_H
+#define MOD_HTVM1MOCA0GO_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_htvm1moca0go.h"
+
+
+#ifdef MOD_HTVM1MOCA0GO_WRAPPER
+
+
+#else
+
+static void** Pymod_htvm1moca0go_API;
+
+
+/*........................................*/
+static int mod_htvm1moca0go_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_htvm1moca0go_API = (void**)PyCapsule_Import("mod_htvm1moca0go._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_htvm1moca0go_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_HTVM1MOCA0GO_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_HY14150Q1IB6_H
+#define MOD_HY14150Q1IB6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_array_list_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_hy14150q1ib6_H
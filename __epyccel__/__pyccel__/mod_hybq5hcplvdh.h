@@ -0,0 +1,12 @@
+#ifndef MOD_HYBQ5HCPLVDH_H
+#define MOD_HYBQ5HCPLVDH_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_scalar_idiv(t_ndarray x, int64_t a);
+#endif // mod_hybq5hcplvdh_H
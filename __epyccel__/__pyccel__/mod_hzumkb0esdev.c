@@ -0,0 +1,10 @@
+#include "mod_hzumkb0esdev.h"
+
+
+/*........................................*/
+double arctan2_call(double x, int64_t y)
+{
+    return atan2(x, (double)(y));
+}
+/*........................................*/
+
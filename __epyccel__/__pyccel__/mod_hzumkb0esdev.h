@@ -0,0 +1,11 @@
+#ifndef MOD_HZUMKB0ESDEV_H
+#define MOD_HZUMKB0ESDEV_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arctan2_call(double x, int64_t y);
+#endif // mod_hzumkb0esdev_H
@@ -0,0 +1,11 @@
+#ifndef MOD_I03VDO20FMV6_H
+#define MOD_I03VDO20FMV6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_single(t_ndarray x);
+#endif // mod_i03vdo20fmv6_H
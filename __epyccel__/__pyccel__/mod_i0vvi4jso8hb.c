@@ -0,0 +1,18 @@
+#include "mod_i0vvi4jso8hb.h"
+
+
+/*........................................*/
+double arrs_1d_int32_index(void)
+{
+    int32_t i;
+    t_ndarray a = {.raw_data = NULL};
+    double b;
+    i = 1;
+    a = array_create(1, (int64_t[]){INT64_C(10)}, nd_double, false, order_c);
+    array_fill((double)1.0, a);
+    b = a.nd_double[i] + a.nd_double[i + INT64_C(2)];
+    free_array(&a);
+    return b;
+}
+/*........................................*/
+
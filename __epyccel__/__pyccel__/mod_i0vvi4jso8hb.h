@@ -0,0 +1,11 @@
+#ifndef MOD_I0VVI4JSO8HB_H
+#define MOD_I0VVI4JSO8HB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int32_index(void);
+#endif // mod_i0vvi4jso8hb_H
@@ -0,0 +1,11 @@
+#ifndef MOD_I5Z3QGMDOTHG_H
+#define MOD_I5Z3QGMDOTHG_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_i5z3qgmdothg_H
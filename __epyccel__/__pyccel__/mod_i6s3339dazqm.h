@@ -0,0 +1,13 @@
+#ifndef MOD_I6S3339DAZQM_H
+#define MOD_I6S3339DAZQM_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void test_linspace3(t_ndarray start, int64_t stop, t_ndarray out, bool endpoint);
+#endif // mod_i6s3339dazqm_H
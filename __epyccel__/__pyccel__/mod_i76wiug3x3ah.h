@@ -0,0 +1,12 @@
+#ifndef MOD_I76WIUG3X3AH_H
+#define MOD_I76WIUG3X3AH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_like_2_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_i76wiug3x3ah_H
@@ -0,0 +1,40 @@
+#ifndef MOD_I9UIW8RPCUZV_WRAPPER_H
+#define MOD_I9UIW8RPCUZV_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_i9uiw8rpcuzv.h"
+
+
+#ifdef MOD_I9UIW8RPCUZV_WRAPPER
+
+
+#else
+
+static void** Pymod_i9uiw8rpcuzv_API;
+
+
+/*........................................*/
+static int mod_i9uiw8rpcuzv_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_i9uiw8rpcuzv_API = (void**)PyCapsule_Import("mod_i9uiw8rpcuzv._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_i9uiw8rpcuzv_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_I9UIW8RPCUZV_WRAPPER_H
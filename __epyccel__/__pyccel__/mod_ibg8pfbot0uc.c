@@ -0,0 +1,12 @@
+#include "mod_ibg8pfbot0uc.h"
+
+
+/*........................................*/
+int64_t test_size_axis_literal_3d(t_ndarray f)
+{
+    int64_t Out_0001;
+    Out_0001 = f.shape[INT64_C(2)];
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_IBG8PFBOT0UC_H
+#define MOD_IBG8PFBOT0UC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_size_axis_literal_3d(t_ndarray f);
+#endif // mod_ibg8pfbot0uc_H
@@ -0,0 +1,12 @@
+#include "mod_ice5mthkdi7g.h"
+
+
+/*........................................*/
+double complex asinh_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = casinh(x) + casinh(y);
+    return a;
+}
+/*........................................*/
+
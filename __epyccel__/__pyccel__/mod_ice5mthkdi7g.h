@@ -0,0 +1,10 @@
+#ifndef MOD_ICE5MTHKDI7G_H
+#define MOD_ICE5MTHKDI7G_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex asinh_phrase(double complex x, double complex y);
+#endif // mod_ice5mthkdi7g_H
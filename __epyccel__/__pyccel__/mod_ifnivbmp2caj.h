@@ -0,0 +1,11 @@
+#ifndef MOD_IFNIVBMP2CAJ_H
+#define MOD_IFNIVBMP2CAJ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_ifnivbmp2caj_H
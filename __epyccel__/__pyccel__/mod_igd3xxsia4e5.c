@@ -0,0 +1,12 @@
+#include "mod_igd3xxsia4e5.h"
+
+
+/*........................................*/
+void p_func(void)
+{
+    int64_t x;
+    x = INT64_C(2);
+    x *= INT64_C(2);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_IGD3XXSIA4E5_H
+#define MOD_IGD3XXSIA4E5_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void p_func(void);
+#endif // mod_igd3xxsia4e5_H
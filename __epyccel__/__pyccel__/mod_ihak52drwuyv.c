@@ -0,0 +1,15 @@
+#include "mod_ihak52drwuyv.h"
+
+
+/*........................................*/
+t_ndarray return_ambiguous_pointer_to_argument(t_ndarray x)
+{
+    t_ndarray y = {.raw_data = NULL};
+    t_ndarray w = {.raw_data = NULL};
+    alias_assign(&y, x);
+    alias_assign(&w, y);
+    free_pointer(&y);
+    return w;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_IHAK52DRWUYV_H
+#define MOD_IHAK52DRWUYV_H
+
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+t_ndarray return_ambiguous_pointer_to_argument(t_ndarray x);
+#endif // mod_ihak52drwuyv_H
@@ -0,0 +1,98 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_IHAK52DRWUYV_WRAPPER
+
+#include "mod_ihak52drwuyv_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_ambiguous_pointer_to_argument_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray w = {.raw_data = NULL};
+    PyObject* w_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    w = return_ambiguous_pointer_to_argument(x);
+    free_pointer(&x);
+    w_obj = ndarray_to_pyarray(w);
+    free_pointer(&w);
+    Py_INCREF(x_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(w_obj), (PyObject*)(x_obj)) < 0)
+    {
+        return NULL;
+    }
+    return w_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ihak52drwuyv_methods[] = {
+    {
+        "return_ambiguous_pointer_to_argument",
+        (PyCFunction)return_ambiguous_pointer_to_argument_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ihak52drwuyv_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ihak52drwuyv",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ihak52drwuyv_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ihak52drwuyv(void)
+{
+    PyObject* mod;
+    static void* Pymod_ihak52drwuyv_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ihak52drwuyv_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ihak52drwuyv_API, "mod_ihak52drwuyv._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
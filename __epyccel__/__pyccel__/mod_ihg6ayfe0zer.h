@@ -0,0 +1,11 @@
+#ifndef MOD_IHG6AYFE0ZER_H
+#define MOD_IHG6AYFE0ZER_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_sub(t_ndarray x, t_ndarray y);
+#endif // mod_ihg6ayfe0zer_H
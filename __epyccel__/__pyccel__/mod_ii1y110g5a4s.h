@@ -0,0 +1,11 @@
+#ifndef MOD_II1Y110G5A4S_H
+#define MOD_II1Y110G5A4S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_ii1y110g5a4s_H
@@ -0,0 +1,12 @@
+#include "mod_ij4t457hi9sp.h"
+
+
+/*........................................*/
+double tan_phrase(double x, double y)
+{
+    double a;
+    a = tan(x) + tan(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_IJ4T457HI9SP_H
+#define MOD_IJ4T457HI9SP_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double tan_phrase(double x, double y);
+#endif // mod_ij4t457hi9sp_H
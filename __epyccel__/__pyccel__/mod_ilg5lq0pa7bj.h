@@ -0,0 +1,11 @@
+#ifndef MOD_ILG5LQ0PA7BJ_H
+#define MOD_ILG5LQ0PA7BJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum(t_ndarray x);
+#endif // mod_ilg5lq0pa7bj_H
@@ -0,0 +1,10 @@
+#include "mod_imamr25cyot7.h"
+
+
+/*........................................*/
+double sin_call_i(int64_t x)
+{
+    return sin((double)(x));
+}
+/*........................................*/
+
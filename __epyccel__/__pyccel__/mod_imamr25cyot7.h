@@ -0,0 +1,11 @@
+#ifndef MOD_IMAMR25CYOT7_H
+#define MOD_IMAMR25CYOT7_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double sin_call_i(int64_t x);
+#endif // mod_imamr25cyot7_H
@@ -0,0 +1,13 @@
+#ifndef MOD_IMV0N21V9H7L_H
+#define MOD_IMV0N21V9H7L_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_zeros_like_val_complex128_auto(void);
+#endif // mod_imv0n21v9h7l_H
@@ -0,0 +1,80 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_IMV0N21V9H7L_WRAPPER
+
+#include "mod_imv0n21v9h7l_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_zeros_like_val_complex128_auto_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = create_zeros_like_val_complex128_auto();
+    Out_0001_obj = Complex128_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_imv0n21v9h7l_methods[] = {
+    {
+        "create_zeros_like_val_complex128_auto",
+        (PyCFunction)create_zeros_like_val_complex128_auto_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_imv0n21v9h7l_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_imv0n21v9h7l",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_imv0n21v9h7l_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_imv0n21v9h7l(void)
+{
+    PyObject* mod;
+    static void* Pymod_imv0n21v9h7l_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_imv0n21v9h7l_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_imv0n21v9h7l_API, "mod_imv0n21v9h7l._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
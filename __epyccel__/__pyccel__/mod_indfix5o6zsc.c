@@ -0,0 +1,12 @@
+#include "mod_indfix5o6zsc.h"
+
+
+/*........................................*/
+int64_t f19(int64_t a)
+{
+    int64_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_INDFIX5O6ZSC_H
+#define MOD_INDFIX5O6ZSC_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f19(int64_t a);
+#endif // mod_indfix5o6zsc_H
@@ -0,0 +1,14 @@
+#include "mod_ip98s443ibr6.h"
+
+
+/*........................................*/
+void copy_to_slice_4(t_ndarray a, t_ndarray b)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < (int64_t)ceil((double)(a.shape[INT64_C(0)]) / 2.0); i += INT64_C(1))
+    {
+        GET_ELEMENT(a, nd_double, i * INT64_C(2)) = GET_ELEMENT(b, nd_double, i);
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_IP98S443IBR6_H
+#define MOD_IP98S443IBR6_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_4(t_ndarray a, t_ndarray b);
+#endif // mod_ip98s443ibr6_H
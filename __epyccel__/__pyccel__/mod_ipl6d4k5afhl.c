@@ -0,0 +1,10 @@
+#include "mod_ipl6d4k5afhl.h"
+
+
+/*........................................*/
+void set_num_threads(int64_t n)
+{
+    omp_set_num_threads((int32_t)(n));
+}
+/*........................................*/
+
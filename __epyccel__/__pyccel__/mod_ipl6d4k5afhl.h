@@ -0,0 +1,11 @@
+#ifndef MOD_IPL6D4K5AFHL_H
+#define MOD_IPL6D4K5AFHL_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_ipl6d4k5afhl_H
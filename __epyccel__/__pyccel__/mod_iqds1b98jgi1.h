@@ -0,0 +1,13 @@
+#ifndef MOD_IQDS1B98JGI1_H
+#define MOD_IQDS1B98JGI1_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_zeros_like_val_complex(void);
+#endif // mod_iqds1b98jgi1_H
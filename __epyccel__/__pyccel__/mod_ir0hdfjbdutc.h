@@ -0,0 +1,11 @@
+#ifndef MOD_IR0HDFJBDUTC_H
+#define MOD_IR0HDFJBDUTC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_single(t_ndarray x);
+#endif // mod_ir0hdfjbdutc_H
@@ -0,0 +1,11 @@
+#ifndef MOD_IR7XZZ8JIO7K_H
+#define MOD_IR7XZZ8JIO7K_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_ir7xzz8jio7k_H
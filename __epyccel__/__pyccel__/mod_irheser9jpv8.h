@@ -0,0 +1,11 @@
+#ifndef MOD_IRHESER9JPV8_H
+#define MOD_IRHESER9JPV8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_mul(t_ndarray x, t_ndarray y);
+#endif // mod_irheser9jpv8_H
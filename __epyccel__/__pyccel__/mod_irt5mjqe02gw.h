@@ -0,0 +1,11 @@
+#ifndef MOD_IRT5MJQE02GW_H
+#define MOD_IRT5MJQE02GW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_single(t_ndarray x);
+#endif // mod_irt5mjqe02gw_H
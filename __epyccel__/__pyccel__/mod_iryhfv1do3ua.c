@@ -0,0 +1,12 @@
+#include "mod_iryhfv1do3ua.h"
+
+
+/*........................................*/
+double complex acosh_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = cacosh(x) + cacosh(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_IRYHFV1DO3UA_H
+#define MOD_IRYHFV1DO3UA_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex acosh_phrase(double complex x, double complex y);
+#endif // mod_iryhfv1do3ua_H
@@ -0,0 +1,13 @@
+#ifndef MOD_ISIPKA1PPDLD_H
+#define MOD_ISIPKA1PPDLD_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float complex create_empty_like_val_complex64_auto(void);
+#endif // mod_isipka1ppdld_H
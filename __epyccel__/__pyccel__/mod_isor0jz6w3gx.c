@@ -0,0 +1,12 @@
+#include "mod_isor0jz6w3gx.h"
+
+
+/*........................................*/
+float complex f21(float complex a)
+{
+    float complex b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
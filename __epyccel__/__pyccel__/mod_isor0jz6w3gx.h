@@ -0,0 +1,10 @@
+#ifndef MOD_ISOR0JZ6W3GX_H
+#define MOD_ISOR0JZ6W3GX_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+float complex f21(float complex a);
+#endif // mod_isor0jz6w3gx_H
@@ -0,0 +1,11 @@
+#ifndef MOD_ITL4M1O8BLD4_H
+#define MOD_ITL4M1O8BLD4_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_itl4m1o8bld4_H
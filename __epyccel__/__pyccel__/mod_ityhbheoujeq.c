@@ -0,0 +1,38 @@
+#include "mod_ityhbheoujeq.h"
+
+
+/*........................................*/
+/*______________________________________________*/
+/* full(shape, fill_value, dtype=None, order='C')*/
+/*                                               */
+/*_______________________________________________*/
+double array_kwargs_full(void)
+{
+    int64_t n;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray e = {.raw_data = NULL};
+    double Out_0001;
+    n = INT64_C(3);
+    a = array_create(2, (int64_t[]){n, n - INT64_C(1)}, nd_double, false, order_c);
+    array_fill((double)0.5, a);
+    b = array_create(2, (int64_t[]){n + INT64_C(1), INT64_C(2) * n}, nd_double, false, order_f);
+    array_fill((double)2.0, b);
+    c = array_create(2, (int64_t[]){INT64_C(1), n}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(3), c);
+    d = array_create(1, (int64_t[]){INT64_C(2) + n}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(5), d);
+    e = array_create(1, (int64_t[]){INT64_C(2) * n}, nd_int64, false, order_c);
+    array_fill((int64_t)(1.0), e);
+    Out_0001 = numpy_sum_float64(a) + numpy_sum_float64(b) + numpy_sum_int64(c) + numpy_sum_int64(d) + numpy_sum_int64(e);
+    free_array(&b);
+    free_array(&d);
+    free_array(&e);
+    free_array(&a);
+    free_array(&c);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_ITYHBHEOUJEQ_H
+#define MOD_ITYHBHEOUJEQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_kwargs_full(void);
+#endif // mod_ityhbheoujeq_H
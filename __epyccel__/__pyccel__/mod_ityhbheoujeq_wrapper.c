@@ -0,0 +1,83 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_ITYHBHEOUJEQ_WRAPPER
+
+#include "mod_ityhbheoujeq_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+/*______________________________________________*/
+/* full(shape, fill_value, dtype=None, order='C')*/
+/*                                               */
+/*_______________________________________________*/
+static PyObject* array_kwargs_full_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = array_kwargs_full();
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ityhbheoujeq_methods[] = {
+    {
+        "array_kwargs_full",
+        (PyCFunction)array_kwargs_full_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        " full(shape, fill_value, dtype=None, order=\'C\')\n    "
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ityhbheoujeq_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ityhbheoujeq",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ityhbheoujeq_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ityhbheoujeq(void)
+{
+    PyObject* mod;
+    static void* Pymod_ityhbheoujeq_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ityhbheoujeq_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ityhbheoujeq_API, "mod_ityhbheoujeq._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_IV7KI42OAHKR_H
+#define MOD_IV7KI42OAHKR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_iv7ki42oahkr_H
@@ -0,0 +1,11 @@
+#ifndef MOD_IVT6FXD2D3OR_H
+#define MOD_IVT6FXD2D3OR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_ivt6fxd2d3or_H
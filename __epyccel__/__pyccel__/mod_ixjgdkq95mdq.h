@@ -0,0 +1,11 @@
+#ifndef MOD_IXJGDKQ95MDQ_H
+#define MOD_IXJGDKQ95MDQ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_ancestor_thread_num(void);
+#endif // mod_ixjgdkq95mdq_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_IXJGDKQ95MDQ_WRAPPER
+
+#include "mod_ixjgdkq95mdq_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_get_ancestor_thread_num_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t ancestor_thread;
+    PyObject* ancestor_thread_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    ancestor_thread = test_omp_get_ancestor_thread_num();
+    ancestor_thread_obj = Int32_to_NumpyLong(&ancestor_thread);
+    return ancestor_thread_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ixjgdkq95mdq_methods[] = {
+    {
+        "test_omp_get_ancestor_thread_num",
+        (PyCFunction)test_omp_get_ancestor_thread_num_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ixjgdkq95mdq_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ixjgdkq95mdq",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ixjgdkq95mdq_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ixjgdkq95mdq(void)
+{
+    PyObject* mod;
+    static void* Pymod_ixjgdkq95mdq_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ixjgdkq95mdq_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ixjgdkq95mdq_API, "mod_ixjgdkq95mdq._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_IXZLWS7FIFYM_H
+#define MOD_IXZLWS7FIFYM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_like_1_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_ixzlws7fifym_H
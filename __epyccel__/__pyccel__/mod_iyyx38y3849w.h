@@ -0,0 +1,11 @@
+#ifndef MOD_IYYX38Y3849W_H
+#define MOD_IYYX38Y3849W_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_max_task_priority(void);
+#endif // mod_iyyx38y3849w_H
@@ -0,0 +1,11 @@
+#ifndef MOD_J025175QG1RN_H
+#define MOD_J025175QG1RN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_0(void);
+#endif // mod_j025175qg1rn_H
@@ -0,0 +1,40 @@
+#ifndef MOD_J025175QG1RN_WRAPPER_H
+#define MOD_J025175QG1RN_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_j025175qg1rn.h"
+
+
+#ifdef MOD_J025175QG1RN_WRAPPER
+
+
+#else
+
+static void** Pymod_j025175qg1rn_API;
+
+
+/*........................................*/
+static int mod_j025175qg1rn_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_j025175qg1rn_API = (void**)PyCapsule_Import("mod_j025175qg1rn._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_j025175qg1rn_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_J025175QG1RN_WRAPPER_H
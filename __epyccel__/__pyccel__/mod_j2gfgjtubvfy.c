@@ -0,0 +1,10 @@
+#include "mod_j2gfgjtubvfy.h"
+
+
+/*........................................*/
+bool isinf_call(double x)
+{
+    return isinf(x);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_J2GFGJTUBVFY_H
+#define MOD_J2GFGJTUBVFY_H
+
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool isinf_call(double x);
+#endif // mod_j2gfgjtubvfy_H
@@ -0,0 +1,10 @@
+#ifndef MOD_J3YW2Y3795GZ_H
+#define MOD_J3YW2Y3795GZ_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sinh_phrase(double x, double y);
+#endif // mod_j3yw2y3795gz_H
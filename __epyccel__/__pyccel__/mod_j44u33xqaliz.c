@@ -0,0 +1,12 @@
+#include "mod_j44u33xqaliz.h"
+
+
+/*........................................*/
+double sinh_phrase(double x, double y)
+{
+    double a;
+    a = sinh(x) + sinh(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_J44U33XQALIZ_H
+#define MOD_J44U33XQALIZ_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sinh_phrase(double x, double y);
+#endif // mod_j44u33xqaliz_H
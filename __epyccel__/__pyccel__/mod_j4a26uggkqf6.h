@@ -0,0 +1,11 @@
+#ifndef MOD_J4A26UGGKQF6_H
+#define MOD_J4A26UGGKQF6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_j4a26uggkqf6_H
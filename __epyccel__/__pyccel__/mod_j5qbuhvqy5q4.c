@@ -0,0 +1,22 @@
+#include "mod_j5qbuhvqy5q4.h"
+
+
+/*........................................*/
+int64_t create_full_like_val(int64_t val, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    arr = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(5), INT64_C(1), INT64_C(8), INT64_C(0), INT64_C(9)};
+    memcpy(&arr.nd_int64[INT64_C(0)], Dummy_0000, 5 * arr.type_size);
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    array_fill(val, a);
+    (*Out_0001) = a.nd_int64[INT64_C(0)];
+    (*Out_0002) = a.nd_int64[INT64_C(1)];
+    (*Out_0003) = a.nd_int64[INT64_C(2)];
+    free_array(&a);
+    free_array(&arr);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_J5QBUHVQY5Q4_H
+#define MOD_J5QBUHVQY5Q4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_val(int64_t val, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_j5qbuhvqy5q4_H
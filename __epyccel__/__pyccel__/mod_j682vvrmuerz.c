@@ -0,0 +1,10 @@
+#include "mod_j682vvrmuerz.h"
+
+
+/*........................................*/
+double complex sin_call(double complex x)
+{
+    return csin(x);
+}
+/*........................................*/
+
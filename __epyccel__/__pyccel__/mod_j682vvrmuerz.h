@@ -0,0 +1,10 @@
+#ifndef MOD_J682VVRMUERZ_H
+#define MOD_J682VVRMUERZ_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex sin_call(double complex x);
+#endif // mod_j682vvrmuerz_H
@@ -0,0 +1,12 @@
+#ifndef MOD_J7K1YBXHD3KT_H
+#define MOD_J7K1YBXHD3KT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_like_shape_F(int64_t n, int64_t m, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_j7k1ybxhd3kt_H
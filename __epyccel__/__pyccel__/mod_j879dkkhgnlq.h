@@ -0,0 +1,12 @@
+#ifndef MOD_J879DKKHGNLQ_H
+#define MOD_J879DKKHGNLQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_multi_indexing_1(double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_j879dkkhgnlq_H
@@ -0,0 +1,24 @@
+#include "mod_jaqn1ojrsghs.h"
+
+
+/*........................................*/
+int64_t f(void)
+{
+    int64_t i;
+    t_ndarray x = {.raw_data = NULL};
+    int64_t Out_0001;
+    for (i = INT64_C(0); i < INT64_C(3); i += INT64_C(1))
+    {
+        if (x.raw_data != NULL)
+        {
+            free_array(&x);
+        }
+        x = array_create(1, (int64_t[]){i}, nd_int64, false, order_c);
+        array_fill((int64_t)INT64_C(1), x);
+    }
+    Out_0001 = numpy_sum_int64(x);
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_JAQN1OJRSGHS_H
+#define MOD_JAQN1OJRSGHS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(void);
+#endif // mod_jaqn1ojrsghs_H
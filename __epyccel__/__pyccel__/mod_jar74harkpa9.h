@@ -0,0 +1,11 @@
+#ifndef MOD_JAR74HARKPA9_H
+#define MOD_JAR74HARKPA9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_jar74harkpa9_H
@@ -0,0 +1,12 @@
+#ifndef MOD_JCJ89RCN8BKP_H
+#define MOD_JCJ89RCN8BKP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_2d_stack_array_2(void);
+#endif // mod_jcj89rcn8bkp_H
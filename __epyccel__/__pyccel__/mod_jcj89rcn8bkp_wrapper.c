@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_JCJ89RCN8BKP_WRAPPER
+
+#include "mod_jcj89rcn8bkp_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* multiple_2d_stack_array_2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double s;
+    PyObject* s_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    s = multiple_2d_stack_array_2();
+    s_obj = Double_to_PyDouble(&s);
+    return s_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_jcj89rcn8bkp_methods[] = {
+    {
+        "multiple_2d_stack_array_2",
+        (PyCFunction)multiple_2d_stack_array_2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_jcj89rcn8bkp_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_jcj89rcn8bkp",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_jcj89rcn8bkp_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_jcj89rcn8bkp(void)
+{
+    PyObject* mod;
+    static void* Pymod_jcj89rcn8bkp_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_jcj89rcn8bkp_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_jcj89rcn8bkp_API, "mod_jcj89rcn8bkp._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#include "mod_jeauz76kz7mt.h"
+
+
+/*........................................*/
+double sum_call(t_ndarray x)
+{
+    double Out_0001;
+    Out_0001 = numpy_sum_float64(x);
+    return Out_0001;
+}
+/*........................................*/
+
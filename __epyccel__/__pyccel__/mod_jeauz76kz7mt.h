@@ -0,0 +1,10 @@
+#ifndef MOD_JEAUZ76KZ7MT_H
+#define MOD_JEAUZ76KZ7MT_H
+
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+double sum_call(t_ndarray x);
+#endif // mod_jeauz76kz7mt_H
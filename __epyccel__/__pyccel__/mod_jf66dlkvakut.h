@@ -0,0 +1,11 @@
+#ifndef MOD_JF66DLKVAKUT_H
+#define MOD_JF66DLKVAKUT_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_jf66dlkvakut_H
@@ -0,0 +1,12 @@
+#ifndef MOD_JGL10W03FK43_H
+#define MOD_JGL10W03FK43_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t iterate_slice(int64_t i);
+#endif // mod_jgl10w03fk43_H
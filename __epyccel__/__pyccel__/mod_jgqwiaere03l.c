@@ -0,0 +1,12 @@
+#include "mod_jgqwiaere03l.h"
+
+
+/*........................................*/
+double sqrt_return_type_real(double x)
+{
+    double a;
+    a = sqrt(x);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_JGQWIAERE03L_H
+#define MOD_JGQWIAERE03L_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sqrt_return_type_real(double x);
+#endif // mod_jgqwiaere03l_H
@@ -0,0 +1,10 @@
+#include "mod_jjav2jtcwe0n.h"
+
+
+/*........................................*/
+double atan_call(double x)
+{
+    return atan(x);
+}
+/*........................................*/
+
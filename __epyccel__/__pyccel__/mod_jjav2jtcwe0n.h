@@ -0,0 +1,10 @@
+#ifndef MOD_JJAV2JTCWE0N_H
+#define MOD_JJAV2JTCWE0N_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double atan_call(double x);
+#endif // mod_jjav2jtcwe0n_H
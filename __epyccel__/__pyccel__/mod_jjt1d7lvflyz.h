@@ -0,0 +1,11 @@
+#ifndef MOD_JJT1D7LVFLYZ_H
+#define MOD_JJT1D7LVFLYZ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_jjt1d7lvflyz_H
@@ -0,0 +1,11 @@
+#ifndef MOD_JM6TA1YU92DH_H
+#define MOD_JM6TA1YU92DH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_stride_1(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_jm6ta1yu92dh_H
@@ -0,0 +1,11 @@
+#ifndef MOD_JM7WHCEJ8BVT_H
+#define MOD_JM7WHCEJ8BVT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_1D_1(t_ndarray a);
+#endif // mod_jm7whcej8bvt_H
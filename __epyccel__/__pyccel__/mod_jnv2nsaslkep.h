@@ -0,0 +1,10 @@
+#ifndef MOD_JNV2NSASLKEP_H
+#define MOD_JNV2NSASLKEP_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_tasks(int64_t x);
+#endif // mod_jnv2nsaslkep_H
@@ -0,0 +1,11 @@
+#ifndef MOD_JOG4JCCRQHDV_H
+#define MOD_JOG4JCCRQHDV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_1D_2(t_ndarray a);
+#endif // mod_jog4jccrqhdv_H
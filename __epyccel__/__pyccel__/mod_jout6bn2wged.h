@@ -0,0 +1,11 @@
+#ifndef MOD_JOUT6BN2WGED_H
+#define MOD_JOUT6BN2WGED_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_barrier(void);
+#endif // mod_jout6bn2wged_H
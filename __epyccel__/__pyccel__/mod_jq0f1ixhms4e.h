@@ -0,0 +1,11 @@
+#ifndef MOD_JQ0F1IXHMS4E_H
+#define MOD_JQ0F1IXHMS4E_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_jq0f1ixhms4e_H
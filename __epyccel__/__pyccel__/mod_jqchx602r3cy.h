@@ -0,0 +1,13 @@
+#ifndef MOD_JQCHX602R3CY_H
+#define MOD_JQCHX602R3CY_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float complex create_ones_like_val_complex64(void);
+#endif // mod_jqchx602r3cy_H
@@ -0,0 +1,11 @@
+#ifndef MOD_JQVDNBELHN9M_H
+#define MOD_JQVDNBELHN9M_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_ones_val_float(void);
+#endif // mod_jqvdnbelhn9m_H
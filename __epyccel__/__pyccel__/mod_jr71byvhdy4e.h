@@ -0,0 +1,11 @@
+#ifndef MOD_JR71BYVHDY4E_H
+#define MOD_JR71BYVHDY4E_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_jr71byvhdy4e_H
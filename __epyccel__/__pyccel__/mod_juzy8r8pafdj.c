@@ -0,0 +1,12 @@
+#include "mod_juzy8r8pafdj.h"
+
+
+/*........................................*/
+int64_t f8(int64_t x, bool b)
+{
+    int64_t a;
+    a = b ? x : INT64_C(2);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_JUZY8R8PAFDJ_H
+#define MOD_JUZY8R8PAFDJ_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f8(int64_t x, bool b);
+#endif // mod_juzy8r8pafdj_H
@@ -0,0 +1,21 @@
+#include "mod_jv7vaw17yy9e.h"
+
+
+/*........................................*/
+int64_t f1(int64_t i)
+{
+    int32_t idx;
+    int64_t out;
+    out = -INT64_C(1);
+    #pragma omp parallel private(idx)
+    {
+        idx = omp_get_thread_num();
+        if (idx == i)
+        {
+            out = (int64_t)(idx);
+        }
+    }
+    return out;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_JV7VAW17YY9E_H
+#define MOD_JV7VAW17YY9E_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(int64_t i);
+#endif // mod_jv7vaw17yy9e_H
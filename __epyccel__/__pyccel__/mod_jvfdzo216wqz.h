@@ -0,0 +1,12 @@
+#ifndef MOD_JVFDZO216WQZ_H
+#define MOD_JVFDZO216WQZ_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_jvfdzo216wqz_H
@@ -0,0 +1,10 @@
+#ifndef MOD_JVPON2LSTJG9_H
+#define MOD_JVPON2LSTJG9_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_master(void);
+#endif // mod_jvpon2lstjg9_H
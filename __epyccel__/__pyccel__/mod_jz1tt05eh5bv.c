@@ -0,0 +1,10 @@
+#include "mod_jz1tt05eh5bv.h"
+
+
+/*........................................*/
+double complex acos_call(double complex x)
+{
+    return cacos(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_JZ1TT05EH5BV_H
+#define MOD_JZ1TT05EH5BV_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex acos_call(double complex x);
+#endif // mod_jz1tt05eh5bv_H
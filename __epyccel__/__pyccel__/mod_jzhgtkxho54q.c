@@ -0,0 +1,10 @@
+#include "mod_jzhgtkxho54q.h"
+
+
+/*........................................*/
+double tanh_call_r(double x)
+{
+    return tanh(x);
+}
+/*........................................*/
+
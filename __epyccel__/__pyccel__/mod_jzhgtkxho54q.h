@@ -0,0 +1,10 @@
+#ifndef MOD_JZHGTKXHO54Q_H
+#define MOD_JZHGTKXHO54Q_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double tanh_call_r(double x);
+#endif // mod_jzhgtkxho54q_H
@@ -0,0 +1,12 @@
+#include "mod_k0bc8qveh8nh.h"
+
+
+/*........................................*/
+double sqrt_return_type_real(double x)
+{
+    double a;
+    a = sqrt(x);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_K0BC8QVEH8NH_H
+#define MOD_K0BC8QVEH8NH_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sqrt_return_type_real(double x);
+#endif // mod_k0bc8qveh8nh_H
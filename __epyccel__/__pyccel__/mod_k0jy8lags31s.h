@@ -0,0 +1,11 @@
+#ifndef MOD_K0JY8LAGS31S_H
+#define MOD_K0JY8LAGS31S_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_num_threads(void);
+#endif // mod_k0jy8lags31s_H
@@ -0,0 +1,16 @@
+#include "mod_k0lxecgj9g90.h"
+
+
+/*........................................*/
+double create_zeros_val_float(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_double, false, order_c);
+    array_fill((double)0.0, a);
+    Out_0001 = a.nd_double[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_K0LXECGJ9G90_H
+#define MOD_K0LXECGJ9G90_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_zeros_val_float(void);
+#endif // mod_k0lxecgj9g90_H
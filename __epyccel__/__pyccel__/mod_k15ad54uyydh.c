@@ -0,0 +1,31 @@
+#include "mod_k15ad54uyydh.h"
+
+
+/*........................................*/
+int64_t omp_flush(void)
+{
+    int64_t flag;
+    flag = INT64_C(0);
+    #pragma omp parallel num_threads(2)
+    {
+        if (omp_get_thread_num() == INT64_C(0))
+        {
+            #pragma omp atomic update
+            flag = flag + INT64_C(1);
+        }
+        else if (omp_get_thread_num() == INT64_C(1))
+        {
+            #pragma omp flush (flag)
+            while(flag < INT64_C(1))
+            {
+                // pass
+                #pragma omp flush (flag)
+            }
+            #pragma omp atomic update
+            flag = flag + INT64_C(1);
+        }
+    }
+    return flag;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_K15AD54UYYDH_H
+#define MOD_K15AD54UYYDH_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_flush(void);
+#endif // mod_k15ad54uyydh_H
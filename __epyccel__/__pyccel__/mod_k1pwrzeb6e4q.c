@@ -0,0 +1,12 @@
+#include "mod_k1pwrzeb6e4q.h"
+
+
+/*........................................*/
+double copysign_return_type(double x, double y)
+{
+    double a;
+    a = copysign(x, y);
+    return a;
+}
+/*........................................*/
+
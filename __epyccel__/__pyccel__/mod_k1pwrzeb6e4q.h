@@ -0,0 +1,10 @@
+#ifndef MOD_K1PWRZEB6E4Q_H
+#define MOD_K1PWRZEB6E4Q_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double copysign_return_type(double x, double y);
+#endif // mod_k1pwrzeb6e4q_H
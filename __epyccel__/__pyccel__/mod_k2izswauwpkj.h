@@ -0,0 +1,12 @@
+#ifndef MOD_K2IZSWAUWPKJ_H
+#define MOD_K2IZSWAUWPKJ_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_k2izswauwpkj_H
@@ -0,0 +1,11 @@
+#ifndef MOD_K2M04X3MSH8B_H
+#define MOD_K2M04X3MSH8B_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_5(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_k2m04x3msh8b_H
@@ -0,0 +1,10 @@
+#include "mod_k2n1wmhc8fg6.h"
+
+
+/*........................................*/
+double f(double a, double b)
+{
+    return a + b;
+}
+/*........................................*/
+
@@ -0,0 +1,9 @@
+#ifndef MOD_K2N1WMHC8FG6_H
+#define MOD_K2N1WMHC8FG6_H
+
+#include <stdlib.h>
+
+
+
+double f(double a, double b);
+#endif // mod_k2n1wmhc8fg6_H
@@ -0,0 +1,11 @@
+#ifndef MOD_K3JFKEPNW8MU_H
+#define MOD_K3JFKEPNW8MU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void stencil(t_ndarray u, t_ndarray out);
+#endif // mod_k3jfkepnw8mu_H
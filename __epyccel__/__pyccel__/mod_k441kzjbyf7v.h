@@ -0,0 +1,11 @@
+#ifndef MOD_K441KZJBYF7V_H
+#define MOD_K441KZJBYF7V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_zeros_val_float64(void);
+#endif // mod_k441kzjbyf7v_H
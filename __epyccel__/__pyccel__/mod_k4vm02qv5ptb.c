@@ -0,0 +1,10 @@
+#include "mod_k4vm02qv5ptb.h"
+
+
+/*........................................*/
+void set_num_threads(int64_t n)
+{
+    omp_set_num_threads((int32_t)(n));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_K4VM02QV5PTB_H
+#define MOD_K4VM02QV5PTB_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_k4vm02qv5ptb_H
@@ -0,0 +1,12 @@
+#ifndef MOD_K4XM8QTYM1M5_H
+#define MOD_K4XM8QTYM1M5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int32_t create_empty_like_val_int32(void);
+#endif // mod_k4xm8qtym1m5_H
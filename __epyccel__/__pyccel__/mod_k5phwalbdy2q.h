@@ -0,0 +1,11 @@
+#ifndef MOD_K5PHWALBDY2Q_H
+#define MOD_K5PHWALBDY2Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_mul(t_ndarray x, int64_t a);
+#endif // mod_k5phwalbdy2q_H
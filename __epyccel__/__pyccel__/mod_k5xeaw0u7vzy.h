@@ -0,0 +1,11 @@
+#ifndef MOD_K5XEAW0U7VZY_H
+#define MOD_K5XEAW0U7VZY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f(int64_t n);
+#endif // mod_k5xeaw0u7vzy_H
@@ -0,0 +1,10 @@
+#include "mod_k68z8jfpzqw3.h"
+
+
+/*........................................*/
+double arccos_call_r(double x)
+{
+    return acos(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_K68Z8JFPZQW3_H
+#define MOD_K68Z8JFPZQW3_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double arccos_call_r(double x);
+#endif // mod_k68z8jfpzqw3_H
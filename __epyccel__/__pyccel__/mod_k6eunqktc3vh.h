@@ -0,0 +1,12 @@
+#ifndef MOD_K6EUNQKTC3VH_H
+#define MOD_K6EUNQKTC3VH_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_k6eunqktc3vh_H
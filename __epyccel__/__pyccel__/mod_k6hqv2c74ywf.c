@@ -0,0 +1,12 @@
+#include "mod_k6hqv2c74ywf.h"
+
+
+/*........................................*/
+double arcsin_phrase(double x, double y)
+{
+    double a;
+    a = asin(x) + asin(y);
+    return a;
+}
+/*........................................*/
+
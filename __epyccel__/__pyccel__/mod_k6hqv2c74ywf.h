@@ -0,0 +1,10 @@
+#ifndef MOD_K6HQV2C74YWF_H
+#define MOD_K6HQV2C74YWF_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double arcsin_phrase(double x, double y);
+#endif // mod_k6hqv2c74ywf_H
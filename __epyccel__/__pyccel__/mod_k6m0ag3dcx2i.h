@@ -0,0 +1,11 @@
+#ifndef MOD_K6M0AG3DCX2I_H
+#define MOD_K6M0AG3DCX2I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f2(t_ndarray x, int64_t* n, int64_t* m, int64_t* p, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_k6m0ag3dcx2i_H
@@ -0,0 +1,11 @@
+#ifndef MOD_K8T2GFQB6BP5_H
+#define MOD_K8T2GFQB6BP5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t expr_negative_index(int64_t n, int64_t idx_1, int64_t idx_2);
+#endif // mod_k8t2gfqb6bp5_H
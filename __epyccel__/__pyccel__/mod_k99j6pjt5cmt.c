@@ -0,0 +1,144 @@
+#include "mod_k99j6pjt5cmt.h"
+
+
+/*........................................*/
+t_ndarray return_f_array_0000(int64_t b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int64, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_int64[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_f_array_0001(int8_t b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int8, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int8, false, order_c);
+    int8_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_int8[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_f_array_0002(int16_t b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int16, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int16, false, order_c);
+    int16_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_int16[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_f_array_0003(int32_t b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int32, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int32, false, order_c);
+    int32_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_int32[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_f_array_0004(int64_t b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int64, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_int64[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_f_array_0005(double b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_double, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_double, false, order_c);
+    double Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_double[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_f_array_0006(float b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_float, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_float, false, order_c);
+    float Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_float[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_f_array_0007(double b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_double, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_double, false, order_c);
+    double Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_double[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_f_array_0008(float complex b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_cfloat, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_cfloat, false, order_c);
+    float complex Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_cfloat[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_f_array_0009(double complex b)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_cdouble, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_cdouble, false, order_c);
+    double complex Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&Dummy_0000.nd_cdouble[INT64_C(0)], Dummy_0001, 6 * Dummy_0000.type_size);
+    array_copy_data(&a, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_K9AR8BSFAHB8_H
+#define MOD_K9AR8BSFAHB8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_ones_val_float64(void);
+#endif // mod_k9ar8bsfahb8_H
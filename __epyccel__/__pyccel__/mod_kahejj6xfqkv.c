@@ -0,0 +1,32 @@
+#include "mod_kahejj6xfqkv.h"
+
+
+/*........................................*/
+int64_t tuples_mul_inhomogeneous2(int64_t* Out_0001, bool* Out_0002, int64_t* Out_0003, bool* Out_0004, int64_t* Out_0005, bool* Out_0006)
+{
+    int64_t a_0;
+    bool a_1;
+    int64_t b_0;
+    bool b_1;
+    int64_t b_2;
+    bool b_3;
+    int64_t b_4;
+    bool b_5;
+    a_0 = INT64_C(1);
+    a_1 = 0;
+    b_0 = a_0;
+    b_1 = a_1;
+    b_2 = a_0;
+    b_3 = a_1;
+    b_4 = a_0;
+    b_5 = a_1;
+    (*Out_0001) = b_0;
+    (*Out_0002) = b_1;
+    (*Out_0003) = b_2;
+    (*Out_0004) = b_3;
+    (*Out_0005) = b_4;
+    (*Out_0006) = b_5;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_KAHEJJ6XFQKV_H
+#define MOD_KAHEJJ6XFQKV_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_mul_inhomogeneous2(int64_t* Out_0001, bool* Out_0002, int64_t* Out_0003, bool* Out_0004, int64_t* Out_0005, bool* Out_0006);
+#endif // mod_kahejj6xfqkv_H
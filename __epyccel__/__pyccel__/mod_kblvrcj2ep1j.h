@@ -0,0 +1,11 @@
+#ifndef MOD_KBLVRCJ2EP1J_H
+#define MOD_KBLVRCJ2EP1J_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_level(void);
+#endif // mod_kblvrcj2ep1j_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KE4Y8Q3V3OJZ_H
+#define MOD_KE4Y8Q3V3OJZ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_ke4y8q3v3ojz_H
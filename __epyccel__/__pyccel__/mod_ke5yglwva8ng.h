@@ -0,0 +1,11 @@
+#ifndef MOD_KE5YGLWVA8NG_H
+#define MOD_KE5YGLWVA8NG_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_ke5yglwva8ng_H
@@ -0,0 +1,10 @@
+#include "mod_kemv0aaexx11.h"
+
+
+/*........................................*/
+double exp_call_r(double x)
+{
+    return exp(x);
+}
+/*........................................*/
+
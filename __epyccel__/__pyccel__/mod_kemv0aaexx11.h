@@ -0,0 +1,10 @@
+#ifndef MOD_KEMV0AAEXX11_H
+#define MOD_KEMV0AAEXX11_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double exp_call_r(double x);
+#endif // mod_kemv0aaexx11_H
@@ -0,0 +1,10 @@
+#ifndef MOD_KGLTLW661CW9_H
+#define MOD_KGLTLW661CW9_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_range_sum_critical(int64_t x);
+#endif // mod_kgltlw661cw9_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KHYMOKFAO5O9_H
+#define MOD_KHYMOKFAO5O9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_add_augassign(t_ndarray x, t_ndarray y);
+#endif // mod_khymokfao5o9_H
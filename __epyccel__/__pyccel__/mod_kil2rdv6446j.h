@@ -0,0 +1,11 @@
+#ifndef MOD_KIL2RDV6446J_H
+#define MOD_KIL2RDV6446J_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_sub(t_ndarray x, t_ndarray y);
+#endif // mod_kil2rdv6446j_H
@@ -0,0 +1,10 @@
+#include "mod_kkdwv9ub09we.h"
+
+
+/*........................................*/
+double ldexp_type(double x, int64_t exp)
+{
+    return ldexp(x, (double)(exp));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_KKDWV9UB09WE_H
+#define MOD_KKDWV9UB09WE_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double ldexp_type(double x, int64_t exp);
+#endif // mod_kkdwv9ub09we_H
@@ -0,0 +1,12 @@
+#ifndef MOD_KLNH1OEO20LM_H
+#define MOD_KLNH1OEO20LM_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_idiv(t_ndarray x, double a);
+#endif // mod_klnh1oeo20lm_H
@@ -0,0 +1,12 @@
+#ifndef MOD_KM1U7VHUY0LQ_H
+#define MOD_KM1U7VHUY0LQ_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_ones_3_val(void);
+#endif // mod_km1u7vhuy0lq_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KM2N3ZN8CJEM_H
+#define MOD_KM2N3ZN8CJEM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_km2n3zn8cjem_H
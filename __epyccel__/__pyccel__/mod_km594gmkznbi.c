@@ -0,0 +1,10 @@
+#include "mod_km594gmkznbi.h"
+
+
+/*........................................*/
+int64_t trunc_call(int64_t x)
+{
+    return trunc((double)(x));
+}
+/*........................................*/
+
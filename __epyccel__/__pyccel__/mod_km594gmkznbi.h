@@ -0,0 +1,11 @@
+#ifndef MOD_KM594GMKZNBI_H
+#define MOD_KM594GMKZNBI_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t trunc_call(int64_t x);
+#endif // mod_km594gmkznbi_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KMHBOJIS5434_H
+#define MOD_KMHBOJIS5434_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_mul(t_ndarray x, double a);
+#endif // mod_kmhbojis5434_H
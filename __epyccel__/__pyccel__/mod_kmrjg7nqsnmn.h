@@ -0,0 +1,12 @@
+#ifndef MOD_KMRJG7NQSNMN_H
+#define MOD_KMRJG7NQSNMN_H
+
+#include <complex.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t inhomogeneous_tuple_1(int64_t* Out_0001, bool* Out_0002, double complex* Out_0003);
+#endif // mod_kmrjg7nqsnmn_H
@@ -0,0 +1,20 @@
+#include "mod_kmywdzhc1ajn.h"
+
+
+/*........................................*/
+int64_t tuple_inhomogeneous_1(int64_t* Out_0001, bool* Out_0002, double complex* Out_0003, int64_t* Out_0004)
+{
+    int64_t a_0;
+    bool a_1;
+    double complex a_2;
+    a_0 = INT64_C(0);
+    a_1 = 0;
+    a_2 = (3.0 + 1.0 * _Complex_I);
+    (*Out_0001) = a_0;
+    (*Out_0002) = a_1;
+    (*Out_0003) = a_2;
+    (*Out_0004) = INT64_C(3);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_KMYWDZHC1AJN_H
+#define MOD_KMYWDZHC1AJN_H
+
+#include <complex.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_inhomogeneous_1(int64_t* Out_0001, bool* Out_0002, double complex* Out_0003, int64_t* Out_0004);
+#endif // mod_kmywdzhc1ajn_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KMZ6QOI14LDQ_H
+#define MOD_KMZ6QOI14LDQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_kmz6qoi14ldq_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KNJV6YOM2RQF_H
+#define MOD_KNJV6YOM2RQF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_knjv6yom2rqf_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KNWHU27RGC03_H
+#define MOD_KNWHU27RGC03_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_add_augassign(t_ndarray x, t_ndarray y);
+#endif // mod_knwhu27rgc03_H
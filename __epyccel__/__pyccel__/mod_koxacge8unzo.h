@@ -0,0 +1,12 @@
+#ifndef MOD_KOXACGE8UNZO_H
+#define MOD_KOXACGE8UNZO_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_koxacge8unzo_H
@@ -0,0 +1,10 @@
+#include "mod_kpa9fp5d5cql.h"
+
+
+/*........................................*/
+double call_degrees(double x)
+{
+    return pyc_degrees(x);
+}
+/*........................................*/
+
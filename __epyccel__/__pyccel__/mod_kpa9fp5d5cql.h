@@ -0,0 +1,10 @@
+#ifndef MOD_KPA9FP5D5CQL_H
+#define MOD_KPA9FP5D5CQL_H
+
+#include "pyc_math_c.h"
+#include <stdlib.h>
+
+
+
+double call_degrees(double x);
+#endif // mod_kpa9fp5d5cql_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KQ6AK7KGNZLJ_H
+#define MOD_KQ6AK7KGNZLJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_kq6ak7kgnzlj_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KQ7A267JXP25_H
+#define MOD_KQ7A267JXP25_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_kq7a267jxp25_H
@@ -0,0 +1,28 @@
+#include "mod_kr1t5q7adkae.h"
+
+
+/*........................................*/
+float mult_on_array_float32(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    float Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    array_fill((float)1.0f, a);
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    {
+        float* restrict a_data = a.nd_float;
+        float* restrict b_data = b.nd_float;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            b_data[i] = a_data[i] * INT64_C(2);
+        }
+    }
+    Out_0001 = b.nd_float[INT64_C(0)];
+    free_array(&a);
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
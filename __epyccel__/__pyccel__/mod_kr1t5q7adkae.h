@@ -0,0 +1,11 @@
+#ifndef MOD_KR1T5Q7ADKAE_H
+#define MOD_KR1T5Q7ADKAE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float mult_on_array_float32(void);
+#endif // mod_kr1t5q7adkae_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_KR1T5Q7ADKAE_WRAPPER
+
+#include "mod_kr1t5q7adkae_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* mult_on_array_float32_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    float Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = mult_on_array_float32();
+    Out_0001_obj = Float_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_kr1t5q7adkae_methods[] = {
+    {
+        "mult_on_array_float32",
+        (PyCFunction)mult_on_array_float32_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_kr1t5q7adkae_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_kr1t5q7adkae",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_kr1t5q7adkae_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_kr1t5q7adkae(void)
+{
+    PyObject* mod;
+    static void* Pymod_kr1t5q7adkae_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_kr1t5q7adkae_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_kr1t5q7adkae_API, "mod_kr1t5q7adkae._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
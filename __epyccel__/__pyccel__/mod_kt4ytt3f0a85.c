@@ -0,0 +1,10 @@
+#include "mod_kt4ytt3f0a85.h"
+
+
+/*........................................*/
+double gamma_call(double x)
+{
+    return tgamma(x);
+}
+/*........................................*/
+
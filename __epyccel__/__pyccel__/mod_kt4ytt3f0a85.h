@@ -0,0 +1,10 @@
+#ifndef MOD_KT4YTT3F0A85_H
+#define MOD_KT4YTT3F0A85_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double gamma_call(double x);
+#endif // mod_kt4ytt3f0a85_H
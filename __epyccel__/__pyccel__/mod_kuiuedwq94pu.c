@@ -0,0 +1,12 @@
+#include "mod_kuiuedwq94pu.h"
+
+
+/*........................................*/
+double fabs_return_type(int64_t x)
+{
+    double a;
+    a = fabs((double)(x));
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_KUIUEDWQ94PU_H
+#define MOD_KUIUEDWQ94PU_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double fabs_return_type(int64_t x);
+#endif // mod_kuiuedwq94pu_H
@@ -0,0 +1,10 @@
+#include "mod_kx2xe04k6ew9.h"
+
+
+/*........................................*/
+double cosh_call_r(double x)
+{
+    return cosh(x);
+}
+/*........................................*/
+
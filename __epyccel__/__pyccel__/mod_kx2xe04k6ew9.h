@@ -0,0 +1,10 @@
+#ifndef MOD_KX2XE04K6EW9_H
+#define MOD_KX2XE04K6EW9_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double cosh_call_r(double x);
+#endif // mod_kx2xe04k6ew9_H
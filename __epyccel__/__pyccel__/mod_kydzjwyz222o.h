@@ -0,0 +1,11 @@
+#ifndef MOD_KYDZJWYZ222O_H
+#define MOD_KYDZJWYZ222O_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_sub(t_ndarray x, int64_t a);
+#endif // mod_kydzjwyz222o_H
@@ -0,0 +1,10 @@
+#include "mod_kyo8zcos5zlh.h"
+
+
+/*........................................*/
+int64_t call_lcm(int64_t x, int64_t y)
+{
+    return (int64_t)pyc_lcm(x, y);
+}
+/*........................................*/
+
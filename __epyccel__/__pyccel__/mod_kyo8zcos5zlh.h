@@ -0,0 +1,11 @@
+#ifndef MOD_KYO8ZCOS5ZLH_H
+#define MOD_KYO8ZCOS5ZLH_H
+
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t call_lcm(int64_t x, int64_t y);
+#endif // mod_kyo8zcos5zlh_H
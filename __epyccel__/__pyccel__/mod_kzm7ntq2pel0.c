@@ -0,0 +1,44 @@
+#include "mod_kzm7ntq2pel0.h"
+
+
+/*........................................*/
+void array_int_1d_scalar_add_0000(t_ndarray x, int8_t a, int64_t x_len)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x_len; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int8, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void array_int_1d_scalar_add_0001(t_ndarray x, int16_t a, int64_t x_len)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x_len; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int16, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void array_int_1d_scalar_add_0002(t_ndarray x, int32_t a, int64_t x_len)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x_len; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int32, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void array_int_1d_scalar_add_0003(t_ndarray x, int64_t a, int64_t x_len)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x_len; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i) += a;
+    }
+}
+/*........................................*/
+
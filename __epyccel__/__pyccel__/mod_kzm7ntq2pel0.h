@@ -0,0 +1,14 @@
+#ifndef MOD_KZM7NTQ2PEL0_H
+#define MOD_KZM7NTQ2PEL0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_add_0000(t_ndarray x, int8_t a, int64_t x_len);
+void array_int_1d_scalar_add_0001(t_ndarray x, int16_t a, int64_t x_len);
+void array_int_1d_scalar_add_0002(t_ndarray x, int32_t a, int64_t x_len);
+void array_int_1d_scalar_add_0003(t_ndarray x, int64_t a, int64_t x_len);
+#endif // mod_kzm7ntq2pel0_H
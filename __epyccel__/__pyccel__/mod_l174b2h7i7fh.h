@@ -0,0 +1,11 @@
+#ifndef MOD_L174B2H7I7FH_H
+#define MOD_L174B2H7I7FH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_sub(t_ndarray x, int64_t a);
+#endif // mod_l174b2h7i7fh_H
@@ -0,0 +1,12 @@
+#ifndef MOD_L20HI7H0KIG9_H
+#define MOD_L20HI7H0KIG9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_like_shape_F(int64_t n, int64_t m, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_l20hi7h0kig9_H
@@ -0,0 +1,12 @@
+#ifndef MOD_L2XCD9CFLDHI_H
+#define MOD_L2XCD9CFLDHI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_like_val_int(void);
+#endif // mod_l2xcd9cfldhi_H
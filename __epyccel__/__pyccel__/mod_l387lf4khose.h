@@ -0,0 +1,12 @@
+#ifndef MOD_L387LF4KHOSE_H
+#define MOD_L387LF4KHOSE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int32_t create_zeros_like_val_int32(void);
+#endif // mod_l387lf4khose_H
@@ -0,0 +1,11 @@
+#ifndef MOD_L5O7N5S45UU0_H
+#define MOD_L5O7N5S45UU0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_mixorder(t_ndarray A, t_ndarray B, t_ndarray out);
+#endif // mod_l5o7n5s45uu0_H
@@ -0,0 +1,12 @@
+#include "mod_l62mzydfnv87.h"
+
+
+/*........................................*/
+double copysign_return_type(double x, int64_t y)
+{
+    double a;
+    a = copysign(x, (double)(y));
+    return a;
+}
+/*........................................*/
+
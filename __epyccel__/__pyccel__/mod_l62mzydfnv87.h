@@ -0,0 +1,11 @@
+#ifndef MOD_L62MZYDFNV87_H
+#define MOD_L62MZYDFNV87_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double copysign_return_type(double x, int64_t y);
+#endif // mod_l62mzydfnv87_H
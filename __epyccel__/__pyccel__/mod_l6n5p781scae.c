@@ -0,0 +1,10 @@
+#include "mod_l6n5p781scae.h"
+
+
+/*........................................*/
+double fabs_call_r(double x)
+{
+    return fabs(x);
+}
+/*........................................*/
+
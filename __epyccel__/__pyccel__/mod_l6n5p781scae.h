@@ -0,0 +1,10 @@
+#ifndef MOD_L6N5P781SCAE_H
+#define MOD_L6N5P781SCAE_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double fabs_call_r(double x);
+#endif // mod_l6n5p781scae_H
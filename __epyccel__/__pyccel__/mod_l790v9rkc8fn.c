@@ -0,0 +1,34 @@
+#include "mod_l790v9rkc8fn.h"
+
+
+/*........................................*/
+/*____________________________________*/
+/* ones(shape, dtype=float, order='C') */
+/*                                     */
+/*_____________________________________*/
+double complex array_kwargs_ones(void)
+{
+    int64_t n;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    double complex Out_0001;
+    n = INT64_C(4);
+    a = array_create(2, (int64_t[]){n, n - INT64_C(1)}, nd_double, false, order_c);
+    array_fill((double)1.0, a);
+    b = array_create(2, (int64_t[]){n + INT64_C(1), INT64_C(2) * n}, nd_double, false, order_f);
+    array_fill((double)1.0, b);
+    c = array_create(2, (int64_t[]){INT64_C(1), n}, nd_cdouble, false, order_c);
+    array_fill((double complex)(1.0 + 0.0 * _Complex_I), c);
+    d = array_create(1, (int64_t[]){INT64_C(2) + n}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(1), d);
+    Out_0001 = numpy_sum_float64(a) + numpy_sum_float64(b) + numpy_sum_complex128(c) + numpy_sum_int64(d);
+    free_array(&c);
+    free_array(&b);
+    free_array(&d);
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_L790V9RKC8FN_H
+#define MOD_L790V9RKC8FN_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex array_kwargs_ones(void);
+#endif // mod_l790v9rkc8fn_H
@@ -0,0 +1,40 @@
+#ifndef MOD_L790V9RKC8FN_WRAPPER_H
+#define MOD_L790V9RKC8FN_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_l790v9rkc8fn.h"
+
+
+#ifdef MOD_L790V9RKC8FN_WRAPPER
+
+
+#else
+
+static void** Pymod_l790v9rkc8fn_API;
+
+
+/*........................................*/
+static int mod_l790v9rkc8fn_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_l790v9rkc8fn_API = (void**)PyCapsule_Import("mod_l790v9rkc8fn._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_l790v9rkc8fn_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_L790V9RKC8FN_WRAPPER_H
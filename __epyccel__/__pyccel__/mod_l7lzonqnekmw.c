@@ -0,0 +1,16 @@
+#include "mod_l7lzonqnekmw.h"
+
+
+/*........................................*/
+int64_t create_zeros_val_int(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), a);
+    Out_0001 = a.nd_int64[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
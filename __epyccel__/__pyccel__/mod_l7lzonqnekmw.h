@@ -0,0 +1,11 @@
+#ifndef MOD_L7LZONQNEKMW_H
+#define MOD_L7LZONQNEKMW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_zeros_val_int(void);
+#endif // mod_l7lzonqnekmw_H
@@ -0,0 +1,23 @@
+#include "mod_l8o7e0zi2blp.h"
+
+
+/*........................................*/
+int64_t omp_arraysum_single(t_ndarray x)
+{
+    int64_t i;
+    int64_t func_result;
+    func_result = INT64_C(0);
+    #pragma omp parallel
+    {
+        #pragma omp single
+        {
+            for (i = INT64_C(0); i < INT64_C(10); i += INT64_C(1))
+            {
+                func_result += GET_ELEMENT(x, nd_int64, i);
+            }
+        }
+    }
+    return func_result;
+}
+/*........................................*/
+
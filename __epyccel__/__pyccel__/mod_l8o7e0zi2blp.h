@@ -0,0 +1,11 @@
+#ifndef MOD_L8O7E0ZI2BLP_H
+#define MOD_L8O7E0ZI2BLP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_single(t_ndarray x);
+#endif // mod_l8o7e0zi2blp_H
@@ -0,0 +1,12 @@
+#ifndef MOD_LBERWYNRQ2UE_H
+#define MOD_LBERWYNRQ2UE_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_zeros_val_complex(void);
+#endif // mod_lberwynrq2ue_H
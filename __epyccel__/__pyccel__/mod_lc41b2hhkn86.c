@@ -0,0 +1,172 @@
+#include "mod_lc41b2hhkn86.h"
+
+
+/*........................................*/
+t_ndarray return_array_arg_array_op_0000(t_ndarray a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_int8, i);
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0001(t_ndarray a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_int16, i);
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0002(t_ndarray a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_int32, i);
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0003(t_ndarray a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_int64, i);
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0004(t_ndarray a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_float, i);
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0005(t_ndarray a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_double, i);
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0006(t_ndarray a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_cdouble, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double complex* restrict Out_0001_data = Out_0001.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_cfloat, i);
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0007(t_ndarray a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    x = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_cdouble, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double complex* restrict Out_0001_data = Out_0001.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_cdouble, i);
+        }
+    }
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+
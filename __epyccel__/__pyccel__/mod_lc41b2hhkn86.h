@@ -0,0 +1,19 @@
+#ifndef MOD_LC41B2HHKN86_H
+#define MOD_LC41B2HHKN86_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray return_array_arg_array_op_0000(t_ndarray a);
+t_ndarray return_array_arg_array_op_0001(t_ndarray a);
+t_ndarray return_array_arg_array_op_0002(t_ndarray a);
+t_ndarray return_array_arg_array_op_0003(t_ndarray a);
+t_ndarray return_array_arg_array_op_0004(t_ndarray a);
+t_ndarray return_array_arg_array_op_0005(t_ndarray a);
+t_ndarray return_array_arg_array_op_0006(t_ndarray a);
+t_ndarray return_array_arg_array_op_0007(t_ndarray a);
+#endif // mod_lc41b2hhkn86_H
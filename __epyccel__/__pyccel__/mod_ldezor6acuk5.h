@@ -0,0 +1,13 @@
+#ifndef MOD_LDEZOR6ACUK5_H
+#define MOD_LDEZOR6ACUK5_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_full_like_val_real_complex128_auto(double val);
+#endif // mod_ldezor6acuk5_H
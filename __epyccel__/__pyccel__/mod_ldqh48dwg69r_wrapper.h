@@ -0,0 +1,40 @@
+#ifndef MOD_LDQH48DWG69R_WRAPPER_H
+#define MOD_LDQH48DWG69R_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ldqh48dwg69r.h"
+
+
+#ifdef MOD_LDQH48DWG69R_WRAPPER
+
+
+#else
+
+static void** Pymod_ldqh48dwg69r_API;
+
+
+/*........................................*/
+static int mod_ldqh48dwg69r_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ldqh48dwg69r_API = (void**)PyCapsule_Import("mod_ldqh48dwg69r._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ldqh48dwg69r_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_LDQH48DWG69R_WRAPPER_H
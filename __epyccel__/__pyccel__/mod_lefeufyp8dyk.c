@@ -0,0 +1,22 @@
+#include "mod_lefeufyp8dyk.h"
+
+
+/*........................................*/
+int64_t ackermann(int64_t m, int64_t n)
+{
+    int64_t Out_0001;
+    if (m == INT64_C(0))
+    {
+        return n + INT64_C(1);
+    }
+    else if (n == INT64_C(0))
+    {
+        return ackermann(m - INT64_C(1), INT64_C(1));
+    }
+    else
+    {
+        return ackermann(m - INT64_C(1), ackermann(m, n - INT64_C(1)));
+    }
+}
+/*........................................*/
+
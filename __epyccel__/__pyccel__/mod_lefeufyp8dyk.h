@@ -0,0 +1,10 @@
+#ifndef MOD_LEFEUFYP8DYK_H
+#define MOD_LEFEUFYP8DYK_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t ackermann(int64_t m, int64_t n);
+#endif // mod_lefeufyp8dyk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_LEWE5USFU6A8_H
+#define MOD_LEWE5USFU6A8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_add(t_ndarray x, double a);
+#endif // mod_lewe5usfu6a8_H
@@ -0,0 +1,12 @@
+#ifndef MOD_LFNEWTUCUORL_H
+#define MOD_LFNEWTUCUORL_H
+
+#include <math.h>
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t fizzbuzz_sum_with_continue(int64_t fizz, int64_t buzz, int64_t max_val);
+#endif // mod_lfnewtucuorl_H
@@ -0,0 +1,11 @@
+#ifndef MOD_LGGCUN6N8G79_H
+#define MOD_LGGCUN6N8G79_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_1D_1(t_ndarray a);
+#endif // mod_lggcun6n8g79_H
@@ -0,0 +1,12 @@
+#include "mod_lh9y9sfo40tq.h"
+
+
+/*........................................*/
+double log_phrase(double x, double y)
+{
+    double a;
+    a = log(x) + log(y);
+    return a;
+}
+/*........................................*/
+
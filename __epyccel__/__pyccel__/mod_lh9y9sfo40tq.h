@@ -0,0 +1,10 @@
+#ifndef MOD_LH9Y9SFO40TQ_H
+#define MOD_LH9Y9SFO40TQ_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log_phrase(double x, double y);
+#endif // mod_lh9y9sfo40tq_H
@@ -0,0 +1,25 @@
+#include "mod_lhgur60kxgjz.h"
+
+
+/*........................................*/
+int32_t test_omp_get_set_schedule(void)
+{
+    int32_t Dummy_0000;
+    int32_t chunk_size;
+    int64_t i;
+    int32_t func_result;
+    func_result = 0;
+    #pragma omp parallel private(i)
+    {
+        omp_set_schedule(2, 3);
+        omp_get_schedule(&Dummy_0000, &chunk_size);
+        #pragma omp for schedule(runtime) reduction(+: func_result) nowait
+        for (i = INT64_C(0); i < INT64_C(16); i += INT64_C(1))
+        {
+            func_result = func_result + chunk_size;
+        }
+    }
+    return func_result;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_LHGUR60KXGJZ_H
+#define MOD_LHGUR60KXGJZ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_set_schedule(void);
+#endif // mod_lhgur60kxgjz_H
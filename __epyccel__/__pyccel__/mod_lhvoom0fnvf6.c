@@ -0,0 +1,20 @@
+#include "mod_lhvoom0fnvf6.h"
+
+
+/*........................................*/
+int64_t f(void)
+{
+    int64_t Dummy_0000;
+    int64_t Dummy_0001;
+    int64_t Dummy_0002;
+    int64_t Dummy_0003;
+    int64_t a;
+    Dummy_0002 = INT64_C(2);
+    Dummy_0003 = INT64_C(5);
+    Dummy_0000 = (Dummy_0002 + Dummy_0003 + INT64_C(3));
+    Dummy_0001 = INT64_C(4);
+    a = Dummy_0000 + Dummy_0001;
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_LHVOOM0FNVF6_H
+#define MOD_LHVOOM0FNVF6_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(void);
+#endif // mod_lhvoom0fnvf6_H
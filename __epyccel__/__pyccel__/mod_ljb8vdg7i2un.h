@@ -0,0 +1,12 @@
+#ifndef MOD_LJB8VDG7I2UN_H
+#define MOD_LJB8VDG7I2UN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuples_mul_homogeneous(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_ljb8vdg7i2un_H
@@ -0,0 +1,12 @@
+#ifndef MOD_LJJ7DAZE9FDP_H
+#define MOD_LJJ7DAZE9FDP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_2_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_ljj7daze9fdp_H
@@ -0,0 +1,12 @@
+#include "mod_lknir3r74lnm.h"
+
+
+/*........................................*/
+double fabs_phrase_r_r(double x, double y)
+{
+    double a;
+    a = fabs(x) * fabs(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_LKNIR3R74LNM_H
+#define MOD_LKNIR3R74LNM_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double fabs_phrase_r_r(double x, double y);
+#endif // mod_lknir3r74lnm_H
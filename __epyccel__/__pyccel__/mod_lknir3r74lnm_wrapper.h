@@ -0,0 +1,40 @@
+#ifndef MOD_LKNIR3R74LNM_WRAPPER_H
+#define MOD_LKNIR3R74LNM_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_lknir3r74lnm.h"
+
+
+#ifdef MOD_LKNIR3R74LNM_WRAPPER
+
+
+#else
+
+static void** Pymod_lknir3r74lnm_API;
+
+
+/*........................................*/
+static int mod_lknir3r74lnm_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_lknir3r74lnm_API = (void**)PyCapsule_Import("mod_lknir3r74lnm._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_lknir3r74lnm_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_LKNIR3R74LNM_WRAPPER_H
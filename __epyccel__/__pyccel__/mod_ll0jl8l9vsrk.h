@@ -0,0 +1,12 @@
+#ifndef MOD_LL0JL8L9VSRK_H
+#define MOD_LL0JL8L9VSRK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_multiple_negative_index_2(int64_t c, int64_t d, double* x, int64_t* y);
+#endif // mod_ll0jl8l9vsrk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_LM0YQZ1BSUK0_H
+#define MOD_LM0YQZ1BSUK0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_1(t_ndarray a, t_ndarray b);
+#endif // mod_lm0yqz1bsuk0_H
@@ -0,0 +1,12 @@
+#ifndef MOD_LO3ZPDECHXEJ_H
+#define MOD_LO3ZPDECHXEJ_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_lo3zpdechxej_H
@@ -0,0 +1,12 @@
+#ifndef MOD_LOH6YT0XM8AU_H
+#define MOD_LOH6YT0XM8AU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t arrs_2d_similar_shapes_0(int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_loh6yt0xm8au_H
@@ -0,0 +1,12 @@
+#include "mod_loldzlcsv3z2.h"
+
+
+/*........................................*/
+double arctan_phrase(double x, double y)
+{
+    double a;
+    a = atan(x) + atan(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_LOLDZLCSV3Z2_H
+#define MOD_LOLDZLCSV3Z2_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double arctan_phrase(double x, double y);
+#endif // mod_loldzlcsv3z2_H
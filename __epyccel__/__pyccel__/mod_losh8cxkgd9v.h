@@ -0,0 +1,11 @@
+#ifndef MOD_LOSH8CXKGD9V_H
+#define MOD_LOSH8CXKGD9V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_full_1_val(void);
+#endif // mod_losh8cxkgd9v_H
@@ -0,0 +1,10 @@
+#include "mod_lpqw1yrw39ap.h"
+
+
+/*........................................*/
+double complex tan_call(double complex x)
+{
+    return ctan(x);
+}
+/*........................................*/
+
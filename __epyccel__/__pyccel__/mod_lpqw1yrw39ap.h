@@ -0,0 +1,10 @@
+#ifndef MOD_LPQW1YRW39AP_H
+#define MOD_LPQW1YRW39AP_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex tan_call(double complex x);
+#endif // mod_lpqw1yrw39ap_H
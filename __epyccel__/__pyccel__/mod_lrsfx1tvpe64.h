@@ -0,0 +1,11 @@
+#ifndef MOD_LRSFX1TVPE64_H
+#define MOD_LRSFX1TVPE64_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_div_stack_array(void);
+#endif // mod_lrsfx1tvpe64_H
@@ -0,0 +1,22 @@
+#include "mod_lt0txp71q2rx.h"
+
+
+/*........................................*/
+int64_t omp_taskloop(int64_t n)
+{
+    int64_t i;
+    int64_t func_result;
+    func_result = INT64_C(0);
+    #pragma omp parallel num_threads(n)
+    {
+        #pragma omp taskloop
+        for (i = INT64_C(0); i < INT64_C(10); i += INT64_C(1))
+        {
+            #pragma omp atomic
+            func_result = func_result + INT64_C(1);
+        }
+    }
+    return func_result;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_LT0TXP71Q2RX_H
+#define MOD_LT0TXP71Q2RX_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_taskloop(int64_t n);
+#endif // mod_lt0txp71q2rx_H
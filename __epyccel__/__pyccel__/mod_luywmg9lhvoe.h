@@ -0,0 +1,11 @@
+#ifndef MOD_LUYWMG9LHVOE_H
+#define MOD_LUYWMG9LHVOE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_mul(t_ndarray x, int64_t a);
+#endif // mod_luywmg9lhvoe_H
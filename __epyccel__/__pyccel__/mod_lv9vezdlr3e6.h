@@ -0,0 +1,11 @@
+#ifndef MOD_LV9VEZDLR3E6_H
+#define MOD_LV9VEZDLR3E6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f(int64_t n);
+#endif // mod_lv9vezdlr3e6_H
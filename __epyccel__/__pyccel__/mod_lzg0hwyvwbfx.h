@@ -0,0 +1,11 @@
+#ifndef MOD_LZG0HWYVWBFX_H
+#define MOD_LZG0HWYVWBFX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_zeros_1_val(void);
+#endif // mod_lzg0hwyvwbfx_H
@@ -0,0 +1,13 @@
+#ifndef MOD_LZOD20DPLE9G_H
+#define MOD_LZOD20DPLE9G_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_empty_like_val_complex_auto(void);
+#endif // mod_lzod20dple9g_H
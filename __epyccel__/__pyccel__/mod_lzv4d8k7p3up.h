@@ -0,0 +1,11 @@
+#ifndef MOD_LZV4D8K7P3UP_H
+#define MOD_LZV4D8K7P3UP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_lzv4d8k7p3up_H
@@ -0,0 +1,10 @@
+#ifndef MOD_M0IU5QDF4YF7_H
+#define MOD_M0IU5QDF4YF7_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t factorial(int64_t n);
+#endif // mod_m0iu5qdf4yf7_H
@@ -0,0 +1,12 @@
+#ifndef MOD_M112ED90ORRU_H
+#define MOD_M112ED90ORRU_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_5(int64_t* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_m112ed90orru_H
@@ -0,0 +1,12 @@
+#ifndef MOD_M289U4G5BYJO_H
+#define MOD_M289U4G5BYJO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_shape_1d(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_m289u4g5byjo_H
@@ -0,0 +1,11 @@
+#ifndef MOD_M2BJAK408LH1_H
+#define MOD_M2BJAK408LH1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int64_index(void);
+#endif // mod_m2bjak408lh1_H
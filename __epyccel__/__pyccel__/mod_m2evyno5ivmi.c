@@ -0,0 +1,10 @@
+#include "mod_m2evyno5ivmi.h"
+
+
+/*........................................*/
+double absolute_call_r(double x)
+{
+    return fabs(x);
+}
+/*........................................*/
+
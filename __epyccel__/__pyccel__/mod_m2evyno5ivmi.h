@@ -0,0 +1,10 @@
+#ifndef MOD_M2EVYNO5IVMI_H
+#define MOD_M2EVYNO5IVMI_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double absolute_call_r(double x);
+#endif // mod_m2evyno5ivmi_H
@@ -0,0 +1,11 @@
+#ifndef MOD_M2SXL35DW5LX_H
+#define MOD_M2SXL35DW5LX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_div(t_ndarray x, double a);
+#endif // mod_m2sxl35dw5lx_H
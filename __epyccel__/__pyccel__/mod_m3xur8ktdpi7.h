@@ -0,0 +1,11 @@
+#ifndef MOD_M3XUR8KTDPI7_H
+#define MOD_M3XUR8KTDPI7_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_m3xur8ktdpi7_H
@@ -0,0 +1,62 @@
+#include "mod_m7o0dxn2c0d1.h"
+
+
+/*........................................*/
+t_ndarray homogeneous_tuple_of_arrays(void)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    t_ndarray z = {.raw_data = NULL};
+    t_ndarray a_0 = {.raw_data = NULL};
+    t_ndarray a_1 = {.raw_data = NULL};
+    t_ndarray a_2 = {.raw_data = NULL};
+    int64_t j;
+    int64_t k;
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray Dummy_0002 = {.raw_data = NULL};
+    t_ndarray Dummy_0004 = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    x = array_create(2, (int64_t[]){INT64_C(2), INT64_C(2)}, nd_int64, false, order_f);
+    Dummy_0000 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4)};
+    memcpy(&Dummy_0000.nd_int64[INT64_C(0)], Dummy_0001, 4 * Dummy_0000.type_size);
+    array_copy_data(&x, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    y = array_create(2, (int64_t[]){INT64_C(2), INT64_C(2)}, nd_int64, false, order_f);
+    Dummy_0002 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0003[] = {INT64_C(5), INT64_C(4), INT64_C(7), INT64_C(8)};
+    memcpy(&Dummy_0002.nd_int64[INT64_C(0)], Dummy_0003, 4 * Dummy_0002.type_size);
+    array_copy_data(&y, Dummy_0002, 0);
+    free_array(&Dummy_0002);
+    z = array_create(2, (int64_t[]){INT64_C(2), INT64_C(2)}, nd_int64, false, order_f);
+    Dummy_0004 = array_create(2, (int64_t[]){INT64_C(2), INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0005[] = {INT64_C(9), INT64_C(10), INT64_C(11), INT64_C(12)};
+    memcpy(&Dummy_0004.nd_int64[INT64_C(0)], Dummy_0005, 4 * Dummy_0004.type_size);
+    array_copy_data(&z, Dummy_0004, 0);
+    free_array(&Dummy_0004);
+    alias_assign(&a_0, x);
+    alias_assign(&a_1, y);
+    alias_assign(&a_2, z);
+    b = array_create(3, (int64_t[]){INT64_C(3), INT64_C(2), INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict b_data = b.nd_double;
+        for (j = INT64_C(0); j < INT64_C(2); j += INT64_C(1))
+        {
+            for (k = INT64_C(0); k < INT64_C(2); k += INT64_C(1))
+            {
+                b_data[j * b.shape[INT64_C(2)] + k] = a_0.nd_int64[k * a_0.shape[INT64_C(0)] + j];
+                b_data[(b.shape[INT64_C(1)] + j) * b.shape[INT64_C(2)] + k] = a_1.nd_int64[k * a_1.shape[INT64_C(0)] + j];
+                b_data[(INT64_C(2) * b.shape[INT64_C(1)] + j) * b.shape[INT64_C(2)] + k] = a_2.nd_int64[k * a_2.shape[INT64_C(0)] + j];
+            }
+        }
+    }
+    free_array(&x);
+    free_pointer(&a_0);
+    free_pointer(&a_2);
+    free_pointer(&a_1);
+    free_array(&z);
+    free_array(&y);
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_M7O0DXN2C0D1_H
+#define MOD_M7O0DXN2C0D1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+t_ndarray homogeneous_tuple_of_arrays(void);
+#endif // mod_m7o0dxn2c0d1_H
@@ -0,0 +1,81 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_M7O0DXN2C0D1_WRAPPER
+
+#include "mod_m7o0dxn2c0d1_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* homogeneous_tuple_of_arrays_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    b = homogeneous_tuple_of_arrays();
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_m7o0dxn2c0d1_methods[] = {
+    {
+        "homogeneous_tuple_of_arrays",
+        (PyCFunction)homogeneous_tuple_of_arrays_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_m7o0dxn2c0d1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_m7o0dxn2c0d1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_m7o0dxn2c0d1_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_m7o0dxn2c0d1(void)
+{
+    PyObject* mod;
+    static void* Pymod_m7o0dxn2c0d1_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_m7o0dxn2c0d1_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_m7o0dxn2c0d1_API, "mod_m7o0dxn2c0d1._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#include "mod_ma5ep6okjbnd.h"
+
+
+/*........................................*/
+double absolute_phrase_r_i(double x, int64_t y)
+{
+    double a;
+    a = fabs(x) * fabs((double)(y));
+    return a;
+}
+/*........................................*/
+
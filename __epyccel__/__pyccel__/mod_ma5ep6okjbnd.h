@@ -0,0 +1,11 @@
+#ifndef MOD_MA5EP6OKJBND_H
+#define MOD_MA5EP6OKJBND_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double absolute_phrase_r_i(double x, int64_t y);
+#endif // mod_ma5ep6okjbnd_H
@@ -0,0 +1,11 @@
+#ifndef MOD_MEH15L1TUO09_H
+#define MOD_MEH15L1TUO09_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray create_float_array_tuple_ref(t_ndarray a);
+#endif // mod_meh15l1tuo09_H
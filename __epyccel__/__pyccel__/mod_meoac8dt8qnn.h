@@ -0,0 +1,11 @@
+#ifndef MOD_MEOAC8DT8QNN_H
+#define MOD_MEOAC8DT8QNN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void matvec(t_ndarray a, t_ndarray x, t_ndarray y);
+#endif // mod_meoac8dt8qnn_H
@@ -0,0 +1,16 @@
+#include "mod_mga8flsy2cwj.h"
+
+
+/*........................................*/
+int64_t tmplt_2_0000(int64_t x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+double tmplt_2_0001(double x, double y)
+{
+    return x + y;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_MGA8FLSY2CWJ_H
+#define MOD_MGA8FLSY2CWJ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tmplt_2_0000(int64_t x, int64_t y);
+double tmplt_2_0001(double x, double y);
+#endif // mod_mga8flsy2cwj_H
@@ -0,0 +1,13 @@
+#ifndef MOD_MH0YW6LDDKNN_H
+#define MOD_MH0YW6LDDKNN_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_empty_like_val_complex128(void);
+#endif // mod_mh0yw6lddknn_H
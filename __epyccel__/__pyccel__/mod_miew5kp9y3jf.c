@@ -0,0 +1,12 @@
+#include "mod_miew5kp9y3jf.h"
+
+
+/*........................................*/
+double atan2_phrase(double x, double y, double z)
+{
+    double a;
+    a = atan2(x, y) + atan2(y, z);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_MIEW5KP9Y3JF_H
+#define MOD_MIEW5KP9Y3JF_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double atan2_phrase(double x, double y, double z);
+#endif // mod_miew5kp9y3jf_H
@@ -0,0 +1,12 @@
+#include "mod_ml2rornxrvqw.h"
+
+
+/*........................................*/
+int64_t test_size_2d(t_ndarray f)
+{
+    int64_t Out_0001;
+    Out_0001 = f.length;
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_ML2RORNXRVQW_H
+#define MOD_ML2RORNXRVQW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_size_2d(t_ndarray f);
+#endif // mod_ml2rornxrvqw_H
@@ -0,0 +1,11 @@
+#ifndef MOD_MM1SJLGUIE50_H
+#define MOD_MM1SJLGUIE50_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_1(void);
+#endif // mod_mm1sjlguie50_H
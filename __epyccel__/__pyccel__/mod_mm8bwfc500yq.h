@@ -0,0 +1,12 @@
+#ifndef MOD_MM8BWFC500YQ_H
+#define MOD_MM8BWFC500YQ_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_mm8bwfc500yq_H
@@ -0,0 +1,20 @@
+#include "mod_mnyz7i1contn.h"
+
+
+/*........................................*/
+int64_t create_full_arg_names(double val, double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006)
+{
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_double, false, order_c);
+    array_fill(val, a);
+    (*Out_0001) = a.nd_double[INT64_C(0)];
+    (*Out_0002) = a.nd_double[INT64_C(1)];
+    (*Out_0003) = a.nd_double[INT64_C(2)];
+    (*Out_0004) = a.nd_double[a.shape[INT64_C(1)]];
+    (*Out_0005) = a.nd_double[a.shape[INT64_C(1)] + INT64_C(1)];
+    (*Out_0006) = a.nd_double[a.shape[INT64_C(1)] + INT64_C(2)];
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_MNYZ7I1CONTN_H
+#define MOD_MNYZ7I1CONTN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_full_arg_names(double val, double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006);
+#endif // mod_mnyz7i1contn_H
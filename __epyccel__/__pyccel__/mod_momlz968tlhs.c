@@ -0,0 +1,12 @@
+#include "mod_momlz968tlhs.h"
+
+
+/*........................................*/
+double exp_phrase_i_r(int64_t x, double y)
+{
+    double a;
+    a = exp((double)(x)) + exp(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_MOMLZ968TLHS_H
+#define MOD_MOMLZ968TLHS_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double exp_phrase_i_r(int64_t x, double y);
+#endif // mod_momlz968tlhs_H
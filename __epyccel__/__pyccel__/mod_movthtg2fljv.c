@@ -0,0 +1,10 @@
+#include "mod_movthtg2fljv.h"
+
+
+/*........................................*/
+double tanh_call_i(int64_t x)
+{
+    return tanh((double)(x));
+}
+/*........................................*/
+
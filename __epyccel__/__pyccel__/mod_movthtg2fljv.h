@@ -0,0 +1,11 @@
+#ifndef MOD_MOVTHTG2FLJV_H
+#define MOD_MOVTHTG2FLJV_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double tanh_call_i(int64_t x);
+#endif // mod_movthtg2fljv_H
@@ -0,0 +1,24 @@
+module mod_mppzdvwa69b0
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine sqrt_step1(a, b, t) 
+
+    implicit none
+
+    real(f64), intent(in) :: a(0_i64:)
+    real(f64), intent(in) :: b(0_i64:)
+    real(f64), intent(inout) :: t(0_i64:)
+
+    t(:) = a * b
+
+  end subroutine sqrt_step1
+  !........................................
+
+end module mod_mppzdvwa69b0
@@ -0,0 +1,10 @@
+#ifndef MOD_MRXUU9DVFKB3_H
+#define MOD_MRXUU9DVFKB3_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t g(int64_t x, int64_t y, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_mrxuu9dvfkb3_H
@@ -0,0 +1,10 @@
+#include "mod_msvztum86ji8.h"
+
+
+/*........................................*/
+double arctan2_call(double x, double y)
+{
+    return atan2(x, y);
+}
+/*........................................*/
+
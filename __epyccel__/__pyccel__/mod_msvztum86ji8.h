@@ -0,0 +1,10 @@
+#ifndef MOD_MSVZTUM86JI8_H
+#define MOD_MSVZTUM86JI8_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double arctan2_call(double x, double y);
+#endif // mod_msvztum86ji8_H
@@ -0,0 +1,12 @@
+#ifndef MOD_MVMZTG0PWJXE_H
+#define MOD_MVMZTG0PWJXE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void mix_int_array_2_0000(t_ndarray x, int64_t a);
+void mix_int_array_2_0001(t_ndarray x, int64_t a);
+#endif // mod_mvmztg0pwjxe_H
@@ -0,0 +1,17 @@
+#include "mod_mw1kaev6v8yn.h"
+
+
+/*........................................*/
+int64_t create_full_val(double val, double* Out_0001, double* Out_0002, double* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_double, false, order_c);
+    array_fill(val, a);
+    (*Out_0001) = a.nd_double[INT64_C(0)];
+    (*Out_0002) = a.nd_double[INT64_C(1)];
+    (*Out_0003) = a.nd_double[INT64_C(2)];
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_MW1KAEV6V8YN_H
+#define MOD_MW1KAEV6V8YN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_full_val(double val, double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_mw1kaev6v8yn_H
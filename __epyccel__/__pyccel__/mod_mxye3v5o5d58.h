@@ -0,0 +1,13 @@
+#ifndef MOD_MXYE3V5O5D58_H
+#define MOD_MXYE3V5O5D58_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float complex create_full_like_val_real_complex64_auto(double val);
+#endif // mod_mxye3v5o5d58_H
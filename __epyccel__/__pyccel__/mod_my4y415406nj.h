@@ -0,0 +1,11 @@
+#ifndef MOD_MY4Y415406NJ_H
+#define MOD_MY4Y415406NJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t var_negative_index(int64_t n, int64_t idx);
+#endif // mod_my4y415406nj_H
@@ -0,0 +1,11 @@
+#ifndef MOD_N0QV3QJ4P186_H
+#define MOD_N0QV3QJ4P186_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t constant_negative_index(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_n0qv3qj4p186_H
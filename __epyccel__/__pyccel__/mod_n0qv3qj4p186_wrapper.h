@@ -0,0 +1,40 @@
+#ifndef MOD_N0QV3QJ4P186_WRAPPER_H
+#define MOD_N0QV3QJ4P186_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_n0qv3qj4p186.h"
+
+
+#ifdef MOD_N0QV3QJ4P186_WRAPPER
+
+
+#else
+
+static void** Pymod_n0qv3qj4p186_API;
+
+
+/*........................................*/
+static int mod_n0qv3qj4p186_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_n0qv3qj4p186_API = (void**)PyCapsule_Import("mod_n0qv3qj4p186._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_n0qv3qj4p186_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_N0QV3QJ4P186_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_N5IVIH0WS3FJ_H
+#define MOD_N5IVIH0WS3FJ_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_n5ivih0ws3fj_H
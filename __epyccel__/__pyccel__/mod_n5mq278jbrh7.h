@@ -0,0 +1,11 @@
+#ifndef MOD_N5MQ278JBRH7_H
+#define MOD_N5MQ278JBRH7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_inhomogeneous_have_pointers(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+#endif // mod_n5mq278jbrh7_H
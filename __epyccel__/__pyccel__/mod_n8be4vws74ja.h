@@ -0,0 +1,11 @@
+#ifndef MOD_N8BE4VWS74JA_H
+#define MOD_N8BE4VWS74JA_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_number_of_procs(void);
+#endif // mod_n8be4vws74ja_H
@@ -0,0 +1,40 @@
+#ifndef MOD_NAKO7BQA3RPR_WRAPPER_H
+#define MOD_NAKO7BQA3RPR_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_NAKO7BQA3RPR_WRAPPER
+
+int64_t bind_c_add(int64_t, int64_t);
+
+#else
+
+static void** Pymod_nako7bqa3rpr_API;
+
+
+/*........................................*/
+static int mod_nako7bqa3rpr_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_nako7bqa3rpr_API = (void**)PyCapsule_Import("mod_nako7bqa3rpr._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_nako7bqa3rpr_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_NAKO7BQA3RPR_WRAPPER_H
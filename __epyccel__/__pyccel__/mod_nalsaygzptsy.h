@@ -0,0 +1,11 @@
+#ifndef MOD_NALSAYGZPTSY_H
+#define MOD_NALSAYGZPTSY_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_number_of_procs(void);
+#endif // mod_nalsaygzptsy_H
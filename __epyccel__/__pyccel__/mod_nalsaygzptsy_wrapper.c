@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_NALSAYGZPTSY_WRAPPER
+
+#include "mod_nalsaygzptsy_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_number_of_procs_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t procs_num;
+    PyObject* procs_num_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    procs_num = test_omp_number_of_procs();
+    procs_num_obj = Int32_to_NumpyLong(&procs_num);
+    return procs_num_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_nalsaygzptsy_methods[] = {
+    {
+        "test_omp_number_of_procs",
+        (PyCFunction)test_omp_number_of_procs_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_nalsaygzptsy_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_nalsaygzptsy",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_nalsaygzptsy_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_nalsaygzptsy(void)
+{
+    PyObject* mod;
+    static void* Pymod_nalsaygzptsy_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_nalsaygzptsy_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_nalsaygzptsy_API, "mod_nalsaygzptsy._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
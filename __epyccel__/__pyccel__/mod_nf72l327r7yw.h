@@ -0,0 +1,11 @@
+#ifndef MOD_NF72L327R7YW_H
+#define MOD_NF72L327R7YW_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_nf72l327r7yw_H
@@ -0,0 +1,13 @@
+#ifndef MOD_NHVEEOZ1VT8E_H
+#define MOD_NHVEEOZ1VT8E_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray numpy_isinf_array_test(t_ndarray x);
+#endif // mod_nhveeoz1vt8e_H
@@ -0,0 +1,11 @@
+#ifndef MOD_NJ64PG6TQO5R_H
+#define MOD_NJ64PG6TQO5R_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_sub_augassign(t_ndarray x, t_ndarray y);
+#endif // mod_nj64pg6tqo5r_H
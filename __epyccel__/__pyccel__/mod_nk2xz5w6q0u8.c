@@ -0,0 +1,23 @@
+#include "mod_nk2xz5w6q0u8.h"
+
+
+/*........................................*/
+int64_t slice_is_pointer_idx_0(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(4)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 4 * a.type_size);
+    b = array_slicing(a, 1, new_slice(INT64_C(1), a.shape[INT64_C(0)], INT64_C(1), RANGE));
+    a.nd_int64[INT64_C(2)] = INT64_C(9);
+    (*Out_0001) = b.nd_int64[INT64_C(0)];
+    (*Out_0002) = b.nd_int64[INT64_C(1)];
+    (*Out_0003) = b.nd_int64[INT64_C(2)];
+    (*Out_0004) = b.shape[INT64_C(0)];
+    free_array(&a);
+    free_pointer(&b);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_NK2XZ5W6Q0U8_H
+#define MOD_NK2XZ5W6Q0U8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t slice_is_pointer_idx_0(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_nk2xz5w6q0u8_H
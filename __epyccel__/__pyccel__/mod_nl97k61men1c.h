@@ -0,0 +1,11 @@
+#ifndef MOD_NL97K61MEN1C_H
+#define MOD_NL97K61MEN1C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_nl97k61men1c_H
@@ -0,0 +1,13 @@
+#ifndef MOD_NN659LGQ991I_H
+#define MOD_NN659LGQ991I_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_mod(t_ndarray x, double a);
+#endif // mod_nn659lgq991i_H
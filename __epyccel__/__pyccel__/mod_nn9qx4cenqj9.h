@@ -0,0 +1,12 @@
+#ifndef MOD_NN9QX4CENQJ9_H
+#define MOD_NN9QX4CENQJ9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_int_2d_F_initialization(t_ndarray a);
+#endif // mod_nn9qx4cenqj9_H
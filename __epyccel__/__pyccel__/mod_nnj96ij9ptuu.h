@@ -0,0 +1,11 @@
+#ifndef MOD_NNJ96IJ9PTUU_H
+#define MOD_NNJ96IJ9PTUU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_single(t_ndarray x);
+#endif // mod_nnj96ij9ptuu_H
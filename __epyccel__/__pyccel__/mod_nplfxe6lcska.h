@@ -0,0 +1,13 @@
+#ifndef MOD_NPLFXE6LCSKA_H
+#define MOD_NPLFXE6LCSKA_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t homogeneous_tuple_math(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_nplfxe6lcska_H
@@ -0,0 +1,47 @@
+#include "mod_nqtk6ok54p86.h"
+
+
+/*........................................*/
+void test_linspace2(t_ndarray start, t_ndarray stop, t_ndarray out, bool endpoint)
+{
+    int64_t numberOfSamplesToGenerate;
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    int64_t j;
+    int64_t k;
+    int64_t i_0001;
+    int64_t i_0002;
+    int64_t i_0003;
+    numberOfSamplesToGenerate = INT64_C(7);
+    a = array_create(3, (int64_t[]){numberOfSamplesToGenerate, start.shape[INT64_C(0)], start.shape[INT64_C(1)]}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(0)]; i_0001 += INT64_C(1))
+        {
+            for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(1)]; i_0002 += INT64_C(1))
+            {
+                for (i_0003 = INT64_C(0); i_0003 < a.shape[INT64_C(2)]; i_0003 += INT64_C(1))
+                {
+                    a_data[(i_0001 * a.shape[INT64_C(1)] + i_0002) * a.shape[INT64_C(2)] + i_0003] = (GET_ELEMENT(start, nd_int64, i_0002, i_0003) + i_0001*(double)((GET_ELEMENT(stop, nd_int64, i_0002, i_0003) - GET_ELEMENT(start, nd_int64, i_0002, i_0003))) / (double)((numberOfSamplesToGenerate - (int64_t)(endpoint))));
+                    a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0002) * a.shape[INT64_C(2)] + i_0003] = endpoint ? (double)GET_ELEMENT(stop, nd_int64, i_0002, i_0003) : a_data[((numberOfSamplesToGenerate - INT64_C(1)) * a.shape[INT64_C(1)] + i_0002) * a.shape[INT64_C(2)] + i_0003];
+                }
+            }
+        }
+    }
+    {
+        double* restrict a_data_0001 = a.nd_double;
+        for (i = INT64_C(0); i < out.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (j = INT64_C(0); j < out.shape[INT64_C(1)]; j += INT64_C(1))
+            {
+                for (k = INT64_C(0); k < out.shape[INT64_C(2)]; k += INT64_C(1))
+                {
+                    GET_ELEMENT(out, nd_double, i, j, k) = a_data_0001[(i * a.shape[INT64_C(1)] + j) * a.shape[INT64_C(2)] + k];
+                }
+            }
+        }
+    }
+    free_array(&a);
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_NQTK6OK54P86_H
+#define MOD_NQTK6OK54P86_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void test_linspace2(t_ndarray start, t_ndarray stop, t_ndarray out, bool endpoint);
+#endif // mod_nqtk6ok54p86_H
@@ -0,0 +1,11 @@
+#ifndef MOD_NR4EGEDV6NNY_H
+#define MOD_NR4EGEDV6NNY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_div(t_ndarray x, int32_t a);
+#endif // mod_nr4egedv6nny_H
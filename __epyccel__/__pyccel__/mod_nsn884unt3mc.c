@@ -0,0 +1,12 @@
+#include "mod_nsn884unt3mc.h"
+
+
+/*........................................*/
+double tan_phrase_r_i(double x, int64_t y)
+{
+    double a;
+    a = tan(x) + tan((double)(y));
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_NSN884UNT3MC_H
+#define MOD_NSN884UNT3MC_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double tan_phrase_r_i(double x, int64_t y);
+#endif // mod_nsn884unt3mc_H
@@ -0,0 +1,11 @@
+#ifndef MOD_NSP3IHM9NSOZ_H
+#define MOD_NSP3IHM9NSOZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_sub(t_ndarray x, t_ndarray y);
+#endif // mod_nsp3ihm9nsoz_H
@@ -0,0 +1,12 @@
+#ifndef MOD_NSRU2TLEBMB5_H
+#define MOD_NSRU2TLEBMB5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void mix_float_array_1_0000(t_ndarray x, double a);
+void mix_float_array_1_0001(t_ndarray x, double a);
+#endif // mod_nsru2tlebmb5_H
@@ -0,0 +1,12 @@
+#ifndef MOD_NVMYYMHMOOML_H
+#define MOD_NVMYYMHMOOML_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_nvmyymhmooml_H
@@ -0,0 +1,42 @@
+#ifndef MOD_NVXIWQ5APEQY_WRAPPER_H
+#define MOD_NVXIWQ5APEQY_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_nvxiwq5apeqy.h"
+
+
+#ifdef MOD_NVXIWQ5APEQY_WRAPPER
+
+
+#else
+
+static void** Pymod_nvxiwq5apeqy_API;
+
+
+/*........................................*/
+static int mod_nvxiwq5apeqy_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_nvxiwq5apeqy_API = (void**)PyCapsule_Import("mod_nvxiwq5apeqy._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_nvxiwq5apeqy_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_NVXIWQ5APEQY_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_O0TGCW43VMDN_H
+#define MOD_O0TGCW43VMDN_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_inhomogeneous_2(int64_t* Out_0001, bool* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_o0tgcw43vmdn_H
@@ -0,0 +1,18 @@
+#include "mod_o0tksh8s1zcc.h"
+
+
+/*........................................*/
+void array_int_2d_C_scalar_idiv(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    int64_t i_0001;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < x.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_int64, i, i_0001) = (int64_t)floor((double)(GET_ELEMENT(x, nd_int64, i, i_0001)) / (double)(a));
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_O0TKSH8S1ZCC_H
+#define MOD_O0TKSH8S1ZCC_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_idiv(t_ndarray x, int64_t a);
+#endif // mod_o0tksh8s1zcc_H
@@ -0,0 +1,16 @@
+#include "mod_o1pa3nvvgzxi.h"
+
+
+/*........................................*/
+int64_t my_tuple(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006)
+{
+    (*Out_0001) = a.shape[INT64_C(0)];
+    (*Out_0002) = a.shape[INT64_C(1)];
+    (*Out_0003) = GET_ELEMENT(a, nd_int64, INT64_C(0), INT64_C(0));
+    (*Out_0004) = GET_ELEMENT(a, nd_int64, INT64_C(1), INT64_C(0));
+    (*Out_0005) = GET_ELEMENT(a, nd_int64, INT64_C(0), INT64_C(1));
+    (*Out_0006) = GET_ELEMENT(a, nd_int64, INT64_C(1), INT64_C(1));
+    return 0;
+}
+/*........................................*/
+
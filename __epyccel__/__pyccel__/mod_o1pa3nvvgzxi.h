@@ -0,0 +1,11 @@
+#ifndef MOD_O1PA3NVVGZXI_H
+#define MOD_O1PA3NVVGZXI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t my_tuple(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_o1pa3nvvgzxi_H
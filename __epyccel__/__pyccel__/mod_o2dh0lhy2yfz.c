@@ -0,0 +1,20 @@
+#include "mod_o2dh0lhy2yfz.h"
+
+
+/*........................................*/
+int64_t tuple_homogeneous_bool(bool* Out_0001, bool* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){INT64_C(2)}, nd_bool, false, order_c);
+    bool Dummy_0000[] = {0, 1};
+    memcpy(&a.nd_bool[INT64_C(0)], Dummy_0000, 2 * a.type_size);
+    i = INT64_C(1);
+    (*Out_0001) = GET_ELEMENT(a, nd_bool, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(a, nd_bool, i);
+    (*Out_0003) = INT64_C(2);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_O2DH0LHY2YFZ_H
+#define MOD_O2DH0LHY2YFZ_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_homogeneous_bool(bool* Out_0001, bool* Out_0002, int64_t* Out_0003);
+#endif // mod_o2dh0lhy2yfz_H
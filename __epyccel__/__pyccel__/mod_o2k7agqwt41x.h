@@ -0,0 +1,11 @@
+#ifndef MOD_O2K7AGQWT41X_H
+#define MOD_O2K7AGQWT41X_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_F_array_initialization_mixed(t_ndarray x, t_ndarray y, t_ndarray z, t_ndarray a);
+#endif // mod_o2k7agqwt41x_H
@@ -0,0 +1,12 @@
+#ifndef MOD_O5Q9GV41R1ER_H
+#define MOD_O5Q9GV41R1ER_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t temp_array_in_loop(t_ndarray a, t_ndarray b, t_ndarray* d1, t_ndarray* d2);
+#endif // mod_o5q9gv41r1er_H
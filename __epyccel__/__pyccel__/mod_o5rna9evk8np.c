@@ -0,0 +1,23 @@
+#include "mod_o5rna9evk8np.h"
+
+
+/*........................................*/
+int64_t tuple_homogeneous_float(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005, int64_t* Out_0006)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    double Dummy_0000[] = {1.5, 4.3, 5.2, 7.2, 9.999};
+    memcpy(&a.nd_double[INT64_C(0)], Dummy_0000, 5 * a.type_size);
+    i = INT64_C(1);
+    (*Out_0001) = GET_ELEMENT(a, nd_double, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(a, nd_double, i);
+    (*Out_0003) = GET_ELEMENT(a, nd_double, INT64_C(2));
+    (*Out_0004) = GET_ELEMENT(a, nd_double, INT64_C(3));
+    (*Out_0005) = GET_ELEMENT(a, nd_double, INT64_C(4));
+    (*Out_0006) = INT64_C(5);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_O5RNA9EVK8NP_H
+#define MOD_O5RNA9EVK8NP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_homogeneous_float(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005, int64_t* Out_0006);
+#endif // mod_o5rna9evk8np_H
@@ -0,0 +1,12 @@
+#include "mod_o5shkvjzi2pk.h"
+
+
+/*........................................*/
+bool test_omp_in_parallel1(void)
+{
+    bool in_parallel;
+    in_parallel = omp_in_parallel();
+    return in_parallel;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_O5SHKVJZI2PK_H
+#define MOD_O5SHKVJZI2PK_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_in_parallel1(void);
+#endif // mod_o5shkvjzi2pk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_O5UNNA6GS8VQ_H
+#define MOD_O5UNNA6GS8VQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double return_mult_arr_arg_element(int64_t i, t_ndarray arg);
+#endif // mod_o5unna6gs8vq_H
@@ -0,0 +1,104 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_O5UNNA6GS8VQ_WRAPPER
+
+#include "mod_o5unna6gs8vq_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_mult_arr_arg_element_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* i_obj;
+    PyObject* arg_obj;
+    int64_t i;
+    t_ndarray arg = {.raw_data = NULL};
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "i",
+        "arg",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &i_obj, &arg_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(i_obj))
+    {
+        i = PyInt64_to_Int64(i_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument i");
+        return NULL;
+    }
+    if (pyarray_check("arg", arg_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        arg = pyarray_to_ndarray(arg_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    Out_0001 = return_mult_arr_arg_element(i, arg);
+    free_pointer(&arg);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_o5unna6gs8vq_methods[] = {
+    {
+        "return_mult_arr_arg_element",
+        (PyCFunction)return_mult_arr_arg_element_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_o5unna6gs8vq_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_o5unna6gs8vq",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_o5unna6gs8vq_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_o5unna6gs8vq(void)
+{
+    PyObject* mod;
+    static void* Pymod_o5unna6gs8vq_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_o5unna6gs8vq_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_o5unna6gs8vq_API, "mod_o5unna6gs8vq._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_O6ZCZ938GT3P_H
+#define MOD_O6ZCZ938GT3P_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_kwargs_full(void);
+#endif // mod_o6zcz938gt3p_H
@@ -0,0 +1,28 @@
+#include "mod_o6zd2tcn3lxv.h"
+
+
+/*........................................*/
+int16_t mult_on_array_int16(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int16_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    array_fill((int16_t)1, a);
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    {
+        int16_t* restrict a_data = a.nd_int16;
+        int16_t* restrict b_data = b.nd_int16;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            b_data[i] = a_data[i] * INT64_C(2);
+        }
+    }
+    Out_0001 = b.nd_int16[INT64_C(0)];
+    free_array(&a);
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
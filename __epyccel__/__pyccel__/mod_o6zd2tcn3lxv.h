@@ -0,0 +1,11 @@
+#ifndef MOD_O6ZD2TCN3LXV_H
+#define MOD_O6ZD2TCN3LXV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int16_t mult_on_array_int16(void);
+#endif // mod_o6zd2tcn3lxv_H
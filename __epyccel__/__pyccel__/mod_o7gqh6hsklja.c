@@ -0,0 +1,16 @@
+#include "mod_o7gqh6hsklja.h"
+
+
+/*........................................*/
+int32_t create_full_val_real_int32(double val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int32_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int32, false, order_c);
+    array_fill((int32_t)(val), a);
+    Out_0001 = a.nd_int32[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_O7GQH6HSKLJA_H
+#define MOD_O7GQH6HSKLJA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t create_full_val_real_int32(double val);
+#endif // mod_o7gqh6hsklja_H
@@ -0,0 +1,12 @@
+#ifndef MOD_O7XYUB8HI408_H
+#define MOD_O7XYUB8HI408_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_shape_2d(int64_t n, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_o7xyub8hi408_H
@@ -0,0 +1,11 @@
+#ifndef MOD_O833CE569L7O_H
+#define MOD_O833CE569L7O_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_o833ce569l7o_H
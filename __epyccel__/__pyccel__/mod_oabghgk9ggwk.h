@@ -0,0 +1,11 @@
+#ifndef MOD_OABGHGK9GGWK_H
+#define MOD_OABGHGK9GGWK_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_mul_inhomogeneous(int64_t* Out_0001, bool* Out_0002, int64_t* Out_0003, bool* Out_0004, int64_t* Out_0005, bool* Out_0006);
+#endif // mod_oabghgk9ggwk_H
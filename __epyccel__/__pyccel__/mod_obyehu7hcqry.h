@@ -0,0 +1,11 @@
+#ifndef MOD_OBYEHU7HCQRY_H
+#define MOD_OBYEHU7HCQRY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_shape_1d(t_ndarray f);
+#endif // mod_obyehu7hcqry_H
@@ -0,0 +1,10 @@
+#include "mod_oc6ea4uwb0p4.h"
+
+
+/*........................................*/
+int64_t absolute_call_i(int64_t x)
+{
+    return fabs((double)(x));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_OC6EA4UWB0P4_H
+#define MOD_OC6EA4UWB0P4_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t absolute_call_i(int64_t x);
+#endif // mod_oc6ea4uwb0p4_H
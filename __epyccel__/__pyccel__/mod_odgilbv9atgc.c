@@ -0,0 +1,43 @@
+#include "mod_odgilbv9atgc.h"
+
+
+/*........................................*/
+int64_t f3(t_ndarray x, int64_t* n, int64_t* m, int64_t* p, double* Out_0001, double* Out_0002, double* Out_0003)
+{
+    t_ndarray y = {.raw_data = NULL};
+    t_ndarray z = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    (*n) = x.shape[INT64_C(0)];
+    (*m) = x.shape[INT64_C(1)];
+    (*p) = x.shape[INT64_C(2)];
+    y = array_create(3, (int64_t[]){(*p), (*m), (*n)}, nd_double, false, order_c);
+    array_fill((double)1.0, y);
+    z = array_create(3, (int64_t[]){x.shape[INT64_C(2)], x.shape[INT64_C(1)], x.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        double* restrict z_data = z.nd_double;
+        for (i = INT64_C(0); i < z.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < z.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                for (i_0002 = INT64_C(0); i_0002 < z.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+                {
+                    z_data[(i * z.shape[INT64_C(1)] + i_0001) * z.shape[INT64_C(2)] + i_0002] = GET_ELEMENT(x, nd_int64, i_0002, i_0001, i) + y_data[(i * y.shape[INT64_C(1)] + i_0001) * y.shape[INT64_C(2)] + i_0002];
+                }
+            }
+        }
+    }
+    (*n) = z.shape[INT64_C(0)];
+    (*m) = z.shape[INT64_C(1)];
+    (*p) = z.shape[INT64_C(2)];
+    (*Out_0001) = z.nd_double[(z.shape[INT64_C(1)] - INT64_C(1)) * z.shape[INT64_C(2)]];
+    (*Out_0002) = z.nd_double[z.shape[INT64_C(2)] - INT64_C(1)];
+    (*Out_0003) = z.nd_double[((z.shape[INT64_C(0)] - INT64_C(1)) * z.shape[INT64_C(1)] + (z.shape[INT64_C(1)] - INT64_C(1))) * z.shape[INT64_C(2)]];
+    free_array(&z);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+
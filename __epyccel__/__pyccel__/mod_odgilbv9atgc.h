@@ -0,0 +1,11 @@
+#ifndef MOD_ODGILBV9ATGC_H
+#define MOD_ODGILBV9ATGC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f3(t_ndarray x, int64_t* n, int64_t* m, int64_t* p, double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_odgilbv9atgc_H
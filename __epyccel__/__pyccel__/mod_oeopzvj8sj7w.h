@@ -0,0 +1,12 @@
+#ifndef MOD_OEOPZVJ8SJ7W_H
+#define MOD_OEOPZVJ8SJ7W_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_int_2d_F_initialization(t_ndarray a);
+#endif // mod_oeopzvj8sj7w_H
@@ -0,0 +1,10 @@
+#include "mod_ogi1puqqoz7r.h"
+
+
+/*........................................*/
+double complex exp_call(double complex x)
+{
+    return cexp(x);
+}
+/*........................................*/
+
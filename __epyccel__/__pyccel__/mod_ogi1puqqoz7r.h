@@ -0,0 +1,10 @@
+#ifndef MOD_OGI1PUQQOZ7R_H
+#define MOD_OGI1PUQQOZ7R_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex exp_call(double complex x);
+#endif // mod_ogi1puqqoz7r_H
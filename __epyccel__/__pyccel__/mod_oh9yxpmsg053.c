@@ -0,0 +1,12 @@
+#include "mod_oh9yxpmsg053.h"
+
+
+/*........................................*/
+double erf_phrase(double x, double y)
+{
+    double a;
+    a = erf(x) + erf(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_OH9YXPMSG053_H
+#define MOD_OH9YXPMSG053_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double erf_phrase(double x, double y);
+#endif // mod_oh9yxpmsg053_H
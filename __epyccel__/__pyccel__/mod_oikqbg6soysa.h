@@ -0,0 +1,11 @@
+#ifndef MOD_OIKQBG6SOYSA_H
+#define MOD_OIKQBG6SOYSA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_add(t_ndarray x, int64_t a);
+#endif // mod_oikqbg6soysa_H
@@ -0,0 +1,12 @@
+#include "mod_oiqhghvz3ljq.h"
+
+
+/*........................................*/
+int64_t test_shape_1d(t_ndarray f)
+{
+    int64_t Out_0001;
+    Out_0001 = f.shape[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_OIQHGHVZ3LJQ_H
+#define MOD_OIQHGHVZ3LJQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_shape_1d(t_ndarray f);
+#endif // mod_oiqhghvz3ljq_H
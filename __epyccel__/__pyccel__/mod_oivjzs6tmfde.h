@@ -0,0 +1,11 @@
+#ifndef MOD_OIVJZS6TMFDE_H
+#define MOD_OIVJZS6TMFDE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_oivjzs6tmfde_H
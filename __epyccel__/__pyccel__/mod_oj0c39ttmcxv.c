@@ -0,0 +1,12 @@
+#include "mod_oj0c39ttmcxv.h"
+
+
+/*........................................*/
+double arccos_phrase(double x, double y)
+{
+    double a;
+    a = acos(x) + acos(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_OJ0C39TTMCXV_H
+#define MOD_OJ0C39TTMCXV_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double arccos_phrase(double x, double y);
+#endif // mod_oj0c39ttmcxv_H
@@ -0,0 +1,10 @@
+#include "mod_ojp2odsy0aha.h"
+
+
+/*........................................*/
+int64_t call_gcd(int64_t x, int64_t y)
+{
+    return (int64_t)pyc_gcd(x, y);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_OJP2ODSY0AHA_H
+#define MOD_OJP2ODSY0AHA_H
+
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t call_gcd(int64_t x, int64_t y);
+#endif // mod_ojp2odsy0aha_H
@@ -0,0 +1,11 @@
+#ifndef MOD_OL32N7GFFK1X_H
+#define MOD_OL32N7GFFK1X_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_team_size(void);
+#endif // mod_ol32n7gffk1x_H
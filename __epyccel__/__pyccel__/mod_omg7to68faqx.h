@@ -0,0 +1,11 @@
+#ifndef MOD_OMG7TO68FAQX_H
+#define MOD_OMG7TO68FAQX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_scalar_mul(t_ndarray x, int64_t a);
+#endif // mod_omg7to68faqx_H
@@ -0,0 +1,12 @@
+#ifndef MOD_OPQUWLOVHLBX_H
+#define MOD_OPQUWLOVHLBX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_like_1_val(void);
+#endif // mod_opquwlovhlbx_H
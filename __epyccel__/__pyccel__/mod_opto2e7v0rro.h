@@ -0,0 +1,11 @@
+#ifndef MOD_OPTO2E7V0RRO_H
+#define MOD_OPTO2E7V0RRO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_add(t_ndarray x, int64_t a);
+#endif // mod_opto2e7v0rro_H
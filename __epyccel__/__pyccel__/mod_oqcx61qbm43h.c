@@ -0,0 +1,12 @@
+#include "mod_oqcx61qbm43h.h"
+
+
+/*........................................*/
+double complex sqrt_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = csqrt(x) * csqrt(y);
+    return a;
+}
+/*........................................*/
+
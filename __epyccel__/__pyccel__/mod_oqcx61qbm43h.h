@@ -0,0 +1,10 @@
+#ifndef MOD_OQCX61QBM43H_H
+#define MOD_OQCX61QBM43H_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex sqrt_phrase(double complex x, double complex y);
+#endif // mod_oqcx61qbm43h_H
@@ -0,0 +1,10 @@
+#include "mod_oqkj3prgbvv7.h"
+
+
+/*........................................*/
+bool numpy_isfinite_expr_test(double x, double y)
+{
+    return isfinite(x + y);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_OQKJ3PRGBVV7_H
+#define MOD_OQKJ3PRGBVV7_H
+
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool numpy_isfinite_expr_test(double x, double y);
+#endif // mod_oqkj3prgbvv7_H
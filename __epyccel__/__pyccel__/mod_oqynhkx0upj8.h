@@ -0,0 +1,12 @@
+#ifndef MOD_OQYNHKX0UPJ8_H
+#define MOD_OQYNHKX0UPJ8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_shape_1d(double n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_oqynhkx0upj8_H
@@ -0,0 +1,11 @@
+#ifndef MOD_OSXXBQ8C01O2_H
+#define MOD_OSXXBQ8C01O2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_4d_F_array_initialization(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_osxxbq8c01o2_H
@@ -0,0 +1,12 @@
+#ifndef MOD_OTDC5JLFH6UN_H
+#define MOD_OTDC5JLFH6UN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_zeros_like_val_float64(void);
+#endif // mod_otdc5jlfh6un_H
@@ -0,0 +1,10 @@
+#include "mod_ou7ax5aisp91.h"
+
+
+/*........................................*/
+double sqrt_call(double x)
+{
+    return sqrt(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_OU7AX5AISP91_H
+#define MOD_OU7AX5AISP91_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sqrt_call(double x);
+#endif // mod_ou7ax5aisp91_H
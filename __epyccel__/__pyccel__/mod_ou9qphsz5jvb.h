@@ -0,0 +1,11 @@
+#ifndef MOD_OU9QPHSZ5JVB_H
+#define MOD_OU9QPHSZ5JVB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_3(t_ndarray a, t_ndarray b);
+#endif // mod_ou9qphsz5jvb_H
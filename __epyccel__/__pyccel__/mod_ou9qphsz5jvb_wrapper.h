@@ -0,0 +1,42 @@
+#ifndef MOD_OU9QPHSZ5JVB_WRAPPER_H
+#define MOD_OU9QPHSZ5JVB_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_ou9qphsz5jvb.h"
+
+
+#ifdef MOD_OU9QPHSZ5JVB_WRAPPER
+
+
+#else
+
+static void** Pymod_ou9qphsz5jvb_API;
+
+
+/*........................................*/
+static int mod_ou9qphsz5jvb_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ou9qphsz5jvb_API = (void**)PyCapsule_Import("mod_ou9qphsz5jvb._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ou9qphsz5jvb_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_OU9QPHSZ5JVB_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_OVM8Y6BQLEKR_H
+#define MOD_OVM8Y6BQLEKR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_scalar_sub(t_ndarray x, int64_t a);
+#endif // mod_ovm8y6bqlekr_H
@@ -0,0 +1,11 @@
+#ifndef MOD_OVPX2HFM89RX_H
+#define MOD_OVPX2HFM89RX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void arr_arange_7(t_ndarray arr);
+#endif // mod_ovpx2hfm89rx_H
@@ -0,0 +1,90 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_OVPX2HFM89RX_WRAPPER
+
+#include "mod_ovpx2hfm89rx_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* arr_arange_7_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* arr_obj;
+    t_ndarray arr = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "arr",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &arr_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("arr", arr_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        arr = pyarray_to_ndarray(arr_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    arr_arange_7(arr);
+    free_pointer(&arr);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ovpx2hfm89rx_methods[] = {
+    {
+        "arr_arange_7",
+        (PyCFunction)arr_arange_7_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ovpx2hfm89rx_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ovpx2hfm89rx",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ovpx2hfm89rx_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ovpx2hfm89rx(void)
+{
+    PyObject* mod;
+    static void* Pymod_ovpx2hfm89rx_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ovpx2hfm89rx_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ovpx2hfm89rx_API, "mod_ovpx2hfm89rx._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
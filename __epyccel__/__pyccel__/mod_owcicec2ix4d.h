@@ -0,0 +1,11 @@
+#ifndef MOD_OWCICEC2IX4D_H
+#define MOD_OWCICEC2IX4D_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f2(t_ndarray x, t_ndarray y);
+#endif // mod_owcicec2ix4d_H
@@ -0,0 +1,21 @@
+#include "mod_oyuvas8o6tw4.h"
+
+
+/*........................................*/
+int64_t enumerate_on_1d_array_with_start(t_ndarray z, int64_t k)
+{
+    int64_t i;
+    int64_t v;
+    int64_t Dummy_0000;
+    int64_t res;
+    res = INT64_C(0);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < z.shape[INT64_C(0)]; Dummy_0000 += INT64_C(1))
+    {
+        i = Dummy_0000 + k;
+        v = GET_ELEMENT(z, nd_int64, Dummy_0000);
+        res += v * i;
+    }
+    return res;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_OYUVAS8O6TW4_H
+#define MOD_OYUVAS8O6TW4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t enumerate_on_1d_array_with_start(t_ndarray z, int64_t k);
+#endif // mod_oyuvas8o6tw4_H
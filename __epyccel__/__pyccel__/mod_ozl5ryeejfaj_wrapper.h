@@ -0,0 +1,40 @@
+#ifndef MOD_OZL5RYEEJFAJ_WRAPPER_H
+#define MOD_OZL5RYEEJFAJ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ozl5ryeejfaj.h"
+
+
+#ifdef MOD_OZL5RYEEJFAJ_WRAPPER
+
+
+#else
+
+static void** Pymod_ozl5ryeejfaj_API;
+
+
+/*........................................*/
+static int mod_ozl5ryeejfaj_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ozl5ryeejfaj_API = (void**)PyCapsule_Import("mod_ozl5ryeejfaj._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ozl5ryeejfaj_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_OZL5RYEEJFAJ_WRAPPER_H
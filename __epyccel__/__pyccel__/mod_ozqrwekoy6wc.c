@@ -0,0 +1,10 @@
+#include "mod_ozqrwekoy6wc.h"
+
+
+/*........................................*/
+int64_t trunc_call(double x)
+{
+    return trunc(x);
+}
+/*........................................*/
+
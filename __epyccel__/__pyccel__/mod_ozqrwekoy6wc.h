@@ -0,0 +1,11 @@
+#ifndef MOD_OZQRWEKOY6WC_H
+#define MOD_OZQRWEKOY6WC_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t trunc_call(double x);
+#endif // mod_ozqrwekoy6wc_H
@@ -0,0 +1,11 @@
+#ifndef MOD_P0J5PHFQ2W7I_H
+#define MOD_P0J5PHFQ2W7I_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_p0j5phfq2w7i_H
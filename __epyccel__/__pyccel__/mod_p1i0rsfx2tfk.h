@@ -0,0 +1,11 @@
+#ifndef MOD_P1I0RSFX2TFK_H
+#define MOD_P1I0RSFX2TFK_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_p1i0rsfx2tfk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_P2HVTBEMRU4I_H
+#define MOD_P2HVTBEMRU4I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_p2hvtbemru4i_H
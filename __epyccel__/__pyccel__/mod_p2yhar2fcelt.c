@@ -0,0 +1,23 @@
+#include "mod_p2yhar2fcelt.h"
+
+
+/*........................................*/
+t_ndarray create_array_tuple_ref(t_ndarray a)
+{
+    t_ndarray b_0 = {.raw_data = NULL};
+    t_ndarray b_1 = {.raw_data = NULL};
+    int64_t offset;
+    t_ndarray c = {.raw_data = NULL};
+    b_0 = array_slicing(a, 1, new_slice(INT64_C(0), INT64_C(1), INT64_C(1), ELEMENT), new_slice(INT64_C(0), a.shape[INT64_C(1)], INT64_C(1), RANGE));
+    b_1 = array_slicing(a, 1, new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT), new_slice(INT64_C(0), a.shape[INT64_C(1)], INT64_C(1), RANGE));
+    c = array_create(2, (int64_t[]){INT64_C(2), b_0.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&c, b_0, offset);
+    offset += b_0.length;
+    array_copy_data(&c, b_1, offset);
+    free_pointer(&b_0);
+    free_pointer(&b_1);
+    return c;
+}
+/*........................................*/
+
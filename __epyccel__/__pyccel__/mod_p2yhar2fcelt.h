@@ -0,0 +1,11 @@
+#ifndef MOD_P2YHAR2FCELT_H
+#define MOD_P2YHAR2FCELT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray create_array_tuple_ref(t_ndarray a);
+#endif // mod_p2yhar2fcelt_H
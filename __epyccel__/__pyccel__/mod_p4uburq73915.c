@@ -0,0 +1,12 @@
+#include "mod_p4uburq73915.h"
+
+
+/*........................................*/
+double absolute_phrase_i_r(int64_t x, double y)
+{
+    double a;
+    a = fabs((double)(x)) * fabs(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_P4UBURQ73915_H
+#define MOD_P4UBURQ73915_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double absolute_phrase_i_r(int64_t x, double y);
+#endif // mod_p4uburq73915_H
@@ -0,0 +1,16 @@
+#include "mod_p4yizk7a0uno.h"
+
+
+/*........................................*/
+int64_t default_var_1_0000(int64_t x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+double default_var_1_0001(double x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_P4YIZK7A0UNO_H
+#define MOD_P4YIZK7A0UNO_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t default_var_1_0000(int64_t x, int64_t y);
+double default_var_1_0001(double x, int64_t y);
+#endif // mod_p4yizk7a0uno_H
@@ -0,0 +1,11 @@
+#ifndef MOD_P5Q5KJ5BE6T4_H
+#define MOD_P5Q5KJ5BE6T4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_uncertain_shape_1(void);
+#endif // mod_p5q5kj5be6t4_H
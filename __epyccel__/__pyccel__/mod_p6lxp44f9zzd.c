@@ -0,0 +1,15 @@
+#include "mod_p6lxp44f9zzd.h"
+
+
+/*........................................*/
+int32_t test_omp_get_thread_limit(void)
+{
+    int32_t maximum_threads_available;
+    #pragma omp parallel
+    {
+        maximum_threads_available = omp_get_thread_limit();
+    }
+    return maximum_threads_available;
+}
+/*........................................*/
+
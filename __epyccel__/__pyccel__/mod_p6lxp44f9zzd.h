@@ -0,0 +1,11 @@
+#ifndef MOD_P6LXP44F9ZZD_H
+#define MOD_P6LXP44F9ZZD_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_thread_limit(void);
+#endif // mod_p6lxp44f9zzd_H
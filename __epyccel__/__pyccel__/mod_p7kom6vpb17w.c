@@ -0,0 +1,10 @@
+#include "mod_p7kom6vpb17w.h"
+
+
+/*........................................*/
+double call_radians(double x)
+{
+    return pyc_radians(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_P7KOM6VPB17W_H
+#define MOD_P7KOM6VPB17W_H
+
+#include "pyc_math_c.h"
+#include <stdlib.h>
+
+
+
+double call_radians(double x);
+#endif // mod_p7kom6vpb17w_H
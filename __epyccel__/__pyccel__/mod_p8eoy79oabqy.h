@@ -0,0 +1,12 @@
+#ifndef MOD_P8EOY79OABQY_H
+#define MOD_P8EOY79OABQY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_full_like_val_real_float64_auto(double val);
+#endif // mod_p8eoy79oabqy_H
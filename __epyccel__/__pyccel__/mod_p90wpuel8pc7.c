@@ -0,0 +1,24 @@
+#include "mod_p90wpuel8pc7.h"
+
+
+/*........................................*/
+int64_t array_copy_is_pointer(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(4)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 4 * a.type_size);
+    alias_assign(&b, a);
+    a.nd_int64[INT64_C(2)] = INT64_C(9);
+    (*Out_0001) = b.nd_int64[INT64_C(0)];
+    (*Out_0002) = b.nd_int64[INT64_C(1)];
+    (*Out_0003) = b.nd_int64[INT64_C(2)];
+    (*Out_0004) = b.nd_int64[INT64_C(3)];
+    (*Out_0005) = b.shape[INT64_C(0)];
+    free_array(&a);
+    free_pointer(&b);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_P90WPUEL8PC7_H
+#define MOD_P90WPUEL8PC7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t array_copy_is_pointer(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_p90wpuel8pc7_H
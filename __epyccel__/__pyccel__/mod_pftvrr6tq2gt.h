@@ -0,0 +1,11 @@
+#ifndef MOD_PFTVRR6TQ2GT_H
+#define MOD_PFTVRR6TQ2GT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_pftvrr6tq2gt_H
@@ -0,0 +1,12 @@
+#ifndef MOD_PI24KF8BRJFK_H
+#define MOD_PI24KF8BRJFK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_zeros_like_val_float64_auto(void);
+#endif // mod_pi24kf8brjfk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_PJ5BWFYLS8C8_H
+#define MOD_PJ5BWFYLS8C8_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_pj5bwfyls8c8_H
@@ -0,0 +1,12 @@
+#ifndef MOD_PJGMLV8F1CS2_H
+#define MOD_PJGMLV8F1CS2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_2_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_pjgmlv8f1cs2_H
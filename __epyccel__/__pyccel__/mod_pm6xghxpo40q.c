@@ -0,0 +1,19 @@
+#include "mod_pm6xghxpo40q.h"
+
+
+/*........................................*/
+int64_t map_on_1d_array(t_ndarray z)
+{
+    int64_t v;
+    int64_t Dummy_0000;
+    int64_t res;
+    res = INT64_C(0);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < z.shape[INT64_C(0)]; Dummy_0000 += INT64_C(1))
+    {
+        v = f(GET_ELEMENT(z, nd_int64, Dummy_0000));
+        res *= v;
+    }
+    return res;
+}
+/*........................................*/
+
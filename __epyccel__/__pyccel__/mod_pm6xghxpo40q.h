@@ -0,0 +1,11 @@
+#ifndef MOD_PM6XGHXPO40Q_H
+#define MOD_PM6XGHXPO40Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t map_on_1d_array(t_ndarray z);
+#endif // mod_pm6xghxpo40q_H
@@ -0,0 +1,11 @@
+#ifndef MOD_PM8AFRLSFI41_H
+#define MOD_PM8AFRLSFI41_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(int64_t i);
+#endif // mod_pm8afrlsfi41_H
@@ -0,0 +1,12 @@
+#include "mod_pmq4uid86rm9.h"
+
+
+/*........................................*/
+double complex min_call(t_ndarray x)
+{
+    double complex Out_0001;
+    Out_0001 = numpy_amin_complex128(x);
+    return Out_0001;
+}
+/*........................................*/
+
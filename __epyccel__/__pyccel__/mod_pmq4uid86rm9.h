@@ -0,0 +1,11 @@
+#ifndef MOD_PMQ4UID86RM9_H
+#define MOD_PMQ4UID86RM9_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+double complex min_call(t_ndarray x);
+#endif // mod_pmq4uid86rm9_H
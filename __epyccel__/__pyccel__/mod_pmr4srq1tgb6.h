@@ -0,0 +1,11 @@
+#ifndef MOD_PMR4SRQ1TGB6_H
+#define MOD_PMR4SRQ1TGB6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_1D_2(t_ndarray a);
+#endif // mod_pmr4srq1tgb6_H
@@ -0,0 +1,12 @@
+#include "mod_pn5rfno1egb1.h"
+
+
+/*........................................*/
+double cos_phrase(double x, double y)
+{
+    double a;
+    a = cos(x) + cos(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_PN5RFNO1EGB1_H
+#define MOD_PN5RFNO1EGB1_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double cos_phrase(double x, double y);
+#endif // mod_pn5rfno1egb1_H
@@ -0,0 +1,28 @@
+#include "mod_pphscr2n160t.h"
+
+
+/*........................................*/
+int32_t mult_on_array_int32(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int32_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    array_fill((int32_t)1, a);
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    {
+        int32_t* restrict a_data = a.nd_int32;
+        int32_t* restrict b_data = b.nd_int32;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            b_data[i] = a_data[i] * INT64_C(2);
+        }
+    }
+    Out_0001 = b.nd_int32[INT64_C(0)];
+    free_array(&a);
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
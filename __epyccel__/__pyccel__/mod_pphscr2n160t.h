@@ -0,0 +1,11 @@
+#ifndef MOD_PPHSCR2N160T_H
+#define MOD_PPHSCR2N160T_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t mult_on_array_int32(void);
+#endif // mod_pphscr2n160t_H
@@ -0,0 +1,11 @@
+#ifndef MOD_PPULLJX81ZBC_H
+#define MOD_PPULLJX81ZBC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum(t_ndarray x);
+#endif // mod_ppulljx81zbc_H
@@ -0,0 +1,10 @@
+#include "mod_ppwjr9zybw1f.h"
+
+
+/*........................................*/
+void array_float_2d_1d_matmul(t_ndarray A, t_ndarray x, t_ndarray out)
+{
+    numpy_matmul_float64(array_slicing(out, 1, new_slice(INT64_C(0), out.shape[INT64_C(0)], INT64_C(1), RANGE)), A, x);
+}
+/*........................................*/
+
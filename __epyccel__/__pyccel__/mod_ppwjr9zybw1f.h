@@ -0,0 +1,11 @@
+#ifndef MOD_PPWJR9ZYBW1F_H
+#define MOD_PPWJR9ZYBW1F_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_1d_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_ppwjr9zybw1f_H
@@ -0,0 +1,20 @@
+#ifndef MOD_PQ9OMRUXQZJN_H
+#define MOD_PQ9OMRUXQZJN_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t get_mod_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003);
+int64_t get_mod_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+int64_t get_mod_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003);
+int64_t get_mod_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int16_t* Out_0003);
+int64_t get_mod_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int32_t* Out_0003);
+int64_t get_mod_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+int64_t get_mod_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float* Out_0003);
+#endif // mod_pq9omruxqzjn_H
@@ -0,0 +1,40 @@
+#ifndef MOD_PQTOHW3QZI9O_WRAPPER_H
+#define MOD_PQTOHW3QZI9O_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_pqtohw3qzi9o.h"
+
+
+#ifdef MOD_PQTOHW3QZI9O_WRAPPER
+
+
+#else
+
+static void** Pymod_pqtohw3qzi9o_API;
+
+
+/*........................................*/
+static int mod_pqtohw3qzi9o_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_pqtohw3qzi9o_API = (void**)PyCapsule_Import("mod_pqtohw3qzi9o._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_pqtohw3qzi9o_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_PQTOHW3QZI9O_WRAPPER_H
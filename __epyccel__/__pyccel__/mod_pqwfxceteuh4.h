@@ -0,0 +1,11 @@
+#ifndef MOD_PQWFXCETEUH4_H
+#define MOD_PQWFXCETEUH4_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_pqwfxceteuh4_H
@@ -0,0 +1,34 @@
+#include "mod_prmub73renuf.h"
+
+
+/*........................................*/
+int64_t int_types_0000(int64_t x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+int32_t int_types_0001(int32_t x, int32_t y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+int8_t int_types_0002(int8_t x, int8_t y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+int16_t int_types_0003(int16_t x, int16_t y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+int64_t int_types_0004(int64_t x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+
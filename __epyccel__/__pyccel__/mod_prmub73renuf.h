@@ -0,0 +1,14 @@
+#ifndef MOD_PRMUB73RENUF_H
+#define MOD_PRMUB73RENUF_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t int_types_0000(int64_t x, int64_t y);
+int32_t int_types_0001(int32_t x, int32_t y);
+int8_t int_types_0002(int8_t x, int8_t y);
+int16_t int_types_0003(int16_t x, int16_t y);
+int64_t int_types_0004(int64_t x, int64_t y);
+#endif // mod_prmub73renuf_H
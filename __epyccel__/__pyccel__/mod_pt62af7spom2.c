@@ -0,0 +1,21 @@
+#include "mod_pt62af7spom2.h"
+
+
+/*........................................*/
+void tuple_visitation_homogeneous(void)
+{
+    t_ndarray ai = {.raw_data = NULL};
+    int64_t a;
+    int64_t Dummy_0000;
+    ai = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(5), INT64_C(4)};
+    memcpy(&ai.nd_int64[INT64_C(0)], Dummy_0001, 3 * ai.type_size);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < INT64_C(3); Dummy_0000 += INT64_C(1))
+    {
+        a = GET_ELEMENT(ai, nd_int64, Dummy_0000);
+        printf("%"PRId64"\n", a);
+    }
+    free_array(&ai);
+}
+/*........................................*/
+
@@ -0,0 +1,14 @@
+#ifndef MOD_PT62AF7SPOM2_H
+#define MOD_PT62AF7SPOM2_H
+
+#include <inttypes.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void tuple_visitation_homogeneous(void);
+#endif // mod_pt62af7spom2_H
@@ -0,0 +1,77 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_PT62AF7SPOM2_WRAPPER
+
+#include "mod_pt62af7spom2_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tuple_visitation_homogeneous_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    tuple_visitation_homogeneous();
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_pt62af7spom2_methods[] = {
+    {
+        "tuple_visitation_homogeneous",
+        (PyCFunction)tuple_visitation_homogeneous_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_pt62af7spom2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_pt62af7spom2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_pt62af7spom2_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_pt62af7spom2(void)
+{
+    PyObject* mod;
+    static void* Pymod_pt62af7spom2_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_pt62af7spom2_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_pt62af7spom2_API, "mod_pt62af7spom2._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
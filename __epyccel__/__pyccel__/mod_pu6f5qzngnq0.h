@@ -0,0 +1,13 @@
+#ifndef MOD_PU6F5QZNGNQ0_H
+#define MOD_PU6F5QZNGNQ0_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_empty_like_val_complex128_auto(void);
+#endif // mod_pu6f5qzngnq0_H
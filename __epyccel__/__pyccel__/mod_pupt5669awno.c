@@ -0,0 +1,88 @@
+#include "mod_pupt5669awno.h"
+
+
+/*........................................*/
+bool func_0000(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    bool Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_bool, false, order_c);
+    array_fill((bool)0, b);
+    Out_0001 = b.nd_bool[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int64_t func_0001(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    int64_t Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), b);
+    Out_0001 = b.nd_int64[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int8_t func_0002(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    int8_t Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    array_fill((int8_t)0, b);
+    Out_0001 = b.nd_int8[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int16_t func_0003(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    int16_t Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    array_fill((int16_t)0, b);
+    Out_0001 = b.nd_int16[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int32_t func_0004(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    int32_t Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    array_fill((int32_t)0, b);
+    Out_0001 = b.nd_int32[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double func_0005(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    double Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)0.0, b);
+    Out_0001 = b.nd_double[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+float func_0006(t_ndarray a)
+{
+    t_ndarray b = {.raw_data = NULL};
+    float Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    array_fill((float)0.0f, b);
+    Out_0001 = b.nd_float[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
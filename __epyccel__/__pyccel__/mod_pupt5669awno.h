@@ -0,0 +1,18 @@
+#ifndef MOD_PUPT5669AWNO_H
+#define MOD_PUPT5669AWNO_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+bool func_0000(t_ndarray a);
+int64_t func_0001(t_ndarray a);
+int8_t func_0002(t_ndarray a);
+int16_t func_0003(t_ndarray a);
+int32_t func_0004(t_ndarray a);
+double func_0005(t_ndarray a);
+float func_0006(t_ndarray a);
+#endif // mod_pupt5669awno_H
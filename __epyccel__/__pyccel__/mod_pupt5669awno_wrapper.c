@@ -0,0 +1,257 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_PUPT5669AWNO_WRAPPER
+
+#include "mod_pupt5669awno_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* func_0000_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    bool Out_0001;
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = func_0000(a);
+    free_pointer(&a);
+    Out_0001_obj = Bool_to_PyBool(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* func_0001_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = func_0001(a);
+    free_pointer(&a);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* func_0002_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int8_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = func_0002(a);
+    free_pointer(&a);
+    Out_0001_obj = Int8_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* func_0003_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int16_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = func_0003(a);
+    free_pointer(&a);
+    Out_0001_obj = Int16_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* func_0004_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int32_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = func_0004(a);
+    free_pointer(&a);
+    Out_0001_obj = Int32_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* func_0005_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = func_0005(a);
+    free_pointer(&a);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* func_0006_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    float Out_0001;
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = func_0006(a);
+    free_pointer(&a);
+    Out_0001_obj = Float_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t func_type_check(PyObject* a_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(a_obj, NPY_BOOL, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(a_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(a_obj, NPY_BYTE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (is_numpy_array(a_obj, NPY_SHORT, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (is_numpy_array(a_obj, NPY_INT32, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (is_numpy_array(a_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (is_numpy_array(a_obj, NPY_FLOAT, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* func_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    type_indicator = func_type_check(a_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return func_0000_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return func_0001_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return func_0002_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return func_0003_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return func_0004_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return func_0005_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(6))
+    {
+        return func_0006_wrapper(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_pupt5669awno_methods[] = {
+    {
+        "func",
+        (PyCFunction)func_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_pupt5669awno_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_pupt5669awno",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_pupt5669awno_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_pupt5669awno(void)
+{
+    PyObject* mod;
+    static void* Pymod_pupt5669awno_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_pupt5669awno_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_pupt5669awno_API, "mod_pupt5669awno._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
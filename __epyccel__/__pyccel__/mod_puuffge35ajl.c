@@ -0,0 +1,28 @@
+#include "mod_puuffge35ajl.h"
+
+
+/*........................................*/
+void matvec(t_ndarray a, t_ndarray x, t_ndarray y)
+{
+    int64_t n;
+    int64_t m;
+    int64_t i;
+    int64_t j;
+    n = a.shape[INT64_C(0)];
+    m = a.shape[INT64_C(1)];
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict a_data = a.nd_double;
+        double* restrict y_data = y.nd_double;
+        for (i = INT64_C(0); i < n; i += INT64_C(1))
+        {
+            y_data[i] = 0.0;
+            for (j = INT64_C(0); j < m; j += INT64_C(1))
+            {
+                y_data[i] += a_data[j * a.shape[INT64_C(0)] + i] * x_data[j];
+            }
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_PUUFFGE35AJL_H
+#define MOD_PUUFFGE35AJL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void matvec(t_ndarray a, t_ndarray x, t_ndarray y);
+#endif // mod_puuffge35ajl_H
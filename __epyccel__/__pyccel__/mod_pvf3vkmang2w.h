@@ -0,0 +1,12 @@
+#ifndef MOD_PVF3VKMANG2W_H
+#define MOD_PVF3VKMANG2W_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_array_tuple_val(void);
+#endif // mod_pvf3vkmang2w_H
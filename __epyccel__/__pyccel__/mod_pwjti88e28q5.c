@@ -0,0 +1,35 @@
+#include "mod_pwjti88e28q5.h"
+
+
+/*........................................*/
+int64_t test_linspace_type(int64_t start, int64_t end, t_ndarray result, int64_t* ret, int64_t* Out_0001)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    x = array_create(1, (int64_t[]){INT64_C(15)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict x_data = x.nd_int64;
+        for (i_0001 = INT64_C(0); i_0001 < INT64_C(15); i_0001 += INT64_C(1))
+        {
+            x_data[i_0001] = (start + INT64_C(4) + i_0001*(double)((end - (start + INT64_C(4)))) / 14.0);
+            x_data[INT64_C(14)] = end;
+        }
+    }
+    (*ret) = INT64_C(1);
+    {
+        int64_t* restrict x_data_0001 = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(15); i += INT64_C(1))
+        {
+            if (x_data_0001[i] != GET_ELEMENT(result, nd_int64, i))
+            {
+                (*ret) = INT64_C(0);
+            }
+        }
+    }
+    (*Out_0001) = x.nd_int64[(int64_t)(15.0 / 2.0)];
+    free_array(&x);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_PWJTI88E28Q5_H
+#define MOD_PWJTI88E28Q5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_linspace_type(int64_t start, int64_t end, t_ndarray result, int64_t* ret, int64_t* Out_0001);
+#endif // mod_pwjti88e28q5_H
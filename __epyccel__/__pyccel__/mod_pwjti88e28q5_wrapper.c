@@ -0,0 +1,123 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_PWJTI88E28Q5_WRAPPER
+
+#include "mod_pwjti88e28q5_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_type_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* start_obj;
+    PyObject* end_obj;
+    PyObject* result_obj;
+    int64_t start;
+    int64_t end;
+    t_ndarray result = {.raw_data = NULL};
+    PyObject* ret_obj;
+    int64_t ret;
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "start",
+        "end",
+        "result",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &start_obj, &end_obj, &result_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(start_obj))
+    {
+        start = PyInt64_to_Int64(start_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument start");
+        return NULL;
+    }
+    if (PyIs_NativeInt(end_obj))
+    {
+        end = PyInt64_to_Int64(end_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument end");
+        return NULL;
+    }
+    if (pyarray_check("result", result_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        result = pyarray_to_ndarray(result_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    test_linspace_type(start, end, result, &ret, &Out_0001);
+    free_pointer(&result);
+    ret_obj = Int64_to_PyLong(&ret);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    Out_obj = Py_BuildValue("OO", ret_obj, Out_0001_obj);
+    Py_DECREF(ret_obj);
+    Py_DECREF(Out_0001_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_pwjti88e28q5_methods[] = {
+    {
+        "test_linspace_type",
+        (PyCFunction)test_linspace_type_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_pwjti88e28q5_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_pwjti88e28q5",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_pwjti88e28q5_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_pwjti88e28q5(void)
+{
+    PyObject* mod;
+    static void* Pymod_pwjti88e28q5_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_pwjti88e28q5_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_pwjti88e28q5_API, "mod_pwjti88e28q5._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
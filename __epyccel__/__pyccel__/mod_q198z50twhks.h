@@ -0,0 +1,12 @@
+#ifndef MOD_Q198Z50TWHKS_H
+#define MOD_Q198Z50TWHKS_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_ones_val_complex128(void);
+#endif // mod_q198z50twhks_H
@@ -0,0 +1,40 @@
+#ifndef MOD_Q198Z50TWHKS_WRAPPER_H
+#define MOD_Q198Z50TWHKS_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_q198z50twhks.h"
+
+
+#ifdef MOD_Q198Z50TWHKS_WRAPPER
+
+
+#else
+
+static void** Pymod_q198z50twhks_API;
+
+
+/*........................................*/
+static int mod_q198z50twhks_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_q198z50twhks_API = (void**)PyCapsule_Import("mod_q198z50twhks._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_q198z50twhks_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_Q198Z50TWHKS_WRAPPER_H
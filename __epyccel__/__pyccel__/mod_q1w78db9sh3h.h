@@ -0,0 +1,12 @@
+#ifndef MOD_Q1W78DB9SH3H_H
+#define MOD_Q1W78DB9SH3H_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t my_tuple(t_ndarray a, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004);
+#endif // mod_q1w78db9sh3h_H
@@ -0,0 +1,15 @@
+#include "mod_q3b4qrtyt3kt.h"
+
+
+/*........................................*/
+bool test_omp_in_parallel2(void)
+{
+    bool in_parallel;
+    #pragma omp parallel
+    {
+        in_parallel = omp_in_parallel();
+    }
+    return in_parallel;
+}
+/*........................................*/
+
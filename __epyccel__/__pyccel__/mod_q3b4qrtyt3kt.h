@@ -0,0 +1,11 @@
+#ifndef MOD_Q3B4QRTYT3KT_H
+#define MOD_Q3B4QRTYT3KT_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_in_parallel2(void);
+#endif // mod_q3b4qrtyt3kt_H
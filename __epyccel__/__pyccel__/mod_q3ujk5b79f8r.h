@@ -0,0 +1,12 @@
+#ifndef MOD_Q3UJK5B79F8R_H
+#define MOD_Q3UJK5B79F8R_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_array_tuple_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_q3ujk5b79f8r_H
@@ -0,0 +1,49 @@
+#include "mod_q46p75937vgt.h"
+
+
+/*........................................*/
+int64_t unpack_array_0000(t_ndarray arr, int64_t* x, int64_t* y, int64_t* z)
+{
+    (*x) = GET_ELEMENT(arr, nd_int64, INT64_C(0));
+    (*y) = GET_ELEMENT(arr, nd_int64, INT64_C(1));
+    (*z) = GET_ELEMENT(arr, nd_int64, INT64_C(2));
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t unpack_array_0001(t_ndarray arr, t_ndarray* x, t_ndarray* y, t_ndarray* z)
+{
+    (*x) = array_slicing(arr, 1, new_slice(INT64_C(0), INT64_C(1), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE));
+    (*y) = array_slicing(arr, 1, new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE));
+    (*z) = array_slicing(arr, 1, new_slice(INT64_C(2), INT64_C(3), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE));
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t unpack_array_0002(t_ndarray arr, t_ndarray* x, t_ndarray* y, t_ndarray* z)
+{
+    (*x) = array_slicing(arr, 2, new_slice(INT64_C(0), INT64_C(1), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE), new_slice(INT64_C(0), arr.shape[INT64_C(2)], INT64_C(1), RANGE));
+    (*y) = array_slicing(arr, 2, new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE), new_slice(INT64_C(0), arr.shape[INT64_C(2)], INT64_C(1), RANGE));
+    (*z) = array_slicing(arr, 2, new_slice(INT64_C(2), INT64_C(3), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE), new_slice(INT64_C(0), arr.shape[INT64_C(2)], INT64_C(1), RANGE));
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t unpack_array_0003(t_ndarray arr, t_ndarray* x, t_ndarray* y, t_ndarray* z)
+{
+    (*x) = array_slicing(arr, 1, new_slice(INT64_C(0), INT64_C(1), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE));
+    (*y) = array_slicing(arr, 1, new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE));
+    (*z) = array_slicing(arr, 1, new_slice(INT64_C(2), INT64_C(3), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE));
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t unpack_array_0004(t_ndarray arr, t_ndarray* x, t_ndarray* y, t_ndarray* z)
+{
+    (*x) = array_slicing(arr, 2, new_slice(INT64_C(0), INT64_C(1), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE), new_slice(INT64_C(0), arr.shape[INT64_C(2)], INT64_C(1), RANGE));
+    (*y) = array_slicing(arr, 2, new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE), new_slice(INT64_C(0), arr.shape[INT64_C(2)], INT64_C(1), RANGE));
+    (*z) = array_slicing(arr, 2, new_slice(INT64_C(2), INT64_C(3), INT64_C(1), ELEMENT), new_slice(INT64_C(0), arr.shape[INT64_C(1)], INT64_C(1), RANGE), new_slice(INT64_C(0), arr.shape[INT64_C(2)], INT64_C(1), RANGE));
+    return 0;
+}
+/*........................................*/
+
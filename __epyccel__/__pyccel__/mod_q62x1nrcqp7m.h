@@ -0,0 +1,10 @@
+#ifndef MOD_Q62X1NRCQP7M_H
+#define MOD_Q62X1NRCQP7M_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_master(void);
+#endif // mod_q62x1nrcqp7m_H
@@ -0,0 +1,11 @@
+#ifndef MOD_Q73JWB90DRZT_H
+#define MOD_Q73JWB90DRZT_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_thread_limit(void);
+#endif // mod_q73jwb90drzt_H
@@ -0,0 +1,10 @@
+#include "mod_q81nnt9tnch9.h"
+
+
+/*........................................*/
+double complex atanh_call(double complex x)
+{
+    return catanh(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_Q81NNT9TNCH9_H
+#define MOD_Q81NNT9TNCH9_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex atanh_call(double complex x);
+#endif // mod_q81nnt9tnch9_H
@@ -0,0 +1,22 @@
+#include "mod_q8b55s0kgz69.h"
+
+
+/*........................................*/
+double complex complex_types_0000(double complex x, double complex y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+float complex complex_types_0001(float complex x, float complex y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+double complex complex_types_0002(double complex x, double complex y)
+{
+    return x + y;
+}
+/*........................................*/
+
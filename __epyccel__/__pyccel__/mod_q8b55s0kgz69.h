@@ -0,0 +1,12 @@
+#ifndef MOD_Q8B55S0KGZ69_H
+#define MOD_Q8B55S0KGZ69_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex complex_types_0000(double complex x, double complex y);
+float complex complex_types_0001(float complex x, float complex y);
+double complex complex_types_0002(double complex x, double complex y);
+#endif // mod_q8b55s0kgz69_H
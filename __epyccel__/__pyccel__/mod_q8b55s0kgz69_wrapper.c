@@ -0,0 +1,190 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_Q8B55S0KGZ69_WRAPPER
+
+#include "mod_q8b55s0kgz69_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* complex_types_0000_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    double complex x;
+    double complex y;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    y = PyComplex_to_Complex128(y_obj);
+    Out_0001 = complex_types_0000(x, y);
+    Out_0001_obj = Complex128_to_PyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* complex_types_0001_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    float complex x;
+    float complex y;
+    float complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex64(x_obj);
+    y = PyComplex_to_Complex64(y_obj);
+    Out_0001 = complex_types_0001(x, y);
+    Out_0001_obj = Complex64_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* complex_types_0002_wrapper(PyObject* x_obj, PyObject* y_obj)
+{
+    double complex x;
+    double complex y;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    x = PyComplex_to_Complex128(x_obj);
+    y = PyComplex_to_Complex128(y_obj);
+    Out_0001 = complex_types_0002(x, y);
+    Out_0001_obj = Complex128_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t complex_types_type_check(PyObject* x_obj, PyObject* y_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeComplex(x_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Complex64(x_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Complex128(x_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    if (PyIs_NativeComplex(y_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Complex64(y_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Complex128(y_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument y");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* complex_types_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    type_indicator = complex_types_type_check(x_obj, y_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return complex_types_0000_wrapper(x_obj, y_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return complex_types_0001_wrapper(x_obj, y_obj);
+    }
+    else if (type_indicator == INT64_C(8))
+    {
+        return complex_types_0002_wrapper(x_obj, y_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_q8b55s0kgz69_methods[] = {
+    {
+        "complex_types",
+        (PyCFunction)complex_types_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_q8b55s0kgz69_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_q8b55s0kgz69",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_q8b55s0kgz69_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_q8b55s0kgz69(void)
+{
+    PyObject* mod;
+    static void* Pymod_q8b55s0kgz69_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_q8b55s0kgz69_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_q8b55s0kgz69_API, "mod_q8b55s0kgz69._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
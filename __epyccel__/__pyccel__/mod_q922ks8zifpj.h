@@ -0,0 +1,11 @@
+#ifndef MOD_Q922KS8ZIFPJ_H
+#define MOD_Q922KS8ZIFPJ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_q922ks8zifpj_H
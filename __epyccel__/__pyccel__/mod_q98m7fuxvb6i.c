@@ -0,0 +1,12 @@
+#include "mod_q98m7fuxvb6i.h"
+
+
+/*........................................*/
+double exp_phrase_i_i(int64_t x, int64_t y)
+{
+    double a;
+    a = exp((double)(x)) + exp((double)(y));
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_Q98M7FUXVB6I_H
+#define MOD_Q98M7FUXVB6I_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double exp_phrase_i_i(int64_t x, int64_t y);
+#endif // mod_q98m7fuxvb6i_H
@@ -0,0 +1,10 @@
+#include "mod_qaa4ni5jupyp.h"
+
+
+/*........................................*/
+double f1(void)
+{
+    return M_PI;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_QAA4NI5JUPYP_H
+#define MOD_QAA4NI5JUPYP_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double f1(void);
+#endif // mod_qaa4ni5jupyp_H
@@ -0,0 +1,13 @@
+#ifndef MOD_QDM2DQA83WB7_H
+#define MOD_QDM2DQA83WB7_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_3_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_qdm2dqa83wb7_H
@@ -0,0 +1,12 @@
+#include "mod_qdti9cv42ac5.h"
+
+
+/*........................................*/
+double cos_phrase_i_i(int64_t x, int64_t y)
+{
+    double a;
+    a = cos((double)(x)) + cos((double)(y));
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_QDTI9CV42AC5_H
+#define MOD_QDTI9CV42AC5_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double cos_phrase_i_i(int64_t x, int64_t y);
+#endif // mod_qdti9cv42ac5_H
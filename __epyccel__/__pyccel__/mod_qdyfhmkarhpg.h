@@ -0,0 +1,12 @@
+#ifndef MOD_QDYFHMKARHPG_H
+#define MOD_QDYFHMKARHPG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float create_full_like_val_real_float32_auto(double val);
+#endif // mod_qdyfhmkarhpg_H
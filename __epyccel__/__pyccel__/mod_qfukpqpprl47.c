@@ -0,0 +1,24 @@
+#include "mod_qfukpqpprl47.h"
+
+
+/*........................................*/
+int64_t default_var_3_0000(int64_t x, bool y)
+{
+    if (y == 1)
+    {
+        return x;
+    }
+    return x - INT64_C(1);
+}
+/*........................................*/
+/*........................................*/
+double default_var_3_0001(double x, bool y)
+{
+    if (y == 1)
+    {
+        return x;
+    }
+    return x - INT64_C(1);
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_QFUKPQPPRL47_H
+#define MOD_QFUKPQPPRL47_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t default_var_3_0000(int64_t x, bool y);
+double default_var_3_0001(double x, bool y);
+#endif // mod_qfukpqpprl47_H
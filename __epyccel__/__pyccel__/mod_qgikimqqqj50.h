@@ -0,0 +1,11 @@
+#ifndef MOD_QGIKIMQQQJ50_H
+#define MOD_QGIKIMQQQJ50_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_mul(t_ndarray x, double a);
+#endif // mod_qgikimqqqj50_H
@@ -0,0 +1,12 @@
+#include "mod_qglxsrqodrja.h"
+
+
+/*........................................*/
+double log1p_phrase(double x, double y)
+{
+    double a;
+    a = log1p(x) + log1p(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_QGLXSRQODRJA_H
+#define MOD_QGLXSRQODRJA_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double log1p_phrase(double x, double y);
+#endif // mod_qglxsrqodrja_H
@@ -0,0 +1,11 @@
+#ifndef MOD_QHZFDN9L607X_H
+#define MOD_QHZFDN9L607X_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_ancestor_thread_num(void);
+#endif // mod_qhzfdn9l607x_H
@@ -0,0 +1,11 @@
+#ifndef MOD_QKAT9YIV3H2Q_H
+#define MOD_QKAT9YIV3H2Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_qkat9yiv3h2q_H
@@ -0,0 +1,10 @@
+#ifndef MOD_QMK0YFF6LRDO_H
+#define MOD_QMK0YFF6LRDO_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t directive_in_else(int64_t x);
+#endif // mod_qmk0yff6lrdo_H
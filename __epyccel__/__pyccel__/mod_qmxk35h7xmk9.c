@@ -0,0 +1,22 @@
+#include "mod_qmxk35h7xmk9.h"
+
+
+/*........................................*/
+void double_loop_on_2d_array_F(t_ndarray z)
+{
+    int64_t m;
+    int64_t n;
+    int64_t i;
+    int64_t j;
+    m = z.shape[INT64_C(0)];
+    n = z.shape[INT64_C(1)];
+    for (i = INT64_C(0); i < m; i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < n; j += INT64_C(1))
+        {
+            GET_ELEMENT(z, nd_int64, i, j) = i - j;
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_QMXK35H7XMK9_H
+#define MOD_QMXK35H7XMK9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void double_loop_on_2d_array_F(t_ndarray z);
+#endif // mod_qmxk35h7xmk9_H
@@ -0,0 +1,13 @@
+#ifndef MOD_QNHQ79VZORB6_H
+#define MOD_QNHQ79VZORB6_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_ones_like_val_complex_auto(void);
+#endif // mod_qnhq79vzorb6_H
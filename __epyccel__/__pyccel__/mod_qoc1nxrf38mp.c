@@ -0,0 +1,24 @@
+#include "mod_qoc1nxrf38mp.h"
+
+
+/*........................................*/
+t_ndarray f4(t_ndarray x)
+{
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray y = {.raw_data = NULL};
+    y = array_create(2, (int64_t[]){x.shape[INT64_C(0)], x.shape[INT64_C(1)]}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < y.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                y_data[i * y.shape[INT64_C(1)] + i_0001] = GET_ELEMENT(x, nd_double, i, i_0001) - 1.0;
+            }
+        }
+    }
+    return y;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_QOC1NXRF38MP_H
+#define MOD_QOC1NXRF38MP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray f4(t_ndarray x);
+#endif // mod_qoc1nxrf38mp_H
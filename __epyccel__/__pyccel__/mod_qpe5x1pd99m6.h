@@ -0,0 +1,12 @@
+#ifndef MOD_QPE5X1PD99M6_H
+#define MOD_QPE5X1PD99M6_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_idiv(t_ndarray x, int64_t a);
+#endif // mod_qpe5x1pd99m6_H
@@ -0,0 +1,13 @@
+#include "mod_qpkrynia0whk.h"
+
+
+/*........................................*/
+int64_t get_complex64(float complex* compl, float* Out_0001, float* Out_0002)
+{
+    (*compl) = (3.0f + 4.0f * _Complex_I);
+    (*Out_0001) = creal((*compl));
+    (*Out_0002) = cimag((*compl));
+    return 0;
+}
+/*........................................*/
+
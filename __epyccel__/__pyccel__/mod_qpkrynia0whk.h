@@ -0,0 +1,11 @@
+#ifndef MOD_QPKRYNIA0WHK_H
+#define MOD_QPKRYNIA0WHK_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t get_complex64(float complex* compl, float* Out_0001, float* Out_0002);
+#endif // mod_qpkrynia0whk_H
@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_QPKRYNIA0WHK_WRAPPER
+
+#include "mod_qpkrynia0whk_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex64_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* compl_obj;
+    float complex compl;
+    PyObject* Out_0001_obj;
+    float Out_0001;
+    PyObject* Out_0002_obj;
+    float Out_0002;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    get_complex64(&compl, &Out_0001, &Out_0002);
+    compl_obj = Complex64_to_NumpyComplex(&compl);
+    Out_0001_obj = Float_to_NumpyDouble(&Out_0001);
+    Out_0002_obj = Float_to_NumpyDouble(&Out_0002);
+    Out_obj = Py_BuildValue("OOO", compl_obj, Out_0001_obj, Out_0002_obj);
+    Py_DECREF(compl_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_qpkrynia0whk_methods[] = {
+    {
+        "get_complex64",
+        (PyCFunction)get_complex64_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_qpkrynia0whk_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_qpkrynia0whk",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_qpkrynia0whk_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_qpkrynia0whk(void)
+{
+    PyObject* mod;
+    static void* Pymod_qpkrynia0whk_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_qpkrynia0whk_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_qpkrynia0whk_API, "mod_qpkrynia0whk._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,10 @@
+#include "mod_qrd30l2zboxq.h"
+
+
+/*........................................*/
+int64_t add(int64_t a, int64_t b)
+{
+    return a + b;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_QRD30L2ZBOXQ_H
+#define MOD_QRD30L2ZBOXQ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t add(int64_t a, int64_t b);
+#endif // mod_qrd30l2zboxq_H
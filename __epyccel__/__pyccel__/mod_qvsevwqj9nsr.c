@@ -0,0 +1,12 @@
+#include "mod_qvsevwqj9nsr.h"
+
+
+/*........................................*/
+int64_t tuple_slice(int64_t* a, int64_t* b)
+{
+    (*a) = INT64_C(1);
+    (*b) = INT64_C(2);
+    return 0;
+}
+/*........................................*/
+
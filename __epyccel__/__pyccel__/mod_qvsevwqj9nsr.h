@@ -0,0 +1,10 @@
+#ifndef MOD_QVSEVWQJ9NSR_H
+#define MOD_QVSEVWQJ9NSR_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_slice(int64_t* a, int64_t* b);
+#endif // mod_qvsevwqj9nsr_H
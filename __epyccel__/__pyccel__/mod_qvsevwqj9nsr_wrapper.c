@@ -0,0 +1,86 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_QVSEVWQJ9NSR_WRAPPER
+
+#include "mod_qvsevwqj9nsr_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tuple_slice_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t a;
+    PyObject* b_obj;
+    int64_t b;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    tuple_slice(&a, &b);
+    a_obj = Int64_to_PyLong(&a);
+    b_obj = Int64_to_PyLong(&b);
+    Out_obj = Py_BuildValue("OO", a_obj, b_obj);
+    Py_DECREF(a_obj);
+    Py_DECREF(b_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_qvsevwqj9nsr_methods[] = {
+    {
+        "tuple_slice",
+        (PyCFunction)tuple_slice_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_qvsevwqj9nsr_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_qvsevwqj9nsr",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_qvsevwqj9nsr_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_qvsevwqj9nsr(void)
+{
+    PyObject* mod;
+    static void* Pymod_qvsevwqj9nsr_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_qvsevwqj9nsr_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_qvsevwqj9nsr_API, "mod_qvsevwqj9nsr._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
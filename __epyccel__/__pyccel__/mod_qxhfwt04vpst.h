@@ -0,0 +1,12 @@
+#ifndef MOD_QXHFWT04VPST_H
+#define MOD_QXHFWT04VPST_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_zeros_like_val_float_auto(void);
+#endif // mod_qxhfwt04vpst_H
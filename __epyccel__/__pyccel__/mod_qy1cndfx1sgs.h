@@ -0,0 +1,11 @@
+#ifndef MOD_QY1CNDFX1SGS_H
+#define MOD_QY1CNDFX1SGS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_sub(t_ndarray x, double a);
+#endif // mod_qy1cndfx1sgs_H
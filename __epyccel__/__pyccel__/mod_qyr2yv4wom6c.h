@@ -0,0 +1,12 @@
+#ifndef MOD_QYR2YV4WOM6C_H
+#define MOD_QYR2YV4WOM6C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int32_t create_zeros_like_val_int32_auto(void);
+#endif // mod_qyr2yv4wom6c_H
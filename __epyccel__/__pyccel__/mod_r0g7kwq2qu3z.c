@@ -0,0 +1,76 @@
+#include "mod_r0g7kwq2qu3z.h"
+
+
+/*........................................*/
+int16_t get_int16_0000(bool a)
+{
+    int16_t b;
+    b = (int16_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_int16_0001(int64_t a)
+{
+    int16_t b;
+    b = (int16_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_int16_0002(int8_t a)
+{
+    int16_t b;
+    b = (int16_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_int16_0003(int16_t a)
+{
+    int16_t b;
+    b = (int16_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_int16_0004(int32_t a)
+{
+    int16_t b;
+    b = (int16_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_int16_0005(int64_t a)
+{
+    int16_t b;
+    b = (int16_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_int16_0006(double a)
+{
+    int16_t b;
+    b = (int16_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_int16_0007(float a)
+{
+    int16_t b;
+    b = (int16_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int16_t get_int16_0008(double a)
+{
+    int16_t b;
+    b = (int16_t)(a);
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,19 @@
+#ifndef MOD_R0G7KWQ2QU3Z_H
+#define MOD_R0G7KWQ2QU3Z_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int16_t get_int16_0000(bool a);
+int16_t get_int16_0001(int64_t a);
+int16_t get_int16_0002(int8_t a);
+int16_t get_int16_0003(int16_t a);
+int16_t get_int16_0004(int32_t a);
+int16_t get_int16_0005(int64_t a);
+int16_t get_int16_0006(double a);
+int16_t get_int16_0007(float a);
+int16_t get_int16_0008(double a);
+#endif // mod_r0g7kwq2qu3z_H
@@ -0,0 +1,11 @@
+#ifndef MOD_R13BDOC37PHC_H
+#define MOD_R13BDOC37PHC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray arr_tuple_slice_index(t_ndarray a);
+#endif // mod_r13bdoc37phc_H
@@ -0,0 +1,22 @@
+#include "mod_r8ykyru9jfq9.h"
+
+
+/*........................................*/
+int64_t tuple_indexing_basic(void)
+{
+    t_ndarray ai = {.raw_data = NULL};
+    int64_t i;
+    int64_t z;
+    ai = array_create(1, (int64_t[]){INT64_C(4)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4)};
+    memcpy(&ai.nd_int64[INT64_C(0)], Dummy_0000, 4 * ai.type_size);
+    z = INT64_C(0);
+    for (i = INT64_C(0); i < INT64_C(4); i += INT64_C(1))
+    {
+        z += GET_ELEMENT(ai, nd_int64, i);
+    }
+    free_array(&ai);
+    return z;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_R8YKYRU9JFQ9_H
+#define MOD_R8YKYRU9JFQ9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_indexing_basic(void);
+#endif // mod_r8ykyru9jfq9_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_R8YKYRU9JFQ9_WRAPPER
+
+#include "mod_r8ykyru9jfq9_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tuple_indexing_basic_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int64_t z;
+    PyObject* z_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    z = tuple_indexing_basic();
+    z_obj = Int64_to_PyLong(&z);
+    return z_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_r8ykyru9jfq9_methods[] = {
+    {
+        "tuple_indexing_basic",
+        (PyCFunction)tuple_indexing_basic_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_r8ykyru9jfq9_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_r8ykyru9jfq9",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_r8ykyru9jfq9_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_r8ykyru9jfq9(void)
+{
+    PyObject* mod;
+    static void* Pymod_r8ykyru9jfq9_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_r8ykyru9jfq9_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_r8ykyru9jfq9_API, "mod_r8ykyru9jfq9._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
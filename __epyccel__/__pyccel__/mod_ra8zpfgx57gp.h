@@ -0,0 +1,11 @@
+#ifndef MOD_RA8ZPFGX57GP_H
+#define MOD_RA8ZPFGX57GP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_sub(t_ndarray x, t_ndarray y);
+#endif // mod_ra8zpfgx57gp_H
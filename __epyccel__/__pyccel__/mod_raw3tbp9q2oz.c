@@ -0,0 +1,27 @@
+#include "mod_raw3tbp9q2oz.h"
+
+
+/*........................................*/
+void f7(int64_t m1, int64_t m2, t_ndarray x)
+{
+    int64_t i;
+    int64_t j;
+    int64_t i_0001;
+    int64_t i_0002;
+    for (i_0001 = INT64_C(0); i_0001 < x.shape[INT64_C(0)]; i_0001 += INT64_C(1))
+    {
+        for (i_0002 = INT64_C(0); i_0002 < x.shape[INT64_C(1)]; i_0002 += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_double, i_0001, i_0002) = 0.0;
+        }
+    }
+    for (i = INT64_C(0); i < m1; i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < m2; j += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_double, i, j) = (INT64_C(2) * i + j) * 1.0;
+        }
+    }
+}
+/*........................................*/
+
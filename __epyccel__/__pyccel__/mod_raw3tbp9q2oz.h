@@ -0,0 +1,11 @@
+#ifndef MOD_RAW3TBP9Q2OZ_H
+#define MOD_RAW3TBP9Q2OZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f7(int64_t m1, int64_t m2, t_ndarray x);
+#endif // mod_raw3tbp9q2oz_H
@@ -0,0 +1,13 @@
+#include "mod_rb1lkhx0id6b.h"
+
+
+/*........................................*/
+int64_t tuple_unpacking_2(int64_t* a, bool* b, double* c)
+{
+    (*a) = INT64_C(1);
+    (*b) = 0;
+    (*c) = 3.5;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_RB1LKHX0ID6B_H
+#define MOD_RB1LKHX0ID6B_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_unpacking_2(int64_t* a, bool* b, double* c);
+#endif // mod_rb1lkhx0id6b_H
@@ -0,0 +1,40 @@
+#ifndef MOD_RB1LKHX0ID6B_WRAPPER_H
+#define MOD_RB1LKHX0ID6B_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_rb1lkhx0id6b.h"
+
+
+#ifdef MOD_RB1LKHX0ID6B_WRAPPER
+
+
+#else
+
+static void** Pymod_rb1lkhx0id6b_API;
+
+
+/*........................................*/
+static int mod_rb1lkhx0id6b_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_rb1lkhx0id6b_API = (void**)PyCapsule_Import("mod_rb1lkhx0id6b._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_rb1lkhx0id6b_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_RB1LKHX0ID6B_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_RB4OLRBGMH3Q_H
+#define MOD_RB4OLRBGMH3Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_rb4olrbgmh3q_H
@@ -0,0 +1,29 @@
+#include "mod_rcdx0f5yzufn.h"
+
+
+/*........................................*/
+int64_t tuples_homogeneous_have_pointers(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c_0 = {.raw_data = NULL};
+    t_ndarray c_1 = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    array_fill((double)0.0, a);
+    b = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    array_fill((double)0.0, b);
+    alias_assign(&c_0, a);
+    alias_assign(&c_1, b);
+    a.nd_double[INT64_C(1)] = INT64_C(4);
+    (*Out_0001) = c_0.nd_double[INT64_C(0)];
+    (*Out_0002) = c_0.nd_double[INT64_C(1)];
+    (*Out_0003) = c_1.nd_double[INT64_C(0)];
+    (*Out_0004) = c_1.nd_double[INT64_C(1)];
+    free_pointer(&c_0);
+    free_pointer(&c_1);
+    free_array(&a);
+    free_array(&b);
+    return 0;
+}
+/*........................................*/
+
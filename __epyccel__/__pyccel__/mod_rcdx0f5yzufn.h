@@ -0,0 +1,11 @@
+#ifndef MOD_RCDX0F5YZUFN_H
+#define MOD_RCDX0F5YZUFN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_homogeneous_have_pointers(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004);
+#endif // mod_rcdx0f5yzufn_H
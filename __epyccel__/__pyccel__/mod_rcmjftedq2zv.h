@@ -0,0 +1,12 @@
+#ifndef MOD_RCMJFTEDQ2ZV_H
+#define MOD_RCMJFTEDQ2ZV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float create_zeros_like_val_float32_auto(void);
+#endif // mod_rcmjftedq2zv_H
@@ -0,0 +1,12 @@
+#include "mod_rdi3mz0xzp1t.h"
+
+
+/*........................................*/
+int64_t floor_return_type_int(int64_t x)
+{
+    int64_t a;
+    a = (int64_t)floor((double)(x));
+    return a;
+}
+/*........................................*/
+
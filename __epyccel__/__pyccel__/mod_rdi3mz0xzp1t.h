@@ -0,0 +1,11 @@
+#ifndef MOD_RDI3MZ0XZP1T_H
+#define MOD_RDI3MZ0XZP1T_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t floor_return_type_int(int64_t x);
+#endif // mod_rdi3mz0xzp1t_H
@@ -0,0 +1,11 @@
+#ifndef MOD_RDUNJ3O9MKGG_H
+#define MOD_RDUNJ3O9MKGG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_sum_stack_array(void);
+#endif // mod_rdunj3o9mkgg_H
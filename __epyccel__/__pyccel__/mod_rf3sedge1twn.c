@@ -0,0 +1,65 @@
+#include "mod_rf3sedge1twn.h"
+
+
+/*........................................*/
+int64_t tuples_mul_mixed_homogeneous_2d(int64_t* Out_0001, int64_t* Out_0002, bool* Out_0003, bool* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, bool* Out_0009, bool* Out_0010, int64_t* Out_0011, int64_t* Out_0012)
+{
+    t_ndarray a_0 = {.raw_data = NULL};
+    t_ndarray a_1 = {.raw_data = NULL};
+    t_ndarray a_2 = {.raw_data = NULL};
+    t_ndarray b_0 = {.raw_data = NULL};
+    t_ndarray b_1 = {.raw_data = NULL};
+    t_ndarray b_2 = {.raw_data = NULL};
+    t_ndarray b_3 = {.raw_data = NULL};
+    t_ndarray b_4 = {.raw_data = NULL};
+    t_ndarray b_5 = {.raw_data = NULL};
+    int64_t i;
+    a_0 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    a_1 = array_create(1, (int64_t[]){INT64_C(2)}, nd_bool, false, order_c);
+    a_2 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2)};
+    memcpy(&a_0.nd_int64[INT64_C(0)], Dummy_0000, 2 * a_0.type_size);
+    bool Dummy_0001[] = {1, 0};
+    memcpy(&a_1.nd_bool[INT64_C(0)], Dummy_0001, 2 * a_1.type_size);
+    int64_t Dummy_0002[] = {INT64_C(5), INT64_C(6)};
+    memcpy(&a_2.nd_int64[INT64_C(0)], Dummy_0002, 2 * a_2.type_size);
+    b_0 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    b_1 = array_create(1, (int64_t[]){INT64_C(2)}, nd_bool, false, order_c);
+    b_2 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    b_3 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    b_4 = array_create(1, (int64_t[]){INT64_C(2)}, nd_bool, false, order_c);
+    b_5 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+    {
+        GET_ELEMENT(b_0, nd_int64, i) = GET_ELEMENT(a_0, nd_int64, i);
+        GET_ELEMENT(b_1, nd_bool, i) = GET_ELEMENT(a_1, nd_bool, i);
+        GET_ELEMENT(b_2, nd_int64, i) = GET_ELEMENT(a_2, nd_int64, i);
+        GET_ELEMENT(b_3, nd_int64, i) = GET_ELEMENT(a_0, nd_int64, i);
+        GET_ELEMENT(b_4, nd_bool, i) = GET_ELEMENT(a_1, nd_bool, i);
+        GET_ELEMENT(b_5, nd_int64, i) = GET_ELEMENT(a_2, nd_int64, i);
+    }
+    (*Out_0001) = GET_ELEMENT(b_0, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(b_0, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(b_1, nd_bool, INT64_C(0));
+    (*Out_0004) = GET_ELEMENT(b_1, nd_bool, INT64_C(1));
+    (*Out_0005) = GET_ELEMENT(b_2, nd_int64, INT64_C(0));
+    (*Out_0006) = GET_ELEMENT(b_2, nd_int64, INT64_C(1));
+    (*Out_0007) = GET_ELEMENT(b_3, nd_int64, INT64_C(0));
+    (*Out_0008) = GET_ELEMENT(b_3, nd_int64, INT64_C(1));
+    (*Out_0009) = GET_ELEMENT(b_4, nd_bool, INT64_C(0));
+    (*Out_0010) = GET_ELEMENT(b_4, nd_bool, INT64_C(1));
+    (*Out_0011) = GET_ELEMENT(b_5, nd_int64, INT64_C(0));
+    (*Out_0012) = GET_ELEMENT(b_5, nd_int64, INT64_C(1));
+    free_array(&b_0);
+    free_array(&b_4);
+    free_array(&a_0);
+    free_array(&a_2);
+    free_array(&b_2);
+    free_array(&b_3);
+    free_array(&a_1);
+    free_array(&b_5);
+    free_array(&b_1);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_RF3SEDGE1TWN_H
+#define MOD_RF3SEDGE1TWN_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuples_mul_mixed_homogeneous_2d(int64_t* Out_0001, int64_t* Out_0002, bool* Out_0003, bool* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, bool* Out_0009, bool* Out_0010, int64_t* Out_0011, int64_t* Out_0012);
+#endif // mod_rf3sedge1twn_H
@@ -0,0 +1,12 @@
+#include "mod_rge2lzlqsu3z.h"
+
+
+/*........................................*/
+double min_call(t_ndarray x)
+{
+    double Out_0001;
+    Out_0001 = numpy_amin_float64(x);
+    return Out_0001;
+}
+/*........................................*/
+
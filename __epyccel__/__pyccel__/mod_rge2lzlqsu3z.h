@@ -0,0 +1,10 @@
+#ifndef MOD_RGE2LZLQSU3Z_H
+#define MOD_RGE2LZLQSU3Z_H
+
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+double min_call(t_ndarray x);
+#endif // mod_rge2lzlqsu3z_H
@@ -0,0 +1,40 @@
+#ifndef MOD_RIK83K3MB3KY_WRAPPER_H
+#define MOD_RIK83K3MB3KY_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_RIK83K3MB3KY_WRAPPER
+
+double bind_c_f(int64_t);
+
+#else
+
+static void** Pymod_rik83k3mb3ky_API;
+
+
+/*........................................*/
+static int mod_rik83k3mb3ky_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_rik83k3mb3ky_API = (void**)PyCapsule_Import("mod_rik83k3mb3ky._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_rik83k3mb3ky_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_RIK83K3MB3KY_WRAPPER_H
@@ -0,0 +1,10 @@
+#include "mod_riqpu1x8rokg.h"
+
+
+/*........................................*/
+int64_t trunc_type(double x)
+{
+    return trunc(x);
+}
+/*........................................*/
+
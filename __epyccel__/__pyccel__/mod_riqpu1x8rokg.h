@@ -0,0 +1,11 @@
+#ifndef MOD_RIQPU1X8ROKG_H
+#define MOD_RIQPU1X8ROKG_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t trunc_type(double x);
+#endif // mod_riqpu1x8rokg_H
@@ -0,0 +1,11 @@
+#ifndef MOD_RK18WSP5CF0I_H
+#define MOD_RK18WSP5CF0I_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(int64_t i);
+#endif // mod_rk18wsp5cf0i_H
@@ -0,0 +1,12 @@
+#include "mod_rk6twr9jvlv5.h"
+
+
+/*........................................*/
+double atanh_phrase(double x, double y)
+{
+    double a;
+    a = atanh(x) + atanh(y);
+    return a;
+}
+/*........................................*/
+
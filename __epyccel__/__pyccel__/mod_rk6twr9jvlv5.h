@@ -0,0 +1,10 @@
+#ifndef MOD_RK6TWR9JVLV5_H
+#define MOD_RK6TWR9JVLV5_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double atanh_phrase(double x, double y);
+#endif // mod_rk6twr9jvlv5_H
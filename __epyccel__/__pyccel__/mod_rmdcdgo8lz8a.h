@@ -0,0 +1,10 @@
+#ifndef MOD_RMDCDGO8LZ8A_H
+#define MOD_RMDCDGO8LZ8A_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_range_sum_critical(int64_t x);
+#endif // mod_rmdcdgo8lz8a_H
@@ -0,0 +1,10 @@
+#include "mod_rmdt69rrzx8j.h"
+
+
+/*........................................*/
+double expm1_call(double x)
+{
+    return expm1(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_RMDT69RRZX8J_H
+#define MOD_RMDT69RRZX8J_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double expm1_call(double x);
+#endif // mod_rmdt69rrzx8j_H
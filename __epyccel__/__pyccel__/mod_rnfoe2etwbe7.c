@@ -0,0 +1,10 @@
+#include "mod_rnfoe2etwbe7.h"
+
+
+/*........................................*/
+double fabs_call(double x)
+{
+    return fabs(x);
+}
+/*........................................*/
+
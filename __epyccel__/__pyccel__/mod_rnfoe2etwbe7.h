@@ -0,0 +1,10 @@
+#ifndef MOD_RNFOE2ETWBE7_H
+#define MOD_RNFOE2ETWBE7_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double fabs_call(double x);
+#endif // mod_rnfoe2etwbe7_H
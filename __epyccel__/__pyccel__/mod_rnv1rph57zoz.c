@@ -0,0 +1,32 @@
+#include "mod_rnv1rph57zoz.h"
+
+
+/*........................................*/
+int64_t f(bool b1, bool b2)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t n;
+    if (b1)
+    {
+        if (b2)
+        {
+            n = INT64_C(0);
+        }
+        else
+        {
+            x = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+            array_fill((int64_t)INT64_C(0), x);
+            n = INT64_C(3);
+        }
+    }
+    else
+    {
+        x = array_create(1, (int64_t[]){INT64_C(4)}, nd_int64, false, order_c);
+        array_fill((int64_t)INT64_C(0), x);
+        n = x.shape[INT64_C(0)];
+    }
+    free_array(&x);
+    return n;
+}
+/*........................................*/
+
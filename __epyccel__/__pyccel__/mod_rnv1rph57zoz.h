@@ -0,0 +1,12 @@
+#ifndef MOD_RNV1RPH57ZOZ_H
+#define MOD_RNV1RPH57ZOZ_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(bool b1, bool b2);
+#endif // mod_rnv1rph57zoz_H
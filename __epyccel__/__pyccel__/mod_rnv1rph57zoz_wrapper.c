@@ -0,0 +1,104 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_RNV1RPH57ZOZ_WRAPPER
+
+#include "mod_rnv1rph57zoz_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* b1_obj;
+    PyObject* b2_obj;
+    bool b1;
+    bool b2;
+    int64_t n;
+    PyObject* n_obj;
+    static const char* const kwlist[] = {
+        "b1",
+        "b2",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &b1_obj, &b2_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Bool(b1_obj))
+    {
+        b1 = PyBool_to_Bool(b1_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument b1");
+        return NULL;
+    }
+    if (PyIs_Bool(b2_obj))
+    {
+        b2 = PyBool_to_Bool(b2_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument b2");
+        return NULL;
+    }
+    n = f(b1, b2);
+    n_obj = Int64_to_PyLong(&n);
+    return n_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_rnv1rph57zoz_methods[] = {
+    {
+        "f",
+        (PyCFunction)f_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_rnv1rph57zoz_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_rnv1rph57zoz",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_rnv1rph57zoz_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_rnv1rph57zoz(void)
+{
+    PyObject* mod;
+    static void* Pymod_rnv1rph57zoz_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_rnv1rph57zoz_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_rnv1rph57zoz_API, "mod_rnv1rph57zoz._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
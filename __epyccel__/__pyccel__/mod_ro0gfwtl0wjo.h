@@ -0,0 +1,11 @@
+#ifndef MOD_RO0GFWTL0WJO_H
+#define MOD_RO0GFWTL0WJO_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_level(void);
+#endif // mod_ro0gfwtl0wjo_H
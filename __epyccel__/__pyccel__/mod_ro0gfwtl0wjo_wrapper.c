@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_RO0GFWTL0WJO_WRAPPER
+
+#include "mod_ro0gfwtl0wjo_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_get_level_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t nested_parallel_regions;
+    PyObject* nested_parallel_regions_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    nested_parallel_regions = test_omp_get_level();
+    nested_parallel_regions_obj = Int32_to_NumpyLong(&nested_parallel_regions);
+    return nested_parallel_regions_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ro0gfwtl0wjo_methods[] = {
+    {
+        "test_omp_get_level",
+        (PyCFunction)test_omp_get_level_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ro0gfwtl0wjo_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ro0gfwtl0wjo",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ro0gfwtl0wjo_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ro0gfwtl0wjo(void)
+{
+    PyObject* mod;
+    static void* Pymod_ro0gfwtl0wjo_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ro0gfwtl0wjo_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ro0gfwtl0wjo_API, "mod_ro0gfwtl0wjo._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_RRJYT23PGDV4_H
+#define MOD_RRJYT23PGDV4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_nowait(t_ndarray x, t_ndarray y, t_ndarray z);
+#endif // mod_rrjyt23pgdv4_H
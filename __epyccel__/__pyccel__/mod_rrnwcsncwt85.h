@@ -0,0 +1,11 @@
+#ifndef MOD_RRNWCSNCWT85_H
+#define MOD_RRNWCSNCWT85_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_get_cancellation(void);
+#endif // mod_rrnwcsncwt85_H
@@ -0,0 +1,10 @@
+#include "mod_rs8q0u40sh7w.h"
+
+
+/*........................................*/
+bool isnan_call(double x)
+{
+    return isnan(x);
+}
+/*........................................*/
+
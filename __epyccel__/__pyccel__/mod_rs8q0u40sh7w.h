@@ -0,0 +1,11 @@
+#ifndef MOD_RS8Q0U40SH7W_H
+#define MOD_RS8Q0U40SH7W_H
+
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool isnan_call(double x);
+#endif // mod_rs8q0u40sh7w_H
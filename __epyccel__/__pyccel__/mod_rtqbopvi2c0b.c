@@ -0,0 +1,11 @@
+#include "mod_rtqbopvi2c0b.h"
+
+
+/*........................................*/
+void tuple_unpacking_3(t_ndarray x)
+{
+    GET_ELEMENT(x, nd_int64, INT64_C(0), INT64_C(0)) = INT64_C(2);
+    GET_ELEMENT(x, nd_int64, INT64_C(1), INT64_C(0)) = INT64_C(2);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_RTQBOPVI2C0B_H
+#define MOD_RTQBOPVI2C0B_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void tuple_unpacking_3(t_ndarray x);
+#endif // mod_rtqbopvi2c0b_H
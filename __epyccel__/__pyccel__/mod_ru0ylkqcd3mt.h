@@ -0,0 +1,12 @@
+#ifndef MOD_RU0YLKQCD3MT_H
+#define MOD_RU0YLKQCD3MT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_full_like_val_int_float_auto(int64_t val);
+#endif // mod_ru0ylkqcd3mt_H
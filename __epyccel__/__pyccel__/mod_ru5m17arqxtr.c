@@ -0,0 +1,26 @@
+#include "mod_ru5m17arqxtr.h"
+
+
+/*........................................*/
+int64_t arrs_similar_shapes_0(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){INT64_C(10)}, nd_double, false, order_c);
+    array_fill((double)0.0, a);
+    b = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            b_data[i] = a_data[i + INT64_C(2)] + a_data[i + INT64_C(4)];
+        }
+    }
+    free_array(&b);
+    free_array(&a);
+    return INT64_C(2);
+}
+/*........................................*/
+
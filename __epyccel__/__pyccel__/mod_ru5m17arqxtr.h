@@ -0,0 +1,11 @@
+#ifndef MOD_RU5M17ARQXTR_H
+#define MOD_RU5M17ARQXTR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_0(void);
+#endif // mod_ru5m17arqxtr_H
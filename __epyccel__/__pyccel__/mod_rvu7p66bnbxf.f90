@@ -0,0 +1,40 @@
+module mod_rvu7p66bnbxf
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine sqrt_fused(a, b, c, v) 
+
+    implicit none
+
+    real(f64), intent(in) :: a(0_i64:)
+    real(f64), intent(in) :: b(0_i64:)
+    real(f64), intent(in) :: c(0_i64:)
+    real(f64), intent(inout) :: v(0_i64:)
+    real(f64), allocatable :: t(:)
+    real(f64), allocatable :: u(:)
+    integer(i64) :: i
+    real(f64) :: t_0001
+    real(f64) :: u_0001
+
+    do i = 0_i64, size(a, kind=i64) - 1_i64
+      t_0001 = a(i) * b(i)
+      u_0001 = t_0001 + c(i)
+      v(i) = sqrt(u_0001)
+    end do
+    if (allocated(t)) then
+      deallocate(t)
+    end if
+    if (allocated(u)) then
+      deallocate(u)
+    end if
+
+  end subroutine sqrt_fused
+  !........................................
+
+end module mod_rvu7p66bnbxf
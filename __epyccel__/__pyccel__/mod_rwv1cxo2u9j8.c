@@ -0,0 +1,14 @@
+#include "mod_rwv1cxo2u9j8.h"
+
+
+/*........................................*/
+void array_int_1d_idiv(t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i) = (int64_t)floor((double)(GET_ELEMENT(x, nd_int64, i)) / (double)(GET_ELEMENT(y, nd_int64, i)));
+    }
+}
+/*........................................*/
+
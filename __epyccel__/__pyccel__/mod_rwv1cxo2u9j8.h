@@ -0,0 +1,12 @@
+#ifndef MOD_RWV1CXO2U9J8_H
+#define MOD_RWV1CXO2U9J8_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_rwv1cxo2u9j8_H
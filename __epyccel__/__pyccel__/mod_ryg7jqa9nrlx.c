@@ -0,0 +1,19 @@
+#include "mod_ryg7jqa9nrlx.h"
+
+
+/*........................................*/
+int64_t tuple_variable_index(void)
+{
+    int64_t a;
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    int64_t b;
+    a = INT64_C(1);
+    Dummy_0000 = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&Dummy_0000.nd_int64[INT64_C(0)], Dummy_0001, 3 * Dummy_0000.type_size);
+    b = GET_ELEMENT(Dummy_0000, nd_int64, a);
+    free_array(&Dummy_0000);
+    return b;
+}
+/*........................................*/
+
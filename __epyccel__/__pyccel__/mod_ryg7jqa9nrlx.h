@@ -0,0 +1,12 @@
+#ifndef MOD_RYG7JQA9NRLX_H
+#define MOD_RYG7JQA9NRLX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_variable_index(void);
+#endif // mod_ryg7jqa9nrlx_H
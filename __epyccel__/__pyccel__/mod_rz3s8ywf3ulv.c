@@ -0,0 +1,10 @@
+#include "mod_rz3s8ywf3ulv.h"
+
+
+/*........................................*/
+double tan_call_i(int64_t x)
+{
+    return tan((double)(x));
+}
+/*........................................*/
+
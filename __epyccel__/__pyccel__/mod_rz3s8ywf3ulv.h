@@ -0,0 +1,11 @@
+#ifndef MOD_RZ3S8YWF3ULV_H
+#define MOD_RZ3S8YWF3ULV_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double tan_call_i(int64_t x);
+#endif // mod_rz3s8ywf3ulv_H
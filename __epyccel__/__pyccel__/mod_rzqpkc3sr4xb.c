@@ -0,0 +1,16 @@
+#include "mod_rzqpkc3sr4xb.h"
+
+
+/*........................................*/
+int64_t polar_call(double complex x, double* r, double* t)
+{
+    double Dummy_0000;
+    double Dummy_0001;
+    Dummy_0000 = creal(x);
+    Dummy_0001 = cimag(x);
+    (*r) = sqrt(Dummy_0000 * Dummy_0000 + Dummy_0001 * Dummy_0001);
+    (*t) = atan2(Dummy_0001, Dummy_0000);
+    return 0;
+}
+/*........................................*/
+
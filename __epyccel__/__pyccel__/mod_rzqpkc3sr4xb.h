@@ -0,0 +1,12 @@
+#ifndef MOD_RZQPKC3SR4XB_H
+#define MOD_RZQPKC3SR4XB_H
+
+#include <complex.h>
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t polar_call(double complex x, double* r, double* t);
+#endif // mod_rzqpkc3sr4xb_H
@@ -0,0 +1,99 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_RZQPKC3SR4XB_WRAPPER
+
+#include "mod_rzqpkc3sr4xb_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* polar_call_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    double complex x;
+    PyObject* r_obj;
+    double r;
+    PyObject* t_obj;
+    double t;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeComplex(x_obj))
+    {
+        x = PyComplex_to_Complex128(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type complex for argument x");
+        return NULL;
+    }
+    polar_call(x, &r, &t);
+    r_obj = Double_to_PyDouble(&r);
+    t_obj = Double_to_PyDouble(&t);
+    Out_obj = Py_BuildValue("OO", r_obj, t_obj);
+    Py_DECREF(r_obj);
+    Py_DECREF(t_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_rzqpkc3sr4xb_methods[] = {
+    {
+        "polar_call",
+        (PyCFunction)polar_call_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_rzqpkc3sr4xb_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_rzqpkc3sr4xb",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_rzqpkc3sr4xb_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_rzqpkc3sr4xb(void)
+{
+    PyObject* mod;
+    static void* Pymod_rzqpkc3sr4xb_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_rzqpkc3sr4xb_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_rzqpkc3sr4xb_API, "mod_rzqpkc3sr4xb._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,40 @@
+#ifndef MOD_RZQPKC3SR4XB_WRAPPER_H
+#define MOD_RZQPKC3SR4XB_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_rzqpkc3sr4xb.h"
+
+
+#ifdef MOD_RZQPKC3SR4XB_WRAPPER
+
+
+#else
+
+static void** Pymod_rzqpkc3sr4xb_API;
+
+
+/*........................................*/
+static int mod_rzqpkc3sr4xb_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_rzqpkc3sr4xb_API = (void**)PyCapsule_Import("mod_rzqpkc3sr4xb._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_rzqpkc3sr4xb_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_RZQPKC3SR4XB_WRAPPER_H
@@ -0,0 +1,12 @@
+#include "mod_s0huwn4je3ri.h"
+
+
+/*........................................*/
+double cos_phrase_r_i(double x, int64_t y)
+{
+    double a;
+    a = cos(x) + cos((double)(y));
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_S0HUWN4JE3RI_H
+#define MOD_S0HUWN4JE3RI_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double cos_phrase_r_i(double x, int64_t y);
+#endif // mod_s0huwn4je3ri_H
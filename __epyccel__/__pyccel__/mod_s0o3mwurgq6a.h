@@ -0,0 +1,11 @@
+#ifndef MOD_S0O3MWURGQ6A_H
+#define MOD_S0O3MWURGQ6A_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_sub(t_ndarray x, t_ndarray y);
+#endif // mod_s0o3mwurgq6a_H
@@ -0,0 +1,13 @@
+#ifndef MOD_S1NB56319AXC_H
+#define MOD_S1NB56319AXC_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_full_like_val_real_complex128(double val);
+#endif // mod_s1nb56319axc_H
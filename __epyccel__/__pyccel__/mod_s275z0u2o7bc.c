@@ -0,0 +1,16 @@
+#include "mod_s275z0u2o7bc.h"
+
+
+/*........................................*/
+bool isnan_call_0000(double complex x)
+{
+    return isnan(cimag(x)) || isnan(creal(x));
+}
+/*........................................*/
+/*........................................*/
+bool isnan_call_0001(double x)
+{
+    return isnan(x);
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_S275Z0U2O7BC_H
+#define MOD_S275Z0U2O7BC_H
+
+#include <complex.h>
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool isnan_call_0000(double complex x);
+bool isnan_call_0001(double x);
+#endif // mod_s275z0u2o7bc_H
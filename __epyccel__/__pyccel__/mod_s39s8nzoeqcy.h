@@ -0,0 +1,11 @@
+#ifndef MOD_S39S8NZOEQCY_H
+#define MOD_S39S8NZOEQCY_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_proc_bind(void);
+#endif // mod_s39s8nzoeqcy_H
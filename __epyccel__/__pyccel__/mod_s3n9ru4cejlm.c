@@ -0,0 +1,10 @@
+#include "mod_s3n9ru4cejlm.h"
+
+
+/*........................................*/
+double ldexp_call(double x, int64_t exp)
+{
+    return ldexp(x, (double)(exp));
+}
+/*........................................*/
+
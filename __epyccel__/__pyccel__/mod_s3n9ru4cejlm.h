@@ -0,0 +1,11 @@
+#ifndef MOD_S3N9RU4CEJLM_H
+#define MOD_S3N9RU4CEJLM_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double ldexp_call(double x, int64_t exp);
+#endif // mod_s3n9ru4cejlm_H
@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_S3N9RU4CEJLM_WRAPPER
+
+#include "mod_s3n9ru4cejlm_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* ldexp_call_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* exp_obj;
+    double x;
+    int64_t exp;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        "exp",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &exp_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(x_obj))
+    {
+        x = PyDouble_to_Double(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument x");
+        return NULL;
+    }
+    if (PyIs_NativeInt(exp_obj))
+    {
+        exp = PyInt64_to_Int64(exp_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument exp");
+        return NULL;
+    }
+    Out_0001 = ldexp_call(x, exp);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_s3n9ru4cejlm_methods[] = {
+    {
+        "ldexp_call",
+        (PyCFunction)ldexp_call_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_s3n9ru4cejlm_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_s3n9ru4cejlm",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_s3n9ru4cejlm_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_s3n9ru4cejlm(void)
+{
+    PyObject* mod;
+    static void* Pymod_s3n9ru4cejlm_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_s3n9ru4cejlm_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_s3n9ru4cejlm_API, "mod_s3n9ru4cejlm._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,31 @@
+#ifndef MOD_S45VD9S9ST5I_H
+#define MOD_S45VD9S9ST5I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_INT64_T
+#define _TOOLS_LIST_VEC_INT64_T
+#define i_type vec_int64_t
+#define i_key int64_t
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_INT64_T
+
+#ifndef _TOOLS_LIST_VEC_INT64_T
+#define _TOOLS_LIST_VEC_INT64_T
+#define i_type vec_int64_t
+#define i_key int64_t
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_INT64_T
+
+
+
+
+void product_loop_on_2d_array_C(t_ndarray z);
+#endif // mod_s45vd9s9st5i_H
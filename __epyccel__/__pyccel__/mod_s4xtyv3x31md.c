@@ -0,0 +1,76 @@
+#include "mod_s4xtyv3x31md.h"
+
+
+/*........................................*/
+double get_double_0000(bool a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_double_0001(int64_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_double_0002(int8_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_double_0003(int16_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_double_0004(int32_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_double_0005(int64_t a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_double_0006(double a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_double_0007(float a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double get_double_0008(double a)
+{
+    double b;
+    b = (double)(a);
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,19 @@
+#ifndef MOD_S4XTYV3X31MD_H
+#define MOD_S4XTYV3X31MD_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double get_double_0000(bool a);
+double get_double_0001(int64_t a);
+double get_double_0002(int8_t a);
+double get_double_0003(int16_t a);
+double get_double_0004(int32_t a);
+double get_double_0005(int64_t a);
+double get_double_0006(double a);
+double get_double_0007(float a);
+double get_double_0008(double a);
+#endif // mod_s4xtyv3x31md_H
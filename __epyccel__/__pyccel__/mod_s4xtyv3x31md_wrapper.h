@@ -0,0 +1,40 @@
+#ifndef MOD_S4XTYV3X31MD_WRAPPER_H
+#define MOD_S4XTYV3X31MD_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_s4xtyv3x31md.h"
+
+
+#ifdef MOD_S4XTYV3X31MD_WRAPPER
+
+
+#else
+
+static void** Pymod_s4xtyv3x31md_API;
+
+
+/*........................................*/
+static int mod_s4xtyv3x31md_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_s4xtyv3x31md_API = (void**)PyCapsule_Import("mod_s4xtyv3x31md._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_s4xtyv3x31md_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_S4XTYV3X31MD_WRAPPER_H
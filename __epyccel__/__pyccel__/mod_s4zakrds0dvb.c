@@ -0,0 +1,34 @@
+#include "mod_s4zakrds0dvb.h"
+
+
+/*........................................*/
+void mix_array_scalar_0000(t_ndarray x)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i) += INT64_C(1);
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_array_scalar_0001(t_ndarray x)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) += INT64_C(1);
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_array_scalar_0002(t_ndarray x)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_cdouble, i) += INT64_C(1);
+    }
+}
+/*........................................*/
+
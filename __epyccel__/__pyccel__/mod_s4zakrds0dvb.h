@@ -0,0 +1,13 @@
+#ifndef MOD_S4ZAKRDS0DVB_H
+#define MOD_S4ZAKRDS0DVB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void mix_array_scalar_0000(t_ndarray x);
+void mix_array_scalar_0001(t_ndarray x);
+void mix_array_scalar_0002(t_ndarray x);
+#endif // mod_s4zakrds0dvb_H
@@ -0,0 +1,12 @@
+#ifndef MOD_S5QAORQ1YT4B_H
+#define MOD_S5QAORQ1YT4B_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_shape_1d(t_ndarray f);
+#endif // mod_s5qaorq1yt4b_H
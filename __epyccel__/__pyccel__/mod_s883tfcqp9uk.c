@@ -0,0 +1,20 @@
+#include "mod_s883tfcqp9uk.h"
+
+
+/*........................................*/
+double expr_arrs_elements(int64_t i)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, a);
+    b = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)0.0, b);
+    Out_0001 = a.nd_double[i - INT64_C(1)] + b.nd_double[i - INT64_C(1)];
+    free_array(&a);
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_S883TFCQP9UK_H
+#define MOD_S883TFCQP9UK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double expr_arrs_elements(int64_t i);
+#endif // mod_s883tfcqp9uk_H
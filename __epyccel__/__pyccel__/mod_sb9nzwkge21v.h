@@ -0,0 +1,12 @@
+#ifndef MOD_SB9NZWKGE21V_H
+#define MOD_SB9NZWKGE21V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_3d_F_array_initialization_2(t_ndarray a);
+#endif // mod_sb9nzwkge21v_H
@@ -0,0 +1,90 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SB9NZWKGE21V_WRAPPER
+
+#include "mod_sb9nzwkge21v_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_3d_F_array_initialization_2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    t_ndarray a = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(3), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    array_float_3d_F_array_initialization_2(a);
+    free_pointer(&a);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_sb9nzwkge21v_methods[] = {
+    {
+        "array_float_3d_F_array_initialization_2",
+        (PyCFunction)array_float_3d_F_array_initialization_2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_sb9nzwkge21v_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_sb9nzwkge21v",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_sb9nzwkge21v_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_sb9nzwkge21v(void)
+{
+    PyObject* mod;
+    static void* Pymod_sb9nzwkge21v_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_sb9nzwkge21v_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_sb9nzwkge21v_API, "mod_sb9nzwkge21v._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_SBLLEQUMUGJ2_H
+#define MOD_SBLLEQUMUGJ2_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_mul_inhomogeneous_2d(int64_t* Out_0001, bool* Out_0002, double* Out_0003, bool* Out_0004, bool* Out_0005, int64_t* Out_0006, int64_t* Out_0007, bool* Out_0008, double* Out_0009, bool* Out_0010, bool* Out_0011, int64_t* Out_0012);
+#endif // mod_sbllequmugj2_H
@@ -0,0 +1,16 @@
+#include "mod_sbqgw3x8azcg.h"
+
+
+/*........................................*/
+double value_types(void)
+{
+    t_ndarray b = {.raw_data = NULL};
+    double Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    array_fill((double)0.0, b);
+    Out_0001 = b.nd_double[INT64_C(0)];
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_SBQGW3X8AZCG_H
+#define MOD_SBQGW3X8AZCG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double value_types(void);
+#endif // mod_sbqgw3x8azcg_H
@@ -0,0 +1,12 @@
+#ifndef MOD_SCBH3Z124BAS_H
+#define MOD_SCBH3Z124BAS_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_scbh3z124bas_H
@@ -0,0 +1,20 @@
+#ifndef MOD_SCQO3QPM9GP1_H
+#define MOD_SCQO3QPM9GP1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_float64_orderF_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006, double* Out_0007, double* Out_0008, double* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float64_orderF_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006, double* Out_0007, double* Out_0008, double* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float64_orderF_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006, double* Out_0007, double* Out_0008, double* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float64_orderF_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006, double* Out_0007, double* Out_0008, double* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float64_orderF_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006, double* Out_0007, double* Out_0008, double* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float64_orderF_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006, double* Out_0007, double* Out_0008, double* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float64_orderF_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006, double* Out_0007, double* Out_0008, double* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float64_orderF_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006, double* Out_0007, double* Out_0008, double* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float64_orderF_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double* Out_0004, double* Out_0005, double* Out_0006, double* Out_0007, double* Out_0008, double* Out_0009);
+#endif // mod_scqo3qpm9gp1_H
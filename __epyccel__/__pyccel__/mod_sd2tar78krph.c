@@ -0,0 +1,10 @@
+#include "mod_sd2tar78krph.h"
+
+
+/*........................................*/
+double exp_call(double x)
+{
+    return exp(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_SD2TAR78KRPH_H
+#define MOD_SD2TAR78KRPH_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double exp_call(double x);
+#endif // mod_sd2tar78krph_H
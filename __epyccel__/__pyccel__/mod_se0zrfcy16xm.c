@@ -0,0 +1,20 @@
+#include "mod_se0zrfcy16xm.h"
+
+
+/*........................................*/
+t_ndarray numpy_isnan_array_test(t_ndarray x)
+{
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    Out_0001 = array_create(1, (int64_t[]){x.shape[INT64_C(0)]}, nd_bool, false, order_c);
+    {
+        bool* restrict Out_0001_data = Out_0001.nd_bool;
+        for (i = INT64_C(0); i < Out_0001.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Out_0001_data[i] = isnan(GET_ELEMENT(x, nd_double, i));
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_SE0ZRFCY16XM_H
+#define MOD_SE0ZRFCY16XM_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray numpy_isnan_array_test(t_ndarray x);
+#endif // mod_se0zrfcy16xm_H
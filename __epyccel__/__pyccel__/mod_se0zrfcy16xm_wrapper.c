@@ -0,0 +1,93 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SE0ZRFCY16XM_WRAPPER
+
+#include "mod_se0zrfcy16xm_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* numpy_isnan_array_test_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    Out_0001 = numpy_isnan_array_test(x);
+    free_pointer(&x);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_se0zrfcy16xm_methods[] = {
+    {
+        "numpy_isnan_array_test",
+        (PyCFunction)numpy_isnan_array_test_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_se0zrfcy16xm_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_se0zrfcy16xm",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_se0zrfcy16xm_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_se0zrfcy16xm(void)
+{
+    PyObject* mod;
+    static void* Pymod_se0zrfcy16xm_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_se0zrfcy16xm_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_se0zrfcy16xm_API, "mod_se0zrfcy16xm._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#include "mod_seh1k30pmobn.h"
+
+
+/*........................................*/
+double complex exp_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = cexp(x) + cexp(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_SEH1K30PMOBN_H
+#define MOD_SEH1K30PMOBN_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex exp_phrase(double complex x, double complex y);
+#endif // mod_seh1k30pmobn_H
@@ -0,0 +1,12 @@
+#include "mod_sgsdbpcjtbwb.h"
+
+
+/*........................................*/
+double complex asin_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = casin(x) + casin(y);
+    return a;
+}
+/*........................................*/
+
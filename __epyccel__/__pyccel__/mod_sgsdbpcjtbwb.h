@@ -0,0 +1,10 @@
+#ifndef MOD_SGSDBPCJTBWB_H
+#define MOD_SGSDBPCJTBWB_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex asin_phrase(double complex x, double complex y);
+#endif // mod_sgsdbpcjtbwb_H
@@ -0,0 +1,104 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SGSDBPCJTBWB_WRAPPER
+
+#include "mod_sgsdbpcjtbwb_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* asin_phrase_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    double complex x;
+    double complex y;
+    double complex a;
+    PyObject* a_obj;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeComplex(x_obj))
+    {
+        x = PyComplex_to_Complex128(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type complex for argument x");
+        return NULL;
+    }
+    if (PyIs_NativeComplex(y_obj))
+    {
+        y = PyComplex_to_Complex128(y_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type complex for argument y");
+        return NULL;
+    }
+    a = asin_phrase(x, y);
+    a_obj = Complex128_to_PyComplex(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_sgsdbpcjtbwb_methods[] = {
+    {
+        "asin_phrase",
+        (PyCFunction)asin_phrase_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_sgsdbpcjtbwb_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_sgsdbpcjtbwb",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_sgsdbpcjtbwb_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_sgsdbpcjtbwb(void)
+{
+    PyObject* mod;
+    static void* Pymod_sgsdbpcjtbwb_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_sgsdbpcjtbwb_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_sgsdbpcjtbwb_API, "mod_sgsdbpcjtbwb._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#include "mod_sh4tn0yuodw5.h"
+
+
+/*........................................*/
+double max_call(t_ndarray x)
+{
+    double Out_0001;
+    Out_0001 = numpy_amax_float64(x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_SH4TN0YUODW5_H
+#define MOD_SH4TN0YUODW5_H
+
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+double max_call(t_ndarray x);
+#endif // mod_sh4tn0yuodw5_H
@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SH4TN0YUODW5_WRAPPER
+
+#include "mod_sh4tn0yuodw5_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* max_call_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    Out_0001 = max_call(x);
+    free_pointer(&x);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_sh4tn0yuodw5_methods[] = {
+    {
+        "max_call",
+        (PyCFunction)max_call_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_sh4tn0yuodw5_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_sh4tn0yuodw5",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_sh4tn0yuodw5_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_sh4tn0yuodw5(void)
+{
+    PyObject* mod;
+    static void* Pymod_sh4tn0yuodw5_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_sh4tn0yuodw5_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_sh4tn0yuodw5_API, "mod_sh4tn0yuodw5._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
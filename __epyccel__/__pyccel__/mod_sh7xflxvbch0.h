@@ -0,0 +1,11 @@
+#ifndef MOD_SH7XFLXVBCH0_H
+#define MOD_SH7XFLXVBCH0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_sh7xflxvbch0_H
@@ -0,0 +1,102 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SH7XFLXVBCH0_WRAPPER
+
+#include "mod_sh7xflxvbch0_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_2d_C_add_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("y", y_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        y = pyarray_to_ndarray(y_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    array_float_2d_C_add(x, y);
+    free_pointer(&x);
+    free_pointer(&y);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_sh7xflxvbch0_methods[] = {
+    {
+        "array_float_2d_C_add",
+        (PyCFunction)array_float_2d_C_add_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_sh7xflxvbch0_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_sh7xflxvbch0",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_sh7xflxvbch0_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_sh7xflxvbch0(void)
+{
+    PyObject* mod;
+    static void* Pymod_sh7xflxvbch0_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_sh7xflxvbch0_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_sh7xflxvbch0_API, "mod_sh7xflxvbch0._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_SJU2TOD09ZMR_H
+#define MOD_SJU2TOD09ZMR_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_set_max_active_levels(int64_t max_active_levels);
+#endif // mod_sju2tod09zmr_H
@@ -0,0 +1,10 @@
+#include "mod_sjzsr7f4oq0q.h"
+
+
+/*........................................*/
+double arctan2_call(int64_t x, double y)
+{
+    return atan2((double)(x), y);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_SJZSR7F4OQ0Q_H
+#define MOD_SJZSR7F4OQ0Q_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arctan2_call(int64_t x, double y);
+#endif // mod_sjzsr7f4oq0q_H
@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SJZSR7F4OQ0Q_WRAPPER
+
+#include "mod_sjzsr7f4oq0q_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* arctan2_call_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    int64_t x;
+    double y;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(x_obj))
+    {
+        x = PyInt64_to_Int64(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument x");
+        return NULL;
+    }
+    if (PyIs_NativeFloat(y_obj))
+    {
+        y = PyDouble_to_Double(y_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument y");
+        return NULL;
+    }
+    Out_0001 = arctan2_call(x, y);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_sjzsr7f4oq0q_methods[] = {
+    {
+        "arctan2_call",
+        (PyCFunction)arctan2_call_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_sjzsr7f4oq0q_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_sjzsr7f4oq0q",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_sjzsr7f4oq0q_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_sjzsr7f4oq0q(void)
+{
+    PyObject* mod;
+    static void* Pymod_sjzsr7f4oq0q_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_sjzsr7f4oq0q_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_sjzsr7f4oq0q_API, "mod_sjzsr7f4oq0q._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
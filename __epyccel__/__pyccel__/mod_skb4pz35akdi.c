@@ -0,0 +1,10 @@
+#include "mod_skb4pz35akdi.h"
+
+
+/*........................................*/
+double cosh_call(double x)
+{
+    return cosh(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_SKB4PZ35AKDI_H
+#define MOD_SKB4PZ35AKDI_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double cosh_call(double x);
+#endif // mod_skb4pz35akdi_H
@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SKB4PZ35AKDI_WRAPPER
+
+#include "mod_skb4pz35akdi_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* cosh_call_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    double x;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(x_obj))
+    {
+        x = PyDouble_to_Double(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument x");
+        return NULL;
+    }
+    Out_0001 = cosh_call(x);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_skb4pz35akdi_methods[] = {
+    {
+        "cosh_call",
+        (PyCFunction)cosh_call_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_skb4pz35akdi_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_skb4pz35akdi",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_skb4pz35akdi_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_skb4pz35akdi(void)
+{
+    PyObject* mod;
+    static void* Pymod_skb4pz35akdi_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_skb4pz35akdi_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_skb4pz35akdi_API, "mod_skb4pz35akdi._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
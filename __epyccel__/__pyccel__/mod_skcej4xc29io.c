@@ -0,0 +1,32 @@
+#include "mod_skcej4xc29io.h"
+
+
+/*........................................*/
+int64_t tuples_mul_homogeneous2(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 3 * a.type_size);
+    b = array_create(1, (int64_t[]){INT64_C(6)}, nd_int64, false, order_c);
+    for (i_0001 = INT64_C(0); i_0001 < INT64_C(3); i_0001 += INT64_C(1))
+    {
+        GET_ELEMENT(b, nd_int64, i_0001) = GET_ELEMENT(a, nd_int64, i_0001);
+        GET_ELEMENT(b, nd_int64, i_0001 + INT64_C(3)) = GET_ELEMENT(a, nd_int64, i_0001);
+    }
+    i = INT64_C(1);
+    (*Out_0001) = GET_ELEMENT(b, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(b, nd_int64, i);
+    (*Out_0003) = GET_ELEMENT(b, nd_int64, INT64_C(2));
+    (*Out_0004) = GET_ELEMENT(b, nd_int64, INT64_C(3));
+    (*Out_0005) = GET_ELEMENT(b, nd_int64, INT64_C(4));
+    (*Out_0006) = GET_ELEMENT(b, nd_int64, INT64_C(5));
+    free_array(&a);
+    free_array(&b);
+    return 0;
+}
+/*........................................*/
+
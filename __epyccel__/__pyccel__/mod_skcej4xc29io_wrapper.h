@@ -0,0 +1,40 @@
+#ifndef MOD_SKCEJ4XC29IO_WRAPPER_H
+#define MOD_SKCEJ4XC29IO_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_skcej4xc29io.h"
+
+
+#ifdef MOD_SKCEJ4XC29IO_WRAPPER
+
+
+#else
+
+static void** Pymod_skcej4xc29io_API;
+
+
+/*........................................*/
+static int mod_skcej4xc29io_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_skcej4xc29io_API = (void**)PyCapsule_Import("mod_skcej4xc29io._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_skcej4xc29io_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_SKCEJ4XC29IO_WRAPPER_H
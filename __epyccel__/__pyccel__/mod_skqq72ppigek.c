@@ -0,0 +1,12 @@
+#include "mod_skqq72ppigek.h"
+
+
+/*........................................*/
+double acos_phrase(double x, double y)
+{
+    double a;
+    a = acos(x) + acos(y);
+    return a;
+}
+/*........................................*/
+
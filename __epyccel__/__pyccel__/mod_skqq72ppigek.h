@@ -0,0 +1,10 @@
+#ifndef MOD_SKQQ72PPIGEK_H
+#define MOD_SKQQ72PPIGEK_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double acos_phrase(double x, double y);
+#endif // mod_skqq72ppigek_H
@@ -0,0 +1,102 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SRBI5YUUHYF1_WRAPPER
+
+#include "mod_srbi5yuuhyf1_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_2d_F_scalar_mul_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* a_obj;
+    t_ndarray x = {.raw_data = NULL};
+    double a;
+    static const char* const kwlist[] = {
+        "x",
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &a_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(a_obj))
+    {
+        a = PyDouble_to_Double(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument a");
+        return NULL;
+    }
+    array_float_2d_F_scalar_mul(x, a);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_srbi5yuuhyf1_methods[] = {
+    {
+        "array_float_2d_F_scalar_mul",
+        (PyCFunction)array_float_2d_F_scalar_mul_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_srbi5yuuhyf1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_srbi5yuuhyf1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_srbi5yuuhyf1_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_srbi5yuuhyf1(void)
+{
+    PyObject* mod;
+    static void* Pymod_srbi5yuuhyf1_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_srbi5yuuhyf1_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_srbi5yuuhyf1_API, "mod_srbi5yuuhyf1._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
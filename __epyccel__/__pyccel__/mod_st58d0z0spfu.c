@@ -0,0 +1,24 @@
+#include "mod_st58d0z0spfu.h"
+
+
+/*........................................*/
+int64_t arr_arange_4(int64_t* Out_0001, double* Out_0002, double* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){(int64_t)ceil((double)((INT64_C(28) - INT64_C(1))) / 3.0)}, nd_double, false, order_c);
+    {
+        double* restrict a_data = a.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = INT64_C(1) + i * INT64_C(3);
+        }
+    }
+    (*Out_0001) = a.shape[INT64_C(0)];
+    (*Out_0002) = a.nd_double[INT64_C(0)];
+    (*Out_0003) = a.nd_double[a.shape[INT64_C(0)] - INT64_C(1)];
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_ST58D0Z0SPFU_H
+#define MOD_ST58D0Z0SPFU_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_4(int64_t* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_st58d0z0spfu_H
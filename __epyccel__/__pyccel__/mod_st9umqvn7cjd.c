@@ -0,0 +1,12 @@
+#include "mod_st9umqvn7cjd.h"
+
+
+/*........................................*/
+int64_t floor_phrase(double x, double y)
+{
+    int64_t a;
+    a = (int64_t)floor(x) * (int64_t)floor(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_ST9UMQVN7CJD_H
+#define MOD_ST9UMQVN7CJD_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t floor_phrase(double x, double y);
+#endif // mod_st9umqvn7cjd_H
@@ -0,0 +1,107 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_STQIQ483XKBQ_WRAPPER
+
+#include "mod_stqiq483xkbq_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_1d_slice_9_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    array_1d_slice_9(a, &Out_0001, &Out_0002, &Out_0003, &Out_0004);
+    free_pointer(&a);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    Out_0002_obj = Int64_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int64_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int64_to_PyLong(&Out_0004);
+    Out_obj = Py_BuildValue("OOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_stqiq483xkbq_methods[] = {
+    {
+        "array_1d_slice_9",
+        (PyCFunction)array_1d_slice_9_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_stqiq483xkbq_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_stqiq483xkbq",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_stqiq483xkbq_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_stqiq483xkbq(void)
+{
+    PyObject* mod;
+    static void* Pymod_stqiq483xkbq_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_stqiq483xkbq_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_stqiq483xkbq_API, "mod_stqiq483xkbq._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
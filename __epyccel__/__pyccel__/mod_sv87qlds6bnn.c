@@ -0,0 +1,12 @@
+#include "mod_sv87qlds6bnn.h"
+
+
+/*........................................*/
+double sqrt_phrase(double x, double y)
+{
+    double a;
+    a = sqrt(x) * sqrt(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_SV87QLDS6BNN_H
+#define MOD_SV87QLDS6BNN_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sqrt_phrase(double x, double y);
+#endif // mod_sv87qlds6bnn_H
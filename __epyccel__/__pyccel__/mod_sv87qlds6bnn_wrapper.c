@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SV87QLDS6BNN_WRAPPER
+
+#include "mod_sv87qlds6bnn_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* sqrt_phrase_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    double x;
+    double y;
+    double a;
+    PyObject* a_obj;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(x_obj))
+    {
+        x = PyDouble_to_Double(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument x");
+        return NULL;
+    }
+    if (PyIs_NativeFloat(y_obj))
+    {
+        y = PyDouble_to_Double(y_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument y");
+        return NULL;
+    }
+    a = sqrt_phrase(x, y);
+    a_obj = Double_to_NumpyDouble(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_sv87qlds6bnn_methods[] = {
+    {
+        "sqrt_phrase",
+        (PyCFunction)sqrt_phrase_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_sv87qlds6bnn_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_sv87qlds6bnn",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_sv87qlds6bnn_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_sv87qlds6bnn(void)
+{
+    PyObject* mod;
+    static void* Pymod_sv87qlds6bnn_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_sv87qlds6bnn_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_sv87qlds6bnn_API, "mod_sv87qlds6bnn._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_SVOAK87S55E4_H
+#define MOD_SVOAK87S55E4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_mul_homogeneous4(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_svoak87s55e4_H
@@ -0,0 +1,134 @@
+#include "mod_svp0h18zvdep.h"
+
+
+/*........................................*/
+int64_t array_return_first_element_0000(int64_t a, int64_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int64[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int8_t array_return_first_element_0001(int8_t a, int8_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int8_t Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int8, false, order_c);
+    int8_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int8[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int8[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int16_t array_return_first_element_0002(int16_t a, int16_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int16_t Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int16, false, order_c);
+    int16_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int16[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int16[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int32_t array_return_first_element_0003(int32_t a, int32_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int32_t Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int32, false, order_c);
+    int32_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int32[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int32[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int64_t array_return_first_element_0004(int64_t a, int64_t b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int64[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double array_return_first_element_0005(double a, double b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    double Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_double[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+float array_return_first_element_0006(float a, float b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    float Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_float, false, order_c);
+    float Dummy_0000[] = {a, b};
+    memcpy(&x.nd_float[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_float[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double array_return_first_element_0007(double a, double b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    double Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_double[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+float complex array_return_first_element_0008(float complex a, float complex b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    float complex Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_cfloat, false, order_c);
+    float complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cfloat[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_cfloat[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double complex array_return_first_element_0009(double complex a, double complex b)
+{
+    t_ndarray x = {.raw_data = NULL};
+    double complex Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_cdouble, false, order_c);
+    double complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cdouble[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_cdouble[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+
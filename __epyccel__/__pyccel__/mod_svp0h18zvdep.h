@@ -0,0 +1,22 @@
+#ifndef MOD_SVP0H18ZVDEP_H
+#define MOD_SVP0H18ZVDEP_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t array_return_first_element_0000(int64_t a, int64_t b);
+int8_t array_return_first_element_0001(int8_t a, int8_t b);
+int16_t array_return_first_element_0002(int16_t a, int16_t b);
+int32_t array_return_first_element_0003(int32_t a, int32_t b);
+int64_t array_return_first_element_0004(int64_t a, int64_t b);
+double array_return_first_element_0005(double a, double b);
+float array_return_first_element_0006(float a, float b);
+double array_return_first_element_0007(double a, double b);
+float complex array_return_first_element_0008(float complex a, float complex b);
+double complex array_return_first_element_0009(double complex a, double complex b);
+#endif // mod_svp0h18zvdep_H
@@ -0,0 +1,40 @@
+#ifndef MOD_SVP0H18ZVDEP_WRAPPER_H
+#define MOD_SVP0H18ZVDEP_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_svp0h18zvdep.h"
+
+
+#ifdef MOD_SVP0H18ZVDEP_WRAPPER
+
+
+#else
+
+static void** Pymod_svp0h18zvdep_API;
+
+
+/*........................................*/
+static int mod_svp0h18zvdep_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_svp0h18zvdep_API = (void**)PyCapsule_Import("mod_svp0h18zvdep._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_svp0h18zvdep_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_SVP0H18ZVDEP_WRAPPER_H
@@ -0,0 +1,24 @@
+module mod_sw0qblcyo9kt
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_float_2d_2d_matmul(A, B, out) 
+
+    implicit none
+
+    real(f64), intent(in) :: A(0_i64:, 0_i64:)
+    real(f64), intent(in) :: B(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: out(0_i64:, 0_i64:)
+
+    out(:, :) = matmul(B,A)
+
+  end subroutine array_float_2d_2d_matmul
+  !........................................
+
+end module mod_sw0qblcyo9kt
@@ -0,0 +1,30 @@
+#include "mod_swnwsc6g6tii.h"
+
+
+/*........................................*/
+int64_t inhomogeneous_tuple_2_levels_1(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, double* Out_0005)
+{
+    t_ndarray ai_0 = {.raw_data = NULL};
+    int64_t ai_1_0;
+    bool ai_1_1;
+    double ai_2_0;
+    bool ai_2_1;
+    /*TODO [EB 15.06.21] Put back original test when strings are supported in C*/
+    /*ai = ((1,2), (4,False), (3.0, 'boo'))*/
+    ai_0 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2)};
+    memcpy(&ai_0.nd_int64[INT64_C(0)], Dummy_0000, 2 * ai_0.type_size);
+    ai_1_0 = INT64_C(4);
+    ai_1_1 = 0;
+    ai_2_0 = 3.0;
+    ai_2_1 = 1;
+    (*Out_0001) = GET_ELEMENT(ai_0, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(ai_0, nd_int64, INT64_C(1));
+    (*Out_0003) = ai_1_0;
+    (*Out_0004) = ai_1_1;
+    (*Out_0005) = ai_2_0;
+    free_array(&ai_0);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_SWNWSC6G6TII_H
+#define MOD_SWNWSC6G6TII_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t inhomogeneous_tuple_2_levels_1(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, double* Out_0005);
+#endif // mod_swnwsc6g6tii_H
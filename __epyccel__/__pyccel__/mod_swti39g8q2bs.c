@@ -0,0 +1,15 @@
+#include "mod_swti39g8q2bs.h"
+
+
+/*........................................*/
+bool test_omp_in_parallel2(void)
+{
+    bool in_parallel;
+    #pragma omp parallel
+    {
+        in_parallel = omp_in_parallel();
+    }
+    return in_parallel;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_SWTI39G8Q2BS_H
+#define MOD_SWTI39G8Q2BS_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_in_parallel2(void);
+#endif // mod_swti39g8q2bs_H
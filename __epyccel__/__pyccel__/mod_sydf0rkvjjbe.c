@@ -0,0 +1,12 @@
+#include "mod_sydf0rkvjjbe.h"
+
+
+/*........................................*/
+int64_t sum_in_single_return(int64_t a, int64_t b)
+{
+    int64_t c;
+    c = a + b;
+    return c;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_SYDF0RKVJJBE_H
+#define MOD_SYDF0RKVJJBE_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t sum_in_single_return(int64_t a, int64_t b);
+#endif // mod_sydf0rkvjjbe_H
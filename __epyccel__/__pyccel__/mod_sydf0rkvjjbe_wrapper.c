@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SYDF0RKVJJBE_WRAPPER
+
+#include "mod_sydf0rkvjjbe_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* sum_in_single_return_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    int64_t a;
+    int64_t b;
+    int64_t c;
+    PyObject* c_obj;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &a_obj, &b_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(a_obj))
+    {
+        a = PyInt64_to_Int64(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument a");
+        return NULL;
+    }
+    if (PyIs_NativeInt(b_obj))
+    {
+        b = PyInt64_to_Int64(b_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument b");
+        return NULL;
+    }
+    c = sum_in_single_return(a, b);
+    c_obj = Int64_to_PyLong(&c);
+    return c_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_sydf0rkvjjbe_methods[] = {
+    {
+        "sum_in_single_return",
+        (PyCFunction)sum_in_single_return_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_sydf0rkvjjbe_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_sydf0rkvjjbe",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_sydf0rkvjjbe_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_sydf0rkvjjbe(void)
+{
+    PyObject* mod;
+    static void* Pymod_sydf0rkvjjbe_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_sydf0rkvjjbe_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_sydf0rkvjjbe_API, "mod_sydf0rkvjjbe._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,21 @@
+#include "mod_szdwoscsrda2.h"
+
+
+/*........................................*/
+int64_t omp_range_sum_critical(int64_t x)
+{
+    int64_t i;
+    int64_t func_result;
+    func_result = INT64_C(0);
+    #pragma omp parallel for num_threads(4) shared(func_result)
+    for (i = INT64_C(0); i < x; i += INT64_C(1))
+    {
+        #pragma omp critical
+        {
+            func_result += i;
+        }
+    }
+    return func_result;
+}
+/*........................................*/
+
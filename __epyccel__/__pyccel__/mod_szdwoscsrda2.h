@@ -0,0 +1,10 @@
+#ifndef MOD_SZDWOSCSRDA2_H
+#define MOD_SZDWOSCSRDA2_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_range_sum_critical(int64_t x);
+#endif // mod_szdwoscsrda2_H
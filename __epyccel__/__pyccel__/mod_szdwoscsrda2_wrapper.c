@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_SZDWOSCSRDA2_WRAPPER
+
+#include "mod_szdwoscsrda2_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* omp_range_sum_critical_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    int64_t x;
+    int64_t func_result;
+    PyObject* func_result_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(x_obj))
+    {
+        x = PyInt64_to_Int64(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument x");
+        return NULL;
+    }
+    func_result = omp_range_sum_critical(x);
+    func_result_obj = Int64_to_PyLong(&func_result);
+    return func_result_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_szdwoscsrda2_methods[] = {
+    {
+        "omp_range_sum_critical",
+        (PyCFunction)omp_range_sum_critical_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_szdwoscsrda2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_szdwoscsrda2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_szdwoscsrda2_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_szdwoscsrda2(void)
+{
+    PyObject* mod;
+    static void* Pymod_szdwoscsrda2_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_szdwoscsrda2_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_szdwoscsrda2_API, "mod_szdwoscsrda2._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
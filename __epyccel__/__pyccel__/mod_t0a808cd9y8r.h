@@ -0,0 +1,11 @@
+#ifndef MOD_T0A808CD9Y8R_H
+#define MOD_T0A808CD9Y8R_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d);
+#endif // mod_t0a808cd9y8r_H
@@ -0,0 +1,94 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_T0A808CD9Y8R_WRAPPER
+
+#include "mod_t0a808cd9y8r_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t a;
+    PyObject* b_obj;
+    int64_t b;
+    PyObject* c_obj;
+    int64_t c;
+    PyObject* d_obj;
+    int64_t d;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    f(&a, &b, &c, &d);
+    a_obj = Int64_to_PyLong(&a);
+    b_obj = Int64_to_PyLong(&b);
+    c_obj = Int64_to_PyLong(&c);
+    d_obj = Int64_to_PyLong(&d);
+    Out_obj = Py_BuildValue("OOOO", a_obj, b_obj, c_obj, d_obj);
+    Py_DECREF(a_obj);
+    Py_DECREF(b_obj);
+    Py_DECREF(c_obj);
+    Py_DECREF(d_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_t0a808cd9y8r_methods[] = {
+    {
+        "f",
+        (PyCFunction)f_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_t0a808cd9y8r_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_t0a808cd9y8r",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_t0a808cd9y8r_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_t0a808cd9y8r(void)
+{
+    PyObject* mod;
+    static void* Pymod_t0a808cd9y8r_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_t0a808cd9y8r_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_t0a808cd9y8r_API, "mod_t0a808cd9y8r._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
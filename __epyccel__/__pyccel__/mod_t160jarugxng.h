@@ -0,0 +1,11 @@
+#ifndef MOD_T160JARUGXNG_H
+#define MOD_T160JARUGXNG_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_thread_limit(void);
+#endif // mod_t160jarugxng_H
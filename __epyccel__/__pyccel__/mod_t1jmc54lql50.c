@@ -0,0 +1,17 @@
+#include "mod_t1jmc54lql50.h"
+
+
+/*........................................*/
+int64_t test_shape_2d(t_ndarray f, int64_t* Out_0001, int64_t* Out_0002)
+{
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {f.shape[INT64_C(0)], f.shape[INT64_C(1)]};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 2 * a.type_size);
+    (*Out_0001) = GET_ELEMENT(a, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(a, nd_int64, INT64_C(1));
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_T1JMC54LQL50_H
+#define MOD_T1JMC54LQL50_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_shape_2d(t_ndarray f, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_t1jmc54lql50_H
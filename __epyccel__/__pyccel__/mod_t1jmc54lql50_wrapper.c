@@ -0,0 +1,99 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_T1JMC54LQL50_WRAPPER
+
+#include "mod_t1jmc54lql50_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_shape_2d_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* f_obj;
+    t_ndarray f = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "f",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &f_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("f", f_obj, NPY_BOOL, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        f = pyarray_to_ndarray(f_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    test_shape_2d(f, &Out_0001, &Out_0002);
+    free_pointer(&f);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_t1jmc54lql50_methods[] = {
+    {
+        "test_shape_2d",
+        (PyCFunction)test_shape_2d_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_t1jmc54lql50_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_t1jmc54lql50",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_t1jmc54lql50_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_t1jmc54lql50(void)
+{
+    PyObject* mod;
+    static void* Pymod_t1jmc54lql50_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_t1jmc54lql50_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_t1jmc54lql50_API, "mod_t1jmc54lql50._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,382 @@
+#include "mod_t1l1wu2l6smz.h"
+
+
+/*........................................*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t offset;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_bool, false, order_c);
+    array_copy_data(&a, arr1, 0);
+    b = array_create(2, (int64_t[]){arr2.shape[INT64_C(0)], arr2.shape[INT64_C(1)]}, nd_bool, false, order_c);
+    array_copy_data(&b, arr2, 0);
+    c = array_create(2, (int64_t[]){arr3.shape[INT64_C(0)], arr3.shape[INT64_C(1)]}, nd_bool, false, order_c);
+    array_copy_data(&c, arr3, 0);
+    d = array_create(3, (int64_t[]){INT64_C(3), a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&d, a, offset);
+    offset += a.length;
+    array_copy_data(&d, c, offset);
+    offset += c.length;
+    array_copy_data(&d, b, offset);
+    s = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), d.shape[INT64_C(1)], d.shape[INT64_C(2)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 3 * s.type_size);
+    (*Out_0001) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(2));
+    (*Out_0004) = d.nd_int64[INT64_C(0)];
+    (*Out_0005) = d.nd_int64[INT64_C(1)];
+    (*Out_0006) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0007) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    (*Out_0008) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0009) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    free_array(&s);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t offset;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&a, arr1, 0);
+    b = array_create(2, (int64_t[]){arr2.shape[INT64_C(0)], arr2.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&b, arr2, 0);
+    c = array_create(2, (int64_t[]){arr3.shape[INT64_C(0)], arr3.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr3, 0);
+    d = array_create(3, (int64_t[]){INT64_C(3), a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&d, a, offset);
+    offset += a.length;
+    array_copy_data(&d, c, offset);
+    offset += c.length;
+    array_copy_data(&d, b, offset);
+    s = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), d.shape[INT64_C(1)], d.shape[INT64_C(2)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 3 * s.type_size);
+    (*Out_0001) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(2));
+    (*Out_0004) = d.nd_int64[INT64_C(0)];
+    (*Out_0005) = d.nd_int64[INT64_C(1)];
+    (*Out_0006) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0007) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    (*Out_0008) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0009) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    free_array(&s);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t offset;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_int8, false, order_c);
+    array_copy_data(&a, arr1, 0);
+    b = array_create(2, (int64_t[]){arr2.shape[INT64_C(0)], arr2.shape[INT64_C(1)]}, nd_int8, false, order_c);
+    array_copy_data(&b, arr2, 0);
+    c = array_create(2, (int64_t[]){arr3.shape[INT64_C(0)], arr3.shape[INT64_C(1)]}, nd_int8, false, order_c);
+    array_copy_data(&c, arr3, 0);
+    d = array_create(3, (int64_t[]){INT64_C(3), a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&d, a, offset);
+    offset += a.length;
+    array_copy_data(&d, c, offset);
+    offset += c.length;
+    array_copy_data(&d, b, offset);
+    s = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), d.shape[INT64_C(1)], d.shape[INT64_C(2)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 3 * s.type_size);
+    (*Out_0001) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(2));
+    (*Out_0004) = d.nd_int64[INT64_C(0)];
+    (*Out_0005) = d.nd_int64[INT64_C(1)];
+    (*Out_0006) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0007) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    (*Out_0008) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0009) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    free_array(&s);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t offset;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_int16, false, order_c);
+    array_copy_data(&a, arr1, 0);
+    b = array_create(2, (int64_t[]){arr2.shape[INT64_C(0)], arr2.shape[INT64_C(1)]}, nd_int16, false, order_c);
+    array_copy_data(&b, arr2, 0);
+    c = array_create(2, (int64_t[]){arr3.shape[INT64_C(0)], arr3.shape[INT64_C(1)]}, nd_int16, false, order_c);
+    array_copy_data(&c, arr3, 0);
+    d = array_create(3, (int64_t[]){INT64_C(3), a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&d, a, offset);
+    offset += a.length;
+    array_copy_data(&d, c, offset);
+    offset += c.length;
+    array_copy_data(&d, b, offset);
+    s = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), d.shape[INT64_C(1)], d.shape[INT64_C(2)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 3 * s.type_size);
+    (*Out_0001) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(2));
+    (*Out_0004) = d.nd_int64[INT64_C(0)];
+    (*Out_0005) = d.nd_int64[INT64_C(1)];
+    (*Out_0006) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0007) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    (*Out_0008) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0009) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    free_array(&s);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t offset;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_int32, false, order_c);
+    array_copy_data(&a, arr1, 0);
+    b = array_create(2, (int64_t[]){arr2.shape[INT64_C(0)], arr2.shape[INT64_C(1)]}, nd_int32, false, order_c);
+    array_copy_data(&b, arr2, 0);
+    c = array_create(2, (int64_t[]){arr3.shape[INT64_C(0)], arr3.shape[INT64_C(1)]}, nd_int32, false, order_c);
+    array_copy_data(&c, arr3, 0);
+    d = array_create(3, (int64_t[]){INT64_C(3), a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&d, a, offset);
+    offset += a.length;
+    array_copy_data(&d, c, offset);
+    offset += c.length;
+    array_copy_data(&d, b, offset);
+    s = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), d.shape[INT64_C(1)], d.shape[INT64_C(2)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 3 * s.type_size);
+    (*Out_0001) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(2));
+    (*Out_0004) = d.nd_int64[INT64_C(0)];
+    (*Out_0005) = d.nd_int64[INT64_C(1)];
+    (*Out_0006) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0007) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    (*Out_0008) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0009) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    free_array(&s);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t offset;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_double, false, order_c);
+    array_copy_data(&a, arr1, 0);
+    b = array_create(2, (int64_t[]){arr2.shape[INT64_C(0)], arr2.shape[INT64_C(1)]}, nd_double, false, order_c);
+    array_copy_data(&b, arr2, 0);
+    c = array_create(2, (int64_t[]){arr3.shape[INT64_C(0)], arr3.shape[INT64_C(1)]}, nd_double, false, order_c);
+    array_copy_data(&c, arr3, 0);
+    d = array_create(3, (int64_t[]){INT64_C(3), a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&d, a, offset);
+    offset += a.length;
+    array_copy_data(&d, c, offset);
+    offset += c.length;
+    array_copy_data(&d, b, offset);
+    s = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), d.shape[INT64_C(1)], d.shape[INT64_C(2)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 3 * s.type_size);
+    (*Out_0001) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(2));
+    (*Out_0004) = d.nd_int64[INT64_C(0)];
+    (*Out_0005) = d.nd_int64[INT64_C(1)];
+    (*Out_0006) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0007) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    (*Out_0008) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0009) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    free_array(&s);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t offset;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_float, false, order_c);
+    array_copy_data(&a, arr1, 0);
+    b = array_create(2, (int64_t[]){arr2.shape[INT64_C(0)], arr2.shape[INT64_C(1)]}, nd_float, false, order_c);
+    array_copy_data(&b, arr2, 0);
+    c = array_create(2, (int64_t[]){arr3.shape[INT64_C(0)], arr3.shape[INT64_C(1)]}, nd_float, false, order_c);
+    array_copy_data(&c, arr3, 0);
+    d = array_create(3, (int64_t[]){INT64_C(3), a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&d, a, offset);
+    offset += a.length;
+    array_copy_data(&d, c, offset);
+    offset += c.length;
+    array_copy_data(&d, b, offset);
+    s = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), d.shape[INT64_C(1)], d.shape[INT64_C(2)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 3 * s.type_size);
+    (*Out_0001) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(2));
+    (*Out_0004) = d.nd_int64[INT64_C(0)];
+    (*Out_0005) = d.nd_int64[INT64_C(1)];
+    (*Out_0006) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0007) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    (*Out_0008) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0009) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    free_array(&s);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t offset;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_cfloat, false, order_c);
+    array_copy_data(&a, arr1, 0);
+    b = array_create(2, (int64_t[]){arr2.shape[INT64_C(0)], arr2.shape[INT64_C(1)]}, nd_cfloat, false, order_c);
+    array_copy_data(&b, arr2, 0);
+    c = array_create(2, (int64_t[]){arr3.shape[INT64_C(0)], arr3.shape[INT64_C(1)]}, nd_cfloat, false, order_c);
+    array_copy_data(&c, arr3, 0);
+    d = array_create(3, (int64_t[]){INT64_C(3), a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&d, a, offset);
+    offset += a.length;
+    array_copy_data(&d, c, offset);
+    offset += c.length;
+    array_copy_data(&d, b, offset);
+    s = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), d.shape[INT64_C(1)], d.shape[INT64_C(2)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 3 * s.type_size);
+    (*Out_0001) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(2));
+    (*Out_0004) = d.nd_int64[INT64_C(0)];
+    (*Out_0005) = d.nd_int64[INT64_C(1)];
+    (*Out_0006) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0007) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    (*Out_0008) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0009) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    free_array(&s);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t offset;
+    a = array_create(2, (int64_t[]){arr1.shape[INT64_C(0)], arr1.shape[INT64_C(1)]}, nd_cdouble, false, order_c);
+    array_copy_data(&a, arr1, 0);
+    b = array_create(2, (int64_t[]){arr2.shape[INT64_C(0)], arr2.shape[INT64_C(1)]}, nd_cdouble, false, order_c);
+    array_copy_data(&b, arr2, 0);
+    c = array_create(2, (int64_t[]){arr3.shape[INT64_C(0)], arr3.shape[INT64_C(1)]}, nd_cdouble, false, order_c);
+    array_copy_data(&c, arr3, 0);
+    d = array_create(3, (int64_t[]){INT64_C(3), a.shape[INT64_C(0)], a.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&d, a, offset);
+    offset += a.length;
+    array_copy_data(&d, c, offset);
+    offset += c.length;
+    array_copy_data(&d, b, offset);
+    s = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(3), d.shape[INT64_C(1)], d.shape[INT64_C(2)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 3 * s.type_size);
+    (*Out_0001) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(2));
+    (*Out_0004) = d.nd_int64[INT64_C(0)];
+    (*Out_0005) = d.nd_int64[INT64_C(1)];
+    (*Out_0006) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0007) = d.nd_int64[d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    (*Out_0008) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)]];
+    (*Out_0009) = d.nd_int64[INT64_C(2) * d.shape[INT64_C(1)] * d.shape[INT64_C(2)] + INT64_C(1)];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    free_array(&s);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+
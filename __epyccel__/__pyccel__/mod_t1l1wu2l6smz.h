@@ -0,0 +1,20 @@
+#ifndef MOD_T1L1WU2L6SMZ_H
+#define MOD_T1L1WU2L6SMZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+#endif // mod_t1l1wu2l6smz_H
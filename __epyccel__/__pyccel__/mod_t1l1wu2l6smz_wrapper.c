@@ -0,0 +1,755 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_T1L1WU2L6SMZ_WRAPPER
+
+#include "mod_t1l1wu2l6smz_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_0000_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    t_ndarray arr3 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    int64_t Out_0008;
+    PyObject* Out_0009_obj;
+    int64_t Out_0009;
+    PyObject* Out_obj;
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    arr3 = pyarray_to_ndarray(arr3_obj);
+    src_dest_diff_sizes_dtype_convert_to_pyint_0000(arr1, arr2, arr3, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    free_pointer(&arr3);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int64_to_NumpyLong(&Out_0005);
+    Out_0006_obj = Int64_to_NumpyLong(&Out_0006);
+    Out_0007_obj = Int64_to_NumpyLong(&Out_0007);
+    Out_0008_obj = Int64_to_NumpyLong(&Out_0008);
+    Out_0009_obj = Int64_to_NumpyLong(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_0001_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    t_ndarray arr3 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    int64_t Out_0008;
+    PyObject* Out_0009_obj;
+    int64_t Out_0009;
+    PyObject* Out_obj;
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    arr3 = pyarray_to_ndarray(arr3_obj);
+    src_dest_diff_sizes_dtype_convert_to_pyint_0001(arr1, arr2, arr3, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    free_pointer(&arr3);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int64_to_NumpyLong(&Out_0005);
+    Out_0006_obj = Int64_to_NumpyLong(&Out_0006);
+    Out_0007_obj = Int64_to_NumpyLong(&Out_0007);
+    Out_0008_obj = Int64_to_NumpyLong(&Out_0008);
+    Out_0009_obj = Int64_to_NumpyLong(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_0002_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    t_ndarray arr3 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    int64_t Out_0008;
+    PyObject* Out_0009_obj;
+    int64_t Out_0009;
+    PyObject* Out_obj;
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    arr3 = pyarray_to_ndarray(arr3_obj);
+    src_dest_diff_sizes_dtype_convert_to_pyint_0002(arr1, arr2, arr3, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    free_pointer(&arr3);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int64_to_NumpyLong(&Out_0005);
+    Out_0006_obj = Int64_to_NumpyLong(&Out_0006);
+    Out_0007_obj = Int64_to_NumpyLong(&Out_0007);
+    Out_0008_obj = Int64_to_NumpyLong(&Out_0008);
+    Out_0009_obj = Int64_to_NumpyLong(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_0003_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    t_ndarray arr3 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    int64_t Out_0008;
+    PyObject* Out_0009_obj;
+    int64_t Out_0009;
+    PyObject* Out_obj;
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    arr3 = pyarray_to_ndarray(arr3_obj);
+    src_dest_diff_sizes_dtype_convert_to_pyint_0003(arr1, arr2, arr3, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    free_pointer(&arr3);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int64_to_NumpyLong(&Out_0005);
+    Out_0006_obj = Int64_to_NumpyLong(&Out_0006);
+    Out_0007_obj = Int64_to_NumpyLong(&Out_0007);
+    Out_0008_obj = Int64_to_NumpyLong(&Out_0008);
+    Out_0009_obj = Int64_to_NumpyLong(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_0004_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    t_ndarray arr3 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    int64_t Out_0008;
+    PyObject* Out_0009_obj;
+    int64_t Out_0009;
+    PyObject* Out_obj;
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    arr3 = pyarray_to_ndarray(arr3_obj);
+    src_dest_diff_sizes_dtype_convert_to_pyint_0004(arr1, arr2, arr3, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    free_pointer(&arr3);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int64_to_NumpyLong(&Out_0005);
+    Out_0006_obj = Int64_to_NumpyLong(&Out_0006);
+    Out_0007_obj = Int64_to_NumpyLong(&Out_0007);
+    Out_0008_obj = Int64_to_NumpyLong(&Out_0008);
+    Out_0009_obj = Int64_to_NumpyLong(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_0005_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    t_ndarray arr3 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    int64_t Out_0008;
+    PyObject* Out_0009_obj;
+    int64_t Out_0009;
+    PyObject* Out_obj;
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    arr3 = pyarray_to_ndarray(arr3_obj);
+    src_dest_diff_sizes_dtype_convert_to_pyint_0005(arr1, arr2, arr3, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    free_pointer(&arr3);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int64_to_NumpyLong(&Out_0005);
+    Out_0006_obj = Int64_to_NumpyLong(&Out_0006);
+    Out_0007_obj = Int64_to_NumpyLong(&Out_0007);
+    Out_0008_obj = Int64_to_NumpyLong(&Out_0008);
+    Out_0009_obj = Int64_to_NumpyLong(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_0006_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    t_ndarray arr3 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    int64_t Out_0008;
+    PyObject* Out_0009_obj;
+    int64_t Out_0009;
+    PyObject* Out_obj;
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    arr3 = pyarray_to_ndarray(arr3_obj);
+    src_dest_diff_sizes_dtype_convert_to_pyint_0006(arr1, arr2, arr3, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    free_pointer(&arr3);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int64_to_NumpyLong(&Out_0005);
+    Out_0006_obj = Int64_to_NumpyLong(&Out_0006);
+    Out_0007_obj = Int64_to_NumpyLong(&Out_0007);
+    Out_0008_obj = Int64_to_NumpyLong(&Out_0008);
+    Out_0009_obj = Int64_to_NumpyLong(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_0007_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    t_ndarray arr3 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    int64_t Out_0008;
+    PyObject* Out_0009_obj;
+    int64_t Out_0009;
+    PyObject* Out_obj;
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    arr3 = pyarray_to_ndarray(arr3_obj);
+    src_dest_diff_sizes_dtype_convert_to_pyint_0007(arr1, arr2, arr3, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    free_pointer(&arr3);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int64_to_NumpyLong(&Out_0005);
+    Out_0006_obj = Int64_to_NumpyLong(&Out_0006);
+    Out_0007_obj = Int64_to_NumpyLong(&Out_0007);
+    Out_0008_obj = Int64_to_NumpyLong(&Out_0008);
+    Out_0009_obj = Int64_to_NumpyLong(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_0008_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    t_ndarray arr3 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    int64_t Out_0008;
+    PyObject* Out_0009_obj;
+    int64_t Out_0009;
+    PyObject* Out_obj;
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    arr3 = pyarray_to_ndarray(arr3_obj);
+    src_dest_diff_sizes_dtype_convert_to_pyint_0008(arr1, arr2, arr3, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    free_pointer(&arr3);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int64_to_NumpyLong(&Out_0005);
+    Out_0006_obj = Int64_to_NumpyLong(&Out_0006);
+    Out_0007_obj = Int64_to_NumpyLong(&Out_0007);
+    Out_0008_obj = Int64_to_NumpyLong(&Out_0008);
+    Out_0009_obj = Int64_to_NumpyLong(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t src_dest_diff_sizes_dtype_convert_to_pyint_type_check(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(arr1_obj, NPY_BOOL, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_BYTE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_SHORT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_INT32, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_FLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_CFLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_CDOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr1");
+        return -INT64_C(1);
+    }
+    if (is_numpy_array(arr2_obj, NPY_BOOL, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(9);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_BYTE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(18);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_SHORT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(27);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_INT32, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(36);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(45);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_FLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(54);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_CFLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(63);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_CDOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(72);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr2");
+        return -INT64_C(1);
+    }
+    if (is_numpy_array(arr3_obj, NPY_BOOL, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(81);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_BYTE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(162);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_SHORT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(243);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_INT32, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(324);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(405);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_FLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(486);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_CFLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(567);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_CDOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(648);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr3");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* src_dest_diff_sizes_dtype_convert_to_pyint_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* arr1_obj;
+    PyObject* arr2_obj;
+    PyObject* arr3_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "arr1",
+        "arr2",
+        "arr3",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &arr1_obj, &arr2_obj, &arr3_obj))
+    {
+        return NULL;
+    }
+    type_indicator = src_dest_diff_sizes_dtype_convert_to_pyint_type_check(arr1_obj, arr2_obj, arr3_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return src_dest_diff_sizes_dtype_convert_to_pyint_0000_wrapper(arr1_obj, arr2_obj, arr3_obj);
+    }
+    else if (type_indicator == INT64_C(91))
+    {
+        return src_dest_diff_sizes_dtype_convert_to_pyint_0001_wrapper(arr1_obj, arr2_obj, arr3_obj);
+    }
+    else if (type_indicator == INT64_C(182))
+    {
+        return src_dest_diff_sizes_dtype_convert_to_pyint_0002_wrapper(arr1_obj, arr2_obj, arr3_obj);
+    }
+    else if (type_indicator == INT64_C(273))
+    {
+        return src_dest_diff_sizes_dtype_convert_to_pyint_0003_wrapper(arr1_obj, arr2_obj, arr3_obj);
+    }
+    else if (type_indicator == INT64_C(364))
+    {
+        return src_dest_diff_sizes_dtype_convert_to_pyint_0004_wrapper(arr1_obj, arr2_obj, arr3_obj);
+    }
+    else if (type_indicator == INT64_C(455))
+    {
+        return src_dest_diff_sizes_dtype_convert_to_pyint_0005_wrapper(arr1_obj, arr2_obj, arr3_obj);
+    }
+    else if (type_indicator == INT64_C(546))
+    {
+        return src_dest_diff_sizes_dtype_convert_to_pyint_0006_wrapper(arr1_obj, arr2_obj, arr3_obj);
+    }
+    else if (type_indicator == INT64_C(637))
+    {
+        return src_dest_diff_sizes_dtype_convert_to_pyint_0007_wrapper(arr1_obj, arr2_obj, arr3_obj);
+    }
+    else if (type_indicator == INT64_C(728))
+    {
+        return src_dest_diff_sizes_dtype_convert_to_pyint_0008_wrapper(arr1_obj, arr2_obj, arr3_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_t1l1wu2l6smz_methods[] = {
+    {
+        "src_dest_diff_sizes_dtype_convert_to_pyint",
+        (PyCFunction)src_dest_diff_sizes_dtype_convert_to_pyint_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_t1l1wu2l6smz_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_t1l1wu2l6smz",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_t1l1wu2l6smz_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_t1l1wu2l6smz(void)
+{
+    PyObject* mod;
+    static void* Pymod_t1l1wu2l6smz_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_t1l1wu2l6smz_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_t1l1wu2l6smz_API, "mod_t1l1wu2l6smz._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
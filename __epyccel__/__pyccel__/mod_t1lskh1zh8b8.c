@@ -0,0 +1,76 @@
+#include "mod_t1lskh1zh8b8.h"
+
+
+/*........................................*/
+int8_t get_int8_0000(bool a)
+{
+    int8_t b;
+    b = (int8_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_int8_0001(int64_t a)
+{
+    int8_t b;
+    b = (int8_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_int8_0002(int8_t a)
+{
+    int8_t b;
+    b = (int8_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_int8_0003(int16_t a)
+{
+    int8_t b;
+    b = (int8_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_int8_0004(int32_t a)
+{
+    int8_t b;
+    b = (int8_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_int8_0005(int64_t a)
+{
+    int8_t b;
+    b = (int8_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_int8_0006(double a)
+{
+    int8_t b;
+    b = (int8_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_int8_0007(float a)
+{
+    int8_t b;
+    b = (int8_t)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+int8_t get_int8_0008(double a)
+{
+    int8_t b;
+    b = (int8_t)(a);
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,19 @@
+#ifndef MOD_T1LSKH1ZH8B8_H
+#define MOD_T1LSKH1ZH8B8_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int8_t get_int8_0000(bool a);
+int8_t get_int8_0001(int64_t a);
+int8_t get_int8_0002(int8_t a);
+int8_t get_int8_0003(int16_t a);
+int8_t get_int8_0004(int32_t a);
+int8_t get_int8_0005(int64_t a);
+int8_t get_int8_0006(double a);
+int8_t get_int8_0007(float a);
+int8_t get_int8_0008(double a);
+#endif // mod_t1lskh1zh8b8_H
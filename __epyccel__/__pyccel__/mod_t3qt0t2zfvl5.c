@@ -0,0 +1,17 @@
+#include "mod_t3qt0t2zfvl5.h"
+
+
+/*........................................*/
+int64_t array_1d_slice_stride_19(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    t_ndarray b = {.raw_data = NULL};
+    b = array_slicing(a, 1, new_slice(INT64_C(5), a.shape[INT64_C(0)] - INT64_C(5), INT64_C(5), RANGE));
+    (*Out_0001) = numpy_sum_int64(b);
+    (*Out_0002) = GET_ELEMENT(b, nd_int64, INT64_C(0));
+    (*Out_0003) = GET_ELEMENT(b, nd_int64, b.shape[INT64_C(0)] - INT64_C(1));
+    (*Out_0004) = b.shape[INT64_C(0)];
+    free_pointer(&b);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,20 @@
+#ifndef MOD_T4762CGMKBC9_H
+#define MOD_T4762CGMKBC9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_int64_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int64_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int64_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int64_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int64_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int64_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int64_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int64_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int64_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009);
+#endif // mod_t4762cgmkbc9_H
@@ -0,0 +1,11 @@
+#ifndef MOD_T47G8UNM97LQ_H
+#define MOD_T47G8UNM97LQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t my_tuple(t_ndarray a, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004);
+#endif // mod_t47g8unm97lq_H
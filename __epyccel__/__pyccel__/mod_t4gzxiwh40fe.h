@@ -0,0 +1,12 @@
+#ifndef MOD_T4GZXIWH40FE_H
+#define MOD_T4GZXIWH40FE_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float complex create_full_val_real_complex64(double val);
+#endif // mod_t4gzxiwh40fe_H
@@ -0,0 +1,10 @@
+#include "mod_t4zou4eh70jw.h"
+
+
+/*........................................*/
+double expm1_call(double x)
+{
+    return expm1(x);
+}
+/*........................................*/
+
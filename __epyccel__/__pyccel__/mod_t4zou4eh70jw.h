@@ -0,0 +1,10 @@
+#ifndef MOD_T4ZOU4EH70JW_H
+#define MOD_T4ZOU4EH70JW_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double expm1_call(double x);
+#endif // mod_t4zou4eh70jw_H
@@ -0,0 +1,11 @@
+#ifndef MOD_T52E2J1IBCSZ_H
+#define MOD_T52E2J1IBCSZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t mult_on_array_int64(void);
+#endif // mod_t52e2j1ibcsz_H
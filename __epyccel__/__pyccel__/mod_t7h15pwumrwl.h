@@ -0,0 +1,10 @@
+#ifndef MOD_T7H15PWUMRWL_H
+#define MOD_T7H15PWUMRWL_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int8_t f17(int8_t a);
+#endif // mod_t7h15pwumrwl_H
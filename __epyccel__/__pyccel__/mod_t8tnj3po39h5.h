@@ -0,0 +1,11 @@
+#ifndef MOD_T8TNJ3PO39H5_H
+#define MOD_T8TNJ3PO39H5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_simd(int64_t n);
+#endif // mod_t8tnj3po39h5_H
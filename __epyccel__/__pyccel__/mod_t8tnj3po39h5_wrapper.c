@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_T8TNJ3PO39H5_WRAPPER
+
+#include "mod_t8tnj3po39h5_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* omp_simd_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* n_obj;
+    int64_t n;
+    int64_t func_result;
+    PyObject* func_result_obj;
+    static const char* const kwlist[] = {
+        "n",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &n_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    func_result = omp_simd(n);
+    func_result_obj = Int64_to_PyLong(&func_result);
+    return func_result_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_t8tnj3po39h5_methods[] = {
+    {
+        "omp_simd",
+        (PyCFunction)omp_simd_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_t8tnj3po39h5_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_t8tnj3po39h5",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_t8tnj3po39h5_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_t8tnj3po39h5(void)
+{
+    PyObject* mod;
+    static void* Pymod_t8tnj3po39h5_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_t8tnj3po39h5_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_t8tnj3po39h5_API, "mod_t8tnj3po39h5._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,18 @@
+#include "mod_t9mu80avcpef.h"
+
+
+/*........................................*/
+int64_t array_2d_F_slice_4(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray b = {.raw_data = NULL};
+    b = array_slicing(a, 2, new_slice(a.shape[INT64_C(0)] - INT64_C(15), a.shape[INT64_C(0)], INT64_C(1), RANGE), new_slice(INT64_C(0), a.shape[INT64_C(1)], INT64_C(1), RANGE));
+    (*Out_0001) = numpy_sum_int64(b);
+    (*Out_0002) = GET_ELEMENT(b, nd_int64, INT64_C(0), INT64_C(0));
+    (*Out_0003) = GET_ELEMENT(b, nd_int64, b.shape[INT64_C(0)] - INT64_C(1), b.shape[INT64_C(1)] - INT64_C(1));
+    (*Out_0004) = b.shape[INT64_C(0)];
+    (*Out_0005) = b.shape[INT64_C(1)];
+    free_pointer(&b);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_TB9S17FG1JDL_H
+#define MOD_TB9S17FG1JDL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_different_shapes_0(void);
+#endif // mod_tb9s17fg1jdl_H
@@ -0,0 +1,10 @@
+#ifndef MOD_TCEZETPG5L5G_H
+#define MOD_TCEZETPG5L5G_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t directive_in_else(int64_t x);
+#endif // mod_tcezetpg5l5g_H
@@ -0,0 +1,12 @@
+#ifndef MOD_TDM5O9D47QWB_H
+#define MOD_TDM5O9D47QWB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_like_2_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_tdm5o9d47qwb_H
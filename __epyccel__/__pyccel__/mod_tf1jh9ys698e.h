@@ -0,0 +1,12 @@
+#ifndef MOD_TF1JH9YS698E_H
+#define MOD_TF1JH9YS698E_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_tf1jh9ys698e_H
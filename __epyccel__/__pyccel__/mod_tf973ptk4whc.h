@@ -0,0 +1,18 @@
+#ifndef MOD_TF973PTK4WHC_H
+#define MOD_TF973PTK4WHC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t get_int8_arr_1d_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004);
+int64_t get_int8_arr_1d_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004);
+int64_t get_int8_arr_1d_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004);
+int64_t get_int8_arr_1d_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004);
+int64_t get_int8_arr_1d_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004);
+int64_t get_int8_arr_1d_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004);
+int64_t get_int8_arr_1d_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003, int8_t* Out_0004);
+#endif // mod_tf973ptk4whc_H
@@ -0,0 +1,11 @@
+#ifndef MOD_TFALDIQ8T2R3_H
+#define MOD_TFALDIQ8T2R3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_tfaldiq8t2r3_H
@@ -0,0 +1,102 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_TFALDIQ8T2R3_WRAPPER
+
+#include "mod_tfaldiq8t2r3_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_int32_2d_C_scalar_add_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* a_obj;
+    t_ndarray x = {.raw_data = NULL};
+    int32_t a;
+    static const char* const kwlist[] = {
+        "x",
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &a_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT32, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_Int32(a_obj))
+    {
+        a = PyInt32_to_Int32(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.int32 for argument a");
+        return NULL;
+    }
+    array_int32_2d_C_scalar_add(x, a);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_tfaldiq8t2r3_methods[] = {
+    {
+        "array_int32_2d_C_scalar_add",
+        (PyCFunction)array_int32_2d_C_scalar_add_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_tfaldiq8t2r3_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_tfaldiq8t2r3",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_tfaldiq8t2r3_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_tfaldiq8t2r3(void)
+{
+    PyObject* mod;
+    static void* Pymod_tfaldiq8t2r3_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_tfaldiq8t2r3_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_tfaldiq8t2r3_API, "mod_tfaldiq8t2r3._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_TG5738DX592I_H
+#define MOD_TG5738DX592I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_size_2d(t_ndarray f);
+#endif // mod_tg5738dx592i_H
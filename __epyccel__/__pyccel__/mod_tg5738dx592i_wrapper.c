@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_TG5738DX592I_WRAPPER
+
+#include "mod_tg5738dx592i_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_size_2d_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* f_obj;
+    t_ndarray f = {.raw_data = NULL};
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "f",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &f_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("f", f_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        f = pyarray_to_ndarray(f_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    Out_0001 = test_size_2d(f);
+    free_pointer(&f);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_tg5738dx592i_methods[] = {
+    {
+        "test_size_2d",
+        (PyCFunction)test_size_2d_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_tg5738dx592i_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_tg5738dx592i",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_tg5738dx592i_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_tg5738dx592i(void)
+{
+    PyObject* mod;
+    static void* Pymod_tg5738dx592i_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_tg5738dx592i_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_tg5738dx592i_API, "mod_tg5738dx592i._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
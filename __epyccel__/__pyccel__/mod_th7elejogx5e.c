@@ -0,0 +1,14 @@
+#include "mod_th7elejogx5e.h"
+
+
+/*........................................*/
+void axpby_step2(t_ndarray u, t_ndarray t, t_ndarray z)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < z.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(z, nd_double, i) = GET_ELEMENT(t, nd_double, i) + GET_ELEMENT(u, nd_double, i);
+    }
+}
+/*........................................*/
+
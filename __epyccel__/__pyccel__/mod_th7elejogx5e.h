@@ -0,0 +1,11 @@
+#ifndef MOD_TH7ELEJOGX5E_H
+#define MOD_TH7ELEJOGX5E_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void axpby_step2(t_ndarray u, t_ndarray t, t_ndarray z);
+#endif // mod_th7elejogx5e_H
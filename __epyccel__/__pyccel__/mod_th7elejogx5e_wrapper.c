@@ -0,0 +1,114 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_TH7ELEJOGX5E_WRAPPER
+
+#include "mod_th7elejogx5e_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* axpby_step2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* u_obj;
+    PyObject* t_obj;
+    PyObject* z_obj;
+    t_ndarray u = {.raw_data = NULL};
+    t_ndarray t = {.raw_data = NULL};
+    t_ndarray z = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "u",
+        "t",
+        "z",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &u_obj, &t_obj, &z_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("u", u_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        u = pyarray_to_ndarray(u_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("t", t_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        t = pyarray_to_ndarray(t_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("z", z_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        z = pyarray_to_ndarray(z_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    axpby_step2(u, t, z);
+    free_pointer(&u);
+    free_pointer(&t);
+    free_pointer(&z);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_th7elejogx5e_methods[] = {
+    {
+        "axpby_step2",
+        (PyCFunction)axpby_step2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_th7elejogx5e_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_th7elejogx5e",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_th7elejogx5e_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_th7elejogx5e(void)
+{
+    PyObject* mod;
+    static void* Pymod_th7elejogx5e_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_th7elejogx5e_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_th7elejogx5e_API, "mod_th7elejogx5e._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,27 @@
+#include "mod_thl87twqsbrk.h"
+
+
+/*........................................*/
+int32_t int_vs_int_array(void)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int32_t Out_0001;
+    Dummy_0000 = array_create(1, (int64_t[]){(int64_t)ceil((double)((INT64_C(7) - INT64_C(0))) / 1.0)}, nd_int32, false, order_c);
+    {
+        int32_t* restrict Dummy_0000_data = Dummy_0000.nd_int32;
+        for (i = INT64_C(0); i < Dummy_0000.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            Dummy_0000_data[i] = i;
+        }
+    }
+    b = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    array_fill((int32_t)0, b);
+    Out_0001 = b.nd_int32[INT64_C(0)];
+    free_array(&Dummy_0000);
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_THL87TWQSBRK_H
+#define MOD_THL87TWQSBRK_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t int_vs_int_array(void);
+#endif // mod_thl87twqsbrk_H
@@ -0,0 +1,10 @@
+#ifndef MOD_THROGQ6F40NK_H
+#define MOD_THROGQ6F40NK_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t fibonacci(int64_t n);
+#endif // mod_throgq6f40nk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_THV6DLD2OUNJ_H
+#define MOD_THV6DLD2OUNJ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_thv6dld2ounj_H
@@ -0,0 +1,12 @@
+#ifndef MOD_TJ0OSZ7U293Z_H
+#define MOD_TJ0OSZ7U293Z_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_tj0osz7u293z_H
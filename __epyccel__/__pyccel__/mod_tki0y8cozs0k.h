@@ -0,0 +1,12 @@
+#ifndef MOD_TKI0Y8COZS0K_H
+#define MOD_TKI0Y8COZS0K_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuples_add_homogeneous_with_variables(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_tki0y8cozs0k_H
@@ -0,0 +1,24 @@
+#ifndef MOD_TKRUGD236QBO_H
+#define MOD_TKRUGD236QBO_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t return_array_0000(bool a, bool b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0001(int64_t a, int64_t b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0002(int8_t a, int8_t b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0003(int16_t a, int16_t b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0004(int32_t a, int32_t b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0005(int64_t a, int64_t b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0006(double a, double b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0007(float a, float b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0008(double a, double b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0009(float complex a, float complex b, t_ndarray* x, t_ndarray* y);
+int64_t return_array_0010(double complex a, double complex b, t_ndarray* x, t_ndarray* y);
+#endif // mod_tkrugd236qbo_H
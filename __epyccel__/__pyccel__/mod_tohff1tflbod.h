@@ -0,0 +1,12 @@
+#ifndef MOD_TOHFF1TFLBOD_H
+#define MOD_TOHFF1TFLBOD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_3d_F_array_initialization_2(t_ndarray a);
+#endif // mod_tohff1tflbod_H
@@ -0,0 +1,12 @@
+#ifndef MOD_TPJ0ZIEFHRBN_H
+#define MOD_TPJ0ZIEFHRBN_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_tpj0ziefhrbn_H
@@ -0,0 +1,11 @@
+#ifndef MOD_TQ4N2AC8QPG7_H
+#define MOD_TQ4N2AC8QPG7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_C_array_initialization_2(t_ndarray a, t_ndarray e, t_ndarray f, t_ndarray x);
+#endif // mod_tq4n2ac8qpg7_H
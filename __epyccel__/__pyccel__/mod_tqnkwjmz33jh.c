@@ -0,0 +1,25 @@
+#include "mod_tqnkwjmz33jh.h"
+
+
+/*........................................*/
+t_ndarray copy_to_slice_issue_1218(int64_t n)
+{
+    int64_t x;
+    int64_t i;
+    t_ndarray arr = {.raw_data = NULL};
+    x = INT64_C(2);
+    arr = array_create(2, (int64_t[]){INT64_C(3), n}, nd_double, false, order_c);
+    array_fill((double)0.0, arr);
+    {
+        double* restrict arr_data = arr.nd_double;
+        for (i = INT64_C(0); i < x - INT64_C(0); i += INT64_C(1))
+        {
+            arr_data[i * arr.shape[INT64_C(1)]] = INT64_C(2);
+            arr_data[i * arr.shape[INT64_C(1)] + INT64_C(2)] = INT64_C(5);
+            arr_data[i * arr.shape[INT64_C(1)] + INT64_C(4)] = INT64_C(6);
+        }
+    }
+    return arr;
+}
+/*........................................*/
+
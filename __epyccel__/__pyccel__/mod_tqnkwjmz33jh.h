@@ -0,0 +1,11 @@
+#ifndef MOD_TQNKWJMZ33JH_H
+#define MOD_TQNKWJMZ33JH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_to_slice_issue_1218(int64_t n);
+#endif // mod_tqnkwjmz33jh_H
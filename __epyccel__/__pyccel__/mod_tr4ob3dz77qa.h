@@ -0,0 +1,11 @@
+#ifndef MOD_TR4OB3DZ77QA_H
+#define MOD_TR4OB3DZ77QA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_argument_negative_index_2(t_ndarray a, t_ndarray b, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_tr4ob3dz77qa_H
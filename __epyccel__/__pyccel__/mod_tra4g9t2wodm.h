@@ -0,0 +1,11 @@
+#ifndef MOD_TRA4G9T2WODM_H
+#define MOD_TRA4G9T2WODM_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_flush(void);
+#endif // mod_tra4g9t2wodm_H
@@ -0,0 +1,123 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_TRFCRT0R7CDZ_WRAPPER
+
+#include "mod_trfcrt0r7cdz_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* start_obj;
+    PyObject* end_obj;
+    float complex start;
+    float complex end;
+    PyObject* Out_0001_obj;
+    float complex Out_0001;
+    PyObject* Out_0002_obj;
+    float complex Out_0002;
+    PyObject* Out_0003_obj;
+    float complex Out_0003;
+    PyObject* Out_0004_obj;
+    float complex Out_0004;
+    PyObject* Out_0005_obj;
+    float complex Out_0005;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "start",
+        "end",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &start_obj, &end_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Complex64(start_obj))
+    {
+        start = PyComplex_to_Complex64(start_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.complex64 for argument start");
+        return NULL;
+    }
+    if (PyIs_Complex64(end_obj))
+    {
+        end = PyComplex_to_Complex64(end_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.complex64 for argument end");
+        return NULL;
+    }
+    test_linspace(start, end, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    Out_0001_obj = Complex64_to_NumpyComplex(&Out_0001);
+    Out_0002_obj = Complex64_to_NumpyComplex(&Out_0002);
+    Out_0003_obj = Complex64_to_NumpyComplex(&Out_0003);
+    Out_0004_obj = Complex64_to_NumpyComplex(&Out_0004);
+    Out_0005_obj = Complex64_to_NumpyComplex(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_trfcrt0r7cdz_methods[] = {
+    {
+        "test_linspace",
+        (PyCFunction)test_linspace_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_trfcrt0r7cdz_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_trfcrt0r7cdz",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_trfcrt0r7cdz_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_trfcrt0r7cdz(void)
+{
+    PyObject* mod;
+    static void* Pymod_trfcrt0r7cdz_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_trfcrt0r7cdz_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_trfcrt0r7cdz_API, "mod_trfcrt0r7cdz._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_TSX34HRFSWE3_H
+#define MOD_TSX34HRFSWE3_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_active_level(void);
+#endif // mod_tsx34hrfswe3_H
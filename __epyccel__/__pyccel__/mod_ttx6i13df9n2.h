@@ -0,0 +1,13 @@
+#ifndef MOD_TTX6I13DF9N2_H
+#define MOD_TTX6I13DF9N2_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float complex create_ones_like_val_complex64_auto(void);
+#endif // mod_ttx6i13df9n2_H
@@ -0,0 +1,40 @@
+#ifndef MOD_TTX6I13DF9N2_WRAPPER_H
+#define MOD_TTX6I13DF9N2_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ttx6i13df9n2.h"
+
+
+#ifdef MOD_TTX6I13DF9N2_WRAPPER
+
+
+#else
+
+static void** Pymod_ttx6i13df9n2_API;
+
+
+/*........................................*/
+static int mod_ttx6i13df9n2_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ttx6i13df9n2_API = (void**)PyCapsule_Import("mod_ttx6i13df9n2._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ttx6i13df9n2_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_TTX6I13DF9N2_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_TUEODPVQ9BNA_H
+#define MOD_TUEODPVQ9BNA_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_tueodpvq9bna_H
@@ -0,0 +1,16 @@
+#include "mod_tvcfscuyu512.h"
+
+
+/*........................................*/
+double create_full_val_real_float64(double val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_double, false, order_c);
+    array_fill(val, a);
+    Out_0001 = a.nd_double[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
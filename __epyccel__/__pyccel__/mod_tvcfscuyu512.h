@@ -0,0 +1,11 @@
+#ifndef MOD_TVCFSCUYU512_H
+#define MOD_TVCFSCUYU512_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_full_val_real_float64(double val);
+#endif // mod_tvcfscuyu512_H
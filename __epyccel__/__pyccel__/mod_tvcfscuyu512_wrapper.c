@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_TVCFSCUYU512_WRAPPER
+
+#include "mod_tvcfscuyu512_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_val_real_float64_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* val_obj;
+    double val;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "val",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &val_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(val_obj))
+    {
+        val = PyDouble_to_Double(val_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument val");
+        return NULL;
+    }
+    Out_0001 = create_full_val_real_float64(val);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_tvcfscuyu512_methods[] = {
+    {
+        "create_full_val_real_float64",
+        (PyCFunction)create_full_val_real_float64_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_tvcfscuyu512_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_tvcfscuyu512",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_tvcfscuyu512_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_tvcfscuyu512(void)
+{
+    PyObject* mod;
+    static void* Pymod_tvcfscuyu512_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_tvcfscuyu512_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_tvcfscuyu512_API, "mod_tvcfscuyu512._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,20 @@
+#ifndef MOD_TWPEPOVMDN1F_H
+#define MOD_TWPEPOVMDN1F_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t dtype_convert_to_pyfloat_0000(t_ndarray arr, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+int64_t dtype_convert_to_pyfloat_0001(t_ndarray arr, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+int64_t dtype_convert_to_pyfloat_0002(t_ndarray arr, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+int64_t dtype_convert_to_pyfloat_0003(t_ndarray arr, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+int64_t dtype_convert_to_pyfloat_0004(t_ndarray arr, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+int64_t dtype_convert_to_pyfloat_0005(t_ndarray arr, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+int64_t dtype_convert_to_pyfloat_0006(t_ndarray arr, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+int64_t dtype_convert_to_pyfloat_0007(t_ndarray arr, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+int64_t dtype_convert_to_pyfloat_0008(t_ndarray arr, int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+#endif // mod_twpepovmdn1f_H
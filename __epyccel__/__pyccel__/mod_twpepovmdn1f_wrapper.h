@@ -0,0 +1,42 @@
+#ifndef MOD_TWPEPOVMDN1F_WRAPPER_H
+#define MOD_TWPEPOVMDN1F_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_twpepovmdn1f.h"
+
+
+#ifdef MOD_TWPEPOVMDN1F_WRAPPER
+
+
+#else
+
+static void** Pymod_twpepovmdn1f_API;
+
+
+/*........................................*/
+static int mod_twpepovmdn1f_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_twpepovmdn1f_API = (void**)PyCapsule_Import("mod_twpepovmdn1f._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_twpepovmdn1f_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_TWPEPOVMDN1F_WRAPPER_H
@@ -0,0 +1,14 @@
+#include "mod_tyc3lywj3atz.h"
+
+
+/*........................................*/
+void axpby_step1(t_ndarray x, t_ndarray t, double alpha)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < t.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(t, nd_double, i) = alpha * GET_ELEMENT(x, nd_double, i);
+    }
+}
+/*........................................*/
+
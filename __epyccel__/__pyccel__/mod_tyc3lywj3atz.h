@@ -0,0 +1,11 @@
+#ifndef MOD_TYC3LYWJ3ATZ_H
+#define MOD_TYC3LYWJ3ATZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void axpby_step1(t_ndarray x, t_ndarray t, double alpha);
+#endif // mod_tyc3lywj3atz_H
@@ -0,0 +1,114 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_TYC3LYWJ3ATZ_WRAPPER
+
+#include "mod_tyc3lywj3atz_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* axpby_step1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* t_obj;
+    PyObject* alpha_obj;
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray t = {.raw_data = NULL};
+    double alpha;
+    static const char* const kwlist[] = {
+        "x",
+        "t",
+        "alpha",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &x_obj, &t_obj, &alpha_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("t", t_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        t = pyarray_to_ndarray(t_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(alpha_obj))
+    {
+        alpha = PyDouble_to_Double(alpha_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument alpha");
+        return NULL;
+    }
+    axpby_step1(x, t, alpha);
+    free_pointer(&x);
+    free_pointer(&t);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_tyc3lywj3atz_methods[] = {
+    {
+        "axpby_step1",
+        (PyCFunction)axpby_step1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_tyc3lywj3atz_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_tyc3lywj3atz",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_tyc3lywj3atz_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_tyc3lywj3atz(void)
+{
+    PyObject* mod;
+    static void* Pymod_tyc3lywj3atz_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_tyc3lywj3atz_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_tyc3lywj3atz_API, "mod_tyc3lywj3atz._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,28 @@
+#include "mod_tyy8f9i1zd2a.h"
+
+
+/*........................................*/
+int64_t tuples_add_mixed_homogeneous(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, int64_t* Out_0005, int64_t* Out_0006)
+{
+    int64_t a_0;
+    int64_t a_1;
+    int64_t a_2;
+    bool a_3;
+    int64_t a_4;
+    int64_t a_5;
+    a_0 = INT64_C(1);
+    a_1 = INT64_C(2);
+    a_2 = INT64_C(3);
+    a_3 = 0;
+    a_4 = INT64_C(5);
+    a_5 = INT64_C(6);
+    (*Out_0001) = a_0;
+    (*Out_0002) = a_1;
+    (*Out_0003) = a_2;
+    (*Out_0004) = a_3;
+    (*Out_0005) = a_4;
+    (*Out_0006) = a_5;
+    return 0;
+}
+/*........................................*/
+
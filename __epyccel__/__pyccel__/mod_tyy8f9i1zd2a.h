@@ -0,0 +1,11 @@
+#ifndef MOD_TYY8F9I1ZD2A_H
+#define MOD_TYY8F9I1ZD2A_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_add_mixed_homogeneous(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_tyy8f9i1zd2a_H
@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_TYY8F9I1ZD2A_WRAPPER
+
+#include "mod_tyy8f9i1zd2a_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tuples_add_mixed_homogeneous_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    tuples_add_mixed_homogeneous(&Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Int64_to_PyLong(&Out_0005);
+    Out_0006_obj = Int64_to_PyLong(&Out_0006);
+    Out_obj = Py_BuildValue("OOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_tyy8f9i1zd2a_methods[] = {
+    {
+        "tuples_add_mixed_homogeneous",
+        (PyCFunction)tuples_add_mixed_homogeneous_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_tyy8f9i1zd2a_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_tyy8f9i1zd2a",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_tyy8f9i1zd2a_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_tyy8f9i1zd2a(void)
+{
+    PyObject* mod;
+    static void* Pymod_tyy8f9i1zd2a_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_tyy8f9i1zd2a_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_tyy8f9i1zd2a_API, "mod_tyy8f9i1zd2a._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_TYYZAW98RF73_H
+#define MOD_TYYZAW98RF73_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_team_size(void);
+#endif // mod_tyyzaw98rf73_H
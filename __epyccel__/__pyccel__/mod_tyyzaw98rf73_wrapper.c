@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_TYYZAW98RF73_WRAPPER
+
+#include "mod_tyyzaw98rf73_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_get_team_size_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t team_size;
+    PyObject* team_size_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    team_size = test_omp_get_team_size();
+    team_size_obj = Int32_to_NumpyLong(&team_size);
+    return team_size_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_tyyzaw98rf73_methods[] = {
+    {
+        "test_omp_get_team_size",
+        (PyCFunction)test_omp_get_team_size_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_tyyzaw98rf73_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_tyyzaw98rf73",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_tyyzaw98rf73_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_tyyzaw98rf73(void)
+{
+    PyObject* mod;
+    static void* Pymod_tyyzaw98rf73_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_tyyzaw98rf73_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_tyyzaw98rf73_API, "mod_tyyzaw98rf73._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
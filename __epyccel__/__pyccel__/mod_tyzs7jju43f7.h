@@ -0,0 +1,11 @@
+#ifndef MOD_TYZS7JJU43F7_H
+#define MOD_TYZS7JJU43F7_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_tyzs7jju43f7_H
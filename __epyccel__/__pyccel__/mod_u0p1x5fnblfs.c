@@ -0,0 +1,12 @@
+#include "mod_u0p1x5fnblfs.h"
+
+
+/*........................................*/
+double complex tan_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = ctan(x) + ctan(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_U0P1X5FNBLFS_H
+#define MOD_U0P1X5FNBLFS_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex tan_phrase(double complex x, double complex y);
+#endif // mod_u0p1x5fnblfs_H
@@ -0,0 +1,40 @@
+#ifndef MOD_U0P1X5FNBLFS_WRAPPER_H
+#define MOD_U0P1X5FNBLFS_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_u0p1x5fnblfs.h"
+
+
+#ifdef MOD_U0P1X5FNBLFS_WRAPPER
+
+
+#else
+
+static void** Pymod_u0p1x5fnblfs_API;
+
+
+/*........................................*/
+static int mod_u0p1x5fnblfs_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_u0p1x5fnblfs_API = (void**)PyCapsule_Import("mod_u0p1x5fnblfs._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_u0p1x5fnblfs_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_U0P1X5FNBLFS_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_U0XCE5Z6ZO51_H
+#define MOD_U0XCE5Z6ZO51_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum(t_ndarray x);
+#endif // mod_u0xce5z6zo51_H
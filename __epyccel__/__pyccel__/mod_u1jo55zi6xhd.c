@@ -0,0 +1,12 @@
+#include "mod_u1jo55zi6xhd.h"
+
+
+/*........................................*/
+int64_t sum_call(t_ndarray x)
+{
+    int64_t Out_0001;
+    Out_0001 = numpy_sum_bool(x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_U1JO55ZI6XHD_H
+#define MOD_U1JO55ZI6XHD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t sum_call(t_ndarray x);
+#endif // mod_u1jo55zi6xhd_H
@@ -0,0 +1,19 @@
+#ifndef MOD_U2TNWEXQCWZR_H
+#define MOD_U2TNWEXQCWZR_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_full_val_auto_0000(int64_t val);
+double create_full_val_auto_0001(double val);
+double complex create_full_val_auto_0002(double complex val);
+int32_t create_full_val_auto_0003(int32_t val);
+float create_full_val_auto_0004(float val);
+double create_full_val_auto_0005(double val);
+float complex create_full_val_auto_0006(float complex val);
+double complex create_full_val_auto_0007(double complex val);
+#endif // mod_u2tnwexqcwzr_H
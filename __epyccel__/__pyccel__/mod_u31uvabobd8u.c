@@ -0,0 +1,17 @@
+#include "mod_u31uvabobd8u.h"
+
+
+/*........................................*/
+bool non_negative(int64_t i)
+{
+    if (i < INT64_C(0))
+    {
+        return 0;
+    }
+    else
+    {
+        return 1;
+    }
+}
+/*........................................*/
+
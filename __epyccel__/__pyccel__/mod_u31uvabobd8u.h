@@ -0,0 +1,11 @@
+#ifndef MOD_U31UVABOBD8U_H
+#define MOD_U31UVABOBD8U_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+bool non_negative(int64_t i);
+#endif // mod_u31uvabobd8u_H
@@ -0,0 +1,12 @@
+#ifndef MOD_U350E3LPDK88_H
+#define MOD_U350E3LPDK88_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_shape_1d(t_ndarray f);
+#endif // mod_u350e3lpdk88_H
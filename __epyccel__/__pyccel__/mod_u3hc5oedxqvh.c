@@ -0,0 +1,12 @@
+#include "mod_u3hc5oedxqvh.h"
+
+
+/*........................................*/
+double asin_phrase(double x, double y)
+{
+    double a;
+    a = asin(x) + asin(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_U3HC5OEDXQVH_H
+#define MOD_U3HC5OEDXQVH_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double asin_phrase(double x, double y);
+#endif // mod_u3hc5oedxqvh_H
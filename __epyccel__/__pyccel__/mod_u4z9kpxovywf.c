@@ -0,0 +1,10 @@
+#include "mod_u4z9kpxovywf.h"
+
+
+/*........................................*/
+double cosh_call_i(int64_t x)
+{
+    return cosh((double)(x));
+}
+/*........................................*/
+
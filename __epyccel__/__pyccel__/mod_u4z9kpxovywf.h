@@ -0,0 +1,11 @@
+#ifndef MOD_U4Z9KPXOVYWF_H
+#define MOD_U4Z9KPXOVYWF_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double cosh_call_i(int64_t x);
+#endif // mod_u4z9kpxovywf_H
@@ -0,0 +1,10 @@
+#include "mod_u64ps3fya7ua.h"
+
+
+/*........................................*/
+int64_t return_scalare(void)
+{
+    return INT64_C(5);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_U64PS3FYA7UA_H
+#define MOD_U64PS3FYA7UA_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t return_scalare(void);
+#endif // mod_u64ps3fya7ua_H
@@ -0,0 +1,40 @@
+#ifndef MOD_U64PS3FYA7UA_WRAPPER_H
+#define MOD_U64PS3FYA7UA_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_u64ps3fya7ua.h"
+
+
+#ifdef MOD_U64PS3FYA7UA_WRAPPER
+
+
+#else
+
+static void** Pymod_u64ps3fya7ua_API;
+
+
+/*........................................*/
+static int mod_u64ps3fya7ua_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_u64ps3fya7ua_API = (void**)PyCapsule_Import("mod_u64ps3fya7ua._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_u64ps3fya7ua_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_U64PS3FYA7UA_WRAPPER_H
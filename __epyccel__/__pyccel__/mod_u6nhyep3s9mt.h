@@ -0,0 +1,11 @@
+#ifndef MOD_U6NHYEP3S9MT_H
+#define MOD_U6NHYEP3S9MT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_u6nhyep3s9mt_H
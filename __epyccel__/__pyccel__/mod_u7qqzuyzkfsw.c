@@ -0,0 +1,18 @@
+#include "mod_u7qqzuyzkfsw.h"
+
+
+/*........................................*/
+int64_t test_c_order_argument_negative_index(t_ndarray a, t_ndarray b, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    int64_t c;
+    int64_t d;
+    c = -INT64_C(2);
+    d = INT64_C(2);
+    (*Out_0001) = GET_ELEMENT(a, nd_int64, c < INT64_C(0) ? a.shape[INT64_C(0)] + c : c, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(a, nd_int64, INT64_C(1), d < INT64_C(0) ? a.shape[INT64_C(1)] + d : d);
+    (*Out_0003) = GET_ELEMENT(b, nd_int64, c < INT64_C(0) ? b.shape[INT64_C(0)] + c : c, INT64_C(1));
+    (*Out_0004) = GET_ELEMENT(b, nd_int64, d < INT64_C(0) ? b.shape[INT64_C(0)] + d : d, INT64_C(0));
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_U8SF37JP4RA6_H
+#define MOD_U8SF37JP4RA6_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(int64_t i);
+#endif // mod_u8sf37jp4ra6_H
@@ -0,0 +1,12 @@
+#ifndef MOD_U9QA3X4TOJ2R_H
+#define MOD_U9QA3X4TOJ2R_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_u9qa3x4toj2r_H
@@ -0,0 +1,26 @@
+#include "mod_ua5sht8ycacv.h"
+
+
+/*........................................*/
+void array_float_2d_C_array_initialization(t_ndarray a)
+{
+    t_ndarray tmp = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    tmp = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_double, false, order_c);
+    double Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&tmp.nd_double[INT64_C(0)], Dummy_0000, 6 * tmp.type_size);
+    {
+        double* restrict tmp_data = tmp.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                GET_ELEMENT(a, nd_double, i, i_0001) = tmp_data[i * tmp.shape[INT64_C(1)] + i_0001];
+            }
+        }
+    }
+    free_array(&tmp);
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_UA5SHT8YCACV_H
+#define MOD_UA5SHT8YCACV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_2d_C_array_initialization(t_ndarray a);
+#endif // mod_ua5sht8ycacv_H
@@ -0,0 +1,12 @@
+#ifndef MOD_UBCHSTBA8PS9_H
+#define MOD_UBCHSTBA8PS9_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_ubchstba8ps9_H
@@ -0,0 +1,11 @@
+#ifndef MOD_UBDKM16TXOEU_H
+#define MOD_UBDKM16TXOEU_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_ubdkm16txoeu_H
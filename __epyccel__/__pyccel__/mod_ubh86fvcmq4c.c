@@ -0,0 +1,14 @@
+#include "mod_ubh86fvcmq4c.h"
+
+
+/*........................................*/
+void array_int_1d_scalar_add(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i) += a;
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_UBH86FVCMQ4C_H
+#define MOD_UBH86FVCMQ4C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_add(t_ndarray x, int64_t a);
+#endif // mod_ubh86fvcmq4c_H
@@ -0,0 +1,12 @@
+#include "mod_ubye6itlel62.h"
+
+
+/*........................................*/
+int64_t f1(int64_t x)
+{
+    int64_t y;
+    y = x - INT64_C(1);
+    return y;
+}
+/*........................................*/
+
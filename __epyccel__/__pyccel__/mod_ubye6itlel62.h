@@ -0,0 +1,10 @@
+#ifndef MOD_UBYE6ITLEL62_H
+#define MOD_UBYE6ITLEL62_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(int64_t x);
+#endif // mod_ubye6itlel62_H
@@ -0,0 +1,11 @@
+#ifndef MOD_UDWQLFLJWD6D_H
+#define MOD_UDWQLFLJWD6D_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_sub(t_ndarray x, t_ndarray y);
+#endif // mod_udwqlfljwd6d_H
@@ -0,0 +1,10 @@
+#include "mod_uf36n4c3z4pq.h"
+
+
+/*........................................*/
+int64_t f(bool a, bool b)
+{
+    return (int64_t)(a || b);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_UF36N4C3Z4PQ_H
+#define MOD_UF36N4C3Z4PQ_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(bool a, bool b);
+#endif // mod_uf36n4c3z4pq_H
@@ -0,0 +1,104 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_UF36N4C3Z4PQ_WRAPPER
+
+#include "mod_uf36n4c3z4pq_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    bool a;
+    bool b;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &a_obj, &b_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Bool(a_obj))
+    {
+        a = PyBool_to_Bool(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument a");
+        return NULL;
+    }
+    if (PyIs_Bool(b_obj))
+    {
+        b = PyBool_to_Bool(b_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument b");
+        return NULL;
+    }
+    Out_0001 = f(a, b);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_uf36n4c3z4pq_methods[] = {
+    {
+        "f",
+        (PyCFunction)f_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_uf36n4c3z4pq_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_uf36n4c3z4pq",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_uf36n4c3z4pq_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_uf36n4c3z4pq(void)
+{
+    PyObject* mod;
+    static void* Pymod_uf36n4c3z4pq_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_uf36n4c3z4pq_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_uf36n4c3z4pq_API, "mod_uf36n4c3z4pq._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,13 @@
+#ifndef MOD_UFYLROE5UWF4_H
+#define MOD_UFYLROE5UWF4_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_like_3_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_ufylroe5uwf4_H
@@ -0,0 +1,12 @@
+#ifndef MOD_UGLNSBTHWGNP_H
+#define MOD_UGLNSBTHWGNP_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void product_loop_on_real_array(t_ndarray z, t_ndarray out);
+#endif // mod_uglnsbthwgnp_H
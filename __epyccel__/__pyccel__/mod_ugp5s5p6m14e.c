@@ -0,0 +1,10 @@
+#include "mod_ugp5s5p6m14e.h"
+
+
+/*........................................*/
+double complex sinh_call(double complex x)
+{
+    return csinh(x);
+}
+/*........................................*/
+
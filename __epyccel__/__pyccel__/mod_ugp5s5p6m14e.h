@@ -0,0 +1,10 @@
+#ifndef MOD_UGP5S5P6M14E_H
+#define MOD_UGP5S5P6M14E_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex sinh_call(double complex x);
+#endif // mod_ugp5s5p6m14e_H
@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_UGP5S5P6M14E_WRAPPER
+
+#include "mod_ugp5s5p6m14e_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* sinh_call_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    double complex x;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeComplex(x_obj))
+    {
+        x = PyComplex_to_Complex128(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type complex for argument x");
+        return NULL;
+    }
+    Out_0001 = sinh_call(x);
+    Out_0001_obj = Complex128_to_PyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ugp5s5p6m14e_methods[] = {
+    {
+        "sinh_call",
+        (PyCFunction)sinh_call_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ugp5s5p6m14e_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ugp5s5p6m14e",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ugp5s5p6m14e_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ugp5s5p6m14e(void)
+{
+    PyObject* mod;
+    static void* Pymod_ugp5s5p6m14e_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ugp5s5p6m14e_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ugp5s5p6m14e_API, "mod_ugp5s5p6m14e._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
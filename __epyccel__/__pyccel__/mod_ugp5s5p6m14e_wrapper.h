@@ -0,0 +1,40 @@
+#ifndef MOD_UGP5S5P6M14E_WRAPPER_H
+#define MOD_UGP5S5P6M14E_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ugp5s5p6m14e.h"
+
+
+#ifdef MOD_UGP5S5P6M14E_WRAPPER
+
+
+#else
+
+static void** Pymod_ugp5s5p6m14e_API;
+
+
+/*........................................*/
+static int mod_ugp5s5p6m14e_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ugp5s5p6m14e_API = (void**)PyCapsule_Import("mod_ugp5s5p6m14e._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ugp5s5p6m14e_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_UGP5S5P6M14E_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_UGZA52YIBICY_H
+#define MOD_UGZA52YIBICY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_combined(t_ndarray x);
+#endif // mod_ugza52yibicy_H
@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_UGZA52YIBICY_WRAPPER
+
+#include "mod_ugza52yibicy_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* omp_arraysum_combined_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    int64_t func_result;
+    PyObject* func_result_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    func_result = omp_arraysum_combined(x);
+    free_pointer(&x);
+    func_result_obj = Int64_to_PyLong(&func_result);
+    return func_result_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ugza52yibicy_methods[] = {
+    {
+        "omp_arraysum_combined",
+        (PyCFunction)omp_arraysum_combined_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ugza52yibicy_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ugza52yibicy",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ugza52yibicy_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ugza52yibicy(void)
+{
+    PyObject* mod;
+    static void* Pymod_ugza52yibicy_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ugza52yibicy_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ugza52yibicy_API, "mod_ugza52yibicy._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,10 @@
+#include "mod_uh5o2775a1zd.h"
+
+
+/*........................................*/
+double cos_call_r(double x)
+{
+    return cos(x);
+}
+/*........................................*/
+
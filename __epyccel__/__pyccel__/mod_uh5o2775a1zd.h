@@ -0,0 +1,10 @@
+#ifndef MOD_UH5O2775A1ZD_H
+#define MOD_UH5O2775A1ZD_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double cos_call_r(double x);
+#endif // mod_uh5o2775a1zd_H
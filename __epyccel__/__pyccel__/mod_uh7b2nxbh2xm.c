@@ -0,0 +1,28 @@
+#include "mod_uh7b2nxbh2xm.h"
+
+
+/*........................................*/
+int64_t test_multiple_negative_index_3(int64_t d, int64_t e, int64_t f, double* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(4)}, nd_double, false, order_c);
+    double Dummy_0000[] = {1.2, 2.2, 3.2, 4.2};
+    memcpy(&a.nd_double[INT64_C(0)], Dummy_0000, 4 * a.type_size);
+    b = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(1)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0001, 1 * b.type_size);
+    c = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0002[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&c.nd_int64[INT64_C(0)], Dummy_0002, 3 * c.type_size);
+    (*Out_0001) = a.nd_double[d < INT64_C(0) ? INT64_C(4) + d : d];
+    (*Out_0002) = b.nd_int64[e < INT64_C(0) ? INT64_C(1) + e : e];
+    (*Out_0003) = c.nd_int64[f < INT64_C(0) ? INT64_C(3) + f : f];
+    free_array(&c);
+    free_array(&b);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,18 @@
+#ifndef MOD_UI6ENFDKTEEO_H
+#define MOD_UI6ENFDKTEEO_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t where_wrapper_0000(t_ndarray cond, t_ndarray arr1, t_ndarray arr2, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+int64_t where_wrapper_0001(t_ndarray cond, t_ndarray arr1, t_ndarray arr2, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003, double* Out_0004);
+int64_t where_wrapper_0002(t_ndarray cond, t_ndarray arr1, t_ndarray arr2, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003, double* Out_0004);
+int64_t where_wrapper_0003(t_ndarray cond, t_ndarray arr1, t_ndarray arr2, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003, double* Out_0004);
+int64_t where_wrapper_0004(t_ndarray cond, t_ndarray arr1, t_ndarray arr2, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+int64_t where_wrapper_0005(t_ndarray cond, t_ndarray arr1, t_ndarray arr2, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+#endif // mod_ui6enfdkteeo_H
@@ -0,0 +1,366 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_UI6ENFDKTEEO_WRAPPER
+
+#include "mod_ui6enfdkteeo_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* where_wrapper_0000_wrapper(PyObject* cond_obj, PyObject* arr1_obj, PyObject* arr2_obj)
+{
+    t_ndarray cond = {.raw_data = NULL};
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_obj;
+    cond = pyarray_to_ndarray(cond_obj);
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    where_wrapper_0000(cond, arr1, arr2, &Out_0001, &Out_0002, &Out_0003, &Out_0004);
+    free_pointer(&cond);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int64_to_NumpyLong(&Out_0004);
+    Out_obj = Py_BuildValue("OOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* where_wrapper_0001_wrapper(PyObject* cond_obj, PyObject* arr1_obj, PyObject* arr2_obj)
+{
+    t_ndarray cond = {.raw_data = NULL};
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    double Out_0003;
+    PyObject* Out_0004_obj;
+    double Out_0004;
+    PyObject* Out_obj;
+    cond = pyarray_to_ndarray(cond_obj);
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    where_wrapper_0001(cond, arr1, arr2, &Out_0001, &Out_0002, &Out_0003, &Out_0004);
+    free_pointer(&cond);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Double_to_NumpyDouble(&Out_0003);
+    Out_0004_obj = Double_to_NumpyDouble(&Out_0004);
+    Out_obj = Py_BuildValue("OOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* where_wrapper_0002_wrapper(PyObject* cond_obj, PyObject* arr1_obj, PyObject* arr2_obj)
+{
+    t_ndarray cond = {.raw_data = NULL};
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    double Out_0003;
+    PyObject* Out_0004_obj;
+    double Out_0004;
+    PyObject* Out_obj;
+    cond = pyarray_to_ndarray(cond_obj);
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    where_wrapper_0002(cond, arr1, arr2, &Out_0001, &Out_0002, &Out_0003, &Out_0004);
+    free_pointer(&cond);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Double_to_NumpyDouble(&Out_0003);
+    Out_0004_obj = Double_to_NumpyDouble(&Out_0004);
+    Out_obj = Py_BuildValue("OOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* where_wrapper_0003_wrapper(PyObject* cond_obj, PyObject* arr1_obj, PyObject* arr2_obj)
+{
+    t_ndarray cond = {.raw_data = NULL};
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    double Out_0003;
+    PyObject* Out_0004_obj;
+    double Out_0004;
+    PyObject* Out_obj;
+    cond = pyarray_to_ndarray(cond_obj);
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    where_wrapper_0003(cond, arr1, arr2, &Out_0001, &Out_0002, &Out_0003, &Out_0004);
+    free_pointer(&cond);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Double_to_NumpyDouble(&Out_0003);
+    Out_0004_obj = Double_to_NumpyDouble(&Out_0004);
+    Out_obj = Py_BuildValue("OOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* where_wrapper_0004_wrapper(PyObject* cond_obj, PyObject* arr1_obj, PyObject* arr2_obj)
+{
+    t_ndarray cond = {.raw_data = NULL};
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    double complex Out_0003;
+    PyObject* Out_0004_obj;
+    double complex Out_0004;
+    PyObject* Out_obj;
+    cond = pyarray_to_ndarray(cond_obj);
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    where_wrapper_0004(cond, arr1, arr2, &Out_0001, &Out_0002, &Out_0003, &Out_0004);
+    free_pointer(&cond);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Complex128_to_NumpyComplex(&Out_0003);
+    Out_0004_obj = Complex128_to_NumpyComplex(&Out_0004);
+    Out_obj = Py_BuildValue("OOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* where_wrapper_0005_wrapper(PyObject* cond_obj, PyObject* arr1_obj, PyObject* arr2_obj)
+{
+    t_ndarray cond = {.raw_data = NULL};
+    t_ndarray arr1 = {.raw_data = NULL};
+    t_ndarray arr2 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    double complex Out_0003;
+    PyObject* Out_0004_obj;
+    double complex Out_0004;
+    PyObject* Out_obj;
+    cond = pyarray_to_ndarray(cond_obj);
+    arr1 = pyarray_to_ndarray(arr1_obj);
+    arr2 = pyarray_to_ndarray(arr2_obj);
+    where_wrapper_0005(cond, arr1, arr2, &Out_0001, &Out_0002, &Out_0003, &Out_0004);
+    free_pointer(&cond);
+    free_pointer(&arr1);
+    free_pointer(&arr2);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Complex128_to_NumpyComplex(&Out_0003);
+    Out_0004_obj = Complex128_to_NumpyComplex(&Out_0004);
+    Out_obj = Py_BuildValue("OOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t where_wrapper_type_check(PyObject* cond_obj, PyObject* arr1_obj, PyObject* arr2_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(arr1_obj, NPY_INT32, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_CDOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr1");
+        return -INT64_C(1);
+    }
+    if (is_numpy_array(arr2_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_FLOAT, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr2");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* where_wrapper_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* cond_obj;
+    PyObject* arr1_obj;
+    PyObject* arr2_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "cond",
+        "arr1",
+        "arr2",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &cond_obj, &arr1_obj, &arr2_obj))
+    {
+        return NULL;
+    }
+    type_indicator = where_wrapper_type_check(cond_obj, arr1_obj, arr2_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return where_wrapper_0000_wrapper(cond_obj, arr1_obj, arr2_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return where_wrapper_0001_wrapper(cond_obj, arr1_obj, arr2_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return where_wrapper_0002_wrapper(cond_obj, arr1_obj, arr2_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return where_wrapper_0003_wrapper(cond_obj, arr1_obj, arr2_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return where_wrapper_0004_wrapper(cond_obj, arr1_obj, arr2_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return where_wrapper_0005_wrapper(cond_obj, arr1_obj, arr2_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ui6enfdkteeo_methods[] = {
+    {
+        "where_wrapper",
+        (PyCFunction)where_wrapper_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ui6enfdkteeo_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ui6enfdkteeo",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ui6enfdkteeo_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ui6enfdkteeo(void)
+{
+    PyObject* mod;
+    static void* Pymod_ui6enfdkteeo_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ui6enfdkteeo_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ui6enfdkteeo_API, "mod_ui6enfdkteeo._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_UI6RTCH8TXCV_H
+#define MOD_UI6RTCH8TXCV_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_ui6rtch8txcv_H
@@ -0,0 +1,47 @@
+#include "mod_uj8yuh6rm0yl.h"
+
+
+/*........................................*/
+int64_t zip_prod(int64_t m)
+{
+    int64_t i;
+    vec_int64_t x = {0};
+    int64_t Dummy_0000;
+    int64_t j;
+    vec_int64_t y = {0};
+    int64_t Dummy_0001;
+    int64_t i1;
+    int64_t i2;
+    int64_t Dummy_0002;
+    int64_t Dummy_0003;
+    int64_t Dummy_0004;
+    int64_t res;
+    vec_int64_t_resize(&x, m, 0);
+    Dummy_0000 = INT64_C(0);
+    for (i = INT64_C(0); i < m; i += INT64_C(1))
+    {
+        (*vec_int64_t_at_mut(&x,Dummy_0000)) = i;
+        Dummy_0000 = Dummy_0000 + INT64_C(1);
+    }
+    vec_int64_t_resize(&y, m, 0);
+    Dummy_0001 = INT64_C(0);
+    for (j = INT64_C(0); j < m; j += INT64_C(1))
+    {
+        (*vec_int64_t_at_mut(&y,Dummy_0001)) = INT64_C(2) * j;
+        Dummy_0001 = Dummy_0001 + INT64_C(1);
+    }
+    res = INT64_C(0);
+    Dummy_0003 = vec_int64_t_size(&x);
+    Dummy_0004 = vec_int64_t_size(&y);
+    for (Dummy_0002 = INT64_C(0); Dummy_0002 < (Dummy_0003 < Dummy_0004 ? Dummy_0003 : Dummy_0004); Dummy_0002 += INT64_C(1))
+    {
+        i1 = (*vec_int64_t_at(&x,Dummy_0002));
+        i2 = (*vec_int64_t_at(&y,Dummy_0002));
+        res += i1 * i2;
+    }
+    vec_int64_t_drop(&x);
+    vec_int64_t_drop(&y);
+    return res;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#include "mod_ujcq33fvr6jm.h"
+
+
+/*........................................*/
+double tan_phrase_i_i(int64_t x, int64_t y)
+{
+    double a;
+    a = tan((double)(x)) + tan((double)(y));
+    return a;
+}
+/*........................................*/
+
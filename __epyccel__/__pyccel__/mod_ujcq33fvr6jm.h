@@ -0,0 +1,11 @@
+#ifndef MOD_UJCQ33FVR6JM_H
+#define MOD_UJCQ33FVR6JM_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double tan_phrase_i_i(int64_t x, int64_t y);
+#endif // mod_ujcq33fvr6jm_H
@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_UJCQ33FVR6JM_WRAPPER
+
+#include "mod_ujcq33fvr6jm_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tan_phrase_i_i_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    int64_t x;
+    int64_t y;
+    double a;
+    PyObject* a_obj;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(x_obj))
+    {
+        x = PyInt64_to_Int64(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument x");
+        return NULL;
+    }
+    if (PyIs_NativeInt(y_obj))
+    {
+        y = PyInt64_to_Int64(y_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument y");
+        return NULL;
+    }
+    a = tan_phrase_i_i(x, y);
+    a_obj = Double_to_NumpyDouble(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ujcq33fvr6jm_methods[] = {
+    {
+        "tan_phrase_i_i",
+        (PyCFunction)tan_phrase_i_i_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ujcq33fvr6jm_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ujcq33fvr6jm",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ujcq33fvr6jm_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ujcq33fvr6jm(void)
+{
+    PyObject* mod;
+    static void* Pymod_ujcq33fvr6jm_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ujcq33fvr6jm_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ujcq33fvr6jm_API, "mod_ujcq33fvr6jm._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_UKCOGOSFND5I_H
+#define MOD_UKCOGOSFND5I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_ukcogosfnd5i_H
@@ -0,0 +1,16 @@
+#include "mod_ulais6ct6onx.h"
+
+
+/*........................................*/
+int64_t test_argument_negative_index_1(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002)
+{
+    int64_t c;
+    int64_t d;
+    c = -INT64_C(2);
+    d = INT64_C(5);
+    (*Out_0001) = GET_ELEMENT(a, nd_int64, c < INT64_C(0) ? a.shape[INT64_C(0)] + c : c);
+    (*Out_0002) = GET_ELEMENT(a, nd_int64, d < INT64_C(0) ? a.shape[INT64_C(0)] + d : d);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_ULAIS6CT6ONX_H
+#define MOD_ULAIS6CT6ONX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_argument_negative_index_1(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_ulais6ct6onx_H
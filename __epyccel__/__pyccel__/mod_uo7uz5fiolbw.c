@@ -0,0 +1,10 @@
+#include "mod_uo7uz5fiolbw.h"
+
+
+/*........................................*/
+double tanh_call(double x)
+{
+    return tanh(x);
+}
+/*........................................*/
+
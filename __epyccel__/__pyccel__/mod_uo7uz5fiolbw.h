@@ -0,0 +1,10 @@
+#ifndef MOD_UO7UZ5FIOLBW_H
+#define MOD_UO7UZ5FIOLBW_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double tanh_call(double x);
+#endif // mod_uo7uz5fiolbw_H
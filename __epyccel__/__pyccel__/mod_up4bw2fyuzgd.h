@@ -0,0 +1,12 @@
+#ifndef MOD_UP4BW2FYUZGD_H
+#define MOD_UP4BW2FYUZGD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_like_shape_1d(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_up4bw2fyuzgd_H
@@ -0,0 +1,12 @@
+#ifndef MOD_UPGJ2C2SRCVE_H
+#define MOD_UPGJ2C2SRCVE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_f_to_default_0000(t_ndarray b);
+t_ndarray copy_f_to_default_0001(t_ndarray b);
+#endif // mod_upgj2c2srcve_H
@@ -0,0 +1,11 @@
+#ifndef MOD_UPYU95GAK9H6_H
+#define MOD_UPYU95GAK9H6_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_set_get_nested(bool nested);
+#endif // mod_upyu95gak9h6_H
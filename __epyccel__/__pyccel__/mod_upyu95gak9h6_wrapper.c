@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_UPYU95GAK9H6_WRAPPER
+
+#include "mod_upyu95gak9h6_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_set_get_nested_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* nested_obj;
+    bool nested;
+    bool Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "nested",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &nested_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Bool(nested_obj))
+    {
+        nested = PyBool_to_Bool(nested_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument nested");
+        return NULL;
+    }
+    Out_0001 = test_omp_set_get_nested(nested);
+    Out_0001_obj = Bool_to_PyBool(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_upyu95gak9h6_methods[] = {
+    {
+        "test_omp_set_get_nested",
+        (PyCFunction)test_omp_set_get_nested_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_upyu95gak9h6_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_upyu95gak9h6",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_upyu95gak9h6_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_upyu95gak9h6(void)
+{
+    PyObject* mod;
+    static void* Pymod_upyu95gak9h6_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_upyu95gak9h6_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_upyu95gak9h6_API, "mod_upyu95gak9h6._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
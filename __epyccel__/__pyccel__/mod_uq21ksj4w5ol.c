@@ -0,0 +1,12 @@
+#include "mod_uq21ksj4w5ol.h"
+
+
+/*........................................*/
+double exp_phrase_r_i(double x, int64_t y)
+{
+    double a;
+    a = exp(x) + exp((double)(y));
+    return a;
+}
+/*........................................*/
+
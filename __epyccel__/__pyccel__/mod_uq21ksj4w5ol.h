@@ -0,0 +1,11 @@
+#ifndef MOD_UQ21KSJ4W5OL_H
+#define MOD_UQ21KSJ4W5OL_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double exp_phrase_r_i(double x, int64_t y);
+#endif // mod_uq21ksj4w5ol_H
@@ -0,0 +1,49 @@
+#include "mod_usbzzrsipzsf.h"
+
+
+/*........................................*/
+t_ndarray array_ndmin_2_0000(t_ndarray x)
+{
+    t_ndarray y = {.raw_data = NULL};
+    y = array_create(2, (int64_t[]){INT64_C(1), x.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    array_copy_data(&y, x, 0);
+    return y;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray array_ndmin_2_0001(t_ndarray x)
+{
+    t_ndarray y = {.raw_data = NULL};
+    y = array_create(2, (int64_t[]){x.shape[INT64_C(0)], x.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&y, x, 0);
+    return y;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray array_ndmin_2_0002(t_ndarray x)
+{
+    t_ndarray y = {.raw_data = NULL};
+    y = array_create(3, (int64_t[]){x.shape[INT64_C(0)], x.shape[INT64_C(1)], x.shape[INT64_C(2)]}, nd_int64, false, order_c);
+    array_copy_data(&y, x, 0);
+    return y;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray array_ndmin_2_0003(t_ndarray x)
+{
+    t_ndarray y = {.raw_data = NULL};
+    y = array_create(2, (int64_t[]){x.shape[INT64_C(0)], x.shape[INT64_C(1)]}, nd_int64, false, order_f);
+    array_copy_data(&y, x, 0);
+    return y;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray array_ndmin_2_0004(t_ndarray x)
+{
+    t_ndarray y = {.raw_data = NULL};
+    y = array_create(3, (int64_t[]){x.shape[INT64_C(0)], x.shape[INT64_C(1)], x.shape[INT64_C(2)]}, nd_int64, false, order_f);
+    array_copy_data(&y, x, 0);
+    return y;
+}
+/*........................................*/
+
@@ -0,0 +1,15 @@
+#ifndef MOD_USBZZRSIPZSF_H
+#define MOD_USBZZRSIPZSF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_ndmin_2_0000(t_ndarray x);
+t_ndarray array_ndmin_2_0001(t_ndarray x);
+t_ndarray array_ndmin_2_0002(t_ndarray x);
+t_ndarray array_ndmin_2_0003(t_ndarray x);
+t_ndarray array_ndmin_2_0004(t_ndarray x);
+#endif // mod_usbzzrsipzsf_H
@@ -0,0 +1,217 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_USBZZRSIPZSF_WRAPPER
+
+#include "mod_usbzzrsipzsf_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_ndmin_2_0000_wrapper(PyObject* x_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* y_obj;
+    x = pyarray_to_ndarray(x_obj);
+    y = array_ndmin_2_0000(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_ndmin_2_0001_wrapper(PyObject* x_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* y_obj;
+    x = pyarray_to_ndarray(x_obj);
+    y = array_ndmin_2_0001(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_ndmin_2_0002_wrapper(PyObject* x_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* y_obj;
+    x = pyarray_to_ndarray(x_obj);
+    y = array_ndmin_2_0002(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_ndmin_2_0003_wrapper(PyObject* x_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* y_obj;
+    x = pyarray_to_ndarray(x_obj);
+    y = array_ndmin_2_0003(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_ndmin_2_0004_wrapper(PyObject* x_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* y_obj;
+    x = pyarray_to_ndarray(x_obj);
+    y = array_ndmin_2_0004(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t array_ndmin_2_type_check(PyObject* x_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(x_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(x_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(x_obj, NPY_INT64, INT64_C(3), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (is_numpy_array(x_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (is_numpy_array(x_obj, NPY_INT64, INT64_C(3), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* array_ndmin_2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    type_indicator = array_ndmin_2_type_check(x_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return array_ndmin_2_0000_wrapper(x_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return array_ndmin_2_0001_wrapper(x_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return array_ndmin_2_0002_wrapper(x_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return array_ndmin_2_0003_wrapper(x_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return array_ndmin_2_0004_wrapper(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_usbzzrsipzsf_methods[] = {
+    {
+        "array_ndmin_2",
+        (PyCFunction)array_ndmin_2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_usbzzrsipzsf_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_usbzzrsipzsf",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_usbzzrsipzsf_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_usbzzrsipzsf(void)
+{
+    PyObject* mod;
+    static void* Pymod_usbzzrsipzsf_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_usbzzrsipzsf_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_usbzzrsipzsf_API, "mod_usbzzrsipzsf._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
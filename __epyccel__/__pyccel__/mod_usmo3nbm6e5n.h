@@ -0,0 +1,12 @@
+#ifndef MOD_USMO3NBM6E5N_H
+#define MOD_USMO3NBM6E5N_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int32_t create_empty_like_val_int32_auto(void);
+#endif // mod_usmo3nbm6e5n_H
@@ -0,0 +1,11 @@
+#ifndef MOD_UT5IWXCUV2K1_H
+#define MOD_UT5IWXCUV2K1_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_ut5iwxcuv2k1_H
@@ -0,0 +1,10 @@
+#include "mod_uvy5q41vq5dq.h"
+
+
+/*........................................*/
+bool numpy_isinf_expr_test(double x, double y)
+{
+    return isinf(x + y);
+}
+/*........................................*/
+
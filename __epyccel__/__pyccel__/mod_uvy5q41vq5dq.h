@@ -0,0 +1,11 @@
+#ifndef MOD_UVY5Q41VQ5DQ_H
+#define MOD_UVY5Q41VQ5DQ_H
+
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool numpy_isinf_expr_test(double x, double y);
+#endif // mod_uvy5q41vq5dq_H
@@ -0,0 +1,11 @@
+#ifndef MOD_UWG6QUMLKD0P_H
+#define MOD_UWG6QUMLKD0P_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_combined(t_ndarray x);
+#endif // mod_uwg6qumlkd0p_H
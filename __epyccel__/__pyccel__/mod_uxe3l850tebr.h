@@ -0,0 +1,11 @@
+#ifndef MOD_UXE3L850TEBR_H
+#define MOD_UXE3L850TEBR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_div(t_ndarray x, int32_t a);
+#endif // mod_uxe3l850tebr_H
@@ -0,0 +1,11 @@
+#ifndef MOD_UXKJKFEW5RI8_H
+#define MOD_UXKJKFEW5RI8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_div(t_ndarray x, double a);
+#endif // mod_uxkjkfew5ri8_H
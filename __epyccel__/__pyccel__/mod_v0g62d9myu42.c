@@ -0,0 +1,10 @@
+#include "mod_v0g62d9myu42.h"
+
+
+/*........................................*/
+double complex cos_call(double complex x)
+{
+    return ccos(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_V0G62D9MYU42_H
+#define MOD_V0G62D9MYU42_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex cos_call(double complex x);
+#endif // mod_v0g62d9myu42_H
@@ -0,0 +1,11 @@
+#ifndef MOD_V0GASK1SAJRQ_H
+#define MOD_V0GASK1SAJRQ_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_get_cancellation(void);
+#endif // mod_v0gask1sajrq_H
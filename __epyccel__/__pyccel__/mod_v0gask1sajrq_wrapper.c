@@ -0,0 +1,80 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_V0GASK1SAJRQ_WRAPPER
+
+#include "mod_v0gask1sajrq_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_get_cancellation_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    bool cancel_var;
+    PyObject* cancel_var_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    cancel_var = test_omp_get_cancellation();
+    cancel_var_obj = Bool_to_PyBool(&cancel_var);
+    return cancel_var_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_v0gask1sajrq_methods[] = {
+    {
+        "test_omp_get_cancellation",
+        (PyCFunction)test_omp_get_cancellation_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_v0gask1sajrq_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_v0gask1sajrq",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_v0gask1sajrq_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_v0gask1sajrq(void)
+{
+    PyObject* mod;
+    static void* Pymod_v0gask1sajrq_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_v0gask1sajrq_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_v0gask1sajrq_API, "mod_v0gask1sajrq._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
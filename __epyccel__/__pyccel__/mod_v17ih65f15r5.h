@@ -0,0 +1,13 @@
+#ifndef MOD_V17IH65F15R5_H
+#define MOD_V17IH65F15R5_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void test_linspace4(t_ndarray start, t_ndarray stop, t_ndarray out, bool endpoint);
+#endif // mod_v17ih65f15r5_H
@@ -0,0 +1,50 @@
+#ifndef MOD_V1T96FI6N63B_H
+#define MOD_V1T96FI6N63B_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_BOOL
+#define _TOOLS_LIST_VEC_BOOL
+#define i_type vec_bool
+#define i_key bool
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_BOOL
+
+#ifndef _TOOLS_LIST_VEC_VEC_BOOL
+#define _TOOLS_LIST_VEC_VEC_BOOL
+#define i_type vec_vec_bool
+#define i_key vec_bool
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_VEC_BOOL
+
+#ifndef _TOOLS_LIST_VEC_BOOL
+#define _TOOLS_LIST_VEC_BOOL
+#define i_type vec_bool
+#define i_key bool
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_BOOL
+
+#ifndef _TOOLS_LIST_VEC_VEC_BOOL
+#define _TOOLS_LIST_VEC_VEC_BOOL
+#define i_type vec_vec_bool
+#define i_key vec_bool
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_VEC_BOOL
+
+
+
+
+int64_t arr_bool_sum(void);
+#endif // mod_v1t96fi6n63b_H
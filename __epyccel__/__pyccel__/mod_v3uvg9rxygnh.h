@@ -0,0 +1,11 @@
+#ifndef MOD_V3UVG9RXYGNH_H
+#define MOD_V3UVG9RXYGNH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_v3uvg9rxygnh_H
@@ -0,0 +1,18 @@
+#include "mod_v4i4b1e7drjd.h"
+
+
+/*........................................*/
+int32_t test_omp_get_level(void)
+{
+    int32_t nested_parallel_regions;
+    #pragma omp parallel
+    {
+        #pragma omp parallel
+        {
+            nested_parallel_regions = omp_get_level();
+        }
+    }
+    return nested_parallel_regions;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_V4I4B1E7DRJD_H
+#define MOD_V4I4B1E7DRJD_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_level(void);
+#endif // mod_v4i4b1e7drjd_H
@@ -0,0 +1,12 @@
+#ifndef MOD_V8C3WIMSV4OC_H
+#define MOD_V8C3WIMSV4OC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_int_2d_C_initialization(t_ndarray a);
+#endif // mod_v8c3wimsv4oc_H
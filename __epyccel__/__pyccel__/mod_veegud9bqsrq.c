@@ -0,0 +1,17 @@
+#include "mod_veegud9bqsrq.h"
+
+
+/*........................................*/
+int64_t test_shape_1d(t_ndarray f)
+{
+    t_ndarray b = {.raw_data = NULL};
+    int64_t Out_0001;
+    b = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {f.shape[INT64_C(0)]};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0000, 1 * b.type_size);
+    Out_0001 = GET_ELEMENT(b, nd_int64, INT64_C(0));
+    free_array(&b);
+    return Out_0001;
+}
+/*........................................*/
+
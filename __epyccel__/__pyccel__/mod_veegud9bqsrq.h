@@ -0,0 +1,12 @@
+#ifndef MOD_VEEGUD9BQSRQ_H
+#define MOD_VEEGUD9BQSRQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_shape_1d(t_ndarray f);
+#endif // mod_veegud9bqsrq_H
@@ -0,0 +1,11 @@
+#ifndef MOD_VG34Y6H6ELKP_H
+#define MOD_VG34Y6H6ELKP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_1D_1(t_ndarray a);
+#endif // mod_vg34y6h6elkp_H
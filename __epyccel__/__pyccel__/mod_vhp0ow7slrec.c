@@ -0,0 +1,21 @@
+#include "mod_vhp0ow7slrec.h"
+
+
+/*........................................*/
+void array_float_1d_complex_3d_expr(t_ndarray x, t_ndarray y)
+{
+    t_ndarray z = {.raw_data = NULL};
+    int64_t i;
+    z = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(5), z);
+    {
+        int64_t* restrict z_data = z.nd_int64;
+        for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_double, i) = floor(GET_ELEMENT(x, nd_double, i) / GET_ELEMENT(y, nd_double, i)) * GET_ELEMENT(x, nd_double, i) + z_data[i];
+        }
+    }
+    free_array(&z);
+}
+/*........................................*/
+
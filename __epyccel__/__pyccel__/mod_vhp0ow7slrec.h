@@ -0,0 +1,12 @@
+#ifndef MOD_VHP0OW7SLREC_H
+#define MOD_VHP0OW7SLREC_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_vhp0ow7slrec_H
@@ -0,0 +1,12 @@
+#ifndef MOD_VKOPTX0G6RON_H
+#define MOD_VKOPTX0G6RON_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_like_shape_2d(int64_t n, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_vkoptx0g6ron_H
@@ -0,0 +1,11 @@
+#ifndef MOD_VLAG1CC9RQ63_H
+#define MOD_VLAG1CC9RQ63_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_vlag1cc9rq63_H
@@ -0,0 +1,42 @@
+#ifndef MOD_VLAG1CC9RQ63_WRAPPER_H
+#define MOD_VLAG1CC9RQ63_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_vlag1cc9rq63.h"
+
+
+#ifdef MOD_VLAG1CC9RQ63_WRAPPER
+
+
+#else
+
+static void** Pymod_vlag1cc9rq63_API;
+
+
+/*........................................*/
+static int mod_vlag1cc9rq63_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_vlag1cc9rq63_API = (void**)PyCapsule_Import("mod_vlag1cc9rq63._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_vlag1cc9rq63_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_VLAG1CC9RQ63_WRAPPER_H
@@ -0,0 +1,10 @@
+#ifndef MOD_VNRWZX7535U3_H
+#define MOD_VNRWZX7535U3_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t while_not_0(int64_t n);
+#endif // mod_vnrwzx7535u3_H
@@ -0,0 +1,42 @@
+#ifndef MOD_VNZ8CPCO0APX_WRAPPER_H
+#define MOD_VNZ8CPCO0APX_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_vnz8cpco0apx.h"
+
+
+#ifdef MOD_VNZ8CPCO0APX_WRAPPER
+
+
+#else
+
+static void** Pymod_vnz8cpco0apx_API;
+
+
+/*........................................*/
+static int mod_vnz8cpco0apx_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_vnz8cpco0apx_API = (void**)PyCapsule_Import("mod_vnz8cpco0apx._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_vnz8cpco0apx_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_VNZ8CPCO0APX_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_VOMG4VHR5CME_H
+#define MOD_VOMG4VHR5CME_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_sub(t_ndarray x, double a);
+#endif // mod_vomg4vhr5cme_H
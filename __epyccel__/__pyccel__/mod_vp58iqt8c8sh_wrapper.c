@@ -0,0 +1,339 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_VP58IQT8C8SH_WRAPPER
+
+#include "mod_vp58iqt8c8sh_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* unpack_array_0000_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* x_obj;
+    int64_t x;
+    PyObject* y_obj;
+    int64_t y;
+    PyObject* z_obj;
+    int64_t z;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    unpack_array_0000(arr, &x, &y, &z);
+    free_pointer(&arr);
+    x_obj = Int64_to_NumpyLong(&x);
+    y_obj = Int64_to_NumpyLong(&y);
+    z_obj = Int64_to_NumpyLong(&z);
+    Out_obj = Py_BuildValue("OOO", x_obj, y_obj, z_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    Py_DECREF(z_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* unpack_array_0001_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* z_obj;
+    t_ndarray z = {.raw_data = NULL};
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    unpack_array_0001(arr, &x, &y, &z);
+    free_pointer(&arr);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(x_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(y_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    z_obj = ndarray_to_pyarray(z);
+    free_pointer(&z);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(z_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    Out_obj = Py_BuildValue("OOO", x_obj, y_obj, z_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    Py_DECREF(z_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* unpack_array_0002_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* z_obj;
+    t_ndarray z = {.raw_data = NULL};
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    unpack_array_0002(arr, &x, &y, &z);
+    free_pointer(&arr);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(x_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(y_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    z_obj = ndarray_to_pyarray(z);
+    free_pointer(&z);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(z_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    Out_obj = Py_BuildValue("OOO", x_obj, y_obj, z_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    Py_DECREF(z_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* unpack_array_0003_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* z_obj;
+    t_ndarray z = {.raw_data = NULL};
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    unpack_array_0003(arr, &x, &y, &z);
+    free_pointer(&arr);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(x_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(y_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    z_obj = ndarray_to_pyarray(z);
+    free_pointer(&z);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(z_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    Out_obj = Py_BuildValue("OOO", x_obj, y_obj, z_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    Py_DECREF(z_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* unpack_array_0004_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* z_obj;
+    t_ndarray z = {.raw_data = NULL};
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    unpack_array_0004(arr, &x, &y, &z);
+    free_pointer(&arr);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(x_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(y_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    z_obj = ndarray_to_pyarray(z);
+    free_pointer(&z);
+    Py_INCREF(arr_obj);
+    if (PyArray_SetBaseObject((PyArrayObject*)(z_obj), (PyObject*)(arr_obj)) < 0)
+    {
+        return NULL;
+    }
+    Out_obj = Py_BuildValue("OOO", x_obj, y_obj, z_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    Py_DECREF(z_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t unpack_array_type_check(PyObject* arr_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(arr_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(arr_obj, NPY_INT64, INT64_C(3), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (is_numpy_array(arr_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (is_numpy_array(arr_obj, NPY_INT64, INT64_C(3), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* unpack_array_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* arr_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "arr",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &arr_obj))
+    {
+        return NULL;
+    }
+    type_indicator = unpack_array_type_check(arr_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return unpack_array_0000_wrapper(arr_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return unpack_array_0001_wrapper(arr_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return unpack_array_0002_wrapper(arr_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return unpack_array_0003_wrapper(arr_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return unpack_array_0004_wrapper(arr_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_vp58iqt8c8sh_methods[] = {
+    {
+        "unpack_array",
+        (PyCFunction)unpack_array_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_vp58iqt8c8sh_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_vp58iqt8c8sh",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_vp58iqt8c8sh_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_vp58iqt8c8sh(void)
+{
+    PyObject* mod;
+    static void* Pymod_vp58iqt8c8sh_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_vp58iqt8c8sh_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_vp58iqt8c8sh_API, "mod_vp58iqt8c8sh._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_VPKU4VWVHWR2_H
+#define MOD_VPKU4VWVHWR2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_barrier(void);
+#endif // mod_vpku4vwvhwr2_H
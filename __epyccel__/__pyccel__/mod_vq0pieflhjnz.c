@@ -0,0 +1,21 @@
+#include "mod_vq0pieflhjnz.h"
+
+
+/*........................................*/
+int32_t create_full_like_val_real_int32(double val)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    int32_t Out_0001;
+    arr = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(5), INT64_C(1), INT64_C(8), INT64_C(0), INT64_C(9)};
+    memcpy(&arr.nd_int64[INT64_C(0)], Dummy_0000, 5 * arr.type_size);
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    array_fill((int32_t)(val), a);
+    Out_0001 = a.nd_int32[INT64_C(0)];
+    free_array(&a);
+    free_array(&arr);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_VQ0PIEFLHJNZ_H
+#define MOD_VQ0PIEFLHJNZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int32_t create_full_like_val_real_int32(double val);
+#endif // mod_vq0pieflhjnz_H
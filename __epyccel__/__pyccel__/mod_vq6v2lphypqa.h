@@ -0,0 +1,11 @@
+#ifndef MOD_VQ6V2LPHYPQA_H
+#define MOD_VQ6V2LPHYPQA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_mul(t_ndarray x, double a);
+#endif // mod_vq6v2lphypqa_H
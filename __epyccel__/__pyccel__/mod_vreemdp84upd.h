@@ -0,0 +1,11 @@
+#ifndef MOD_VREEMDP84UPD_H
+#define MOD_VREEMDP84UPD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_arraysum_combined(t_ndarray x);
+#endif // mod_vreemdp84upd_H
@@ -0,0 +1,11 @@
+#ifndef MOD_VSNQDX9QUEGU_H
+#define MOD_VSNQDX9QUEGU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_vsnqdx9quegu_H
@@ -0,0 +1,10 @@
+#include "mod_vszp9x8tjyme.h"
+
+
+/*........................................*/
+bool numpy_isfinite_test(double x)
+{
+    return isfinite(x);
+}
+/*........................................*/
+
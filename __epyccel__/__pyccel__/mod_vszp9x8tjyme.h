@@ -0,0 +1,11 @@
+#ifndef MOD_VSZP9X8TJYME_H
+#define MOD_VSZP9X8TJYME_H
+
+#include <math.h>
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool numpy_isfinite_test(double x);
+#endif // mod_vszp9x8tjyme_H
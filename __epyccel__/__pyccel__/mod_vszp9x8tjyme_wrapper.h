@@ -0,0 +1,40 @@
+#ifndef MOD_VSZP9X8TJYME_WRAPPER_H
+#define MOD_VSZP9X8TJYME_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_vszp9x8tjyme.h"
+
+
+#ifdef MOD_VSZP9X8TJYME_WRAPPER
+
+
+#else
+
+static void** Pymod_vszp9x8tjyme_API;
+
+
+/*........................................*/
+static int mod_vszp9x8tjyme_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_vszp9x8tjyme_API = (void**)PyCapsule_Import("mod_vszp9x8tjyme._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_vszp9x8tjyme_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_VSZP9X8TJYME_WRAPPER_H
@@ -0,0 +1,15 @@
+#include "mod_vt7bm0ro1695.h"
+
+
+/*........................................*/
+float complex create_empty_val_complex64(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    float complex Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_cfloat, false, order_c);
+    Out_0001 = a.nd_cfloat[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
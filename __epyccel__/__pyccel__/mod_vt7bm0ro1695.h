@@ -0,0 +1,12 @@
+#ifndef MOD_VT7BM0RO1695_H
+#define MOD_VT7BM0RO1695_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float complex create_empty_val_complex64(void);
+#endif // mod_vt7bm0ro1695_H
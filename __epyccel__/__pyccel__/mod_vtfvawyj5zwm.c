@@ -0,0 +1,12 @@
+#include "mod_vtfvawyj5zwm.h"
+
+
+/*........................................*/
+double sin_phrase_i_r(int64_t x, double y)
+{
+    double a;
+    a = sin((double)(x)) + sin(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_VTFVAWYJ5ZWM_H
+#define MOD_VTFVAWYJ5ZWM_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double sin_phrase_i_r(int64_t x, double y);
+#endif // mod_vtfvawyj5zwm_H
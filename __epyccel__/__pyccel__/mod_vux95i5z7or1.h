@@ -0,0 +1,11 @@
+#ifndef MOD_VUX95I5Z7OR1_H
+#define MOD_VUX95I5Z7OR1_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_max_threads(void);
+#endif // mod_vux95i5z7or1_H
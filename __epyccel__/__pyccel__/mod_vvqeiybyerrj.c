@@ -0,0 +1,19 @@
+#include "mod_vvqeiybyerrj.h"
+
+
+/*........................................*/
+void f5(int64_t m1, t_ndarray x)
+{
+    int64_t i;
+    int64_t i_0001;
+    for (i_0001 = INT64_C(0); i_0001 < x.shape[INT64_C(0)]; i_0001 += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i_0001) = 0.0;
+    }
+    for (i = INT64_C(0); i < m1; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) = i * 1.0;
+    }
+}
+/*........................................*/
+
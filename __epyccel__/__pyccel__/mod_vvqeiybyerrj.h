@@ -0,0 +1,11 @@
+#ifndef MOD_VVQEIYBYERRJ_H
+#define MOD_VVQEIYBYERRJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f5(int64_t m1, t_ndarray x);
+#endif // mod_vvqeiybyerrj_H
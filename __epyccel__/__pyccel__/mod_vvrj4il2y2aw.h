@@ -0,0 +1,20 @@
+#ifndef MOD_VVRJ4IL2Y2AW_H
+#define MOD_VVRJ4IL2Y2AW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_int8_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006, int8_t* Out_0007, int8_t* Out_0008, int8_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int8_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006, int8_t* Out_0007, int8_t* Out_0008, int8_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int8_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006, int8_t* Out_0007, int8_t* Out_0008, int8_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int8_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006, int8_t* Out_0007, int8_t* Out_0008, int8_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int8_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006, int8_t* Out_0007, int8_t* Out_0008, int8_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int8_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006, int8_t* Out_0007, int8_t* Out_0008, int8_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int8_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006, int8_t* Out_0007, int8_t* Out_0008, int8_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int8_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006, int8_t* Out_0007, int8_t* Out_0008, int8_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int8_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int8_t* Out_0004, int8_t* Out_0005, int8_t* Out_0006, int8_t* Out_0007, int8_t* Out_0008, int8_t* Out_0009);
+#endif // mod_vvrj4il2y2aw_H
@@ -0,0 +1,11 @@
+#ifndef MOD_VWY7U9FRHK7T_H
+#define MOD_VWY7U9FRHK7T_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_div(t_ndarray x, t_ndarray y);
+#endif // mod_vwy7u9frhk7t_H
@@ -0,0 +1,12 @@
+#ifndef MOD_VXTON3SE59L1_H
+#define MOD_VXTON3SE59L1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float create_zeros_like_val_float32(void);
+#endif // mod_vxton3se59l1_H
@@ -0,0 +1,12 @@
+#ifndef MOD_VXVM0BBWK2KB_H
+#define MOD_VXVM0BBWK2KB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int32_t create_full_like_val_real_int32_auto(double val);
+#endif // mod_vxvm0bbwk2kb_H
@@ -0,0 +1,10 @@
+#ifndef MOD_VYRL5FTBKU0Q_H
+#define MOD_VYRL5FTBKU0Q_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_sections(void);
+#endif // mod_vyrl5ftbku0q_H
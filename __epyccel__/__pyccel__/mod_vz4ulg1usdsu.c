@@ -0,0 +1,22 @@
+#include "mod_vz4ulg1usdsu.h"
+
+
+/*........................................*/
+int64_t create_zeros_2_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    a = array_create(2, (int64_t[]){INT64_C(4), INT64_C(2)}, nd_double, false, order_c);
+    array_fill((double)0.0, a);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(4), INT64_C(2)};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
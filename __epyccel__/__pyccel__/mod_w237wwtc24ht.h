@@ -0,0 +1,10 @@
+#ifndef MOD_W237WWTC24HT_H
+#define MOD_W237WWTC24HT_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_master(void);
+#endif // mod_w237wwtc24ht_H
@@ -0,0 +1,15 @@
+#include "mod_w325wrqijpy6.h"
+
+
+/*........................................*/
+float create_empty_val_float32(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    float Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_float, false, order_c);
+    Out_0001 = a.nd_float[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
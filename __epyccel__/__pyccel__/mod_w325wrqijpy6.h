@@ -0,0 +1,11 @@
+#ifndef MOD_W325WRQIJPY6_H
+#define MOD_W325WRQIJPY6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float create_empty_val_float32(void);
+#endif // mod_w325wrqijpy6_H
@@ -0,0 +1,11 @@
+#ifndef MOD_W47BBGPQAP6N_H
+#define MOD_W47BBGPQAP6N_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_set_max_active_levels(int64_t max_active_levels);
+#endif // mod_w47bbgpqap6n_H
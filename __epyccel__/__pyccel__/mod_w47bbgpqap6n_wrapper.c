@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_W47BBGPQAP6N_WRAPPER
+
+#include "mod_w47bbgpqap6n_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_get_set_max_active_levels_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* max_active_levels_obj;
+    int64_t max_active_levels;
+    int32_t max_active_levels_var;
+    PyObject* max_active_levels_var_obj;
+    static const char* const kwlist[] = {
+        "max_active_levels",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &max_active_levels_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(max_active_levels_obj))
+    {
+        max_active_levels = PyInt64_to_Int64(max_active_levels_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument max_active_levels");
+        return NULL;
+    }
+    max_active_levels_var = test_omp_get_set_max_active_levels(max_active_levels);
+    max_active_levels_var_obj = Int32_to_NumpyLong(&max_active_levels_var);
+    return max_active_levels_var_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_w47bbgpqap6n_methods[] = {
+    {
+        "test_omp_get_set_max_active_levels",
+        (PyCFunction)test_omp_get_set_max_active_levels_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_w47bbgpqap6n_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_w47bbgpqap6n",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_w47bbgpqap6n_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_w47bbgpqap6n(void)
+{
+    PyObject* mod;
+    static void* Pymod_w47bbgpqap6n_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_w47bbgpqap6n_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_w47bbgpqap6n_API, "mod_w47bbgpqap6n._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_W5BJCYJ8193G_H
+#define MOD_W5BJCYJ8193G_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_3(t_ndarray a);
+#endif // mod_w5bjcyj8193g_H
@@ -0,0 +1,11 @@
+#ifndef MOD_W63336ECPRP0_H
+#define MOD_W63336ECPRP0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_4d_F_array_initialization(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_w63336ecprp0_H
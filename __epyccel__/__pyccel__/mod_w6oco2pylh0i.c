@@ -0,0 +1,16 @@
+#include "mod_w6oco2pylh0i.h"
+
+
+/*........................................*/
+int32_t create_ones_val_int32(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int32_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int32, false, order_c);
+    array_fill((int32_t)1, a);
+    Out_0001 = a.nd_int32[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
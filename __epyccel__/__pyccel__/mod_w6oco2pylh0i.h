@@ -0,0 +1,11 @@
+#ifndef MOD_W6OCO2PYLH0I_H
+#define MOD_W6OCO2PYLH0I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t create_ones_val_int32(void);
+#endif // mod_w6oco2pylh0i_H
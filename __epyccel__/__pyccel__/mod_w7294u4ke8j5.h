@@ -0,0 +1,13 @@
+#ifndef MOD_W7294U4KE8J5_H
+#define MOD_W7294U4KE8J5_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_mod(t_ndarray x, double a);
+#endif // mod_w7294u4ke8j5_H
@@ -0,0 +1,12 @@
+#include "mod_w7anwhebzwty.h"
+
+
+/*........................................*/
+bool test_omp_in_parallel1(void)
+{
+    bool in_parallel;
+    in_parallel = omp_in_parallel();
+    return in_parallel;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_W7ANWHEBZWTY_H
+#define MOD_W7ANWHEBZWTY_H
+
+#include "omp.h"
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool test_omp_in_parallel1(void);
+#endif // mod_w7anwhebzwty_H
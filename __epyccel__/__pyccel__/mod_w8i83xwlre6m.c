@@ -0,0 +1,34 @@
+#include "mod_w8i83xwlre6m.h"
+
+
+/*........................................*/
+void mix_array_1_0000(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_array_1_0001(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) += a;
+    }
+}
+/*........................................*/
+/*........................................*/
+void mix_array_1_0002(t_ndarray x, int64_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_cdouble, i) += a;
+    }
+}
+/*........................................*/
+
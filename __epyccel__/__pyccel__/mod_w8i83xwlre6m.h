@@ -0,0 +1,13 @@
+#ifndef MOD_W8I83XWLRE6M_H
+#define MOD_W8I83XWLRE6M_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void mix_array_1_0000(t_ndarray x, int64_t a);
+void mix_array_1_0001(t_ndarray x, int64_t a);
+void mix_array_1_0002(t_ndarray x, int64_t a);
+#endif // mod_w8i83xwlre6m_H
@@ -0,0 +1,170 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_W8I83XWLRE6M_WRAPPER
+
+#include "mod_w8i83xwlre6m_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_array_1_0000_wrapper(PyObject* x_obj, PyObject* a_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t a;
+    x = pyarray_to_ndarray(x_obj);
+    a = PyInt64_to_Int64(a_obj);
+    mix_array_1_0000(x, a);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_array_1_0001_wrapper(PyObject* x_obj, PyObject* a_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t a;
+    x = pyarray_to_ndarray(x_obj);
+    a = PyInt64_to_Int64(a_obj);
+    mix_array_1_0001(x, a);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* mix_array_1_0002_wrapper(PyObject* x_obj, PyObject* a_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t a;
+    x = pyarray_to_ndarray(x_obj);
+    a = PyInt64_to_Int64(a_obj);
+    mix_array_1_0002(x, a);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t mix_array_1_type_check(PyObject* x_obj, PyObject* a_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(x_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(x_obj, NPY_CDOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* mix_array_1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* a_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &a_obj))
+    {
+        return NULL;
+    }
+    type_indicator = mix_array_1_type_check(x_obj, a_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return mix_array_1_0000_wrapper(x_obj, a_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return mix_array_1_0001_wrapper(x_obj, a_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return mix_array_1_0002_wrapper(x_obj, a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_w8i83xwlre6m_methods[] = {
+    {
+        "mix_array_1",
+        (PyCFunction)mix_array_1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_w8i83xwlre6m_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_w8i83xwlre6m",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_w8i83xwlre6m_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_w8i83xwlre6m(void)
+{
+    PyObject* mod;
+    static void* Pymod_w8i83xwlre6m_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_w8i83xwlre6m_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_w8i83xwlre6m_API, "mod_w8i83xwlre6m._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_W9SAGSEQO3N7_H
+#define MOD_W9SAGSEQO3N7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_2(t_ndarray a);
+#endif // mod_w9sagseqo3n7_H
@@ -0,0 +1,12 @@
+#ifndef MOD_WAHREFE7020I_H
+#define MOD_WAHREFE7020I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_empty_like_val_float64_auto(void);
+#endif // mod_wahrefe7020i_H
@@ -0,0 +1,40 @@
+#ifndef MOD_WAHREFE7020I_WRAPPER_H
+#define MOD_WAHREFE7020I_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_wahrefe7020i.h"
+
+
+#ifdef MOD_WAHREFE7020I_WRAPPER
+
+
+#else
+
+static void** Pymod_wahrefe7020i_API;
+
+
+/*........................................*/
+static int mod_wahrefe7020i_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_wahrefe7020i_API = (void**)PyCapsule_Import("mod_wahrefe7020i._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_wahrefe7020i_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_WAHREFE7020I_WRAPPER_H
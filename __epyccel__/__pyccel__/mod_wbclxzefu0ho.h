@@ -0,0 +1,11 @@
+#ifndef MOD_WBCLXZEFU0HO_H
+#define MOD_WBCLXZEFU0HO_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_number_of_procs(void);
+#endif // mod_wbclxzefu0ho_H
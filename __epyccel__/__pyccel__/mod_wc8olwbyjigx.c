@@ -0,0 +1,27 @@
+#include "mod_wc8olwbyjigx.h"
+
+
+/*........................................*/
+int64_t create_ones_like_3_shape(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    arr = array_create(2, (int64_t[]){INT64_C(2), INT64_C(5)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(5), INT64_C(1), INT64_C(8), INT64_C(0), INT64_C(9), INT64_C(5), INT64_C(1), INT64_C(8), INT64_C(0), INT64_C(9)};
+    memcpy(&arr.nd_int64[INT64_C(0)], Dummy_0000, 10 * arr.type_size);
+    a = array_create(2, (int64_t[]){INT64_C(4), INT64_C(2)}, nd_cdouble, false, order_f);
+    array_fill((double complex)(1.0 + 0.0 * _Complex_I), a);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {INT64_C(4), INT64_C(2)};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0001, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = GET_ELEMENT(s, nd_int64, INT64_C(1));
+    free_array(&s);
+    free_array(&a);
+    free_array(&arr);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#include "mod_wdkh0f3jrn34.h"
+
+
+/*........................................*/
+double sin_phrase_r_r(double x, double y)
+{
+    double a;
+    a = sin(x) + sin(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_WDKH0F3JRN34_H
+#define MOD_WDKH0F3JRN34_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sin_phrase_r_r(double x, double y);
+#endif // mod_wdkh0f3jrn34_H
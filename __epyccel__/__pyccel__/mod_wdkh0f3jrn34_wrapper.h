@@ -0,0 +1,40 @@
+#ifndef MOD_WDKH0F3JRN34_WRAPPER_H
+#define MOD_WDKH0F3JRN34_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_wdkh0f3jrn34.h"
+
+
+#ifdef MOD_WDKH0F3JRN34_WRAPPER
+
+
+#else
+
+static void** Pymod_wdkh0f3jrn34_API;
+
+
+/*........................................*/
+static int mod_wdkh0f3jrn34_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_wdkh0f3jrn34_API = (void**)PyCapsule_Import("mod_wdkh0f3jrn34._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_wdkh0f3jrn34_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_WDKH0F3JRN34_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_WDP3FMG4ML9J_H
+#define MOD_WDP3FMG4ML9J_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_wdp3fmg4ml9j_H
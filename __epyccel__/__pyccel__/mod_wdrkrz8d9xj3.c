@@ -0,0 +1,16 @@
+#include "mod_wdrkrz8d9xj3.h"
+
+
+/*........................................*/
+float create_full_val_real_float32(double val)
+{
+    t_ndarray a = {.raw_data = NULL};
+    float Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_float, false, order_c);
+    array_fill((float)(val), a);
+    Out_0001 = a.nd_float[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
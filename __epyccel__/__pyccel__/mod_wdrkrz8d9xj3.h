@@ -0,0 +1,11 @@
+#ifndef MOD_WDRKRZ8D9XJ3_H
+#define MOD_WDRKRZ8D9XJ3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float create_full_val_real_float32(double val);
+#endif // mod_wdrkrz8d9xj3_H
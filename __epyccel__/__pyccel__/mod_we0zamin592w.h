@@ -0,0 +1,12 @@
+#ifndef MOD_WE0ZAMIN592W_H
+#define MOD_WE0ZAMIN592W_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_zeros_val_complex128(void);
+#endif // mod_we0zamin592w_H
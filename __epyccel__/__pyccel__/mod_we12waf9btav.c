@@ -0,0 +1,12 @@
+#include "mod_we12waf9btav.h"
+
+
+/*........................................*/
+double expm1_phrase(double x, double y)
+{
+    double a;
+    a = expm1(x) + expm1(y);
+    return a;
+}
+/*........................................*/
+
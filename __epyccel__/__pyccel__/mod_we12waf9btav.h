@@ -0,0 +1,10 @@
+#ifndef MOD_WE12WAF9BTAV_H
+#define MOD_WE12WAF9BTAV_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double expm1_phrase(double x, double y);
+#endif // mod_we12waf9btav_H
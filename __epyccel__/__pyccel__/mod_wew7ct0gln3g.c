@@ -0,0 +1,156 @@
+#include "mod_wew7ct0gln3g.h"
+
+
+/*........................................*/
+t_ndarray get_linspace_0000(int64_t start, int64_t steps, int64_t num)
+{
+    int64_t stop;
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    stop = start + steps;
+    b = array_create(1, (int64_t[]){num}, nd_double, false, order_c);
+    {
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = (start + i*(double)((stop - start)) / (double)((num - INT64_C(1))));
+            b_data[num - INT64_C(1)] = (double)stop;
+        }
+    }
+    return b;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray get_linspace_0001(int8_t start, int64_t steps, int64_t num)
+{
+    int8_t stop;
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    stop = start + steps;
+    b = array_create(1, (int64_t[]){num}, nd_double, false, order_c);
+    {
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = (start + i*(double)((stop - start)) / (double)((num - INT64_C(1))));
+            b_data[num - INT64_C(1)] = (double)stop;
+        }
+    }
+    return b;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray get_linspace_0002(int16_t start, int64_t steps, int64_t num)
+{
+    int16_t stop;
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    stop = start + steps;
+    b = array_create(1, (int64_t[]){num}, nd_double, false, order_c);
+    {
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = (start + i*(double)((stop - start)) / (double)((num - INT64_C(1))));
+            b_data[num - INT64_C(1)] = (double)stop;
+        }
+    }
+    return b;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray get_linspace_0003(int32_t start, int64_t steps, int64_t num)
+{
+    int32_t stop;
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    stop = start + steps;
+    b = array_create(1, (int64_t[]){num}, nd_double, false, order_c);
+    {
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = (start + i*(double)((stop - start)) / (double)((num - INT64_C(1))));
+            b_data[num - INT64_C(1)] = (double)stop;
+        }
+    }
+    return b;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray get_linspace_0004(int64_t start, int64_t steps, int64_t num)
+{
+    int64_t stop;
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    stop = start + steps;
+    b = array_create(1, (int64_t[]){num}, nd_double, false, order_c);
+    {
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = (start + i*(double)((stop - start)) / (double)((num - INT64_C(1))));
+            b_data[num - INT64_C(1)] = (double)stop;
+        }
+    }
+    return b;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray get_linspace_0005(double start, int64_t steps, int64_t num)
+{
+    double stop;
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    stop = start + steps;
+    b = array_create(1, (int64_t[]){num}, nd_double, false, order_c);
+    {
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = (start + i*(stop - start) / (num - INT64_C(1)));
+            b_data[num - INT64_C(1)] = stop;
+        }
+    }
+    return b;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray get_linspace_0006(float start, int64_t steps, int64_t num)
+{
+    float stop;
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    stop = start + steps;
+    b = array_create(1, (int64_t[]){num}, nd_float, false, order_c);
+    {
+        float* restrict b_data = b.nd_float;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = (start + i*(stop - start) / (num - INT64_C(1)));
+            b_data[num - INT64_C(1)] = stop;
+        }
+    }
+    return b;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray get_linspace_0007(double start, int64_t steps, int64_t num)
+{
+    double stop;
+    int64_t i;
+    t_ndarray b = {.raw_data = NULL};
+    stop = start + steps;
+    b = array_create(1, (int64_t[]){num}, nd_double, false, order_c);
+    {
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            b_data[i] = (start + i*(stop - start) / (num - INT64_C(1)));
+            b_data[num - INT64_C(1)] = stop;
+        }
+    }
+    return b;
+}
+/*........................................*/
+
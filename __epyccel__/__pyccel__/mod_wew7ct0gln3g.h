@@ -0,0 +1,18 @@
+#ifndef MOD_WEW7CT0GLN3G_H
+#define MOD_WEW7CT0GLN3G_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray get_linspace_0000(int64_t start, int64_t steps, int64_t num);
+t_ndarray get_linspace_0001(int8_t start, int64_t steps, int64_t num);
+t_ndarray get_linspace_0002(int16_t start, int64_t steps, int64_t num);
+t_ndarray get_linspace_0003(int32_t start, int64_t steps, int64_t num);
+t_ndarray get_linspace_0004(int64_t start, int64_t steps, int64_t num);
+t_ndarray get_linspace_0005(double start, int64_t steps, int64_t num);
+t_ndarray get_linspace_0006(float start, int64_t steps, int64_t num);
+t_ndarray get_linspace_0007(double start, int64_t steps, int64_t num);
+#endif // mod_wew7ct0gln3g_H
@@ -0,0 +1,19 @@
+#ifndef MOD_WF9J2CIJWOR0_H
+#define MOD_WF9J2CIJWOR0_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t get_complex128_arr_1d_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+int64_t get_complex128_arr_1d_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+int64_t get_complex128_arr_1d_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+int64_t get_complex128_arr_1d_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+int64_t get_complex128_arr_1d_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+int64_t get_complex128_arr_1d_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+int64_t get_complex128_arr_1d_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+#endif // mod_wf9j2cijwor0_H
@@ -0,0 +1,11 @@
+#ifndef MOD_WFP4SS9VKN5R_H
+#define MOD_WFP4SS9VKN5R_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_div(t_ndarray x, t_ndarray y);
+#endif // mod_wfp4ss9vkn5r_H
@@ -0,0 +1,42 @@
+#ifndef MOD_WI0OLCWUCV53_WRAPPER_H
+#define MOD_WI0OLCWUCV53_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_wi0olcwucv53.h"
+
+
+#ifdef MOD_WI0OLCWUCV53_WRAPPER
+
+
+#else
+
+static void** Pymod_wi0olcwucv53_API;
+
+
+/*........................................*/
+static int mod_wi0olcwucv53_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_wi0olcwucv53_API = (void**)PyCapsule_Import("mod_wi0olcwucv53._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_wi0olcwucv53_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_WI0OLCWUCV53_WRAPPER_H
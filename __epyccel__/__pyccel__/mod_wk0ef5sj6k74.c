@@ -0,0 +1,10 @@
+#include "mod_wk0ef5sj6k74.h"
+
+
+/*........................................*/
+double f(double complex a, double complex b)
+{
+    return creal(a + b);
+}
+/*........................................*/
+
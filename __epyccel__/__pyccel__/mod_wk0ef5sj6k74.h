@@ -0,0 +1,10 @@
+#ifndef MOD_WK0EF5SJ6K74_H
+#define MOD_WK0EF5SJ6K74_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double f(double complex a, double complex b);
+#endif // mod_wk0ef5sj6k74_H
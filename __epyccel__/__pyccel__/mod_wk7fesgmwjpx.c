@@ -0,0 +1,12 @@
+#include "mod_wk7fesgmwjpx.h"
+
+
+/*........................................*/
+double sin_phrase(double x, double y)
+{
+    double a;
+    a = sin(x) + sin(y);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_WK7FESGMWJPX_H
+#define MOD_WK7FESGMWJPX_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sin_phrase(double x, double y);
+#endif // mod_wk7fesgmwjpx_H
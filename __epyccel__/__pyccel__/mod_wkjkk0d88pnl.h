@@ -0,0 +1,11 @@
+#ifndef MOD_WKJKK0D88PNL_H
+#define MOD_WKJKK0D88PNL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_add(t_ndarray x, double a);
+#endif // mod_wkjkk0d88pnl_H
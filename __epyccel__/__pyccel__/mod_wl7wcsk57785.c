@@ -0,0 +1,12 @@
+#include "mod_wl7wcsk57785.h"
+
+
+/*........................................*/
+double exp_phrase_r_r(double x, double y)
+{
+    double a;
+    a = exp(x) + exp(y);
+    return a;
+}
+/*........................................*/
+
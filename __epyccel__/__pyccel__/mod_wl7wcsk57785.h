@@ -0,0 +1,10 @@
+#ifndef MOD_WL7WCSK57785_H
+#define MOD_WL7WCSK57785_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double exp_phrase_r_r(double x, double y);
+#endif // mod_wl7wcsk57785_H
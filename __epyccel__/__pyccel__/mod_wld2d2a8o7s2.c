@@ -0,0 +1,31 @@
+#include "mod_wld2d2a8o7s2.h"
+
+
+/*........................................*/
+void axpby_fused(t_ndarray x, t_ndarray y, t_ndarray z, double alpha, double beta)
+{
+    t_ndarray t = {.raw_data = NULL};
+    t_ndarray u = {.raw_data = NULL};
+    int64_t i;
+    double u_0001;
+    t = array_create(1, (int64_t[]){x.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict t_data = t.nd_double;
+        for (i = INT64_C(0); i < t.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            t_data[i] = alpha * GET_ELEMENT(x, nd_double, i);
+        }
+    }
+    {
+        double* restrict t_data_0001 = t.nd_double;
+        for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            u_0001 = beta * GET_ELEMENT(y, nd_double, i);
+            GET_ELEMENT(z, nd_double, i) = t_data_0001[i] + u_0001;
+        }
+    }
+    free_array(&t);
+    free_array(&u);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_WLD2D2A8O7S2_H
+#define MOD_WLD2D2A8O7S2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void axpby_fused(t_ndarray x, t_ndarray y, t_ndarray z, double alpha, double beta);
+#endif // mod_wld2d2a8o7s2_H
@@ -0,0 +1,138 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_WLD2D2A8O7S2_WRAPPER
+
+#include "mod_wld2d2a8o7s2_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* axpby_fused_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    PyObject* z_obj;
+    PyObject* alpha_obj;
+    PyObject* beta_obj;
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    t_ndarray z = {.raw_data = NULL};
+    double alpha;
+    double beta;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        "z",
+        "alpha",
+        "beta",
+        NULL
+    };
+    static PyObject* kwlist_interned[6] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 5, 5, &x_obj, &y_obj, &z_obj, &alpha_obj, &beta_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("y", y_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        y = pyarray_to_ndarray(y_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("z", z_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        z = pyarray_to_ndarray(z_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(alpha_obj))
+    {
+        alpha = PyDouble_to_Double(alpha_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument alpha");
+        return NULL;
+    }
+    if (PyIs_NativeFloat(beta_obj))
+    {
+        beta = PyDouble_to_Double(beta_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument beta");
+        return NULL;
+    }
+    axpby_fused(x, y, z, alpha, beta);
+    free_pointer(&x);
+    free_pointer(&y);
+    free_pointer(&z);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_wld2d2a8o7s2_methods[] = {
+    {
+        "axpby_fused",
+        (PyCFunction)axpby_fused_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_wld2d2a8o7s2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_wld2d2a8o7s2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_wld2d2a8o7s2_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_wld2d2a8o7s2(void)
+{
+    PyObject* mod;
+    static void* Pymod_wld2d2a8o7s2_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_wld2d2a8o7s2_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_wld2d2a8o7s2_API, "mod_wld2d2a8o7s2._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,20 @@
+#include "mod_wm69zfwi8ltt.h"
+
+
+/*........................................*/
+int64_t create_empty_shape_1d(int64_t n, int64_t* Out_0001, int64_t* Out_0002)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){n}, nd_double, false, order_c);
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
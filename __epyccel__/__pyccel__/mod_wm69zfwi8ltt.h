@@ -0,0 +1,12 @@
+#ifndef MOD_WM69ZFWI8LTT_H
+#define MOD_WM69ZFWI8LTT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_empty_shape_1d(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_wm69zfwi8ltt_H
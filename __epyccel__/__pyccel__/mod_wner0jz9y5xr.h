@@ -0,0 +1,12 @@
+#ifndef MOD_WNER0JZ9Y5XR_H
+#define MOD_WNER0JZ9Y5XR_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_idiv(t_ndarray x, int64_t a);
+#endif // mod_wner0jz9y5xr_H
@@ -0,0 +1,13 @@
+#ifndef MOD_WO30E250819M_H
+#define MOD_WO30E250819M_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_empty_like_val_complex(void);
+#endif // mod_wo30e250819m_H
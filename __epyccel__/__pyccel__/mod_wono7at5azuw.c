@@ -0,0 +1,17 @@
+#include "mod_wono7at5azuw.h"
+
+
+/*........................................*/
+int32_t test_omp_get_ancestor_thread_num(void)
+{
+    int32_t active_level;
+    int32_t ancestor_thread;
+    #pragma omp parallel
+    {
+        active_level = omp_get_active_level();
+        ancestor_thread = omp_get_ancestor_thread_num(active_level);
+    }
+    return ancestor_thread;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_WONO7AT5AZUW_H
+#define MOD_WONO7AT5AZUW_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_ancestor_thread_num(void);
+#endif // mod_wono7at5azuw_H
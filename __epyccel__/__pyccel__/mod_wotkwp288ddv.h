@@ -0,0 +1,11 @@
+#ifndef MOD_WOTKWP288DDV_H
+#define MOD_WOTKWP288DDV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_mul(t_ndarray x, t_ndarray y);
+#endif // mod_wotkwp288ddv_H
@@ -0,0 +1,13 @@
+#ifndef MOD_WR02DKZH2ZSV_H
+#define MOD_WR02DKZH2ZSV_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_mod(t_ndarray x, t_ndarray y);
+#endif // mod_wr02dkzh2zsv_H
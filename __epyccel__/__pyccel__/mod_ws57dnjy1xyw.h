@@ -0,0 +1,11 @@
+#ifndef MOD_WS57DNJY1XYW_H
+#define MOD_WS57DNJY1XYW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_2(t_ndarray a);
+#endif // mod_ws57dnjy1xyw_H
@@ -0,0 +1,11 @@
+#ifndef MOD_WS5H992YKWIF_H
+#define MOD_WS5H992YKWIF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray create_float_array_tuple_ref(t_ndarray a);
+#endif // mod_ws5h992ykwif_H
@@ -0,0 +1,16 @@
+#include "mod_wuhkdi98vsmg.h"
+
+
+/*........................................*/
+double dup_header_0000(double a)
+{
+    return a;
+}
+/*........................................*/
+/*........................................*/
+double dup_header_0001(double a)
+{
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_WUHKDI98VSMG_H
+#define MOD_WUHKDI98VSMG_H
+
+#include <stdlib.h>
+
+
+
+double dup_header_0000(double a);
+double dup_header_0001(double a);
+#endif // mod_wuhkdi98vsmg_H
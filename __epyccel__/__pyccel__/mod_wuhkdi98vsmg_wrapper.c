@@ -0,0 +1,143 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_WUHKDI98VSMG_WRAPPER
+
+#include "mod_wuhkdi98vsmg_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* dup_header_0000_wrapper(PyObject* a_obj)
+{
+    double a;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyDouble_to_Double(a_obj);
+    Out_0001 = dup_header_0000(a);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* dup_header_0001_wrapper(PyObject* a_obj)
+{
+    double a;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyDouble_to_Double(a_obj);
+    Out_0001 = dup_header_0001(a);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t dup_header_type_check(PyObject* a_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeFloat(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Double(a_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* dup_header_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    type_indicator = dup_header_type_check(a_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return dup_header_0000_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return dup_header_0001_wrapper(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_wuhkdi98vsmg_methods[] = {
+    {
+        "dup_header",
+        (PyCFunction)dup_header_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_wuhkdi98vsmg_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_wuhkdi98vsmg",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_wuhkdi98vsmg_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_wuhkdi98vsmg(void)
+{
+    PyObject* mod;
+    static void* Pymod_wuhkdi98vsmg_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_wuhkdi98vsmg_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_wuhkdi98vsmg_API, "mod_wuhkdi98vsmg._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_WVLFCGIVKMYR_H
+#define MOD_WVLFCGIVKMYR_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_3(int64_t* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_wvlfcgivkmyr_H
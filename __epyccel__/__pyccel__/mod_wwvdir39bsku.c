@@ -0,0 +1,15 @@
+#include "mod_wwvdir39bsku.h"
+
+
+/*........................................*/
+double complex create_empty_3_val(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double complex Out_0001;
+    a = array_create(2, (int64_t[]){INT64_C(4), INT64_C(2)}, nd_cdouble, false, order_f);
+    Out_0001 = a.nd_cdouble[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
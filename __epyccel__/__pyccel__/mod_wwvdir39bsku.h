@@ -0,0 +1,12 @@
+#ifndef MOD_WWVDIR39BSKU_H
+#define MOD_WWVDIR39BSKU_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_empty_3_val(void);
+#endif // mod_wwvdir39bsku_H
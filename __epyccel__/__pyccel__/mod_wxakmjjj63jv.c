@@ -0,0 +1,23 @@
+#include "mod_wxakmjjj63jv.h"
+
+
+/*........................................*/
+int64_t f(t_ndarray x, t_ndarray y)
+{
+    t_ndarray z = {.raw_data = NULL};
+    int64_t i;
+    int64_t a;
+    z = array_create(1, (int64_t[]){x.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    {
+        int64_t* restrict z_data = z.nd_int64;
+        for (i = INT64_C(0); i < z.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            z_data[i] = GET_ELEMENT(x, nd_int64, i) + GET_ELEMENT(y, nd_int64, i);
+        }
+    }
+    a = numpy_sum_int64(z);
+    free_array(&z);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_WXAKMJJJ63JV_H
+#define MOD_WXAKMJJJ63JV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(t_ndarray x, t_ndarray y);
+#endif // mod_wxakmjjj63jv_H
@@ -0,0 +1,11 @@
+#ifndef MOD_WXDR4A1MPWEV_H
+#define MOD_WXDR4A1MPWEV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_add(t_ndarray x, int64_t a);
+#endif // mod_wxdr4a1mpwev_H
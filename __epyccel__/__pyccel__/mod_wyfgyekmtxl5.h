@@ -0,0 +1,12 @@
+#ifndef MOD_WYFGYEKMTXL5_H
+#define MOD_WYFGYEKMTXL5_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_wyfgyekmtxl5_H
@@ -0,0 +1,16 @@
+#include "mod_wzpnu56nrm30.h"
+
+
+/*........................................*/
+double complex_expr(int64_t i)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    a = array_create(1, (int64_t[]){i}, nd_double, false, order_c);
+    array_fill((double)1.0, a);
+    Out_0001 = pyc_fmodulo((double)((INT64_C(4) + INT64_C(5))) / (double)((INT64_C(6) - INT64_C(3))) * a.nd_double[INT64_C(0)], (INT64_C(9) - a.nd_double[INT64_C(1)]));
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_WZPNU56NRM30_H
+#define MOD_WZPNU56NRM30_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex_expr(int64_t i);
+#endif // mod_wzpnu56nrm30_H
@@ -0,0 +1,17 @@
+#include "mod_x090cjplz2fk.h"
+
+
+/*........................................*/
+int64_t create_full_val(int64_t val, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    array_fill(val, a);
+    (*Out_0001) = a.nd_int64[INT64_C(0)];
+    (*Out_0002) = a.nd_int64[INT64_C(1)];
+    (*Out_0003) = a.nd_int64[INT64_C(2)];
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
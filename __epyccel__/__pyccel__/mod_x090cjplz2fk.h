@@ -0,0 +1,11 @@
+#ifndef MOD_X090CJPLZ2FK_H
+#define MOD_X090CJPLZ2FK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_full_val(int64_t val, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_x090cjplz2fk_H
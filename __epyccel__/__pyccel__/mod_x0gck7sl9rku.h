@@ -0,0 +1,11 @@
+#ifndef MOD_X0GCK7SL9RKU_H
+#define MOD_X0GCK7SL9RKU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t max_call(t_ndarray x);
+#endif // mod_x0gck7sl9rku_H
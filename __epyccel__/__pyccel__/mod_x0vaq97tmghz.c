@@ -0,0 +1,15 @@
+#include "mod_x0vaq97tmghz.h"
+
+
+/*........................................*/
+int64_t f(t_ndarray x)
+{
+    t_ndarray z = {.raw_data = NULL};
+    int64_t a;
+    z = array_slicing(x, 1, new_slice(INT64_C(1), x.shape[INT64_C(0)], INT64_C(1), RANGE));
+    a = numpy_sum_int64(z);
+    free_pointer(&z);
+    return a;
+}
+/*........................................*/
+
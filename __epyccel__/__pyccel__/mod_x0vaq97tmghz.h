@@ -0,0 +1,11 @@
+#ifndef MOD_X0VAQ97TMGHZ_H
+#define MOD_X0VAQ97TMGHZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(t_ndarray x);
+#endif // mod_x0vaq97tmghz_H
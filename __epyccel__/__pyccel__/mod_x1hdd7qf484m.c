@@ -0,0 +1,16 @@
+#include "mod_x1hdd7qf484m.h"
+
+
+/*........................................*/
+t_ndarray array_view_steps_C_1D_2(t_ndarray a)
+{
+    t_ndarray tmp = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    tmp = array_slicing(a, 1, new_slice(INT64_C(1), INT64_C(10), INT64_C(2), RANGE));
+    b = array_create(1, (int64_t[]){tmp.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    array_copy_data(&b, tmp, 0);
+    free_pointer(&tmp);
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_X1HDD7QF484M_H
+#define MOD_X1HDD7QF484M_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_1D_2(t_ndarray a);
+#endif // mod_x1hdd7qf484m_H
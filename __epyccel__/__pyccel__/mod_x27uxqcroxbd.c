@@ -0,0 +1,24 @@
+#include "mod_x27uxqcroxbd.h"
+
+
+/*........................................*/
+int64_t arr_arange_1(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){(int64_t)ceil((double)((INT64_C(6) - INT64_C(0))) / 1.0)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict a_data = a.nd_int64;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = i;
+        }
+    }
+    (*Out_0001) = a.shape[INT64_C(0)];
+    (*Out_0002) = a.nd_int64[INT64_C(0)];
+    (*Out_0003) = a.nd_int64[a.shape[INT64_C(0)] - INT64_C(1)];
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
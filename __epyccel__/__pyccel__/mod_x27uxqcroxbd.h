@@ -0,0 +1,12 @@
+#ifndef MOD_X27UXQCROXBD_H
+#define MOD_X27UXQCROXBD_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_1(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_x27uxqcroxbd_H
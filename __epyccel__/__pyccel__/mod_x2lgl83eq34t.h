@@ -0,0 +1,11 @@
+#ifndef MOD_X2LGL83EQ34T_H
+#define MOD_X2LGL83EQ34T_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_x2lgl83eq34t_H
@@ -0,0 +1,10 @@
+#ifndef MOD_X36W5BOYO00E_H
+#define MOD_X36W5BOYO00E_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_taskloop(int64_t n);
+#endif // mod_x36w5boyo00e_H
@@ -0,0 +1,11 @@
+#ifndef MOD_X4AIIKIQD3MR_H
+#define MOD_X4AIIKIQD3MR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_2(t_ndarray a, t_ndarray b);
+#endif // mod_x4aiikiqd3mr_H
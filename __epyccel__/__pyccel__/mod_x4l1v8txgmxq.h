@@ -0,0 +1,12 @@
+#ifndef MOD_X4L1V8TXGMXQ_H
+#define MOD_X4L1V8TXGMXQ_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_linspace(float complex start, float complex end, float complex* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+#endif // mod_x4l1v8txgmxq_H
@@ -0,0 +1,12 @@
+#include "mod_x76euob5m832.h"
+
+
+/*........................................*/
+double atan_phrase(double x, double y)
+{
+    double a;
+    a = atan(x) + atan(y);
+    return a;
+}
+/*........................................*/
+
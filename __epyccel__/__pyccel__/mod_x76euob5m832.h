@@ -0,0 +1,10 @@
+#ifndef MOD_X76EUOB5M832_H
+#define MOD_X76EUOB5M832_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double atan_phrase(double x, double y);
+#endif // mod_x76euob5m832_H
@@ -0,0 +1,24 @@
+#include "mod_x9cgj64wwyzm.h"
+
+
+/*........................................*/
+int64_t fibonacci_while(int64_t n)
+{
+    int64_t y;
+    int64_t i;
+    int64_t z;
+    int64_t x;
+    x = INT64_C(0);
+    y = INT64_C(1);
+    i = INT64_C(1);
+    while(i <= n)
+    {
+        z = x + y;
+        x = y;
+        y = z;
+        i = i + INT64_C(1);
+    }
+    return x;
+}
+/*........................................*/
+
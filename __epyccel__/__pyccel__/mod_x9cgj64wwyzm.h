@@ -0,0 +1,10 @@
+#ifndef MOD_X9CGJ64WWYZM_H
+#define MOD_X9CGJ64WWYZM_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t fibonacci_while(int64_t n);
+#endif // mod_x9cgj64wwyzm_H
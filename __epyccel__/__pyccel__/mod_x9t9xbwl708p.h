@@ -0,0 +1,11 @@
+#ifndef MOD_X9T9XBWL708P_H
+#define MOD_X9T9XBWL708P_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int32_index(void);
+#endif // mod_x9t9xbwl708p_H
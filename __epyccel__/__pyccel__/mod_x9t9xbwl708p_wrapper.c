@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_X9T9XBWL708P_WRAPPER
+
+#include "mod_x9t9xbwl708p_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* arrs_1d_int32_index_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double b;
+    PyObject* b_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    b = arrs_1d_int32_index();
+    b_obj = Double_to_NumpyDouble(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_x9t9xbwl708p_methods[] = {
+    {
+        "arrs_1d_int32_index",
+        (PyCFunction)arrs_1d_int32_index_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_x9t9xbwl708p_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_x9t9xbwl708p",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_x9t9xbwl708p_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_x9t9xbwl708p(void)
+{
+    PyObject* mod;
+    static void* Pymod_x9t9xbwl708p_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_x9t9xbwl708p_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_x9t9xbwl708p_API, "mod_x9t9xbwl708p._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,28 @@
+#include "mod_xa3yw9u1ulv3.h"
+
+
+/*........................................*/
+int64_t directive_in_else(int64_t x)
+{
+    int64_t func_result;
+    int64_t i;
+    func_result = INT64_C(0);
+    if (x < INT64_C(30))
+    {
+        return x;
+    }
+    else
+    {
+        #pragma omp parallel
+        {
+            #pragma omp for reduction(+: func_result)
+            for (i = INT64_C(0); i < x; i += INT64_C(1))
+            {
+                func_result = func_result + i;
+            }
+        }
+    }
+    return func_result;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_XA3YW9U1ULV3_H
+#define MOD_XA3YW9U1ULV3_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t directive_in_else(int64_t x);
+#endif // mod_xa3yw9u1ulv3_H
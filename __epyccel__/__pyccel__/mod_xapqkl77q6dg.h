@@ -0,0 +1,11 @@
+#ifndef MOD_XAPQKL77Q6DG_H
+#define MOD_XAPQKL77Q6DG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_3d_C_array_initialization_1(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_xapqkl77q6dg_H
@@ -0,0 +1,10 @@
+#include "mod_xbmawo874hjx.h"
+
+
+/*........................................*/
+double f(double a, double b)
+{
+    return a + b;
+}
+/*........................................*/
+
@@ -0,0 +1,9 @@
+#ifndef MOD_XBMAWO874HJX_H
+#define MOD_XBMAWO874HJX_H
+
+#include <stdlib.h>
+
+
+
+double f(double a, double b);
+#endif // mod_xbmawo874hjx_H
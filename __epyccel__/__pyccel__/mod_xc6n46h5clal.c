@@ -0,0 +1,19 @@
+#include "mod_xc6n46h5clal.h"
+
+
+/*........................................*/
+int64_t sum_nat_numbers_while(int64_t n)
+{
+    int64_t i;
+    int64_t x;
+    x = INT64_C(0);
+    i = INT64_C(0);
+    while(i <= n)
+    {
+        x += i;
+        i = i + INT64_C(1);
+    }
+    return x;
+}
+/*........................................*/
+
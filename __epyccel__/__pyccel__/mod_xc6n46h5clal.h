@@ -0,0 +1,10 @@
+#ifndef MOD_XC6N46H5CLAL_H
+#define MOD_XC6N46H5CLAL_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t sum_nat_numbers_while(int64_t n);
+#endif // mod_xc6n46h5clal_H
@@ -0,0 +1,13 @@
+#ifndef MOD_XE9WQ9VQGQYH_H
+#define MOD_XE9WQ9VQGQYH_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double complex create_empty_like_3_val(void);
+#endif // mod_xe9wq9vqgqyh_H
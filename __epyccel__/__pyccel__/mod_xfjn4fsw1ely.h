@@ -0,0 +1,12 @@
+#ifndef MOD_XFJN4FSW1ELY_H
+#define MOD_XFJN4FSW1ELY_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_full_arg_names(bool val, bool* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006);
+#endif // mod_xfjn4fsw1ely_H
@@ -0,0 +1,115 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_XFJN4FSW1ELY_WRAPPER
+
+#include "mod_xfjn4fsw1ely_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* create_full_arg_names_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* val_obj;
+    bool val;
+    PyObject* Out_0001_obj;
+    bool Out_0001;
+    PyObject* Out_0002_obj;
+    bool Out_0002;
+    PyObject* Out_0003_obj;
+    bool Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "val",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &val_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Bool(val_obj))
+    {
+        val = PyBool_to_Bool(val_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument val");
+        return NULL;
+    }
+    create_full_arg_names(val, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006);
+    Out_0001_obj = Bool_to_PyBool(&Out_0001);
+    Out_0002_obj = Bool_to_PyBool(&Out_0002);
+    Out_0003_obj = Bool_to_PyBool(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_obj = Py_BuildValue("OOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_xfjn4fsw1ely_methods[] = {
+    {
+        "create_full_arg_names",
+        (PyCFunction)create_full_arg_names_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_xfjn4fsw1ely_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_xfjn4fsw1ely",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_xfjn4fsw1ely_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_xfjn4fsw1ely(void)
+{
+    PyObject* mod;
+    static void* Pymod_xfjn4fsw1ely_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_xfjn4fsw1ely_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_xfjn4fsw1ely_API, "mod_xfjn4fsw1ely._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,28 @@
+#include "mod_xfmykp06ymbp.h"
+
+
+/*........................................*/
+void array_float_loopdiff(t_ndarray x, t_ndarray y, t_ndarray out)
+{
+    t_ndarray dxy = {.raw_data = NULL};
+    int64_t k;
+    int64_t i;
+    dxy = array_create(1, (int64_t[]){x.shape[INT64_C(0)]}, nd_double, false, order_c);
+    {
+        double* restrict dxy_data = dxy.nd_double;
+        for (i = INT64_C(0); i < dxy.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            dxy_data[i] = GET_ELEMENT(x, nd_double, i) - GET_ELEMENT(y, nd_double, i);
+        }
+    }
+    {
+        double* restrict dxy_data_0001 = dxy.nd_double;
+        for (k = INT64_C(0); k < x.shape[INT64_C(0)]; k += INT64_C(1))
+        {
+            GET_ELEMENT(out, nd_double, k) = dxy_data_0001[k];
+        }
+    }
+    free_array(&dxy);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_XFMYKP06YMBP_H
+#define MOD_XFMYKP06YMBP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_loopdiff(t_ndarray x, t_ndarray y, t_ndarray out);
+#endif // mod_xfmykp06ymbp_H
@@ -0,0 +1,11 @@
+#ifndef MOD_XGGSS35WJE90_H
+#define MOD_XGGSS35WJE90_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_set_schedule(void);
+#endif // mod_xggss35wje90_H
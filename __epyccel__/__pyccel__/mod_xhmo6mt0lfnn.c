@@ -0,0 +1,12 @@
+#include "mod_xhmo6mt0lfnn.h"
+
+
+/*........................................*/
+double cos_phrase_r_r(double x, double y)
+{
+    double a;
+    a = cos(x) + cos(y);
+    return a;
+}
+/*........................................*/
+
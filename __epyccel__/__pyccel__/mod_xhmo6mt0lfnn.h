@@ -0,0 +1,10 @@
+#ifndef MOD_XHMO6MT0LFNN_H
+#define MOD_XHMO6MT0LFNN_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double cos_phrase_r_r(double x, double y);
+#endif // mod_xhmo6mt0lfnn_H
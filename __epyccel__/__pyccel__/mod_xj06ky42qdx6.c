@@ -0,0 +1,17 @@
+#include "mod_xj06ky42qdx6.h"
+
+
+/*........................................*/
+int64_t f15(bool a, int8_t b, int16_t c, int32_t d, int64_t e)
+{
+    if (a)
+    {
+        return (int64_t)(b + c);
+    }
+    else
+    {
+        return d + e;
+    }
+}
+/*........................................*/
+
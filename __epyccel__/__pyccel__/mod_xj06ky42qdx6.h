@@ -0,0 +1,11 @@
+#ifndef MOD_XJ06KY42QDX6_H
+#define MOD_XJ06KY42QDX6_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f15(bool a, int8_t b, int16_t c, int32_t d, int64_t e);
+#endif // mod_xj06ky42qdx6_H
@@ -0,0 +1,140 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_XJ06KY42QDX6_WRAPPER
+
+#include "mod_xj06ky42qdx6_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f15_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    PyObject* c_obj;
+    PyObject* d_obj;
+    PyObject* e_obj;
+    bool a;
+    int8_t b;
+    int16_t c;
+    int32_t d;
+    int64_t e;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        "c",
+        "d",
+        "e",
+        NULL
+    };
+    static PyObject* kwlist_interned[6] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 5, 5, &a_obj, &b_obj, &c_obj, &d_obj, &e_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Bool(a_obj))
+    {
+        a = PyBool_to_Bool(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument a");
+        return NULL;
+    }
+    if (PyIs_Int8(b_obj))
+    {
+        b = PyInt8_to_Int8(b_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.int8 for argument b");
+        return NULL;
+    }
+    if (PyIs_Int16(c_obj))
+    {
+        c = PyInt16_to_Int16(c_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.int16 for argument c");
+        return NULL;
+    }
+    if (PyIs_Int32(d_obj))
+    {
+        d = PyInt32_to_Int32(d_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.int32 for argument d");
+        return NULL;
+    }
+    if (PyIs_Int64(e_obj))
+    {
+        e = PyInt64_to_Int64(e_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.int64 for argument e");
+        return NULL;
+    }
+    Out_0001 = f15(a, b, c, d, e);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_xj06ky42qdx6_methods[] = {
+    {
+        "f15",
+        (PyCFunction)f15_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_xj06ky42qdx6_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_xj06ky42qdx6",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_xj06ky42qdx6_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_xj06ky42qdx6(void)
+{
+    PyObject* mod;
+    static void* Pymod_xj06ky42qdx6_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_xj06ky42qdx6_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_xj06ky42qdx6_API, "mod_xj06ky42qdx6._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
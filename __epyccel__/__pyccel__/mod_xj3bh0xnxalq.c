@@ -0,0 +1,12 @@
+#include "mod_xj3bh0xnxalq.h"
+
+
+/*........................................*/
+double tan_phrase_i_r(int64_t x, double y)
+{
+    double a;
+    a = tan((double)(x)) + tan(y);
+    return a;
+}
+/*........................................*/
+
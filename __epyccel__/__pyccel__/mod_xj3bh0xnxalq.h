@@ -0,0 +1,11 @@
+#ifndef MOD_XJ3BH0XNXALQ_H
+#define MOD_XJ3BH0XNXALQ_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double tan_phrase_i_r(int64_t x, double y);
+#endif // mod_xj3bh0xnxalq_H
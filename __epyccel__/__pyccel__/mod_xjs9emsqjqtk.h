@@ -0,0 +1,11 @@
+#ifndef MOD_XJS9EMSQJQTK_H
+#define MOD_XJS9EMSQJQTK_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_xjs9emsqjqtk_H
@@ -0,0 +1,12 @@
+#ifndef MOD_XKQI3H6ECNTV_H
+#define MOD_XKQI3H6ECNTV_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_3(int64_t* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_xkqi3h6ecntv_H
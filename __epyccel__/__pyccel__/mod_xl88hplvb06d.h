@@ -0,0 +1,11 @@
+#ifndef MOD_XL88HPLVB06D_H
+#define MOD_XL88HPLVB06D_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_barrier(void);
+#endif // mod_xl88hplvb06d_H
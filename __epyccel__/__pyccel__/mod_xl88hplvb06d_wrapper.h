@@ -0,0 +1,40 @@
+#ifndef MOD_XL88HPLVB06D_WRAPPER_H
+#define MOD_XL88HPLVB06D_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_xl88hplvb06d.h"
+
+
+#ifdef MOD_XL88HPLVB06D_WRAPPER
+
+
+#else
+
+static void** Pymod_xl88hplvb06d_API;
+
+
+/*........................................*/
+static int mod_xl88hplvb06d_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_xl88hplvb06d_API = (void**)PyCapsule_Import("mod_xl88hplvb06d._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_xl88hplvb06d_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_XL88HPLVB06D_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_XLTMUQW4AHHA_H
+#define MOD_XLTMUQW4AHHA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t combined_for_simd(void);
+#endif // mod_xltmuqw4ahha_H
@@ -0,0 +1,12 @@
+#ifndef MOD_XLZK3YJDUCAP_H
+#define MOD_XLZK3YJDUCAP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_ones_shape_1d(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_xlzk3yjducap_H
@@ -0,0 +1,12 @@
+#ifndef MOD_XNYEEU1FBI4D_H
+#define MOD_XNYEEU1FBI4D_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_3d_C_array_initialization_2(t_ndarray a);
+#endif // mod_xnyeeu1fbi4d_H
@@ -0,0 +1,11 @@
+#ifndef MOD_XOM3Q7CC4W86_H
+#define MOD_XOM3Q7CC4W86_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_proc_bind(void);
+#endif // mod_xom3q7cc4w86_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_XOM3Q7CC4W86_WRAPPER
+
+#include "mod_xom3q7cc4w86_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_get_proc_bind_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t bind_var;
+    PyObject* bind_var_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    bind_var = test_omp_get_proc_bind();
+    bind_var_obj = Int32_to_NumpyLong(&bind_var);
+    return bind_var_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_xom3q7cc4w86_methods[] = {
+    {
+        "test_omp_get_proc_bind",
+        (PyCFunction)test_omp_get_proc_bind_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_xom3q7cc4w86_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_xom3q7cc4w86",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_xom3q7cc4w86_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_xom3q7cc4w86(void)
+{
+    PyObject* mod;
+    static void* Pymod_xom3q7cc4w86_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_xom3q7cc4w86_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_xom3q7cc4w86_API, "mod_xom3q7cc4w86._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
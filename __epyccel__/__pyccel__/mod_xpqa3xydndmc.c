@@ -0,0 +1,10 @@
+#include "mod_xpqa3xydndmc.h"
+
+
+/*........................................*/
+double atan2_call(double x, double y)
+{
+    return atan2(x, y);
+}
+/*........................................*/
+
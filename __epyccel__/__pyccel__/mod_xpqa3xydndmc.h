@@ -0,0 +1,10 @@
+#ifndef MOD_XPQA3XYDNDMC_H
+#define MOD_XPQA3XYDNDMC_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double atan2_call(double x, double y);
+#endif // mod_xpqa3xydndmc_H
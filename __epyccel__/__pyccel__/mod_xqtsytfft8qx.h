@@ -0,0 +1,12 @@
+#ifndef MOD_XQTSYTFFT8QX_H
+#define MOD_XQTSYTFFT8QX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_ones_like_val_float_auto(void);
+#endif // mod_xqtsytfft8qx_H
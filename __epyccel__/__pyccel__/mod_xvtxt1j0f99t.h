@@ -0,0 +1,12 @@
+#ifndef MOD_XVTXT1J0F99T_H
+#define MOD_XVTXT1J0F99T_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_1(void);
+#endif // mod_xvtxt1j0f99t_H
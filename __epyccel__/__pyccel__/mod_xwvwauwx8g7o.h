@@ -0,0 +1,11 @@
+#ifndef MOD_XWVWAUWX8G7O_H
+#define MOD_XWVWAUWX8G7O_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_xwvwauwx8g7o_H
@@ -0,0 +1,14 @@
+#include "mod_xwyqpnv2lp6y.h"
+
+
+/*........................................*/
+t_ndarray my_tuple(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 5 * a.type_size);
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_XWYQPNV2LP6Y_H
+#define MOD_XWYQPNV2LP6Y_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+t_ndarray my_tuple(void);
+#endif // mod_xwyqpnv2lp6y_H
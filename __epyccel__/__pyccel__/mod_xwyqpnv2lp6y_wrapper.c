@@ -0,0 +1,94 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_XWYQPNV2LP6Y_WRAPPER
+
+#include "mod_xwyqpnv2lp6y_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* my_tuple_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t a_size;
+    int64_t Dummy_0000;
+    PyObject* tmp_obj;
+    int64_t tmp;
+    PyObject* a_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    my_tuple(&GET_ELEMENT(a, nd_int64, INT64_C(0)), &GET_ELEMENT(a, nd_int64, INT64_C(1)), &GET_ELEMENT(a, nd_int64, INT64_C(2)), &GET_ELEMENT(a, nd_int64, INT64_C(3)), &GET_ELEMENT(a, nd_int64, INT64_C(4)));
+    a_size = INT64_C(5);
+    a_obj = PyTuple_New(a_size);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < a_size; Dummy_0000 += INT64_C(1))
+    {
+        tmp = GET_ELEMENT(a, nd_int64, Dummy_0000);
+        tmp_obj = Int64_to_PyLong(&tmp);
+        if (PyTuple_SetItem(a_obj, Dummy_0000, tmp_obj) == -INT64_C(1))
+        {
+            return NULL;
+        }
+    }
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_xwyqpnv2lp6y_methods[] = {
+    {
+        "my_tuple",
+        (PyCFunction)my_tuple_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_xwyqpnv2lp6y_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_xwyqpnv2lp6y",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_xwyqpnv2lp6y_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_xwyqpnv2lp6y(void)
+{
+    PyObject* mod;
+    static void* Pymod_xwyqpnv2lp6y_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_xwyqpnv2lp6y_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_xwyqpnv2lp6y_API, "mod_xwyqpnv2lp6y._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_XXBX3Z8IV1Y7_H
+#define MOD_XXBX3Z8IV1Y7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_full_val_int_float(int64_t val);
+#endif // mod_xxbx3z8iv1y7_H
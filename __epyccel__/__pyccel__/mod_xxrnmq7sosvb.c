@@ -0,0 +1,14 @@
+#include "mod_xxrnmq7sosvb.h"
+
+
+/*........................................*/
+int64_t assign_vars_return(int64_t a, int64_t b)
+{
+    int64_t c;
+    int64_t d;
+    c = a + b;
+    d = a - b;
+    return c + d;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_XXRNMQ7SOSVB_H
+#define MOD_XXRNMQ7SOSVB_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t assign_vars_return(int64_t a, int64_t b);
+#endif // mod_xxrnmq7sosvb_H
@@ -0,0 +1,10 @@
+#include "mod_y20hsm5wzlka.h"
+
+
+/*........................................*/
+int64_t f(int64_t a, int64_t b)
+{
+    return a + b;
+}
+/*........................................*/
+
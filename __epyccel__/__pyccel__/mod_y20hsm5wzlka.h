@@ -0,0 +1,10 @@
+#ifndef MOD_Y20HSM5WZLKA_H
+#define MOD_Y20HSM5WZLKA_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(int64_t a, int64_t b);
+#endif // mod_y20hsm5wzlka_H
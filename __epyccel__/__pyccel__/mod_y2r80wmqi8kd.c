@@ -0,0 +1,16 @@
+#include "mod_y2r80wmqi8kd.h"
+
+
+/*........................................*/
+int64_t tuples_func(int64_t* Out_0001, int64_t* Out_0002)
+{
+    t_ndarray c = {.raw_data = NULL};
+    c = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    my_tup(&GET_ELEMENT(c, nd_int64, INT64_C(0)), &GET_ELEMENT(c, nd_int64, INT64_C(1)));
+    (*Out_0001) = GET_ELEMENT(c, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(c, nd_int64, INT64_C(1));
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_Y2R80WMQI8KD_H
+#define MOD_Y2R80WMQI8KD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_func(int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_y2r80wmqi8kd_H
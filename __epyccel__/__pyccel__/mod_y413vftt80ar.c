@@ -0,0 +1,10 @@
+#include "mod_y413vftt80ar.h"
+
+
+/*........................................*/
+double sin_call(double x)
+{
+    return sin(x);
+}
+/*........................................*/
+
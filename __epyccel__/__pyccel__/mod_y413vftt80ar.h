@@ -0,0 +1,10 @@
+#ifndef MOD_Y413VFTT80AR_H
+#define MOD_Y413VFTT80AR_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sin_call(double x);
+#endif // mod_y413vftt80ar_H
@@ -0,0 +1,11 @@
+#ifndef MOD_Y4WHS7XW5RU1_H
+#define MOD_Y4WHS7XW5RU1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void scale(t_ndarray x, double factor, int64_t offset);
+#endif // mod_y4whs7xw5ru1_H
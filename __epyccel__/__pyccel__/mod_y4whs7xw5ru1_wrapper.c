@@ -0,0 +1,119 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_Y4WHS7XW5RU1_WRAPPER
+
+#include "mod_y4whs7xw5ru1_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* scale_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* factor_obj;
+    PyObject* offset_obj;
+    t_ndarray x = {.raw_data = NULL};
+    double factor;
+    int64_t offset;
+    offset_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        "factor",
+        "offset",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 3, &x_obj, &factor_obj, &offset_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(factor_obj))
+    {
+        factor = PyDouble_to_Double(factor_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument factor");
+        return NULL;
+    }
+    offset = INT64_C(1);
+    if (offset_obj != Py_None)
+    {
+        if (PyIs_NativeInt(offset_obj))
+        {
+            offset = PyInt64_to_Int64(offset_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument offset");
+            return NULL;
+        }
+    }
+    scale(x, factor, offset);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_y4whs7xw5ru1_methods[] = {
+    {
+        "scale",
+        (PyCFunction)scale_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_y4whs7xw5ru1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_y4whs7xw5ru1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_y4whs7xw5ru1_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_y4whs7xw5ru1(void)
+{
+    PyObject* mod;
+    static void* Pymod_y4whs7xw5ru1_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_y4whs7xw5ru1_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_y4whs7xw5ru1_API, "mod_y4whs7xw5ru1._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
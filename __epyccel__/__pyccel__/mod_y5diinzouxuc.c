@@ -0,0 +1,16 @@
+#include "mod_y5diinzouxuc.h"
+
+
+/*........................................*/
+float create_ones_val_float32(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    float Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_float, false, order_c);
+    array_fill((float)1.0f, a);
+    Out_0001 = a.nd_float[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
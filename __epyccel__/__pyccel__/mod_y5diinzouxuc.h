@@ -0,0 +1,11 @@
+#ifndef MOD_Y5DIINZOUXUC_H
+#define MOD_Y5DIINZOUXUC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float create_ones_val_float32(void);
+#endif // mod_y5diinzouxuc_H
@@ -0,0 +1,10 @@
+#include "mod_y5jv5t7bd7jd.h"
+
+
+/*........................................*/
+int64_t return_single_var(int64_t x)
+{
+    return x;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_Y5JV5T7BD7JD_H
+#define MOD_Y5JV5T7BD7JD_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t return_single_var(int64_t x);
+#endif // mod_y5jv5t7bd7jd_H
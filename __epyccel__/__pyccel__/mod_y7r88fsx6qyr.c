@@ -0,0 +1,32 @@
+#include "mod_y7r88fsx6qyr.h"
+
+
+/*........................................*/
+int64_t omp_simd(int64_t n)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    int64_t i;
+    int64_t func_result;
+    func_result = INT64_C(0);
+    arr = array_create(1, (int64_t[]){n}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), arr);
+    #pragma omp parallel num_threads(4)
+    {
+        #pragma omp simd
+        for (i = INT64_C(0); i < n; i += INT64_C(1))
+        {
+            arr.nd_int64[i] = i;
+        }
+    }
+    {
+        int64_t* restrict arr_data = arr.nd_int64;
+        for (i = INT64_C(0); i < n; i += INT64_C(1))
+        {
+            func_result = func_result + arr_data[i];
+        }
+    }
+    free_array(&arr);
+    return func_result;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_Y7R88FSX6QYR_H
+#define MOD_Y7R88FSX6QYR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_simd(int64_t n);
+#endif // mod_y7r88fsx6qyr_H
@@ -0,0 +1,12 @@
+#include "mod_y9adc1yybpsf.h"
+
+
+/*........................................*/
+double erfc_phrase(double x, double y)
+{
+    double a;
+    a = erfc(x) + erfc(y);
+    return a;
+}
+/*........................................*/
+
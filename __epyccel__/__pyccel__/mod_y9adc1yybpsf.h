@@ -0,0 +1,10 @@
+#ifndef MOD_Y9ADC1YYBPSF_H
+#define MOD_Y9ADC1YYBPSF_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double erfc_phrase(double x, double y);
+#endif // mod_y9adc1yybpsf_H
@@ -0,0 +1,24 @@
+#include "mod_y9z8rwbri18l.h"
+
+
+/*........................................*/
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d)
+{
+    int64_t g;
+    int64_t Dummy_0000;
+    int64_t Dummy_0001;
+    int64_t Dummy_0002;
+    int64_t Dummy_0003;
+    Dummy_0000 = INT64_C(3) * INT64_C(3);
+    (*a) = Dummy_0000 * Dummy_0000;
+    Dummy_0001 = (INT64_C(8) + INT64_C(3)) * (INT64_C(8) + INT64_C(3));
+    (*b) = Dummy_0001 * Dummy_0001;
+    Dummy_0002 = ((int64_t)floor((double)(((*b) - (*a))) / 2000.0)) * ((int64_t)floor((double)(((*b) - (*a))) / 2000.0));
+    (*c) = Dummy_0002 * Dummy_0002;
+    g = INT64_C(4);
+    Dummy_0003 = g * g;
+    (*d) = Dummy_0003 * Dummy_0003;
+    return 0;
+}
+/*........................................*/
+
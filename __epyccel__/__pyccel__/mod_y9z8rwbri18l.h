@@ -0,0 +1,11 @@
+#ifndef MOD_Y9Z8RWBRI18L_H
+#define MOD_Y9Z8RWBRI18L_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d);
+#endif // mod_y9z8rwbri18l_H
@@ -0,0 +1,13 @@
+#ifndef MOD_YALGJ23C1Z1C_H
+#define MOD_YALGJ23C1Z1C_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray test_linspace_dtype_0000(t_ndarray start, int64_t stop, bool endpoint);
+t_ndarray test_linspace_dtype_0001(t_ndarray start, int64_t stop, bool endpoint);
+#endif // mod_yalgj23c1z1c_H
@@ -0,0 +1,161 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_YALGJ23C1Z1C_WRAPPER
+
+#include "mod_yalgj23c1z1c_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_dtype_0000_wrapper(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    t_ndarray start = {.raw_data = NULL};
+    int64_t stop;
+    bool endpoint;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    start = pyarray_to_ndarray(start_obj);
+    stop = PyInt64_to_Int64(stop_obj);
+    endpoint = PyBool_to_Bool(endpoint_obj);
+    a = test_linspace_dtype_0000(start, stop, endpoint);
+    free_pointer(&start);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_linspace_dtype_0001_wrapper(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    t_ndarray start = {.raw_data = NULL};
+    int64_t stop;
+    bool endpoint;
+    t_ndarray a = {.raw_data = NULL};
+    PyObject* a_obj;
+    start = pyarray_to_ndarray(start_obj);
+    stop = PyInt64_to_Int64(stop_obj);
+    endpoint = PyBool_to_Bool(endpoint_obj);
+    a = test_linspace_dtype_0001(start, stop, endpoint);
+    free_pointer(&start);
+    a_obj = ndarray_to_pyarray(a);
+    free_pointer(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t test_linspace_dtype_type_check(PyObject* start_obj, PyObject* stop_obj, PyObject* endpoint_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(start_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(start_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument start");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* test_linspace_dtype_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* start_obj;
+    PyObject* stop_obj;
+    PyObject* endpoint_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "start",
+        "stop",
+        "endpoint",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &start_obj, &stop_obj, &endpoint_obj))
+    {
+        return NULL;
+    }
+    type_indicator = test_linspace_dtype_type_check(start_obj, stop_obj, endpoint_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return test_linspace_dtype_0000_wrapper(start_obj, stop_obj, endpoint_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return test_linspace_dtype_0001_wrapper(start_obj, stop_obj, endpoint_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_yalgj23c1z1c_methods[] = {
+    {
+        "test_linspace_dtype",
+        (PyCFunction)test_linspace_dtype_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_yalgj23c1z1c_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_yalgj23c1z1c",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_yalgj23c1z1c_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_yalgj23c1z1c(void)
+{
+    PyObject* mod;
+    static void* Pymod_yalgj23c1z1c_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_yalgj23c1z1c_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_yalgj23c1z1c_API, "mod_yalgj23c1z1c._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,26 @@
+#include "mod_yarufnin03p7.h"
+
+
+/*........................................*/
+int64_t inhomogeneous_tuple_2_levels_2(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006)
+{
+    t_ndarray ai_0 = {.raw_data = NULL};
+    t_ndarray ai_1 = {.raw_data = NULL};
+    ai_0 = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    ai_1 = array_create(1, (int64_t[]){INT64_C(3)}, nd_bool, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(0), INT64_C(1), INT64_C(2)};
+    memcpy(&ai_0.nd_int64[INT64_C(0)], Dummy_0000, 3 * ai_0.type_size);
+    bool Dummy_0001[] = {1, 0, 1};
+    memcpy(&ai_1.nd_bool[INT64_C(0)], Dummy_0001, 3 * ai_1.type_size);
+    (*Out_0001) = GET_ELEMENT(ai_0, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(ai_0, nd_int64, INT64_C(1));
+    (*Out_0003) = GET_ELEMENT(ai_0, nd_int64, INT64_C(2));
+    (*Out_0004) = GET_ELEMENT(ai_1, nd_bool, INT64_C(0));
+    (*Out_0005) = GET_ELEMENT(ai_1, nd_bool, INT64_C(1));
+    (*Out_0006) = GET_ELEMENT(ai_1, nd_bool, INT64_C(2));
+    free_array(&ai_0);
+    free_array(&ai_1);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+#ifndef MOD_YARUFNIN03P7_H
+#define MOD_YARUFNIN03P7_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t inhomogeneous_tuple_2_levels_2(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006);
+#endif // mod_yarufnin03p7_H
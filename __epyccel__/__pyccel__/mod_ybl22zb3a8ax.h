@@ -0,0 +1,19 @@
+#ifndef MOD_YBL22ZB3A8AX_H
+#define MOD_YBL22ZB3A8AX_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_int32_0000(bool a);
+int32_t get_int32_0001(int64_t a);
+int32_t get_int32_0002(int8_t a);
+int32_t get_int32_0003(int16_t a);
+int32_t get_int32_0004(int32_t a);
+int32_t get_int32_0005(int64_t a);
+int32_t get_int32_0006(double a);
+int32_t get_int32_0007(float a);
+int32_t get_int32_0008(double a);
+#endif // mod_ybl22zb3a8ax_H
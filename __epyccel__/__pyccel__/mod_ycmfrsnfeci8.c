@@ -0,0 +1,24 @@
+#include "mod_ycmfrsnfeci8.h"
+
+
+/*........................................*/
+int64_t f(double c)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t Out_0001;
+    if (c > 0.5)
+    {
+        x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+        array_fill((int64_t)INT64_C(1), x);
+    }
+    else
+    {
+        x = array_create(1, (int64_t[]){INT64_C(7)}, nd_int64, false, order_c);
+        array_fill((int64_t)INT64_C(1), x);
+    }
+    Out_0001 = numpy_sum_int64(x);
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_YCMFRSNFECI8_H
+#define MOD_YCMFRSNFECI8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(double c);
+#endif // mod_ycmfrsnfeci8_H
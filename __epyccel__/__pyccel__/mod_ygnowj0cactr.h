@@ -0,0 +1,11 @@
+#ifndef MOD_YGNOWJ0CACTR_H
+#define MOD_YGNOWJ0CACTR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_ygnowj0cactr_H
@@ -0,0 +1,56 @@
+#include "mod_yh1p3e0aqowr.h"
+
+
+/*........................................*/
+int64_t where_wrapper_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray cond, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){cond.shape[INT64_C(0)]}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict a_data = a.nd_cfloat;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = GET_ELEMENT(cond, nd_bool, i) ? GET_ELEMENT(arr1, nd_cfloat, i) : GET_ELEMENT(arr2, nd_cfloat, i);
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_cfloat[INT64_C(1)];
+    (*Out_0004) = a.nd_cfloat[INT64_C(0)];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t where_wrapper_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray cond, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){cond.shape[INT64_C(0)]}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict a_data = a.nd_cdouble;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            a_data[i] = GET_ELEMENT(cond, nd_bool, i) ? GET_ELEMENT(arr1, nd_cdouble, i) : GET_ELEMENT(arr2, nd_cdouble, i);
+        }
+    }
+    s = array_create(1, (int64_t[]){INT64_C(1)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a.shape[INT64_C(0)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 1 * s.type_size);
+    (*Out_0001) = INT64_C(1);
+    (*Out_0002) = GET_ELEMENT(s, nd_int64, INT64_C(0));
+    (*Out_0003) = a.nd_cdouble[INT64_C(1)];
+    (*Out_0004) = a.nd_cdouble[INT64_C(0)];
+    free_array(&s);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
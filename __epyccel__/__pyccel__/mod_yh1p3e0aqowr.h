@@ -0,0 +1,14 @@
+#ifndef MOD_YH1P3E0AQOWR_H
+#define MOD_YH1P3E0AQOWR_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t where_wrapper_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray cond, int64_t* Out_0001, int64_t* Out_0002, float complex* Out_0003, float complex* Out_0004);
+int64_t where_wrapper_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray cond, int64_t* Out_0001, int64_t* Out_0002, double complex* Out_0003, double complex* Out_0004);
+#endif // mod_yh1p3e0aqowr_H
@@ -0,0 +1,11 @@
+#ifndef MOD_YHAIP9HG5338_H
+#define MOD_YHAIP9HG5338_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_barrier(void);
+#endif // mod_yhaip9hg5338_H
@@ -0,0 +1,10 @@
+#ifndef MOD_YIPY46455IHG_H
+#define MOD_YIPY46455IHG_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sqrt_phrase(double x, double y);
+#endif // mod_yipy46455ihg_H
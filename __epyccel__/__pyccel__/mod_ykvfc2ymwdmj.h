@@ -0,0 +1,11 @@
+#ifndef MOD_YKVFC2YMWDMJ_H
+#define MOD_YKVFC2YMWDMJ_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t inhomogeneous_tuple_2(int64_t* Out_0001, bool* Out_0002, int64_t* Out_0003);
+#endif // mod_ykvfc2ymwdmj_H
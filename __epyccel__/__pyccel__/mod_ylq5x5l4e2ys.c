@@ -0,0 +1,10 @@
+#include "mod_ylq5x5l4e2ys.h"
+
+
+/*........................................*/
+double erf_call(double x)
+{
+    return erf(x);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_YLQ5X5L4E2YS_H
+#define MOD_YLQ5X5L4E2YS_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double erf_call(double x);
+#endif // mod_ylq5x5l4e2ys_H
@@ -0,0 +1,40 @@
+#ifndef MOD_YLQ5X5L4E2YS_WRAPPER_H
+#define MOD_YLQ5X5L4E2YS_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ylq5x5l4e2ys.h"
+
+
+#ifdef MOD_YLQ5X5L4E2YS_WRAPPER
+
+
+#else
+
+static void** Pymod_ylq5x5l4e2ys_API;
+
+
+/*........................................*/
+static int mod_ylq5x5l4e2ys_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ylq5x5l4e2ys_API = (void**)PyCapsule_Import("mod_ylq5x5l4e2ys._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ylq5x5l4e2ys_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_YLQ5X5L4E2YS_WRAPPER_H
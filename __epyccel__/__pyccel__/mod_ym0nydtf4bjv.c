@@ -0,0 +1,12 @@
+#include "mod_ym0nydtf4bjv.h"
+
+
+/*........................................*/
+double complex sqrt_return_type_comp(double complex x)
+{
+    double complex a;
+    a = csqrt(x);
+    return a;
+}
+/*........................................*/
+
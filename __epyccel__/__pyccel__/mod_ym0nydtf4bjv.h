@@ -0,0 +1,11 @@
+#ifndef MOD_YM0NYDTF4BJV_H
+#define MOD_YM0NYDTF4BJV_H
+
+#include <complex.h>
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double complex sqrt_return_type_comp(double complex x);
+#endif // mod_ym0nydtf4bjv_H
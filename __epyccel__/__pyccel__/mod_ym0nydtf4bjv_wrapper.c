@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_YM0NYDTF4BJV_WRAPPER
+
+#include "mod_ym0nydtf4bjv_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* sqrt_return_type_comp_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    double complex x;
+    double complex a;
+    PyObject* a_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeComplex(x_obj))
+    {
+        x = PyComplex_to_Complex128(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type complex for argument x");
+        return NULL;
+    }
+    a = sqrt_return_type_comp(x);
+    a_obj = Complex128_to_NumpyComplex(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ym0nydtf4bjv_methods[] = {
+    {
+        "sqrt_return_type_comp",
+        (PyCFunction)sqrt_return_type_comp_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ym0nydtf4bjv_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ym0nydtf4bjv",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ym0nydtf4bjv_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ym0nydtf4bjv(void)
+{
+    PyObject* mod;
+    static void* Pymod_ym0nydtf4bjv_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ym0nydtf4bjv_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ym0nydtf4bjv_API, "mod_ym0nydtf4bjv._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,21 @@
+#include "mod_ymrkrbmd7ecj.h"
+
+
+/*........................................*/
+int64_t create_zeros_like_val_int(void)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    int64_t Out_0001;
+    arr = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(5), INT64_C(1), INT64_C(8), INT64_C(0), INT64_C(9)};
+    memcpy(&arr.nd_int64[INT64_C(0)], Dummy_0000, 5 * arr.type_size);
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), a);
+    Out_0001 = a.nd_int64[INT64_C(0)];
+    free_array(&a);
+    free_array(&arr);
+    return Out_0001;
+}
+/*........................................*/
+
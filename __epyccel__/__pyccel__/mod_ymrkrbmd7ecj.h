@@ -0,0 +1,12 @@
+#ifndef MOD_YMRKRBMD7ECJ_H
+#define MOD_YMRKRBMD7ECJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_like_val_int(void);
+#endif // mod_ymrkrbmd7ecj_H
@@ -0,0 +1,40 @@
+#ifndef MOD_YMRKRBMD7ECJ_WRAPPER_H
+#define MOD_YMRKRBMD7ECJ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ymrkrbmd7ecj.h"
+
+
+#ifdef MOD_YMRKRBMD7ECJ_WRAPPER
+
+
+#else
+
+static void** Pymod_ymrkrbmd7ecj_API;
+
+
+/*........................................*/
+static int mod_ymrkrbmd7ecj_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ymrkrbmd7ecj_API = (void**)PyCapsule_Import("mod_ymrkrbmd7ecj._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ymrkrbmd7ecj_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_YMRKRBMD7ECJ_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_YMZT8TYDNUUT_H
+#define MOD_YMZT8TYDNUUT_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+float complex create_zeros_val_complex64(void);
+#endif // mod_ymzt8tydnuut_H
@@ -0,0 +1,21 @@
+#include "mod_yntx0xm10yw2.h"
+
+
+/*........................................*/
+int64_t enumerate_on_1d_array_with_tuple(t_ndarray z)
+{
+    int64_t Dummy_0000;
+    int64_t v_0;
+    int64_t v_1;
+    int64_t res;
+    res = INT64_C(0);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < z.shape[INT64_C(0)]; Dummy_0000 += INT64_C(1))
+    {
+        v_0 = Dummy_0000;
+        v_1 = GET_ELEMENT(z, nd_int64, Dummy_0000);
+        res += v_0 * v_1;
+    }
+    return res;
+}
+/*........................................*/
+
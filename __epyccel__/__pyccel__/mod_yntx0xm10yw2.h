@@ -0,0 +1,11 @@
+#ifndef MOD_YNTX0XM10YW2_H
+#define MOD_YNTX0XM10YW2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t enumerate_on_1d_array_with_tuple(t_ndarray z);
+#endif // mod_yntx0xm10yw2_H
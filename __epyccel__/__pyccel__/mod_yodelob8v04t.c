@@ -0,0 +1,39 @@
+#include "mod_yodelob8v04t.h"
+
+
+/*........................................*/
+int64_t tuples_add_mixed_homogeneous_variables(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, bool* Out_0006)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t b_0;
+    int64_t b_1;
+    bool b_2;
+    int64_t c_0;
+    int64_t c_1;
+    int64_t c_2;
+    int64_t c_3;
+    int64_t c_4;
+    bool c_5;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 3 * a.type_size);
+    b_0 = INT64_C(4);
+    b_1 = INT64_C(5);
+    b_2 = 1;
+    c_0 = GET_ELEMENT(a, nd_int64, INT64_C(0));
+    c_1 = GET_ELEMENT(a, nd_int64, INT64_C(1));
+    c_2 = GET_ELEMENT(a, nd_int64, INT64_C(2));
+    c_3 = b_0;
+    c_4 = b_1;
+    c_5 = b_2;
+    (*Out_0001) = c_0;
+    (*Out_0002) = c_1;
+    (*Out_0003) = c_2;
+    (*Out_0004) = c_3;
+    (*Out_0005) = c_4;
+    (*Out_0006) = c_5;
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
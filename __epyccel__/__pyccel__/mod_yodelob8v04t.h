@@ -0,0 +1,13 @@
+#ifndef MOD_YODELOB8V04T_H
+#define MOD_YODELOB8V04T_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuples_add_mixed_homogeneous_variables(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, bool* Out_0006);
+#endif // mod_yodelob8v04t_H
@@ -0,0 +1,12 @@
+#include "mod_yoqzicjt5fak.h"
+
+
+/*........................................*/
+double sin_phrase_i_i(int64_t x, int64_t y)
+{
+    double a;
+    a = sin((double)(x)) + sin((double)(y));
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_YOQZICJT5FAK_H
+#define MOD_YOQZICJT5FAK_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double sin_phrase_i_i(int64_t x, int64_t y);
+#endif // mod_yoqzicjt5fak_H
@@ -0,0 +1,11 @@
+#ifndef MOD_YP40M00FA9J0_H
+#define MOD_YP40M00FA9J0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_yp40m00fa9j0_H
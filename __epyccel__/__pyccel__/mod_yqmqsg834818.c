@@ -0,0 +1,17 @@
+#include "mod_yqmqsg834818.h"
+
+
+/*........................................*/
+int64_t get_min(int64_t a, int64_t b)
+{
+    if (a < b)
+    {
+        return a;
+    }
+    else
+    {
+        return b;
+    }
+}
+/*........................................*/
+
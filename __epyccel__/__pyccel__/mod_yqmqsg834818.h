@@ -0,0 +1,10 @@
+#ifndef MOD_YQMQSG834818_H
+#define MOD_YQMQSG834818_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t get_min(int64_t a, int64_t b);
+#endif // mod_yqmqsg834818_H
@@ -0,0 +1,40 @@
+#ifndef MOD_YQMQSG834818_WRAPPER_H
+#define MOD_YQMQSG834818_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_yqmqsg834818.h"
+
+
+#ifdef MOD_YQMQSG834818_WRAPPER
+
+
+#else
+
+static void** Pymod_yqmqsg834818_API;
+
+
+/*........................................*/
+static int mod_yqmqsg834818_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_yqmqsg834818_API = (void**)PyCapsule_Import("mod_yqmqsg834818._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_yqmqsg834818_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_YQMQSG834818_WRAPPER_H
@@ -0,0 +1,15 @@
+#include "mod_yqujd4m0x88f.h"
+
+
+/*........................................*/
+int64_t create_empty_val_int(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t Out_0001;
+    a = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    Out_0001 = a.nd_int64[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_YQUJD4M0X88F_H
+#define MOD_YQUJD4M0X88F_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t create_empty_val_int(void);
+#endif // mod_yqujd4m0x88f_H
@@ -0,0 +1,55 @@
+#include "mod_yrzh5dllcbzz.h"
+
+
+/*........................................*/
+int64_t omp_long_line(t_ndarray long_variable_1_oiwed423rnoij21d4kojklm, t_ndarray long_variable_2_oiwedqwrnoij2asxaxnjkna, t_ndarray long_variable_3_oiweqxhnoijaqed34023423, t_ndarray long_variable_4_oiweaxaijaqedqd34023423, t_ndarray long_variable_5_oiwed423rnoic3242ewdx35)
+{
+    int64_t n1;
+    int64_t n2;
+    int64_t n3;
+    int64_t n4;
+    int64_t n5;
+    int64_t i1;
+    int64_t i2;
+    int64_t i3;
+    int64_t i4;
+    int64_t i5;
+    int64_t func_result;
+    func_result = INT64_C(0);
+    n1 = long_variable_1_oiwed423rnoij21d4kojklm.shape[INT64_C(0)];
+    n2 = long_variable_2_oiwedqwrnoij2asxaxnjkna.shape[INT64_C(0)];
+    n3 = long_variable_3_oiweqxhnoijaqed34023423.shape[INT64_C(0)];
+    n4 = long_variable_4_oiweaxaijaqedqd34023423.shape[INT64_C(0)];
+    n5 = long_variable_5_oiwed423rnoic3242ewdx35.shape[INT64_C(0)];
+    #pragma omp parallel private(i1, i2, i3, i4, i5) shared(long_variable_1_oiwed423rnoij21d4kojklm, long_variable_2_oiwedqwrnoij2asxaxnjkna, long_variable_3_oiweqxhnoijaqed34023423, long_variable_4_oiweaxaijaqedqd34023423, long_variable_5_oiwed423rnoic3242ewdx35, n1, n2, n3, n4, n5)
+    {
+        #pragma omp for reduction(+: func_result)
+        for (i1 = INT64_C(0); i1 < n1; i1 += INT64_C(1))
+        {
+            func_result += GET_ELEMENT(long_variable_1_oiwed423rnoij21d4kojklm, nd_int64, i1);
+        }
+        #pragma omp for reduction(+: func_result)
+        for (i2 = INT64_C(0); i2 < n2; i2 += INT64_C(1))
+        {
+            func_result += GET_ELEMENT(long_variable_2_oiwedqwrnoij2asxaxnjkna, nd_int64, i2);
+        }
+        #pragma omp for reduction(+: func_result)
+        for (i3 = INT64_C(0); i3 < n3; i3 += INT64_C(1))
+        {
+            func_result += GET_ELEMENT(long_variable_3_oiweqxhnoijaqed34023423, nd_int64, i3);
+        }
+        #pragma omp for reduction(+: func_result)
+        for (i4 = INT64_C(0); i4 < n4; i4 += INT64_C(1))
+        {
+            func_result += GET_ELEMENT(long_variable_4_oiweaxaijaqedqd34023423, nd_int64, i4);
+        }
+        #pragma omp for reduction(+: func_result)
+        for (i5 = INT64_C(0); i5 < n5; i5 += INT64_C(1))
+        {
+            func_result += GET_ELEMENT(long_variable_5_oiwed423rnoic3242ewdx35, nd_int64, i5);
+        }
+    }
+    return func_result;
+}
+/*........................................*/
+
@@ -0,0 +1,20 @@
+#ifndef MOD_YXUKZVMBVEN5_H
+#define MOD_YXUKZVMBVEN5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t get_imag_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+int64_t get_imag_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+int64_t get_imag_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int8_t* Out_0003);
+int64_t get_imag_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int16_t* Out_0003);
+int64_t get_imag_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int32_t* Out_0003);
+int64_t get_imag_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+int64_t get_imag_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float* Out_0003);
+int64_t get_imag_0007(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, float* Out_0003);
+int64_t get_imag_0008(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, double* Out_0003);
+#endif // mod_yxukzvmbven5_H
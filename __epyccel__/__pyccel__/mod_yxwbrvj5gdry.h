@@ -0,0 +1,12 @@
+#ifndef MOD_YXWBRVJ5GDRY_H
+#define MOD_YXWBRVJ5GDRY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_c_to_f_0000(t_ndarray b);
+t_ndarray copy_c_to_f_0001(t_ndarray b);
+#endif // mod_yxwbrvj5gdry_H
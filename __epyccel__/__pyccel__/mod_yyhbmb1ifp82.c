@@ -0,0 +1,10 @@
+#include "mod_yyhbmb1ifp82.h"
+
+
+/*........................................*/
+double sin_call_r(double x)
+{
+    return sin(x);
+}
+/*........................................*/
+
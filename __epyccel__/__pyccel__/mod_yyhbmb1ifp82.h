@@ -0,0 +1,10 @@
+#ifndef MOD_YYHBMB1IFP82_H
+#define MOD_YYHBMB1IFP82_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double sin_call_r(double x);
+#endif // mod_yyhbmb1ifp82_H
@@ -0,0 +1,10 @@
+#ifndef MOD_Z03561WVAZHY_H
+#define MOD_Z03561WVAZHY_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d);
+#endif // mod_z03561wvazhy_H
@@ -0,0 +1,11 @@
+#ifndef MOD_Z31PMAAC1CZL_H
+#define MOD_Z31PMAAC1CZL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_F_array_initialization(t_ndarray x, t_ndarray y, t_ndarray z, t_ndarray a);
+#endif // mod_z31pmaac1czl_H
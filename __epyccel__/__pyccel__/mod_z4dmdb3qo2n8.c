@@ -0,0 +1,22 @@
+#include "mod_z4dmdb3qo2n8.h"
+
+
+/*........................................*/
+double float_types_0000(double x, double y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+float float_types_0001(float x, float y)
+{
+    return x + y;
+}
+/*........................................*/
+/*........................................*/
+double float_types_0002(double x, double y)
+{
+    return x + y;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_Z4DMDB3QO2N8_H
+#define MOD_Z4DMDB3QO2N8_H
+
+#include <stdlib.h>
+
+
+
+double float_types_0000(double x, double y);
+float float_types_0001(float x, float y);
+double float_types_0002(double x, double y);
+#endif // mod_z4dmdb3qo2n8_H
@@ -0,0 +1,12 @@
+#ifndef MOD_Z4GPL5F8VQ1W_H
+#define MOD_Z4GPL5F8VQ1W_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_full_like_shape_1d(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_z4gpl5f8vq1w_H
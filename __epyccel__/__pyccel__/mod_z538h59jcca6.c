@@ -0,0 +1,20 @@
+#include "mod_z538h59jcca6.h"
+
+
+/*........................................*/
+double create_empty_like_val_float_auto(void)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    double Out_0001;
+    arr = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    double Dummy_0000[] = {INT64_C(5), INT64_C(1), INT64_C(8), INT64_C(0), INT64_C(9)};
+    memcpy(&arr.nd_double[INT64_C(0)], Dummy_0000, 5 * arr.type_size);
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    Out_0001 = a.nd_double[INT64_C(0)];
+    free_array(&a);
+    free_array(&arr);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_Z538H59JCCA6_H
+#define MOD_Z538H59JCCA6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_empty_like_val_float_auto(void);
+#endif // mod_z538h59jcca6_H
@@ -0,0 +1,11 @@
+#ifndef MOD_Z7C71VR098DS_H
+#define MOD_Z7C71VR098DS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double create_zeros_2_val(void);
+#endif // mod_z7c71vr098ds_H
@@ -0,0 +1,11 @@
+#ifndef MOD_Z7GEEXLL4LTY_H
+#define MOD_Z7GEEXLL4LTY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t my_tuple(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_z7geexll4lty_H
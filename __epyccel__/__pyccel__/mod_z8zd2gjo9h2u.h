@@ -0,0 +1,11 @@
+#ifndef MOD_Z8ZD2GJO9H2U_H
+#define MOD_Z8ZD2GJO9H2U_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_simd(int64_t n);
+#endif // mod_z8zd2gjo9h2u_H
@@ -0,0 +1,17 @@
+#include "mod_z96qmr6ooimn.h"
+
+
+/*........................................*/
+int64_t for_loop2(void)
+{
+    int64_t i;
+    int64_t x;
+    x = INT64_C(0);
+    for (i = INT64_C(1); i < INT64_C(10); i += INT64_C(1))
+    {
+        x += i;
+    }
+    return x;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_Z96QMR6OOIMN_H
+#define MOD_Z96QMR6OOIMN_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t for_loop2(void);
+#endif // mod_z96qmr6ooimn_H
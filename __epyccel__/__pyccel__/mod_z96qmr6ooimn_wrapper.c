@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_Z96QMR6OOIMN_WRAPPER
+
+#include "mod_z96qmr6ooimn_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* for_loop2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int64_t x;
+    PyObject* x_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    x = for_loop2();
+    x_obj = Int64_to_PyLong(&x);
+    return x_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_z96qmr6ooimn_methods[] = {
+    {
+        "for_loop2",
+        (PyCFunction)for_loop2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_z96qmr6ooimn_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_z96qmr6ooimn",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_z96qmr6ooimn_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_z96qmr6ooimn(void)
+{
+    PyObject* mod;
+    static void* Pymod_z96qmr6ooimn_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_z96qmr6ooimn_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_z96qmr6ooimn_API, "mod_z96qmr6ooimn._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
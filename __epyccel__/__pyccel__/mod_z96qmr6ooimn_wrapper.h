@@ -0,0 +1,40 @@
+#ifndef MOD_Z96QMR6OOIMN_WRAPPER_H
+#define MOD_Z96QMR6OOIMN_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_z96qmr6ooimn.h"
+
+
+#ifdef MOD_Z96QMR6OOIMN_WRAPPER
+
+
+#else
+
+static void** Pymod_z96qmr6ooimn_API;
+
+
+/*........................................*/
+static int mod_z96qmr6ooimn_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_z96qmr6ooimn_API = (void**)PyCapsule_Import("mod_z96qmr6ooimn._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_z96qmr6ooimn_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_Z96QMR6OOIMN_WRAPPER_H
@@ -0,0 +1,76 @@
+#include "mod_z9kq4yszvx2a.h"
+
+
+/*........................................*/
+double complex get_complex128_0000(bool a)
+{
+    double complex b;
+    b = (double complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double complex get_complex128_0001(int64_t a)
+{
+    double complex b;
+    b = (double complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double complex get_complex128_0002(int8_t a)
+{
+    double complex b;
+    b = (double complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double complex get_complex128_0003(int16_t a)
+{
+    double complex b;
+    b = (double complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double complex get_complex128_0004(int32_t a)
+{
+    double complex b;
+    b = (double complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double complex get_complex128_0005(int64_t a)
+{
+    double complex b;
+    b = (double complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double complex get_complex128_0006(double a)
+{
+    double complex b;
+    b = (double complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double complex get_complex128_0007(float a)
+{
+    double complex b;
+    b = (double complex)(a);
+    return b;
+}
+/*........................................*/
+/*........................................*/
+double complex get_complex128_0008(double a)
+{
+    double complex b;
+    b = (double complex)(a);
+    return b;
+}
+/*........................................*/
+
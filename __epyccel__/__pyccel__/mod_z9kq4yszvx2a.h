@@ -0,0 +1,20 @@
+#ifndef MOD_Z9KQ4YSZVX2A_H
+#define MOD_Z9KQ4YSZVX2A_H
+
+#include <complex.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex get_complex128_0000(bool a);
+double complex get_complex128_0001(int64_t a);
+double complex get_complex128_0002(int8_t a);
+double complex get_complex128_0003(int16_t a);
+double complex get_complex128_0004(int32_t a);
+double complex get_complex128_0005(int64_t a);
+double complex get_complex128_0006(double a);
+double complex get_complex128_0007(float a);
+double complex get_complex128_0008(double a);
+#endif // mod_z9kq4yszvx2a_H
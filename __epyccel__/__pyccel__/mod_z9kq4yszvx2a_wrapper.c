@@ -0,0 +1,292 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_Z9KQ4YSZVX2A_WRAPPER
+
+#include "mod_z9kq4yszvx2a_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_0000_wrapper(PyObject* a_obj)
+{
+    bool a;
+    double complex b;
+    PyObject* b_obj;
+    a = PyBool_to_Bool(a_obj);
+    b = get_complex128_0000(a);
+    b_obj = Complex128_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_0001_wrapper(PyObject* a_obj)
+{
+    int64_t a;
+    double complex b;
+    PyObject* b_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = get_complex128_0001(a);
+    b_obj = Complex128_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_0002_wrapper(PyObject* a_obj)
+{
+    int8_t a;
+    double complex b;
+    PyObject* b_obj;
+    a = PyInt8_to_Int8(a_obj);
+    b = get_complex128_0002(a);
+    b_obj = Complex128_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_0003_wrapper(PyObject* a_obj)
+{
+    int16_t a;
+    double complex b;
+    PyObject* b_obj;
+    a = PyInt16_to_Int16(a_obj);
+    b = get_complex128_0003(a);
+    b_obj = Complex128_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_0004_wrapper(PyObject* a_obj)
+{
+    int32_t a;
+    double complex b;
+    PyObject* b_obj;
+    a = PyInt32_to_Int32(a_obj);
+    b = get_complex128_0004(a);
+    b_obj = Complex128_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_0005_wrapper(PyObject* a_obj)
+{
+    int64_t a;
+    double complex b;
+    PyObject* b_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = get_complex128_0005(a);
+    b_obj = Complex128_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_0006_wrapper(PyObject* a_obj)
+{
+    double a;
+    double complex b;
+    PyObject* b_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = get_complex128_0006(a);
+    b_obj = Complex128_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_0007_wrapper(PyObject* a_obj)
+{
+    float a;
+    double complex b;
+    PyObject* b_obj;
+    a = PyFloat_to_Float(a_obj);
+    b = get_complex128_0007(a);
+    b_obj = Complex128_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_complex128_0008_wrapper(PyObject* a_obj)
+{
+    double a;
+    double complex b;
+    PyObject* b_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = get_complex128_0008(a);
+    b_obj = Complex128_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t get_complex128_type_check(PyObject* a_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_Bool(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeInt(a_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Int8(a_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Int16(a_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Int32(a_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_Int64(a_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (PyIs_NativeFloat(a_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Float(a_obj))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (PyIs_Double(a_obj))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* get_complex128_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    type_indicator = get_complex128_type_check(a_obj);
+    if (type_indicator == INT64_C(0))
+    {
+        return get_complex128_0000_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(1))
+    {
+        return get_complex128_0001_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(2))
+    {
+        return get_complex128_0002_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(3))
+    {
+        return get_complex128_0003_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(4))
+    {
+        return get_complex128_0004_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(5))
+    {
+        return get_complex128_0005_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(6))
+    {
+        return get_complex128_0006_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(7))
+    {
+        return get_complex128_0007_wrapper(a_obj);
+    }
+    else if (type_indicator == INT64_C(8))
+    {
+        return get_complex128_0008_wrapper(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+        return NULL;
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_z9kq4yszvx2a_methods[] = {
+    {
+        "get_complex128",
+        (PyCFunction)get_complex128_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_z9kq4yszvx2a_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_z9kq4yszvx2a",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_z9kq4yszvx2a_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_z9kq4yszvx2a(void)
+{
+    PyObject* mod;
+    static void* Pymod_z9kq4yszvx2a_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_z9kq4yszvx2a_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_z9kq4yszvx2a_API, "mod_z9kq4yszvx2a._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
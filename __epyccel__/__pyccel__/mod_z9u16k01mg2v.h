@@ -0,0 +1,11 @@
+#ifndef MOD_Z9U16K01MG2V_H
+#define MOD_Z9U16K01MG2V_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_num_threads(void);
+#endif // mod_z9u16k01mg2v_H
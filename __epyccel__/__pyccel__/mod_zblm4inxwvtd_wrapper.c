@@ -0,0 +1,140 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_ZBLM4INXWVTD_WRAPPER
+
+#include "mod_zblm4inxwvtd_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* multi_layer_index_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* start_obj;
+    PyObject* stop_obj;
+    PyObject* step_obj;
+    PyObject* idx_obj;
+    t_ndarray x = {.raw_data = NULL};
+    int64_t start;
+    int64_t stop;
+    int64_t step;
+    int64_t idx;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        "start",
+        "stop",
+        "step",
+        "idx",
+        NULL
+    };
+    static PyObject* kwlist_interned[6] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 5, 5, &x_obj, &start_obj, &stop_obj, &step_obj, &idx_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(start_obj))
+    {
+        start = PyInt64_to_Int64(start_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument start");
+        return NULL;
+    }
+    if (PyIs_NativeInt(stop_obj))
+    {
+        stop = PyInt64_to_Int64(stop_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument stop");
+        return NULL;
+    }
+    if (PyIs_NativeInt(step_obj))
+    {
+        step = PyInt64_to_Int64(step_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument step");
+        return NULL;
+    }
+    if (PyIs_NativeInt(idx_obj))
+    {
+        idx = PyInt64_to_Int64(idx_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument idx");
+        return NULL;
+    }
+    Out_0001 = multi_layer_index(x, start, stop, step, idx);
+    free_pointer(&x);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_zblm4inxwvtd_methods[] = {
+    {
+        "multi_layer_index",
+        (PyCFunction)multi_layer_index_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_zblm4inxwvtd_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_zblm4inxwvtd",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_zblm4inxwvtd_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_zblm4inxwvtd(void)
+{
+    PyObject* mod;
+    static void* Pymod_zblm4inxwvtd_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_zblm4inxwvtd_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_zblm4inxwvtd_API, "mod_zblm4inxwvtd._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
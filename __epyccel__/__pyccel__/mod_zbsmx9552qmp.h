@@ -0,0 +1,13 @@
+#ifndef MOD_ZBSMX9552QMP_H
+#define MOD_ZBSMX9552QMP_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+float complex create_empty_like_val_complex64(void);
+#endif // mod_zbsmx9552qmp_H
@@ -0,0 +1,28 @@
+#include "mod_zbyru5wk3o8i.h"
+
+
+/*........................................*/
+double zeros_type_0000(double a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    double Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(10)}, nd_double, false, order_c);
+    array_fill((double)0.0, x);
+    Out_0001 = x.nd_double[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int64_t zeros_type_0001(int64_t a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t Out_0001;
+    x = array_create(1, (int64_t[]){INT64_C(10)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), x);
+    Out_0001 = x.nd_int64[INT64_C(0)];
+    free_array(&x);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_ZBYRU5WK3O8I_H
+#define MOD_ZBYRU5WK3O8I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double zeros_type_0000(double a);
+int64_t zeros_type_0001(int64_t a);
+#endif // mod_zbyru5wk3o8i_H
@@ -0,0 +1,40 @@
+#ifndef MOD_ZD290UI59ZAR_WRAPPER_H
+#define MOD_ZD290UI59ZAR_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_zd290ui59zar.h"
+
+
+#ifdef MOD_ZD290UI59ZAR_WRAPPER
+
+
+#else
+
+static void** Pymod_zd290ui59zar_API;
+
+
+/*........................................*/
+static int mod_zd290ui59zar_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_zd290ui59zar_API = (void**)PyCapsule_Import("mod_zd290ui59zar._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_zd290ui59zar_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_ZD290UI59ZAR_WRAPPER_H
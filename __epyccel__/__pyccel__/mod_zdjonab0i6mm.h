@@ -0,0 +1,11 @@
+#ifndef MOD_ZDJONAB0I6MM_H
+#define MOD_ZDJONAB0I6MM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f2(t_ndarray x, int64_t* n, int64_t* m, double* Out_0001, double* Out_0002);
+#endif // mod_zdjonab0i6mm_H
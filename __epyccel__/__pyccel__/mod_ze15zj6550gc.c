@@ -0,0 +1,12 @@
+#include "mod_ze15zj6550gc.h"
+
+
+/*........................................*/
+int64_t tuple_negative_slice(int64_t* a, int64_t* b)
+{
+    (*a) = INT64_C(1);
+    (*b) = INT64_C(2);
+    return 0;
+}
+/*........................................*/
+
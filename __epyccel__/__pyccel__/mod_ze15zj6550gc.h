@@ -0,0 +1,10 @@
+#ifndef MOD_ZE15ZJ6550GC_H
+#define MOD_ZE15ZJ6550GC_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_negative_slice(int64_t* a, int64_t* b);
+#endif // mod_ze15zj6550gc_H
@@ -0,0 +1,40 @@
+#ifndef MOD_ZE15ZJ6550GC_WRAPPER_H
+#define MOD_ZE15ZJ6550GC_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ze15zj6550gc.h"
+
+
+#ifdef MOD_ZE15ZJ6550GC_WRAPPER
+
+
+#else
+
+static void** Pymod_ze15zj6550gc_API;
+
+
+/*........................................*/
+static int mod_ze15zj6550gc_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ze15zj6550gc_API = (void**)PyCapsule_Import("mod_ze15zj6550gc._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ze15zj6550gc_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_ZE15ZJ6550GC_WRAPPER_H
@@ -0,0 +1,10 @@
+#include "mod_ze3i9hn8hgxt.h"
+
+
+/*........................................*/
+double complex f(double complex a, double complex b)
+{
+    return conj(a + b);
+}
+/*........................................*/
+
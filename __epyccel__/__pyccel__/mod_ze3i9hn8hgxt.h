@@ -0,0 +1,10 @@
+#ifndef MOD_ZE3I9HN8HGXT_H
+#define MOD_ZE3I9HN8HGXT_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex f(double complex a, double complex b);
+#endif // mod_ze3i9hn8hgxt_H
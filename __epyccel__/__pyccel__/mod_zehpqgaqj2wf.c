@@ -0,0 +1,16 @@
+#include "mod_zehpqgaqj2wf.h"
+
+
+/*........................................*/
+double complex create_zeros_3_val(void)
+{
+    t_ndarray a = {.raw_data = NULL};
+    double complex Out_0001;
+    a = array_create(2, (int64_t[]){INT64_C(4), INT64_C(2)}, nd_cdouble, false, order_f);
+    array_fill((double complex)(0.0 * _Complex_I), a);
+    Out_0001 = a.nd_cdouble[INT64_C(0)];
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
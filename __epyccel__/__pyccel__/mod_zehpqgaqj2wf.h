@@ -0,0 +1,12 @@
+#ifndef MOD_ZEHPQGAQJ2WF_H
+#define MOD_ZEHPQGAQJ2WF_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex create_zeros_3_val(void);
+#endif // mod_zehpqgaqj2wf_H
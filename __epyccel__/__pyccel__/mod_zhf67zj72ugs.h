@@ -0,0 +1,12 @@
+#ifndef MOD_ZHF67ZJ72UGS_H
+#define MOD_ZHF67ZJ72UGS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t combined_for_simd(void);
+#endif // mod_zhf67zj72ugs_H
@@ -0,0 +1,12 @@
+#ifndef MOD_ZKUSZ0GZ4QVO_H
+#define MOD_ZKUSZ0GZ4QVO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double create_zeros_like_val_float(void);
+#endif // mod_zkusz0gz4qvo_H
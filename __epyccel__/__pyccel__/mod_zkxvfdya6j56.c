@@ -0,0 +1,19 @@
+#include "mod_zkxvfdya6j56.h"
+
+
+/*........................................*/
+int64_t tuple_unpacking_1(int64_t* a, bool* b, double* c)
+{
+    int64_t ai_0;
+    bool ai_1;
+    double ai_2;
+    ai_0 = INT64_C(1);
+    ai_1 = 0;
+    ai_2 = 3.5;
+    (*a) = ai_0;
+    (*b) = ai_1;
+    (*c) = ai_2;
+    return 0;
+}
+/*........................................*/
+
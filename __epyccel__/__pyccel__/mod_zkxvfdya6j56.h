@@ -0,0 +1,11 @@
+#ifndef MOD_ZKXVFDYA6J56_H
+#define MOD_ZKXVFDYA6J56_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_unpacking_1(int64_t* a, bool* b, double* c);
+#endif // mod_zkxvfdya6j56_H
@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_ZKXVFDYA6J56_WRAPPER
+
+#include "mod_zkxvfdya6j56_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tuple_unpacking_1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t a;
+    PyObject* b_obj;
+    bool b;
+    PyObject* c_obj;
+    double c;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    tuple_unpacking_1(&a, &b, &c);
+    a_obj = Int64_to_PyLong(&a);
+    b_obj = Bool_to_PyBool(&b);
+    c_obj = Double_to_PyDouble(&c);
+    Out_obj = Py_BuildValue("OOO", a_obj, b_obj, c_obj);
+    Py_DECREF(a_obj);
+    Py_DECREF(b_obj);
+    Py_DECREF(c_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_zkxvfdya6j56_methods[] = {
+    {
+        "tuple_unpacking_1",
+        (PyCFunction)tuple_unpacking_1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_zkxvfdya6j56_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_zkxvfdya6j56",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_zkxvfdya6j56_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_zkxvfdya6j56(void)
+{
+    PyObject* mod;
+    static void* Pymod_zkxvfdya6j56_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_zkxvfdya6j56_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_zkxvfdya6j56_API, "mod_zkxvfdya6j56._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
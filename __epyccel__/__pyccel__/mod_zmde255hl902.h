@@ -0,0 +1,11 @@
+#ifndef MOD_ZMDE255HL902_H
+#define MOD_ZMDE255HL902_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_zmde255hl902_H
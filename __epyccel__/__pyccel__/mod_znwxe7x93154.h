@@ -0,0 +1,12 @@
+#ifndef MOD_ZNWXE7X93154_H
+#define MOD_ZNWXE7X93154_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t combined_for_simd(void);
+#endif // mod_znwxe7x93154_H
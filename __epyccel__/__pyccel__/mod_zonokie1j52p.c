@@ -0,0 +1,12 @@
+#include "mod_zonokie1j52p.h"
+
+
+/*........................................*/
+int64_t test_size_3d(t_ndarray f)
+{
+    int64_t Out_0001;
+    Out_0001 = f.length;
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_ZONOKIE1J52P_H
+#define MOD_ZONOKIE1J52P_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_size_3d(t_ndarray f);
+#endif // mod_zonokie1j52p_H
@@ -0,0 +1,12 @@
+#ifndef MOD_ZQVH15GR3GH4_H
+#define MOD_ZQVH15GR3GH4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t pointer_to_pointer_is_pointer(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_zqvh15gr3gh4_H
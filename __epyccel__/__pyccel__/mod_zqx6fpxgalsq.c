@@ -0,0 +1,12 @@
+#include "mod_zqx6fpxgalsq.h"
+
+
+/*........................................*/
+int64_t multi_return_scalare(int64_t* Out_0001, int64_t* Out_0002)
+{
+    (*Out_0001) = INT64_C(5);
+    (*Out_0002) = INT64_C(7);
+    return 0;
+}
+/*........................................*/
+
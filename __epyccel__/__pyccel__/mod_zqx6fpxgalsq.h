@@ -0,0 +1,10 @@
+#ifndef MOD_ZQX6FPXGALSQ_H
+#define MOD_ZQX6FPXGALSQ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t multi_return_scalare(int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_zqx6fpxgalsq_H
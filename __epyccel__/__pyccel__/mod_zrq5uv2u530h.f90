@@ -0,0 +1,24 @@
+module mod_zrq5uv2u530h
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine axpby_step2(u, t, z) 
+
+    implicit none
+
+    real(f64), intent(in) :: u(0_i64:)
+    real(f64), intent(in) :: t(0_i64:)
+    real(f64), intent(inout) :: z(0_i64:)
+
+    z(:) = t + u
+
+  end subroutine axpby_step2
+  !........................................
+
+end module mod_zrq5uv2u530h
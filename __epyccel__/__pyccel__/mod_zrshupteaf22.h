@@ -0,0 +1,12 @@
+#ifndef MOD_ZRSHUPTEAF22_H
+#define MOD_ZRSHUPTEAF22_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_zrshupteaf22_H
@@ -0,0 +1,12 @@
+#include "mod_zvvl7z55v8nr.h"
+
+
+/*........................................*/
+double complex tanh_phrase(double complex x, double complex y)
+{
+    double complex a;
+    a = ctanh(x) + ctanh(y);
+    return a;
+}
+/*........................................*/
+
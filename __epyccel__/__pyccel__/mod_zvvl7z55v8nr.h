@@ -0,0 +1,10 @@
+#ifndef MOD_ZVVL7Z55V8NR_H
+#define MOD_ZVVL7Z55V8NR_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex tanh_phrase(double complex x, double complex y);
+#endif // mod_zvvl7z55v8nr_H
@@ -0,0 +1,354 @@
+#include "mod_zvxg4h8vqu72.h"
+
+
+/*........................................*/
+int64_t return_array_0000(int64_t a, int64_t b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int64[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data = y.nd_int64;
+        int64_t* restrict x_data = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int64[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data_0001 = y.nd_int64;
+        int64_t* restrict x_data_0001 = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int64[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_array_0001(int8_t a, int8_t b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int8, false, order_c);
+    int8_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int8[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_int8, false, order_c);
+    int8_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int8[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int8, false, order_c);
+    {
+        int8_t* restrict y_data = y.nd_int8;
+        int8_t* restrict x_data = x.nd_int8;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int8[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int8, false, order_c);
+    {
+        int8_t* restrict y_data_0001 = y.nd_int8;
+        int8_t* restrict x_data_0001 = x.nd_int8;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int8[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_array_0002(int16_t a, int16_t b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int16, false, order_c);
+    int16_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int16[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_int16, false, order_c);
+    int16_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int16[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int16, false, order_c);
+    {
+        int16_t* restrict y_data = y.nd_int16;
+        int16_t* restrict x_data = x.nd_int16;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int16[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int16, false, order_c);
+    {
+        int16_t* restrict y_data_0001 = y.nd_int16;
+        int16_t* restrict x_data_0001 = x.nd_int16;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int16[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_array_0003(int32_t a, int32_t b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int32, false, order_c);
+    int32_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int32[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_int32, false, order_c);
+    int32_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int32[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int32, false, order_c);
+    {
+        int32_t* restrict y_data = y.nd_int32;
+        int32_t* restrict x_data = x.nd_int32;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int32[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int32, false, order_c);
+    {
+        int32_t* restrict y_data_0001 = y.nd_int32;
+        int32_t* restrict x_data_0001 = x.nd_int32;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int32[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_array_0004(int64_t a, int64_t b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int64[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data = y.nd_int64;
+        int64_t* restrict x_data = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int64[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data_0001 = y.nd_int64;
+        int64_t* restrict x_data_0001 = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_int64[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_array_0005(double a, double b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    double Dummy_0001[] = {a, b};
+    memcpy(&y.nd_double[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        double* restrict x_data = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_double[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict y_data_0001 = y.nd_double;
+        double* restrict x_data_0001 = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_double[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_array_0006(float a, float b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_float, false, order_c);
+    float Dummy_0000[] = {a, b};
+    memcpy(&x.nd_float[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_float, false, order_c);
+    float Dummy_0001[] = {a, b};
+    memcpy(&y.nd_float[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_float, false, order_c);
+    {
+        float* restrict y_data = y.nd_float;
+        float* restrict x_data = x.nd_float;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_float[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_float, false, order_c);
+    {
+        float* restrict y_data_0001 = y.nd_float;
+        float* restrict x_data_0001 = x.nd_float;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_float[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_array_0007(double a, double b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    double Dummy_0001[] = {a, b};
+    memcpy(&y.nd_double[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        double* restrict x_data = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_double[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict y_data_0001 = y.nd_double;
+        double* restrict x_data_0001 = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_double[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_array_0008(float complex a, float complex b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_cfloat, false, order_c);
+    float complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cfloat[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_cfloat, false, order_c);
+    float complex Dummy_0001[] = {a, b};
+    memcpy(&y.nd_cfloat[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict y_data = y.nd_cfloat;
+        float complex* restrict x_data = x.nd_cfloat;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_cfloat[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict y_data_0001 = y.nd_cfloat;
+        float complex* restrict x_data_0001 = x.nd_cfloat;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_cfloat[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_array_0009(double complex a, double complex b, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    x = array_create(1, (int64_t[]){INT64_C(2)}, nd_cdouble, false, order_c);
+    double complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cdouble[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    y = array_create(1, (int64_t[]){INT64_C(2)}, nd_cdouble, false, order_c);
+    double complex Dummy_0001[] = {a, b};
+    memcpy(&y.nd_cdouble[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(2)}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict y_data = y.nd_cdouble;
+        double complex* restrict x_data = x.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0001).nd_cdouble[i] = x_data[i] + y_data[i];
+        }
+    }
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(2)}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict y_data_0001 = y.nd_cdouble;
+        double complex* restrict x_data_0001 = x.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            (*Out_0002).nd_cdouble[i] = x_data_0001[i] - y_data_0001[i];
+        }
+    }
+    free_array(&x);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+
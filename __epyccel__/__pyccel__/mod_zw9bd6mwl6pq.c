@@ -0,0 +1,10 @@
+#include "mod_zw9bd6mwl6pq.h"
+
+
+/*........................................*/
+double copysign_call(double x, double y)
+{
+    return copysign(x, y);
+}
+/*........................................*/
+
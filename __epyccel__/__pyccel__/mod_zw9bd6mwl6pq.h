@@ -0,0 +1,10 @@
+#ifndef MOD_ZW9BD6MWL6PQ_H
+#define MOD_ZW9BD6MWL6PQ_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double copysign_call(double x, double y);
+#endif // mod_zw9bd6mwl6pq_H
@@ -0,0 +1,10 @@
+#include "mod_zydiajsdxi7n.h"
+
+
+/*........................................*/
+double copysign_zero_case(int64_t x, int64_t y)
+{
+    return copysign((double)(x), (double)(y));
+}
+/*........................................*/
+
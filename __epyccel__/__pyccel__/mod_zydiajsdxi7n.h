@@ -0,0 +1,11 @@
+#ifndef MOD_ZYDIAJSDXI7N_H
+#define MOD_ZYDIAJSDXI7N_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double copysign_zero_case(int64_t x, int64_t y);
+#endif // mod_zydiajsdxi7n_H
@@ -0,0 +1,12 @@
+#ifndef MOD_ZZVP48SMP76K_H
+#define MOD_ZZVP48SMP76K_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t create_zeros_shape_2d(int64_t n, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_zzvp48smp76k_H
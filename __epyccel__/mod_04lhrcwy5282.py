@@ -0,0 +1,6 @@
+def tuples_mul_homogeneous3():
+    a = (1,2,3)
+    s = 2
+    b = a*s
+    i = 1
+    return b[0], b[i], b[2], b[3], b[4], b[5]
@@ -0,0 +1,6 @@
+def arrs_2d_different_shapes_0():
+    import numpy as np
+    pn = np.array([[1, 2, 3], [1, 2, 3], [1, 2, 3], [1, 2, 3]])
+    pm = np.array([[1, 1, 1]])
+    x = pn + pm
+    return np.shape(x)[0], np.shape(x)[1]
@@ -0,0 +1,5 @@
+def create_zeros_like_val_complex64_auto():
+    from numpy import zeros_like, array, complex64
+    arr = array([5, 1, 8, 0, 9], dtype=complex64)
+    a = zeros_like(arr)
+    return a[0]
@@ -0,0 +1,8 @@
+def reassigned_pointer_shape():
+    from numpy import array, shape
+    a = array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    b = array([1, 2, 3, 4, 5, 6, 7, 8, 9])
+    c = a
+    c = a[1:]
+    d = c*b
+    return shape(d)[0], d[0], d[5]
@@ -0,0 +1,4 @@
+@template('Z', types=['int', 'float'])
+@template('Y', types=['int', 'float'])
+def multi_tmplt_1(x : 'Z', y : 'Z', z : 'Y'):
+    return x + y + z
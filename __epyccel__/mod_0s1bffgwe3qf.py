@@ -0,0 +1,5 @@
+def get_mod(arr1 : 'float[:,:]', arr2 : 'float[:,:](order=F)'):
+    from numpy import mod, shape
+    a = mod(arr1, arr2)
+    s = shape(a)
+    return len(s), s[0], s[1], a[0,1], a[1,0]
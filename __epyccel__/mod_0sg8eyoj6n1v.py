@@ -0,0 +1,5 @@
+def create_zeros_3_shape():
+    from numpy import zeros, shape
+    a = zeros(order = 'F', shape = (4,2),dtype=complex)
+    s = shape(a)
+    return len(s),s[0],s[1]
@@ -0,0 +1,8 @@
+def multi_allocs(i :int):
+    import numpy as np
+    a = np.ones(i)
+    b = np.ones(i)
+    c = np.ones(i)
+    d = np.ones(i)
+    e = np.ones(i)
+    return ((4 + 5)/(d[0] + e[2]) * c[0])%(b[2] + a[1]) - 4
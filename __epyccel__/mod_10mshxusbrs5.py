@@ -0,0 +1,2 @@
+def square(a : int | float): #pylint: disable=unsupported-binary-operation
+    return a*a
@@ -0,0 +1,5 @@
+def create_ones_like_val_float64():
+    from numpy import ones_like, float64, array
+    arr = array([5, 1, 8, 0, 9])
+    a = ones_like(arr, float64)
+    return a[0]
@@ -0,0 +1,4 @@
+def tuple_inhomogeneous():
+    b = ( 42, True, 3.14)
+    a = tuple(b)
+    return a[0], a[1], a[2], len(a)
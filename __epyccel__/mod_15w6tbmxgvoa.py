@@ -0,0 +1,2 @@
+def default_var_4(x : 'int | float', y : int = 5):
+    return x + y
@@ -0,0 +1,2 @@
+def sum_call(x : 'int[:]'):
+    return x.sum()
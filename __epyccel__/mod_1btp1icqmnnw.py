@@ -0,0 +1,4 @@
+def create_ones_2_val():
+    from numpy import ones
+    a = ones((4,2),dtype=float)
+    return a[0,0]
@@ -0,0 +1,6 @@
+@template('T1', ['bool[:,:]', 'int[:,:]', 'int8[:,:]', 'int16[:,:]', 'int32[:,:]', 'int64[:,:]', 'float[:,:]', 'float32[:,:]', 'float64[:,:]', 'complex64[:,:]', 'complex128[:,:]'])
+def dtype_convert_to_cdouble(arr : 'T1'):
+    from numpy import shape, array
+    c = array(arr, dtype='complex128')
+    s = shape(c)
+    return len(s), c[0,0], c[0,1], c[1,0], c[1,1]
@@ -0,0 +1,4 @@
+def array_float_2d_1d_matmul_creation(A : 'float[:,:]', x : 'float[:]'):
+    from numpy import matmul
+    out = matmul(A, x)
+    return out.sum()
@@ -0,0 +1,3 @@
+def min_call(x: 'bool[:]'):
+    from numpy import amin
+    return amin(x)
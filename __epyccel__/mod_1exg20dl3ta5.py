@@ -0,0 +1,4 @@
+def create_empty_2_val():
+    from numpy import empty
+    a = empty((4,2),dtype=float)
+    return a[0,0]
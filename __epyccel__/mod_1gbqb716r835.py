@@ -0,0 +1,3 @@
+def numpy_isnan_expr_test(x : 'float', y : 'float'):
+    from numpy import isnan
+    return isnan(x+y)
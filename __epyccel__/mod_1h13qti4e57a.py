@@ -0,0 +1,5 @@
+def create_full_like_val_int_int_auto(val : 'int'):
+    from numpy import full_like, array
+    arr = array([5, 1, 8, 0, 9], int)
+    a = full_like(arr,val)
+    return a[0]
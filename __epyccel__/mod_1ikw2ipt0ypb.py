@@ -0,0 +1,3 @@
+def acosh_call(x : complex):
+    from cmath import acosh
+    return acosh(x)
@@ -0,0 +1,4 @@
+def test_omp_set_get_dynamic(dynamic_theads : 'bool'):
+    from pyccel.stdlib.internal.openmp import omp_set_dynamic, omp_get_dynamic
+    omp_set_dynamic(dynamic_theads)
+    return omp_get_dynamic()
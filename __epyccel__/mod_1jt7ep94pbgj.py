@@ -0,0 +1,4 @@
+def tuples_add_inhomogeneous_with_variables2():
+    a = (1,2,True)
+    c = (4,False,6) + a
+    return c[0], c[1], c[2], c[3], c[4], c[5]
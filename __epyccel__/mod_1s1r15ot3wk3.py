@@ -0,0 +1,7 @@
+def factorial_while(n : int):
+    x = 1
+    i = 1
+    while i <= n:
+        x = i * x
+        i = i + 1
+    return x
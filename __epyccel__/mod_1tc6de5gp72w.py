@@ -0,0 +1,5 @@
+def create_ones_like_val_complex():
+    from numpy import ones_like, array
+    arr = array([5, 1, 8, 0, 9])
+    a = ones_like(arr, complex)
+    return a[0]
@@ -0,0 +1,8 @@
+def double_loop(n : int):
+    x = 0
+    for i in range( 3, 10 ): # pylint: disable=unused-variable
+        x += 1
+        y  = n*x
+        for j in range( 4, 15 ): # pylint: disable=unused-variable
+            z = x-y
+    return z
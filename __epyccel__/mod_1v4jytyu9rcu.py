@@ -0,0 +1,4 @@
+def gamma_phrase(x : 'float', y : 'float'):
+    from math import gamma
+    a = gamma(x)+ gamma(y)
+    return a
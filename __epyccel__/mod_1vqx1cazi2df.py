@@ -0,0 +1,2 @@
+def return_expr(x : 'int', y : 'int'):
+    return x + y
@@ -0,0 +1,7 @@
+def test_linspace2(start : 'complex128[:]', stop : 'int', out : 'complex128[:,:]', endpoint : 'bool'):
+    from numpy import linspace
+    numberOfSamplesToGenerate = 7
+    a = linspace(start, stop, numberOfSamplesToGenerate, endpoint=endpoint)
+    for i in range(len(out)):
+        for j in range(len(out[i])):
+            out[i][j] = a[i][j]
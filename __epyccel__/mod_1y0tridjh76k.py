@@ -0,0 +1,12 @@
+@stack_array('a')
+@stack_array('b')
+def multiple_2d_stack_array_1():
+    from numpy import ones, array
+    a = ones((2, 5))
+    b = array([[1, 3, 5, 7, 9], [11, 13, 17, 19, 23]])
+    s = 0.0
+    j = 0
+    for i in range(2):
+        for j in range(5):
+            s += a[i][j] / b[i][j]
+    return s
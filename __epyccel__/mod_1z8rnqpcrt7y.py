@@ -0,0 +1,11 @@
+def array_float_4d_F_array_initialization_mixed_ordering(x : 'float[:,:](order=F)', a : 'float[:,:,:,:](order=F)'):
+    import numpy as np
+    tmp      = np.array(((((0., 1.), (2., 3.)),
+                          ((4., 5.), (6., 7.)),
+                          ((8., 9.), (10., 11.))),
+                          (((12., 13.), (14., 15.)),
+                          x,
+                          ((20., 21.), (22., 23.)))),
+                          dtype='float', order='F')
+
+    a[:,:,:,:] = tmp[:,:,:,:]
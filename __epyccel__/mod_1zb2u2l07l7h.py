@@ -0,0 +1,6 @@
+@template('T', ['bool[:]', 'int[:]', 'int8[:]', 'int16[:]', 'int32[:]', 'int64[:]', 'float[:]', 'float32[:]', 'float64[:]'])
+def get_complex64_arr_1d(arr : 'T'):
+    from numpy import complex64, shape
+    a = complex64(arr)
+    s = shape(a)
+    return len(s), s[0], a[0], a[1]
@@ -0,0 +1,5 @@
+@template('T', types=['int64', 'int32', 'int16', 'float', 'complex', 'float32'])
+def mix_types_2(x : 'T', y : 'T'):
+    if y != x:
+        return y - x
+    return -x
@@ -0,0 +1,3 @@
+def arcsin_call_r(x : 'float'):
+    from numpy import arcsin
+    return arcsin(x)
@@ -0,0 +1,4 @@
+def sin_phrase_r_i(x : 'float', y : 'int'):
+    from numpy import sin
+    a = sin(x)+sin(y)
+    return a
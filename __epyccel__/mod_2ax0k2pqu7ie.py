@@ -0,0 +1,4 @@
+def fabs_phrase_r_i(x : 'float', y : 'int'):
+    from numpy import fabs
+    a = fabs(x)*fabs(y)
+    return a
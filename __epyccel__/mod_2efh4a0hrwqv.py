@@ -0,0 +1,4 @@
+def sum_phrase(x : 'float[:]', y : 'float[:]'):
+    from numpy import sum as np_sum
+    a = np_sum(x)*np_sum(y)
+    return a
@@ -0,0 +1,3 @@
+def f():
+    a = 1+2j
+    return a.real
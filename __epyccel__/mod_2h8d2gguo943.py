@@ -0,0 +1,3 @@
+def mix_array_2(x : 'complex[:] | float[:]', y : 'complex[:] | int64[:]', a : int):
+    x[:] += a
+    y[:] -= a
@@ -0,0 +1,2 @@
+def f1(x : 'int[:,:]', y : 'int[:,:,:,:]'):
+    y[0,:,:,0] = x.T
@@ -0,0 +1,5 @@
+def tuples_mul_homogeneous_2d():
+    a= ((1,2), (3,4), (5,6))
+    b = a*2
+    return b[0][0], b[0][1], b[1][0], b[1][1], b[2][0], b[2][1], \
+            b[3][0], b[3][1], b[4][0], b[4][1], b[5][0], b[5][1]
@@ -0,0 +1,2 @@
+def annotated_return(b : 'float[:,:]', c : 'float[:,:]') -> 'float[:,:]':
+    return b + c
@@ -0,0 +1,4 @@
+def return_arr_element(i : int):
+    import numpy as np
+    a = np.ones(i)
+    return a[0]
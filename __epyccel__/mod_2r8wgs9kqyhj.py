@@ -0,0 +1,3 @@
+@template('Z', types=['int', 'float'])
+def tmplt_1(x : 'Z', y : 'Z'):
+    return x + y
@@ -0,0 +1,5 @@
+def create_full_like_2_val():
+    from numpy import full_like, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = full_like(arr,dtype=float,fill_value=1)
+    return a[0,0]
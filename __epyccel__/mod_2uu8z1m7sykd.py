@@ -0,0 +1,5 @@
+def tuples_add_homogeneous_with_variables2():
+    a = (1,2,3)
+    c = (4,5,6) + a
+    i = 1
+    return c[0], c[i], c[2], c[3], c[4], c[5]
@@ -0,0 +1,3 @@
+@template('T', types=['complex[:]', 'complex64[:]'])
+def mix_complex_array_1(x : 'T', a : 'float'):
+    x[:] *= a
@@ -0,0 +1,4 @@
+def create_empty_val_int32():
+    from numpy import empty, int32
+    a = empty(3,int32)
+    return a[0]
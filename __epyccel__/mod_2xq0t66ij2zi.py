@@ -0,0 +1,3 @@
+def ceil_call(x : 'float'):
+    from math import ceil
+    return ceil(x)
@@ -0,0 +1,3 @@
+def inhomogeneous_tuple_negative_slice():
+    a,b = (1,False,3)[:-1]
+    return a,b
@@ -0,0 +1,6 @@
+def create_zeros_like_1_shape():
+    from numpy import zeros_like, shape, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = zeros_like(arr,int,'F')
+    s = shape(a)
+    return len(s),s[0],s[1]
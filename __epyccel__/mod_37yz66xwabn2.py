@@ -0,0 +1,4 @@
+def array_1d_slice_stride_5(a : 'int[:]'):
+    import numpy as np
+    b = a[5::2]
+    return np.sum(b), b[0], b[-1], len(b)
@@ -0,0 +1,3 @@
+def arctan_call_r(x : 'float'):
+    from numpy import arctan
+    return arctan(x)
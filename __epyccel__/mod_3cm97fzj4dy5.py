@@ -0,0 +1,3 @@
+def asin_call(x : complex):
+    from cmath import asin
+    return asin(x)
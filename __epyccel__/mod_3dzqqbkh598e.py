@@ -0,0 +1,3 @@
+def erfc_call(x : 'float'):
+    from math import erfc
+    return erfc(x)
@@ -0,0 +1,4 @@
+@template('T', [float, complex])
+def isfinite_call(x : 'T'):
+    from cmath import isfinite
+    return isfinite(x)
@@ -0,0 +1,3 @@
+def tuple_multilevel_inhomogeneous():
+    a = (1,(2,(3,4)))
+    return a[0], a[1][0], a[1][1][0], a[1][1][1]
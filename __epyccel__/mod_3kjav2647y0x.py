@@ -0,0 +1,4 @@
+def test_shape_2d(f : 'int[:,:]'):
+    from numpy import shape
+    a, b = shape(f)
+    return a, b
@@ -0,0 +1,4 @@
+def tuple_sum():
+    import numpy as np
+    t = (1, 2, 3, 5, 8, 13)
+    return np.sum(t)
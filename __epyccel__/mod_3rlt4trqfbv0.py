@@ -0,0 +1,3 @@
+def exp_call_i(x : 'int'):
+    from numpy import exp
+    return exp(x)
@@ -0,0 +1,4 @@
+@template('T', [float, complex])
+def isinf_call(x : 'T'):
+    from cmath import isinf
+    return isinf(x)
@@ -0,0 +1,4 @@
+def cosh_phrase(x : 'float', y : 'float'):
+    from numpy import cosh
+    a = cosh(x)+cosh(y)
+    return a
@@ -0,0 +1,9 @@
+@stack_array('a')
+def array_float_2d_div_stack_array():
+    from numpy import full
+    a = full((10, 10), 2)
+    s = 1.
+    for i in range(10):
+        for j in range(10):
+            s /= a[i][j]
+    return s
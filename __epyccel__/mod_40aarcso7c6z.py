@@ -0,0 +1,5 @@
+def create_full_3_shape():
+    from numpy import full, shape
+    a = full(order = 'F', shape = (4,2),dtype=complex,fill_value=1)
+    s = shape(a)
+    return len(s),s[0],s[1]
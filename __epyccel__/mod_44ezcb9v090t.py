@@ -0,0 +1,5 @@
+@template('T', ['bool', 'int', 'int8', 'int16', 'int32', 'int64', 'float', 'float32', 'float64', 'complex64', 'complex128'])
+def get_imag(a : 'T'):
+    from numpy import imag
+    b = imag(a)
+    return b
@@ -0,0 +1,3 @@
+def remainder_call(x : 'float', y : 'float'):
+    from math import remainder
+    return remainder(x, y)
@@ -0,0 +1,5 @@
+def create_ones_like_val_float32():
+    from numpy import ones_like, float32, array
+    arr = array([5, 1, 8, 0, 9])
+    a = ones_like(arr, float32)
+    return a[0]
@@ -0,0 +1,4 @@
+def array_float_2d_C_array_initialization(a : 'float[:,:]'):
+    from numpy import array
+    tmp = array([[1, 2, 3], [4, 5, 6]], dtype='float')
+    a[:,:] = tmp[:,:]
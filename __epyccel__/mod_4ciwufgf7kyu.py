@@ -0,0 +1,4 @@
+def sqrt_complex_abs(x : 'complex'):
+    from cmath import sqrt
+    a = sqrt(x * x.conjugate()) + sqrt(x.conjugate() * x)
+    return a
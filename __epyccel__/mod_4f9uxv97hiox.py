@@ -0,0 +1,5 @@
+def f2(x : 'int[:,:,:]'):
+    from numpy import transpose
+    y = transpose(x)
+    n, m, p = y.shape
+    return n, m, p, y[0,-1,0], y[0,0,-1], y[-1,-1,0]
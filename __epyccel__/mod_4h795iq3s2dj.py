@@ -0,0 +1,3 @@
+def log2_call(x : 'float'):
+    from math import log2
+    return log2(x)
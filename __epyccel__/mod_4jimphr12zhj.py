@@ -0,0 +1,2 @@
+def multi_heads_1(x : int, y : 'int | float'):
+    return x + y
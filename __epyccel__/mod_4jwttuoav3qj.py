@@ -0,0 +1,3 @@
+def cosh_call(x : complex):
+    from cmath import cosh
+    return cosh(x)
@@ -0,0 +1,4 @@
+def ceil_phrase(x : 'float', y : 'float'):
+    from math import ceil
+    a = ceil(x)*ceil(y)
+    return a
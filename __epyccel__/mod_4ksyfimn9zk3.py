@@ -0,0 +1,3 @@
+def isfinite_call(x : 'float'):
+    from math import isfinite
+    return isfinite(x)
@@ -0,0 +1,5 @@
+def mult_on_array_int8():
+    from numpy import ones, int8
+    a = ones(5, dtype=int8)
+    b = a * 2
+    return b[0]
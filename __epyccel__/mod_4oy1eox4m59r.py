@@ -0,0 +1,4 @@
+def floor_phrase(x : 'float', y : 'float'):
+    from numpy import floor
+    a = floor(x)*floor(y)
+    return a
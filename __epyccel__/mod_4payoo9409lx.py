@@ -0,0 +1,4 @@
+def create_empty_val_float64():
+    from numpy import empty, float64
+    a = empty(3,float64)
+    return a[0]
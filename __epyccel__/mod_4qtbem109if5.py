@@ -0,0 +1,7 @@
+def f2(x : 'int[:,:,:]'):
+    from numpy import empty
+    n,m,p = x.shape
+    y = empty((p,m,n))
+    y[:,:,:] = x.transpose()
+    n, m, p = y.shape
+    return n, m, p, y[0,-1,0], y[0,0,-1], y[-1,-1,0]
@@ -0,0 +1,2 @@
+def f3(x : 'int[:,:,:]', y : 'int[:,:,:,:,:]'):
+    y[0,:,:,:,0] = x.T
@@ -0,0 +1,3 @@
+def test_shape_2d(f : 'int[:,:]'):
+    a = f.shape
+    return a[0], a[1]
@@ -0,0 +1,3 @@
+def arctan2_call(x : 'int', y : 'int'):
+    from numpy import arctan2
+    return arctan2(x,y)
@@ -0,0 +1,4 @@
+def tuple_homogeneous_math():
+    a = tuple((4 + 5, 3 * 9, 2 ** 3))
+    i = 1
+    return a[0], a[i], a[2], len(a)
@@ -0,0 +1,3 @@
+def cos_call(x : 'float'):
+    from math import cos
+    return cos(x)
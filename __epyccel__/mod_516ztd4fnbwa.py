@@ -0,0 +1,2 @@
+def array_float_2d_C_sub(x : 'float[:,:]', y : 'float[:,:]'):
+    x[:,:] -= y
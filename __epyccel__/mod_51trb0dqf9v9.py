@@ -0,0 +1,3 @@
+def floor_call(x : 'float'):
+    from numpy import floor
+    return floor(x)
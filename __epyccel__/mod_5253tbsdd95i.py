@@ -0,0 +1,4 @@
+def array_float_2d_F_complex_3d_expr(x : 'float[:,:](order=F)', y : 'float[:,:](order=F)'):
+    from numpy import full
+    z = full((2,3),5,order='F')
+    x[:] = (x // y) * x + z
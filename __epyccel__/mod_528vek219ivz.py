@@ -0,0 +1,4 @@
+def test_linspace2(start : 'complex128', end : 'complex128'):
+    from numpy import linspace
+    x = linspace(start, end, 5)
+    return x[0], x[1], x[2], x[3], x[4]
@@ -0,0 +1,4 @@
+def create_full_2_val():
+    from numpy import full
+    a = full((4,2),dtype=float,fill_value=1)
+    return a[0,0]
@@ -0,0 +1,7 @@
+def enumerate_on_1d_array(z : 'int[:]'):
+
+    res = 0
+    for i,v in enumerate( z ):
+        res += v*i
+
+    return res
@@ -0,0 +1,2 @@
+def axpy(a : "float", x : "float64[:,:](order=F)", y : "float64[:,:](order=F)"):
+    y[:] = a * x + y
@@ -0,0 +1,5 @@
+def create_zeros_like_3_val():
+    from numpy import zeros_like, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = zeros_like(arr, shape = (4,2), order = 'F',dtype=complex)
+    return a[0,0]
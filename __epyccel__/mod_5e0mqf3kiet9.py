@@ -0,0 +1,4 @@
+def create_full_val_real_complex128(val : 'float'):
+    from numpy import full, complex128
+    a = full(3,val,complex128)
+    return a[0]
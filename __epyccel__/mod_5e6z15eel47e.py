@@ -0,0 +1,5 @@
+def test_linspace_type2(start : 'int', end : 'int', result : 'complex128[:]'):
+    from numpy import linspace
+    x = linspace(start, end * 2, 15, dtype='complex128')
+    for i in range(len(x)):
+        result[i] = x[i]
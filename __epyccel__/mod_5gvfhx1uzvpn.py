@@ -0,0 +1,7 @@
+def array_variable_size(n : 'int', m : 'int'):
+    import numpy as np
+    s = n
+    a = np.zeros(s)
+    s = m
+    c = np.zeros_like(a)
+    return np.shape(a)[0], np.shape(c)[0]
@@ -0,0 +1,4 @@
+def create_arr(i : int):
+    import numpy as np
+    _ = np.ones(i)
+    return True
@@ -0,0 +1,7 @@
+def array_float_nested_F_array_initialization_3(a : 'float[:,:,:]', e : 'float[:,:]', x : 'float[:,:,:,:](order=F)'):
+    from numpy import array
+    tmp      = array(((e, ((1., 2., 3.), (1., 2., 3.))),
+                       a,
+                       (((1., 2., 3.), (1., 2., 3.)),
+                        ((1., 2., 3.), (1., 2., 3.)))), dtype='float', order="F")
+    x[:,:,:,:] = tmp[:,:,:,:]
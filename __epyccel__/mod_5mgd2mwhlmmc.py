@@ -0,0 +1,6 @@
+def copy_to_slice_issue_1218(n : int):
+    from numpy import zeros, array
+    x = 2
+    arr = zeros((3, n))
+    arr[0:x, 0:6:2] = array([2, 5, 6])
+    return arr
@@ -0,0 +1,5 @@
+def f3(x : 'int [:]'):
+    from numpy import empty_like
+    y = empty_like(x)
+    y[:] = x - 1
+    return y
@@ -0,0 +1,4 @@
+def floor_return_type_real(x : 'float'):
+    from math import floor
+    a = floor(x)
+    return a
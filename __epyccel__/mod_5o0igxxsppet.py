@@ -0,0 +1,4 @@
+@template('T', [float, complex])
+def phase_call(x : 'T'):
+    from cmath import phase
+    return phase(x)
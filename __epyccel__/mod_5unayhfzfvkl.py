@@ -0,0 +1,5 @@
+def divide_by(a : 'float[:]', b : 'float'): # pylint: disable=inconsistent-return-statements
+    if abs(b)<0.1:
+        return None
+    for i,ai in enumerate(a):
+        a[i] = ai/b
@@ -0,0 +1,4 @@
+def sin_phrase(x : complex, y : complex):
+    from cmath import sin
+    a = sin(x)+sin(y)
+    return a
@@ -0,0 +1,4 @@
+def array_float_loopdiff(x : 'float[:]', y : 'float[:]', out : 'float[:]'):
+    dxy = x - y
+    for k in range(len(x)):
+        out[k] = dxy[k]
@@ -0,0 +1,2 @@
+def array_int32_2d_C_sub(x : 'int32[:,:]', y : 'int32[:,:]'):
+    x[:,:] -= y
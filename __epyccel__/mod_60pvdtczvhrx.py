@@ -0,0 +1,3 @@
+def f20(a : 'complex'):
+    b = a
+    return b
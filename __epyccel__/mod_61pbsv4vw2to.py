@@ -0,0 +1,2 @@
+def sqrt_step2(t : 'float[:]', c : 'float[:]', u : 'float[:]'):
+    u[:] = t + c
@@ -0,0 +1,10 @@
+def tuples_as_indexing_var():
+    from numpy import ones
+    x = ones((2,3,2))
+    for z in range(2):
+        for y in range(3):
+            for w in range(2):
+                x[z,y,w] = w+y*2+z*6
+    idx_0 = 1
+    idx = (1,idx_0,0)
+    return x[idx]
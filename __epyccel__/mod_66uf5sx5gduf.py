@@ -0,0 +1,3 @@
+def asin_call(x : 'float'):
+    from math import asin
+    return asin(x)
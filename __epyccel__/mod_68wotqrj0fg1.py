@@ -0,0 +1,3 @@
+def homogeneous_tuple_2_levels():
+    ai = ((0,1,2), (3,4,5))
+    return ai[0][0], ai[0][1] ,ai[0][2], ai[1][0], ai[1][1], ai[1][2]
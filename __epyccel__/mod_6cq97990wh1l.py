@@ -0,0 +1,4 @@
+def homogeneous_tuple_int():
+    ai = (1,4,5)
+    i = 1
+    return ai[0], ai[i], ai[2]
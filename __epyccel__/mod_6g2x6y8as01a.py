@@ -0,0 +1,3 @@
+@template('T', types=['int32[:]', 'int8[:]', 'int16[:]', 'int64[:]'])
+def mix_int_array_1(x : 'T', a : 'int'):
+    x[:] += a
@@ -0,0 +1,4 @@
+def create_full_val_int_complex(val : 'int'):
+    from numpy import full
+    a = full(3,val,complex)
+    return a[0]
@@ -0,0 +1,7 @@
+def tuples_mul_homogeneous5():
+    import numpy as np
+    s = 2
+    a = np.ones(5)
+    b = (1,2,3)*(len(a)*s)
+    i = 1
+    return b[0], b[i], b[2], b[3], b[4], b[5]
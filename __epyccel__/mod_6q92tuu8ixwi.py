@@ -0,0 +1,6 @@
+@template(name='T', types=['int','float', 'complex', 'int32',
+                           'float32', 'float64', 'complex64', 'complex128'])
+def create_full_val_auto(val : 'T'):
+    from numpy import full
+    a = full(3,val)
+    return a[0]
@@ -0,0 +1,5 @@
+def create_ones_1_shape():
+    from numpy import ones, shape
+    a = ones((2,1),int,'F')
+    s = shape(a)
+    return len(s),s[0],s[1]
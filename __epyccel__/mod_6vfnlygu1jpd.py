@@ -0,0 +1,3 @@
+def sinh_call(x : 'float'):
+    from math import sinh
+    return sinh(x)
@@ -0,0 +1,6 @@
+@template('T', ['bool[:]', 'int[:]', 'int8[:]', 'int16[:]', 'int32[:]', 'int64[:]', 'float[:]', 'float32[:]', 'float64[:]'])
+def get_float32_arr_1d(arr : 'T'):
+    from numpy import float32, shape
+    a = float32(arr)
+    s = shape(a)
+    return len(s), s[0], a[0], a[1]
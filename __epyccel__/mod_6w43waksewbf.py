@@ -0,0 +1,5 @@
+def create_full_like_val(val : 'float'):
+    from numpy import full_like, array
+    arr = array([5, 1, 8, 0, 9])
+    a = full_like(arr, val, float, 'F')
+    return a[0],a[1],a[2]
@@ -0,0 +1,18 @@
+def omp_tasks(x : 'int'):
+    def fib(n : int) -> int:
+        if n < 2:
+            return n
+        #$ omp task shared(i) firstprivate(n)
+        i = fib(n-1)
+        #$ omp end task
+        #$ omp task shared(j) firstprivate(n)
+        j = fib(n-2)
+        #$ omp end task
+        #$ omp taskwait
+        return i + j
+    #$ omp parallel
+    #$ omp single
+    m = fib(x)
+    #$ omp end single
+    #$ omp end parallel
+    return m
@@ -0,0 +1,4 @@
+def asinh_phrase(x : 'float', y : 'float'):
+    from math import asinh
+    a = asinh(x)+ asinh(y)
+    return a
@@ -0,0 +1,6 @@
+def tuples_add_homogeneous_variables():
+    a = (1,2,3)
+    b = (4,5,6)
+    c = a + b
+    i = 1
+    return c[0], c[i], c[2], c[3], c[4], c[5]
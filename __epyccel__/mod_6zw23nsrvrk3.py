@@ -0,0 +1,3 @@
+def test_size_1d(f: 'int[:]'):
+    from numpy import size
+    return size(f)
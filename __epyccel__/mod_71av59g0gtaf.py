@@ -0,0 +1,3 @@
+def cos_call_i(x : 'int'):
+    from numpy import cos
+    return cos(x)
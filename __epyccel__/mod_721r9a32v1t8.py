@@ -0,0 +1,4 @@
+def create_empty_val_float():
+    from numpy import empty
+    a = empty(3,float)
+    return a[0]
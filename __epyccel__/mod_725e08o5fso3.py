@@ -0,0 +1,4 @@
+def create_empty_1_val():
+    from numpy import empty
+    a = empty((2,1),int,'F')
+    return a[0,0]
@@ -0,0 +1,8 @@
+def test_omp_get_active_level():
+    from pyccel.stdlib.internal.openmp import omp_get_active_level
+    #$ omp parallel
+    #$ omp parallel
+    active_level_vars = omp_get_active_level()
+    #$ omp end parallel
+    #$ omp end parallel
+    return active_level_vars
@@ -0,0 +1,3 @@
+def f():
+    a = 1.5
+    return a.imag
@@ -0,0 +1,5 @@
+@template('T', ['int[:]', 'int[:,:]', 'int[:,:,:]', 'int[:,:](order=F)', 'int[:,:,:](order=F)'])
+def array_ndmin_4(x : 'T'):
+    from numpy import array
+    y = array(x, ndmin=4)
+    return y
@@ -0,0 +1,4 @@
+def create_empty_val_complex128():
+    from numpy import empty, complex128
+    a = empty(3,complex128)
+    return a[0]
@@ -0,0 +1,5 @@
+def mult_on_array_float64():
+    from numpy import ones, float64
+    a = ones(5, dtype=float64)
+    b = a * 2
+    return b[0]
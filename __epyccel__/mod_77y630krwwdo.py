@@ -0,0 +1,3 @@
+def p_lose():
+    lose = -10
+    return lose
@@ -0,0 +1,3 @@
+def asinh_call(x : complex):
+    from cmath import asinh
+    return asinh(x)
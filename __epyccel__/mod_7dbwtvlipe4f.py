@@ -0,0 +1,2 @@
+def multi_return_vars(a : 'int', b : 'int'):
+    return a, b
@@ -0,0 +1,4 @@
+def cosh_phrase(x : 'float', y : 'float'):
+    from math import cosh
+    a = cosh(x)+cosh(y)
+    return a
@@ -0,0 +1,3 @@
+def sqrt_step3(u : 'float[:]', v : 'float[:]'):
+    from numpy import sqrt
+    v[:] = sqrt(u)
@@ -0,0 +1,7 @@
+def reassigned_pointer():
+    from numpy import array, shape
+    a = array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    c = a[1:]
+    c[1] = 0
+    c = a
+    return c[0], c[1], c[2], shape(c)[0]
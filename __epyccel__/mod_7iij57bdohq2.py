@@ -0,0 +1,4 @@
+def test_omp_set_get_nested(nested : 'bool'):
+    from pyccel.stdlib.internal.openmp import omp_set_nested, omp_get_nested
+    omp_set_nested(nested)
+    return omp_get_nested()
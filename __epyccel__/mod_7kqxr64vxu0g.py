@@ -0,0 +1,3 @@
+def sum_call(x : 'int[:]'):
+    from numpy import sum
+    return sum(x)
@@ -0,0 +1,5 @@
+@template('T', ['float[:,:,:](order=F)', 'float[:,:](order=F)'])
+def copy_f_to_c(b : 'T'):
+    from numpy import array
+    a = array(b, order='C')
+    return a
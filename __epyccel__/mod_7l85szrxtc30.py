@@ -0,0 +1,3 @@
+def log_call(x : 'float'):
+    from math import log
+    return log(x)
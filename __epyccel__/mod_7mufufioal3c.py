@@ -0,0 +1,3 @@
+def tuple_inhomogeneous_return():
+    ai = (7.5, False, 8)
+    return ai
@@ -0,0 +1,6 @@
+@stack_array('x')
+def f():
+    import numpy as np
+    x = np.zeros((3, 7), dtype=int)
+    x = np.ones ((4, 5), dtype=int)
+    return x.sum()
@@ -0,0 +1,8 @@
+def tuple_arg_unpacking():
+    @pure
+    def add2(x : 'int', y : 'int'):
+        return x+y
+
+    args = (3,4)
+    z = add2(*args)
+    return z
@@ -0,0 +1,4 @@
+@template('K', types=['int'])
+@template('G', types=['int', 'float'])
+def multi_tmplt_2(y : 'K', z : 'G'):
+    return y + z
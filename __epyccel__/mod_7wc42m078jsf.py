@@ -0,0 +1,6 @@
+def create_full_like_shape_C(n : 'int'):
+    from numpy import full_like, shape, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = full_like(arr,4, order = 'C')
+    s = shape(a)
+    return len(s),s[0], s[1]
@@ -0,0 +1,10 @@
+@allow_negative_index('a')
+@allow_negative_index('b')
+def test_multiple_negative_index(c : 'int', d : 'int'):
+    import numpy as np
+    a = np.array([1, 2, 3, 4, 5, 6])
+    b = np.array([1, 2, 3])
+    x = a[c]
+    y = b[d]
+
+    return x, y
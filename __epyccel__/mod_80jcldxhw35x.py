@@ -0,0 +1,9 @@
+@allow_negative_index('a')
+def expr_negative_index(n : 'int', idx_1 : 'int', idx_2 : 'int'):
+    import numpy as np
+    a = np.empty(n, dtype=int)
+
+    for i in range(n):
+        a[i] = i
+
+    return a[idx_1-idx_2]
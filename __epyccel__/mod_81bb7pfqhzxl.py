@@ -0,0 +1,2 @@
+def f(a : 'complex64', b : 'complex64'):
+    return (a+b).conj()
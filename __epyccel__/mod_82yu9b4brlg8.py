@@ -0,0 +1,3 @@
+def atanh_call(x : 'float'):
+    from math import atanh
+    return atanh(x)
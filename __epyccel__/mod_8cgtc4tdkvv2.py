@@ -0,0 +1,5 @@
+@template('T', ['float32', 'float'])
+def array_float_2d_scalar_add(x : 'T[:,:]', a : 'T', d1 : int, d2 : int):
+    for i in range(d1):
+        for j in range(d2):
+            x[i, j] += a
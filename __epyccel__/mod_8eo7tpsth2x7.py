@@ -0,0 +1,5 @@
+def create_ones_shape_2d(n : 'int'):
+    from numpy import ones, shape
+    a = ones((n,n))
+    s = shape(a)
+    return len(s),s[0], s[1]
@@ -0,0 +1,4 @@
+def homogeneous_tuple_bool():
+    ai = (False, True)
+    i = 1
+    return ai[0], ai[i]
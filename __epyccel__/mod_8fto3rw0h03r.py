@@ -0,0 +1,4 @@
+def tuples_add_homogeneous():
+    a = (1,2,3) + (4,5,6)
+    i = 1
+    return a[0], a[i], a[2], a[3], a[4], a[5]
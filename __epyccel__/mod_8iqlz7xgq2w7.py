@@ -0,0 +1,3 @@
+def sinh_call_i(x : 'int'):
+    from numpy import sinh
+    return sinh(x)
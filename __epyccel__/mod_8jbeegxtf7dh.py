@@ -0,0 +1,4 @@
+def get_complex128():
+    from numpy import complex128
+    compl = complex128(3+4j)
+    return compl, compl.real, compl.imag
@@ -0,0 +1,3 @@
+def remainder_type(x : 'float', y : 'float'):
+    from math import remainder
+    return remainder(x, y)
@@ -0,0 +1,4 @@
+def tuples_add_mixed_homogeneous_with_variables():
+    a = (1,2,3)
+    c = a + (4,False,6)
+    return c[0], c[1], c[2], c[3], c[4], c[5]
@@ -0,0 +1,4 @@
+def tanh_phrase(x : 'float', y : 'float'):
+    from math import tanh
+    a = tanh(x)+tanh(y)
+    return a
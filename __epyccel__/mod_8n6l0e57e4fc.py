@@ -0,0 +1,5 @@
+def array_1d_slice_stride_22(a : 'int[:]'):
+    import numpy as np
+    c = 5
+    b = a[5:-5:c]
+    return np.sum(b), b[0], b[-1], len(b)
@@ -0,0 +1,4 @@
+def max_phrase(x : 'float[:]', y : 'float[:]'):
+    from numpy import amax
+    a = amax(x)*amax(y)
+    return a
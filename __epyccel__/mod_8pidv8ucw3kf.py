@@ -0,0 +1,3 @@
+def tuple_index():
+    a = (1,2,3,False)[2]
+    return a
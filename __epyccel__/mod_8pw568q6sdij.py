@@ -0,0 +1,3 @@
+def tan_call(x : 'float'):
+    from math import tan
+    return tan(x)
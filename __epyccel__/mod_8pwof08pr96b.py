@@ -0,0 +1,6 @@
+@template('T', ['bool[:,:]', 'int[:,:]', 'int8[:,:]', 'int16[:,:]', 'int32[:,:]', 'int64[:,:]', 'float[:,:]', 'float32[:,:]', 'float64[:,:]'])
+def get_chosen_elements(arr : 'T'):
+    from numpy import where, shape
+    a = where(arr < 0, arr, arr + 1)
+    s = shape(a)
+    return len(s), s[0], a[0,0], a[0,1], a[1,0], a[1,1]
@@ -0,0 +1,2 @@
+def f(a : 'complex', b : 'complex'):
+    return (a+b).imag
@@ -0,0 +1,4 @@
+def acosh_phrase(x : 'float', y : 'float'):
+    from math import acosh
+    a = acosh(x) + acosh(y)
+    return a
@@ -0,0 +1,5 @@
+def create_full_shape_2d(n : 'int'):
+    from numpy import full, shape
+    a = full((n,n),4)
+    s = shape(a)
+    return len(s),s[0], s[1]
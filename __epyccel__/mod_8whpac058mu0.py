@@ -0,0 +1,4 @@
+def log2_phrase(x : 'float', y : 'float'):
+    from math import log2
+    a = log2(x)+log2(y)
+    return a
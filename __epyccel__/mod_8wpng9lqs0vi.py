@@ -0,0 +1,11 @@
+def double_while_sum(n : int, m : int):
+    x = 0
+    y = 0
+    i = 0
+    while x <= n:
+        while y <= m:
+            i += y
+            y = y + 1
+        i += x
+        x = x + 1
+    return i
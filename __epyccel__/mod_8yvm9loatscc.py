@@ -0,0 +1,5 @@
+def create_full_like_arg_names(val : 'float'):
+    from numpy import full_like, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = full_like(arr, val, float, 'F', shape = (2,3))
+    return a[0,0],a[0,1],a[0,2],a[1,0],a[1,1],a[1,2]
@@ -0,0 +1,5 @@
+def create_full_2_shape():
+    from numpy import full, shape
+    a = full((4,2),dtype=float,fill_value=1)
+    s = shape(a)
+    return len(s),s[0],s[1]
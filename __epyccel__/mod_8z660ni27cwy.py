@@ -0,0 +1,4 @@
+def exp_phrase(x : 'float', y : 'float'):
+    from math import exp
+    a = exp(x)+exp(y)
+    return a
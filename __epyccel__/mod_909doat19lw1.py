@@ -0,0 +1,3 @@
+def single_return_var_assign():
+    y = 3
+    return y
@@ -0,0 +1,7 @@
+def array_float_nested_C_array_initialization_3(a : 'float[:,:,:]', e : 'float[:,:]', x : 'float[:,:,:,:]'):
+    from numpy import array
+    tmp      = array(((e, ((1., 2., 3.), (1., 2., 3.))),
+                       a,
+                       (((1., 2., 3.), (1., 2., 3.)),
+                        ((1., 2., 3.), (1., 2., 3.)))), dtype='float')
+    x[:,:,:,:] = tmp[:,:,:,:]
@@ -0,0 +1,2 @@
+def array_int_2d_C_mul(x : 'int[:,:]', y : 'int[:,:]'):
+    x[:,:] *= y
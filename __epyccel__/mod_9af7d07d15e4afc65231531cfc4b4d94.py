@@ -0,0 +1,2 @@
+def mul_two(x : int):
+    return x * 2
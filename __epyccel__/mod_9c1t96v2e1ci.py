@@ -0,0 +1,3 @@
+def call_factorial(x : 'int'):
+    from math import factorial
+    return factorial(x)
@@ -0,0 +1,2 @@
+def f9(x : 'int64[:]'):
+    x += 1
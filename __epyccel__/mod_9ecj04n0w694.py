@@ -0,0 +1,3 @@
+def test_size_axis_variable_2d(f: 'int[:,:]', axis :'int'):
+    from numpy import size
+    return size(f, axis)
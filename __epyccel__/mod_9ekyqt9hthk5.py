@@ -0,0 +1,11 @@
+def product_loop( z : 'float[:]', m : int, n : int ):
+
+    from itertools import product
+
+    x = [i*3+2 for i in range(m)]
+    y = [j*7+6 for j in range(n)]
+
+    k = 0
+    for i,j in product( x, y ):
+        z[k] = i-j
+        k += 1
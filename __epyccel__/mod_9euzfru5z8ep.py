@@ -0,0 +1,4 @@
+def cosh_phrase(x : complex, y : complex):
+    from cmath import cosh
+    a = cosh(x)+cosh(y)
+    return a
@@ -0,0 +1,4 @@
+def type_comparison():
+    import numpy as np
+    b = np.zeros(5, dtype=np.result_type(np.int32, np.int16))
+    return b[0]
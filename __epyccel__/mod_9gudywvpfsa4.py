@@ -0,0 +1,3 @@
+def sqrt_call(x : 'float'):
+    from math import sqrt
+    return sqrt(x)
@@ -0,0 +1,8 @@
+def tuples_inhomogeneous_copies_have_pointers():
+    from numpy import zeros
+    a = zeros(2)
+    b = zeros(3)
+    c = (a,b)
+    d = c
+    a[1] = 4
+    return d[0][0], d[0][1], d[1][0], d[1][1], d[1][2]
@@ -0,0 +1,4 @@
+@template(name='T', types=['complex','complex64','complex128'])
+def absolute_call_c(x : 'T'):
+    from numpy import absolute
+    return absolute(x)
@@ -0,0 +1,6 @@
+def create_full_like_2_shape():
+    from numpy import full_like, shape, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = full_like(arr,dtype=float,fill_value=1)
+    s = shape(a)
+    return len(s),s[0],s[1]
@@ -0,0 +1,4 @@
+def create_full_val_int_int(val : 'int'):
+    from numpy import full
+    a = full(3,val,int)
+    return a[0]
@@ -0,0 +1,5 @@
+def create_ones_shape_C(n : 'int', m : 'int'):
+    from numpy import ones, shape
+    a = ones((n,m), order = 'C')
+    s = shape(a)
+    return len(s),s[0], s[1]
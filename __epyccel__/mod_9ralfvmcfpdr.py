@@ -0,0 +1,3 @@
+def fabs_call_i(x : 'int'):
+    from numpy import fabs
+    return fabs(x)
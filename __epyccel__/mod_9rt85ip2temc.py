@@ -0,0 +1,3 @@
+def sqrt_call(x : complex):
+    from cmath import sqrt
+    return sqrt(x)
@@ -0,0 +1,5 @@
+def array_int_1d_initialization_1():
+    import numpy as np
+    a = np.array([1, 2, 4, 8, 16])
+    b = np.array(a)
+    return np.sum(b), b[0], b[-1]
@@ -0,0 +1,4 @@
+def cos_phrase(x : complex, y : complex):
+    from cmath import cos
+    a = cos(x)+cos(y)
+    return a
@@ -0,0 +1,4 @@
+def tan_phrase_r_r(x : 'float', y : 'float'):
+    from numpy import tan
+    a = tan(x)+tan(y)
+    return a
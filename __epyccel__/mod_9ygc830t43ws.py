@@ -0,0 +1,4 @@
+def f1(x : 'int[:,:]'):
+    y = x.T
+    n, m = y.shape
+    return n, m, y[-1,0], y[0,-1]
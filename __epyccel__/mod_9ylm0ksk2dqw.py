@@ -0,0 +1,3 @@
+def log_call_r(x : 'float'):
+    from numpy import log
+    return log(x)
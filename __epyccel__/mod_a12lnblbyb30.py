@@ -0,0 +1,3 @@
+def tanh_call(x : complex):
+    from cmath import tanh
+    return tanh(x)
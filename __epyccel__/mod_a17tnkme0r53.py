@@ -0,0 +1,6 @@
+@template('K', types=['complex'])
+@template('G', types=['int', 'float'])
+def optional_var_2(x : 'G', y  : 'K' =  None):
+    if y is None :
+        return x + 1j
+    return x + y
@@ -0,0 +1,4 @@
+def fabs_phrase_i_i(x : 'int', y : 'int'):
+    from numpy import fabs
+    a = fabs(x)*fabs(y)
+    return a
@@ -0,0 +1,3 @@
+def max_call(x: 'complex128[:]'):
+    from numpy import amax
+    return amax(x)
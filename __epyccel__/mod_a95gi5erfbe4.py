@@ -0,0 +1,4 @@
+def test_shape_1d_tuple(f : 'int[:]'):
+    from numpy import shape
+    s, = shape(f)
+    return s
@@ -0,0 +1,5 @@
+def create_zeros_like_val_int_auto():
+    from numpy import zeros_like, array
+    arr = array([5, 1, 8, 0, 9], dtype=int)
+    a = zeros_like(arr)
+    return a[0]
@@ -0,0 +1,5 @@
+def create_full_like_3_val():
+    from numpy import full_like, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = full_like(arr,order = 'F', shape = (4,2),dtype=complex,fill_value=1)
+    return a[0,0]
@@ -0,0 +1,4 @@
+@template('T', [int, float])
+def pow_call(x : float, y : 'T'):
+    from math import pow as my_pow
+    return my_pow(x, y)
@@ -0,0 +1,5 @@
+def for_loop1(start : int, stop : int, step : int):
+    x = 0
+    for i in range(start, stop, step):
+        x += i
+    return x
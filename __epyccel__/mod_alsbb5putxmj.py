@@ -0,0 +1,8 @@
+def omp_range_sum_critical(x : 'int'):
+    func_result = 0
+    #$ omp parallel for num_threads(4) shared(func_result)
+    for i in range(0, x):
+        #$ omp critical
+        func_result += i
+        #$ omp end critical
+    return func_result
@@ -0,0 +1,5 @@
+def create_zeros_like_val_complex128():
+    from numpy import zeros_like, complex128, array
+    arr = array([5, 1, 8, 0, 9])
+    a = zeros_like(arr,complex128)
+    return a[0]
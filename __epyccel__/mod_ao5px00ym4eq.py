@@ -0,0 +1,4 @@
+def tuple_homogeneous_int():
+    a = tuple((1, 2, 3))
+    i = 1
+    return a[0], a[i], a[2], len(a)
@@ -0,0 +1,6 @@
+def test_omp_get_set_max_active_levels(max_active_levels : 'int'):
+    import numpy as np
+    from pyccel.stdlib.internal.openmp import omp_get_max_active_levels, omp_set_max_active_levels
+    omp_set_max_active_levels(np.int32(max_active_levels))
+    max_active_levels_var = omp_get_max_active_levels()
+    return max_active_levels_var
@@ -0,0 +1,7 @@
+def tuple_indexing_2d():
+    ai = ((0,1,2), (True,False,True))
+    z = 0
+    for i in range(3):
+        if ai[1][i]:
+            z += ai[0][i]
+    return z
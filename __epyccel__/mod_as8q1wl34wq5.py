@@ -0,0 +1,10 @@
+def omp_nowait(x : 'int[:]', y : 'int[:]', z : 'float[:]'):
+    #$ omp parallel
+    #$ omp for nowait
+    for i in range(0, 1000):
+        y[i] = x[i] * 2
+    #$ omp for nowait
+    for j in range(0, 1000):
+        z[j] = x[j] / 2
+    #$ omp end parallel
+    "bypass issue #468" # pylint: disable=W0105
@@ -0,0 +1,3 @@
+def arccos_call_i(x : 'int'):
+    from numpy import arccos
+    return arccos(x)
@@ -0,0 +1,4 @@
+def array_float_2d_F_array_initialization(a : 'float[:,:](order=F)'):
+    from numpy import array
+    tmp = array([[1, 2, 3], [4, 5, 6]], dtype='float', order='F')
+    a[:,:] = tmp[:,:]
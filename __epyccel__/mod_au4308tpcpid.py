@@ -0,0 +1,5 @@
+@template('T', ['bool', 'int', 'int8', 'int16', 'int32', 'int64', 'float', 'float32', 'float64', 'complex64', 'complex128'])
+def return_array(a : 'T', b : 'T'):
+    from numpy import array
+    x = array([a,b], dtype=type(a))
+    return x
@@ -0,0 +1,4 @@
+def atanh_phrase(x : complex, y : complex):
+    from cmath import atanh
+    a = atanh(x)+ atanh(y)
+    return a
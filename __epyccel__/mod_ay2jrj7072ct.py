@@ -0,0 +1,3 @@
+def f18(a : 'int32'):
+    b = a
+    return b
@@ -0,0 +1,4 @@
+def create_ones_val_complex64():
+    from numpy import ones, complex64
+    a = ones(3,complex64)
+    return a[0]
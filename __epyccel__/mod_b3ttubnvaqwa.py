@@ -0,0 +1,5 @@
+@template('T', ['bool', 'int', 'int8', 'int16', 'int32', 'int64', 'float', 'float32', 'float64'])
+def get_float64(a : 'T'):
+    from numpy import float64
+    b = float64(a)
+    return b
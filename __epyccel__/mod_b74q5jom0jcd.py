@@ -0,0 +1,4 @@
+def create_ones_val_int():
+    from numpy import ones
+    a = ones(3,int)
+    return a[0]
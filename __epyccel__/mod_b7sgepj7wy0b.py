@@ -0,0 +1,3 @@
+@template('T', types=['int', 'float[:]', 'complex[:, :]'])
+def add_scalars_or_arrays(a: 'T', b: 'T'):
+    return a + b + 1
@@ -0,0 +1,4 @@
+def create_ones_1_val():
+    from numpy import ones
+    a = ones((2,1),int,'F')
+    return a[0,0]
@@ -0,0 +1,4 @@
+@template('T', ['complex64', 'complex128'])
+def array_complex_1d_scalar_add(x : 'T[:]', a : 'T', x_len : int):
+    for i in range(x_len):
+        x[i] += a
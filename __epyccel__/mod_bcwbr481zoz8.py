@@ -0,0 +1,4 @@
+def arctan2_phrase(x : 'float', y : 'float', z : 'float'):
+    from numpy import arctan2
+    a = arctan2(x,y)+arctan2(x,z)
+    return a
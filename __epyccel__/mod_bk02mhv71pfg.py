@@ -0,0 +1,6 @@
+@template('T', ['int[:,:]', 'int8[:,:]', 'int16[:,:]', 'int32[:,:]', 'float[:,:]', 'float32[:,:]', 'float64[:,:]'])
+def test_linspace(start : 'T', stop : int, endpoint : bool):
+    from numpy import linspace
+    numberOfSamplesToGenerate = 7
+    a = linspace(start, stop, numberOfSamplesToGenerate, endpoint=endpoint)
+    return a
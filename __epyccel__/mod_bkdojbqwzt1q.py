@@ -0,0 +1,4 @@
+def test_shape_1d(f : 'int[:]'):
+    from numpy import shape
+    s = shape(f)
+    return s[0]
@@ -0,0 +1,12 @@
+def omp_simd(n : 'int'):
+    from numpy import zeros
+    func_result = 0
+    arr = zeros(n, dtype=int)
+    #$ omp parallel num_threads(4)
+    #$ omp simd
+    for i in range(0, n):
+        arr[i] = i
+    #$ omp end parallel
+    for i in range(0, n):
+        func_result = func_result + arr[i]
+    return func_result
@@ -0,0 +1,3 @@
+def atan_call(x : complex):
+    from cmath import atan
+    return atan(x)
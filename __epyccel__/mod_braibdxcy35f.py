@@ -0,0 +1,3 @@
+def min_call(x : 'int[:]'):
+    from numpy import amin
+    return amin(x)
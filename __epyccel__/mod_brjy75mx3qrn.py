@@ -0,0 +1,3 @@
+def log1p_call(x : 'float'):
+    from math import log1p
+    return log1p(x)
@@ -0,0 +1,3 @@
+def sinh_call_r(x : 'float'):
+    from numpy import sinh
+    return sinh(x)
@@ -0,0 +1,3 @@
+def rect_call(r : float, phi : float):
+    from cmath import rect
+    return rect(r, phi)
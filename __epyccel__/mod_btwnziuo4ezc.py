@@ -0,0 +1,4 @@
+def tuple_unpacking_5():
+    ai = (1,2,3)
+    a,b,c = ai
+    return a,b,c
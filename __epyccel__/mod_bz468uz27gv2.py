@@ -0,0 +1,5 @@
+def fizzbuzz_search_with_breaks(fizz : 'int', buzz : 'int', max_val : 'int'):
+    for i in range(1,max_val+1):
+        if i%fizz == 0 and i%buzz == 0:
+            break
+    return i
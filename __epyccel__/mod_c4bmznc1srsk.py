@@ -0,0 +1,4 @@
+def copysign_return_type(x : 'int', y : 'float'):
+    from math import copysign
+    a = copysign(x, y)
+    return a
@@ -0,0 +1,4 @@
+@template('T', ['float[:,:]', 'complex[:,:,:](order=F)'])
+def copy_array_to_C(a : 'T'):
+    b = a.copy(order='C')
+    return b
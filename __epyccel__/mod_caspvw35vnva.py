@@ -0,0 +1,6 @@
+def create_multi_arrs(i : int):
+    import numpy as np
+    _ = np.ones(i)
+    _ = np.zeros(i)
+    _ = np.zeros(i)
+    return True
@@ -0,0 +1,3 @@
+@template('T', ['int', 'int[:]'])
+def scalar_or_array(a : 'T'):
+    return a+2
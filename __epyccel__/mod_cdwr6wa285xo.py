@@ -0,0 +1,4 @@
+def inhomogeneous_tuple_var_negative_slice():
+    c = (1,False,3)
+    a,b = c[:-1]
+    return a,b
@@ -0,0 +1,4 @@
+def tuple_variable_slice():
+    a = 1
+    b = (1,2,3)[:a]
+    return b[0]
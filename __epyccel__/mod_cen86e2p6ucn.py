@@ -0,0 +1,2 @@
+def max_call(x : 'int[:]'):
+    return x.max()
@@ -0,0 +1,2 @@
+def p_func(x : int):
+    x *= 2
@@ -0,0 +1,4 @@
+def absolute_phrase_r_r(x : 'float', y : 'float'):
+    from numpy import absolute
+    a = absolute(x)*absolute(y)
+    return a
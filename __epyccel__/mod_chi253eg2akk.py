@@ -0,0 +1,5 @@
+def create_full_like_val_int_complex(val : 'int'):
+    from numpy import full_like, array
+    arr = array([5, 1, 8, 0, 9])
+    a = full_like(arr,val,complex)
+    return a[0]
@@ -0,0 +1,3 @@
+def ceil_call(x : 'int'):
+    from math import ceil
+    return ceil(x)
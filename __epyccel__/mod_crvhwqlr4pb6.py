@@ -0,0 +1,4 @@
+@template('T', ['float32', 'float'])
+def array_float_1d_scalar_add(x : 'T[:]', a : 'T', x_len : int):
+    for i in range(x_len):
+        x[i] += a
@@ -0,0 +1,6 @@
+@template('K', types=['int'])
+@template('G', types=['int', 'float'])
+def optional_var_1(x : 'G', y  : 'K' =  None):
+    if y is None :
+        return x
+    return x + y
@@ -0,0 +1,5 @@
+def sum_natural_numbers(n : int):
+    x = 0
+    for i in range( 1, n+1 ):
+        x += i
+    return x
@@ -0,0 +1,4 @@
+def create_empty_val_complex():
+    from numpy import empty
+    a = empty(3,complex)
+    return a[0]
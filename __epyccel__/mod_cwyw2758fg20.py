@@ -0,0 +1,7 @@
+@template('G', types=['complex', 'int'])
+@template('H', types=['int', 'float64'])
+@template('K', types=['int16', 'bool'])
+def mix_types_1(x : 'G', y : 'H', z : 'K'):
+    if z :
+        return x + y
+    return x - y
@@ -0,0 +1,6 @@
+@template('T', ['bool[:,:]', 'int[:,:]', 'int8[:,:]', 'int16[:,:]', 'int32[:,:]', 'int64[:,:]', 'float[:,:]', 'float32[:,:]', 'float64[:,:]'])
+def get_int32_arr_2d(arr : 'T'):
+    from numpy import int32, shape
+    a = int32(arr)
+    s = shape(a)
+    return len(s), s[0], s[1], a[0,0], a[1,0]
@@ -0,0 +1,5 @@
+def create_ones_like_val_int32_auto():
+    from numpy import ones_like, int32, array
+    arr = array([5, 1, 8, 0, 9], int32)
+    a = ones_like(arr)
+    return a[0]
@@ -0,0 +1,4 @@
+@template('T', ['float[:,:]', 'complex[:,:,:](order=F)'])
+def copy_array_to_F(a : 'T'):
+    b = a.copy(order='F')
+    return b
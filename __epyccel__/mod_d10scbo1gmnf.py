@@ -0,0 +1,4 @@
+def create_full_3_val():
+    from numpy import full
+    a = full(order = 'F', shape = (4,2),dtype=complex,fill_value=1)
+    return a[0,0]
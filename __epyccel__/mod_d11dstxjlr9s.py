@@ -0,0 +1,5 @@
+def create_full_like_val_real_float32(val : 'float'):
+    from numpy import full_like, float32, array
+    arr = array([5, 1, 8, 0, 9])
+    a = full_like(arr,val,float32)
+    return a[0]
@@ -0,0 +1,4 @@
+def tuple_name_clash():
+    ai = (1+2j, False, 10.4)
+    ai_0 = 44
+    return ai_0, ai[0], ai[1], ai[2]
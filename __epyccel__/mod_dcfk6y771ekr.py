@@ -0,0 +1,6 @@
+def return_arrays_in_expression():
+    def single_return():
+        from numpy import array
+        return array([1,2,3,4])
+    b = single_return()+1
+    return b
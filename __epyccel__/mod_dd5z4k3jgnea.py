@@ -0,0 +1,3 @@
+def sum_call(x : 'int[:]'):
+    from numpy import sum as np_sum
+    return np_sum(x)
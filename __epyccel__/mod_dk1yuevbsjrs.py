@@ -0,0 +1,2 @@
+def add(a : "float", b : "float"):
+    return a + b
@@ -0,0 +1,3 @@
+@template('T', [int, float])
+def my_tuple(a : 'tuple[T,...]'):
+    return len(a), a[0], a[1], a[2]
@@ -0,0 +1,5 @@
+def array_view_steps_C_2D_1(a : 'int[:,:]'):
+    from numpy import array
+    tmp = a[::2]
+    b = array(tmp)
+    return b
@@ -0,0 +1,5 @@
+@template('T', ['int8', 'int16', 'int32', 'int64', 'int', 'float32', 'float64', 'float', 'complex64', 'complex128'])
+def return_array_scalar_op(a : 'T'):
+    from numpy import ones, int8, int16, int32, int64, float32, float64, complex64, complex128 # pylint: disable=unused-import
+    x = ones(5, dtype=type(a))
+    return x * a
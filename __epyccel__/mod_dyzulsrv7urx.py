@@ -0,0 +1,2 @@
+def multi_return_vars_expr(a : 'int', b : 'int'):
+    return (a-b), (a+b)
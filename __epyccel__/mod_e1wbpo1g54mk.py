@@ -0,0 +1,3 @@
+def inhomogeneous_tuple_3():
+    ai = (0, 1.0, 3)
+    return ai[0], ai[1], ai[2]
@@ -0,0 +1,4 @@
+def atan_phrase(x : complex, y : complex):
+    from cmath import atan
+    a = atan(x)+atan(y)
+    return a
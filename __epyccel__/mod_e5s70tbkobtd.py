@@ -0,0 +1,5 @@
+def create_empty_like_val_float64():
+    from numpy import empty_like, float64, array
+    arr = array([5, 1, 8, 0, 9])
+    a = empty_like(arr,dtype=float64)
+    return a[0]
@@ -0,0 +1,5 @@
+def array_view_steps_F_2D_1(a : 'int[:,:](order=F)'):
+    from numpy import array
+    tmp = a[::2]
+    b = array(tmp, order="F")
+    return b
@@ -0,0 +1,4 @@
+@template('K', types=['complex'])
+@template('G', types=['int', 'float'])
+def default_var_2(x : 'G', y  : 'K' =  5j):
+    return x + y
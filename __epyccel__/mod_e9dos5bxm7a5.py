@@ -0,0 +1,5 @@
+def create_empty_like_1_val():
+    from numpy import empty_like, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = empty_like(arr, dtype=int,order='F')
+    return a[0,0]
@@ -0,0 +1,5 @@
+@template(name='T', types=['int32', 'int64', 'float32', 'float64', 'complex64', 'complex128'])
+@template(name='D', types=['int32', 'int64', 'float32', 'float64', 'complex64', 'complex128'])
+def add_numpy_to_numpy_type(np_s_l : 'T', np_s_r : 'D'):
+    rs = np_s_l + np_s_r
+    return rs
@@ -0,0 +1,2 @@
+def f10(x : 'int64[:]'):
+    x[:] += 1
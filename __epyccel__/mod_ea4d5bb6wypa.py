@@ -0,0 +1,4 @@
+def cos_phrase_i_r(x : 'int', y : 'float'):
+    from numpy import cos
+    a = cos(x)+cos(y)
+    return a
@@ -0,0 +1,3 @@
+def lgamma_call(x : 'float'):
+    from math import lgamma
+    return lgamma(x)
@@ -0,0 +1,3 @@
+def tuple_inhomogeneous_3():
+    a = tuple((0, 1.0, 3))
+    return a[0], a[1], a[2], len(a)
@@ -0,0 +1,2 @@
+def array_float_1d_scalar_sub(x : 'float[:]', a : 'float'):
+    x[:] -= a
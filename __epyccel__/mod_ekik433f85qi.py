@@ -0,0 +1,4 @@
+def lgamma_phrase(x : 'float', y : 'float'):
+    from math import lgamma
+    a = lgamma(x)+ lgamma(y)
+    return a
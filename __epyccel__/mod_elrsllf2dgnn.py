@@ -0,0 +1,8 @@
+def scalare_multi_return_stmts(a : 'int'):
+    a = 7
+    if a:
+        return 1
+    else:
+        return 2
+    a = 4
+    return a
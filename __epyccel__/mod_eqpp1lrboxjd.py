@@ -0,0 +1,5 @@
+@template('T', ['complex64', 'complex128'])
+def array_complex_2d_scalar_add(x : 'T[:,:]', a : 'T', d1 : int, d2 : int):
+    for i in range(d1):
+        for j in range(d2):
+            x[i, j] += a
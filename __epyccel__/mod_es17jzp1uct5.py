@@ -0,0 +1,4 @@
+def create_zeros_val_float32():
+    from numpy import zeros, float32
+    a = zeros(3,float32)
+    return a[0]
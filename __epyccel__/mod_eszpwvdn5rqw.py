@@ -0,0 +1,4 @@
+def log10_phrase(x : 'float', y : 'float'):
+    from math import log10
+    a = log10(x)+log10(y)
+    return a
@@ -0,0 +1,5 @@
+def get_max_threads():
+    from pyccel.stdlib.internal.openmp import omp_get_max_threads
+    max_threads = omp_get_max_threads()
+
+    return max_threads
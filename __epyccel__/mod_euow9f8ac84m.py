@@ -0,0 +1,2 @@
+def array_float_2d_2d_matmul_operator(A : 'float[:,:]', B : 'float[:,:]', out : 'float[:,:]'):
+    out[:,:] = A @ B
@@ -0,0 +1,4 @@
+def fabs_phrase(x : 'float', y : 'float'):
+    from math import fabs
+    a = fabs(x)*fabs(y)
+    return a
@@ -0,0 +1,4 @@
+def optional_var_4(x : 'complex | float', y : int = None):
+    if y is None:
+        return x
+    return x + y
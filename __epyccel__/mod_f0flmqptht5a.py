@@ -0,0 +1,3 @@
+def hypot_call(x : 'float', y : 'float'):
+    from math import hypot
+    return hypot(x, y)
@@ -0,0 +1,4 @@
+def tuple_homogeneous():
+    b = (10, 20, 30, 40)
+    a = tuple(b)
+    return a[0], a[1], a[2], a[3], len(a)
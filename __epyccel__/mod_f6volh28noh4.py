@@ -0,0 +1,3 @@
+def f16(a : 'int16'):
+    b = a
+    return b
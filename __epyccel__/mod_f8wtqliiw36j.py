@@ -0,0 +1,3 @@
+def arcsin_call_i(x : 'int'):
+    from numpy import arcsin
+    return arcsin(x)
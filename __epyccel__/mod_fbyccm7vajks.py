@@ -0,0 +1,4 @@
+def tuple_homogeneous_string():
+    a = tuple(('hello', 'tuple', 'world', '!!'))
+    i = 1
+    return a[0], a[i], a[2], a[3], len(a)
@@ -0,0 +1,4 @@
+def optional_var_3(x : 'int | float', y : float = None):
+    if y is None:
+        return x / 2.0
+    return x / y
@@ -0,0 +1,3 @@
+def numpy_isfinite_array_test(x : 'float[:]'):
+    from numpy import isfinite
+    return isfinite(x)
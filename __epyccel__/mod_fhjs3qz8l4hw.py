@@ -0,0 +1,5 @@
+@template('T', types=['int', 'int32'])
+def mix_types_3(x : 'T', y : 'T'):
+    if y != x:
+        return y - x
+    return -x
@@ -0,0 +1,5 @@
+def arrs_1d_negative_step_positive_step():
+    import numpy as np
+    a = np.ones(10)
+    b = a[1:-1: 3] + a[2::3]
+    return np.shape(b)[0], np.sum(b)
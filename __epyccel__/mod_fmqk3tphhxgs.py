@@ -0,0 +1,3 @@
+def f22(a : 'complex128'):
+    b = a
+    return b
@@ -0,0 +1,2 @@
+def tuple_unpacking_4(x : 'int[:,:]'):
+    x[:,0], x[0,:] = 2, 3
@@ -0,0 +1,6 @@
+def f1(x : 'int[:,:]'):
+    from numpy import transpose
+    y = transpose(x)
+    x[0,-1] += 22
+    n, m = y.shape
+    return n, m, y[-1,0], y[0,-1]
@@ -0,0 +1,9 @@
+def tuples_as_indexing_basic():
+    from numpy import ones
+    x = ones((2,3,2))
+    for z in range(2):
+        for y in range(3):
+            for w in range(2):
+                x[z,y,w] = w+y*2+z*6
+    idx = (1,1,0)
+    return x[idx]
@@ -0,0 +1,5 @@
+def create_full_1_shape():
+    from numpy import full, shape
+    a = full((2,1),4.0,int,'F')
+    s = shape(a)
+    return len(s),s[0],s[1]
@@ -0,0 +1,5 @@
+def create_zeros_1_shape():
+    from numpy import zeros, shape
+    a = zeros((2,1),int,'F')
+    s = shape(a)
+    return len(s),s[0],s[1]
@@ -0,0 +1,4 @@
+def test_omp_in_parallel1():
+    from pyccel.stdlib.internal.openmp import omp_in_parallel
+    in_parallel = omp_in_parallel()
+    return in_parallel
@@ -0,0 +1,3 @@
+def log10_call(x : 'float'):
+    from math import log10
+    return log10(x)
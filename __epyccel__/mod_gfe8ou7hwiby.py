@@ -0,0 +1,8 @@
+@stack_array('a')
+def array_float_1d_div_stack_array():
+    from numpy import ones
+    a = ones(10)
+    s = 0.
+    for i in range(10):
+        s += 1.0 / a[i]
+    return s
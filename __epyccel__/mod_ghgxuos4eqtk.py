@@ -0,0 +1,2 @@
+def array_float_2d_C_scalar_mod(x : 'float[:,:]', a : 'float'):
+    x[:,:] %= a
@@ -0,0 +1,4 @@
+def array_2d_C_slice_1(a : 'int[:,:]'):
+    import numpy as np
+    b = a[:]
+    return np.sum(b), b[0][0], b[-1][-1], len(b), len(b[0])
@@ -0,0 +1,3 @@
+def tan_call_r(x : 'float'):
+    from numpy import tan
+    return tan(x)
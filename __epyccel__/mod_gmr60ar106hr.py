@@ -0,0 +1,5 @@
+def divide_by(a : 'float[:]', b : 'float'):
+    if abs(b)<0.1:
+        return
+    for i,ai in enumerate(a):
+        a[i] = ai/b
@@ -0,0 +1,5 @@
+def create_full_like_1_val():
+    from numpy import full_like, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = full_like(arr, 4.0, int,'F')
+    return a[0,0]
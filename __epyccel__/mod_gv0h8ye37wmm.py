@@ -0,0 +1,5 @@
+def less_than_100(n : int):
+    for i in range(100):
+        if i > n:
+            return True
+    return False
@@ -0,0 +1,3 @@
+def acosh_call(x : 'float'):
+    from math import acosh
+    return acosh(x)
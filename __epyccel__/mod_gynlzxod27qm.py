@@ -0,0 +1,3 @@
+def max_call(x: 'bool[:]'):
+    from numpy import amax
+    return amax(x)
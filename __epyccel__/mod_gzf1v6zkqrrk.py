@@ -0,0 +1,3 @@
+def arctan_call_i(x : 'int'):
+    from numpy import arctan
+    return arctan(x)
@@ -0,0 +1,5 @@
+def f6_1(m1 : 'int', m2 : 'int', x : 'float [:,:]'):
+    x[:,:] = 0.
+    for i in range(0, m1):
+        for j in range(0, m2):
+            x[i,j] = (2*i+j) * 1.
@@ -0,0 +1,2 @@
+def f(a : 'int32', b : 'int32'):
+    return (a+b).conj()
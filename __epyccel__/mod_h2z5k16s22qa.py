@@ -0,0 +1,7 @@
+def f1(x : 'int[:,:]'):
+    from numpy import transpose, empty
+    n,m = x.shape
+    y = empty((m,n))
+    y[:,:] = transpose(x)
+    n, m = y.shape
+    return n, m, y[-1,0], y[0,-1]
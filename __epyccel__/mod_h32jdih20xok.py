@@ -0,0 +1,4 @@
+def sinh_phrase(x : complex, y : complex):
+    from cmath import sinh
+    a = sinh(x)+sinh(y)
+    return a
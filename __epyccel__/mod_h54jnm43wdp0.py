@@ -0,0 +1,3 @@
+def acos_call(x : 'float'):
+    from math import acos
+    return acos(x)
@@ -0,0 +1,4 @@
+def array_int32_in_bool_out_1d_complex_3d_expr(x : 'int32[:]', y : 'int32[:]', ri : 'bool[:]'):
+    from numpy import full, int32, empty
+    z = full(3,5, dtype=int32)
+    ri[:] = (x // y) * x > z
@@ -0,0 +1,4 @@
+@template('T', ['int[:]', 'float[:,:]', 'complex[:,:,:](order=F)'])
+def copy_array(a : 'T'):
+    b = a.copy()
+    return b
@@ -0,0 +1,3 @@
+def log_call_i(x : 'int'):
+    from numpy import log
+    return log(x)
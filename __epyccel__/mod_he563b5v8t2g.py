@@ -0,0 +1,4 @@
+def return_op_arr_arg_element(i: 'int', arg:'float[:]'):
+    import numpy as np
+    a = np.ones(i)
+    return ((a[2] + arg[0]) * arg[2] - 2) / 4 * 2
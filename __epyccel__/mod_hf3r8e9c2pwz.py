@@ -0,0 +1,3 @@
+def floor_call(x : 'int'):
+    from numpy import floor
+    return floor(x)
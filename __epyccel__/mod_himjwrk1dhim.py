@@ -0,0 +1,4 @@
+def fabs_phrase_r_i(x : 'int', y : 'float'):
+    from numpy import fabs
+    a = fabs(x)*fabs(y)
+    return a
@@ -0,0 +1,6 @@
+def return_arrays_in_expression2(n : int):
+    def single_return(n : int):
+        from numpy import ones
+        return ones(n)
+    b = single_return(n)+1
+    return b
@@ -0,0 +1,4 @@
+def acos_phrase(x : complex, y : complex):
+    from cmath import acos
+    a = acos(x)+acos(y)
+    return a
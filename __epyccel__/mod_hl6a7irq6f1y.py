@@ -0,0 +1,3 @@
+def call_degrees_i(x : 'int'):
+    from math import degrees
+    return degrees(x)
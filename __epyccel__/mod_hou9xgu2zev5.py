@@ -0,0 +1,3 @@
+def asinh_call(x : 'float'):
+    from math import asinh
+    return asinh(x)
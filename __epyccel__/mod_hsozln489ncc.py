@@ -0,0 +1,4 @@
+def create_ones_val_complex():
+    from numpy import ones
+    a = ones(3,complex)
+    return a[0]
@@ -0,0 +1,4 @@
+def create_zeros_val_int32():
+    from numpy import zeros, int32
+    a = zeros(3,int32)
+    return a[0]
@@ -0,0 +1,5 @@
+def create_array_list_shape():
+    from numpy import array, shape
+    a = array([[1,2,3],[4,5,6]])
+    s = shape(a)
+    return len(s), s[0], s[1]
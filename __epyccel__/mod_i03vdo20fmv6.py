@@ -0,0 +1,9 @@
+def omp_arraysum_single(x : 'int[:]'):
+    func_result = 0
+    #$ omp parallel
+    #$ omp single
+    for i in range(0, 10):
+        func_result += x[i]
+    #$ omp end single
+    #$ omp end parallel
+    return func_result
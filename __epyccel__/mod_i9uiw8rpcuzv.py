@@ -0,0 +1,5 @@
+def tuples_2d_sum():
+    a = ((1,2), (3,4))
+    b = a + ((5,6),)
+    i = 1
+    return b[0][0], b[0][i], b[1][0], b[i][i], b[2][0], b[2][1]
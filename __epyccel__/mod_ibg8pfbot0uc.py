@@ -0,0 +1,3 @@
+def test_size_axis_literal_3d(f: 'int[:,:,:]'):
+    from numpy import size
+    return size(f, 2)
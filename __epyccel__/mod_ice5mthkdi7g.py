@@ -0,0 +1,4 @@
+def asinh_phrase(x : complex, y : complex):
+    from cmath import asinh
+    a = asinh(x)+ asinh(y)
+    return a
@@ -0,0 +1,3 @@
+def p_func():
+    x = 2
+    x *= 2
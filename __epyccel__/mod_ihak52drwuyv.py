@@ -0,0 +1,4 @@
+def return_ambiguous_pointer_to_argument(x: 'int[:]'):
+    y = x
+    w = y
+    return w
@@ -0,0 +1,4 @@
+def tan_phrase(x : 'float', y : 'float'):
+    from math import tan
+    a = tan(x)+tan(y)
+    return a
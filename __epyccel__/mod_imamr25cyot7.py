@@ -0,0 +1,3 @@
+def sin_call_i(x : 'int'):
+    from numpy import sin
+    return sin(x)
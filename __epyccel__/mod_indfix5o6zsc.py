@@ -0,0 +1,3 @@
+def f19(a : 'int64'):
+    b = a
+    return b
@@ -0,0 +1,2 @@
+def copy_to_slice_4(a : 'float[:]', b : 'float[:]'):
+    a[::2] = b
@@ -0,0 +1,4 @@
+def acosh_phrase(x : complex, y : complex):
+    from cmath import acosh
+    a = acosh(x) + acosh(y)
+    return a
@@ -0,0 +1,3 @@
+def f21(a : 'complex64'):
+    b = a
+    return b
@@ -0,0 +1,6 @@
+def create_empty_like_1_shape():
+    from numpy import empty_like, shape, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = empty_like(arr,dtype=int,order='F')
+    s = shape(a)
+    return len(s),s[0],s[1]
@@ -0,0 +1,3 @@
+def isinf_call(x : 'float'):
+    from math import isinf
+    return isinf(x)
@@ -0,0 +1,4 @@
+def sinh_phrase(x : 'float', y : 'float'):
+    from numpy import sinh
+    a = sinh(x)+sinh(y)
+    return a
@@ -0,0 +1,4 @@
+def sinh_phrase(x : 'float', y : 'float'):
+    from math import sinh
+    a = sinh(x)+sinh(y)
+    return a
@@ -0,0 +1,5 @@
+def create_full_like_val(val : 'int'):
+    from numpy import full_like, array
+    arr = array([5, 1, 8, 0, 9])
+    a = full_like(arr, val, int, 'F')
+    return a[0],a[1],a[2]
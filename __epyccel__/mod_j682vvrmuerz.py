@@ -0,0 +1,3 @@
+def sin_call(x : complex):
+    from cmath import sin
+    return sin(x)
@@ -0,0 +1,10 @@
+def tuple_multi_indexing_1():
+    from numpy import ones
+    x = ones((2,3,2))
+    for z in range(2):
+        for y in range(3):
+            for w in range(2):
+                x[z,y,w] = w+y*2+z*6
+    idx = (1,1,0)
+    ai = x[idx,0,1]
+    return ai[0], ai[1], ai[2]
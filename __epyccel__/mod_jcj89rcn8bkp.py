@@ -0,0 +1,12 @@
+@stack_array('a')
+@stack_array('b', 'c')
+def multiple_2d_stack_array_2():
+    from numpy import ones, array
+    a = ones(5)
+    b = array([[2, 4, 6, 8, 10], [1, 3, 5, 7, 9]])
+    c = array([[1, 3, 5, 7, 9], [2, 4, 6, 8, 10]])
+    s = 0.0
+    for i in range(2):
+        for j in range(5):
+            s = s + b[i][j] - a[j] / c[i][j]
+    return s
@@ -0,0 +1,3 @@
+def sum_call(x : 'float[:]'):
+    from numpy import sum as np_sum
+    return np_sum(x)
@@ -0,0 +1,4 @@
+def sqrt_return_type_real(x : 'float'):
+    from math import sqrt
+    a = sqrt(x)
+    return a
@@ -0,0 +1,3 @@
+def atan_call(x : 'float'):
+    from math import atan
+    return atan(x)
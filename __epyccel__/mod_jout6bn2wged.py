@@ -0,0 +1,15 @@
+def omp_barrier():
+    from numpy import zeros
+    arr = zeros(1000, dtype=int)
+    func_result = 0
+    #$ omp parallel num_threads(3)
+    #$ omp for
+    for i in range(0, 1000):
+        arr[i] = i * 2
+
+    #$ omp barrier
+    #$ omp for reduction(+:func_result)
+    for i in range(0, 1000):
+        func_result = func_result + arr[i]
+    #$ omp end parallel
+    return func_result
@@ -0,0 +1,4 @@
+def create_ones_val_float():
+    from numpy import ones
+    a = ones(3,float)
+    return a[0]
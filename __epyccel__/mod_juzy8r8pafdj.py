@@ -0,0 +1,3 @@
+def f8(x : 'int', b : 'bool'):
+    a = x if b else 2
+    return a
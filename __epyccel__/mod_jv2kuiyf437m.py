@@ -0,0 +1,17 @@
+def test_omp_in_final():
+    from pyccel.stdlib.internal.openmp import omp_in_final
+    x = 20
+    z = 0
+    func_result = 0
+
+    #$ omp parallel
+    #$ omp single
+    #$ omp task final(i >= 10)
+    for i in range(x):
+        z = z + i
+        if omp_in_final() == 1:
+            func_result = 1
+    #$ omp end task
+    #$ omp end single
+    #$ omp end parallel
+    return func_result
@@ -0,0 +1,8 @@
+def omp_master():
+    func_result = 30
+    #$omp parallel num_threads(3) reduction(+:func_result)
+    #$omp master
+    func_result += 1
+    #$omp end master
+    #$omp end parallel
+    return func_result
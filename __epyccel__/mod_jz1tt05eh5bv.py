@@ -0,0 +1,3 @@
+def acos_call(x : complex):
+    from cmath import acos
+    return acos(x)
@@ -0,0 +1,3 @@
+def tanh_call_r(x : 'float'):
+    from numpy import tanh
+    return tanh(x)
@@ -0,0 +1,4 @@
+def create_zeros_val_float():
+    from numpy import zeros
+    a = zeros(3,float)
+    return a[0]
@@ -0,0 +1,2 @@
+def array_float_1d_idiv(x : 'float[:]', y : 'float[:]'):
+    x[:] = x // y
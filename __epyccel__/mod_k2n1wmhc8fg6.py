@@ -0,0 +1,2 @@
+def f(a : 'float', b : 'float'):
+    return (a+b).conjugate()
@@ -0,0 +1,4 @@
+def create_zeros_val_float64():
+    from numpy import zeros, float64
+    a = zeros(3,float64)
+    return a[0]
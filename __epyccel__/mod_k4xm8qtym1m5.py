@@ -0,0 +1,5 @@
+def create_empty_like_val_int32():
+    from numpy import empty_like, int32, array
+    arr = array([5, 1, 8, 0, 9])
+    a = empty_like(arr, dtype=int32)
+    return a[0]
@@ -0,0 +1,3 @@
+def arccos_call_r(x : 'float'):
+    from numpy import arccos
+    return arccos(x)
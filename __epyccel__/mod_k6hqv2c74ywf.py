@@ -0,0 +1,4 @@
+def arcsin_phrase(x : 'float', y : 'float'):
+    from numpy import arcsin
+    a = arcsin(x)+arcsin(y)
+    return a
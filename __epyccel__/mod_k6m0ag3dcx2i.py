@@ -0,0 +1,4 @@
+def f2(x : 'int[:,:,:]'):
+    y = (x*2).T*3
+    n, m, p = y.shape
+    return n, m, p, y[0,-1,0], y[0,0,-1], y[-1,-1,0]
@@ -0,0 +1,7 @@
+@template('T', ['int', 'int8', 'int16', 'int32', 'int64',
+                'float', 'float32', 'float64',
+                'complex64', 'complex128'])
+def return_f_array(b : 'T'):
+    from numpy import array
+    a = array([[1, 2, 3], [4, 5, 6]], dtype=type(b), order='F')
+    return a
@@ -0,0 +1,4 @@
+def create_ones_val_float64():
+    from numpy import ones, float64
+    a = ones(3,float64)
+    return a[0]
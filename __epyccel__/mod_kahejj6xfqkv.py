@@ -0,0 +1,4 @@
+def tuples_mul_inhomogeneous2():
+    a = (1,False)
+    b = 3*a
+    return b[0], b[1], b[2], b[3], b[4], b[5]
@@ -0,0 +1,3 @@
+def exp_call_r(x : 'float'):
+    from numpy import exp
+    return exp(x)
@@ -0,0 +1,5 @@
+def create_ones_shape_F(n : 'int', m : 'int'):
+    from numpy import ones, shape
+    a = ones((n,m), order = 'F')
+    s = shape(a)
+    return len(s),s[0], s[1]
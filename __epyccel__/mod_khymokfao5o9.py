@@ -0,0 +1,2 @@
+def array_int32_1d_add_augassign(x : 'int32[:]', y : 'int32[:]'):
+    x += y
@@ -0,0 +1,3 @@
+def ldexp_type(x : 'float', exp : 'int'):
+    from math import ldexp
+    return ldexp(x, exp)
@@ -0,0 +1,4 @@
+def create_ones_3_val():
+    from numpy import ones
+    a = ones(order = 'F', shape = (4,2),dtype=complex)
+    return a[0,0]
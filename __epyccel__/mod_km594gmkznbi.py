@@ -0,0 +1,3 @@
+def trunc_call(x : 'int'):
+    from math import trunc
+    return trunc((x))
@@ -0,0 +1,3 @@
+def inhomogeneous_tuple_1():
+    ai = (0, False, 3+1j)
+    return ai[0], ai[1], ai[2]
@@ -0,0 +1,3 @@
+def tuple_inhomogeneous_1():
+    a = tuple((0, False, 3 + 1j))
+    return a[0], a[1], a[2], len(a)
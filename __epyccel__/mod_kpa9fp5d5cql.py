@@ -0,0 +1,3 @@
+def call_degrees(x : 'float'):
+    from math import degrees
+    return degrees(x)
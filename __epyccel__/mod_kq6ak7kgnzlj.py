@@ -0,0 +1,2 @@
+def array_float_2d_F_sub(x : 'float[:,:](order=F)', y : 'float[:,:](order=F)'):
+    x[:,:] -= y
@@ -0,0 +1,5 @@
+def create_zeros_shape_C(n : 'int', m : 'int'):
+    from numpy import zeros, shape
+    a = zeros((n,m), order = 'C')
+    s = shape(a)
+    return len(s),s[0], s[1]
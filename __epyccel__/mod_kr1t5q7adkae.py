@@ -0,0 +1,5 @@
+def mult_on_array_float32():
+    from numpy import ones, float32
+    a = ones(5, dtype=float32)
+    b = a * 2
+    return b[0]
@@ -0,0 +1,3 @@
+def gamma_call(x : 'float'):
+    from math import gamma
+    return gamma(x)
@@ -0,0 +1,4 @@
+def fabs_return_type(x : 'int'):
+    from math import fabs
+    a = fabs(x)
+    return a
@@ -0,0 +1,3 @@
+def cosh_call_r(x : 'float'):
+    from numpy import cosh
+    return cosh(x)
@@ -0,0 +1,3 @@
+def call_lcm(x : int, y : int):
+    from math import lcm
+    return lcm(x, y)
@@ -0,0 +1,4 @@
+@template('T', ['int8', 'int16', 'int32', 'int64'])
+def array_int_1d_scalar_add(x : 'T[:]', a : 'T', x_len : int):
+    for i in range(x_len):
+        x[i] += a
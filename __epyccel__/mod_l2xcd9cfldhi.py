@@ -0,0 +1,5 @@
+def create_empty_like_val_int():
+    from numpy import empty_like, array
+    arr = array([5, 1, 8, 0, 9])
+    a = empty_like(arr, int)
+    return a[0]
@@ -0,0 +1,5 @@
+def create_zeros_like_val_int32():
+    from numpy import zeros_like, int32, array
+    arr = array([5, 1, 8, 0, 9])
+    a = zeros_like(arr,int32)
+    return a[0]
@@ -0,0 +1,3 @@
+def array_float_2d_2d_matmul_mixorder(A : 'float[:,:]', B : 'float[:,:](order=F)', out : 'float[:,:]'):
+    from numpy import matmul
+    out[:,:] = matmul(A, B)
@@ -0,0 +1,4 @@
+def copysign_return_type(x : 'float', y : 'int'):
+    from math import copysign
+    a = copysign(x, y)
+    return a
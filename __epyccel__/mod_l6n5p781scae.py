@@ -0,0 +1,3 @@
+def fabs_call_r(x : 'float'):
+    from numpy import fabs
+    return fabs(x)
@@ -0,0 +1,4 @@
+def create_zeros_val_int():
+    from numpy import zeros
+    a = zeros(3,int)
+    return a[0]
@@ -0,0 +1,4 @@
+def create_zeros_val_complex():
+    from numpy import zeros
+    a = zeros(3,complex)
+    return a[0]
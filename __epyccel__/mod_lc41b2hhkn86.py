@@ -0,0 +1,5 @@
+@template('T', ['int8[:]', 'int16[:]', 'int32[:]', 'int64[:]', 'int[:]', 'float32[:]', 'float64[:]', 'float[:]', 'complex64[:]', 'complex128[:]'])
+def return_array_arg_array_op(a : 'T'):
+    from numpy import ones
+    x = ones(7)
+    return x * a
@@ -0,0 +1,9 @@
+def fizzbuzz_sum_with_continue(fizz : int, buzz : int, max_val : int):
+    fizzbuzz_sum = 0
+    for i in range(1,max_val+1):
+        if i%fizz != 0:
+            continue
+        if i%buzz != 0:
+            continue
+        fizzbuzz_sum += i
+    return fizzbuzz_sum
@@ -0,0 +1,4 @@
+def log_phrase(x : 'float', y : 'float'):
+    from numpy import log
+    a = log(x)+log(y)
+    return a
@@ -0,0 +1,5 @@
+def create_empty_2_shape():
+    from numpy import empty, shape
+    a = empty((4,2),dtype=float)
+    s = shape(a)
+    return len(s),s[0],s[1]
@@ -0,0 +1,4 @@
+def fabs_phrase_r_r(x : 'float', y : 'float'):
+    from numpy import fabs
+    a = fabs(x)*fabs(y)
+    return a
@@ -0,0 +1,10 @@
+@allow_negative_index('a', 'b')
+def test_multiple_negative_index_2(c : 'int', d : 'int'):
+    import numpy as np
+    a = np.array([1.2, 2.2, 3.2, 4.2])
+    b = np.array([1, 5, 9, 13])
+
+    x = a[c] * d
+    y = b[d] * c
+
+    return x, y
@@ -0,0 +1,4 @@
+def arctan_phrase(x : 'float', y : 'float'):
+    from numpy import arctan
+    a = arctan(x)+arctan(y)
+    return a
@@ -0,0 +1,4 @@
+def create_full_1_val():
+    from numpy import full
+    a = full((2,1),4.0,int,'F')
+    return a[0,0]
@@ -0,0 +1,3 @@
+def tan_call(x : complex):
+    from cmath import tan
+    return tan(x)
@@ -0,0 +1,4 @@
+def create_zeros_1_val():
+    from numpy import zeros
+    a = zeros((2,1),int,'F')
+    return a[0,0]
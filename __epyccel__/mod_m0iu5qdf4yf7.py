@@ -0,0 +1,5 @@
+def factorial(n : int):
+    x = 1
+    for i in range( 2, n+1 ):
+        x *= i
+    return x
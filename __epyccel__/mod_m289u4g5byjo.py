@@ -0,0 +1,5 @@
+def create_zeros_shape_1d(n : 'int'):
+    from numpy import zeros, shape
+    a = zeros(n)
+    s = shape(a)
+    return len(s),s[0]
@@ -0,0 +1,3 @@
+def absolute_call_r(x : 'float'):
+    from numpy import absolute
+    return absolute(x)
@@ -0,0 +1,13 @@
+def homogeneous_tuple_of_arrays():
+    from numpy import array, empty
+    x = array(((1,2), (3,4)), order='F')
+    y = array(((5,4), (7,8)), order='F')
+    z = array(((9,10), (11,12)), order='F')
+    a = (x, y, z)
+    b = empty((3,2,2))
+    for j in range(2):
+        for k in range(2):
+            b[0,j,k] = a[0][j,k]
+            b[1,j,k] = a[1][j,k]
+            b[2,j,k] = a[2][j,k]
+    return b
@@ -0,0 +1,4 @@
+def absolute_phrase_r_i(x : 'float', y : 'int'):
+    from numpy import absolute
+    a = absolute(x)*absolute(y)
+    return a
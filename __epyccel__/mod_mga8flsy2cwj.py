@@ -0,0 +1,3 @@
+@template(types=['int', 'float'], name = 'Z')
+def tmplt_2(x : 'Z', y : 'Z'):
+    return x + y
@@ -0,0 +1,5 @@
+def create_empty_like_val_complex128():
+    from numpy import empty_like, complex128, array
+    arr = array([5, 1, 8, 0, 9])
+    a = empty_like(arr,dtype=complex128)
+    return a[0]
@@ -0,0 +1,4 @@
+def atan2_phrase(x : 'float', y : 'float', z : 'float'):
+    from math import atan2
+    a = atan2(x, y)+atan2(y, z)
+    return a
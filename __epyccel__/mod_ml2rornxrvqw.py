@@ -0,0 +1,2 @@
+def test_size_2d(f: 'int[:,:]'):
+    return f.size
@@ -0,0 +1,9 @@
+def omp_matmul_single(A : 'float[:,:]', x : 'float[:,:]', out : 'float[:,:]'):
+    from numpy import matmul
+    #$ omp parallel
+    #$ omp single
+    out[:] = matmul(A, x)
+    #$ omp end single
+    #$ omp end parallel
+    #to let the function compile using epyccel issue #468
+    "bypass issue #468" # pylint: disable=W0105
@@ -0,0 +1,4 @@
+def create_full_arg_names(val : 'float'):
+    from numpy import full
+    a = full(fill_value = val, shape = (2,3))
+    return a[0,0],a[0,1],a[0,2],a[1,0],a[1,1],a[1,2]
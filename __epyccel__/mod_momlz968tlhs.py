@@ -0,0 +1,4 @@
+def exp_phrase_i_r(x : 'int', y : 'float'):
+    from numpy import exp
+    a = exp(x)+exp(y)
+    return a
@@ -0,0 +1,3 @@
+def tanh_call_i(x : 'int'):
+    from numpy import tanh
+    return tanh(x)
@@ -0,0 +1,5 @@
+def create_full_shape_C(n : 'int', m : 'int'):
+    from numpy import full, shape
+    a = full((n,m),4, order = 'C')
+    s = shape(a)
+    return len(s),s[0], s[1]
@@ -0,0 +1,2 @@
+def sqrt_step1(a : 'float[:]', b : 'float[:]', t : 'float[:]'):
+    t[:] = a * b
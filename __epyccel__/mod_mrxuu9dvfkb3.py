@@ -0,0 +1,2 @@
+def g(x : 'int', y : 'int'):
+    return x,y,y,y,x
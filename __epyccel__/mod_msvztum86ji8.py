@@ -0,0 +1,3 @@
+def arctan2_call(x : 'float', y : 'float'):
+    from numpy import arctan2
+    return arctan2(x,y)
@@ -0,0 +1,3 @@
+@template('T', types=['int[:]', 'int32[:]', 'int64[:]'])
+def mix_int_array_2(x : 'T', a : 'int'):
+    x[:] += a
@@ -0,0 +1,4 @@
+def create_full_val(val : 'float'):
+    from numpy import full
+    a = full(3,val)
+    return a[0],a[1],a[2]
@@ -0,0 +1,4 @@
+def test_omp_number_of_procs():
+    from pyccel.stdlib.internal.openmp import omp_get_num_procs
+    procs_num = omp_get_num_procs()
+    return procs_num
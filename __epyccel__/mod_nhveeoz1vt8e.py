@@ -0,0 +1,3 @@
+def numpy_isinf_array_test(x : 'float[:]'):
+    from numpy import isinf
+    return isinf(x)
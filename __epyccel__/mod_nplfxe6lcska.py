@@ -0,0 +1,4 @@
+def homogeneous_tuple_math():
+    ai = (4+5,3*9, 2**3)
+    i = 1
+    return ai[0], ai[i], ai[2]
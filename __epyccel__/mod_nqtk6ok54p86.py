@@ -0,0 +1,8 @@
+def test_linspace2(start : 'int[:,:]', stop : 'int[:,:]', out : 'float[:,:,:]', endpoint : 'bool'):
+    from numpy import linspace
+    numberOfSamplesToGenerate = 7
+    a = linspace(start, stop, numberOfSamplesToGenerate, endpoint=endpoint)
+    for i in range(len(out)):
+        for j in range(len(out[i])):
+            for k in range(len(out[i][j])):
+                out[i][j][k] = a[i][j][k]
@@ -0,0 +1,4 @@
+def tan_phrase_r_i(x : 'float', y : 'int'):
+    from numpy import tan
+    a = tan(x)+tan(y)
+    return a
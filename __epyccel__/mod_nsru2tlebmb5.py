@@ -0,0 +1,3 @@
+@template('T', types=['float[:]', 'float32[:]'])
+def mix_float_array_1(x : 'T', a : 'float'):
+    x[:] *= a
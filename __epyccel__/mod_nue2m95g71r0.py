@@ -0,0 +1,4 @@
+def array_int32_2d_F_complex_3d_expr(x : 'int32[:,:](order=F)', y : 'int32[:,:](order=F)'):
+    from numpy import full, int32
+    z = full((2,3),5,order='F', dtype=int32)
+    x[:] = (x // y) * x + z
@@ -0,0 +1,2 @@
+def array_int_1d_idiv(x : 'int[:]', y : 'int[:]'):
+    x[:] = x // y
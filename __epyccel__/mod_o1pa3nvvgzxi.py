@@ -0,0 +1,2 @@
+def my_tuple(a : 'tuple[tuple[int,...],...]'):
+    return len(a), len(a[0]), a[0][0], a[1][0], a[0][1], a[1][1]
@@ -0,0 +1,4 @@
+def tuple_homogeneous_bool():
+    a = tuple((False, True))
+    i = 1
+    return a[0], a[i], len(a)
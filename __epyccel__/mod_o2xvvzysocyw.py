@@ -0,0 +1,3 @@
+def allow_negative_index_annotation():
+    a = [1,2,3,4]
+    return a[-1], a[-2], a[-3], a[0]
@@ -0,0 +1,4 @@
+def return_mult_arr_arg_element(i: 'int', arg:'float[:]'):
+    import numpy as np
+    a = np.ones(i)
+    return a[0] * arg[0]
@@ -0,0 +1,16 @@
+def array_kwargs_full():
+    """ full(shape, fill_value, dtype=None, order='C')
+    """
+
+    from numpy import sum as np_sum
+    from numpy import full
+
+    n = 3
+
+    a = full((n, n-1), 0.5, 'float', 'C')
+    b = full((n+1, 2*n), 2.0, order='F')
+    c = full((1, n), 3)
+    d = full(2+n, order='F', fill_value=5)
+    e = full(dtype=int, fill_value=1.0, shape=2*n)
+
+    return np_sum(a) + np_sum(b) + np_sum(c) + np_sum(d) + np_sum(e)
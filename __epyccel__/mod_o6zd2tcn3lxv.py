@@ -0,0 +1,5 @@
+def mult_on_array_int16():
+    from numpy import ones, int16
+    a = ones(5, dtype=int16)
+    b = a * 2
+    return b[0]
@@ -0,0 +1,4 @@
+def create_full_val_real_int32(val : 'float'):
+    from numpy import full, int32
+    a = full(3,val,int32)
+    return a[0]
@@ -0,0 +1,3 @@
+def test_shape_1d(f : 'int[:]'):
+    from numpy import shape
+    return shape(f)[0]
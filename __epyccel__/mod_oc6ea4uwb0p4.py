@@ -0,0 +1,3 @@
+def absolute_call_i(x : 'int'):
+    from numpy import absolute
+    return absolute(x)
@@ -0,0 +1,7 @@
+def f3(x : 'int[:,:,:]'):
+    from numpy import transpose, ones
+    n, m, p = x.shape
+    y = ones((p,m,n))
+    z = transpose(x)+y
+    n, m, p = z.shape
+    return n, m, p, z[0,-1,0], z[0,0,-1], z[-1,-1,0]
@@ -0,0 +1,4 @@
+def array_int_2d_F_initialization(a : 'int[:,:](order=F)'):
+    from numpy import array
+    tmp = array([[1, 2, 3], [4, 5, 6]], dtype='int', order='F')
+    a[:,:] = tmp[:,:]
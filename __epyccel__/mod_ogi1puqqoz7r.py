@@ -0,0 +1,3 @@
+def exp_call(x : complex):
+    from cmath import exp
+    return exp(x)
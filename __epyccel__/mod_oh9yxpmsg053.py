@@ -0,0 +1,4 @@
+def erf_phrase(x : 'float', y : 'float'):
+    from math import erf
+    a = erf(x)+ erf(y)
+    return a
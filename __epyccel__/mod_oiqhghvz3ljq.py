@@ -0,0 +1,2 @@
+def test_shape_1d(f : 'int[:]'):
+    return f.shape[0]
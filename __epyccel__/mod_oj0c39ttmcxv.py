@@ -0,0 +1,4 @@
+def arccos_phrase(x : 'float', y : 'float'):
+    from numpy import arccos
+    a = arccos(x)+arccos(y)
+    return a
@@ -0,0 +1,3 @@
+def call_gcd(x : int, y : int):
+    from math import gcd
+    return gcd(x, y)
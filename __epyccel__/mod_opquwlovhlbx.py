@@ -0,0 +1,5 @@
+def create_ones_like_1_val():
+    from numpy import ones_like, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = ones_like(arr,int,'F')
+    return a[0,0]
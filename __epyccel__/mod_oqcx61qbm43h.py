@@ -0,0 +1,4 @@
+def sqrt_phrase(x : complex, y : complex):
+    from cmath import sqrt
+    a = sqrt(x)*sqrt(y)
+    return a
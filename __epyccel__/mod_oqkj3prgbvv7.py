@@ -0,0 +1,3 @@
+def numpy_isfinite_expr_test(x : 'float', y : 'float'):
+    from numpy import isfinite
+    return isfinite(x+y)
@@ -0,0 +1,6 @@
+def create_full_like_shape_1d(n : 'float'):
+    from numpy import full_like, shape, array
+    arr = array([5, 1, 8, 0, 9])
+    a = full_like(arr, n, float, 'F')
+    s = shape(a)
+    return len(s),s[0]
@@ -0,0 +1,5 @@
+def create_zeros_like_val_float64():
+    from numpy import zeros_like, float64, array
+    arr = array([5, 1, 8, 0, 9])
+    a = zeros_like(arr,float64)
+    return a[0]
@@ -0,0 +1,3 @@
+def sqrt_call(x : 'float'):
+    from numpy import sqrt
+    return sqrt(x)
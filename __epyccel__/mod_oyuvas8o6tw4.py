@@ -0,0 +1,7 @@
+def enumerate_on_1d_array_with_start(z : 'int[:]', k : 'int'):
+
+    res = 0
+    for i,v in enumerate( z, k ):
+        res += v*i
+
+    return res
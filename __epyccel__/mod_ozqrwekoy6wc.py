@@ -0,0 +1,3 @@
+def trunc_call(x : 'float'):
+    from math import trunc
+    return trunc(x)
@@ -0,0 +1,5 @@
+def create_array_tuple_ref(a : 'int[:,:]'):
+    from numpy import array
+    b = (a[0,:], a[1,:])
+    c = array(b)
+    return c
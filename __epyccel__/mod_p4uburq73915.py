@@ -0,0 +1,4 @@
+def absolute_phrase_i_r(x : 'int', y : 'float'):
+    from numpy import absolute
+    a = absolute(x)*absolute(y)
+    return a
@@ -0,0 +1,4 @@
+@template('K', types=['int'])
+@template('G', types=['int', 'float'])
+def default_var_1(x : 'G', y  : 'K' =  5):
+    return x + y
@@ -0,0 +1,7 @@
+def arrs_uncertain_shape_1():
+    import numpy as np
+    i = 4
+    j = 6
+    a = np.zeros(10)
+    b = a[2:i]+a[4:j]
+    return np.shape(b)[0]
@@ -0,0 +1,3 @@
+def call_radians(x : 'float'):
+    from math import radians
+    return radians(x)
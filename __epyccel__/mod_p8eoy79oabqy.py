@@ -0,0 +1,5 @@
+def create_full_like_val_real_float64_auto(val : 'float'):
+    from numpy import full_like, float64, array
+    arr = array([5, 1, 8, 0, 9], float64)
+    a = full_like(arr,val)
+    return a[0]
@@ -0,0 +1,6 @@
+def array_copy_is_pointer():
+    from numpy import array, shape
+    a = array([1, 2, 3, 4])
+    b = a
+    a[2] = 9
+    return b[0], b[1], b[2], b[3], shape(b)[0]
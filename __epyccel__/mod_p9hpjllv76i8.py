@@ -0,0 +1,3 @@
+def tuple_homogeneous_return():
+    ai = (7.5, 4.2, 8)
+    return ai
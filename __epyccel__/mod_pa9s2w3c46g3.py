@@ -0,0 +1,5 @@
+
+def array_float_2d_2d_matmul_F_F(A : 'float[::,::](order=F)', B : 'float[::,::](order=F)', out : 'float[::,::](order=F)'):
+    from numpy import matmul
+    out[::,::] = matmul(A, B)
+
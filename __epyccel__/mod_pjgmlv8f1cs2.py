@@ -0,0 +1,5 @@
+def create_ones_2_shape():
+    from numpy import ones, shape
+    a = ones((4,2),dtype=float)
+    s = shape(a)
+    return len(s),s[0],s[1]
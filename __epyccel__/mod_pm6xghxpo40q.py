@@ -0,0 +1,10 @@
+def map_on_1d_array(z : 'int[:]'):
+
+    def f(x : int):
+        return x+5
+
+    res = 0
+    for v in map( f, z ):
+        res *= v
+
+    return res
@@ -0,0 +1,3 @@
+def min_call(x: 'complex128[:]'):
+    from numpy import amin
+    return amin(x)
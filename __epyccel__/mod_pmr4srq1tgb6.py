@@ -0,0 +1,5 @@
+def array_view_steps_F_1D_2(a : 'int[:](order=F)'):
+    from numpy import array
+    tmp = a[1:10:2]
+    b = array(tmp, order="F")
+    return b
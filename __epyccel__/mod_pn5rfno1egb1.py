@@ -0,0 +1,4 @@
+def cos_phrase(x : 'float', y : 'float'):
+    from math import cos
+    a = cos(x)+cos(y)
+    return a
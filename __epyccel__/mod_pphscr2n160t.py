@@ -0,0 +1,5 @@
+def mult_on_array_int32():
+    from numpy import ones, int32
+    a = ones(5, dtype=int32)
+    b = a * 2
+    return b[0]
@@ -0,0 +1,3 @@
+@template('T', types=['int', 'int32', 'int8', 'int16', 'int64'])
+def int_types(x : 'T', y : 'T'):
+    return x + y
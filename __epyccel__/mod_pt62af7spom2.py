@@ -0,0 +1,4 @@
+def tuple_visitation_homogeneous():
+    ai = (1,5, 4)
+    for a in ai:
+        print(a)
@@ -0,0 +1,5 @@
+def create_empty_like_val_complex128_auto():
+    from numpy import empty_like, array, complex128
+    arr = array([5, 1, 8, 0, 9], dtype=complex128)
+    a = empty_like(arr)
+    return a[0]
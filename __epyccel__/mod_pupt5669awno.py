@@ -0,0 +1,6 @@
+@template('T', ['bool[:]', 'int[:]', 'int8[:]', 'int16[:]', 'int32[:]', 'int64[:]',
+                'float[:]', 'float32[:]', 'float64[:]'])
+def func(a : 'T'):
+    from numpy import zeros
+    b = zeros(5, dtype=a.dtype)
+    return b[0]
@@ -0,0 +1,4 @@
+def create_array_tuple_val():
+    from numpy import array
+    a = array(((1,2,3),(4,5,6)))
+    return a[0,0]
@@ -0,0 +1,9 @@
+def test_linspace_type(start : 'int', end : 'int', result : 'int64[:]'):
+    from numpy import linspace
+    import numpy as np
+    x = linspace(start + 4, end, 15, dtype=np.int64)
+    ret = 1
+    for i in range(len(x)):
+        if x[i] != result[i]:
+            ret = 0
+    return ret, x[int(len(x) / 2)]
@@ -0,0 +1,4 @@
+def create_ones_val_complex128():
+    from numpy import ones, complex128
+    a = ones(3,complex128)
+    return a[0]
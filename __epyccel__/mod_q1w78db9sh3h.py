@@ -0,0 +1,2 @@
+def my_tuple(a : 'tuple[bool,...]'):
+    return len(a), a[0], a[1], a[2]
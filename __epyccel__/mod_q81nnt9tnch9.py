@@ -0,0 +1,3 @@
+def atanh_call(x : complex):
+    from cmath import atanh
+    return atanh(x)
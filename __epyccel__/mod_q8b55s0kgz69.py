@@ -0,0 +1,3 @@
+@template('T', types=['complex', 'complex64', 'complex128'])
+def complex_types(x : 'T', y : 'T'):
+    return x + y
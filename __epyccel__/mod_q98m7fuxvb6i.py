@@ -0,0 +1,4 @@
+def exp_phrase_i_i(x : 'int', y : 'int'):
+    from numpy import exp
+    a = exp(x)+exp(y)
+    return a
@@ -0,0 +1,3 @@
+def f1():
+    from numpy import pi
+    return pi
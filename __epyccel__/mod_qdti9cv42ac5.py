@@ -0,0 +1,4 @@
+def cos_phrase_i_i(x : 'int', y : 'int'):
+    from numpy import cos
+    a = cos(x)+cos(y)
+    return a
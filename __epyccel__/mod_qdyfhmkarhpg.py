@@ -0,0 +1,5 @@
+def create_full_like_val_real_float32_auto(val : 'float'):
+    from numpy import full_like, float32, array
+    arr = array([5, 1, 8, 0, 9], float32)
+    a = full_like(arr,val)
+    return a[0]
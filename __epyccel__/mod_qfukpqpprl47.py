@@ -0,0 +1,6 @@
+@template('K', types=['bool'])
+@template('G', types=['int', 'float'])
+def default_var_3(x : 'G', y  : 'K' =  False):
+    if y is True:
+        return x
+    return x - 1
@@ -0,0 +1,4 @@
+def log1p_phrase(x : 'float', y : 'float'):
+    from math import log1p
+    a = log1p(x)+log1p(y)
+    return a
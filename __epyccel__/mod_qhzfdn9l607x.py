@@ -0,0 +1,7 @@
+def test_omp_get_ancestor_thread_num():
+    from pyccel.stdlib.internal.openmp import omp_get_ancestor_thread_num, omp_get_active_level
+    #$ omp parallel
+    active_level = omp_get_active_level()
+    ancestor_thread = omp_get_ancestor_thread_num(active_level)
+    #$ omp end parallel
+    return ancestor_thread
@@ -0,0 +1,12 @@
+def directive_in_else(x : int):
+    func_result = 0
+    if x < 30:
+        return x
+    else:
+        #$ omp parallel
+        #$ omp for reduction(+:func_result)
+        for i in range(x):
+            func_result = func_result + i
+        #$ omp end parallel
+
+    return func_result
@@ -0,0 +1,9 @@
+def double_loop_on_2d_array_F(z : 'int[:,:](order=F)'):
+
+    from numpy import shape
+
+    m, n = shape( z )
+
+    for i in range( m ):
+        for j in range( n ):
+            z[i,j] = i-j
@@ -0,0 +1,5 @@
+def f4(x : 'float [:,:]'):
+    from numpy import empty_like
+    y = empty_like(x)
+    y[:] = x - 1.0
+    return y
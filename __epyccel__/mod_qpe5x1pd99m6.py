@@ -0,0 +1,2 @@
+def array_int_2d_C_scalar_idiv(x : 'int[:,:]', a : 'int'):
+    x[:,:] = x // a
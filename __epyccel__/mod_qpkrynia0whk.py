@@ -0,0 +1,4 @@
+def get_complex64():
+    from numpy import complex64
+    compl = complex64(3+4j)
+    return compl, compl.real, compl.imag
@@ -0,0 +1,3 @@
+def tuple_slice():
+    a,b = (1,2,3)[:2]
+    return a,b
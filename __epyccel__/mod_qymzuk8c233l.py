@@ -0,0 +1,6 @@
+def create_ones_like_shape_2d(n : 'int'):
+    from numpy import ones_like, shape, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = ones_like(arr)
+    s = shape(a)
+    return len(s),s[0], s[1]
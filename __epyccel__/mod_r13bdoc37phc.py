@@ -0,0 +1,3 @@
+def arr_tuple_slice_index(a : 'int[:,:]'):
+    r = a[(0,1,3),1:]
+    return r
@@ -0,0 +1,5 @@
+def create_empty_1_shape():
+    from numpy import empty, shape
+    a = empty((2,1),int,'F')
+    s = shape(a)
+    return len(s),s[0],s[1]
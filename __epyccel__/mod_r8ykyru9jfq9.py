@@ -0,0 +1,6 @@
+def tuple_indexing_basic():
+    ai = (1,2,3,4)
+    z = 0
+    for i in range(4):
+        z += ai[i]
+    return z
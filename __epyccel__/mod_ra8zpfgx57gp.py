@@ -0,0 +1,2 @@
+def array_int_1d_sub(x : 'int[:]', y : 'int[:]'):
+    x[:] -= y
@@ -0,0 +1,3 @@
+def tuple_unpacking_2():
+    a,b,c = 1,False,3.5
+    return a,b,c
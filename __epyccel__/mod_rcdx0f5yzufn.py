@@ -0,0 +1,7 @@
+def tuples_homogeneous_have_pointers():
+    from numpy import zeros
+    a = zeros(2)
+    b = zeros(2)
+    c = (a,b)
+    a[1] = 4
+    return c[0][0], c[0][1], c[1][0], c[1][1]
@@ -0,0 +1,5 @@
+def create_zeros_like_val_float32_auto():
+    from numpy import zeros_like, array, float32
+    arr = array([5, 1, 8, 0, 9], dtype='float32')
+    a = zeros_like(arr)
+    return a[0]
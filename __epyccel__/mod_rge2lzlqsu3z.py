@@ -0,0 +1,3 @@
+def min_call(x : 'float[:]'):
+    from numpy import amin
+    return amin(x)
@@ -0,0 +1,14 @@
+def f(n : int):
+    import numpy as np
+    a = np.zeros((n, n))
+    for i in range(n):
+        for j in range(n):
+            a[i, j] = i * n + j
+    b = a[1:, :]
+    c = a.T
+    d = a[:, 1]
+    e = a[1, 1:]
+    s = 0.0
+    for i in range(n-1):
+        s += b[i, 2] + c[i, 1] + d[i] + e[i]
+    return s
@@ -0,0 +1,4 @@
+def atanh_phrase(x : 'float', y : 'float'):
+    from math import atanh
+    a = atanh(x)+ atanh(y)
+    return a
@@ -0,0 +1,3 @@
+def fabs_call(x : 'float'):
+    from math import fabs
+    return fabs(x)
@@ -0,0 +1,8 @@
+def test_omp_get_level():
+    from pyccel.stdlib.internal.openmp import omp_get_level
+    #$ omp parallel
+    #$ omp parallel
+    nested_parallel_regions = omp_get_level()
+    #$ omp end parallel
+    #$ omp end parallel
+    return nested_parallel_regions
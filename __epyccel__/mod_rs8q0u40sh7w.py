@@ -0,0 +1,3 @@
+def isnan_call(x : 'float'):
+    from math import isnan
+    return isnan(x)
@@ -0,0 +1,2 @@
+def tuple_unpacking_3(x : 'int[:,:]'):
+    x[0,0], x[1,0] = 2, 2
@@ -0,0 +1,5 @@
+def arrs_similar_shapes_0():
+    import numpy as np
+    a = np.zeros(10)
+    b = a[2:4]+a[4:6]
+    return np.shape(b)[0]
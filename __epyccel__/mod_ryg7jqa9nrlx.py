@@ -0,0 +1,4 @@
+def tuple_variable_index():
+    a = 1
+    b = (1,2,3)[a]
+    return b
@@ -0,0 +1,3 @@
+def tan_call_i(x : 'int'):
+    from numpy import tan
+    return tan(x)
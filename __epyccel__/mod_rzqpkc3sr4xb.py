@@ -0,0 +1,4 @@
+def polar_call(x : complex):
+    from cmath import polar
+    r,t = polar(x)
+    return r, t
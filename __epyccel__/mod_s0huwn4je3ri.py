@@ -0,0 +1,4 @@
+def cos_phrase_r_i(x : 'float', y : 'int'):
+    from numpy import cos
+    a = cos(x)+cos(y)
+    return a
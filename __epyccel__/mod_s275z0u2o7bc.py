@@ -0,0 +1,4 @@
+@template('T', [complex, float])
+def isnan_call(x : 'T'):
+    from cmath import isnan
+    return isnan(x)
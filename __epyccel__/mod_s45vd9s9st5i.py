@@ -0,0 +1,12 @@
+def product_loop_on_2d_array_C(z : 'int[:,:](order=C)'):
+
+    from numpy     import shape
+    from itertools import product
+
+    m, n = shape( z )
+
+    x = [i for i in range(m)]
+    y = [j for j in range(n)]
+
+    for i,j in product( x, y ):
+        z[i,j] = i-j
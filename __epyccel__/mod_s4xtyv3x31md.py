@@ -0,0 +1,5 @@
+@template('T', ['bool', 'int', 'int8', 'int16', 'int32', 'int64', 'float', 'float32', 'float64'])
+def get_double(a : 'T'):
+    from numpy import double
+    b = double(a)
+    return b
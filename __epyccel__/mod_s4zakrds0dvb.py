@@ -0,0 +1,3 @@
+@template('T', types=['int64[:]', 'float[:]', 'complex[:]'])
+def mix_array_scalar(x : 'T'):
+    x[:] += 1
@@ -0,0 +1,4 @@
+def test_shape_1d(f : 'bool[:]'):
+    from numpy import shape
+    b = shape(f)
+    return b[0]
@@ -0,0 +1,5 @@
+def expr_arrs_elements(i : int):
+    import numpy as np
+    a = np.ones(i)
+    b = np.zeros(i)
+    return a[i - 1]+b[i - 1]
@@ -0,0 +1,5 @@
+def tuples_mul_inhomogeneous_2d():
+    a= ((1,False), (3.0,False), (True,6))
+    b = a*2
+    return b[0][0], b[0][1], b[1][0], b[1][1], b[2][0], b[2][1], \
+            b[3][0], b[3][1], b[4][0], b[4][1], b[5][0], b[5][1]
@@ -0,0 +1,4 @@
+def value_types():
+    import numpy as np
+    b = np.zeros(5, dtype=np.result_type(3.0, -2))
+    return b[0]
@@ -0,0 +1,3 @@
+def exp_call(x : 'float'):
+    from math import exp
+    return exp(x)
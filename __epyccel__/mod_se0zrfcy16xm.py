@@ -0,0 +1,3 @@
+def numpy_isnan_array_test(x : 'float[:]'):
+    from numpy import isnan
+    return isnan(x)
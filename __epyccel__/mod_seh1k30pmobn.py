@@ -0,0 +1,4 @@
+def exp_phrase(x : complex, y : complex):
+    from cmath import exp
+    a = exp(x)+exp(y)
+    return a
@@ -0,0 +1,4 @@
+def asin_phrase(x : complex, y : complex):
+    from cmath import asin
+    a = asin(x)+asin(y)
+    return a
@@ -0,0 +1,3 @@
+def max_call(x : 'float[:]'):
+    from numpy import amax
+    return amax(x)
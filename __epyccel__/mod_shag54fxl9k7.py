@@ -0,0 +1,5 @@
+
+def array_float_2d_1d_matmul_order_F(A : 'float[::,::](order=F)', x : 'float[::]', out : 'float[::]'):
+    from numpy import matmul
+    out[::] = matmul(A, x)
+
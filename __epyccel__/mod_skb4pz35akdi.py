@@ -0,0 +1,3 @@
+def cosh_call(x : 'float'):
+    from math import cosh
+    return cosh(x)
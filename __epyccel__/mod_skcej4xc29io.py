@@ -0,0 +1,5 @@
+def tuples_mul_homogeneous2():
+    a = (1,2,3)
+    b = 2*a
+    i = 1
+    return b[0], b[i], b[2], b[3], b[4], b[5]
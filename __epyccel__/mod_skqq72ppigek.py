@@ -0,0 +1,4 @@
+def acos_phrase(x : 'float', y : 'float'):
+    from math import acos
+    a = acos(x)+acos(y)
+    return a
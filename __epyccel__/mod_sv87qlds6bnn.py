@@ -0,0 +1,4 @@
+def sqrt_phrase(x : 'float', y : 'float'):
+    from numpy import sqrt
+    a = sqrt(x)*sqrt(y)
+    return a
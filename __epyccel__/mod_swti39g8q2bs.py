@@ -0,0 +1,6 @@
+def test_omp_in_parallel2():
+    from pyccel.stdlib.internal.openmp import omp_in_parallel
+    #$ omp parallel
+    in_parallel = omp_in_parallel()
+    #$ omp end parallel
+    return in_parallel
@@ -0,0 +1,3 @@
+def sum_in_single_return(a : 'int', b : 'int'):
+    c = a + b
+    return c
@@ -0,0 +1,6 @@
+def test_omp_get_thread_limit():
+    from pyccel.stdlib.internal.openmp import omp_get_thread_limit
+    #$ omp parallel
+    maximum_threads_available = omp_get_thread_limit()
+    #$ omp end parallel
+    return maximum_threads_available
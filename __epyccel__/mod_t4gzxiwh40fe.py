@@ -0,0 +1,4 @@
+def create_full_val_real_complex64(val : 'float'):
+    from numpy import full, complex64
+    a = full(3,val,complex64)
+    return a[0]
@@ -0,0 +1,3 @@
+def expm1_call(x : 'float'):
+    from math import expm1
+    return expm1(x)
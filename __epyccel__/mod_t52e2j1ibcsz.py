@@ -0,0 +1,5 @@
+def mult_on_array_int64():
+    from numpy import ones, int64
+    a = ones(5, dtype=int64)
+    b = a * 2
+    return b[0]
@@ -0,0 +1,3 @@
+def f17(a : 'int8'):
+    b = a
+    return b
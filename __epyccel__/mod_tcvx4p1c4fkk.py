@@ -0,0 +1,4 @@
+def array_float_3d_C_array_initialization_1(x : 'float[:,:]', y : 'float[:,:]', a : 'float[:,:,:]'):
+    from numpy import array
+    tmp      = array([x, y], dtype='float')
+    a[:,:,:] = tmp[:,:,:]
@@ -0,0 +1,2 @@
+def axpby_step2(u : 'float[:]', t : 'float[:]', z : 'float[:]'):
+    z[:] = t + u
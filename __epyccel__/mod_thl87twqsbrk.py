@@ -0,0 +1,4 @@
+def int_vs_int_array():
+    import numpy as np
+    b = np.zeros(5, dtype=np.result_type(3, np.arange(7, dtype=np.int32)))
+    return b[0]
@@ -0,0 +1,8 @@
+def fibonacci(n : int):
+    x = 0
+    y = 1
+    for i in range( n ): # pylint: disable=unused-variable
+        z = x+y
+        x = y
+        y = z
+    return x
@@ -0,0 +1,4 @@
+def array_int32_2d_C_complex_3d_expr(x : 'int32[:,:]', y : 'int32[:,:]'):
+    from numpy import full, int32
+    z = full((2,3),5, dtype=int32)
+    x[:] = (x // y) * x + z
@@ -0,0 +1,5 @@
+def array_float_3d_F_array_initialization_2(a : 'float[:,:,:](order=F)'):
+    from numpy import array
+    x = array([[[0., 1., 2., 3.], [4., 5., 6., 7.], [8., 9., 10., 11.]],
+                 [[12., 13., 14., 15.], [16., 17., 18., 19.], [20., 21., 22., 23.]]], order='F')
+    a[:,:,:] = x[:,:,:]
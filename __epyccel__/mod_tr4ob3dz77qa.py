@@ -0,0 +1,5 @@
+@allow_negative_index('a', 'b')
+def test_argument_negative_index_2(a : 'int[:]', b : 'int[:]'):
+    c = -2
+    d = 3
+    return a[c], a[d], b[c], b[d]
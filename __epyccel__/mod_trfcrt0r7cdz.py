@@ -0,0 +1,4 @@
+def test_linspace(start : 'complex64', end : 'complex64'):
+    from numpy import linspace
+    x = linspace(start, end, 5)
+    return x[0], x[1], x[2], x[3], x[4]
@@ -0,0 +1,5 @@
+def create_ones_like_val_complex64_auto():
+    from numpy import ones_like, complex64, array
+    arr = array([5, 1, 8, 0, 9], complex64)
+    a = ones_like(arr)
+    return a[0]
@@ -0,0 +1,4 @@
+def create_full_val_real_float64(val : 'float'):
+    from numpy import full, float64
+    a = full(3,val,float64)
+    return a[0]
@@ -0,0 +1,2 @@
+def axpby_step1(x : 'float[:]', t : 'float[:]', alpha : float):
+    t[:] = alpha * x
@@ -0,0 +1,3 @@
+def tuples_add_mixed_homogeneous():
+    a = (1,2,3) + (False,5,6)
+    return a[0], a[1], a[2], a[3], a[4], a[5]
@@ -0,0 +1,7 @@
+def test_omp_get_team_size():
+    from pyccel.stdlib.internal.openmp import omp_get_team_size, omp_get_active_level
+    #$ omp parallel
+    active_level = omp_get_active_level()
+    team_size = omp_get_team_size(active_level)
+    #$ omp end parallel
+    return team_size
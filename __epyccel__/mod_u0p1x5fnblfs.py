@@ -0,0 +1,4 @@
+def tan_phrase(x : complex, y : complex):
+    from cmath import tan
+    a = tan(x)+tan(y)
+    return a
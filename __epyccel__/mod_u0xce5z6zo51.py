@@ -0,0 +1,8 @@
+def omp_arraysum(x : 'int[:]'):
+    func_result = 0
+    #$ omp parallel private(i)
+    #$ omp for reduction (+:func_result)
+    for i in range(0, 5):
+        func_result += x[i]
+    #$ omp end parallel
+    return func_result
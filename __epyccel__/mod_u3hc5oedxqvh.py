@@ -0,0 +1,4 @@
+def asin_phrase(x : 'float', y : 'float'):
+    from math import asin
+    a = asin(x)+asin(y)
+    return a
@@ -0,0 +1,3 @@
+def cosh_call_i(x : 'int'):
+    from numpy import cosh
+    return cosh(x)
@@ -0,0 +1,2 @@
+def return_scalare():
+    return 5
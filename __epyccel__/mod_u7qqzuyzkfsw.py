@@ -0,0 +1,5 @@
+@allow_negative_index('a', 'b')
+def test_c_order_argument_negative_index(a : 'int[:,:]', b : 'int[:,:]'):
+    c = -2
+    d = 2
+    return a[c,0], a[1,d], b[c,1], b[d,0]
@@ -0,0 +1,2 @@
+def array_int32_1d_idiv(x : 'int32[:]', y : 'int32[:]'):
+    x[:] = x // y
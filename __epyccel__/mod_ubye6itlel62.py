@@ -0,0 +1,3 @@
+def f1(x : 'int'):
+    y = x - 1
+    return y
@@ -0,0 +1,4 @@
+def array_float_nested_C_array_initialization(x : 'float[:,:,:]', y : 'float[:,:]', z : 'float[:,:]', a : 'float[:,:,:,:]'):
+    from numpy import array
+    tmp      = array((x, (y, z, z), x), dtype='float')
+    a[:,:,:,:] = tmp[:,:,:,:]
@@ -0,0 +1,2 @@
+def f(a : 'bool', b : 'bool'):
+    return (a or b).conjugate()
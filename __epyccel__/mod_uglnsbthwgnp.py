@@ -0,0 +1,8 @@
+def product_loop_on_real_array(z : 'float[:]', out : 'float[:]'):
+
+    from numpy     import shape
+
+    n, = shape( z )
+
+    for i in range(n):
+        out[i] = z[i]**2
@@ -0,0 +1,3 @@
+def sinh_call(x : complex):
+    from cmath import sinh
+    return sinh(x)
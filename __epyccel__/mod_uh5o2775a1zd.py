@@ -0,0 +1,3 @@
+def cos_call_r(x : 'float'):
+    from numpy import cos
+    return cos(x)
@@ -0,0 +1,9 @@
+@allow_negative_index('a')
+@allow_negative_index('b', 'c')
+def test_multiple_negative_index_3(d : 'int', e : 'int', f : 'int'):
+    import numpy as np
+    a = np.array([1.2, 2.2, 3.2, 4.2])
+    b = np.array([1])
+    c = np.array([1, 2, 3])
+
+    return a[d], b[e], c[f]
@@ -0,0 +1,5 @@
+def where_wrapper(cond : 'bool[:]', arr1 : 'int32[:] | float64[:] | complex128[:]', arr2 : 'int64[:] | float32[:]'):
+    from numpy import where, shape
+    a = where(cond, arr1, arr2)
+    s = shape(a)
+    return len(s), s[0], a[1], a[0]
@@ -0,0 +1,4 @@
+def tan_phrase_i_i(x : 'int', y : 'int'):
+    from numpy import tan
+    a = tan(x)+tan(y)
+    return a
@@ -0,0 +1,3 @@
+def tanh_call(x : 'float'):
+    from math import tanh
+    return tanh(x)
@@ -0,0 +1,6 @@
+def create_empty_like_shape_1d(n : 'int'):
+    from numpy import empty_like, shape, array
+    arr = array([5, 1, 8, 0, 9])
+    a = empty_like(arr,int)
+    s = shape(a)
+    return len(s),s[0]
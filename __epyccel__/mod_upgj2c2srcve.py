@@ -0,0 +1,5 @@
+@template('T', ['float[:,:,:](order=F)', 'float[:,:](order=F)'])
+def copy_f_to_default(b : 'T'):
+    from numpy import array
+    a = array(b)
+    return a
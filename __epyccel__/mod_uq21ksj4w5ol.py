@@ -0,0 +1,4 @@
+def exp_phrase_r_i(x : 'float', y : 'int'):
+    from numpy import exp
+    a = exp(x)+exp(y)
+    return a
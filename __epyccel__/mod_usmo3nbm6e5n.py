@@ -0,0 +1,5 @@
+def create_empty_like_val_int32_auto():
+    from numpy import empty_like, array, int32
+    arr = array([5, 1, 8, 0, 9], dtype=int32)
+    a = empty_like(arr)
+    return a[0]
@@ -0,0 +1,3 @@
+def numpy_isinf_expr_test(x : 'float', y : 'float'):
+    from numpy import isinf
+    return isinf(x+y)
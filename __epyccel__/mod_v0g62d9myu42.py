@@ -0,0 +1,3 @@
+def cos_call(x : complex):
+    from cmath import cos
+    return cos(x)
@@ -0,0 +1,8 @@
+def test_linspace4(start : 'complex128[:,:]', stop : 'complex128[:,:]', out : 'complex128[:,:,:]', endpoint : 'bool'):
+    from numpy import linspace
+    numberOfSamplesToGenerate = 7
+    a = linspace(start, stop, numberOfSamplesToGenerate, endpoint=endpoint)
+    for i in range(len(out)):
+        for j in range(len(out[i])):
+            for k in range(len(out[i][j])):
+                out[i][j][k] = a[i][j][k]
@@ -0,0 +1,6 @@
+def arr_bool_sum():
+    import numpy as np
+    rows = [True for i in range(100)]
+    mat = [rows for j in range(100)]
+    a = np.array(mat, dtype=bool)
+    return np.sum(a)
@@ -0,0 +1,5 @@
+@allow_negative_index('a', 'b')
+def test_f_order_argument_negative_index(a : 'int[:,:](order=F)', b : 'int[:,:](order=F)'):
+    c = -2
+    d = 3
+    return a[c,0], a[1,d], b[c,1], b[0,d]
@@ -0,0 +1,4 @@
+def while_not_0(n : int):
+    while n:
+        n -= 1
+    return n
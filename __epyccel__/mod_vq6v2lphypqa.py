@@ -0,0 +1,2 @@
+def array_float_2d_C_scalar_mul(x : 'float[:,:]', a : 'float'):
+    x[:,:] *= a
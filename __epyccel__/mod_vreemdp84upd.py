@@ -0,0 +1,6 @@
+def omp_arraysum_combined(x : 'int[:]'):
+    func_result = 0
+    #$ omp parallel for reduction (+:func_result)
+    for i in range(0, 5):
+        func_result += x[i]
+    return func_result
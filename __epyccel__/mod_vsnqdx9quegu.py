@@ -0,0 +1,2 @@
+def array_float_1d_add(x : 'float[:]', y : 'float[:]'):
+    x[:] += y
@@ -0,0 +1,4 @@
+def create_empty_val_complex64():
+    from numpy import empty, complex64
+    a = empty(3,complex64)
+    return a[0]
@@ -0,0 +1,4 @@
+def sin_phrase_i_r(x : 'int', y : 'float'):
+    from numpy import sin
+    a = sin(x)+sin(y)
+    return a
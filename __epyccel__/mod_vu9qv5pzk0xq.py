@@ -0,0 +1,6 @@
+@allow_negative_index('a')
+def array_1d_slice_stride_23(a : 'int[:]'):
+    import numpy as np
+    c = -5
+    b = a[::c]
+    return np.sum(b), b[0], b[-1], len(b)
@@ -0,0 +1,4 @@
+def f5(m1 : 'int', x : 'float [:]'):
+    x[:] = 0.
+    for i in range(0, m1):
+        x[i] = i * 1.
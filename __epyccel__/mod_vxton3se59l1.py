@@ -0,0 +1,5 @@
+def create_zeros_like_val_float32():
+    from numpy import zeros_like, float32, array
+    arr = array([5, 1, 8, 0, 9])
+    a = zeros_like(arr,float32)
+    return a[0]
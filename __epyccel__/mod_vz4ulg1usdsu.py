@@ -0,0 +1,5 @@
+def create_zeros_2_shape():
+    from numpy import zeros, shape
+    a = zeros((4,2),dtype=float)
+    s = shape(a)
+    return len(s),s[0],s[1]
@@ -0,0 +1,4 @@
+def create_empty_val_float32():
+    from numpy import empty, float32
+    a = empty(3,float32)
+    return a[0]
@@ -0,0 +1,4 @@
+def array_float_4d_F_array_initialization(x : 'float[:,:,:](order=F)', y : 'float[:,:,:](order=F)', a : 'float[:,:,:,:](order=F)'):
+    from numpy import array
+    tmp      = array([x, y], dtype='float', order='F')
+    a[:,:,:,:] = tmp[:,:,:,:]
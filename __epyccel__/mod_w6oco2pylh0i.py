@@ -0,0 +1,4 @@
+def create_ones_val_int32():
+    from numpy import ones, int32
+    a = ones(3,int32)
+    return a[0]
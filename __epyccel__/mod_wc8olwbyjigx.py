@@ -0,0 +1,6 @@
+def create_ones_like_3_shape():
+    from numpy import ones_like, shape, array
+    arr = array([[5, 1, 8, 0, 9], [5, 1, 8, 0, 9]])
+    a = ones_like(arr,shape = (4,2),order = 'F',dtype=complex)
+    s = shape(a)
+    return len(s),s[0],s[1]
@@ -0,0 +1,4 @@
+def sin_phrase_r_r(x : 'float', y : 'float'):
+    from numpy import sin
+    a = sin(x)+sin(y)
+    return a
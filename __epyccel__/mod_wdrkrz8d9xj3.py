@@ -0,0 +1,4 @@
+def create_full_val_real_float32(val : 'float'):
+    from numpy import full, float32
+    a = full(3,val,float32)
+    return a[0]
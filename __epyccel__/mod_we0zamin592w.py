@@ -0,0 +1,4 @@
+def create_zeros_val_complex128():
+    from numpy import zeros, complex128
+    a = zeros(3,complex128)
+    return a[0]
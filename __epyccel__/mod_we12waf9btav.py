@@ -0,0 +1,4 @@
+def expm1_phrase(x : 'float', y : 'float'):
+    from math import expm1
+    a = expm1(x)+expm1(y)
+    return a
@@ -0,0 +1,6 @@
+@template('T', ['int', 'int8', 'int16', 'int32', 'int64', 'float', 'float32', 'float64'])
+def get_linspace(start : 'T', steps : int, num : int):
+    from numpy import linspace
+    stop = start + steps
+    b = linspace(start, stop, num)
+    return b
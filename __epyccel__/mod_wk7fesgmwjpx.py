@@ -0,0 +1,4 @@
+def sin_phrase(x : 'float', y : 'float'):
+    from math import sin
+    a = sin(x)+sin(y)
+    return a
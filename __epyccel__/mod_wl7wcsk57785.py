@@ -0,0 +1,4 @@
+def exp_phrase_r_r(x : 'float', y : 'float'):
+    from numpy import exp
+    a = exp(x)+exp(y)
+    return a
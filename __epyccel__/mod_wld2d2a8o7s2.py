@@ -0,0 +1,4 @@
+def axpby_fused(x : 'float[:]', y : 'float[:]', z : 'float[:]', alpha : float, beta : float):
+    t = alpha * x
+    u = beta * y
+    z[:] = t + u
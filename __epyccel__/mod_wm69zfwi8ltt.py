@@ -0,0 +1,5 @@
+def create_empty_shape_1d(n : 'int'):
+    from numpy import empty, shape
+    a = empty(n)
+    s = shape(a)
+    return len(s),s[0]
@@ -0,0 +1,5 @@
+def array_view_steps_C_2D_2(a : 'int[:,:]'):
+    from numpy import array
+    tmp = a[1:10:2]
+    b = array(tmp)
+    return b
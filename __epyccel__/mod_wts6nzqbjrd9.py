@@ -0,0 +1,5 @@
+def create_empty_shape_2d(n : 'int'):
+    from numpy import empty, shape
+    a = empty((n,n))
+    s = shape(a)
+    return len(s),s[0], s[1]
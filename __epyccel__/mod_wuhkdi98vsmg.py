@@ -0,0 +1,3 @@
+@template('T', ['float', 'float64'])
+def dup_header(a : 'T'):
+    return a
@@ -0,0 +1,4 @@
+def arr_arange_3():
+    import numpy as np
+    a = np.arange(0, 10, 0.3)
+    return np.shape(a)[0], a[0], a[-1]
@@ -0,0 +1,4 @@
+def create_empty_3_val():
+    from numpy import empty
+    a = empty(order = 'F', shape = (4,2),dtype=complex)
+    return a[0,0]
@@ -0,0 +1,4 @@
+def f(x : 'int[:]', y : 'int[:]'):
+    z = x + y
+    a = z.sum()
+    return a
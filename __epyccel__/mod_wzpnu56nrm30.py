@@ -0,0 +1,4 @@
+def complex_expr(i : int):
+    import numpy as np
+    a = np.ones(i)
+    return ((4 + 5)/(6 - 3) * a[0])%(9 - a[1])
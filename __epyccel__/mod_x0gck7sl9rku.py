@@ -0,0 +1,3 @@
+def max_call(x : 'int[:]'):
+    from numpy import amax
+    return amax(x)
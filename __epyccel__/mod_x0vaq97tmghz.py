@@ -0,0 +1,4 @@
+def f(x : 'int[:]'):
+    z = x[1:]
+    a = z.sum()
+    return a
@@ -0,0 +1,4 @@
+def atan_phrase(x : 'float', y : 'float'):
+    from math import atan
+    a = atan(x)+atan(y)
+    return a
@@ -0,0 +1,10 @@
+def fibonacci_while(n : int):
+    x = 0
+    y = 1
+    i = 1
+    while i <= n:
+        z = x+y
+        x = y
+        y = z
+        i = i + 1
+    return x
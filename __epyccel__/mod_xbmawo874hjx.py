@@ -0,0 +1,2 @@
+def f(a : 'float64', b : 'float64'):
+    return (a+b).conj()
@@ -0,0 +1,7 @@
+def sum_nat_numbers_while(n : int):
+    x = 0
+    i = 0
+    while i <= n:
+        x += i
+        i = i + 1
+    return x
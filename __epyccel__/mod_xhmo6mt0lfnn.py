@@ -0,0 +1,4 @@
+def cos_phrase_r_r(x : 'float', y : 'float'):
+    from numpy import cos
+    a = cos(x)+cos(y)
+    return a
@@ -0,0 +1,6 @@
+def f15(a : 'bool', b : 'int8', c : 'int16', d : 'int32', e : 'int64'):
+    from numpy import int64
+    if a:
+        return int64(b + c)
+    else:
+        return d + e
@@ -0,0 +1,4 @@
+def tan_phrase_i_r(x : 'int', y : 'float'):
+    from numpy import tan
+    a = tan(x)+tan(y)
+    return a
@@ -0,0 +1,13 @@
+def combined_for_simd():
+    import numpy as np
+    x = np.array([1,2,1,2,1,2,1,2])
+    y = np.array([2,1,2,1,2,1,2,1])
+    z = np.zeros(8, dtype = int)
+    func_result = 0
+    #$ omp parallel for simd
+    for i in range(0, 8):
+        z[i] = x[i] + y[i]
+
+    for i in range(0, 8):
+        func_result = func_result + z[i]
+    return func_result
@@ -0,0 +1,5 @@
+def create_ones_shape_1d(n : 'int'):
+    from numpy import ones, shape
+    a = ones(n)
+    s = shape(a)
+    return len(s),s[0]
@@ -0,0 +1,5 @@
+def test_omp_get_proc_bind():
+    from pyccel.stdlib.internal.openmp import omp_get_proc_bind
+
+    bind_var = omp_get_proc_bind()
+    return bind_var
@@ -0,0 +1,3 @@
+def atan2_call(x : 'float', y : 'float'):
+    from math import atan2
+    return atan2(x, y)
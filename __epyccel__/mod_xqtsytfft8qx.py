@@ -0,0 +1,5 @@
+def create_ones_like_val_float_auto():
+    from numpy import ones_like, array
+    arr = array([5, 1, 8, 0, 9], float)
+    a = ones_like(arr)
+    return a[0]
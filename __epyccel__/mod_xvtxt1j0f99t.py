@@ -0,0 +1,10 @@
+@stack_array('a')
+@stack_array('b')
+def multiple_stack_array_1():
+    from numpy import ones, array
+    a = ones(5)
+    b = array([1, 3, 5, 7, 9])
+    s = 0.0
+    for i in range(5):
+        s += a[i] / b[i]
+    return s
@@ -0,0 +1,10 @@
+def omp_matmul(A : 'float[:,:]', x : 'float[:,:]', out : 'float[:,:]'):
+    #$ omp parallel shared(A,x,out) private(i,j,k)
+    #$ omp for
+    for i in range(len(A)):# pylint: disable=C0200
+        for j in range(len(x[0])):# pylint: disable=C0200
+            for k in range(len(x)):# pylint: disable=C0200
+                out[i][j] += A[i][k] * x[k][j]
+    #$ omp end parallel
+    #to let the function compile using epyccel issue #468
+    "bypass issue #468" # pylint: disable=W0105
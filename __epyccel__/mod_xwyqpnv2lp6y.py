@@ -0,0 +1,3 @@
+def my_tuple() -> 'tuple[int, ...]':
+    a = (1,2,3,4,5)
+    return a
@@ -0,0 +1,4 @@
+def create_full_val_int_float(val : 'int'):
+    from numpy import full
+    a = full(3,val,float)
+    return a[0]
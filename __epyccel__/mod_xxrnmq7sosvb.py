@@ -0,0 +1,4 @@
+def assign_vars_return(a : 'int', b : 'int'):
+    c = a+b
+    d = a-b
+    return c+d
@@ -0,0 +1,5 @@
+def tuples_func():
+    def my_tup():
+        return 1, 2
+    c = my_tup()
+    return c[0], c[1]
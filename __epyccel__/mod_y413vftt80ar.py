@@ -0,0 +1,3 @@
+def sin_call(x : 'float'):
+    from math import sin
+    return sin(x)
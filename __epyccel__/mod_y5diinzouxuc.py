@@ -0,0 +1,4 @@
+def create_ones_val_float32():
+    from numpy import ones, float32
+    a = ones(3,float32)
+    return a[0]
@@ -0,0 +1,2 @@
+def return_single_var(x : 'int'):
+    return x
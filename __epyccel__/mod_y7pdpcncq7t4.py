@@ -0,0 +1,4 @@
+def tuple_visitation_inhomogeneous():
+    ai = (1,3.5, False)
+    for a in ai:
+        print(a)
@@ -0,0 +1,4 @@
+def erfc_phrase(x : 'float', y : 'float'):
+    from math import erfc
+    a = erfc(x)+ erfc(y)
+    return a
@@ -0,0 +1,6 @@
+def test_linspace_dtype(start : 'int[:] | float64[:]', stop : int, endpoint : bool):
+    from numpy import linspace
+    import numpy as np
+    numberOfSamplesToGenerate = 7
+    a = linspace(start, stop, numberOfSamplesToGenerate, endpoint=(endpoint == True), dtype=np.int32)
+    return a
@@ -0,0 +1,3 @@
+def inhomogeneous_tuple_2_levels_2():
+    ai = ((0,1,2), (True,False,True))
+    return ai[0][0], ai[0][1] ,ai[0][2], ai[1][0], ai[1][1], ai[1][2]
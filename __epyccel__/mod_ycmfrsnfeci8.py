@@ -0,0 +1,7 @@
+def f(c : 'float'):
+    import numpy as np
+    if c > 0.5:
+        x = np.ones(2, dtype=int)
+    else:
+        x = np.ones(7, dtype=int)
+    return x.sum()
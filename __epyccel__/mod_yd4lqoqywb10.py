@@ -0,0 +1,11 @@
+def f1(i : 'int'):
+    from pyccel.stdlib.internal.openmp import omp_get_thread_num
+    out = -1
+    #$ omp parallel private(idx)
+    idx = omp_get_thread_num()
+
+    if idx == i:
+        out = int(idx)
+
+    #$ omp end parallel
+    return out
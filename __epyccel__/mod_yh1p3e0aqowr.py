@@ -0,0 +1,6 @@
+@template('T', ['complex64[:]','complex128[:]'])
+def where_wrapper(arr1 : 'T', arr2 : 'T', cond : 'bool[:]'):
+    from numpy import where, shape
+    a = where(cond, arr1, arr2)
+    s = shape(a)
+    return len(s), s[0], a[1], a[0]
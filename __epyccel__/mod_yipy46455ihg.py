@@ -0,0 +1,4 @@
+def sqrt_phrase(x : 'float', y : 'float'):
+    from math import sqrt
+    a = sqrt(x)*sqrt(y)
+    return a
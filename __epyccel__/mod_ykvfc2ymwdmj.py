@@ -0,0 +1,3 @@
+def inhomogeneous_tuple_2():
+    ai = (0, False, 3)
+    return ai[0], ai[1], ai[2]
@@ -0,0 +1,3 @@
+def erf_call(x : 'float'):
+    from math import erf
+    return erf(x)
@@ -0,0 +1,4 @@
+def sqrt_return_type_comp(x : 'complex'):
+    from numpy import sqrt
+    a = sqrt(x)
+    return a
@@ -0,0 +1,4 @@
+def create_zeros_val_complex64():
+    from numpy import zeros, complex64
+    a = zeros(3,complex64)
+    return a[0]
@@ -0,0 +1,7 @@
+def enumerate_on_1d_array_with_tuple(z : 'int[:]'):
+
+    res = 0
+    for v in enumerate( z ):
+        res += v[0]*v[1]
+
+    return res
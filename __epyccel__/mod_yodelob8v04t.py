@@ -0,0 +1,5 @@
+def tuples_add_mixed_homogeneous_variables():
+    a = (1,2,3)
+    b = (4,5,True)
+    c = a + b
+    return c[0], c[1], c[2], c[3], c[4], c[5]
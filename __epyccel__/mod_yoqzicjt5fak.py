@@ -0,0 +1,4 @@
+def sin_phrase_i_i(x : 'int', y : 'int'):
+    from numpy import sin
+    a = sin(x)+sin(y)
+    return a
@@ -0,0 +1,5 @@
+def get_min(a : 'int', b : 'int'):
+    if a<b:
+        return a
+    else:
+        return b
@@ -0,0 +1,4 @@
+def create_empty_val_int():
+    from numpy import empty
+    a = empty(3,int)
+    return a[0]
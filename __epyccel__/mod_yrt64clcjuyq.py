@@ -0,0 +1,2 @@
+def array_float_2d_F_scalar_mod(x : 'float[:,:](order=F)', a : 'float'):
+    x[:,:] %= a
@@ -0,0 +1,6 @@
+@template('T', ['bool[:]', 'int[:]', 'int8[:]', 'int16[:]', 'int32[:]', 'int64[:]', 'float[:]', 'float32[:]', 'float64[:]', 'complex64[:]', 'complex128[:]'])
+def get_imag(arr : 'T'):
+    from numpy import imag, shape
+    a = imag(arr)
+    s = shape(a)
+    return len(s), s[0], a[0]
@@ -0,0 +1,5 @@
+@template('T', ['float[:,:,:](order=C)', 'float[:,:](order=C)'])
+def copy_c_to_f(b : 'T'):
+    from numpy import array
+    a = array(b, order='F')
+    return a
@@ -0,0 +1,3 @@
+def sin_call_r(x : 'float'):
+    from numpy import sin
+    return sin(x)
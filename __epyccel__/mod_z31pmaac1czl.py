@@ -0,0 +1,4 @@
+def array_float_nested_F_array_initialization(x : 'float[:,:,:]', y : 'float[:,:]', z : 'float[:,:]', a : 'float[:,:,:,:](order=F)'):
+    from numpy import array
+    tmp      = array((x, (y, z, z), x), dtype='float', order="F")
+    a[:,:,:,:] = tmp[:,:,:,:]
@@ -0,0 +1,3 @@
+@template('T', types=['float', 'float32', 'float64'])
+def float_types(x : 'T', y : 'T'):
+    return x + y
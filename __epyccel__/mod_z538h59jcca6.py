@@ -0,0 +1,5 @@
+def create_empty_like_val_float_auto():
+    from numpy import empty_like, array
+    arr = array([5, 1, 8, 0, 9], dtype=float)
+    a = empty_like(arr)
+    return a[0]
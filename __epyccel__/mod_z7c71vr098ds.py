@@ -0,0 +1,4 @@
+def create_zeros_2_val():
+    from numpy import zeros
+    a = zeros((4,2),dtype=float)
+    return a[0,0]
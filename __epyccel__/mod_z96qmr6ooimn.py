@@ -0,0 +1,5 @@
+def for_loop2():
+    x = 0
+    for i in range(1, 10, 1):
+        x += i
+    return x
@@ -0,0 +1,5 @@
+@template('T', ['bool', 'int', 'int8', 'int16', 'int32', 'int64', 'float', 'float32', 'float64'])
+def get_complex128(a : 'T'):
+    from numpy import complex128
+    b = complex128(a)
+    return b
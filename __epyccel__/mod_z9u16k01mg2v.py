@@ -0,0 +1,6 @@
+def get_num_threads():
+    from pyccel.stdlib.internal.openmp import omp_get_num_threads
+    #$ omp parallel
+    n = omp_get_num_threads()
+    #$ omp end parallel
+    return n
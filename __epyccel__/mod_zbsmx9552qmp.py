@@ -0,0 +1,5 @@
+def create_empty_like_val_complex64():
+    from numpy import empty_like, complex64, array
+    arr = array([5, 1, 8, 0, 9])
+    a = empty_like(arr,dtype=complex64)
+    return a[0]
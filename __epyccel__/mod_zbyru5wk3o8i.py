@@ -0,0 +1,5 @@
+@template('T', types=[float,int])
+def zeros_type(a : 'T'):
+    from numpy import zeros
+    x = zeros(10,dtype= type(a))
+    return x[0]
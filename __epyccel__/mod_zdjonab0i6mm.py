@@ -0,0 +1,7 @@
+def f2(x : 'int[:,:]'):
+    from numpy import transpose, ones
+    n, m = x.shape
+    y = ones((m,n), order='F')
+    z = x.transpose()+y
+    n, m = z.shape
+    return n, m, z[-1,0], z[0,-1]
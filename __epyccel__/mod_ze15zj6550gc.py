@@ -0,0 +1,3 @@
+def tuple_negative_slice():
+    a,b = (1,2,3)[:-1]
+    return a,b
@@ -0,0 +1,4 @@
+def create_zeros_3_val():
+    from numpy import zeros
+    a = zeros(order = 'F', shape = (4,2),dtype=complex)
+    return a[0,0]
@@ -0,0 +1,4 @@
+def tuple_unpacking_1():
+    ai = (1,False,3.5)
+    a,b,c = ai
+    return a,b,c
@@ -0,0 +1,2 @@
+def test_size_3d(f: 'int[:,:,:]'):
+    return f.size
@@ -0,0 +1,7 @@
+def pointer_to_pointer_is_pointer():
+    from numpy import array, shape
+    a = array([1, 2, 3, 4])
+    b = a[1:]
+    c = b
+    a[2] = 9
+    return c[0], c[1], c[2], shape(c)[0]
@@ -0,0 +1,2 @@
+def multi_return_scalare():
+    return 5, 7
@@ -0,0 +1,4 @@
+def tanh_phrase(x : complex, y : complex):
+    from cmath import tanh
+    a = tanh(x)+tanh(y)
+    return a
@@ -0,0 +1,3 @@
+def copysign_call(x : 'float', y : 'float'):
+    from math import copysign
+    return copysign(x, y)
@@ -0,0 +1,3 @@
+def copysign_zero_case(x : 'int', y : 'int'):
+    from math import copysign
+    return copysign(x, y)
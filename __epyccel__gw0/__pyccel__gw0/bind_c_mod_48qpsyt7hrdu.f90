@@ -0,0 +1,24 @@
+module bind_c_mod_48qpsyt7hrdu
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+  use mod_48qpsyt7hrdu
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_add(a, b) bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: a
+    real(f64), value :: b
+
+    Out_0001 = add(a = a, b = b)
+
+  end function bind_c_add
+  !........................................
+
+end module bind_c_mod_48qpsyt7hrdu
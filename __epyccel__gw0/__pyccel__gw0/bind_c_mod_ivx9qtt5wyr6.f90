@@ -0,0 +1,28 @@
+module bind_c_mod_ivx9qtt5wyr6
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_ivx9qtt5wyr6
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_draw_integers(seed, low, high, x, y, z) bind(c) 
+
+    implicit none
+
+    integer(i64), intent(out) :: x
+    integer(i64), intent(out) :: y
+    integer(i64), intent(out) :: z
+    integer(i64), value :: seed
+    integer(i64), value :: low
+    integer(i64), value :: high
+
+    call draw_integers(seed = seed, low = low, high = high, x = x, y = y &
+          , z = z)
+
+  end subroutine bind_c_draw_integers
+  !........................................
+
+end module bind_c_mod_ivx9qtt5wyr6
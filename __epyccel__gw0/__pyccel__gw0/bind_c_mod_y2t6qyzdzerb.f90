@@ -0,0 +1,31 @@
+module bind_c_mod_y2t6qyzdzerb
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , i64 => C_INT64_T &
+        , f64 => C_DOUBLE , c_ptr
+  use mod_y2t6qyzdzerb
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_scale(bound_x, bound_x_shape_1, bound_x_stride_1, &
+        factor, offset) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    real(f64), value :: factor
+    integer(i64), value :: offset
+    real(f64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call scale(x = x(1_i64::bound_x_stride_1), factor = factor, offset = &
+          offset)
+
+  end subroutine bind_c_scale
+  !........................................
+
+end module bind_c_mod_y2t6qyzdzerb
@@ -0,0 +1,35 @@
+module bind_c_mod_zuyiikw5gkw2
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , f64 => C_DOUBLE &
+        , c_ptr , i64 => C_INT64_T
+  use mod_zuyiikw5gkw2
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_axpy(a, bound_x, bound_x_shape_1, bound_x_stride_1, &
+        bound_y, bound_y_shape_1, bound_y_stride_1) bind(c)
+
+    implicit none
+
+    real(f64), value :: a
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    type(c_ptr), value :: bound_y
+    integer(i64), value :: bound_y_shape_1
+    integer(i64), value :: bound_y_stride_1
+    real(f64), pointer :: x(:)
+    real(f64), pointer :: y(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call C_F_Pointer(bound_y, y, [bound_y_shape_1 * bound_y_stride_1])
+    call axpy(a = a, x = x(1_i64::bound_x_stride_1), y = y(1_i64:: &
+          bound_y_stride_1))
+
+  end subroutine bind_c_axpy
+  !........................................
+
+end module bind_c_mod_zuyiikw5gkw2
@@ -0,0 +1,24 @@
+module mod_2vv5uz83h6tw
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function add(a, b) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: a
+    integer(i64), value :: b
+
+    Out_0001 = a + b
+    return
+
+  end function add
+  !........................................
+
+end module mod_2vv5uz83h6tw
@@ -0,0 +1,40 @@
+#ifndef MOD_2VV5UZ83H6TW_WRAPPER_H
+#define MOD_2VV5UZ83H6TW_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_2VV5UZ83H6TW_WRAPPER
+
+int64_t bind_c_add(int64_t, int64_t);
+
+#else
+
+static void** Pymod_2vv5uz83h6tw_API;
+
+
+/*........................................*/
+static int mod_2vv5uz83h6tw_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_2vv5uz83h6tw_API = (void**)PyCapsule_Import("mod_2vv5uz83h6tw._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_2vv5uz83h6tw_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_2VV5UZ83H6TW_WRAPPER_H
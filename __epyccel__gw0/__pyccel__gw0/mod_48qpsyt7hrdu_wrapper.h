@@ -0,0 +1,40 @@
+#ifndef MOD_48QPSYT7HRDU_WRAPPER_H
+#define MOD_48QPSYT7HRDU_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_48QPSYT7HRDU_WRAPPER
+
+double bind_c_add(double, double);
+
+#else
+
+static void** Pymod_48qpsyt7hrdu_API;
+
+
+/*........................................*/
+static int mod_48qpsyt7hrdu_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_48qpsyt7hrdu_API = (void**)PyCapsule_Import("mod_48qpsyt7hrdu._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_48qpsyt7hrdu_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_48QPSYT7HRDU_WRAPPER_H
@@ -0,0 +1,40 @@
+#ifndef MOD_6NK5LHUEGOE7_WRAPPER_H
+#define MOD_6NK5LHUEGOE7_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_6NK5LHUEGOE7_WRAPPER
+
+int64_t bind_c_draw_random(int64_t, int64_t, double*, double*, double*);
+
+#else
+
+static void** Pymod_6nk5lhuegoe7_API;
+
+
+/*........................................*/
+static int mod_6nk5lhuegoe7_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_6nk5lhuegoe7_API = (void**)PyCapsule_Import("mod_6nk5lhuegoe7._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_6nk5lhuegoe7_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_6NK5LHUEGOE7_WRAPPER_H
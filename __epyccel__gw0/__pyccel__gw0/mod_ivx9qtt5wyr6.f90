@@ -0,0 +1,32 @@
+module mod_ivx9qtt5wyr6
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use pyc_random_f90
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine draw_integers(seed, low, high, x, y, z) 
+
+    implicit none
+
+    integer(i64), intent(out) :: x
+    integer(i64), intent(out) :: y
+    integer(i64), intent(out) :: z
+    integer(i64), value :: seed
+    integer(i64), value :: low
+    integer(i64), value :: high
+    type(pyc_philox) :: rng
+
+    rng = pyc_philox_init(seed, 0_i64)
+    x = pyc_philox_integers(rng, low, high)
+    y = pyc_philox_integers(rng, low, high)
+    z = pyc_philox_integers(rng, low, high)
+    return
+
+  end subroutine draw_integers
+  !........................................
+
+end module mod_ivx9qtt5wyr6
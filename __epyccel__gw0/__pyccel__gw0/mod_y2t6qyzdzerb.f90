@@ -0,0 +1,24 @@
+module mod_y2t6qyzdzerb
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine scale(x, factor, offset) 
+
+    implicit none
+
+    real(f64), intent(inout) :: x(0_i64:)
+    real(f64), value :: factor
+    integer(i64), value :: offset
+
+    x(:) = x * factor + offset
+
+  end subroutine scale
+  !........................................
+
+end module mod_y2t6qyzdzerb
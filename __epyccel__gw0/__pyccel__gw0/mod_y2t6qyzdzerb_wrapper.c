@@ -0,0 +1,120 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_Y2T6QYZDZERB_WRAPPER
+
+#include "mod_y2t6qyzdzerb_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_scale_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* factor_obj;
+    PyObject* offset_obj;
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    int64_t x_strides[1];
+    double factor;
+    int64_t offset;
+    offset_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        "factor",
+        "offset",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 3, &x_obj, &factor_obj, &offset_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(factor_obj))
+    {
+        factor = PyDouble_to_Double(factor_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument factor");
+        return NULL;
+    }
+    offset = INT64_C(1);
+    if (offset_obj != Py_None)
+    {
+        if (PyIs_NativeInt(offset_obj))
+        {
+            offset = PyInt64_to_Int64(offset_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument offset");
+            return NULL;
+        }
+    }
+    bind_c_scale(x_data, x_shape[INT64_C(0)], x_strides[INT64_C(0)], factor, offset);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_y2t6qyzdzerb_methods[] = {
+    {
+        "scale",
+        (PyCFunction)bind_c_scale_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_y2t6qyzdzerb_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_y2t6qyzdzerb",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_y2t6qyzdzerb_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_y2t6qyzdzerb(void)
+{
+    PyObject* mod;
+    static void* Pymod_y2t6qyzdzerb_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_y2t6qyzdzerb_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_y2t6qyzdzerb_API, "mod_y2t6qyzdzerb._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
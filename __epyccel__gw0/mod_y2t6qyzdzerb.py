@@ -0,0 +1,2 @@
+def scale(x : 'float[:]', factor : "float", offset : "int" = 1):
+    x[:] = x * factor + offset
@@ -0,0 +1,31 @@
+module bind_c_mod_3ddm1viv2yh8
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , i64 => C_INT64_T , &
+        C_F_Pointer , f64 => C_DOUBLE
+  use mod_3ddm1viv2yh8
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_thread_sums(seed, bound_sums, bound_sums_shape_1, &
+        bound_sums_stride_1) bind(c)
+
+    implicit none
+
+    integer(i64), value :: seed
+    type(c_ptr), value :: bound_sums
+    integer(i64), value :: bound_sums_shape_1
+    integer(i64), value :: bound_sums_stride_1
+    real(f64), pointer :: sums(:)
+
+    call C_F_Pointer(bound_sums, sums, [bound_sums_shape_1 * &
+          bound_sums_stride_1])
+    call thread_sums(seed = seed, sums = sums(1_i64::bound_sums_stride_1 &
+          ))
+
+  end subroutine bind_c_thread_sums
+  !........................................
+
+end module bind_c_mod_3ddm1viv2yh8
@@ -0,0 +1,29 @@
+module bind_c_mod_i2qf8p9vijrk
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use mod_i2qf8p9vijrk
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_draw_normal(seed, loc, scale, x, y, z) bind(c) 
+
+    implicit none
+
+    real(f64), intent(out) :: x
+    real(f64), intent(out) :: y
+    real(f64), intent(out) :: z
+    integer(i64), value :: seed
+    real(f64), value :: loc
+    real(f64), value :: scale
+
+    call draw_normal(seed = seed, loc = loc, scale = scale, x = x, y = y &
+          , z = z)
+
+  end subroutine bind_c_draw_normal
+  !........................................
+
+end module bind_c_mod_i2qf8p9vijrk
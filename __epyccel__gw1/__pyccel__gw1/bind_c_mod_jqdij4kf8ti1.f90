@@ -0,0 +1,24 @@
+module bind_c_mod_jqdij4kf8ti1
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_jqdij4kf8ti1
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_skip_ahead(seed, n_blocks) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: seed
+    integer(i64), value :: n_blocks
+
+    Out_0001 = skip_ahead(seed = seed, n_blocks = n_blocks)
+
+  end function bind_c_skip_ahead
+  !........................................
+
+end module bind_c_mod_jqdij4kf8ti1
@@ -0,0 +1,31 @@
+module bind_c_mod_nq2q6cyp3e6v
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , i64 => C_INT64_T , &
+        C_F_Pointer , f64 => C_DOUBLE
+  use mod_nq2q6cyp3e6v
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_stream_means(seed, bound_means, bound_means_shape_1, &
+        bound_means_stride_1) bind(c)
+
+    implicit none
+
+    integer(i64), value :: seed
+    type(c_ptr), value :: bound_means
+    integer(i64), value :: bound_means_shape_1
+    integer(i64), value :: bound_means_stride_1
+    real(f64), pointer :: means(:)
+
+    call C_F_Pointer(bound_means, means, [bound_means_shape_1 * &
+          bound_means_stride_1])
+    call stream_means(seed = seed, means = means(1_i64:: &
+          bound_means_stride_1))
+
+  end subroutine bind_c_stream_means
+  !........................................
+
+end module bind_c_mod_nq2q6cyp3e6v
@@ -0,0 +1,33 @@
+module bind_c_mod_xekvcpvioyjg
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , i64 => C_INT64_T , &
+        C_F_Pointer , f64 => C_DOUBLE
+  use mod_xekvcpvioyjg
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_fill(seed, bound_a, bound_a_shape_1, bound_a_shape_2 &
+        , bound_a_stride_1, bound_a_stride_2) bind(c)
+
+    implicit none
+
+    integer(i64), value :: seed
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_shape_2
+    integer(i64), value :: bound_a_stride_1
+    integer(i64), value :: bound_a_stride_2
+    real(f64), pointer :: a(:, :)
+
+    call C_F_Pointer(bound_a, a, [bound_a_stride_2,bound_a_shape_2])
+    call fill(seed = seed, a = a(1_i64:bound_a_shape_1 * &
+          bound_a_stride_1 + 1_i64 - 1_i64:bound_a_stride_1, 1_i64: &
+          bound_a_shape_2 + 1_i64 - 1_i64))
+
+  end subroutine bind_c_fill
+  !........................................
+
+end module bind_c_mod_xekvcpvioyjg
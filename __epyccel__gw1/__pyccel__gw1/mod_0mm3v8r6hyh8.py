@@ -0,0 +1,7 @@
+
+def dict_ptr():
+    a = {1: 1.0, 2: 2.0, 3: 3.0}
+    b = a
+    c = b.pop(2)
+    return len(a),len(b),c
+
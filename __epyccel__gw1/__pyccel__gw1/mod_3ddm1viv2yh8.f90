@@ -0,0 +1,36 @@
+module mod_3ddm1viv2yh8
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , f64 => &
+        C_DOUBLE , i64 => C_INT64_T
+  use pyc_random_f90
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine thread_sums(seed, sums) 
+
+    use omp_lib, only: omp_get_thread_num
+
+    implicit none
+
+    integer(i64), value :: seed
+    real(f64), intent(inout) :: sums(0_i64:)
+    integer(i32) :: rank
+    type(pyc_philox) :: rng
+    integer(i64) :: j
+
+    !$omp parallel num_threads(4) private(rank, rng, j)
+    rank = omp_get_thread_num()
+    rng = pyc_philox_init(seed, Int(rank, kind = i64))
+    sums(rank) = 0.0_f64
+    do j = 0_i64, 99_i64
+      sums(rank) = sums(rank) + pyc_philox_random(rng)
+    end do
+    !$omp end parallel
+
+  end subroutine thread_sums
+  !........................................
+
+end module mod_3ddm1viv2yh8
@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_3DDM1VIV2YH8_WRAPPER
+
+#include "mod_3ddm1viv2yh8_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_thread_sums_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* seed_obj;
+    PyObject* sums_obj;
+    int64_t seed;
+    void* sums_data = NULL;
+    int64_t sums_shape[1];
+    int64_t sums_strides[1];
+    static const char* const kwlist[] = {
+        "seed",
+        "sums",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &seed_obj, &sums_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(seed_obj))
+    {
+        seed = PyInt64_to_Int64(seed_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument seed");
+        return NULL;
+    }
+    if (pyarray_check("sums", sums_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        sums_data = PyArray_DATA((PyArrayObject*)(sums_obj));
+        get_strides_and_shape_from_numpy_array(sums_obj, sums_shape, sums_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_thread_sums(seed, sums_data, sums_shape[INT64_C(0)], sums_strides[INT64_C(0)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_3ddm1viv2yh8_methods[] = {
+    {
+        "thread_sums",
+        (PyCFunction)bind_c_thread_sums_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_3ddm1viv2yh8_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_3ddm1viv2yh8",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_3ddm1viv2yh8_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_3ddm1viv2yh8(void)
+{
+    PyObject* mod;
+    static void* Pymod_3ddm1viv2yh8_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_3ddm1viv2yh8_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_3ddm1viv2yh8_API, "mod_3ddm1viv2yh8._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
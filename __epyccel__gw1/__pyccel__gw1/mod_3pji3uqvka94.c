@@ -0,0 +1,10 @@
+#include "mod_3pji3uqvka94.h"
+
+
+/*........................................*/
+bool one(void)
+{
+    return 1;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_3PJI3UQVKA94_H
+#define MOD_3PJI3UQVKA94_H
+
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool one(void);
+#endif // mod_3pji3uqvka94_H
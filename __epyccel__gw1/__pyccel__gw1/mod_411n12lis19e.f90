@@ -0,0 +1,42 @@
+module mod_411n12lis19e
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , f64 => &
+        C_DOUBLE , i64 => C_INT64_T
+  use pyc_random_f90
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine fill(seed, a, b, c) 
+
+    implicit none
+
+    integer(i64), value :: seed
+    real(f64), intent(inout) :: a(0_i64:, 0_i64:)
+    integer(i32), intent(inout) :: b(0_i64:)
+    real(f64), intent(inout) :: c(0_i64:)
+    type(pyc_philox) :: rng
+    integer(i64) :: i
+    integer(i64) :: i_0001
+    integer(i64) :: i_0002
+    integer(i64) :: i_0003
+
+    rng = pyc_philox_init(seed, 1_i64)
+    do i = 0_i64, size(a, 2_i64, i64) - 1_i64
+      do i_0001 = 0_i64, size(a, 1_i64, i64) - 1_i64
+        a(i_0001, i) = pyc_philox_random(rng)
+      end do
+    end do
+    do i_0002 = 0_i64, size(b, kind=i64) - 1_i64
+      b(i_0002) = pyc_philox_integers(rng, -100_i64, 100_i64)
+    end do
+    do i_0003 = 0_i64, size(c, kind=i64) - 1_i64
+      c(i_0003) = pyc_philox_normal(rng, 2.0_f64, 3.0_f64)
+    end do
+
+  end subroutine fill
+  !........................................
+
+end module mod_411n12lis19e
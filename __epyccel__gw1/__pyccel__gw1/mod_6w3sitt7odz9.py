@@ -0,0 +1,6 @@
+
+def pop_item_str_keys():
+    a = {'a': 1, 'b': 2}
+    (b_0, b_1) = a.popitem()
+    return b_0,b_1
+
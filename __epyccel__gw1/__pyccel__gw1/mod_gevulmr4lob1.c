@@ -0,0 +1,18 @@
+#include "mod_gevulmr4lob1.h"
+
+
+/*........................................*/
+hmap_int64_t_int64_t dict_build(int64_t n)
+{
+    int64_t i;
+    int64_t Dummy_0000;
+    hmap_int64_t_int64_t a = {0};
+    a = c_init(hmap_int64_t_int64_t, {});
+    for (i = INT64_C(0); i < n; i += INT64_C(1))
+    {
+        Dummy_0000 = hmap_int64_t_int64_t_setdefault(&a, pyc_modulo(i, INT64_C(7)), i);
+    }
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,32 @@
+#ifndef MOD_GEVULMR4LOB1_H
+#define MOD_GEVULMR4LOB1_H
+
+#include <math.h>
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_DICT_HMAP_INT64_T_INT64_T
+#define _TOOLS_DICT_HMAP_INT64_T_INT64_T
+#define i_type hmap_int64_t_int64_t
+#define i_key int64_t
+#define i_val int64_t
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_INT64_T
+
+#ifndef _TOOLS_DICT_HMAP_INT64_T_INT64_T
+#define _TOOLS_DICT_HMAP_INT64_T_INT64_T
+#define i_type hmap_int64_t_int64_t
+#define i_key int64_t
+#define i_val int64_t
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_INT64_T
+
+
+
+
+hmap_int64_t_int64_t dict_build(int64_t n);
+#endif // mod_gevulmr4lob1_H
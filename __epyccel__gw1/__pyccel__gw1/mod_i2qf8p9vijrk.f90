@@ -0,0 +1,33 @@
+module mod_i2qf8p9vijrk
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use pyc_random_f90
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine draw_normal(seed, loc, scale, x, y, z) 
+
+    implicit none
+
+    real(f64), intent(out) :: x
+    real(f64), intent(out) :: y
+    real(f64), intent(out) :: z
+    integer(i64), value :: seed
+    real(f64), value :: loc
+    real(f64), value :: scale
+    type(pyc_philox) :: rng
+
+    rng = pyc_philox_init(seed, 0_i64)
+    x = pyc_philox_normal(rng, 0.0_f64, 1.0_f64)
+    y = pyc_philox_normal(rng, loc, scale)
+    z = pyc_philox_normal(rng, loc, scale)
+    return
+
+  end subroutine draw_normal
+  !........................................
+
+end module mod_i2qf8p9vijrk
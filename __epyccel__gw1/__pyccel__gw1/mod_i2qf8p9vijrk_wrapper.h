@@ -0,0 +1,40 @@
+#ifndef MOD_I2QF8P9VIJRK_WRAPPER_H
+#define MOD_I2QF8P9VIJRK_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_I2QF8P9VIJRK_WRAPPER
+
+int64_t bind_c_draw_normal(int64_t, double, double, double*, double*, double*);
+
+#else
+
+static void** Pymod_i2qf8p9vijrk_API;
+
+
+/*........................................*/
+static int mod_i2qf8p9vijrk_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw1")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_i2qf8p9vijrk_API = (void**)PyCapsule_Import("mod_i2qf8p9vijrk._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_i2qf8p9vijrk_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_I2QF8P9VIJRK_WRAPPER_H
@@ -0,0 +1,31 @@
+module mod_jqdij4kf8ti1
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use pyc_random_f90
+
+  implicit none
+
+  contains
+
+  !........................................
+  function skip_ahead(seed, n_blocks) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: seed
+    integer(i64), value :: n_blocks
+    type(pyc_philox) :: rng
+    real(f64) :: Dummy_0000
+
+    rng = pyc_philox_init(seed, 0_i64)
+    Dummy_0000 = pyc_philox_random(rng)
+    call pyc_philox_advance(rng, n_blocks)
+    Out_0001 = pyc_philox_integers(rng, 0_i64, 1000000_i64)
+    return
+
+  end function skip_ahead
+  !........................................
+
+end module mod_jqdij4kf8ti1
@@ -0,0 +1,40 @@
+#ifndef MOD_JQDIJ4KF8TI1_WRAPPER_H
+#define MOD_JQDIJ4KF8TI1_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_JQDIJ4KF8TI1_WRAPPER
+
+int64_t bind_c_skip_ahead(int64_t, int64_t);
+
+#else
+
+static void** Pymod_jqdij4kf8ti1_API;
+
+
+/*........................................*/
+static int mod_jqdij4kf8ti1_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw1")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_jqdij4kf8ti1_API = (void**)PyCapsule_Import("mod_jqdij4kf8ti1._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_jqdij4kf8ti1_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_JQDIJ4KF8TI1_WRAPPER_H
@@ -0,0 +1,10 @@
+#include "mod_klkq49kq2e15.h"
+
+
+/*........................................*/
+void f(void)
+{
+    printf("hidden\n");
+}
+/*........................................*/
+
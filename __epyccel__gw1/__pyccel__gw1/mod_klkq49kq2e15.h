@@ -0,0 +1,11 @@
+#ifndef MOD_KLKQ49KQ2E15_H
+#define MOD_KLKQ49KQ2E15_H
+
+#include <inttypes.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+
+
+void f(void);
+#endif // mod_klkq49kq2e15_H
@@ -0,0 +1,68 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_KLKQ49KQ2E15_WRAPPER
+
+#include "mod_klkq49kq2e15_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f_wrapper(PyObject* self, PyObject* args, PyObject* kwargs)
+{
+    PyErr_SetString(PyExc_NotImplementedError, "Private functions are not accessible from python");
+    return NULL;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_klkq49kq2e15_methods[] = {
+    {
+        "f",
+        (PyCFunction)f_wrapper,
+        METH_VARARGS | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_klkq49kq2e15_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_klkq49kq2e15",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_klkq49kq2e15_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_klkq49kq2e15(void)
+{
+    PyObject* mod;
+    static void* Pymod_klkq49kq2e15_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_klkq49kq2e15_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_klkq49kq2e15_API, "mod_klkq49kq2e15._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
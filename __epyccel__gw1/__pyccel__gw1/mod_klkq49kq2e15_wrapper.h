@@ -0,0 +1,40 @@
+#ifndef MOD_KLKQ49KQ2E15_WRAPPER_H
+#define MOD_KLKQ49KQ2E15_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_klkq49kq2e15.h"
+
+
+#ifdef MOD_KLKQ49KQ2E15_WRAPPER
+
+
+#else
+
+static void** Pymod_klkq49kq2e15_API;
+
+
+/*........................................*/
+static int mod_klkq49kq2e15_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw1")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_klkq49kq2e15_API = (void**)PyCapsule_Import("mod_klkq49kq2e15._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_klkq49kq2e15_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_KLKQ49KQ2E15_WRAPPER_H
@@ -0,0 +1,43 @@
+module mod_luymkpwq20wv
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use Map_integer8__real8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine dict_items(key_sum, val_sum) 
+
+    implicit none
+
+    integer(i64), intent(out) :: key_sum
+    real(f64), intent(out) :: val_sum
+    type(Map_integer8__real8) :: a
+    integer(i64) :: key
+    real(f64) :: val
+    type(Map_integer8__real8_Iterator) :: a_iter
+    type(Map_integer8__real8_Iterator) :: a_last
+
+    a = Map_integer8__real8([Pair_integer8__real8(1_i64, 1.0_f64), &
+          Pair_integer8__real8(2_i64, 2.0_f64), Pair_integer8__real8( &
+          3_i64, 3.0_f64), Pair_integer8__real8(5_i64, 4.7_f64)])
+    key_sum = 0_i64
+    val_sum = 0.0_f64
+    a_iter = a % begin()
+    a_last = a % end()
+    do while (a_iter /= a_last)
+      key = a_iter % first()
+      val = a_iter % second()
+      key_sum = key_sum + key
+      val_sum = val_sum + val
+      call a_iter % next()
+    end do
+    return
+
+  end subroutine dict_items
+  !........................................
+
+end module mod_luymkpwq20wv
@@ -0,0 +1,36 @@
+module mod_nq2q6cyp3e6v
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use pyc_random_f90
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine stream_means(seed, means) 
+
+    implicit none
+
+    integer(i64), value :: seed
+    real(f64), intent(inout) :: means(0_i64:)
+    integer(i64) :: s
+    type(pyc_philox) :: rng
+    real(f64) :: total
+    integer(i64) :: Dummy_0000
+    integer(i64) :: Dummy_0001
+
+    do s = 0_i64, size(means, kind=i64) - 1_i64
+      rng = pyc_philox_init(seed, s)
+      total = 0.0_f64
+      do Dummy_0000 = 0_i64, 999_i64
+        total = total + pyc_philox_random(rng)
+      end do
+      means(s) = total / 1000_i64
+    end do
+
+  end subroutine stream_means
+  !........................................
+
+end module mod_nq2q6cyp3e6v
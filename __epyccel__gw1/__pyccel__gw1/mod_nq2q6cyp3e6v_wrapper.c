@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_NQ2Q6CYP3E6V_WRAPPER
+
+#include "mod_nq2q6cyp3e6v_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_stream_means_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* seed_obj;
+    PyObject* means_obj;
+    int64_t seed;
+    void* means_data = NULL;
+    int64_t means_shape[1];
+    int64_t means_strides[1];
+    static const char* const kwlist[] = {
+        "seed",
+        "means",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &seed_obj, &means_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(seed_obj))
+    {
+        seed = PyInt64_to_Int64(seed_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument seed");
+        return NULL;
+    }
+    if (pyarray_check("means", means_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        means_data = PyArray_DATA((PyArrayObject*)(means_obj));
+        get_strides_and_shape_from_numpy_array(means_obj, means_shape, means_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_stream_means(seed, means_data, means_shape[INT64_C(0)], means_strides[INT64_C(0)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_nq2q6cyp3e6v_methods[] = {
+    {
+        "stream_means",
+        (PyCFunction)bind_c_stream_means_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_nq2q6cyp3e6v_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_nq2q6cyp3e6v",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_nq2q6cyp3e6v_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_nq2q6cyp3e6v(void)
+{
+    PyObject* mod;
+    static void* Pymod_nq2q6cyp3e6v_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_nq2q6cyp3e6v_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_nq2q6cyp3e6v_API, "mod_nq2q6cyp3e6v._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
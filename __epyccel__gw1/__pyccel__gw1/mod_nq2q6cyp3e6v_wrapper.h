@@ -0,0 +1,42 @@
+#ifndef MOD_NQ2Q6CYP3E6V_WRAPPER_H
+#define MOD_NQ2Q6CYP3E6V_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_NQ2Q6CYP3E6V_WRAPPER
+
+void bind_c_stream_means(int64_t, void*, int64_t, int64_t);
+
+#else
+
+static void** Pymod_nq2q6cyp3e6v_API;
+
+
+/*........................................*/
+static int mod_nq2q6cyp3e6v_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw1")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_nq2q6cyp3e6v_API = (void**)PyCapsule_Import("mod_nq2q6cyp3e6v._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_nq2q6cyp3e6v_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_NQ2Q6CYP3E6V_WRAPPER_H
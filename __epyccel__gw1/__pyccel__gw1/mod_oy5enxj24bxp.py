@@ -0,0 +1,6 @@
+
+def dict_copy():
+    a = {1: 1.0, 2: 2.0}
+    b = dict(a)
+    return b
+
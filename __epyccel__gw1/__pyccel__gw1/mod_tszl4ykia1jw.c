@@ -0,0 +1,19 @@
+#include "mod_tszl4ykia1jw.h"
+
+
+/*........................................*/
+double dict_arg_items(const hmap_int64_t_double a)
+{
+    int64_t key;
+    double val;
+    double total;
+    total = 0.0;
+    c_foreach (Dummy_0000, hmap_int64_t_double, a){
+        key = Dummy_0000.ref->first;
+        val = Dummy_0000.ref->second;
+        total += key * val;
+    }
+    return total;
+}
+/*........................................*/
+
@@ -0,0 +1,30 @@
+#ifndef MOD_TSZL4YKIA1JW_H
+#define MOD_TSZL4YKIA1JW_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define i_type hmap_int64_t_double
+#define i_key int64_t
+#define i_val double
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+
+#ifndef _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define i_type hmap_int64_t_double
+#define i_key int64_t
+#define i_val double
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+
+
+
+
+double dict_arg_items(const hmap_int64_t_double a);
+#endif // mod_tszl4ykia1jw_H
@@ -0,0 +1,22 @@
+#include "mod_vum5rap9tobq.h"
+
+
+/*........................................*/
+void thread_sums(int64_t seed, t_ndarray sums)
+{
+    int32_t rank;
+    t_philox rng;
+    int64_t j;
+    #pragma omp parallel num_threads(4) private(rank, rng, j)
+    {
+        rank = omp_get_thread_num();
+        rng = pyc_philox_init(seed, (int64_t)(rank));
+        GET_ELEMENT(sums, nd_double, (int64_t)rank) = 0.0;
+        for (j = INT64_C(0); j < INT64_C(100); j += INT64_C(1))
+        {
+            GET_ELEMENT(sums, nd_double, (int64_t)rank) += pyc_philox_random(&rng);
+        }
+    }
+}
+/*........................................*/
+
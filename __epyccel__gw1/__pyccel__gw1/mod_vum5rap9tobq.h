@@ -0,0 +1,13 @@
+#ifndef MOD_VUM5RAP9TOBQ_H
+#define MOD_VUM5RAP9TOBQ_H
+
+#include "ndarrays.h"
+#include "omp.h"
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void thread_sums(int64_t seed, t_ndarray sums);
+#endif // mod_vum5rap9tobq_H
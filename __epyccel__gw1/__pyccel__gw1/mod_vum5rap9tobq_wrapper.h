@@ -0,0 +1,42 @@
+#ifndef MOD_VUM5RAP9TOBQ_WRAPPER_H
+#define MOD_VUM5RAP9TOBQ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_vum5rap9tobq.h"
+
+
+#ifdef MOD_VUM5RAP9TOBQ_WRAPPER
+
+
+#else
+
+static void** Pymod_vum5rap9tobq_API;
+
+
+/*........................................*/
+static int mod_vum5rap9tobq_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw1")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_vum5rap9tobq_API = (void**)PyCapsule_Import("mod_vum5rap9tobq._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_vum5rap9tobq_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_VUM5RAP9TOBQ_WRAPPER_H
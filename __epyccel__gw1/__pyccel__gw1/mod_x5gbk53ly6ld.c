@@ -0,0 +1,10 @@
+#include "mod_x5gbk53ly6ld.h"
+
+
+/*........................................*/
+bool one(void)
+{
+    return 1;
+}
+/*........................................*/
+
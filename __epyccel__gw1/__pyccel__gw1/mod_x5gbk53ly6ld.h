@@ -0,0 +1,10 @@
+#ifndef MOD_X5GBK53LY6LD_H
+#define MOD_X5GBK53LY6LD_H
+
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+
+bool one(void);
+#endif // mod_x5gbk53ly6ld_H
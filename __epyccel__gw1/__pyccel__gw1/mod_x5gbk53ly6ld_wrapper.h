@@ -0,0 +1,40 @@
+#ifndef MOD_X5GBK53LY6LD_WRAPPER_H
+#define MOD_X5GBK53LY6LD_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_x5gbk53ly6ld.h"
+
+
+#ifdef MOD_X5GBK53LY6LD_WRAPPER
+
+
+#else
+
+static void** Pymod_x5gbk53ly6ld_API;
+
+
+/*........................................*/
+static int mod_x5gbk53ly6ld_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw1")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_x5gbk53ly6ld_API = (void**)PyCapsule_Import("mod_x5gbk53ly6ld._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_x5gbk53ly6ld_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_X5GBK53LY6LD_WRAPPER_H
@@ -0,0 +1,32 @@
+module mod_xekvcpvioyjg
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use pyc_random_f90
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine fill(seed, a) 
+
+    implicit none
+
+    integer(i64), value :: seed
+    real(f64), intent(inout) :: a(0_i64:, 0_i64:)
+    type(pyc_philox) :: rng
+    integer(i64) :: i
+    integer(i64) :: i_0001
+
+    rng = pyc_philox_init(seed, 0_i64)
+    do i = 0_i64, size(a, 1_i64, i64) - 1_i64
+      do i_0001 = 0_i64, size(a, 2_i64, i64) - 1_i64
+        a(i, i_0001) = pyc_philox_random(rng)
+      end do
+    end do
+
+  end subroutine fill
+  !........................................
+
+end module mod_xekvcpvioyjg
@@ -0,0 +1,10 @@
+def thread_sums(seed : int, sums : 'float[:]'):
+    from pyccel.random import Generator
+    from pyccel.stdlib.internal.openmp import omp_get_thread_num
+    #$ omp parallel num_threads(4) private(rank, rng, j)
+    rank = omp_get_thread_num()
+    rng = Generator(seed, rank)
+    sums[rank] = 0.0
+    for j in range(100):
+        sums[rank] += rng.random()
+    #$ omp end parallel
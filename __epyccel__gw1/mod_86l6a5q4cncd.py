@@ -0,0 +1,4 @@
+
+def add(a : 'int', b : 'int'):
+    return a + b
+
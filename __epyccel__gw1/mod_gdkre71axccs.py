@@ -0,0 +1,7 @@
+def f():
+    import numpy as np
+    x = np.zeros((3, 7), dtype=int)
+    y = np.ones ((4, 5), dtype=int)
+    x = y
+    x[0][0] = 1
+    return y.sum()
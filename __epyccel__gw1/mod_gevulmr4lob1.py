@@ -0,0 +1,5 @@
+def dict_build(n : int):
+    a : 'dict[int, int]' = {}
+    for i in range(n):
+        a.setdefault(i % 7, i)
+    return a
@@ -0,0 +1,7 @@
+
+def dict_build(n : 'int'):
+    a = {}
+    for i in range(0, n, 1):
+        Dummy_0000 = a.setdefault(i%7, i)
+    return a
+
@@ -0,0 +1,8 @@
+def dict_items():
+    a = {1:1.0, 2:2.0, 3:3.0, 5:4.7}
+    key_sum = 0
+    val_sum = 0.0
+    for key, val in a.items():
+        key_sum += key
+        val_sum += val
+    return key_sum, val_sum
@@ -0,0 +1,8 @@
+def stream_means(seed : int, means : 'float[:]'):
+    from pyccel.random import Generator
+    for s in range(means.shape[0]):
+        rng = Generator(seed, s)
+        total = 0.0
+        for _ in range(1000):
+            total += rng.random()
+        means[s] = total / 1000
@@ -0,0 +1,4 @@
+def fill(seed : int, a : 'float[:,:](order=F)'):
+    from pyccel.random import Generator
+    rng = Generator(seed)
+    rng.random(out = a)
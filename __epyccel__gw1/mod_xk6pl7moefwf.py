@@ -0,0 +1,4 @@
+
+def add(a : 'float', b : 'float'):
+    return a + b
+
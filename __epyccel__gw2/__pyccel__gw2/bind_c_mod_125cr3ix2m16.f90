@@ -0,0 +1,24 @@
+module bind_c_mod_125cr3ix2m16
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i64 => &
+        C_INT64_T
+  use mod_125cr3ix2m16
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f4(x) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    logical(b1), value :: x
+
+    Out_0001 = f4(x = x)
+
+  end function bind_c_f4
+  !........................................
+
+end module bind_c_mod_125cr3ix2m16
@@ -0,0 +1,23 @@
+module bind_c_mod_ad86iyzgydyo
+
+  use, intrinsic :: ISO_C_Binding, only : c64 => C_DOUBLE_COMPLEX
+  use mod_ad86iyzgydyo
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f5(x) bind(c) result(y)
+
+    implicit none
+
+    complex(c64) :: y
+    complex(c64), value :: x
+
+    y = f5(x = x)
+
+  end function bind_c_f5
+  !........................................
+
+end module bind_c_mod_ad86iyzgydyo
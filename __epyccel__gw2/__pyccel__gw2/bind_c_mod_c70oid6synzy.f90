@@ -0,0 +1,23 @@
+module bind_c_mod_c70oid6synzy
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_c70oid6synzy
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f1(x) bind(c) result(y)
+
+    implicit none
+
+    integer(i64) :: y
+    integer(i64), value :: x
+
+    y = f1(x = x)
+
+  end function bind_c_f1
+  !........................................
+
+end module bind_c_mod_c70oid6synzy
@@ -0,0 +1,24 @@
+module bind_c_mod_riabkl1mjtwc
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+  use mod_riabkl1mjtwc
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f3(x, y) bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: x
+    real(f64), value :: y
+
+    Out_0001 = f3(x = x, y = y)
+
+  end function bind_c_f3
+  !........................................
+
+end module bind_c_mod_riabkl1mjtwc
@@ -0,0 +1,29 @@
+module bind_c_mod_uw51wv9wwubi
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , c_ptr , f64 => &
+        C_DOUBLE , i64 => C_INT64_T
+  use mod_uw51wv9wwubi
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f5(bound_x, bound_x_shape_1, bound_x_stride_1, m1) &
+        bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: m1
+    real(f64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call f5(x = x(1_i64::bound_x_stride_1), m1 = m1)
+
+  end subroutine bind_c_f5
+  !........................................
+
+end module bind_c_mod_uw51wv9wwubi
@@ -0,0 +1,26 @@
+module bind_c_mod_ymtggmilqylb
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use mod_ymtggmilqylb
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f6(x, y, z) bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    integer(i64), value :: x
+    real(f64), value :: y
+    integer(i64), value :: z
+
+    Out_0001 = f6(x = x, y = y, z = z)
+
+  end function bind_c_f6
+  !........................................
+
+end module bind_c_mod_ymtggmilqylb
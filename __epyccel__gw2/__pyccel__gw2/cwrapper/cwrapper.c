@@ -0,0 +1,360 @@
+/* -------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file  */
+/* or go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details. */
+/* -------------------------------------------------------------------------------------- */
+
+#include "cwrapper.h"
+#include <stdarg.h>
+
+
+
+/* Casting python object to c type
+ *
+ * Reference of the used c python api function
+ * --------------------------------------------
+ * https://docs.python.org/3/c-api/complex.html#c.PyComplex_RealAsDouble
+ * https://docs.python.org/3/c-api/complex.html#c.PyComplex_ImagAsDouble
+ */
+float complex PyComplex_to_Complex64(PyObject *object)
+{
+	float complex	c;
+
+	// https://numpy.org/doc/1.17/reference/c-api.array.html#c.PyArray_IsScalar
+	// https://numpy.org/doc/stable/reference/c-api/array.html#c.PyArray_ScalarAsCtype
+	if (PyArray_IsScalar(object, Complex64))
+    {
+		PyArray_ScalarAsCtype(object, &c);
+    }
+	else
+	{
+		float real_part = (float)PyComplex_RealAsDouble(object);
+		float imag_part = (float)PyComplex_ImagAsDouble(object);
+
+		c = real_part + imag_part * _Complex_I;
+	}
+	return	c;
+}
+//-----------------------------------------------------//
+double complex	PyComplex_to_Complex128(PyObject *object)
+{
+	double	real_part;
+	double	imag_part;
+
+	real_part = PyComplex_RealAsDouble(object);
+	imag_part = PyComplex_ImagAsDouble(object);
+
+	return real_part + imag_part * _Complex_I;
+}
+
+
+/* casting c type to python object
+ *
+ * reference of the used c/python api function
+ * ---------------------------------------------------
+ * https://numpy.org/doc/stable/reference/c-api/array.html?highlight=pyarray_scalar#c.PyArray_Scalar
+ * https://docs.python.org/3/c-api/complex.html#c.PyComplex_FromDoubles
+ * https://docs.python.org/3/c-api/float.html#c.PyFloat_FromDouble
+ * https://docs.python.org/3/c-api/long.html#c.PyLong_FromLongLong
+ */
+
+PyObject	*Complex128_to_PyComplex(double complex *c)
+{
+	double		real_part;
+	double		imag_part;
+
+	real_part = creal(*c);
+	imag_part = cimag(*c);
+	return PyComplex_FromDoubles(real_part, imag_part);
+}
+//-----------------------------------------------------//
+PyObject	*Complex128_to_NumpyComplex(double complex *c)
+{
+    return PyArray_Scalar(c, PyArray_DescrFromType(NPY_COMPLEX128), NULL);
+}
+//-----------------------------------------------------//
+PyObject	*Complex64_to_NumpyComplex(float complex *c)
+{
+    return PyArray_Scalar(c, PyArray_DescrFromType(NPY_COMPLEX64), NULL);
+}
+//-----------------------------------------------------//
+PyObject	*Bool_to_PyBool(bool *b)
+{
+	return (*b) ? Py_True : Py_False;
+}
+//-----------------------------------------------------//
+PyObject	*Int64_to_PyLong(int64_t *i)
+{
+	return PyLong_FromLongLong((long long) *i);
+}
+//-----------------------------------------------------//
+PyObject	*Int32_to_PyLong(int32_t *i)
+{
+	return PyLong_FromLongLong((long long) *i);
+}
+//-----------------------------------------------------//
+PyObject	*Int64_to_NumpyLong(int64_t *i)
+{
+    return PyArray_Scalar(i, PyArray_DescrFromType(NPY_INT64), NULL);
+}
+//-----------------------------------------------------//
+PyObject	*Int32_to_NumpyLong(int32_t *i)
+{
+    return PyArray_Scalar(i, PyArray_DescrFromType(NPY_INT32), NULL);
+}
+//-----------------------------------------------------//
+PyObject	*Int16_to_NumpyLong(int16_t *i)
+{
+    return PyArray_Scalar(i, PyArray_DescrFromType(NPY_INT16), NULL);
+}
+//--------------------------------------------------------//
+PyObject	*Int8_to_NumpyLong(int8_t *i)
+{
+    return PyArray_Scalar(i, PyArray_DescrFromType(NPY_INT8), NULL);
+}
+//--------------------------------------------------------//
+PyObject	*Double_to_PyDouble(double *d)
+{
+	return PyFloat_FromDouble(*d);
+}
+//--------------------------------------------------------//
+PyObject	*Double_to_NumpyDouble(double *d)
+{
+    return PyArray_Scalar(d, PyArray_DescrFromType(NPY_DOUBLE), NULL);
+}
+//--------------------------------------------------------//
+PyObject	*Float_to_NumpyDouble(float *d)
+{
+    return PyArray_Scalar(d, PyArray_DescrFromType(NPY_FLOAT), NULL);
+}
+
+
+/*
+ * Functions : Numpy array handling functions
+ */
+
+bool get_fortran_array_layout(PyArrayObject* a, int64_t shape[], int64_t strides[], bool c_order)
+{
+    int nd = PyArray_NDIM(a);
+    npy_intp* np_shape = PyArray_SHAPE(a);
+    npy_intp* np_strides = PyArray_STRIDES(a);
+    npy_intp itemsize = PyArray_ITEMSIZE(a);
+
+    // Number of elements between consecutive elements of each dimension in memory order
+    int64_t elem_strides[NPY_MAXDIMS];
+    // Index (in memory order) of the slowest dimension containing several elements
+    int slowest = -1;
+    bool is_empty = false;
+
+    for (int j = 0; j < nd; ++j) {
+        int i = c_order ? nd - 1 - j : j;
+        shape[i] = np_shape[i];
+        is_empty = is_empty || np_shape[i] == 0;
+    }
+
+    if (is_empty) {
+        // The data is never accessed so describe a contiguous array
+        for (int j = 0; j < nd; ++j) {
+            int i = c_order ? nd - 1 - j : j;
+            int i_prev = c_order ? nd - j : j - 1;
+            strides[i] = (j == 0 || shape[i_prev] == 0) ? 1 : shape[i_prev];
+        }
+        return true;
+    }
+
+    for (int j = 0; j < nd; ++j) {
+        int i = c_order ? nd - 1 - j : j;
+        if (np_shape[i] > 1) {
+            if (np_strides[i] <= 0 || np_strides[i] % itemsize != 0)
+                return false;
+            elem_strides[j] = np_strides[i] / itemsize;
+            slowest = j;
+        }
+    }
+
+    // The strides of dimensions containing a single element are never used to
+    // access the data so they are chosen to satisfy the conditions below
+    for (int j = slowest + 1; j < nd; ++j) {
+        if (slowest < 0)
+            elem_strides[j] = 1;
+        else if (slowest == 0)
+            elem_strides[j] = (shape[c_order ? nd - 1 : 0] - 1) * elem_strides[0] + 1;
+        else
+            elem_strides[j] = shape[c_order ? nd - 1 - slowest : slowest] * elem_strides[slowest];
+    }
+    for (int j = slowest - 1; j >= 0; --j) {
+        int i = c_order ? nd - 1 - j : j;
+        if (np_shape[i] <= 1)
+            elem_strides[j] = (j == 0) ? 1 : elem_strides[j+1];
+    }
+
+    // Each dimension of the block of memory must contain the corresponding dimension of the array
+    for (int j = 1; j < nd; ++j) {
+        int i_prev = c_order ? nd - j : j - 1;
+        if (j == 1) {
+            if (elem_strides[1] < (shape[i_prev] - 1) * elem_strides[0] + 1)
+                return false;
+        }
+        else if (elem_strides[j] % elem_strides[j-1] != 0 ||
+                 elem_strides[j] / elem_strides[j-1] < shape[i_prev]) {
+            return false;
+        }
+    }
+
+    for (int j = 0; j < nd; ++j) {
+        int i = c_order ? nd - 1 - j : j;
+        strides[i] = j < 2 ? elem_strides[j] : elem_strides[j] / elem_strides[j-1];
+    }
+    return true;
+}
+
+void get_strides_and_shape_from_numpy_array(PyObject* arr, int64_t shape[], int64_t strides[], bool c_order)
+{
+    PyArrayObject* a = (PyArrayObject*)(arr);
+
+    if (PyArray_NDIM(a) == 1) {
+        shape[0] = PyArray_DIM(a, 0);
+        strides[0] = PyArray_STRIDE(a, 0) / PyArray_ITEMSIZE(a);
+    }
+    else {
+        // The layout was checked when the argument type was checked
+        get_fortran_array_layout(a, shape, strides, c_order);
+    }
+}
+
+/*
+ * Functions : Argument parsing functions
+ */
+
+/*
+ * Find the index of a keyword in the tuple of keyword names.
+ * Keywords passed at a call site are interned by the interpreter so
+ * pointers are compared first. A string comparison is only used if
+ * the pointer comparison fails (e.g. for keywords built at runtime).
+ * Returns -1 if the keyword is not found.
+ */
+static Py_ssize_t find_keyword(PyObject* kwnames, Py_ssize_t n_kwargs, PyObject* key, const char* name)
+{
+    for (Py_ssize_t i = 0; i < n_kwargs; ++i) {
+        if (PyTuple_GET_ITEM(kwnames, i) == key) {
+            return i;
+        }
+    }
+    for (Py_ssize_t i = 0; i < n_kwargs; ++i) {
+        if (PyUnicode_CompareWithASCIIString(PyTuple_GET_ITEM(kwnames, i), name) == 0) {
+            return i;
+        }
+    }
+    return -1;
+}
+
+bool pyccel_parse_fastcall(PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames,
+        const char* const kwlist[], PyObject* kwlist_interned[],
+        Py_ssize_t n_required, Py_ssize_t n_expected, ...)
+{
+    Py_ssize_t n_kwargs = (kwnames == NULL ? 0 : PyTuple_GET_SIZE(kwnames));
+    Py_ssize_t n_found = 0;
+    va_list outputs;
+
+    if (nargs > n_expected) {
+        PyErr_Format(PyExc_TypeError, "function takes at most %zd positional arguments (%zd given)",
+                n_expected, nargs);
+        return false;
+    }
+
+    if (n_kwargs > 0 && n_expected > 0 && kwlist_interned[n_expected-1] == NULL) {
+        for (Py_ssize_t i = 0; i < n_expected; ++i) {
+            if (kwlist_interned[i] == NULL) {
+                kwlist_interned[i] = PyUnicode_InternFromString(kwlist[i]);
+                if (kwlist_interned[i] == NULL) {
+                    return false;
+                }
+            }
+        }
+    }
+
+    va_start(outputs, n_expected);
+    for (Py_ssize_t i = 0; i < n_expected; ++i) {
+        PyObject** out = va_arg(outputs, PyObject**);
+        PyObject* value = (i < nargs ? args[i] : NULL);
+        if (n_kwargs > n_found) {
+            Py_ssize_t k = find_keyword(kwnames, n_kwargs, kwlist_interned[i], kwlist[i]);
+            if (k >= 0) {
+                if (value != NULL) {
+                    PyErr_Format(PyExc_TypeError, "argument for function given by name ('%s') and position (%zd)",
+                            kwlist[i], i+1);
+                    va_end(outputs);
+                    return false;
+                }
+                value = args[nargs + k];
+                n_found++;
+            }
+        }
+        if (value != NULL) {
+            *out = value;
+        }
+        else if (i < n_required) {
+            PyErr_Format(PyExc_TypeError, "function missing required argument '%s' (pos %zd)",
+                    kwlist[i], i+1);
+            va_end(outputs);
+            return false;
+        }
+    }
+    va_end(outputs);
+
+    if (n_found < n_kwargs) {
+        for (Py_ssize_t k = 0; k < n_kwargs; ++k) {
+            PyObject* key = PyTuple_GET_ITEM(kwnames, k);
+            bool expected = false;
+            for (Py_ssize_t i = 0; i < n_expected && !expected; ++i) {
+                expected = (PyUnicode_CompareWithASCIIString(key, kwlist[i]) == 0);
+            }
+            if (!expected) {
+                PyErr_Format(PyExc_TypeError, "'%U' is an invalid keyword argument for this function", key);
+                return false;
+            }
+        }
+    }
+    return true;
+}
+
+void capsule_cleanup(PyObject *capsule) {
+    void *memory = PyCapsule_GetPointer(capsule, NULL);
+    // TODO: Correct free method. See #2001
+#ifndef __INTEL_LLVM_COMPILER
+    free(memory);
+#endif
+}
+
+#if defined(WIN32) && (PyArray_RUNTIME_VERSION >= NPY_2_0_API_VERSION)
+PyObject* to_pyarray(int nd, enum NPY_TYPES typenum, void* data, int32_t shape[], bool c_order, bool release_memory)
+#else
+PyObject* to_pyarray(int nd, enum NPY_TYPES typenum, void* data, int64_t shape[], bool c_order, bool release_memory)
+#endif
+{
+    int FLAGS;
+    if (nd == 1) {
+        FLAGS = NPY_ARRAY_F_CONTIGUOUS | NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_WRITEABLE;
+    }
+    else if (c_order) {
+        FLAGS = NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_WRITEABLE;
+    }
+    else {
+        FLAGS = NPY_ARRAY_F_CONTIGUOUS | NPY_ARRAY_WRITEABLE;
+    }
+
+    npy_intp npy_shape[nd];
+
+    for (int i=0; i<nd; ++i) {
+        npy_shape[i] = shape[i];
+    }
+
+    PyObject* arr = PyArray_NewFromDescr(&PyArray_Type, PyArray_DescrFromType(typenum),
+                                         nd, npy_shape, NULL, data, FLAGS, NULL);
+    if (release_memory) {
+        // Add a capsule base to ensure that memory is freed.
+        PyObject* base = PyCapsule_New(data, NULL, capsule_cleanup);
+        PyArray_SetBaseObject((PyArrayObject*)arr, base);
+    }
+    return arr;
+}
+
@@ -0,0 +1,29 @@
+module mod_125cr3ix2m16
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f4(x) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    logical(b1), value :: x
+
+    if (x) then
+      Out_0001 = 1_i64
+      return
+    else
+      Out_0001 = 2_i64
+      return
+    end if
+
+  end function f4
+  !........................................
+
+end module mod_125cr3ix2m16
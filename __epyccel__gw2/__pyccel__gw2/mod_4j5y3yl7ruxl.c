@@ -0,0 +1,10 @@
+#include "mod_4j5y3yl7ruxl.h"
+
+
+/*........................................*/
+double dict_arg(const hmap_int64_t_double a, int64_t k)
+{
+    return hmap_int64_t_double_get_with_default(&a, k, -1.0) + hmap_int64_t_double_get_with_default(&a, k + INT64_C(1), -1.0);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_5J5YIRATWVH9_H
+#define MOD_5J5YIRATWVH9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(double c);
+#endif // mod_5j5yiratwvh9_H
@@ -0,0 +1,24 @@
+module mod_ad86iyzgydyo
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c64 => &
+        C_DOUBLE_COMPLEX
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f5(x) result(y)
+
+    implicit none
+
+    complex(c64) :: y
+    complex(c64), value :: x
+
+    y = x - 1_i64
+    return
+
+  end function f5
+  !........................................
+
+end module mod_ad86iyzgydyo
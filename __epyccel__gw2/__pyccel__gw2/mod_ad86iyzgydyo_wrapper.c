@@ -0,0 +1,97 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_AD86IYZGYDYO_WRAPPER
+
+#include "mod_ad86iyzgydyo_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f5_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    double complex x;
+    double complex y;
+    PyObject* y_obj;
+    x_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 1, &x_obj))
+    {
+        return NULL;
+    }
+    x = _Complex_I;
+    if (x_obj != Py_None)
+    {
+        if (PyIs_NativeComplex(x_obj))
+        {
+            x = PyComplex_to_Complex128(x_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type complex for argument x");
+            return NULL;
+        }
+    }
+    y = bind_c_f5(x);
+    y_obj = Complex128_to_PyComplex(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ad86iyzgydyo_methods[] = {
+    {
+        "f5",
+        (PyCFunction)bind_c_f5_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ad86iyzgydyo_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ad86iyzgydyo",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ad86iyzgydyo_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ad86iyzgydyo(void)
+{
+    PyObject* mod;
+    static void* Pymod_ad86iyzgydyo_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ad86iyzgydyo_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ad86iyzgydyo_API, "mod_ad86iyzgydyo._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
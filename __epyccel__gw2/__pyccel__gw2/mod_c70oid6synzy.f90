@@ -0,0 +1,23 @@
+module mod_c70oid6synzy
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f1(x) result(y)
+
+    implicit none
+
+    integer(i64) :: y
+    integer(i64), value :: x
+
+    y = x - 1_i64
+    return
+
+  end function f1
+  !........................................
+
+end module mod_c70oid6synzy
@@ -0,0 +1,96 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_C70OID6SYNZY_WRAPPER
+
+#include "mod_c70oid6synzy_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    int64_t x;
+    int64_t y;
+    PyObject* y_obj;
+    x_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 1, &x_obj))
+    {
+        return NULL;
+    }
+    x = INT64_C(1);
+    if (x_obj != Py_None)
+    {
+        if (PyIs_NativeInt(x_obj))
+        {
+            x = PyInt64_to_Int64(x_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument x");
+            return NULL;
+        }
+    }
+    y = bind_c_f1(x);
+    y_obj = Int64_to_PyLong(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_c70oid6synzy_methods[] = {
+    {
+        "f1",
+        (PyCFunction)bind_c_f1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_c70oid6synzy_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_c70oid6synzy",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_c70oid6synzy_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_c70oid6synzy(void)
+{
+    PyObject* mod;
+    static void* Pymod_c70oid6synzy_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_c70oid6synzy_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_c70oid6synzy_API, "mod_c70oid6synzy._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
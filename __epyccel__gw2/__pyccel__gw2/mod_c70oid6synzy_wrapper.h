@@ -0,0 +1,40 @@
+#ifndef MOD_C70OID6SYNZY_WRAPPER_H
+#define MOD_C70OID6SYNZY_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_C70OID6SYNZY_WRAPPER
+
+int64_t bind_c_f1(int64_t);
+
+#else
+
+static void** Pymod_c70oid6synzy_API;
+
+
+/*........................................*/
+static int mod_c70oid6synzy_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw2")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_c70oid6synzy_API = (void**)PyCapsule_Import("mod_c70oid6synzy._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_c70oid6synzy_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_C70OID6SYNZY_WRAPPER_H
@@ -0,0 +1,15 @@
+#include "mod_dx6vgr5rt0bq.h"
+
+
+/*........................................*/
+int64_t get_default_str_keys(void)
+{
+    hmap_cstr_int64_t a = {0};
+    int64_t Out_0001;
+    a = c_init(hmap_cstr_int64_t, {{"a", INT64_C(1)}, {"b", INT64_C(2)}});
+    Out_0001 = hmap_cstr_int64_t_get_with_default(&a, "c", INT64_C(4));
+    hmap_cstr_int64_t_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
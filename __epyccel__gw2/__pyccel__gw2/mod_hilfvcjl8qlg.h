@@ -0,0 +1,11 @@
+#ifndef MOD_HILFVCJL8QLG_H
+#define MOD_HILFVCJL8QLG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(void);
+#endif // mod_hilfvcjl8qlg_H
@@ -0,0 +1,11 @@
+#ifndef MOD_R5060IIUBQFS_H
+#define MOD_R5060IIUBQFS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double first(t_ndarray x);
+#endif // mod_r5060iiubqfs_H
@@ -0,0 +1,24 @@
+module mod_riabkl1mjtwc
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f3(x, y) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: x
+    real(f64), value :: y
+
+    Out_0001 = x + y
+    return
+
+  end function f3
+  !........................................
+
+end module mod_riabkl1mjtwc
@@ -0,0 +1,13 @@
+#include "mod_rtcfr80vljav.h"
+
+
+/*........................................*/
+int64_t set_default(hmap_int64_t_double* a, double* b, double* c)
+{
+    (*a) = c_init(hmap_int64_t_double, {{INT64_C(1), 1.0}, {INT64_C(2), 2.0}});
+    (*b) = hmap_int64_t_double_setdefault(a, INT64_C(1), 3.0);
+    (*c) = hmap_int64_t_double_setdefault(a, INT64_C(3), 4.0);
+    return 0;
+}
+/*........................................*/
+
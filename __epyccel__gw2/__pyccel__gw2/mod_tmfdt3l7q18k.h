@@ -0,0 +1,11 @@
+#ifndef MOD_TMFDT3L7Q18K_H
+#define MOD_TMFDT3L7Q18K_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(double c);
+#endif // mod_tmfdt3l7q18k_H
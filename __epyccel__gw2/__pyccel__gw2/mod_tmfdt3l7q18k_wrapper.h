@@ -0,0 +1,40 @@
+#ifndef MOD_TMFDT3L7Q18K_WRAPPER_H
+#define MOD_TMFDT3L7Q18K_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_tmfdt3l7q18k.h"
+
+
+#ifdef MOD_TMFDT3L7Q18K_WRAPPER
+
+
+#else
+
+static void** Pymod_tmfdt3l7q18k_API;
+
+
+/*........................................*/
+static int mod_tmfdt3l7q18k_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw2")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_tmfdt3l7q18k_API = (void**)PyCapsule_Import("mod_tmfdt3l7q18k._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_tmfdt3l7q18k_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_TMFDT3L7Q18K_WRAPPER_H
@@ -0,0 +1,108 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_UW51WV9WWUBI_WRAPPER
+
+#include "mod_uw51wv9wwubi_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f5_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* m1_obj;
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    int64_t x_strides[1];
+    int64_t m1;
+    m1_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        "m1",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 2, &x_obj, &m1_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    m1 = INT64_C(2);
+    if (m1_obj != Py_None)
+    {
+        if (PyIs_NativeInt(m1_obj))
+        {
+            m1 = PyInt64_to_Int64(m1_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument m1");
+            return NULL;
+        }
+    }
+    bind_c_f5(x_data, x_shape[INT64_C(0)], x_strides[INT64_C(0)], m1);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_uw51wv9wwubi_methods[] = {
+    {
+        "f5",
+        (PyCFunction)bind_c_f5_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_uw51wv9wwubi_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_uw51wv9wwubi",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_uw51wv9wwubi_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_uw51wv9wwubi(void)
+{
+    PyObject* mod;
+    static void* Pymod_uw51wv9wwubi_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_uw51wv9wwubi_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_uw51wv9wwubi_API, "mod_uw51wv9wwubi._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,13 @@
+#ifndef MOD_VYWPZPMLLABZ_H
+#define MOD_VYWPZPMLLABZ_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t f(bool b);
+#endif // mod_vywpzpmllabz_H
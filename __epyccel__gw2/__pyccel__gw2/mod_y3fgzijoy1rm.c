@@ -0,0 +1,21 @@
+#include "mod_y3fgzijoy1rm.h"
+
+
+/*........................................*/
+t_ndarray f(void)
+{
+    int64_t i;
+    t_ndarray x = {.raw_data = NULL};
+    for (i = INT64_C(0); i < INT64_C(3); i += INT64_C(1))
+    {
+        if (x.raw_data != NULL)
+        {
+            free_array(&x);
+        }
+        x = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+        array_fill(i, x);
+    }
+    return x;
+}
+/*........................................*/
+
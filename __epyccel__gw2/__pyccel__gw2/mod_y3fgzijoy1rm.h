@@ -0,0 +1,11 @@
+#ifndef MOD_Y3FGZIJOY1RM_H
+#define MOD_Y3FGZIJOY1RM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray f(void);
+#endif // mod_y3fgzijoy1rm_H
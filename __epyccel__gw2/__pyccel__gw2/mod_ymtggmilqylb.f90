@@ -0,0 +1,26 @@
+module mod_ymtggmilqylb
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f6(x, y, z) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    integer(i64), value :: x
+    real(f64), value :: y
+    integer(i64), value :: z
+
+    Out_0001 = x + y * z
+    return
+
+  end function f6
+  !........................................
+
+end module mod_ymtggmilqylb
@@ -0,0 +1,125 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_YMTGGMILQYLB_WRAPPER
+
+#include "mod_ymtggmilqylb_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f6_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    PyObject* z_obj;
+    int64_t x;
+    double y;
+    int64_t z;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    y_obj = Py_None;
+    z_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        "z",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 3, &x_obj, &y_obj, &z_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(x_obj))
+    {
+        x = PyInt64_to_Int64(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument x");
+        return NULL;
+    }
+    y = 2.0;
+    if (y_obj != Py_None)
+    {
+        if (PyIs_NativeFloat(y_obj))
+        {
+            y = PyDouble_to_Double(y_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument y");
+            return NULL;
+        }
+    }
+    z = INT64_C(3);
+    if (z_obj != Py_None)
+    {
+        if (PyIs_NativeInt(z_obj))
+        {
+            z = PyInt64_to_Int64(z_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument z");
+            return NULL;
+        }
+    }
+    Out_0001 = bind_c_f6(x, y, z);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ymtggmilqylb_methods[] = {
+    {
+        "f6",
+        (PyCFunction)bind_c_f6_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ymtggmilqylb_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ymtggmilqylb",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ymtggmilqylb_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ymtggmilqylb(void)
+{
+    PyObject* mod;
+    static void* Pymod_ymtggmilqylb_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ymtggmilqylb_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ymtggmilqylb_API, "mod_ymtggmilqylb._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
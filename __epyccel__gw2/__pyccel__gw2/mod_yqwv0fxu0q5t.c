@@ -0,0 +1,14 @@
+#include "mod_yqwv0fxu0q5t.h"
+
+
+/*........................................*/
+int64_t dict_pop_arg(hmap_int64_t_int64_t* a, int64_t k)
+{
+    int64_t b;
+    int64_t c;
+    b = hmap_int64_t_int64_t_pop_with_default(a, k, INT64_C(0));
+    c = hmap_int64_t_int64_t_setdefault(a, INT64_C(2) * k, b);
+    return b + c;
+}
+/*........................................*/
+
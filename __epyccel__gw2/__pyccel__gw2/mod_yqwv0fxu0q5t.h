@@ -0,0 +1,30 @@
+#ifndef MOD_YQWV0FXU0Q5T_H
+#define MOD_YQWV0FXU0Q5T_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_DICT_HMAP_INT64_T_INT64_T
+#define _TOOLS_DICT_HMAP_INT64_T_INT64_T
+#define i_type hmap_int64_t_int64_t
+#define i_key int64_t
+#define i_val int64_t
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_INT64_T
+
+#ifndef _TOOLS_DICT_HMAP_INT64_T_INT64_T
+#define _TOOLS_DICT_HMAP_INT64_T_INT64_T
+#define i_type hmap_int64_t_int64_t
+#define i_key int64_t
+#define i_val int64_t
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_INT64_T
+
+
+
+
+int64_t dict_pop_arg(hmap_int64_t_int64_t* a, int64_t k);
+#endif // mod_yqwv0fxu0q5t_H
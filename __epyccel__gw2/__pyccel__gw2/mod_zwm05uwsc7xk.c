@@ -0,0 +1,29 @@
+#include "mod_zwm05uwsc7xk.h"
+
+
+/*........................................*/
+double f(t_ndarray x)
+{
+    int64_t i;
+    double array_dummy[INT64_C(3)];
+    t_ndarray y = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(3)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    double s;
+    s = 0.0;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        array_fill((double)0.0, y);
+        y.nd_double[INT64_C(0)] = GET_ELEMENT(x, nd_double, i);
+        y.nd_double[INT64_C(2)] = INT64_C(2) * GET_ELEMENT(x, nd_double, i);
+        s += numpy_sum_float64(y);
+    }
+    return s;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_ZWM05UWSC7XK_H
+#define MOD_ZWM05UWSC7XK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f(t_ndarray x);
+#endif // mod_zwm05uwsc7xk_H
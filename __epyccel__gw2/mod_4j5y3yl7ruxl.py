@@ -0,0 +1,2 @@
+def dict_arg(a : 'const dict[int, float]', k : int):
+    return a.get(k, -1.0) + a.get(k + 1, -1.0)
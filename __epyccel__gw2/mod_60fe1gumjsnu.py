@@ -0,0 +1,6 @@
+@stack_array('x')
+def f():
+    import numpy as np
+    for i in range(3):
+        x = np.ones(i, dtype=int)
+    return x.sum()
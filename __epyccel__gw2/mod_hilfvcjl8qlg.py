@@ -0,0 +1,5 @@
+def f():
+    import numpy as np
+    for i in range(3):
+        x = np.ones(i, dtype=int)
+    return x.sum()
@@ -0,0 +1,3 @@
+@contiguous('x')
+def first(x : 'float[:]'):
+    return x[0]
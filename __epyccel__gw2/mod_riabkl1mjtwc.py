@@ -0,0 +1,2 @@
+def f3(x  : 'float' =  1.5, y  : 'float' =  2.5):
+    return x+y
@@ -0,0 +1,5 @@
+def set_default():
+    a = {1: 1.0, 2:2.0}
+    b = a.setdefault(1, 3.0)
+    c = a.setdefault(3, 4.0)
+    return a, b, c
@@ -0,0 +1,4 @@
+def dict_pop_arg(a : 'dict[int, int]', k : int):
+    b = a.pop(k, 0)
+    c = a.setdefault(2 * k, b)
+    return b + c
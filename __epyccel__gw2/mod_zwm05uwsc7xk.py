@@ -0,0 +1,9 @@
+def f(x : 'float[:]'):
+    import numpy as np
+    s = 0.0
+    for i in range(x.shape[0]):
+        y = np.zeros(3)
+        y[0] = x[i]
+        y[2] = 2 * x[i]
+        s += y.sum()
+    return s
@@ -0,0 +1,24 @@
+module bind_c_mod_98uxd0mjvx7x
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_98uxd0mjvx7x
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f7(x, y) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: x
+    integer(i64), value :: y
+
+    Out_0001 = f7(x = x, y = y)
+
+  end function bind_c_f7
+  !........................................
+
+end module bind_c_mod_98uxd0mjvx7x
@@ -0,0 +1,28 @@
+module bind_c_mod_kfxp6ar7qpr8
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c_ptr , &
+        C_F_Pointer
+  use mod_kfxp6ar7qpr8
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f(bound_x, bound_x_shape_1, bound_x_stride_1) bind(c &
+        )
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call f(x = x(1_i64::bound_x_stride_1))
+
+  end subroutine bind_c_f
+  !........................................
+
+end module bind_c_mod_kfxp6ar7qpr8
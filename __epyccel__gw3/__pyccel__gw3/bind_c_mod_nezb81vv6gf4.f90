@@ -0,0 +1,26 @@
+module bind_c_mod_nezb81vv6gf4
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_nezb81vv6gf4
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f(a, b, c, d, x) bind(c) 
+
+    implicit none
+
+    integer(i64), intent(out) :: a
+    integer(i64), intent(out) :: b
+    integer(i64), intent(out) :: c
+    integer(i64), intent(out) :: d
+    integer(i64), intent(out) :: x
+
+    call f(a = a, b = b, c = c, d = d, x = x)
+
+  end subroutine bind_c_f
+  !........................................
+
+end module bind_c_mod_nezb81vv6gf4
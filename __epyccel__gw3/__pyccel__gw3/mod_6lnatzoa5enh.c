@@ -0,0 +1,41 @@
+#include "mod_6lnatzoa5enh.h"
+
+
+/*........................................*/
+double f(int64_t n)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    int64_t j;
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    t_ndarray e = {.raw_data = NULL};
+    double s;
+    a = array_create(2, (int64_t[]){n, n}, nd_double, false, order_c);
+    array_fill((double)0.0, a);
+    for (i = INT64_C(0); i < n; i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < n; j += INT64_C(1))
+        {
+            a.nd_double[i * a.shape[INT64_C(1)] + j] = i * n + j;
+        }
+    }
+    b = array_slicing(a, 2, new_slice(INT64_C(1), a.shape[INT64_C(0)], INT64_C(1), RANGE), new_slice(INT64_C(0), a.shape[INT64_C(1)], INT64_C(1), RANGE));
+    transpose_alias_assign(&c, a);
+    d = array_slicing(a, 1, new_slice(INT64_C(0), a.shape[INT64_C(0)], INT64_C(1), RANGE), new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT));
+    e = array_slicing(a, 1, new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT), new_slice(INT64_C(1), a.shape[INT64_C(1)], INT64_C(1), RANGE));
+    s = 0.0;
+    for (i = INT64_C(0); i < n - INT64_C(1); i += INT64_C(1))
+    {
+        s += b.nd_double[i * b.shape[INT64_C(1)] + INT64_C(2)] + c.nd_double[c.shape[INT64_C(0)] + i] + GET_ELEMENT(d, nd_double, i) + e.nd_double[i];
+    }
+    free_pointer(&e);
+    free_pointer(&d);
+    free_array(&a);
+    free_pointer(&b);
+    free_pointer(&c);
+    return s;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_6LNATZOA5ENH_H
+#define MOD_6LNATZOA5ENH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f(int64_t n);
+#endif // mod_6lnatzoa5enh_H
@@ -0,0 +1,40 @@
+#ifndef MOD_6LNATZOA5ENH_WRAPPER_H
+#define MOD_6LNATZOA5ENH_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_6lnatzoa5enh.h"
+
+
+#ifdef MOD_6LNATZOA5ENH_WRAPPER
+
+
+#else
+
+static void** Pymod_6lnatzoa5enh_API;
+
+
+/*........................................*/
+static int mod_6lnatzoa5enh_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw3")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_6lnatzoa5enh_API = (void**)PyCapsule_Import("mod_6lnatzoa5enh._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_6lnatzoa5enh_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_6LNATZOA5ENH_WRAPPER_H
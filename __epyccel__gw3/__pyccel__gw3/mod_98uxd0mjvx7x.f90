@@ -0,0 +1,24 @@
+module mod_98uxd0mjvx7x
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f7(x, y) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: x
+    integer(i64), value :: y
+
+    Out_0001 = x + y
+    return
+
+  end function f7
+  !........................................
+
+end module mod_98uxd0mjvx7x
@@ -0,0 +1,108 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_98UXD0MJVX7X_WRAPPER
+
+#include "mod_98uxd0mjvx7x_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f7_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    int64_t x;
+    int64_t y;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    y_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(x_obj))
+    {
+        x = PyInt64_to_Int64(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument x");
+        return NULL;
+    }
+    y = INT64_C(2);
+    if (y_obj != Py_None)
+    {
+        if (PyIs_NativeInt(y_obj))
+        {
+            y = PyInt64_to_Int64(y_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument y");
+            return NULL;
+        }
+    }
+    Out_0001 = bind_c_f7(x, y);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_98uxd0mjvx7x_methods[] = {
+    {
+        "f7",
+        (PyCFunction)bind_c_f7_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_98uxd0mjvx7x_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_98uxd0mjvx7x",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_98uxd0mjvx7x_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_98uxd0mjvx7x(void)
+{
+    PyObject* mod;
+    static void* Pymod_98uxd0mjvx7x_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_98uxd0mjvx7x_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_98uxd0mjvx7x_API, "mod_98uxd0mjvx7x._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_E0ZFEO44EZU0_H
+#define MOD_E0ZFEO44EZU0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void stencil(t_ndarray u, t_ndarray out);
+#endif // mod_e0zfeo44ezu0_H
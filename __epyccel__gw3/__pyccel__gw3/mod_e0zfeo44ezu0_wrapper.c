@@ -0,0 +1,102 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_E0ZFEO44EZU0_WRAPPER
+
+#include "mod_e0zfeo44ezu0_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* stencil_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* u_obj;
+    PyObject* out_obj;
+    t_ndarray u = {.raw_data = NULL};
+    t_ndarray out = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "u",
+        "out",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &u_obj, &out_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("u", u_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        u = pyarray_to_ndarray(u_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out", out_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        out = pyarray_to_ndarray(out_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    stencil(u, out);
+    free_pointer(&u);
+    free_pointer(&out);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_e0zfeo44ezu0_methods[] = {
+    {
+        "stencil",
+        (PyCFunction)stencil_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_e0zfeo44ezu0_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_e0zfeo44ezu0",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_e0zfeo44ezu0_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_e0zfeo44ezu0(void)
+{
+    PyObject* mod;
+    static void* Pymod_e0zfeo44ezu0_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_e0zfeo44ezu0_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_e0zfeo44ezu0_API, "mod_e0zfeo44ezu0._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_ET7WOSPGDQF9_H
+#define MOD_ET7WOSPGDQF9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void matvec(t_ndarray a, t_ndarray x, t_ndarray y);
+#endif // mod_et7wospgdqf9_H
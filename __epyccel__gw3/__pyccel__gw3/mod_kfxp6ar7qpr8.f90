@@ -0,0 +1,22 @@
+module mod_kfxp6ar7qpr8
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f(x) 
+
+    implicit none
+
+    integer(i64), intent(inout) :: x(0_i64:)
+
+    x(0_i64) = 3_i64
+    x(1_i64) = 3_i64
+
+  end subroutine f
+  !........................................
+
+end module mod_kfxp6ar7qpr8
@@ -0,0 +1,34 @@
+#include "mod_mod7tfle0ykl.h"
+
+
+/*........................................*/
+double f(void)
+{
+    double array_dummy[INT64_C(10)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(2), INT64_C(5)},
+        .nd=2,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t array_dummy_0001[INT64_C(4)];
+    t_ndarray y = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(2), INT64_C(2), INT64_C(1)},
+        .nd=3,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    double Out_0001;
+    array_fill((double)0.0, x);
+    array_fill((double)1.0, x);
+    array_fill((int64_t)INT64_C(0), y);
+    array_fill((int64_t)INT64_C(1), y);
+    Out_0001 = numpy_sum_float64(x) + numpy_sum_int64(y);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_MOD7TFLE0YKL_H
+#define MOD_MOD7TFLE0YKL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f(void);
+#endif // mod_mod7tfle0ykl_H
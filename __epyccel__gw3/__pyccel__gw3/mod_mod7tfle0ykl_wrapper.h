@@ -0,0 +1,40 @@
+#ifndef MOD_MOD7TFLE0YKL_WRAPPER_H
+#define MOD_MOD7TFLE0YKL_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_mod7tfle0ykl.h"
+
+
+#ifdef MOD_MOD7TFLE0YKL_WRAPPER
+
+
+#else
+
+static void** Pymod_mod7tfle0ykl_API;
+
+
+/*........................................*/
+static int mod_mod7tfle0ykl_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw3")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_mod7tfle0ykl_API = (void**)PyCapsule_Import("mod_mod7tfle0ykl._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_mod7tfle0ykl_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_MOD7TFLE0YKL_WRAPPER_H
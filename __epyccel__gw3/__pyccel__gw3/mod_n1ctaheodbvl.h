@@ -0,0 +1,10 @@
+#ifndef MOD_N1CTAHEODBVL_H
+#define MOD_N1CTAHEODBVL_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(void);
+#endif // mod_n1ctaheodbvl_H
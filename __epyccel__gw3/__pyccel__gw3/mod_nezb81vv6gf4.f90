@@ -0,0 +1,40 @@
+module mod_nezb81vv6gf4
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f(a, b, c, d, x) 
+
+    implicit none
+
+    integer(i64), intent(out) :: a
+    integer(i64), intent(out) :: b
+    integer(i64), intent(out) :: c
+    integer(i64), intent(out) :: d
+    integer(i64), intent(out) :: x
+    integer(i64) :: x_0001
+    integer(i64) :: x_0002
+    integer(i64) :: x_0003
+    integer(i64) :: x_0004
+
+    x_0001 = 3_i64 * 3_i64
+    a = x_0001 * x_0001
+    x_0002 = (8_i64 + 3_i64) * (8_i64 + 3_i64)
+    b = x_0002 * x_0002
+    x_0003 = (FLOOR((b - a)/2000.0_f64,i64)) * (FLOOR((b - a)/2000.0_f64 &
+          ,i64))
+    c = x_0003 * x_0003
+    x = 2_i64
+    x_0004 = x * x
+    d = x_0004 * x_0004
+    return
+
+  end subroutine f
+  !........................................
+
+end module mod_nezb81vv6gf4
@@ -0,0 +1,40 @@
+module mod_omffbby6zmsk
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f(a, b, c, d) 
+
+    implicit none
+
+    integer(i64), intent(out) :: a
+    integer(i64), intent(out) :: b
+    integer(i64), intent(out) :: c
+    integer(i64), intent(out) :: d
+    integer(i64) :: g
+    integer(i64) :: x
+    integer(i64) :: x_0001
+    integer(i64) :: x_0002
+    integer(i64) :: x_0003
+
+    x = 3_i64 * 3_i64
+    a = x * x
+    x_0001 = (8_i64 + 3_i64) * (8_i64 + 3_i64)
+    b = x_0001 * x_0001
+    x_0002 = (FLOOR((b - a)/2000.0_f64,i64)) * (FLOOR((b - a)/2000.0_f64 &
+          ,i64))
+    c = x_0002 * x_0002
+    g = 4_i64
+    x_0003 = g * g
+    d = x_0003 * x_0003
+    return
+
+  end subroutine f
+  !........................................
+
+end module mod_omffbby6zmsk
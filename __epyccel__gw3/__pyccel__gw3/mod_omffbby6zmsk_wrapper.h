@@ -0,0 +1,40 @@
+#ifndef MOD_OMFFBBY6ZMSK_WRAPPER_H
+#define MOD_OMFFBBY6ZMSK_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_OMFFBBY6ZMSK_WRAPPER
+
+int64_t bind_c_f(int64_t*, int64_t*, int64_t*, int64_t*);
+
+#else
+
+static void** Pymod_omffbby6zmsk_API;
+
+
+/*........................................*/
+static int mod_omffbby6zmsk_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw3")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_omffbby6zmsk_API = (void**)PyCapsule_Import("mod_omffbby6zmsk._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_omffbby6zmsk_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_OMFFBBY6ZMSK_WRAPPER_H
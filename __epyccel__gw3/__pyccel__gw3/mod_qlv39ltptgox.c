@@ -0,0 +1,29 @@
+#include "mod_qlv39ltptgox.h"
+
+
+/*........................................*/
+int64_t f(double* Out_0001, double* Out_0002)
+{
+    double array_dummy[INT64_C(4)];
+    t_ndarray arr = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(4)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&arr);
+    int64_t Dummy_0000;
+    {
+        double* restrict arr_data = arr.nd_double;
+        for (Dummy_0000 = INT64_C(0); Dummy_0000 < arr.shape[INT64_C(0)]; Dummy_0000 += INT64_C(1))
+        {
+            arr_data[Dummy_0000] = 3.14;
+        }
+    }
+    (*Out_0001) = arr.nd_double[INT64_C(0)];
+    (*Out_0002) = arr.nd_double[INT64_C(3)];
+    return 0;
+}
+/*........................................*/
+
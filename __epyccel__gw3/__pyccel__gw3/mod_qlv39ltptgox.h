@@ -0,0 +1,11 @@
+#ifndef MOD_QLV39LTPTGOX_H
+#define MOD_QLV39LTPTGOX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(double* Out_0001, double* Out_0002);
+#endif // mod_qlv39ltptgox_H
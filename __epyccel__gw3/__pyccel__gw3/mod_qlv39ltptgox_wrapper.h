@@ -0,0 +1,40 @@
+#ifndef MOD_QLV39LTPTGOX_WRAPPER_H
+#define MOD_QLV39LTPTGOX_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_qlv39ltptgox.h"
+
+
+#ifdef MOD_QLV39LTPTGOX_WRAPPER
+
+
+#else
+
+static void** Pymod_qlv39ltptgox_API;
+
+
+/*........................................*/
+static int mod_qlv39ltptgox_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw3")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_qlv39ltptgox_API = (void**)PyCapsule_Import("mod_qlv39ltptgox._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_qlv39ltptgox_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_QLV39LTPTGOX_WRAPPER_H
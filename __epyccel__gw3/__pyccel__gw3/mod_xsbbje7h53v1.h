@@ -0,0 +1,11 @@
+#ifndef MOD_XSBBJE7H53V1_H
+#define MOD_XSBBJE7H53V1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(void);
+#endif // mod_xsbbje7h53v1_H
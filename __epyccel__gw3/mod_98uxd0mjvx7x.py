@@ -0,0 +1,2 @@
+def f7(x : 'int', y : 'int' = 2):
+    return x + y
@@ -0,0 +1,6 @@
+def f():
+    import numpy as np
+    x = np.zeros((3, 7), dtype=int)
+    c = x
+    x = np.ones ((4, 5), dtype=int)
+    return c.sum()
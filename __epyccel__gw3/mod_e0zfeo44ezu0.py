@@ -0,0 +1,6 @@
+@contiguous('u', 'out')
+def stencil(u : 'float[:,:]', out : 'float[:,:]'):
+    n, m = u.shape
+    for i in range(1, n-1):
+        for j in range(1, m-1):
+            out[i, j] = 0.25 * (u[i-1, j] + u[i+1, j] + u[i, j-1] + u[i, j+1])
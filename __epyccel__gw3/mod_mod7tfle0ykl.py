@@ -0,0 +1,8 @@
+@stack_array('y')
+def f():
+    import numpy as np
+    x = np.zeros((2, 5), dtype=float)
+    x = np.ones ((2, 5), dtype=float)
+    y = np.zeros((2, 2, 1), dtype=int)
+    y = np.ones ((2, 2, 1), dtype=int)
+    return x.sum() + y.sum()
@@ -0,0 +1,3 @@
+@template(name='T', types=[float, complex])
+def my_sum(v: 'T[:]'):
+    return v.sum()
@@ -0,0 +1,17 @@
+def f():
+    @inline
+    def get_val(x : int = None , y : int = None):
+        if x is None :
+            a = 3
+        else:
+            a = x
+        if y is not None :
+            b = 4
+        else:
+            b = 5
+        return a + b
+    a = get_val(2,7)
+    b = get_val()
+    c = get_val(6)
+    d = get_val(y=0)
+    return a,b,c,d
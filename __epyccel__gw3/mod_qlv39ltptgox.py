@@ -0,0 +1,9 @@
+def f():
+    from numpy import empty
+    @inline
+    def fill_array(a : 'float[:]'):
+        for i in range(a.shape[0]):
+            a[i] = 3.14
+    arr = empty(4)
+    fill_array(arr)
+    return arr[0], arr[-1]
@@ -0,0 +1,47 @@
+module bind_c_mod_f5kfw8vvdcc6
+
+  use, intrinsic :: ISO_C_Binding, only : c64 => C_DOUBLE_COMPLEX , &
+        c_ptr , i64 => C_INT64_T , f64 => C_DOUBLE , C_F_Pointer
+  use mod_f5kfw8vvdcc6
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_my_sum_0000(bound_v, bound_v_shape_1, bound_v_stride_1 &
+        ) bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    type(c_ptr), value :: bound_v
+    integer(i64), value :: bound_v_shape_1
+    integer(i64), value :: bound_v_stride_1
+    real(f64), pointer :: v(:)
+
+    call C_F_Pointer(bound_v, v, [bound_v_shape_1 * bound_v_stride_1])
+    Out_0001 = my_sum_0000(v = v(1_i64::bound_v_stride_1))
+
+  end function bind_c_my_sum_0000
+  !........................................
+
+  !........................................
+  function bind_c_my_sum_0001(bound_v, bound_v_shape_1, bound_v_stride_1 &
+        ) bind(c) result(Out_0001)
+
+    implicit none
+
+    complex(c64) :: Out_0001
+    type(c_ptr), value :: bound_v
+    integer(i64), value :: bound_v_shape_1
+    integer(i64), value :: bound_v_stride_1
+    complex(c64), pointer :: v(:)
+
+    call C_F_Pointer(bound_v, v, [bound_v_shape_1 * bound_v_stride_1])
+    Out_0001 = my_sum_0001(v = v(1_i64::bound_v_stride_1))
+
+  end function bind_c_my_sum_0001
+  !........................................
+
+end module bind_c_mod_f5kfw8vvdcc6
@@ -0,0 +1,24 @@
+module bind_c_mod_l17e9xrnz9zy
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use mod_l17e9xrnz9zy
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f(n) bind(c) result(s)
+
+    implicit none
+
+    real(f64) :: s
+    integer(i64), value :: n
+
+    s = f(n = n)
+
+  end function bind_c_f
+  !........................................
+
+end module bind_c_mod_l17e9xrnz9zy
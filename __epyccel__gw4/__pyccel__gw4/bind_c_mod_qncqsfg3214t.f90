@@ -0,0 +1,44 @@
+module bind_c_mod_qncqsfg3214t
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , c_ptr , i64 &
+        => C_INT64_T , C_F_Pointer
+  use mod_qncqsfg3214t
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_stencil(bound_u, bound_u_shape_1, bound_u_shape_2, &
+        bound_u_stride_1, bound_u_stride_2, bound_out, &
+        bound_out_shape_1, bound_out_shape_2, bound_out_stride_1, &
+        bound_out_stride_2) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_u
+    integer(i64), value :: bound_u_shape_1
+    integer(i64), value :: bound_u_shape_2
+    integer(i64), value :: bound_u_stride_1
+    integer(i64), value :: bound_u_stride_2
+    type(c_ptr), value :: bound_out
+    integer(i64), value :: bound_out_shape_1
+    integer(i64), value :: bound_out_shape_2
+    integer(i64), value :: bound_out_stride_1
+    integer(i64), value :: bound_out_stride_2
+    real(f64), pointer :: u(:, :)
+    real(f64), pointer :: out(:, :)
+
+    call C_F_Pointer(bound_u, u, [bound_u_stride_1,bound_u_shape_1])
+    call C_F_Pointer(bound_out, out, [bound_out_stride_1, &
+          bound_out_shape_1])
+    call stencil(u = u(1_i64:bound_u_shape_2 * bound_u_stride_2 + 1_i64 &
+          - 1_i64:bound_u_stride_2, 1_i64:bound_u_shape_1 + 1_i64 - &
+          1_i64), out = out(1_i64:bound_out_shape_2 * &
+          bound_out_stride_2 + 1_i64 - 1_i64:bound_out_stride_2, 1_i64: &
+          bound_out_shape_1 + 1_i64 - 1_i64))
+
+  end subroutine bind_c_stencil
+  !........................................
+
+end module bind_c_mod_qncqsfg3214t
@@ -0,0 +1,11 @@
+from numpy import shape
+
+def stream_means(seed : 'int', means : 'float[::]'):
+    from pyccel.random import Generator
+    for s in range(0, shape(means)[0], 1):
+        rng = Generator(seed, s)
+        total = 0.0
+        for Dummy_0001 in range(0, 1000, 1):
+            total += rng.random()
+        means[s] = total / 1000
+
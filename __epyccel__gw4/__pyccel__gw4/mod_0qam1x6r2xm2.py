@@ -0,0 +1,17 @@
+from pyccel.decorators import inline
+
+def f():
+    @inline
+    def get_val(x : 'int' = None, y : 'int' = None):
+        if x is None:
+            a = 3
+        else:
+            a = x
+        if y is not None:
+            b = 4
+        else:
+            b = 5
+        return a + b
+    a = get_val(get_val(2, y = None) + 3, 7)
+    return a
+
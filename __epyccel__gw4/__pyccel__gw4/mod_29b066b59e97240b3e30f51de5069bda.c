@@ -0,0 +1,10 @@
+#include "mod_29b066b59e97240b3e30f51de5069bda.h"
+
+
+/*........................................*/
+int64_t add_two(int64_t x)
+{
+    return x + INT64_C(2);
+}
+/*........................................*/
+
@@ -0,0 +1,40 @@
+#ifndef MOD_29B066B59E97240B3E30F51DE5069BDA_WRAPPER_H
+#define MOD_29B066B59E97240B3E30F51DE5069BDA_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_29b066b59e97240b3e30f51de5069bda.h"
+
+
+#ifdef MOD_29B066B59E97240B3E30F51DE5069BDA_WRAPPER
+
+
+#else
+
+static void** Pymod_29b066b59e97240b3e30f51de5069bda_API;
+
+
+/*........................................*/
+static int mod_29b066b59e97240b3e30f51de5069bda_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw4")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_29b066b59e97240b3e30f51de5069bda_API = (void**)PyCapsule_Import("mod_29b066b59e97240b3e30f51de5069bda._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_29b066b59e97240b3e30f51de5069bda_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_29B066B59E97240B3E30F51DE5069BDA_WRAPPER_H
@@ -0,0 +1,10 @@
+#include "mod_39a8834c7d65ed79217d1d52ec402b6d.h"
+
+
+/*........................................*/
+int64_t add_two(int64_t x)
+{
+    return x + INT64_C(2);
+}
+/*........................................*/
+
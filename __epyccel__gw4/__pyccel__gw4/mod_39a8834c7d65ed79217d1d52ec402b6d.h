@@ -0,0 +1,10 @@
+#ifndef MOD_39A8834C7D65ED79217D1D52EC402B6D_H
+#define MOD_39A8834C7D65ED79217D1D52EC402B6D_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t add_two(int64_t x);
+#endif // mod_39a8834c7d65ed79217d1d52ec402b6d_H
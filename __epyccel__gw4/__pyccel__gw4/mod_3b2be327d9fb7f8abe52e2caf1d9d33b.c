@@ -0,0 +1,10 @@
+#include "mod_3b2be327d9fb7f8abe52e2caf1d9d33b.h"
+
+
+/*........................................*/
+int64_t mul_three(int64_t x)
+{
+    return x * INT64_C(3);
+}
+/*........................................*/
+
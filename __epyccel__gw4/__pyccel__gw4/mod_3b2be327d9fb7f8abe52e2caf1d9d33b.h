@@ -0,0 +1,10 @@
+#ifndef MOD_3B2BE327D9FB7F8ABE52E2CAF1D9D33B_H
+#define MOD_3B2BE327D9FB7F8ABE52E2CAF1D9D33B_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t mul_three(int64_t x);
+#endif // mod_3b2be327d9fb7f8abe52e2caf1d9d33b_H
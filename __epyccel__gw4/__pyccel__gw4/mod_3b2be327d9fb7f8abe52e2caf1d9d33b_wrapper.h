@@ -0,0 +1,40 @@
+#ifndef MOD_3B2BE327D9FB7F8ABE52E2CAF1D9D33B_WRAPPER_H
+#define MOD_3B2BE327D9FB7F8ABE52E2CAF1D9D33B_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_3b2be327d9fb7f8abe52e2caf1d9d33b.h"
+
+
+#ifdef MOD_3B2BE327D9FB7F8ABE52E2CAF1D9D33B_WRAPPER
+
+
+#else
+
+static void** Pymod_3b2be327d9fb7f8abe52e2caf1d9d33b_API;
+
+
+/*........................................*/
+static int mod_3b2be327d9fb7f8abe52e2caf1d9d33b_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw4")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_3b2be327d9fb7f8abe52e2caf1d9d33b_API = (void**)PyCapsule_Import("mod_3b2be327d9fb7f8abe52e2caf1d9d33b._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_3b2be327d9fb7f8abe52e2caf1d9d33b_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_3B2BE327D9FB7F8ABE52E2CAF1D9D33B_WRAPPER_H
@@ -0,0 +1,14 @@
+from pyccel.decorators import inline
+
+def f():
+    @inline
+    def power_4(s : 'int'):
+        x = s * s
+        return x * x
+    a = power_4(3)
+    b = power_4(8 + 3)
+    c = power_4((b - a)//2000)
+    x = 2
+    d = power_4(x)
+    return a,b,c,d,x
+
@@ -0,0 +1,29 @@
+module mod_751b3z3gq4pl
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f() result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64) :: x(0_i64:4_i64, 0_i64:1_i64)
+    integer(i64) :: y(0_i64:0_i64, 0_i64:1_i64, 0_i64:1_i64)
+
+    x = 0.0_f64
+    x = 1.0_f64
+    y = 0_i64
+    y = 1_i64
+    Out_0001 = sum(x) + sum(y)
+    return
+
+  end function f
+  !........................................
+
+end module mod_751b3z3gq4pl
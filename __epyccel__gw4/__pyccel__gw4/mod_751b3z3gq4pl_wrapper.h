@@ -0,0 +1,40 @@
+#ifndef MOD_751B3Z3GQ4PL_WRAPPER_H
+#define MOD_751B3Z3GQ4PL_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_751B3Z3GQ4PL_WRAPPER
+
+double bind_c_f(void);
+
+#else
+
+static void** Pymod_751b3z3gq4pl_API;
+
+
+/*........................................*/
+static int mod_751b3z3gq4pl_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw4")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_751b3z3gq4pl_API = (void**)PyCapsule_Import("mod_751b3z3gq4pl._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_751b3z3gq4pl_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_751B3Z3GQ4PL_WRAPPER_H
@@ -0,0 +1,40 @@
+#ifndef MOD_BA732853153BB1DFDE3EDF8E0951F47C_WRAPPER_H
+#define MOD_BA732853153BB1DFDE3EDF8E0951F47C_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_BA732853153BB1DFDE3EDF8E0951F47C_WRAPPER
+
+int64_t bind_c_mul_three(int64_t);
+
+#else
+
+static void** Pymod_ba732853153bb1dfde3edf8e0951f47c_API;
+
+
+/*........................................*/
+static int mod_ba732853153bb1dfde3edf8e0951f47c_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw4")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ba732853153bb1dfde3edf8e0951f47c_API = (void**)PyCapsule_Import("mod_ba732853153bb1dfde3edf8e0951f47c._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ba732853153bb1dfde3edf8e0951f47c_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BA732853153BB1DFDE3EDF8E0951F47C_WRAPPER_H
@@ -0,0 +1,9 @@
+
+def draw_normal(seed : 'int', loc : 'float', scale : 'float'):
+    from pyccel.random import Generator
+    rng = Generator(seed, 0)
+    x = rng.normal(0.0, 1.0)
+    y = rng.normal(loc, scale)
+    z = rng.normal(loc, scale)
+    return x,y,z
+
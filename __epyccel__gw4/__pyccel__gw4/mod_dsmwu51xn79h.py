@@ -0,0 +1,4 @@
+
+def f7(x : 'int', y : 'int' = 2):
+    return x + y
+
@@ -0,0 +1,12 @@
+from pyccel.decorators import inline
+
+def f():
+    @inline
+    def cube(s : 'int'):
+        return s * s * s
+    a = cube(3)
+    b = cube(8 + 3)
+    c = cube((b - a)//20)
+    d = cube(a)
+    return a,b,c,d
+
@@ -0,0 +1,43 @@
+module mod_f5kfw8vvdcc6
+
+  use, intrinsic :: ISO_C_Binding, only : c64 => C_DOUBLE_COMPLEX , i64 &
+        => C_INT64_T , f64 => C_DOUBLE
+
+  implicit none
+
+  interface my_sum
+    module procedure my_sum_0000
+    module procedure my_sum_0001
+  end interface
+
+  contains
+
+  !........................................
+  function my_sum_0000(v) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), intent(in) :: v(0_i64:)
+
+    Out_0001 = sum(v)
+    return
+
+  end function my_sum_0000
+  !........................................
+
+  !........................................
+  function my_sum_0001(v) result(Out_0001)
+
+    implicit none
+
+    complex(c64) :: Out_0001
+    complex(c64), intent(in) :: v(0_i64:)
+
+    Out_0001 = sum(v)
+    return
+
+  end function my_sum_0001
+  !........................................
+
+end module mod_f5kfw8vvdcc6
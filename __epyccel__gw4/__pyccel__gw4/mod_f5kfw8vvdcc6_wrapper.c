@@ -0,0 +1,153 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_F5KFW8VVDCC6_WRAPPER
+
+#include "mod_f5kfw8vvdcc6_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_my_sum_0000_wrapper(PyObject* v_obj)
+{
+    void* v_data = NULL;
+    int64_t v_shape[1];
+    int64_t v_strides[1];
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    v_data = PyArray_DATA((PyArrayObject*)(v_obj));
+    get_strides_and_shape_from_numpy_array(v_obj, v_shape, v_strides, 1);
+    Out_0001 = bind_c_my_sum_0000(v_data, v_shape[INT64_C(0)], v_strides[INT64_C(0)]);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_my_sum_0001_wrapper(PyObject* v_obj)
+{
+    void* v_data = NULL;
+    int64_t v_shape[1];
+    int64_t v_strides[1];
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    v_data = PyArray_DATA((PyArrayObject*)(v_obj));
+    get_strides_and_shape_from_numpy_array(v_obj, v_shape, v_strides, 1);
+    Out_0001 = bind_c_my_sum_0001(v_data, v_shape[INT64_C(0)], v_strides[INT64_C(0)]);
+    Out_0001_obj = Complex128_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t my_sum_type_check(PyObject* v_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(v_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(v_obj, NPY_CDOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument v");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* my_sum_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* v_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "v",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &v_obj))
+    {
+        return NULL;
+    }
+    type_indicator = my_sum_type_check(v_obj);
+    switch (type_indicator)
+    {
+        case INT64_C(0):
+        {
+            return bind_c_my_sum_0000_wrapper(v_obj);
+        }
+        case INT64_C(1):
+        {
+            return bind_c_my_sum_0001_wrapper(v_obj);
+        }
+        default:
+        {
+            PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+            return NULL;
+        }
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_f5kfw8vvdcc6_methods[] = {
+    {
+        "my_sum",
+        (PyCFunction)my_sum_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_f5kfw8vvdcc6_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_f5kfw8vvdcc6",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_f5kfw8vvdcc6_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_f5kfw8vvdcc6(void)
+{
+    PyObject* mod;
+    static void* Pymod_f5kfw8vvdcc6_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_f5kfw8vvdcc6_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_f5kfw8vvdcc6_API, "mod_f5kfw8vvdcc6._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
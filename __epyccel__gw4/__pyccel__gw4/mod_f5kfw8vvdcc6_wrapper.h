@@ -0,0 +1,43 @@
+#ifndef MOD_F5KFW8VVDCC6_WRAPPER_H
+#define MOD_F5KFW8VVDCC6_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_F5KFW8VVDCC6_WRAPPER
+
+double bind_c_my_sum_0000(void*, int64_t, int64_t);
+double complex bind_c_my_sum_0001(void*, int64_t, int64_t);
+
+#else
+
+static void** Pymod_f5kfw8vvdcc6_API;
+
+
+/*........................................*/
+static int mod_f5kfw8vvdcc6_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw4")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_f5kfw8vvdcc6_API = (void**)PyCapsule_Import("mod_f5kfw8vvdcc6._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_f5kfw8vvdcc6_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_F5KFW8VVDCC6_WRAPPER_H
@@ -0,0 +1,12 @@
+from pyccel.decorators import stack_array
+
+@stack_array('y')
+def f():
+    from numpy import zeros, ones
+    from numpy import sum
+    x = zeros((2, 5), dtype = float, order='C')
+    x = ones((2, 5), dtype = float, order='C')
+    y = zeros((2, 2, 1), dtype = int, order='C')
+    y = ones((2, 2, 1), dtype = int, order='C')
+    return sum(x) + sum(y)
+
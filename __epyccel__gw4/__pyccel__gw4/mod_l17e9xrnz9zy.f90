@@ -0,0 +1,48 @@
+module mod_l17e9xrnz9zy
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f(n) result(s)
+
+    implicit none
+
+    real(f64) :: s
+    integer(i64), value :: n
+    real(f64), allocatable, target :: a(:, :)
+    integer(i64) :: i
+    integer(i64) :: j
+    real(f64), pointer :: b(:, :)
+    real(f64), pointer :: c(:, :)
+    real(f64), pointer :: d(:)
+    real(f64), pointer :: e(:)
+
+    allocate(a(0:n - 1_i64, 0:n - 1_i64))
+    a = 0.0_f64
+    do i = 0_i64, n - 1_i64
+      do j = 0_i64, n - 1_i64
+        a(j, i) = i * n + j
+      end do
+    end do
+    b(0:, 0:) => a(:, 1_i64:)
+    c(0:, 0:) => a
+    d(0:) => a(1_i64, :)
+    e(0:) => a(1_i64:, 1_i64)
+    s = 0.0_f64
+    do i = 0_i64, n - 1_i64 - 1_i64
+      s = s + (b(2_i64, i) + c(i, 1_i64) + d(i) + e(i))
+    end do
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end function f
+  !........................................
+
+end module mod_l17e9xrnz9zy
@@ -0,0 +1,6 @@
+
+def f5(x : 'float[::]', m1 : 'int' = 2):
+    x[::] = 0.0
+    for i in range(0, m1, 1):
+        x[i] = i * 1.0
+
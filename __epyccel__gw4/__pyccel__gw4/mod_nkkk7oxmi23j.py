@@ -0,0 +1,8 @@
+
+def f():
+    from numpy import ones
+    from numpy import sum
+    for i in range(0, 3, 1):
+        x = ones((i), dtype = int)
+    return sum(x)
+
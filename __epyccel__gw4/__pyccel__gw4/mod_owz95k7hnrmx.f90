@@ -0,0 +1,35 @@
+module mod_owz95k7hnrmx
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine matvec(a, x, y) 
+
+    implicit none
+
+    real(f64), intent(in) :: a(0_i64:, 0_i64:)
+    real(f64), intent(in) :: x(0_i64:)
+    real(f64), intent(inout) :: y(0_i64:)
+    integer(i64) :: n
+    integer(i64) :: m
+    integer(i64) :: i
+    integer(i64) :: j
+
+    n = size(a, 1_i64, i64)
+    m = size(a, 2_i64, i64)
+    do i = 0_i64, n - 1_i64
+      y(i) = 0.0_f64
+      do j = 0_i64, m - 1_i64
+        y(i) = y(i) + a(i, j) * x(j)
+      end do
+    end do
+
+  end subroutine matvec
+  !........................................
+
+end module mod_owz95k7hnrmx
@@ -0,0 +1,34 @@
+module mod_qncqsfg3214t
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine stencil(u, out) 
+
+    implicit none
+
+    real(f64), intent(in) :: u(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: out(0_i64:, 0_i64:)
+    integer(i64) :: n
+    integer(i64) :: m
+    integer(i64) :: i
+    integer(i64) :: j
+
+    n = size(u, 2_i64, i64)
+    m = size(u, 1_i64, i64)
+    do i = 1_i64, n - 1_i64 - 1_i64
+      do j = 1_i64, m - 1_i64 - 1_i64
+        out(j, i) = 0.25_f64 * (u(j, i - 1_i64) + u(j, i + 1_i64) + u(j &
+              - 1_i64, i) + u(j + 1_i64, i))
+      end do
+    end do
+
+  end subroutine stencil
+  !........................................
+
+end module mod_qncqsfg3214t
@@ -0,0 +1,105 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_QNCQSFG3214T_WRAPPER
+
+#include "mod_qncqsfg3214t_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_stencil_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* u_obj;
+    PyObject* out_obj;
+    void* u_data = NULL;
+    int64_t u_shape[2];
+    int64_t u_strides[2];
+    void* out_data = NULL;
+    int64_t out_shape[2];
+    int64_t out_strides[2];
+    static const char* const kwlist[] = {
+        "u",
+        "out",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &u_obj, &out_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("u", u_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        u_data = PyArray_DATA((PyArrayObject*)(u_obj));
+        get_strides_and_shape_from_numpy_array(u_obj, u_shape, u_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out", out_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        out_data = PyArray_DATA((PyArrayObject*)(out_obj));
+        get_strides_and_shape_from_numpy_array(out_obj, out_shape, out_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_stencil(u_data, u_shape[INT64_C(0)], u_shape[INT64_C(1)], u_strides[INT64_C(0)], u_strides[INT64_C(1)], out_data, out_shape[INT64_C(0)], out_shape[INT64_C(1)], out_strides[INT64_C(0)], out_strides[INT64_C(1)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_qncqsfg3214t_methods[] = {
+    {
+        "stencil",
+        (PyCFunction)bind_c_stencil_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_qncqsfg3214t_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_qncqsfg3214t",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_qncqsfg3214t_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_qncqsfg3214t(void)
+{
+    PyObject* mod;
+    static void* Pymod_qncqsfg3214t_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_qncqsfg3214t_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_qncqsfg3214t_API, "mod_qncqsfg3214t._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
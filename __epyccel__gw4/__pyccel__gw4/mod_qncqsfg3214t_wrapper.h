@@ -0,0 +1,42 @@
+#ifndef MOD_QNCQSFG3214T_WRAPPER_H
+#define MOD_QNCQSFG3214T_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_QNCQSFG3214T_WRAPPER
+
+void bind_c_stencil(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t);
+
+#else
+
+static void** Pymod_qncqsfg3214t_API;
+
+
+/*........................................*/
+static int mod_qncqsfg3214t_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw4")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_qncqsfg3214t_API = (void**)PyCapsule_Import("mod_qncqsfg3214t._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_qncqsfg3214t_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_QNCQSFG3214T_WRAPPER_H
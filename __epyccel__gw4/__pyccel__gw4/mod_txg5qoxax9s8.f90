@@ -0,0 +1,30 @@
+module mod_txg5qoxax9s8
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f() result(a)
+
+    implicit none
+
+    integer(i64) :: a
+    integer(i64) :: a_0001
+    integer(i64) :: b
+    integer(i64) :: a_0002
+    integer(i64) :: b_0001
+
+    a_0002 = 2_i64
+    b_0001 = 5_i64
+    a_0001 = (a_0002 + b_0001 + 3_i64)
+    b = 4_i64
+    a = a_0001 + b
+    return
+
+  end function f
+  !........................................
+
+end module mod_txg5qoxax9s8
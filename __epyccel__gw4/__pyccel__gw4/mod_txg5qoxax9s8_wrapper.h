@@ -0,0 +1,40 @@
+#ifndef MOD_TXG5QOXAX9S8_WRAPPER_H
+#define MOD_TXG5QOXAX9S8_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_TXG5QOXAX9S8_WRAPPER
+
+int64_t bind_c_f(void);
+
+#else
+
+static void** Pymod_txg5qoxax9s8_API;
+
+
+/*........................................*/
+static int mod_txg5qoxax9s8_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw4")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_txg5qoxax9s8_API = (void**)PyCapsule_Import("mod_txg5qoxax9s8._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_txg5qoxax9s8_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_TXG5QOXAX9S8_WRAPPER_H
@@ -0,0 +1,13 @@
+from numpy import shape
+from pyccel.decorators import contiguous
+
+@contiguous('a', 'x', 'y')
+def matvec(a : 'float[::,::](order=F)', x : 'float[::]', y : 'float[::]'):
+    from numpy import shape
+    n = shape(a)[0]
+    m = shape(a)[1]
+    for i in range(0, n, 1):
+        y[i] = 0.0
+        for j in range(0, m, 1):
+            y[i] += a[i,j] * x[j]
+
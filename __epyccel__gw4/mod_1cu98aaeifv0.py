@@ -0,0 +1,9 @@
+
+def draw_random(seed : 'int', stream : 'int'):
+    from pyccel.random import Generator
+    rng = Generator(seed, stream)
+    x = rng.random()
+    y = rng.random()
+    z = rng.random()
+    return x,y,z
+
@@ -0,0 +1,20 @@
+from pyccel.decorators import inline
+
+def f():
+    @inline
+    def get_val(x : 'int' = None, y : 'int' = None):
+        if x is None:
+            a = 3
+        else:
+            a = x
+        if y is not None:
+            b = 4
+        else:
+            b = 5
+        return a + b
+    a = get_val(2, 7)
+    b = get_val(x = None, y = None)
+    c = get_val(6, y = None)
+    d = get_val(x = None, y = 0)
+    return a,b,c,d
+
@@ -0,0 +1,18 @@
+from numpy import float64
+
+def f(n : 'int'):
+    from numpy import zeros
+    from numpy import transpose
+    a = zeros((n, n), dtype = float64, order='C')
+    for i in range(0, n, 1):
+        for j in range(0, n, 1):
+            a[i,j] = i * n + j
+    b = a[1::,::]
+    c = a.T
+    d = a[::,1]
+    e = a[1,1::]
+    s = 0.0
+    for i in range(0, n - 1, 1):
+        s += b[i,2] + c[i,1] + d[i] + e[i]
+    return s
+
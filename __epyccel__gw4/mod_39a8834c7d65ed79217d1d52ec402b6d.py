@@ -0,0 +1,2 @@
+def add_two(x : int):
+    return x + 2
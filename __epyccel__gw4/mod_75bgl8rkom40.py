@@ -0,0 +1,4 @@
+
+def f6(x : 'int', y : 'float' = 2.0, z : 'int' = 3):
+    return x + y * z
+
@@ -0,0 +1,8 @@
+
+def fill(seed : 'int', a : 'float[::,::]', b : 'int32[::]', c : 'float[::]'):
+    from pyccel.random import Generator
+    rng = Generator(seed, 1)
+    rng.random(out = a)
+    rng.integers(-100, 100, out = b)
+    rng.normal(2.0, 3.0, out = c)
+
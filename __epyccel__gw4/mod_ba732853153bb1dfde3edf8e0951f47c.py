@@ -0,0 +1,2 @@
+def mul_three(x : int):
+    return x * 3
@@ -0,0 +1,6 @@
+
+def fill(seed : 'int', a : 'float[::,::](order=F)'):
+    from pyccel.random import Generator
+    rng = Generator(seed, 0)
+    rng.random(out = a)
+
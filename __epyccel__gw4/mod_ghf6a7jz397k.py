@@ -0,0 +1,9 @@
+
+def draw_integers(seed : 'int', low : 'int', high : 'int'):
+    from pyccel.random import Generator
+    rng = Generator(seed, 0)
+    x = rng.integers(low, high)
+    y = rng.integers(low, high)
+    z = rng.integers(low, high)
+    return x,y,z
+
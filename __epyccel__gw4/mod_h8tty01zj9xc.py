@@ -0,0 +1,4 @@
+
+def one():
+    return True
+
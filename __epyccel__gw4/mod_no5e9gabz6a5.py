@@ -0,0 +1,13 @@
+from numpy import shape, float64
+from pyccel.decorators import inline
+
+def f():
+    @inline
+    def fill_array(a : 'float[::]'):
+        for i in range(0, shape(a)[0], 1):
+            a[i] = 3.14
+    from numpy import empty, shape
+    arr = empty((4), dtype = float64)
+    fill_array(arr)
+    return arr[0],arr[-1]
+
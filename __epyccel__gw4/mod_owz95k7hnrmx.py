@@ -0,0 +1,7 @@
+@contiguous('a', 'x', 'y')
+def matvec(a : 'float[:,:](order=F)', x : 'float[:]', y : 'float[:]'):
+    n, m = a.shape
+    for i in range(n):
+        y[i] = 0.0
+        for j in range(m):
+            y[i] += a[i, j] * x[j]
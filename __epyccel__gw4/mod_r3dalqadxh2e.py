@@ -0,0 +1,12 @@
+from numpy import shape, float64
+
+def f(x : 'float[::]'):
+    from numpy import zeros
+    s = 0.0
+    for i in range(0, shape(x)[0], 1):
+        y = zeros((3), dtype = float64)
+        y[0] = x[i]
+        y[2] = 2 * x[i]
+        s += sum(y)
+    return s
+
@@ -0,0 +1,8 @@
+
+def f():
+    from numpy import zeros, ones
+    from numpy import sum
+    x = zeros((3, 7), dtype = int, order='C')
+    x = ones((4, 5), dtype = int, order='C')
+    return sum(x)
+
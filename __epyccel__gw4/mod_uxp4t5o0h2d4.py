@@ -0,0 +1,7 @@
+
+def f4(x : 'bool' = True):
+    if x:
+        return 1
+    else:
+        return 2
+
@@ -0,0 +1,7 @@
+from pyccel.decorators import template
+
+@template(name = 'T', types = [float, complex])
+def my_sum(v : 'T[::]'):
+    from numpy import sum
+    return sum(v)
+
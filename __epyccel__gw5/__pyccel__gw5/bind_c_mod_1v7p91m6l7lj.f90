@@ -0,0 +1,30 @@
+module bind_c_mod_1v7p91m6l7lj
+
+  use, intrinsic :: ISO_C_Binding, only : c_loc , i64 => C_INT64_T , &
+        c_ptr
+  use mod_1v7p91m6l7lj
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f(bound_x, x_shape_1) bind(c) 
+
+    implicit none
+
+    type(c_ptr), intent(out) :: bound_x
+    integer(i64), intent(out) :: x_shape_1
+    integer(i64), allocatable :: x(:)
+    integer(i64), pointer :: x_ptr(:)
+
+    call f(x = x)
+    x_shape_1 = 3_i64
+    allocate(x_ptr(0:x_shape_1 - 1_i64))
+    x_ptr = x
+    bound_x = c_loc(x_ptr)
+
+  end subroutine bind_c_f
+  !........................................
+
+end module bind_c_mod_1v7p91m6l7lj
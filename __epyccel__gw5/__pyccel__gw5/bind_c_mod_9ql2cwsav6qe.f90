@@ -0,0 +1,25 @@
+module bind_c_mod_9ql2cwsav6qe
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i64 => &
+        C_INT64_T
+  use mod_9ql2cwsav6qe
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f(b, n, m) bind(c) 
+
+    implicit none
+
+    integer(i64), intent(out) :: n
+    integer(i64), intent(out) :: m
+    logical(b1), value :: b
+
+    call f(b = b, n = n, m = m)
+
+  end subroutine bind_c_f
+  !........................................
+
+end module bind_c_mod_9ql2cwsav6qe
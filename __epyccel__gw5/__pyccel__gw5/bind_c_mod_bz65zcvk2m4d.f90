@@ -0,0 +1,29 @@
+module bind_c_mod_bz65zcvk2m4d
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , i64 => C_INT64_T &
+        , f64 => C_DOUBLE , c_ptr
+  use mod_bz65zcvk2m4d
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f(bound_x, bound_x_shape_1, bound_x_stride_1) bind(c) &
+        result(s)
+
+    implicit none
+
+    real(f64) :: s
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    real(f64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    s = f(x = x(1_i64::bound_x_stride_1))
+
+  end function bind_c_f
+  !........................................
+
+end module bind_c_mod_bz65zcvk2m4d
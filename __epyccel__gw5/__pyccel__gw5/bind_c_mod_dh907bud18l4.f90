@@ -0,0 +1,24 @@
+module bind_c_mod_dh907bud18l4
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use mod_dh907bud18l4
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f(c) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    real(f64), value :: c
+
+    Out_0001 = f(c = c)
+
+  end function bind_c_f
+  !........................................
+
+end module bind_c_mod_dh907bud18l4
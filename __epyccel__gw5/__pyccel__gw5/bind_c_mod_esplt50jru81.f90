@@ -0,0 +1,24 @@
+module bind_c_mod_esplt50jru81
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , C_BOOL
+  use mod_esplt50jru81
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f(b1, b2) bind(c) result(n)
+
+    implicit none
+
+    integer(i64) :: n
+    logical(C_BOOL), value :: b1
+    logical(C_BOOL), value :: b2
+
+    n = f(b1 = b1, b2 = b2)
+
+  end function bind_c_f
+  !........................................
+
+end module bind_c_mod_esplt50jru81
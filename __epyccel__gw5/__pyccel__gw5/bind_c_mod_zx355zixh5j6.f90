@@ -0,0 +1,7 @@
+module bind_c_mod_zx355zixh5j6
+
+  use mod_zx355zixh5j6
+
+  implicit none
+
+end module bind_c_mod_zx355zixh5j6
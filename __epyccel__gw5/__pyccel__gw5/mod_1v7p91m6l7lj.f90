@@ -0,0 +1,33 @@
+module mod_1v7p91m6l7lj
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f(x) 
+
+    implicit none
+
+    integer(i64), allocatable, intent(out) :: x(:)
+    integer(i64) :: i
+
+    do i = 0_i64, 2_i64
+      if (allocated(x)) then
+        if (any(size(x) /= [3_i64])) then
+          deallocate(x)
+          allocate(x(0:2_i64))
+        end if
+      else
+        allocate(x(0:2_i64))
+      end if
+      x = i
+    end do
+    return
+
+  end subroutine f
+  !........................................
+
+end module mod_1v7p91m6l7lj
@@ -0,0 +1,80 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_1V7P91M6L7LJ_WRAPPER
+
+#include "mod_1v7p91m6l7lj_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    PyObject* x_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    bind_c_f(&x_data, &x_shape[INT64_C(0)]);
+    x_obj = to_pyarray(INT64_C(1), NPY_INT64, x_data, x_shape, 1, 1);
+    return x_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_1v7p91m6l7lj_methods[] = {
+    {
+        "f",
+        (PyCFunction)bind_c_f_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_1v7p91m6l7lj_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_1v7p91m6l7lj",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_1v7p91m6l7lj_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_1v7p91m6l7lj(void)
+{
+    PyObject* mod;
+    static void* Pymod_1v7p91m6l7lj_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_1v7p91m6l7lj_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_1v7p91m6l7lj_API, "mod_1v7p91m6l7lj._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
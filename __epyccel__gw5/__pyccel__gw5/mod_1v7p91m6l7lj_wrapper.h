@@ -0,0 +1,40 @@
+#ifndef MOD_1V7P91M6L7LJ_WRAPPER_H
+#define MOD_1V7P91M6L7LJ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_1V7P91M6L7LJ_WRAPPER
+
+int64_t bind_c_f(void*, int64_t*);
+
+#else
+
+static void** Pymod_1v7p91m6l7lj_API;
+
+
+/*........................................*/
+static int mod_1v7p91m6l7lj_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw5")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_1v7p91m6l7lj_API = (void**)PyCapsule_Import("mod_1v7p91m6l7lj._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_1v7p91m6l7lj_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_1V7P91M6L7LJ_WRAPPER_H
@@ -0,0 +1,31 @@
+#ifndef MOD_3QT5DSGS26EY_H
+#define MOD_3QT5DSGS26EY_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_DICT_HMAP_INT64_T_BOOL
+#define _TOOLS_DICT_HMAP_INT64_T_BOOL
+#define i_type hmap_int64_t_bool
+#define i_key int64_t
+#define i_val bool
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_BOOL
+
+#ifndef _TOOLS_DICT_HMAP_INT64_T_BOOL
+#define _TOOLS_DICT_HMAP_INT64_T_BOOL
+#define i_type hmap_int64_t_bool
+#define i_key int64_t
+#define i_val bool
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_BOOL
+
+
+
+
+bool get_default_element(void);
+#endif // mod_3qt5dsgs26ey_H
@@ -0,0 +1,15 @@
+#include "mod_54g2v0fhiu1x.h"
+
+
+/*........................................*/
+double get_element(void)
+{
+    hmap_int64_t_double a = {0};
+    double Out_0001;
+    a = c_init(hmap_int64_t_double, {{INT64_C(1), 1.0}, {INT64_C(2), 2.0}});
+    Out_0001 = (*hmap_int64_t_double_at(&a, INT64_C(1)));
+    hmap_int64_t_double_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
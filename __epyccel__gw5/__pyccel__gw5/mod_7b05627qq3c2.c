@@ -0,0 +1,12 @@
+#include "mod_7b05627qq3c2.h"
+
+
+/*........................................*/
+hmap_int64_t_double dict_init(void)
+{
+    hmap_int64_t_double a = {0};
+    a = c_init(hmap_int64_t_double, {{INT64_C(1), 1.0}, {INT64_C(2), 2.0}});
+    return a;
+}
+/*........................................*/
+
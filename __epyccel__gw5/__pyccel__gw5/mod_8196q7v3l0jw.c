@@ -0,0 +1,13 @@
+#include "mod_8196q7v3l0jw.h"
+
+
+/*........................................*/
+hmap_int64_t_double dict_clear(void)
+{
+    hmap_int64_t_double a = {0};
+    a = c_init(hmap_int64_t_double, {{INT64_C(1), 1.0}, {INT64_C(2), 2.0}});
+    hmap_int64_t_double_clear(&a);
+    return a;
+}
+/*........................................*/
+
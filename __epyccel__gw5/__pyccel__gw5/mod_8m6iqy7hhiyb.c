@@ -0,0 +1,15 @@
+#include "mod_8m6iqy7hhiyb.h"
+
+
+/*........................................*/
+hmap_int64_t_double dict_copy(void)
+{
+    hmap_int64_t_double a = {0};
+    hmap_int64_t_double b = {0};
+    a = c_init(hmap_int64_t_double, {{INT64_C(1), 1.0}, {INT64_C(2), 2.0}});
+    b = hmap_int64_t_double_clone(a);
+    hmap_int64_t_double_drop(&a);
+    return b;
+}
+/*........................................*/
+
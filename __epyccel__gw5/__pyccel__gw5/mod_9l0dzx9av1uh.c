@@ -0,0 +1,12 @@
+#include "mod_9l0dzx9av1uh.h"
+
+
+/*........................................*/
+int64_t f1(int64_t x)
+{
+    int64_t y;
+    y = x - INT64_C(1);
+    return y;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_9L0DZX9AV1UH_H
+#define MOD_9L0DZX9AV1UH_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(int64_t x);
+#endif // mod_9l0dzx9av1uh_H
@@ -0,0 +1,46 @@
+module mod_9ql2cwsav6qe
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f(b, n, m) 
+
+    implicit none
+
+    integer(i64), intent(out) :: n
+    integer(i64), intent(out) :: m
+    logical(b1), value :: b
+    integer(i64), allocatable :: x(:)
+
+    if (b) then
+      allocate(x(0:2_i64))
+      x = 0_i64
+    else
+      allocate(x(0:3_i64))
+      x = 0_i64
+    end if
+    n = size(x, kind=i64)
+    if (allocated(x)) then
+      if (any(size(x) /= [3_i64])) then
+        deallocate(x)
+        allocate(x(0:2_i64))
+      end if
+    else
+      allocate(x(0:2_i64))
+    end if
+    x = 1_i64
+    m = size(x, kind=i64)
+    if (allocated(x)) then
+      deallocate(x)
+    end if
+    return
+
+  end subroutine f
+  !........................................
+
+end module mod_9ql2cwsav6qe
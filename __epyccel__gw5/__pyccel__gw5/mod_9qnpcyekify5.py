@@ -0,0 +1,6 @@
+
+def pop_item():
+    a = {1: 1.0, 2: 2.0}
+    (Dummy_0000_0, Dummy_0000_1) = a.popitem()
+    return Dummy_0000_0
+
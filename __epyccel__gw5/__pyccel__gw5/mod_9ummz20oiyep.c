@@ -0,0 +1,15 @@
+#include "mod_9ummz20oiyep.h"
+
+
+/*........................................*/
+int64_t pop_str_keys(void)
+{
+    hmap_cstr_int64_t a = {0};
+    int64_t Out_0001;
+    a = c_init(hmap_cstr_int64_t, {{"a", INT64_C(1)}, {"b", INT64_C(2)}});
+    Out_0001 = hmap_cstr_int64_t_pop(&a, "a");
+    hmap_cstr_int64_t_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
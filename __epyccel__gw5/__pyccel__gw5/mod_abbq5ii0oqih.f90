@@ -0,0 +1,38 @@
+module mod_abbq5ii0oqih
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f() result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64) :: i
+    integer(i64), allocatable :: x(:)
+
+    do i = 0_i64, 2_i64
+      if (allocated(x)) then
+        if (any(size(x) /= [i])) then
+          deallocate(x)
+          allocate(x(0:i - 1_i64))
+        end if
+      else
+        allocate(x(0:i - 1_i64))
+      end if
+      x = 1_i64
+    end do
+    Out_0001 = sum(x)
+    if (allocated(x)) then
+      deallocate(x)
+    end if
+    return
+
+  end function f
+  !........................................
+
+end module mod_abbq5ii0oqih
@@ -0,0 +1,12 @@
+#include "mod_ahmeogxsi0uq.h"
+
+
+/*........................................*/
+hmap_int64_t_double dict_empty_init(void)
+{
+    hmap_int64_t_double a = {0};
+    a = c_init(hmap_int64_t_double, {});
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,32 @@
+module mod_bz65zcvk2m4d
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f(x) result(s)
+
+    implicit none
+
+    real(f64) :: s
+    real(f64), intent(in) :: x(0_i64:)
+    integer(i64) :: i
+    real(f64) :: y(0_i64:2_i64)
+
+    s = 0.0_f64
+    do i = 0_i64, size(x, kind=i64) - 1_i64
+      y = 0.0_f64
+      y(0_i64) = x(i)
+      y(2_i64) = 2_i64 * x(i)
+      s = s + sum(y)
+    end do
+    return
+
+  end function f
+  !........................................
+
+end module mod_bz65zcvk2m4d
@@ -0,0 +1,42 @@
+#ifndef MOD_BZ65ZCVK2M4D_WRAPPER_H
+#define MOD_BZ65ZCVK2M4D_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_BZ65ZCVK2M4D_WRAPPER
+
+double bind_c_f(void*, int64_t, int64_t);
+
+#else
+
+static void** Pymod_bz65zcvk2m4d_API;
+
+
+/*........................................*/
+static int mod_bz65zcvk2m4d_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw5")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_bz65zcvk2m4d_API = (void**)PyCapsule_Import("mod_bz65zcvk2m4d._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_bz65zcvk2m4d_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BZ65ZCVK2M4D_WRAPPER_H
@@ -0,0 +1,37 @@
+module mod_ddr0t92r7jdt
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    real(f64), value :: c
+    integer(i64), allocatable, target :: x(:)
+    integer(i64), pointer :: y(:)
+
+    if (c > 0.5_f64) then
+      allocate(x(0:1_i64))
+      x = 1_i64
+    else
+      allocate(x(0:6_i64))
+      x = 1_i64
+    end if
+    y(0:) => x(1_i64:size(x, kind=i64) - 1_i64 - 1_i64)
+    Out_0001 = sum(y)
+    if (allocated(x)) then
+      deallocate(x)
+    end if
+    return
+
+  end function f
+  !........................................
+
+end module mod_ddr0t92r7jdt
@@ -0,0 +1,35 @@
+module mod_dh907bud18l4
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    real(f64), value :: c
+    integer(i64), allocatable :: x(:)
+
+    if (c > 0.5_f64) then
+      allocate(x(0:1_i64))
+      x = 1_i64
+    else
+      allocate(x(0:6_i64))
+      x = 1_i64
+    end if
+    Out_0001 = sum(x)
+    if (allocated(x)) then
+      deallocate(x)
+    end if
+    return
+
+  end function f
+  !........................................
+
+end module mod_dh907bud18l4
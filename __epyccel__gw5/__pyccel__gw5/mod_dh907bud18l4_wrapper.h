@@ -0,0 +1,40 @@
+#ifndef MOD_DH907BUD18L4_WRAPPER_H
+#define MOD_DH907BUD18L4_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_DH907BUD18L4_WRAPPER
+
+int64_t bind_c_f(double);
+
+#else
+
+static void** Pymod_dh907bud18l4_API;
+
+
+/*........................................*/
+static int mod_dh907bud18l4_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw5")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_dh907bud18l4_API = (void**)PyCapsule_Import("mod_dh907bud18l4._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_dh907bud18l4_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_DH907BUD18L4_WRAPPER_H
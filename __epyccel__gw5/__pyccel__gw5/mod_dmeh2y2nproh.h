@@ -0,0 +1,11 @@
+#ifndef MOD_DMEH2Y2NPROH_H
+#define MOD_DMEH2Y2NPROH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f5(t_ndarray x, int64_t m1);
+#endif // mod_dmeh2y2nproh_H
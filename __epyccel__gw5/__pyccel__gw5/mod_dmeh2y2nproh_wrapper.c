@@ -0,0 +1,107 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_DMEH2Y2NPROH_WRAPPER
+
+#include "mod_dmeh2y2nproh_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f5_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* m1_obj;
+    t_ndarray x = {.raw_data = NULL};
+    int64_t m1;
+    m1_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        "m1",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 2, &x_obj, &m1_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    m1 = INT64_C(2);
+    if (m1_obj != Py_None)
+    {
+        if (PyIs_NativeInt(m1_obj))
+        {
+            m1 = PyInt64_to_Int64(m1_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument m1");
+            return NULL;
+        }
+    }
+    f5(x, m1);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_dmeh2y2nproh_methods[] = {
+    {
+        "f5",
+        (PyCFunction)f5_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_dmeh2y2nproh_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_dmeh2y2nproh",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_dmeh2y2nproh_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_dmeh2y2nproh(void)
+{
+    PyObject* mod;
+    static void* Pymod_dmeh2y2nproh_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_dmeh2y2nproh_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_dmeh2y2nproh_API, "mod_dmeh2y2nproh._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,42 @@
+#ifndef MOD_DMEH2Y2NPROH_WRAPPER_H
+#define MOD_DMEH2Y2NPROH_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_dmeh2y2nproh.h"
+
+
+#ifdef MOD_DMEH2Y2NPROH_WRAPPER
+
+
+#else
+
+static void** Pymod_dmeh2y2nproh_API;
+
+
+/*........................................*/
+static int mod_dmeh2y2nproh_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw5")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_dmeh2y2nproh_API = (void**)PyCapsule_Import("mod_dmeh2y2nproh._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_dmeh2y2nproh_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_DMEH2Y2NPROH_WRAPPER_H
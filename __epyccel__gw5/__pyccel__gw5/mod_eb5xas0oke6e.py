@@ -0,0 +1,7 @@
+
+def f():
+    from numpy import full
+    for i in range(0, 3, 1):
+        x = full((3), i)
+    return x
+
@@ -0,0 +1,40 @@
+module mod_esplt50jru81
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , C_BOOL
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f(b1, b2) result(n)
+
+    implicit none
+
+    integer(i64) :: n
+    logical(C_BOOL), value :: b1
+    logical(C_BOOL), value :: b2
+    integer(i64), allocatable :: x(:)
+
+    if (b1) then
+      if (b2) then
+        n = 0_i64
+      else
+        allocate(x(0:2_i64))
+        x = 0_i64
+        n = 3_i64
+      end if
+    else
+      allocate(x(0:3_i64))
+      x = 0_i64
+      n = size(x, kind=i64)
+    end if
+    if (allocated(x)) then
+      deallocate(x)
+    end if
+    return
+
+  end function f
+  !........................................
+
+end module mod_esplt50jru81
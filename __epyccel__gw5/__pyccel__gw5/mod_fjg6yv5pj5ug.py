@@ -0,0 +1,5 @@
+
+def dict_empty_init():
+    a = {}
+    return a
+
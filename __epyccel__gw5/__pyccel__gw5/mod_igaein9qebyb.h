@@ -0,0 +1,31 @@
+#ifndef MOD_IGAEIN9QEBYB_H
+#define MOD_IGAEIN9QEBYB_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#include "stc/cstr.h"
+#ifndef _TOOLS_DICT_HMAP_CSTR_INT64_T
+#define _TOOLS_DICT_HMAP_CSTR_INT64_T
+#define i_type hmap_cstr_int64_t
+#define i_keypro cstr
+#define i_val int64_t
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_CSTR_INT64_T
+
+#ifndef _TOOLS_DICT_HMAP_CSTR_INT64_T
+#define _TOOLS_DICT_HMAP_CSTR_INT64_T
+#define i_type hmap_cstr_int64_t
+#define i_keypro cstr
+#define i_val int64_t
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_CSTR_INT64_T
+
+
+
+
+int64_t get_str_keys(void);
+#endif // mod_igaein9qebyb_H
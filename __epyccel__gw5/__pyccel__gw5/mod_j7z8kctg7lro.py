@@ -0,0 +1,5 @@
+
+def get_default_str_keys():
+    a = {'a': 1, 'b': 2}
+    return a.get('c', 4)
+
@@ -0,0 +1,16 @@
+#include "mod_lh4w3aby1uf2.h"
+
+
+/*........................................*/
+int64_t dict_contains(bool* Out_0001, bool* Out_0002, bool* Out_0003)
+{
+    hmap_int64_t_double a = {0};
+    a = c_init(hmap_int64_t_double, {{INT64_C(1), 1.0}, {INT64_C(2), 2.0}, {INT64_C(3), 3.0}});
+    (*Out_0001) = hmap_int64_t_double_contains(&a, INT64_C(1));
+    (*Out_0002) = hmap_int64_t_double_contains(&a, INT64_C(5));
+    (*Out_0003) = 0;
+    hmap_int64_t_double_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,24 @@
+#include "mod_qw2uadqn9u64.h"
+
+
+/*........................................*/
+void stream_means(int64_t seed, t_ndarray means)
+{
+    int64_t s;
+    t_philox rng;
+    double total;
+    int64_t Dummy_0000;
+    int64_t Dummy_0001;
+    for (s = INT64_C(0); s < means.shape[INT64_C(0)]; s += INT64_C(1))
+    {
+        rng = pyc_philox_init(seed, s);
+        total = 0.0;
+        for (Dummy_0000 = INT64_C(0); Dummy_0000 < INT64_C(1000); Dummy_0000 += INT64_C(1))
+        {
+            total += pyc_philox_random(&rng);
+        }
+        GET_ELEMENT(means, nd_double, s) = total / INT64_C(1000);
+    }
+}
+/*........................................*/
+
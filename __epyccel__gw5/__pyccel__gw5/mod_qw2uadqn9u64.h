@@ -0,0 +1,12 @@
+#ifndef MOD_QW2UADQN9U64_H
+#define MOD_QW2UADQN9U64_H
+
+#include "ndarrays.h"
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void stream_means(int64_t seed, t_ndarray means);
+#endif // mod_qw2uadqn9u64_H
@@ -0,0 +1,7 @@
+
+def dict_arg_items(a : 'const dict[int,float]'):
+    total = 0.0
+    for key,val in a.items():
+        total += key * val
+    return total
+
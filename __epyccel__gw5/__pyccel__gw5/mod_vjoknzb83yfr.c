@@ -0,0 +1,10 @@
+#include "mod_vjoknzb83yfr.h"
+
+
+/*........................................*/
+double f3(double x, double y)
+{
+    return x + y;
+}
+/*........................................*/
+
@@ -0,0 +1,9 @@
+#ifndef MOD_VJOKNZB83YFR_H
+#define MOD_VJOKNZB83YFR_H
+
+#include <stdlib.h>
+
+
+
+double f3(double x, double y);
+#endif // mod_vjoknzb83yfr_H
@@ -0,0 +1,113 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_VJOKNZB83YFR_WRAPPER
+
+#include "mod_vjoknzb83yfr_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f3_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    double x;
+    double y;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    x_obj = Py_None;
+    y_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    x = 1.5;
+    if (x_obj != Py_None)
+    {
+        if (PyIs_NativeFloat(x_obj))
+        {
+            x = PyDouble_to_Double(x_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument x");
+            return NULL;
+        }
+    }
+    y = 2.5;
+    if (y_obj != Py_None)
+    {
+        if (PyIs_NativeFloat(y_obj))
+        {
+            y = PyDouble_to_Double(y_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument y");
+            return NULL;
+        }
+    }
+    Out_0001 = f3(x, y);
+    Out_0001_obj = Double_to_PyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_vjoknzb83yfr_methods[] = {
+    {
+        "f3",
+        (PyCFunction)f3_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_vjoknzb83yfr_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_vjoknzb83yfr",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_vjoknzb83yfr_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_vjoknzb83yfr(void)
+{
+    PyObject* mod;
+    static void* Pymod_vjoknzb83yfr_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_vjoknzb83yfr_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_vjoknzb83yfr_API, "mod_vjoknzb83yfr._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
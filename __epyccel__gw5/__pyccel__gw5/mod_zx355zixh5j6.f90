@@ -0,0 +1,21 @@
+module mod_zx355zixh5j6
+
+  use, intrinsic :: ISO_FORTRAN_ENV, only : stdout => output_unit
+
+  implicit none
+
+  private :: f
+
+  contains
+
+  !........................................
+  subroutine f() 
+
+    implicit none
+
+    write(stdout, '(A)', advance="yes") 'hidden'
+
+  end subroutine f
+  !........................................
+
+end module mod_zx355zixh5j6
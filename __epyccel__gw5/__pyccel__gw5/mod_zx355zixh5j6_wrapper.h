@@ -0,0 +1,39 @@
+#ifndef MOD_ZX355ZIXH5J6_WRAPPER_H
+#define MOD_ZX355ZIXH5J6_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_ZX355ZIXH5J6_WRAPPER
+
+
+#else
+
+static void** Pymod_zx355zixh5j6_API;
+
+
+/*........................................*/
+static int mod_zx355zixh5j6_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw5")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_zx355zixh5j6_API = (void**)PyCapsule_Import("mod_zx355zixh5j6._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_zx355zixh5j6_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_ZX355ZIXH5J6_WRAPPER_H
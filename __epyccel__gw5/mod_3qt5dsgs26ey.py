@@ -0,0 +1,3 @@
+def get_default_element():
+    a = {1:True, 2:False}
+    return a.get(3, True)
@@ -0,0 +1,3 @@
+def get_element():
+    a = {1:1.0, 2:2.0}
+    return a.get(1)
@@ -0,0 +1,3 @@
+def f1(x  : 'int' =  1):
+    y = x - 1
+    return y
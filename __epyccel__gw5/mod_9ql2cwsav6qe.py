@@ -0,0 +1,10 @@
+def f(b : bool):
+    import numpy as np
+    if b:
+        x = np.zeros(3, dtype=int)
+    else:
+        x = np.zeros(4, dtype=int)
+    n = x.shape[0]
+    x = np.ones(3, dtype=int)
+    m = x.shape[0]
+    return n,m
@@ -0,0 +1,3 @@
+def pop_str_keys():
+    a = {'a':1, 'b':2}
+    return a.pop('a')
@@ -0,0 +1,3 @@
+def dict_empty_init():
+    a : 'dict[int, float]' = {}
+    return a
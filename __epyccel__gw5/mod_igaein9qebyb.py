@@ -0,0 +1,3 @@
+def get_str_keys():
+    a = {'a':1, 'b':2}
+    return a.get('a')
@@ -0,0 +1,6 @@
+
+def dict_clear():
+    a = {1: 1.0, 2: 2.0}
+    a.clear()
+    return a
+
@@ -0,0 +1,11 @@
+
+def f(c : 'float'):
+    from numpy import ones
+    from numpy import sum
+    if c > 0.5:
+        x = ones((2), dtype = int)
+    else:
+        x = ones((7), dtype = int)
+    y = x[1:-1:]
+    return sum(y)
+
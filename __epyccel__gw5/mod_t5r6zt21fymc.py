@@ -0,0 +1,12 @@
+from numpy import array
+from pyccel.decorators import stack_array
+
+@stack_array('x')
+def f(b : 'bool'):
+    from numpy import array
+    if b:
+        x = array([1, 2, 3])
+    else:
+        x = array([4, 5, 6])
+    return x[0]
+
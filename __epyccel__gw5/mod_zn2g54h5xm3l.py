@@ -0,0 +1,5 @@
+
+def dict_str_keys():
+    a = {'a': 1, 'b': 2}
+    return a
+
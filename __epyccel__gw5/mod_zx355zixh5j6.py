@@ -0,0 +1,3 @@
+@private
+def f():
+    print("hidden")
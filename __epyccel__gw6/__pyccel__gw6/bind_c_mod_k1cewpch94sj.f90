@@ -0,0 +1,22 @@
+module bind_c_mod_k1cewpch94sj
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL
+  use mod_k1cewpch94sj
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_one() bind(c) result(Out_0001)
+
+    implicit none
+
+    logical(b1) :: Out_0001
+
+    Out_0001 = one()
+
+  end function bind_c_one
+  !........................................
+
+end module bind_c_mod_k1cewpch94sj
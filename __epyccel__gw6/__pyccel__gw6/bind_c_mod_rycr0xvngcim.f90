@@ -0,0 +1,24 @@
+module bind_c_mod_rycr0xvngcim
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , b1 => &
+        C_BOOL
+  use mod_rycr0xvngcim
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f(b) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    logical(b1), value :: b
+
+    Out_0001 = f(b = b)
+
+  end function bind_c_f
+  !........................................
+
+end module bind_c_mod_rycr0xvngcim
@@ -0,0 +1,18 @@
+#include "mod_41p7o6xwcro4.h"
+
+
+/*........................................*/
+void axpy(double a, t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    int64_t i_0001;
+    for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < y.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(y, nd_double, i, i_0001) = a * GET_ELEMENT(x, nd_double, i, i_0001) + GET_ELEMENT(y, nd_double, i, i_0001);
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_41P7O6XWCRO4_H
+#define MOD_41P7O6XWCRO4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void axpy(double a, t_ndarray x, t_ndarray y);
+#endif // mod_41p7o6xwcro4_H
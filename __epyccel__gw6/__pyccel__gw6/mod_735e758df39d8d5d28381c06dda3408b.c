@@ -0,0 +1,10 @@
+#include "mod_735e758df39d8d5d28381c06dda3408b.h"
+
+
+/*........................................*/
+int64_t add_one(int64_t x)
+{
+    return x + INT64_C(1);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_735E758DF39D8D5D28381C06DDA3408B_H
+#define MOD_735E758DF39D8D5D28381C06DDA3408B_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t add_one(int64_t x);
+#endif // mod_735e758df39d8d5d28381c06dda3408b_H
@@ -0,0 +1,40 @@
+#ifndef MOD_735E758DF39D8D5D28381C06DDA3408B_WRAPPER_H
+#define MOD_735E758DF39D8D5D28381C06DDA3408B_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_735e758df39d8d5d28381c06dda3408b.h"
+
+
+#ifdef MOD_735E758DF39D8D5D28381C06DDA3408B_WRAPPER
+
+
+#else
+
+static void** Pymod_735e758df39d8d5d28381c06dda3408b_API;
+
+
+/*........................................*/
+static int mod_735e758df39d8d5d28381c06dda3408b_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw6")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_735e758df39d8d5d28381c06dda3408b_API = (void**)PyCapsule_Import("mod_735e758df39d8d5d28381c06dda3408b._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_735e758df39d8d5d28381c06dda3408b_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_735E758DF39D8D5D28381C06DDA3408B_WRAPPER_H
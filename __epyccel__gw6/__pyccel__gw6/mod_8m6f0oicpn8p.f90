@@ -0,0 +1,22 @@
+module mod_8m6f0oicpn8p
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL
+
+  implicit none
+
+  contains
+
+  !........................................
+  function one() result(Out_0001)
+
+    implicit none
+
+    logical(b1) :: Out_0001
+
+    Out_0001 = .True._b1
+    return
+
+  end function one
+  !........................................
+
+end module mod_8m6f0oicpn8p
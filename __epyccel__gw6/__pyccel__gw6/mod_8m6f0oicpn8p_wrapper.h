@@ -0,0 +1,40 @@
+#ifndef MOD_8M6F0OICPN8P_WRAPPER_H
+#define MOD_8M6F0OICPN8P_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_8M6F0OICPN8P_WRAPPER
+
+bool bind_c_one(void);
+
+#else
+
+static void** Pymod_8m6f0oicpn8p_API;
+
+
+/*........................................*/
+static int mod_8m6f0oicpn8p_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw6")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_8m6f0oicpn8p_API = (void**)PyCapsule_Import("mod_8m6f0oicpn8p._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_8m6f0oicpn8p_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_8M6F0OICPN8P_WRAPPER_H
@@ -0,0 +1,40 @@
+#ifndef MOD_K1CEWPCH94SJ_WRAPPER_H
+#define MOD_K1CEWPCH94SJ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_K1CEWPCH94SJ_WRAPPER
+
+bool bind_c_one(void);
+
+#else
+
+static void** Pymod_k1cewpch94sj_API;
+
+
+/*........................................*/
+static int mod_k1cewpch94sj_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw6")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_k1cewpch94sj_API = (void**)PyCapsule_Import("mod_k1cewpch94sj._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_k1cewpch94sj_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_K1CEWPCH94SJ_WRAPPER_H
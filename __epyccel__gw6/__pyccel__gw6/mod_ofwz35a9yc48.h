@@ -0,0 +1,11 @@
+#ifndef MOD_OFWZ35A9YC48_H
+#define MOD_OFWZ35A9YC48_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void axpy(double a, t_ndarray x, t_ndarray y);
+#endif // mod_ofwz35a9yc48_H
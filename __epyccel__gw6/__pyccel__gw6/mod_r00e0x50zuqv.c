@@ -0,0 +1,10 @@
+#include "mod_r00e0x50zuqv.h"
+
+
+/*........................................*/
+int64_t add(int64_t a, int64_t b)
+{
+    return a + b;
+}
+/*........................................*/
+
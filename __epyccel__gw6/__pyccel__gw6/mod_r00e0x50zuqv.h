@@ -0,0 +1,10 @@
+#ifndef MOD_R00E0X50ZUQV_H
+#define MOD_R00E0X50ZUQV_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t add(int64_t a, int64_t b);
+#endif // mod_r00e0x50zuqv_H
@@ -0,0 +1,40 @@
+#ifndef MOD_R00E0X50ZUQV_WRAPPER_H
+#define MOD_R00E0X50ZUQV_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_r00e0x50zuqv.h"
+
+
+#ifdef MOD_R00E0X50ZUQV_WRAPPER
+
+
+#else
+
+static void** Pymod_r00e0x50zuqv_API;
+
+
+/*........................................*/
+static int mod_r00e0x50zuqv_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw6")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_r00e0x50zuqv_API = (void**)PyCapsule_Import("mod_r00e0x50zuqv._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_r00e0x50zuqv_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_R00E0X50ZUQV_WRAPPER_H
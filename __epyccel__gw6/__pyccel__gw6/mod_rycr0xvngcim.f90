@@ -0,0 +1,30 @@
+module mod_rycr0xvngcim
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , b1 => &
+        C_BOOL
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f(b) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    logical(b1), value :: b
+    integer(i64) :: x(0_i64:2_i64)
+
+    if (b) then
+      x = [1_i64, 2_i64, 3_i64]
+    else
+      x = [4_i64, 5_i64, 6_i64]
+    end if
+    Out_0001 = x(0_i64)
+    return
+
+  end function f
+  !........................................
+
+end module mod_rycr0xvngcim
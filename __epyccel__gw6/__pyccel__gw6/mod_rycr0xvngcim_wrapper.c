@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_RYCR0XVNGCIM_WRAPPER
+
+#include "mod_rycr0xvngcim_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* b_obj;
+    bool b;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &b_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Bool(b_obj))
+    {
+        b = PyBool_to_Bool(b_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument b");
+        return NULL;
+    }
+    Out_0001 = bind_c_f(b);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_rycr0xvngcim_methods[] = {
+    {
+        "f",
+        (PyCFunction)bind_c_f_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_rycr0xvngcim_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_rycr0xvngcim",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_rycr0xvngcim_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_rycr0xvngcim(void)
+{
+    PyObject* mod;
+    static void* Pymod_rycr0xvngcim_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_rycr0xvngcim_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_rycr0xvngcim_API, "mod_rycr0xvngcim._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,40 @@
+#ifndef MOD_RYCR0XVNGCIM_WRAPPER_H
+#define MOD_RYCR0XVNGCIM_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_RYCR0XVNGCIM_WRAPPER
+
+int64_t bind_c_f(bool);
+
+#else
+
+static void** Pymod_rycr0xvngcim_API;
+
+
+/*........................................*/
+static int mod_rycr0xvngcim_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw6")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_rycr0xvngcim_API = (void**)PyCapsule_Import("mod_rycr0xvngcim._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_rycr0xvngcim_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_RYCR0XVNGCIM_WRAPPER_H
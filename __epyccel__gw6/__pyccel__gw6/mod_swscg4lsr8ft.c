@@ -0,0 +1,10 @@
+#include "mod_swscg4lsr8ft.h"
+
+
+/*........................................*/
+double add(double a, double b)
+{
+    return a + b;
+}
+/*........................................*/
+
@@ -0,0 +1,9 @@
+#ifndef MOD_SWSCG4LSR8FT_H
+#define MOD_SWSCG4LSR8FT_H
+
+#include <stdlib.h>
+
+
+
+double add(double a, double b);
+#endif // mod_swscg4lsr8ft_H
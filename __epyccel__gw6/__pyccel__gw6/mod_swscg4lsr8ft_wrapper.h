@@ -0,0 +1,40 @@
+#ifndef MOD_SWSCG4LSR8FT_WRAPPER_H
+#define MOD_SWSCG4LSR8FT_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_swscg4lsr8ft.h"
+
+
+#ifdef MOD_SWSCG4LSR8FT_WRAPPER
+
+
+#else
+
+static void** Pymod_swscg4lsr8ft_API;
+
+
+/*........................................*/
+static int mod_swscg4lsr8ft_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw6")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_swscg4lsr8ft_API = (void**)PyCapsule_Import("mod_swscg4lsr8ft._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_swscg4lsr8ft_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_SWSCG4LSR8FT_WRAPPER_H
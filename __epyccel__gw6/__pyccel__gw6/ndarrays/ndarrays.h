@@ -0,0 +1,397 @@
+/* -------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file  */
+/* or go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details. */
+/* -------------------------------------------------------------------------------------- */
+
+#ifndef NDARRAYS_H
+# define NDARRAYS_H
+
+# include <complex.h>
+# include <stdbool.h>
+# include <stdint.h>
+# include <math.h>
+
+/* mapping the function array_fill to the correct type */
+# define array_fill(c, arr) _Generic((c), int64_t : _array_fill_int64,\
+                                        int32_t : _array_fill_int32,\
+                                        int16_t : _array_fill_int16,\
+                                        int8_t : _array_fill_int8,\
+                                        float : _array_fill_float,\
+                                        double : _array_fill_double,\
+                                        bool : _array_fill_bool,\
+                                        float complex : _array_fill_cfloat,\
+                                        double complex : _array_fill_cdouble)(c, arr)
+
+/*
+** The maximum number of dimensions of an array. The shape and strides are
+** stored inside the array so that creating a view requires no allocation.
+*/
+# ifndef MAX_NDIM
+#  define MAX_NDIM 15
+# endif
+
+typedef enum e_slice_type { ELEMENT, RANGE } t_slice_type;
+
+typedef struct  s_slice
+{
+    int64_t             start;
+    int64_t             end;
+    int64_t             step;
+    t_slice_type   type;
+}               t_slice;
+
+#define GET_INDEX_EXP1(t, arr, a) t(arr, 0, a)
+#define GET_INDEX_EXP2(t, arr, a, b) GET_INDEX_EXP1(t, arr, a) + t(arr, 1, b)
+#define GET_INDEX_EXP3(t, arr, a, b, c) GET_INDEX_EXP2(t, arr, a, b) + t(arr, 2, c)
+#define GET_INDEX_EXP4(t, arr, a, b, c, d) GET_INDEX_EXP3(t, arr, a, b, c) + t(arr, 3, d)
+#define GET_INDEX_EXP5(t, arr, a, b, c, d, e) GET_INDEX_EXP4(t, arr, a, b, c, d) + t(arr, 4, e)
+#define GET_INDEX_EXP6(t, arr, a, b, c, d, e, f) GET_INDEX_EXP5(t, arr, a, b, c, d, e) + t(arr, 5, f)
+#define GET_INDEX_EXP7(t, arr, a, b, c, d, e, f, g) GET_INDEX_EXP6(t, arr, a, b, c, d, e, f) + t(arr, 6, g)
+#define GET_INDEX_EXP8(t, arr, a, b, c, d, e, f, g, h) GET_INDEX_EXP7(t, arr, a, b, c, d, e, f, g) + t(arr, 7, h)
+#define GET_INDEX_EXP9(t, arr, a, b, c, d, e, f, g, h, i) GET_INDEX_EXP8(t, arr, a, b, c, d, e, f, g, h) + t(arr, 8, i)
+#define GET_INDEX_EXP10(t, arr, a, b, c, d, e, f, g, h, i, j) GET_INDEX_EXP9(t, arr, a, b, c, d, e, f, g, h, i) + t(arr, 9, j)
+#define GET_INDEX_EXP11(t, arr, a, b, c, d, e, f, g, h, i, j, k) GET_INDEX_EXP10(t, arr, a, b, c, d, e, f, g, h, i, j) + t(arr, 10, k)
+#define GET_INDEX_EXP12(t, arr, a, b, c, d, e, f, g, h, i, j, k, l) GET_INDEX_EXP11(t, arr, a, b, c, d, e, f, g, h, i, j, k) + t(arr, 11, l)
+#define GET_INDEX_EXP13(t, arr, a, b, c, d, e, f, g, h, i, j, k, l, m) GET_INDEX_EXP12(t, arr, a, b, c, d, e, f, g, h, i, j, k, l) + t(arr, 12, m)
+#define GET_INDEX_EXP14(t, arr, a, b, c, d, e, f, g, h, i, j, k, l, m, n) GET_INDEX_EXP13(t, arr, a, b, c, d, e, f, g, h, i, j, k, l, m) + t(arr, 13, n)
+#define GET_INDEX_EXP15(t, arr, a, b, c, d, e, f, g, h, i, j, k, l, m, n, o) GET_INDEX_EXP14(t, arr, a, b, c, d, e, f, g, h, i, j, k, l, m, n) + t(arr, 14, o)
+
+#define NUM_ARGS_H1(dummy, x15, x14, x13, x12, x11, x10, x9, x8, x7, x6, x5, x4, x3, x2, x1, x0, ...) x0
+#define NUM_ARGS(...) NUM_ARGS_H1(dummy, __VA_ARGS__, 15, 14, 13, 12, 11, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1, 0)
+#define GET_INDEX_FUNC_H2(t, arr, ndim, ...) GET_INDEX_EXP##ndim(t, arr, __VA_ARGS__)
+#define GET_INDEX_FUNC(t, arr, ndim, ...) GET_INDEX_FUNC_H2(t, arr, ndim, __VA_ARGS__)
+
+#define GET_INDEX(arr, ...) GET_INDEX_FUNC(INDEX, arr, NUM_ARGS(__VA_ARGS__), __VA_ARGS__)
+#define INDEX(arr, dim, a) (arr.strides[dim] * (a))
+#define GET_ELEMENT(arr, type, ...) arr.type[GET_INDEX(arr, __VA_ARGS__)]
+
+/*
+** Map e_types enum to numpy NPY_TYPES enum
+** ref: numpy_repo: numpy/numpy/core/include/numpy/ndarraytypes.h
+*/
+typedef enum e_types
+{
+        nd_bool     = 0,
+        nd_int8     = 1,
+        nd_int16    = 3,
+        nd_int32    = 5,
+        nd_int64    = 7,
+        nd_float    = 11,
+        nd_double   = 12,
+        nd_cfloat   = 14,
+        nd_cdouble  = 15
+} t_types;
+
+typedef enum e_order
+{
+    order_f,
+    order_c,
+} t_order;
+
+typedef struct  s_ndarray
+{
+    /* raw data buffer*/
+    union {
+            void            *raw_data;
+            int8_t          *nd_int8;
+            int16_t         *nd_int16;
+            int32_t         *nd_int32;
+            int64_t         *nd_int64;
+            float           *nd_float;
+            double          *nd_double;
+            bool            *nd_bool;
+            double complex  *nd_cdouble;
+            float  complex  *nd_cfloat;
+            };
+    /* number of dimensions */
+    int32_t                 nd;
+    /* shape 'size of each dimension' */
+    int64_t                 shape[MAX_NDIM];
+    /* strides 'number of elements to skip to get the next element' */
+    int64_t                 strides[MAX_NDIM];
+    /* type of the array elements */
+    t_types            type;
+    /* type size of the array elements */
+    int32_t                 type_size;
+    /* number of element in the array */
+    int64_t                 length;
+    /* size of the array in bytes */
+    int64_t                 buffer_size;
+    /* True if the array does not own the data */
+    bool                    is_view;
+    /* stores the order of the array: order_f or order_c */
+    t_order            order;
+}               t_ndarray;
+
+/* functions prototypes */
+
+/* allocations */
+void        stack_array_init(t_ndarray *arr);
+t_ndarray   array_create(int32_t nd, int64_t *shape,
+        t_types type, bool is_view, t_order order);
+void        _array_fill_int8(int8_t c, t_ndarray arr);
+void        _array_fill_int16(int16_t c, t_ndarray arr);
+void        _array_fill_int32(int32_t c, t_ndarray arr);
+void        _array_fill_int64(int64_t c, t_ndarray arr);
+void        _array_fill_float(float c, t_ndarray arr);
+void        _array_fill_double(double c, t_ndarray arr);
+void        _array_fill_bool(bool c, t_ndarray arr);
+void        _array_fill_cfloat(float complex c, t_ndarray arr);
+void        _array_fill_cdouble(double complex c, t_ndarray arr);
+
+/* slicing */
+                /* creating a Slice object */
+t_slice new_slice(int64_t start, int64_t end, int64_t step, t_slice_type type);
+                /* creating an array view */
+t_ndarray   array_slicing(t_ndarray arr, int n, ...);
+
+/* assigns */
+void        alias_assign(t_ndarray *dest, t_ndarray src);
+void        transpose_alias_assign(t_ndarray *dest, t_ndarray src);
+
+/* free */
+int32_t         free_array(t_ndarray* dump);
+int32_t         free_pointer(t_ndarray* dump);
+
+/* indexing */
+int64_t         get_index(t_ndarray arr, ...);
+
+/* data converting between numpy and ndarray */
+int64_t     *numpy_to_ndarray_strides(int64_t *np_strides, int type_size, int nd);
+int64_t     *numpy_to_ndarray_shape(int64_t *np_shape, int nd);
+void print_ndarray_memory(t_ndarray nd);
+/* copy data from ndarray */
+void array_copy_data(t_ndarray* dest, t_ndarray src, int64_t offset);
+
+/* numpy sum */
+
+int64_t            numpy_sum_bool(t_ndarray arr);
+int64_t            numpy_sum_int8(t_ndarray arr);
+int64_t            numpy_sum_int16(t_ndarray arr);
+int64_t            numpy_sum_int32(t_ndarray arr);
+int64_t            numpy_sum_int64(t_ndarray arr);
+float              numpy_sum_float32(t_ndarray arr);
+double             numpy_sum_float64(t_ndarray arr);
+float complex      numpy_sum_complex64(t_ndarray arr);
+double complex     numpy_sum_complex128(t_ndarray arr);
+
+/*numpy max/amax */
+
+int64_t            numpy_amax_bool(t_ndarray arr);
+int64_t            numpy_amax_int8(t_ndarray arr);
+int64_t            numpy_amax_int16(t_ndarray arr);
+int64_t            numpy_amax_int32(t_ndarray arr);
+int64_t            numpy_amax_int64(t_ndarray arr);
+float              numpy_amax_float32(t_ndarray arr);
+double             numpy_amax_float64(t_ndarray arr);
+float complex      numpy_amax_complex64(t_ndarray arr);
+double complex     numpy_amax_complex128(t_ndarray arr);
+
+/* numpy min/amin */
+
+int64_t            numpy_amin_bool(t_ndarray arr);
+int64_t            numpy_amin_int8(t_ndarray arr);
+int64_t            numpy_amin_int16(t_ndarray arr);
+int64_t            numpy_amin_int32(t_ndarray arr);
+int64_t            numpy_amin_int64(t_ndarray arr);
+float              numpy_amin_float32(t_ndarray arr);
+double             numpy_amin_float64(t_ndarray arr);
+float complex      numpy_amin_complex64(t_ndarray arr);
+double complex     numpy_amin_complex128(t_ndarray arr);
+
+/* numpy matmul */
+
+/*
+** Description of an operand of a matrix product. Vectors are described as
+** matrices with a single row (left operand) or a single column (right operand).
+*/
+typedef struct  s_matrix
+{
+    void        *data;
+    int64_t     rows;
+    int64_t     cols;
+    int64_t     row_stride;
+    int64_t     col_stride;
+}               t_matrix;
+
+bool    arrays_overlap(t_ndarray a, t_ndarray b);
+void    matmul_operands(t_ndarray out, t_ndarray a, t_ndarray b,
+        t_matrix *out_mat, t_matrix *a_mat, t_matrix *b_mat);
+
+void    numpy_matmul_tiled_bool(t_ndarray out, t_ndarray a, t_ndarray b);
+void    numpy_matmul_tiled_int8(t_ndarray out, t_ndarray a, t_ndarray b);
+void    numpy_matmul_tiled_int16(t_ndarray out, t_ndarray a, t_ndarray b);
+void    numpy_matmul_tiled_int32(t_ndarray out, t_ndarray a, t_ndarray b);
+void    numpy_matmul_tiled_int64(t_ndarray out, t_ndarray a, t_ndarray b);
+void    numpy_matmul_tiled_float32(t_ndarray out, t_ndarray a, t_ndarray b);
+void    numpy_matmul_tiled_float64(t_ndarray out, t_ndarray a, t_ndarray b);
+void    numpy_matmul_tiled_complex64(t_ndarray out, t_ndarray a, t_ndarray b);
+void    numpy_matmul_tiled_complex128(t_ndarray out, t_ndarray a, t_ndarray b);
+
+bool               numpy_dot_bool(t_ndarray a, t_ndarray b);
+int8_t             numpy_dot_int8(t_ndarray a, t_ndarray b);
+int16_t            numpy_dot_int16(t_ndarray a, t_ndarray b);
+int32_t            numpy_dot_int32(t_ndarray a, t_ndarray b);
+int64_t            numpy_dot_int64(t_ndarray a, t_ndarray b);
+float              numpy_dot_float32(t_ndarray a, t_ndarray b);
+double             numpy_dot_float64(t_ndarray a, t_ndarray b);
+float complex      numpy_dot_complex64(t_ndarray a, t_ndarray b);
+double complex     numpy_dot_complex128(t_ndarray a, t_ndarray b);
+
+# define numpy_matmul_bool   numpy_matmul_tiled_bool
+# define numpy_matmul_int8   numpy_matmul_tiled_int8
+# define numpy_matmul_int16  numpy_matmul_tiled_int16
+# define numpy_matmul_int32  numpy_matmul_tiled_int32
+# define numpy_matmul_int64  numpy_matmul_tiled_int64
+
+/*
+** When a BLAS library is linked (PYCCEL_USE_BLAS is defined by the `blas`
+** section of the compiler configuration) the floating point products are
+** computed by gemm/gemv whenever the memory layout of the operands can be
+** described to BLAS. Otherwise the tiled loops are used.
+*/
+# ifdef PYCCEL_USE_BLAS
+
+# include <limits.h>
+
+void    sgemm_(const char *transa, const char *transb, const int *m, const int *n, const int *k,
+        const float *alpha, const float *a, const int *lda, const float *b, const int *ldb,
+        const float *beta, float *c, const int *ldc);
+void    dgemm_(const char *transa, const char *transb, const int *m, const int *n, const int *k,
+        const double *alpha, const double *a, const int *lda, const double *b, const int *ldb,
+        const double *beta, double *c, const int *ldc);
+void    cgemm_(const char *transa, const char *transb, const int *m, const int *n, const int *k,
+        const float complex *alpha, const float complex *a, const int *lda, const float complex *b,
+        const int *ldb, const float complex *beta, float complex *c, const int *ldc);
+void    zgemm_(const char *transa, const char *transb, const int *m, const int *n, const int *k,
+        const double complex *alpha, const double complex *a, const int *lda, const double complex *b,
+        const int *ldb, const double complex *beta, double complex *c, const int *ldc);
+void    sgemv_(const char *trans, const int *m, const int *n, const float *alpha, const float *a,
+        const int *lda, const float *x, const int *incx, const float *beta, float *y, const int *incy);
+void    dgemv_(const char *trans, const int *m, const int *n, const double *alpha, const double *a,
+        const int *lda, const double *x, const int *incx, const double *beta, double *y, const int *incy);
+void    cgemv_(const char *trans, const int *m, const int *n, const float complex *alpha,
+        const float complex *a, const int *lda, const float complex *x, const int *incx,
+        const float complex *beta, float complex *y, const int *incy);
+void    zgemv_(const char *trans, const int *m, const int *n, const double complex *alpha,
+        const double complex *a, const int *lda, const double complex *x, const int *incx,
+        const double complex *beta, double complex *y, const int *incy);
+
+static inline t_matrix  matrix_transpose(t_matrix mat)
+{
+    t_matrix transpose = {mat.data, mat.cols, mat.rows, mat.col_stride, mat.row_stride};
+    return transpose;
+}
+
+/*
+** Get the transpose flag and the leading dimension which describe the matrix
+** in the column-major layout used by BLAS. A row-major matrix is described as
+** the transpose of a column-major matrix. Returns false if the matrix cannot
+** be described in this way (e.g. non-unit strides in both dimensions).
+*/
+static inline bool  blas_layout(t_matrix mat, char *trans, int *ld)
+{
+    int64_t lead;
+
+    if (mat.rows > INT_MAX || mat.cols > INT_MAX)
+        return false;
+    if (mat.row_stride == 1 || mat.rows == 1)
+    {
+        lead = mat.cols == 1 ? mat.rows : mat.col_stride;
+        if (lead >= mat.rows && lead >= 1 && lead <= INT_MAX)
+        {
+            *trans = 'N';
+            *ld = (int)lead;
+            return true;
+        }
+    }
+    if (mat.col_stride == 1 || mat.cols == 1)
+    {
+        lead = mat.rows == 1 ? mat.cols : mat.row_stride;
+        if (lead >= mat.cols && lead >= 1 && lead <= INT_MAX)
+        {
+            *trans = 'T';
+            *ld = (int)lead;
+            return true;
+        }
+    }
+    return false;
+}
+
+/*
+** Get the increment describing a vector (a matrix with a single row or column).
+*/
+static inline bool  blas_increment(t_matrix vec, int *inc)
+{
+    int64_t stride = vec.rows == 1 ? vec.col_stride : vec.row_stride;
+
+    if (vec.rows * vec.cols <= 1)
+        stride = 1;
+    if (stride < 1 || stride > INT_MAX)
+        return false;
+    *inc = (int)stride;
+    return true;
+}
+
+# define BLAS_MATMUL_(NAME, TYPE, PREFIX) \
+    static inline bool blas_matmul_##NAME(t_matrix c, t_matrix a, t_matrix b) \
+    { \
+        const TYPE  one = 1; \
+        const TYPE  zero = 0; \
+        t_matrix    tmp; \
+        char        trans_a, trans_b, trans_c; \
+        int         lda, ldb, ldc, inc_x, inc_y, m, n, k; \
+        /* Use C^T = B^T A^T to obtain a column vector or a column-major result */ \
+        if ((c.rows == 1 && c.cols != 1) || \
+                (c.cols != 1 && blas_layout(c, &trans_c, &ldc) && trans_c == 'T')) \
+        { \
+            tmp = a; \
+            a = matrix_transpose(b); \
+            b = matrix_transpose(tmp); \
+            c = matrix_transpose(c); \
+        } \
+        if (!blas_layout(a, &trans_a, &lda)) \
+            return false; \
+        if (c.cols == 1) \
+        { \
+            if (!blas_increment(b, &inc_x) || !blas_increment(c, &inc_y)) \
+                return false; \
+            m = (int)(trans_a == 'N' ? a.rows : a.cols); \
+            n = (int)(trans_a == 'N' ? a.cols : a.rows); \
+            PREFIX##gemv_(&trans_a, &m, &n, &one, (TYPE*)a.data, &lda, \
+                    (TYPE*)b.data, &inc_x, &zero, (TYPE*)c.data, &inc_y); \
+            return true; \
+        } \
+        if (!blas_layout(b, &trans_b, &ldb) || !blas_layout(c, &trans_c, &ldc) || trans_c != 'N') \
+            return false; \
+        m = (int)c.rows; \
+        n = (int)c.cols; \
+        k = (int)a.cols; \
+        PREFIX##gemm_(&trans_a, &trans_b, &m, &n, &k, &one, (TYPE*)a.data, &lda, \
+                (TYPE*)b.data, &ldb, &zero, (TYPE*)c.data, &ldc); \
+        return true; \
+    } \
+    static inline void numpy_matmul_##NAME(t_ndarray out, t_ndarray a, t_ndarray b) \
+    { \
+        t_matrix    out_mat, a_mat, b_mat; \
+        matmul_operands(out, a, b, &out_mat, &a_mat, &b_mat); \
+        if (arrays_overlap(out, a) || arrays_overlap(out, b) || \
+                !blas_matmul_##NAME(out_mat, a_mat, b_mat)) \
+            numpy_matmul_tiled_##NAME(out, a, b); \
+    }
+
+BLAS_MATMUL_(float32, float, s)
+BLAS_MATMUL_(float64, double, d)
+BLAS_MATMUL_(complex64, float complex, c)
+BLAS_MATMUL_(complex128, double complex, z)
+
+# else
+
+#  define numpy_matmul_float32     numpy_matmul_tiled_float32
+#  define numpy_matmul_float64     numpy_matmul_tiled_float64
+#  define numpy_matmul_complex64   numpy_matmul_tiled_complex64
+#  define numpy_matmul_complex128  numpy_matmul_tiled_complex128
+
+# endif
+
+#endif
@@ -0,0 +1,2 @@
+def axpy(a : "float", x : "float64[:]", y : "float64[:]"):
+    y[:] = a * x + y
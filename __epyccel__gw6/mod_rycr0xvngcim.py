@@ -0,0 +1,8 @@
+@stack_array('x')
+def f(b : bool):
+    import numpy as np
+    if b:
+        x = np.array([1,2,3])
+    else:
+        x = np.array([4,5,6])
+    return x[0]
@@ -0,0 +1,3 @@
+#ifndef NPY_NO_DEPRECATED_API
+# define NPY_NO_DEPRECATED_API NPY_1_19_API_VERSION
+#endif
\ No newline at end of file
@@ -0,0 +1,11 @@
+#include "mod_008oeh2hdje8.h"
+
+
+/*........................................*/
+void f(t_ndarray x)
+{
+    GET_ELEMENT(x, nd_int64, INT64_C(0)) = INT64_C(3);
+    GET_ELEMENT(x, nd_int64, INT64_C(1)) = INT64_C(3);
+}
+/*........................................*/
+
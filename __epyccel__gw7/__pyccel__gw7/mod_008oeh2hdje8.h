@@ -0,0 +1,11 @@
+#ifndef MOD_008OEH2HDJE8_H
+#define MOD_008OEH2HDJE8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f(t_ndarray x);
+#endif // mod_008oeh2hdje8_H
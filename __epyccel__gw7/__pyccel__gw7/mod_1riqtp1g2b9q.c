@@ -0,0 +1,10 @@
+#include "mod_1riqtp1g2b9q.h"
+
+
+/*........................................*/
+double f6(int64_t x, double y, int64_t z)
+{
+    return x + y * z;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_1RIQTP1G2B9Q_H
+#define MOD_1RIQTP1G2B9Q_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f6(int64_t x, double y, int64_t z);
+#endif // mod_1riqtp1g2b9q_H
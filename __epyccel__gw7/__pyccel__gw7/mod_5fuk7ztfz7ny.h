@@ -0,0 +1,12 @@
+#ifndef MOD_5FUK7ZTFZ7NY_H
+#define MOD_5FUK7ZTFZ7NY_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(bool b1, bool b2);
+#endif // mod_5fuk7ztfz7ny_H
@@ -0,0 +1,11 @@
+#ifndef MOD_60WTAXNP5B7R_H
+#define MOD_60WTAXNP5B7R_H
+
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t draw_normal(int64_t seed, double loc, double scale, double* x, double* y, double* z);
+#endif // mod_60wtaxnp5b7r_H
@@ -0,0 +1,11 @@
+#ifndef MOD_7MTVN6U8FWLC_H
+#define MOD_7MTVN6U8FWLC_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d);
+#endif // mod_7mtvn6u8fwlc_H
@@ -0,0 +1,17 @@
+#include "mod_c1ymmggq2rob.h"
+
+
+/*........................................*/
+int64_t f4(bool x)
+{
+    if (x)
+    {
+        return INT64_C(1);
+    }
+    else
+    {
+        return INT64_C(2);
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_C1YMMGGQ2ROB_H
+#define MOD_C1YMMGGQ2ROB_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f4(bool x);
+#endif // mod_c1ymmggq2rob_H
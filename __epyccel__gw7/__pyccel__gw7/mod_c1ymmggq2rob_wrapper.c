@@ -0,0 +1,97 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_C1YMMGGQ2ROB_WRAPPER
+
+#include "mod_c1ymmggq2rob_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f4_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    bool x;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    x_obj = Py_None;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 1, &x_obj))
+    {
+        return NULL;
+    }
+    x = 1;
+    if (x_obj != Py_None)
+    {
+        if (PyIs_Bool(x_obj))
+        {
+            x = PyBool_to_Bool(x_obj);
+        }
+        else
+        {
+            PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument x");
+            return NULL;
+        }
+    }
+    Out_0001 = f4(x);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_c1ymmggq2rob_methods[] = {
+    {
+        "f4",
+        (PyCFunction)f4_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_c1ymmggq2rob_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_c1ymmggq2rob",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_c1ymmggq2rob_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_c1ymmggq2rob(void)
+{
+    PyObject* mod;
+    static void* Pymod_c1ymmggq2rob_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_c1ymmggq2rob_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_c1ymmggq2rob_API, "mod_c1ymmggq2rob._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
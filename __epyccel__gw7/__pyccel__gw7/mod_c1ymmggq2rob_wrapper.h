@@ -0,0 +1,40 @@
+#ifndef MOD_C1YMMGGQ2ROB_WRAPPER_H
+#define MOD_C1YMMGGQ2ROB_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_c1ymmggq2rob.h"
+
+
+#ifdef MOD_C1YMMGGQ2ROB_WRAPPER
+
+
+#else
+
+static void** Pymod_c1ymmggq2rob_API;
+
+
+/*........................................*/
+static int mod_c1ymmggq2rob_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw7")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_c1ymmggq2rob_API = (void**)PyCapsule_Import("mod_c1ymmggq2rob._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_c1ymmggq2rob_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_C1YMMGGQ2ROB_WRAPPER_H
@@ -0,0 +1,16 @@
+from numpy import shape
+
+def f(b1 : 'bool', b2 : 'bool'):
+    from numpy import zeros
+    from numpy import shape
+    if b1:
+        if b2:
+            n = 0
+        else:
+            x = zeros((3), dtype = int)
+            n = 3
+    else:
+        x = zeros((4), dtype = int)
+        n = shape(x)[0]
+    return n
+
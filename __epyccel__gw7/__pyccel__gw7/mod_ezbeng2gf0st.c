@@ -0,0 +1,12 @@
+#include "mod_ezbeng2gf0st.h"
+
+
+/*........................................*/
+double complex f5(double complex x)
+{
+    double complex y;
+    y = x - INT64_C(1);
+    return y;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_EZBENG2GF0ST_H
+#define MOD_EZBENG2GF0ST_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex f5(double complex x);
+#endif // mod_ezbeng2gf0st_H
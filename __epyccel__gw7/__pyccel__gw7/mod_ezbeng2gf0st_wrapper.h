@@ -0,0 +1,40 @@
+#ifndef MOD_EZBENG2GF0ST_WRAPPER_H
+#define MOD_EZBENG2GF0ST_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ezbeng2gf0st.h"
+
+
+#ifdef MOD_EZBENG2GF0ST_WRAPPER
+
+
+#else
+
+static void** Pymod_ezbeng2gf0st_API;
+
+
+/*........................................*/
+static int mod_ezbeng2gf0st_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw7")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ezbeng2gf0st_API = (void**)PyCapsule_Import("mod_ezbeng2gf0st._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ezbeng2gf0st_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_EZBENG2GF0ST_WRAPPER_H
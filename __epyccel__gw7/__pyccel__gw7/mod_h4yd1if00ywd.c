@@ -0,0 +1,23 @@
+#include "mod_h4yd1if00ywd.h"
+
+
+/*........................................*/
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d, int64_t* x)
+{
+    int64_t Dummy_0000;
+    int64_t Dummy_0001;
+    int64_t Dummy_0002;
+    int64_t Dummy_0003;
+    Dummy_0000 = INT64_C(3) * INT64_C(3);
+    (*a) = Dummy_0000 * Dummy_0000;
+    Dummy_0001 = (INT64_C(8) + INT64_C(3)) * (INT64_C(8) + INT64_C(3));
+    (*b) = Dummy_0001 * Dummy_0001;
+    Dummy_0002 = ((int64_t)floor((double)(((*b) - (*a))) / 2000.0)) * ((int64_t)floor((double)(((*b) - (*a))) / 2000.0));
+    (*c) = Dummy_0002 * Dummy_0002;
+    (*x) = INT64_C(2);
+    Dummy_0003 = (*x) * (*x);
+    (*d) = Dummy_0003 * Dummy_0003;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_H4YD1IF00YWD_H
+#define MOD_H4YD1IF00YWD_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d, int64_t* x);
+#endif // mod_h4yd1if00ywd_H
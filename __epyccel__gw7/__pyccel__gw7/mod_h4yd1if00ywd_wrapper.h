@@ -0,0 +1,40 @@
+#ifndef MOD_H4YD1IF00YWD_WRAPPER_H
+#define MOD_H4YD1IF00YWD_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_h4yd1if00ywd.h"
+
+
+#ifdef MOD_H4YD1IF00YWD_WRAPPER
+
+
+#else
+
+static void** Pymod_h4yd1if00ywd_API;
+
+
+/*........................................*/
+static int mod_h4yd1if00ywd_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw7")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_h4yd1if00ywd_API = (void**)PyCapsule_Import("mod_h4yd1if00ywd._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_h4yd1if00ywd_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_H4YD1IF00YWD_WRAPPER_H
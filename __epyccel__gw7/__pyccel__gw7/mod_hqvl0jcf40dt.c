@@ -0,0 +1,15 @@
+#include "mod_hqvl0jcf40dt.h"
+
+
+/*........................................*/
+int64_t draw_random(int64_t seed, int64_t stream, double* x, double* y, double* z)
+{
+    t_philox rng;
+    rng = pyc_philox_init(seed, stream);
+    (*x) = pyc_philox_random(&rng);
+    (*y) = pyc_philox_random(&rng);
+    (*z) = pyc_philox_random(&rng);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_HQVL0JCF40DT_H
+#define MOD_HQVL0JCF40DT_H
+
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t draw_random(int64_t seed, int64_t stream, double* x, double* y, double* z);
+#endif // mod_hqvl0jcf40dt_H
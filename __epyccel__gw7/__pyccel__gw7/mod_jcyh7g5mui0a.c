@@ -0,0 +1,15 @@
+#include "mod_jcyh7g5mui0a.h"
+
+
+/*........................................*/
+int64_t skip_ahead(int64_t seed, int64_t n_blocks)
+{
+    t_philox rng;
+    double Dummy_0000;
+    rng = pyc_philox_init(seed, INT64_C(0));
+    Dummy_0000 = pyc_philox_random(&rng);
+    pyc_philox_advance(&rng, n_blocks);
+    return pyc_philox_integers(&rng, INT64_C(0), INT64_C(1000000));
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_JCYH7G5MUI0A_H
+#define MOD_JCYH7G5MUI0A_H
+
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t skip_ahead(int64_t seed, int64_t n_blocks);
+#endif // mod_jcyh7g5mui0a_H
@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_JCYH7G5MUI0A_WRAPPER
+
+#include "mod_jcyh7g5mui0a_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* skip_ahead_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* seed_obj;
+    PyObject* n_blocks_obj;
+    int64_t seed;
+    int64_t n_blocks;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "seed",
+        "n_blocks",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &seed_obj, &n_blocks_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(seed_obj))
+    {
+        seed = PyInt64_to_Int64(seed_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument seed");
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_blocks_obj))
+    {
+        n_blocks = PyInt64_to_Int64(n_blocks_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n_blocks");
+        return NULL;
+    }
+    Out_0001 = skip_ahead(seed, n_blocks);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_jcyh7g5mui0a_methods[] = {
+    {
+        "skip_ahead",
+        (PyCFunction)skip_ahead_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_jcyh7g5mui0a_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_jcyh7g5mui0a",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_jcyh7g5mui0a_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_jcyh7g5mui0a(void)
+{
+    PyObject* mod;
+    static void* Pymod_jcyh7g5mui0a_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_jcyh7g5mui0a_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_jcyh7g5mui0a_API, "mod_jcyh7g5mui0a._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
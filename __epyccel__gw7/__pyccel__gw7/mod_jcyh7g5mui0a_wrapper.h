@@ -0,0 +1,40 @@
+#ifndef MOD_JCYH7G5MUI0A_WRAPPER_H
+#define MOD_JCYH7G5MUI0A_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_jcyh7g5mui0a.h"
+
+
+#ifdef MOD_JCYH7G5MUI0A_WRAPPER
+
+
+#else
+
+static void** Pymod_jcyh7g5mui0a_API;
+
+
+/*........................................*/
+static int mod_jcyh7g5mui0a_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw7")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_jcyh7g5mui0a_API = (void**)PyCapsule_Import("mod_jcyh7g5mui0a._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_jcyh7g5mui0a_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_JCYH7G5MUI0A_WRAPPER_H
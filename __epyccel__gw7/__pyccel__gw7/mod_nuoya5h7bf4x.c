@@ -0,0 +1,20 @@
+#include "mod_nuoya5h7bf4x.h"
+
+
+/*........................................*/
+void fill(int64_t seed, t_ndarray a)
+{
+    t_philox rng;
+    int64_t i;
+    int64_t i_0001;
+    rng = pyc_philox_init(seed, INT64_C(0));
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(a, nd_double, i, i_0001) = pyc_philox_random(&rng);
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_NUOYA5H7BF4X_H
+#define MOD_NUOYA5H7BF4X_H
+
+#include "ndarrays.h"
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void fill(int64_t seed, t_ndarray a);
+#endif // mod_nuoya5h7bf4x_H
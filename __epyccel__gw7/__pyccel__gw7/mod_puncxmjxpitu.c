@@ -0,0 +1,14 @@
+#include "mod_puncxmjxpitu.h"
+
+
+/*........................................*/
+void scale(t_ndarray x, double factor, int64_t offset)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) = GET_ELEMENT(x, nd_double, i) * factor + offset;
+    }
+}
+/*........................................*/
+
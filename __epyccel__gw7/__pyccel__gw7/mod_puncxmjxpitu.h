@@ -0,0 +1,11 @@
+#ifndef MOD_PUNCXMJXPITU_H
+#define MOD_PUNCXMJXPITU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void scale(t_ndarray x, double factor, int64_t offset);
+#endif // mod_puncxmjxpitu_H
@@ -0,0 +1,12 @@
+#ifndef MOD_QSVO82XOAB0L_H
+#define MOD_QSVO82XOAB0L_H
+
+#include "ndarrays.h"
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void fill(int64_t seed, t_ndarray a, t_ndarray b, t_ndarray c);
+#endif // mod_qsvo82xoab0l_H
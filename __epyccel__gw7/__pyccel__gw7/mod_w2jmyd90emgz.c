@@ -0,0 +1,18 @@
+#include "mod_w2jmyd90emgz.h"
+
+
+/*........................................*/
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d)
+{
+
+    (*a) = INT64_C(3) * INT64_C(3) * INT64_C(3);
+
+    (*b) = (INT64_C(8) + INT64_C(3)) * (INT64_C(8) + INT64_C(3)) * (INT64_C(8) + INT64_C(3));
+
+    (*c) = ((int64_t)floor((double)(((*b) - (*a))) / 20.0)) * ((int64_t)floor((double)(((*b) - (*a))) / 20.0)) * ((int64_t)floor((double)(((*b) - (*a))) / 20.0));
+
+    (*d) = (*a) * (*a) * (*a);
+    return 0;
+}
+/*........................................*/
+
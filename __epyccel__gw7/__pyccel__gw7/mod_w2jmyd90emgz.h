@@ -0,0 +1,11 @@
+#ifndef MOD_W2JMYD90EMGZ_H
+#define MOD_W2JMYD90EMGZ_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d);
+#endif // mod_w2jmyd90emgz_H
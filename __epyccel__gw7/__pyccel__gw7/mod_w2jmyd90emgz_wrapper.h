@@ -0,0 +1,40 @@
+#ifndef MOD_W2JMYD90EMGZ_WRAPPER_H
+#define MOD_W2JMYD90EMGZ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_w2jmyd90emgz.h"
+
+
+#ifdef MOD_W2JMYD90EMGZ_WRAPPER
+
+
+#else
+
+static void** Pymod_w2jmyd90emgz_API;
+
+
+/*........................................*/
+static int mod_w2jmyd90emgz_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/__epyccel__gw7")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_w2jmyd90emgz_API = (void**)PyCapsule_Import("mod_w2jmyd90emgz._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_w2jmyd90emgz_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_W2JMYD90EMGZ_WRAPPER_H
@@ -0,0 +1,10 @@
+#include "mod_x3k8rl8ngo67.h"
+
+
+/*........................................*/
+int64_t f7(int64_t x, int64_t y)
+{
+    return x + y;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_X3K8RL8NGO67_H
+#define MOD_X3K8RL8NGO67_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f7(int64_t x, int64_t y);
+#endif // mod_x3k8rl8ngo67_H
@@ -0,0 +1,15 @@
+#include "mod_yfvticrd4oo8.h"
+
+
+/*........................................*/
+int64_t draw_integers(int64_t seed, int64_t low, int64_t high, int64_t* x, int64_t* y, int64_t* z)
+{
+    t_philox rng;
+    rng = pyc_philox_init(seed, INT64_C(0));
+    (*x) = pyc_philox_integers(&rng, low, high);
+    (*y) = pyc_philox_integers(&rng, low, high);
+    (*z) = pyc_philox_integers(&rng, low, high);
+    return 0;
+}
+/*........................................*/
+
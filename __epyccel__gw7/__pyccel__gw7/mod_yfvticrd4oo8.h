@@ -0,0 +1,11 @@
+#ifndef MOD_YFVTICRD4OO8_H
+#define MOD_YFVTICRD4OO8_H
+
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t draw_integers(int64_t seed, int64_t low, int64_t high, int64_t* x, int64_t* y, int64_t* z);
+#endif // mod_yfvticrd4oo8_H
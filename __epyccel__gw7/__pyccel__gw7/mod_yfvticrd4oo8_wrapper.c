@@ -0,0 +1,126 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_YFVTICRD4OO8_WRAPPER
+
+#include "mod_yfvticrd4oo8_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* draw_integers_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* seed_obj;
+    PyObject* low_obj;
+    PyObject* high_obj;
+    int64_t seed;
+    int64_t low;
+    int64_t high;
+    PyObject* x_obj;
+    int64_t x;
+    PyObject* y_obj;
+    int64_t y;
+    PyObject* z_obj;
+    int64_t z;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "seed",
+        "low",
+        "high",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &seed_obj, &low_obj, &high_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(seed_obj))
+    {
+        seed = PyInt64_to_Int64(seed_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument seed");
+        return NULL;
+    }
+    if (PyIs_NativeInt(low_obj))
+    {
+        low = PyInt64_to_Int64(low_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument low");
+        return NULL;
+    }
+    if (PyIs_NativeInt(high_obj))
+    {
+        high = PyInt64_to_Int64(high_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument high");
+        return NULL;
+    }
+    draw_integers(seed, low, high, &x, &y, &z);
+    x_obj = Int64_to_PyLong(&x);
+    y_obj = Int64_to_PyLong(&y);
+    z_obj = Int64_to_PyLong(&z);
+    Out_obj = Py_BuildValue("OOO", x_obj, y_obj, z_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    Py_DECREF(z_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_yfvticrd4oo8_methods[] = {
+    {
+        "draw_integers",
+        (PyCFunction)draw_integers_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_yfvticrd4oo8_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_yfvticrd4oo8",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_yfvticrd4oo8_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_yfvticrd4oo8(void)
+{
+    PyObject* mod;
+    static void* Pymod_yfvticrd4oo8_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_yfvticrd4oo8_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_yfvticrd4oo8_API, "mod_yfvticrd4oo8._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,230 @@
+! -------------------------------------------------------------------------------------- !
+! This file is part of Pyccel which is released under MIT License. See the LICENSE file  !
+! or go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details. !
+! -------------------------------------------------------------------------------------- !
+
+! Counter-based random number generator Philox4x32-10 (see J. K. Salmon et al.,
+! "Parallel random numbers: as easy as 1, 2, 3", SC'11).
+! The key is the seed. The upper 64 bits of the counter contain the index of
+! the stream and the lower 64 bits contain the index of the block in the stream.
+! The numbers are identical to those generated by pyccel.random.Generator.
+! Fortran has no unsigned integers so each 32-bit word is stored in a 64-bit
+! integer and no operation is allowed to overflow.
+
+module pyc_random_f90
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T, &
+         i64 => C_INT64_T, &
+         f64 => C_DOUBLE
+
+implicit none
+
+private
+
+real(f64), parameter :: pi = 4.0_f64 * DATAN(1.0_f64)
+integer(i64), parameter :: mask32 = 4294967295_i64
+integer(i64), parameter :: two_pow_32 = 4294967296_i64
+integer(i64), parameter :: two_pow_62 = 4611686018427387904_i64
+
+type, public :: pyc_philox
+    integer(i64) :: key(0:1) = 0_i64
+    integer(i64) :: counter(0:3) = 0_i64
+    integer(i64) :: block(0:3) = 0_i64
+    integer(i32) :: index = 4_i32
+    logical      :: has_spare = .False.
+    real(f64)    :: spare = 0.0_f64
+end type pyc_philox
+
+public :: pyc_philox_init, &
+          pyc_philox_advance, &
+          pyc_philox_random, &
+          pyc_philox_integers, &
+          pyc_philox_normal
+
+contains
+
+! Multiply two 32-bit words and return the high and low words of the product.
+! The second word is split into 16-bit halves so no intermediate exceeds 2**49.
+pure subroutine mulhilo32(a, b, hi, lo)
+
+    implicit none
+
+    integer(i64), value      :: a, b
+    integer(i64), intent(out) :: hi, lo
+    integer(i64)             :: lo_part, hi_part, total
+
+    lo_part = a * IAND(b, 65535_i64)
+    hi_part = a * SHIFTR(b, 16)
+    total = lo_part + SHIFTL(IAND(hi_part, 65535_i64), 16)
+    hi = SHIFTR(hi_part, 16) + SHIFTR(total, 32)
+    lo = IAND(total, mask32)
+
+end subroutine mulhilo32
+
+! Compute one block by applying the ten rounds of the Philox4x32 bijection
+pure subroutine philox4x32(counter, key, block)
+
+    implicit none
+
+    integer(i64), intent(in)  :: counter(0:3)
+    integer(i64), intent(in)  :: key(0:1)
+    integer(i64), intent(out) :: block(0:3)
+    integer(i64)             :: k0, k1, hi0, lo0, hi1, lo1
+    integer(i32)             :: i
+
+    block = counter
+    k0 = key(0)
+    k1 = key(1)
+    do i = 0_i32, 9_i32
+        if (i > 0_i32) then
+            k0 = IAND(k0 + 2654435769_i64, mask32)
+            k1 = IAND(k1 + 3144134277_i64, mask32)
+        end if
+        call mulhilo32(3528531795_i64, block(0), hi0, lo0)
+        call mulhilo32(3449720151_i64, block(2), hi1, lo1)
+        block(0) = IEOR(IEOR(hi1, block(1)), k0)
+        block(1) = lo1
+        block(2) = IEOR(IEOR(hi0, block(3)), k1)
+        block(3) = lo0
+    end do
+
+end subroutine philox4x32
+
+! Increment the index of the block in the stream modulo 2**64
+pure subroutine philox_step(rng, n_blocks)
+
+    implicit none
+
+    type(pyc_philox), intent(inout) :: rng
+    integer(i64), value            :: n_blocks
+    integer(i64)                   :: low
+
+    low = rng%counter(0) + IAND(n_blocks, mask32)
+    rng%counter(0) = IAND(low, mask32)
+    rng%counter(1) = IAND(rng%counter(1) + SHIFTR(n_blocks, 32) + SHIFTR(low, 32), mask32)
+
+end subroutine philox_step
+
+! Get the next 32-bit word of the stream
+function philox_next_uint32(rng) result(word)
+
+    implicit none
+
+    type(pyc_philox), intent(inout) :: rng
+    integer(i64)                   :: word
+
+    if (rng%index == 4_i32) then
+        call philox4x32(rng%counter, rng%key, rng%block)
+        call philox_step(rng, 1_i64)
+        rng%index = 0_i32
+    end if
+    word = rng%block(rng%index)
+    rng%index = rng%index + 1_i32
+
+end function philox_next_uint32
+
+! Create a generator from a seed and the index of a stream
+pure function pyc_philox_init(seed, stream) result(rng)
+
+    implicit none
+
+    integer(i64), value :: seed
+    integer(i64), value :: stream
+    type(pyc_philox)    :: rng
+
+    rng%key(0) = IAND(seed, mask32)
+    rng%key(1) = SHIFTR(seed, 32)
+    rng%counter(0) = 0_i64
+    rng%counter(1) = 0_i64
+    rng%counter(2) = IAND(stream, mask32)
+    rng%counter(3) = SHIFTR(stream, 32)
+
+end function pyc_philox_init
+
+! Skip blocks of the stream
+subroutine pyc_philox_advance(rng, n_blocks)
+
+    implicit none
+
+    type(pyc_philox), intent(inout) :: rng
+    integer(i64), value            :: n_blocks
+
+    call philox_step(rng, n_blocks)
+    rng%index = 4_i32
+    rng%has_spare = .False.
+
+end subroutine pyc_philox_advance
+
+! Get a float in [0, 1) with 53 random bits built from two words
+function pyc_philox_random(rng) result(x)
+
+    implicit none
+
+    type(pyc_philox), intent(inout) :: rng
+    real(f64)                      :: x
+    integer(i64)                   :: a, b
+
+    a = SHIFTR(philox_next_uint32(rng), 5)
+    b = SHIFTR(philox_next_uint32(rng), 6)
+    x = (real(a, f64) * 67108864.0_f64 + real(b, f64)) / 9007199254740992.0_f64
+
+end function pyc_philox_random
+
+! Get an integer in [low, high) using rejection sampling
+! 0 < high - low <= 2**62 is assumed
+function pyc_philox_integers(rng, low, high) result(n)
+
+    implicit none
+
+    type(pyc_philox), intent(inout) :: rng
+    integer(i64), value            :: low
+    integer(i64), value            :: high
+    integer(i64)                   :: n
+    integer(i64)                   :: span, limit, x
+
+    span = high - low
+    if (span <= two_pow_32) then
+        limit = two_pow_32 - MODULO(two_pow_32, span)
+        x = philox_next_uint32(rng)
+        do while (x >= limit)
+            x = philox_next_uint32(rng)
+        end do
+    else
+        limit = two_pow_62 - MODULO(two_pow_62, span)
+        x = SHIFTL(IAND(philox_next_uint32(rng), 1073741823_i64), 32)
+        x = IOR(x, philox_next_uint32(rng))
+        do while (x >= limit)
+            x = SHIFTL(IAND(philox_next_uint32(rng), 1073741823_i64), 32)
+            x = IOR(x, philox_next_uint32(rng))
+        end do
+    end if
+    n = low + MODULO(x, span)
+
+end function pyc_philox_integers
+
+! Get a float from a normal distribution using the Box-Muller transform
+! The second variate is kept for the next call
+function pyc_philox_normal(rng, loc, scale) result(x)
+
+    implicit none
+
+    type(pyc_philox), intent(inout) :: rng
+    real(f64), value               :: loc
+    real(f64), value               :: scale
+    real(f64)                      :: x
+    real(f64)                      :: radius, theta
+
+    if (rng%has_spare) then
+        rng%has_spare = .False.
+        x = loc + scale * rng%spare
+        return
+    end if
+    radius = sqrt(-2.0_f64 * log(1.0_f64 - pyc_philox_random(rng)))
+    theta = 2.0_f64 * pi * pyc_philox_random(rng)
+    rng%spare = radius * sin(theta)
+    rng%has_spare = .True.
+    x = loc + scale * radius * cos(theta)
+
+end function pyc_philox_normal
+
+end module pyc_random_f90
@@ -0,0 +1,6 @@
+def f(x : 'int[:]'):
+    @inline
+    def set_3(s : 'int[:]', i : int):
+        s[i] = 3
+    set_3(x, 0)
+    set_3(x, 1)
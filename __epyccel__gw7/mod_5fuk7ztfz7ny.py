@@ -0,0 +1,12 @@
+def f(b1 : bool, b2 : bool):
+    import numpy as np
+    if b1:
+        if b2:
+            n = 0
+        else:
+            x = np.zeros(3, dtype=int)
+            n = x.shape[0]
+    else:
+        x = np.zeros(4, dtype=int)
+        n = x.shape[0]
+    return n
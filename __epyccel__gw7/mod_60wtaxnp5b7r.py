@@ -0,0 +1,7 @@
+def draw_normal(seed : int, loc : float, scale : float):
+    from pyccel.random import Generator
+    rng = Generator(seed)
+    x = rng.normal()
+    y = rng.normal(loc, scale)
+    z = rng.normal(loc, scale)
+    return x, y, z
@@ -0,0 +1,5 @@
+def f4(x  : 'bool' =  True):
+    if x:
+        return 1
+    else:
+        return 2
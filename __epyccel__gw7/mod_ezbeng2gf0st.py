@@ -0,0 +1,3 @@
+def f5(x  : 'complex' =  1j):
+    y = x - 1
+    return y
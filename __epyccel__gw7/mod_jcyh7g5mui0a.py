@@ -0,0 +1,6 @@
+def skip_ahead(seed : int, n_blocks : int):
+    from pyccel.random import Generator
+    rng = Generator(seed)
+    rng.random()
+    rng.advance(n_blocks)
+    return rng.integers(0, 1000000)
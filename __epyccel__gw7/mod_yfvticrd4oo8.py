@@ -0,0 +1,7 @@
+def draw_integers(seed : int, low : int, high : int):
+    from pyccel.random import Generator
+    rng = Generator(seed)
+    x = rng.integers(low, high)
+    y = rng.integers(low, high)
+    z = rng.integers(low, high)
+    return x, y, z
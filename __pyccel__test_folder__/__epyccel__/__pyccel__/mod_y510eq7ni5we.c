@@ -0,0 +1,12 @@
+#include "mod_y510eq7ni5we.h"
+
+
+/*........................................*/
+int64_t free_gift(void)
+{
+    int64_t gift;
+    gift = INT64_C(10);
+    return gift;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_Y510EQ7NI5WE_H
+#define MOD_Y510EQ7NI5WE_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t free_gift(void);
+#endif // mod_y510eq7ni5we_H
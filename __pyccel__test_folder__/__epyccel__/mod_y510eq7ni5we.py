@@ -0,0 +1,3 @@
+def free_gift():
+    gift = 10
+    return gift
@@ -0,0 +1,82 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Micro-benchmark measuring the cost of creating array views in the generated code.
+
+The benchmarked function loops over the rows of a 2D array and creates a view of
+each row before accessing a single element. The work done per row is negligible
+so the measured time is dominated by the creation (and destruction) of the views.
+This is the pattern that is most sensitive to the cost of `array_slicing` in the
+C `ndarrays` library:
+
+    python benchmarks/array_view_overhead.py --language c
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from pyccel import epyccel
+
+#==============================================================================
+def row_views(a : 'float[:,:]', n_repeat : int):
+    s = 0.0
+    for _ in range(n_repeat):
+        for i in range(a.shape[0]):
+            row = a[i, :]
+            s += row[0]
+    return s
+
+def transposed_views(a : 'float[:,:]', n_repeat : int):
+    s = 0.0
+    for _ in range(n_repeat):
+        b = a.T
+        s += b[0, 0]
+    return s
+
+#==============================================================================
+def run_benchmark(language, n_rows, n_repeat, repeat):
+    """
+    Print the time needed to create a view.
+
+    Accelerate the benchmarked functions with epyccel and print the best time
+    per view measured by timeit.
+
+    Parameters
+    ----------
+    language : str
+        The language that the functions are translated to.
+    n_rows : int
+        The number of rows in the array (i.e. the number of views per repetition).
+    n_repeat : int
+        The number of times that the loop over the rows is repeated inside the
+        accelerated function.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    a = np.ones((n_rows, 8))
+
+    print(f"Language : {language}")
+    for func in (row_views, transposed_views):
+        accelerated = epyccel(func, language = language)
+        n_views = n_rows * n_repeat if func is row_views else n_repeat
+        t = min(timeit.repeat(lambda f=accelerated: f(a, n_repeat), number = 1, repeat = repeat))
+        print(f"{func.__name__:<20} {t / n_views * 1e9:8.2f} ns per view")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the cost of creating array views.')
+    parser.add_argument('--language', choices=('c', 'fortran'), default='c',
+                        help='The language that the functions are translated to.')
+    parser.add_argument('--rows', type=int, default=1000,
+                        help='The number of rows in the array.')
+    parser.add_argument('--n-repeat', type=int, default=10000,
+                        help='The number of loops over the rows in each timing.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.rows, args.n_repeat, args.repeat)
@@ -0,0 +1,109 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark comparing dictionaries translated to C (STC hash maps) with CPython dicts.
+
+The same functions are run in Python and accelerated with epyccel. They build
+dictionaries with integer keys, look up integer keys in a dictionary passed
+from Python (which includes the cost of the conversion) and look up string keys:
+
+    python benchmarks/dict_lookups.py
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+from pyccel import epyccel
+
+#==============================================================================
+code = '''
+def build_int(n : int):
+    a : 'dict[int, int]' = {}
+    for i in range(n):
+        a.setdefault((i * 7919) % n, i)
+    return a.get(0, -1)
+
+def lookup_int(a : 'const dict[int, int]', keys : 'int[:]'):
+    total = 0
+    for k in keys:
+        total += a.get(k, 0)
+    return total
+
+def lookup_str(n : int):
+    a = {'alpha' : 1, 'beta' : 2, 'gamma' : 3, 'delta' : 4, 'epsilon' : 5}
+    total = 0
+    for _ in range(n):
+        total += a.get('gamma', 0) + a.get('omega', 0)
+    return total
+'''
+
+#==============================================================================
+def load_module():
+    """
+    Get the Python and accelerated versions of the functions.
+
+    Write the code to a file, import it as a module and accelerate this module
+    with epyccel.
+
+    Returns
+    -------
+    module
+        The Python module.
+    module
+        The accelerated module.
+    """
+    folder = tempfile.mkdtemp()
+    with open(os.path.join(folder, 'dict_lookups_bench.py'), 'w', encoding='utf-8') as f:
+        f.write(code)
+    sys.path.insert(0, folder)
+    mod = importlib.import_module('dict_lookups_bench')
+    sys.path.pop(0)
+    return mod, epyccel(mod, language = 'c')
+
+def run_benchmark(sizes, number, repeat):
+    """
+    Print the time per call of the Python and accelerated versions of each function.
+
+    Parameters
+    ----------
+    sizes : list[int]
+        The number of elements or of lookups.
+    number : int
+        The number of calls in each timing.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    pymod, mod = load_module()
+
+    print(f"{'Call':<12}{'Size':>12}{'Python':>14}{'Pyccel':>14}{'Speed-up':>10}")
+    for n in sizes:
+        a = {i : 2 * i for i in range(n)}
+        keys = np.random.default_rng(0).integers(0, 2 * n, n)
+        calls = {'build_int'  : lambda m: m.build_int(n),
+                 'lookup_int' : lambda m: m.lookup_int(a, keys),
+                 'lookup_str' : lambda m: m.lookup_str(n)}
+        for name, call in calls.items():
+            times = [min(timeit.repeat(lambda m=m: call(m), number = number, repeat = repeat)) / number
+                     for m in (pymod, mod)]
+            print(f"{name:<12}{n:>12}{times[0]*1e6:12.2f}us{times[1]*1e6:12.2f}us{times[0]/times[1]:10.2f}")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare dictionaries translated to C with CPython dicts.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 1000000],
+                        help='The number of elements or of lookups.')
+    parser.add_argument('--number', type=int, default=5,
+                        help='The number of calls in each timing.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.sizes, args.number, args.repeat)
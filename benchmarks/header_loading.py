@@ -0,0 +1,102 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark measuring the time needed to load Pyccel's internal header files.
+
+Each header in `pyccel/stdlib/internal` is copied to a temporary folder and
+parsed once to create its `.pyccel` file. The best time needed to parse the
+header without a `.pyccel` file and to load it from the `.pyccel` file is then
+printed together with the size of the `.pyccel` file:
+
+    python benchmarks/header_loading.py
+"""
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import timeit
+
+from pyccel.errors.errors import Errors, PyccelError
+from pyccel.parser.syntactic import SyntaxParser
+
+#==============================================================================
+internal_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                               'pyccel', 'stdlib', 'internal')
+
+#==============================================================================
+def get_load_times(filename, repeat):
+    """
+    Get the time needed to parse a header with and without its `.pyccel` file.
+
+    Copy the header to a temporary folder and measure the best time needed to
+    parse it when the `.pyccel` file does not exist and when it does.
+
+    Parameters
+    ----------
+    filename : str
+        The absolute path to the header file.
+    repeat : int
+        The number of timings. The best timing is reported.
+
+    Returns
+    -------
+    parse_time : float
+        The time needed to parse the header.
+    load_time : float
+        The time needed to load the header from its `.pyccel` file.
+    size : int
+        The size of the `.pyccel` file in bytes.
+    """
+    with tempfile.TemporaryDirectory() as folder, contextlib.redirect_stdout(io.StringIO()):
+        header = shutil.copy(filename, folder)
+        cache = os.path.splitext(header)[0] + '.pyccel'
+
+        def parse():
+            if os.path.exists(cache):
+                os.remove(cache)
+            SyntaxParser(header)
+
+        parse_time = min(timeit.repeat(parse, number = 1, repeat = repeat))
+        load_time = min(timeit.repeat(lambda: SyntaxParser(header), number = 1, repeat = repeat))
+        size = os.path.getsize(cache)
+
+    return parse_time, load_time, size
+
+#==============================================================================
+def run_benchmark(repeat):
+    """
+    Print the time needed to load each internal header.
+
+    Print the time needed to parse each internal header, the time needed to
+    load it from its `.pyccel` file and the size of this file. Headers which
+    cannot be parsed are skipped.
+
+    Parameters
+    ----------
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    print(f"{'Header':<16}{'Parse':>12}{'Load':>12}{'Size':>12}")
+    for f in sorted(os.listdir(internal_folder)):
+        if f.endswith('.pyh'):
+            try:
+                parse_time, load_time, size = get_load_times(os.path.join(internal_folder, f), repeat)
+            except PyccelError:
+                Errors().reset()
+                print(f"{f:<16}{'Invalid header':>36}")
+                continue
+            print(f"{f:<16}{parse_time*1e3:10.1f}ms{load_time*1e3:10.1f}ms{size/1024:10.1f}kB")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the time needed to load Pyccel's internal header files.")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.repeat)
@@ -0,0 +1,93 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Micro-benchmark measuring the cost of choosing the specialisation of a function with union types.
+
+When a function has arguments with several possible types, one specialisation is
+generated for each combination of types and the wrapper must determine which
+one to call from the types of the Python arguments. The functions which are
+benchmarked do almost no work and have 1, 8 or 64 specialisations so the
+difference between the timings shows the cost of the dispatch:
+
+    python benchmarks/interface_dispatch.py --language c
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from pyccel import epyccel
+
+#==============================================================================
+def scalar_1(a : float, b : float, c : float, d : float, e : float, f : float):
+    return a
+
+def scalar_8(a : 'int | float', b : 'int | float', c : 'int | float', d : float, e : float, f : float):
+    return a
+
+def scalar_64(a : 'int | float', b : 'int | float', c : 'int | float',
+              d : 'int | float', e : 'int | float', f : 'int | float'):
+    return a
+
+def array_1(x : 'int32[:]', y : 'int32[:]', z : 'int32[:]'):
+    return x[0]
+
+def array_8(x : 'int[:] | int32[:]', y : 'int[:] | int32[:]', z : 'int[:] | int32[:]'):
+    return x[0]
+
+def array_64(x : 'float[:] | int[:] | complex[:] | int32[:]',
+             y : 'float[:] | int[:] | complex[:] | int32[:]',
+             z : 'float[:] | int[:] | complex[:] | int32[:]'):
+    return x[0]
+
+x_int32 = np.ones(4, dtype=np.int32)
+
+calls = {'scalar_1(1., 1., 1., 1., 1., 1.)'  : scalar_1,
+         'scalar_8(1., 1., 1., 1., 1., 1.)'  : scalar_8,
+         'scalar_64(1., 1., 1., 1., 1., 1.)' : scalar_64,
+         'array_1(x, x, x)'                  : array_1,
+         'array_8(x, x, x)'                  : array_8,
+         'array_64(x, x, x)'                 : array_64}
+
+#==============================================================================
+def run_benchmark(language, number, repeat):
+    """
+    Print the time per call of each of the benchmarked calls.
+
+    Accelerate the benchmarked functions with epyccel and print the best time
+    per call measured by timeit for each of the benchmarked calls. The
+    arguments are chosen so that the last type of each argument is used.
+
+    Parameters
+    ----------
+    language : str
+        The language that the functions are translated to.
+    number : int
+        The number of calls in each timing.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    namespace = {'x' : x_int32}
+    for func in calls.values():
+        namespace[func.__name__] = epyccel(func, language = language)
+
+    print(f"Language : {language}")
+    for call in calls:
+        t = min(timeit.repeat(call, globals = namespace, number = number, repeat = repeat))
+        print(f"{call:<36} {t / number * 1e9:8.1f} ns")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the cost of choosing the specialisation of a function.')
+    parser.add_argument('--language', choices=('c', 'fortran'), default='c',
+                        help='The language that the functions are translated to.')
+    parser.add_argument('--number', type=int, default=1000000,
+                        help='The number of calls in each timing.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.number, args.repeat)
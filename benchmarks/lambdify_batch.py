@@ -0,0 +1,93 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark measuring the time needed to lambdify many SymPy expressions.
+
+Generated expressions are lambdified one at a time (one call to Pyccel and to
+the compiler per expression), in one batch (one call for all the expressions),
+and again once they have been compiled (the functions are found in the cache
+of the session):
+
+    python benchmarks/lambdify_batch.py --language c --number 20
+"""
+import argparse
+import time
+
+import sympy as sp
+
+from pyccel import lambdify, lambdify_batch
+
+#==============================================================================
+def generate_expressions(number):
+    """
+    Generate different SymPy expressions.
+
+    Generate polynomial-trigonometric expressions of two variables which all
+    differ from one another.
+
+    Parameters
+    ----------
+    number : int
+        The number of expressions.
+
+    Returns
+    -------
+    list[sp.Expr]
+        The expressions.
+    tuple[sp.Symbol, sp.Symbol]
+        The variables of the expressions.
+    """
+    x, y = sp.symbols('x y')
+    exprs = [sp.sin(i*x + y)**2 + sp.cos(x*y + i) * sp.exp(-(x*y + i)) + i*x**(i % 4 + 1)
+             for i in range(1, number+1)]
+    return exprs, (x, y)
+
+def run_benchmark(language, number):
+    """
+    Print the time needed to lambdify the expressions in each mode.
+
+    The expressions lambdified one at a time and in a batch are different so
+    that the second mode does not benefit from the cache filled by the first.
+
+    Parameters
+    ----------
+    language : str
+        The language that the functions are translated to.
+    number : int
+        The number of expressions lambdified in each mode.
+    """
+    exprs, (x, y) = generate_expressions(2*number)
+    args = {x : 'float[:]', y : 'float[:]'}
+
+    start = time.perf_counter()
+    for e in exprs[:number]:
+        lambdify(e, args, result_type = 'float[:]', language = language)
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lambdify_batch(exprs[number:], args, result_type = 'float[:]', use_cse = True, language = language)
+    batch = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lambdify_batch(exprs[:number], args, result_type = 'float[:]', language = language)
+    lambdify_batch(exprs[number:], args, result_type = 'float[:]', use_cse = True, language = language)
+    cached = time.perf_counter() - start
+
+    print(f"Language : {language}")
+    print(f"{number} expressions lambdified one at a time : {one_by_one:8.2f} s")
+    print(f"{number} expressions lambdified in one batch  : {batch:8.2f} s")
+    print(f"{2*number} expressions found in the cache      : {cached*1e3:8.2f} ms")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the time needed to lambdify many expressions.')
+    parser.add_argument('--language', choices=('c', 'fortran'), default='c',
+                        help='The language that the functions are translated to.')
+    parser.add_argument('--number', type=int, default=20,
+                        help='The number of expressions lambdified in each mode.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.number)
@@ -0,0 +1,114 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark measuring the effect of fusing the loops of consecutive array statements.
+
+Consecutive element-wise array statements are evaluated in one loop and the
+temporary arrays which are only used in this loop are replaced by scalars. The
+fused kernels are compared with the same statements translated one at a time
+(so each statement is evaluated by its own loop and the temporary arrays are
+written to and read back from memory). The number of bytes which must be
+read from or written to memory is printed for both versions:
+
+    python benchmarks/loop_fusion.py --language c
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from pyccel import epyccel
+
+#==============================================================================
+def sqrt_fused(a : 'float[:]', b : 'float[:]', c : 'float[:]', v : 'float[:]'):
+    from numpy import sqrt
+    t = a * b
+    u = t + c
+    v[:] = sqrt(u)
+
+def sqrt_step1(a : 'float[:]', b : 'float[:]', t : 'float[:]'):
+    t[:] = a * b
+
+def sqrt_step2(t : 'float[:]', c : 'float[:]', u : 'float[:]'):
+    u[:] = t + c
+
+def sqrt_step3(u : 'float[:]', v : 'float[:]'):
+    from numpy import sqrt
+    v[:] = sqrt(u)
+
+def axpby_fused(x : 'float[:]', y : 'float[:]', z : 'float[:]', alpha : float, beta : float):
+    t = alpha * x
+    u = beta * y
+    z[:] = t + u
+
+def axpby_step1(x : 'float[:]', t : 'float[:]', alpha : float):
+    t[:] = alpha * x
+
+def axpby_step2(u : 'float[:]', t : 'float[:]', z : 'float[:]'):
+    z[:] = t + u
+
+#==============================================================================
+def run_benchmark(language, size, number, repeat):
+    """
+    Print the time per call and the memory traffic of the fused and unfused kernels.
+
+    Accelerate the benchmarked functions with epyccel and print the best time
+    per call measured by timeit for each kernel, as well as the number of
+    bytes which must be read from or written to memory in each version
+    (assuming that the arrays do not fit in the caches).
+
+    Parameters
+    ----------
+    language : str
+        The language that the functions are translated to.
+    size : int
+        The number of elements of the arrays.
+    number : int
+        The number of calls in each timing.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    funcs = {f.__name__ : epyccel(f, language = language) for f in
+             (sqrt_fused, sqrt_step1, sqrt_step2, sqrt_step3, axpby_fused, axpby_step1, axpby_step2)}
+    a, b, c = (np.random.random(size) for _ in range(3))
+    t, u, v = (np.empty(size) for _ in range(3))
+
+    def sqrt_unfused():
+        funcs['sqrt_step1'](a, b, t)
+        funcs['sqrt_step2'](t, c, u)
+        funcs['sqrt_step3'](u, v)
+
+    def axpby_unfused():
+        funcs['axpby_step1'](a, t, 2.0)
+        funcs['axpby_step1'](b, u, 3.0)
+        funcs['axpby_step2'](u, t, v)
+
+    # Kernel : (fused call, unfused call, arrays streamed when fused, arrays streamed when unfused)
+    kernels = {'v = sqrt(a*b + c)' : (lambda: funcs['sqrt_fused'](a, b, c, v), sqrt_unfused, 4, 8),
+               'z = 2*x + 3*y'     : (lambda: funcs['axpby_fused'](a, b, v, 2.0, 3.0), axpby_unfused, 3, 7)}
+
+    print(f"Language : {language}")
+    print(f"{'Kernel':<20}{'Fused':>12}{'Unfused':>12}{'Fused traffic':>16}{'Unfused traffic':>18}")
+    for name, (fused, unfused, fused_arrays, unfused_arrays) in kernels.items():
+        times = [min(timeit.repeat(f, number = number, repeat = repeat)) / number for f in (fused, unfused)]
+        traffic = [n * size * a.itemsize / 2**20 for n in (fused_arrays, unfused_arrays)]
+        print(f"{name:<20}{times[0]*1e3:10.3f}ms{times[1]*1e3:10.3f}ms"
+              f"{traffic[0]:13.1f}MiB{traffic[1]:15.1f}MiB")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the effect of fusing the loops of array statements.')
+    parser.add_argument('--language', choices=('c', 'fortran'), default='c',
+                        help='The language that the functions are translated to.')
+    parser.add_argument('--size', type=int, default=10000000,
+                        help='The number of elements of the arrays.')
+    parser.add_argument('--number', type=int, default=10,
+                        help='The number of calls in each timing.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.size, args.number, args.repeat)
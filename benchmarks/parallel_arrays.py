@@ -0,0 +1,127 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark measuring the speed-up obtained by parallelising array expressions with OpenMP.
+
+The same functions are accelerated with and without the `parallel_arrays`
+decorator (both are compiled with OpenMP) and are timed for arrays of several
+sizes. The number of threads is chosen with the environment variable
+`OMP_NUM_THREADS`:
+
+    OMP_NUM_THREADS=4 python benchmarks/parallel_arrays.py --language c
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+from pyccel import epyccel
+
+#==============================================================================
+serial_code = '''
+import numpy as np
+
+def axpy(c : 'float[:]', a : 'float[:]', b : 'float[:]', d : float):
+    c[:] = a * b + d
+
+def total(a : 'float[:]'):
+    s = np.sum(a)
+    return s
+'''
+
+parallel_code = '''
+import numpy as np
+from pyccel.decorators import parallel_arrays
+
+@parallel_arrays
+def axpy(c : 'float[:]', a : 'float[:]', b : 'float[:]', d : float):
+    c[:] = a * b + d
+
+@parallel_arrays
+def total(a : 'float[:]'):
+    s = np.sum(a)
+    return s
+'''
+
+#==============================================================================
+def load_module(code, name, language):
+    """
+    Accelerate the functions described by some code.
+
+    Write the code to a file, import it as a module and accelerate this module
+    with epyccel using OpenMP.
+
+    Parameters
+    ----------
+    code : str
+        The code of the module.
+    name : str
+        The name of the module.
+    language : str
+        The language that the module is translated to.
+
+    Returns
+    -------
+    module
+        The accelerated module.
+    """
+    folder = tempfile.mkdtemp()
+    with open(os.path.join(folder, f'{name}.py'), 'w', encoding='utf-8') as f:
+        f.write(code)
+    sys.path.insert(0, folder)
+    mod = importlib.import_module(name)
+    sys.path.pop(0)
+    return epyccel(mod, language = language, accelerators = ['openmp'])
+
+def run_benchmark(language, sizes, number, repeat):
+    """
+    Print the time per call of the serial and parallel versions of each function.
+
+    Parameters
+    ----------
+    language : str
+        The language that the functions are translated to.
+    sizes : list[int]
+        The sizes of the arrays.
+    number : int
+        The number of calls in each timing.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    serial = load_module(serial_code, 'serial_arrays', language)
+    parallel = load_module(parallel_code, 'parallel_arrays_bench', language)
+
+    print(f"Language : {language}")
+    print(f"{'Call':<10}{'Size':>12}{'Serial':>14}{'Parallel':>14}{'Speed-up':>10}")
+    for n in sizes:
+        a = np.random.random(n)
+        b = np.random.random(n)
+        c = np.empty(n)
+        calls = {'axpy'  : lambda mod: mod.axpy(c, a, b, 2.0),
+                 'sum'   : lambda mod: mod.total(a)}
+        for name, call in calls.items():
+            times = [min(timeit.repeat(lambda m=m: call(m), number = number, repeat = repeat)) / number
+                     for m in (serial, parallel)]
+            print(f"{name:<10}{n:>12}{times[0]*1e6:12.2f}us{times[1]*1e6:12.2f}us{times[0]/times[1]:10.2f}")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the speed-up obtained by parallelising array expressions.')
+    parser.add_argument('--language', choices=('c', 'fortran'), default='c',
+                        help='The language that the functions are translated to.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 10000000],
+                        help='The sizes of the arrays.')
+    parser.add_argument('--number', type=int, default=20,
+                        help='The number of calls in each timing.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.sizes, args.number, args.repeat)
@@ -0,0 +1,113 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark measuring the speed of the random number generator `pyccel.random.Generator`.
+
+Arrays of several sizes are filled with random numbers by accelerated code
+using `pyccel.random.Generator` and by `numpy.random.Generator`:
+
+    python benchmarks/random_numbers.py --language fortran
+"""
+import argparse
+import importlib
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+from pyccel import epyccel
+
+#==============================================================================
+code = '''
+from pyccel.random import Generator
+
+def fill_random(seed : int, a : 'float[:]'):
+    rng = Generator(seed)
+    rng.random(out = a)
+
+def fill_integers(seed : int, a : 'int[:]'):
+    rng = Generator(seed)
+    rng.integers(0, 1000, out = a)
+
+def fill_normal(seed : int, a : 'float[:]'):
+    rng = Generator(seed)
+    rng.normal(out = a)
+'''
+
+#==============================================================================
+def load_module(language):
+    """
+    Accelerate the functions which fill arrays with random numbers.
+
+    Write the code to a file, import it as a module and accelerate this module
+    with epyccel.
+
+    Parameters
+    ----------
+    language : str
+        The language that the module is translated to.
+
+    Returns
+    -------
+    module
+        The accelerated module.
+    """
+    folder = tempfile.mkdtemp()
+    with open(os.path.join(folder, 'random_numbers_bench.py'), 'w', encoding='utf-8') as f:
+        f.write(code)
+    sys.path.insert(0, folder)
+    mod = importlib.import_module('random_numbers_bench')
+    sys.path.pop(0)
+    return epyccel(mod, language = language)
+
+def run_benchmark(language, sizes, number, repeat):
+    """
+    Print the time per call of the accelerated and NumPy versions of each function.
+
+    Parameters
+    ----------
+    language : str
+        The language that the functions are translated to.
+    sizes : list[int]
+        The sizes of the arrays.
+    number : int
+        The number of calls in each timing.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    mod = load_module(language)
+
+    print(f"Language : {language}")
+    print(f"{'Call':<10}{'Size':>12}{'Pyccel':>14}{'NumPy':>14}{'Ratio':>10}")
+    for n in sizes:
+        a = np.empty(n)
+        b = np.empty(n, dtype = int)
+        calls = {'random'   : (lambda: mod.fill_random(1, a),
+                               lambda: np.random.default_rng(1).random(out = a)),
+                 'integers' : (lambda: mod.fill_integers(1, b),
+                               lambda: np.random.default_rng(1).integers(0, 1000, size = n)),
+                 'normal'   : (lambda: mod.fill_normal(1, a),
+                               lambda: np.random.default_rng(1).standard_normal(out = a))}
+        for name, funcs in calls.items():
+            times = [min(timeit.repeat(f, number = number, repeat = repeat)) / number for f in funcs]
+            print(f"{name:<10}{n:>12}{times[0]*1e6:12.2f}us{times[1]*1e6:12.2f}us{times[1]/times[0]:10.2f}")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the speed of pyccel.random.Generator.')
+    parser.add_argument('--language', choices=('c', 'fortran'), default='c',
+                        help='The language that the functions are translated to.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 100000, 10000000],
+                        help='The sizes of the arrays.')
+    parser.add_argument('--number', type=int, default=10,
+                        help='The number of calls in each timing.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.sizes, args.number, args.repeat)
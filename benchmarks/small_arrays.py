@@ -0,0 +1,92 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark measuring the cost of allocating small temporary arrays in a loop.
+
+Small local arrays whose shape is a compile-time constant and which do not
+escape from their function are placed on the stack, so an array created in a
+loop is reused at each iteration. This benchmark compares a particle update
+kernel which creates such an array at each iteration with the same kernel
+where the shape of the array is only known at run time (so the array is
+allocated on the heap and freed at each iteration):
+
+    python benchmarks/small_arrays.py --language c
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from pyccel import epyccel
+
+#==============================================================================
+def push_constant_shape(x : 'float[:,:]', v : 'float[:,:]', dt : float):
+    import numpy as np
+    n = x.shape[0]
+    for i in range(n):
+        f = np.zeros(3)
+        for d in range(3):
+            f[d] = -x[i, d]
+        for d in range(3):
+            v[i, d] += dt * f[d]
+            x[i, d] += dt * v[i, d]
+
+def push_runtime_shape(x : 'float[:,:]', v : 'float[:,:]', dt : float):
+    import numpy as np
+    n, dim = x.shape
+    for i in range(n):
+        f = np.zeros(dim)
+        for d in range(dim):
+            f[d] = -x[i, d]
+        for d in range(dim):
+            v[i, d] += dt * f[d]
+            x[i, d] += dt * v[i, d]
+
+#==============================================================================
+def run_benchmark(language, size, number, repeat):
+    """
+    Print the time per call of the particle update kernels.
+
+    Accelerate the benchmarked functions with epyccel and print the best time
+    per call measured by timeit for the kernel whose temporary array has a
+    constant shape (stored on the stack) and for the kernel whose temporary
+    array has a shape known at run time (stored on the heap).
+
+    Parameters
+    ----------
+    language : str
+        The language that the functions are translated to.
+    size : int
+        The number of particles.
+    number : int
+        The number of calls in each timing.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    funcs = {'Stack' : epyccel(push_constant_shape, language = language),
+             'Heap'  : epyccel(push_runtime_shape, language = language)}
+    x = np.random.random((size, 3))
+    v = np.random.random((size, 3))
+
+    print(f"Language : {language}")
+    for name, f in funcs.items():
+        t = min(timeit.repeat(lambda f=f: f(x, v, 1e-3), number = number, repeat = repeat)) / number
+        print(f"{name:<6} {t*1e3:10.3f}ms")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the cost of allocating small arrays in a loop.')
+    parser.add_argument('--language', choices=('c', 'fortran'), default='c',
+                        help='The language that the functions are translated to.')
+    parser.add_argument('--size', type=int, default=1000000,
+                        help='The number of particles.')
+    parser.add_argument('--number', type=int, default=10,
+                        help='The number of calls in each timing.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.size, args.number, args.repeat)
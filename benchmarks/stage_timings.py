@@ -0,0 +1,131 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark measuring the time spent in Pyccel's internal stages.
+
+The largest scripts found in the test folders are translated (without compilation)
+and the best time measured for each stage (as reported by `--time_execution`) is
+printed. This is mostly sensitive to the cost of the visitor dispatch in the
+syntactic and semantic stages and in the code printers:
+
+    python benchmarks/stage_timings.py --language c
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+
+from pyccel.codegen.pipeline import execute_pyccel
+
+#==============================================================================
+tests_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests')
+scripts_folders = (os.path.join(tests_folder, 'pyccel', 'scripts'),
+                   os.path.join(tests_folder, 'epyccel', 'modules'))
+
+stages = ('Syntactic Stage', 'Semantic Stage', 'Codegen Stage')
+
+#==============================================================================
+def get_largest_scripts(n_files):
+    """
+    Get the largest scripts in the test folders.
+
+    Get the scripts in the test folders with the largest number of lines.
+
+    Parameters
+    ----------
+    n_files : int
+        The number of scripts to return.
+
+    Returns
+    -------
+    list[str]
+        The absolute paths to the largest scripts.
+    """
+    scripts = []
+    for folder in scripts_folders:
+        for f in os.listdir(folder):
+            if f.endswith('.py') and not f.startswith('__'):
+                filename = os.path.join(folder, f)
+                with open(filename, encoding="utf-8") as script:
+                    scripts.append((sum(1 for _ in script), filename))
+    return [f for _, f in sorted(scripts, reverse=True)[:n_files]]
+
+def get_stage_times(filename, language):
+    """
+    Get the time spent in each stage when translating a file.
+
+    Translate a file in a temporary folder (so that no previous build is
+    reused) and collect the times printed by Pyccel.
+
+    Parameters
+    ----------
+    filename : str
+        The absolute path to the file being translated.
+    language : str
+        The language that the file is translated to.
+
+    Returns
+    -------
+    dict[str, float]
+        The time spent in each stage.
+    """
+    output = io.StringIO()
+    base_dirpath = os.getcwd()
+    with tempfile.TemporaryDirectory() as folder, contextlib.redirect_stdout(output):
+        try:
+            execute_pyccel(filename, language = language, folder = folder,
+                           convert_only = True, show_timings = True)
+        finally:
+            # Pyccel does not return to the original folder after an unexpected error
+            os.chdir(base_dirpath)
+    times = {}
+    for line in output.getvalue().splitlines():
+        name, _, time = line.partition(':')
+        if name.strip() in (*stages, 'Total'):
+            times[name.strip()] = float(time)
+    return times
+
+#==============================================================================
+def run_benchmark(language, n_files, repeat):
+    """
+    Print the time spent in each stage for the largest test scripts.
+
+    Translate the largest test scripts several times and print the best time
+    measured for each stage.
+
+    Parameters
+    ----------
+    language : str
+        The language that the scripts are translated to.
+    n_files : int
+        The number of scripts which are translated.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    print(f"Language : {language}")
+    print(f"{'File':<24}" + ''.join(f"{s.split()[0]:>12}" for s in (*stages, 'Total')))
+    for filename in get_largest_scripts(n_files):
+        try:
+            timings = [get_stage_times(filename, language) for _ in range(repeat)]
+        except Exception: # pylint: disable=broad-exception-caught
+            print(f"{os.path.basename(filename):<24} translation failed")
+            continue
+        best = {s: min(t[s] for t in timings) for s in (*stages, 'Total')}
+        print(f"{os.path.basename(filename):<24}" + ''.join(f"{best[s]*1e3:10.1f}ms" for s in (*stages, 'Total')))
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure the time spent in Pyccel's internal stages.")
+    parser.add_argument('--language', choices=('c', 'fortran'), default='c',
+                        help='The language that the scripts are translated to.')
+    parser.add_argument('--files', type=int, default=5,
+                        help='The number of scripts which are translated.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.files, args.repeat)
@@ -0,0 +1,115 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark measuring the cost of passing views with steps of NumPy arrays to translated functions.
+
+Callers which slice their arrays pass views which are not contiguous. When such
+views could not be passed to a function, the caller had to copy them into
+contiguous arrays first. This benchmark compares the time and the memory
+allocated per call when the views are passed directly and when they are copied
+first:
+
+    python benchmarks/strided_arguments.py --language fortran
+"""
+import argparse
+import timeit
+import tracemalloc
+
+import numpy as np
+
+from pyccel import epyccel
+
+#==============================================================================
+def smooth(x : 'float[:,:]', y : 'float[:,:]'):
+    n, m = x.shape
+    for i in range(n):
+        for j in range(m):
+            x[i, j] = 0.5 * x[i, j] + 0.5 * y[i, j]
+
+views = {'a[1:, :]'     : (slice(1, None), slice(None)),
+         'a[:, 1:]'     : (slice(None), slice(1, None)),
+         'a[::2, 1:]'   : (slice(None, None, 2), slice(1, None)),
+         'a[1::3, ::2]' : (slice(1, None, 3), slice(None, None, 2))}
+
+#==============================================================================
+def allocated_memory(call):
+    """
+    Get the memory allocated while running a call.
+
+    Get the peak of the memory allocated (as measured by tracemalloc) while
+    running a call. NumPy reports its allocations to tracemalloc so this
+    includes the temporary copies of the arrays.
+
+    Parameters
+    ----------
+    call : callable
+        The function to run.
+
+    Returns
+    -------
+    int
+        The peak memory allocated in bytes.
+    """
+    tracemalloc.start()
+    call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+def run_benchmark(language, size, number, repeat):
+    """
+    Print the time per call and the memory allocated by each call.
+
+    Accelerate the benchmarked function with epyccel and call it on views of two
+    arrays, either passing the views directly or passing contiguous copies (and
+    copying the result back into the view which is modified).
+
+    Parameters
+    ----------
+    language : str
+        The language that the function is translated to.
+    size : int
+        The number of rows and columns of the arrays.
+    number : int
+        The number of calls in each timing.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    func = epyccel(smooth, language = language)
+    a = np.random.random((size, size))
+    b = np.random.random((size, size))
+
+    def direct(view):
+        func(a[view], b[view])
+
+    def copied(view):
+        x = np.ascontiguousarray(a[view])
+        func(x, np.ascontiguousarray(b[view]))
+        a[view] = x
+
+    print(f"Language : {language}")
+    print(f"{'View':<14}{'Direct':>12}{'Copied':>12}{'Direct mem':>14}{'Copied mem':>14}")
+    for name, view in views.items():
+        times = [min(timeit.repeat(lambda f=f: f(view), number = number, repeat = repeat)) / number
+                 for f in (direct, copied)]
+        memory = [allocated_memory(lambda f=f: f(view)) for f in (direct, copied)]
+        print(f"{name:<14}{times[0]*1e3:10.3f}ms{times[1]*1e3:10.3f}ms"
+              f"{memory[0]/2**20:11.2f}MiB{memory[1]/2**20:11.2f}MiB")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the cost of passing views with steps of arrays to a function.')
+    parser.add_argument('--language', choices=('c', 'fortran'), default='fortran',
+                        help='The language that the function is translated to.')
+    parser.add_argument('--size', type=int, default=1000,
+                        help='The number of rows and columns of the arrays.')
+    parser.add_argument('--number', type=int, default=20,
+                        help='The number of calls in each timing.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.size, args.number, args.repeat)
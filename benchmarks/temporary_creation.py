@@ -0,0 +1,85 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Benchmark measuring the time needed to create temporary variables.
+
+A stress test which creates thousands of temporary variables in a nested scope
+(as happens when translating large functions). Each new temporary must be checked
+against all the names already used in the scope and its enclosing scopes:
+
+    python benchmarks/temporary_creation.py --language fortran
+"""
+import argparse
+import timeit
+
+from pyccel.ast.datatypes import PythonNativeFloat
+from pyccel.naming        import name_clash_checkers
+from pyccel.parser.scope  import Scope
+
+#==============================================================================
+def create_temporaries(n_temporaries, depth):
+    """
+    Create temporary variables in a nested scope.
+
+    Create a chain of nested scopes (each containing some user-defined
+    symbols) and create temporary variables in the innermost scope.
+
+    Parameters
+    ----------
+    n_temporaries : int
+        The number of temporary variables created.
+    depth : int
+        The number of nested scopes.
+    """
+    scope = Scope(name = 'mod')
+    for d in range(depth):
+        scope.insert_symbols(f'user_var_{d}_{i}' for i in range(100))
+        scope = scope.new_child_scope(f'func_{d}')
+    for i in range(n_temporaries):
+        scope.get_temporary_variable(PythonNativeFloat())
+        if i % 2:
+            scope.get_temporary_variable(PythonNativeFloat(), name = 'tmp')
+
+#==============================================================================
+def run_benchmark(language, sizes, depth, repeat):
+    """
+    Print the time needed to create temporary variables.
+
+    Print the best time needed to create different numbers of temporary
+    variables.
+
+    Parameters
+    ----------
+    language : str
+        The language whose naming rules are used.
+    sizes : list[int]
+        The numbers of temporary variables created.
+    depth : int
+        The number of nested scopes.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    Scope.name_clash_checker = name_clash_checkers[language]
+    print(f"Language : {language}")
+    print(f"{'Temporaries':>12}{'Time':>12}{'Per temp':>12}")
+    for n in sizes:
+        best = min(timeit.repeat(lambda n=n: create_temporaries(n, depth), number = 1, repeat = repeat))
+        print(f"{n:>12}{best*1e3:10.1f}ms{best/n*1e6:10.1f}us")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the time needed to create temporary variables.')
+    parser.add_argument('--language', choices=('c', 'fortran', 'python'), default='fortran',
+                        help='The language whose naming rules are used.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 1000, 2000, 4000],
+                        help='The numbers of temporary variables created.')
+    parser.add_argument('--depth', type=int, default=3,
+                        help='The number of nested scopes.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.sizes, args.depth, args.repeat)
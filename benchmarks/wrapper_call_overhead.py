@@ -0,0 +1,86 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Micro-benchmark measuring the cost of calling a Pyccel-generated function from Python.
+
+The functions which are benchmarked do almost no work so the measured time is dominated
+by the wrapper (argument unpacking, conversion to C types and creation of the result).
+The benchmark can be used to compare the `METH_FASTCALL` calling convention with the
+`METH_VARARGS` calling convention:
+
+    python benchmarks/wrapper_call_overhead.py --language c
+    python benchmarks/wrapper_call_overhead.py --language c --no-fastcall
+"""
+import argparse
+import timeit
+from unittest.mock import patch
+
+from pyccel import epyccel
+from pyccel.codegen.wrapper import c_to_python_wrapper
+
+#==============================================================================
+def no_args():
+    return 0
+
+def one_arg(x : int):
+    return x
+
+def three_args(x : int, y : float, z : int):
+    return x + y + z
+
+def with_defaults(x : int, y : float = 1.0, z : int = 2):
+    return x + y + z
+
+calls = {'no_args()'                     : no_args,
+         'one_arg(1)'                    : one_arg,
+         'three_args(1, 2.0, 3)'         : three_args,
+         'with_defaults(1)'              : with_defaults,
+         'with_defaults(1, z = 3)'       : with_defaults,
+         'with_defaults(z = 3, x = 1)'   : with_defaults}
+
+#==============================================================================
+def run_benchmark(language, use_fastcall, number, repeat):
+    """
+    Print the time per call of each of the benchmarked calls.
+
+    Accelerate the benchmarked functions with epyccel and print the best time
+    per call measured by timeit for each of the benchmarked calls.
+
+    Parameters
+    ----------
+    language : str
+        The language that the functions are translated to.
+    use_fastcall : bool
+        Indicates whether the wrapper should use the `METH_FASTCALL` calling convention.
+    number : int
+        The number of calls in each timing.
+    repeat : int
+        The number of timings. The best timing is reported.
+    """
+    namespace = {}
+    with patch.object(c_to_python_wrapper, 'fastcall_available', use_fastcall):
+        for func in set(calls.values()):
+            namespace[func.__name__] = epyccel(func, language = language)
+
+    print(f"Language : {language}, fastcall : {use_fastcall}")
+    for call in calls:
+        t = min(timeit.repeat(call, globals = namespace, number = number, repeat = repeat))
+        print(f"{call:<32} {t / number * 1e9:8.1f} ns")
+
+#==============================================================================
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the overhead of calling a Pyccel function from Python.')
+    parser.add_argument('--language', choices=('c', 'fortran'), default='c',
+                        help='The language that the functions are translated to.')
+    parser.add_argument('--no-fastcall', action='store_false', dest='fastcall',
+                        help='Use the METH_VARARGS calling convention.')
+    parser.add_argument('--number', type=int, default=1000000,
+                        help='The number of calls in each timing.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='The number of timings.')
+    args = parser.parse_args()
+
+    run_benchmark(args.language, args.fastcall, args.number, args.repeat)
@@ -1,3 +1,4 @@
 from .version import __version__
 from .commands.epyccel import epyccel
-from .commands.lambdify import lambdify
+from .commands.lambdify import lambdify, lambdify_batch
+from .commands.jit import jit
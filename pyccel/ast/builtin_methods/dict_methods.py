@@ -19,10 +19,12 @@ __all__ = ('DictClear',
            'DictCopy',
            'DictGet',
            'DictItems',
+           'DictKeys',
            'DictMethod',
            'DictPop',
            'DictPopitem',
            'DictSetDefault',
+           'DictValues',
            )
 
 #==============================================================================
@@ -213,7 +215,7 @@ class DictSetDefault(DictMethod):
         dict_type = dict_obj.class_type
         self._class_type = dict_type.value_type
 
-        self._shape = (None) * self._class_type.rank if self._class_type.rank else None
+        self._shape = (None,) * self._class_type.rank if self._class_type.rank else None
 
         if k.class_type != dict_type.key_type:
             raise TypeError(f"Key passed to setdefault method has type {k.class_type}. Expected {dict_type.key_type}")
@@ -327,3 +329,98 @@ class DictItems(Iterable):
         """
         item = DictPopitem(self._dict_obj)
         return [IndexedElement(item, 0), IndexedElement(item, 1)]
+
+#==============================================================================
+class DictKeys(Iterable):
+    """
+    Represents a call to the .keys() method.
+
+    Represents a call to the .keys() method which iterates over the keys of a
+    dictionary. This object is also used when a for loop iterates directly
+    over a dictionary.
+
+    Parameters
+    ----------
+    dict_obj : TypedAstNode
+        The object from which the method is called.
+    """
+    __slots__ = ('_dict_obj',)
+    _attribute_nodes = Iterable._attribute_nodes + ("_dict_obj",)
+    _shape = None
+    _class_type = SymbolicType()
+    name = 'keys'
+
+    def __init__(self, dict_obj):
+        self._dict_obj = dict_obj
+        super().__init__(1)
+
+    @property
+    def variable(self):
+        """
+        Get the object representing the dict.
+
+        Get the object representing the dict.
+        """
+        return self._dict_obj
+
+    def get_python_iterable_item(self):
+        """
+        Get the item of the iterable that will be saved to the loop targets.
+
+        Returns an object that could be a key of the dictionary. This element
+        is used to determine the type of the loop target.
+
+        Returns
+        -------
+        list[TypedAstNode]
+            A list of objects that should be assigned to variables.
+        """
+        item = DictPopitem(self._dict_obj)
+        return [IndexedElement(item, 0)]
+
+#==============================================================================
+class DictValues(Iterable):
+    """
+    Represents a call to the .values() method.
+
+    Represents a call to the .values() method which iterates over the values of a
+    dictionary.
+
+    Parameters
+    ----------
+    dict_obj : TypedAstNode
+        The object from which the method is called.
+    """
+    __slots__ = ('_dict_obj',)
+    _attribute_nodes = Iterable._attribute_nodes + ("_dict_obj",)
+    _shape = None
+    _class_type = SymbolicType()
+    name = 'values'
+
+    def __init__(self, dict_obj):
+        self._dict_obj = dict_obj
+        super().__init__(1)
+
+    @property
+    def variable(self):
+        """
+        Get the object representing the dict.
+
+        Get the object representing the dict.
+        """
+        return self._dict_obj
+
+    def get_python_iterable_item(self):
+        """
+        Get the item of the iterable that will be saved to the loop targets.
+
+        Returns an object that could be a value of the dictionary. This element
+        is used to determine the type of the loop target.
+
+        Returns
+        -------
+        list[TypedAstNode]
+            A list of objects that should be assigned to variables.
+        """
+        item = DictPopitem(self._dict_obj)
+        return [IndexedElement(item, 1)]
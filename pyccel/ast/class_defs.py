@@ -13,7 +13,8 @@ from pyccel.ast.builtin_methods.list_methods import (ListAppend, ListInsert, Lis
                                                      ListClear, ListExtend, ListRemove,
                                                      ListCopy, ListSort)
 from pyccel.ast.builtin_methods.dict_methods import (DictPop, DictPopitem, DictGet, DictClear,DictCopy,
-                                                     DictSetDefault, DictItems)
+                                                     DictSetDefault, DictItems, DictKeys,
+                                                     DictValues)
 
 from .builtins   import PythonImag, PythonReal, PythonConjugate
 from .core       import ClassDef, PyccelFunctionDef
@@ -24,6 +25,8 @@ from .numpyext   import (NumpyShape, NumpySum, NumpyAmin, NumpyAmax,
                          NumpyImag, NumpyReal, NumpyTranspose,
                          NumpyConjugate, NumpySize, NumpyResultType, NumpyArray)
 from .numpytypes import NumpyNumericType, NumpyNDArrayType
+from .randomext  import (PhiloxGeneratorType, GeneratorAdvance, GeneratorIntegers,
+                         GeneratorNormal, GeneratorRandom)
 
 __all__ = (
     'BooleanClass',
@@ -33,6 +36,7 @@ __all__ = (
     'IntegerClass',
     'ListClass',
     'NumpyArrayClass',
+    'RandomGeneratorClass',
     'SetClass',
     'StringClass',
     'TupleClass',
@@ -184,9 +188,11 @@ DictClass = ClassDef('dict',
             PyccelFunctionDef('clear', func_class = DictClear),
             PyccelFunctionDef('get', func_class = DictGet),
             PyccelFunctionDef('items', func_class = DictItems),
+            PyccelFunctionDef('keys', func_class = DictKeys),
             PyccelFunctionDef('pop', func_class = DictPop),
             PyccelFunctionDef('popitem', func_class = DictPopitem),
             PyccelFunctionDef('setdefault', func_class = DictSetDefault),
+            PyccelFunctionDef('values', func_class = DictValues),
         ])
 
 #=======================================================================================
@@ -236,6 +242,16 @@ StackArrayClass = ClassDef('stack_array')
 
 #=======================================================================================
 
+RandomGeneratorClass = ClassDef('pyccel.random.Generator', class_type = PhiloxGeneratorType(),
+        methods=[
+            PyccelFunctionDef('advance', func_class = GeneratorAdvance),
+            PyccelFunctionDef('integers', func_class = GeneratorIntegers),
+            PyccelFunctionDef('normal', func_class = GeneratorNormal),
+            PyccelFunctionDef('random', func_class = GeneratorRandom),
+        ])
+
+#=======================================================================================
+
 literal_classes = {
         PythonNativeBool()    : BooleanClass,
         PythonNativeInt()     : IntegerClass,
@@ -281,6 +297,8 @@ def get_cls_base(class_type):
         return SetClass
     elif isinstance(class_type, DictType):
         return DictClass
+    elif isinstance(class_type, PhiloxGeneratorType):
+        return RandomGeneratorClass
     else:
         raise NotImplementedError(f"No class definition found for type {class_type}")
 
@@ -1080,9 +1080,10 @@ class Module(ScopedAstNode):
                                 for i in imports if isinstance(i, Import)}
             self._internal_dictionary.update({v:t[0] for v,t in import_mods.items() if t})
 
-            if init_func:
+            if init_func and init_func.body.body:
                 init_if = init_func.body.body[0]
                 # The init function should always contain an If block unless it is part of a wrapper
+                # (it has no body if the module was loaded from a saved interface)
                 if isinstance(init_if, If):
                     init_cond = init_if.blocks[0].condition
                     init_var = init_cond.args[0]
@@ -10,11 +10,16 @@ Provides CUDA functionality for code generation.
 """
 from .internals      import PyccelFunction
 
-from .datatypes      import VoidType
+from .datatypes      import VoidType, PythonNativeInt
 from .core           import Module, PyccelFunctionDef
+from .literals       import LiteralInteger
 
 __all__ = (
+    'CudaBlockDim',
+    'CudaBlockIdx',
+    'CudaIndexingFunction',
     'CudaSynchronize',
+    'CudaThreadIdx',
 )
 
 class CudaSynchronize(PyccelFunction):
@@ -30,8 +35,88 @@ class CudaSynchronize(PyccelFunction):
     def __init__(self):
         super().__init__()
 
+class CudaIndexingFunction(PyccelFunction):
+    """
+    Super class for the functions describing the position of a thread in the grid.
+
+    Super class representing a call to one of the functions which give the
+    position of the current thread in the grid of a kernel launch (e.g.
+    `cuda.threadIdx`) in one of its dimensions.
+
+    Parameters
+    ----------
+    dim : LiteralInteger
+        The dimension of the indexing (0, 1 or 2 for x, y or z).
+    """
+    __slots__ = ()
+    _attribute_nodes = ()
+    _shape     = None
+    _class_type = PythonNativeInt()
+
+    def __init__(self, dim):
+        if not isinstance(dim, LiteralInteger) or dim.python_value not in (0, 1, 2):
+            raise TypeError(f"The dimension passed to cuda.{self.name} must be 0, 1 or 2")
+        super().__init__(dim)
+
+    @property
+    def dim(self):
+        """
+        The dimension of the indexing.
+
+        The dimension of the indexing (0, 1 or 2 for x, y or z).
+        """
+        return self._args[0].python_value
+
+class CudaThreadIdx(CudaIndexingFunction):
+    """
+    Represents a call to cuda.threadIdx for code generation.
+
+    Represents a call to cuda.threadIdx which gives the index of the current
+    thread in its block.
+
+    Parameters
+    ----------
+    dim : LiteralInteger
+        The dimension of the indexing (0, 1 or 2 for x, y or z).
+    """
+    __slots__ = ()
+    name = 'threadIdx'
+
+class CudaBlockIdx(CudaIndexingFunction):
+    """
+    Represents a call to cuda.blockIdx for code generation.
+
+    Represents a call to cuda.blockIdx which gives the index of the block
+    of the current thread in the grid.
+
+    Parameters
+    ----------
+    dim : LiteralInteger
+        The dimension of the indexing (0, 1 or 2 for x, y or z).
+    """
+    __slots__ = ()
+    name = 'blockIdx'
+
+class CudaBlockDim(CudaIndexingFunction):
+    """
+    Represents a call to cuda.blockDim for code generation.
+
+    Represents a call to cuda.blockDim which gives the number of threads
+    in the block of the current thread.
+
+    Parameters
+    ----------
+    dim : LiteralInteger
+        The dimension of the indexing (0, 1 or 2 for x, y or z).
+    """
+    __slots__ = ()
+    name = 'blockDim'
+
 cuda_funcs = {
     'synchronize'       : PyccelFunctionDef('synchronize' , CudaSynchronize),
+    'threadIdx'         : PyccelFunctionDef('threadIdx'   , CudaThreadIdx),
+    'blockIdx'          : PyccelFunctionDef('blockIdx'    , CudaBlockIdx),
+    'blockDim'          : PyccelFunctionDef('blockDim'    , CudaBlockDim),
 }
 
 cuda_mod = Module('cuda',
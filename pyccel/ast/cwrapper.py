@@ -42,6 +42,8 @@ __all__ = (
     'PyccelPyObject',
     'PyccelPyClassType',
     'PyccelPyTypeObject',
+    'PyccelPyObjectArray',
+    'PyccelPySsizeT',
     'WrapperCustomDataType',
 # --------- CLASSES -----------
     'PyFunctionDef',
@@ -50,6 +52,8 @@ __all__ = (
     'PyModule',
     'PyArgKeywords',
     'PyArg_ParseTupleNode',
+    'PyFastcallKeywords',
+    'PyArg_ParseFastcallNode',
     'PyBuildValueNode',
     'PyCapsule_New',
     'PyCapsule_Import',
@@ -110,6 +114,27 @@ class PyccelPyTypeObject(FixedSizeType, metaclass=Singleton):
     __slots__ = ()
     _name = 'pytypeobject'
 
+class PyccelPyObjectArray(FixedSizeType, metaclass=Singleton):
+    """
+    Datatype representing a constant array of `PyObject` pointers.
+
+    Datatype representing the elements of the array of arguments
+    (`PyObject *const *args`) received by a function using the
+    `METH_FASTCALL` calling convention.
+    """
+    __slots__ = ()
+    _name = 'pyobjectarray'
+
+class PyccelPySsizeT(FixedSizeType, metaclass=Singleton):
+    """
+    Datatype representing a `Py_ssize_t`.
+
+    Datatype representing a `Py_ssize_t` which is the signed
+    integer type used by `Python.h` to describe sizes.
+    """
+    __slots__ = ()
+    _name = 'pyssizet'
+
 class WrapperCustomDataType(CustomDataType):
     """
     Datatype representing a subclass of `PyObject`.
@@ -250,6 +275,142 @@ class PyArg_ParseTupleNode(PyccelAstNode):
         """
         return self._arg_names
 
+#-------------------------------------------------------------------
+class PyFastcallKeywords(PyArgKeywords):
+    """
+    Represents the list containing the names of all arguments to a fastcall function.
+
+    Represents the list containing the names of all arguments to a function
+    which uses the `METH_FASTCALL | METH_KEYWORDS` calling convention. In
+    addition to the list of names, a static array is declared to store the
+    interned versions of these names. This array is filled the first time
+    that the function is called and allows keywords to be identified by
+    comparing pointers.
+
+    Parameters
+    ----------
+    name : str
+        The name of the variable in which the list is stored.
+    interned_name : str
+        The name of the variable in which the interned names are stored.
+    arg_names : list of str
+        A list of the names of the function arguments.
+    """
+    __slots__ = ('_interned_name',)
+    _attribute_nodes = ()
+    def __init__(self, name, interned_name, arg_names):
+        self._interned_name = interned_name
+        super().__init__(name, arg_names)
+
+    @property
+    def interned_name(self):
+        """
+        The name of the variable in which the interned names are stored.
+
+        The name of the static array of `PyObject *` in which the interned
+        versions of the argument names are stored.
+        """
+        return self._interned_name
+
+#-------------------------------------------------------------------
+class PyArg_ParseFastcallNode(PyccelAstNode):
+    """
+    Represents a call to the function `pyccel_parse_fastcall`.
+
+    Represents a call to the function `pyccel_parse_fastcall` from `cwrapper.h`.
+    This function collects the expected arguments from the `args` array,
+    the number of positional arguments `nargs` and the tuple of keyword
+    names `kwnames` received by a function using the
+    `METH_FASTCALL | METH_KEYWORDS` calling convention. The arguments are
+    unpacked into variables with datatype `PyccelPyObject` without creating
+    an intermediate tuple or dictionary.
+
+    Parameters
+    ----------
+    python_func_args : Variable
+        The array of arguments provided to the function in Python.
+    python_func_nargs : Variable
+        The number of positional arguments provided to the function in Python.
+    python_func_kwnames : Variable
+        The tuple containing the names of the keyword arguments provided to the function.
+    c_func_args : list of Variable
+        List of expected arguments. This helps determine which arguments are required.
+    parse_args : list of Variable
+        List of arguments into which the result will be collected.
+    arg_names : PyFastcallKeywords
+        The object describing the names of the function arguments.
+    """
+    __slots__ = ('_pyarg','_pynargs','_pykwnames','_parse_args','_arg_names','_n_required')
+    _attribute_nodes = ('_pyarg','_pynargs','_pykwnames','_parse_args','_arg_names')
+
+    def __init__(self, python_func_args,
+                        python_func_nargs,
+                        python_func_kwnames,
+                        c_func_args,
+                        parse_args,
+                        arg_names):
+        if not all(isinstance(a, Variable) for a in (python_func_args, python_func_nargs, python_func_kwnames)):
+            raise TypeError('Python func args, nargs and kwnames should be Variables')
+        if not isinstance(parse_args, list) or any(not isinstance(c, Variable) for c in parse_args):
+            raise TypeError('Parse args should be a list of Variables')
+        if not isinstance(arg_names, PyFastcallKeywords):
+            raise TypeError('Arg names should be described by a PyFastcallKeywords object')
+
+        i = 0
+        while i < len(c_func_args) and not c_func_args[i].has_default:
+            i+=1
+        self._n_required = i
+
+        self._pyarg      = python_func_args
+        self._pynargs    = python_func_nargs
+        self._pykwnames  = python_func_kwnames
+        self._parse_args = parse_args
+        self._arg_names  = arg_names
+        super().__init__()
+
+    @property
+    def pyarg(self):
+        """ The array containing all arguments passed to the function
+        """
+        return self._pyarg
+
+    @property
+    def pynargs(self):
+        """ The variable containing the number of positional arguments
+        passed to the function
+        """
+        return self._pynargs
+
+    @property
+    def pykwnames(self):
+        """ The tuple containing the names of the keyword arguments
+        passed to the function
+        """
+        return self._pykwnames
+
+    @property
+    def n_required(self):
+        """
+        The number of required arguments.
+
+        The number of arguments which do not have a default value and
+        must therefore be provided by the caller.
+        """
+        return self._n_required
+
+    @property
+    def args(self):
+        """ The arguments into which the python args are collected
+        """
+        return self._parse_args
+
+    @property
+    def arg_names(self):
+        """ The PyFastcallKeywords object which contains all the
+        names of the function's arguments
+        """
+        return self._arg_names
+
 #-------------------------------------------------------------------
 class PyBuildValueNode(PyccelFunction):
     """
@@ -1088,6 +1249,7 @@ PyErr_SetString = FunctionDef(name = 'PyErr_SetString',
 PyNotImplementedError = Variable(PyccelPyObject(), name = 'PyExc_NotImplementedError')
 PyTypeError = Variable(PyccelPyObject(), name = 'PyExc_TypeError')
 PyAttributeError = Variable(PyccelPyObject(), name = 'PyExc_AttributeError')
+PyValueError = Variable(PyccelPyObject(), name = 'PyExc_ValueError')
 
 PyObject_TypeCheck = FunctionDef(name = 'PyObject_TypeCheck',
             arguments = [FunctionDefArgument(Variable(PyccelPyObject(), 'o', memory_handling = 'alias')),
@@ -1211,6 +1373,56 @@ PySet_Clear = FunctionDef(name = 'PySet_Clear',
                         arguments = [FunctionDefArgument(Variable(PyccelPyObject(), name='set', memory_handling='alias'))],
                         results = [FunctionDefResult(Variable(PythonNativeInt(), 'i'))])
 
+#-------------------------------------------------------------------
+#                         Dict functions
+#-------------------------------------------------------------------
+
+# https://docs.python.org/3/c-api/dict.html#c.PyDict_New
+PyDict_New = FunctionDef(name = 'PyDict_New',
+                    arguments = [],
+                    results = [FunctionDefResult(Variable(PyccelPyObject(), 'dict', memory_handling='alias'))],
+                    body = [])
+
+# https://docs.python.org/3/c-api/dict.html#c.PyDict_SetItem
+PyDict_SetItem = FunctionDef(name = 'PyDict_SetItem',
+                    arguments = [FunctionDefArgument(Variable(PyccelPyObject(), 'dict', memory_handling='alias')),
+                                 FunctionDefArgument(Variable(PyccelPyObject(), 'key', memory_handling='alias')),
+                                 FunctionDefArgument(Variable(PyccelPyObject(), 'val', memory_handling='alias'))],
+                    results = [FunctionDefResult(Variable(CNativeInt(), 'i'))],
+                    body = [])
+
+# https://docs.python.org/3/c-api/dict.html#c.PyDict_GetItem
+PyDict_GetItem = FunctionDef(name = 'PyDict_GetItem',
+                    arguments = [FunctionDefArgument(Variable(PyccelPyObject(), 'dict', memory_handling='alias')),
+                                 FunctionDefArgument(Variable(PyccelPyObject(), 'key', memory_handling='alias'))],
+                    results = [FunctionDefResult(Variable(PyccelPyObject(), 'val', memory_handling='alias'))],
+                    body = [])
+
+# https://docs.python.org/3/c-api/dict.html#c.PyDict_Check
+PyDict_Check = FunctionDef(name = 'PyDict_Check',
+                    arguments = [FunctionDefArgument(Variable(PyccelPyObject(), 'dict', memory_handling='alias'))],
+                    results = [FunctionDefResult(Variable(CNativeInt(), 'i'))],
+                    body = [])
+
+# https://docs.python.org/3/c-api/dict.html#c.PyDict_Size
+PyDict_Size = FunctionDef(name = 'PyDict_Size',
+                    arguments = [FunctionDefArgument(Variable(PyccelPyObject(), 'dict', memory_handling='alias'))],
+                    results = [FunctionDefResult(Variable(PythonNativeInt(), 'i'))],
+                    body = [])
+
+# https://docs.python.org/3/c-api/dict.html#c.PyDict_DelItem
+PyDict_DelItem = FunctionDef(name = 'PyDict_DelItem',
+                    arguments = [FunctionDefArgument(Variable(PyccelPyObject(), 'dict', memory_handling='alias')),
+                                 FunctionDefArgument(Variable(PyccelPyObject(), 'key', memory_handling='alias'))],
+                    results = [FunctionDefResult(Variable(CNativeInt(), 'i'))],
+                    body = [])
+
+# https://docs.python.org/3/c-api/dict.html#c.PyDict_Keys
+PyDict_Keys = FunctionDef(name = 'PyDict_Keys',
+                    arguments = [FunctionDefArgument(Variable(PyccelPyObject(), 'dict', memory_handling='alias'))],
+                    results = [FunctionDefResult(Variable(PyccelPyObject(), 'keys', memory_handling='alias'))],
+                    body = [])
+
 # https://docs.python.org/3/c-api/iter.html#c.PyIter_Check
 PyIter_Next = FunctionDef(name = 'PyIter_Next',
                         body = [],
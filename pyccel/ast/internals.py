@@ -213,7 +213,10 @@ class Slice(PyccelAstNode):
     start : stop : step
     """
     __slots__ = ('_start','_stop','_step', '_slice_type')
-    _attribute_nodes = ('_start','_stop','_step', '_slice_type')
+    # The slice type is a shared class attribute so it is not an attribute node.
+    # Otherwise it would collect every slice as a user and drag unrelated trees
+    # into pickled files.
+    _attribute_nodes = ('_start','_stop','_step')
 
     Range = LiteralInteger(1)
     Element = LiteralInteger(0)
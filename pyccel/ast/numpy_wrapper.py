@@ -11,7 +11,7 @@ import numpy as np
 
 from .bind_c            import BindCPointer
 
-from .datatypes         import PythonNativeBool, GenericType, VoidType, FixedSizeType, CharType
+from .datatypes         import PythonNativeBool, PythonNativeInt, GenericType, VoidType, FixedSizeType, CharType
 
 from .cwrapper          import PyccelPyObject, check_type_registry, c_to_py_registry, pytype_parse_registry
 
@@ -126,7 +126,8 @@ get_strides_and_shape_from_numpy_array = FunctionDef(
         arguments = [
             FunctionDefArgument(Variable(PyccelPyObject(), 'arr', memory_handling='alias')),
             FunctionDefArgument(Variable(CStackArray(NumpyInt64Type()), 'shape', memory_handling='alias')),
-            FunctionDefArgument(Variable(CStackArray(NumpyInt64Type()), 'strides', memory_handling='alias'))
+            FunctionDefArgument(Variable(CStackArray(NumpyInt64Type()), 'strides', memory_handling='alias')),
+            FunctionDefArgument(Variable(PythonNativeBool(), 'c_order'))
             ],
         body = [],
         results = [])
@@ -141,19 +142,19 @@ array_get_dim  = FunctionDef(name    = 'nd_ndim',
                            body      = [],
                            arguments = [FunctionDefArgument(Variable(VoidType(), name = 'o', is_optional = True)),
                                         FunctionDefArgument(Variable(CNativeInt(), name = 'idx'))],
-                           results   = [FunctionDefResult(Variable(CNativeInt(), name = 'd'))])
+                           results   = [FunctionDefResult(Variable(PythonNativeInt(), name = 'd'))])
 
 # Return the stride of the n-th dimension : function definition in pyccel/stdlib/cwrapper/cwrapper_ndarrays.c
 array_get_c_step = FunctionDef(name    = 'nd_nstep_C',
                            body      = [],
                            arguments = [FunctionDefArgument(Variable(VoidType(), name = 'o', is_optional = True)),
                                         FunctionDefArgument(Variable(CNativeInt(), name = 'idx'))],
-                           results   = [FunctionDefResult(Variable(CNativeInt(), name = 'd'))])
+                           results   = [FunctionDefResult(Variable(PythonNativeInt(), name = 'd'))])
 array_get_f_step = FunctionDef(name    = 'nd_nstep_F',
                            body      = [],
                            arguments = [FunctionDefArgument(Variable(VoidType(), name = 'o', is_optional = True)),
                                         FunctionDefArgument(Variable(CNativeInt(), name = 'idx'))],
-                           results   = [FunctionDefResult(Variable(CNativeInt(), name = 'd'))])
+                           results   = [FunctionDefResult(Variable(PythonNativeInt(), name = 'd'))])
 
 # Return the data of ndarray : function definition in pyccel/stdlib/cwrapper/cwrapper_ndarrays.c
 array_get_data  = FunctionDef(name   = 'nd_data',
@@ -192,6 +193,8 @@ numpy_flag_f_contig     = Variable(CNativeInt(),  name = 'NPY_ARRAY_F_CONTIGUOUS
 # Custom Array Flags defined in pyccel/stdlib/cwrapper/cwrapper_ndarrays.h
 no_type_check           = Variable(CNativeInt(),  name = 'NO_TYPE_CHECK')
 no_order_check          = Variable(CNativeInt(),  name = 'NO_ORDER_CHECK')
+strided_c_order         = Variable(CNativeInt(),  name = 'STRIDED_C_ORDER')
+strided_f_order         = Variable(CNativeInt(),  name = 'STRIDED_F_ORDER')
 
 # https://numpy.org/doc/stable/reference/c-api/dtype.html
 numpy_bool_type         = Variable(CNativeInt(),  name = 'NPY_BOOL')
@@ -28,6 +28,7 @@ __all__ = ('OmpAnnotatedComment',
            'OMP_Teams_Construct',
            'OMP_Sections_Construct',
            'OMP_Section_Construct',
+           'OMP_Array_Loop_Construct',
            'Omp_End_Clause')
 
 class OmpAnnotatedComment(PyccelAstNode):
@@ -236,6 +237,79 @@ class OMP_Section_Construct(OmpAnnotatedComment):
     def __init__(self, txt, has_nowait):
         super().__init__(txt, has_nowait)
 
+class OMP_Array_Loop_Construct(OmpAnnotatedComment):
+    """
+    Represents an OpenMP construct parallelising a loop generated from an array expression.
+
+    Represents the combined `parallel for` (or `parallel for simd`) construct which
+    is printed before a loop generated to evaluate an array expression or a reduction over an array
+    (see `pyccel.decorators.parallel_arrays`). Unlike the other constructs, this
+    construct is not written by the user so its clauses are described by Pyccel
+    objects which are printed in the target language.
+
+    Parameters
+    ----------
+    size : TypedAstNode
+        The number of iterations of the parallelised loops.
+    threshold : int
+        The minimum number of iterations for which the loop is run in parallel.
+    collapse : int
+        The number of perfectly nested loops which are parallelised.
+    private : iterable[Variable], default=()
+        The index variables of the inner loops which are not parallelised.
+    reduction : tuple[str, Variable], optional
+        The operator (`+`, `max` or `min`) and the variable of a reduction.
+    simd : bool, default=True
+        Indicates whether the `simd` construct is combined with the parallel
+        construct.
+    """
+    __slots__ = ('_size', '_threshold', '_collapse', '_private', '_reduction_operator',
+                 '_reduction_variable')
+    _attribute_nodes = ('_size', '_private', '_reduction_variable')
+
+    def __init__(self, size, threshold, collapse, private = (), reduction = None, simd = True):
+        self._size = size
+        self._threshold = threshold
+        self._collapse = collapse
+        self._private = tuple(private)
+        self._reduction_operator, self._reduction_variable = reduction or (None, None)
+        super().__init__('', combined = 'for simd' if simd else 'for')
+
+    @property
+    def name(self):
+        """Name of the construct."""
+        return 'parallel'
+
+    @property
+    def size(self):
+        """The number of iterations of the parallelised loops."""
+        return self._size
+
+    @property
+    def threshold(self):
+        """The minimum number of iterations for which the loop is run in parallel."""
+        return self._threshold
+
+    @property
+    def collapse(self):
+        """The number of perfectly nested loops which are parallelised."""
+        return self._collapse
+
+    @property
+    def private(self):
+        """The index variables of the inner loops which are not parallelised."""
+        return self._private
+
+    @property
+    def reduction_operator(self):
+        """The operator of the reduction (`+`, `max` or `min`) or None."""
+        return self._reduction_operator
+
+    @property
+    def reduction_variable(self):
+        """The variable in which the reduction is saved or None."""
+        return self._reduction_variable
+
 class Omp_End_Clause(OmpAnnotatedComment):
     """ Represents the End of an OpenMP block. """
     __slots__ = ()
@@ -0,0 +1,368 @@
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Module containing objects from the pyccel.random module understood by pyccel.
+
+The random number generator `pyccel.random.Generator` is implemented in the
+runtime libraries found in `pyccel/stdlib/random`.
+"""
+from .builtins   import PythonFloat, PythonInt
+from .core       import Module, PyccelFunctionDef, FunctionDef, FunctionDefResult
+from .datatypes  import (FixedSizeType, VoidType, PythonNativeInt, PythonNativeFloat,
+                         PythonNativeBool, PrimitiveIntegerType, PrimitiveFloatingPointType)
+from .internals  import PyccelFunction
+from .literals   import LiteralInteger, LiteralFloat
+from .numpytypes import NumpyNDArrayType
+from .variable   import Variable
+
+__all__ = (
+    'GeneratorAdvance',
+    'GeneratorDrawMethod',
+    'GeneratorIntegers',
+    'GeneratorMethod',
+    'GeneratorNormal',
+    'GeneratorRandom',
+    'PhiloxGeneratorType',
+    'RandomGenerator',
+    'philox_take_error',
+    'random_mod',
+)
+
+#==============================================================================
+def _as_native(arg, cast):
+    """
+    Convert a scalar argument to a Python native type.
+
+    Check that the argument is a scalar number which can be converted to the
+    type returned by the cast and cast it if it has a different type. The
+    runtime libraries only accept 64-bit integers and double precision floats.
+
+    Parameters
+    ----------
+    arg : TypedAstNode
+        The argument passed to the function.
+    cast : type
+        The class used to cast the argument to the native type (PythonInt or
+        PythonFloat).
+
+    Returns
+    -------
+    TypedAstNode
+        The argument with a native type.
+    """
+    allowed = (PrimitiveIntegerType(),) if cast is PythonInt else \
+              (PrimitiveIntegerType(), PrimitiveFloatingPointType())
+    if arg.rank != 0 or arg.class_type.primitive_type not in allowed:
+        raise TypeError(f"Expected a scalar argument which can be converted to {cast.static_type()}")
+    if arg.class_type is cast.static_type():
+        return arg
+    else:
+        return cast(arg)
+
+#==============================================================================
+class PhiloxGeneratorType(FixedSizeType):
+    """
+    Class representing the type of a `pyccel.random.Generator` object.
+
+    Class representing the type of a random number generator based on the
+    Philox4x32-10 algorithm. The state of the generator is stored in a small
+    structure on the stack.
+    """
+    __slots__ = ()
+    _name = 'Generator'
+    _primitive_type = None
+
+#==============================================================================
+class RandomGenerator(PyccelFunction):
+    """
+    Represents a call to the constructor of `pyccel.random.Generator`.
+
+    Represents a call to `pyccel.random.Generator(seed, stream)` which creates
+    a counter-based random number generator.
+
+    Parameters
+    ----------
+    seed : TypedAstNode
+        The seed of the generator.
+    stream : TypedAstNode, optional
+        The index of the stream. The default is 0.
+    """
+    __slots__ = ()
+    name = 'Generator'
+    _shape = None
+    _class_type = PhiloxGeneratorType()
+
+    def __init__(self, seed, stream = None):
+        if stream is None:
+            stream = LiteralInteger(0)
+        seed = _as_native(seed, PythonInt)
+        stream = _as_native(stream, PythonInt)
+        super().__init__(seed, stream)
+
+    @property
+    def seed(self):
+        """
+        The seed of the generator.
+
+        The seed of the generator.
+        """
+        return self._args[0]
+
+    @property
+    def stream(self):
+        """
+        The index of the stream.
+
+        The index of the stream used by the generator.
+        """
+        return self._args[1]
+
+#==============================================================================
+class GeneratorMethod(PyccelFunction):
+    """
+    Abstract class for `pyccel.random.Generator` method calls.
+
+    A subclass of this base class represents calls to a specific
+    method of the random number generator.
+
+    Parameters
+    ----------
+    generator : TypedAstNode
+        The generator on which the method will operate.
+
+    *args : TypedAstNode
+        The arguments passed to the function call.
+    """
+    __slots__ = ('_generator',)
+    _attribute_nodes = PyccelFunction._attribute_nodes + ('_generator',)
+
+    def __init__(self, generator, *args):
+        self._generator = generator
+        super().__init__(*args)
+
+    @property
+    def generator(self):
+        """
+        Get the variable representing the generator.
+
+        Get the variable representing the generator.
+        """
+        return self._generator
+
+#==============================================================================
+class GeneratorAdvance(GeneratorMethod):
+    """
+    Represents a call to the .advance() method.
+
+    Represents a call to the .advance() method which skips a number of
+    blocks of four 32-bit words in the stream of the generator.
+
+    Parameters
+    ----------
+    generator : TypedAstNode
+        The generator on which the method will operate.
+
+    n_blocks : TypedAstNode
+        The number of blocks to skip.
+    """
+    __slots__ = ()
+    name = 'advance'
+    _shape = None
+    _class_type = VoidType()
+
+    def __init__(self, generator, n_blocks):
+        super().__init__(generator, _as_native(n_blocks, PythonInt))
+
+#==============================================================================
+class GeneratorDrawMethod(GeneratorMethod):
+    """
+    Abstract class for the methods which draw random numbers.
+
+    A subclass of this base class represents calls to a method which
+    returns a random number. If an array is passed as the `out` argument
+    then the array is filled (in row-major order) and nothing is returned.
+
+    Parameters
+    ----------
+    generator : TypedAstNode
+        The generator on which the method will operate.
+
+    *args : TypedAstNode
+        The arguments passed to the function call.
+
+    out : TypedAstNode, optional
+        An array which should be filled with random numbers.
+    """
+    __slots__ = ('_out', '_class_type')
+    _attribute_nodes = GeneratorMethod._attribute_nodes + ('_out',)
+    _shape = None
+    _scalar_type = None
+
+    def __init__(self, generator, *args, out = None):
+        if out is not None:
+            if not isinstance(out.class_type, NumpyNDArrayType) or \
+                    out.class_type.primitive_type is not self._scalar_type.primitive_type:
+                raise TypeError(f"The out argument of Generator.{self.name} must be an array of {self._scalar_type.primitive_type}s")
+            self._class_type = VoidType()
+        else:
+            self._class_type = self._scalar_type
+        self._out = out
+        super().__init__(generator, *args)
+
+    @property
+    def out(self):
+        """
+        The array which is filled.
+
+        The array which is filled with random numbers. If it is None then
+        a single random number is returned.
+        """
+        return self._out
+
+    @property
+    def scalar_call(self):
+        """
+        Get the call which returns a single random number.
+
+        Get an object representing the same method call without the
+        `out` argument. This is the call which must be used to fill each
+        element of `out`.
+        """
+        return type(self)(self.generator, *self.args)
+
+#==============================================================================
+class GeneratorRandom(GeneratorDrawMethod):
+    """
+    Represents a call to the .random() method.
+
+    Represents a call to the .random() method which returns a float
+    uniformly distributed in [0, 1).
+
+    Parameters
+    ----------
+    generator : TypedAstNode
+        The generator on which the method will operate.
+
+    out : TypedAstNode, optional
+        An array of floats which should be filled with random numbers.
+    """
+    __slots__ = ()
+    name = 'random'
+    _scalar_type = PythonNativeFloat()
+
+    def __init__(self, generator, out = None):
+        super().__init__(generator, out = out)
+
+#==============================================================================
+class GeneratorIntegers(GeneratorDrawMethod):
+    """
+    Represents a call to the .integers() method.
+
+    Represents a call to the .integers() method which returns an integer
+    uniformly distributed in [low, high).
+
+    Parameters
+    ----------
+    generator : TypedAstNode
+        The generator on which the method will operate.
+
+    low : TypedAstNode
+        The lowest integer which can be drawn.
+
+    high : TypedAstNode
+        One more than the highest integer which can be drawn.
+
+    out : TypedAstNode, optional
+        An array of integers which should be filled with random numbers.
+    """
+    __slots__ = ()
+    name = 'integers'
+    _scalar_type = PythonNativeInt()
+
+    def __init__(self, generator, low, high, out = None):
+        low = _as_native(low, PythonInt)
+        high = _as_native(high, PythonInt)
+        super().__init__(generator, low, high, out = out)
+
+    @property
+    def low(self):
+        """
+        The lowest integer which can be drawn.
+
+        The lowest integer which can be drawn.
+        """
+        return self._args[0]
+
+    @property
+    def high(self):
+        """
+        One more than the highest integer which can be drawn.
+
+        One more than the highest integer which can be drawn.
+        """
+        return self._args[1]
+
+#==============================================================================
+class GeneratorNormal(GeneratorDrawMethod):
+    """
+    Represents a call to the .normal() method.
+
+    Represents a call to the .normal() method which returns a float
+    drawn from a normal distribution.
+
+    Parameters
+    ----------
+    generator : TypedAstNode
+        The generator on which the method will operate.
+
+    loc : TypedAstNode, optional
+        The mean of the distribution. The default is 0.0.
+
+    scale : TypedAstNode, optional
+        The standard deviation of the distribution. The default is 1.0.
+
+    out : TypedAstNode, optional
+        An array of floats which should be filled with random numbers.
+    """
+    __slots__ = ()
+    name = 'normal'
+    _scalar_type = PythonNativeFloat()
+
+    def __init__(self, generator, loc = None, scale = None, out = None):
+        loc = LiteralFloat(0.0) if loc is None else loc
+        scale = LiteralFloat(1.0) if scale is None else scale
+        loc = _as_native(loc, PythonFloat)
+        scale = _as_native(scale, PythonFloat)
+        super().__init__(generator, loc, scale, out = out)
+
+    @property
+    def loc(self):
+        """
+        The mean of the distribution.
+
+        The mean of the distribution.
+        """
+        return self._args[0]
+
+    @property
+    def scale(self):
+        """
+        The standard deviation of the distribution.
+
+        The standard deviation of the distribution.
+        """
+        return self._args[1]
+
+#==============================================================================
+random_mod = Module('random', (),
+        funcs = [PyccelFunctionDef('Generator', RandomGenerator)])
+
+#==============================================================================
+# Function of the runtime libraries which indicates if integers() was called with
+# an invalid range since the last call. It is called by the Python wrapper.
+philox_take_error = FunctionDef(name = 'pyc_philox_take_error',
+                                body = [],
+                                arguments = [],
+                                results = [FunctionDefResult(Variable(PythonNativeBool(), name = 'error'))])
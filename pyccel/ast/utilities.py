@@ -6,33 +6,36 @@
 #------------------------------------------------------------------------------------------#
 
 import sys
-from itertools import chain
+from itertools import chain, groupby
 from collections import namedtuple
 
 import pyccel.decorators as pyccel_decorators
 from pyccel.errors.errors import Errors, PyccelError
 
-from .core          import (AsName, Import, FunctionCall,
-                            Allocate, Duplicate, Assign, For, CodeBlock,
-                            Concatenate, Module, PyccelFunctionDef)
+from .core          import (AsName, Import, FunctionCall, FunctionDef,
+                            Allocate, Deallocate, Duplicate, Assign, AugAssign, For, CodeBlock,
+                            Concatenate, Module, PyccelFunctionDef, If, IfSection)
 
 from .builtins      import (builtin_functions_dict,
                             PythonRange, PythonList, PythonTuple, PythonSet)
 from .cmathext      import cmath_mod
 from .datatypes     import HomogeneousTupleType, InhomogeneousTupleType, PythonNativeInt
-from .datatypes     import StringType
-from .internals     import PyccelFunction, Slice
+from .datatypes     import StringType, PrimitiveIntegerType, PrimitiveFloatingPointType
+from .internals     import PyccelFunction, PyccelArrayShapeElement, PyccelArraySize, Slice
 from .itertoolsext  import itertools_mod
-from .literals      import LiteralInteger, LiteralEllipsis, Nil
+from .literals      import Literal, LiteralInteger, LiteralEllipsis, Nil, convert_to_literal
 from .mathext       import math_mod
 from .sysext        import sys_mod
 from .cudaext       import cuda_mod
 
-from .numpyext      import (NumpyEmpty, NumpyArray, numpy_mod,
-                            NumpyTranspose, NumpyLinspace)
+from .numpyext      import (NumpyEmpty, NumpyArray, NumpyNewArray, numpy_mod,
+                            NumpyTranspose, NumpyLinspace,
+                            NumpySum, NumpyAmax, NumpyAmin)
 from .numpytypes    import NumpyNDArrayType
-from .operators     import PyccelAdd, PyccelMul, PyccelIs, PyccelArithmeticOperator
-from .operators     import PyccelUnarySub
+from .operators     import PyccelAdd, PyccelMul, PyccelIs, PyccelArithmeticOperator, PyccelOperator
+from .operators     import PyccelUnarySub, PyccelGt, PyccelLt
+from .omp           import OMP_Array_Loop_Construct, OMP_Simd_Construct
+from .randomext     import random_mod
 from .scipyext      import scipy_mod
 from .sysext        import sys_mod
 from .typingext     import typing_mod
@@ -55,7 +58,8 @@ decorators_mod = Module('decorators',(),
         funcs = [PyccelFunctionDef(d, PyccelFunction) for d in pyccel_decorators.__all__])
 pyccel_mod = Module('pyccel',(),(),
         imports = [Import('decorators', decorators_mod),
-                    Import('cuda', cuda_mod)])
+                    Import('cuda', cuda_mod),
+                    Import('random', random_mod)])
 
 # TODO add documentation
 builtin_import_registry = Module('__main__',
@@ -378,7 +382,8 @@ def insert_index(expr, pos, index_var):
 LoopCollection = namedtuple('LoopCollection', ['body', 'length', 'modified_vars'])
 
 #==============================================================================
-def collect_loops(block, indices, new_index, language_has_vectors = False, result = None):
+def collect_loops(block, indices, new_index, language_has_vectors = False, result = None,
+                  equivalent_lengths = None):
     """
     Collect blocks of code into loops.
 
@@ -414,6 +419,11 @@ def collect_loops(block, indices, new_index, language_has_vectors = False, resul
     result : list, default: None
         The list which will be returned. If none is provided, a new list
         is created.
+    equivalent_lengths : function, optional
+        A function which indicates whether two loop lengths are known to be
+        equal. Consecutive lines are only collected into the same loop if
+        the lengths of the loops are equal. By default the lengths must be
+        identical expressions.
 
     Returns
     -------
@@ -422,6 +432,8 @@ def collect_loops(block, indices, new_index, language_has_vectors = False, resul
     """
     if result is None:
         result = []
+    if equivalent_lengths is None:
+        equivalent_lengths = lambda l1, l2: l1 == l2
     current_level = 0
     array_creator_types = (Allocate, PythonList, PythonTuple, Concatenate, Duplicate, PythonSet)
     is_function_call = lambda f: ((isinstance(f, FunctionCall) and not f.funcdef.is_elemental)
@@ -470,7 +482,8 @@ def collect_loops(block, indices, new_index, language_has_vectors = False, resul
                                                                           IndexedElement,
                                                                           ObjectAddress))]
             variables      += [v for f in elemental_func_calls \
-                                 for v in f.get_attribute_nodes((Variable, IndexedElement, ObjectAddress))]
+                                 for v in f.get_attribute_nodes((Variable, IndexedElement, ObjectAddress),
+                                                                excluded_nodes = (PyccelArrayShapeElement,))]
             transposed_vars = [v for v in notable_nodes if isinstance(v, NumpyTranspose)] \
                                 + [v for f in elemental_func_calls \
                                      for v in f.get_attribute_nodes(NumpyTranspose)]
@@ -556,7 +569,8 @@ def collect_loops(block, indices, new_index, language_has_vectors = False, resul
                     excluded_nodes = (FunctionCall, PyccelFunction))
             line.substitute(transposed_vars + indexed_funcs, handled_funcs,
                     excluded_nodes = (FunctionCall))
-            _ = [f.substitute(variables, new_vars) for f in elemental_func_calls]
+            _ = [f.substitute(variables, new_vars, excluded_nodes = (PyccelArrayShapeElement,))
+                    for f in elemental_func_calls]
             _ = [f.substitute(transposed_vars + indexed_funcs, handled_funcs) for f in elemental_func_calls]
 
             # Recurse through result tree to save line with lines which need
@@ -566,7 +580,7 @@ def collect_loops(block, indices, new_index, language_has_vectors = False, resul
             for _ in range(min(new_level,current_level)):
                 # Select the existing loop if the shape matches the shape of the expression
                 # and the loop is not used to modify one of the variable dependencies
-                if save_spot[-1].length == shape[j] and not any(u in save_spot[-1].modified_vars for u in dependencies):
+                if equivalent_lengths(save_spot[-1].length, shape[j]) and not any(u in save_spot[-1].modified_vars for u in dependencies):
                     save_spot[-1].modified_vars.update(lhs_vars)
                     save_spot = save_spot[-1].body
                     j+=1
@@ -765,7 +779,695 @@ def expand_inhomog_tuple_assignments(block, language_has_vectors = False):
         expand_inhomog_tuple_assignments(block)
 
 #==============================================================================
-def expand_to_loops(block, new_index, scope, language_has_vectors = False):
+def annotate_parallel_loop(loop, threshold, reduction = None, private = ()):
+    """
+    Precede a loop with the OpenMP constructs which run it in parallel.
+
+    Precede a loop whose iterations are independent with the OpenMP constructs
+    which run it in parallel. The perfectly nested loops are collapsed and
+    shared between the threads. If the innermost of these loops contains no
+    other loops then it is also vectorised. This is done by combining the
+    `simd` construct with the parallel construct if there is only one loop,
+    otherwise the innermost loop is preceded by a separate `simd` construct
+    (vectorising a collapsed loop is less efficient and is badly handled by
+    some compilers).
+
+    Parameters
+    ----------
+    loop : For
+        The outermost loop.
+    threshold : int
+        The minimum number of iterations for which the loop is run in parallel.
+    reduction : tuple[str, Variable], optional
+        The operator and the variable of a reduction carried out in the loop.
+    private : iterable[Variable], optional
+        The scalars which are assigned in each iteration before being used.
+
+    Returns
+    -------
+    CodeBlock
+        The code block containing the annotated loop.
+    """
+    nested = [loop]
+    while len(nested[-1].body.body) == 1 and isinstance(nested[-1].body.body[0], For):
+        nested.append(nested[-1].body.body[0])
+    size = nested[0].iterable.stop
+    for l in nested[1:]:
+        size = PyccelMul(size, l.iterable.stop, simplify = True)
+
+    simd = not nested[-1].body.get_attribute_nodes(For)
+    if simd and len(nested) > 1:
+        inner = nested.pop()
+        clauses = f' private({", ".join(v.name for v in private)})' if private else ''
+        clauses += f' reduction({reduction[0]}:{reduction[1].name})' if reduction else ''
+        nested[-1].body.substitute(inner, CodeBlock([OMP_Simd_Construct(clauses, False), inner],
+                                                    unravelled = True),
+                                   invalidate = False)
+        simd = False
+
+    private = {**{l.target[0] : None for l in loop.get_attribute_nodes(For) if l not in nested},
+               **{v : None for v in private}}
+
+    return CodeBlock([OMP_Array_Loop_Construct(size, threshold, len(nested), private, reduction, simd), loop],
+                     unravelled = True)
+
+def is_elementwise_statement(line):
+    """
+    Indicate whether a statement may be evaluated element by element in parallel.
+
+    Check that a statement does not call a function which builds an array
+    without being elemental. `np.linspace` is also excluded although it is
+    marked as elemental to be printed element by element in loops. Such
+    functions are not evaluated independently for each element (their
+    arguments must not be indexed in the loops) so their loops are not run in
+    parallel.
+
+    Parameters
+    ----------
+    line : PyccelAstNode
+        The statement.
+
+    Returns
+    -------
+    bool
+        True if the statement does not call a non-elemental array function.
+    """
+    return not any(isinstance(f, NumpyLinspace) or
+                   (f.rank > 0 and not f.is_elemental and not hasattr(f, '__getitem__'))
+                   for f in line.get_attribute_nodes(PyccelFunction))
+
+def parallelise_array_loop(loop, threshold):
+    """
+    Annotate a loop generated from array expressions so that it is run in parallel.
+
+    Check whether the iterations of a loop created by `insert_fors` are
+    independent and, if so, precede the loop with the OpenMP constructs which
+    run it in parallel (see `annotate_parallel_loop`). The iterations are
+    independent if the loop only contains assignments to array elements and if
+    each array which is modified is always accessed at the element which is
+    modified (e.g. `a[i] = a[i] + b[i+1]` but not `a[i] = a[i+1] + b[i]`) and
+    if no statement calls a non-elemental array function (see
+    `is_elementwise_statement`). Loops using pointers are not parallelised as
+    the pointers may point at a modified array. Scalars may also be assigned
+    in the loop (e.g. temporary arrays replaced by scalars in fused loops, see
+    `scalarise_temporaries`) if they are assigned before being used in each
+    iteration. These scalars are private to each thread.
+
+    Parameters
+    ----------
+    loop : For
+        The loop generated from array expressions.
+    threshold : int
+        The minimum number of iterations for which the loop is run in parallel.
+
+    Returns
+    -------
+    PyccelAstNode
+        The annotated loop or the original loop if it cannot be run in parallel.
+    """
+    statements = []
+    to_examine = list(loop.body.body)
+    while to_examine:
+        stmt = to_examine.pop(0)
+        if isinstance(stmt, For):
+            to_examine = list(stmt.body.body) + to_examine
+        elif not isinstance(stmt, Assign) or not isinstance(stmt.lhs, (IndexedElement, Variable)) \
+                or stmt.lhs.rank > 0:
+            return loop
+        elif not is_elementwise_statement(stmt):
+            return loop
+        else:
+            statements.append(stmt)
+
+    if any(v.is_alias for v in loop.get_attribute_nodes(Variable) if v.rank > 0):
+        return loop
+
+    private = [stmt.lhs for stmt in statements if isinstance(stmt.lhs, Variable)]
+    for var in private:
+        first_use = next(stmt for stmt in statements if var in stmt.get_attribute_nodes(Variable))
+        if first_use.lhs != var or isinstance(first_use, AugAssign) or \
+                var == first_use.rhs or var in first_use.rhs.get_attribute_nodes(Variable):
+            return loop
+
+    # The bases are compared by identity as an indexed base (e.g. a slice) cannot be hashed
+    written = []
+    for stmt in statements:
+        if isinstance(stmt.lhs, Variable):
+            continue
+        indices = tuple(repr(i) for i in stmt.lhs.indices)
+        prev = next((idx for base, idx in written if base is stmt.lhs.base), None)
+        if prev is None:
+            written.append((stmt.lhs.base, indices))
+        elif prev != indices:
+            return loop
+    for e in loop.get_attribute_nodes(IndexedElement):
+        indices = next((idx for base, idx in written if base is e.base), None)
+        if indices is not None and tuple(repr(i) for i in e.indices) != indices:
+            return loop
+
+    return annotate_parallel_loop(loop, threshold, private = dict.fromkeys(private))
+
+def expand_reduction(line, indices, new_index, scope, threshold):
+    """
+    Rewrite a reduction over an array as a parallel loop.
+
+    Rewrite an assignment of the form `x = np.sum(a)` (or `np.max(a)`, `np.min(a)`)
+    where `a` is an array of integers or floats as an explicit loop over the
+    elements of the array annotated with an OpenMP reduction construct. The
+    loops are nested in the order in which the elements are stored in memory.
+    The reduction is carried out on a new temporary scalar so that it can be
+    used in the reduction clause whatever the nature of the left-hand side.
+
+    Parameters
+    ----------
+    line : PyccelAstNode
+        The statement which may be a reduction.
+    indices : list[Variable]
+        The index variables which are already used for the loops generated in
+        this block. New variables are added to this list if necessary.
+    new_index : function
+        A function which provides a new variable from a base name, avoiding
+        name collisions.
+    scope : Scope
+        The scope on which the loop is defined.
+    threshold : int
+        The minimum number of iterations for which the loop is run in parallel.
+
+    Returns
+    -------
+    list[PyccelAstNode]
+        The statements which replace the line, or an empty list if the line is
+        not a reduction which can be parallelised.
+    """
+    operators = {NumpySum : '+', NumpyAmax : 'max', NumpyAmin : 'min'}
+    if not isinstance(line, Assign) or isinstance(line, AugAssign) or \
+            type(line.rhs) not in operators or line.lhs.rank != 0:
+        return []
+    arg = line.rhs.arg
+    if not isinstance(arg, (Variable, IndexedElement)) or arg.rank == 0 or \
+            not isinstance(arg.dtype.primitive_type, (PrimitiveIntegerType, PrimitiveFloatingPointType)):
+        return []
+
+    operator = operators[type(line.rhs)]
+    rank = arg.rank
+    while len(indices) < rank:
+        indices.append(new_index(PythonNativeInt(), 'i'))
+
+    def get_element(loop_indices):
+        element = arg
+        for index_depth, index in zip(range(-rank, 0), loop_indices):
+            element = insert_index(element, index_depth, index)
+        return element
+
+    result = new_index(line.lhs.class_type, 'tmp')
+    if operator == '+':
+        init = convert_to_literal(0, result.class_type)
+        body = Assign(result, PyccelAdd(result, get_element(indices)))
+    else:
+        init = get_element([LiteralInteger(0)]*rank)
+        comparison = PyccelGt if operator == 'max' else PyccelLt
+        body = If(IfSection(comparison(get_element(indices), result),
+                            [Assign(result, get_element(indices))]))
+
+    dims = range(rank-1, -1, -1) if arg.order == 'F' else range(rank)
+    loop_scopes = [scope.create_new_loop_scope()]
+    for _ in dims[1:]:
+        loop_scopes.append(loop_scopes[-1].create_new_loop_scope())
+    for d, loop_scope in zip(reversed(dims), reversed(loop_scopes)):
+        body = For([indices[d]], PythonRange(0, arg.shape[d]),
+                   CodeBlock([body], unravelled = True), scope = loop_scope)
+
+    return [Assign(result, init),
+            annotate_parallel_loop(body, threshold, (operator, result)),
+            Assign(line.lhs, result)]
+
+#==============================================================================
+def get_structural_key(expr):
+    """
+    Get a key which identifies an expression from its structure.
+
+    Get a hashable key which is identical for expressions built in the same
+    way from the same variables and literals, even if they are represented by
+    different objects (e.g. the slices in `a[1:]` and `b[1:]`). Only the
+    nodes which may be found in shapes and indices (operators, array sizes,
+    slices, indexed elements) are examined. Other nodes are identified by the
+    object itself.
+
+    Parameters
+    ----------
+    expr : PyccelAstNode | tuple | None
+        The expression.
+
+    Returns
+    -------
+    object
+        A hashable key describing the expression.
+    """
+    if isinstance(expr, tuple):
+        return tuple(get_structural_key(e) for e in expr)
+    elif isinstance(expr, Variable):
+        return str(expr)
+    elif isinstance(expr, Literal):
+        return (type(expr).__name__, expr.python_value)
+    elif isinstance(expr, (PyccelOperator, PyccelArrayShapeElement, PyccelArraySize)):
+        return (type(expr).__name__, get_structural_key(expr.args))
+    elif isinstance(expr, Slice):
+        return ('Slice', get_structural_key((expr.start, expr.stop, expr.step, expr.slice_type)))
+    elif isinstance(expr, IndexedElement):
+        return ('IndexedElement', get_structural_key(expr.base), get_structural_key(expr.indices))
+    elif expr is None:
+        return None
+    else:
+        return ('Node', id(expr))
+
+class LengthEquivalences:
+    """
+    Groups of array lengths which are known to be equal.
+
+    A union-find structure describing which expressions are known to have the
+    same value. The lengths are equal either because they describe the same
+    dimension of arrays used in an element-wise operation (NumPy would raise
+    an error otherwise) or because they describe the shape of an array and
+    the shape which was used to allocate it. The expressions are identified by
+    their structure (see `get_structural_key`).
+    """
+    __slots__ = ('_parents',)
+
+    def __init__(self):
+        self._parents = {}
+
+    def _find(self, length):
+        """
+        Get the key of the representative of the group containing a length.
+
+        Get the key of the representative of the group containing a length.
+
+        Parameters
+        ----------
+        length : TypedAstNode
+            The length.
+
+        Returns
+        -------
+        object
+            The key of the representative of the group.
+        """
+        key = get_structural_key(length)
+        while self._parents.get(key, key) != key:
+            key = self._parents[key]
+        return key
+
+    def add_equivalence(self, length1, length2):
+        """
+        Indicate that two lengths are equal.
+
+        Merge the groups containing the two lengths.
+
+        Parameters
+        ----------
+        length1 : TypedAstNode
+            The first length.
+        length2 : TypedAstNode
+            The second length.
+        """
+        key1 = self._find(length1)
+        key2 = self._find(length2)
+        if key1 != key2:
+            self._parents[key1] = key2
+
+    def are_equivalent(self, length1, length2):
+        """
+        Indicate whether two lengths are known to be equal.
+
+        Indicate whether two lengths are known to be equal.
+
+        Parameters
+        ----------
+        length1 : TypedAstNode
+            The first length.
+        length2 : TypedAstNode
+            The second length.
+
+        Returns
+        -------
+        bool
+            True if the lengths are known to be equal.
+        """
+        return length1 == length2 or self._find(length1) == self._find(length2)
+
+def get_elementwise_accesses(line):
+    """
+    Get the arrays accessed by an element-wise array statement.
+
+    Check whether a statement is an assignment to a NumPy array whose
+    right-hand side is computed element by element (e.g. `a[:] = b + 2*c[1:]`)
+    without calling functions which are not elemental and without using
+    pointers. The loops evaluating such statements can be fused with the
+    loops evaluating the neighbouring statements. For each access to an array
+    the base array is returned with a key describing the elements which are
+    accessed. A statement which reads elements of the array that it modifies
+    other than the modified elements (e.g. `a[1:] = a[:-1]`) is not
+    element-wise.
+
+    Parameters
+    ----------
+    line : PyccelAstNode
+        The statement.
+
+    Returns
+    -------
+    list[tuple[Variable, object, TypedAstNode]] | None
+        The base array, the key describing the accessed elements and the
+        accessed expression for each array access. The first access is the
+        left-hand side. None is returned if the statement is not an
+        element-wise array statement.
+    """
+    if not isinstance(line, Assign) or not isinstance(line.lhs, (Variable, IndexedElement)) \
+            or line.lhs.rank == 0 or not isinstance(line.lhs.class_type, NumpyNDArrayType):
+        return None
+
+    rhs = line.rhs
+    forbidden_types = (Allocate, PythonList, PythonTuple, PythonSet, Concatenate, Duplicate,
+                       FunctionCall, NumpyNewArray, NumpyTranspose, ObjectAddress, PyccelIs, Nil)
+    if isinstance(rhs, forbidden_types) or rhs.get_attribute_nodes(forbidden_types):
+        return None
+
+    funcs = [f for f in [rhs, *rhs.get_attribute_nodes(PyccelFunction, excluded_nodes = (PyccelArrayShapeElement,))]
+             if isinstance(f, PyccelFunction) and not isinstance(f, PyccelArrayShapeElement)]
+    if any(not f.is_elemental or hasattr(f, '__getitem__') for f in funcs):
+        return None
+
+    operands = [rhs] if isinstance(rhs, (Variable, IndexedElement)) else \
+               rhs.get_attribute_nodes((Variable, IndexedElement), excluded_nodes = (PyccelArrayShapeElement,))
+    operands = [line.lhs] + [o for o in operands if isinstance(o, IndexedElement) or o.rank > 0]
+
+    is_full_slice = lambda i: isinstance(i, Slice) and i.start is None and i.stop is None and i.step is None
+    accesses = []
+    for o in operands:
+        if isinstance(o, IndexedElement) and \
+                (len(o.indices) < o.base.rank or not all(is_full_slice(i) for i in o.indices)):
+            accesses.append((o.base, get_structural_key(o.indices), o))
+        elif isinstance(o, IndexedElement):
+            accesses.append((o.base, 'full', o))
+        else:
+            accesses.append((o, 'full', o))
+
+    if any(not isinstance(b.class_type, NumpyNDArrayType) or b.is_alias or (b.rank > 1 and b.order == 'F')
+           for b, _, _ in accesses):
+        return None
+
+    # Arrays must not be used in any other way (e.g. in the indices)
+    arrays = [v for v in line.get_attribute_nodes(Variable, excluded_nodes = (PyccelArrayShapeElement,))
+              if v.rank > 0]
+    if len(arrays) != len(accesses):
+        return None
+
+    lhs_base, lhs_key, _ = accesses[0]
+    if any(b == lhs_base and k != lhs_key for b, k, _ in accesses):
+        return None
+
+    return accesses
+
+def is_hoistable_allocation(line):
+    """
+    Indicate whether a statement is an allocation which can be moved upwards.
+
+    Indicate whether a statement is the allocation of a NumPy array whose
+    shape is computed from scalars and from the shapes of other arrays. The
+    value of the shape is therefore not modified by statements which modify
+    the elements of arrays so the allocation can be moved before such
+    statements.
+
+    Parameters
+    ----------
+    line : PyccelAstNode
+        The statement.
+
+    Returns
+    -------
+    bool
+        True if the statement is an allocation which can be moved upwards.
+    """
+    if not isinstance(line, Allocate) or line.like is not None or \
+            not isinstance(line.variable.class_type, NumpyNDArrayType):
+        return False
+
+    for s in line.shape:
+        if isinstance(s, (int, PyccelArrayShapeElement)):
+            continue
+        if not isinstance(s, (Literal, Variable, PyccelOperator)) or \
+                (isinstance(s, Variable) and s.rank > 0):
+            return False
+        nodes = s.get_attribute_nodes((Variable, IndexedElement, FunctionCall, PyccelFunction),
+                                      excluded_nodes = (PyccelArrayShapeElement,))
+        if any(not isinstance(n, Variable) or n.rank > 0 for n in nodes):
+            return False
+
+    return True
+
+def hoist_allocations(lines):
+    """
+    Move the allocations of arrays upwards, before element-wise array statements.
+
+    Move the allocations of arrays upwards past element-wise array statements
+    and other allocations when the allocated array is not used by these
+    statements. This groups the element-wise array statements together so
+    that the loops evaluating them can be fused. E.g. the statements:
+    ```
+    allocate(t, a.shape)
+    t = a * b
+    allocate(u, t.shape)
+    u = t + c
+    ```
+    become:
+    ```
+    allocate(t, a.shape)
+    allocate(u, t.shape)
+    t = a * b
+    u = t + c
+    ```
+
+    Parameters
+    ----------
+    lines : iterable[PyccelAstNode]
+        The statements.
+
+    Returns
+    -------
+    list[PyccelAstNode]
+        The statements in their new order.
+    """
+    result = []
+    for line in lines:
+        pos = len(result)
+        if is_hoistable_allocation(line):
+            var = line.variable
+            shape_vars = [v for s in line.shape if not isinstance(s, int)
+                            for v in ([s] if isinstance(s, Variable) else s.get_attribute_nodes(Variable))]
+            while pos > 0:
+                previous = result[pos-1]
+                if is_hoistable_allocation(previous):
+                    if previous.variable == var or previous.variable in shape_vars:
+                        break
+                elif get_elementwise_accesses(previous) is None or \
+                        var in previous.get_attribute_nodes(Variable):
+                    break
+                pos -= 1
+        result.insert(pos, line)
+    return result
+
+def split_fusable_statements(lines):
+    """
+    Split statements into groups whose loops can be fused.
+
+    Split a list of statements into groups of consecutive element-wise array
+    statements (see `get_elementwise_accesses`) which can be evaluated in the
+    same loops. The statements in a group modify arrays of the same rank
+    whose lengths are known to be equal and each array modified in the group
+    is always accessed at the same elements. This ensures that evaluating
+    the statements element by element in one loop gives the same result as
+    evaluating them one after the other. Other statements are returned in
+    groups of one statement.
+
+    The lengths which are known to be equal are collected in runs of
+    statements starting with allocations (see `hoist_allocations`) and
+    followed by element-wise array statements. Within such a run the shapes of
+    the arrays cannot change.
+
+    Parameters
+    ----------
+    lines : iterable[PyccelAstNode]
+        The statements.
+
+    Yields
+    ------
+    group : list[PyccelAstNode]
+        The statements in the group.
+    lengths : LengthEquivalences
+        The lengths which are known to be equal in the run containing the group.
+    allocations : dict[Variable, Allocate]
+        The allocations in the run containing the group.
+    """
+    lengths = LengthEquivalences()
+    allocations = {}
+    in_allocations = True
+    group = []
+    accessed = {}
+    written = set()
+    for line in lines:
+        accesses = get_elementwise_accesses(line)
+
+        if accesses is None:
+            if group:
+                yield group, lengths, allocations
+                group = []
+            if not is_hoistable_allocation(line) or not in_allocations or line.variable in allocations:
+                lengths = LengthEquivalences()
+                allocations = {}
+            if is_hoistable_allocation(line):
+                in_allocations = True
+                allocations[line.variable] = line
+                for s, a in zip(line.variable.shape, line.shape):
+                    lengths.add_equivalence(s, a)
+            yield [line], lengths, allocations
+            continue
+
+        in_allocations = False
+        lhs = line.lhs
+        is_one = lambda s: isinstance(s, LiteralInteger) and s.python_value == 1
+        for _, _, a in accesses[1:]:
+            offset = lhs.rank - a.rank
+            for d, s in enumerate(a.shape or ()):
+                if not is_one(s) and not is_one(lhs.shape[d+offset]):
+                    lengths.add_equivalence(lhs.shape[d+offset], s)
+
+        if group:
+            new_written = written | {accesses[0][0]}
+            new_accessed = {b : accessed.get(b, set()) | {k for b2, k, _ in accesses if b2 == b}
+                            for b in new_written}
+            same_shape = lhs.rank == group[0].lhs.rank and \
+                    all(lengths.are_equivalent(s1, s2) for s1, s2 in zip(lhs.shape, group[0].lhs.shape))
+            if not same_shape or any(len(keys) > 1 for keys in new_accessed.values()):
+                yield group, lengths, allocations
+                group = []
+                accessed = {}
+                written = set()
+
+        group.append(line)
+        written.add(accesses[0][0])
+        for b, k, _ in accesses:
+            accessed.setdefault(b, set()).add(k)
+
+    if group:
+        yield group, lengths, allocations
+
+def scalarise_temporaries(collected, statements, allocations, func, new_index):
+    """
+    Replace the temporary arrays which are only used in a fused loop with scalars.
+
+    A temporary array which is allocated before a fused loop, which is only
+    used in this loop and whose elements are always assigned before being used
+    does not need to be stored. The elements of this array are therefore
+    replaced by a scalar and the allocation of the array is removed. The
+    allocations and the loop lengths which use the shape of the array are
+    modified to use the shape which was used to allocate the array instead.
+    E.g. in the function:
+    ```python
+    def f(a : 'float[:]', b : 'float[:]', c : 'float[:]'):
+        t = a * b
+        c[:] = t + 1
+    ```
+    the fused loop becomes:
+    ```
+    for i in range(a.shape[0]):
+        t_0 = a[i] * b[i]
+        c[i] = t_0 + 1
+    ```
+
+    Parameters
+    ----------
+    collected : list
+        The result of `collect_loops`. The last element is the LoopCollection
+        describing the fused loop. This list is modified in place.
+    statements : list[Assign]
+        The statements in the fused loop.
+    allocations : dict[Variable, Allocate]
+        The allocations in the run containing the fused loop (see
+        `split_fusable_statements`). This dictionary is modified in place.
+    func : FunctionDef
+        The function containing the fused loop.
+    new_index : function
+        A function which provides a new variable from a base name, avoiding
+        name collisions.
+    """
+    results = [r.var for r in func.results]
+    all_allocations = func.body.get_attribute_nodes(Allocate)
+    all_deallocations = func.body.get_attribute_nodes(Deallocate)
+    get_shape_variables = lambda s: [] if isinstance(s, int) else \
+                                    [s] if isinstance(s, Variable) else s.get_attribute_nodes(Variable)
+
+    def get_lengths(loops):
+        return [loops.length] + [l for b in loops.body if isinstance(b, LoopCollection) for l in get_lengths(b)]
+
+    def replace_lengths(loops, var, shape):
+        length = loops.length
+        if isinstance(length, PyccelArrayShapeElement) and length.arg == var:
+            length = shape[length.index.python_value]
+        body = [replace_lengths(b, var, shape) if isinstance(b, LoopCollection) else b for b in loops.body]
+        return LoopCollection(body, length, loops.modified_vars)
+
+    for var in list(allocations):
+        alloc = allocations[var]
+        if var.is_argument or var.is_alias or var.is_target or var in results or \
+                not any(v is var for v in func.scope.variables.values()) or \
+                not any(a is alloc for a in collected):
+            continue
+
+        # The array must only be used in the loop at the element which is computed
+        users = [s for s in statements if var in s.get_attribute_nodes(Variable)]
+        if not users:
+            continue
+        first = users[0]
+        if isinstance(first, AugAssign) or not isinstance(first.lhs, IndexedElement) or \
+                first.lhs.base != var or var in first.rhs.get_attribute_nodes(Variable):
+            continue
+        elements = [e for s in users for e in s.get_attribute_nodes(IndexedElement) if e.base == var]
+        n_uses = sum(1 for s in users for v in s.get_attribute_nodes(Variable) if v == var)
+        if n_uses != len(elements) or any(e.rank > 0 for e in elements) or \
+                any(get_structural_key(e.indices) != get_structural_key(first.lhs.indices) for e in elements):
+            continue
+
+        # The array must not be used elsewhere in the function
+        n_deallocations = sum(1 for d in all_deallocations if d.variable == var)
+        if sum(1 for v in func.body.get_attribute_nodes(Variable) if v == var) != n_uses + n_deallocations + 1:
+            continue
+
+        # The shape of the array may only be used to allocate arrays in the run and as a loop length
+        shape_users = [a for a in all_allocations if any(var in get_shape_variables(s) for s in a.shape)]
+        if any(allocations.get(a.variable) is not a for a in shape_users) or \
+                any(var in get_shape_variables(s) and not (isinstance(s, PyccelArrayShapeElement) and s.arg == var)
+                    for a in shape_users for s in a.shape) or \
+                any(var in get_shape_variables(l) and not (isinstance(l, PyccelArrayShapeElement) and l.arg == var)
+                    for l in get_lengths(collected[-1])):
+            continue
+
+        scalar = new_index(var.dtype, var.name)
+        for s in users:
+            s.substitute(elements, [scalar]*len(elements))
+        collected[-1] = replace_lengths(collected[-1], var, alloc.shape)
+
+        collected.pop(next(i for i, c in enumerate(collected) if c is alloc))
+        del allocations[var]
+        for a in shape_users:
+            shape = tuple(alloc.shape[s.index.python_value] if isinstance(s, PyccelArrayShapeElement) and s.arg == var
+                          else s for s in a.shape)
+            new_alloc = Allocate(a.variable, shape = shape, status = a.status, like = a.like,
+                                 alloc_type = a.alloc_type)
+            collected[next(i for i, c in enumerate(collected) if c is a)] = new_alloc
+            allocations[a.variable] = new_alloc
+
+#==============================================================================
+def expand_to_loops(block, new_index, scope, language_has_vectors = False, parallel_threshold = None):
     """
     Re-write a list of expressions to include explicit loops where necessary.
 
@@ -791,6 +1493,14 @@ def expand_to_loops(block, new_index, scope, language_has_vectors = False):
     language_has_vectors : bool
         Indicates if the language has support for vector operations of the
         same shape.
+    parallel_threshold : int, optional
+        If provided, the loops which are created are parallelised with OpenMP
+        when their iterations are independent and reductions over arrays are
+        rewritten as parallel loops (see `parallelise_array_loop` and
+        `expand_reduction`). The value is the minimum number of iterations for
+        which a loop is run in parallel. In languages which have vectors, the
+        element-wise statements are then unravelled into loops (see
+        `is_elementwise_statement`).
 
     Returns
     -------
@@ -814,12 +1524,46 @@ def expand_to_loops(block, new_index, scope, language_has_vectors = False):
     """
     expand_inhomog_tuple_assignments(block)
 
+    functions = block.get_user_nodes(FunctionDef)
+    func = functions[0] if len(functions) == 1 else None
+
     indices = []
-    res = collect_loops(block.body, indices, new_index, language_has_vectors)
+    res = []
+
+    def collect_unfused(lines):
+        if parallel_threshold is None or not language_has_vectors:
+            collect_loops(lines, indices, new_index, language_has_vectors, result = res)
+            return
+        # Element-wise statements are unravelled so that their loops can be run in parallel
+        for elementwise, run in groupby(lines, key = is_elementwise_statement):
+            collect_loops(list(run), indices, new_index, not elementwise, result = res)
+
+    unfused = []
+    for group, lengths, allocations in split_fusable_statements(hoist_allocations(block.body)):
+        if len(group) == 1:
+            unfused.extend(group)
+            continue
+        collect_unfused(unfused)
+        unfused = []
+        n_collected = len(res)
+        collect_loops(group, indices, new_index, result = res,
+                      equivalent_lengths = lengths.are_equivalent)
+        if func is not None and len(res) == n_collected + 1 and isinstance(res[-1], LoopCollection):
+            scalarise_temporaries(res, group, allocations, func, new_index)
+    collect_unfused(unfused)
 
     body = [insert_fors(b, indices, scope) if isinstance(b, tuple) else [b] for b in res]
     body = [bi for b in body for bi in b]
 
+    if parallel_threshold is not None:
+        parallel_body = []
+        for b in body:
+            if isinstance(b, For) and b not in block.body:
+                parallel_body.append(parallelise_array_loop(b, parallel_threshold))
+            else:
+                parallel_body.extend(expand_reduction(b, indices, new_index, scope, parallel_threshold) or [b])
+        body = parallel_body
+
     return body
 
 #==============================================================================
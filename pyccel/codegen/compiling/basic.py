@@ -209,6 +209,33 @@ class CompileObj:
                 deps.update(d.extra_modules)
         return deps
 
+    @property
+    def interface_files(self):
+        """
+        Get the interface files read when compiling the file.
+
+        Get the C headers and Fortran `.mod` files of this object and of
+        all the objects it depends on (directly or indirectly) which exist
+        on disk. These are the files (other than the source file) which are
+        read by the compiler when the file is compiled.
+        """
+        files = []
+        to_visit = [self]
+        visited = set()
+        while to_visit:
+            obj = to_visit.pop()
+            if obj.module_target in visited:
+                continue
+            visited.add(obj.module_target)
+            stem = os.path.splitext(obj.source)[0]
+            folder, name = os.path.split(stem)
+            candidates = [f'{stem}.h', os.path.join(folder, f'{name.lower()}.mod')]
+            if not obj.has_target_file:
+                candidates.append(obj.source)
+            files.extend(f for f in candidates if f not in files and os.path.isfile(f))
+            to_visit.extend(obj.dependencies)
+        return files
+
     @property
     def dependencies(self):
         """ Returns the objects which the file to be compiled uses
@@ -79,10 +79,15 @@ class Compiler:
                Language that we are translating to.
     debug : bool
                Indicates whether we are compiling in debug mode.
+    manifest : BuildManifest, optional
+               The manifest in which the compilation commands are recorded.
+               If it is provided then commands whose inputs have not changed
+               since the last build are not run again.
     """
-    __slots__ = ('_debug','_info')
+    __slots__ = ('_debug','_info','_manifest')
     acceptable_bin_paths = None
-    def __init__(self, vendor : str, language : str, debug=False):
+    def __init__(self, vendor : str, language : str, debug=False, manifest=None):
+        self._manifest = manifest
         if language=='python':
             return
         if vendor.endswith('.json') and os.path.exists(vendor):
@@ -167,7 +172,8 @@ class Compiler:
         #    # Python sets its own standard
         #    flags.extend(self._info.get('standard_flags',()))
 
-        for a in accelerators:
+        # Sort sets so that the command is identical from one build to the next
+        for a in sorted(accelerators):
             flags.extend(self._info.get(a,{}).get('flags',()))
 
         return flags
@@ -185,11 +191,12 @@ class Compiler:
                        Accelerators used by the code
         """
         # Use dict keys as an ordered set
-        prop = dict.fromkeys(prop)
+        # Sort sets so that the command is identical from one build to the next
+        prop = dict.fromkeys(sorted(prop) if isinstance(prop, (set, frozenset)) else prop)
 
         prop.update(dict.fromkeys(self._info.get(key,())))
 
-        for a in accelerators:
+        for a in sorted(accelerators):
             prop.update(dict.fromkeys(self._info.get(a,{}).get(key,())))
 
         return prop.keys()
@@ -312,6 +319,33 @@ class Compiler:
 
         return exec_cmd, inc_flags, libs_flags, libdirs_flags, m_code
 
+    def get_module_compile_signature(self, compile_obj):
+        """
+        Get a description of the command used to compile a module.
+
+        Get a list of strings describing the parts of the command used to
+        compile a module which do not depend on the location of the files
+        (the executable, the flags and the include directories required by
+        the accelerators). The modification time of the executable is also
+        included so that the description changes when the compiler is updated.
+
+        Parameters
+        ----------
+        compile_obj : CompileObj
+            Object containing all information about the object to be compiled.
+
+        Returns
+        -------
+        list[str]
+            The description of the compilation command.
+        """
+        accelerators = compile_obj.accelerators
+        exec_cmd = self._get_exec(accelerators)
+        exec_time = os.stat(os.path.realpath(exec_cmd)).st_mtime_ns
+        return [self._info['language'], exec_cmd, str(exec_time),
+                *self._get_flags(compile_obj.flags, accelerators),
+                *self._get_includes((), accelerators)]
+
     def compile_module(self, compile_obj, output_folder, verbose = False):
         """
         Compile a module.
@@ -355,7 +389,8 @@ class Compiler:
                 *j_code]
 
         with compile_obj:
-            self.run_command(cmd, verbose)
+            self._run_build_step(cmd, [compile_obj.source, *compile_obj.interface_files],
+                    (compile_obj.module_target,), verbose)
 
     def compile_program(self, compile_obj, output_folder, verbose = False):
         """
@@ -400,7 +435,9 @@ class Compiler:
                 *libs_flags, *j_code]
 
         with compile_obj:
-            self.run_command(cmd, verbose)
+            self._run_build_step(cmd, [compile_obj.source, *compile_obj.interface_files,
+                                       *sorted(compile_obj.extra_modules)],
+                    (compile_obj.program_target,), verbose)
 
         return compile_obj.program_target
 
@@ -461,10 +498,35 @@ class Compiler:
                 '-o', file_out, *libs_flags]
 
         with compile_obj:
-            self.run_command(cmd, verbose)
+            self._run_build_step(cmd, [compile_obj.module_target, *sorted(compile_obj.extra_modules)],
+                    (file_out,), verbose)
 
         return file_out
 
+    def _run_build_step(self, cmd, inputs, outputs, verbose):
+        """
+        Run a compilation command, skipping it if it is up to date.
+
+        Run the provided compilation command. If a manifest was provided
+        then the command is recorded in it and it is only run if it was
+        not run with the same inputs during the last build.
+
+        Parameters
+        ----------
+        cmd : list of str
+            The command to run.
+        inputs : iterable of str
+            The files read by the command.
+        outputs : iterable of str
+            The files created by the command.
+        verbose : bool
+            Indicates whether additional output should be shown.
+        """
+        if self._manifest is None:
+            self.run_command(cmd, verbose)
+        else:
+            self._manifest.run_step(cmd, inputs, outputs, verbose)
+
     @staticmethod
     def run_command(cmd, verbose):
         """
@@ -0,0 +1,501 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Module containing the BuildManifest class which records the inputs and outputs of each
+stage of a build so that unchanged stages can be skipped when a file is translated again.
+"""
+import json
+import os
+import shutil
+import sys
+from functools import lru_cache
+
+from filelock import FileLock
+import numpy
+
+from pyccel.ast.variable    import Variable
+from pyccel.utilities.cache import hash_contents
+from pyccel.version         import __version__
+
+from .compilers  import Compiler
+from .file_locks import FileLockSet
+
+__all__ = ('BuildManifest',
+           'get_build_key',
+           'get_interface_fingerprint',
+           'get_manifest_filename',
+           'get_module_fingerprint',
+           'hash_file')
+
+# get path to the pyccel package
+pyccel_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+#==============================================================================
+def hash_file(filename):
+    """
+    Compute a hash describing the contents of a file.
+
+    Compute a SHA-256 hash describing the contents of a file. If the file
+    cannot be read then None is returned.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file.
+
+    Returns
+    -------
+    str | None
+        The hexadecimal representation of the hash or None if the file
+        does not exist.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            return hash_contents(f.read())
+    except OSError:
+        return None
+
+#==============================================================================
+@lru_cache(maxsize=None)
+def get_pyccel_fingerprint():
+    """
+    Get a hash describing the installed version of Pyccel.
+
+    Get a hash describing the installed version of Pyccel. In addition to the
+    version number (and the Python and NumPy versions), the modification time
+    and size of every Python file in the package are used so that the generated
+    code is not reused after Pyccel has been modified in place (e.g. in a
+    development installation).
+
+    Returns
+    -------
+    str
+        The hexadecimal representation of the hash.
+    """
+    items = [__version__, sys.version, numpy.__version__]
+    for root, dirs, files in os.walk(pyccel_path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('__') and d != 'extensions')
+        for f in sorted(files):
+            if f.endswith(('.py', '.pyh')):
+                stat = os.stat(os.path.join(root, f))
+                items.append(f'{os.path.relpath(os.path.join(root, f), pyccel_path)}:{stat.st_mtime_ns}:{stat.st_size}')
+    return hash_contents(*items)
+
+#==============================================================================
+def get_manifest_filename(pyccel_dirpath, module_name):
+    """
+    Get the name of the file where the manifest of a module is saved.
+
+    Get the name of the file where the manifest describing the build of a
+    module is saved.
+
+    Parameters
+    ----------
+    pyccel_dirpath : str
+        The folder where the files generated for the module are saved (`__pyccel__`).
+    module_name : str
+        The name of the module.
+
+    Returns
+    -------
+    str
+        The name of the manifest file.
+    """
+    return os.path.join(pyccel_dirpath, f'{module_name}.manifest.json')
+
+#==============================================================================
+def _describe_variable(var):
+    """
+    Get a string describing the type of an object seen from other modules.
+
+    Get a string describing the properties of a variable which may be used
+    by the code that accesses it from another module.
+
+    Parameters
+    ----------
+    var : TypedAstNode
+        The object being described.
+
+    Returns
+    -------
+    str
+        A description of the object.
+    """
+    if isinstance(var, Variable):
+        shape = ','.join(str(s) for s in (var.shape or ()))
+        return f'{var.name}:{var.class_type}:({shape}):{var.memory_handling}:{var.is_const}:{var.is_optional}'
+    else:
+        return f'{getattr(var, "name", "")}:{type(var).__name__}'
+
+def get_interface_fingerprint(module):
+    """
+    Get a hash describing the interface of a module.
+
+    Get a hash describing the parts of a semantic module which can be used by
+    the modules which import it (the signatures of the functions and methods,
+    the module variables and the class attributes). The bodies of the
+    functions are not described so the hash does not change when only the
+    implementation of a function is modified. The bodies of inline functions
+    are printed in the modules which use them so no hash is returned if the
+    module contains an inline function.
+
+    Parameters
+    ----------
+    module : Module
+        The semantic module.
+
+    Returns
+    -------
+    str | None
+        The hexadecimal representation of the hash or None if the interface
+        cannot be described independently of the implementation.
+    """
+    funcs = [*module.funcs, *(f for i in module.interfaces for f in i.functions)]
+    items = [_describe_variable(v) for v in module.variables]
+    for c in module.classes:
+        funcs.extend(c.methods)
+        funcs.extend(f for i in c.interfaces for f in i.functions)
+        items.append(c.name)
+        items.extend(_describe_variable(a) for a in c.attributes)
+
+    if any(f.is_inline for f in funcs):
+        return None
+
+    for f in funcs:
+        items.append(f'{f.name}:{sorted(f.decorators)}:{f.is_pure}:{f.is_elemental}:{f.is_private}')
+        items.extend(f'{a.name}:{a.inout}:{a.value}:{a.is_kwonly}:{a.persistent_target}:{_describe_variable(a.var)}'
+                     for a in f.arguments)
+        items.extend(_describe_variable(r.var) for r in f.results)
+
+    return hash_contents(*items)
+
+#==============================================================================
+def get_module_fingerprint(filename):
+    """
+    Get a hash describing a module imported by the file being translated.
+
+    Get a hash describing the parts of an imported module which may be used
+    when translating the file which imports it. If the imported module has
+    been translated by Pyccel, and has not been modified since, then the hash
+    of its interface saved in its manifest is used. Otherwise the contents of
+    the file are used.
+
+    Parameters
+    ----------
+    filename : str
+        The absolute path to the file containing the imported module.
+
+    Returns
+    -------
+    str
+        A string describing the imported module.
+    """
+    source_hash = hash_file(filename)
+    folder, name = os.path.split(filename)
+    pyccel_dirpath = os.path.join(folder, '__pyccel__' + os.environ.get('PYTEST_XDIST_WORKER', ''))
+    manifest = BuildManifest(get_manifest_filename(pyccel_dirpath, os.path.splitext(name)[0]))
+    if manifest.interface and manifest.source_hash == source_hash:
+        return f'interface:{manifest.interface}'
+    else:
+        return f'source:{source_hash}'
+
+def get_build_key(source_hash, dependencies, *options):
+    """
+    Get a hash describing everything which affects the code generated for a file.
+
+    Get a hash describing the installed version of Pyccel, the contents of the
+    file being translated, the modules that it imports and the options passed
+    to Pyccel. If this hash has not changed since the last build then the
+    generated code will not change so the syntactic, semantic and code
+    generation stages can be skipped.
+
+    Parameters
+    ----------
+    source_hash : str
+        The hash of the contents of the file being translated.
+    dependencies : iterable[str]
+        The absolute paths to the files containing the user modules imported
+        (directly or indirectly) by the file being translated.
+    *options : object
+        The options passed to Pyccel.
+
+    Returns
+    -------
+    str
+        The hexadecimal representation of the hash.
+    """
+    return hash_contents(get_pyccel_fingerprint(), source_hash, *options,
+                         *(f'{d}={get_module_fingerprint(d)}' for d in sorted(dependencies)))
+
+#==============================================================================
+class BuildManifest:
+    """
+    Class describing the steps carried out to build a module.
+
+    Class which records the content hashes of the files read and written by
+    each step of the build of a module together with the options used. The
+    manifest is saved in a JSON file in the `__pyccel__` folder. When the
+    module is translated again it is used to determine which stages can be
+    skipped:
+
+    - If the file, the interfaces of the modules it imports and the options
+      are unchanged then the generated code is unchanged. In this case the
+      syntactic, semantic and code generation stages are skipped and only the
+      recorded compilation steps whose inputs have changed are run again.
+    - Otherwise the code is regenerated but each compilation or link command
+      is only run if the command or the contents of the files that it reads
+      have changed.
+
+    Parameters
+    ----------
+    filename : str
+        The name of the JSON file where the manifest is saved.
+    """
+    __slots__ = ('_filename', '_data', '_previous_steps', '_steps')
+
+    def __init__(self, filename):
+        self._filename = filename
+        try:
+            with open(filename, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get('version', None) != __version__:
+            data = {}
+        self._data = data
+        self._previous_steps = {self._step_id(s): s for s in data.get('steps', ())}
+        self._steps = []
+
+    @staticmethod
+    def _step_id(step):
+        """
+        Get a key which identifies a step.
+
+        Get a key which identifies a step from the command it runs and the
+        directory it is run from.
+
+        Parameters
+        ----------
+        step : dict
+            The step being identified.
+
+        Returns
+        -------
+        str
+            The key identifying the step.
+        """
+        return json.dumps([step['cwd'], step['cmd']])
+
+    @staticmethod
+    def _outputs_unchanged(step):
+        """
+        Check whether the outputs of a step are unchanged since it was run.
+
+        Check whether the files created by a step still exist and have not
+        been modified since the step was run.
+
+        Parameters
+        ----------
+        step : dict
+            The step being examined.
+
+        Returns
+        -------
+        bool
+            True if the outputs are unchanged, False otherwise.
+        """
+        return all(h is not None and hash_file(o) == h for o, h in step['outputs'].items())
+
+    @property
+    def build_key(self):
+        """
+        The hash describing the inputs of the code generation.
+
+        The hash describing the inputs of the code generation during the last
+        successful build. See `get_build_key`.
+        """
+        return self._data.get('build_key', None)
+
+    @property
+    def source_hash(self):
+        """
+        The hash of the contents of the translated file.
+
+        The hash of the contents of the file which was translated during the
+        last successful build.
+        """
+        return self._data.get('source_hash', None)
+
+    @property
+    def interface(self):
+        """
+        The hash describing the interface of the module.
+
+        The hash describing the interface of the module translated during the
+        last successful build. See `get_interface_fingerprint`.
+        """
+        return self._data.get('interface', None)
+
+    @property
+    def dependencies(self):
+        """
+        The user modules imported by the translated file.
+
+        The absolute paths to the files containing the user modules imported
+        by the file translated during the last successful build.
+        """
+        return self._data.get('dependencies', ())
+
+    def run_step(self, cmd, inputs, outputs, verbose = False):
+        """
+        Run a compilation command unless it is already up to date.
+
+        Run a compilation or link command and record it in the manifest.
+        The command is not run if it was already run during the last build
+        with the same inputs and its outputs have not been modified since.
+
+        Parameters
+        ----------
+        cmd : list[str]
+            The command to run.
+        inputs : iterable[str]
+            The absolute paths to the files read by the command.
+        outputs : iterable[str]
+            The absolute paths to the files created by the command.
+        verbose : bool, default=False
+            Indicates whether additional output should be shown.
+        """
+        step = {'cmd'    : list(cmd),
+                'cwd'    : os.getcwd(),
+                'inputs' : {i: hash_file(i) for i in inputs},
+                'outputs': {},
+                'moves'  : {}}
+        previous = self._previous_steps.get(self._step_id(step), None)
+        if previous and previous['inputs'] == step['inputs'] and self._outputs_unchanged(previous):
+            if verbose:
+                print(f"Up to date: {' '.join(cmd)}")
+            step['outputs'] = dict(previous['outputs'])
+            step['moves']   = dict(previous['moves'])
+        else:
+            Compiler.run_command(cmd, verbose)
+            step['outputs'] = {o: hash_file(o) for o in outputs}
+        self._steps.append(step)
+
+    def move_output(self, src, dst):
+        """
+        Move a file created by a step.
+
+        Move a file created by a recorded step and record the move so that
+        it can be repeated if the step must be run again. If the step was
+        skipped then the file was already moved during a previous build.
+
+        Parameters
+        ----------
+        src : str
+            The path to the file created by the step.
+        dst : str
+            The path to the location where the file should be moved.
+        """
+        for step in reversed(self._steps):
+            if src in step['outputs']:
+                shutil.move(src, dst)
+                step['outputs'][dst] = step['outputs'].pop(src)
+                step['moves'][src] = dst
+                return
+            elif step['moves'].get(src, None) == dst:
+                return
+        shutil.move(src, dst)
+
+    def replay(self, verbose = False):
+        """
+        Update the build using the steps recorded during the last build.
+
+        Check that the files generated during the last build still exist and
+        run the recorded compilation steps whose inputs or outputs have been
+        modified since. This method should only be called if the build key
+        is unchanged. If a file used by the build is missing then nothing is
+        run and the module must be translated again.
+
+        Parameters
+        ----------
+        verbose : bool, default=False
+            Indicates whether additional output should be shown.
+
+        Returns
+        -------
+        bool
+            True if the build is up to date, False if the module must be
+            translated again.
+        """
+        generated = self._data.get('generated', {})
+        steps     = self._data.get('steps', [])
+        if any(hash_file(f) != h for f, h in generated.items()) or \
+                any(not os.path.exists(i) for s in steps for i in s['inputs']):
+            return False
+
+        modified = False
+        base_dirpath = os.getcwd()
+        for step in steps:
+            inputs = {i: hash_file(i) for i in step['inputs']}
+            if inputs == step['inputs'] and self._outputs_unchanged(step):
+                continue
+            locks = FileLockSet([FileLock(f'{o}.lock') for o in step['moves'].keys() or step['outputs'].keys()])
+            with locks:
+                os.chdir(step['cwd'])
+                try:
+                    Compiler.run_command(step['cmd'], verbose)
+                finally:
+                    os.chdir(base_dirpath)
+                for src, dst in step['moves'].items():
+                    shutil.move(src, dst)
+            step['inputs']  = inputs
+            step['outputs'] = {o: hash_file(o) for o in step['outputs']}
+            modified = True
+
+        if modified:
+            self._save()
+        return True
+
+    def record_build(self, build_key, source_hash, interface, dependencies, generated):
+        """
+        Save the description of a successful build.
+
+        Save the manifest describing a successful build. The recorded steps
+        replace those from the previous build.
+
+        Parameters
+        ----------
+        build_key : str
+            The hash describing the inputs of the code generation. See `get_build_key`.
+        source_hash : str
+            The hash of the contents of the translated file.
+        interface : str | None
+            The hash describing the interface of the module. See `get_interface_fingerprint`.
+        dependencies : iterable[str]
+            The absolute paths to the files containing the user modules imported by the file.
+        generated : iterable[str]
+            The absolute paths to the files created by the code generation stage.
+        """
+        self._data = {'version'     : __version__,
+                      'build_key'   : build_key,
+                      'source_hash' : source_hash,
+                      'interface'   : interface,
+                      'dependencies': sorted(dependencies),
+                      'generated'   : {f: hash_file(f) for f in generated},
+                      'steps'       : self._steps}
+        self._save()
+
+    def _save(self):
+        """
+        Write the manifest to its file.
+
+        Write the manifest to a temporary file which then replaces the
+        manifest file so that an incomplete manifest is never read.
+        """
+        tmp_filename = f'{self._filename}.{os.getpid()}.tmp'
+        with open(tmp_filename, 'w', encoding="utf-8") as f:
+            json.dump(self._data, f, indent=1)
+        os.replace(tmp_filename, self._filename)
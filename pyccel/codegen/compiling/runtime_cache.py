@@ -0,0 +1,187 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Module containing the functions which store the compiled objects of Pyccel's runtime
+libraries (ndarrays, cwrapper, etc.) in the user-level cache so that they are compiled
+once and shared by all projects.
+"""
+import json
+import os
+import shutil
+import sys
+
+from filelock import FileLock
+import numpy
+
+from pyccel.utilities.cache import get_cache_dirpath, hash_contents, prune_cache, touch_cache_entry
+from pyccel.version         import __version__
+
+from .manifest import hash_file
+
+__all__ = ('compile_runtime_object',
+           'get_runtime_key')
+
+# Name of the file listing the checksums of the objects saved in a cache entry
+checksums_filename = 'checksums.json'
+
+#==============================================================================
+def get_runtime_key(compile_obj, compiler):
+    """
+    Get a hash describing everything which affects the compilation of a runtime object.
+
+    Get a hash describing the versions of Pyccel, Python and NumPy, the compiler
+    executable, the flags used to compile the object and the contents of the
+    source file and of the headers that it includes. The location of the
+    files is not used so the same hash is obtained in every project.
+
+    Parameters
+    ----------
+    compile_obj : CompileObj
+        The object which is compiled.
+    compiler : Compiler
+        The compiler used to compile the object.
+
+    Returns
+    -------
+    str
+        The hexadecimal representation of the hash.
+    """
+    files = (compile_obj.source, *compile_obj.interface_files)
+    return hash_contents(__version__, sys.version, numpy.__version__,
+                         *compiler.get_module_compile_signature(compile_obj),
+                         *(f'{os.path.basename(f)}={hash_file(f)}' for f in files))
+
+#==============================================================================
+def _get_artefacts(compile_obj):
+    """
+    Get the files created by the compilation of a runtime object.
+
+    Get the absolute paths to the object file and to the Fortran module file
+    (if it exists) created by the compilation of a runtime object.
+
+    Parameters
+    ----------
+    compile_obj : CompileObj
+        The object which was compiled.
+
+    Returns
+    -------
+    list[str]
+        The files created by the compilation.
+    """
+    mod_file = os.path.join(compile_obj.source_folder, f'{compile_obj.python_module.lower()}.mod')
+    return [f for f in (compile_obj.module_target, mod_file) if os.path.isfile(f)]
+
+def _fetch(entry_dirpath, compile_obj):
+    """
+    Copy the compiled files from a cache entry to the folder of a runtime object.
+
+    Check the integrity of the files saved in a cache entry and copy them to the
+    folder where the runtime object is compiled. If a file is missing or does
+    not match its checksum then nothing is copied.
+
+    Parameters
+    ----------
+    entry_dirpath : str
+        The folder containing the cache entry.
+    compile_obj : CompileObj
+        The object which should be compiled.
+
+    Returns
+    -------
+    bool
+        True if the files were copied, False if they must be compiled.
+    """
+    try:
+        with open(os.path.join(entry_dirpath, checksums_filename), encoding="utf-8") as f:
+            checksums = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    if os.path.basename(compile_obj.module_target) not in checksums or \
+            any(hash_file(os.path.join(entry_dirpath, a)) != h for a, h in checksums.items()):
+        return False
+
+    for a in checksums:
+        shutil.copyfile(os.path.join(entry_dirpath, a), os.path.join(compile_obj.source_folder, a))
+    return True
+
+def _store(entry_dirpath, compile_obj):
+    """
+    Save the compiled files of a runtime object in a cache entry.
+
+    Copy the files created by the compilation of a runtime object to a cache
+    entry and save their checksums. The checksums are written last so an
+    interrupted copy is never mistaken for a valid entry.
+
+    Parameters
+    ----------
+    entry_dirpath : str
+        The folder containing the cache entry.
+    compile_obj : CompileObj
+        The object which was compiled.
+    """
+    checksums = {}
+    for a in _get_artefacts(compile_obj):
+        name = os.path.basename(a)
+        shutil.copyfile(a, os.path.join(entry_dirpath, name))
+        checksums[name] = hash_file(a)
+
+    tmp_filename = os.path.join(entry_dirpath, f'{checksums_filename}.{os.getpid()}.tmp')
+    with open(tmp_filename, 'w', encoding="utf-8") as f:
+        json.dump(checksums, f, indent=1)
+    os.replace(tmp_filename, os.path.join(entry_dirpath, checksums_filename))
+
+#==============================================================================
+def compile_runtime_object(compile_obj, compiler, verbose = False):
+    """
+    Compile a runtime object, reusing the result of a previous compilation if possible.
+
+    Compile an object from Pyccel's runtime libraries (e.g. `ndarrays.c`). The
+    result of the compilation is saved in the folder `runtime` of the user-level
+    cache (see `pyccel.utilities.cache.get_cache_dirpath`), in an entry identified
+    by `get_runtime_key`. If a valid entry already exists then its files are copied
+    instead of compiling the object again. If the cache cannot be used (e.g. because
+    it is read-only) then the object is simply compiled.
+
+    Parameters
+    ----------
+    compile_obj : CompileObj
+        The object to compile.
+    compiler : Compiler
+        The compiler used to compile the object.
+    verbose : bool, default=False
+        Indicates whether additional information should be printed.
+    """
+    try:
+        entry_dirpath = os.path.join(get_cache_dirpath('runtime'), get_runtime_key(compile_obj, compiler))
+        os.makedirs(entry_dirpath, exist_ok=True)
+    except OSError:
+        compiler.compile_module(compile_obj=compile_obj,
+                output_folder=compile_obj.source_folder,
+                verbose=verbose)
+        return
+
+    with FileLock(entry_dirpath + '.lock'):
+        touch_cache_entry(entry_dirpath)
+        with compile_obj:
+            found = _fetch(entry_dirpath, compile_obj)
+        if found:
+            if verbose:
+                print(f"Using cached runtime object: {compile_obj.module_target}")
+            return
+
+        compiler.compile_module(compile_obj=compile_obj,
+                output_folder=compile_obj.source_folder,
+                verbose=verbose)
+
+        with compile_obj:
+            try:
+                _store(entry_dirpath, compile_obj)
+            except OSError:
+                return
+
+    prune_cache(subfolder = 'runtime')
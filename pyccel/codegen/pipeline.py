@@ -16,6 +16,7 @@ from pathlib import Path
 from pyccel.errors.errors          import Errors, PyccelError
 from pyccel.errors.errors          import PyccelSyntaxError, PyccelSemanticError, PyccelCodegenError
 from pyccel.errors.messages        import PYCCEL_RESTRICTION_TODO
+from pyccel.parser.interface       import ModuleInterface
 from pyccel.parser.parser          import Parser
 from pyccel.codegen.codegen        import Codegen
 from pyccel.codegen.utilities      import manage_dependencies
@@ -27,6 +28,8 @@ from pyccel.parser.scope           import Scope
 
 from .compiling.basic     import CompileObj
 from .compiling.compilers import Compiler, get_condaless_search_path
+from .compiling.manifest  import BuildManifest, get_build_key, get_interface_fingerprint
+from .compiling.manifest  import get_manifest_filename, hash_file
 
 pyccel_stage = PyccelStage()
 
@@ -185,10 +188,20 @@ def execute_pyccel(fname, *,
     fflags = [] if fflags is None else fflags.split()
     wrapper_flags = [] if wrapper_flags is None else wrapper_flags.split()
 
+    # Load the manifest describing the previous build
+    if language == 'python' or syntax_only or semantic_only:
+        manifest = None
+    else:
+        manifest = BuildManifest(get_manifest_filename(pyccel_dirpath, module_name))
+        source_hash = hash_file(pymod_filepath)
+        build_options = (module_name, language, compiler, fflags, wrapper_flags, includes,
+                         libdirs, [getattr(m, 'module_target', m) for m in modules], libs,
+                         debug, sorted(accelerators), output_name, convert_only)
+
     # Get compiler object
     Compiler.acceptable_bin_paths = get_condaless_search_path(conda_warnings)
-    src_compiler = Compiler(compiler, language, debug)
-    wrapper_compiler = Compiler(compiler, 'c', debug)
+    src_compiler = Compiler(compiler, language, debug, manifest = manifest)
+    wrapper_compiler = Compiler(compiler, 'c', debug, manifest = manifest)
 
     # Export the compiler information if requested
     if compiler_export_file:
@@ -201,6 +214,23 @@ def execute_pyccel(fname, *,
     # Change working directory to 'folder'
     os.chdir(folder)
 
+    # Skip the translation if the generated code would be unchanged
+    if manifest and manifest.build_key == get_build_key(source_hash, manifest.dependencies, *build_options):
+        try:
+            up_to_date = manifest.replay(verbose = verbose)
+        except Exception:
+            handle_error('compilation')
+            raise
+        if up_to_date:
+            if verbose:
+                print(f'> {pymod_filename} is up to date')
+            timers["Up-to-date check"] = time.time() - start
+            os.chdir(base_dirpath)
+            pyccel_stage.pyccel_finished()
+            if show_timings:
+                print_timers(start, timers)
+            return
+
     start_syntax = time.time()
     timers["Initialisation"] = start_syntax-start
     # Parse Python file
@@ -253,6 +283,12 @@ def execute_pyccel(fname, *,
             print_timers(start, timers)
         return
 
+    if manifest:
+        # Save the interface of the module so that the modules which import it
+        # do not need to run the semantic stage on it again
+        imported_files = get_imported_files(parser)
+        ModuleInterface.save(parser, pyccel_dirpath, imported_files)
+
     # -------------------------------------------------------------------------
 
     semantic_parser = parser.semantic_parser
@@ -278,6 +314,17 @@ def execute_pyccel(fname, *,
 
     timers["Codegen Stage"] = time.time() - start_codegen
 
+    if manifest:
+        header_name = os.path.splitext(fname)[0]+'.h' if language != 'fortran' else None
+        generated_files = [f for f in (fname, header_name, prog_name) \
+                            if f and os.path.isfile(f)]
+        def record_build():
+            manifest.record_build(get_build_key(source_hash, imported_files, *build_options),
+                                  source_hash  = source_hash,
+                                  interface    = get_interface_fingerprint(semantic_parser.ast),
+                                  dependencies = imported_files,
+                                  generated    = generated_files)
+
     if language == 'python':
         output_file = (output_name + '.py') if output_name else os.path.basename(fname)
         new_location = os.path.join(folder, output_file)
@@ -325,6 +372,8 @@ def execute_pyccel(fname, *,
         raise
 
     if convert_only:
+        if manifest:
+            record_build()
         # Change working directory back to starting point
         os.chdir(base_dirpath)
         pyccel_stage.pyccel_finished()
@@ -332,6 +381,12 @@ def execute_pyccel(fname, *,
             print_timers(start, timers)
         return
 
+    def move_output(src, dst):
+        if manifest:
+            manifest.move_output(src, dst)
+        else:
+            shutil.move(src, dst)
+
     deps = dict()
     # ...
     # Determine all .o files and all folders needed by executable
@@ -419,7 +474,7 @@ def execute_pyccel(fname, *,
     # (First construct absolute path of target location)
     generated_filename = os.path.basename(generated_filepath)
     target = os.path.join(folder, generated_filename)
-    shutil.move(generated_filepath, target)
+    move_output(generated_filepath, target)
     generated_filepath = target
     if verbose:
         print( '> Shared library has been created: {}'.format(generated_filepath))
@@ -427,12 +482,15 @@ def execute_pyccel(fname, *,
     if codegen.is_program:
         generated_program_filename = os.path.basename(generated_program_filepath)
         target = os.path.join(folder, generated_program_filename)
-        shutil.move(generated_program_filepath, target)
+        move_output(generated_program_filepath, target)
         generated_program_filepath = target
 
         if verbose:
             print( '> Executable has been created: {}'.format(generated_program_filepath))
 
+    if manifest:
+        record_build()
+
     # Print all warnings now
     if errors.has_warnings():
         errors.check()
@@ -444,6 +502,32 @@ def execute_pyccel(fname, *,
     if show_timings:
         print_timers(start, timers)
 
+def get_imported_files(parser):
+    """
+    Get the files containing the user modules imported by a file.
+
+    Get the absolute paths to the files containing the user modules which are
+    imported (directly or indirectly) by the file described by the parser.
+
+    Parameters
+    ----------
+    parser : Parser
+        The parser which was used to parse the file.
+
+    Returns
+    -------
+    set[str]
+        The absolute paths to the imported files.
+    """
+    imported_files = set()
+    to_visit = [*parser.sons]
+    while to_visit:
+        p = to_visit.pop()
+        if p.filename not in imported_files:
+            imported_files.add(p.filename)
+            to_visit.extend(p.sons)
+    return imported_files
+
 def print_timers(start, timers):
     """
     Print the timers measured during the execution.
@@ -19,7 +19,7 @@ from pyccel.ast.builtins  import PythonPrint, PythonType, VariableIterator
 
 from pyccel.ast.builtins  import PythonList, PythonTuple, PythonSet, PythonDict, PythonLen
 
-from pyccel.ast.builtin_methods.dict_methods  import DictItems
+from pyccel.ast.builtin_methods.dict_methods  import DictItems, DictKeys, DictValues
 
 from pyccel.ast.core      import Declare, For, CodeBlock, ClassDef
 from pyccel.ast.core      import FuncAddressDeclare, FunctionCall, FunctionCallArgument
@@ -29,6 +29,8 @@ from pyccel.ast.core      import Assign, Import, AugAssign, AliasAssign
 from pyccel.ast.core      import SeparatorComment
 from pyccel.ast.core      import Module, AsName
 
+from pyccel.ast.cudaext   import CudaThreadIdx, CudaBlockIdx, CudaBlockDim
+
 from pyccel.ast.c_concepts import ObjectAddress, CMacro, CStringExpression, PointerCast, CNativeInt
 from pyccel.ast.c_concepts import CStackArray
 
@@ -49,7 +51,8 @@ from pyccel.ast.low_level_tools import IteratorType
 
 from pyccel.ast.mathext  import math_constants
 
-from pyccel.ast.numpyext import NumpyFull, NumpyArray
+
+from pyccel.ast.numpyext import NumpyFull, NumpyArray, NumpyMatmul, NumpyTranspose
 from pyccel.ast.numpyext import NumpyReal, NumpyImag, NumpyFloat, NumpySize
 
 from pyccel.ast.numpytypes import NumpyInt8Type, NumpyInt16Type, NumpyInt32Type, NumpyInt64Type
@@ -60,6 +63,8 @@ from pyccel.ast.operators import PyccelAdd, PyccelMul, PyccelMinus, PyccelLt, Py
 from pyccel.ast.operators import PyccelAssociativeParenthesis, PyccelMod
 from pyccel.ast.operators import PyccelUnarySub, IfTernaryOperator
 
+from pyccel.ast.randomext import PhiloxGeneratorType
+
 from pyccel.ast.type_annotations import VariableTypeAnnotation
 
 from pyccel.ast.utilities import expand_to_loops, is_literal_integer
@@ -244,6 +249,7 @@ c_imports = {n : Import(n, Module(n, (), ())) for n in
                  'complex',
                  'stdint',
                  'pyc_math_c',
+                 'pyc_random_c',
                  'stdio',
                  "inttypes",
                  'stdbool',
@@ -251,11 +257,13 @@ c_imports = {n : Import(n, Module(n, (), ())) for n in
                  'stc/cstr']}
 
 import_header_guard_prefix = {'stc/hset'    : '_TOOLS_SET',
+                              'stc/hmap'    : '_TOOLS_DICT',
                               'stc/vec'   : '_TOOLS_LIST',
                               'stc/common' : '_TOOLS_COMMON'}
 
 stc_extension_mapping = {'stc/vec': 'List_extensions',
                       'stc/hset' : 'Set_extensions',
+                      'stc/hmap' : 'Dict_extensions',
                       'stc/common' : 'Common_extensions'}
 
 class CCodePrinter(CodePrinter):
@@ -324,6 +332,8 @@ class CCodePrinter(CodePrinter):
         self._temporary_args = []
         self._current_module = None
         self._in_header = False
+        self._thread_position = ()
+        self._thread_position_arguments = {}
 
     def sort_imports(self, imports):
         """
@@ -331,7 +341,9 @@ class CCodePrinter(CodePrinter):
 
         Sort imports. This is important so that types exist before they are used to create
         container types. E.g. it is important that complex or inttypes be imported before
-        vec_int or vec_double_complex is declared.
+        vec_int or vec_double_complex is declared. Imports from the same source (e.g. the
+        STC containers found in the module imports and in the additional imports) are
+        merged so that each source is only printed once.
 
         Parameters
         ----------
@@ -343,9 +355,21 @@ class CCodePrinter(CodePrinter):
         list[Import]
             A sorted list of the imports.
         """
-        import_src = [str(i.source) for i in imports]
-        stc_imports = [i for i in import_src if i.startswith('stc/')]
+        unique_imports = {}
+        for i in imports:
+            src = str(i.source)
+            if src not in unique_imports:
+                unique_imports[src] = i
+            elif not i.ignore:
+                previous = unique_imports[src]
+                if previous.ignore:
+                    unique_imports[src] = i
+                elif i.target:
+                    unique_imports[src] = Import(previous.source, [*previous.target, *i.target])
+        imports = list(unique_imports.values())
+        import_src = list(unique_imports.keys())
         dependent_imports = [i for i in import_src if i in import_header_guard_prefix]
+        stc_imports = [i for i in import_src if i.startswith('stc/') and i not in dependent_imports]
         non_stc_imports = [i for i in import_src if i not in chain(stc_imports, dependent_imports)]
         stc_imports.sort()
         dependent_imports.sort()
@@ -540,6 +564,143 @@ class CCodePrinter(CodePrinter):
                 code_init += 'array_fill({0}, {1});\n'.format(self._print(rhs.fill_value), self._print(lhs))
         return code_init
 
+    def arrayMatmul(self, expr):
+        """
+        Print the assignment of a matrix product to an NdArray.
+
+        Print the code necessary to save the result of a call to `numpy.matmul`
+        (or the `@` operator) in an NdArray. The product is computed by a function
+        of the ndarrays library which writes into the result. This function uses
+        BLAS when the `blas` accelerator is used and tiled loops otherwise.
+        Transposed operands are passed as views with reversed strides so that
+        BLAS receives them via its transpose flags instead of a copy.
+
+        Parameters
+        ----------
+        expr : Assign
+            The Assign Node used to get the lhs and rhs.
+
+        Returns
+        -------
+        str
+            Return a str that contains a call to the C function numpy_matmul.
+        """
+        rhs = expr.rhs
+        type_name = self._get_matmul_type_name(rhs)
+        lhs_code = self._print(expr.lhs)
+        code = ''
+        operands = []
+        for arg in (rhs.a, rhs.b):
+            if isinstance(arg, NumpyTranspose):
+                view = self.scope.get_temporary_variable(arg.class_type, shape = arg.shape,
+                                                         memory_handling = 'alias')
+                code += f'transpose_alias_assign({self._print(ObjectAddress(view))}, {self._print(arg.internal_var)});\n'
+                arg = view
+            operands.append(self._print(arg))
+        a_code, b_code = operands
+        return code + f'numpy_matmul_{type_name}({lhs_code}, {a_code}, {b_code});\n'
+
+    def _get_matmul_type_name(self, expr):
+        """
+        Get the suffix of the ndarrays function which computes a matrix product.
+
+        Get the name of the type of the elements of a matrix product, as used in the
+        names of the functions of the ndarrays library. An error is raised if the
+        product cannot be computed by these functions.
+
+        Parameters
+        ----------
+        expr : NumpyMatmul
+            The matrix product.
+
+        Returns
+        -------
+        str
+            The name of the type (e.g. float64).
+        """
+        a, b = expr.a, expr.b
+        if not all(self._is_matmul_operand(arg) for arg in (a, b)):
+            return errors.report("matmul in C is only supported for arrays saved in variables",
+                    symbol=expr, severity='fatal')
+        if a.dtype != expr.dtype or b.dtype != expr.dtype:
+            return errors.report(f"matmul in C does not support arguments of different types ({a.dtype} and {b.dtype})",
+                    symbol=expr, severity='fatal')
+        primitive_type = expr.dtype.primitive_type
+        prec = expr.dtype.precision
+        if isinstance(primitive_type, PrimitiveIntegerType):
+            return f'int{prec * 8}'
+        elif isinstance(primitive_type, PrimitiveFloatingPointType):
+            return f'float{prec * 8}'
+        elif isinstance(primitive_type, PrimitiveComplexType):
+            return f'complex{prec * 16}'
+        else:
+            return 'bool'
+
+    def _is_matmul_operand(self, expr):
+        """
+        Indicate whether an object can be passed to the functions computing a matrix product.
+
+        Indicate whether an object can be passed directly to the functions of the
+        ndarrays library which compute a matrix product. This is the case for
+        arrays saved in variables, slices of such arrays and their transposes.
+
+        Parameters
+        ----------
+        expr : TypedAstNode
+            The operand of the matrix product.
+
+        Returns
+        -------
+        bool
+            True if the object can be passed directly, False otherwise.
+        """
+        if isinstance(expr, NumpyTranspose):
+            expr = expr.internal_var
+        return isinstance(expr, (Variable, IndexedElement))
+
+    def _hoist_matmuls(self, expr):
+        """
+        Save the matrix products used inside larger expressions in temporary arrays.
+
+        The functions of the ndarrays library which compute a matrix product
+        write into an array and can only read arrays saved in variables. The
+        products which are used inside a larger expression (e.g. `a @ b + c`)
+        and the operands which are expressions (e.g. `(a + b) @ c`) are
+        therefore computed in temporary arrays which are allocated before the
+        statement and deallocated after it.
+
+        Parameters
+        ----------
+        expr : PyccelAstNode
+            A statement of a code block.
+
+        Returns
+        -------
+        list[PyccelAstNode]
+            The statements which replace the original statement.
+        """
+        if not isinstance(expr, Assign):
+            return [expr]
+
+        to_hoist = None
+        for m in expr.get_attribute_nodes(NumpyMatmul):
+            if m.rank > 0 and (m is not expr.rhs or isinstance(expr, AugAssign)):
+                to_hoist = m
+            else:
+                to_hoist = next((a for a in (m.a, m.b) if not self._is_matmul_operand(a)), None)
+            if to_hoist is not None:
+                break
+        else:
+            return [expr]
+
+        tmp = self.scope.get_temporary_variable(to_hoist.class_type, shape = to_hoist.shape,
+                                                memory_handling = 'heap')
+        expr.substitute(to_hoist, tmp, invalidate = False)
+        return [Allocate(tmp, shape = to_hoist.shape, status = 'unallocated'),
+                *self._hoist_matmuls(Assign(tmp, to_hoist)),
+                *self._hoist_matmuls(expr),
+                Deallocate(tmp)]
+
     def _init_stack_array(self, expr):
         """
         Return a string which handles the assignment of a stack ndarray.
@@ -569,19 +730,16 @@ class CCodePrinter(CodePrinter):
         shape = ", ".join(self._print(i) for i in var.alloc_shape)
         tot_shape = self._print(functools.reduce(
             lambda x,y: PyccelMul(x,y,simplify=True), var.alloc_shape))
-        declare_dtype = self.get_c_type(NumpyInt64Type())
 
         dummy_array_name = self.scope.get_new_name('array_dummy')
         buffer_array = "{dtype} {name}[{size}];\n".format(
                 dtype = dtype,
                 name  = dummy_array_name,
                 size  = tot_shape)
-        shape_init = "({declare_dtype}[]){{{shape}}}".format(declare_dtype=declare_dtype, shape=shape)
-        strides_init = "({declare_dtype}[{length}]){{0}}".format(declare_dtype=declare_dtype, length=len(var.shape))
-        array_init = ' = (t_ndarray){{\n.{0}={1},\n .shape={2},\n .strides={3},\n '
-        array_init += '.nd={4},\n .type={0},\n .is_view={5}\n}};\n'
+        array_init = ' = (t_ndarray){{\n.{0}={1},\n .shape={{{2}}},\n '
+        array_init += '.nd={3},\n .type={0},\n .is_view={4}\n}};\n'
         array_init = array_init.format(np_dtype, dummy_array_name,
-                    shape_init, strides_init, len(var.shape), 'false')
+                    shape, len(var.shape), 'false')
         array_init += 'stack_array_init(&{})'.format(self._print(var))
         self.add_import(c_imports['ndarrays'])
         return buffer_array, array_init
@@ -1016,7 +1174,10 @@ class CCodePrinter(CodePrinter):
         element = self._print(expr.element)
         container = self._print(ObjectAddress(expr.container))
         c_type = self.get_c_type(expr.container.class_type)
-        if isinstance(container_type, (HomogeneousSetType, DictType)):
+        if isinstance(container_type, DictType):
+            element = self._print_dict_raw_value(expr.element)
+            return f'{c_type}_contains({container}, {element})'
+        elif isinstance(container_type, HomogeneousSetType):
             return f'{c_type}_contains({container}, {element})'
         elif isinstance(container_type, HomogeneousListType):
             return f'{c_type}_find({container}, {element}).ref != {c_type}_end({container}).ref'
@@ -1083,14 +1244,21 @@ class CCodePrinter(CodePrinter):
             return code
         elif source != 'stc/cstr' and (source.startswith('stc/') or source in import_header_guard_prefix):
             code = ''
+            printed_types = set()
             for t in expr.target:
                 class_type = t.object.class_type
                 container_type = t.local_alias
+                if container_type in printed_types:
+                    continue
+                printed_types.add(container_type)
                 if isinstance(class_type, DictType):
                     container_key_key = self.get_c_type(class_type.key_type)
                     container_val_key = self.get_c_type(class_type.value_type)
                     container_key = f'{container_key_key}_{container_val_key}'
-                    element_decl = f'#define i_key {container_key_key}\n#define i_val {container_val_key}\n'
+                    # Strings are declared as "pro" types so they are hashed and compared by value
+                    key_decl = 'i_keypro' if isinstance(class_type.key_type, StringType) else 'i_key'
+                    val_decl = 'i_valpro' if isinstance(class_type.value_type, StringType) else 'i_val'
+                    element_decl = f'#define {key_decl} {container_key_key}\n#define {val_decl} {container_val_key}\n'
                 else:
                     container_key = self.get_c_type(class_type.element_type)
                     element_decl = f'#define i_key {container_key}\n'
@@ -1350,10 +1518,16 @@ class CCodePrinter(CodePrinter):
             val_type = self.get_c_type(dtype.value_type).replace(' ', '_')
             i_type = f'{container_type}_{key_type}_{val_type}'
             self.add_import(Import(f'stc/{container_type}', AsName(VariableTypeAnnotation(dtype), i_type)))
+            self.add_import(Import(f'{stc_extension_mapping["stc/" + container_type]}',
+                                   AsName(VariableTypeAnnotation(dtype), i_type),
+                                   ignore_at_print=True))
             return i_type
         elif isinstance(dtype, StringType):
             self.add_import(c_imports['stc/cstr'])
             return 'cstr'
+        elif isinstance(dtype, PhiloxGeneratorType):
+            self.add_import(c_imports['pyc_random_c'])
+            return 't_philox'
         else:
             key = dtype
 
@@ -1492,7 +1666,7 @@ class CCodePrinter(CodePrinter):
         elif declaration_type == 't_ndarray' and not self._in_header:
             assert init == ''
             preface = ''
-            init    = ' = {.shape = NULL}'
+            init    = ' = {.raw_data = NULL}'
         elif isinstance(var.class_type, (HomogeneousListType, HomogeneousSetType, DictType)):
             preface = ''
             init = ' = {0}'
@@ -1533,6 +1707,8 @@ class CCodePrinter(CodePrinter):
         """
         arg_vars = [a.var for a in expr.arguments]
         result_vars = [r.var for r in expr.results if not r.is_argument]
+        if not isinstance(expr, FunctionAddress):
+            arg_vars.extend(self._get_thread_position_arguments(expr))
 
         n_results = len(result_vars)
 
@@ -1776,8 +1952,8 @@ class CCodePrinter(CodePrinter):
         elif isinstance(variable.class_type, (NumpyNDArrayType, HomogeneousTupleType)):
             #free the array if its already allocated and checking if its not null if the status is unknown
             if  (expr.status == 'unknown'):
-                shape_var = DottedVariable(VoidType(), 'shape', lhs = variable)
-                free_code = f'if ({self._print(shape_var)} != NULL)\n'
+                data_var = DottedVariable(VoidType(), 'raw_data', lhs = variable)
+                free_code = f'if ({self._print(data_var)} != NULL)\n'
                 free_code += "{{\n{}}}\n".format(self._print(Deallocate(variable)))
             elif (expr.status == 'allocated'):
                 free_code += self._print(Deallocate(variable))
@@ -2079,6 +2255,30 @@ class CCodePrinter(CodePrinter):
             return f'numpy_sum_bool({name})'
         raise NotImplementedError('Sum not implemented for argument')
 
+    def _print_NumpyMatmul(self, expr):
+        """
+        Convert a call to numpy.matmul to the equivalent function in C.
+
+        Convert a call to numpy.matmul (or the `@` operator) whose result is a
+        scalar (the inner product of two vectors) to the equivalent function in
+        C. Products whose result is an array are printed by `arrayMatmul`.
+
+        Parameters
+        ----------
+        expr : NumpyMatmul
+            The matrix product.
+
+        Returns
+        -------
+        str
+            The code describing the product.
+        """
+        if expr.rank > 0:
+            return errors.report("The result of matmul must be saved in an array before being used in C",
+                    symbol=expr, severity='fatal')
+        type_name = self._get_matmul_type_name(expr)
+        return f'numpy_dot_{type_name}({self._print(expr.a)}, {self._print(expr.b)})'
+
     def _print_NumpyAmax(self, expr):
         '''
         Convert a call to numpy.max to the equivalent function in C.
@@ -2156,7 +2356,10 @@ class CCodePrinter(CodePrinter):
         if len(expr.results) > 1:
             self._additional_args.append(results)
 
+        outer_thread_position = self._thread_position
+        self._thread_position = self._get_thread_position_arguments(expr)
         body  = self._print(expr.body)
+        self._thread_position = outer_thread_position
         decs = [Declare(i, value=(Nil() if i.is_alias and isinstance(i.class_type, (VoidType, BindCPointer)) else None))
                 if isinstance(i, Variable) else FuncAddressDeclare(i) for i in expr.local_vars]
 
@@ -2211,6 +2414,9 @@ class CCodePrinter(CodePrinter):
             else :
                 args.append(arg_val)
 
+        if 'kernel' in func.decorators or 'device' in func.decorators:
+            args.extend(self._thread_position)
+
         args += self._temporary_args
         self._temporary_args = []
         args = ', '.join(['{}'.format(self._print(a)) for a in args])
@@ -2221,6 +2427,85 @@ class CCodePrinter(CodePrinter):
         else:
             return call_code
 
+    def _get_thread_position_arguments(self, expr):
+        """
+        Get the arguments describing the position of the thread in a kernel or device function.
+
+        In C, kernels are run on the host by an OpenMP loop over the blocks of
+        the grid and the threads of each block. The index of the block, the
+        index of the thread and the number of threads in a block are passed to
+        kernels and device functions as additional arguments. This function
+        returns the variables describing these arguments. The same variables
+        are returned each time the function is called for a given function.
+
+        Parameters
+        ----------
+        expr : FunctionDef
+            The function definition.
+
+        Returns
+        -------
+        tuple[Variable, ...]
+            The index of the block, the index of the thread and the size of
+            the block, or an empty tuple if the function is neither a kernel
+            nor a device function.
+        """
+        if 'kernel' not in expr.decorators and 'device' not in expr.decorators:
+            return ()
+        scope = expr.scope
+        if scope not in self._thread_position_arguments:
+            self._thread_position_arguments[scope] = tuple(Variable(PythonNativeInt(), scope.get_new_name(n))
+                                                           for n in ('block_idx', 'thread_idx', 'block_dim'))
+        return self._thread_position_arguments[scope]
+
+    def _print_KernelCall(self, expr):
+        scope = self.scope
+        # Evaluate the arguments once, before the threads are launched
+        code = ''
+        args = []
+        for a in expr.args:
+            value = a.value
+            if isinstance(value, TypedAstNode) and value.rank == 0 and not isinstance(value, (Variable, Literal)):
+                tmp_var = scope.get_temporary_variable(value.class_type)
+                code += self._print(Assign(tmp_var, value))
+                a = FunctionCallArgument(tmp_var, keyword = a.keyword)
+            args.append(a)
+
+        block_idx = scope.get_temporary_variable(PythonNativeInt(), 'block_idx')
+        thread_idx = scope.get_temporary_variable(PythonNativeInt(), 'thread_idx')
+
+        outer_thread_position = self._thread_position
+        self._thread_position = (block_idx, thread_idx, expr.tp_block)
+        call_code = self._print_FunctionCall(FunctionCall(expr.funcdef, args))
+        self._thread_position = outer_thread_position
+
+        block_code = self._print(block_idx)
+        thread_code = self._print(thread_idx)
+        zero = self._print(LiteralInteger(0))
+        one = self._print(LiteralInteger(1))
+        num_blocks = self._print(expr.num_blocks)
+        tp_block = self._print(expr.tp_block)
+        return (code + '#pragma omp parallel for collapse(2)\n'
+                f'for ({block_code} = {zero}; {block_code} < {num_blocks}; {block_code} += {one})\n{{\n'
+                f'for ({thread_code} = {zero}; {thread_code} < {tp_block}; {thread_code} += {one})\n{{\n'
+                f'{call_code}'
+                '}\n}\n')
+
+    def _print_CudaSynchronize(self, expr):
+        # The OpenMP loops which run the kernels end with an implicit barrier
+        return ''
+
+    def _print_CudaIndexingFunction(self, expr):
+        if not self._thread_position:
+            errors.report(f"cuda.{expr.name} can only be used in a kernel or a device function",
+                    symbol=expr, severity='fatal')
+        if expr.dim != 0:
+            # Only one-dimensional grids can be launched
+            return self._print(LiteralInteger(int(isinstance(expr, CudaBlockDim))))
+        block_idx, thread_idx, block_dim = self._thread_position
+        position = {CudaBlockIdx : block_idx, CudaThreadIdx : thread_idx, CudaBlockDim : block_dim}
+        return self._print(position[type(expr)])
+
     def _print_Return(self, expr):
         code = ''
         args = [ObjectAddress(a) if isinstance(a, Variable) and self.is_c_pointer(a) else a for a in expr.expr]
@@ -2361,6 +2646,8 @@ class CCodePrinter(CodePrinter):
             return self.copy_NumpyArray_Data(expr)
         if isinstance(rhs, (NumpyFull)):
             return self.arrayFill(expr)
+        if isinstance(rhs, NumpyMatmul) and rhs.rank > 0:
+            return self.arrayMatmul(expr)
         lhs_code = self._print(lhs)
         if isinstance(rhs, (PythonList, PythonSet, PythonDict)):
             return self.init_stc_container(rhs, expr)
@@ -2402,7 +2689,7 @@ class CCodePrinter(CodePrinter):
         iterable = expr.iterable
         indices = iterable.loop_counters
 
-        if isinstance(iterable, (VariableIterator, DictItems)) and \
+        if isinstance(iterable, (VariableIterator, DictItems, DictKeys, DictValues)) and \
                 isinstance(iterable.variable.class_type, (DictType, HomogeneousSetType, HomogeneousListType)):
             var = iterable.variable
             iterable_type = var.class_type
@@ -2414,6 +2701,10 @@ class CCodePrinter(CodePrinter):
             if isinstance(iterable, DictItems):
                 assigns = [Assign(expr.target[0], DottedVariable(VoidType(), 'first', lhs = tmp_ref)),
                            Assign(expr.target[1], DottedVariable(VoidType(), 'second', lhs = tmp_ref))]
+            elif isinstance(iterable, DictKeys):
+                assigns = [Assign(expr.target[0], DottedVariable(VoidType(), 'first', lhs = tmp_ref))]
+            elif isinstance(iterable, DictValues):
+                assigns = [Assign(expr.target[0], DottedVariable(VoidType(), 'second', lhs = tmp_ref))]
             else:
                 assigns = [Assign(expr.target[0], tmp_ref)]
             additional_assign = CodeBlock(assigns)
@@ -2463,9 +2754,14 @@ class CCodePrinter(CodePrinter):
 
     def _print_CodeBlock(self, expr):
         if not expr.unravelled:
+            if expr.get_attribute_nodes(NumpyMatmul):
+                body = [l for b in expr.body for l in self._hoist_matmuls(b)]
+                if len(body) != len(expr.body):
+                    expr = CodeBlock(body)
             body_exprs = expand_to_loops(expr,
                     self.scope.get_temporary_variable, self.scope,
-                    language_has_vectors = False)
+                    language_has_vectors = False,
+                    parallel_threshold = self.scope.decorators.get('parallel_arrays', None))
         else:
             body_exprs = expr.body
         body_stmts = []
@@ -2688,6 +2984,15 @@ class CCodePrinter(CodePrinter):
 
     def _print_Omp_End_Clause(self, expr):
         return '}\n'
+
+    def _print_OMP_Array_Loop_Construct(self, expr):
+        clauses = f' collapse({expr.collapse})' if expr.collapse > 1 else ''
+        if expr.private:
+            clauses += f" private({', '.join(self._print(v) for v in expr.private)})"
+        if expr.reduction_variable:
+            clauses += f' reduction({expr.reduction_operator}:{self._print(expr.reduction_variable)})'
+        clauses += f' if(parallel: {self._print(expr.size)} >= {expr.threshold})'
+        return f'#pragma omp {expr.name} {expr.combined}{clauses}\n'
     #=====================================
 
     def _print_Program(self, expr):
@@ -2810,6 +3115,100 @@ class CCodePrinter(CodePrinter):
         arg_val = self._print(expr.args[0])
         return f'{var_type}_erase({set_var}, {arg_val});\n'
 
+    #================== Dict methods ==================
+
+    def _print_dict_raw_value(self, expr):
+        """
+        Print an object which is passed to an STC hmap function as a raw value.
+
+        The functions of an STC hmap which search for a key (or which only
+        construct an element if it is not present) take raw values as arguments.
+        This is also the case for the default values of the extension functions
+        which return a new value. For strings this is a `const char*` rather
+        than a `cstr`.
+
+        Parameters
+        ----------
+        expr : TypedAstNode
+            The key or value which is passed to the function.
+
+        Returns
+        -------
+        str
+            The code describing the raw value.
+        """
+        if isinstance(expr.class_type, StringType) and not isinstance(expr, LiteralString):
+            return f'cstr_str({self._print(ObjectAddress(expr))})'
+        return self._print(expr)
+
+    def _print_DictPop(self, expr):
+        class_type = expr.dict_obj.class_type
+        var_type = self.get_c_type(class_type)
+        dict_var = self._print(ObjectAddress(expr.dict_obj))
+        key = self._print_dict_raw_value(expr.key)
+        if expr.default_value is not None:
+            default = self._print_dict_raw_value(expr.default_value)
+            return f'{var_type}_pop_with_default({dict_var}, {key}, {default})'
+        return f'{var_type}_pop({dict_var}, {key})'
+
+    def _print_DictGet(self, expr):
+        class_type = expr.dict_obj.class_type
+        var_type = self.get_c_type(class_type)
+        dict_var = self._print(ObjectAddress(expr.dict_obj))
+        key = self._print_dict_raw_value(expr.key)
+        if expr.default_value is not None:
+            default = self._print_dict_raw_value(expr.default_value)
+            return f'{var_type}_get_with_default({dict_var}, {key}, {default})'
+        return f'{var_type}_get_value({dict_var}, {key})'
+
+    def _print_DictSetDefault(self, expr):
+        class_type = expr.dict_obj.class_type
+        var_type = self.get_c_type(class_type)
+        dict_var = self._print(ObjectAddress(expr.dict_obj))
+        key = self._print_dict_raw_value(expr.key)
+        default = self._print_dict_raw_value(expr.default_value)
+        return f'{var_type}_setdefault({dict_var}, {key}, {default})'
+
+    def _print_DictClear(self, expr):
+        var_type = self.get_c_type(expr.dict_obj.class_type)
+        dict_var = self._print(ObjectAddress(expr.dict_obj))
+        return f'{var_type}_clear({dict_var});\n'
+
+    def _print_DictCopy(self, expr):
+        var_type = self.get_c_type(expr.dict_obj.class_type)
+        dict_var = self._print(expr.dict_obj)
+        return f'{var_type}_clone({dict_var})'
+
+    #================== Random generator methods ==================
+
+    def _print_RandomGenerator(self, expr):
+        self.add_import(c_imports['pyc_random_c'])
+        seed = self._print(expr.seed)
+        stream = self._print(expr.stream)
+        return f'pyc_philox_init({seed}, {stream})'
+
+    def _print_GeneratorAdvance(self, expr):
+        rng = self._print(ObjectAddress(expr.generator))
+        n_blocks = self._print(expr.args[0])
+        return f'pyc_philox_advance({rng}, {n_blocks});\n'
+
+    def _print_GeneratorDrawMethod(self, expr):
+        out = expr.out
+        if out is not None:
+            # Fill the array in row-major order with one call per element
+            indices = [self.scope.get_temporary_variable(PythonNativeInt(), name = 'i') for _ in range(out.rank)]
+            loop_scopes = [self.scope.create_new_loop_scope()]
+            for _ in indices[1:]:
+                loop_scopes.append(loop_scopes[-1].create_new_loop_scope())
+            body = [Assign(IndexedElement(out, *indices), expr.scalar_call)]
+            for idx, dim_size, loop_scope in zip(indices[::-1], out.shape[::-1], loop_scopes[::-1]):
+                body = [For((idx,), PythonRange(dim_size), body, scope = loop_scope)]
+            return self._print(CodeBlock(body, unravelled = True))
+
+        rng = self._print(ObjectAddress(expr.generator))
+        args = ''.join(f', {self._print(a)}' for a in expr.args)
+        return f'pyc_philox_{expr.name}({rng}{args})'
+
     #=================== MACROS ==================
 
     def _print_MacroShape(self, expr):
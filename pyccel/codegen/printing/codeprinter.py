@@ -13,6 +13,8 @@ from pyccel.ast.internals import PyccelSymbol
 from pyccel.errors.errors     import Errors
 from pyccel.errors.messages   import PYCCEL_RESTRICTION_TODO
 
+from pyccel.utilities.dispatch import get_dispatch_method
+
 # TODO: add examples
 
 __all__ = ["CodePrinter"]
@@ -114,12 +116,9 @@ class CodePrinter:
         raised
         """
 
-        classes = type(expr).__mro__
-        for cls in classes:
-            print_method = '_print_' + cls.__name__
-            if hasattr(self, print_method):
-                obj = getattr(self, print_method)(expr)
-                return obj
+        print_method = get_dispatch_method(type(self), '_print_', type(expr))
+        if print_method is not None:
+            return print_method(self, expr)
         return self._print_not_supported(expr)
 
     def _declare_number_const(self, name, value):
@@ -96,11 +96,35 @@ class CudaCodePrinter(CCodePrinter):
         args = [a.value or Nil() for a in expr.args]
 
         args = ', '.join(self._print(a) for a in args)
-        return f"{func.name}<<<{expr.num_blocks}, {expr.tp_block}>>>({args});\n"
+        num_blocks = self._print(expr.num_blocks)
+        tp_block = self._print(expr.tp_block)
+        return f"{func.name}<<<{num_blocks}, {tp_block}>>>({args});\n"
 
     def _print_CudaSynchronize(self, expr):
         return 'cudaDeviceSynchronize();\n'
 
+    def _get_thread_position_arguments(self, expr):
+        """
+        Get the arguments describing the position of the thread in a kernel or device function.
+
+        In CUDA the position of the thread is available through built-in
+        variables so no additional arguments are needed.
+
+        Parameters
+        ----------
+        expr : FunctionDef
+            The function definition.
+
+        Returns
+        -------
+        tuple
+            An empty tuple.
+        """
+        return ()
+
+    def _print_CudaIndexingFunction(self, expr):
+        return f"{expr.name}.{'xyz'[expr.dim]}"
+
     def _print_ModuleHeader(self, expr):
         self.set_scope(expr.module.scope)
         self._in_header = True
@@ -11,11 +11,16 @@ from pyccel.ast.bind_c     import BindCModule, BindCFunctionDef
 from pyccel.ast.c_concepts import CStackArray
 from pyccel.ast.core       import FunctionAddress, SeparatorComment
 from pyccel.ast.core       import Import, Module, Declare
+from pyccel.ast.core       import Break, Continue, Return
+from pyccel.ast.datatypes  import PrimitiveIntegerType
 from pyccel.ast.cwrapper   import PyBuildValueNode, PyCapsule_New, PyCapsule_Import, PyModule_Create
 from pyccel.ast.cwrapper   import Py_None, WrapperCustomDataType
 from pyccel.ast.cwrapper   import PyccelPyObject, PyccelPyTypeObject
-from pyccel.ast.literals   import LiteralString, Nil, LiteralInteger
+from pyccel.ast.cwrapper   import PyccelPyObjectArray, PyccelPySsizeT, PyInterface
+from pyccel.ast.literals   import LiteralString, Nil, LiteralInteger, LiteralTrue
 from pyccel.ast.numpy_wrapper import PyccelPyArrayObject
+from pyccel.ast.operators  import PyccelEq
+from pyccel.ast.variable   import Variable
 from pyccel.ast.c_concepts import ObjectAddress
 
 from pyccel.errors.errors  import Errors
@@ -52,6 +57,8 @@ class CWrapperCodePrinter(CCodePrinter):
                       PyccelPyObject() : 'PyObject',
                       PyccelPyArrayObject() : 'PyArrayObject',
                       PyccelPyTypeObject() : 'PyTypeObject',
+                      PyccelPyObjectArray() : 'PyObject* const',
+                      PyccelPySsizeT() : 'Py_ssize_t',
                       BindCPointer()  : 'void'}
 
     def __init__(self, filename, target_language, **settings):
@@ -93,6 +100,32 @@ class CWrapperCodePrinter(CCodePrinter):
         else:
             return CCodePrinter.is_c_pointer(self,a)
 
+    def get_method_flags(self, func):
+        """
+        Get the flags describing the calling convention of a wrapper function.
+
+        Get the flags which should be saved in a `PyMethodDef` to describe the
+        calling convention used by the wrapper function. Functions whose arguments
+        are received in a C array use `METH_FASTCALL | METH_KEYWORDS`, other functions
+        use `METH_VARARGS | METH_KEYWORDS`.
+
+        Parameters
+        ----------
+        func : PyFunctionDef | PyInterface
+            The wrapper function.
+
+        Returns
+        -------
+        str
+            The flags.
+        """
+        if isinstance(func, PyInterface):
+            func = func.interface_func
+        if any(a.var.class_type is PyccelPyObjectArray() for a in func.arguments):
+            return 'METH_FASTCALL | METH_KEYWORDS'
+        else:
+            return 'METH_VARARGS | METH_KEYWORDS'
+
     def get_python_name(self, scope, obj):
         """
         Get the name of object as defined in the original python code.
@@ -195,10 +228,69 @@ class CWrapperCodePrinter(CCodePrinter):
         else:
             return super()._handle_is_operator(Op, expr)
 
+    def _get_switch_variable(self, expr):
+        """
+        Get the variable on which an `If` can be printed as a `switch`.
+
+        The wrapper chooses the specialisation of an interface by comparing an
+        integer (calculated by the type check function) with the index of each
+        specialisation. Such an `If` block is printed as a `switch` statement so
+        that the C compiler can jump directly to the relevant case. This function
+        checks if all conditions compare the same integer variable to different
+        literal integers (except for a final `else` block). The blocks must not
+        contain any `break` or `continue` statement as these would apply to the
+        `switch`.
+
+        Parameters
+        ----------
+        expr : If
+            The `If` block being printed.
+
+        Returns
+        -------
+        Variable | None
+            The variable on which the `switch` is carried out or None if the `If`
+            cannot be printed as a `switch`.
+        """
+        conditions = [b.condition for b in expr.blocks]
+        if isinstance(conditions[-1], LiteralTrue):
+            conditions = conditions[:-1]
+        if len(conditions) < 2 or not all(isinstance(c, PyccelEq) for c in conditions):
+            return None
+        var = conditions[0].args[0]
+        if not isinstance(var, Variable) or var.rank != 0 or \
+                not isinstance(getattr(var.dtype, 'primitive_type', None), PrimitiveIntegerType):
+            return None
+        values = [c.args[1] for c in conditions]
+        if any(c.args[0] != var for c in conditions) or \
+                not all(isinstance(v, LiteralInteger) for v in values) or \
+                len({v.python_value for v in values}) != len(values):
+            return None
+        if any(b.get_attribute_nodes((Break, Continue)) for b in expr.bodies):
+            return None
+        return var
+
     #--------------------------------------------------------------------
     #                 _print_ClassName functions
     #--------------------------------------------------------------------
 
+    def _print_If(self, expr):
+        switch_var = self._get_switch_variable(expr)
+        if switch_var is None:
+            return super()._print_If(expr)
+
+        lines = [f'switch ({self._print(switch_var)})\n{{\n']
+        for c, e in expr.blocks:
+            body = self._print(e)
+            if isinstance(c, LiteralTrue):
+                lines.append('default:\n{\n')
+            else:
+                lines.append(f'case {self._print(c.args[1])}:\n{{\n')
+            end = '' if e.body and isinstance(e.body[-1], Return) else 'break;\n'
+            lines.append(f'{body}{end}}}\n')
+        lines.append('}\n')
+        return ''.join(lines)
+
     def _print_DottedName(self, expr):
         names = expr.name
         return '.'.join(self._print(n) for n in names)
@@ -222,6 +314,13 @@ class CWrapperCodePrinter(CCodePrinter):
 
         return code
 
+    def _print_PyArg_ParseFastcallNode(self, expr):
+        keywords = expr.arg_names
+        # All args are modified so even pointers are passed by address
+        args = ''.join(f', &{a.name}' for a in expr.args)
+        return (f'pyccel_parse_fastcall({expr.pyarg.name}, {expr.pynargs.name}, {expr.pykwnames.name}, '
+                f'{keywords.name}, {keywords.interned_name}, {expr.n_required}, {len(expr.args)}{args})')
+
     def _print_PyBuildValueNode(self, expr):
         name  = 'Py_BuildValue'
         flags = expr.flags
@@ -239,6 +338,13 @@ class CWrapperCodePrinter(CCodePrinter):
                         f'{arg_names}\n'
                         '};\n')
 
+    def _print_PyFastcallKeywords(self, expr):
+        arg_names = ',\n'.join([f'"{a}"' for a in expr.arg_names] + [self._print(Nil())])
+        return (f'static const char* const {expr.name}[] = {{\n'
+                        f'{arg_names}\n'
+                        '};\n'
+                        f'static PyObject* {expr.interned_name}[{len(expr.arg_names)+1}] = {{NULL}};\n')
+
     def _print_PyModule_AddObject(self, expr):
         name = self._print(expr.name)
         var  = self._print(expr.variable)
@@ -343,11 +449,12 @@ class CWrapperCodePrinter(CCodePrinter):
         method_def_func = ''.join(('{{\n'
                                      '"{name}",\n'
                                      '(PyCFunction){wrapper_name},\n'
-                                     'METH_VARARGS | METH_KEYWORDS,\n'
+                                     '{flags},\n'
                                      '{docstring}\n'
                                      '}},\n').format(
                                             name = self.get_python_name(expr.scope, f.original_function),
                                             wrapper_name = f.name,
+                                            flags = self.get_method_flags(f),
                                             docstring = self._print(LiteralString('\n'.join(f.docstring.comments))) \
                                                         if f.docstring else '""')
                                      for f in funcs if not getattr(f, 'is_header', False))
@@ -410,13 +517,13 @@ class CWrapperCodePrinter(CCodePrinter):
             else:
                 docstring = self._print(LiteralString('\n'.join(f.docstring.comments))) \
                                                         if f.docstring else '""'
-                funcs[py_name] = (f.name, docstring)
+                funcs[py_name] = (f.name, self.get_method_flags(f), docstring)
 
         for f in expr.interfaces:
             py_name = self.get_python_name(original_scope, f.original_function)
             docstring = self._print(LiteralString('\n'.join(f.docstring.comments))) \
                                                     if f.docstring else '""'
-            funcs[py_name] = (f.name, docstring)
+            funcs[py_name] = (f.name, self.get_method_flags(f), docstring)
 
         property_definitions = ''.join(''.join(('{\n',
                                         f'"{p.python_name}",\n',
@@ -430,10 +537,10 @@ class CWrapperCodePrinter(CCodePrinter):
         method_def_funcs = ''.join(('{\n'
                                      f'"{name}",\n'
                                      f'(PyCFunction){wrapper_name},\n'
-                                      'METH_VARARGS | METH_KEYWORDS,\n'
+                                     f'{flags},\n'
                                      f'{doc_string}\n'
                                      '},\n')
-                                     for name, (wrapper_name, doc_string) in funcs.items())
+                                     for name, (wrapper_name, flags, doc_string) in funcs.items())
 
         magic_methods = {self.get_python_name(original_scope, f.original_function): f for f in expr.magic_methods}
 
@@ -24,7 +24,7 @@ from pyccel.ast.builtins import PythonInt, PythonType, PythonPrint, PythonRange
 from pyccel.ast.builtins import PythonTuple, DtypePrecisionToCastFunction
 from pyccel.ast.builtins import PythonBool, PythonList, PythonSet, VariableIterator
 
-from pyccel.ast.builtin_methods.dict_methods import DictItems
+from pyccel.ast.builtin_methods.dict_methods import DictItems, DictKeys, DictValues
 
 from pyccel.ast.builtin_methods.list_methods import ListPop
 
@@ -68,7 +68,7 @@ from pyccel.ast.numpyext import NumpyReal, NumpyImag
 from pyccel.ast.numpyext import NumpyRand, NumpyAbs
 from pyccel.ast.numpyext import NumpyNewArray, NumpyArray
 from pyccel.ast.numpyext import NumpyNonZero
-from pyccel.ast.numpyext import NumpySign
+from pyccel.ast.numpyext import NumpySign, NumpyTranspose
 from pyccel.ast.numpyext import NumpyIsFinite, NumpyIsNan
 
 from pyccel.ast.numpytypes import NumpyNDArrayType, NumpyInt64Type
@@ -77,6 +77,8 @@ from pyccel.ast.operators import PyccelAdd, PyccelMul, PyccelMinus, PyccelAnd, P
 from pyccel.ast.operators import PyccelMod, PyccelNot, PyccelAssociativeParenthesis
 from pyccel.ast.operators import PyccelUnarySub, PyccelLt, PyccelGt, IfTernaryOperator
 
+from pyccel.ast.randomext import PhiloxGeneratorType
+
 from pyccel.ast.utilities import builtin_import_registry as pyccel_builtin_import_registry
 from pyccel.ast.utilities import expand_to_loops
 
@@ -1437,6 +1439,36 @@ class FCodePrinter(CodePrinter):
         success = self.scope.get_temporary_variable(PythonNativeInt())
         return f'{success} = {var} % erase_value({val})\n'
 
+    #================== Random generator methods ==================
+
+    def _print_RandomGenerator(self, expr):
+        self.add_import(Import('pyc_random_f90', Module('pyc_random_f90',(),())))
+        seed = self._print(expr.seed)
+        stream = self._print(expr.stream)
+        return f'pyc_philox_init({seed}, {stream})'
+
+    def _print_GeneratorAdvance(self, expr):
+        rng = self._print(expr.generator)
+        n_blocks = self._print(expr.args[0])
+        return f'call pyc_philox_advance({rng}, {n_blocks})\n'
+
+    def _print_GeneratorDrawMethod(self, expr):
+        out = expr.out
+        if out is not None:
+            # Fill the array in row-major order with one call per element
+            indices = [self.scope.get_temporary_variable(PythonNativeInt(), name = 'i') for _ in range(out.rank)]
+            loop_scopes = [self.scope.create_new_loop_scope()]
+            for _ in indices[1:]:
+                loop_scopes.append(loop_scopes[-1].create_new_loop_scope())
+            body = [Assign(IndexedElement(out, *indices), expr.scalar_call)]
+            for idx, dim_size, loop_scope in zip(indices[::-1], out.shape[::-1], loop_scopes[::-1]):
+                body = [For((idx,), PythonRange(dim_size), body, scope = loop_scope)]
+            return self._print(CodeBlock(body, unravelled = True))
+
+        rng = self._print(expr.generator)
+        args = ''.join(f', {self._print(a)}' for a in expr.args)
+        return f'pyc_philox_{expr.name}({rng}{args})'
+
     #========================== Numpy Elements ===============================#
 
     def _print_NumpySum(self, expr):
@@ -1451,26 +1483,63 @@ class FCodePrinter(CodePrinter):
         return f'product({arg_code})'
 
     def _print_NumpyMatmul(self, expr):
-        """Fortran print."""
-        a_code = self._print(expr.a)
-        b_code = self._print(expr.b)
+        """
+        Convert a call to numpy.matmul to the equivalent function in Fortran.
+
+        Convert a call to numpy.matmul (or the `@` operator) to a call to the
+        `matmul` intrinsic. A C-ordered matrix is stored transposed in Fortran
+        so the product is either computed directly (`matmul(a, b)`) or as the
+        transpose of the product of the transposed operands (`matmul(b, a)`)
+        depending on the order of the result (or of the array it is saved in).
+        Operands whose order does not match are wrapped in a call to
+        `transpose`. The transpose of an array is printed as the array itself
+        with the opposite order, which allows the compiler to pass it to BLAS
+        with a transpose flag.
+
+        Parameters
+        ----------
+        expr : NumpyMatmul
+            The matrix product.
 
+        Returns
+        -------
+        str
+            The code describing the product.
+        """
         if expr.rank == 0:
+            a_code = self._print(expr.a)
+            b_code = self._print(expr.b)
             if isinstance(expr.a.dtype.primitive_type, PrimitiveBooleanType):
                 a_code = self._print(PythonInt(expr.a))
             if isinstance(expr.b.dtype.primitive_type, PrimitiveBooleanType):
                 b_code = self._print(PythonInt(expr.b))
             return 'sum({}*{})'.format(a_code, b_code)
-        if expr.a.order and expr.b.order:
-            if expr.a.order != expr.b.order:
-                raise NotImplementedError("Mixed order matmul not supported.")
 
-        # Fortran ordering
-        if expr.a.order == 'F':
-            return 'matmul({0},{1})'.format(a_code, b_code)
+        operands = []
+        for arg in (expr.a, expr.b):
+            if isinstance(arg, NumpyTranspose):
+                var = arg.internal_var
+                operands.append((self._print(var), 'C' if var.order == 'F' else 'F'))
+            else:
+                operands.append((self._print(arg), arg.order if arg.rank > 1 else None))
+        orders = [o for _, o in operands]
 
-        # C ordering
-        return 'matmul({1},{0})'.format(a_code, b_code)
+        # Compute the product directly if the result is stored in Fortran order.
+        # A vector result is stored identically in both orders so the
+        # orientation requiring the fewest transposes is chosen
+        if expr.rank > 1:
+            assigns = expr.get_direct_user_nodes(lambda u: isinstance(u, Assign))
+            order = assigns[0].lhs.order if assigns else expr.order
+            direct = order == 'F'
+        else:
+            direct = orders.count('C') < orders.count('F')
+
+        if direct:
+            a_code, b_code = (c if o != 'C' else f'transpose({c})' for c, o in operands)
+            return f'matmul({a_code},{b_code})'
+        else:
+            a_code, b_code = (c if o != 'F' else f'transpose({c})' for c, o in operands)
+            return f'matmul({b_code},{a_code})'
 
     def _print_NumpyEmpty(self, expr):
         errors.report(FORTRAN_ALLOCATABLE_IN_EXPRESSION, symbol=expr, severity='fatal')
@@ -1982,6 +2051,9 @@ class FCodePrinter(CodePrinter):
         elif isinstance(dtype, BindCPointer):
             dtype_str = 'type(c_ptr)'
             self._constantImports.setdefault('ISO_C_Binding', set()).add('c_ptr')
+        elif isinstance(dtype, PhiloxGeneratorType):
+            dtype_str = 'type(pyc_philox)'
+            self.add_import(Import('pyc_random_f90', Module('pyc_random_f90',(),())))
         else:
             errors.report(f"Don't know how to print type {expr_type} in Fortran",
                     symbol=expr, severity='fatal')
@@ -2069,9 +2141,12 @@ class FCodePrinter(CodePrinter):
 
     def _print_CodeBlock(self, expr):
         if not expr.unravelled:
+            # Array expressions are unravelled into loops which can be parallelised
+            parallel_threshold = self.scope.decorators.get('parallel_arrays', None)
             body_exprs = expand_to_loops(expr,
                     self.scope.get_temporary_variable, self.scope,
-                    language_has_vectors = True)
+                    language_has_vectors = True,
+                    parallel_threshold = parallel_threshold)
         else:
             body_exprs = expr.body
         body_stmts = []
@@ -2654,7 +2729,7 @@ class FCodePrinter(CodePrinter):
         iterable = expr.iterable
         indices = iterable.loop_counters
 
-        if isinstance(iterable, (VariableIterator, DictItems)) and \
+        if isinstance(iterable, (VariableIterator, DictItems, DictKeys, DictValues)) and \
                 isinstance(iterable.variable.class_type, (DictType, HomogeneousSetType)):
             var = iterable.variable
             iterable_type = var.class_type
@@ -2674,6 +2749,12 @@ class FCodePrinter(CodePrinter):
                 val = self._print(expr.target[1])
                 target_assign = (f'{key} = {iterator} % first()\n'
                                  f'{val} = {iterator} % second()\n')
+            elif isinstance(iterable, DictKeys):
+                target = self._print(expr.target[0])
+                target_assign = f'{target} = {iterator} % first()\n'
+            elif isinstance(iterable, DictValues):
+                target = self._print(expr.target[0])
+                target_assign = f'{target} = {iterator} % second()\n'
             else:
                 target = self._print(expr.target[0])
                 target_assign = f'{target} = {iterator} % of()\n'
@@ -2735,6 +2816,16 @@ class FCodePrinter(CodePrinter):
             omp_expr += ' nowait'
         omp_expr = '!$omp {}\n'.format(omp_expr)
         return omp_expr
+
+    def _print_OMP_Array_Loop_Construct(self, expr):
+        clauses = f' collapse({expr.collapse})' if expr.collapse > 1 else ''
+        if expr.private:
+            clauses += f" private({', '.join(self._print(v) for v in expr.private)})"
+        if expr.reduction_variable:
+            clauses += f' reduction({expr.reduction_operator}:{self._print(expr.reduction_variable)})'
+        clauses += f' if(parallel: {self._print(expr.size)} >= {expr.threshold})'
+        combined = expr.combined.replace('for', 'do')
+        return f'!$omp {expr.name} {combined}{clauses}\n'
     # .....................................................
 
     # .....................................................
@@ -3527,6 +3618,10 @@ class FCodePrinter(CodePrinter):
 
 #=======================================================================================
 
+    def _print_KernelCall(self, expr):
+        return errors.report("Kernels can only be launched in C or CUDA",
+                symbol=expr, severity='fatal')
+
     def _print_FunctionCall(self, expr):
         func = expr.funcdef
 
@@ -3574,7 +3669,8 @@ class FCodePrinter(CodePrinter):
                 results_strs = []
             else:
                 # If func body is unknown then we may not know result names
-                use_names = (len(func.body.body) != 0)
+                # (unless the function was loaded from a saved interface which has a scope)
+                use_names = (len(func.body.body) != 0) or func.scope is not None
                 if use_names:
                     results_strs = [f'{self._print(n)} = {self._print(r)}'
                             for n,r in lhs_vars.items()]
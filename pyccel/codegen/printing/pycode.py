@@ -10,7 +10,7 @@ from pyccel.decorators import __all__ as pyccel_decorators
 from pyccel.ast.builtins   import PythonMin, PythonMax, PythonType, PythonBool, PythonInt, PythonFloat
 from pyccel.ast.builtins   import PythonComplex, DtypePrecisionToCastFunction
 from pyccel.ast.core       import CodeBlock, Import, Assign, FunctionCall, For, AsName, FunctionAddress
-from pyccel.ast.core       import IfSection, FunctionDef, Module, PyccelFunctionDef
+from pyccel.ast.core       import IfSection, FunctionDef, Module, PyccelFunctionDef, FunctionCallArgument
 from pyccel.ast.datatypes  import HomogeneousTupleType, VoidType
 from pyccel.ast.functionalexpr import FunctionalFor
 from pyccel.ast.literals   import LiteralTrue, LiteralString, LiteralInteger
@@ -326,6 +326,8 @@ class PythonCodePrinter(CodePrinter):
                         args = func.args
                     elif func == n:
                         args = []
+                    elif n == 'parallel_arrays':
+                        args = [FunctionCallArgument(LiteralInteger(func), keyword = 'threshold')]
                     else:
                         args = [LiteralString(a) for a in func]
                     if n == 'types':
@@ -851,12 +853,29 @@ class PythonCodePrinter(CodePrinter):
         else:
             return code
 
+    def _print_GeneratorMethod(self, expr):
+        method_name = expr.name
+        rng = self._print(expr.generator)
+        method_args = [self._print(a) for a in expr.args]
+        if getattr(expr, 'out', None) is not None:
+            method_args.append(f'out = {self._print(expr.out)}')
+        method_args = ', '.join(method_args)
+
+        code = f"{rng}.{method_name}({method_args})"
+        if isinstance(expr.class_type, VoidType):
+            return code + '\n'
+        else:
+            return code
+
     def _print_DictMethod(self, expr):
         method_name = expr.name
         dict_obj = self._print(expr.dict_obj)
         method_args = ', '.join(self._print(a) for a in expr.args)
 
-        return f"{dict_obj}.{method_name}({method_args})\n"
+        code = f"{dict_obj}.{method_name}({method_args})"
+        if isinstance(expr.class_type, VoidType):
+            code += '\n'
+        return code
 
     def _print_DictPop(self, expr):
         dict_obj = self._print(expr.dict_obj)
@@ -872,15 +891,25 @@ class PythonCodePrinter(CodePrinter):
         key = self._print(expr.key)
         if expr.default_value:
             val = self._print(expr.default_value)
-            return f"{dict_obj}.get({key}, {val})\n"
+            return f"{dict_obj}.get({key}, {val})"
         else:
-            return f"{dict_obj}.get({key})\n"
+            return f"{dict_obj}.get({key})"
 
     def _print_DictItems(self, expr):
         dict_obj = self._print(expr.variable)
 
         return f"{dict_obj}.items()"
 
+    def _print_DictKeys(self, expr):
+        dict_obj = self._print(expr.variable)
+
+        return f"{dict_obj}.keys()"
+
+    def _print_DictValues(self, expr):
+        dict_obj = self._print(expr.variable)
+
+        return f"{dict_obj}.values()"
+
     def _print_Slice(self, expr):
         start = self._print(expr.start) if expr.start else ''
         stop  = self._print(expr.stop)  if expr.stop  else ''
@@ -31,6 +31,38 @@ pyccel_stage = PyccelStage()
 
 __all__ = ['create_shared_library']
 
+#==============================================================================
+def depends_on(compile_obj, dependency):
+    """
+    Determine if an object depends on another object.
+
+    Determine if the object being compiled uses the dependency, either
+    directly or through one of its other dependencies.
+
+    Parameters
+    ----------
+    compile_obj : CompileObj
+        The object being compiled.
+    dependency : CompileObj
+        The dependency which is searched for.
+
+    Returns
+    -------
+    bool
+        True if the object uses the dependency, False otherwise.
+    """
+    to_visit = list(compile_obj.dependencies)
+    visited = set()
+    while to_visit:
+        obj = to_visit.pop()
+        if obj.module_target in visited:
+            continue
+        if obj == dependency:
+            return True
+        visited.add(obj.module_target)
+        to_visit.extend(obj.dependencies)
+    return False
+
 #==============================================================================
 def create_shared_library(codegen,
                           main_obj,
@@ -166,7 +198,8 @@ def create_shared_library(codegen,
     # get the include folder path and library files
     recompile_object(cwrapper_lib,
                       compiler = wrapper_compiler,
-                      verbose  = verbose)
+                      verbose  = verbose,
+                      cache    = True)
     timings['Dependency compilation'] = time.time() - start_compile_libs
 
     wrapper_compile_obj.add_dependencies(cwrapper_lib)
@@ -177,7 +210,8 @@ def create_shared_library(codegen,
     module_old_name = codegen.ast.name
     wrapper_codegen = CWrapperCodePrinter(codegen.parser.filename, language)
     Scope.name_clash_checker = name_clash_checkers['c']
-    wrapper = CToPythonWrapper(base_dirpath)
+    random_lib = internal_libs['pyc_random_f90' if language == 'fortran' else 'pyc_random_c'][1]
+    wrapper = CToPythonWrapper(base_dirpath, check_random_errors = depends_on(main_obj, random_lib))
 
     start_wrapper_creation = time.time()
     cwrap_ast = wrapper.wrap(c_ast)
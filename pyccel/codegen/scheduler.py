@@ -0,0 +1,243 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Contains the functions used to translate and compile the modules of a project in parallel.
+"""
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from pyccel.errors.errors   import Errors, ErrorsMode, PyccelError, PyccelSyntaxError
+from pyccel.parser.parser   import Parser
+from pyccel.utilities.stage import PyccelStage
+
+from .pipeline import execute_pyccel
+
+pyccel_stage = PyccelStage()
+
+__all__ = ['execute_pyccel_parallel', 'get_import_graph']
+
+# Arguments of execute_pyccel which only concern the file passed to the command
+main_file_only_arguments = ('folder', 'output_name', 'compiler_export_file', 'show_timings')
+
+#==============================================================================
+def get_import_graph(fname):
+    """
+    Get the graph describing the user modules imported by a file.
+
+    Parse the file and all the files that it imports (syntactic stage only) in
+    order to construct the directed acyclic graph describing which Python files
+    must be translated before each file can be translated. Header files and
+    modules which are marked as `ignore_at_import` or `no_target` are not
+    translated so they do not appear in the graph.
+
+    Parameters
+    ----------
+    fname : str
+        The name of the Python file whose dependencies are examined.
+
+    Returns
+    -------
+    dict[str, set[str]]
+        A dictionary whose keys are the absolute paths of the Python files in
+        the project and whose values are the files which they import.
+    """
+    errors = Errors()
+    errors.reset()
+
+    base_dirpath = os.getcwd()
+    sys.path.insert(0, base_dirpath)
+    try:
+        parser = Parser(os.path.abspath(fname))
+        parser.parse()
+    except PyccelError:
+        print('\nERROR at parsing (syntax) stage')
+        errors.check()
+        raise
+    finally:
+        sys.path.remove(base_dirpath)
+        pyccel_stage.pyccel_finished()
+
+    if errors.has_errors():
+        print('\nERROR at parsing (syntax) stage')
+        errors.check()
+        raise PyccelSyntaxError('Syntax step failed')
+    errors.reset()
+
+    def is_translated(p):
+        return p.filename.endswith('.py') and not (p.metavars.get('ignore_at_import', False) or \
+                                                   p.metavars.get('no_target', False))
+
+    graph = {}
+    to_visit = [parser]
+    while to_visit:
+        p = to_visit.pop()
+        if p.filename in graph:
+            continue
+        sons = [s for s in p.sons if is_translated(s)]
+        graph[p.filename] = {s.filename for s in sons}
+        to_visit.extend(sons)
+
+    return graph
+
+#==============================================================================
+def _execute_pyccel_in_worker(fname, error_mode, kwargs):
+    """
+    Run Pyccel on a dependency in a worker process.
+
+    Run Pyccel on a dependency in a worker process. Errors raised by Pyccel
+    have already been printed so they are caught and the failure is reported
+    via the return value.
+
+    Parameters
+    ----------
+    fname : str
+        The name of the Python file to be translated.
+    error_mode : str
+        The mode of the errors in the main process (user or developer).
+    kwargs : dict
+        The keyword arguments passed to `execute_pyccel`.
+
+    Returns
+    -------
+    bool
+        True if the file was translated successfully, False otherwise.
+    """
+    ErrorsMode().set_mode(error_mode)
+    try:
+        execute_pyccel(fname, **kwargs)
+    except PyccelError:
+        return False
+    return True
+
+#==============================================================================
+class SerialExecutor:
+    """
+    Executor which runs the submitted calls immediately in the current process.
+
+    Executor with the same interface as `ProcessPoolExecutor` which is used
+    when a single job is requested. Each call is run as soon as it is submitted
+    so the dependencies are translated in the same order and with the same
+    error handling as when several processes are used.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Run the function and return a future containing its result.
+
+        Run the function and return a future containing its result.
+
+        Parameters
+        ----------
+        fn : callable
+            The function to be called.
+        *args : tuple
+            The positional arguments passed to the function.
+        **kwargs : dict
+            The keyword arguments passed to the function.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            A future which is already done.
+        """
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+#==============================================================================
+def execute_pyccel_parallel(fname, *, n_jobs, **kwargs):
+    """
+    Run Pyccel on the provided file and all the user modules it imports.
+
+    Construct the graph describing the user modules imported by the file (see
+    `get_import_graph`) and run Pyccel on each of these modules as soon as the
+    modules it depends on have been translated. If `n_jobs` is 1 the modules
+    are handled one after the other in the current process. Otherwise each
+    module is handled (parsing, annotation, code generation and compilation)
+    in a separate process so up to `n_jobs` independent modules are treated
+    concurrently. Files shared between these processes (e.g. the internal
+    libraries in a `__pyccel__` folder) are protected by the same file locks
+    as when Pyccel is run on several files at once. The worker processes are
+    spawned rather than forked so that they do not inherit the file locks
+    held by this process. The provided file is handled last, in the current
+    process.
+
+    Parameters
+    ----------
+    fname : str
+        Name of the Python file to be translated.
+    n_jobs : int
+        The maximum number of modules which are treated concurrently.
+    **kwargs : dict
+        See `execute_pyccel`. The options which describe the output of the
+        provided file (e.g. `folder` or `output_name`) are not used for its
+        dependencies.
+    """
+    # Dependencies are only built if the file itself is compiled
+    if not fname or kwargs.get('language', None) == 'python' or \
+            kwargs.get('syntax_only', False) or kwargs.get('semantic_only', False):
+        execute_pyccel(fname, **kwargs)
+        return
+
+    graph = get_import_graph(fname)
+    main_file = os.path.abspath(fname)
+    remaining = {f: set(deps) for f, deps in graph.items() if f != main_file}
+    dependency_kwargs = {k: v for k, v in kwargs.items() if k not in main_file_only_arguments}
+
+    if remaining:
+        errors = Errors()
+        failed = []
+        error_mode = ErrorsMode().value
+        if n_jobs == 1:
+            pool = SerialExecutor()
+        else:
+            pool = ProcessPoolExecutor(max_workers = n_jobs,
+                                       mp_context = multiprocessing.get_context('spawn'))
+        with pool as executor:
+            running = {}
+            while remaining or running:
+                ready = [f for f, deps in remaining.items() if not deps]
+                for f in ready:
+                    if kwargs.get('verbose', False):
+                        print(f'>>> Building dependency :: {f}')
+                    running[executor.submit(_execute_pyccel_in_worker, f, error_mode, dependency_kwargs)] = f
+                    remaining.pop(f)
+
+                if not running:
+                    errors.report('Circular import found between the modules : ' + ', '.join(remaining),
+                                  severity='error')
+                    break
+
+                done, _ = wait(running, return_when = FIRST_COMPLETED)
+                for future in done:
+                    f = running.pop(future)
+                    if future.result():
+                        for deps in remaining.values():
+                            deps.discard(f)
+                    else:
+                        failed.append(f)
+
+                if failed:
+                    # Don't start any new modules but wait for the running ones
+                    remaining.clear()
+
+        if failed:
+            errors.report('Pyccel failed to translate the dependencies : ' + ', '.join(failed),
+                          severity='error')
+
+        if errors.has_errors():
+            errors.check()
+            raise PyccelError('Failed to build dependencies')
+
+    execute_pyccel(fname, **kwargs)
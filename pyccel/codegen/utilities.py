@@ -19,6 +19,7 @@ from pyccel.errors.errors import Errors
 from .codegen              import printer_registry
 from .compiling.basic      import CompileObj
 from .compiling.file_locks import FileLockSet
+from .compiling.runtime_cache import compile_runtime_object
 
 # get path to pyccel/stdlib/lib_name
 stdlib_path = os.path.dirname(stdlib_folder.__file__)
@@ -46,6 +47,8 @@ internal_libs = {
     "pyc_math_f90"    : ("math", CompileObj("pyc_math_f90.f90",folder="math")),
     "pyc_math_c"      : ("math", CompileObj("pyc_math_c.c",folder="math")),
     "pyc_tools_f90"   : ("tools", CompileObj("pyc_tools_f90.f90",folder="tools")),
+    "pyc_random_f90"  : ("random", CompileObj("pyc_random_f90.f90",folder="random")),
+    "pyc_random_c"    : ("random", CompileObj("pyc_random_c.c",folder="random")),
     "cwrapper"        : ("cwrapper", CompileObj("cwrapper.c",folder="cwrapper", accelerators=('python',))),
     "numpy_f90"       : ("numpy", CompileObj("numpy_f90.f90",folder="numpy")),
     "numpy_c"         : ("numpy", CompileObj("numpy_c.c",folder="numpy")),
@@ -57,6 +60,10 @@ internal_libs = {
                                                       folder="STC_Extensions",
                                                       has_target_file = False,
                                                       dependencies = (external_libs['stc'][1],))),
+    "Dict_extensions" : ("STC_Extensions", CompileObj("Dict_Extensions.h",
+                                                      folder="STC_Extensions",
+                                                      has_target_file = False,
+                                                      dependencies = (external_libs['stc'][1],))),
     "Common_extensions" : ("STC_Extensions", CompileObj("Common_Extensions.h",
                                                       folder="STC_Extensions",
                                                       has_target_file = False,
@@ -276,12 +283,15 @@ def generate_extension_modules(import_key, import_node, pyccel_dirpath,
 #==============================================================================
 def recompile_object(compile_obj,
                    compiler,
-                   verbose = False):
+                   verbose = False,
+                   cache = False):
     """
     Compile the provided file if necessary.
 
     Check if the file has already been compiled, if it hasn't or if the source has
-    been modified then compile the file.
+    been modified then compile the file. Files from Pyccel's runtime libraries can
+    be compiled via the user-level cache so that they are only compiled once for
+    all projects.
 
     Parameters
     ----------
@@ -293,6 +303,10 @@ def recompile_object(compile_obj,
 
     verbose : bool
         Indicates whether additional information should be printed.
+
+    cache : bool, default=False
+        Indicates whether the compiled file should be retrieved from (or saved
+        to) the user-level cache. See `compile_runtime_object`.
     """
 
     # compile library source files
@@ -304,7 +318,9 @@ def recompile_object(compile_obj,
             outdated     = o_file_age < src_file_age
         else:
             outdated = True
-    if outdated:
+    if outdated and cache:
+        compile_runtime_object(compile_obj, compiler, verbose)
+    elif outdated:
         compiler.compile_module(compile_obj=compile_obj,
                 output_folder=compile_obj.source_folder,
                 verbose=verbose)
@@ -360,7 +376,8 @@ def manage_dependencies(pyccel_imports, compiler, pyccel_dirpath, mod_obj, langu
             # get the include folder path and library files
             recompile_object(stdlib,
                              compiler = compiler,
-                             verbose  = verbose)
+                             verbose  = verbose,
+                             cache    = True)
 
             mod_obj.add_dependencies(stdlib)
 
@@ -7,12 +7,14 @@
 Module describing the code-wrapping class : CToPythonWrapper
 which creates an interface exposing C code to Python.
 """
+import sys
 import warnings
 from pyccel.ast.bind_c        import BindCFunctionDef, BindCPointer, BindCFunctionDefArgument
 from pyccel.ast.bind_c        import BindCModule, BindCVariable, BindCFunctionDefResult
 from pyccel.ast.bind_c        import BindCClassDef, BindCClassProperty
 from pyccel.ast.builtins      import PythonTuple, PythonRange, PythonLen, PythonSet
-from pyccel.ast.builtins      import VariableIterator
+from pyccel.ast.builtins      import VariableIterator, PythonDict
+from pyccel.ast.builtin_methods.dict_methods import DictItems, DictSetDefault
 from pyccel.ast.builtin_methods.set_methods import SetAdd, SetPop
 from pyccel.ast.class_defs    import StackArrayClass
 from pyccel.ast.core          import Interface, If, IfSection, Return, FunctionCall
@@ -22,24 +24,29 @@ from pyccel.ast.core          import Import, Module, AugAssign, CommentBlock, Fo
 from pyccel.ast.core          import FunctionAddress, Declare, ClassDef, AsName
 from pyccel.ast.cwrapper      import PyModule, PyccelPyObject, PyArgKeywords, PyModule_Create
 from pyccel.ast.cwrapper      import PyArg_ParseTupleNode, Py_None, PyClassDef, PyModInitFunc
+from pyccel.ast.cwrapper      import PyArg_ParseFastcallNode, PyFastcallKeywords
+from pyccel.ast.cwrapper      import PyccelPyObjectArray, PyccelPySsizeT
 from pyccel.ast.cwrapper      import py_to_c_registry, check_type_registry, PyBuildValueNode
 from pyccel.ast.cwrapper      import PyErr_SetString, PyTypeError, PyNotImplementedError
-from pyccel.ast.cwrapper      import PyAttributeError
+from pyccel.ast.cwrapper      import PyAttributeError, PyValueError
 from pyccel.ast.cwrapper      import C_to_Python, PyFunctionDef, PyInterface
 from pyccel.ast.cwrapper      import PyModule_AddObject, Py_DECREF, PyObject_TypeCheck
 from pyccel.ast.cwrapper      import Py_INCREF, PyType_Ready, WrapperCustomDataType
 from pyccel.ast.cwrapper      import PyList_New, PyList_Append, PyList_GetItem, PyList_SetItem
+from pyccel.ast.cwrapper      import PyList_Size
 from pyccel.ast.cwrapper      import PyccelPyTypeObject, PyCapsule_New, PyCapsule_Import
 from pyccel.ast.cwrapper      import PySys_GetObject, PyUnicode_FromString, PyGetSetDefElement
 from pyccel.ast.cwrapper      import PyTuple_Size, PyTuple_Check, PyTuple_New
 from pyccel.ast.cwrapper      import PyTuple_GetItem, PyTuple_SetItem
 from pyccel.ast.cwrapper      import PySet_New, PySet_Add
 from pyccel.ast.cwrapper      import PySet_Size, PySet_Check, PySet_GetIter, PySet_Clear
+from pyccel.ast.cwrapper      import PyDict_New, PyDict_SetItem, PyDict_GetItem
+from pyccel.ast.cwrapper      import PyDict_Check, PyDict_Size, PyDict_Keys, PyDict_DelItem
 from pyccel.ast.cwrapper      import PyIter_Next
 from pyccel.ast.c_concepts    import ObjectAddress, PointerCast, CStackArray, CNativeInt
 from pyccel.ast.datatypes     import VoidType, PythonNativeInt, CustomDataType, DataTypeFactory
 from pyccel.ast.datatypes     import FixedSizeNumericType, HomogeneousTupleType, PythonNativeBool
-from pyccel.ast.datatypes     import HomogeneousSetType, HomogeneousListType
+from pyccel.ast.datatypes     import HomogeneousSetType, HomogeneousListType, DictType
 from pyccel.ast.datatypes     import TupleType
 from pyccel.ast.literals      import Nil, LiteralTrue, LiteralString, LiteralInteger
 from pyccel.ast.literals      import LiteralFalse, convert_to_literal
@@ -50,9 +57,11 @@ from pyccel.ast.numpy_wrapper import pyarray_to_ndarray, PyArray_SetBaseObject,
 from pyccel.ast.numpy_wrapper import array_get_data, array_get_dim, to_pyarray
 from pyccel.ast.numpy_wrapper import array_get_c_step, array_get_f_step
 from pyccel.ast.numpy_wrapper import numpy_dtype_registry, numpy_flag_f_contig, numpy_flag_c_contig
+from pyccel.ast.randomext     import philox_take_error
 from pyccel.ast.numpy_wrapper import pyarray_check, is_numpy_array, no_order_check
+from pyccel.ast.numpy_wrapper import strided_c_order, strided_f_order
 from pyccel.ast.operators     import PyccelNot, PyccelIsNot, PyccelUnarySub, PyccelEq, PyccelIs
-from pyccel.ast.operators     import PyccelLt, IfTernaryOperator, PyccelAnd
+from pyccel.ast.operators     import PyccelLt, IfTernaryOperator, PyccelAnd, PyccelIn
 from pyccel.ast.variable      import Variable, DottedVariable, IndexedElement
 from pyccel.parser.scope      import Scope
 from pyccel.errors.errors     import Errors
@@ -84,6 +93,10 @@ magic_binary_funcs = ('__add__',
                       '__ior__',
                       )
 
+# The METH_FASTCALL calling convention is only part of the stable API from Python 3.10
+# but it is available in CPython from Python 3.7
+fastcall_available = sys.implementation.name == 'cpython' and sys.version_info >= (3, 7)
+
 class CToPythonWrapper(Wrapper):
     """
     Class for creating a wrapper exposing C code to Python.
@@ -96,14 +109,27 @@ class CToPythonWrapper(Wrapper):
     file_location : str
         The folder where the translated code is located and where the generated .so file will
         be located.
+
+    check_random_errors : bool, default=False
+        Indicates if the wrapped code uses the runtime of `pyccel.random`. In this case each
+        function checks if `Generator.integers` was called with an invalid range and raises
+        a `ValueError` if this is the case.
     """
-    def __init__(self, file_location):
+    def __init__(self, file_location, check_random_errors = False):
         # A map used to find the Python-compatible Variable equivalent to an object in the AST
         self._python_object_map = {}
         # Indicate if arrays were wrapped.
         self._wrapping_arrays = False
+        # Indicate if the wrapped functions are C-compatible Fortran functions. Their array
+        # arguments may be strided views as they are accessed through pointers.
+        self._wrapping_bind_c = False
         # The object that should be returned to indicate an error
         self._error_exit_code = Nil()
+        # Indicate if the METH_FASTCALL calling convention should be used. This convention
+        # avoids the creation of a tuple and a dictionary to pass the arguments.
+        self._use_fastcall = fastcall_available
+        # Indicate if the errors reported by the runtime of pyccel.random must be raised
+        self._check_random_errors = check_random_errors
 
         self._file_location = file_location
         super().__init__()
@@ -175,14 +201,20 @@ class CToPythonWrapper(Wrapper):
         self._python_object_map.update(dict(zip(args, collect_args)))
         return collect_args
 
-    def _unpack_python_args(self, args, class_base = None):
+    def _unpack_python_args(self, args, class_base = None, allow_fastcall = True):
         """
         Unpack the arguments received from Python into the expected Python variables.
 
-        Create the wrapper arguments of the current `FunctionDef` (`self`, `args`, `kwargs`).
-        Get a new set of `PyccelPyObject` `Variable`s representing each of the expected
-        arguments. Add the code which unpacks the `args` and `kwargs` into individual
-        `PyccelPyObject`s for each of the expected arguments.
+        Create the wrapper arguments of the current `FunctionDef`. Get a new set of
+        `PyccelPyObject` `Variable`s representing each of the expected arguments. Add
+        the code which unpacks the arguments into individual `PyccelPyObject`s for each
+        of the expected arguments.
+
+        If the `METH_FASTCALL` calling convention is used then the wrapper arguments are
+        `self`, `args` (a C array of `PyObject *`), `nargs` and `kwnames` and the
+        arguments are unpacked with `pyccel_parse_fastcall` (see cwrapper.h). Otherwise
+        the wrapper arguments are `self`, `args`, `kwargs` and the arguments are
+        unpacked with `PyArg_ParseTupleAndKeywords`.
 
         Parameters
         ----------
@@ -193,6 +225,10 @@ class CToPythonWrapper(Wrapper):
             The DataType of the class which the method belongs to. In the case of a method
             defined in a module this value is None.
 
+        allow_fastcall : bool, default=True
+            Indicates whether the `METH_FASTCALL` calling convention can be used. This is
+            not the case for functions whose signature is fixed by Python (e.g. `tp_init`).
+
         Returns
         -------
         func_args : list of Variable
@@ -205,7 +241,7 @@ class CToPythonWrapper(Wrapper):
         --------
         >>> arg = Variable('int', 'x')
         >>> func_args = (FunctionDefArgument(arg),)
-        >>> wrapper_args, body = self._unpack_python_args(func_args)
+        >>> wrapper_args, body = self._unpack_python_args(func_args, allow_fastcall = False)
         >>> wrapper_args
         [Variable('self', dtype=PyccelPyObject()), Variable('args', dtype=PyccelPyObject()), Variable('kwargs', dtype=PyccelPyObject())]
         >>> body
@@ -223,8 +259,18 @@ class CToPythonWrapper(Wrapper):
         has_bound_arg = class_base is not None
         bound_arg = args[0] if has_bound_arg else None
         args = args[int(has_bound_arg):]
+        use_fastcall = allow_fastcall and self._use_fastcall
         # Create necessary variables
-        func_args = [self.get_new_PyObject("self", class_base)] + [self.get_new_PyObject(n) for n in ("args", "kwargs")]
+        if use_fastcall:
+            args_array = Variable(PyccelPyObjectArray(), self.scope.get_new_name('args'),
+                                  memory_handling='alias')
+            nargs = Variable(PyccelPySsizeT(), self.scope.get_new_name('nargs'))
+            self.scope.insert_variable(args_array)
+            self.scope.insert_variable(nargs)
+            func_args = [self.get_new_PyObject("self", class_base), args_array, nargs,
+                         self.get_new_PyObject("kwnames")]
+        else:
+            func_args = [self.get_new_PyObject("self", class_base)] + [self.get_new_PyObject(n) for n in ("args", "kwargs")]
         arg_vars  = self._get_python_argument_variables(args)
         keyword_list_name = self.scope.get_new_name('kwlist')
 
@@ -233,10 +279,15 @@ class CToPythonWrapper(Wrapper):
 
         # Create the list of argument names
         arg_names = [getattr(a, 'original_function_argument_variable', a.var).name for a in args]
-        keyword_list = PyArgKeywords(keyword_list_name, arg_names)
 
         # Parse arguments
-        parse_node = PyArg_ParseTupleNode(*func_args[1:], args, arg_vars, keyword_list)
+        if use_fastcall:
+            keyword_list = PyFastcallKeywords(keyword_list_name, self.scope.get_new_name('kwlist_interned'),
+                                              arg_names)
+            parse_node = PyArg_ParseFastcallNode(*func_args[1:], args, arg_vars, keyword_list)
+        else:
+            keyword_list = PyArgKeywords(keyword_list_name, arg_names)
+            parse_node = PyArg_ParseTupleNode(*func_args[1:], args, arg_vars, keyword_list)
 
         # Initialise optionals
         body = [AliasAssign(py_arg, Py_None) for func_def_arg, py_arg in zip(args, arg_vars) if func_def_arg.has_default]
@@ -330,11 +381,11 @@ class CToPythonWrapper(Wrapper):
 
             # order flag
             if rank == 1:
-                flag     = no_order_check
+                flag     = strided_c_order if self._wrapping_bind_c else no_order_check
             elif arg.order == 'F':
-                flag = numpy_flag_f_contig
+                flag = strided_f_order if self._wrapping_bind_c else numpy_flag_f_contig
             else:
-                flag = numpy_flag_c_contig
+                flag = strided_c_order if self._wrapping_bind_c else numpy_flag_c_contig
 
             if raise_error:
                 type_check_condition = pyarray_check(ObjectAddress(LiteralString(arg.name)), py_obj, type_ref,
@@ -391,6 +442,39 @@ class CToPythonWrapper(Wrapper):
             set_checks = IfSection(set_check, [size_assign, iter_assign, Assign(type_check_condition, LiteralTrue()), internal_type_check])
             default_value = IfSection(LiteralTrue(), [Assign(type_check_condition, LiteralFalse())])
             body.append(If(set_checks, default_value))
+
+        elif isinstance(arg.class_type, DictType):
+            # Create type check result variable
+            type_check_condition = self.scope.get_temporary_variable(PythonNativeBool(), 'is_homog_dict')
+
+            # Check if the object is a dict
+            dict_check = PyDict_Check(py_obj)
+
+            # If the dict is an object check that the keys and the values have the right type
+            for_scope = self.scope.create_new_loop_scope()
+            size_var = self.scope.get_temporary_variable(PythonNativeInt(), 'size')
+            idx = self.scope.get_temporary_variable(CNativeInt())
+            key_py_obj = self.scope.get_temporary_variable(PyccelPyObject(), 'key', memory_handling='alias')
+            val_py_obj = self.scope.get_temporary_variable(PyccelPyObject(), 'val', memory_handling='alias')
+            iter_obj = self.scope.get_temporary_variable(PyccelPyObject(), 'iter', memory_handling='alias')
+
+            size_assign = Assign(size_var, PyDict_Size(py_obj))
+            iter_assign = AliasAssign(iter_obj, PySet_GetIter(py_obj))
+            for_body = [AliasAssign(key_py_obj, PyIter_Next(iter_obj)),
+                        AliasAssign(val_py_obj, PyDict_GetItem(py_obj, key_py_obj))]
+            key_type_check_condition, _ = self._get_type_check_condition(key_py_obj,
+                                                Variable(arg.class_type.key_type, 'key'), False, for_body)
+            val_type_check_condition, _ = self._get_type_check_condition(val_py_obj,
+                                                Variable(arg.class_type.value_type, 'val'), False, for_body)
+            for_body.extend([Assign(type_check_condition, PyccelAnd(type_check_condition,
+                                        key_type_check_condition, val_type_check_condition)),
+                             Py_DECREF(key_py_obj)])
+            internal_type_check = For((idx,), PythonRange(size_var), for_body, scope = for_scope)
+
+            dict_checks = IfSection(dict_check, [size_assign, iter_assign, Assign(type_check_condition, LiteralTrue()),
+                                                 internal_type_check, Py_DECREF(iter_obj)])
+            default_value = IfSection(LiteralTrue(), [Assign(type_check_condition, LiteralFalse())])
+            body.append(If(dict_checks, default_value))
         else:
             errors.report(f"Can't check the type of an array of {arg.class_type}\n"+PYCCEL_RESTRICTION_TODO,
                     symbol=arg, severity='fatal')
@@ -989,7 +1073,7 @@ class CToPythonWrapper(Wrapper):
         original_c_args = init_function.arguments
 
         # Get the arguments of the PyFunctionDef
-        func_args, body = self._unpack_python_args(python_args, cls_dtype)
+        func_args, body = self._unpack_python_args(python_args, cls_dtype, allow_fastcall = False)
         func_args = [FunctionDefArgument(a) for a in func_args]
 
         # Get the results of the PyFunctionDef
@@ -1143,7 +1227,8 @@ class CToPythonWrapper(Wrapper):
 
         get_data = AliasAssign(data_var, PyArray_DATA(ObjectAddress(pyarray_collect_arg)))
         get_strides_and_shape = get_strides_and_shape_from_numpy_array(
-                                        ObjectAddress(collect_arg), shape_var, stride_var)
+                                        ObjectAddress(collect_arg), shape_var, stride_var,
+                                        convert_to_literal(orig_var.order != 'F'))
 
         body = [get_data, get_strides_and_shape]
 
@@ -1281,6 +1366,8 @@ class CToPythonWrapper(Wrapper):
         self.exit_scope()
 
         imports += cwrapper_ndarray_imports if self._wrapping_arrays else []
+        if self._check_random_errors and not isinstance(expr, BindCModule):
+            imports.append(Import('pyc_random_c', Module('pyc_random_c', (), ())))
         if not isinstance(expr, BindCModule):
             imports.append(Import(mod_scope.get_python_name(expr.name), expr))
         original_mod = getattr(expr, 'original_module', expr)
@@ -1307,6 +1394,7 @@ class CToPythonWrapper(Wrapper):
         PyModule
             The module which can be called from Python.
         """
+        self._wrapping_bind_c = True
         pymod = self._wrap_Module(expr)
 
         # Add declarations for C-compatible variables
@@ -1336,6 +1424,10 @@ class CToPythonWrapper(Wrapper):
                 for f in (a.getter, a.setter):
                     if f:
                         external_funcs.append(FunctionDef(f.name, f.arguments, [], f.results, is_header = True, scope = Scope()))
+
+        # The Fortran runtime of pyccel.random has no C header
+        if self._check_random_errors:
+            external_funcs.append(philox_take_error)
         pymod.external_funcs = external_funcs
 
         return pymod
@@ -1467,6 +1559,12 @@ class CToPythonWrapper(Wrapper):
                          func_scope, expr,
                          "Private functions are not accessible from python")
 
+        if 'kernel' in expr.decorators or 'device' in expr.decorators:
+            self.exit_scope()
+            return self._get_untranslatable_function(func_name,
+                         func_scope, expr,
+                         "Kernels and device functions are not accessible from python")
+
         # Handle un-wrappable functions
         if any(isinstance(getattr(a, 'original_function_argument_variable', a.var), FunctionAddress) for a in expr.arguments):
             self.exit_scope()
@@ -1557,6 +1655,15 @@ class CToPythonWrapper(Wrapper):
             body.extend(wrapped_results['body'])
         body.extend(ai for arg in wrapped_args for ai in arg['clean_up'])
 
+        # Raise the error if Generator.integers was called with an invalid range
+        if self._check_random_errors:
+            error_body = [PyErr_SetString(PyValueError,
+                            LiteralString("Generator.integers: high - low must be in the range [1, 2**62]")),
+                          Return([self._error_exit_code])]
+            if python_result_variable is not Py_None and original_func_name != '__len__':
+                error_body.insert(0, Py_DECREF(python_result_variable))
+            body.append(If(IfSection(philox_take_error(), error_body)))
+
         # Pack the Python compatible results of the function into one argument.
         if python_result_variable is Py_None:
             res = Py_None
@@ -2554,6 +2661,140 @@ class CToPythonWrapper(Wrapper):
 
         return {'body': body, 'args': arg_vars, 'clean_up': clean_up}
 
+    def _extract_DictType_FunctionDefArgument(self, orig_var, collect_arg, bound_argument,
+            is_bind_c_argument, *, arg_var = None):
+        """
+        Extract the C-compatible dict FunctionDefArgument from the PythonObject.
+
+        Extract the C-compatible dict FunctionDefArgument from the PythonObject.
+        The C-compatible argument is extracted from collect_arg which holds a Python
+        object into arg_var.
+
+        The extraction is done by creating an empty hash map and inserting the keys
+        and values extracted from the Python dict in collect_arg. If the dict is
+        modified by the function then the Python dict is updated from the hash map
+        after the call. Keys which were removed are deleted and the remaining values
+        are set in place so the insertion order of the Python dict is preserved.
+
+        Parameters
+        ----------
+        orig_var : Variable | IndexedElement
+            An object representing the variable or an element of the variable from the
+            FunctionDefArgument being wrapped.
+
+        collect_arg : Variable
+            A variable with type PythonObject* holding the Python argument from which the
+            C-compatible argument should be collected.
+
+        bound_argument : bool
+            True if the argument is the self argument of a class method. False otherwise.
+            This should always be False for this function.
+
+        is_bind_c_argument : bool
+            True if the argument was saved in a BindCFunctionDefArgument. False otherwise.
+
+        arg_var : Variable | IndexedElement, optional
+            A variable or an element of the variable representing the argument that
+            will be passed to the low-level function call.
+
+        Returns
+        -------
+        dict
+            A dictionary describing the objects necessary to access the argument.
+        """
+        assert arg_var is None
+
+        if orig_var.is_optional:
+            errors.report("Optionals are not yet supported",
+                    severity='fatal', symbol=orig_var)
+
+        assert not bound_argument
+
+        if is_bind_c_argument:
+            raise errors.report("Fortran dict interface is not yet implemented", severity='fatal', symbol=orig_var)
+
+        class_type = orig_var.class_type
+        arg_var = orig_var.clone(self.scope.get_expected_name(orig_var.name), is_argument = False,
+                                memory_handling='heap', new_class = Variable)
+        self._wrapping_arrays = True
+        self.scope.insert_variable(arg_var, orig_var.name)
+
+        size_var = self.scope.get_temporary_variable(PythonNativeInt(), self.scope.get_new_name(f'{orig_var.name}_size'))
+        idx = self.scope.get_temporary_variable(CNativeInt())
+        key_var = self.scope.get_temporary_variable(class_type.key_type)
+        val_var = self.scope.get_temporary_variable(class_type.value_type)
+        key_collect_arg = self.scope.get_temporary_variable(PyccelPyObject(), memory_handling='alias')
+        val_collect_arg = self.scope.get_temporary_variable(PyccelPyObject(), memory_handling='alias')
+        iter_obj = self.scope.get_temporary_variable(PyccelPyObject(), 'iter', memory_handling='alias')
+
+        body = [Assign(arg_var, PythonDict((), ())),
+                Assign(size_var, PyDict_Size(collect_arg)),
+                AliasAssign(iter_obj, PySet_GetIter(collect_arg))]
+
+        for_scope = self.scope.create_new_loop_scope()
+        self.scope = for_scope
+        for_body = [AliasAssign(key_collect_arg, PyIter_Next(iter_obj)),
+                    AliasAssign(val_collect_arg, PyDict_GetItem(collect_arg, key_collect_arg))]
+        for_body += self._extract_FunctionDefArgument(key_var, key_collect_arg,
+                                    bound_argument, is_bind_c_argument, arg_var = key_var)['body']
+        for_body += self._extract_FunctionDefArgument(val_var, val_collect_arg,
+                                    bound_argument, is_bind_c_argument, arg_var = val_var)['body']
+        # The keys of a Python dict are unique so setdefault always inserts the value
+        for_body += [Assign(val_var, DictSetDefault(arg_var, key_var, val_var)),
+                     Py_DECREF(key_collect_arg)]
+        self.exit_scope()
+
+        body += [For((idx,), PythonRange(size_var), for_body, scope = for_scope),
+                 Py_DECREF(iter_obj)]
+
+        # Only write the hash map back if the function modifies the dict
+        func_args = orig_var.get_direct_user_nodes(lambda u: isinstance(u, FunctionDefArgument))
+        clean_up = []
+        if any(a.inout for a in func_args):
+            keys_obj = self.scope.get_temporary_variable(PyccelPyObject(), 'keys', memory_handling='alias')
+
+            # Delete the keys which are no longer in the hash map
+            for_scope = self.scope.create_new_loop_scope()
+            self.scope = for_scope
+            for_body = [AliasAssign(key_collect_arg, PyList_GetItem(keys_obj, idx))]
+            for_body += self._extract_FunctionDefArgument(key_var, key_collect_arg,
+                                    bound_argument, is_bind_c_argument, arg_var = key_var)['body']
+            elem_del = PyDict_DelItem(collect_arg, key_collect_arg)
+            for_body.append(If(IfSection(PyccelNot(PyccelIn(key_var, arg_var)),
+                    [If(IfSection(PyccelEq(elem_del, PyccelUnarySub(LiteralInteger(1))),
+                                    [Py_DECREF(keys_obj), Return([self._error_exit_code])]))])))
+            self.exit_scope()
+
+            clean_up = [AliasAssign(keys_obj, PyDict_Keys(collect_arg)),
+                    If(IfSection(PyccelIs(keys_obj, Nil()), [Return([self._error_exit_code])])),
+                    For((idx,), PythonRange(PyList_Size(keys_obj)), for_body, scope = for_scope),
+                    Py_DECREF(keys_obj)]
+
+            # Set the values in place. New keys are appended to the Python dict
+            for_scope = self.scope.create_new_loop_scope()
+            self.scope = for_scope
+            key_extraction = self._extract_FunctionDefResult(Variable(class_type.key_type, 'key'),
+                                            is_bind_c_argument, None)
+            val_extraction = self._extract_FunctionDefResult(Variable(class_type.value_type, 'val'),
+                                            is_bind_c_argument, None)
+            self.exit_scope()
+            elem_set = PyDict_SetItem(collect_arg, key_extraction['py_result'], val_extraction['py_result'])
+            for_body = [*key_extraction['body'], *val_extraction['body'],
+                    If(IfSection(PyccelEq(elem_set, PyccelUnarySub(LiteralInteger(1))),
+                                             [Py_DECREF(key_extraction['py_result']),
+                                              Py_DECREF(val_extraction['py_result']),
+                                              Return([self._error_exit_code])])),
+                    Py_DECREF(key_extraction['py_result']),
+                    Py_DECREF(val_extraction['py_result'])]
+
+            loop_iterator = DictItems(arg_var)
+            loop_iterator.set_loop_counter(idx)
+            clean_up.append(For((key_extraction['c_results'][0], val_extraction['c_results'][0]),
+                        loop_iterator, for_body, for_scope))
+        clean_up.append(Deallocate(arg_var))
+
+        return {'body': body, 'args': [arg_var], 'clean_up': clean_up}
+
     def _extract_FunctionDefResult(self, orig_var, is_bind_c, funcdef = None):
         """
         Get the code which translates a C-compatible `Variable` to a Python `FunctionDefResult`.
@@ -2842,3 +3083,59 @@ class CToPythonWrapper(Wrapper):
             body.append(Deallocate(c_res))
 
         return {'c_results': c_results, 'py_result': py_res, 'body': body}
+
+    def _extract_DictType_FunctionDefResult(self, orig_var, is_bind_c, funcdef):
+        """
+        Get the code which translates a `Variable` containing a dict to a PyObject.
+
+        Get the code which translates a `Variable` containing a dict to a PyObject.
+        The keys and values of the hash map are inserted into a new Python dict and
+        the hash map is then freed.
+
+        Parameters
+        ----------
+        orig_var : Variable | IndexedElement
+            An object representing the variable or an element of the variable from the
+            FunctionDefResult being wrapped.
+        is_bind_c : bool
+            True if the result was saved in a BindCFunctionDefResult. False otherwise.
+        funcdef : FunctionDef
+            The function being wrapped.
+
+        Returns
+        -------
+        dict
+            A dictionary describing the objects necessary to collect the result.
+        """
+        if is_bind_c:
+            raise errors.report("Fortran dict interface is not yet implemented", severity='fatal', symbol=orig_var)
+
+        class_type = orig_var.class_type
+        name = getattr(orig_var, 'name', 'tmp')
+        py_res = self.get_new_PyObject(f'{name}_obj', orig_var.dtype)
+        c_res = orig_var.clone(self.scope.get_new_name(name), is_argument = False)
+        idx = Variable(PythonNativeInt(), self.scope.get_new_name())
+        self.scope.insert_variable(c_res)
+        self.scope.insert_variable(idx)
+
+        for_scope = self.scope.create_new_loop_scope()
+        self.scope = for_scope
+        key_extraction = self._extract_FunctionDefResult(Variable(class_type.key_type, 'key'), is_bind_c, funcdef)
+        val_extraction = self._extract_FunctionDefResult(Variable(class_type.value_type, 'val'), is_bind_c, funcdef)
+        self.exit_scope()
+
+        elem_set = PyDict_SetItem(py_res, key_extraction['py_result'], val_extraction['py_result'])
+        for_body = [*key_extraction['body'], *val_extraction['body'],
+                If(IfSection(PyccelEq(elem_set, PyccelUnarySub(LiteralInteger(1))),
+                                         [Return([self._error_exit_code])])),
+                Py_DECREF(key_extraction['py_result']),
+                Py_DECREF(val_extraction['py_result'])]
+
+        loop_iterator = DictItems(c_res)
+        loop_iterator.set_loop_counter(idx)
+        body = [AliasAssign(py_res, PyDict_New()),
+                For((key_extraction['c_results'][0], val_extraction['c_results'][0]),
+                    loop_iterator, for_body, for_scope),
+                Deallocate(c_res)]
+
+        return {'c_results': [c_res], 'py_result': py_res, 'body': body}
@@ -27,6 +27,7 @@ from pyccel.ast.internals import Slice
 from pyccel.ast.literals import LiteralInteger, Nil, LiteralTrue
 from pyccel.ast.numpytypes import NumpyNDArrayType
 from pyccel.ast.operators import PyccelIsNot, PyccelMul, PyccelAdd
+from pyccel.ast.randomext import PhiloxGeneratorType
 from pyccel.ast.variable import Variable, IndexedElement, DottedVariable
 from pyccel.ast.numpyext import NumpyNDArrayType
 from pyccel.errors.errors import Errors
@@ -48,6 +49,47 @@ class FortranToCWrapper(Wrapper):
         self._wrapper_names_dict = {}
         super().__init__()
 
+    @staticmethod
+    def _get_array_layout(bind_c_arg):
+        """
+        Get the description of the memory containing an array argument.
+
+        An array passed from C is described by a data pointer, a shape and strides
+        (see `get_fortran_array_layout` in `cwrapper.h`). The data is accessed
+        through a pointer to a contiguous block of memory which contains the array.
+        The array is then a section of this block. In memory order (fastest
+        dimension first), the extents of the block are the strides (except the
+        first one) followed by the size of the slowest dimension. The section
+        uses the first stride as the step of the fastest dimension. For arrays
+        of rank 1 the extent of the block is the size multiplied by the stride.
+
+        Parameters
+        ----------
+        bind_c_arg : BindCFunctionDefArgument
+            The argument describing the array.
+
+        Returns
+        -------
+        block_shape : list[TypedAstNode]
+            The extents of the contiguous block in the order expected by `C_F_Pointer`.
+        slices : list[Slice]
+            The slices selecting the array from the block (in the order of the
+            indices of the original array).
+        """
+        is_c_order = bind_c_arg.original_function_argument_variable.order == 'C'
+        shape = bind_c_arg.shape[::-1] if is_c_order else bind_c_arg.shape
+        strides = bind_c_arg.strides[::-1] if is_c_order else bind_c_arg.strides
+        start = LiteralInteger(1) # C_F_Pointer leads to default Fortran lbound
+        if len(shape) == 1:
+            block_shape = [PyccelMul(shape[0], strides[0])]
+            slices = [Slice(start, None, strides[0])]
+        else:
+            # The stop of a slice is exclusive
+            block_shape = [*strides[1:], shape[-1]]
+            slices = [Slice(start, PyccelAdd(PyccelMul(shape[0], strides[0]), start), strides[0])] + \
+                     [Slice(start, PyccelAdd(s, start)) for s in shape[1:]]
+        return block_shape, (slices[::-1] if is_c_order else slices)
+
     def _get_function_def_body(self, func, func_def_args, func_arg_to_call_arg, results, handled = ()):
         """
         Get the body of the bind c function definition.
@@ -96,13 +138,8 @@ class FortranToCWrapper(Wrapper):
             args = [FunctionCallArgument(func_arg_to_call_arg[fa],
                                          keyword = fa.original_function_argument_variable.name)
                     for fa in func_def_args]
-            size = [fa.shape[::-1] if fa.original_function_argument_variable.order == 'C' else
-                    fa.shape for fa in func_def_args]
-            stride = [fa.strides[::-1] if fa.original_function_argument_variable.order == 'C' else
-                      fa.strides for fa in func_def_args]
-            orig_size = [[PyccelMul(l,s) for l,s in zip(sz, st)] for sz,st in zip(size,stride)]
-            body = [C_F_Pointer(fa.var, func_arg_to_call_arg[fa].base, s)
-                    for fa,s in zip(func_def_args, orig_size)
+            body = [C_F_Pointer(fa.var, func_arg_to_call_arg[fa].base, self._get_array_layout(fa)[0])
+                    for fa in func_def_args
                     if isinstance(func_arg_to_call_arg[fa], IndexedElement)]
             body += [C_F_Pointer(fa.var, func_arg_to_call_arg[fa], [fa.shape[0]])
                     for fa in func_def_args
@@ -154,10 +191,7 @@ class FortranToCWrapper(Wrapper):
         original_arg = bind_c_arg.original_function_argument_variable
         arg_var = self.scope.find(self.scope.get_expected_name(original_arg.name), category='variables')
         if original_arg.is_ndarray:
-            start = LiteralInteger(1) # C_F_Pointer leads to default Fortran lbound
-            stop = None
-            indexes = [Slice(start, stop, step) for step in bind_c_arg.strides]
-            return IndexedElement(arg_var, *indexes)
+            return IndexedElement(arg_var, *self._get_array_layout(bind_c_arg)[1])
         else:
             return arg_var
 
@@ -345,6 +379,9 @@ class FortranToCWrapper(Wrapper):
         """
         var = expr.var
         name = var.name
+        if isinstance(var.class_type, PhiloxGeneratorType):
+            raise errors.report(f"Don't know how to pass an object of type {var.class_type} to C code.",
+                    severity='fatal', symbol = var)
         self.scope.insert_symbol(name)
         collisionless_name = self.scope.get_expected_name(var.name)
         if isinstance(var.class_type, (NumpyNDArrayType, HomogeneousTupleType)) or \
@@ -397,6 +434,9 @@ class FortranToCWrapper(Wrapper):
         """
         var = expr.var
         name = var.name
+        if isinstance(var.class_type, PhiloxGeneratorType):
+            raise errors.report(f"Don't know how to return an object of type {var.class_type} to C code.",
+                    severity='fatal', symbol = var)
         scope = self.scope
         # Make name available for later
         scope.insert_symbol(name)
@@ -589,10 +629,7 @@ class FortranToCWrapper(Wrapper):
             setter_body.append(C_F_Pointer(setter_args[1].var, set_val))
         elif isinstance(set_val, IndexedElement):
             func_arg = setter_args[1]
-            size = func_arg.shape[::-1] if expr.order == 'C' else func_arg.shape
-            stride = func_arg.strides[::-1] if expr.order == 'C' else func_arg.strides
-            orig_size = [PyccelMul(sz,st) for sz,st in zip(size, stride)]
-            setter_body.append(C_F_Pointer(func_arg.var, set_val.base, orig_size))
+            setter_body.append(C_F_Pointer(func_arg.var, set_val.base, self._get_array_layout(func_arg)[0]))
 
         attrib = expr.clone(expr.name, lhs = self_obj)
         # Cast the C variable into a Python variable
@@ -5,6 +5,7 @@
 # go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
 #------------------------------------------------------------------------------------------#
 
+import functools
 import sys
 import os
 import argparse
@@ -115,6 +116,9 @@ def pyccel(files=None, mpi=None, openmp=None, openacc=None, output_dir=None, com
     group.add_argument('--output', type=str, default = '',\
                        help='folder in which the output is stored.')
 
+    group.add_argument('-j', '--jobs', type=int, default = None, metavar = 'N', \
+                       help='also translate the user modules imported by the file, using up to N processes.')
+
     # ...
 
     # ... Accelerators
@@ -125,6 +129,8 @@ def pyccel(files=None, mpi=None, openmp=None, openacc=None, output_dir=None, com
                        help='uses openmp')
     group.add_argument('--openacc', action='store_true', \
                        help='uses openacc')
+    group.add_argument('--blas', action='store_true', \
+                       help='uses the BLAS library from the compiler configuration for matrix products')
     # ...
 
     # ... Other options
@@ -155,6 +161,7 @@ def pyccel(files=None, mpi=None, openmp=None, openacc=None, output_dir=None, com
     from pyccel.errors.errors     import ErrorsMode
     from pyccel.errors.messages   import INVALID_FILE_DIRECTORY, INVALID_FILE_EXTENSION
     from pyccel.codegen.pipeline  import execute_pyccel
+    from pyccel.codegen.scheduler import execute_pyccel_parallel
 
     # ...
     if not files:
@@ -244,6 +251,8 @@ def pyccel(files=None, mpi=None, openmp=None, openacc=None, output_dir=None, com
         accelerators.append("openmp")
     if openacc:
         accelerators.append("openacc")
+    if args.blas:
+        accelerators.append("blas")
 
     # ...
 
@@ -259,31 +268,39 @@ def pyccel(files=None, mpi=None, openmp=None, openacc=None, output_dir=None, com
 
     base_dirpath = os.getcwd()
 
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("the number of jobs must be a positive integer")
+
     if args.language == 'python' and args.output == '':
         print("Cannot output python file to same folder as this would overwrite the original file. Please specify --output")
         sys.exit(1)
 
+    if args.jobs is None:
+        pyccel_executor = execute_pyccel
+    else:
+        pyccel_executor = functools.partial(execute_pyccel_parallel, n_jobs = args.jobs)
+
     try:
         # TODO: prune options
-        execute_pyccel(filename,
-                       syntax_only   = args.syntax_only,
-                       semantic_only = args.semantic_only,
-                       convert_only  = args.convert_only,
-                       verbose       = args.verbose,
-                       show_timings  = args.time_execution,
-                       language      = args.language,
-                       compiler      = compiler,
-                       fflags        = args.flags,
-                       wrapper_flags = args.wrapper_flags,
-                       includes      = args.includes,
-                       libdirs       = args.libdirs,
-                       modules       = (),
-                       libs          = args.libs,
-                       debug         = args.debug,
-                       accelerators  = accelerators,
-                       folder        = args.output,
-                       compiler_export_file = compiler_export_file,
-                       conda_warnings = args.conda_warnings)
+        pyccel_executor(filename,
+                        syntax_only   = args.syntax_only,
+                        semantic_only = args.semantic_only,
+                        convert_only  = args.convert_only,
+                        verbose       = args.verbose,
+                        show_timings  = args.time_execution,
+                        language      = args.language,
+                        compiler      = compiler,
+                        fflags        = args.flags,
+                        wrapper_flags = args.wrapper_flags,
+                        includes      = args.includes,
+                        libdirs       = args.libdirs,
+                        modules       = (),
+                        libs          = args.libs,
+                        debug         = args.debug,
+                        accelerators  = accelerators,
+                        folder        = args.output,
+                        compiler_export_file = compiler_export_file,
+                        conda_warnings = args.conda_warnings)
     except PyccelError:
         sys.exit(1)
     finally:
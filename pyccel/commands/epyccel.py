@@ -6,10 +6,13 @@
 """ File containing functions for calling Pyccel interactively (epyccel and epyccel_seq)
 """
 
+import ast
 import inspect
 import importlib
 import sys
 import os
+import shutil
+import sysconfig
 
 from filelock import FileLock, Timeout
 
@@ -17,8 +20,10 @@ from types import ModuleType, FunctionType
 from importlib.machinery import ExtensionFileLoader
 
 from pyccel.utilities.strings  import random_string
+from pyccel.utilities.cache    import get_cache_dirpath, hash_contents, prune_cache, touch_cache_entry
 from pyccel.codegen.pipeline   import execute_pyccel
 from pyccel.errors.errors      import ErrorsMode, PyccelError
+from pyccel.version            import __version__
 
 __all__ = ['get_source_function', 'epyccel_seq', 'epyccel']
 
@@ -105,6 +110,96 @@ def get_unique_name(prefix, path):
         return get_unique_name(prefix, path)
     return module_name, lock
 
+#==============================================================================
+def get_local_dependencies(code, path, visited = None):
+    """
+    Get the source code of the local modules imported by some code.
+
+    Get the source code of all modules imported (directly or indirectly)
+    by the code which can be found in the folder `path`. These are the
+    modules which would be translated by Pyccel alongside the code.
+
+    Parameters
+    ----------
+    code : str
+        The code whose imports should be examined.
+    path : str
+        The folder in which local modules are searched for.
+    visited : set, optional
+        The files which have already been examined.
+
+    Returns
+    -------
+    dict[str, str]
+        A dictionary whose keys are the files containing the local modules
+        and whose values are the source code found in these files.
+    """
+    if visited is None:
+        visited = {}
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return visited
+
+    module_names = [n.name for i in ast.walk(tree) if isinstance(i, ast.Import) for n in i.names] + \
+                   [i.module or '' for i in ast.walk(tree) if isinstance(i, ast.ImportFrom)]
+
+    for m in module_names:
+        mod_path = os.path.join(path, *m.split('.'))
+        for f in (mod_path + '.py', mod_path + '.pyh', os.path.join(mod_path, '__init__.py')):
+            if os.path.isfile(f) and f not in visited:
+                with open(f, encoding='utf-8') as mod_file:
+                    visited[f] = mod_file.read()
+                get_local_dependencies(visited[f], path, visited)
+
+    return visited
+
+#==============================================================================
+def get_cache_key(code, dirpath, **options):
+    """
+    Get the key describing a compiled module in the epyccel cache.
+
+    Get a hash describing everything that may influence the shared library
+    generated by epyccel. This includes the source code, the source code of
+    the local modules it imports, the Pyccel, Python and NumPy versions and
+    all options passed to `epyccel`.
+
+    Parameters
+    ----------
+    code : str
+        The code which is translated.
+    dirpath : str
+        The folder in which local imports are searched for.
+    **options : dict
+        The options passed to `execute_pyccel`.
+
+    Returns
+    -------
+    str
+        The hexadecimal hash which identifies the module.
+    """
+    import numpy # pylint: disable=import-outside-toplevel
+
+    dependencies = get_local_dependencies(code, dirpath)
+
+    compiler = options.get('compiler', None) or ''
+    if compiler.endswith('.json') and os.path.isfile(compiler):
+        with open(compiler, encoding='utf-8') as compiler_file:
+            compiler = compiler_file.read()
+
+    extra_modules = []
+    for m in options.get('modules', ()):
+        with open(m, 'rb') as module_file:
+            extra_modules.append(module_file.read())
+
+    return hash_contents(code,
+                         *(v for k in sorted(dependencies) for v in (os.path.basename(k), dependencies[k])),
+                         __version__, sys.version, numpy.__version__,
+                         sysconfig.get_config_var('EXT_SUFFIX'),
+                         os.environ.get('PYCCEL_DEFAULT_COMPILER', ''), compiler,
+                         *(f'{k}={options[k]!r}' for k in sorted(options) if k != 'compiler'),
+                         *extra_modules)
+
 #==============================================================================
 def epyccel_seq(function_or_module, *,
                 language      = None,
@@ -121,6 +216,7 @@ def epyccel_seq(function_or_module, *,
                 libs          = (),
                 folder        = None,
                 conda_warnings= 'basic',
+                cache         = False,
                 comm          = None,
                 root          = None,
                 bcast         = None):
@@ -148,7 +244,7 @@ def epyccel_seq(function_or_module, *,
         Flags to be passed to the wrapper code generator.
     accelerators : iterable of str, optional
         Parallel multi-threading acceleration strategy
-        (currently supported: 'mpi', 'openmp', 'openacc').
+        (currently supported: 'mpi', 'openmp', 'openacc', 'blas').
     verbose : bool
         Print additional information (default: False).
     time_execution : bool
@@ -167,6 +263,11 @@ def epyccel_seq(function_or_module, *,
         Output folder for the compiled code.
     conda_warnings : {off, basic, verbose}
         Specify the level of Conda warnings to display (choices: off, basic, verbose), Default is 'basic'.
+    cache : bool, default=False
+        Indicates whether the generated module should be stored in (and retrieved from) the
+        persistent user-level cache (see `pyccel.utilities.cache.get_cache_dirpath`). When a
+        module generated from the same code with the same options is found in the cache, it
+        is imported directly without calling Pyccel.
 
     Returns
     -------
@@ -206,71 +307,108 @@ def epyccel_seq(function_or_module, *,
         pyfunc = function_or_module
         code = get_source_function(pyfunc)
 
-        module_name, module_lock = get_unique_name('mod', epyccel_dirpath)
+        module_prefix = 'mod'
 
     elif isinstance(function_or_module, ModuleType):
         pymod = function_or_module
         lines = inspect.getsourcelines(pymod)[0]
         code = ''.join(lines)
 
-        module_name, module_lock = get_unique_name(pymod.__name__, epyccel_dirpath)
+        module_prefix = pymod.__name__
 
     elif isinstance(function_or_module, str):
         code = function_or_module
 
-        module_name, module_lock = get_unique_name('mod', epyccel_dirpath)
+        module_prefix = 'mod'
 
     else:
         raise TypeError('> Expecting a FunctionType, type or a ModuleType')
 
+    if cache:
+        # The module name is deduced from the hash so it can be found by another process
+        cache_key = get_cache_key(code, dirpath,
+                                  language      = language,
+                                  compiler      = compiler,
+                                  fflags        = fflags,
+                                  wrapper_flags = wrapper_flags,
+                                  accelerators  = sorted(accelerators),
+                                  debug         = debug,
+                                  includes      = [os.path.abspath(i) for i in includes],
+                                  libdirs       = [os.path.abspath(l) for l in libdirs],
+                                  libs          = list(libs))
+        module_name = module_prefix.split('.')[-1] + '_' + cache_key[:32]
+        cache_dirpath = os.path.join(get_cache_dirpath('epyccel'), module_name)
+        module_lock = FileLock(cache_dirpath + '.lock')
+        module_lock.acquire()
+    else:
+        module_name, module_lock = get_unique_name(module_prefix, epyccel_dirpath)
+
     # Try is necessary to ensure lock is released
     try:
-        pymod_filename = '{}.py'.format(module_name)
-        pymod_filepath = os.path.join(dirpath, pymod_filename)
-        # ...
+        module_ext = '.py' if language == 'python' else sysconfig.get_config_var('EXT_SUFFIX')
+        cached_filepath = os.path.join(cache_dirpath, module_name + module_ext) if cache else None
 
-        # Create new directories if not existing
-        os.makedirs(folder, exist_ok=True)
-        os.makedirs(epyccel_dirpath, exist_ok=True)
+        if cache and (module_name in sys.modules or os.path.isfile(cached_filepath)):
+            # Cache hit : use the existing shared library
+            touch_cache_entry(cache_dirpath)
+            import_dirpath = cache_dirpath
+        else:
+            pymod_filename = '{}.py'.format(module_name)
 
-        # Change working directory to '__epyccel__'
-        os.chdir(epyccel_dirpath)
+            # Create new directories if not existing
+            os.makedirs(folder, exist_ok=True)
+            os.makedirs(epyccel_dirpath, exist_ok=True)
 
-        # Store python file in '__epyccel__' folder, so that execute_pyccel can run
-        with open(pymod_filename, 'w') as f:
-            f.writelines(code)
+            # Change working directory to '__epyccel__'
+            os.chdir(epyccel_dirpath)
 
-        try:
-            # Generate shared library
-            execute_pyccel(pymod_filename,
-                           verbose       = verbose,
-                           show_timings  = time_execution,
-                           language      = language,
-                           compiler      = compiler,
-                           fflags        = fflags,
-                           wrapper_flags = wrapper_flags,
-                           includes      = includes,
-                           libdirs       = libdirs,
-                           modules       = modules,
-                           libs          = libs,
-                           debug         = debug,
-                           accelerators  = accelerators,
-                           output_name   = module_name,
-                           conda_warnings= conda_warnings)
-        finally:
-            # Change working directory back to starting point
-            os.chdir(base_dirpath)
+            # Store python file in '__epyccel__' folder, so that execute_pyccel can run
+            with open(pymod_filename, 'w') as f:
+                f.writelines(code)
 
+            try:
+                # Generate shared library
+                execute_pyccel(pymod_filename,
+                               verbose       = verbose,
+                               show_timings  = time_execution,
+                               language      = language,
+                               compiler      = compiler,
+                               fflags        = fflags,
+                               wrapper_flags = wrapper_flags,
+                               includes      = includes,
+                               libdirs       = libdirs,
+                               modules       = modules,
+                               libs          = libs,
+                               debug         = debug,
+                               accelerators  = accelerators,
+                               output_name   = module_name,
+                               conda_warnings= conda_warnings)
+            finally:
+                # Change working directory back to starting point
+                os.chdir(base_dirpath)
+
+            if cache:
+                # Store the shared library in the cache. The copy is renamed once it is
+                # complete so an interrupted copy is never mistaken for a valid entry
+                os.makedirs(cache_dirpath, exist_ok=True)
+                shutil.copyfile(os.path.join(epyccel_dirpath, module_name + module_ext),
+                                cached_filepath + '.tmp')
+                os.replace(cached_filepath + '.tmp', cached_filepath)
+                touch_cache_entry(cache_dirpath)
+                prune_cache(subfolder = 'epyccel')
+                import_dirpath = cache_dirpath
+            else:
+                import_dirpath = epyccel_dirpath
 
         # Import shared library
-        sys.path.insert(0, epyccel_dirpath)
+        sys.path.insert(0, import_dirpath)
 
         # http://ballingt.com/import-invalidate-caches
         # https://docs.python.org/3/library/importlib.html#importlib.invalidate_caches
         importlib.invalidate_caches()
 
         package = importlib.import_module(module_name)
-        sys.path.remove(epyccel_dirpath)
+        sys.path.remove(import_dirpath)
 
         if language != 'python':
             # Verify that we have imported the shared library, not the Python one
@@ -0,0 +1,303 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+File describing the jit decorator which accelerates a function with Pyccel the first time
+it is called with a given set of argument types.
+"""
+import ast
+import functools
+import inspect
+
+import numpy as np
+
+from pyccel.commands.epyccel import epyccel, get_source_function
+from pyccel.errors.errors    import PyccelError
+
+__all__ = ('jit', 'JitFunction', 'get_type_annotation')
+
+#==============================================================================
+def get_type_annotation(value):
+    """
+    Get the Pyccel type annotation describing a Python object.
+
+    Get a string containing the Pyccel type annotation which describes the
+    type of the object passed as argument. The annotation contains the
+    datatype, the rank and (for multi-dimensional arrays) the order.
+
+    Parameters
+    ----------
+    value : object
+        The object whose type should be described.
+
+    Returns
+    -------
+    str
+        The type annotation.
+
+    Raises
+    ------
+    TypeError
+        Raised if the type of the object cannot be described by Pyccel.
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return 'bool'
+    elif isinstance(value, np.generic):
+        return value.dtype.name
+    elif isinstance(value, int):
+        return 'int'
+    elif isinstance(value, float):
+        return 'float'
+    elif isinstance(value, complex):
+        return 'complex'
+    elif isinstance(value, str):
+        return 'str'
+    elif isinstance(value, np.ndarray):
+        if value.ndim == 0:
+            return value.dtype.name
+        annotation = f"{value.dtype.name}[{','.join(':'*value.ndim)}]"
+        if value.ndim > 1 and value.flags.f_contiguous and not value.flags.c_contiguous:
+            annotation += '(order=F)'
+        return annotation
+    elif isinstance(value, tuple) and value:
+        elem_types = {get_type_annotation(v) for v in value}
+        if len(elem_types) == 1:
+            return f'tuple[{elem_types.pop()}, ...]'
+    raise TypeError(f"Cannot infer a Pyccel type for an object of type {type(value).__name__}")
+
+#==============================================================================
+class JitFunction:
+    """
+    Function which is accelerated with Pyccel when it is called.
+
+    A callable object wrapping a pure Python function. When it is called,
+    the types of the arguments are used to generate a type-annotated version
+    of the function which is then accelerated with `epyccel`. The
+    accelerated function is saved in a dispatch table so that the
+    translation only happens the first time that the function is called with
+    a given type signature.
+
+    Parameters
+    ----------
+    func : function
+        The pure Python function to be accelerated. Arguments which are already
+        annotated keep their annotation.
+    **kwargs : dict
+        Additional arguments that are passed to epyccel.
+    """
+    def __init__(self, func, **kwargs):
+        if not inspect.isfunction(func):
+            raise TypeError("Expecting a Python function")
+        self._func = func
+        self._signature = inspect.signature(func)
+        self._kwargs = kwargs
+        self._dispatch_table = {}
+        for p in self._signature.parameters.values():
+            if p.kind in (p.VAR_POSITIONAL, p.VAR_KEYWORD):
+                raise TypeError(f"Variadic argument {p.name} is not supported by Pyccel")
+        functools.update_wrapper(self, func)
+
+    @property
+    def python_function(self):
+        """
+        The pure Python function.
+
+        The pure Python function which is accelerated.
+        """
+        return self._func
+
+    @property
+    def signatures(self):
+        """
+        The type signatures for which the function has been accelerated.
+
+        A tuple containing a description of all the type signatures for which an
+        accelerated function is available. Each signature is a tuple of the type
+        annotations of the arguments which were not annotated by the user.
+        """
+        return tuple(self._dispatch_table.keys())
+
+    def get_annotations(self, *args, **kwargs):
+        """
+        Get the type annotations of the unannotated arguments for a call.
+
+        Get a dictionary mapping the names of the arguments which are not annotated
+        in the original function to the Pyccel type annotations deduced from the
+        arguments of the call. Arguments which are not passed are described by the
+        type of their default value.
+
+        Parameters
+        ----------
+        *args : tuple
+            The positional arguments passed to the function.
+        **kwargs : dict
+            The keyword arguments passed to the function.
+
+        Returns
+        -------
+        dict[str, str]
+            The type annotations of the unannotated arguments.
+        """
+        bound_args = self._signature.bind(*args, **kwargs)
+        annotations = {}
+        for name, p in self._signature.parameters.items():
+            if p.annotation is not p.empty:
+                continue
+            value = bound_args.arguments.get(name, p.default)
+            if value is None:
+                raise TypeError(f"Cannot infer the type of argument {name} from the value None. " +
+                                "Please provide a type annotation for this argument.")
+            annotations[name] = get_type_annotation(value)
+        return annotations
+
+    def get_annotated_source(self, annotations):
+        """
+        Get the source code of the function with the specified type annotations.
+
+        Get the source code of the function where the unannotated arguments are
+        annotated with the types described by the argument. The jit decorator is
+        removed from the code. Comments (e.g. OpenMP pragmas) are preserved.
+
+        Parameters
+        ----------
+        annotations : dict[str, str]
+            A dictionary mapping the names of the arguments to their type annotations.
+
+        Returns
+        -------
+        str
+            The annotated source code.
+        """
+        code = get_source_function(self._func)
+        func_def = ast.parse(code).body[0]
+        lines = code.split('\n')
+
+        args = func_def.args
+        edits = [(a.end_lineno, a.end_col_offset, f' : "{annotations[a.arg]}"') \
+                    for a in (*args.posonlyargs, *args.args, *args.kwonlyargs) if a.arg in annotations]
+        for lineno, col, text in sorted(edits, reverse=True):
+            line = lines[lineno-1]
+            lines[lineno-1] = line[:col] + text + line[col:]
+
+        jit_decorators = [d for d in func_def.decorator_list if _is_jit_decorator(d)]
+        for d in reversed(jit_decorators):
+            del lines[d.lineno-1:d.end_lineno]
+
+        return '\n'.join(lines)
+
+    def compile(self, *args, **kwargs):
+        """
+        Accelerate the function for the types of the provided arguments.
+
+        Get the accelerated version of the function which can be called with the
+        provided arguments. If such a function has not yet been generated then
+        the function is translated and compiled with Pyccel.
+
+        Parameters
+        ----------
+        *args : tuple
+            The positional arguments passed to the function.
+        **kwargs : dict
+            The keyword arguments passed to the function.
+
+        Returns
+        -------
+        function
+            The accelerated function.
+        """
+        annotations = self.get_annotations(*args, **kwargs)
+        key = tuple(annotations.values())
+        try:
+            return self._dispatch_table[key]
+        except KeyError:
+            pass
+
+        code = self.get_annotated_source(annotations)
+        try:
+            package = epyccel(code, **self._kwargs)
+        except PyccelError as e:
+            raise type(e)(str(e)) from None
+
+        func = getattr(package, self._func.__name__)
+        self._dispatch_table[key] = func
+        return func
+
+    def __call__(self, *args, **kwargs):
+        return self.compile(*args, **kwargs)(*args, **kwargs)
+
+    def __repr__(self):
+        return f'JitFunction({self._func.__qualname__})'
+
+#==============================================================================
+def _is_jit_decorator(decorator):
+    """
+    Determine if an AST node describes the jit decorator.
+
+    Determine if an AST node from a function's decorator list describes the
+    jit decorator (e.g. `@jit`, `@pyccel.jit` or `@jit(language='c')`).
+
+    Parameters
+    ----------
+    decorator : ast.expr
+        The decorator.
+
+    Returns
+    -------
+    bool
+        True if the decorator is the jit decorator, False otherwise.
+    """
+    if isinstance(decorator, ast.Call):
+        decorator = decorator.func
+    if isinstance(decorator, ast.Attribute):
+        return decorator.attr == 'jit'
+    return isinstance(decorator, ast.Name) and decorator.id == 'jit'
+
+#==============================================================================
+def jit(func = None, **kwargs):
+    """
+    Accelerate a Python function with Pyccel when it is first called.
+
+    Decorator which accelerates a function with Pyccel using the types of the
+    arguments passed to the function. No type annotations are required. The
+    function is translated the first time that it is called with a given type
+    signature (datatype, rank and order of each argument). Subsequent calls
+    with the same type signature use the accelerated function directly. This
+    avoids compiling all possible combinations of the types described in
+    `@template` decorators when only a few are used.
+
+    Parameters
+    ----------
+    func : function, optional
+        The function to be accelerated. If this argument is not provided then
+        a decorator is returned (e.g. `@jit(language='c')`).
+    **kwargs : dict
+        Additional arguments that are passed to epyccel.
+
+    Returns
+    -------
+    JitFunction | function
+        An object which can be called in place of the original function, or a
+        decorator creating such an object.
+
+    See Also
+    --------
+    epyccel
+        The function that accelerates the generated code.
+
+    Examples
+    --------
+    >>> from pyccel import jit
+    >>> @jit(language='c')
+    ... def axpy(a, x, y):
+    ...     y[:] = a*x + y
+    >>> import numpy as np
+    >>> x = np.ones(4); y = np.ones(4)
+    >>> axpy(2.0, x, y)
+    >>> y
+    array([3., 3., 3., 3.])
+    """
+    if func is None:
+        return lambda f: JitFunction(f, **kwargs)
+    return JitFunction(func, **kwargs)
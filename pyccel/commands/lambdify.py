@@ -6,7 +6,7 @@ import sympy as sp
 from packaging import version
 
 from pyccel.commands.epyccel  import epyccel
-from pyccel.utilities.strings import random_string
+from pyccel.utilities.cache   import hash_contents
 from pyccel.errors.errors     import PyccelError
 
 if version.parse(sp.__version__) >= version.parse('1.8'):
@@ -14,8 +14,160 @@ if version.parse(sp.__version__) >= version.parse('1.8'):
 else:
     from sympy.printing.pycode import NumPyPrinter
 
+__all__ = ('lambdify', 'lambdify_batch')
+
+# Functions which have already been compiled in this session, indexed by the
+# key returned by `_get_cache_key`
+_compiled_functions = {}
+
+def _check_arguments(args, result_type, templates, use_out):
+    """
+    Check the types of the arguments passed to `lambdify`.
+
+    Check the types of the arguments passed to `lambdify` or `lambdify_batch`
+    and raise a TypeError if they are not valid.
+
+    Parameters
+    ----------
+    args : dict[sp.Symbol, str]
+        A dictionary of the arguments of the function being created.
+    result_type : str, optional
+        The type annotation for the result of the function.
+    templates : dict[str, list[str]], optional
+        A description of any templates that should be added to the function.
+    use_out : bool
+        Indicates whether the result is saved in an argument called 'out'.
+    """
+    if not (isinstance(args, dict) and all(isinstance(k, sp.Symbol) and isinstance(v, str) for k,v in args.items())):
+        raise TypeError("Argument 'args': Expected a dictionary mapping SymPy symbols to string type annotations.")
+    if result_type is not None and not isinstance(result_type, str):
+        raise TypeError("Argument 'result_type': Expected a string type annotation.")
+    if use_out and not result_type:
+        raise TypeError("The result_type must be provided if use_out is true.")
+    if templates:
+        if not (isinstance(templates, dict) and all(isinstance(k, str) and hasattr(v, '__iter__') for k,v in templates.items()) \
+                and all(all(isinstance(type_annot, str) for type_annot in v) for v in templates.values())):
+            raise TypeError("Argument 'templates': Expected a dictionary mapping strings describing type specifiers to lists of string type annotations.")
+
+def _get_cache_key(expr, args, result_type, templates, use_out, use_cse, kwargs):
+    """
+    Get the key describing a function created by `lambdify`.
+
+    Get a hash describing everything that influences the function generated
+    from a SymPy expression. The expression is described by its canonical
+    representation (`sympy.srepr`) so equal expressions share the same key.
+
+    Parameters
+    ----------
+    expr : sp.Expr
+        The SymPy expression that should be returned from the function.
+    args : dict[sp.Symbol, str]
+        A dictionary of the arguments of the function being created.
+    result_type : str, optional
+        The type annotation for the result of the function.
+    templates : dict[str, list[str]], optional
+        A description of any templates that should be added to the function.
+    use_out : bool
+        Indicates whether the result is saved in an argument called 'out'.
+    use_cse : bool
+        Indicates whether common subexpressions are eliminated.
+    kwargs : dict
+        Additional arguments that are passed to epyccel.
+
+    Returns
+    -------
+    str
+        The hexadecimal hash which identifies the function.
+    """
+    return hash_contents(sp.srepr(expr),
+                         *(f'{sp.srepr(a)} : {annot}' for a, annot in args.items()),
+                         result_type,
+                         *(f'{k} : {list(v)}' for k, v in (templates or {}).items()),
+                         use_out, use_cse,
+                         *(f'{k}={kwargs[k]!r}' for k in sorted(kwargs)))
+
+def _get_function_code(func_name, expr, args, result_type, templates, use_out, use_cse):
+    """
+    Get the code of the function evaluating a SymPy expression.
+
+    Get the Python code of a function which evaluates a SymPy expression.
+    The code is generated using SymPy's NumPyPrinter and uses the `numpy`
+    module which must be imported by the enclosing module.
+
+    Parameters
+    ----------
+    func_name : str
+        The name of the function.
+    expr : sp.Expr
+        The SymPy expression that should be returned from the function.
+    args : dict[sp.Symbol, str]
+        A dictionary of the arguments of the function being created.
+    result_type : str, optional
+        The type annotation for the result of the function.
+    templates : dict[str, list[str]], optional
+        A description of any templates that should be added to the function.
+    use_out : bool
+        Indicates whether the result is saved in an argument called 'out'.
+    use_cse : bool
+        Indicates whether common subexpressions should be computed once and
+        saved in temporary variables.
+
+    Returns
+    -------
+    str
+        The code of the function.
+    """
+    printer = NumPyPrinter()
+    args_code = ', '.join(f'{a} : "{annot}"' for a, annot in args.items())
+
+    if use_cse:
+        # Choose a prefix for the temporaries which cannot clash with the arguments
+        prefix = 'cse'
+        while any(str(a).startswith(prefix) for a in args):
+            prefix += '_'
+        replacements, (result,) = sp.cse(expr, symbols = sp.numbered_symbols(prefix))
+    else:
+        replacements, result = [], expr
+
+    docstring = " \n".join(('    """',
+            "    Expression evaluation created with `pyccel.lambdify`.",
+            "",
+            "    Function evaluating the expression:",
+           f"    {printer.doprint(expr)}",
+            "",
+            "    Parameters",
+            "    ----------\n"))
+    docstring += '\n'.join(f"    {a} : {type_annot}" for a, type_annot in args.items())
+
+    if use_out:
+        signature = f'def {func_name}({args_code}, out : "{result_type}"):'
+        docstring += f"\n    out : {result_type}"
+    elif result_type:
+        signature = f'def {func_name}({args_code}) -> "{result_type}":'
+        docstring += "\n".join(("\n",
+                    "     Returns",
+                    "     -------",
+                   f"     {result_type}"))
+    else:
+        signature = f'def {func_name}({args_code}):'
+    if templates:
+        decorators = '\n'.join(f'@template("{key}", ['+', '.join(f'"{annot}"' for annot in annotations)+'])' \
+                for key, annotations in templates.items())
+    else:
+        decorators = ''
+
+    code = [f'    {tmp} = {printer.doprint(value)}' for tmp, value in replacements]
+    if use_out:
+        code.append(f'    out[:] = {printer.doprint(result)}')
+    else:
+        code.append(f'    return {printer.doprint(result)}')
+
+    docstring += '\n    """'
+
+    return '\n'.join((decorators, signature, docstring, *code))
+
 def lambdify(expr : sp.Expr, args : 'dict[sp.Symbol, str]', *, result_type : str = None,
-             templates : 'dict[str, list[str]]' = None, use_out = False,
+             templates : 'dict[str, list[str]]' = None, use_out = False, use_cse = False,
              **kwargs):
     """
     Convert a SymPy expression into a Pyccel-accelerated function.
@@ -24,6 +176,13 @@ def lambdify(expr : sp.Expr, args : 'dict[sp.Symbol, str]', *, result_type : str
     numeric evaluation. This is done using SymPy's NumPyPrinter to
     generate code that can be accelerated by Pyccel.
 
+    The compiled functions are saved for the rest of the session. If the same
+    expression is lambdified again with the same types and options, then the
+    previously compiled function is returned. The name of the generated
+    function only depends on the expression, the types and the options, so
+    the persistent cache of `epyccel` can be used between sessions by passing
+    `cache = True`.
+
     Parameters
     ----------
     expr : sp.Expr
@@ -51,6 +210,10 @@ def lambdify(expr : sp.Expr, args : 'dict[sp.Symbol, str]', *, result_type : str
         of returning a newly allocated array. If this argument is set then
         result_type must be provided. This only works if the result is an
         array type.
+    use_cse : bool, default=False
+        If true the common subexpressions are found with `sympy.cse`. They
+        are computed once and saved in temporary variables before the
+        expression is evaluated.
     **kwargs : dict
         Additional arguments that are passed to epyccel.
 
@@ -64,64 +227,74 @@ def lambdify(expr : sp.Expr, args : 'dict[sp.Symbol, str]', *, result_type : str
     --------
     sympy.lambdify
         <https://docs.sympy.org/latest/modules/utilities/lambdify.html>.
+    lambdify_batch
+        The function that converts several expressions at once.
     epyccel
         The function that accelerates the generated code.
     """
-    if not (isinstance(args, dict) and all(isinstance(k, sp.Symbol) and isinstance(v, str) for k,v in args.items())):
-        raise TypeError("Argument 'args': Expected a dictionary mapping SymPy symbols to string type annotations.")
-    if result_type is not None and not isinstance(result_type, str):
-        raise TypeError("Argument 'result_type': Expected a string type annotation.")
+    return lambdify_batch([expr], args, result_type = result_type, templates = templates,
+                          use_out = use_out, use_cse = use_cse, **kwargs)[0]
 
-    expr = NumPyPrinter().doprint(expr)
-    args_code = ', '.join(f'{a} : "{annot}"' for a, annot in args.items())
-    func_name = 'func_'+random_string(8)
+def lambdify_batch(exprs : 'list[sp.Expr]', args : 'dict[sp.Symbol, str]', *, result_type : str = None,
+             templates : 'dict[str, list[str]]' = None, use_out = False, use_cse = False,
+             **kwargs):
+    """
+    Convert several SymPy expressions into Pyccel-accelerated functions.
 
-    docstring = " \n".join(('    """',
-            "    Expression evaluation created with `pyccel.lambdify`.",
-            "",
-            "    Function evaluating the expression:",
-           f"    {expr}",
-            "",
-            "    Parameters",
-            "    ----------\n"))
-    docstring += '\n'.join(f"    {a} : {type_annot}" for a, type_annot in args.items())
+    Convert several SymPy expressions with the same arguments into functions
+    that allow for fast numeric evaluation (see `lambdify`). The functions
+    which have not already been compiled in this session are all placed in
+    the same module so Pyccel and the compiler are only called once.
 
-    if use_out:
-        if not result_type:
-            raise TypeError("The result_type must be provided if use_out is true.")
-        else:
-            signature = f'def {func_name}({args_code}, out : "{result_type}"):'
-            docstring += f"\n    out : {result_type}"
-    elif result_type:
-        signature = f'def {func_name}({args_code}) -> "{result_type}":'
-        docstring += "\n".join(("\n",
-                    "     Returns",
-                    "     -------",
-                   f"     {result_type}"))
-    else:
-        signature = f'def {func_name}({args_code}):'
-    if templates:
-        if not (isinstance(templates, dict) and all(isinstance(k, str) and hasattr(v, '__iter__') for k,v in templates.items()) \
-                and all(all(isinstance(type_annot, str) for type_annot in v) for v in templates.values())):
-            raise TypeError("Argument 'templates': Expected a dictionary mapping strings describing type specifiers to lists of string type annotations.")
+    Parameters
+    ----------
+    exprs : iterable of sp.Expr
+        The SymPy expressions that should be returned from the functions.
+    args : dict[sp.Symbol, str]
+        A dictionary of the arguments of the functions being created.
+        The keys are variables representing the arguments that will be
+        passed to the functions. The values are the the type annotations
+        for those functions.
+    result_type : str, optional
+        The type annotation for the result of the functions.
+    templates : dict[str, list[str]], optional
+        A description of any templates that should be added to the
+        functions.
+    use_out : bool, default=False
+        If true the functions will modify an argument called 'out' instead
+        of returning a newly allocated array.
+    use_cse : bool, default=False
+        If true the common subexpressions of each expression are computed
+        once and saved in temporary variables.
+    **kwargs : dict
+        Additional arguments that are passed to epyccel.
 
-        decorators = '\n'.join(f'@template("{key}", ['+', '.join(f'"{annot}"' for annot in annotations)+'])' \
-                for key, annotations in templates.items())
-    else:
-        decorators = ''
-    if use_out:
-        code = f'    out[:] = {expr}'
-    else:
-        code = f'    return {expr}'
-    numpy_import = 'import numpy\n'
+    Returns
+    -------
+    list[func]
+        The Pyccel-accelerated functions which allow the evaluation of the
+        SymPy expressions, in the same order as the expressions.
 
-    docstring += '\n    """'
+    See Also
+    --------
+    lambdify
+        The function that converts one expression.
+    """
+    _check_arguments(args, result_type, templates, use_out)
+
+    keys = [_get_cache_key(e, args, result_type, templates, use_out, use_cse, kwargs) for e in exprs]
 
-    func = '\n'.join((numpy_import, decorators, signature, docstring, code))
-    try:
-        package = epyccel(func, **kwargs)
-    except PyccelError as e:
-        raise type(e)(str(e)) from None
+    missing = {k : e for k, e in zip(keys, exprs) if k not in _compiled_functions}
+    if missing:
+        func_names = {k : 'func_'+k[:16] for k in missing}
+        functions = [_get_function_code(func_names[k], e, args, result_type, templates, use_out, use_cse)
+                     for k, e in missing.items()]
+        code = '\n\n'.join(('import numpy\n', *functions))
+        try:
+            package = epyccel(code, **kwargs)
+        except PyccelError as e:
+            raise type(e)(str(e)) from None
 
-    return getattr(package, func_name)
+        _compiled_functions.update((k, getattr(package, name)) for k, name in func_names.items())
 
+    return [_compiled_functions[k] for k in keys]
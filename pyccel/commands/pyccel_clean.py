@@ -10,6 +10,8 @@ import shutil
 import sysconfig
 from argparse import ArgumentParser
 
+from pyccel.utilities.cache import prune_cache, get_cache_max_size
+
 ext_suffix = sysconfig.get_config_var('EXT_SUFFIX')
 
 def pyccel_clean(path_dir = None, recursive = True, remove_shared_libs = False, remove_programs = False):
@@ -73,6 +75,8 @@ def pyccel_clean_command():
             help='Also remove any libraries generated by Python from the folder. Beware this may remove shared libraries generated by tools other than pyccel')
     parser.add_argument('-p', '--remove-programs', action='store_true',
             help='Also remove any programs from the folder. Beware this may remove programs unrelated to pyccel')
+    parser.add_argument('-c', '--prune-cache', metavar='SIZE', nargs='?', const=get_cache_max_size(), default=None,
+            help='Remove the least recently used entries from the user-level Pyccel cache until it occupies at most SIZE (e.g. 500M, 2G, 0 to empty the cache). If SIZE is not provided then PYCCEL_CACHE_SIZE (default 1G) is used. If no folders are provided then only the cache is cleaned')
     args = parser.parse_args()
 
     folders = args.folders
@@ -80,6 +84,11 @@ def pyccel_clean_command():
     remove_libs = args.remove_libs
     remove_programs = args.remove_programs
 
+    if args.prune_cache is not None:
+        prune_cache(args.prune_cache)
+        if len(folders)==0:
+            return
+
     if len(folders)==0:
         pyccel_clean(None, recursive, remove_libs, remove_programs)
     else:
@@ -32,6 +32,10 @@ gfort_info = {'exec' : 'gfortran',
               'openacc': {
                   'flags' : ("-ta=multicore", "-Minfo=accel"),
                   },
+              'blas': {
+                  'flags' : ('-fexternal-blas',),
+                  'libs'  : ('blas',),
+                  },
               'family': 'GNU',
               }
 
@@ -58,6 +62,10 @@ ifort_info = {'exec' : 'ifx',
               'openacc': {
                   'flags' : ("-ta=multicore", "-Minfo=accel"),
                   },
+              'blas': {
+                  'flags' : ('-qopt-matmul',),
+                  'libs'  : ('mkl_rt',),
+                  },
               'family': 'intel',
               }
 
@@ -76,6 +84,9 @@ pgfortran_info = {'exec' : 'pgfortran',
               'openacc': {
                   'flags' : ("-acc"),
                   },
+              'blas': {
+                  'libs'  : ('blas',),
+                  },
               'family': 'PGI',
               }
 
@@ -94,6 +105,9 @@ nvfort_info = {'exec' : 'nvfort',
               'openacc': {
                   'flags' : ("-acc"),
                   },
+              'blas': {
+                  'libs'  : ('blas',),
+                  },
               'family': 'nvidia',
               }
 
@@ -114,6 +128,10 @@ gcc_info = {'exec' : 'gcc',
             'openacc': {
                 'flags' : ("-ta=multicore", "-Minfo=accel"),
                 },
+            'blas': {
+                'flags' : ('-DPYCCEL_USE_BLAS',),
+                'libs'  : ('blas',),
+                },
             'family': 'GNU',
             }
 
@@ -149,6 +167,10 @@ icc_info = {'exec' : 'icx',
             'openacc': {
                 'flags' : ("-ta=multicore", "-Minfo=accel"),
                 },
+            'blas': {
+                'flags' : ('-DPYCCEL_USE_BLAS',),
+                'libs'  : ('mkl_rt',),
+                },
             'family': 'intel',
             }
 
@@ -166,6 +188,10 @@ pgcc_info = {'exec' : 'pgcc',
             'openacc': {
                 'flags' : ("-acc"),
                 },
+            'blas': {
+                'flags' : ('-DPYCCEL_USE_BLAS',),
+                'libs'  : ('blas',),
+                },
             'family': 'PGI',
             }
 
@@ -183,6 +209,10 @@ nvc_info = {'exec' : 'nvc',
             'openacc': {
                 'flags' : ("-acc"),
                 },
+            'blas': {
+                'flags' : ('-DPYCCEL_USE_BLAS',),
+                'libs'  : ('blas',),
+                },
             'family': 'nvidia',
             }
 #------------------------------------------------------------
@@ -6,5 +6,6 @@
     This module is for exposing the CudaSubmodule functions.
 """
 from .cuda_sync_primitives    import synchronize
+from .cuda_thread_indexing    import threadIdx, blockIdx, blockDim
 
-__all__ = ['synchronize']
+__all__ = ['synchronize', 'threadIdx', 'blockIdx', 'blockDim']
@@ -0,0 +1,158 @@
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/master/LICENSE for full license details.     #
+#------------------------------------------------------------------------------------------#
+"""
+This module contains the emulation of kernel launches used when the code is run in Python.
+
+The blocks of a kernel launch are distributed over a pool of Python threads and
+run concurrently. The CUDA threads of a block are run one after the other by
+the Python thread which runs the block. As on a GPU, kernel launches are
+asynchronous: the launch returns once the blocks have been submitted and
+`wait_for_kernels` (called by `cuda.synchronize`) must be used to wait for
+their completion. Kernels are run in the order in which they are launched.
+An exception raised by a kernel is raised again by `wait_for_kernels`, i.e.
+by `cuda.synchronize`, by the next kernel launch, or when the interpreter
+exits if neither of these is called.
+
+The number of Python threads in the pool can be chosen with the environment
+variable PYCCEL_CUDA_EMULATION_THREADS. By default the number of CPUs is used.
+"""
+import atexit
+import os
+import sys
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from .cuda_thread_indexing import CudaThreadIndexing, get_current_indexing
+
+__all__ = ['launch_kernel', 'wait_for_kernels']
+
+_lock = threading.Lock()
+_executor = None
+_num_workers = None
+_pending_blocks = []
+
+def _get_executor():
+    """
+    Get the pool of Python threads which run the blocks.
+
+    Get the pool of Python threads which run the blocks. The pool is created
+    the first time that it is needed.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+        The pool of Python threads.
+    int
+        The number of Python threads in the pool.
+    """
+    global _executor, _num_workers # pylint: disable=global-statement
+    with _lock:
+        if _executor is None:
+            _num_workers = max(1, int(os.environ.get('PYCCEL_CUDA_EMULATION_THREADS', os.cpu_count() or 1)))
+            _executor = ThreadPoolExecutor(max_workers = _num_workers,
+                                           thread_name_prefix = 'pyccel_cuda_block')
+        return _executor, _num_workers
+
+def _run_blocks(f, blocks, num_threads, args, kwargs):
+    """
+    Run all the CUDA threads of some blocks of a kernel launch.
+
+    Run all the CUDA threads of some blocks of a kernel launch in the calling
+    Python thread. The indexing of the CUDA thread being run is made available
+    to the `cuda` functions through a `CudaThreadIndexing` context.
+
+    Parameters
+    ----------
+    f : function
+        The Python function which implements the kernel.
+    blocks : iterable of int
+        The indices of the blocks which should be run.
+    num_threads : int
+        The number of threads in each block.
+    args : tuple
+        The positional arguments passed to the kernel.
+    kwargs : dict
+        The keyword arguments passed to the kernel.
+    """
+    with CudaThreadIndexing(0, 0, num_threads) as indexing:
+        for b in blocks:
+            for t in range(num_threads):
+                indexing.move_to(b, t)
+                f(*args, **kwargs)
+
+def launch_kernel(f, num_blocks, num_threads, args, kwargs):
+    """
+    Launch a kernel.
+
+    Launch a kernel on a grid of `num_blocks` blocks of `num_threads` threads.
+    The blocks are submitted to the pool of Python threads and the function
+    returns without waiting for them to finish. Any previous kernel launch is
+    completed first, and an exception raised by a previous kernel is raised
+    again before the new kernel is launched. If the launch is made from inside
+    a kernel, the blocks are run immediately by the calling Python thread.
+
+    Parameters
+    ----------
+    f : function
+        The Python function which implements the kernel.
+    num_blocks : int
+        The number of blocks in the grid.
+    num_threads : int
+        The number of threads in each block.
+    args : tuple
+        The positional arguments passed to the kernel.
+    kwargs : dict
+        The keyword arguments passed to the kernel.
+    """
+    if get_current_indexing() is not None:
+        _run_blocks(f, range(num_blocks), num_threads, args, kwargs)
+        return
+
+    wait_for_kernels()
+
+    executor, num_workers = _get_executor()
+    # Each task runs a strided subset of the blocks so large grids only create a few tasks
+    num_tasks = min(num_blocks, 4*num_workers)
+    futures = [executor.submit(_run_blocks, f, range(i, num_blocks, num_tasks), num_threads, args, kwargs)
+               for i in range(num_tasks)]
+    with _lock:
+        _pending_blocks.extend(futures)
+
+def wait_for_kernels():
+    """
+    Wait for the completion of all the kernels which have been launched.
+
+    Wait for the completion of all the blocks which have been submitted to
+    the pool of Python threads. If a kernel raised an exception, the first
+    exception raised is raised again here once all the blocks have finished.
+    The function returns immediately when it is called from inside a kernel.
+    """
+    if get_current_indexing() is not None:
+        return
+
+    with _lock:
+        pending = _pending_blocks.copy()
+        _pending_blocks.clear()
+
+    errors = [e for e in (future.exception() for future in pending) if e is not None]
+    if errors:
+        raise errors[0]
+
+def _report_pending_errors():
+    """
+    Report the exceptions raised by kernels which were never synchronised.
+
+    Report the exceptions raised by kernels whose completion was never waited
+    for (see `wait_for_kernels`). This function is called when the interpreter
+    exits so that these exceptions are not lost silently.
+    """
+    try:
+        wait_for_kernels()
+    except Exception as e: # pylint: disable=broad-exception-caught
+        print('Exception raised by a kernel which was never synchronised:', file=sys.stderr)
+        traceback.print_exception(type(e), e, e.__traceback__)
+
+atexit.register(_report_pending_errors)
@@ -5,12 +5,15 @@
 """
 This submodule contains CUDA methods for Pyccel.
 """
-
+from .cuda_emulation import wait_for_kernels
 
 def synchronize():
     """
     Synchronize CUDA device execution.
 
-    Synchronize CUDA device execution.
+    Synchronize CUDA device execution. When the code is run in Python, this
+    waits for the completion of all the kernels which have been launched and
+    raises any exception which was raised by one of them.
     """
+    wait_for_kernels()
 
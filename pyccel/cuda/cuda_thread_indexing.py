@@ -5,11 +5,24 @@
 """
 This module contains all the CUDA thread indexing methods
 """
+import threading
+
+__all__ = ['CudaThreadIndexing', 'blockDim', 'blockIdx', 'threadIdx']
+
+_current = threading.local()
+
 class CudaThreadIndexing:
     """
     Class representing the CUDA thread indexing.
 
-    Class representing the CUDA thread indexing.
+    Class representing the CUDA thread indexing. When the kernels are run
+    in Python, an instance of this class is used as a context manager
+    around the execution of each CUDA thread. Inside this context the
+    indices of the thread can be obtained from the functions `threadIdx`,
+    `blockIdx` and `blockDim` of this module. The context is local to the
+    Python thread so several CUDA threads can be emulated concurrently.
+    Only one-dimensional grids can be launched so the indices in the y- and
+    z-dimensions are always 0 and the block size in these dimensions is 1.
 
     Parameters
     ----------
@@ -18,8 +31,41 @@ class CudaThreadIndexing:
 
     thread_idx : int
         The index of the thread in the x-dimension.
+
+    block_dim : int, default=1
+        The number of threads in a block in the x-dimension.
     """
-    def __init__(self, block_idx, thread_idx):
+    def __init__(self, block_idx, thread_idx, block_dim = 1):
+        self._block_idx = block_idx
+        self._thread_idx = thread_idx
+        self._block_dim = block_dim
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = getattr(_current, 'indexing', None)
+        _current.indexing = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current.indexing = self._previous
+        self._previous = None
+
+    def move_to(self, block_idx, thread_idx):
+        """
+        Change the thread described by this indexing.
+
+        Change the indices of the thread described by this indexing. This
+        allows the threads of several blocks to be run one after the other
+        inside the same context.
+
+        Parameters
+        ----------
+        block_idx : int
+            The index of the block in the x-dimension.
+
+        thread_idx : int
+            The index of the thread in the x-dimension.
+        """
         self._block_idx = block_idx
         self._thread_idx = thread_idx
 
@@ -42,7 +88,7 @@ class CudaThreadIndexing:
         int
             The index of the thread in the specified dimension of its block.
         """
-        return self._thread_idx
+        return self._thread_idx if dim == 0 else 0
 
     def blockIdx(self, dim):
         """
@@ -63,7 +109,7 @@ class CudaThreadIndexing:
         int
             The index of the block in the specified dimension.
         """
-        return self._block_idx
+        return self._block_idx if dim == 0 else 0
 
     def blockDim(self, dim):
         """
@@ -84,5 +130,101 @@ class CudaThreadIndexing:
         int
             The size of the block in the specified dimension.
         """
-        return 0
+        return self._block_dim if dim == 0 else 1
+
+def get_current_indexing():
+    """
+    Get the indexing of the CUDA thread being emulated by this Python thread.
+
+    Get the indexing of the CUDA thread being emulated by this Python thread.
+    This is the innermost `CudaThreadIndexing` context which was entered
+    by this Python thread.
+
+    Returns
+    -------
+    CudaThreadIndexing | None
+        The indexing of the CUDA thread or None if this Python thread is not
+        running a kernel.
+    """
+    return getattr(_current, 'indexing', None)
+
+def _outside_kernel(name):
+    """
+    Raise the error reported when an indexing function is called outside a kernel.
+
+    Raise the error reported when an indexing function is called by a Python
+    thread which is not running a kernel.
+
+    Parameters
+    ----------
+    name : str
+        The name of the function which was called.
+    """
+    raise RuntimeError(f"cuda.{name} can only be called from a kernel")
+
+def threadIdx(dim):
+    """
+    Get the index of the current thread in its block.
+
+    Get the index of the CUDA thread which is being run by the calling
+    Python thread.
+
+    Parameters
+    ----------
+    dim : int
+        The dimension of the indexing (0, 1 or 2 for x, y or z).
+
+    Returns
+    -------
+    int
+        The index of the thread in the specified dimension of its block.
+    """
+    indexing = getattr(_current, 'indexing', None)
+    if indexing is None:
+        _outside_kernel('threadIdx')
+    return indexing.threadIdx(dim)
+
+def blockIdx(dim):
+    """
+    Get the index of the block of the current thread.
+
+    Get the index of the block of the CUDA thread which is being run by the
+    calling Python thread.
+
+    Parameters
+    ----------
+    dim : int
+        The dimension of the indexing (0, 1 or 2 for x, y or z).
+
+    Returns
+    -------
+    int
+        The index of the block in the specified dimension.
+    """
+    indexing = getattr(_current, 'indexing', None)
+    if indexing is None:
+        _outside_kernel('blockIdx')
+    return indexing.blockIdx(dim)
+
+def blockDim(dim):
+    """
+    Get the size of the block of the current thread.
+
+    Get the number of threads in the block of the CUDA thread which is being
+    run by the calling Python thread.
+
+    Parameters
+    ----------
+    dim : int
+        The dimension of the indexing (0, 1 or 2 for x, y or z).
+
+    Returns
+    -------
+    int
+        The size of the block in the specified dimension.
+    """
+    indexing = getattr(_current, 'indexing', None)
+    if indexing is None:
+        _outside_kernel('blockDim')
+    return indexing.blockDim(dim)
 
@@ -6,7 +6,7 @@
 """
 This module contains all the provided decorator methods.
 """
-from pyccel.cuda.cuda_thread_indexing import CudaThreadIndexing
+from pyccel.cuda.cuda_emulation import launch_kernel
 import warnings
 
 __all__ = (
@@ -15,6 +15,7 @@ __all__ = (
     'device',
     'elemental',
     'inline',
+    'parallel_arrays',
     'private',
     'pure',
     'stack_array',
@@ -113,6 +114,35 @@ def allow_negative_index(f,*args):
         return f
     return identity
 
+def parallel_arrays(f = None, *, threshold = 10000):
+    """
+    Decorator indicating that the array expressions of the function should be parallelised.
+
+    Decorator indicating that the loops used to evaluate the array expressions
+    of the function (e.g. `c[:] = a[:] * b[:] + d`) should be parallelised with
+    OpenMP. The reductions `numpy.sum`, `numpy.max` and `numpy.min` of arrays
+    are also parallelised. The decorator can be used with or without
+    arguments. It only has an effect when the code is compiled with OpenMP
+    (i.e. with the flag `--openmp`).
+
+    Parameters
+    ----------
+    f : Function, optional
+        The function to which the decorator is applied.
+    threshold : int, default=10000
+        The minimum number of iterations of a loop for which the loop is run in
+        parallel. Smaller loops are run by a single thread to avoid the overhead
+        of starting the threads.
+
+    Returns
+    -------
+    Function | decorator
+        The unmodified function if it is provided, the identity decorator otherwise.
+    """
+    if f is None:
+        return lambda f: f
+    return f
+
 def kernel(f):
     """
     Decorator for marking a Python function as a kernel.
@@ -145,18 +175,11 @@ def kernel(f):
                 """
                 The internal loop for kernel execution.
 
-                The internal loop for kernel execution.
+                The internal loop for kernel execution. The blocks are run
+                concurrently by a pool of Python threads and the launch is
+                asynchronous (see `pyccel.cuda.cuda_emulation`).
                 """
-                for b in range(num_blocks):
-                    for t in range(num_threads):
-                        cu = CudaThreadIndexing(b, t)
-                        if 'cuda' in self._f.__globals__:
-                            self._f.__globals__['cuda'].threadIdx = cu.threadIdx
-                            self._f.__globals__['cuda'].blockIdx = cu.blockIdx
-                            self._f.__globals__['cuda'].blockDim = cu.blockDim
-                        else:
-                            self._f.__globals__['cuda'] = cu
-                        self._f(*args, **kwargs)
+                launch_kernel(self._f, num_blocks, num_threads, args, kwargs)
             return internal_loop
 
     return KernelAccessor(f)
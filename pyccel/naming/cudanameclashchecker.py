@@ -95,8 +95,7 @@ class CudaNameClashChecker(LanguageNameClashChecker):
             True if the name is a collision.
             False if the name is collision free.
         """
-        return any(name == k for k in self.keywords) or \
-               any(name == s for s in symbols)
+        return name in self.keywords or name in symbols
 
     def get_collisionless_name(self, name, symbols):
         """
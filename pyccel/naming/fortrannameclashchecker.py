@@ -8,6 +8,8 @@ Handles name clash problems in Fortran.
 """
 import warnings
 
+from pyccel.utilities.used_symbols import UsedSymbolsView
+
 from .languagenameclashchecker import LanguageNameClashChecker
 
 class FortranNameClashChecker(LanguageNameClashChecker):
@@ -59,7 +61,7 @@ class FortranNameClashChecker(LanguageNameClashChecker):
         ----------
         name : str
             The proposed name.
-        symbols : set of str
+        symbols : set of str | UsedSymbolsView
             The symbols already used in the scope.
 
         Returns
@@ -68,8 +70,11 @@ class FortranNameClashChecker(LanguageNameClashChecker):
             True if the name clashes with an existing name. False otherwise.
         """
         name = name.lower()
-        return name in self.keywords or \
-               any(name == s.lower() for s in symbols)
+        if name in self.keywords:
+            return True
+        if isinstance(symbols, UsedSymbolsView):
+            return symbols.contains_casefolded(name)
+        return any(name == s.lower() for s in symbols)
 
     def get_collisionless_name(self, name, symbols):
         """
@@ -43,9 +43,8 @@ class LanguageNameClashChecker(metaclass = Singleton):
             A new name which is collision free.
         """
         if self.has_clash(name, symbols): #pylint: disable=no-member
-            coll_symbols = self.keywords.copy()
-            coll_symbols.update(symbols)
+            # has_clash also checks the keywords so the symbols do not need to be copied
             counter = 1
-            name, counter = create_incremented_string(coll_symbols,
+            name, counter = create_incremented_string(symbols,
                     prefix = name, counter = counter, name_clash_checker = self)
         return name
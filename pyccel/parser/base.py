@@ -10,13 +10,11 @@ Module containing aspects of a parser which are in common over all stages.
 
 import importlib
 import os
+import pickle
 import re
 import warnings
-from filelock import FileLock
 
 #==============================================================================
-from pyccel.version import __version__
-
 from pyccel.ast.builtins import Lambda
 
 from pyccel.ast.core import FunctionDef, Interface, FunctionAddress
@@ -27,6 +25,7 @@ from pyccel.ast.utilities import recognised_source
 
 from pyccel.ast.variable import DottedName
 
+from pyccel.parser.header_cache import HeaderCache, get_header_cache_key
 from pyccel.parser.scope     import Scope
 from pyccel.parser.utilities import is_valid_filename_pyh, is_valid_filename_py
 
@@ -447,15 +446,17 @@ class BasicParser(object):
 
     def dump(self, filename=None):
         """
-        Dump the current ast using Pickle.
+        Save the result of the syntactic stage for a header file.
 
-        Dump the current ast using Pickle.
+        Save the AST, the metavariables and the scope created by the
+        syntactic stage for a header file in a `.pyccel` file (see
+        `HeaderCache`).
 
         Parameters
         ----------
         filename : str
             Output file name. if not given `name.pyccel` will be used and placed
-            in the Pyccel directory ($HOME/.pyccel).
+            in the same directory as the header file.
         """
         if self._created_from_pickle:
             return
@@ -477,35 +478,27 @@ class BasicParser(object):
         if os.path.splitext(filename)[1] != '.pyccel':
             raise ValueError('Expecting a .pyccel extension')
 
-        import pickle
-        import hashlib
-
-        # ...
-
-        # we are only exporting the AST.
         try:
-            with FileLock(filename+'.lock'):
-                try:
-                    code = self.code.encode('utf-8')
-                    hs   = hashlib.md5(code)
-                    with open(filename, 'wb') as f:
-                        pickle.dump((hs.hexdigest(), __version__, self), f)
-                    print("Created pickle file : ", filename)
-                except (FileNotFoundError, pickle.PickleError):
-                    pass
+            HeaderCache.write(filename, get_header_cache_key(self.code),
+                              self.ast, self.metavars, self.scope)
+            print("Created header cache file : ", filename)
         except PermissionError:
-            warnings.warn("Can't pickle files on a read-only system. Please run `sudo pyccel-init`")
+            warnings.warn("Can't save header caches on a read-only system. Please run `sudo pyccel-init`")
+        except (OSError, pickle.PicklingError):
+            pass
 
     def load(self, filename=None):
         """
-        Load the current ast using Pickle.
+        Load the result of the syntactic stage for a header file.
 
-        Load the current ast using Pickle.
+        Load the AST, the metavariables and the scope saved by `dump` if the
+        `.pyccel` file was created from the same header by the same version
+        of Pyccel.
 
         Parameters
         ----------
         filename : str, optional
-            The name of the pickled file. if not given `name.pyccel` will be used.
+            The name of the `.pyccel` file. if not given `name.pyccel` will be used.
         """
 
         # ...
@@ -527,51 +520,22 @@ class BasicParser(object):
         if not filename.split(""".""")[-1] == 'pyccel':
             raise ValueError('Expecting a .pyccel extension')
 
-        import pickle
-
-        possible_pickle_errors = (FileNotFoundError, PermissionError,
-                pickle.PickleError, AttributeError)
+        cache = HeaderCache.read(filename, get_header_cache_key(self.code))
+        if cache is None:
+            return
 
         try:
-            with FileLock(filename+'.lock'):
-                try:
-                    with open(filename, 'rb') as f:
-                        hs, version, parser = pickle.load(f)
-                    self._created_from_pickle = True
-                except possible_pickle_errors:
-                    return
-        except PermissionError:
-            # read/write problems don't need to be avoided on a read-only system
-            try:
-                with open(filename, 'rb') as f:
-                    hs, version, parser = pickle.load(f)
-                self._created_from_pickle = True
-            except possible_pickle_errors:
-                return
-
-        import hashlib
-        code = self.code.encode('utf-8')
-        if hashlib.md5(code).hexdigest() == hs and __version__ == version:
-            self.copy(parser)
-
-    def copy(self, parser):
-        """
-        Copy the parser attributes in self
-
-          Parameters
-          ----------
-          parser : BasicParser
-
-        """
-        self._fst = parser.fst
-        self._ast = parser.ast
+            ast, metavars, scope = cache.get_module()
+        except (pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+            return
 
-        self._metavars = parser.metavars
-        self._scope    = parser.scope
+        self._ast      = ast
+        self._metavars = metavars
+        self._scope    = scope
 
         # the following flags give us a status on the parsing stage
-        self._syntax_done   = parser.syntax_done
-        self._semantic_done = parser.semantic_done
+        self._syntax_done   = True
+        self._created_from_pickle = True
 
 
 #==============================================================================
@@ -0,0 +1,170 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Module containing the HeaderCache class which saves the result of the syntactic stage
+for a header file (`.pyh`) in a `.pyccel` file.
+"""
+import json
+import os
+import pickle
+import struct
+
+from pyccel.codegen.compiling.manifest import get_pyccel_fingerprint
+from pyccel.utilities.cache import hash_contents
+
+__all__ = ('HeaderCache',
+           'get_header_cache_key')
+
+# Increment when the layout of the cache files changes
+header_cache_format = 2
+
+magic = b'PYCCELHC'
+# Format version and size of the index
+index_struct = struct.Struct('<HI')
+
+#==============================================================================
+def get_header_cache_key(code):
+    """
+    Get a hash describing everything which affects the result of parsing a header.
+
+    Get a hash describing the contents of the header file and the installed
+    version of Pyccel. The fingerprint of Pyccel changes whenever one of its
+    files is modified, so a cache is never decoded by classes whose
+    `__slots__` differ from those of the classes which created it.
+
+    Parameters
+    ----------
+    code : str
+        The contents of the header file.
+
+    Returns
+    -------
+    str
+        The hexadecimal representation of the hash.
+    """
+    return hash_contents(get_pyccel_fingerprint(), code)
+
+#==============================================================================
+class HeaderCache:
+    """
+    Class describing the contents of a `.pyccel` file.
+
+    Class describing a `.pyccel` file which stores the result of the syntactic
+    stage for a header file. The file starts with a fixed-size prefix (a magic
+    number, the format version and the size of the index) followed by a JSON
+    index and the data. The index contains the key describing the header and
+    Pyccel (see `get_header_cache_key`) so a stale file is rejected without
+    decoding the data. The data is a single pickle of the AST, the
+    metavariables and the scope. The function headers share most of their
+    nodes with each other and with the scope, so they are not saved
+    separately as this would save a copy of the shared objects with each
+    function.
+
+    Parameters
+    ----------
+    data : bytes | memoryview
+        The encoded objects.
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self, data):
+        self._data = data
+
+    @classmethod
+    def read(cls, filename, key):
+        """
+        Read a `.pyccel` file if it describes the expected header.
+
+        Read a `.pyccel` file and check that it was created from the same
+        header by the same version of Pyccel. Only the index is decoded.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the `.pyccel` file.
+        key : str
+            The key describing the header (see `get_header_cache_key`).
+
+        Returns
+        -------
+        HeaderCache | None
+            The contents of the file or None if the file is missing, invalid
+            or out of date.
+        """
+        try:
+            with open(filename, 'rb') as f:
+                contents = f.read()
+        except OSError:
+            return None
+
+        start = len(magic) + index_struct.size
+        if len(contents) < start or not contents.startswith(magic):
+            return None
+        file_format, index_size = index_struct.unpack_from(contents, len(magic))
+        if file_format != header_cache_format:
+            return None
+        try:
+            index = json.loads(contents[start:start+index_size])
+        except ValueError:
+            return None
+        if index.get('key', None) != key:
+            return None
+        return cls(memoryview(contents)[start+index_size:])
+
+    @staticmethod
+    def write(filename, key, ast, metavars, scope):
+        """
+        Save the result of the syntactic stage for a header file.
+
+        Save the result of the syntactic stage for a header file in a
+        `.pyccel` file. The file is written to a temporary file which then
+        replaces the previous file so that readers never see a partially
+        written file and do not need to lock it.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the `.pyccel` file.
+        key : str
+            The key describing the header (see `get_header_cache_key`).
+        ast : PyccelAstNode
+            The AST created by the syntactic stage.
+        metavars : dict
+            The metavariables defined in the header.
+        scope : Scope
+            The scope created by the syntactic stage.
+        """
+        data = pickle.dumps((ast, metavars, scope), protocol=pickle.HIGHEST_PROTOCOL)
+        index = json.dumps({'key' : key}, separators=(',', ':')).encode('utf-8')
+
+        tmp_filename = f'{filename}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_filename, 'wb') as f:
+                f.write(magic)
+                f.write(index_struct.pack(header_cache_format, len(index)))
+                f.write(index)
+                f.write(data)
+            os.replace(tmp_filename, filename)
+        finally:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+
+    def get_module(self):
+        """
+        Decode the objects describing the module.
+
+        Decode the AST, the metavariables and the scope of the header.
+
+        Returns
+        -------
+        ast : PyccelAstNode
+            The AST created by the syntactic stage.
+        metavars : dict
+            The metavariables defined in the header.
+        scope : Scope
+            The scope created by the syntactic stage.
+        """
+        return pickle.loads(self._data)
@@ -0,0 +1,727 @@
+# coding: utf-8
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Module containing the ModuleInterface class which saves the interface of a semantic module
+so that the modules which import it do not need to run the semantic stage on it again.
+"""
+import importlib
+import json
+import os
+
+from pyccel.ast.class_defs  import get_cls_base
+from pyccel.ast.core        import AsName, FunctionAddress, FunctionDef, FunctionDefArgument
+from pyccel.ast.core        import FunctionDefResult, InlineFunctionDef, Interface, Module
+from pyccel.ast.datatypes   import PyccelType, InhomogeneousTupleType
+from pyccel.ast.internals   import PyccelSymbol
+from pyccel.ast.literals    import Literal, LiteralComplex, LiteralFalse, LiteralFloat
+from pyccel.ast.literals    import LiteralInteger, LiteralString, LiteralTrue, Nil
+from pyccel.ast.operators   import PyccelUnarySub
+from pyccel.ast.utilities   import builtin_import_registry
+from pyccel.ast.variable    import Variable
+
+from pyccel.codegen.compiling.manifest import get_module_fingerprint, get_pyccel_fingerprint
+from pyccel.codegen.compiling.manifest import hash_file
+
+from pyccel.parser.scope import Scope
+
+from pyccel.utilities.cache import hash_contents
+from pyccel.utilities.stage import PyccelStage
+from pyccel.version         import __version__
+
+__all__ = ('ModuleInterface',
+           'get_interface_filename')
+
+pyccel_stage = PyccelStage()
+
+# Increment when the layout of the saved interfaces changes
+interface_format = 1
+
+literal_classes = {c.__name__: c for c in (LiteralComplex, LiteralFalse, LiteralFloat,
+                                           LiteralInteger, LiteralString, LiteralTrue, Nil)}
+
+#==============================================================================
+def get_interface_filename(pyccel_dirpath, module_name):
+    """
+    Get the name of the file where the interface of a module is saved.
+
+    Get the name of the file where the summary of the interface of a module
+    (see `ModuleInterface`) is saved.
+
+    Parameters
+    ----------
+    pyccel_dirpath : str
+        The folder where the files generated for the module are saved (`__pyccel__`).
+    module_name : str
+        The name of the module.
+
+    Returns
+    -------
+    str
+        The name of the interface file.
+    """
+    return os.path.join(pyccel_dirpath, f'{module_name}.interface.json')
+
+def get_interface_key(source_hash, dependencies):
+    """
+    Get a hash describing everything which affects the interface of a module.
+
+    Get a hash describing the installed version of Pyccel, the target language
+    (which determines how names are chosen), the contents of the file and the
+    modules that it imports. If this hash has not changed since the interface
+    was saved then the semantic stage would create the same interface.
+
+    Parameters
+    ----------
+    source_hash : str
+        The hash of the contents of the file containing the module.
+    dependencies : iterable[str]
+        The absolute paths to the files containing the user modules imported
+        (directly or indirectly) by the module.
+
+    Returns
+    -------
+    str
+        The hexadecimal representation of the hash.
+    """
+    return hash_contents(get_pyccel_fingerprint(), type(Scope.name_clash_checker).__name__,
+                         source_hash, *(f'{d}={get_module_fingerprint(d)}' for d in sorted(dependencies)))
+
+#==============================================================================
+class UnsupportedInterfaceError(Exception):
+    """
+    Error raised when a module cannot be described by a ModuleInterface.
+
+    Error raised when a module contains an object which cannot be saved in a
+    ModuleInterface. In this case the interface is not saved and the module
+    is analysed by the semantic stage whenever it is imported.
+    """
+
+#==============================================================================
+def _encode_type(class_type):
+    """
+    Get a description of a type which can be saved in a JSON file.
+
+    Get a description of a type which can be saved in a JSON file. Types
+    describe how they are created when they are pickled so the same
+    information is saved (the class and the arguments passed to it).
+
+    Parameters
+    ----------
+    class_type : PyccelType | object
+        The type being described or one of the arguments used to create it.
+
+    Returns
+    -------
+    dict | object
+        The description of the type.
+    """
+    if not isinstance(class_type, PyccelType):
+        if isinstance(class_type, (str, int, bool, type(None))):
+            return class_type
+        raise UnsupportedInterfaceError(f"Can't save type argument {class_type}")
+    if isinstance(class_type, InhomogeneousTupleType):
+        raise UnsupportedInterfaceError("Can't save inhomogeneous tuples")
+    cls, args = class_type.__reduce__()
+    module = importlib.import_module(cls.__module__)
+    if not cls.__module__.startswith('pyccel.') or getattr(module, cls.__qualname__, None) is not cls:
+        raise UnsupportedInterfaceError(f"Can't save type {class_type}")
+    return {'class': f'{cls.__module__}:{cls.__qualname__}', 'args': [_encode_type(a) for a in args]}
+
+def _decode_type(description):
+    """
+    Create a type from its description.
+
+    Create a type from the description created by `_encode_type`.
+
+    Parameters
+    ----------
+    description : dict | object
+        The description of the type.
+
+    Returns
+    -------
+    PyccelType | object
+        The type.
+    """
+    if not isinstance(description, dict):
+        return description
+    module, name = description['class'].split(':')
+    assert module.startswith('pyccel.')
+    cls = getattr(importlib.import_module(module), name)
+    assert issubclass(cls, PyccelType)
+    return cls(*[_decode_type(a) for a in description['args']])
+
+def _encode_value(value):
+    """
+    Get a description of the default value of an argument.
+
+    Get a description of the default value of an argument which can be saved
+    in a JSON file. Only literals (and negated literals) are supported.
+
+    Parameters
+    ----------
+    value : TypedAstNode | None
+        The default value.
+
+    Returns
+    -------
+    dict | None
+        The description of the value.
+    """
+    if value is None:
+        return None
+    elif isinstance(value, PyccelUnarySub):
+        return {'negate': _encode_value(value.args[0])}
+    elif isinstance(value, Literal) and type(value).__name__ in literal_classes:
+        python_value = value.python_value
+        if isinstance(python_value, complex):
+            python_value = [python_value.real, python_value.imag]
+        return {'literal': type(value).__name__, 'value': python_value,
+                'type': _encode_type(value.class_type)}
+    else:
+        raise UnsupportedInterfaceError(f"Can't save default value {value}")
+
+def _decode_value(description):
+    """
+    Create the default value of an argument from its description.
+
+    Create the default value of an argument from the description created by
+    `_encode_value`.
+
+    Parameters
+    ----------
+    description : dict | None
+        The description of the value.
+
+    Returns
+    -------
+    TypedAstNode | None
+        The default value.
+    """
+    if description is None:
+        return None
+    elif 'negate' in description:
+        return PyccelUnarySub(_decode_value(description['negate']))
+
+    cls = literal_classes[description['literal']]
+    dtype = _decode_type(description['type'])
+    value = description['value']
+    if cls is Nil:
+        return Nil()
+    elif cls is LiteralString:
+        return LiteralString(value)
+    elif cls in (LiteralTrue, LiteralFalse):
+        return cls(dtype)
+    elif cls is LiteralComplex:
+        return LiteralComplex(*value, dtype)
+    else:
+        return cls(value, dtype)
+
+def _encode_variable(var):
+    """
+    Get a description of a variable which can be saved in a JSON file.
+
+    Get a description of the properties of a variable which may be used by
+    the modules which import it (or which call a function that it describes).
+
+    Parameters
+    ----------
+    var : Variable
+        The variable being described.
+
+    Returns
+    -------
+    dict
+        The description of the variable.
+    """
+    if type(var) is not Variable: # pylint: disable=unidiomatic-typecheck
+        raise UnsupportedInterfaceError(f"Can't save variable {var}")
+    return {'name'           : var.name,
+            'type'           : _encode_type(var.class_type),
+            'memory_handling': var.memory_handling,
+            'is_const'       : var.is_const,
+            'is_target'      : var.is_target,
+            'is_optional'    : var.is_optional,
+            'is_private'     : var.is_private,
+            'shape'          : [int(s) if isinstance(s, LiteralInteger) else None for s in var.alloc_shape] \
+                                    if var.rank else None,
+            'allows_negative_indexes': var.allows_negative_indexes}
+
+def _decode_variable(description):
+    """
+    Create a variable from its description.
+
+    Create a variable from the description created by `_encode_variable`.
+
+    Parameters
+    ----------
+    description : dict
+        The description of the variable.
+
+    Returns
+    -------
+    Variable
+        The variable.
+    """
+    class_type = _decode_type(description['type'])
+    shape = description['shape']
+    return Variable(class_type, description['name'],
+                    memory_handling = description['memory_handling'],
+                    is_const = description['is_const'],
+                    is_target = description['is_target'],
+                    is_optional = description['is_optional'],
+                    is_private = description['is_private'],
+                    shape = tuple(shape) if shape is not None else None,
+                    cls_base = get_cls_base(class_type),
+                    allows_negative_indexes = description['allows_negative_indexes'])
+
+def _encode_function(func):
+    """
+    Get a description of the signature of a function which can be saved in a JSON file.
+
+    Get a description of everything which is used by the code which calls a
+    function: its name, its arguments (with their default values), its results
+    and the properties of the function. The body of the function is not saved.
+
+    Parameters
+    ----------
+    func : FunctionDef
+        The function being described.
+
+    Returns
+    -------
+    dict
+        The description of the function.
+    """
+    if isinstance(func, InlineFunctionDef) or func.functions or \
+            any(not i.is_argument for i in func.interfaces):
+        raise UnsupportedInterfaceError(f"Can't save function {func.name}")
+
+    python_names = func.scope.python_names if func.scope else {}
+    arg_vars = [a.var for a in func.arguments]
+    arguments = []
+    for a in func.arguments:
+        if isinstance(a.var, FunctionAddress):
+            var = {'function_address': _encode_function(a.var),
+                   'is_optional'     : a.var.is_optional,
+                   'is_kwonly'       : a.var.is_kwonly,
+                   'memory_handling' : a.var.memory_handling}
+        else:
+            var = _encode_variable(a.var)
+        arguments.append({'name'             : python_names.get(a.name, a.name),
+                          'var'              : var,
+                          'value'            : _encode_value(a.value),
+                          'kwonly'           : a.is_kwonly,
+                          'bound_argument'   : a.bound_argument,
+                          'persistent_target': a.persistent_target,
+                          'inout'            : a.inout})
+    results = []
+    for r in func.results:
+        if r.var in arg_vars:
+            results.append({'argument': arg_vars.index(r.var)})
+        else:
+            results.append({'name': python_names.get(r.var.name, r.var.name),
+                            'var' : _encode_variable(r.var)})
+
+    return {'name'        : func.name,
+            'arguments'   : arguments,
+            'results'     : results,
+            'decorators'  : sorted(func.decorators),
+            'is_pure'     : func.is_pure,
+            'is_elemental': func.is_elemental,
+            'is_private'  : func.is_private,
+            'is_recursive': func.is_recursive,
+            'result_pointer_map': [[func.results.index(r), list(i)] for r, i in func.result_pointer_map.items()]}
+
+def _decode_function(description, parent_scope):
+    """
+    Create a function from the description of its signature.
+
+    Create a function without a body from the description created by
+    `_encode_function`. The function has a scope containing its arguments
+    and results so that keyword arguments can be matched to the names used
+    in the generated code.
+
+    Parameters
+    ----------
+    description : dict
+        The description of the function.
+    parent_scope : Scope | None
+        The scope in which the function is defined. None for function addresses.
+
+    Returns
+    -------
+    FunctionDef
+        The function.
+    """
+    arguments = []
+    results = []
+    python_names = {}
+    for a in description['arguments']:
+        var = a['var']
+        if 'function_address' in var:
+            address = _decode_function(var['function_address'], None)
+            var = FunctionAddress(address.name, address.arguments, address.results,
+                                  is_optional = var['is_optional'], is_kwonly = var['is_kwonly'],
+                                  is_argument = True, memory_handling = var['memory_handling'])
+        else:
+            var = _decode_variable(var)
+        arg = FunctionDefArgument(var, value = _decode_value(a['value']), kwonly = a['kwonly'],
+                                  bound_argument = a['bound_argument'],
+                                  persistent_target = a['persistent_target'])
+        if not a['inout']:
+            arg.make_const()
+        arguments.append(arg)
+        python_names[var.name] = a['name']
+    for r in description['results']:
+        if 'argument' in r:
+            results.append(FunctionDefResult(arguments[r['argument']].var))
+        else:
+            results.append(FunctionDefResult(_decode_variable(r['var'])))
+            python_names[results[-1].var.name] = r['name']
+
+    if parent_scope:
+        arg_vars = [a.var for a in arguments]
+        scope = parent_scope.new_child_scope(description['name'],
+                        used_symbols = {p: n for n, p in python_names.items()},
+                        original_symbols = python_names)
+        for a in arguments:
+            if isinstance(a.var, Variable):
+                scope.insert_variable(a.var, python_names[a.var.name])
+        for r in results:
+            if r.var not in arg_vars:
+                scope.insert_variable(r.var, python_names[r.var.name])
+    else:
+        scope = None
+
+    result_pointer_map = {results[r]: i for r, i in description['result_pointer_map']}
+
+    return FunctionDef(description['name'], arguments, [], results,
+                       decorators = dict.fromkeys(description['decorators']),
+                       is_pure = description['is_pure'],
+                       is_elemental = description['is_elemental'],
+                       is_private = description['is_private'],
+                       is_recursive = description['is_recursive'],
+                       is_header = True,
+                       result_pointer_map = result_pointer_map,
+                       scope = scope)
+
+#==============================================================================
+class ModuleInterface:
+    """
+    Class describing the interface of a module which has been analysed by the semantic stage.
+
+    Class describing everything which is needed by the modules which import a
+    module: the signatures of its functions and interfaces, its variables,
+    its metavariables and the modules that it imports. When a module is
+    translated its interface is saved in a JSON file in the `__pyccel__`
+    folder together with a hash of the inputs of the semantic stage (see
+    `get_interface_key`). When another module imports it, the interface is
+    loaded instead of running the syntactic and semantic stages on the module
+    again. The loaded object can be used in place of the SemanticParser: it
+    provides the properties `ast`, `scope` and `metavars`.
+
+    Modules whose interface cannot be described without their implementation
+    (modules containing classes, inline functions or macros) do not have a
+    saved interface.
+
+    Parameters
+    ----------
+    filename : str
+        The absolute path to the file containing the module.
+    data : dict
+        The description of the interface read from the JSON file.
+    """
+    __slots__ = ('_filename', '_data', '_ast', '_scope')
+
+    def __init__(self, filename, data):
+        self._filename = filename
+        self._data = data
+        self._ast = None
+        self._scope = None
+
+    @classmethod
+    def load(cls, filename):
+        """
+        Load the saved interface of a module if it is up to date.
+
+        Read the interface of the module saved in the `__pyccel__` folder next
+        to the file. The interface is only returned if the file, the modules
+        it imports and Pyccel are unchanged since it was saved.
+
+        Parameters
+        ----------
+        filename : str
+            The absolute path to the file containing the module.
+
+        Returns
+        -------
+        ModuleInterface | None
+            The interface of the module or None if there is no up-to-date interface.
+        """
+        folder, name = os.path.split(filename)
+        module_name, ext = os.path.splitext(name)
+        if ext != '.py':
+            return None
+        pyccel_dirpath = os.path.join(folder, '__pyccel__' + os.environ.get('PYTEST_XDIST_WORKER', ''))
+        try:
+            with open(get_interface_filename(pyccel_dirpath, module_name), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('version', None) != __version__ or data.get('format', None) != interface_format \
+                or data['key'] != get_interface_key(hash_file(filename), data['dependencies']):
+            return None
+        return cls(filename, data)
+
+    @staticmethod
+    def save(parser, pyccel_dirpath, dependencies):
+        """
+        Save the interface of a module which has been analysed by the semantic stage.
+
+        Save a description of the interface of the module in the `__pyccel__`
+        folder. If the module contains objects which cannot be described
+        without their implementation then any previously saved interface is
+        removed.
+
+        Parameters
+        ----------
+        parser : Parser
+            The parser which was used to annotate the module.
+        pyccel_dirpath : str
+            The folder where the files generated for the module are saved (`__pyccel__`).
+        dependencies : iterable[str]
+            The absolute paths to the files containing the user modules imported
+            (directly or indirectly) by the module.
+
+        Returns
+        -------
+        bool
+            True if the interface was saved, False otherwise.
+        """
+        module_name = os.path.splitext(os.path.basename(parser.filename))[0]
+        filename = get_interface_filename(pyccel_dirpath, module_name)
+        try:
+            data = ModuleInterface._encode_module(parser)
+            data.update({'version'     : __version__,
+                         'format'      : interface_format,
+                         'key'         : get_interface_key(hash_file(parser.filename), dependencies),
+                         'dependencies': sorted(dependencies)})
+            contents = json.dumps(data, indent=1)
+        except (UnsupportedInterfaceError, TypeError, ValueError):
+            if os.path.exists(filename):
+                os.remove(filename)
+            return False
+
+        tmp_filename = f'{filename}.{os.getpid()}.tmp'
+        with open(tmp_filename, 'w', encoding="utf-8") as f:
+            f.write(contents)
+        os.replace(tmp_filename, filename)
+        return True
+
+    @staticmethod
+    def _encode_module(parser):
+        """
+        Get a description of the interface of a module.
+
+        Get a description of the interface of a module which can be saved in
+        a JSON file.
+
+        Parameters
+        ----------
+        parser : Parser
+            The parser which was used to annotate the module.
+
+        Returns
+        -------
+        dict
+            The description of the interface.
+        """
+        semantic_parser = parser.semantic_parser
+        module = semantic_parser.ast
+        scope = semantic_parser.scope
+        if module.classes or scope.macros or scope.cls_constructs:
+            raise UnsupportedInterfaceError("Can't save classes or macros")
+
+        variables = {id(v): k for k, v in scope.variables.items()}
+        functions = []
+        interfaces = []
+        for key, f in scope.functions.items():
+            if isinstance(f, Interface):
+                function_keys = [next(k for k, g in scope.functions.items() if g is i) for i in f.functions]
+                interfaces.append({'key': key, 'name': f.name, 'functions': function_keys})
+            else:
+                functions.append({'key': key, **_encode_function(f)})
+        init_func = next((k for k, f in scope.functions.items() if f is module.init_func), None)
+        free_func = next((k for k, f in scope.functions.items() if f is module.free_func), None)
+
+        # Describe the objects which can be imported from this module because it imported them
+        reexports = []
+        for source, imp in scope.imports['imports'].items():
+            son = parser.d_parsers.get(source, None)
+            if son:
+                son_module = son.semantic_parser.ast
+                son_imports = son.scope.imports
+            else:
+                son_module = builtin_import_registry[str(imp.source)]
+            for t in imp.target:
+                obj = t.object
+                if son and obj in (son_module.init_func, son_module.free_func):
+                    continue
+                entry = next((e for e in ('variables', 'functions', 'classes') \
+                                if t.local_alias in scope.imports[e]), None)
+                if entry is None:
+                    continue
+                if obj is son_module:
+                    name = None
+                elif son:
+                    name = next((k for d in (getattr(son.scope, entry), son_imports[entry]) \
+                                    for k, v in d.items() if v is obj), None)
+                else:
+                    name = next((k for k in son_module.keys() if son_module[k] is obj), None)
+                if name is None and obj is not son_module:
+                    raise UnsupportedInterfaceError(f"Can't save import of {t.local_alias}")
+                reexports.append({'entry' : entry,
+                                  'local' : str(t.local_alias),
+                                  'source': str(source) if son else str(imp.source),
+                                  'user'  : son is not None,
+                                  'name'  : name})
+
+        return {'name'        : module.name,
+                'imports'     : [[str(i.name), str(i.local_alias)] if isinstance(i, AsName) else [str(i), None] \
+                                    for i in parser.d_parsers],
+                'metavars'    : dict(semantic_parser.metavars),
+                'python_names': dict(scope.python_names),
+                'variables'   : [{'key': variables.get(id(v), None), **_encode_variable(v)} for v in module.variables],
+                'functions'   : functions,
+                'interfaces'  : interfaces,
+                'init_func'   : init_func,
+                'free_func'   : free_func,
+                'reexports'   : reexports}
+
+    @property
+    def filename(self):
+        """
+        The absolute path to the file containing the module.
+
+        The absolute path to the file containing the module.
+        """
+        return self._filename
+
+    @property
+    def imports(self):
+        """
+        The user modules imported by the module.
+
+        The names of the user modules imported by the module (as they would be
+        returned by `Scope.collect_all_imports` in the syntactic stage).
+        """
+        return [AsName(PyccelSymbol(n), a) if a else n for n, a in self._data['imports']]
+
+    @property
+    def metavars(self):
+        """
+        The metavariables of the module.
+
+        The metavariables defined in the module (e.g. `ignore_at_import`).
+        """
+        return self._data['metavars']
+
+    @property
+    def ast(self):
+        """
+        The semantic module.
+
+        The Module which describes the interface of the module. The functions
+        of the module do not have a body. This is only available after
+        `annotate` has been called.
+        """
+        return self._ast
+
+    @property
+    def scope(self):
+        """
+        The scope of the module.
+
+        The scope containing the objects which can be imported from the module.
+        This is only available after `annotate` has been called.
+        """
+        return self._scope
+
+    def annotate(self, d_parsers):
+        """
+        Create the semantic module described by the interface.
+
+        Create the semantic objects described by the interface: the Module,
+        its scope, its functions (without bodies), interfaces and variables,
+        and the objects that it imports from other modules which may be
+        imported from it.
+
+        Parameters
+        ----------
+        d_parsers : dict
+            The parsers of the modules imported by this module, indexed by the
+            name used in the import. These modules must already be annotated.
+
+        Returns
+        -------
+        ModuleInterface
+            The current object which can be used in place of a SemanticParser.
+        """
+        data = self._data
+        pyccel_stage.set_stage('semantic')
+        python_names = data['python_names']
+        scope = Scope(used_symbols = {p: n for n, p in python_names.items()},
+                      original_symbols = python_names)
+
+        variables = []
+        for v in data['variables']:
+            var = _decode_variable(v)
+            if v['key']:
+                scope.insert_variable(var, v['key'])
+            variables.append(var)
+
+        funcs = []
+        for f in data['functions']:
+            func = _decode_function(f, scope)
+            scope.functions[f['key']] = func
+            funcs.append(func)
+
+        interfaces = []
+        for i in data['interfaces']:
+            interface = Interface(i['name'], [scope.functions[k] for k in i['functions']])
+            scope.functions[i['key']] = interface
+            interfaces.append(interface)
+
+        init_func = scope.functions[data['init_func']] if data['init_func'] else None
+        free_func = scope.functions[data['free_func']] if data['free_func'] else None
+
+        for r in data['reexports']:
+            entry, local, name = r['entry'], r['local'], r['name']
+            if r['user']:
+                son = d_parsers[r['source']]
+                if name is None:
+                    obj = son.semantic_parser.ast
+                else:
+                    obj = getattr(son.scope, entry).get(name, None) or son.scope.imports[entry][name]
+                    if entry == 'functions':
+                        mod = obj.get_direct_user_nodes(lambda x: isinstance(x, Module))[0]
+                        obj = obj.clone(local, is_imported = True)
+                        obj.set_current_user_node(mod)
+                    elif entry == 'variables':
+                        obj = obj.clone(local)
+            else:
+                mod = builtin_import_registry[r['source']]
+                obj = mod if name is None else mod[name]
+            scope.imports[entry][local] = obj
+
+        self._scope = scope
+        self._ast = Module(data['name'], variables, funcs,
+                           init_func = init_func,
+                           free_func = free_func,
+                           interfaces = interfaces,
+                           scope = scope)
+        return self
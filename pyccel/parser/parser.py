@@ -11,6 +11,7 @@ Module containing the Parser object
 import os
 
 from pyccel.parser.base      import get_filename_from_import
+from pyccel.parser.interface import ModuleInterface
 from pyccel.parser.syntactic import SyntaxParser
 from pyccel.parser.semantic  import SemanticParser
 
@@ -48,11 +49,14 @@ class Parser(object):
         self._semantic_parser = None
         self._compile_obj     = None
 
+        # The saved interface which replaces the syntactic and semantic stages
+        self._interface       = None
+
         self._input_folder = os.path.dirname(filename)
 
     @property
     def semantic_parser(self):
-        """ Semantic parser """
+        """ Semantic parser (or the ModuleInterface used in its place) """
         return self._semantic_parser
 
     @property
@@ -106,10 +110,17 @@ class Parser(object):
 
         return self._sons
 
+    @property
+    def interface(self):
+        """ The saved interface used instead of the syntactic and semantic stages """
+        return self._interface
+
     @property
     def metavars(self):
         if self._semantic_parser:
             return self._semantic_parser.metavars
+        elif self._interface:
+            return self._interface.metavars
         else:
             return self._syntax_parser.metavars
 
@@ -122,13 +133,15 @@ class Parser(object):
 
     @property
     def imports(self):
+        if self._interface:
+            return self._interface.imports
         return self.scope.collect_all_imports()
 
     @property
     def fst(self):
         return self._syntax_parser.fst
 
-    def parse(self, d_parsers_by_filename=None, verbose=False):
+    def parse(self, d_parsers_by_filename=None, verbose=False, use_interface=False):
         """
           Parse the parent file an all its dependencies.
 
@@ -140,24 +153,37 @@ class Parser(object):
           verbose: bool
             Determine the verbosity.
 
+          use_interface : bool, default=False
+            Indicates whether an up-to-date saved interface of the module
+            (see ModuleInterface) should be used instead of parsing the file.
+            This is only possible for imported modules.
+
           Returns
           -------
           ast: Ast
-           The ast created in the syntactic stage.
+           The ast created in the syntactic stage (None if a saved interface is used).
           """
         if self._syntax_parser:
             return self._syntax_parser.ast
+        if self._interface:
+            return None
 
-        parser             = SyntaxParser(self._filename, **self._kwargs)
-        self.syntax_parser = parser
-        parser.ast        = parser.ast
+        if use_interface:
+            self._interface = ModuleInterface.load(self._filename)
+
+        if self._interface:
+            parser = None
+        else:
+            parser             = SyntaxParser(self._filename, **self._kwargs)
+            self.syntax_parser = parser
+            parser.ast        = parser.ast
 
         if d_parsers_by_filename is None:
             d_parsers_by_filename = {}
 
         self._d_parsers = self.parse_sons(d_parsers_by_filename, verbose=verbose)
 
-        return parser.ast
+        return parser.ast if parser else None
 
     def annotate(self, **settings):
 
@@ -169,6 +195,11 @@ class Parser(object):
         verbose = settings.pop('verbose', False)
         self._annotate_sons(verbose=verbose)
 
+        # Use the saved interface instead of running the semantic stage
+        if self._interface:
+            self._semantic_parser = self._interface.annotate(self.d_parsers)
+            return self._semantic_parser
+
         # Create a new semantic parser and store it in object
         parser = SemanticParser(self._syntax_parser,
                                 d_parsers=self.d_parsers,
@@ -229,7 +260,7 @@ class Parser(object):
                 q = d_parsers_by_filename[filename]
             else:
                 q = Parser(filename)
-            q.parse(d_parsers_by_filename=d_parsers_by_filename)
+            q.parse(d_parsers_by_filename=d_parsers_by_filename, use_interface=True)
             d_parsers_by_filename[filename] = q
 
         d_parsers = {}
@@ -18,6 +18,8 @@ from pyccel.parser.syntax.headers import FunctionHeaderStmt
 
 from pyccel.errors.errors import Errors
 
+from pyccel.utilities.used_symbols import UsedSymbols, UsedSymbolsView
+
 from pyccel.naming.pythonnameclashchecker import PythonNameClashChecker
 
 from pyccel.utilities.strings import create_incremented_string
@@ -60,7 +62,7 @@ class Scope(object):
     name_clash_checker = PythonNameClashChecker()
     __slots__ = ('_name', '_imports','_locals','_parent_scope','_sons_scopes',
             '_is_loop','_loops','_temporary_variables', '_used_symbols',
-            '_dummy_counter','_original_symbol', '_dotted_symbols')
+            '_dummy_counter','_name_counters','_original_symbol', '_dotted_symbols')
 
     categories = ('functions','variables','classes',
             'imports','symbolic_functions', 'symbolic_alias',
@@ -81,10 +83,14 @@ class Scope(object):
         if used_symbols and not isinstance(used_symbols, dict):
             raise RuntimeError("Used symbols must be a dictionary")
 
-        self._used_symbols = used_symbols or {}
+        if not isinstance(used_symbols, UsedSymbols):
+            used_symbols = UsedSymbols(used_symbols or {})
+        self._used_symbols = used_symbols
         self._original_symbol = original_symbols or {}
 
         self._dummy_counter = 0
+        # The expected value of the next counter for each prefix passed to get_new_name
+        self._name_counters = {}
 
         self._locals['decorators'].update(decorators)
 
@@ -343,7 +349,7 @@ class Scope(object):
                 self._temporary_variables.append(var)
             else:
                 self._locals['variables'][name] = var
-            if name not in self.local_used_symbols.values():
+            if not self._used_symbols.has_name(name):
                 self.insert_symbol(name)
 
     def remove_variable(self, var, name = None):
@@ -564,14 +570,20 @@ class Scope(object):
 
     @property
     def all_used_symbols(self):
-        """ Get all symbols which already exist in this scope
         """
-        if self.parent_scope:
-            symbols = self.parent_scope.all_used_symbols
-        else:
-            symbols = set()
-        symbols.update(self._used_symbols.values())
-        return symbols
+        Get all symbols which already exist in this scope.
+
+        Get a set-like view of the collisionless names used in this scope and in
+        the enclosing scopes. The view is not a copy so it is cheap to create and
+        each membership test only costs one look-up per enclosing scope. If a
+        snapshot is needed then the `copy` method returns a set.
+        """
+        used_symbols = [self._used_symbols]
+        scope = self.parent_scope
+        while scope:
+            used_symbols.append(scope.local_used_symbols)
+            scope = scope.parent_scope
+        return UsedSymbolsView(used_symbols)
 
     @property
     def local_used_symbols(self):
@@ -601,7 +613,7 @@ class Scope(object):
             The newly created name.
         """
 
-        new_name, counter = create_incremented_string(self.local_used_symbols.values(),
+        new_name, counter = create_incremented_string(UsedSymbolsView((self._used_symbols,)),
                                     prefix = prefix, counter = counter, name_clash_checker = self.name_clash_checker)
 
         new_symbol = PyccelSymbol(new_name, is_temp=True)
@@ -644,7 +656,9 @@ class Scope(object):
                                                 name_clash_checker = self.name_clash_checker)
         else:
             # When a name is suggested, try to stick to it
-            new_name,_ = create_incremented_string(self.all_used_symbols, prefix = current_name)
+            counter = self._name_counters.get(current_name, 1)
+            new_name, self._name_counters[current_name] = create_incremented_string(self.all_used_symbols,
+                                                prefix = current_name, counter = counter)
 
         new_name = PyccelSymbol(new_name, is_temp = True)
         self.insert_symbol(new_name)
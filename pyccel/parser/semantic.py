@@ -8,7 +8,9 @@ See the developer docs for more details
 """
 
 from itertools import chain, product
+from math import prod
 import os
+import re
 import warnings
 
 from sympy.utilities.iterables import iterable as sympy_iterable
@@ -34,7 +36,9 @@ from pyccel.ast.builtins import PythonRange, PythonZip, PythonEnumerate, PythonT
 from pyccel.ast.builtins import Lambda, PythonMap
 
 from pyccel.ast.builtin_methods.list_methods import ListMethod, ListAppend
-from pyccel.ast.builtin_methods.set_methods  import SetAdd, SetUnion, SetCopy, SetIntersectionUpdate
+from pyccel.ast.builtin_methods.set_methods  import SetMethod, SetAdd, SetUnion, SetCopy, SetIntersectionUpdate
+from pyccel.ast.builtin_methods.dict_methods import DictMethod, DictPop, DictPopitem, DictSetDefault, DictClear
+from pyccel.ast.builtin_methods.dict_methods import DictKeys
 
 from pyccel.ast.core import Comment, CommentBlock, Pass
 from pyccel.ast.core import If, IfSection
@@ -95,7 +99,7 @@ from pyccel.ast.numpyext import process_dtype as numpy_process_dtype
 
 from pyccel.ast.numpytypes import NumpyNDArrayType
 
-from pyccel.ast.omp import (OMP_For_Loop, OMP_Simd_Construct, OMP_Distribute_Construct,
+from pyccel.ast.omp import (OmpAnnotatedComment, OMP_For_Loop, OMP_Simd_Construct, OMP_Distribute_Construct,
                             OMP_TaskLoop_Construct, OMP_Sections_Construct, Omp_End_Clause,
                             OMP_Single_Construct)
 
@@ -103,6 +107,8 @@ from pyccel.ast.operators import PyccelArithmeticOperator, PyccelIs, PyccelIsNot
 from pyccel.ast.operators import PyccelNot, PyccelAdd, PyccelMinus, PyccelMul, PyccelPow
 from pyccel.ast.operators import PyccelAssociativeParenthesis, PyccelDiv, PyccelIn
 
+from pyccel.ast.randomext import GeneratorDrawMethod
+
 from pyccel.ast.sympy_helper import sympy_to_pyccel, pyccel_to_sympy
 
 from pyccel.ast.type_annotations import VariableTypeAnnotation, UnionTypeAnnotation, SyntacticTypeAnnotation
@@ -146,8 +152,9 @@ from pyccel.errors.messages import (PYCCEL_RESTRICTION_TODO, UNDERSCORE_NOT_A_TH
 
 from pyccel.parser.base      import BasicParser
 from pyccel.parser.syntactic import SyntaxParser
-from pyccel.parser.syntax.headers import types_meta
+from pyccel.parser.syntax.headers import get_types_metamodel
 
+from pyccel.utilities.dispatch import get_dispatch_method
 from pyccel.utilities.stage import PyccelStage
 
 import pyccel.decorators as def_decorators
@@ -163,6 +170,10 @@ type_container = {
                    NumpyArray : NumpyNDArrayType,
                   }
 
+# The maximum number of elements of a local array which is placed on the stack
+# automatically when it does not escape from its function
+max_automatic_stack_array_size = 256
+
 #==============================================================================
 
 def _get_name(var):
@@ -264,6 +275,10 @@ class SemanticParser(BasicParser):
         # contain persistent pointers
         self._pointer_targets = []
 
+        # used to store the position of the definitions of arrays in loops. The warning about
+        # these definitions is only raised if the array is not placed on the stack
+        self._array_definitions_in_loop = {}
+
         #
         self._code = parser._code
         # ...
@@ -614,6 +629,128 @@ class SemanticParser(BasicParser):
         self._allocs.pop()
         return deallocs
 
+    def _is_small_fixed_size_array(self, var):
+        """
+        Check if a variable is an array which is small enough to be placed on the stack.
+
+        Check if a variable is a NumPy array whose shape is a compile-time
+        constant and which contains at most `max_automatic_stack_array_size`
+        elements. Such arrays are placed on the stack automatically if they
+        do not escape from the function where they are defined.
+
+        Parameters
+        ----------
+        var : Variable
+            The variable being examined.
+
+        Returns
+        -------
+        bool
+            True if the variable is a small array with a constant shape.
+        """
+        return isinstance(var.class_type, NumpyNDArrayType) and (var.rank == 1 or var.order != 'F') and \
+                all(isinstance(s, LiteralInteger) for s in var.alloc_shape) and \
+                0 < prod(s.python_value for s in var.alloc_shape) <= max_automatic_stack_array_size
+
+    def _move_small_arrays_to_stack(self, body, allow_stack = True):
+        """
+        Place the small local arrays which do not escape from a function on the stack.
+
+        Search the arrays allocated on the heap in the current function for
+        arrays whose shape is a compile-time constant containing at most
+        `max_automatic_stack_array_size` elements and which do not escape
+        from the function. These arrays are placed on the stack (as if they
+        had been listed in a `stack_array` decorator) and their `Allocate`
+        and `Deallocate` nodes are removed. As stack arrays are declared at
+        the start of the function, an array created in a loop is then reused
+        across iterations instead of being allocated at each iteration.
+
+        An array escapes from the function if it is returned, if it is the
+        target of a pointer, if it is stored in a container or an object, or
+        if it is passed to a function whose results may point to its
+        arguments. Such arrays are left on the heap, as are arrays which
+        store the result of a function call (these are allocated by the
+        called function).
+
+        Parameters
+        ----------
+        body : CodeBlock
+            The annotated body of the function. The `Allocate` and `Deallocate`
+            nodes of the arrays moved to the stack are removed from this block.
+
+        allow_stack : bool, default=True
+            Indicates whether arrays may be placed on the stack in this function.
+            If not, only the warnings about arrays defined in loops are raised.
+        """
+        candidates = [v for v in self._allocs[-1] if type(v) is Variable and v.on_heap and \
+                        not v.is_target and not v.is_argument and self._is_small_fixed_size_array(v)]
+        if allow_stack and candidates:
+            self._place_arrays_on_stack(body, candidates)
+
+        for v in [v for v in self._array_definitions_in_loop if v in self._allocs[-1]]:
+            errors.report(ARRAY_DEFINITION_IN_LOOP, symbol=self.scope.get_python_name(v.name),
+                severity='warning',
+                bounding_box=self._array_definitions_in_loop.pop(v))
+
+    def _place_arrays_on_stack(self, body, candidates):
+        """
+        Place the arrays which do not escape from a function on the stack.
+
+        Place the arrays which do not escape from a function on the stack and
+        remove their `Allocate` and `Deallocate` nodes. See
+        `SemanticParser._move_small_arrays_to_stack` for more details.
+
+        Parameters
+        ----------
+        body : CodeBlock
+            The annotated body of the function.
+
+        candidates : list[Variable]
+            The arrays with a small constant shape allocated in the function.
+        """
+        escaped = set()
+        def direct_uses(expr):
+            # The variables used by an expression, ignoring their elements and their shapes
+            if isinstance(expr, Variable):
+                return [expr]
+            return expr.get_attribute_nodes(Variable, excluded_nodes = (IndexedElement, PyccelArrayShapeElement))
+
+        for r in body.get_attribute_nodes(Return):
+            escaped.update(v for e in r.expr for v in direct_uses(e))
+        for a in body.get_attribute_nodes(AliasAssign):
+            escaped.update(a.rhs.get_attribute_nodes(Variable))
+        for c in body.get_attribute_nodes((PythonList, PythonTuple, PythonSet, PythonDict, ListMethod,
+                                           SetMethod, DictMethod, Del)):
+            escaped.update(direct_uses(c))
+        for a in body.get_attribute_nodes(Assign):
+            # The results of functions are allocated by the function
+            if isinstance(a.rhs, FunctionCall) and not isinstance(a.rhs.funcdef, PyccelFunctionDef):
+                escaped.update(a.lhs.get_attribute_nodes(Variable) if not isinstance(a.lhs, Variable) else [a.lhs])
+        for f in body.get_attribute_nodes(FunctionCall):
+            func = f.funcdef
+            args = getattr(func, 'arguments', ())
+            if isinstance(f, ConstructorCall) or getattr(func, 'result_pointer_map', None) or \
+                    (args and args[0].bound_argument):
+                escaped.update(v for a in f.args for v in direct_uses(a.value))
+        for c in body.get_attribute_nodes(OmpAnnotatedComment):
+            escaped.update(v for v in candidates if re.search(rf'\b{v.name}\b', c.txt))
+
+        allocs = body.get_attribute_nodes(Allocate)
+        stack_vars = [v for v in candidates if v not in escaped and any(a.variable is v for a in allocs) and \
+                        all(a.like is None and a.shape == v.alloc_shape for a in allocs if a.variable is v)]
+        if not stack_vars:
+            return
+
+        for v in stack_vars:
+            v.memory_handling = 'stack'
+            self._allocs[-1].discard(v)
+            # A stack array is not reallocated at each cycle of a loop
+            self._array_definitions_in_loop.pop(v, None)
+
+        removed = [a for a in allocs if a.variable in stack_vars] + \
+                  [d for d in body.get_attribute_nodes(Deallocate) if d.variable in stack_vars]
+        body.substitute(removed, [EmptyNode() for _ in removed])
+
     def _check_pointer_targets(self, exceptions = ()):
         """
         Check that all pointer targets to be deallocated are not needed beyond this scope.
@@ -1257,6 +1394,7 @@ class SemanticParser(BasicParser):
             errors.report(f"{len(args)} argument types given, but function takes {len(func.arguments)} arguments",
                 symbol=expr,
                 severity='fatal')
+        num_blocks, tp_block = expr.indexes
         if not isinstance(expr.indexes[0], (LiteralInteger)):
             if isinstance(expr.indexes[0], PyccelSymbol):
                 num_blocks = self.get_variable(expr.indexes[0])
@@ -1280,7 +1418,7 @@ class SemanticParser(BasicParser):
                 errors.report(INVALID_KERNEL_CALL_TP_BLOCK,
                     symbol = expr,
                     severity='fatal')
-        new_expr = KernelCall(func, args, expr.indexes[0], expr.indexes[1])
+        new_expr = KernelCall(func, args, num_blocks, tp_block)
         return new_expr
 
     def _sort_function_call_args(self, func_args, args):
@@ -1492,6 +1630,7 @@ class SemanticParser(BasicParser):
             d_lhs['memory_handling'] = 'alias'
             rhs.base.is_target = not rhs.base.is_alias
 
+
     def _assign_lhs_variable(self, lhs, d_var, rhs, new_expressions, is_augassign = False,
             arr_in_multirets=False):
         """
@@ -1630,10 +1769,14 @@ class SemanticParser(BasicParser):
                 if lhs.on_heap and not array_declared_in_function:
                     if self.scope.is_loop:
                         # Array defined in a loop may need reallocation at every cycle
-                        errors.report(ARRAY_DEFINITION_IN_LOOP, symbol=name,
-                            severity='warning',
-                            bounding_box=(self.current_ast_node.lineno,
-                                self.current_ast_node.col_offset))
+                        bounding_box = (self.current_ast_node.lineno, self.current_ast_node.col_offset)
+                        if self._current_function and self._is_small_fixed_size_array(lhs):
+                            # The warning is raised later if the array cannot be placed on the stack
+                            self._array_definitions_in_loop.setdefault(lhs, bounding_box)
+                        else:
+                            errors.report(ARRAY_DEFINITION_IN_LOOP, symbol=name,
+                                severity='warning',
+                                bounding_box=bounding_box)
                         status='unknown'
                     else:
                         # Array defined outside of a loop will be allocated only once
@@ -2218,9 +2361,7 @@ class SemanticParser(BasicParser):
             A semantic Iterable object.
         """
         iterable = self._visit(syntactic_iterable)
-        if isinstance(iterable, (Variable, IndexedElement)):
-            iterable = VariableIterator(iterable)
-        elif not isinstance(iterable, Iterable):
+        if not isinstance(iterable, (Variable, IndexedElement, Iterable)):
             if isinstance(iterable, TypedAstNode):
                 pyccel_stage.set_stage('syntactic')
                 tmp_var = self.scope.get_new_name()
@@ -2228,11 +2369,18 @@ class SemanticParser(BasicParser):
                 pyccel_stage.set_stage('semantic')
                 assign = self._visit(syntactic_assign)
                 self._additional_exprs[-1].append(assign)
-                iterable = VariableIterator(self._visit(tmp_var))
+                iterable = self._visit(tmp_var)
             else:
                 errors.report(f"{iterable} is not handled as the iterable of a for loop",
                         symbol=syntactic_iterable, severity='fatal')
 
+        if isinstance(iterable, (Variable, IndexedElement)):
+            if isinstance(iterable.class_type, DictType):
+                # Iterating over a dict iterates over its keys
+                iterable = DictKeys(iterable)
+            else:
+                iterable = VariableIterator(iterable)
+
         return iterable
 
     def _get_for_iterators(self, syntactic_iterable, iterator, new_expr):
@@ -2355,15 +2503,13 @@ class SemanticParser(BasicParser):
         if getattr(expr,'python_ast', None) is not None:
             self._current_ast_node = expr.python_ast
 
-        classes = type(expr).__mro__
-        for cls in classes:
-            annotation_method = '_visit_' + cls.__name__
-            if hasattr(self, annotation_method):
-                obj = getattr(self, annotation_method)(expr)
-                if isinstance(obj, PyccelAstNode) and self.current_ast_node:
-                    obj.set_current_ast(self.current_ast_node)
-                self._current_ast_node = current_ast
-                return obj
+        annotation_method = get_dispatch_method(type(self), '_visit_', type(expr))
+        if annotation_method is not None:
+            obj = annotation_method(self, expr)
+            if isinstance(obj, PyccelAstNode) and self.current_ast_node:
+                obj.set_current_ast(self.current_ast_node)
+            self._current_ast_node = current_ast
+            return obj
 
         # Unknown object, we raise an error.
         return errors.report(PYCCEL_RESTRICTION_TODO, symbol=type(expr),
@@ -2379,7 +2525,7 @@ class SemanticParser(BasicParser):
 
         # Avoid conflicts with symbols from Program
         if expr.program:
-            self.scope.insert_symbols(expr.program.scope.all_used_symbols)
+            self.scope.insert_symbols(list(expr.program.scope.all_used_symbols))
 
         for c in expr.classes:
             self._visit(c)
@@ -3235,7 +3381,8 @@ class SemanticParser(BasicParser):
                     bounding_box=(self.current_ast_node.lineno, self.current_ast_node.col_offset),
                     severity='fatal')
 
-        func = self._annotate_the_called_function_def(func)
+        if not func.is_semantic:
+            func = self._annotate_the_called_function_def(func)
         if 'kernel' in func.decorators :
             return self._handle_kernel(expr, func, args)
         else:
@@ -3388,7 +3535,7 @@ class SemanticParser(BasicParser):
                 pyccel_stage.set_stage('syntactic')
                 if isinstance(rhs, LiteralString):
                     try:
-                        annotation = types_meta.model_from_str(rhs.python_value)
+                        annotation = get_types_metamodel().model_from_str(rhs.python_value)
                     except TextXSyntaxError as e:
                         errors.report(f"Invalid header. {e.message}",
                                 symbol = expr, severity = 'fatal')
@@ -4390,6 +4537,10 @@ class SemanticParser(BasicParser):
             for i in sub_funcs:
                 self._visit(i)
 
+            # Place the small arrays which do not escape from the function on the stack
+            self._move_small_arrays_to_stack(body, allow_stack = not is_inline and \
+                                   'kernel' not in decorators and 'device' not in decorators)
+
             # Calling the Garbage collecting,
             # it will add the necessary Deallocate nodes
             # to the body of the function
@@ -4437,6 +4588,10 @@ class SemanticParser(BasicParser):
             lhs_assigns   = [a.lhs for a in assigns]
             modified_args = [call_arg.value for f in calls
                                 for call_arg, func_arg in zip(f.args, f.funcdef.arguments) if func_arg.inout]
+            # Collect the arrays filled by a random number generator
+            modified_args += [f.out for f in body.get_attribute_nodes(GeneratorDrawMethod) if f.out is not None]
+            # Collect the dictionaries modified by their methods
+            modified_args += [f.dict_obj for f in body.get_attribute_nodes((DictPop, DictPopitem, DictSetDefault, DictClear))]
             # Collect modified variables
             all_assigned = [v for a in (lhs_assigns + modified_args) for v in
                             (a.get_attribute_nodes(Variable) if not isinstance(a, Variable) else [a])]
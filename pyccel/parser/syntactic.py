@@ -72,10 +72,11 @@ from pyccel.parser.base        import BasicParser
 from pyccel.parser.extend_tree import extend_tree
 from pyccel.parser.utilities   import get_default_path
 
-from pyccel.parser.syntax.headers import parse as hdr_parse, types_meta
+from pyccel.parser.syntax.headers import parse as hdr_parse, get_types_metamodel
 from pyccel.parser.syntax.openmp  import parse as omp_parse
 from pyccel.parser.syntax.openacc import parse as acc_parse
 
+from pyccel.utilities.dispatch import get_dispatch_method
 from pyccel.utilities.stage import PyccelStage
 
 from pyccel.errors.errors import Errors
@@ -278,7 +279,7 @@ class SyntaxParser(BasicParser):
             return SyntacticTypeAnnotation(dtype=annotation)
         elif isinstance(annotation, LiteralString):
             try:
-                annotation = types_meta.model_from_str(annotation.python_value)
+                annotation = get_types_metamodel().model_from_str(annotation.python_value)
             except TextXSyntaxError as e:
                 errors.report(f"Invalid header. {e.message}",
                         symbol = stmt, column = e.col,
@@ -327,11 +328,10 @@ class SyntaxParser(BasicParser):
         #      - line and column
         #      - blocking errors
 
-        cls = type(stmt)
-        syntax_method = '_visit_' + cls.__name__
-        if hasattr(self, syntax_method):
+        syntax_method = get_dispatch_method(type(self), '_visit_', type(stmt), follow_mro = False)
+        if syntax_method is not None:
             self._context.append(stmt)
-            result = getattr(self, syntax_method)(stmt)
+            result = syntax_method(self, stmt)
             if isinstance(result, PyccelAstNode) and result.python_ast is None and isinstance(stmt, ast.AST):
                 result.set_current_ast(stmt)
             self._context.pop()
@@ -781,6 +781,16 @@ class SyntaxParser(BasicParser):
         if 'allow_negative_index' in decorators:
             decorators['allow_negative_index'] = tuple(str(b.value) for a in decorators['allow_negative_index'] for b in a.args)
 
+        if 'parallel_arrays' in decorators:
+            parallel_arrays = decorators['parallel_arrays'][0]
+            dec_args = parallel_arrays.args if isinstance(parallel_arrays, FunctionCall) else ()
+            if len(dec_args) > 1 or any(a.keyword not in (None, 'threshold') or \
+                    not isinstance(a.value, LiteralInteger) for a in dec_args):
+                errors.report('The parallel_arrays decorator only accepts an integer threshold',
+                              symbol = parallel_arrays, severity='error')
+                dec_args = ()
+            decorators['parallel_arrays'] = dec_args[0].value.python_value if dec_args else 10000
+
         if 'pure' in decorators:
             is_pure = True
 
@@ -6,6 +6,7 @@
 """
 """
 import warnings
+from functools import lru_cache
 from os.path import join, dirname
 
 from textx import metamodel_from_file, register_language, metamodel_from_str
@@ -629,16 +630,47 @@ this_folder = dirname(__file__)
 types_grammar = join(this_folder, '../grammar/types.tx')
 header_grammar = join(this_folder, '../grammar/headers.tx')
 
-types_meta = metamodel_from_file(types_grammar, classes=type_classes)
-register_language("types", metamodel=types_meta)
+@lru_cache(maxsize=None)
+def get_types_metamodel():
+    """
+    Get the textX meta-model describing type annotations.
+
+    Get the textX meta-model describing the types which can be used in
+    string annotations and headers. The meta-model is built the first time
+    that it is needed so that importing Pyccel does not require the grammar
+    to be parsed.
+
+    Returns
+    -------
+    textx.metamodel.TextXMetaModel
+        The meta-model.
+    """
+    return metamodel_from_file(types_grammar, classes=type_classes)
+
+@lru_cache(maxsize=None)
+def get_metamodel():
+    """
+    Get the textX meta-model describing header comments.
+
+    Get the textX meta-model describing header comments (`#$ header`). The
+    meta-model is built the first time that it is needed so that importing
+    Pyccel does not require the grammar to be parsed.
+
+    Returns
+    -------
+    textx.metamodel.TextXMetaModel
+        The meta-model.
+    """
+    with open(header_grammar, 'r', encoding="utf-8") as f:
+        grammar = f.read()
+    with open(types_grammar, 'r', encoding="utf-8") as f:
+        grammar += f.read()
 
-with open(header_grammar, 'r', encoding="utf-8") as f:
-    grammar = f.read()
-with open(types_grammar, 'r', encoding="utf-8") as f:
-    grammar += f.read()
+    return metamodel_from_str(grammar, classes=hdr_classes+type_classes)
 
-meta = metamodel_from_str(grammar, classes=hdr_classes+type_classes)
-register_language("headers", metamodel=meta)
+# textX builds the meta-models of registered languages when they are first requested
+register_language("types", metamodel=get_types_metamodel)
+register_language("headers", metamodel=get_metamodel)
 
 def parse(filename=None, stmts=None):
     """ Parse header pragmas
@@ -658,9 +690,9 @@ def parse(filename=None, stmts=None):
     """
     # Instantiate model
     if filename:
-        model = meta.model_from_file(filename)
+        model = get_metamodel().model_from_file(filename)
     elif stmts:
-        model = meta.model_from_str(stmts)
+        model = get_metamodel().model_from_str(stmts)
     else:
         raise ValueError('Expecting a filename or a string')
     # Ensure correct stage
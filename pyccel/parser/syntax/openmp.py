@@ -6,6 +6,7 @@
 """
 """
 
+from functools import lru_cache
 from os.path import join, dirname
 
 from textx.metamodel import metamodel_from_file
@@ -831,7 +832,21 @@ this_folder = dirname(__file__)
 # Get meta-model from language description
 grammar = join(this_folder, '../grammar/openmp.tx')
 
-meta = metamodel_from_file(grammar, classes=omp_classes)
+@lru_cache(maxsize=None)
+def get_metamodel():
+    """
+    Get the textX meta-model describing the OpenMP pragmas.
+
+    Get the textX meta-model describing the OpenMP pragmas. The meta-model
+    is built the first time that it is needed so that importing Pyccel does
+    not require the grammar to be parsed.
+
+    Returns
+    -------
+    textx.metamodel.TextXMetaModel
+        The meta-model.
+    """
+    return metamodel_from_file(grammar, classes=omp_classes)
 
 def parse(filename=None, stmts=None):
     """ Parse openmp pragmas
@@ -851,9 +866,9 @@ def parse(filename=None, stmts=None):
     """
     # Instantiate model
     if filename:
-        model = meta.model_from_file(filename)
+        model = get_metamodel().model_from_file(filename)
     elif stmts:
-        model = meta.model_from_str(stmts)
+        model = get_metamodel().model_from_str(stmts)
     else:
         raise ValueError('Expecting a filename or a string')
 
@@ -0,0 +1,10 @@
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+This module exposes the random number generators which are supported by Pyccel.
+"""
+from .philox import Generator
+
+__all__ = ['Generator']
@@ -0,0 +1,257 @@
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+"""
+Python implementation of the counter-based random number generator Philox4x32-10.
+
+This implementation is used when the code is run in Python. The translated code
+uses the equivalent implementations found in `pyccel/stdlib/random` which
+produce the same numbers. The algorithm is described in: J. K. Salmon,
+M. A. Moraes, R. O. Dror and D. E. Shaw, "Parallel random numbers: as easy as
+1, 2, 3", SC'11.
+"""
+from math import cos, log, pi, sin, sqrt
+
+import numpy as np
+
+__all__ = ('Generator',
+           'philox4x32')
+
+mask32 = 0xFFFFFFFF
+mask64 = 0xFFFFFFFFFFFFFFFF
+
+def philox4x32(counter, key):
+    """
+    Compute one block of the Philox4x32-10 generator.
+
+    Apply the ten rounds of the Philox4x32 bijection to a 128-bit counter
+    using a 64-bit key.
+
+    Parameters
+    ----------
+    counter : tuple[int, int, int, int]
+        The four 32-bit words of the counter.
+    key : tuple[int, int]
+        The two 32-bit words of the key.
+
+    Returns
+    -------
+    tuple[int, int, int, int]
+        The four 32-bit words of the block.
+    """
+    r0, r1, r2, r3 = counter
+    k0, k1 = key
+    for i in range(10):
+        if i > 0:
+            k0 = (k0 + 0x9E3779B9) & mask32
+            k1 = (k1 + 0xBB67AE85) & mask32
+        p0 = 0xD2511F53 * r0
+        p1 = 0xCD9E8D57 * r2
+        r0, r1, r2, r3 = ((p1 >> 32) ^ r1 ^ k0, p1 & mask32,
+                          (p0 >> 32) ^ r3 ^ k1, p0 & mask32)
+    return r0, r1, r2, r3
+
+class Generator:
+    """
+    A counter-based random number generator.
+
+    A random number generator providing a subset of the methods of
+    `numpy.random.Generator`. It is based on the Philox4x32-10 algorithm.
+    The 64-bit key is the seed. The 128-bit counter contains the index of
+    the stream (high 64 bits) and the index of the current block in the
+    stream (low 64 bits). Each stream therefore contains 2**64 blocks of four
+    32-bit words and different streams never overlap. This makes it possible
+    to give each OpenMP thread or MPI rank its own stream without any
+    communication:
+
+    >>> rng = Generator(seed, stream = omp_get_thread_num())
+
+    Parameters
+    ----------
+    seed : int
+        The seed of the generator (only the lower 64 bits are used).
+    stream : int, default=0
+        The index of the stream (only the lower 64 bits are used).
+    """
+    __slots__ = ('_key', '_counter', '_block', '_index', '_spare')
+
+    def __init__(self, seed, stream = 0):
+        seed = seed & mask64
+        stream = stream & mask64
+        self._key = (seed & mask32, seed >> 32)
+        self._counter = [0, 0, stream & mask32, stream >> 32]
+        self._block = (0, 0, 0, 0)
+        self._index = 4
+        self._spare = None
+
+    def _next_uint32(self):
+        """
+        Get the next 32-bit word of the stream.
+
+        Get the next 32-bit word of the stream. A new block is computed and
+        the counter is incremented when the words of the current block have
+        all been used.
+
+        Returns
+        -------
+        int
+            A random integer in [0, 2**32).
+        """
+        if self._index == 4:
+            self._block = philox4x32(self._counter, self._key)
+            self._step(1)
+            self._index = 0
+        word = self._block[self._index]
+        self._index += 1
+        return word
+
+    def _step(self, n_blocks):
+        """
+        Increment the index of the block in the stream.
+
+        Increment the lower 64 bits of the counter modulo 2**64.
+
+        Parameters
+        ----------
+        n_blocks : int
+            The increment.
+        """
+        position = (self._counter[0] + (self._counter[1] << 32) + n_blocks) & mask64
+        self._counter[0] = position & mask32
+        self._counter[1] = position >> 32
+
+    def _fill(self, out, draw):
+        """
+        Fill an array with random numbers.
+
+        Fill an array with the results of successive calls to a function.
+        The elements are filled in row-major order whatever the memory layout
+        of the array.
+
+        Parameters
+        ----------
+        out : numpy.ndarray
+            The array to be filled.
+        draw : callable
+            The function which returns a random number.
+        """
+        for idx in np.ndindex(out.shape):
+            out[idx] = draw()
+
+    def advance(self, n_blocks):
+        """
+        Advance the generator in its stream.
+
+        Skip the next `n_blocks` blocks of four 32-bit words. Any unused words
+        of the current block (and the cached normal variate) are discarded.
+
+        Parameters
+        ----------
+        n_blocks : int
+            The number of blocks to skip.
+        """
+        self._step(n_blocks)
+        self._index = 4
+        self._spare = None
+
+    def random(self, out = None):
+        """
+        Get random floats in [0, 1).
+
+        Get a double precision float uniformly distributed in [0, 1) with 53
+        random bits (two 32-bit words are used). If an array is provided then
+        it is filled with such floats.
+
+        Parameters
+        ----------
+        out : numpy.ndarray, optional
+            An array of floats which should be filled.
+
+        Returns
+        -------
+        float | None
+            The random number or None if `out` is provided.
+        """
+        if out is not None:
+            self._fill(out, self.random)
+            return None
+        a = self._next_uint32() >> 5
+        b = self._next_uint32() >> 6
+        return (a * 67108864.0 + b) / 9007199254740992.0
+
+    def integers(self, low, high, out = None):
+        """
+        Get random integers in [low, high).
+
+        Get an integer uniformly distributed in [low, high). Rejection
+        sampling is used so the result is not biased. The difference
+        `high - low` must be positive and no larger than 2**62. If an array
+        is provided then it is filled with such integers.
+
+        Parameters
+        ----------
+        low : int
+            The lowest integer which can be drawn.
+        high : int
+            One more than the highest integer which can be drawn.
+        out : numpy.ndarray, optional
+            An array of integers which should be filled.
+
+        Returns
+        -------
+        int | None
+            The random integer or None if `out` is provided.
+        """
+        span = high - low
+        if span <= 0 or span > 1 << 62:
+            raise ValueError("high - low must be in the range [1, 2**62]")
+        if out is not None:
+            self._fill(out, lambda: self.integers(low, high))
+            return None
+        if span <= 1 << 32:
+            limit = (1 << 32) - (1 << 32) % span
+            x = self._next_uint32()
+            while x >= limit:
+                x = self._next_uint32()
+        else:
+            limit = (1 << 62) - (1 << 62) % span
+            x = ((self._next_uint32() & 0x3FFFFFFF) << 32) | self._next_uint32()
+            while x >= limit:
+                x = ((self._next_uint32() & 0x3FFFFFFF) << 32) | self._next_uint32()
+        return low + x % span
+
+    def normal(self, loc = 0.0, scale = 1.0, out = None):
+        """
+        Get random floats from a normal distribution.
+
+        Get a float from a normal distribution with mean `loc` and standard
+        deviation `scale`. The Box-Muller transform is used. It creates two
+        variates, the second one is returned by the next call. If an array is
+        provided then it is filled with such floats.
+
+        Parameters
+        ----------
+        loc : float, default=0.0
+            The mean of the distribution.
+        scale : float, default=1.0
+            The standard deviation of the distribution.
+        out : numpy.ndarray, optional
+            An array of floats which should be filled.
+
+        Returns
+        -------
+        float | None
+            The random number or None if `out` is provided.
+        """
+        if out is not None:
+            self._fill(out, lambda: self.normal(loc, scale))
+            return None
+        if self._spare is not None:
+            spare = self._spare
+            self._spare = None
+            return loc + scale * spare
+        radius = sqrt(-2.0 * log(1.0 - self.random()))
+        theta = 2.0 * pi * self.random()
+        self._spare = radius * sin(theta)
+        return loc + scale * radius * cos(theta)
@@ -0,0 +1,83 @@
+// i_type: Class type (e.g., hmap_int64_t_double).
+// i_key: Data type of the keys of the dictionary (e.g., int64_t).
+// i_val: Data type of the values of the dictionary (e.g., double).
+//
+// The values returned by these functions are owned by the caller. Values which
+// manage memory (e.g. cstr) are copied with i_valclone so that the caller can
+// drop them independently of the dictionary.
+
+/*
+ * This function represents a call to the .pop() method without a default value.
+ * The key is assumed to be present in the dictionary.
+ * @param self : The dictionary instance.
+ * @param key : The key of the element which is removed.
+ */
+static inline _c_MEMB(_mapped) _c_MEMB(_pop)(i_type* self, _c_MEMB(_keyraw) key) {
+    _c_MEMB(_iter) itr = _c_MEMB(_find)(self, key); // Get an iterator pointing at the element using (_find).
+    _c_MEMB(_mapped) value = i_valclone(itr.ref->second); // Copy the value before the element is dropped.
+    _c_MEMB(_erase_at)(self, itr); // Remove the element using "_erase_at".
+    return value;
+}
+
+/*
+ * This function represents a call to the .pop() method with a default value.
+ * @param self : The dictionary instance.
+ * @param key : The key of the element which is removed.
+ * @param default_value : The value returned if the key is not present in the dictionary.
+ */
+static inline _c_MEMB(_mapped) _c_MEMB(_pop_with_default)(i_type* self, _c_MEMB(_keyraw) key,
+                                                          _c_MEMB(_rmapped) default_value) {
+    _c_MEMB(_iter) itr = _c_MEMB(_find)(self, key);
+    if (itr.ref)
+    {
+        _c_MEMB(_mapped) value = i_valclone(itr.ref->second);
+        _c_MEMB(_erase_at)(self, itr);
+        return value;
+    }
+    return i_valfrom(default_value);
+}
+
+/*
+ * This function represents a call to the .get() method without a default value.
+ * The key is assumed to be present in the dictionary.
+ * @param self : The dictionary instance.
+ * @param key : The key of the element.
+ */
+static inline _c_MEMB(_mapped) _c_MEMB(_get_value)(const i_type* self, _c_MEMB(_keyraw) key) {
+    return i_valclone((*_c_MEMB(_at)(self, key)));
+}
+
+/*
+ * This function represents a call to the .get() method with a default value.
+ * @param self : The dictionary instance.
+ * @param key : The key of the element.
+ * @param default_value : The value returned if the key is not present in the dictionary.
+ */
+static inline _c_MEMB(_mapped) _c_MEMB(_get_with_default)(const i_type* self, _c_MEMB(_keyraw) key,
+                                                          _c_MEMB(_rmapped) default_value) {
+    const _c_MEMB(_value)* ref = _c_MEMB(_get)(self, key); // NULL if the key is not present.
+    return ref ? i_valclone(ref->second) : i_valfrom(default_value);
+}
+
+/*
+ * This function represents a call to the .setdefault() method.
+ * The value is only inserted if the key is not present in the dictionary.
+ * @param self : The dictionary instance.
+ * @param key : The key of the element.
+ * @param default_value : The value inserted if the key is not present in the dictionary.
+ */
+static inline _c_MEMB(_mapped) _c_MEMB(_setdefault)(i_type* self, _c_MEMB(_keyraw) key,
+                                                    _c_MEMB(_rmapped) default_value) {
+    _c_MEMB(_result) res = _c_MEMB(_insert_entry_)(self, key); // Existing elements are not modified.
+    if (res.inserted)
+    {
+        res.ref->first = i_keyfrom(key);
+        res.ref->second = i_valfrom(default_value);
+    }
+    return i_valclone(res.ref->second);
+}
+
+#undef i_type
+#undef i_key
+#undef i_val
+#include <stc/priv/template2.h>
@@ -226,6 +226,74 @@ static inline bool    PyIs_Complex64(PyObject *o)
 /*
  * Functions : Numpy array handling functions
  */
-void get_strides_and_shape_from_numpy_array(PyObject* arr, int64_t shape[], int64_t strides[]);
+/*
+ * Function: get_fortran_array_layout
+ * ----------------------------------
+ * Describe a NumPy array as a section of a contiguous block of memory so that
+ * it can be accessed from Fortran through a pointer without copying the data.
+ *
+ * The dimensions are considered in memory order (fastest first). For the
+ * fastest dimension, strides contains the number of elements between
+ * consecutive elements. For each of the other dimensions it contains the
+ * extent of the previous dimension of the block. The Fortran code creates a
+ * pointer to the block whose extents are these values (followed by the shape
+ * of the slowest dimension) and selects the elements of the array with the
+ * step of the fastest dimension.
+ *
+ * Parameters :
+ *     a       : The NumPy array.
+ *     shape   : The array where the shape is saved.
+ *     strides : The array where the strides are saved.
+ *     c_order : True if the last dimension is the fastest, false if the first one is.
+ *
+ * Returns :
+ *     true if the array can be described in this way, false otherwise (e.g. if a
+ *     stride is negative or if the dimensions are not in the expected order).
+ */
+bool get_fortran_array_layout(PyArrayObject* a, int64_t shape[], int64_t strides[], bool c_order);
+
+/*
+ * Function: get_strides_and_shape_from_numpy_array
+ * ------------------------------------------------
+ * Get the shape and the strides which describe a NumPy array to a Fortran
+ * function (see get_fortran_array_layout). The layout must have been checked
+ * before calling this function.
+ *
+ * Parameters :
+ *     arr     : The NumPy array.
+ *     shape   : The array where the shape is saved.
+ *     strides : The array where the strides are saved.
+ *     c_order : True if the last dimension is the fastest, false if the first one is.
+ */
+void get_strides_and_shape_from_numpy_array(PyObject* arr, int64_t shape[], int64_t strides[], bool c_order);
+
+/*
+ * Functions : Argument parsing functions
+ */
+
+/*
+ * Unpack the arguments received by a function using the METH_FASTCALL | METH_KEYWORDS
+ * calling convention into the PyObject pointers passed as variadic arguments.
+ * Arguments which are not provided are left unchanged so that they can be
+ * initialised to Py_None before the call.
+ *
+ * Parameters
+ * ----------
+ * args : The array of positional arguments followed by the values of the keyword arguments.
+ * nargs : The number of positional arguments.
+ * kwnames : A tuple containing the names of the keyword arguments (may be NULL).
+ * kwlist : A NULL-terminated list of the names of the expected arguments.
+ * kwlist_interned : A static array where the interned names are saved on the first call.
+ * n_required : The number of arguments which must be provided.
+ * n_expected : The number of expected arguments.
+ * ... : n_expected PyObject** where the arguments are saved.
+ *
+ * Returns
+ * -------
+ * True if the arguments were unpacked successfully, False if an exception was raised.
+ */
+bool pyccel_parse_fastcall(PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames,
+        const char* const kwlist[], PyObject* kwlist_interned[],
+        Py_ssize_t n_required, Py_ssize_t n_expected, ...);
 
 #endif
@@ -9,70 +9,49 @@
 /*
  * Function : _numpy_to_ndarray_strides
  * --------------------
- * Convert numpy strides to nd_array strides, and return it in a new array, to
- * avoid the problem of different implementations of strides in numpy and ndarray.
+ * Convert numpy strides to nd_array strides, and save them in the provided
+ * array, to avoid the problem of different implementations of strides in
+ * numpy and ndarray.
  * Parameters :
  *     np_strides : npy_intp array
  *     type_size  : data type enum
  *     nd : size of the array
- *
- * Returns    :
- *     ndarray_strides : a new array with new strides values
+ *     ndarray_strides : the array where the new strides values are saved
  */
-static int64_t	*_numpy_to_ndarray_strides(npy_intp  *np_strides, int type_size, int nd)
+static void	_numpy_to_ndarray_strides(npy_intp  *np_strides, int type_size, int nd, int64_t *ndarray_strides)
 {
-    int64_t *ndarray_strides;
-
-    ndarray_strides = (int64_t*)malloc(sizeof(int64_t) * nd);
     for (int i = 0; i < nd; i++)
         ndarray_strides[i] = (int64_t) np_strides[i] / type_size;
-
-    return ndarray_strides;
 }
 
-static npy_intp	*_ndarray_to_numpy_strides(int64_t  *nd_strides, int32_t type_size, int nd)
+static void	_ndarray_to_numpy_strides(int64_t  *nd_strides, int32_t type_size, int nd, npy_intp *numpy_strides)
 {
-    npy_intp *numpy_strides;
-
-    numpy_strides = (npy_intp*)malloc(sizeof(npy_intp) * nd);
     for (int i = 0; i < nd; i++)
         numpy_strides[i] = (npy_intp) nd_strides[i] * type_size;
-
-    return numpy_strides;
 }
 
 
 /*
  * Function : _numpy_to_ndarray_shape
  * --------------------
- * Copy numpy shape to nd_array shape, and return it in a new array, to
+ * Copy numpy shape to nd_array shape, and save it in the provided array, to
  * avoid the problem of variation of system architecture because numpy shape
  * is not saved in fixed length type.
  * Parameters :
  *     np_shape : npy_intp array
  *     nd : size of the array
- *
- * Returns    :
- *     ndarray_strides : new array
+ *     nd_shape : the array where the shape is saved
 */
-static int64_t     *_numpy_to_ndarray_shape(npy_intp  *np_shape, int nd)
+static void	_numpy_to_ndarray_shape(npy_intp  *np_shape, int nd, int64_t *nd_shape)
 {
-    int64_t *nd_shape;
-
-    nd_shape = (int64_t*)malloc(sizeof(int64_t) * nd);
     for (int i = 0; i < nd; i++)
         nd_shape[i] = (int64_t) np_shape[i];
-    return nd_shape;
 }
 
-static npy_intp *_ndarray_to_numpy_shape(int64_t *nd_shape, int nd)
+static void	_ndarray_to_numpy_shape(int64_t *nd_shape, int nd, npy_intp *np_shape)
 {
-    npy_intp *np_shape;
-
-    np_shape = (npy_intp*)malloc(sizeof(npy_intp) * nd);
     for (int i = 0; i < nd; i++)
         np_shape[i] = (npy_intp) nd_shape[i];
-    return np_shape;
 }
 
 /*
@@ -147,6 +126,27 @@ static char* _check_pyarray_rank(PyArrayObject *a, int rank)
 	return NULL;
 }
 
+/*
+ * Function: _has_pyarray_order
+ * --------------------
+ * Check if the memory layout of a Python array matches the desired order:
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ *      flag  : desired order (a NumPy flag or STRIDED_C_ORDER/STRIDED_F_ORDER)
+ * 	Returns		:
+ *		true if the array has the desired order, false otherwise
+ */
+static bool _has_pyarray_order(PyArrayObject *a, int flag)
+{
+    if (flag == STRIDED_C_ORDER || flag == STRIDED_F_ORDER) {
+        int64_t shape[NPY_MAXDIMS];
+        int64_t strides[NPY_MAXDIMS];
+        return get_fortran_array_layout(a, shape, strides, flag == STRIDED_C_ORDER);
+    }
+    return PyArray_CHKFLAGS(a, flag);
+}
+
 /*
  * Function: _check_pyarray_order
  * --------------------
@@ -168,11 +168,17 @@ static char* _check_pyarray_order(PyArrayObject *a, int flag)
 	if (flag == NO_ORDER_CHECK)
 		return NULL;
 
-	if (!PyArray_CHKFLAGS(a, flag))
+	if (!_has_pyarray_order(a, flag))
 	{
-		char order = (flag == NPY_ARRAY_C_CONTIGUOUS ? 'C' : (flag == NPY_ARRAY_F_CONTIGUOUS ? 'F' : '?'));
+		char order = (flag == NPY_ARRAY_C_CONTIGUOUS || flag == STRIDED_C_ORDER ? 'C' :
+                     (flag == NPY_ARRAY_F_CONTIGUOUS || flag == STRIDED_F_ORDER ? 'F' : '?'));
         char* error = (char *)malloc(200);
-		sprintf(error, "argument does not have the expected ordering (%c)", order);
+		if ((flag == STRIDED_C_ORDER || flag == STRIDED_F_ORDER) && PyArray_NDIM(a) == 1)
+			sprintf(error, "argument cannot be passed without a copy (the step must be positive)");
+		else if (flag == STRIDED_C_ORDER || flag == STRIDED_F_ORDER)
+			sprintf(error, "argument cannot be passed without a copy (the steps must be positive and the ordering must be %c)", order);
+		else
+			sprintf(error, "argument does not have the expected ordering (%c)", order);
 		return error;
 	}
 
@@ -300,8 +306,8 @@ t_ndarray	pyarray_to_ndarray(PyObject *o)
 	array.type        = get_ndarray_type(a);
 	array.length      = PyArray_SIZE(a);
 	array.buffer_size = PyArray_NBYTES(a);
-	array.shape       = _numpy_to_ndarray_shape(PyArray_SHAPE(a), array.nd);
-	array.strides     = _numpy_to_ndarray_strides(PyArray_STRIDES(a), array.type_size, array.nd);
+	_numpy_to_ndarray_shape(PyArray_SHAPE(a), array.nd, array.shape);
+	_numpy_to_ndarray_strides(PyArray_STRIDES(a), array.type_size, array.nd, array.strides);
 	array.order       = PyArray_CHKFLAGS(a, NPY_ARRAY_C_CONTIGUOUS) ? order_c : order_f;
 
 	array.is_view     = 1;
@@ -327,10 +333,13 @@ PyObject* ndarray_to_pyarray(t_ndarray o)
 
     enum NPY_TYPES npy_type = get_numpy_type(o);
 
+    npy_intp shape[MAX_NDIM];
+    npy_intp strides[MAX_NDIM];
+    _ndarray_to_numpy_shape(o.shape, o.nd, shape);
+    _ndarray_to_numpy_strides(o.strides, o.type_size, o.nd, strides);
+
     return PyArray_NewFromDescr(&PyArray_Type, PyArray_DescrFromType(npy_type),
-            o.nd, _ndarray_to_numpy_shape(o.shape, o.nd),
-            _ndarray_to_numpy_strides(o.strides, o.type_size, o.nd),
-            o.raw_data, FLAGS, NULL);
+            o.nd, shape, strides, o.raw_data, FLAGS, NULL);
 }
 
 /*
@@ -379,7 +388,7 @@ bool	pyarray_check(char* name, PyObject *o, int dtype, int rank, int flag)
         correct_type = false;
     }
 
-    if (rank > 1) {
+    if (rank > 1 || flag != NO_ORDER_CHECK) {
         char* array_order = _check_pyarray_order(a, flag);
         if (array_order != NULL) {
             if (!correct_type)
@@ -398,36 +407,24 @@ bool	pyarray_check(char* name, PyObject *o, int dtype, int rank, int flag)
 
 bool	is_numpy_array(PyObject *o, int dtype, int rank, int flag)
 {
-    char* array_type = _check_pyarray_type(o);
-	if (array_type != NULL) {
-        free(array_type);
+    // No error messages are built here as this function is called for each
+    // candidate type when choosing the specialisation of an interface
+    if (!PyArray_Check(o))
         return false;
-    }
 
     PyArrayObject* a = (PyArrayObject*)o;
 
-	// check array element type / rank / order
-    char* array_dtype = _check_pyarray_dtype(a, dtype);
-	if(array_dtype != NULL) {
-        free(array_dtype);
+    // check array element type / rank / order
+    if (dtype != NO_TYPE_CHECK && PyArray_TYPE(a) != dtype)
         return false;
-    }
 
-    char* array_rank = _check_pyarray_rank(a, rank);
-	if(array_rank != NULL) {
-        free(array_rank);
+    if (PyArray_NDIM(a) != rank)
         return false;
-    }
 
-    if (rank > 1) {
-        char* array_order = _check_pyarray_order(a, flag);
-        if(array_order != NULL) {
-            free(array_order);
-            return false;
-        }
-    }
+    if (flag != NO_ORDER_CHECK && !_has_pyarray_order(a, flag))
+        return false;
 
-	return true;
+    return true;
 }
 
 /*
@@ -444,7 +441,7 @@ bool	is_numpy_array(PyObject *o, int dtype, int rank, int flag)
  * -------------------------------------------
  * https://numpy.org/doc/1.17/reference/c-api.array.html#c.PyArray_DIM
  */
-int     nd_ndim(t_ndarray *a, int n)
+int64_t nd_ndim(t_ndarray *a, int n)
 {
 	if (a == NULL)
 		return 0;
@@ -485,12 +482,12 @@ void    *nd_data(t_ndarray *a)
  * 	Returns		:
  *		return 1 if object is NULL or the step along the indexed dimension
  */
-int     nd_nstep_C(t_ndarray *a, int n)
+int64_t nd_nstep_C(t_ndarray *a, int n)
 {
 	if (a == NULL || a->length == 0)
 		return 1;
 
-	int step = a->strides[n];
+	int64_t step = a->strides[n];
 	for (int i = n+1; i<a->nd; ++i) {
 		step /= a->shape[i];
 	}
@@ -507,12 +504,12 @@ int     nd_nstep_C(t_ndarray *a, int n)
  * 	Returns		:
  *		return 1 if object is NULL or the step along the indexed dimension
  */
-int     nd_nstep_F(t_ndarray *a, int n)
+int64_t nd_nstep_F(t_ndarray *a, int n)
 {
 	if (a == NULL || a->length == 0)
 		return 1;
 
-	int step = a->strides[n];
+	int64_t step = a->strides[n];
 	for (int i = 0; i<n; ++i) {
 		step /= a->shape[i];
 	}
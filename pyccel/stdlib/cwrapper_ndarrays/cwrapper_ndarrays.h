@@ -18,6 +18,9 @@
 
 # define NO_TYPE_CHECK -1
 # define NO_ORDER_CHECK -1
+// The array must be accessible from Fortran without a copy (see get_fortran_array_layout)
+# define STRIDED_C_ORDER -2
+# define STRIDED_F_ORDER -3
 
 /*
  * Function: pyarray_to_ndarray
@@ -48,8 +51,8 @@ bool	pyarray_check(char* name, PyObject *o, int dtype, int rank, int flag);
 bool	is_numpy_array(PyObject *o, int dtype, int rank, int flag);
 
 void    *nd_data(t_ndarray *a);
-int     nd_ndim(t_ndarray *a, int n);
-int     nd_nstep_C(t_ndarray *a, int n);
-int     nd_nstep_F(t_ndarray *a, int n);
+int64_t nd_ndim(t_ndarray *a, int n);
+int64_t nd_nstep_C(t_ndarray *a, int n);
+int64_t nd_nstep_F(t_ndarray *a, int n);
 
 #endif
@@ -19,7 +19,7 @@
 
 void print_ndarray_memory(t_ndarray nd)
 {
-    int i;
+    int64_t i;
 
     for (i = 0; i < nd.length; ++i)
     {
@@ -111,14 +111,12 @@ t_ndarray   array_create(int32_t nd, int64_t *shape,
     }
     arr.is_view = is_view;
     arr.length = 1;
-    arr.shape = malloc(arr.nd * sizeof(int64_t));
     for (int32_t i = 0; i < arr.nd; i++)
     {
         arr.length *= shape[i];
         arr.shape[i] = shape[i];
     }
     arr.buffer_size = arr.length * arr.type_size;
-    arr.strides = malloc(nd * sizeof(int64_t));
     if (arr.order == order_c)
     {
         for (int32_t i = 0; i < arr.nd; i++)
@@ -137,8 +135,7 @@ t_ndarray   array_create(int32_t nd, int64_t *shape,
                 arr.strides[i] *= arr.shape[j];
         }
     }
-    if (!is_view)
-        arr.raw_data = malloc(arr.buffer_size);
+    arr.raw_data = is_view ? NULL : malloc(arr.buffer_size);
     return (arr);
 }
 
@@ -191,7 +188,7 @@ void   _array_fill_int8(int8_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int8[i] = c;
 }
 
@@ -200,7 +197,7 @@ void   _array_fill_int16(int16_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int16[i] = c;
 }
 
@@ -209,7 +206,7 @@ void   _array_fill_int32(int32_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int32[i] = c;
 }
 
@@ -218,7 +215,7 @@ void   _array_fill_int64(int64_t c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_int64[i] = c;
 }
 
@@ -227,7 +224,7 @@ void   _array_fill_bool(bool c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_bool[i] = c;
 }
 
@@ -236,7 +233,7 @@ void   _array_fill_float(float c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_float[i] = c;
 }
 
@@ -245,7 +242,7 @@ void   _array_fill_double(double c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_double[i] = c;
 }
 
@@ -254,7 +251,7 @@ void   _array_fill_cfloat(float complex c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_cfloat[i] = c;
 }
 
@@ -264,7 +261,7 @@ void   _array_fill_cdouble(double complex c, t_ndarray arr)
     if (c == 0)
         memset(arr.raw_data, 0, arr.buffer_size);
     else
-        for (int32_t i = 0; i < arr.length; i++)
+        for (int64_t i = 0; i < arr.length; i++)
             arr.nd_cdouble[i] = c;
 }
 
@@ -274,26 +271,23 @@ void   _array_fill_cdouble(double complex c, t_ndarray arr)
 
 int32_t free_array(t_ndarray* arr)
 {
-    if (arr->shape == NULL)
+    if (arr->raw_data == NULL)
         return (0);
     free(arr->raw_data);
     arr->raw_data = NULL;
-    free(arr->shape);
-    arr->shape = NULL;
-    free(arr->strides);
-    arr->strides = NULL;
     return (1);
 }
 
 
 int32_t free_pointer(t_ndarray* arr)
 {
-    if (arr->is_view == false || arr->shape == NULL)
+    /*
+    ** the shape and strides are stored in the array so
+    ** there is nothing to free, the view is simply detached
+    */
+    if (arr->is_view == false || arr->raw_data == NULL)
         return (0);
-    free(arr->shape);
-    arr->shape = NULL;
-    free(arr->strides);
-    arr->strides = NULL;
+    arr->raw_data = NULL;
     return (1);
 }
 
@@ -301,7 +295,7 @@ int32_t free_pointer(t_ndarray* arr)
 ** slices
 */
 
-t_slice new_slice(int32_t start, int32_t end, int32_t step, t_slice_type type)
+t_slice new_slice(int64_t start, int64_t end, int64_t step, t_slice_type type)
 {
     t_slice slice;
 
@@ -317,15 +311,13 @@ t_ndarray array_slicing(t_ndarray arr, int n, ...)
     t_ndarray view;
     va_list  va;
     t_slice slice;
-    int32_t start = 0;
+    int64_t start = 0;
     int32_t j = 0;
     t_order order = arr.order;
 
     view.nd = n;
     view.type = arr.type;
     view.type_size = arr.type_size;
-    view.shape = malloc(sizeof(int64_t) * view.nd);
-    view.strides = malloc(sizeof(int64_t) * view.nd);
     view.order = order;
     view.is_view = true;
 
@@ -359,30 +351,22 @@ t_ndarray array_slicing(t_ndarray arr, int n, ...)
 void        alias_assign(t_ndarray *dest, t_ndarray src)
 {
     /*
-    ** copy src to dest
-    ** allocate new memory for shape and strides
-    ** setting is_view to true for the garbage collector to deallocate
+    ** copy src to dest (including the shape and strides)
+    ** setting is_view to true so the data is not deallocated with dest
     */
 
     *dest = src;
-    dest->shape = malloc(sizeof(int64_t) * src.nd);
-    memcpy(dest->shape, src.shape, sizeof(int64_t) * src.nd);
-    dest->strides = malloc(sizeof(int64_t) * src.nd);
-    memcpy(dest->strides, src.strides, sizeof(int64_t) * src.nd);
     dest->is_view = true;
 }
 
 void        transpose_alias_assign(t_ndarray *dest, t_ndarray src)
 {
     /*
-    ** copy src to dest
-    ** allocate new memory for shape and strides
-    ** setting is_view to true for the garbage collector to deallocate
+    ** copy src to dest reversing the shape and strides
+    ** setting is_view to true so the data is not deallocated with dest
     */
 
     *dest = src;
-    dest->shape = malloc(sizeof(int64_t) * src.nd);
-    dest->strides = malloc(sizeof(int64_t) * src.nd);
     for (int32_t i = 0; i < src.nd; i++)
     {
         dest->shape[i] = src.shape[src.nd-1-i];
@@ -398,7 +382,7 @@ void        transpose_alias_assign(t_ndarray *dest, t_ndarray src)
 int64_t     get_index(t_ndarray arr, ...)
 {
     va_list va;
-    int32_t index;
+    int64_t index;
 
     va_start(va, arr);
     index = 0;
@@ -491,7 +475,7 @@ bool is_same_shape(t_ndarray a, t_ndarray b)
 }
 
 #define COPY_DATA_FROM_(SRC_TYPE) \
-    void copy_data_from_##SRC_TYPE(t_ndarray **ds, t_ndarray src, uint32_t offset, bool elem_wise_cp) \
+    void copy_data_from_##SRC_TYPE(t_ndarray **ds, t_ndarray src, int64_t offset, bool elem_wise_cp) \
     { \
         t_ndarray *dest = *ds; \
         switch(dest->type) \
@@ -617,7 +601,7 @@ COPY_DATA_FROM_(double)
 COPY_DATA_FROM_(cfloat)
 COPY_DATA_FROM_(cdouble)
 
-void copy_data(t_ndarray **ds, t_ndarray src, uint32_t offset, bool elem_wise_cp)
+void copy_data(t_ndarray **ds, t_ndarray src, int64_t offset, bool elem_wise_cp)
 {
     switch(src.type)
     {
@@ -659,7 +643,7 @@ void copy_data(t_ndarray **ds, t_ndarray src, uint32_t offset, bool elem_wise_cp
     }
 }
 
-void array_copy_data(t_ndarray *dest, t_ndarray src, uint32_t offset)
+void array_copy_data(t_ndarray *dest, t_ndarray src, int64_t offset)
 {
     unsigned char *d = (unsigned char*)dest->raw_data;
     unsigned char *s = (unsigned char*)src.raw_data;
@@ -726,7 +710,7 @@ static int64_t     get_index_from_array(t_ndarray arr, int64_t *nd_indices)
         int64_t nd_indices[arr.nd]; \
         memset(nd_indices, 0, sizeof(int64_t) * arr.nd); \
         TYPE output = 0; \
-        for (int32_t i = 0; i < arr.length; i++) \
+        for (int64_t i = 0; i < arr.length; i++) \
         { \
             output += arr.nd_##CTYPE[get_index_from_array(arr, nd_indices)]; \
             nd_indices[0]++; \
@@ -756,7 +740,7 @@ NUMPY_SUM_(complex128, double complex, cdouble)
         int64_t nd_indices[arr.nd]; \
         memset(nd_indices, 0, sizeof(int64_t) * arr.nd); \
         TYPE output = arr.nd_##CTYPE[get_index_from_array(arr, nd_indices)]; \
-        for (int32_t i = 0; i < arr.length; i++) \
+        for (int64_t i = 0; i < arr.length; i++) \
         { \
             TYPE current_value = arr.nd_##CTYPE[get_index_from_array(arr, nd_indices)]; \
             if (creal(current_value) > creal(output) || \
@@ -791,7 +775,7 @@ NUMPY_AMAX_(complex128, double complex, cdouble)
         int64_t nd_indices[arr.nd]; \
         memset(nd_indices, 0, sizeof(int64_t) * arr.nd); \
         TYPE output = arr.nd_##CTYPE[get_index_from_array(arr, nd_indices)]; \
-        for (int32_t i = 0; i < arr.length; i++) \
+        for (int64_t i = 0; i < arr.length; i++) \
         { \
             TYPE current_value = arr.nd_##CTYPE[get_index_from_array(arr, nd_indices)]; \
             if (creal(current_value) < creal(output) || \
@@ -820,3 +804,157 @@ NUMPY_AMIN_(float64, double, double)
 NUMPY_AMIN_(complex64, float complex, cfloat)
 NUMPY_AMIN_(complex128, double complex, cdouble)
 
+
+/*
+** matrix multiplication
+*/
+
+/*
+** Check if the memory occupied by the elements of two arrays overlaps.
+*/
+bool    arrays_overlap(t_ndarray a, t_ndarray b)
+{
+    int64_t     a_first = 0, a_last = 0, b_first = 0, b_last = 0;
+    uintptr_t   a_start, a_end, b_start, b_end;
+
+    if (a.length == 0 || b.length == 0)
+        return false;
+    for (int32_t i = 0; i < a.nd; i++)
+    {
+        if (a.strides[i] < 0)
+            a_first += (a.shape[i] - 1) * a.strides[i];
+        else
+            a_last += (a.shape[i] - 1) * a.strides[i];
+    }
+    for (int32_t i = 0; i < b.nd; i++)
+    {
+        if (b.strides[i] < 0)
+            b_first += (b.shape[i] - 1) * b.strides[i];
+        else
+            b_last += (b.shape[i] - 1) * b.strides[i];
+    }
+    a_start = (uintptr_t)a.raw_data + a_first * a.type_size;
+    a_end = (uintptr_t)a.raw_data + (a_last + 1) * a.type_size;
+    b_start = (uintptr_t)b.raw_data + b_first * b.type_size;
+    b_end = (uintptr_t)b.raw_data + (b_last + 1) * b.type_size;
+    return a_start < b_end && b_start < a_end;
+}
+
+/*
+** Describe the operands and the result of a matrix product as matrices.
+** A vector on the left is a single row, a vector on the right is a single
+** column and the result has the corresponding shape.
+*/
+void    matmul_operands(t_ndarray out, t_ndarray a, t_ndarray b,
+        t_matrix *out_mat, t_matrix *a_mat, t_matrix *b_mat)
+{
+    if (a.nd == 2)
+        *a_mat = (t_matrix){a.raw_data, a.shape[0], a.shape[1], a.strides[0], a.strides[1]};
+    else
+        *a_mat = (t_matrix){a.raw_data, 1, a.shape[0], 0, a.strides[0]};
+
+    if (b.nd == 2)
+        *b_mat = (t_matrix){b.raw_data, b.shape[0], b.shape[1], b.strides[0], b.strides[1]};
+    else
+        *b_mat = (t_matrix){b.raw_data, b.shape[0], 1, b.strides[0], 0};
+
+    if (out.nd == 2)
+        *out_mat = (t_matrix){out.raw_data, out.shape[0], out.shape[1], out.strides[0], out.strides[1]};
+    else if (a.nd == 1)
+        *out_mat = (t_matrix){out.raw_data, 1, out.shape[0], 0, out.strides[0]};
+    else
+        *out_mat = (t_matrix){out.raw_data, out.shape[0], 1, out.strides[0], 0};
+}
+
+/*
+** Size of the square tiles used by the loops computing a matrix product.
+** The tiles of the three operands should fit into the cache together.
+*/
+#define MATMUL_TILE_SIZE 64
+
+/*
+** Compute the matrix product out = a @ b using tiled loops. This function
+** handles any strides and any element type. If the result overlaps with one
+** of the operands it is computed in a temporary buffer before being copied.
+*/
+#define NUMPY_MATMUL_TILED_(NAME, TYPE, CTYPE) \
+    void numpy_matmul_tiled_##NAME(t_ndarray out, t_ndarray a, t_ndarray b) \
+    { \
+        t_matrix    c_mat, a_mat, b_mat; \
+        matmul_operands(out, a, b, &c_mat, &a_mat, &b_mat); \
+        int64_t m = c_mat.rows, n = c_mat.cols, k = a_mat.cols; \
+        TYPE    *a_data = a.nd_##CTYPE; \
+        TYPE    *b_data = b.nd_##CTYPE; \
+        TYPE    *c_data = out.nd_##CTYPE; \
+        int64_t c_rs = c_mat.row_stride, c_cs = c_mat.col_stride; \
+        TYPE    *buffer = NULL; \
+        if (arrays_overlap(out, a) || arrays_overlap(out, b)) \
+        { \
+            buffer = malloc(sizeof(TYPE) * (m * n > 0 ? m * n : 1)); \
+            c_data = buffer; \
+            c_rs = n; \
+            c_cs = 1; \
+        } \
+        for (int64_t i = 0; i < m; i++) \
+            for (int64_t j = 0; j < n; j++) \
+                c_data[i * c_rs + j * c_cs] = 0; \
+        for (int64_t i0 = 0; i0 < m; i0 += MATMUL_TILE_SIZE) \
+        { \
+            int64_t i_end = i0 + MATMUL_TILE_SIZE < m ? i0 + MATMUL_TILE_SIZE : m; \
+            for (int64_t p0 = 0; p0 < k; p0 += MATMUL_TILE_SIZE) \
+            { \
+                int64_t p_end = p0 + MATMUL_TILE_SIZE < k ? p0 + MATMUL_TILE_SIZE : k; \
+                for (int64_t j0 = 0; j0 < n; j0 += MATMUL_TILE_SIZE) \
+                { \
+                    int64_t j_end = j0 + MATMUL_TILE_SIZE < n ? j0 + MATMUL_TILE_SIZE : n; \
+                    for (int64_t i = i0; i < i_end; i++) \
+                        for (int64_t p = p0; p < p_end; p++) \
+                        { \
+                            TYPE a_ip = a_data[i * a_mat.row_stride + p * a_mat.col_stride]; \
+                            for (int64_t j = j0; j < j_end; j++) \
+                                c_data[i * c_rs + j * c_cs] += a_ip * b_data[p * b_mat.row_stride + j * b_mat.col_stride]; \
+                        } \
+                } \
+            } \
+        } \
+        if (buffer != NULL) \
+        { \
+            for (int64_t i = 0; i < m; i++) \
+                for (int64_t j = 0; j < n; j++) \
+                    out.nd_##CTYPE[i * c_mat.row_stride + j * c_mat.col_stride] = buffer[i * n + j]; \
+            free(buffer); \
+        } \
+    }
+
+NUMPY_MATMUL_TILED_(bool, bool, bool)
+NUMPY_MATMUL_TILED_(int8, int8_t, int8)
+NUMPY_MATMUL_TILED_(int16, int16_t, int16)
+NUMPY_MATMUL_TILED_(int32, int32_t, int32)
+NUMPY_MATMUL_TILED_(int64, int64_t, int64)
+NUMPY_MATMUL_TILED_(float32, float, float)
+NUMPY_MATMUL_TILED_(float64, double, double)
+NUMPY_MATMUL_TILED_(complex64, float complex, cfloat)
+NUMPY_MATMUL_TILED_(complex128, double complex, cdouble)
+
+/*
+** Compute the inner product of two vectors (the result of a @ b when both
+** arrays have one dimension).
+*/
+#define NUMPY_DOT_(NAME, TYPE, CTYPE) \
+    TYPE numpy_dot_##NAME(t_ndarray a, t_ndarray b) \
+    { \
+        TYPE output = 0; \
+        for (int64_t i = 0; i < a.shape[0]; i++) \
+            output += a.nd_##CTYPE[i * a.strides[0]] * b.nd_##CTYPE[i * b.strides[0]]; \
+        return output; \
+    }
+
+NUMPY_DOT_(bool, bool, bool)
+NUMPY_DOT_(int8, int8_t, int8)
+NUMPY_DOT_(int16, int16_t, int16)
+NUMPY_DOT_(int32, int32_t, int32)
+NUMPY_DOT_(int64, int64_t, int64)
+NUMPY_DOT_(float32, float, float)
+NUMPY_DOT_(float64, double, double)
+NUMPY_DOT_(complex64, float complex, cfloat)
+NUMPY_DOT_(complex128, double complex, cdouble)
@@ -0,0 +1,148 @@
+/* -------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file  */
+/* or go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details. */
+/* -------------------------------------------------------------------------------------- */
+
+#include <math.h>
+#include "pyc_random_c.h"
+
+/* Set when integers() is called with an invalid range. All the threads which
+** write to it store the same value. */
+static bool                 invalid_range = false;
+
+/*---------------------------------------------------------------------------*/
+static void                 philox4x32(const uint32_t counter[4], const uint32_t key[2], uint32_t block[4])
+{
+    uint32_t    r0 = counter[0];
+    uint32_t    r1 = counter[1];
+    uint32_t    r2 = counter[2];
+    uint32_t    r3 = counter[3];
+    uint32_t    k0 = key[0];
+    uint32_t    k1 = key[1];
+
+    for (int i = 0; i < 10; i++)
+    {
+        if (i > 0)
+        {
+            k0 += UINT32_C(0x9E3779B9);
+            k1 += UINT32_C(0xBB67AE85);
+        }
+        uint64_t    p0 = (uint64_t)UINT32_C(0xD2511F53) * r0;
+        uint64_t    p1 = (uint64_t)UINT32_C(0xCD9E8D57) * r2;
+        r0 = (uint32_t)(p1 >> 32) ^ r1 ^ k0;
+        r1 = (uint32_t)p1;
+        r2 = (uint32_t)(p0 >> 32) ^ r3 ^ k1;
+        r3 = (uint32_t)p0;
+    }
+    block[0] = r0;
+    block[1] = r1;
+    block[2] = r2;
+    block[3] = r3;
+}
+/*---------------------------------------------------------------------------*/
+static void                 philox_step(t_philox* rng, uint64_t n_blocks)
+{
+    uint64_t    position = ((uint64_t)rng->counter[1] << 32 | rng->counter[0]) + n_blocks;
+
+    rng->counter[0] = (uint32_t)position;
+    rng->counter[1] = (uint32_t)(position >> 32);
+}
+/*---------------------------------------------------------------------------*/
+static uint32_t             philox_next_uint32(t_philox* rng)
+{
+    if (rng->index == 4)
+    {
+        philox4x32(rng->counter, rng->key, rng->block);
+        philox_step(rng, 1);
+        rng->index = 0;
+    }
+    return rng->block[rng->index++];
+}
+/*---------------------------------------------------------------------------*/
+t_philox                    pyc_philox_init(int64_t seed, int64_t stream)
+{
+    t_philox    rng;
+
+    rng.key[0] = (uint32_t)seed;
+    rng.key[1] = (uint32_t)((uint64_t)seed >> 32);
+    rng.counter[0] = 0;
+    rng.counter[1] = 0;
+    rng.counter[2] = (uint32_t)stream;
+    rng.counter[3] = (uint32_t)((uint64_t)stream >> 32);
+    for (int i = 0; i < 4; i++)
+        rng.block[i] = 0;
+    rng.index = 4;
+    rng.has_spare = false;
+    rng.spare = 0.0;
+    return rng;
+}
+/*---------------------------------------------------------------------------*/
+void                        pyc_philox_advance(t_philox* rng, int64_t n_blocks)
+{
+    philox_step(rng, (uint64_t)n_blocks);
+    rng->index = 4;
+    rng->has_spare = false;
+}
+/*---------------------------------------------------------------------------*/
+double                      pyc_philox_random(t_philox* rng)
+{
+    /* Use 53 random bits built from two words */
+    uint32_t    a = philox_next_uint32(rng) >> 5;
+    uint32_t    b = philox_next_uint32(rng) >> 6;
+
+    return (a * 67108864.0 + b) / 9007199254740992.0;
+}
+/*---------------------------------------------------------------------------*/
+int64_t                     pyc_philox_integers(t_philox* rng, int64_t low, int64_t high)
+{
+    /* Rejection sampling: 0 < high - low <= 2**62 is required */
+    uint64_t    span = (uint64_t)high - (uint64_t)low;
+    uint64_t    limit;
+    uint64_t    x;
+
+    if (high <= low || span > (UINT64_C(1) << 62))
+    {
+        invalid_range = true;
+        return low;
+    }
+    if (span <= (UINT64_C(1) << 32))
+    {
+        limit = (UINT64_C(1) << 32) - (UINT64_C(1) << 32) % span;
+        do {
+            x = philox_next_uint32(rng);
+        } while (x >= limit);
+    }
+    else
+    {
+        limit = (UINT64_C(1) << 62) - (UINT64_C(1) << 62) % span;
+        do {
+            x = (uint64_t)(philox_next_uint32(rng) & UINT32_C(0x3FFFFFFF)) << 32;
+            x |= philox_next_uint32(rng);
+        } while (x >= limit);
+    }
+    return low + (int64_t)(x % span);
+}
+/*---------------------------------------------------------------------------*/
+double                      pyc_philox_normal(t_philox* rng, double loc, double scale)
+{
+    /* Box-Muller transform, the second variate is kept for the next call */
+    if (rng->has_spare)
+    {
+        rng->has_spare = false;
+        return loc + scale * rng->spare;
+    }
+    double      radius = sqrt(-2.0 * log(1.0 - pyc_philox_random(rng)));
+    double      theta = 2.0 * M_PI * pyc_philox_random(rng);
+
+    rng->spare = radius * sin(theta);
+    rng->has_spare = true;
+    return loc + scale * radius * cos(theta);
+}
+/*---------------------------------------------------------------------------*/
+bool                        pyc_philox_take_error(void)
+{
+    bool    error = invalid_range;
+
+    invalid_range = false;
+    return error;
+}
@@ -0,0 +1,41 @@
+/* -------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file  */
+/* or go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details. */
+/* -------------------------------------------------------------------------------------- */
+
+#ifndef         PYC_RANDOM_C_H
+#define         PYC_RANDOM_C_H
+#include <stdint.h>
+#include <stdbool.h>
+
+/*
+** Counter-based random number generator Philox4x32-10 (see J. K. Salmon et al.,
+** "Parallel random numbers: as easy as 1, 2, 3", SC'11).
+** The key is the seed. The upper 64 bits of the counter contain the index of
+** the stream and the lower 64 bits contain the index of the block in the stream.
+** The numbers are identical to those generated by pyccel.random.Generator.
+*/
+typedef struct
+{
+    uint32_t    key[2];
+    uint32_t    counter[4];
+    uint32_t    block[4];
+    int32_t     index;
+    bool        has_spare;
+    double      spare;
+}               t_philox;
+
+t_philox        pyc_philox_init(int64_t seed, int64_t stream);
+void            pyc_philox_advance(t_philox* rng, int64_t n_blocks);
+double          pyc_philox_random(t_philox* rng);
+int64_t         pyc_philox_integers(t_philox* rng, int64_t low, int64_t high);
+double          pyc_philox_normal(t_philox* rng, double loc, double scale);
+
+/*
+** Return true if integers() was called with high - low outside of the range
+** [1, 2**62] since the last call, and reset the error. The invalid call
+** returns low.
+*/
+bool            pyc_philox_take_error(void);
+
+#endif
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+""" Module containing helper functions for managing Pyccel's persistent user-level cache
+"""
+import hashlib
+import os
+import shutil
+
+from filelock import FileLock, Timeout
+
+__all__ = ('default_cache_size',
+           'get_cache_dirpath',
+           'get_cache_max_size',
+           'hash_contents',
+           'parse_size',
+           'prune_cache',
+           'touch_cache_entry')
+
+#==============================================================================
+default_cache_size = 2**30
+
+size_units = {'': 1, 'K': 2**10, 'M': 2**20, 'G': 2**30, 'T': 2**40}
+
+#==============================================================================
+def get_cache_dirpath(*subfolders):
+    """
+    Get the path to the user-level Pyccel cache.
+
+    Get the path to the folder where Pyccel stores objects which should persist
+    between processes. The location can be chosen via the environment variable
+    `PYCCEL_CACHE_DIR`. Otherwise the folder `pyccel` is created in the
+    directory described by `XDG_CACHE_HOME` (`~/.cache` by default). The
+    folder is created if it does not already exist.
+
+    Parameters
+    ----------
+    *subfolders : str
+        The names of any sub-folders of the cache which are requested.
+
+    Returns
+    -------
+    str
+        The absolute path to the requested folder.
+    """
+    cache_dir = os.environ.get('PYCCEL_CACHE_DIR', None)
+    if not cache_dir:
+        xdg_cache = os.environ.get('XDG_CACHE_HOME', None) or \
+                os.path.join(os.path.expanduser('~'), '.cache')
+        cache_dir = os.path.join(xdg_cache, 'pyccel')
+    folder = os.path.abspath(os.path.join(cache_dir, *subfolders))
+    os.makedirs(folder, exist_ok=True)
+    return folder
+
+#==============================================================================
+def parse_size(size):
+    """
+    Convert a human-readable size into a number of bytes.
+
+    Convert a string such as `500M` or `2G` into a number of bytes. Integers
+    are returned unchanged.
+
+    Parameters
+    ----------
+    size : str | int
+        The size that should be converted.
+
+    Returns
+    -------
+    int
+        The size in bytes.
+
+    Raises
+    ------
+    ValueError
+        If the string does not describe a size.
+    """
+    if isinstance(size, int):
+        return size
+    size = size.strip().upper()
+    if size.endswith('B'):
+        size = size[:-1]
+    unit = size[-1] if size and size[-1] in size_units else ''
+    value = size[:-1] if unit else size
+    try:
+        return int(float(value) * size_units[unit])
+    except ValueError:
+        raise ValueError(f"Unrecognised size : {size}") from None
+
+#==============================================================================
+def get_cache_max_size():
+    """
+    Get the maximum size of the cache.
+
+    Get the maximum size (in bytes) that the cache is allowed to occupy before
+    the least recently used entries are evicted. This can be set via the
+    environment variable `PYCCEL_CACHE_SIZE` (e.g. `PYCCEL_CACHE_SIZE=500M`).
+    The default value is 1 GiB.
+
+    Returns
+    -------
+    int
+        The maximum size of the cache in bytes.
+    """
+    return parse_size(os.environ.get('PYCCEL_CACHE_SIZE', default_cache_size))
+
+#==============================================================================
+def hash_contents(*items):
+    """
+    Compute a hash describing the provided objects.
+
+    Compute a SHA-256 hash which uniquely describes the provided objects. Each
+    object is converted to a string (bytes are used directly) and a separator
+    is inserted between objects to avoid ambiguities.
+
+    Parameters
+    ----------
+    *items : object
+        The objects which should be described by the hash.
+
+    Returns
+    -------
+    str
+        The hexadecimal representation of the hash.
+    """
+    hasher = hashlib.sha256()
+    for i in items:
+        hasher.update(i if isinstance(i, bytes) else str(i).encode('utf-8'))
+        hasher.update(b'\0')
+    return hasher.hexdigest()
+
+#==============================================================================
+def touch_cache_entry(entry_path):
+    """
+    Mark a cache entry as recently used.
+
+    Update the modification time of a cache entry. This time is used to
+    determine which entries were least recently used when the cache is pruned.
+
+    Parameters
+    ----------
+    entry_path : str
+        The path to the folder containing the cache entry.
+    """
+    try:
+        os.utime(entry_path)
+    except OSError:
+        pass
+
+#==============================================================================
+def _folder_size(folder):
+    """
+    Get the size of all files in a folder.
+
+    Get the size of all files in a folder and its sub-folders.
+
+    Parameters
+    ----------
+    folder : str
+        The folder whose size should be calculated.
+
+    Returns
+    -------
+    int
+        The size of the folder in bytes.
+    """
+    size = 0
+    for root, _, files in os.walk(folder):
+        for f in files:
+            try:
+                size += os.path.getsize(os.path.join(root, f))
+            except OSError:
+                pass
+    return size
+
+#==============================================================================
+def prune_cache(max_size = None, subfolder = None):
+    """
+    Remove the least recently used entries from the cache.
+
+    Remove entries from the cache, starting with the least recently used,
+    until the size of the cache no longer exceeds the maximum size. Each
+    folder found in a sub-folder of the cache is considered to be an
+    entry. Entries which are currently locked by another process are
+    not removed.
+
+    Parameters
+    ----------
+    max_size : int | str, optional
+        The maximum size of the cache. The default is given by
+        `get_cache_max_size`. A size of 0 empties the cache.
+    subfolder : str, optional
+        The sub-folder of the cache which should be pruned. By default
+        all sub-folders are considered together.
+
+    Returns
+    -------
+    int
+        The number of entries which were removed.
+    """
+    max_size = get_cache_max_size() if max_size is None else parse_size(max_size)
+    cache_dir = get_cache_dirpath()
+    categories = [subfolder] if subfolder else [d for d in os.listdir(cache_dir) \
+                    if os.path.isdir(os.path.join(cache_dir, d))]
+
+    entries = []
+    for c in categories:
+        category_dir = os.path.join(cache_dir, c)
+        if not os.path.isdir(category_dir):
+            continue
+        for e in os.listdir(category_dir):
+            entry_path = os.path.join(category_dir, e)
+            if os.path.isdir(entry_path):
+                entries.append((os.path.getmtime(entry_path), entry_path, _folder_size(entry_path)))
+
+    total_size = sum(s for _,_,s in entries)
+    n_removed = 0
+    for _, entry_path, size in sorted(entries):
+        if total_size <= max_size:
+            break
+        lock = FileLock(entry_path + '.lock')
+        try:
+            lock.acquire(timeout=0)
+        except Timeout:
+            continue
+        try:
+            shutil.rmtree(entry_path, ignore_errors=True)
+        finally:
+            lock.release()
+        total_size -= size
+        n_removed += 1
+
+    return n_removed
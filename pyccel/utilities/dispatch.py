@@ -0,0 +1,60 @@
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+""" Module containing the registry used by the visitor classes (parsers and printers) to find
+the method which handles each type of node.
+"""
+
+__all__ = ('get_dispatch_method',)
+
+# Cache of the methods found for each (visitor class, prefix, node class)
+_dispatch_registry = {}
+
+def get_dispatch_method(visitor_cls, prefix, node_cls, follow_mro = True):
+    """
+    Get the method of a visitor class which handles a type of node.
+
+    Get the method of a visitor class (e.g. a parser or a printer) which
+    handles objects of a given type. The method is called `prefix` followed by
+    the name of the type (e.g. `_visit_Assign` or `_print_Variable`). If the
+    visitor does not have such a method then the method resolution order of
+    the type is used to search for a method handling one of its superclasses.
+    The search is only carried out the first time that a given type is handled
+    by a given visitor class. The result is then saved in a registry shared by
+    all the visitors.
+
+    Parameters
+    ----------
+    visitor_cls : type
+        The class of the object visiting the node.
+    prefix : str
+        The prefix of the names of the methods (e.g. `_visit_` or `_print_`).
+    node_cls : type
+        The type of the node being visited.
+    follow_mro : bool, default=True
+        Indicates whether methods handling the superclasses of the node type
+        should be searched for.
+
+    Returns
+    -------
+    function | None
+        The function defined in the visitor class which handles the node. This
+        function must be called with the visitor as its first argument. None is
+        returned if the visitor cannot handle the node.
+    """
+    key = (visitor_cls, prefix, node_cls, follow_mro)
+    try:
+        return _dispatch_registry[key]
+    except KeyError:
+        pass
+
+    classes = node_cls.__mro__ if follow_mro else (node_cls,)
+    method = None
+    for cls in classes:
+        method = getattr(visitor_cls, prefix + cls.__name__, None)
+        if method is not None:
+            break
+
+    _dispatch_registry[key] = method
+    return method
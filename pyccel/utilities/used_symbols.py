@@ -0,0 +1,251 @@
+#------------------------------------------------------------------------------------------#
+# This file is part of Pyccel which is released under MIT License. See the LICENSE file or #
+# go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details.      #
+#------------------------------------------------------------------------------------------#
+""" Module containing the classes used by the Scope to store the symbols used in the
+generated code.
+"""
+
+__all__ = ('UsedSymbols', 'UsedSymbolsView')
+
+class UsedSymbols(dict):
+    """
+    Dictionary mapping symbols to the collisionless names used in the generated code.
+
+    A dictionary mapping the symbols used in the Python code to the collisionless
+    names which are used in the generated code. In addition to the dictionary,
+    an index of the collisionless names (and of their lower-case versions) is
+    maintained so that it can be determined in constant time whether a name is
+    already used.
+
+    Parameters
+    ----------
+    *args : tuple
+        See `dict`.
+    **kwargs : dict
+        See `dict`.
+    """
+    __slots__ = ('_names', '_casefolded_names')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._names = {}
+        self._casefolded_names = {}
+        self.update(*args, **kwargs)
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    @staticmethod
+    def _add(counter, name):
+        """
+        Increment the number of occurrences of a name in an index.
+
+        Increment the number of occurrences of a name in an index.
+
+        Parameters
+        ----------
+        counter : dict[str, int]
+            The index.
+        name : str
+            The name.
+        """
+        counter[name] = counter.get(name, 0) + 1
+
+    @staticmethod
+    def _remove(counter, name):
+        """
+        Decrement the number of occurrences of a name in an index.
+
+        Decrement the number of occurrences of a name in an index and remove
+        it if it no longer occurs.
+
+        Parameters
+        ----------
+        counter : dict[str, int]
+            The index.
+        name : str
+            The name.
+        """
+        count = counter[name] - 1
+        if count:
+            counter[name] = count
+        else:
+            counter.pop(name)
+
+    def _index(self, name):
+        """
+        Add a collisionless name to the indices.
+
+        Add a collisionless name to the indices.
+
+        Parameters
+        ----------
+        name : str
+            The collisionless name.
+        """
+        self._add(self._names, name)
+        self._add(self._casefolded_names, name.lower())
+
+    def _unindex(self, name):
+        """
+        Remove a collisionless name from the indices.
+
+        Remove a collisionless name from the indices.
+
+        Parameters
+        ----------
+        name : str
+            The collisionless name.
+        """
+        self._remove(self._names, name)
+        self._remove(self._casefolded_names, name.lower())
+
+    def __setitem__(self, key, value):
+        if key in self:
+            self._unindex(self[key])
+        super().__setitem__(key, value)
+        self._index(value)
+
+    def __delitem__(self, key):
+        self._unindex(self[key])
+        super().__delitem__(key)
+
+    def pop(self, key, *args):
+        if key in self:
+            self._unindex(self[key])
+        return super().pop(key, *args)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._unindex(value)
+        return key, value
+
+    def setdefault(self, key, default = None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        super().clear()
+        self._names.clear()
+        self._casefolded_names.clear()
+
+    def copy(self):
+        return UsedSymbols(self)
+
+    def has_name(self, name):
+        """
+        Indicate whether a collisionless name is used.
+
+        Indicate whether a name is one of the values of the dictionary.
+
+        Parameters
+        ----------
+        name : str
+            The name.
+
+        Returns
+        -------
+        bool
+            True if the name is used, False otherwise.
+        """
+        return name in self._names
+
+    def has_casefolded_name(self, name):
+        """
+        Indicate whether a collisionless name is used, ignoring the case.
+
+        Indicate whether a name is one of the values of the dictionary when the
+        case is ignored.
+
+        Parameters
+        ----------
+        name : str
+            The name in lower case.
+
+        Returns
+        -------
+        bool
+            True if the name is used, False otherwise.
+        """
+        return name in self._casefolded_names
+
+    @property
+    def names(self):
+        """
+        The collisionless names used.
+
+        A view of the collisionless names which are used (i.e. the values of the
+        dictionary).
+        """
+        return self._names.keys()
+
+class UsedSymbolsView:
+    """
+    Set-like view of the names used in a scope and its enclosing scopes.
+
+    A read-only view of the collisionless names stored in a chain of
+    `UsedSymbols` dictionaries (one for each scope, starting with the
+    innermost scope). Membership tests look up each scope in turn without
+    copying any names so their cost only depends on the depth of the scope.
+
+    Parameters
+    ----------
+    used_symbols : iterable[UsedSymbols]
+        The dictionaries of the scopes, starting with the innermost scope.
+    """
+    __slots__ = ('_used_symbols',)
+
+    def __init__(self, used_symbols):
+        self._used_symbols = tuple(used_symbols)
+
+    def __contains__(self, name):
+        return any(s.has_name(name) for s in self._used_symbols)
+
+    def contains_casefolded(self, name):
+        """
+        Indicate whether a name is used, ignoring the case.
+
+        Indicate whether a name is used in any of the scopes when the case is
+        ignored.
+
+        Parameters
+        ----------
+        name : str
+            The name in lower case.
+
+        Returns
+        -------
+        bool
+            True if the name is used, False otherwise.
+        """
+        return any(s.has_casefolded_name(name) for s in self._used_symbols)
+
+    def __iter__(self):
+        seen = set()
+        for s in self._used_symbols:
+            for n in s.names:
+                if n not in seen:
+                    seen.add(n)
+                    yield n
+
+    def __len__(self):
+        return len(self.copy())
+
+    def copy(self):
+        """
+        Get a set containing the names.
+
+        Get a new set containing all the names in the view.
+
+        Returns
+        -------
+        set[str]
+            The names.
+        """
+        return set(self)
@@ -0,0 +1,23 @@
+module bind_c_mod_30ft5if6pjj1
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_30ft5if6pjj1
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_test_omp_get_active_level() bind(c) result( &
+        active_level_vars)
+
+    implicit none
+
+    integer(i32) :: active_level_vars
+
+    active_level_vars = test_omp_get_active_level()
+
+  end function bind_c_test_omp_get_active_level
+  !........................................
+
+end module bind_c_mod_30ft5if6pjj1
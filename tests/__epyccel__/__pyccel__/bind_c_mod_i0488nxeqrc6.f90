@@ -0,0 +1,53 @@
+module bind_c_mod_i0488nxeqrc6
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , i64 => &
+        C_INT64_T , f64 => C_DOUBLE , c_ptr , C_F_Pointer
+  use mod_i0488nxeqrc6
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_parallel_array_reductions(bound_a, bound_a_shape_1, &
+        bound_a_shape_2, bound_a_stride_1, bound_a_stride_2, bound_b, &
+        bound_b_shape_1, bound_b_stride_1, bound_c, bound_c_shape_1, &
+        bound_c_shape_2, bound_c_stride_1, bound_c_stride_2, s, m, n) &
+        bind(c)
+
+    implicit none
+
+    real(f64), intent(out) :: s
+    integer(i32), intent(out) :: m
+    real(f64), intent(out) :: n
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_shape_2
+    integer(i64), value :: bound_a_stride_1
+    integer(i64), value :: bound_a_stride_2
+    type(c_ptr), value :: bound_b
+    integer(i64), value :: bound_b_shape_1
+    integer(i64), value :: bound_b_stride_1
+    type(c_ptr), value :: bound_c
+    integer(i64), value :: bound_c_shape_1
+    integer(i64), value :: bound_c_shape_2
+    integer(i64), value :: bound_c_stride_1
+    integer(i64), value :: bound_c_stride_2
+    real(f64), pointer :: a(:, :)
+    integer(i32), pointer :: b(:)
+    real(f64), pointer :: c(:, :)
+
+    call C_F_Pointer(bound_a, a, [bound_a_stride_1,bound_a_shape_1])
+    call C_F_Pointer(bound_b, b, [bound_b_shape_1 * bound_b_stride_1])
+    call C_F_Pointer(bound_c, c, [bound_c_stride_2,bound_c_shape_2])
+    call parallel_array_reductions(a = a(1_i64:bound_a_shape_2 * &
+          bound_a_stride_2 + 1_i64 - 1_i64:bound_a_stride_2, 1_i64: &
+          bound_a_shape_1 + 1_i64 - 1_i64), b = b(1_i64:: &
+          bound_b_stride_1), c = c(1_i64:bound_c_shape_1 * &
+          bound_c_stride_1 + 1_i64 - 1_i64:bound_c_stride_1, 1_i64: &
+          bound_c_shape_2 + 1_i64 - 1_i64), s = s, m = m, n = n)
+
+  end subroutine bind_c_parallel_array_reductions
+  !........................................
+
+end module bind_c_mod_i0488nxeqrc6
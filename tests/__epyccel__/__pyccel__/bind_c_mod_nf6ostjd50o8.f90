@@ -0,0 +1,33 @@
+module bind_c_mod_nf6ostjd50o8
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , f64 => C_DOUBLE , &
+        C_F_Pointer , i64 => C_INT64_T
+  use mod_nf6ostjd50o8
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_parallel_array_constructors(bound_a, bound_a_shape_1 &
+        , bound_a_stride_1, Out_0001, Out_0002, Out_0003) bind(c)
+
+    implicit none
+
+    real(f64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_stride_1
+    real(f64), pointer :: a(:)
+
+    call C_F_Pointer(bound_a, a, [bound_a_shape_1 * bound_a_stride_1])
+    call parallel_array_constructors(a = a(1_i64::bound_a_stride_1), &
+          Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = Out_0003 &
+          )
+
+  end subroutine bind_c_parallel_array_constructors
+  !........................................
+
+end module bind_c_mod_nf6ostjd50o8
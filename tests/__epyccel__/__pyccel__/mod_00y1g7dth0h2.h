@@ -0,0 +1,11 @@
+#ifndef MOD_00Y1G7DTH0H2_H
+#define MOD_00Y1G7DTH0H2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_mul(t_ndarray x, double a);
+#endif // mod_00y1g7dth0h2_H
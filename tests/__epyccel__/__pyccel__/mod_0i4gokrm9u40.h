@@ -0,0 +1,12 @@
+#ifndef MOD_0I4GOKRM9U40_H
+#define MOD_0I4GOKRM9U40_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_0i4gokrm9u40_H
@@ -0,0 +1,11 @@
+#ifndef MOD_0OTUZN3SF80P_H
+#define MOD_0OTUZN3SF80P_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_number_of_procs(void);
+#endif // mod_0otuzn3sf80p_H
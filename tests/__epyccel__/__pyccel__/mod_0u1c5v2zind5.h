@@ -0,0 +1,11 @@
+#ifndef MOD_0U1C5V2ZIND5_H
+#define MOD_0U1C5V2ZIND5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t constant_negative_index(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_0u1c5v2zind5_H
@@ -0,0 +1,11 @@
+#ifndef MOD_0X1EMC3Y3AWP_H
+#define MOD_0X1EMC3Y3AWP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_scalar_mul(t_ndarray x, int64_t a);
+#endif // mod_0x1emc3y3awp_H
@@ -0,0 +1,22 @@
+#include "mod_13eb7ycf66fk.h"
+
+
+/*........................................*/
+void arr_arange_7(t_ndarray arr)
+{
+    int64_t n;
+    int64_t m;
+    int64_t i;
+    int64_t i_0001;
+    n = arr.shape[INT64_C(0)];
+    m = arr.shape[INT64_C(1)];
+    for (i = INT64_C(0); i < n; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < arr.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(arr, nd_int64, i, i_0001) = i + i_0001;
+        }
+    }
+}
+/*........................................*/
+
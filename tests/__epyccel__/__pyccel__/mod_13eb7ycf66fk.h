@@ -0,0 +1,11 @@
+#ifndef MOD_13EB7YCF66FK_H
+#define MOD_13EB7YCF66FK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void arr_arange_7(t_ndarray arr);
+#endif // mod_13eb7ycf66fk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_15CUVS1CSE83_H
+#define MOD_15CUVS1CSE83_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_15cuvs1cse83_H
@@ -0,0 +1,63 @@
+module mod_18ar4j9kdfft
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , f64 => &
+        C_DOUBLE , i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine parallel_array_reductions(a, b, c, s, m, n) 
+
+    implicit none
+
+    real(f64), intent(out) :: s
+    integer(i32), intent(out) :: m
+    real(f64), intent(out) :: n
+    real(f64), intent(in) :: a(0_i64:, 0_i64:)
+    integer(i32), intent(in) :: b(0_i64:)
+    real(f64), intent(in) :: c(0_i64:, 0_i64:)
+    integer(i64) :: i
+    integer(i64) :: i_0001
+    real(f64) :: tmp
+    integer(i32) :: tmp_0001
+    real(f64) :: tmp_0002
+
+    tmp = 0.0_f64
+    !$omp parallel do private(i_0001) reduction(+:tmp) if(parallel: size &
+    !$omp &(a, 2_i64, i64) * size(a, 1_i64, i64) >= 100)
+    do i = 0_i64, size(a, 2_i64, i64) - 1_i64
+      !$omp simd reduction(+:tmp)
+      do i_0001 = 0_i64, size(a, 1_i64, i64) - 1_i64
+        tmp = tmp + a(i_0001, i)
+      end do
+    end do
+    s = tmp
+    tmp_0001 = b(0_i64)
+    !$omp parallel do simd reduction(max:tmp_0001) if(parallel: size(b, &
+    !$omp &kind=i64) >= 100)
+    do i = 0_i64, size(b, kind=i64) - 1_i64
+      if (b(i) > tmp_0001) then
+        tmp_0001 = b(i)
+      end if
+    end do
+    m = tmp_0001
+    tmp_0002 = c(1_i64, 0_i64)
+    !$omp parallel do private(i) reduction(min:tmp_0002) if(parallel: &
+    !$omp &size(c, 2_i64, i64) * (size(c, 1_i64, i64) - 1_i64) >= 100)
+    do i_0001 = 0_i64, size(c, 2_i64, i64) - 1_i64
+      !$omp simd reduction(min:tmp_0002)
+      do i = 0_i64, size(c, 1_i64, i64) - 1_i64 - 1_i64
+        if (c(i + 1_i64, i_0001) < tmp_0002) then
+          tmp_0002 = c(i + 1_i64, i_0001)
+        end if
+      end do
+    end do
+    n = tmp_0002
+    return
+
+  end subroutine parallel_array_reductions
+  !........................................
+
+end module mod_18ar4j9kdfft
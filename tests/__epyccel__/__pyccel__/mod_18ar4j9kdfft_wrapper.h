@@ -0,0 +1,42 @@
+#ifndef MOD_18AR4J9KDFFT_WRAPPER_H
+#define MOD_18AR4J9KDFFT_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_18AR4J9KDFFT_WRAPPER
+
+int64_t bind_c_parallel_array_reductions(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, double*, int32_t*, double*);
+
+#else
+
+static void** Pymod_18ar4j9kdfft_API;
+
+
+/*........................................*/
+static int mod_18ar4j9kdfft_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_18ar4j9kdfft_API = (void**)PyCapsule_Import("mod_18ar4j9kdfft._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_18ar4j9kdfft_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_18AR4J9KDFFT_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_192QXPGFZZIQ_H
+#define MOD_192QXPGFZZIQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_3d_C_array_initialization_1(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_192qxpgfzziq_H
@@ -0,0 +1,14 @@
+#include "mod_1b21rtj9e9br.h"
+
+
+/*........................................*/
+void array_int32_1d_idiv(t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int32, i) = (int32_t)floor((double)(GET_ELEMENT(x, nd_int32, i)) / (double)(GET_ELEMENT(y, nd_int32, i)));
+    }
+}
+/*........................................*/
+
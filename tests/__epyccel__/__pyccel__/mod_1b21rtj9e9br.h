@@ -0,0 +1,12 @@
+#ifndef MOD_1B21RTJ9E9BR_H
+#define MOD_1B21RTJ9E9BR_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_1b21rtj9e9br_H
@@ -0,0 +1,42 @@
+#ifndef MOD_1CCKMGDO5TTO_WRAPPER_H
+#define MOD_1CCKMGDO5TTO_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_1CCKMGDO5TTO_WRAPPER
+
+int64_t bind_c_parallel_array_constructors(void*, int64_t, int64_t, double*, double*, double*);
+
+#else
+
+static void** Pymod_1cckmgdo5tto_API;
+
+
+/*........................................*/
+static int mod_1cckmgdo5tto_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_1cckmgdo5tto_API = (void**)PyCapsule_Import("mod_1cckmgdo5tto._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_1cckmgdo5tto_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_1CCKMGDO5TTO_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_1M9EBPFTYZIJ_H
+#define MOD_1M9EBPFTYZIJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_sum_stack_array(void);
+#endif // mod_1m9ebpftyzij_H
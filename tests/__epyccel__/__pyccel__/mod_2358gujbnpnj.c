@@ -0,0 +1,57 @@
+#include "mod_2358gujbnpnj.h"
+
+
+/*........................................*/
+double multiple_np_linspace(void)
+{
+    int64_t linspace_index;
+    double array_dummy[INT64_C(128)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(128)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double array_dummy_0001[INT64_C(128)];
+    t_ndarray y = (t_ndarray){
+        .nd_double=array_dummy_0001,
+        .shape={INT64_C(128)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    double array_dummy_0002[INT64_C(128)];
+    t_ndarray z = (t_ndarray){
+        .nd_double=array_dummy_0002,
+        .shape={INT64_C(128)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&z);
+    int64_t i;
+    double Out_0001;
+    linspace_index = INT64_C(5);
+    for (i = INT64_C(0); i < INT64_C(128); i += INT64_C(1))
+    {
+        x.nd_double[i] = (INT64_C(0) + i*(double)((INT64_C(2) - INT64_C(0))) / 127.0);
+        x.nd_double[INT64_C(127)] = (double)INT64_C(2);
+    }
+    for (i = INT64_C(0); i < INT64_C(128); i += INT64_C(1))
+    {
+        y.nd_double[i] = (INT64_C(0) + i*(double)((INT64_C(4) - INT64_C(0))) / 127.0);
+        y.nd_double[INT64_C(127)] = (double)INT64_C(4);
+    }
+    for (i = INT64_C(0); i < INT64_C(128); i += INT64_C(1))
+    {
+        z.nd_double[i] = (INT64_C(0) + i*(double)((INT64_C(8) - INT64_C(0))) / 127.0);
+        z.nd_double[INT64_C(127)] = (double)INT64_C(8);
+    }
+    Out_0001 = x.nd_double[INT64_C(0)] + y.nd_double[INT64_C(1)] + z.nd_double[INT64_C(2)] + linspace_index;
+    return Out_0001;
+}
+/*........................................*/
+
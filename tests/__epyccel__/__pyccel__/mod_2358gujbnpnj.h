@@ -0,0 +1,11 @@
+#ifndef MOD_2358GUJBNPNJ_H
+#define MOD_2358GUJBNPNJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double multiple_np_linspace(void);
+#endif // mod_2358gujbnpnj_H
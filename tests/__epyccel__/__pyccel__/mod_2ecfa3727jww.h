@@ -0,0 +1,11 @@
+#ifndef MOD_2ECFA3727JWW_H
+#define MOD_2ECFA3727JWW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_4(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_2ecfa3727jww_H
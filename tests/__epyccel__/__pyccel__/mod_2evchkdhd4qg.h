@@ -0,0 +1,11 @@
+#ifndef MOD_2EVCHKDHD4QG_H
+#define MOD_2EVCHKDHD4QG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_sum_stack_array(void);
+#endif // mod_2evchkdhd4qg_H
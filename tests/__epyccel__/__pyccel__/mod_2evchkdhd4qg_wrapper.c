@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_2EVCHKDHD4QG_WRAPPER
+
+#include "mod_2evchkdhd4qg_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_2d_sum_stack_array_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double s;
+    PyObject* s_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    s = array_float_2d_sum_stack_array();
+    s_obj = Double_to_PyDouble(&s);
+    return s_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_2evchkdhd4qg_methods[] = {
+    {
+        "array_float_2d_sum_stack_array",
+        (PyCFunction)array_float_2d_sum_stack_array_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_2evchkdhd4qg_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_2evchkdhd4qg",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_2evchkdhd4qg_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_2evchkdhd4qg(void)
+{
+    PyObject* mod;
+    static void* Pymod_2evchkdhd4qg_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_2evchkdhd4qg_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_2evchkdhd4qg_API, "mod_2evchkdhd4qg._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
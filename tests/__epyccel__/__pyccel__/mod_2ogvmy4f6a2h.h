@@ -0,0 +1,12 @@
+#ifndef MOD_2OGVMY4F6A2H_H
+#define MOD_2OGVMY4F6A2H_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_2d_F_array_initialization(t_ndarray a);
+#endif // mod_2ogvmy4f6a2h_H
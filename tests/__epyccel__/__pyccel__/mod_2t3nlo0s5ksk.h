@@ -0,0 +1,11 @@
+#ifndef MOD_2T3NLO0S5KSK_H
+#define MOD_2T3NLO0S5KSK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_2t3nlo0s5ksk_H
@@ -0,0 +1,12 @@
+#ifndef MOD_2TMXZZTDUGPS_H
+#define MOD_2TMXZZTDUGPS_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_in_bool_out_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri);
+#endif // mod_2tmxzztdugps_H
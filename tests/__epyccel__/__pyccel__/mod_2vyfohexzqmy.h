@@ -0,0 +1,11 @@
+#ifndef MOD_2VYFOHEXZQMY_H
+#define MOD_2VYFOHEXZQMY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_mul(t_ndarray x, double a);
+#endif // mod_2vyfohexzqmy_H
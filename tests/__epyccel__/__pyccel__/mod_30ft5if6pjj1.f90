@@ -0,0 +1,28 @@
+module mod_30ft5if6pjj1
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function test_omp_get_active_level() result(active_level_vars)
+
+    use omp_lib, only: omp_get_active_level
+
+    implicit none
+
+    integer(i32) :: active_level_vars
+
+    !$omp parallel
+    !$omp parallel
+    active_level_vars = omp_get_active_level()
+    !$omp end parallel
+    !$omp end parallel
+    return
+
+  end function test_omp_get_active_level
+  !........................................
+
+end module mod_30ft5if6pjj1
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_30FT5IF6PJJ1_WRAPPER
+
+#include "mod_30ft5if6pjj1_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_test_omp_get_active_level_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t active_level_vars;
+    PyObject* active_level_vars_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    active_level_vars = bind_c_test_omp_get_active_level();
+    active_level_vars_obj = Int32_to_NumpyLong(&active_level_vars);
+    return active_level_vars_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_30ft5if6pjj1_methods[] = {
+    {
+        "test_omp_get_active_level",
+        (PyCFunction)bind_c_test_omp_get_active_level_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_30ft5if6pjj1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_30ft5if6pjj1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_30ft5if6pjj1_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_30ft5if6pjj1(void)
+{
+    PyObject* mod;
+    static void* Pymod_30ft5if6pjj1_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_30ft5if6pjj1_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_30ft5if6pjj1_API, "mod_30ft5if6pjj1._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,40 @@
+#ifndef MOD_30FT5IF6PJJ1_WRAPPER_H
+#define MOD_30FT5IF6PJJ1_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_30FT5IF6PJJ1_WRAPPER
+
+int32_t bind_c_test_omp_get_active_level(void);
+
+#else
+
+static void** Pymod_30ft5if6pjj1_API;
+
+
+/*........................................*/
+static int mod_30ft5if6pjj1_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_30ft5if6pjj1_API = (void**)PyCapsule_Import("mod_30ft5if6pjj1._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_30ft5if6pjj1_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_30FT5IF6PJJ1_WRAPPER_H
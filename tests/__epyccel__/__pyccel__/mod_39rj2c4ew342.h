@@ -0,0 +1,11 @@
+#ifndef MOD_39RJ2C4EW342_H
+#define MOD_39RJ2C4EW342_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_sub(t_ndarray x, t_ndarray y);
+#endif // mod_39rj2c4ew342_H
@@ -0,0 +1,11 @@
+#ifndef MOD_3FN132M2WQZE_H
+#define MOD_3FN132M2WQZE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_sub(t_ndarray x, int64_t a);
+#endif // mod_3fn132m2wqze_H
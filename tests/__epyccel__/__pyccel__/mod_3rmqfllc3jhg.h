@@ -0,0 +1,12 @@
+#ifndef MOD_3RMQFLLC3JHG_H
+#define MOD_3RMQFLLC3JHG_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_3rmqfllc3jhg_H
@@ -0,0 +1,12 @@
+#ifndef MOD_4KS1P0SX78DM_H
+#define MOD_4KS1P0SX78DM_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex array_kwargs_ones(void);
+#endif // mod_4ks1p0sx78dm_H
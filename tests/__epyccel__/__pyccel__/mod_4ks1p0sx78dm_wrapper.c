@@ -0,0 +1,84 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4KS1P0SX78DM_WRAPPER
+
+#include "mod_4ks1p0sx78dm_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+/*____________________________________*/
+/* ones(shape, dtype=float, order='C') */
+/*                                     */
+/*_____________________________________*/
+static PyObject* array_kwargs_ones_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = array_kwargs_ones();
+    Out_0001_obj = Complex128_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4ks1p0sx78dm_methods[] = {
+    {
+        "array_kwargs_ones",
+        (PyCFunction)array_kwargs_ones_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        " ones(shape, dtype=float, order=\'C\')\n    "
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4ks1p0sx78dm_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4ks1p0sx78dm",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4ks1p0sx78dm_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4ks1p0sx78dm(void)
+{
+    PyObject* mod;
+    static void* Pymod_4ks1p0sx78dm_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4ks1p0sx78dm_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4ks1p0sx78dm_API, "mod_4ks1p0sx78dm._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,21 @@
+#ifndef MOD_4TLNQ8ZC35UE_H
+#define MOD_4TLNQ8ZC35UE_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t dtype_convert_to_cfloat_0000(t_ndarray arr, int64_t* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+int64_t dtype_convert_to_cfloat_0001(t_ndarray arr, int64_t* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+int64_t dtype_convert_to_cfloat_0002(t_ndarray arr, int64_t* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+int64_t dtype_convert_to_cfloat_0003(t_ndarray arr, int64_t* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+int64_t dtype_convert_to_cfloat_0004(t_ndarray arr, int64_t* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+int64_t dtype_convert_to_cfloat_0005(t_ndarray arr, int64_t* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+int64_t dtype_convert_to_cfloat_0006(t_ndarray arr, int64_t* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+int64_t dtype_convert_to_cfloat_0007(t_ndarray arr, int64_t* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+int64_t dtype_convert_to_cfloat_0008(t_ndarray arr, int64_t* Out_0001, float complex* Out_0002, float complex* Out_0003, float complex* Out_0004, float complex* Out_0005);
+#endif // mod_4tlnq8zc35ue_H
@@ -0,0 +1,11 @@
+#ifndef MOD_55Z56GPTHYL5_H
+#define MOD_55Z56GPTHYL5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_sub(t_ndarray x, double a);
+#endif // mod_55z56gpthyl5_H
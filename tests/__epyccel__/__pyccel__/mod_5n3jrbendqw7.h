@@ -0,0 +1,12 @@
+#ifndef MOD_5N3JRBENDQW7_H
+#define MOD_5N3JRBENDQW7_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_5n3jrbendqw7_H
@@ -0,0 +1,12 @@
+#ifndef MOD_5TJ880FOQTW2_H
+#define MOD_5TJ880FOQTW2_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_5tj880foqtw2_H
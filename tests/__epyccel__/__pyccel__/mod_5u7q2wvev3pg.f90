@@ -0,0 +1,32 @@
+module mod_5u7q2wvev3pg
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine omp_matmul_single(A, x, out) 
+
+    implicit none
+
+    real(f64), intent(in) :: A(0_i64:, 0_i64:)
+    real(f64), intent(in) :: x(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: out(0_i64:, 0_i64:)
+
+    !$omp parallel
+    !$omp single
+    out(:, :) = matmul(x,A)
+    !$omp end single
+    !$omp end parallel
+    !to let the function compile using epyccel issue #468
+    !____CommentBlock____!
+    !bypass issue #468   !
+    !____________________!
+
+  end subroutine omp_matmul_single
+  !........................................
+
+end module mod_5u7q2wvev3pg
@@ -0,0 +1,42 @@
+#ifndef MOD_5U7Q2WVEV3PG_WRAPPER_H
+#define MOD_5U7Q2WVEV3PG_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_5U7Q2WVEV3PG_WRAPPER
+
+void bind_c_omp_matmul_single(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t);
+
+#else
+
+static void** Pymod_5u7q2wvev3pg_API;
+
+
+/*........................................*/
+static int mod_5u7q2wvev3pg_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_5u7q2wvev3pg_API = (void**)PyCapsule_Import("mod_5u7q2wvev3pg._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_5u7q2wvev3pg_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_5U7Q2WVEV3PG_WRAPPER_H
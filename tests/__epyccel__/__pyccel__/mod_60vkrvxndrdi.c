@@ -0,0 +1,22 @@
+#include "mod_60vkrvxndrdi.h"
+
+
+/*........................................*/
+int64_t f(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    vec_int64_t a = {0};
+    vec_vec_int64_t b = {0};
+    a = c_init(vec_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4)});
+    b = c_init(vec_vec_int64_t, {a});
+    (*vec_int64_t_at_mut(&(*vec_vec_int64_t_at_mut(&b,INT64_C(0))),INT64_C(0))) = INT64_C(5);
+    (*vec_int64_t_at_mut(&(*vec_vec_int64_t_at_mut(&b,INT64_C(0))),INT64_C(2))) = INT64_C(6);
+    (*Out_0001) = (*vec_int64_t_at(&a,INT64_C(0)));
+    (*Out_0002) = (*vec_int64_t_at(&a,INT64_C(1)));
+    (*Out_0003) = (*vec_int64_t_at(&a,INT64_C(2)));
+    (*Out_0004) = (*vec_int64_t_at(&a,INT64_C(3)));
+    vec_int64_t_drop(&a);
+    vec_vec_int64_t_drop(&b);
+    return 0;
+}
+/*........................................*/
+
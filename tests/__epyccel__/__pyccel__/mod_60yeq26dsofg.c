@@ -0,0 +1,29 @@
+#include "mod_60yeq26dsofg.h"
+
+
+/*........................................*/
+double fused_temporaries_2d(t_ndarray x, t_ndarray y, t_ndarray z)
+{
+    t_ndarray t = {.raw_data = NULL};
+    t_ndarray u = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    double t_0001;
+    double Out_0001;
+    u = array_create(2, (int64_t[]){x.shape[INT64_C(0)], x.shape[INT64_C(1)]}, nd_double, false, order_c);
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < x.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            t_0001 = GET_ELEMENT(x, nd_double, i, i_0001) * GET_ELEMENT(y, nd_double, i, i_0001);
+            u.nd_double[i * u.shape[INT64_C(1)] + i_0001] = t_0001 - 1.0;
+            GET_ELEMENT(z, nd_double, i, i_0001) = u.nd_double[i * u.shape[INT64_C(1)] + i_0001] * t_0001;
+        }
+    }
+    Out_0001 = numpy_sum_float64(u);
+    free_array(&u);
+    free_array(&t);
+    return Out_0001;
+}
+/*........................................*/
+
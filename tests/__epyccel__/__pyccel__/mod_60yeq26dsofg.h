@@ -0,0 +1,11 @@
+#ifndef MOD_60YEQ26DSOFG_H
+#define MOD_60YEQ26DSOFG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double fused_temporaries_2d(t_ndarray x, t_ndarray y, t_ndarray z);
+#endif // mod_60yeq26dsofg_H
@@ -0,0 +1,11 @@
+#ifndef MOD_621C0O24MIU9_H
+#define MOD_621C0O24MIU9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_621c0o24miu9_H
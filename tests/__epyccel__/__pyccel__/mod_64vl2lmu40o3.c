@@ -0,0 +1,18 @@
+#include "mod_64vl2lmu40o3.h"
+
+
+/*........................................*/
+void fused_shifted_slices(t_ndarray a, t_ndarray b)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)] - INT64_C(1); i += INT64_C(1))
+    {
+        GET_ELEMENT(a, nd_double, i) = GET_ELEMENT(a, nd_double, i + INT64_C(1)) + GET_ELEMENT(b, nd_double, i);
+    }
+    for (i = INT64_C(0); i < b.shape[INT64_C(0)] - INT64_C(1); i += INT64_C(1))
+    {
+        GET_ELEMENT(b, nd_double, i + INT64_C(1)) = GET_ELEMENT(a, nd_double, i) * 2.0;
+    }
+}
+/*........................................*/
+
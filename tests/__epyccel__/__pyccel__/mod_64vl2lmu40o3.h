@@ -0,0 +1,11 @@
+#ifndef MOD_64VL2LMU40O3_H
+#define MOD_64VL2LMU40O3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void fused_shifted_slices(t_ndarray a, t_ndarray b);
+#endif // mod_64vl2lmu40o3_H
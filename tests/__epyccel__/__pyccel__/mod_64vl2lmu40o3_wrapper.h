@@ -0,0 +1,42 @@
+#ifndef MOD_64VL2LMU40O3_WRAPPER_H
+#define MOD_64VL2LMU40O3_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_64vl2lmu40o3.h"
+
+
+#ifdef MOD_64VL2LMU40O3_WRAPPER
+
+
+#else
+
+static void** Pymod_64vl2lmu40o3_API;
+
+
+/*........................................*/
+static int mod_64vl2lmu40o3_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_64vl2lmu40o3_API = (void**)PyCapsule_Import("mod_64vl2lmu40o3._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_64vl2lmu40o3_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_64VL2LMU40O3_WRAPPER_H
@@ -0,0 +1,13 @@
+#ifndef MOD_699QAT12VNLH_H
+#define MOD_699QAT12VNLH_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_mod(t_ndarray x, double a);
+#endif // mod_699qat12vnlh_H
@@ -0,0 +1,11 @@
+#ifndef MOD_6MRO3X8R69UH_H
+#define MOD_6MRO3X8R69UH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_div(t_ndarray x, double a);
+#endif // mod_6mro3x8r69uh_H
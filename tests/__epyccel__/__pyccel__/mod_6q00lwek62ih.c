@@ -0,0 +1,18 @@
+#include "mod_6q00lwek62ih.h"
+
+
+/*........................................*/
+void array_int32_2d_F_sub(t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    int64_t i_0001;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < x.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_int32, i, i_0001) -= GET_ELEMENT(y, nd_int32, i, i_0001);
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_6Q00LWEK62IH_H
+#define MOD_6Q00LWEK62IH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_6q00lwek62ih_H
@@ -0,0 +1,11 @@
+#ifndef MOD_6UNN7DA7JFBK_H
+#define MOD_6UNN7DA7JFBK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_mul(t_ndarray x, t_ndarray y);
+#endif // mod_6unn7da7jfbk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_6XQ0QLN4KPYI_H
+#define MOD_6XQ0QLN4KPYI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_6xq0qln4kpyi_H
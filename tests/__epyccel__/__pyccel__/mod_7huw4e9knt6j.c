@@ -0,0 +1,14 @@
+#include "mod_7huw4e9knt6j.h"
+
+
+/*........................................*/
+void array_float_1d_idiv(t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) = floor(GET_ELEMENT(x, nd_double, i) / GET_ELEMENT(y, nd_double, i));
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_7HUW4E9KNT6J_H
+#define MOD_7HUW4E9KNT6J_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_idiv(t_ndarray x, t_ndarray y);
+#endif // mod_7huw4e9knt6j_H
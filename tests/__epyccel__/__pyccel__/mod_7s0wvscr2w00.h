@@ -0,0 +1,13 @@
+#ifndef MOD_7S0WVSCR2W00_H
+#define MOD_7S0WVSCR2W00_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_mod(t_ndarray x, double a);
+#endif // mod_7s0wvscr2w00_H
@@ -0,0 +1,11 @@
+#ifndef MOD_7T5WMT4OFPWJ_H
+#define MOD_7T5WMT4OFPWJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_7t5wmt4ofpwj_H
@@ -0,0 +1,50 @@
+#include "mod_885cqs3gwqbd.h"
+
+
+/*........................................*/
+int64_t parallel_array_reductions(t_ndarray a, t_ndarray b, t_ndarray c, double* s, int32_t* m, double* n)
+{
+    int64_t i;
+    int64_t i_0001;
+    double tmp;
+    int32_t tmp_0001;
+    double tmp_0002;
+    tmp = 0.0;
+    #pragma omp parallel for private(i_0001) reduction(+:tmp) if(parallel: a.shape[INT64_C(0)] * a.shape[INT64_C(1)] >= 100)
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        #pragma omp simd reduction(+:tmp)
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            tmp = tmp + GET_ELEMENT(a, nd_double, i, i_0001);
+        }
+    }
+    (*s) = tmp;
+    tmp_0001 = GET_ELEMENT(b, nd_int32, INT64_C(0));
+    #pragma omp parallel for simd reduction(max:tmp_0001) if(parallel: b.shape[INT64_C(0)] >= 100)
+    for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        if (GET_ELEMENT(b, nd_int32, i) > tmp_0001)
+        {
+            tmp_0001 = GET_ELEMENT(b, nd_int32, i);
+        }
+    }
+    (*m) = tmp_0001;
+    tmp_0002 = GET_ELEMENT(c, nd_double, INT64_C(1), INT64_C(0));
+    #pragma omp parallel for private(i) reduction(min:tmp_0002) if(parallel: c.shape[INT64_C(1)] * (c.shape[INT64_C(0)] - INT64_C(1)) >= 100)
+    for (i_0001 = INT64_C(0); i_0001 < c.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+    {
+        #pragma omp simd reduction(min:tmp_0002)
+        for (i = INT64_C(0); i < c.shape[INT64_C(0)] - INT64_C(1); i += INT64_C(1))
+        {
+            if (GET_ELEMENT(c, nd_double, i + INT64_C(1), i_0001) < tmp_0002)
+            {
+                tmp_0002 = GET_ELEMENT(c, nd_double, i + INT64_C(1), i_0001);
+            }
+        }
+    }
+    (*n) = tmp_0002;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_885CQS3GWQBD_H
+#define MOD_885CQS3GWQBD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t parallel_array_reductions(t_ndarray a, t_ndarray b, t_ndarray c, double* s, int32_t* m, double* n);
+#endif // mod_885cqs3gwqbd_H
@@ -0,0 +1,11 @@
+#ifndef MOD_8HG1HAL8S3PP_H
+#define MOD_8HG1HAL8S3PP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_2(t_ndarray a, t_ndarray b);
+#endif // mod_8hg1hal8s3pp_H
@@ -0,0 +1,12 @@
+#ifndef MOD_8HJIX6KEGFVA_H
+#define MOD_8HJIX6KEGFVA_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_8hjix6kegfva_H
@@ -0,0 +1,11 @@
+#ifndef MOD_8Q2OLJV2LPEF_H
+#define MOD_8Q2OLJV2LPEF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_stride_9(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_8q2oljv2lpef_H
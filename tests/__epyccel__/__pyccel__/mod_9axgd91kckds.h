@@ -0,0 +1,11 @@
+#ifndef MOD_9AXGD91KCKDS_H
+#define MOD_9AXGD91KCKDS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_to_slice_issue_1218(int64_t n);
+#endif // mod_9axgd91kckds_H
@@ -0,0 +1,93 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9AXGD91KCKDS_WRAPPER
+
+#include "mod_9axgd91kckds_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* copy_to_slice_issue_1218_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* n_obj;
+    int64_t n;
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* arr_obj;
+    static const char* const kwlist[] = {
+        "n",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &n_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    arr = copy_to_slice_issue_1218(n);
+    arr_obj = ndarray_to_pyarray(arr);
+    free_pointer(&arr);
+    return arr_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9axgd91kckds_methods[] = {
+    {
+        "copy_to_slice_issue_1218",
+        (PyCFunction)copy_to_slice_issue_1218_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9axgd91kckds_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9axgd91kckds",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9axgd91kckds_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9axgd91kckds(void)
+{
+    PyObject* mod;
+    static void* Pymod_9axgd91kckds_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9axgd91kckds_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9axgd91kckds_API, "mod_9axgd91kckds._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
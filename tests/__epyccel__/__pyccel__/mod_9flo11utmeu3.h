@@ -0,0 +1,13 @@
+#ifndef MOD_9FLO11UTMEU3_H
+#define MOD_9FLO11UTMEU3_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_mod(t_ndarray x, t_ndarray y);
+#endif // mod_9flo11utmeu3_H
@@ -0,0 +1,11 @@
+#ifndef MOD_9H3OSPJKNOQO_H
+#define MOD_9H3OSPJKNOQO_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_9h3ospjknoqo_H
@@ -0,0 +1,11 @@
+#ifndef MOD_9KGNGU0IKO73_H
+#define MOD_9KGNGU0IKO73_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_9kgngu0iko73_H
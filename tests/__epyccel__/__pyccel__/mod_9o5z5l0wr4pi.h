@@ -0,0 +1,11 @@
+#ifndef MOD_9O5Z5L0WR4PI_H
+#define MOD_9O5Z5L0WR4PI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_stride_19(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_9o5z5l0wr4pi_H
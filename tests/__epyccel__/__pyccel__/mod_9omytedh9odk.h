@@ -0,0 +1,11 @@
+#ifndef MOD_9OMYTEDH9ODK_H
+#define MOD_9OMYTEDH9ODK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_mul(t_ndarray x, int64_t a);
+#endif // mod_9omytedh9odk_H
@@ -0,0 +1,24 @@
+#include "mod_9pg0updwxekm.h"
+
+
+/*........................................*/
+int64_t unpack_array_of_known_size(double* x, double* y, double* z)
+{
+    double array_dummy[INT64_C(3)];
+    t_ndarray arr = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(3)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&arr);
+    double Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&arr.nd_double[INT64_C(0)], Dummy_0000, 3 * arr.type_size);
+    (*x) = arr.nd_double[INT64_C(0)];
+    (*y) = arr.nd_double[INT64_C(1)];
+    (*z) = arr.nd_double[INT64_C(2)];
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_9PG0UPDWXEKM_H
+#define MOD_9PG0UPDWXEKM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t unpack_array_of_known_size(double* x, double* y, double* z);
+#endif // mod_9pg0updwxekm_H
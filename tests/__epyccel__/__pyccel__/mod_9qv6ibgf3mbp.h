@@ -0,0 +1,12 @@
+#ifndef MOD_9QV6IBGF3MBP_H
+#define MOD_9QV6IBGF3MBP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_1(void);
+#endif // mod_9qv6ibgf3mbp_H
@@ -0,0 +1,40 @@
+#ifndef MOD_9QV6IBGF3MBP_WRAPPER_H
+#define MOD_9QV6IBGF3MBP_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_9qv6ibgf3mbp.h"
+
+
+#ifdef MOD_9QV6IBGF3MBP_WRAPPER
+
+
+#else
+
+static void** Pymod_9qv6ibgf3mbp_API;
+
+
+/*........................................*/
+static int mod_9qv6ibgf3mbp_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_9qv6ibgf3mbp_API = (void**)PyCapsule_Import("mod_9qv6ibgf3mbp._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_9qv6ibgf3mbp_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_9QV6IBGF3MBP_WRAPPER_H
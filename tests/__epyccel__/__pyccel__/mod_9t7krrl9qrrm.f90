@@ -0,0 +1,43 @@
+module mod_9t7krrl9qrrm
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine parallel_array_expressions(c, a, b, d) 
+
+    implicit none
+
+    real(f64), intent(inout) :: c(0_i64:, 0_i64:)
+    real(f64), intent(in) :: a(0_i64:, 0_i64:)
+    real(f64), intent(in) :: b(0_i64:)
+    real(f64), value :: d
+    integer(i64) :: i
+    integer(i64) :: i_0001
+
+    !$omp parallel do private(i_0001) if(parallel: size(c, 2_i64, i64) * &
+    !$omp &size(c, 1_i64, i64) >= 100)
+    do i = 0_i64, size(c, 2_i64, i64) - 1_i64
+      !$omp simd
+      do i_0001 = 0_i64, size(c, 1_i64, i64) - 1_i64
+        c(i_0001, i) = a(i_0001, i) * b(i_0001) + d
+      end do
+    end do
+    !$omp parallel do private(i_0001) if(parallel: (size(c, 2_i64, i64) &
+    !$omp &- 1_i64) * size(c, 1_i64, i64) >= 100)
+    do i = 0_i64, size(c, 2_i64, i64) - 1_i64 - 1_i64
+      !$omp simd
+      do i_0001 = 0_i64, size(c, 1_i64, i64) - 1_i64
+        c(i_0001, i + 1_i64) = c(i_0001, i + 1_i64) - a(i_0001, i + &
+              1_i64)
+      end do
+    end do
+
+  end subroutine parallel_array_expressions
+  !........................................
+
+end module mod_9t7krrl9qrrm
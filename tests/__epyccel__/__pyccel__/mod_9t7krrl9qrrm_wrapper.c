@@ -0,0 +1,131 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9T7KRRL9QRRM_WRAPPER
+
+#include "mod_9t7krrl9qrrm_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_parallel_array_expressions_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* c_obj;
+    PyObject* a_obj;
+    PyObject* b_obj;
+    PyObject* d_obj;
+    void* c_data = NULL;
+    int64_t c_shape[2];
+    int64_t c_strides[2];
+    void* a_data = NULL;
+    int64_t a_shape[2];
+    int64_t a_strides[2];
+    void* b_data = NULL;
+    int64_t b_shape[1];
+    int64_t b_strides[1];
+    double d;
+    static const char* const kwlist[] = {
+        "c",
+        "a",
+        "b",
+        "d",
+        NULL
+    };
+    static PyObject* kwlist_interned[5] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 4, 4, &c_obj, &a_obj, &b_obj, &d_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("c", c_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        c_data = PyArray_DATA((PyArrayObject*)(c_obj));
+        get_strides_and_shape_from_numpy_array(c_obj, c_shape, c_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        a_data = PyArray_DATA((PyArrayObject*)(a_obj));
+        get_strides_and_shape_from_numpy_array(a_obj, a_shape, a_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("b", b_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        b_data = PyArray_DATA((PyArrayObject*)(b_obj));
+        get_strides_and_shape_from_numpy_array(b_obj, b_shape, b_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(d_obj))
+    {
+        d = PyDouble_to_Double(d_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument d");
+        return NULL;
+    }
+    bind_c_parallel_array_expressions(c_data, c_shape[INT64_C(0)], c_shape[INT64_C(1)], c_strides[INT64_C(0)], c_strides[INT64_C(1)], a_data, a_shape[INT64_C(0)], a_shape[INT64_C(1)], a_strides[INT64_C(0)], a_strides[INT64_C(1)], b_data, b_shape[INT64_C(0)], b_strides[INT64_C(0)], d);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9t7krrl9qrrm_methods[] = {
+    {
+        "parallel_array_expressions",
+        (PyCFunction)bind_c_parallel_array_expressions_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9t7krrl9qrrm_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9t7krrl9qrrm",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9t7krrl9qrrm_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9t7krrl9qrrm(void)
+{
+    PyObject* mod;
+    static void* Pymod_9t7krrl9qrrm_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9t7krrl9qrrm_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9t7krrl9qrrm_API, "mod_9t7krrl9qrrm._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
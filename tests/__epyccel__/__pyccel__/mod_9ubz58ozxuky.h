@@ -0,0 +1,11 @@
+#ifndef MOD_9UBZ58OZXUKY_H
+#define MOD_9UBZ58OZXUKY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_4d_F_array_initialization(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_9ubz58ozxuky_H
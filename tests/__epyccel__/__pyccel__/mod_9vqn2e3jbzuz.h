@@ -0,0 +1,11 @@
+#ifndef MOD_9VQN2E3JBZUZ_H
+#define MOD_9VQN2E3JBZUZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_div(t_ndarray x, t_ndarray y);
+#endif // mod_9vqn2e3jbzuz_H
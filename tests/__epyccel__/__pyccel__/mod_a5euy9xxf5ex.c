@@ -0,0 +1,46 @@
+#include "mod_a5euy9xxf5ex.h"
+
+
+/*........................................*/
+int64_t test_multiple_negative_index_3(int64_t d, int64_t e, int64_t f, double* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    double array_dummy[INT64_C(4)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(4)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t array_dummy_0001[INT64_C(1)];
+    t_ndarray b = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(1)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    int64_t array_dummy_0002[INT64_C(3)];
+    t_ndarray c = (t_ndarray){
+        .nd_int64=array_dummy_0002,
+        .shape={INT64_C(3)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&c);
+    double Dummy_0000[] = {1.2, 2.2, 3.2, 4.2};
+    memcpy(&a.nd_double[INT64_C(0)], Dummy_0000, 4 * a.type_size);
+    int64_t Dummy_0001[] = {INT64_C(1)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0001, 1 * b.type_size);
+    int64_t Dummy_0002[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&c.nd_int64[INT64_C(0)], Dummy_0002, 3 * c.type_size);
+    (*Out_0001) = a.nd_double[d < INT64_C(0) ? INT64_C(4) + d : d];
+    (*Out_0002) = b.nd_int64[e < INT64_C(0) ? INT64_C(1) + e : e];
+    (*Out_0003) = c.nd_int64[f < INT64_C(0) ? INT64_C(3) + f : f];
+    return 0;
+}
+/*........................................*/
+
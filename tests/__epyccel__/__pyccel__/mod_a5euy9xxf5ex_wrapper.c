@@ -0,0 +1,126 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_A5EUY9XXF5EX_WRAPPER
+
+#include "mod_a5euy9xxf5ex_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_multiple_negative_index_3_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* d_obj;
+    PyObject* e_obj;
+    PyObject* f_obj;
+    int64_t d;
+    int64_t e;
+    int64_t f;
+    PyObject* Out_0001_obj;
+    double Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "d",
+        "e",
+        "f",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &d_obj, &e_obj, &f_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(d_obj))
+    {
+        d = PyInt64_to_Int64(d_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument d");
+        return NULL;
+    }
+    if (PyIs_NativeInt(e_obj))
+    {
+        e = PyInt64_to_Int64(e_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument e");
+        return NULL;
+    }
+    if (PyIs_NativeInt(f_obj))
+    {
+        f = PyInt64_to_Int64(f_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument f");
+        return NULL;
+    }
+    test_multiple_negative_index_3(d, e, f, &Out_0001, &Out_0002, &Out_0003);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    Out_0002_obj = Int64_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int64_to_NumpyLong(&Out_0003);
+    Out_obj = Py_BuildValue("OOO", Out_0001_obj, Out_0002_obj, Out_0003_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_a5euy9xxf5ex_methods[] = {
+    {
+        "test_multiple_negative_index_3",
+        (PyCFunction)test_multiple_negative_index_3_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_a5euy9xxf5ex_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_a5euy9xxf5ex",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_a5euy9xxf5ex_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_a5euy9xxf5ex(void)
+{
+    PyObject* mod;
+    static void* Pymod_a5euy9xxf5ex_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_a5euy9xxf5ex_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_a5euy9xxf5ex_API, "mod_a5euy9xxf5ex._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,19 @@
+#include "mod_ajhs6uxjc26w.h"
+
+
+/*........................................*/
+void fused_augmented_temporary(t_ndarray a, t_ndarray b)
+{
+    t_ndarray t = {.raw_data = NULL};
+    int64_t i;
+    double t_0001;
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        t_0001 = GET_ELEMENT(a, nd_double, i) * 2.0;
+        t_0001 += GET_ELEMENT(b, nd_double, i);
+        GET_ELEMENT(a, nd_double, i) = t_0001 - GET_ELEMENT(b, nd_double, i);
+    }
+    free_array(&t);
+}
+/*........................................*/
+
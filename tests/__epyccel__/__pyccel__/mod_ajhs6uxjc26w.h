@@ -0,0 +1,11 @@
+#ifndef MOD_AJHS6UXJC26W_H
+#define MOD_AJHS6UXJC26W_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void fused_augmented_temporary(t_ndarray a, t_ndarray b);
+#endif // mod_ajhs6uxjc26w_H
@@ -0,0 +1,20 @@
+#ifndef MOD_ANX6VRCMPS8P_H
+#define MOD_ANX6VRCMPS8P_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t dtype_convert_to_int16_0000(t_ndarray arr, int64_t* Out_0001, int16_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005);
+int64_t dtype_convert_to_int16_0001(t_ndarray arr, int64_t* Out_0001, int16_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005);
+int64_t dtype_convert_to_int16_0002(t_ndarray arr, int64_t* Out_0001, int16_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005);
+int64_t dtype_convert_to_int16_0003(t_ndarray arr, int64_t* Out_0001, int16_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005);
+int64_t dtype_convert_to_int16_0004(t_ndarray arr, int64_t* Out_0001, int16_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005);
+int64_t dtype_convert_to_int16_0005(t_ndarray arr, int64_t* Out_0001, int16_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005);
+int64_t dtype_convert_to_int16_0006(t_ndarray arr, int64_t* Out_0001, int16_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005);
+int64_t dtype_convert_to_int16_0007(t_ndarray arr, int64_t* Out_0001, int16_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005);
+int64_t dtype_convert_to_int16_0008(t_ndarray arr, int64_t* Out_0001, int16_t* Out_0002, int16_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005);
+#endif // mod_anx6vrcmps8p_H
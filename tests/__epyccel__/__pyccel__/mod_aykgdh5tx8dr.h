@@ -0,0 +1,11 @@
+#ifndef MOD_AYKGDH5TX8DR_H
+#define MOD_AYKGDH5TX8DR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t var_negative_index(int64_t n, int64_t idx);
+#endif // mod_aykgdh5tx8dr_H
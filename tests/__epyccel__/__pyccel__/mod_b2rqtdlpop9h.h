@@ -0,0 +1,12 @@
+#ifndef MOD_B2RQTDLPOP9H_H
+#define MOD_B2RQTDLPOP9H_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_b2rqtdlpop9h_H
@@ -0,0 +1,15 @@
+#ifndef MOD_B39MN8AW6YGV_H
+#define MOD_B39MN8AW6YGV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_ndmin_4_0000(t_ndarray x);
+t_ndarray array_ndmin_4_0001(t_ndarray x);
+t_ndarray array_ndmin_4_0002(t_ndarray x);
+t_ndarray array_ndmin_4_0003(t_ndarray x);
+t_ndarray array_ndmin_4_0004(t_ndarray x);
+#endif // mod_b39mn8aw6ygv_H
@@ -0,0 +1,11 @@
+#ifndef MOD_B5W076D52SR6_H
+#define MOD_B5W076D52SR6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_sub(t_ndarray x, int64_t a);
+#endif // mod_b5w076d52sr6_H
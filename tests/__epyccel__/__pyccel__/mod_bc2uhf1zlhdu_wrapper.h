@@ -0,0 +1,42 @@
+#ifndef MOD_BC2UHF1ZLHDU_WRAPPER_H
+#define MOD_BC2UHF1ZLHDU_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_BC2UHF1ZLHDU_WRAPPER
+
+void bind_c_parallel_array_expressions(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, double);
+
+#else
+
+static void** Pymod_bc2uhf1zlhdu_API;
+
+
+/*........................................*/
+static int mod_bc2uhf1zlhdu_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_bc2uhf1zlhdu_API = (void**)PyCapsule_Import("mod_bc2uhf1zlhdu._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_bc2uhf1zlhdu_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BC2UHF1ZLHDU_WRAPPER_H
@@ -0,0 +1,21 @@
+#include "mod_bfmlkp39ulg7.h"
+
+
+/*........................................*/
+int64_t arr_arange_5(int64_t* Out_0001, double* Out_0002, double* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){(int64_t)ceil((2.2 - INT64_C(20)) / (-INT64_C(2)))}, nd_double, false, order_c);
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        a.nd_double[i] = INT64_C(20) + i * (-INT64_C(2));
+    }
+    (*Out_0001) = a.shape[INT64_C(0)];
+    (*Out_0002) = a.nd_double[INT64_C(0)];
+    (*Out_0003) = a.nd_double[a.shape[INT64_C(0)] - INT64_C(1)];
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
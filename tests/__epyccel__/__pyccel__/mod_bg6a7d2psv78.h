@@ -0,0 +1,11 @@
+#ifndef MOD_BG6A7D2PSV78_H
+#define MOD_BG6A7D2PSV78_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_bg6a7d2psv78_H
@@ -0,0 +1,11 @@
+#ifndef MOD_BMB9LBYZQFKE_H
+#define MOD_BMB9LBYZQFKE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_scalar_sub(t_ndarray x, int64_t a);
+#endif // mod_bmb9lbyzqfke_H
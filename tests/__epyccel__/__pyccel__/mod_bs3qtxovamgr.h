@@ -0,0 +1,11 @@
+#ifndef MOD_BS3QTXOVAMGR_H
+#define MOD_BS3QTXOVAMGR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_1d_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_bs3qtxovamgr_H
@@ -0,0 +1,11 @@
+#ifndef MOD_BUKLXK0R5BST_H
+#define MOD_BUKLXK0R5BST_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_add(t_ndarray x, double a);
+#endif // mod_buklxk0r5bst_H
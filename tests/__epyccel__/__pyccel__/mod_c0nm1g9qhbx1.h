@@ -0,0 +1,12 @@
+#ifndef MOD_C0NM1G9QHBX1_H
+#define MOD_C0NM1G9QHBX1_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_scalar_idiv(t_ndarray x, int64_t a);
+#endif // mod_c0nm1g9qhbx1_H
@@ -0,0 +1,11 @@
+#ifndef MOD_C5RNTGPGD6S9_H
+#define MOD_C5RNTGPGD6S9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_F_array_initialization_2(t_ndarray a, t_ndarray e, t_ndarray f, t_ndarray x);
+#endif // mod_c5rntgpgd6s9_H
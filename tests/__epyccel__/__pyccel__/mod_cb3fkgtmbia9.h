@@ -0,0 +1,11 @@
+#ifndef MOD_CB3FKGTMBIA9_H
+#define MOD_CB3FKGTMBIA9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_cb3fkgtmbia9_H
@@ -0,0 +1,15 @@
+#ifndef MOD_CBKTC8OKYU1X_H
+#define MOD_CBKTC8OKYU1X_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_ndmin_2_order_0000(t_ndarray x);
+t_ndarray array_ndmin_2_order_0001(t_ndarray x);
+t_ndarray array_ndmin_2_order_0002(t_ndarray x);
+t_ndarray array_ndmin_2_order_0003(t_ndarray x);
+t_ndarray array_ndmin_2_order_0004(t_ndarray x);
+#endif // mod_cbktc8okyu1x_H
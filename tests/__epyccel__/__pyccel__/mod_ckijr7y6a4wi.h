@@ -0,0 +1,11 @@
+#ifndef MOD_CKIJR7Y6A4WI_H
+#define MOD_CKIJR7Y6A4WI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_sub(t_ndarray x, t_ndarray y);
+#endif // mod_ckijr7y6a4wi_H
@@ -0,0 +1,11 @@
+#ifndef MOD_CQ66QS2R41OU_H
+#define MOD_CQ66QS2R41OU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_cq66qs2r41ou_H
@@ -0,0 +1,42 @@
+#ifndef MOD_CQ66QS2R41OU_WRAPPER_H
+#define MOD_CQ66QS2R41OU_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_cq66qs2r41ou.h"
+
+
+#ifdef MOD_CQ66QS2R41OU_WRAPPER
+
+
+#else
+
+static void** Pymod_cq66qs2r41ou_API;
+
+
+/*........................................*/
+static int mod_cq66qs2r41ou_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_cq66qs2r41ou_API = (void**)PyCapsule_Import("mod_cq66qs2r41ou._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_cq66qs2r41ou_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_CQ66QS2R41OU_WRAPPER_H
@@ -0,0 +1,40 @@
+#ifndef MOD_CXTBIK3BWR7E_WRAPPER_H
+#define MOD_CXTBIK3BWR7E_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_CXTBIK3BWR7E_WRAPPER
+
+void bind_c_set_num_threads(int64_t);
+
+#else
+
+static void** Pymod_cxtbik3bwr7e_API;
+
+
+/*........................................*/
+static int mod_cxtbik3bwr7e_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_cxtbik3bwr7e_API = (void**)PyCapsule_Import("mod_cxtbik3bwr7e._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_cxtbik3bwr7e_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_CXTBIK3BWR7E_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_D0C50LPHZ83U_H
+#define MOD_D0C50LPHZ83U_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_d0c50lphz83u_H
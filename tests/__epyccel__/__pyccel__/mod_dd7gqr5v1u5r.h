@@ -0,0 +1,11 @@
+#ifndef MOD_DD7GQR5V1U5R_H
+#define MOD_DD7GQR5V1U5R_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_expression(t_ndarray A, t_ndarray B, t_ndarray C, t_ndarray out);
+#endif // mod_dd7gqr5v1u5r_H
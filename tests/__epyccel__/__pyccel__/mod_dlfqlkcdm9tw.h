@@ -0,0 +1,11 @@
+#ifndef MOD_DLFQLKCDM9TW_H
+#define MOD_DLFQLKCDM9TW_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_dlfqlkcdm9tw_H
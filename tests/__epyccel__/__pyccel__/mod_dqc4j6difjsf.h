@@ -0,0 +1,11 @@
+#ifndef MOD_DQC4J6DIFJSF_H
+#define MOD_DQC4J6DIFJSF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_1D_2(t_ndarray a);
+#endif // mod_dqc4j6difjsf_H
@@ -0,0 +1,12 @@
+#ifndef MOD_DQSWNUOPT3HR_H
+#define MOD_DQSWNUOPT3HR_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void fused_temporaries(t_ndarray a, t_ndarray b, t_ndarray c, t_ndarray v);
+#endif // mod_dqswnuopt3hr_H
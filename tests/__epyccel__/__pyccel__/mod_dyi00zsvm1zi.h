@@ -0,0 +1,11 @@
+#ifndef MOD_DYI00ZSVM1ZI_H
+#define MOD_DYI00ZSVM1ZI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_mul(t_ndarray x, t_ndarray y);
+#endif // mod_dyi00zsvm1zi_H
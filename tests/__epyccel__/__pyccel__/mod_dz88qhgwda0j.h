@@ -0,0 +1,11 @@
+#ifndef MOD_DZ88QHGWDA0J_H
+#define MOD_DZ88QHGWDA0J_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_F_slice_stride_7(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_dz88qhgwda0j_H
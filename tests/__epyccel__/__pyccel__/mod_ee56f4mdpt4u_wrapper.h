@@ -0,0 +1,42 @@
+#ifndef MOD_EE56F4MDPT4U_WRAPPER_H
+#define MOD_EE56F4MDPT4U_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_ee56f4mdpt4u.h"
+
+
+#ifdef MOD_EE56F4MDPT4U_WRAPPER
+
+
+#else
+
+static void** Pymod_ee56f4mdpt4u_API;
+
+
+/*........................................*/
+static int mod_ee56f4mdpt4u_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ee56f4mdpt4u_API = (void**)PyCapsule_Import("mod_ee56f4mdpt4u._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ee56f4mdpt4u_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_EE56F4MDPT4U_WRAPPER_H
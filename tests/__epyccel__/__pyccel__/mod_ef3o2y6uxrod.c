@@ -0,0 +1,30 @@
+#include "mod_ef3o2y6uxrod.h"
+
+
+/*........................................*/
+int64_t arrs_1d_negative_step_positive_step(int64_t* Out_0001, double* Out_0002)
+{
+    double array_dummy[INT64_C(10)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(10)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    array_fill((double)1.0, a);
+    b = array_create(1, (int64_t[]){(int64_t)ceil(8.0 / 3.0)}, nd_double, false, order_c);
+    for (i = INT64_C(0); i < b.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        b.nd_double[i] = a.nd_double[i * INT64_C(3) + INT64_C(1)] + a.nd_double[i * INT64_C(3) + INT64_C(2)];
+    }
+    (*Out_0001) = b.shape[INT64_C(0)];
+    (*Out_0002) = numpy_sum_float64(b);
+    free_array(&b);
+    return 0;
+}
+/*........................................*/
+
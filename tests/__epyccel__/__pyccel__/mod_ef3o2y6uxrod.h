@@ -0,0 +1,12 @@
+#ifndef MOD_EF3O2Y6UXROD_H
+#define MOD_EF3O2Y6UXROD_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_1d_negative_step_positive_step(int64_t* Out_0001, double* Out_0002);
+#endif // mod_ef3o2y6uxrod_H
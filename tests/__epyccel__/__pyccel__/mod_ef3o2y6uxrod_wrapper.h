@@ -0,0 +1,40 @@
+#ifndef MOD_EF3O2Y6UXROD_WRAPPER_H
+#define MOD_EF3O2Y6UXROD_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ef3o2y6uxrod.h"
+
+
+#ifdef MOD_EF3O2Y6UXROD_WRAPPER
+
+
+#else
+
+static void** Pymod_ef3o2y6uxrod_API;
+
+
+/*........................................*/
+static int mod_ef3o2y6uxrod_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ef3o2y6uxrod_API = (void**)PyCapsule_Import("mod_ef3o2y6uxrod._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ef3o2y6uxrod_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_EF3O2Y6UXROD_WRAPPER_H
@@ -0,0 +1,40 @@
+#ifndef MOD_EGZS882J4F0G_WRAPPER_H
+#define MOD_EGZS882J4F0G_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_EGZS882J4F0G_WRAPPER
+
+void bind_c_set_num_threads(int64_t);
+
+#else
+
+static void** Pymod_egzs882j4f0g_API;
+
+
+/*........................................*/
+static int mod_egzs882j4f0g_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_egzs882j4f0g_API = (void**)PyCapsule_Import("mod_egzs882j4f0g._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_egzs882j4f0g_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_EGZS882J4F0G_WRAPPER_H
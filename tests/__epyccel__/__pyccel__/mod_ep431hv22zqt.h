@@ -0,0 +1,11 @@
+#ifndef MOD_EP431HV22ZQT_H
+#define MOD_EP431HV22ZQT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_sub(t_ndarray x, double a);
+#endif // mod_ep431hv22zqt_H
@@ -0,0 +1,11 @@
+#ifndef MOD_EPHYUOHJS3ZP_H
+#define MOD_EPHYUOHJS3ZP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_C_array_initialization_2(t_ndarray a, t_ndarray e, t_ndarray f, t_ndarray x);
+#endif // mod_ephyuohjs3zp_H
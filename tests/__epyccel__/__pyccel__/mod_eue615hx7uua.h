@@ -0,0 +1,12 @@
+#ifndef MOD_EUE615HX7UUA_H
+#define MOD_EUE615HX7UUA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_int_2d_C_initialization(t_ndarray a);
+#endif // mod_eue615hx7uua_H
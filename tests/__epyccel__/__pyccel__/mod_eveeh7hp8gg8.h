@@ -0,0 +1,11 @@
+#ifndef MOD_EVEEH7HP8GG8_H
+#define MOD_EVEEH7HP8GG8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_mul(t_ndarray x, double a);
+#endif // mod_eveeh7hp8gg8_H
@@ -0,0 +1,11 @@
+#ifndef MOD_EVM8FPVR6GWE_H
+#define MOD_EVM8FPVR6GWE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_evm8fpvr6gwe_H
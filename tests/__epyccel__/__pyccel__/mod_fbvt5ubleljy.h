@@ -0,0 +1,11 @@
+#ifndef MOD_FBVT5UBLELJY_H
+#define MOD_FBVT5UBLELJY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_fbvt5ubleljy_H
@@ -0,0 +1,12 @@
+#ifndef MOD_FFZ8HI7IND7I_H
+#define MOD_FFZ8HI7IND7I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_nested_C_array_initialization_3(t_ndarray a, t_ndarray e, t_ndarray x);
+#endif // mod_ffz8hi7ind7i_H
@@ -0,0 +1,11 @@
+#ifndef MOD_FKD15WSG9ZOU_H
+#define MOD_FKD15WSG9ZOU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_2(t_ndarray a);
+#endif // mod_fkd15wsg9zou_H
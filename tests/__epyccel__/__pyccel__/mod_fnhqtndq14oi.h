@@ -0,0 +1,11 @@
+#ifndef MOD_FNHQTNDQ14OI_H
+#define MOD_FNHQTNDQ14OI_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_active_level(void);
+#endif // mod_fnhqtndq14oi_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_FNHQTNDQ14OI_WRAPPER
+
+#include "mod_fnhqtndq14oi_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* test_omp_get_active_level_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t active_level_vars;
+    PyObject* active_level_vars_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    active_level_vars = test_omp_get_active_level();
+    active_level_vars_obj = Int32_to_NumpyLong(&active_level_vars);
+    return active_level_vars_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_fnhqtndq14oi_methods[] = {
+    {
+        "test_omp_get_active_level",
+        (PyCFunction)test_omp_get_active_level_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_fnhqtndq14oi_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_fnhqtndq14oi",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_fnhqtndq14oi_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_fnhqtndq14oi(void)
+{
+    PyObject* mod;
+    static void* Pymod_fnhqtndq14oi_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_fnhqtndq14oi_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_fnhqtndq14oi_API, "mod_fnhqtndq14oi._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
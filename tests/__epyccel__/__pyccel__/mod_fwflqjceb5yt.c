@@ -0,0 +1,34 @@
+#include "mod_fwflqjceb5yt.h"
+
+
+/*........................................*/
+int64_t test_multiple_negative_index(int64_t c, int64_t d, int64_t* x, int64_t* y)
+{
+    int64_t array_dummy[INT64_C(6)];
+    t_ndarray a = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(6)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t array_dummy_0001[INT64_C(3)];
+    t_ndarray b = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(3)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 6 * a.type_size);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0001, 3 * b.type_size);
+    (*x) = a.nd_int64[c < INT64_C(0) ? INT64_C(6) + c : c];
+    (*y) = b.nd_int64[d < INT64_C(0) ? INT64_C(3) + d : d];
+    return 0;
+}
+/*........................................*/
+
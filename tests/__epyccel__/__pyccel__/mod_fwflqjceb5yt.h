@@ -0,0 +1,12 @@
+#ifndef MOD_FWFLQJCEB5YT_H
+#define MOD_FWFLQJCEB5YT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_multiple_negative_index(int64_t c, int64_t d, int64_t* x, int64_t* y);
+#endif // mod_fwflqjceb5yt_H
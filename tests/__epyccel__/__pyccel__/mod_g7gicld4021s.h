@@ -0,0 +1,11 @@
+#ifndef MOD_G7GICLD4021S_H
+#define MOD_G7GICLD4021S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_sub(t_ndarray x, t_ndarray y);
+#endif // mod_g7gicld4021s_H
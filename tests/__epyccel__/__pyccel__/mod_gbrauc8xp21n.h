@@ -0,0 +1,11 @@
+#ifndef MOD_GBRAUC8XP21N_H
+#define MOD_GBRAUC8XP21N_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_1(t_ndarray a);
+#endif // mod_gbrauc8xp21n_H
@@ -0,0 +1,27 @@
+#include "mod_go2neonc2rft.h"
+
+
+/*........................................*/
+int64_t iterate_slice(int64_t i)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t ai;
+    int64_t i_0001;
+    int64_t Dummy_0000;
+    int64_t res;
+    a = array_create(1, (int64_t[]){(int64_t)ceil((double)((INT64_C(15) - INT64_C(0))) / 1.0)}, nd_int64, false, order_c);
+    for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(0)]; i_0001 += INT64_C(1))
+    {
+        a.nd_int64[i_0001] = i_0001;
+    }
+    res = INT64_C(0);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < i; Dummy_0000 += INT64_C(1))
+    {
+        ai = a.nd_int64[Dummy_0000];
+        res += ai;
+    }
+    free_array(&a);
+    return res;
+}
+/*........................................*/
+
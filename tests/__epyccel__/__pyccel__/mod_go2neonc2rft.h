@@ -0,0 +1,12 @@
+#ifndef MOD_GO2NEONC2RFT_H
+#define MOD_GO2NEONC2RFT_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t iterate_slice(int64_t i);
+#endif // mod_go2neonc2rft_H
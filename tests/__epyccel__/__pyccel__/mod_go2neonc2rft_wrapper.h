@@ -0,0 +1,40 @@
+#ifndef MOD_GO2NEONC2RFT_WRAPPER_H
+#define MOD_GO2NEONC2RFT_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_go2neonc2rft.h"
+
+
+#ifdef MOD_GO2NEONC2RFT_WRAPPER
+
+
+#else
+
+static void** Pymod_go2neonc2rft_API;
+
+
+/*........................................*/
+static int mod_go2neonc2rft_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_go2neonc2rft_API = (void**)PyCapsule_Import("mod_go2neonc2rft._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_go2neonc2rft_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_GO2NEONC2RFT_WRAPPER_H
@@ -0,0 +1,28 @@
+#include "mod_gwoqfmg7pt3i.h"
+
+
+/*........................................*/
+void array_float_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y)
+{
+    int64_t array_dummy[INT64_C(6)];
+    t_ndarray z = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(2), INT64_C(3)},
+        .nd=2,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&z);
+    int64_t i;
+    int64_t i_0001;
+    array_fill((int64_t)INT64_C(5), z);
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < x.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_double, i, i_0001) = floor(GET_ELEMENT(x, nd_double, i, i_0001) / GET_ELEMENT(y, nd_double, i, i_0001)) * GET_ELEMENT(x, nd_double, i, i_0001) + z.nd_int64[i * z.shape[INT64_C(1)] + i_0001];
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_GWOQFMG7PT3I_H
+#define MOD_GWOQFMG7PT3I_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_gwoqfmg7pt3i_H
@@ -0,0 +1,11 @@
+#ifndef MOD_H5XMHCZKNA89_H
+#define MOD_H5XMHCZKNA89_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_h5xmhczkna89_H
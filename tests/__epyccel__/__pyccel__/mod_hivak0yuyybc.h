@@ -0,0 +1,21 @@
+#ifndef MOD_HIVAK0YUYYBC_H
+#define MOD_HIVAK0YUYYBC_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_cfloat_orderF_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float complex* Out_0004, float complex* Out_0005, float complex* Out_0006, float complex* Out_0007, float complex* Out_0008, float complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cfloat_orderF_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float complex* Out_0004, float complex* Out_0005, float complex* Out_0006, float complex* Out_0007, float complex* Out_0008, float complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cfloat_orderF_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float complex* Out_0004, float complex* Out_0005, float complex* Out_0006, float complex* Out_0007, float complex* Out_0008, float complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cfloat_orderF_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float complex* Out_0004, float complex* Out_0005, float complex* Out_0006, float complex* Out_0007, float complex* Out_0008, float complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cfloat_orderF_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float complex* Out_0004, float complex* Out_0005, float complex* Out_0006, float complex* Out_0007, float complex* Out_0008, float complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cfloat_orderF_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float complex* Out_0004, float complex* Out_0005, float complex* Out_0006, float complex* Out_0007, float complex* Out_0008, float complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cfloat_orderF_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float complex* Out_0004, float complex* Out_0005, float complex* Out_0006, float complex* Out_0007, float complex* Out_0008, float complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cfloat_orderF_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float complex* Out_0004, float complex* Out_0005, float complex* Out_0006, float complex* Out_0007, float complex* Out_0008, float complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cfloat_orderF_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float complex* Out_0004, float complex* Out_0005, float complex* Out_0006, float complex* Out_0007, float complex* Out_0008, float complex* Out_0009);
+#endif // mod_hivak0yuyybc_H
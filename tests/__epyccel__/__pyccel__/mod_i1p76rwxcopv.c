@@ -0,0 +1,14 @@
+#include "mod_i1p76rwxcopv.h"
+
+
+/*........................................*/
+void array_int_1d_add(t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int64, i) += GET_ELEMENT(y, nd_int64, i);
+    }
+}
+/*........................................*/
+
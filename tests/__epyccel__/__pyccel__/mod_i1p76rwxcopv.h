@@ -0,0 +1,11 @@
+#ifndef MOD_I1P76RWXCOPV_H
+#define MOD_I1P76RWXCOPV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_i1p76rwxcopv_H
@@ -0,0 +1,11 @@
+#ifndef MOD_I1UEQA86B9JD_H
+#define MOD_I1UEQA86B9JD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_3(t_ndarray a);
+#endif // mod_i1ueqa86b9jd_H
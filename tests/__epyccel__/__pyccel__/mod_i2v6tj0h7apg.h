@@ -0,0 +1,11 @@
+#ifndef MOD_I2V6TJ0H7APG_H
+#define MOD_I2V6TJ0H7APG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_i2v6tj0h7apg_H
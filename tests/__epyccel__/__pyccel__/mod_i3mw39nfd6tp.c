@@ -0,0 +1,14 @@
+#include "mod_i3mw39nfd6tp.h"
+
+
+/*........................................*/
+void array_int32_1d_sub_augassign(t_ndarray x, t_ndarray y)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int32, i) -= GET_ELEMENT(y, nd_int32, i);
+    }
+}
+/*........................................*/
+
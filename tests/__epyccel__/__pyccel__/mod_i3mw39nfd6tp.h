@@ -0,0 +1,11 @@
+#ifndef MOD_I3MW39NFD6TP_H
+#define MOD_I3MW39NFD6TP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_sub_augassign(t_ndarray x, t_ndarray y);
+#endif // mod_i3mw39nfd6tp_H
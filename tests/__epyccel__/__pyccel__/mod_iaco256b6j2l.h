@@ -0,0 +1,11 @@
+#ifndef MOD_IACO256B6J2L_H
+#define MOD_IACO256B6J2L_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_stride_1(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_iaco256b6j2l_H
@@ -0,0 +1,11 @@
+#ifndef MOD_IBF7IR9DL1CN_H
+#define MOD_IBF7IR9DL1CN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_ibf7ir9dl1cn_H
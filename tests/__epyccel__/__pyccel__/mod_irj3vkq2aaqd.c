@@ -0,0 +1,29 @@
+#include "mod_irj3vkq2aaqd.h"
+
+
+/*........................................*/
+void parallel_array_expressions(t_ndarray c, t_ndarray a, t_ndarray b, double d)
+{
+    int64_t i;
+    int64_t i_0001;
+    #pragma omp parallel for private(i_0001) if(parallel: c.shape[INT64_C(0)] * c.shape[INT64_C(1)] >= 100)
+    for (i = INT64_C(0); i < c.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        #pragma omp simd
+        for (i_0001 = INT64_C(0); i_0001 < c.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(c, nd_double, i, i_0001) = GET_ELEMENT(a, nd_double, i, i_0001) * GET_ELEMENT(b, nd_double, i_0001) + d;
+        }
+    }
+    #pragma omp parallel for private(i_0001) if(parallel: (c.shape[INT64_C(0)] - INT64_C(1)) * c.shape[INT64_C(1)] >= 100)
+    for (i = INT64_C(0); i < c.shape[INT64_C(0)] - INT64_C(1); i += INT64_C(1))
+    {
+        #pragma omp simd
+        for (i_0001 = INT64_C(0); i_0001 < c.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(c, nd_double, i + INT64_C(1), i_0001) = GET_ELEMENT(c, nd_double, i + INT64_C(1), i_0001) - GET_ELEMENT(a, nd_double, i + INT64_C(1), i_0001);
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_IRJ3VKQ2AAQD_H
+#define MOD_IRJ3VKQ2AAQD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void parallel_array_expressions(t_ndarray c, t_ndarray a, t_ndarray b, double d);
+#endif // mod_irj3vkq2aaqd_H
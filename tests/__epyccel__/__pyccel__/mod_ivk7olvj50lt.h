@@ -0,0 +1,11 @@
+#ifndef MOD_IVK7OLVJ50LT_H
+#define MOD_IVK7OLVJ50LT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_scalar_add(t_ndarray x, int64_t a);
+#endif // mod_ivk7olvj50lt_H
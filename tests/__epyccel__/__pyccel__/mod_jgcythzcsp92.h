@@ -0,0 +1,11 @@
+#ifndef MOD_JGCYTHZCSP92_H
+#define MOD_JGCYTHZCSP92_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_1(void);
+#endif // mod_jgcythzcsp92_H
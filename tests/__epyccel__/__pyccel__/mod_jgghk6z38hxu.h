@@ -0,0 +1,11 @@
+#ifndef MOD_JGGHK6Z38HXU_H
+#define MOD_JGGHK6Z38HXU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_add(t_ndarray x, double a);
+#endif // mod_jgghk6z38hxu_H
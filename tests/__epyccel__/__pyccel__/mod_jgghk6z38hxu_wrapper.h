@@ -0,0 +1,42 @@
+#ifndef MOD_JGGHK6Z38HXU_WRAPPER_H
+#define MOD_JGGHK6Z38HXU_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_jgghk6z38hxu.h"
+
+
+#ifdef MOD_JGGHK6Z38HXU_WRAPPER
+
+
+#else
+
+static void** Pymod_jgghk6z38hxu_API;
+
+
+/*........................................*/
+static int mod_jgghk6z38hxu_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_jgghk6z38hxu_API = (void**)PyCapsule_Import("mod_jgghk6z38hxu._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_jgghk6z38hxu_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_JGGHK6Z38HXU_WRAPPER_H
@@ -0,0 +1,12 @@
+#include "mod_jljqydxtlw6o.h"
+
+
+/*........................................*/
+void array_float_2d_1d_matmul_transpose(t_ndarray A, t_ndarray x, t_ndarray out)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    transpose_alias_assign(&Dummy_0000, A);
+    numpy_matmul_float64(array_slicing(out, 1, new_slice(INT64_C(0), out.shape[INT64_C(0)], INT64_C(1), RANGE)), Dummy_0000, x);
+}
+/*........................................*/
+
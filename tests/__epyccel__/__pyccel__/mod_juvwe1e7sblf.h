@@ -0,0 +1,12 @@
+#ifndef MOD_JUVWE1E7SBLF_H
+#define MOD_JUVWE1E7SBLF_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_scalar_idiv(t_ndarray x, int64_t a);
+#endif // mod_juvwe1e7sblf_H
@@ -0,0 +1,11 @@
+#ifndef MOD_JWJLRNPXSZ8O_H
+#define MOD_JWJLRNPXSZ8O_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_jwjlrnpxsz8o_H
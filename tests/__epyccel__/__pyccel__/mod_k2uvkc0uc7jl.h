@@ -0,0 +1,11 @@
+#ifndef MOD_K2UVKC0UC7JL_H
+#define MOD_K2UVKC0UC7JL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_k2uvkc0uc7jl_H
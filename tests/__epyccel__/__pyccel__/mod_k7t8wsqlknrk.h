@@ -0,0 +1,11 @@
+#ifndef MOD_K7T8WSQLKNRK_H
+#define MOD_K7T8WSQLKNRK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_div_stack_array(void);
+#endif // mod_k7t8wsqlknrk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_K83SRU0K18E3_H
+#define MOD_K83SRU0K18E3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_div(t_ndarray x, t_ndarray y);
+#endif // mod_k83sru0k18e3_H
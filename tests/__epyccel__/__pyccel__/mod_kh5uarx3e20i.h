@@ -0,0 +1,11 @@
+#ifndef MOD_KH5UARX3E20I_H
+#define MOD_KH5UARX3E20I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_kwargs_full(void);
+#endif // mod_kh5uarx3e20i_H
@@ -0,0 +1,40 @@
+#ifndef MOD_KH5UARX3E20I_WRAPPER_H
+#define MOD_KH5UARX3E20I_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_kh5uarx3e20i.h"
+
+
+#ifdef MOD_KH5UARX3E20I_WRAPPER
+
+
+#else
+
+static void** Pymod_kh5uarx3e20i_API;
+
+
+/*........................................*/
+static int mod_kh5uarx3e20i_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_kh5uarx3e20i_API = (void**)PyCapsule_Import("mod_kh5uarx3e20i._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_kh5uarx3e20i_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_KH5UARX3E20I_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KKOKN7X9CJ9C_H
+#define MOD_KKOKN7X9CJ9C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_sub(t_ndarray x, t_ndarray y);
+#endif // mod_kkokn7x9cj9c_H
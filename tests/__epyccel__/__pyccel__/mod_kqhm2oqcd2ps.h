@@ -0,0 +1,11 @@
+#ifndef MOD_KQHM2OQCD2PS_H
+#define MOD_KQHM2OQCD2PS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_kqhm2oqcd2ps_H
@@ -0,0 +1,12 @@
+#ifndef MOD_KTDZF85IQFHX_H
+#define MOD_KTDZF85IQFHX_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_ktdzf85iqfhx_H
@@ -0,0 +1,11 @@
+#ifndef MOD_KZVIYNN7GR2T_H
+#define MOD_KZVIYNN7GR2T_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int32_index(void);
+#endif // mod_kzviynn7gr2t_H
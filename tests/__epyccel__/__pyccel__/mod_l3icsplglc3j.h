@@ -0,0 +1,12 @@
+#ifndef MOD_L3ICSPLGLC3J_H
+#define MOD_L3ICSPLGLC3J_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_l3icsplglc3j_H
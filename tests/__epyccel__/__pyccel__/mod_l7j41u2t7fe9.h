@@ -0,0 +1,11 @@
+#ifndef MOD_L7J41U2T7FE9_H
+#define MOD_L7J41U2T7FE9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_F_slice_17(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_l7j41u2t7fe9_H
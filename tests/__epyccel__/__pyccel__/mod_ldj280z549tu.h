@@ -0,0 +1,12 @@
+#ifndef MOD_LDJ280Z549TU_H
+#define MOD_LDJ280Z549TU_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_ldj280z549tu_H
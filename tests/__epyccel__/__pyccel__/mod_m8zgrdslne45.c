@@ -0,0 +1,12 @@
+#include "mod_m8zgrdslne45.h"
+
+
+/*........................................*/
+int64_t multi_layer_index(t_ndarray x, int64_t start, int64_t stop, int64_t step, int64_t idx)
+{
+    int64_t Out_0001;
+    Out_0001 = GET_ELEMENT(x, nd_int64, start + step * idx);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_M8ZGRDSLNE45_H
+#define MOD_M8ZGRDSLNE45_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t multi_layer_index(t_ndarray x, int64_t start, int64_t stop, int64_t step, int64_t idx);
+#endif // mod_m8zgrdslne45_H
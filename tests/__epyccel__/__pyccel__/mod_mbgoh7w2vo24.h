@@ -0,0 +1,11 @@
+#ifndef MOD_MBGOH7W2VO24_H
+#define MOD_MBGOH7W2VO24_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_int_1d_initialization_4(void);
+#endif // mod_mbgoh7w2vo24_H
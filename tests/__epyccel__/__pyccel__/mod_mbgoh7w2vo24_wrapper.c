@@ -0,0 +1,81 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_MBGOH7W2VO24_WRAPPER
+
+#include "mod_mbgoh7w2vo24_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_int_1d_initialization_4_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    b = array_int_1d_initialization_4();
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_mbgoh7w2vo24_methods[] = {
+    {
+        "array_int_1d_initialization_4",
+        (PyCFunction)array_int_1d_initialization_4_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_mbgoh7w2vo24_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_mbgoh7w2vo24",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_mbgoh7w2vo24_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_mbgoh7w2vo24(void)
+{
+    PyObject* mod;
+    static void* Pymod_mbgoh7w2vo24_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_mbgoh7w2vo24_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_mbgoh7w2vo24_API, "mod_mbgoh7w2vo24._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_MCPH6LWY8EYT_H
+#define MOD_MCPH6LWY8EYT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_mcph6lwy8eyt_H
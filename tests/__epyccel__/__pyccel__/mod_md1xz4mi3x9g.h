@@ -0,0 +1,12 @@
+#ifndef MOD_MD1XZ4MI3X9G_H
+#define MOD_MD1XZ4MI3X9G_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t unpack_array_2D_of_known_size(double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_md1xz4mi3x9g_H
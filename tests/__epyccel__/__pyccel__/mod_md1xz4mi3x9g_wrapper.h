@@ -0,0 +1,40 @@
+#ifndef MOD_MD1XZ4MI3X9G_WRAPPER_H
+#define MOD_MD1XZ4MI3X9G_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_md1xz4mi3x9g.h"
+
+
+#ifdef MOD_MD1XZ4MI3X9G_WRAPPER
+
+
+#else
+
+static void** Pymod_md1xz4mi3x9g_API;
+
+
+/*........................................*/
+static int mod_md1xz4mi3x9g_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_md1xz4mi3x9g_API = (void**)PyCapsule_Import("mod_md1xz4mi3x9g._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_md1xz4mi3x9g_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_MD1XZ4MI3X9G_WRAPPER_H
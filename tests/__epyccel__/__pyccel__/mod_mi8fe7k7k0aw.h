@@ -0,0 +1,11 @@
+#ifndef MOD_MI8FE7K7K0AW_H
+#define MOD_MI8FE7K7K0AW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray arr_tuple_slice_index(t_ndarray a);
+#endif // mod_mi8fe7k7k0aw_H
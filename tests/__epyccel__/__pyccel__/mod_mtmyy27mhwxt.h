@@ -0,0 +1,11 @@
+#ifndef MOD_MTMYY27MHWXT_H
+#define MOD_MTMYY27MHWXT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_mul(t_ndarray x, int64_t a);
+#endif // mod_mtmyy27mhwxt_H
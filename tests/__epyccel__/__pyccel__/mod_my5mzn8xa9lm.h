@@ -0,0 +1,11 @@
+#ifndef MOD_MY5MZN8XA9LM_H
+#define MOD_MY5MZN8XA9LM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_uncertain_shape_1(void);
+#endif // mod_my5mzn8xa9lm_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_MY5MZN8XA9LM_WRAPPER
+
+#include "mod_my5mzn8xa9lm_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* arrs_uncertain_shape_1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = arrs_uncertain_shape_1();
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_my5mzn8xa9lm_methods[] = {
+    {
+        "arrs_uncertain_shape_1",
+        (PyCFunction)arrs_uncertain_shape_1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_my5mzn8xa9lm_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_my5mzn8xa9lm",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_my5mzn8xa9lm_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_my5mzn8xa9lm(void)
+{
+    PyObject* mod;
+    static void* Pymod_my5mzn8xa9lm_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_my5mzn8xa9lm_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_my5mzn8xa9lm_API, "mod_my5mzn8xa9lm._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
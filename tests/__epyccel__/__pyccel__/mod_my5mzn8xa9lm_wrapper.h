@@ -0,0 +1,40 @@
+#ifndef MOD_MY5MZN8XA9LM_WRAPPER_H
+#define MOD_MY5MZN8XA9LM_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_my5mzn8xa9lm.h"
+
+
+#ifdef MOD_MY5MZN8XA9LM_WRAPPER
+
+
+#else
+
+static void** Pymod_my5mzn8xa9lm_API;
+
+
+/*........................................*/
+static int mod_my5mzn8xa9lm_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_my5mzn8xa9lm_API = (void**)PyCapsule_Import("mod_my5mzn8xa9lm._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_my5mzn8xa9lm_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_MY5MZN8XA9LM_WRAPPER_H
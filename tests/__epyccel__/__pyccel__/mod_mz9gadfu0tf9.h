@@ -0,0 +1,13 @@
+#ifndef MOD_MZ9GADFU0TF9_H
+#define MOD_MZ9GADFU0TF9_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_mod(t_ndarray x, t_ndarray y);
+#endif // mod_mz9gadfu0tf9_H
@@ -0,0 +1,11 @@
+#ifndef MOD_NC76FWPQF24I_H
+#define MOD_NC76FWPQF24I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_1d_matmul_transpose(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_nc76fwpqf24i_H
@@ -0,0 +1,42 @@
+#ifndef MOD_NF6OSTJD50O8_WRAPPER_H
+#define MOD_NF6OSTJD50O8_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_NF6OSTJD50O8_WRAPPER
+
+int64_t bind_c_parallel_array_constructors(void*, int64_t, int64_t, double*, double*, double*);
+
+#else
+
+static void** Pymod_nf6ostjd50o8_API;
+
+
+/*........................................*/
+static int mod_nf6ostjd50o8_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_nf6ostjd50o8_API = (void**)PyCapsule_Import("mod_nf6ostjd50o8._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_nf6ostjd50o8_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_NF6OSTJD50O8_WRAPPER_H
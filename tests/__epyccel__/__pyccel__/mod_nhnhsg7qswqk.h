@@ -0,0 +1,20 @@
+#ifndef MOD_NHNHSG7QSWQK_H
+#define MOD_NHNHSG7QSWQK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t dtype_convert_to_float32_0000(t_ndarray arr, int64_t* Out_0001, float* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005);
+int64_t dtype_convert_to_float32_0001(t_ndarray arr, int64_t* Out_0001, float* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005);
+int64_t dtype_convert_to_float32_0002(t_ndarray arr, int64_t* Out_0001, float* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005);
+int64_t dtype_convert_to_float32_0003(t_ndarray arr, int64_t* Out_0001, float* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005);
+int64_t dtype_convert_to_float32_0004(t_ndarray arr, int64_t* Out_0001, float* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005);
+int64_t dtype_convert_to_float32_0005(t_ndarray arr, int64_t* Out_0001, float* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005);
+int64_t dtype_convert_to_float32_0006(t_ndarray arr, int64_t* Out_0001, float* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005);
+int64_t dtype_convert_to_float32_0007(t_ndarray arr, int64_t* Out_0001, float* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005);
+int64_t dtype_convert_to_float32_0008(t_ndarray arr, int64_t* Out_0001, float* Out_0002, float* Out_0003, float* Out_0004, float* Out_0005);
+#endif // mod_nhnhsg7qswqk_H
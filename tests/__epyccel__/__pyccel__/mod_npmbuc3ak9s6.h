@@ -0,0 +1,12 @@
+#ifndef MOD_NPMBUC3AK9S6_H
+#define MOD_NPMBUC3AK9S6_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_npmbuc3ak9s6_H
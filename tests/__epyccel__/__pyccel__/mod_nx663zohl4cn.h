@@ -0,0 +1,11 @@
+#ifndef MOD_NX663ZOHL4CN_H
+#define MOD_NX663ZOHL4CN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_nx663zohl4cn_H
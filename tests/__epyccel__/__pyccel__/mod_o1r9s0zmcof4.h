@@ -0,0 +1,11 @@
+#ifndef MOD_O1R9S0ZMCOF4_H
+#define MOD_O1R9S0ZMCOF4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul(t_ndarray A, t_ndarray B, t_ndarray out);
+#endif // mod_o1r9s0zmcof4_H
@@ -0,0 +1,11 @@
+#ifndef MOD_O24OKM1SELC1_H
+#define MOD_O24OKM1SELC1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_loopdiff(t_ndarray x, t_ndarray y, t_ndarray out);
+#endif // mod_o24okm1selc1_H
@@ -0,0 +1,12 @@
+#ifndef MOD_O4D6ATZ68FZU_H
+#define MOD_O4D6ATZ68FZU_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_4(t_ndarray a, t_ndarray b);
+#endif // mod_o4d6atz68fzu_H
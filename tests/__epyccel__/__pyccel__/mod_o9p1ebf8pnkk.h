@@ -0,0 +1,11 @@
+#ifndef MOD_O9P1EBF8PNKK_H
+#define MOD_O9P1EBF8PNKK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t constant_negative_index(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_o9p1ebf8pnkk_H
@@ -0,0 +1,11 @@
+#ifndef MOD_OB083LG2F4KI_H
+#define MOD_OB083LG2F4KI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_C_slice_stride_1(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_ob083lg2f4ki_H
@@ -0,0 +1,11 @@
+#ifndef MOD_OQFG0E4PPRGF_H
+#define MOD_OQFG0E4PPRGF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_1D_2(t_ndarray a);
+#endif // mod_oqfg0e4pprgf_H
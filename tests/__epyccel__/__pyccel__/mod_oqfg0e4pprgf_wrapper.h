@@ -0,0 +1,42 @@
+#ifndef MOD_OQFG0E4PPRGF_WRAPPER_H
+#define MOD_OQFG0E4PPRGF_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_oqfg0e4pprgf.h"
+
+
+#ifdef MOD_OQFG0E4PPRGF_WRAPPER
+
+
+#else
+
+static void** Pymod_oqfg0e4pprgf_API;
+
+
+/*........................................*/
+static int mod_oqfg0e4pprgf_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_oqfg0e4pprgf_API = (void**)PyCapsule_Import("mod_oqfg0e4pprgf._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_oqfg0e4pprgf_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_OQFG0E4PPRGF_WRAPPER_H
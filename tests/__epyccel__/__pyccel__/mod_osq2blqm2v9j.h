@@ -0,0 +1,11 @@
+#ifndef MOD_OSQ2BLQM2V9J_H
+#define MOD_OSQ2BLQM2V9J_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_osq2blqm2v9j_H
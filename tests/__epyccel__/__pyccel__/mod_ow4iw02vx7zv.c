@@ -0,0 +1,22 @@
+#include "mod_ow4iw02vx7zv.h"
+
+
+/*........................................*/
+void fused_temporary_used_later(t_ndarray a, t_ndarray b)
+{
+    t_ndarray t = {.raw_data = NULL};
+    int64_t i;
+    t = array_create(1, (int64_t[]){a.shape[INT64_C(0)]}, nd_double, false, order_c);
+    for (i = INT64_C(0); i < t.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        t.nd_double[i] = GET_ELEMENT(a, nd_double, i) + GET_ELEMENT(b, nd_double, i);
+        GET_ELEMENT(b, nd_double, i) = t.nd_double[i] * 2.0;
+    }
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)] - INT64_C(1); i += INT64_C(1))
+    {
+        GET_ELEMENT(a, nd_double, i + INT64_C(1)) = t.nd_double[i];
+    }
+    free_array(&t);
+}
+/*........................................*/
+
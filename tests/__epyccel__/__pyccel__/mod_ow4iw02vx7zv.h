@@ -0,0 +1,11 @@
+#ifndef MOD_OW4IW02VX7ZV_H
+#define MOD_OW4IW02VX7ZV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void fused_temporary_used_later(t_ndarray a, t_ndarray b);
+#endif // mod_ow4iw02vx7zv_H
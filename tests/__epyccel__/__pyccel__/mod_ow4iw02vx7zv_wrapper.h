@@ -0,0 +1,42 @@
+#ifndef MOD_OW4IW02VX7ZV_WRAPPER_H
+#define MOD_OW4IW02VX7ZV_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_ow4iw02vx7zv.h"
+
+
+#ifdef MOD_OW4IW02VX7ZV_WRAPPER
+
+
+#else
+
+static void** Pymod_ow4iw02vx7zv_API;
+
+
+/*........................................*/
+static int mod_ow4iw02vx7zv_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ow4iw02vx7zv_API = (void**)PyCapsule_Import("mod_ow4iw02vx7zv._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ow4iw02vx7zv_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_OW4IW02VX7ZV_WRAPPER_H
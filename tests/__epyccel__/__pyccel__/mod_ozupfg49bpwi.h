@@ -0,0 +1,11 @@
+#ifndef MOD_OZUPFG49BPWI_H
+#define MOD_OZUPFG49BPWI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_ozupfg49bpwi_H
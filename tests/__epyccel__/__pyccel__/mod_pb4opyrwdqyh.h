@@ -0,0 +1,11 @@
+#ifndef MOD_PB4OPYRWDQYH_H
+#define MOD_PB4OPYRWDQYH_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_pb4opyrwdqyh_H
@@ -0,0 +1,42 @@
+#ifndef MOD_PDUIQ9F6IGS0_WRAPPER_H
+#define MOD_PDUIQ9F6IGS0_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_PDUIQ9F6IGS0_WRAPPER
+
+void bind_c_array_float_2d_1d_matmul_transpose(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, void*, int64_t, int64_t);
+
+#else
+
+static void** Pymod_pduiq9f6igs0_API;
+
+
+/*........................................*/
+static int mod_pduiq9f6igs0_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_pduiq9f6igs0_API = (void**)PyCapsule_Import("mod_pduiq9f6igs0._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_pduiq9f6igs0_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_PDUIQ9F6IGS0_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_PMSLYEUO42CX_H
+#define MOD_PMSLYEUO42CX_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_4(int64_t* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_pmslyeuo42cx_H
@@ -0,0 +1,29 @@
+#include "mod_q5q26t55x5bo.h"
+
+
+/*........................................*/
+void array_float_2d_C_array_initialization(t_ndarray a)
+{
+    double array_dummy[INT64_C(6)];
+    t_ndarray tmp = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(2), INT64_C(3)},
+        .nd=2,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&tmp);
+    int64_t i;
+    int64_t i_0001;
+    double Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6)};
+    memcpy(&tmp.nd_double[INT64_C(0)], Dummy_0000, 6 * tmp.type_size);
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(a, nd_double, i, i_0001) = tmp.nd_double[i * tmp.shape[INT64_C(1)] + i_0001];
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_Q5Q26T55X5BO_H
+#define MOD_Q5Q26T55X5BO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_2d_C_array_initialization(t_ndarray a);
+#endif // mod_q5q26t55x5bo_H
@@ -0,0 +1,11 @@
+#ifndef MOD_Q7CF3L5E4TKO_H
+#define MOD_Q7CF3L5E4TKO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_q7cf3l5e4tko_H
@@ -0,0 +1,11 @@
+#ifndef MOD_QD28ZAV5OO20_H
+#define MOD_QD28ZAV5OO20_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int64_index(void);
+#endif // mod_qd28zav5oo20_H
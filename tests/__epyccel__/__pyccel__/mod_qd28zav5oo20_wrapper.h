@@ -0,0 +1,40 @@
+#ifndef MOD_QD28ZAV5OO20_WRAPPER_H
+#define MOD_QD28ZAV5OO20_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_qd28zav5oo20.h"
+
+
+#ifdef MOD_QD28ZAV5OO20_WRAPPER
+
+
+#else
+
+static void** Pymod_qd28zav5oo20_API;
+
+
+/*........................................*/
+static int mod_qd28zav5oo20_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_qd28zav5oo20_API = (void**)PyCapsule_Import("mod_qd28zav5oo20._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_qd28zav5oo20_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_QD28ZAV5OO20_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_QDS9TMAWXPWG_H
+#define MOD_QDS9TMAWXPWG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_div(t_ndarray x, double a);
+#endif // mod_qds9tmawxpwg_H
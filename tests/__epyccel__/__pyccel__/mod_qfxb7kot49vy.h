@@ -0,0 +1,12 @@
+#ifndef MOD_QFXB7KOT49VY_H
+#define MOD_QFXB7KOT49VY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_int_2d_F_initialization(t_ndarray a);
+#endif // mod_qfxb7kot49vy_H
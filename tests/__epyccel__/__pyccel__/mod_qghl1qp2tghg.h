@@ -0,0 +1,11 @@
+#ifndef MOD_QGHL1QP2TGHG_H
+#define MOD_QGHL1QP2TGHG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_qghl1qp2tghg_H
@@ -0,0 +1,11 @@
+#ifndef MOD_QP0H9DYGCRQU_H
+#define MOD_QP0H9DYGCRQU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_3(t_ndarray a);
+#endif // mod_qp0h9dygcrqu_H
@@ -0,0 +1,11 @@
+#ifndef MOD_QQTRFS207SCO_H
+#define MOD_QQTRFS207SCO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_qqtrfs207sco_H
@@ -0,0 +1,14 @@
+#include "mod_qs3h5t6xsy0y.h"
+
+
+/*........................................*/
+void array_float_1d_scalar_idiv(t_ndarray x, double a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) = floor(GET_ELEMENT(x, nd_double, i) / a);
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_QS3H5T6XSY0Y_H
+#define MOD_QS3H5T6XSY0Y_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_scalar_idiv(t_ndarray x, double a);
+#endif // mod_qs3h5t6xsy0y_H
@@ -0,0 +1,11 @@
+#ifndef MOD_QW2BCBBNM3K7_H
+#define MOD_QW2BCBBNM3K7_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_qw2bcbbnm3k7_H
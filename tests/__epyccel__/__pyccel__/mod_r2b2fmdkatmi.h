@@ -0,0 +1,15 @@
+#ifndef MOD_R2B2FMDKATMI_H
+#define MOD_R2B2FMDKATMI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_ndmin_1_0000(t_ndarray x);
+t_ndarray array_ndmin_1_0001(t_ndarray x);
+t_ndarray array_ndmin_1_0002(t_ndarray x);
+t_ndarray array_ndmin_1_0003(t_ndarray x);
+t_ndarray array_ndmin_1_0004(t_ndarray x);
+#endif // mod_r2b2fmdkatmi_H
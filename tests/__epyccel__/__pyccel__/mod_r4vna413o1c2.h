@@ -0,0 +1,11 @@
+#ifndef MOD_R4VNA413O1C2_H
+#define MOD_R4VNA413O1C2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_1(t_ndarray a, t_ndarray b);
+#endif // mod_r4vna413o1c2_H
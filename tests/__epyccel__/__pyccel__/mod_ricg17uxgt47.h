@@ -0,0 +1,11 @@
+#ifndef MOD_RICG17UXGT47_H
+#define MOD_RICG17UXGT47_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void parallel_array_expressions(t_ndarray c, t_ndarray a, t_ndarray b, double d);
+#endif // mod_ricg17uxgt47_H
@@ -0,0 +1,11 @@
+#ifndef MOD_RLMWXJVHBM22_H
+#define MOD_RLMWXJVHBM22_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_rlmwxjvhbm22_H
@@ -0,0 +1,11 @@
+#ifndef MOD_RX0MHPKPIGHN_H
+#define MOD_RX0MHPKPIGHN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_div_stack_array(void);
+#endif // mod_rx0mhpkpighn_H
@@ -0,0 +1,11 @@
+#ifndef MOD_S1QOU8I7RA6E_H
+#define MOD_S1QOU8I7RA6E_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_2(t_ndarray a);
+#endif // mod_s1qou8i7ra6e_H
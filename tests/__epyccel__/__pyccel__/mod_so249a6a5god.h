@@ -0,0 +1,11 @@
+#ifndef MOD_SO249A6A5GOD_H
+#define MOD_SO249A6A5GOD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_C_slice_11(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_so249a6a5god_H
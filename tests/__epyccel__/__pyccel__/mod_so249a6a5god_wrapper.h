@@ -0,0 +1,42 @@
+#ifndef MOD_SO249A6A5GOD_WRAPPER_H
+#define MOD_SO249A6A5GOD_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_so249a6a5god.h"
+
+
+#ifdef MOD_SO249A6A5GOD_WRAPPER
+
+
+#else
+
+static void** Pymod_so249a6a5god_API;
+
+
+/*........................................*/
+static int mod_so249a6a5god_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_so249a6a5god_API = (void**)PyCapsule_Import("mod_so249a6a5god._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_so249a6a5god_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_SO249A6A5GOD_WRAPPER_H
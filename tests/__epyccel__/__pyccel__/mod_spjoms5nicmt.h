@@ -0,0 +1,11 @@
+#ifndef MOD_SPJOMS5NICMT_H
+#define MOD_SPJOMS5NICMT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_spjoms5nicmt_H
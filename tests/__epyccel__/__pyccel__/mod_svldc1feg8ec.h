@@ -0,0 +1,11 @@
+#ifndef MOD_SVLDC1FEG8EC_H
+#define MOD_SVLDC1FEG8EC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_mul(t_ndarray x, t_ndarray y);
+#endif // mod_svldc1feg8ec_H
@@ -0,0 +1,42 @@
+#ifndef MOD_TH8OF7NFTEOG_WRAPPER_H
+#define MOD_TH8OF7NFTEOG_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_th8of7nfteog.h"
+
+
+#ifdef MOD_TH8OF7NFTEOG_WRAPPER
+
+
+#else
+
+static void** Pymod_th8of7nfteog_API;
+
+
+/*........................................*/
+static int mod_th8of7nfteog_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_th8of7nfteog_API = (void**)PyCapsule_Import("mod_th8of7nfteog._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_th8of7nfteog_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_TH8OF7NFTEOG_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_TPLH4LQKMV5A_H
+#define MOD_TPLH4LQKMV5A_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_3(t_ndarray a, t_ndarray b);
+#endif // mod_tplh4lqkmv5a_H
@@ -0,0 +1,11 @@
+#ifndef MOD_TR194A23MRZB_H
+#define MOD_TR194A23MRZB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_sub(t_ndarray x, double a);
+#endif // mod_tr194a23mrzb_H
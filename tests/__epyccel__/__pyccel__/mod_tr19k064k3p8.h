@@ -0,0 +1,11 @@
+#ifndef MOD_TR19K064K3P8_H
+#define MOD_TR19K064K3P8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_1D_1(t_ndarray a);
+#endif // mod_tr19k064k3p8_H
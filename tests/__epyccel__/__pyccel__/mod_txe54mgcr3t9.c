@@ -0,0 +1,35 @@
+#include "mod_txe54mgcr3t9.h"
+
+
+/*........................................*/
+int64_t parallel_array_constructors(t_ndarray a, double* Out_0001, double* Out_0002, double* Out_0003)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray d = {.raw_data = NULL};
+    int64_t i;
+    c = array_create(1, (int64_t[]){a.shape[INT64_C(0)]}, nd_double, false, order_c);
+    for (i = INT64_C(0); i < c.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        c.nd_double[i] = (0.0 + i*(1.0 - 0.0) / (a.shape[INT64_C(0)] - INT64_C(1)));
+        c.nd_double[a.shape[INT64_C(0)] - INT64_C(1)] = 1.0;
+    }
+    d = array_create(1, (int64_t[]){(int64_t)ceil((double)((a.shape[INT64_C(0)] - INT64_C(0))) / 1.0)}, nd_double, false, order_c);
+    #pragma omp parallel for simd if(parallel: d.shape[INT64_C(0)] >= 100)
+    for (i = INT64_C(0); i < d.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        d.nd_double[i] = i + GET_ELEMENT(a, nd_double, i);
+    }
+    #pragma omp parallel for simd if(parallel: c.shape[INT64_C(0)] >= 100)
+    for (i = INT64_C(0); i < c.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        c.nd_double[i] = c.nd_double[i] + GET_ELEMENT(a, nd_double, i) * 2.0;
+    }
+    (*Out_0001) = c.nd_double[INT64_C(0)];
+    (*Out_0002) = c.nd_double[a.shape[INT64_C(0)] - INT64_C(1)];
+    (*Out_0003) = d.nd_double[a.shape[INT64_C(0)] - INT64_C(1)];
+    free_array(&c);
+    free_array(&d);
+    return 0;
+}
+/*........................................*/
+
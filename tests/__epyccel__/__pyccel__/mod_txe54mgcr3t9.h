@@ -0,0 +1,12 @@
+#ifndef MOD_TXE54MGCR3T9_H
+#define MOD_TXE54MGCR3T9_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t parallel_array_constructors(t_ndarray a, double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_txe54mgcr3t9_H
@@ -0,0 +1,11 @@
+#ifndef MOD_U9MBWLEJ8U6Y_H
+#define MOD_U9MBWLEJ8U6Y_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_sub(t_ndarray x, t_ndarray y);
+#endif // mod_u9mbwlej8u6y_H
@@ -0,0 +1,33 @@
+#include "mod_udql8qriziaq.h"
+
+
+/*........................................*/
+void array_float_3d_C_array_initialization_2(t_ndarray a)
+{
+    double array_dummy[INT64_C(24)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(2), INT64_C(3), INT64_C(4)},
+        .nd=3,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    double Dummy_0000[] = {0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 24 * x.type_size);
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+            {
+                GET_ELEMENT(a, nd_double, i, i_0001, i_0002) = x.nd_double[(i * x.shape[INT64_C(1)] + i_0001) * x.shape[INT64_C(2)] + i_0002];
+            }
+        }
+    }
+}
+/*........................................*/
+
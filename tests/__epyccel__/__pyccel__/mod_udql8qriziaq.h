@@ -0,0 +1,12 @@
+#ifndef MOD_UDQL8QRIZIAQ_H
+#define MOD_UDQL8QRIZIAQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_3d_C_array_initialization_2(t_ndarray a);
+#endif // mod_udql8qriziaq_H
@@ -0,0 +1,41 @@
+module mod_uvdh3j485h4x
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine omp_matmul(A, x, out) 
+
+    implicit none
+
+    real(f64), intent(in) :: A(0_i64:, 0_i64:)
+    real(f64), intent(in) :: x(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: out(0_i64:, 0_i64:)
+    integer(i64) :: i
+    integer(i64) :: j
+    integer(i64) :: k
+
+    !$omp parallel shared(A, x, out) private(i, j, k)
+    !$omp do
+    do i = 0_i64, size(A, 2_i64, i64) - 1_i64
+      do j = 0_i64, size(x, 1_i64, i64) - 1_i64
+        do k = 0_i64, size(x, 2_i64, i64) - 1_i64
+          out(j, i) = out(j, i) + A(k, i) * x(j, k)
+        end do
+      end do
+    end do
+    !$omp end do
+    !$omp end parallel
+    !to let the function compile using epyccel issue #468
+    !____CommentBlock____!
+    !bypass issue #468   !
+    !____________________!
+
+  end subroutine omp_matmul
+  !........................................
+
+end module mod_uvdh3j485h4x
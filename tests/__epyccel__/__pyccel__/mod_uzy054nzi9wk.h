@@ -0,0 +1,11 @@
+#ifndef MOD_UZY054NZI9WK_H
+#define MOD_UZY054NZI9WK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_0(void);
+#endif // mod_uzy054nzi9wk_H
@@ -0,0 +1,40 @@
+#ifndef MOD_UZY054NZI9WK_WRAPPER_H
+#define MOD_UZY054NZI9WK_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_uzy054nzi9wk.h"
+
+
+#ifdef MOD_UZY054NZI9WK_WRAPPER
+
+
+#else
+
+static void** Pymod_uzy054nzi9wk_API;
+
+
+/*........................................*/
+static int mod_uzy054nzi9wk_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_uzy054nzi9wk_API = (void**)PyCapsule_Import("mod_uzy054nzi9wk._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_uzy054nzi9wk_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_UZY054NZI9WK_WRAPPER_H
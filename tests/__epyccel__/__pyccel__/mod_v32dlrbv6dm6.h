@@ -0,0 +1,11 @@
+#ifndef MOD_V32DLRBV6DM6_H
+#define MOD_V32DLRBV6DM6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_different_shapes_0(void);
+#endif // mod_v32dlrbv6dm6_H
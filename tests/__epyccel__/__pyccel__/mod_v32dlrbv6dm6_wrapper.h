@@ -0,0 +1,40 @@
+#ifndef MOD_V32DLRBV6DM6_WRAPPER_H
+#define MOD_V32DLRBV6DM6_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_v32dlrbv6dm6.h"
+
+
+#ifdef MOD_V32DLRBV6DM6_WRAPPER
+
+
+#else
+
+static void** Pymod_v32dlrbv6dm6_API;
+
+
+/*........................................*/
+static int mod_v32dlrbv6dm6_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_v32dlrbv6dm6_API = (void**)PyCapsule_Import("mod_v32dlrbv6dm6._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_v32dlrbv6dm6_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_V32DLRBV6DM6_WRAPPER_H
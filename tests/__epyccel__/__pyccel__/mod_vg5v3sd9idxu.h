@@ -0,0 +1,12 @@
+#ifndef MOD_VG5V3SD9IDXU_H
+#define MOD_VG5V3SD9IDXU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_sum(void);
+#endif // mod_vg5v3sd9idxu_H
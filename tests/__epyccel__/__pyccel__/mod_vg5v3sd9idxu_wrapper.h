@@ -0,0 +1,40 @@
+#ifndef MOD_VG5V3SD9IDXU_WRAPPER_H
+#define MOD_VG5V3SD9IDXU_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_vg5v3sd9idxu.h"
+
+
+#ifdef MOD_VG5V3SD9IDXU_WRAPPER
+
+
+#else
+
+static void** Pymod_vg5v3sd9idxu_API;
+
+
+/*........................................*/
+static int mod_vg5v3sd9idxu_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_vg5v3sd9idxu_API = (void**)PyCapsule_Import("mod_vg5v3sd9idxu._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_vg5v3sd9idxu_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_VG5V3SD9IDXU_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_VGVU7Q03A5PQ_H
+#define MOD_VGVU7Q03A5PQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t arrs_2d_different_shapes_0(int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_vgvu7q03a5pq_H
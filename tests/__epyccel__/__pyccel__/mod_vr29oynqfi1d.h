@@ -0,0 +1,11 @@
+#ifndef MOD_VR29OYNQFI1D_H
+#define MOD_VR29OYNQFI1D_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_scalar_div(t_ndarray x, double a);
+#endif // mod_vr29oynqfi1d_H
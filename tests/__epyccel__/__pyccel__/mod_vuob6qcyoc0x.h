@@ -0,0 +1,11 @@
+#ifndef MOD_VUOB6QCYOC0X_H
+#define MOD_VUOB6QCYOC0X_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_F_F(t_ndarray A, t_ndarray B, t_ndarray out);
+#endif // mod_vuob6qcyoc0x_H
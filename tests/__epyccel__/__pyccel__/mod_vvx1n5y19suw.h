@@ -0,0 +1,11 @@
+#ifndef MOD_VVX1N5Y19SUW_H
+#define MOD_VVX1N5Y19SUW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_vvx1n5y19suw_H
@@ -0,0 +1,11 @@
+#ifndef MOD_VYD25HVYFP4U_H
+#define MOD_VYD25HVYFP4U_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_vyd25hvyfp4u_H
@@ -0,0 +1,15 @@
+#ifndef MOD_W8SNXMKX930P_H
+#define MOD_W8SNXMKX930P_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t unpack_array_0000(t_ndarray arr, int64_t* x, int64_t* y, int64_t* z);
+int64_t unpack_array_0001(t_ndarray arr, t_ndarray* x, t_ndarray* y, t_ndarray* z);
+int64_t unpack_array_0002(t_ndarray arr, t_ndarray* x, t_ndarray* y, t_ndarray* z);
+int64_t unpack_array_0003(t_ndarray arr, t_ndarray* x, t_ndarray* y, t_ndarray* z);
+int64_t unpack_array_0004(t_ndarray arr, t_ndarray* x, t_ndarray* y, t_ndarray* z);
+#endif // mod_w8snxmkx930p_H
@@ -0,0 +1,11 @@
+#ifndef MOD_WBGMGVXD4LFB_H
+#define MOD_WBGMGVXD4LFB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_div(t_ndarray x, t_ndarray y);
+#endif // mod_wbgmgvxd4lfb_H
@@ -0,0 +1,11 @@
+#ifndef MOD_WGABB5D73IUW_H
+#define MOD_WGABB5D73IUW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_sub(t_ndarray x, t_ndarray y);
+#endif // mod_wgabb5d73iuw_H
@@ -0,0 +1,11 @@
+#ifndef MOD_WQVKK2PKNZI3_H
+#define MOD_WQVKK2PKNZI3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_scalar_add(t_ndarray x, int64_t a);
+#endif // mod_wqvkk2pknzi3_H
@@ -0,0 +1,34 @@
+#include "mod_wsjhus7q7mj7.h"
+
+
+/*........................................*/
+int64_t test_multiple_negative_index_2(int64_t c, int64_t d, double* x, int64_t* y)
+{
+    double array_dummy[INT64_C(4)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(4)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t array_dummy_0001[INT64_C(4)];
+    t_ndarray b = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(4)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    double Dummy_0000[] = {1.2, 2.2, 3.2, 4.2};
+    memcpy(&a.nd_double[INT64_C(0)], Dummy_0000, 4 * a.type_size);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(5), INT64_C(9), INT64_C(13)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0001, 4 * b.type_size);
+    (*x) = a.nd_double[c < INT64_C(0) ? INT64_C(4) + c : c] * d;
+    (*y) = b.nd_int64[d < INT64_C(0) ? INT64_C(4) + d : d] * c;
+    return 0;
+}
+/*........................................*/
+
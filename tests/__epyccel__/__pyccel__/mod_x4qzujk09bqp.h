@@ -0,0 +1,11 @@
+#ifndef MOD_X4QZUJK09BQP_H
+#define MOD_X4QZUJK09BQP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_add_augassign(t_ndarray x, t_ndarray y);
+#endif // mod_x4qzujk09bqp_H
@@ -0,0 +1,11 @@
+#ifndef MOD_XBILKDJS6LX1_H
+#define MOD_XBILKDJS6LX1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_add(t_ndarray x, double a);
+#endif // mod_xbilkdjs6lx1_H
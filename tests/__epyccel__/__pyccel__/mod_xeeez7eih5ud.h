@@ -0,0 +1,11 @@
+#ifndef MOD_XEEEZ7EIH5UD_H
+#define MOD_XEEEZ7EIH5UD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_xeeez7eih5ud_H
@@ -0,0 +1,16 @@
+#include "mod_xm5x5t29gtfb.h"
+
+
+/*........................................*/
+double array_float_2d_1d_matmul_creation(t_ndarray A, t_ndarray x)
+{
+    t_ndarray out = {.raw_data = NULL};
+    double Out_0001;
+    out = array_create(1, (int64_t[]){A.shape[INT64_C(0)]}, nd_double, false, order_c);
+    numpy_matmul_float64(out, A, x);
+    Out_0001 = numpy_sum_float64(out);
+    free_array(&out);
+    return Out_0001;
+}
+/*........................................*/
+
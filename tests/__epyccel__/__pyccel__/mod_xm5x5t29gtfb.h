@@ -0,0 +1,11 @@
+#ifndef MOD_XM5X5T29GTFB_H
+#define MOD_XM5X5T29GTFB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_1d_matmul_creation(t_ndarray A, t_ndarray x);
+#endif // mod_xm5x5t29gtfb_H
@@ -0,0 +1,11 @@
+#ifndef MOD_XQROYYPJ2OJV_H
+#define MOD_XQROYYPJ2OJV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_F_slice_16(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_xqroyypj2ojv_H
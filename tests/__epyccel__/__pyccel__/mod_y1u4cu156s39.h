@@ -0,0 +1,11 @@
+#ifndef MOD_Y1U4CU156S39_H
+#define MOD_Y1U4CU156S39_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_y1u4cu156s39_H
@@ -0,0 +1,10 @@
+#include "mod_yfi3coft09v4.h"
+
+
+/*........................................*/
+void array_float_2d_2d_matmul_mixorder(t_ndarray A, t_ndarray B, t_ndarray out)
+{
+    numpy_matmul_float64(array_slicing(out, 2, new_slice(INT64_C(0), out.shape[INT64_C(0)], INT64_C(1), RANGE), new_slice(INT64_C(0), out.shape[INT64_C(1)], INT64_C(1), RANGE)), A, B);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_YFI3COFT09V4_H
+#define MOD_YFI3COFT09V4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_mixorder(t_ndarray A, t_ndarray B, t_ndarray out);
+#endif // mod_yfi3coft09v4_H
@@ -0,0 +1,11 @@
+#ifndef MOD_YNSLDU3QZDGO_H
+#define MOD_YNSLDU3QZDGO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_ynsldu3qzdgo_H
@@ -0,0 +1,12 @@
+#ifndef MOD_YOYQYMH7IIK2_H
+#define MOD_YOYQYMH7IIK2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_2d_stack_array_1(void);
+#endif // mod_yoyqymh7iik2_H
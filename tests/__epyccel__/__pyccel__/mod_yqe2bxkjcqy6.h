@@ -0,0 +1,11 @@
+#ifndef MOD_YQE2BXKJCQY6_H
+#define MOD_YQE2BXKJCQY6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_transpose(t_ndarray A, t_ndarray B, t_ndarray C, t_ndarray out1, t_ndarray out2);
+#endif // mod_yqe2bxkjcqy6_H
@@ -0,0 +1,11 @@
+#ifndef MOD_YUF0W7JHDM3C_H
+#define MOD_YUF0W7JHDM3C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_yuf0w7jhdm3c_H
@@ -0,0 +1,28 @@
+#include "mod_yww7nq84pp0y.h"
+
+
+/*........................................*/
+int64_t array_int_1d_initialization_3(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t array_dummy[INT64_C(5)];
+    t_ndarray b = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    a = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(4), INT64_C(8), INT64_C(16)};
+    memcpy(&a.nd_int64[INT64_C(0)], Dummy_0000, 5 * a.type_size);
+    array_copy_data(&b, a, 0);
+    (*Out_0001) = numpy_sum_int64(b);
+    (*Out_0002) = b.nd_int64[INT64_C(0)];
+    (*Out_0003) = b.nd_int64[INT64_C(4)];
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_YWW7NQ84PP0Y_H
+#define MOD_YWW7NQ84PP0Y_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t array_int_1d_initialization_3(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_yww7nq84pp0y_H
@@ -0,0 +1,40 @@
+#ifndef MOD_YWW7NQ84PP0Y_WRAPPER_H
+#define MOD_YWW7NQ84PP0Y_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_yww7nq84pp0y.h"
+
+
+#ifdef MOD_YWW7NQ84PP0Y_WRAPPER
+
+
+#else
+
+static void** Pymod_yww7nq84pp0y_API;
+
+
+/*........................................*/
+static int mod_yww7nq84pp0y_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_yww7nq84pp0y_API = (void**)PyCapsule_Import("mod_yww7nq84pp0y._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_yww7nq84pp0y_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_YWW7NQ84PP0Y_WRAPPER_H
@@ -0,0 +1,42 @@
+#ifndef MOD_Z3Z6A1OD0OJ8_WRAPPER_H
+#define MOD_Z3Z6A1OD0OJ8_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_z3z6a1od0oj8.h"
+
+
+#ifdef MOD_Z3Z6A1OD0OJ8_WRAPPER
+
+
+#else
+
+static void** Pymod_z3z6a1od0oj8_API;
+
+
+/*........................................*/
+static int mod_z3z6a1od0oj8_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_z3z6a1od0oj8_API = (void**)PyCapsule_Import("mod_z3z6a1od0oj8._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_z3z6a1od0oj8_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_Z3Z6A1OD0OJ8_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_Z92Y20PI8A92_H
+#define MOD_Z92Y20PI8A92_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_z92y20pi8a92_H
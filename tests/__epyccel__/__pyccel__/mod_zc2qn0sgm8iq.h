@@ -0,0 +1,12 @@
+#ifndef MOD_ZC2QN0SGM8IQ_H
+#define MOD_ZC2QN0SGM8IQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_2(void);
+#endif // mod_zc2qn0sgm8iq_H
@@ -0,0 +1,11 @@
+#ifndef MOD_ZC35MJW87BOI_H
+#define MOD_ZC35MJW87BOI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_1D_1(t_ndarray a);
+#endif // mod_zc35mjw87boi_H
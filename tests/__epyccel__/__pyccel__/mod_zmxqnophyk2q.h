@@ -0,0 +1,11 @@
+#ifndef MOD_ZMXQNOPHYK2Q_H
+#define MOD_ZMXQNOPHYK2Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_zmxqnophyk2q_H
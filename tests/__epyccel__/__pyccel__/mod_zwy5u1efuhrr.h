@@ -0,0 +1,11 @@
+#ifndef MOD_ZWY5U1EFUHRR_H
+#define MOD_ZWY5U1EFUHRR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t parallel_array_reductions(t_ndarray a, t_ndarray b, t_ndarray c, double* s, int32_t* m, double* n);
+#endif // mod_zwy5u1efuhrr_H
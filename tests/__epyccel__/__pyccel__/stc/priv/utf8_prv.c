@@ -0,0 +1,131 @@
+/* MIT License
+ *
+ * Copyright (c) 2025 Tyge Løvset
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in all
+ * copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+ * SOFTWARE.
+ */
+#ifndef STC_UTF8_PRV_C_INCLUDED
+#define STC_UTF8_PRV_C_INCLUDED
+
+#include "utf8_tab.c"
+
+const uint8_t utf8_dtab[] = {
+   0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,  0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+   0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,  0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+   0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,  0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+   0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,  0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,
+   1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,  9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,
+   7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,  7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,
+   8,8,2,2,2,2,2,2,2,2,2,2,2,2,2,2,  2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,
+  10,3,3,3,3,3,3,3,3,3,3,3,3,4,3,3, 11,6,6,6,5,8,8,8,8,8,8,8,8,8,8,8,
+   0,12,24,36,60,96,84,12,12,12,48,72, 12,12,12,12,12,12,12,12,12,12,12,12,
+  12, 0,12,12,12,12,12, 0,12, 0,12,12, 12,24,12,12,12,12,12,24,12,24,12,12,
+  12,12,12,12,12,12,12,24,12,12,12,12, 12,24,12,12,12,12,12,12,12,24,12,12,
+  12,12,12,12,12,12,12,36,12,36,12,12, 12,36,12,12,12,12,12,36,12,36,12,12,
+  12,36,12,12,12,12,12,12,12,12,12,12,
+};
+
+int utf8_encode(char *out, uint32_t c) {
+    if (c < 0x80U) {
+        out[0] = (char) c;
+        return 1;
+    } else if (c < 0x0800U) {
+        out[0] = (char) ((c>>6  & 0x1F) | 0xC0);
+        out[1] = (char) ((c     & 0x3F) | 0x80);
+        return 2;
+    } else if (c < 0x010000U) {
+        if ((c < 0xD800U) | (c >= 0xE000U)) {
+            out[0] = (char) ((c>>12 & 0x0F) | 0xE0);
+            out[1] = (char) ((c>>6  & 0x3F) | 0x80);
+            out[2] = (char) ((c     & 0x3F) | 0x80);
+            return 3;
+        }
+    } else if (c < 0x110000U) {
+        out[0] = (char) ((c>>18 & 0x07) | 0xF0);
+        out[1] = (char) ((c>>12 & 0x3F) | 0x80);
+        out[2] = (char) ((c>>6  & 0x3F) | 0x80);
+        out[3] = (char) ((c     & 0x3F) | 0x80);
+        return 4;
+    }
+    return 0;
+}
+
+uint32_t utf8_peek_at(const char* s, isize offset)
+    { return utf8_peek(utf8_offset(s, offset)); }
+
+bool utf8_valid_n(const char* s, isize nbytes) {
+    utf8_decode_t d = {.state=0};
+    while ((nbytes-- != 0) & (*s != 0))
+        utf8_decode(&d, (uint8_t)*s++);
+    return d.state == 0;
+}
+
+uint32_t utf8_casefold(uint32_t c) {
+    for (int i=0; i < casefold_len; ++i) {
+        const struct CaseMapping entry = casemappings[i];
+        if (c <= entry.c2) {
+            if (c < entry.c1) return c;
+            int d = entry.m2 - entry.c2;
+            if (d == 1) return c + ((entry.c2 & 1U) == (c & 1U));
+            return (uint32_t)((int)c + d);
+        }
+    }
+    return c;
+}
+
+uint32_t utf8_tolower(uint32_t c) {
+    for (int i=0; i < (int)(sizeof upcase_ind/sizeof *upcase_ind); ++i) {
+        const struct CaseMapping entry = casemappings[upcase_ind[i]];
+        if (c <= entry.c2) {
+            if (c < entry.c1) return c;
+            int d = entry.m2 - entry.c2;
+            if (d == 1) return c + ((entry.c2 & 1U) == (c & 1U));
+            return (uint32_t)((int)c + d);
+        }
+    }
+    return c;
+}
+
+uint32_t utf8_toupper(uint32_t c) {
+    for (int i=0; i < (int)(sizeof lowcase_ind/sizeof *lowcase_ind); ++i) {
+        const struct CaseMapping entry = casemappings[lowcase_ind[i]];
+        if (c <= entry.m2) {
+            int d = entry.m2 - entry.c2;
+            if (c < (uint32_t)(entry.c1 + d)) return c;
+            if (d == 1) return c - ((entry.m2 & 1U) == (c & 1U));
+            return (uint32_t)((int)c - d);
+        }
+    }
+    return c;
+}
+
+int utf8_icompare(const csview s1, const csview s2) {
+    utf8_decode_t d1 = {.state=0}, d2 = {.state=0};
+    isize j1 = 0, j2 = 0;
+    while ((j1 < s1.size) & (j2 < s2.size)) {
+        do { utf8_decode(&d1, (uint8_t)s1.buf[j1++]); } while (d1.state);
+        do { utf8_decode(&d2, (uint8_t)s2.buf[j2++]); } while (d2.state);
+        int32_t c = (int32_t)utf8_casefold(d1.codep) - (int32_t)utf8_casefold(d2.codep);
+        if (c || !s2.buf[j2 - 1]) // OK if s1.size and s2.size are npos
+            return (int)c;
+    }
+    return (int)(s1.size - s2.size);
+}
+
+#endif // STC_UTF8_PRV_C_INCLUDED
@@ -0,0 +1,7 @@
+@parallel_arrays(threshold = 100)
+def parallel_array_reductions(a : 'float[:,:]', b : 'int32[:]', c : 'float[:,:](order=F)'):
+    import numpy as np
+    s = np.sum(a)
+    m = np.max(b)
+    n = np.min(c[1:, :])
+    return s, m, n
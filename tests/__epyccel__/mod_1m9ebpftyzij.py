@@ -0,0 +1,8 @@
+@stack_array('a')
+def array_float_1d_sum_stack_array():
+    from numpy import zeros
+    a = zeros(10)
+    s = 0.
+    for i in range(10):
+        s += a[i]
+    return s
@@ -0,0 +1,9 @@
+@stack_array('a')
+def array_float_2d_sum_stack_array():
+    from numpy import zeros
+    a = zeros((10, 10))
+    s = 0.
+    for i in range(10):
+        for j in range(10):
+            s += a[i][j]
+    return s
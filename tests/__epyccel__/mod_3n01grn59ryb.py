@@ -0,0 +1,7 @@
+from pyccel.decorators import parallel_arrays
+
+@parallel_arrays(threshold = 100)
+def parallel_array_expressions(c : 'float[::,::]', a : 'float[::,::]', b : 'float[::]', d : 'float'):
+    c[::,::] = a * b + d
+    c[1::,::] = c[1::,::] - a[1::,::]
+
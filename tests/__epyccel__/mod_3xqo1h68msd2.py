@@ -0,0 +1,3 @@
+def dict_init():
+    a = {1:1.0, 2:2.0}
+    return a
@@ -0,0 +1,15 @@
+def array_kwargs_ones():
+    """ ones(shape, dtype=float, order='C')
+    """
+
+    from numpy import sum as np_sum
+    from numpy import ones
+
+    n = 4
+
+    a = ones((n, n-1), 'float', 'C')
+    b = ones((n+1, 2*n), float, order='F')
+    c = ones((1, n), complex)
+    d = ones(dtype=int, shape=2+n)
+
+    return np_sum(a) + np_sum(b) + np_sum(c) + np_sum(d)
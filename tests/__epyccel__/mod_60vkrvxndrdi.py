@@ -0,0 +1,6 @@
+def f():
+    a = [1,2,3,4]
+    b = [a]
+    b[0][0] = 5
+    b[0][2] = 6
+    return a[0], a[1], a[2], a[3]
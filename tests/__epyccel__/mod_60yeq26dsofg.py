@@ -0,0 +1,5 @@
+def fused_temporaries_2d(x : 'float[:,:]', y : 'float[:,:]', z : 'float[:,:]'):
+    t = x * y
+    u = t - 1.0
+    z[:,:] = u * t
+    return u.sum()
@@ -0,0 +1,4 @@
+def arr_arange_1():
+    import numpy as np
+    a = np.arange(6)
+    return np.shape(a)[0], a[0], a[-1]
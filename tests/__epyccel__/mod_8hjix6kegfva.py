@@ -0,0 +1,2 @@
+def array_int32_2d_F_scalar_idiv(x : 'int32[:,:](order=F)', a : 'int32'):
+    x[:,:] = x // a
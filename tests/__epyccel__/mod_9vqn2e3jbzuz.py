@@ -0,0 +1,2 @@
+def array_float_1d_div(x : 'float[:]', y : 'float[:]'):
+    x[:] /= y
@@ -0,0 +1,4 @@
+def arr_arange_2():
+    import numpy as np
+    a = np.arange(1, 7)
+    return np.shape(a)[0], a[0], a[-1]
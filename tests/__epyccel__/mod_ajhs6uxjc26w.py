@@ -0,0 +1,4 @@
+def fused_augmented_temporary(a : 'float[:]', b : 'float[:]'):
+    t = a * 2.0
+    t += b
+    a[:] = t - b
@@ -0,0 +1,9 @@
+@allow_negative_index('a')
+def var_negative_index(n : 'int', idx : 'int'):
+    import numpy as np
+    a = np.empty(n, dtype=int)
+
+    for i in range(n):
+        a[i] = i
+
+    return a[idx]
@@ -0,0 +1,2 @@
+def array_int32_2d_C_scalar_idiv(x : 'int32[:,:]', a : 'int32'):
+    x[:,:] = x // a
@@ -0,0 +1,2 @@
+def array_int_2d_C_scalar_sub(x : 'int[:,:]', a : 'int'):
+    x[:,:] -= a
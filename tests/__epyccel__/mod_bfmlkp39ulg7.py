@@ -0,0 +1,4 @@
+def arr_arange_5():
+    import numpy as np
+    a = np.arange(20, 2.2, -2)
+    return np.shape(a)[0], a[0], a[-1]
@@ -0,0 +1,2 @@
+def array_int_2d_F_scalar_sub(x : 'int[:,:](order=F)', a : 'int'):
+    x[:,:] -= a
@@ -0,0 +1,4 @@
+def array_float_nested_F_array_initialization_2(a : 'float[:,:,:]', e : 'float[:,:]', f : 'float[:]', x : 'float[:,:,:,:](order=F)'):
+    from numpy import array
+    tmp      = array(((e, (f, f)), a, ((f, f), (f, f))), dtype='float', order="F")
+    x[:,:,:,:] = tmp[:,:,:,:]
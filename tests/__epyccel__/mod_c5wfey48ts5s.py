@@ -0,0 +1,4 @@
+def array_2d_F_slice_stride_9(a : 'int[:,:](order=F)'):
+    import numpy as np
+    b = a[::-2, ::2]
+    return np.sum(b), b[0][0], b[-1][-1], len(b), len(b[0])
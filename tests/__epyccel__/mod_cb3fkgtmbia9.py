@@ -0,0 +1,2 @@
+def array_int_2d_F_add(x : 'int[:,:](order=F)', y : 'int[:,:](order=F)'):
+    x[:,:] += y
@@ -0,0 +1,4 @@
+def array_float_nested_F_array_initialization_mixed(x : 'float[:,:,:](order=F)', y : 'float[:,:](order=F)', z : 'float[:,:](order=F)', a : 'float[:,:,:,:](order=F)'):
+    from numpy import array
+    tmp      = array((x, (y, z, z), x), dtype='float', order="F")
+    a[:,:,:,:] = tmp[:,:,:,:]
@@ -0,0 +1,4 @@
+def array_int_2d_C_initialization(a : 'int[:,:]'):
+    from numpy import array
+    tmp = array([[1, 2, 3], [4, 5, 6]])
+    a[:,:] = tmp[:,:]
@@ -0,0 +1,4 @@
+def array_float_2d_C_complex_3d_expr(x : 'float[:,:]', y : 'float[:,:]'):
+    from numpy import full
+    z = full((2,3),5)
+    x[:] = (x // y) * x + z
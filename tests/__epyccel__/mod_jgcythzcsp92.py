@@ -0,0 +1,6 @@
+def arrs_similar_shapes_1():
+    import numpy as np
+    i = 4
+    a = np.zeros(10)
+    b = a[2:i]+a[4:i + 2]
+    return np.shape(b)[0]
@@ -0,0 +1,3 @@
+def array_float_2d_2d_matmul_expression(A : 'float[:,:]', B : 'float[:,:]', C : 'float[:,:]', out : 'float[:,:]'):
+    out[:,:] = 2.0 * (A.T @ B) + C
+    out[:,:] += (A.T @ B) @ (C + 1.0)
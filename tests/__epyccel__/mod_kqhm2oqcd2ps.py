@@ -0,0 +1,2 @@
+def array_float_1d_mul(x : 'float[:]', y : 'float[:]'):
+    x[:] *= y
@@ -0,0 +1,2 @@
+def multi_layer_index(x : 'int[:]', start : int, stop : int, step : int, idx : int):
+    return x[start:stop:step][idx]
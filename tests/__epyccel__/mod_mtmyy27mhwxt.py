@@ -0,0 +1,2 @@
+def array_int_1d_scalar_mul(x : 'int[:]', a : 'int'):
+    x[:] *= a
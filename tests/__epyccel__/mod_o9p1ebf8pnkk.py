@@ -0,0 +1,8 @@
+def constant_negative_index(n : 'int'):
+    import numpy as np
+    a = np.empty(n, dtype=int)
+
+    for i in range(n):
+        a[i] = i
+
+    return a[-1], a[-2]
@@ -0,0 +1,2 @@
+def array_float_2d_1d_matmul_transpose(A : 'float[:,:]', x : 'float[:]', out : 'float[:]'):
+    out[:] = A.T @ x
@@ -0,0 +1,4 @@
+def arr_arange_6():
+    import numpy as np
+    a = np.arange(20, 1, -1.1)
+    return np.shape(a)[0], a[0], a[-1]
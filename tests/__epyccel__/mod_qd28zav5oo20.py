@@ -0,0 +1,6 @@
+def arrs_1d_int64_index():
+    import numpy as np
+    i = np.int64(1)
+    a = np.ones(10)
+    b = a[i] + a[i + 2]
+    return b
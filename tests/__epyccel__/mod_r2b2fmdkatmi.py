@@ -0,0 +1,5 @@
+@template('T', ['int[:]', 'int[:,:]', 'int[:,:,:]', 'int[:,:](order=F)', 'int[:,:,:](order=F)'])
+def array_ndmin_1(x : 'T'):
+    from numpy import array
+    y = array(x, ndmin=1)
+    return y
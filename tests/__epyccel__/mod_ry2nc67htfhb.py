@@ -0,0 +1,3 @@
+def array_float_2d_2d_matmul_transpose(A : 'float[:,:]', B : 'float[:,:]', C : 'float[:,:]', out1 : 'float[:,:]', out2 : 'float[:,:]'):
+    out1[:,:] = A.T @ B
+    out2[:,:] = C.T @ A.T
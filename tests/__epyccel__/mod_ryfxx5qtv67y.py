@@ -0,0 +1,2 @@
+def array_int32_1d_scalar_sub(x : 'int32[:]', a : 'int32'):
+    x[:] -= a
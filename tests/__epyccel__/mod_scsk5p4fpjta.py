@@ -0,0 +1,7 @@
+from numpy import int32
+
+def set_num_threads(n : 'int'):
+    from numpy import int32
+    from pyccel.stdlib.internal.openmp import omp_set_num_threads
+    omp_set_num_threads(int32(n))
+
@@ -0,0 +1,7 @@
+@parallel_arrays(threshold = 100)
+def parallel_array_constructors(a : 'float[:]'):
+    import numpy as np
+    c = np.linspace(0., 1., len(a))
+    d = np.arange(len(a)) + a
+    c[:] = c + a * 2.0
+    return c[0], c[len(a)-1], d[len(a)-1]
@@ -0,0 +1,6 @@
+@template(name='T' , types=['int', 'int8', 'int16', 'int32', 'int64', 'float',
+                            'float32', 'float64', 'complex64', 'complex128'])
+def array_return_first_element(a : 'T', b : 'T'):
+    from numpy import array
+    x = array([a,b])
+    return x[0]
@@ -0,0 +1,5 @@
+@allow_negative_index('a')
+def test_argument_negative_index_1(a : 'int[:]'):
+    c = -2
+    d = 5
+    return a[c], a[d]
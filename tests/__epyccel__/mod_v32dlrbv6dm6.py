@@ -0,0 +1,6 @@
+def arrs_different_shapes_0():
+    import numpy as np
+    i = 5
+    a = np.zeros(10)
+    b = a[2:4]+a[4:i]
+    return np.shape(b)[0]
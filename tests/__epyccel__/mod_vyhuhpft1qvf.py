@@ -0,0 +1,5 @@
+def arrs_1d_negative_index_2():
+    import numpy as np
+    a = np.ones(10)
+    b = a[1:-1] + a[2:]
+    return np.shape(b)[0], np.sum(b)
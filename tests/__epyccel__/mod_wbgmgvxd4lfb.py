@@ -0,0 +1,2 @@
+def array_float_2d_C_div(x : 'float[:,:]', y : 'float[:,:]'):
+    x[:,:] /= y
@@ -0,0 +1,4 @@
+def array_float_3d_F_array_initialization_1(x : 'float[:,:](order=F)', y : 'float[:,:](order=F)', a : 'float[:,:,:](order=F)'):
+    from numpy import array
+    tmp      = array([x, y], dtype='float', order='F')
+    a[:,:,:] = tmp[:,:,:]
@@ -0,0 +1,4 @@
+def array_float_4d_C_array_initialization(x : 'float[:,:,:]', y : 'float[:,:,:]', a : 'float[:,:,:,:]'):
+    from numpy import array
+    tmp      = array([x, y], dtype='float')
+    a[:,:,:,:] = tmp[:,:,:,:]
@@ -0,0 +1,11 @@
+@stack_array('a')
+@stack_array('b', 'c')
+def multiple_stack_array_2():
+    from numpy import ones, array
+    a = ones(5)
+    b = array([2, 4, 6, 8, 10])
+    c = array([1, 3, 5, 7, 9])
+    s = 0.0
+    for i in range(5):
+        s = s + b[i] - a[i] / c[i]
+    return s
@@ -0,0 +1,22 @@
+module bind_c_mod_03sv1gsbzng6
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_03sv1gsbzng6
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_combined_for_simd() bind(c) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+
+    func_result = combined_for_simd()
+
+  end function bind_c_combined_for_simd
+  !........................................
+
+end module bind_c_mod_03sv1gsbzng6
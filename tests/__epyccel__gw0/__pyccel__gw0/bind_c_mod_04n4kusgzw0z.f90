@@ -0,0 +1,54 @@
+module bind_c_mod_04n4kusgzw0z
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , c_ptr , f64 => &
+        C_DOUBLE , i64 => C_INT64_T
+  use mod_04n4kusgzw0z
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_omp_matmul(bound_A, bound_A_shape_1, bound_A_shape_2 &
+        , bound_A_stride_1, bound_A_stride_2, bound_x, bound_x_shape_1, &
+        bound_x_shape_2, bound_x_stride_1, bound_x_stride_2, bound_out, &
+        bound_out_shape_1, bound_out_shape_2, bound_out_stride_1, &
+        bound_out_stride_2) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_A
+    integer(i64), value :: bound_A_shape_1
+    integer(i64), value :: bound_A_shape_2
+    integer(i64), value :: bound_A_stride_1
+    integer(i64), value :: bound_A_stride_2
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_shape_2
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: bound_x_stride_2
+    type(c_ptr), value :: bound_out
+    integer(i64), value :: bound_out_shape_1
+    integer(i64), value :: bound_out_shape_2
+    integer(i64), value :: bound_out_stride_1
+    integer(i64), value :: bound_out_stride_2
+    real(f64), pointer :: A(:, :)
+    real(f64), pointer :: x(:, :)
+    real(f64), pointer :: out(:, :)
+
+    call C_F_Pointer(bound_A, A, [bound_A_stride_1,bound_A_shape_1])
+    call C_F_Pointer(bound_x, x, [bound_x_stride_1,bound_x_shape_1])
+    call C_F_Pointer(bound_out, out, [bound_out_stride_1, &
+          bound_out_shape_1])
+    call omp_matmul(A = A(1_i64:bound_A_shape_2 * bound_A_stride_2 + &
+          1_i64 - 1_i64:bound_A_stride_2, 1_i64:bound_A_shape_1 + 1_i64 &
+          - 1_i64), x = x(1_i64:bound_x_shape_2 * bound_x_stride_2 + &
+          1_i64 - 1_i64:bound_x_stride_2, 1_i64:bound_x_shape_1 + 1_i64 &
+          - 1_i64), out = out(1_i64:bound_out_shape_2 * &
+          bound_out_stride_2 + 1_i64 - 1_i64:bound_out_stride_2, 1_i64: &
+          bound_out_shape_1 + 1_i64 - 1_i64))
+
+  end subroutine bind_c_omp_matmul
+  !........................................
+
+end module bind_c_mod_04n4kusgzw0z
@@ -0,0 +1,22 @@
+module bind_c_mod_0hzgq3wu36hf
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_0hzgq3wu36hf
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f() bind(c) result(a)
+
+    implicit none
+
+    integer(i64) :: a
+
+    a = f()
+
+  end function bind_c_f
+  !........................................
+
+end module bind_c_mod_0hzgq3wu36hf
@@ -0,0 +1,571 @@
+module bind_c_mod_0s7h8jyg7yxj
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i16 => &
+        C_INT16_T , i32 => C_INT32_T , f64 => C_DOUBLE , C_F_Pointer , &
+        i8 => C_INT8_T , c32 => C_FLOAT_COMPLEX , i64 => C_INT64_T , &
+        f32 => C_FLOAT , c64 => C_DOUBLE_COMPLEX , c_ptr
+  use mod_0s7h8jyg7yxj
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0000( &
+        bound_arr1, bound_arr1_shape_1, bound_arr1_shape_2, &
+        bound_arr1_stride_1, bound_arr1_stride_2, bound_arr2, &
+        bound_arr2_shape_1, bound_arr2_shape_2, bound_arr2_stride_1, &
+        bound_arr2_stride_2, bound_arr3, bound_arr3_shape_1, &
+        bound_arr3_shape_2, bound_arr3_stride_1, bound_arr3_stride_2, &
+        Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, Out_0006, &
+        Out_0007, Out_0008, Out_0009) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    complex(c32), intent(out) :: Out_0004
+    complex(c32), intent(out) :: Out_0005
+    complex(c32), intent(out) :: Out_0006
+    complex(c32), intent(out) :: Out_0007
+    complex(c32), intent(out) :: Out_0008
+    complex(c32), intent(out) :: Out_0009
+    type(c_ptr), value :: bound_arr1
+    integer(i64), value :: bound_arr1_shape_1
+    integer(i64), value :: bound_arr1_shape_2
+    integer(i64), value :: bound_arr1_stride_1
+    integer(i64), value :: bound_arr1_stride_2
+    type(c_ptr), value :: bound_arr2
+    integer(i64), value :: bound_arr2_shape_1
+    integer(i64), value :: bound_arr2_shape_2
+    integer(i64), value :: bound_arr2_stride_1
+    integer(i64), value :: bound_arr2_stride_2
+    type(c_ptr), value :: bound_arr3
+    integer(i64), value :: bound_arr3_shape_1
+    integer(i64), value :: bound_arr3_shape_2
+    integer(i64), value :: bound_arr3_stride_1
+    integer(i64), value :: bound_arr3_stride_2
+    logical(b1), pointer :: arr1(:, :)
+    logical(b1), pointer :: arr2(:, :)
+    logical(b1), pointer :: arr3(:, :)
+
+    call C_F_Pointer(bound_arr1, arr1, [bound_arr1_stride_1, &
+          bound_arr1_shape_1])
+    call C_F_Pointer(bound_arr2, arr2, [bound_arr2_stride_1, &
+          bound_arr2_shape_1])
+    call C_F_Pointer(bound_arr3, arr3, [bound_arr3_stride_1, &
+          bound_arr3_shape_1])
+    call src_dest_diff_sizes_dtype_convert_to_cfloat_0000(arr1 = arr1( &
+          1_i64:bound_arr1_shape_2 * bound_arr1_stride_2 + 1_i64 - &
+          1_i64:bound_arr1_stride_2, 1_i64:bound_arr1_shape_1 + 1_i64 - &
+          1_i64), arr2 = arr2(1_i64:bound_arr2_shape_2 * &
+          bound_arr2_stride_2 + 1_i64 - 1_i64:bound_arr2_stride_2, &
+          1_i64:bound_arr2_shape_1 + 1_i64 - 1_i64), arr3 = arr3(1_i64: &
+          bound_arr3_shape_2 * bound_arr3_stride_2 + 1_i64 - 1_i64: &
+          bound_arr3_stride_2, 1_i64:bound_arr3_shape_1 + 1_i64 - 1_i64 &
+          ), Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006, Out_0007 = Out_0007, Out_0008 = Out_0008, &
+          Out_0009 = Out_0009)
+
+  end subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0000
+  !........................................
+
+  !........................................
+  subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0001( &
+        bound_arr1, bound_arr1_shape_1, bound_arr1_shape_2, &
+        bound_arr1_stride_1, bound_arr1_stride_2, bound_arr2, &
+        bound_arr2_shape_1, bound_arr2_shape_2, bound_arr2_stride_1, &
+        bound_arr2_stride_2, bound_arr3, bound_arr3_shape_1, &
+        bound_arr3_shape_2, bound_arr3_stride_1, bound_arr3_stride_2, &
+        Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, Out_0006, &
+        Out_0007, Out_0008, Out_0009) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    complex(c32), intent(out) :: Out_0004
+    complex(c32), intent(out) :: Out_0005
+    complex(c32), intent(out) :: Out_0006
+    complex(c32), intent(out) :: Out_0007
+    complex(c32), intent(out) :: Out_0008
+    complex(c32), intent(out) :: Out_0009
+    type(c_ptr), value :: bound_arr1
+    integer(i64), value :: bound_arr1_shape_1
+    integer(i64), value :: bound_arr1_shape_2
+    integer(i64), value :: bound_arr1_stride_1
+    integer(i64), value :: bound_arr1_stride_2
+    type(c_ptr), value :: bound_arr2
+    integer(i64), value :: bound_arr2_shape_1
+    integer(i64), value :: bound_arr2_shape_2
+    integer(i64), value :: bound_arr2_stride_1
+    integer(i64), value :: bound_arr2_stride_2
+    type(c_ptr), value :: bound_arr3
+    integer(i64), value :: bound_arr3_shape_1
+    integer(i64), value :: bound_arr3_shape_2
+    integer(i64), value :: bound_arr3_stride_1
+    integer(i64), value :: bound_arr3_stride_2
+    integer(i64), pointer :: arr1(:, :)
+    integer(i64), pointer :: arr2(:, :)
+    integer(i64), pointer :: arr3(:, :)
+
+    call C_F_Pointer(bound_arr1, arr1, [bound_arr1_stride_1, &
+          bound_arr1_shape_1])
+    call C_F_Pointer(bound_arr2, arr2, [bound_arr2_stride_1, &
+          bound_arr2_shape_1])
+    call C_F_Pointer(bound_arr3, arr3, [bound_arr3_stride_1, &
+          bound_arr3_shape_1])
+    call src_dest_diff_sizes_dtype_convert_to_cfloat_0001(arr1 = arr1( &
+          1_i64:bound_arr1_shape_2 * bound_arr1_stride_2 + 1_i64 - &
+          1_i64:bound_arr1_stride_2, 1_i64:bound_arr1_shape_1 + 1_i64 - &
+          1_i64), arr2 = arr2(1_i64:bound_arr2_shape_2 * &
+          bound_arr2_stride_2 + 1_i64 - 1_i64:bound_arr2_stride_2, &
+          1_i64:bound_arr2_shape_1 + 1_i64 - 1_i64), arr3 = arr3(1_i64: &
+          bound_arr3_shape_2 * bound_arr3_stride_2 + 1_i64 - 1_i64: &
+          bound_arr3_stride_2, 1_i64:bound_arr3_shape_1 + 1_i64 - 1_i64 &
+          ), Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006, Out_0007 = Out_0007, Out_0008 = Out_0008, &
+          Out_0009 = Out_0009)
+
+  end subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0001
+  !........................................
+
+  !........................................
+  subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0002( &
+        bound_arr1, bound_arr1_shape_1, bound_arr1_shape_2, &
+        bound_arr1_stride_1, bound_arr1_stride_2, bound_arr2, &
+        bound_arr2_shape_1, bound_arr2_shape_2, bound_arr2_stride_1, &
+        bound_arr2_stride_2, bound_arr3, bound_arr3_shape_1, &
+        bound_arr3_shape_2, bound_arr3_stride_1, bound_arr3_stride_2, &
+        Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, Out_0006, &
+        Out_0007, Out_0008, Out_0009) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    complex(c32), intent(out) :: Out_0004
+    complex(c32), intent(out) :: Out_0005
+    complex(c32), intent(out) :: Out_0006
+    complex(c32), intent(out) :: Out_0007
+    complex(c32), intent(out) :: Out_0008
+    complex(c32), intent(out) :: Out_0009
+    type(c_ptr), value :: bound_arr1
+    integer(i64), value :: bound_arr1_shape_1
+    integer(i64), value :: bound_arr1_shape_2
+    integer(i64), value :: bound_arr1_stride_1
+    integer(i64), value :: bound_arr1_stride_2
+    type(c_ptr), value :: bound_arr2
+    integer(i64), value :: bound_arr2_shape_1
+    integer(i64), value :: bound_arr2_shape_2
+    integer(i64), value :: bound_arr2_stride_1
+    integer(i64), value :: bound_arr2_stride_2
+    type(c_ptr), value :: bound_arr3
+    integer(i64), value :: bound_arr3_shape_1
+    integer(i64), value :: bound_arr3_shape_2
+    integer(i64), value :: bound_arr3_stride_1
+    integer(i64), value :: bound_arr3_stride_2
+    integer(i8), pointer :: arr1(:, :)
+    integer(i8), pointer :: arr2(:, :)
+    integer(i8), pointer :: arr3(:, :)
+
+    call C_F_Pointer(bound_arr1, arr1, [bound_arr1_stride_1, &
+          bound_arr1_shape_1])
+    call C_F_Pointer(bound_arr2, arr2, [bound_arr2_stride_1, &
+          bound_arr2_shape_1])
+    call C_F_Pointer(bound_arr3, arr3, [bound_arr3_stride_1, &
+          bound_arr3_shape_1])
+    call src_dest_diff_sizes_dtype_convert_to_cfloat_0002(arr1 = arr1( &
+          1_i64:bound_arr1_shape_2 * bound_arr1_stride_2 + 1_i64 - &
+          1_i64:bound_arr1_stride_2, 1_i64:bound_arr1_shape_1 + 1_i64 - &
+          1_i64), arr2 = arr2(1_i64:bound_arr2_shape_2 * &
+          bound_arr2_stride_2 + 1_i64 - 1_i64:bound_arr2_stride_2, &
+          1_i64:bound_arr2_shape_1 + 1_i64 - 1_i64), arr3 = arr3(1_i64: &
+          bound_arr3_shape_2 * bound_arr3_stride_2 + 1_i64 - 1_i64: &
+          bound_arr3_stride_2, 1_i64:bound_arr3_shape_1 + 1_i64 - 1_i64 &
+          ), Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006, Out_0007 = Out_0007, Out_0008 = Out_0008, &
+          Out_0009 = Out_0009)
+
+  end subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0002
+  !........................................
+
+  !........................................
+  subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0003( &
+        bound_arr1, bound_arr1_shape_1, bound_arr1_shape_2, &
+        bound_arr1_stride_1, bound_arr1_stride_2, bound_arr2, &
+        bound_arr2_shape_1, bound_arr2_shape_2, bound_arr2_stride_1, &
+        bound_arr2_stride_2, bound_arr3, bound_arr3_shape_1, &
+        bound_arr3_shape_2, bound_arr3_stride_1, bound_arr3_stride_2, &
+        Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, Out_0006, &
+        Out_0007, Out_0008, Out_0009) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    complex(c32), intent(out) :: Out_0004
+    complex(c32), intent(out) :: Out_0005
+    complex(c32), intent(out) :: Out_0006
+    complex(c32), intent(out) :: Out_0007
+    complex(c32), intent(out) :: Out_0008
+    complex(c32), intent(out) :: Out_0009
+    type(c_ptr), value :: bound_arr1
+    integer(i64), value :: bound_arr1_shape_1
+    integer(i64), value :: bound_arr1_shape_2
+    integer(i64), value :: bound_arr1_stride_1
+    integer(i64), value :: bound_arr1_stride_2
+    type(c_ptr), value :: bound_arr2
+    integer(i64), value :: bound_arr2_shape_1
+    integer(i64), value :: bound_arr2_shape_2
+    integer(i64), value :: bound_arr2_stride_1
+    integer(i64), value :: bound_arr2_stride_2
+    type(c_ptr), value :: bound_arr3
+    integer(i64), value :: bound_arr3_shape_1
+    integer(i64), value :: bound_arr3_shape_2
+    integer(i64), value :: bound_arr3_stride_1
+    integer(i64), value :: bound_arr3_stride_2
+    integer(i16), pointer :: arr1(:, :)
+    integer(i16), pointer :: arr2(:, :)
+    integer(i16), pointer :: arr3(:, :)
+
+    call C_F_Pointer(bound_arr1, arr1, [bound_arr1_stride_1, &
+          bound_arr1_shape_1])
+    call C_F_Pointer(bound_arr2, arr2, [bound_arr2_stride_1, &
+          bound_arr2_shape_1])
+    call C_F_Pointer(bound_arr3, arr3, [bound_arr3_stride_1, &
+          bound_arr3_shape_1])
+    call src_dest_diff_sizes_dtype_convert_to_cfloat_0003(arr1 = arr1( &
+          1_i64:bound_arr1_shape_2 * bound_arr1_stride_2 + 1_i64 - &
+          1_i64:bound_arr1_stride_2, 1_i64:bound_arr1_shape_1 + 1_i64 - &
+          1_i64), arr2 = arr2(1_i64:bound_arr2_shape_2 * &
+          bound_arr2_stride_2 + 1_i64 - 1_i64:bound_arr2_stride_2, &
+          1_i64:bound_arr2_shape_1 + 1_i64 - 1_i64), arr3 = arr3(1_i64: &
+          bound_arr3_shape_2 * bound_arr3_stride_2 + 1_i64 - 1_i64: &
+          bound_arr3_stride_2, 1_i64:bound_arr3_shape_1 + 1_i64 - 1_i64 &
+          ), Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006, Out_0007 = Out_0007, Out_0008 = Out_0008, &
+          Out_0009 = Out_0009)
+
+  end subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0003
+  !........................................
+
+  !........................................
+  subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0004( &
+        bound_arr1, bound_arr1_shape_1, bound_arr1_shape_2, &
+        bound_arr1_stride_1, bound_arr1_stride_2, bound_arr2, &
+        bound_arr2_shape_1, bound_arr2_shape_2, bound_arr2_stride_1, &
+        bound_arr2_stride_2, bound_arr3, bound_arr3_shape_1, &
+        bound_arr3_shape_2, bound_arr3_stride_1, bound_arr3_stride_2, &
+        Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, Out_0006, &
+        Out_0007, Out_0008, Out_0009) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    complex(c32), intent(out) :: Out_0004
+    complex(c32), intent(out) :: Out_0005
+    complex(c32), intent(out) :: Out_0006
+    complex(c32), intent(out) :: Out_0007
+    complex(c32), intent(out) :: Out_0008
+    complex(c32), intent(out) :: Out_0009
+    type(c_ptr), value :: bound_arr1
+    integer(i64), value :: bound_arr1_shape_1
+    integer(i64), value :: bound_arr1_shape_2
+    integer(i64), value :: bound_arr1_stride_1
+    integer(i64), value :: bound_arr1_stride_2
+    type(c_ptr), value :: bound_arr2
+    integer(i64), value :: bound_arr2_shape_1
+    integer(i64), value :: bound_arr2_shape_2
+    integer(i64), value :: bound_arr2_stride_1
+    integer(i64), value :: bound_arr2_stride_2
+    type(c_ptr), value :: bound_arr3
+    integer(i64), value :: bound_arr3_shape_1
+    integer(i64), value :: bound_arr3_shape_2
+    integer(i64), value :: bound_arr3_stride_1
+    integer(i64), value :: bound_arr3_stride_2
+    integer(i32), pointer :: arr1(:, :)
+    integer(i32), pointer :: arr2(:, :)
+    integer(i32), pointer :: arr3(:, :)
+
+    call C_F_Pointer(bound_arr1, arr1, [bound_arr1_stride_1, &
+          bound_arr1_shape_1])
+    call C_F_Pointer(bound_arr2, arr2, [bound_arr2_stride_1, &
+          bound_arr2_shape_1])
+    call C_F_Pointer(bound_arr3, arr3, [bound_arr3_stride_1, &
+          bound_arr3_shape_1])
+    call src_dest_diff_sizes_dtype_convert_to_cfloat_0004(arr1 = arr1( &
+          1_i64:bound_arr1_shape_2 * bound_arr1_stride_2 + 1_i64 - &
+          1_i64:bound_arr1_stride_2, 1_i64:bound_arr1_shape_1 + 1_i64 - &
+          1_i64), arr2 = arr2(1_i64:bound_arr2_shape_2 * &
+          bound_arr2_stride_2 + 1_i64 - 1_i64:bound_arr2_stride_2, &
+          1_i64:bound_arr2_shape_1 + 1_i64 - 1_i64), arr3 = arr3(1_i64: &
+          bound_arr3_shape_2 * bound_arr3_stride_2 + 1_i64 - 1_i64: &
+          bound_arr3_stride_2, 1_i64:bound_arr3_shape_1 + 1_i64 - 1_i64 &
+          ), Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006, Out_0007 = Out_0007, Out_0008 = Out_0008, &
+          Out_0009 = Out_0009)
+
+  end subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0004
+  !........................................
+
+  !........................................
+  subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0005( &
+        bound_arr1, bound_arr1_shape_1, bound_arr1_shape_2, &
+        bound_arr1_stride_1, bound_arr1_stride_2, bound_arr2, &
+        bound_arr2_shape_1, bound_arr2_shape_2, bound_arr2_stride_1, &
+        bound_arr2_stride_2, bound_arr3, bound_arr3_shape_1, &
+        bound_arr3_shape_2, bound_arr3_stride_1, bound_arr3_stride_2, &
+        Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, Out_0006, &
+        Out_0007, Out_0008, Out_0009) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    complex(c32), intent(out) :: Out_0004
+    complex(c32), intent(out) :: Out_0005
+    complex(c32), intent(out) :: Out_0006
+    complex(c32), intent(out) :: Out_0007
+    complex(c32), intent(out) :: Out_0008
+    complex(c32), intent(out) :: Out_0009
+    type(c_ptr), value :: bound_arr1
+    integer(i64), value :: bound_arr1_shape_1
+    integer(i64), value :: bound_arr1_shape_2
+    integer(i64), value :: bound_arr1_stride_1
+    integer(i64), value :: bound_arr1_stride_2
+    type(c_ptr), value :: bound_arr2
+    integer(i64), value :: bound_arr2_shape_1
+    integer(i64), value :: bound_arr2_shape_2
+    integer(i64), value :: bound_arr2_stride_1
+    integer(i64), value :: bound_arr2_stride_2
+    type(c_ptr), value :: bound_arr3
+    integer(i64), value :: bound_arr3_shape_1
+    integer(i64), value :: bound_arr3_shape_2
+    integer(i64), value :: bound_arr3_stride_1
+    integer(i64), value :: bound_arr3_stride_2
+    real(f64), pointer :: arr1(:, :)
+    real(f64), pointer :: arr2(:, :)
+    real(f64), pointer :: arr3(:, :)
+
+    call C_F_Pointer(bound_arr1, arr1, [bound_arr1_stride_1, &
+          bound_arr1_shape_1])
+    call C_F_Pointer(bound_arr2, arr2, [bound_arr2_stride_1, &
+          bound_arr2_shape_1])
+    call C_F_Pointer(bound_arr3, arr3, [bound_arr3_stride_1, &
+          bound_arr3_shape_1])
+    call src_dest_diff_sizes_dtype_convert_to_cfloat_0005(arr1 = arr1( &
+          1_i64:bound_arr1_shape_2 * bound_arr1_stride_2 + 1_i64 - &
+          1_i64:bound_arr1_stride_2, 1_i64:bound_arr1_shape_1 + 1_i64 - &
+          1_i64), arr2 = arr2(1_i64:bound_arr2_shape_2 * &
+          bound_arr2_stride_2 + 1_i64 - 1_i64:bound_arr2_stride_2, &
+          1_i64:bound_arr2_shape_1 + 1_i64 - 1_i64), arr3 = arr3(1_i64: &
+          bound_arr3_shape_2 * bound_arr3_stride_2 + 1_i64 - 1_i64: &
+          bound_arr3_stride_2, 1_i64:bound_arr3_shape_1 + 1_i64 - 1_i64 &
+          ), Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006, Out_0007 = Out_0007, Out_0008 = Out_0008, &
+          Out_0009 = Out_0009)
+
+  end subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0005
+  !........................................
+
+  !........................................
+  subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0006( &
+        bound_arr1, bound_arr1_shape_1, bound_arr1_shape_2, &
+        bound_arr1_stride_1, bound_arr1_stride_2, bound_arr2, &
+        bound_arr2_shape_1, bound_arr2_shape_2, bound_arr2_stride_1, &
+        bound_arr2_stride_2, bound_arr3, bound_arr3_shape_1, &
+        bound_arr3_shape_2, bound_arr3_stride_1, bound_arr3_stride_2, &
+        Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, Out_0006, &
+        Out_0007, Out_0008, Out_0009) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    complex(c32), intent(out) :: Out_0004
+    complex(c32), intent(out) :: Out_0005
+    complex(c32), intent(out) :: Out_0006
+    complex(c32), intent(out) :: Out_0007
+    complex(c32), intent(out) :: Out_0008
+    complex(c32), intent(out) :: Out_0009
+    type(c_ptr), value :: bound_arr1
+    integer(i64), value :: bound_arr1_shape_1
+    integer(i64), value :: bound_arr1_shape_2
+    integer(i64), value :: bound_arr1_stride_1
+    integer(i64), value :: bound_arr1_stride_2
+    type(c_ptr), value :: bound_arr2
+    integer(i64), value :: bound_arr2_shape_1
+    integer(i64), value :: bound_arr2_shape_2
+    integer(i64), value :: bound_arr2_stride_1
+    integer(i64), value :: bound_arr2_stride_2
+    type(c_ptr), value :: bound_arr3
+    integer(i64), value :: bound_arr3_shape_1
+    integer(i64), value :: bound_arr3_shape_2
+    integer(i64), value :: bound_arr3_stride_1
+    integer(i64), value :: bound_arr3_stride_2
+    real(f32), pointer :: arr1(:, :)
+    real(f32), pointer :: arr2(:, :)
+    real(f32), pointer :: arr3(:, :)
+
+    call C_F_Pointer(bound_arr1, arr1, [bound_arr1_stride_1, &
+          bound_arr1_shape_1])
+    call C_F_Pointer(bound_arr2, arr2, [bound_arr2_stride_1, &
+          bound_arr2_shape_1])
+    call C_F_Pointer(bound_arr3, arr3, [bound_arr3_stride_1, &
+          bound_arr3_shape_1])
+    call src_dest_diff_sizes_dtype_convert_to_cfloat_0006(arr1 = arr1( &
+          1_i64:bound_arr1_shape_2 * bound_arr1_stride_2 + 1_i64 - &
+          1_i64:bound_arr1_stride_2, 1_i64:bound_arr1_shape_1 + 1_i64 - &
+          1_i64), arr2 = arr2(1_i64:bound_arr2_shape_2 * &
+          bound_arr2_stride_2 + 1_i64 - 1_i64:bound_arr2_stride_2, &
+          1_i64:bound_arr2_shape_1 + 1_i64 - 1_i64), arr3 = arr3(1_i64: &
+          bound_arr3_shape_2 * bound_arr3_stride_2 + 1_i64 - 1_i64: &
+          bound_arr3_stride_2, 1_i64:bound_arr3_shape_1 + 1_i64 - 1_i64 &
+          ), Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006, Out_0007 = Out_0007, Out_0008 = Out_0008, &
+          Out_0009 = Out_0009)
+
+  end subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0006
+  !........................................
+
+  !........................................
+  subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0007( &
+        bound_arr1, bound_arr1_shape_1, bound_arr1_shape_2, &
+        bound_arr1_stride_1, bound_arr1_stride_2, bound_arr2, &
+        bound_arr2_shape_1, bound_arr2_shape_2, bound_arr2_stride_1, &
+        bound_arr2_stride_2, bound_arr3, bound_arr3_shape_1, &
+        bound_arr3_shape_2, bound_arr3_stride_1, bound_arr3_stride_2, &
+        Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, Out_0006, &
+        Out_0007, Out_0008, Out_0009) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    complex(c32), intent(out) :: Out_0004
+    complex(c32), intent(out) :: Out_0005
+    complex(c32), intent(out) :: Out_0006
+    complex(c32), intent(out) :: Out_0007
+    complex(c32), intent(out) :: Out_0008
+    complex(c32), intent(out) :: Out_0009
+    type(c_ptr), value :: bound_arr1
+    integer(i64), value :: bound_arr1_shape_1
+    integer(i64), value :: bound_arr1_shape_2
+    integer(i64), value :: bound_arr1_stride_1
+    integer(i64), value :: bound_arr1_stride_2
+    type(c_ptr), value :: bound_arr2
+    integer(i64), value :: bound_arr2_shape_1
+    integer(i64), value :: bound_arr2_shape_2
+    integer(i64), value :: bound_arr2_stride_1
+    integer(i64), value :: bound_arr2_stride_2
+    type(c_ptr), value :: bound_arr3
+    integer(i64), value :: bound_arr3_shape_1
+    integer(i64), value :: bound_arr3_shape_2
+    integer(i64), value :: bound_arr3_stride_1
+    integer(i64), value :: bound_arr3_stride_2
+    complex(c32), pointer :: arr1(:, :)
+    complex(c32), pointer :: arr2(:, :)
+    complex(c32), pointer :: arr3(:, :)
+
+    call C_F_Pointer(bound_arr1, arr1, [bound_arr1_stride_1, &
+          bound_arr1_shape_1])
+    call C_F_Pointer(bound_arr2, arr2, [bound_arr2_stride_1, &
+          bound_arr2_shape_1])
+    call C_F_Pointer(bound_arr3, arr3, [bound_arr3_stride_1, &
+          bound_arr3_shape_1])
+    call src_dest_diff_sizes_dtype_convert_to_cfloat_0007(arr1 = arr1( &
+          1_i64:bound_arr1_shape_2 * bound_arr1_stride_2 + 1_i64 - &
+          1_i64:bound_arr1_stride_2, 1_i64:bound_arr1_shape_1 + 1_i64 - &
+          1_i64), arr2 = arr2(1_i64:bound_arr2_shape_2 * &
+          bound_arr2_stride_2 + 1_i64 - 1_i64:bound_arr2_stride_2, &
+          1_i64:bound_arr2_shape_1 + 1_i64 - 1_i64), arr3 = arr3(1_i64: &
+          bound_arr3_shape_2 * bound_arr3_stride_2 + 1_i64 - 1_i64: &
+          bound_arr3_stride_2, 1_i64:bound_arr3_shape_1 + 1_i64 - 1_i64 &
+          ), Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006, Out_0007 = Out_0007, Out_0008 = Out_0008, &
+          Out_0009 = Out_0009)
+
+  end subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0007
+  !........................................
+
+  !........................................
+  subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0008( &
+        bound_arr1, bound_arr1_shape_1, bound_arr1_shape_2, &
+        bound_arr1_stride_1, bound_arr1_stride_2, bound_arr2, &
+        bound_arr2_shape_1, bound_arr2_shape_2, bound_arr2_stride_1, &
+        bound_arr2_stride_2, bound_arr3, bound_arr3_shape_1, &
+        bound_arr3_shape_2, bound_arr3_stride_1, bound_arr3_stride_2, &
+        Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, Out_0006, &
+        Out_0007, Out_0008, Out_0009) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    complex(c32), intent(out) :: Out_0004
+    complex(c32), intent(out) :: Out_0005
+    complex(c32), intent(out) :: Out_0006
+    complex(c32), intent(out) :: Out_0007
+    complex(c32), intent(out) :: Out_0008
+    complex(c32), intent(out) :: Out_0009
+    type(c_ptr), value :: bound_arr1
+    integer(i64), value :: bound_arr1_shape_1
+    integer(i64), value :: bound_arr1_shape_2
+    integer(i64), value :: bound_arr1_stride_1
+    integer(i64), value :: bound_arr1_stride_2
+    type(c_ptr), value :: bound_arr2
+    integer(i64), value :: bound_arr2_shape_1
+    integer(i64), value :: bound_arr2_shape_2
+    integer(i64), value :: bound_arr2_stride_1
+    integer(i64), value :: bound_arr2_stride_2
+    type(c_ptr), value :: bound_arr3
+    integer(i64), value :: bound_arr3_shape_1
+    integer(i64), value :: bound_arr3_shape_2
+    integer(i64), value :: bound_arr3_stride_1
+    integer(i64), value :: bound_arr3_stride_2
+    complex(c64), pointer :: arr1(:, :)
+    complex(c64), pointer :: arr2(:, :)
+    complex(c64), pointer :: arr3(:, :)
+
+    call C_F_Pointer(bound_arr1, arr1, [bound_arr1_stride_1, &
+          bound_arr1_shape_1])
+    call C_F_Pointer(bound_arr2, arr2, [bound_arr2_stride_1, &
+          bound_arr2_shape_1])
+    call C_F_Pointer(bound_arr3, arr3, [bound_arr3_stride_1, &
+          bound_arr3_shape_1])
+    call src_dest_diff_sizes_dtype_convert_to_cfloat_0008(arr1 = arr1( &
+          1_i64:bound_arr1_shape_2 * bound_arr1_stride_2 + 1_i64 - &
+          1_i64:bound_arr1_stride_2, 1_i64:bound_arr1_shape_1 + 1_i64 - &
+          1_i64), arr2 = arr2(1_i64:bound_arr2_shape_2 * &
+          bound_arr2_stride_2 + 1_i64 - 1_i64:bound_arr2_stride_2, &
+          1_i64:bound_arr2_shape_1 + 1_i64 - 1_i64), arr3 = arr3(1_i64: &
+          bound_arr3_shape_2 * bound_arr3_stride_2 + 1_i64 - 1_i64: &
+          bound_arr3_stride_2, 1_i64:bound_arr3_shape_1 + 1_i64 - 1_i64 &
+          ), Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006, Out_0007 = Out_0007, Out_0008 = Out_0008, &
+          Out_0009 = Out_0009)
+
+  end subroutine bind_c_src_dest_diff_sizes_dtype_convert_to_cfloat_0008
+  !........................................
+
+end module bind_c_mod_0s7h8jyg7yxj
@@ -0,0 +1,22 @@
+module bind_c_mod_0yb573pyi3ov
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+  use mod_0yb573pyi3ov
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f() bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+
+    Out_0001 = f()
+
+  end function bind_c_f
+  !........................................
+
+end module bind_c_mod_0yb573pyi3ov
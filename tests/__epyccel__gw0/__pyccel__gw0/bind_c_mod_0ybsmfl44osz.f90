@@ -0,0 +1,22 @@
+module bind_c_mod_0ybsmfl44osz
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_0ybsmfl44osz
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_p_func(x) bind(c) 
+
+    implicit none
+
+    integer(i64), value :: x
+
+    call p_func(x = x)
+
+  end subroutine bind_c_p_func
+  !........................................
+
+end module bind_c_mod_0ybsmfl44osz
@@ -0,0 +1,43 @@
+module bind_c_mod_114cur7uhkly
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , i64 => &
+        C_INT64_T , c_ptr , C_F_Pointer
+  use mod_114cur7uhkly
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_int32_2d_c_add(bound_x, bound_x_shape_1, &
+        bound_x_shape_2, bound_x_stride_1, bound_x_stride_2, bound_y, &
+        bound_y_shape_1, bound_y_shape_2, bound_y_stride_1, &
+        bound_y_stride_2) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_shape_2
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: bound_x_stride_2
+    type(c_ptr), value :: bound_y
+    integer(i64), value :: bound_y_shape_1
+    integer(i64), value :: bound_y_shape_2
+    integer(i64), value :: bound_y_stride_1
+    integer(i64), value :: bound_y_stride_2
+    integer(i32), pointer :: x(:, :)
+    integer(i32), pointer :: y(:, :)
+
+    call C_F_Pointer(bound_x, x, [bound_x_stride_1,bound_x_shape_1])
+    call C_F_Pointer(bound_y, y, [bound_y_stride_1,bound_y_shape_1])
+    call array_int32_2d_C_add(x = x(1_i64:bound_x_shape_2 * &
+          bound_x_stride_2 + 1_i64 - 1_i64:bound_x_stride_2, 1_i64: &
+          bound_x_shape_1 + 1_i64 - 1_i64), y = y(1_i64:bound_y_shape_2 &
+          * bound_y_stride_2 + 1_i64 - 1_i64:bound_y_stride_2, 1_i64: &
+          bound_y_shape_1 + 1_i64 - 1_i64))
+
+  end subroutine bind_c_array_int32_2d_c_add
+  !........................................
+
+end module bind_c_mod_114cur7uhkly
@@ -0,0 +1,37 @@
+module bind_c_mod_1vvfmfbfz5tc
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use mod_1vvfmfbfz5tc
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_square_0000(a) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: a
+
+    Out_0001 = square_0000(a = a)
+
+  end function bind_c_square_0000
+  !........................................
+
+  !........................................
+  function bind_c_square_0001(a) bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: a
+
+    Out_0001 = square_0001(a = a)
+
+  end function bind_c_square_0001
+  !........................................
+
+end module bind_c_mod_1vvfmfbfz5tc
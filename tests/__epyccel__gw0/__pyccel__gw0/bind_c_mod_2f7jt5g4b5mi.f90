@@ -0,0 +1,25 @@
+module bind_c_mod_2f7jt5g4b5mi
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_2f7jt5g4b5mi
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f(a, b, c, d) bind(c) 
+
+    implicit none
+
+    integer(i64), intent(out) :: a
+    integer(i64), intent(out) :: b
+    integer(i64), intent(out) :: c
+    integer(i64), intent(out) :: d
+
+    call f(a = a, b = b, c = c, d = d)
+
+  end subroutine bind_c_f
+  !........................................
+
+end module bind_c_mod_2f7jt5g4b5mi
@@ -0,0 +1,25 @@
+module bind_c_mod_2jrqhyjdmaaf
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL
+  use mod_2jrqhyjdmaaf
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_dict_contains(Out_0001, Out_0002, Out_0003) bind(c)
+
+    implicit none
+
+    logical(b1), intent(out) :: Out_0001
+    logical(b1), intent(out) :: Out_0002
+    logical(b1), intent(out) :: Out_0003
+
+    call dict_contains(Out_0001 = Out_0001, Out_0002 = Out_0002, &
+          Out_0003 = Out_0003)
+
+  end subroutine bind_c_dict_contains
+  !........................................
+
+end module bind_c_mod_2jrqhyjdmaaf
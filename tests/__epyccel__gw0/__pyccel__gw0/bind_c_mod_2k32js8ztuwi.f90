@@ -0,0 +1,23 @@
+module bind_c_mod_2k32js8ztuwi
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_2k32js8ztuwi
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_random_size(Out_0001, Out_0002) bind(c) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+
+    call array_random_size(Out_0001 = Out_0001, Out_0002 = Out_0002)
+
+  end subroutine bind_c_array_random_size
+  !........................................
+
+end module bind_c_mod_2k32js8ztuwi
@@ -0,0 +1,23 @@
+module bind_c_mod_2lteon2h127t
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_2lteon2h127t
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_iterate_slice(i) bind(c) result(res)
+
+    implicit none
+
+    integer(i64) :: res
+    integer(i64), value :: i
+
+    res = iterate_slice(i = i)
+
+  end function bind_c_iterate_slice
+  !........................................
+
+end module bind_c_mod_2lteon2h127t
@@ -0,0 +1,35 @@
+module bind_c_mod_2xquy637gx49
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , C_F_Pointer &
+        , i32 => C_INT32_T , c_ptr
+  use mod_2xquy637gx49
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_int32_1d_sub(bound_x, bound_x_shape_1, &
+        bound_x_stride_1, bound_y, bound_y_shape_1, bound_y_stride_1) &
+        bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    type(c_ptr), value :: bound_y
+    integer(i64), value :: bound_y_shape_1
+    integer(i64), value :: bound_y_stride_1
+    integer(i32), pointer :: x(:)
+    integer(i32), pointer :: y(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call C_F_Pointer(bound_y, y, [bound_y_shape_1 * bound_y_stride_1])
+    call array_int32_1d_sub(x = x(1_i64::bound_x_stride_1), y = y(1_i64 &
+          ::bound_y_stride_1))
+
+  end subroutine bind_c_array_int32_1d_sub
+  !........................................
+
+end module bind_c_mod_2xquy637gx49
@@ -0,0 +1,26 @@
+module bind_c_mod_3a7kjhbk35f6
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use mod_3a7kjhbk35f6
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_arrs_1d_negative_index_1(Out_0001, Out_0002) bind(c &
+        )
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+
+    call arrs_1d_negative_index_1(Out_0001 = Out_0001, Out_0002 = &
+          Out_0002)
+
+  end subroutine bind_c_arrs_1d_negative_index_1
+  !........................................
+
+end module bind_c_mod_3a7kjhbk35f6
@@ -0,0 +1,23 @@
+module bind_c_mod_3c3nsc0iyv0l
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_3c3nsc0iyv0l
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_test_omp_get_set_schedule() bind(c) result(func_result &
+        )
+
+    implicit none
+
+    integer(i32) :: func_result
+
+    func_result = test_omp_get_set_schedule()
+
+  end function bind_c_test_omp_get_set_schedule
+  !........................................
+
+end module bind_c_mod_3c3nsc0iyv0l
@@ -0,0 +1,22 @@
+module bind_c_mod_3f8uho6auaiy
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_3f8uho6auaiy
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_clear_float() bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+
+    Out_0001 = clear_float()
+
+  end function bind_c_clear_float
+  !........................................
+
+end module bind_c_mod_3f8uho6auaiy
@@ -0,0 +1,22 @@
+module bind_c_mod_4gozq6ldz4ud
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_4gozq6ldz4ud
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_omp_barrier() bind(c) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+
+    func_result = omp_barrier()
+
+  end function bind_c_omp_barrier
+  !........................................
+
+end module bind_c_mod_4gozq6ldz4ud
@@ -0,0 +1,40 @@
+module bind_c_mod_4hbqydjxiw27
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , c_ptr , i64 => &
+        C_INT64_T
+  use mod_4hbqydjxiw27
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_2d_f_slice_stride_17(bound_a, bound_a_shape_1, &
+        bound_a_shape_2, bound_a_stride_1, bound_a_stride_2, Out_0001, &
+        Out_0002, Out_0003, Out_0004, Out_0005) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_shape_2
+    integer(i64), value :: bound_a_stride_1
+    integer(i64), value :: bound_a_stride_2
+    integer(i64), pointer :: a(:, :)
+
+    call C_F_Pointer(bound_a, a, [bound_a_stride_2,bound_a_shape_2])
+    call array_2d_F_slice_stride_17(a = a(1_i64:bound_a_shape_1 * &
+          bound_a_stride_1 + 1_i64 - 1_i64:bound_a_stride_1, 1_i64: &
+          bound_a_shape_2 + 1_i64 - 1_i64), Out_0001 = Out_0001, &
+          Out_0002 = Out_0002, Out_0003 = Out_0003, Out_0004 = Out_0004 &
+          , Out_0005 = Out_0005)
+
+  end subroutine bind_c_array_2d_f_slice_stride_17
+  !........................................
+
+end module bind_c_mod_4hbqydjxiw27
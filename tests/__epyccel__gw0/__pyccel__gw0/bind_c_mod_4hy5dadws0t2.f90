@@ -0,0 +1,27 @@
+module bind_c_mod_4hy5dadws0t2
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use mod_4hy5dadws0t2
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_draw_random(seed, stream, x, y, z) bind(c) 
+
+    implicit none
+
+    real(f64), intent(out) :: x
+    real(f64), intent(out) :: y
+    real(f64), intent(out) :: z
+    integer(i64), value :: seed
+    integer(i64), value :: stream
+
+    call draw_random(seed = seed, stream = stream, x = x, y = y, z = z)
+
+  end subroutine bind_c_draw_random
+  !........................................
+
+end module bind_c_mod_4hy5dadws0t2
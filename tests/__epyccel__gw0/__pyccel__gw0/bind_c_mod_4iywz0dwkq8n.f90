@@ -0,0 +1,22 @@
+module bind_c_mod_4iywz0dwkq8n
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_4iywz0dwkq8n
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_test_omp_get_team_size() bind(c) result(team_size)
+
+    implicit none
+
+    integer(i32) :: team_size
+
+    team_size = test_omp_get_team_size()
+
+  end function bind_c_test_omp_get_team_size
+  !........................................
+
+end module bind_c_mod_4iywz0dwkq8n
@@ -0,0 +1,23 @@
+module bind_c_mod_56q2f05nd4qg
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_56q2f05nd4qg
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_directive_in_else(x) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: x
+
+    Out_0001 = directive_in_else(x = x)
+
+  end function bind_c_directive_in_else
+  !........................................
+
+end module bind_c_mod_56q2f05nd4qg
@@ -0,0 +1,24 @@
+module bind_c_mod_58nf0h8etdfd
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use mod_58nf0h8etdfd
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_dict_iter_local(keys, vals) bind(c) 
+
+    implicit none
+
+    integer(i64), intent(out) :: keys
+    real(f64), intent(out) :: vals
+
+    call dict_iter_local(keys = keys, vals = vals)
+
+  end subroutine bind_c_dict_iter_local
+  !........................................
+
+end module bind_c_mod_58nf0h8etdfd
@@ -0,0 +1,34 @@
+module bind_c_mod_5sb7isnew0ou
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , i64 => C_INT64_T , i32 &
+        => C_INT32_T , C_F_Pointer
+  use mod_5sb7isnew0ou
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_int32_2d_c_scalar_add(bound_x, bound_x_shape_1 &
+        , bound_x_shape_2, bound_x_stride_1, bound_x_stride_2, a) bind( &
+        c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_shape_2
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: bound_x_stride_2
+    integer(i32), value :: a
+    integer(i32), pointer :: x(:, :)
+
+    call C_F_Pointer(bound_x, x, [bound_x_stride_1,bound_x_shape_1])
+    call array_int32_2d_C_scalar_add(x = x(1_i64:bound_x_shape_2 * &
+          bound_x_stride_2 + 1_i64 - 1_i64:bound_x_stride_2, 1_i64: &
+          bound_x_shape_1 + 1_i64 - 1_i64), a = a)
+
+  end subroutine bind_c_array_int32_2d_c_scalar_add
+  !........................................
+
+end module bind_c_mod_5sb7isnew0ou
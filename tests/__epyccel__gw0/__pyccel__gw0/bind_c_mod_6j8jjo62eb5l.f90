@@ -0,0 +1,44 @@
+module bind_c_mod_6j8jjo62eb5l
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c64 => &
+        C_DOUBLE_COMPLEX , c_ptr , c_loc
+  use mod_6j8jjo62eb5l
+  use pyc_tools_f90
+  use Set_complex8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_discard_complex(bound_se, se_shape_1) bind(c) 
+
+    implicit none
+
+    type(c_ptr), intent(out) :: bound_se
+    integer(i64), intent(out) :: se_shape_1
+    type(Set_complex8) :: se
+    complex(c64), pointer :: se_ptr(:)
+    complex(c64) :: Dummy_0000
+    integer(i64) :: Dummy_0001
+    type(Set_complex8_Iterator) :: se_iter
+    type(Set_complex8_Iterator) :: se_last
+
+    call Discard_complex(se = se)
+    se_shape_1 = se % size()
+    allocate(se_ptr(0:se_shape_1 - 1_i64))
+    Dummy_0001 = 0_i64
+    se_iter = se % begin()
+    se_last = se % end()
+    do while (se_iter /= se_last)
+      Dummy_0000 = se_iter % of()
+      se_ptr(Dummy_0001) = Dummy_0000
+      Dummy_0001 = Dummy_0001 + 1_i64
+      call se_iter % next()
+    end do
+    bound_se = c_loc(se_ptr)
+
+  end subroutine bind_c_discard_complex
+  !........................................
+
+end module bind_c_mod_6j8jjo62eb5l
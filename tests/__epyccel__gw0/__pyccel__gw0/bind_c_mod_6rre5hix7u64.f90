@@ -0,0 +1,22 @@
+module bind_c_mod_6rre5hix7u64
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_6rre5hix7u64
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_add_complex() bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+
+    Out_0001 = add_complex()
+
+  end function bind_c_add_complex
+  !........................................
+
+end module bind_c_mod_6rre5hix7u64
@@ -0,0 +1,26 @@
+module bind_c_mod_7axisu4nm65k
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_7axisu4nm65k
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_int_1d_initialization_3(Out_0001, Out_0002, &
+        Out_0003) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+
+    call array_int_1d_initialization_3(Out_0001 = Out_0001, Out_0002 = &
+          Out_0002, Out_0003 = Out_0003)
+
+  end subroutine bind_c_array_int_1d_initialization_3
+  !........................................
+
+end module bind_c_mod_7axisu4nm65k
@@ -0,0 +1,23 @@
+module bind_c_mod_7niu15ord048
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_7niu15ord048
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_test_omp_get_level() bind(c) result( &
+        nested_parallel_regions)
+
+    implicit none
+
+    integer(i32) :: nested_parallel_regions
+
+    nested_parallel_regions = test_omp_get_level()
+
+  end function bind_c_test_omp_get_level
+  !........................................
+
+end module bind_c_mod_7niu15ord048
@@ -0,0 +1,35 @@
+module bind_c_mod_7sr66brb7jdh
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , c_ptr , i64 => &
+        C_INT64_T
+  use mod_7sr66brb7jdh
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_1d_slice_12(bound_a, bound_a_shape_1, &
+        bound_a_stride_1, Out_0001, Out_0002, Out_0003, Out_0004) bind( &
+        c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_stride_1
+    integer(i64), pointer :: a(:)
+
+    call C_F_Pointer(bound_a, a, [bound_a_shape_1 * bound_a_stride_1])
+    call array_1d_slice_12(a = a(1_i64::bound_a_stride_1), Out_0001 = &
+          Out_0001, Out_0002 = Out_0002, Out_0003 = Out_0003, Out_0004 &
+          = Out_0004)
+
+  end subroutine bind_c_array_1d_slice_12
+  !........................................
+
+end module bind_c_mod_7sr66brb7jdh
@@ -0,0 +1,31 @@
+module bind_c_mod_8bi8nhwya3wp
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_8bi8nhwya3wp
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_g(x, y, Out_0001, Out_0002, Out_0003, Out_0004, &
+        Out_0005) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    integer(i64), value :: x
+    integer(i64), value :: y
+
+    call g(x = x, y = y, Out_0001 = Out_0001, Out_0002 = Out_0002, &
+          Out_0003 = Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005 &
+          )
+
+  end subroutine bind_c_g
+  !........................................
+
+end module bind_c_mod_8bi8nhwya3wp
@@ -0,0 +1,22 @@
+module bind_c_mod_8gtxa1vigevw
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_8gtxa1vigevw
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_set_num_threads(n) bind(c) 
+
+    implicit none
+
+    integer(i64), value :: n
+
+    call set_num_threads(n = n)
+
+  end subroutine bind_c_set_num_threads
+  !........................................
+
+end module bind_c_mod_8gtxa1vigevw
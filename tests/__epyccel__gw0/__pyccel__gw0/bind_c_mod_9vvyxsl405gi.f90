@@ -0,0 +1,23 @@
+module bind_c_mod_9vvyxsl405gi
+
+  use, intrinsic :: ISO_C_Binding, only : i16 => C_INT16_T
+  use mod_9vvyxsl405gi
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f16(a) bind(c) result(b)
+
+    implicit none
+
+    integer(i16) :: b
+    integer(i16), value :: a
+
+    b = f16(a = a)
+
+  end function bind_c_f16
+  !........................................
+
+end module bind_c_mod_9vvyxsl405gi
@@ -0,0 +1,35 @@
+module bind_c_mod_9w9gd6x9wxlv
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use mod_9w9gd6x9wxlv
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_test_nowait_schedule(n, Out_0001, Out_0002, Out_0003 &
+        , Out_0004, Out_0005, Out_0006, Out_0007, Out_0008) bind(c)
+
+    implicit none
+
+    real(f64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+    real(f64), intent(out) :: Out_0004
+    real(f64), intent(out) :: Out_0005
+    real(f64), intent(out) :: Out_0006
+    real(f64), intent(out) :: Out_0007
+    real(f64), intent(out) :: Out_0008
+    integer(i64), value :: n
+
+    call test_nowait_schedule(n = n, Out_0001 = Out_0001, Out_0002 = &
+          Out_0002, Out_0003 = Out_0003, Out_0004 = Out_0004, Out_0005 &
+          = Out_0005, Out_0006 = Out_0006, Out_0007 = Out_0007, &
+          Out_0008 = Out_0008)
+
+  end subroutine bind_c_test_nowait_schedule
+  !........................................
+
+end module bind_c_mod_9w9gd6x9wxlv
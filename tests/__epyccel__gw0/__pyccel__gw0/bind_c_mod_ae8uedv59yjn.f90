@@ -0,0 +1,29 @@
+module bind_c_mod_ae8uedv59yjn
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , c_ptr , i64 => &
+        C_INT64_T
+  use mod_ae8uedv59yjn
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_omp_arraysum_combined(bound_x, bound_x_shape_1, &
+        bound_x_stride_1) bind(c) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    func_result = omp_arraysum_combined(x = x(1_i64::bound_x_stride_1))
+
+  end function bind_c_omp_arraysum_combined
+  !........................................
+
+end module bind_c_mod_ae8uedv59yjn
@@ -0,0 +1,22 @@
+module bind_c_mod_alqnzoi5v3r4
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_alqnzoi5v3r4
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_p_lose() bind(c) result(lose)
+
+    implicit none
+
+    integer(i64) :: lose
+
+    lose = p_lose()
+
+  end function bind_c_p_lose
+  !........................................
+
+end module bind_c_mod_alqnzoi5v3r4
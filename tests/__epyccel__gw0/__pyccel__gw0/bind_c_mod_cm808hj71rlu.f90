@@ -0,0 +1,54 @@
+module bind_c_mod_cm808hj71rlu
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , c_ptr , f64 => &
+        C_DOUBLE , i64 => C_INT64_T
+  use mod_cm808hj71rlu
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_fused_temporaries_2d(bound_x, bound_x_shape_1, &
+        bound_x_shape_2, bound_x_stride_1, bound_x_stride_2, bound_y, &
+        bound_y_shape_1, bound_y_shape_2, bound_y_stride_1, &
+        bound_y_stride_2, bound_z, bound_z_shape_1, bound_z_shape_2, &
+        bound_z_stride_1, bound_z_stride_2) bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_shape_2
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: bound_x_stride_2
+    type(c_ptr), value :: bound_y
+    integer(i64), value :: bound_y_shape_1
+    integer(i64), value :: bound_y_shape_2
+    integer(i64), value :: bound_y_stride_1
+    integer(i64), value :: bound_y_stride_2
+    type(c_ptr), value :: bound_z
+    integer(i64), value :: bound_z_shape_1
+    integer(i64), value :: bound_z_shape_2
+    integer(i64), value :: bound_z_stride_1
+    integer(i64), value :: bound_z_stride_2
+    real(f64), pointer :: x(:, :)
+    real(f64), pointer :: y(:, :)
+    real(f64), pointer :: z(:, :)
+
+    call C_F_Pointer(bound_x, x, [bound_x_stride_1,bound_x_shape_1])
+    call C_F_Pointer(bound_y, y, [bound_y_stride_1,bound_y_shape_1])
+    call C_F_Pointer(bound_z, z, [bound_z_stride_1,bound_z_shape_1])
+    Out_0001 = fused_temporaries_2d(x = x(1_i64:bound_x_shape_2 * &
+          bound_x_stride_2 + 1_i64 - 1_i64:bound_x_stride_2, 1_i64: &
+          bound_x_shape_1 + 1_i64 - 1_i64), y = y(1_i64:bound_y_shape_2 &
+          * bound_y_stride_2 + 1_i64 - 1_i64:bound_y_stride_2, 1_i64: &
+          bound_y_shape_1 + 1_i64 - 1_i64), z = z(1_i64:bound_z_shape_2 &
+          * bound_z_stride_2 + 1_i64 - 1_i64:bound_z_stride_2, 1_i64: &
+          bound_z_shape_1 + 1_i64 - 1_i64))
+
+  end function bind_c_fused_temporaries_2d
+  !........................................
+
+end module bind_c_mod_cm808hj71rlu
@@ -0,0 +1,23 @@
+module bind_c_mod_cyvh9rs1f8gz
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_cyvh9rs1f8gz
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_tuples_func(Out_0001, Out_0002) bind(c) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+
+    call tuples_func(Out_0001 = Out_0001, Out_0002 = Out_0002)
+
+  end subroutine bind_c_tuples_func
+  !........................................
+
+end module bind_c_mod_cyvh9rs1f8gz
@@ -0,0 +1,23 @@
+module bind_c_mod_dv40snbk3qa5
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_dv40snbk3qa5
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_test_omp_get_thread_limit() bind(c) result( &
+        maximum_threads_available)
+
+    implicit none
+
+    integer(i32) :: maximum_threads_available
+
+    maximum_threads_available = test_omp_get_thread_limit()
+
+  end function bind_c_test_omp_get_thread_limit
+  !........................................
+
+end module bind_c_mod_dv40snbk3qa5
@@ -0,0 +1,37 @@
+module bind_c_mod_e2x7kz1v1mfj
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , C_F_Pointer &
+        , f64 => C_DOUBLE , c_ptr
+  use mod_e2x7kz1v1mfj
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_float_3d_c_array_initialization_2(bound_a, &
+        bound_a_shape_1, bound_a_shape_2, bound_a_shape_3, &
+        bound_a_stride_1, bound_a_stride_2, bound_a_stride_3) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_shape_2
+    integer(i64), value :: bound_a_shape_3
+    integer(i64), value :: bound_a_stride_1
+    integer(i64), value :: bound_a_stride_2
+    integer(i64), value :: bound_a_stride_3
+    real(f64), pointer :: a(:, :, :)
+
+    call C_F_Pointer(bound_a, a, [bound_a_stride_2,bound_a_stride_1, &
+          bound_a_shape_1])
+    call array_float_3d_C_array_initialization_2(a = a(1_i64: &
+          bound_a_shape_3 * bound_a_stride_3 + 1_i64 - 1_i64: &
+          bound_a_stride_3, 1_i64:bound_a_shape_2 + 1_i64 - 1_i64, &
+          1_i64:bound_a_shape_1 + 1_i64 - 1_i64))
+
+  end subroutine bind_c_array_float_3d_c_array_initialization_2
+  !........................................
+
+end module bind_c_mod_e2x7kz1v1mfj
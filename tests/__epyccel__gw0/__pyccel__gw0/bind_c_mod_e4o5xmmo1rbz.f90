@@ -0,0 +1,55 @@
+module bind_c_mod_e4o5xmmo1rbz
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , C_F_Pointer &
+        , c_ptr , i64 => C_INT64_T
+  use mod_e4o5xmmo1rbz
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_float_2d_2d_matmul_operator(bound_A, &
+        bound_A_shape_1, bound_A_shape_2, bound_A_stride_1, &
+        bound_A_stride_2, bound_B, bound_B_shape_1, bound_B_shape_2, &
+        bound_B_stride_1, bound_B_stride_2, bound_out, &
+        bound_out_shape_1, bound_out_shape_2, bound_out_stride_1, &
+        bound_out_stride_2) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_A
+    integer(i64), value :: bound_A_shape_1
+    integer(i64), value :: bound_A_shape_2
+    integer(i64), value :: bound_A_stride_1
+    integer(i64), value :: bound_A_stride_2
+    type(c_ptr), value :: bound_B
+    integer(i64), value :: bound_B_shape_1
+    integer(i64), value :: bound_B_shape_2
+    integer(i64), value :: bound_B_stride_1
+    integer(i64), value :: bound_B_stride_2
+    type(c_ptr), value :: bound_out
+    integer(i64), value :: bound_out_shape_1
+    integer(i64), value :: bound_out_shape_2
+    integer(i64), value :: bound_out_stride_1
+    integer(i64), value :: bound_out_stride_2
+    real(f64), pointer :: A(:, :)
+    real(f64), pointer :: B(:, :)
+    real(f64), pointer :: out(:, :)
+
+    call C_F_Pointer(bound_A, A, [bound_A_stride_1,bound_A_shape_1])
+    call C_F_Pointer(bound_B, B, [bound_B_stride_1,bound_B_shape_1])
+    call C_F_Pointer(bound_out, out, [bound_out_stride_1, &
+          bound_out_shape_1])
+    call array_float_2d_2d_matmul_operator(A = A(1_i64:bound_A_shape_2 * &
+          bound_A_stride_2 + 1_i64 - 1_i64:bound_A_stride_2, 1_i64: &
+          bound_A_shape_1 + 1_i64 - 1_i64), B = B(1_i64:bound_B_shape_2 &
+          * bound_B_stride_2 + 1_i64 - 1_i64:bound_B_stride_2, 1_i64: &
+          bound_B_shape_1 + 1_i64 - 1_i64), out = out(1_i64: &
+          bound_out_shape_2 * bound_out_stride_2 + 1_i64 - 1_i64: &
+          bound_out_stride_2, 1_i64:bound_out_shape_1 + 1_i64 - 1_i64))
+
+  end subroutine bind_c_array_float_2d_2d_matmul_operator
+  !........................................
+
+end module bind_c_mod_e4o5xmmo1rbz
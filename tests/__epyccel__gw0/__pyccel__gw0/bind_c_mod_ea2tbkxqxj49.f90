@@ -0,0 +1,34 @@
+module bind_c_mod_ea2tbkxqxj49
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , f64 => C_DOUBLE &
+        , c_ptr , i64 => C_INT64_T
+  use mod_ea2tbkxqxj49
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f7(m1, m2, bound_x, bound_x_shape_1, bound_x_shape_2 &
+        , bound_x_stride_1, bound_x_stride_2) bind(c)
+
+    implicit none
+
+    integer(i64), value :: m1
+    integer(i64), value :: m2
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_shape_2
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: bound_x_stride_2
+    real(f64), pointer :: x(:, :)
+
+    call C_F_Pointer(bound_x, x, [bound_x_stride_2,bound_x_shape_2])
+    call f7(m1 = m1, m2 = m2, x = x(1_i64:bound_x_shape_1 * &
+          bound_x_stride_1 + 1_i64 - 1_i64:bound_x_stride_1, 1_i64: &
+          bound_x_shape_2 + 1_i64 - 1_i64))
+
+  end subroutine bind_c_f7
+  !........................................
+
+end module bind_c_mod_ea2tbkxqxj49
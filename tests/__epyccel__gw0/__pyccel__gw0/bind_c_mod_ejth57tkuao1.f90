@@ -0,0 +1,29 @@
+module bind_c_mod_ejth57tkuao1
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , C_F_Pointer &
+        , c_ptr
+  use mod_ejth57tkuao1
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_int_1d_scalar_add(bound_x, bound_x_shape_1, &
+        bound_x_stride_1, a) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: a
+    integer(i64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call array_int_1d_scalar_add(x = x(1_i64::bound_x_stride_1), a = a)
+
+  end subroutine bind_c_array_int_1d_scalar_add
+  !........................................
+
+end module bind_c_mod_ejth57tkuao1
@@ -0,0 +1,23 @@
+module bind_c_mod_ey62q2zxg8cj
+
+  use, intrinsic :: ISO_C_Binding, only : i8 => C_INT8_T
+  use mod_ey62q2zxg8cj
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f17(a) bind(c) result(b)
+
+    implicit none
+
+    integer(i8) :: b
+    integer(i8), value :: a
+
+    b = f17(a = a)
+
+  end function bind_c_f17
+  !........................................
+
+end module bind_c_mod_ey62q2zxg8cj
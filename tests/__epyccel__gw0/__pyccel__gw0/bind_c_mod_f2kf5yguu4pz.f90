@@ -0,0 +1,22 @@
+module bind_c_mod_f2kf5yguu4pz
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+  use mod_f2kf5yguu4pz
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f1() bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+
+    Out_0001 = f1()
+
+  end function bind_c_f1
+  !........................................
+
+end module bind_c_mod_f2kf5yguu4pz
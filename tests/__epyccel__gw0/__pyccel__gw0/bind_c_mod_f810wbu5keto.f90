@@ -0,0 +1,29 @@
+module bind_c_mod_f810wbu5keto
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , C_F_Pointer , i64 => &
+        C_INT64_T , f64 => C_DOUBLE
+  use mod_f810wbu5keto
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f5(m1, bound_x, bound_x_shape_1, bound_x_stride_1) &
+        bind(c)
+
+    implicit none
+
+    integer(i64), value :: m1
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    real(f64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call f5(m1 = m1, x = x(1_i64::bound_x_stride_1))
+
+  end subroutine bind_c_f5
+  !........................................
+
+end module bind_c_mod_f810wbu5keto
@@ -0,0 +1,22 @@
+module bind_c_mod_fat7ehnfg2sx
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_fat7ehnfg2sx
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_tuple_arg_unpacking() bind(c) result(z)
+
+    implicit none
+
+    integer(i64) :: z
+
+    z = tuple_arg_unpacking()
+
+  end function bind_c_tuple_arg_unpacking
+  !........................................
+
+end module bind_c_mod_fat7ehnfg2sx
@@ -0,0 +1,23 @@
+module bind_c_mod_gsssxpv8lr2g
+
+  use, intrinsic :: ISO_C_Binding, only : c64 => C_DOUBLE_COMPLEX
+  use mod_gsssxpv8lr2g
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f22(a) bind(c) result(b)
+
+    implicit none
+
+    complex(c64) :: b
+    complex(c64), value :: a
+
+    b = f22(a = a)
+
+  end function bind_c_f22
+  !........................................
+
+end module bind_c_mod_gsssxpv8lr2g
@@ -0,0 +1,23 @@
+module bind_c_mod_hdsgw9l5knfu
+
+  use, intrinsic :: ISO_C_Binding, only : c32 => C_FLOAT_COMPLEX
+  use mod_hdsgw9l5knfu
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f21(a) bind(c) result(b)
+
+    implicit none
+
+    complex(c32) :: b
+    complex(c32), value :: a
+
+    b = f21(a = a)
+
+  end function bind_c_f21
+  !........................................
+
+end module bind_c_mod_hdsgw9l5knfu
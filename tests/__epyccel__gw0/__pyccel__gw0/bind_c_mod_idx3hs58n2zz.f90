@@ -0,0 +1,23 @@
+module bind_c_mod_idx3hs58n2zz
+
+  use, intrinsic :: ISO_C_Binding, only : i8 => C_INT8_T
+  use mod_idx3hs58n2zz
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f17(a) bind(c) result(b)
+
+    implicit none
+
+    integer(i8) :: b
+    integer(i8), value :: a
+
+    b = f17(a = a)
+
+  end function bind_c_f17
+  !........................................
+
+end module bind_c_mod_idx3hs58n2zz
@@ -0,0 +1,24 @@
+module bind_c_mod_in0kopq0k9y4
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_in0kopq0k9y4
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_get_min(a, b) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: a
+    integer(i64), value :: b
+
+    Out_0001 = get_min(a = a, b = b)
+
+  end function bind_c_get_min
+  !........................................
+
+end module bind_c_mod_in0kopq0k9y4
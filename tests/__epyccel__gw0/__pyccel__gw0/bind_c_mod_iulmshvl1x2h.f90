@@ -0,0 +1,22 @@
+module bind_c_mod_iulmshvl1x2h
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_iulmshvl1x2h
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_get_num_threads() bind(c) result(n)
+
+    implicit none
+
+    integer(i32) :: n
+
+    n = get_num_threads()
+
+  end function bind_c_get_num_threads
+  !........................................
+
+end module bind_c_mod_iulmshvl1x2h
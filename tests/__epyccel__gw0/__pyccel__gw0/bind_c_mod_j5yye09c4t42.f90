@@ -0,0 +1,22 @@
+module bind_c_mod_j5yye09c4t42
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_j5yye09c4t42
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_omp_master() bind(c) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+
+    func_result = omp_master()
+
+  end function bind_c_omp_master
+  !........................................
+
+end module bind_c_mod_j5yye09c4t42
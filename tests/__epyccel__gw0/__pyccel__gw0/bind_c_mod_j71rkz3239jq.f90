@@ -0,0 +1,40 @@
+module bind_c_mod_j71rkz3239jq
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , c_ptr , f64 => &
+        C_DOUBLE , i64 => C_INT64_T
+  use mod_j71rkz3239jq
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_omp_nowait(bound_x, bound_x_shape_1, &
+        bound_x_stride_1, bound_y, bound_y_shape_1, bound_y_stride_1, &
+        bound_z, bound_z_shape_1, bound_z_stride_1) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    type(c_ptr), value :: bound_y
+    integer(i64), value :: bound_y_shape_1
+    integer(i64), value :: bound_y_stride_1
+    type(c_ptr), value :: bound_z
+    integer(i64), value :: bound_z_shape_1
+    integer(i64), value :: bound_z_stride_1
+    integer(i64), pointer :: x(:)
+    integer(i64), pointer :: y(:)
+    real(f64), pointer :: z(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call C_F_Pointer(bound_y, y, [bound_y_shape_1 * bound_y_stride_1])
+    call C_F_Pointer(bound_z, z, [bound_z_shape_1 * bound_z_stride_1])
+    call omp_nowait(x = x(1_i64::bound_x_stride_1), y = y(1_i64:: &
+          bound_y_stride_1), z = z(1_i64::bound_z_stride_1))
+
+  end subroutine bind_c_omp_nowait
+  !........................................
+
+end module bind_c_mod_j71rkz3239jq
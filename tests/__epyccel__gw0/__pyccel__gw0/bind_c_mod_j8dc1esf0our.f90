@@ -0,0 +1,28 @@
+module bind_c_mod_j8dc1esf0our
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_j8dc1esf0our
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_copy_int(size, Out_0001, a, b, c, d) bind(c) 
+
+    implicit none
+
+    integer(i64), intent(out) :: size
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: a
+    integer(i64), intent(out) :: b
+    integer(i64), intent(out) :: c
+    integer(i64), intent(out) :: d
+
+    call copy_int(size = size, Out_0001 = Out_0001, a = a, b = b, c = c, &
+          d = d)
+
+  end subroutine bind_c_copy_int
+  !........................................
+
+end module bind_c_mod_j8dc1esf0our
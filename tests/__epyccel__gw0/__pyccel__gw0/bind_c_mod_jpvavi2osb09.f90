@@ -0,0 +1,22 @@
+module bind_c_mod_jpvavi2osb09
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_jpvavi2osb09
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f() bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+
+    Out_0001 = f()
+
+  end function bind_c_f
+  !........................................
+
+end module bind_c_mod_jpvavi2osb09
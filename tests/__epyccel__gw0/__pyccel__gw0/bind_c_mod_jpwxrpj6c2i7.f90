@@ -0,0 +1,22 @@
+module bind_c_mod_jpwxrpj6c2i7
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_jpwxrpj6c2i7
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_get_max_threads() bind(c) result(max_threads)
+
+    implicit none
+
+    integer(i32) :: max_threads
+
+    max_threads = get_max_threads()
+
+  end function bind_c_get_max_threads
+  !........................................
+
+end module bind_c_mod_jpwxrpj6c2i7
@@ -0,0 +1,19 @@
+module bind_c_mod_jqeikw8f938w
+
+  use mod_jqeikw8f938w
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_p_func() bind(c) 
+
+    implicit none
+
+    call p_func()
+
+  end subroutine bind_c_p_func
+  !........................................
+
+end module bind_c_mod_jqeikw8f938w
@@ -0,0 +1,22 @@
+module bind_c_mod_k0zeeqgjiwzs
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_k0zeeqgjiwzs
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_clear_complex() bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+
+    Out_0001 = clear_complex()
+
+  end function bind_c_clear_complex
+  !........................................
+
+end module bind_c_mod_k0zeeqgjiwzs
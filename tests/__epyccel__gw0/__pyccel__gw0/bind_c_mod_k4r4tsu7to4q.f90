@@ -0,0 +1,35 @@
+module bind_c_mod_k4r4tsu7to4q
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , C_F_Pointer , i64 => &
+        C_INT64_T , f64 => C_DOUBLE
+  use mod_k4r4tsu7to4q
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_fused_shifted_slices(bound_a, bound_a_shape_1, &
+        bound_a_stride_1, bound_b, bound_b_shape_1, bound_b_stride_1) &
+        bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_stride_1
+    type(c_ptr), value :: bound_b
+    integer(i64), value :: bound_b_shape_1
+    integer(i64), value :: bound_b_stride_1
+    real(f64), pointer :: a(:)
+    real(f64), pointer :: b(:)
+
+    call C_F_Pointer(bound_a, a, [bound_a_shape_1 * bound_a_stride_1])
+    call C_F_Pointer(bound_b, b, [bound_b_shape_1 * bound_b_stride_1])
+    call fused_shifted_slices(a = a(1_i64::bound_a_stride_1), b = b( &
+          1_i64::bound_b_stride_1))
+
+  end subroutine bind_c_fused_shifted_slices
+  !........................................
+
+end module bind_c_mod_k4r4tsu7to4q
@@ -0,0 +1,35 @@
+module bind_c_mod_kae9y1w14xw0
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , C_F_Pointer , i64 => &
+        C_INT64_T
+  use mod_kae9y1w14xw0
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_multi_layer_index(bound_x, bound_x_shape_1, &
+        bound_x_stride_1, start, stop_0001, step, idx) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: start
+    integer(i64), value :: stop_0001
+    integer(i64), value :: step
+    integer(i64), value :: idx
+    integer(i64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    Out_0001 = multi_layer_index(x = x(1_i64::bound_x_stride_1), start = &
+          start, stop_0001 = stop_0001, step = step, idx = idx)
+
+  end function bind_c_multi_layer_index
+  !........................................
+
+end module bind_c_mod_kae9y1w14xw0
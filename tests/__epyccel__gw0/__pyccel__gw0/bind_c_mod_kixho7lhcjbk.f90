@@ -0,0 +1,23 @@
+module bind_c_mod_kixho7lhcjbk
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+  use mod_kixho7lhcjbk
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f(Out_0001, Out_0002) bind(c) 
+
+    implicit none
+
+    real(f64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+
+    call f(Out_0001 = Out_0001, Out_0002 = Out_0002)
+
+  end subroutine bind_c_f
+  !........................................
+
+end module bind_c_mod_kixho7lhcjbk
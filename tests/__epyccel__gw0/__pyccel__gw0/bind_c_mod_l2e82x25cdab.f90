@@ -0,0 +1,163 @@
+module bind_c_mod_l2e82x25cdab
+
+  use, intrinsic :: ISO_C_Binding, only : i8 => C_INT8_T , f64 => &
+        C_DOUBLE , i64 => C_INT64_T , i32 => C_INT32_T , i16 => &
+        C_INT16_T , c64 => C_DOUBLE_COMPLEX , c32 => C_FLOAT_COMPLEX , &
+        f32 => C_FLOAT
+  use mod_l2e82x25cdab
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_array_return_first_element_0000(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: a
+    integer(i64), value :: b
+
+    Out_0001 = array_return_first_element_0000(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0000
+  !........................................
+
+  !........................................
+  function bind_c_array_return_first_element_0001(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    integer(i8) :: Out_0001
+    integer(i8), value :: a
+    integer(i8), value :: b
+
+    Out_0001 = array_return_first_element_0001(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0001
+  !........................................
+
+  !........................................
+  function bind_c_array_return_first_element_0002(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    integer(i16) :: Out_0001
+    integer(i16), value :: a
+    integer(i16), value :: b
+
+    Out_0001 = array_return_first_element_0002(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0002
+  !........................................
+
+  !........................................
+  function bind_c_array_return_first_element_0003(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    integer(i32) :: Out_0001
+    integer(i32), value :: a
+    integer(i32), value :: b
+
+    Out_0001 = array_return_first_element_0003(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0003
+  !........................................
+
+  !........................................
+  function bind_c_array_return_first_element_0004(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: a
+    integer(i64), value :: b
+
+    Out_0001 = array_return_first_element_0004(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0004
+  !........................................
+
+  !........................................
+  function bind_c_array_return_first_element_0005(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: a
+    real(f64), value :: b
+
+    Out_0001 = array_return_first_element_0005(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0005
+  !........................................
+
+  !........................................
+  function bind_c_array_return_first_element_0006(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    real(f32) :: Out_0001
+    real(f32), value :: a
+    real(f32), value :: b
+
+    Out_0001 = array_return_first_element_0006(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0006
+  !........................................
+
+  !........................................
+  function bind_c_array_return_first_element_0007(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: a
+    real(f64), value :: b
+
+    Out_0001 = array_return_first_element_0007(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0007
+  !........................................
+
+  !........................................
+  function bind_c_array_return_first_element_0008(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    complex(c32) :: Out_0001
+    complex(c32), value :: a
+    complex(c32), value :: b
+
+    Out_0001 = array_return_first_element_0008(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0008
+  !........................................
+
+  !........................................
+  function bind_c_array_return_first_element_0009(a, b) bind(c) result( &
+        Out_0001)
+
+    implicit none
+
+    complex(c64) :: Out_0001
+    complex(c64), value :: a
+    complex(c64), value :: b
+
+    Out_0001 = array_return_first_element_0009(a = a, b = b)
+
+  end function bind_c_array_return_first_element_0009
+  !........................................
+
+end module bind_c_mod_l2e82x25cdab
@@ -0,0 +1,22 @@
+module bind_c_mod_l571hoi7fs5t
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_l571hoi7fs5t
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_add_element_range() bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+
+    Out_0001 = add_element_range()
+
+  end function bind_c_add_element_range
+  !........................................
+
+end module bind_c_mod_l571hoi7fs5t
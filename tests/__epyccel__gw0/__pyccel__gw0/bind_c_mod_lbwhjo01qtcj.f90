@@ -0,0 +1,31 @@
+module bind_c_mod_lbwhjo01qtcj
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c_ptr , &
+        c_loc
+  use mod_lbwhjo01qtcj
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_int_1d_initialization_4(bound_b, b_shape_1) &
+        bind(c)
+
+    implicit none
+
+    type(c_ptr), intent(out) :: bound_b
+    integer(i64), intent(out) :: b_shape_1
+    integer(i64), allocatable :: b(:)
+    integer(i64), pointer :: b_ptr(:)
+
+    call array_int_1d_initialization_4(b = b)
+    b_shape_1 = 10_i64
+    allocate(b_ptr(0:b_shape_1 - 1_i64))
+    b_ptr = b
+    bound_b = c_loc(b_ptr)
+
+  end subroutine bind_c_array_int_1d_initialization_4
+  !........................................
+
+end module bind_c_mod_lbwhjo01qtcj
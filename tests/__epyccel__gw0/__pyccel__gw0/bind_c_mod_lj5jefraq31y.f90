@@ -0,0 +1,25 @@
+module bind_c_mod_lj5jefraq31y
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , b1 => &
+        C_BOOL
+  use mod_lj5jefraq31y
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f8(x, b) bind(c) result(a)
+
+    implicit none
+
+    integer(i64) :: a
+    integer(i64), value :: x
+    logical(b1), value :: b
+
+    a = f8(x = x, b = b)
+
+  end function bind_c_f8
+  !........................................
+
+end module bind_c_mod_lj5jefraq31y
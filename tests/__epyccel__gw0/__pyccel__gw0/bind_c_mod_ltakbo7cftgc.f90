@@ -0,0 +1,23 @@
+module bind_c_mod_ltakbo7cftgc
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_ltakbo7cftgc
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_omp_simd(n) bind(c) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    integer(i64), value :: n
+
+    func_result = omp_simd(n = n)
+
+  end function bind_c_omp_simd
+  !........................................
+
+end module bind_c_mod_ltakbo7cftgc
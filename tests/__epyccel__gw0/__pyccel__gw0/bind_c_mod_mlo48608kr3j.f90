@@ -0,0 +1,24 @@
+module bind_c_mod_mlo48608kr3j
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+  use mod_mlo48608kr3j
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_unpack_array_of_known_size(x, y, z) bind(c) 
+
+    implicit none
+
+    real(f64), intent(out) :: x
+    real(f64), intent(out) :: y
+    real(f64), intent(out) :: z
+
+    call unpack_array_of_known_size(x = x, y = y, z = z)
+
+  end subroutine bind_c_unpack_array_of_known_size
+  !........................................
+
+end module bind_c_mod_mlo48608kr3j
@@ -0,0 +1,22 @@
+module bind_c_mod_n2btuwpn9mqq
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_n2btuwpn9mqq
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_test_omp_get_proc_bind() bind(c) result(bind_var)
+
+    implicit none
+
+    integer(i32) :: bind_var
+
+    bind_var = test_omp_get_proc_bind()
+
+  end function bind_c_test_omp_get_proc_bind
+  !........................................
+
+end module bind_c_mod_n2btuwpn9mqq
@@ -0,0 +1,31 @@
+module bind_c_mod_nj3dlp7ka0em
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use mod_nj3dlp7ka0em
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_copy_float(Out_0001, Out_0002, Out_0003, Out_0004, &
+        Out_0005, Out_0006) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+    real(f64), intent(out) :: Out_0004
+    real(f64), intent(out) :: Out_0005
+    integer(i64), intent(out) :: Out_0006
+
+    call copy_float(Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 = &
+          Out_0003, Out_0004 = Out_0004, Out_0005 = Out_0005, Out_0006 &
+          = Out_0006)
+
+  end subroutine bind_c_copy_float
+  !........................................
+
+end module bind_c_mod_nj3dlp7ka0em
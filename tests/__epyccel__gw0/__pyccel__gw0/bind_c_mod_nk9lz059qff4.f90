@@ -0,0 +1,23 @@
+module bind_c_mod_nk9lz059qff4
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_nk9lz059qff4
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f18(a) bind(c) result(b)
+
+    implicit none
+
+    integer(i32) :: b
+    integer(i32), value :: a
+
+    b = f18(a = a)
+
+  end function bind_c_f18
+  !........................................
+
+end module bind_c_mod_nk9lz059qff4
@@ -0,0 +1,43 @@
+module bind_c_mod_nszfxrrd1ttd
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , i64 => C_INT64_T , &
+        C_F_Pointer , c_loc , f64 => C_DOUBLE
+  use mod_nszfxrrd1ttd
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f4(bound_x, bound_x_shape_1, bound_x_shape_2, &
+        bound_x_stride_1, bound_x_stride_2, bound_y, y_shape_1, &
+        y_shape_2) bind(c)
+
+    implicit none
+
+    type(c_ptr), intent(out) :: bound_y
+    integer(i64), intent(out) :: y_shape_1
+    integer(i64), intent(out) :: y_shape_2
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_shape_2
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), value :: bound_x_stride_2
+    real(f64), pointer :: x(:, :)
+    real(f64), allocatable :: y(:, :)
+    real(f64), pointer :: y_ptr(:, :)
+
+    call C_F_Pointer(bound_x, x, [bound_x_stride_1,bound_x_shape_1])
+    call f4(x = x(1_i64:bound_x_shape_2 * bound_x_stride_2 + 1_i64 - &
+          1_i64:bound_x_stride_2, 1_i64:bound_x_shape_1 + 1_i64 - 1_i64 &
+          ), y = y)
+    y_shape_1 = size(y, 2_i64, i64)
+    y_shape_2 = size(y, 1_i64, i64)
+    allocate(y_ptr(0:y_shape_2 - 1_i64, 0:y_shape_1 - 1_i64))
+    y_ptr = y
+    bound_y = c_loc(y_ptr)
+
+  end subroutine bind_c_f4
+  !........................................
+
+end module bind_c_mod_nszfxrrd1ttd
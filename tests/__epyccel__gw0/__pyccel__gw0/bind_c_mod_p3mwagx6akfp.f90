@@ -0,0 +1,24 @@
+module bind_c_mod_p3mwagx6akfp
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i64 => &
+        C_INT64_T
+  use mod_p3mwagx6akfp
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_non_negative(i) bind(c) result(Out_0001)
+
+    implicit none
+
+    logical(b1) :: Out_0001
+    integer(i64), value :: i
+
+    Out_0001 = non_negative(i = i)
+
+  end function bind_c_non_negative
+  !........................................
+
+end module bind_c_mod_p3mwagx6akfp
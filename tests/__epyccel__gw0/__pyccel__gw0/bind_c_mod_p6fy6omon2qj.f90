@@ -0,0 +1,23 @@
+module bind_c_mod_p6fy6omon2qj
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_p6fy6omon2qj
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f1(i) bind(c) result(out)
+
+    implicit none
+
+    integer(i64) :: out
+    integer(i64), value :: i
+
+    out = f1(i = i)
+
+  end function bind_c_f1
+  !........................................
+
+end module bind_c_mod_p6fy6omon2qj
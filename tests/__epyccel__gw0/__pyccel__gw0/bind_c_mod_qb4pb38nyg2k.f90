@@ -0,0 +1,78 @@
+module bind_c_mod_qb4pb38nyg2k
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , f64 => C_DOUBLE &
+        , i64 => C_INT64_T , c_ptr
+  use mod_qb4pb38nyg2k
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_array_float_2d_2d_matmul_transpose(bound_A, &
+        bound_A_shape_1, bound_A_shape_2, bound_A_stride_1, &
+        bound_A_stride_2, bound_B, bound_B_shape_1, bound_B_shape_2, &
+        bound_B_stride_1, bound_B_stride_2, bound_C, bound_C_shape_1, &
+        bound_C_shape_2, bound_C_stride_1, bound_C_stride_2, bound_out1 &
+        , bound_out1_shape_1, bound_out1_shape_2, bound_out1_stride_1, &
+        bound_out1_stride_2, bound_out2, bound_out2_shape_1, &
+        bound_out2_shape_2, bound_out2_stride_1, bound_out2_stride_2) &
+        bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_A
+    integer(i64), value :: bound_A_shape_1
+    integer(i64), value :: bound_A_shape_2
+    integer(i64), value :: bound_A_stride_1
+    integer(i64), value :: bound_A_stride_2
+    type(c_ptr), value :: bound_B
+    integer(i64), value :: bound_B_shape_1
+    integer(i64), value :: bound_B_shape_2
+    integer(i64), value :: bound_B_stride_1
+    integer(i64), value :: bound_B_stride_2
+    type(c_ptr), value :: bound_C
+    integer(i64), value :: bound_C_shape_1
+    integer(i64), value :: bound_C_shape_2
+    integer(i64), value :: bound_C_stride_1
+    integer(i64), value :: bound_C_stride_2
+    type(c_ptr), value :: bound_out1
+    integer(i64), value :: bound_out1_shape_1
+    integer(i64), value :: bound_out1_shape_2
+    integer(i64), value :: bound_out1_stride_1
+    integer(i64), value :: bound_out1_stride_2
+    type(c_ptr), value :: bound_out2
+    integer(i64), value :: bound_out2_shape_1
+    integer(i64), value :: bound_out2_shape_2
+    integer(i64), value :: bound_out2_stride_1
+    integer(i64), value :: bound_out2_stride_2
+    real(f64), pointer :: A(:, :)
+    real(f64), pointer :: B(:, :)
+    real(f64), pointer :: C(:, :)
+    real(f64), pointer :: out1(:, :)
+    real(f64), pointer :: out2(:, :)
+
+    call C_F_Pointer(bound_A, A, [bound_A_stride_1,bound_A_shape_1])
+    call C_F_Pointer(bound_B, B, [bound_B_stride_1,bound_B_shape_1])
+    call C_F_Pointer(bound_C, C, [bound_C_stride_1,bound_C_shape_1])
+    call C_F_Pointer(bound_out1, out1, [bound_out1_stride_1, &
+          bound_out1_shape_1])
+    call C_F_Pointer(bound_out2, out2, [bound_out2_stride_1, &
+          bound_out2_shape_1])
+    call array_float_2d_2d_matmul_transpose(A = A(1_i64:bound_A_shape_2 &
+          * bound_A_stride_2 + 1_i64 - 1_i64:bound_A_stride_2, 1_i64: &
+          bound_A_shape_1 + 1_i64 - 1_i64), B = B(1_i64:bound_B_shape_2 &
+          * bound_B_stride_2 + 1_i64 - 1_i64:bound_B_stride_2, 1_i64: &
+          bound_B_shape_1 + 1_i64 - 1_i64), C = C(1_i64:bound_C_shape_2 &
+          * bound_C_stride_2 + 1_i64 - 1_i64:bound_C_stride_2, 1_i64: &
+          bound_C_shape_1 + 1_i64 - 1_i64), out1 = out1(1_i64: &
+          bound_out1_shape_2 * bound_out1_stride_2 + 1_i64 - 1_i64: &
+          bound_out1_stride_2, 1_i64:bound_out1_shape_1 + 1_i64 - 1_i64 &
+          ), out2 = out2(1_i64:bound_out2_shape_2 * bound_out2_stride_2 &
+          + 1_i64 - 1_i64:bound_out2_stride_2, 1_i64:bound_out2_shape_1 &
+          + 1_i64 - 1_i64))
+
+  end subroutine bind_c_array_float_2d_2d_matmul_transpose
+  !........................................
+
+end module bind_c_mod_qb4pb38nyg2k
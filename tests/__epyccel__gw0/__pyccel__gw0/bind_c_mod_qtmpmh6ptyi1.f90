@@ -0,0 +1,24 @@
+module bind_c_mod_qtmpmh6ptyi1
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_qtmpmh6ptyi1
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_ackermann(m, n) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: m
+    integer(i64), value :: n
+
+    Out_0001 = ackermann(m = m, n = n)
+
+  end function bind_c_ackermann
+  !........................................
+
+end module bind_c_mod_qtmpmh6ptyi1
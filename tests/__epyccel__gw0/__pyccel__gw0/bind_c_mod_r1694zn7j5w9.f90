@@ -0,0 +1,28 @@
+module bind_c_mod_r1694zn7j5w9
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , c64 => &
+        C_DOUBLE_COMPLEX
+  use mod_r1694zn7j5w9
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_copy_complex(Out_0001, Out_0002, Out_0003, Out_0004 &
+        ) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    complex(c64), intent(out) :: Out_0002
+    complex(c64), intent(out) :: Out_0003
+    complex(c64), intent(out) :: Out_0004
+
+    call copy_complex(Out_0001 = Out_0001, Out_0002 = Out_0002, Out_0003 &
+          = Out_0003, Out_0004 = Out_0004)
+
+  end subroutine bind_c_copy_complex
+  !........................................
+
+end module bind_c_mod_r1694zn7j5w9
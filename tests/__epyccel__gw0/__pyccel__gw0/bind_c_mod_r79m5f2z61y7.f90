@@ -0,0 +1,51 @@
+module bind_c_mod_r79m5f2z61y7
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , f64 => C_DOUBLE &
+        , i64 => C_INT64_T , c_ptr
+  use mod_r79m5f2z61y7
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_parallel_array_expressions(bound_c, bound_c_shape_1, &
+        bound_c_shape_2, bound_c_stride_1, bound_c_stride_2, bound_a, &
+        bound_a_shape_1, bound_a_shape_2, bound_a_stride_1, &
+        bound_a_stride_2, bound_b, bound_b_shape_1, bound_b_stride_1, d &
+        ) bind(c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_c
+    integer(i64), value :: bound_c_shape_1
+    integer(i64), value :: bound_c_shape_2
+    integer(i64), value :: bound_c_stride_1
+    integer(i64), value :: bound_c_stride_2
+    type(c_ptr), value :: bound_a
+    integer(i64), value :: bound_a_shape_1
+    integer(i64), value :: bound_a_shape_2
+    integer(i64), value :: bound_a_stride_1
+    integer(i64), value :: bound_a_stride_2
+    type(c_ptr), value :: bound_b
+    integer(i64), value :: bound_b_shape_1
+    integer(i64), value :: bound_b_stride_1
+    real(f64), value :: d
+    real(f64), pointer :: c(:, :)
+    real(f64), pointer :: a(:, :)
+    real(f64), pointer :: b(:)
+
+    call C_F_Pointer(bound_c, c, [bound_c_stride_1,bound_c_shape_1])
+    call C_F_Pointer(bound_a, a, [bound_a_stride_1,bound_a_shape_1])
+    call C_F_Pointer(bound_b, b, [bound_b_shape_1 * bound_b_stride_1])
+    call parallel_array_expressions(c = c(1_i64:bound_c_shape_2 * &
+          bound_c_stride_2 + 1_i64 - 1_i64:bound_c_stride_2, 1_i64: &
+          bound_c_shape_1 + 1_i64 - 1_i64), a = a(1_i64:bound_a_shape_2 &
+          * bound_a_stride_2 + 1_i64 - 1_i64:bound_a_stride_2, 1_i64: &
+          bound_a_shape_1 + 1_i64 - 1_i64), b = b(1_i64:: &
+          bound_b_stride_1), d = d)
+
+  end subroutine bind_c_parallel_array_expressions
+  !........................................
+
+end module bind_c_mod_r79m5f2z61y7
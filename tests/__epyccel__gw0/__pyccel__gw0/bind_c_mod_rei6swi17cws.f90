@@ -0,0 +1,50 @@
+module bind_c_mod_rei6swi17cws
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , c_loc , c_ptr
+  use mod_rei6swi17cws
+
+  implicit none
+
+  contains
+
+  function a_bind_c_alloc() bind(c) result(bound_A)
+
+    implicit none
+
+    type(c_ptr) :: bound_A
+    type(A), pointer :: A_obj
+
+    allocate(A_obj)
+    bound_A = c_loc(A_obj)
+
+  end function a_bind_c_alloc
+
+  !........................................
+
+  subroutine bind_c_a_create(bound_self) bind(c) 
+
+    implicit none
+
+    type(c_ptr), value :: bound_self
+    type(A), pointer :: self
+
+    call C_F_Pointer(bound_self, self)
+    call self % create()
+
+  end subroutine bind_c_a_create
+
+  !........................................
+
+  subroutine bind_c_a_free(bound_self) bind(c) 
+
+    implicit none
+
+    type(c_ptr), value :: bound_self
+    type(A), pointer :: self
+
+    call C_F_Pointer(bound_self, self)
+    call self % free()
+    deallocate(self)
+  end subroutine bind_c_a_free
+
+end module bind_c_mod_rei6swi17cws
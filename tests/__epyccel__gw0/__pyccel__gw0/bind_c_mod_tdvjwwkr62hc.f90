@@ -0,0 +1,26 @@
+module bind_c_mod_tdvjwwkr62hc
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+  use mod_tdvjwwkr62hc
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_unpack_array_2d_of_known_size(Out_0001, Out_0002, &
+        Out_0003) bind(c)
+
+    implicit none
+
+    real(f64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+
+    call unpack_array_2D_of_known_size(Out_0001 = Out_0001, Out_0002 = &
+          Out_0002, Out_0003 = Out_0003)
+
+  end subroutine bind_c_unpack_array_2d_of_known_size
+  !........................................
+
+end module bind_c_mod_tdvjwwkr62hc
@@ -0,0 +1,23 @@
+module bind_c_mod_tm6saq7d0l1t
+
+  use, intrinsic :: ISO_C_Binding, only : i16 => C_INT16_T
+  use mod_tm6saq7d0l1t
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f16(a) bind(c) result(b)
+
+    implicit none
+
+    integer(i16) :: b
+    integer(i16), value :: a
+
+    b = f16(a = a)
+
+  end function bind_c_f16
+  !........................................
+
+end module bind_c_mod_tm6saq7d0l1t
@@ -0,0 +1,103 @@
+module bind_c_mod_umz9srmtaj1y
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , i64 => C_INT64_T &
+        , c_ptr
+  use mod_umz9srmtaj1y
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_omp_long_line( &
+        bound_long_variable_1_oiwed423rnoij21d4kojklm, &
+        bound_long_variable_1_oiwed423rnoij21d4kojklm_shape_1, &
+        bound_long_variable_1_oiwed423rnoij21d4kojklm_stride_1, &
+        bound_long_variable_2_oiwedqwrnoij2asxaxnjkna, &
+        bound_long_variable_2_oiwedqwrnoij2asxaxnjkna_shape_1, &
+        bound_long_variable_2_oiwedqwrnoij2asxaxnjkna_stride_1, &
+        bound_long_variable_3_oiweqxhnoijaqed34023423, &
+        bound_long_variable_3_oiweqxhnoijaqed34023423_shape_1, &
+        bound_long_variable_3_oiweqxhnoijaqed34023423_stride_1, &
+        bound_long_variable_4_oiweaxaijaqedqd34023423, &
+        bound_long_variable_4_oiweaxaijaqedqd34023423_shape_1, &
+        bound_long_variable_4_oiweaxaijaqedqd34023423_stride_1, &
+        bound_long_variable_5_oiwed423rnoic3242ewdx35, &
+        bound_long_variable_5_oiwed423rnoic3242ewdx35_shape_1, &
+        bound_long_variable_5_oiwed423rnoic3242ewdx35_stride_1) bind(c &
+        ) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    type(c_ptr), value :: bound_long_variable_1_oiwed423rnoij21d4kojklm
+    integer(i64), value :: &
+          bound_long_variable_1_oiwed423rnoij21d4kojklm_shape_1
+    integer(i64), value :: &
+          bound_long_variable_1_oiwed423rnoij21d4kojklm_stride_1
+    type(c_ptr), value :: bound_long_variable_2_oiwedqwrnoij2asxaxnjkna
+    integer(i64), value :: &
+          bound_long_variable_2_oiwedqwrnoij2asxaxnjkna_shape_1
+    integer(i64), value :: &
+          bound_long_variable_2_oiwedqwrnoij2asxaxnjkna_stride_1
+    type(c_ptr), value :: bound_long_variable_3_oiweqxhnoijaqed34023423
+    integer(i64), value :: &
+          bound_long_variable_3_oiweqxhnoijaqed34023423_shape_1
+    integer(i64), value :: &
+          bound_long_variable_3_oiweqxhnoijaqed34023423_stride_1
+    type(c_ptr), value :: bound_long_variable_4_oiweaxaijaqedqd34023423
+    integer(i64), value :: &
+          bound_long_variable_4_oiweaxaijaqedqd34023423_shape_1
+    integer(i64), value :: &
+          bound_long_variable_4_oiweaxaijaqedqd34023423_stride_1
+    type(c_ptr), value :: bound_long_variable_5_oiwed423rnoic3242ewdx35
+    integer(i64), value :: &
+          bound_long_variable_5_oiwed423rnoic3242ewdx35_shape_1
+    integer(i64), value :: &
+          bound_long_variable_5_oiwed423rnoic3242ewdx35_stride_1
+    integer(i64), pointer :: long_variable_1_oiwed423rnoij21d4kojklm(:)
+    integer(i64), pointer :: long_variable_2_oiwedqwrnoij2asxaxnjkna(:)
+    integer(i64), pointer :: long_variable_3_oiweqxhnoijaqed34023423(:)
+    integer(i64), pointer :: long_variable_4_oiweaxaijaqedqd34023423(:)
+    integer(i64), pointer :: long_variable_5_oiwed423rnoic3242ewdx35(:)
+
+    call C_F_Pointer(bound_long_variable_1_oiwed423rnoij21d4kojklm, &
+          long_variable_1_oiwed423rnoij21d4kojklm, [ &
+          bound_long_variable_1_oiwed423rnoij21d4kojklm_shape_1 * &
+          bound_long_variable_1_oiwed423rnoij21d4kojklm_stride_1])
+    call C_F_Pointer(bound_long_variable_2_oiwedqwrnoij2asxaxnjkna, &
+          long_variable_2_oiwedqwrnoij2asxaxnjkna, [ &
+          bound_long_variable_2_oiwedqwrnoij2asxaxnjkna_shape_1 * &
+          bound_long_variable_2_oiwedqwrnoij2asxaxnjkna_stride_1])
+    call C_F_Pointer(bound_long_variable_3_oiweqxhnoijaqed34023423, &
+          long_variable_3_oiweqxhnoijaqed34023423, [ &
+          bound_long_variable_3_oiweqxhnoijaqed34023423_shape_1 * &
+          bound_long_variable_3_oiweqxhnoijaqed34023423_stride_1])
+    call C_F_Pointer(bound_long_variable_4_oiweaxaijaqedqd34023423, &
+          long_variable_4_oiweaxaijaqedqd34023423, [ &
+          bound_long_variable_4_oiweaxaijaqedqd34023423_shape_1 * &
+          bound_long_variable_4_oiweaxaijaqedqd34023423_stride_1])
+    call C_F_Pointer(bound_long_variable_5_oiwed423rnoic3242ewdx35, &
+          long_variable_5_oiwed423rnoic3242ewdx35, [ &
+          bound_long_variable_5_oiwed423rnoic3242ewdx35_shape_1 * &
+          bound_long_variable_5_oiwed423rnoic3242ewdx35_stride_1])
+    func_result = omp_long_line(long_variable_1_oiwed423rnoij21d4kojklm &
+          = long_variable_1_oiwed423rnoij21d4kojklm(1_i64:: &
+          bound_long_variable_1_oiwed423rnoij21d4kojklm_stride_1), &
+          long_variable_2_oiwedqwrnoij2asxaxnjkna = &
+          long_variable_2_oiwedqwrnoij2asxaxnjkna(1_i64:: &
+          bound_long_variable_2_oiwedqwrnoij2asxaxnjkna_stride_1), &
+          long_variable_3_oiweqxhnoijaqed34023423 = &
+          long_variable_3_oiweqxhnoijaqed34023423(1_i64:: &
+          bound_long_variable_3_oiweqxhnoijaqed34023423_stride_1), &
+          long_variable_4_oiweaxaijaqedqd34023423 = &
+          long_variable_4_oiweaxaijaqedqd34023423(1_i64:: &
+          bound_long_variable_4_oiweaxaijaqedqd34023423_stride_1), &
+          long_variable_5_oiwed423rnoic3242ewdx35 = &
+          long_variable_5_oiwed423rnoic3242ewdx35(1_i64:: &
+          bound_long_variable_5_oiwed423rnoic3242ewdx35_stride_1))
+
+  end function bind_c_omp_long_line
+  !........................................
+
+end module bind_c_mod_umz9srmtaj1y
@@ -0,0 +1,27 @@
+module bind_c_mod_v83l5zwwdxtl
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use mod_v83l5zwwdxtl
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_draw_random(seed, stream, x, y, z) bind(c) 
+
+    implicit none
+
+    real(f64), intent(out) :: x
+    real(f64), intent(out) :: y
+    real(f64), intent(out) :: z
+    integer(i64), value :: seed
+    integer(i64), value :: stream
+
+    call draw_random(seed = seed, stream = stream, x = x, y = y, z = z)
+
+  end subroutine bind_c_draw_random
+  !........................................
+
+end module bind_c_mod_v83l5zwwdxtl
@@ -0,0 +1,28 @@
+module bind_c_mod_vvomidq9tlu7
+
+  use, intrinsic :: ISO_C_Binding, only : C_F_Pointer , i64 => C_INT64_T &
+        , c_ptr
+  use mod_vvomidq9tlu7
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f10(bound_x, bound_x_shape_1, bound_x_stride_1) bind &
+        (c)
+
+    implicit none
+
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call f10(x = x(1_i64::bound_x_stride_1))
+
+  end subroutine bind_c_f10
+  !........................................
+
+end module bind_c_mod_vvomidq9tlu7
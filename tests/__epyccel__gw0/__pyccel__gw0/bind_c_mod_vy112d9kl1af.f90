@@ -0,0 +1,22 @@
+module bind_c_mod_vy112d9kl1af
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_vy112d9kl1af
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_test_omp_number_of_procs() bind(c) result(procs_num)
+
+    implicit none
+
+    integer(i32) :: procs_num
+
+    procs_num = test_omp_number_of_procs()
+
+  end function bind_c_test_omp_number_of_procs
+  !........................................
+
+end module bind_c_mod_vy112d9kl1af
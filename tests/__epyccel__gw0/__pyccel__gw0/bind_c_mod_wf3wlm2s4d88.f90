@@ -0,0 +1,22 @@
+module bind_c_mod_wf3wlm2s4d88
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+  use mod_wf3wlm2s4d88
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f1() bind(c) result(value_0001)
+
+    implicit none
+
+    real(f64) :: value_0001
+
+    value_0001 = f1()
+
+  end function bind_c_f1
+  !........................................
+
+end module bind_c_mod_wf3wlm2s4d88
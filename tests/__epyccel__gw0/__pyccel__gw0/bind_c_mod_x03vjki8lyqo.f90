@@ -0,0 +1,26 @@
+module bind_c_mod_x03vjki8lyqo
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use mod_x03vjki8lyqo
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_arrs_1d_negative_index_negative_step(Out_0001, &
+        Out_0002) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+
+    call arrs_1d_negative_index_negative_step(Out_0001 = Out_0001, &
+          Out_0002 = Out_0002)
+
+  end subroutine bind_c_arrs_1d_negative_index_negative_step
+  !........................................
+
+end module bind_c_mod_x03vjki8lyqo
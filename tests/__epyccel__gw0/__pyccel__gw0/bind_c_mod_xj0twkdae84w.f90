@@ -0,0 +1,22 @@
+module bind_c_mod_xj0twkdae84w
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_xj0twkdae84w
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_add_int() bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+
+    Out_0001 = add_int()
+
+  end function bind_c_add_int
+  !........................................
+
+end module bind_c_mod_xj0twkdae84w
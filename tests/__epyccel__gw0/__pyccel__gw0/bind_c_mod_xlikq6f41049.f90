@@ -0,0 +1,36 @@
+module bind_c_mod_xlikq6f41049
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , C_F_Pointer &
+        , c_loc , c_ptr
+  use mod_xlikq6f41049
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_f3(bound_x, bound_x_shape_1, bound_x_stride_1, &
+        bound_y, y_shape_1) bind(c)
+
+    implicit none
+
+    type(c_ptr), intent(out) :: bound_y
+    integer(i64), intent(out) :: y_shape_1
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), pointer :: x(:)
+    integer(i64), allocatable :: y(:)
+    integer(i64), pointer :: y_ptr(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    call f3(x = x(1_i64::bound_x_stride_1), y = y)
+    y_shape_1 = size(y, kind=i64)
+    allocate(y_ptr(0:y_shape_1 - 1_i64))
+    y_ptr = y
+    bound_y = c_loc(y_ptr)
+
+  end subroutine bind_c_f3
+  !........................................
+
+end module bind_c_mod_xlikq6f41049
@@ -0,0 +1,22 @@
+module bind_c_mod_ysm8jqol9whb
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL
+  use mod_ysm8jqol9whb
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_test_omp_get_cancellation() bind(c) result(cancel_var)
+
+    implicit none
+
+    logical(b1) :: cancel_var
+
+    cancel_var = test_omp_get_cancellation()
+
+  end function bind_c_test_omp_get_cancellation
+  !........................................
+
+end module bind_c_mod_ysm8jqol9whb
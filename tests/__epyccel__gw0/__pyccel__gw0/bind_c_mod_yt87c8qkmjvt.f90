@@ -0,0 +1,7 @@
+module bind_c_mod_yt87c8qkmjvt
+
+  use mod_yt87c8qkmjvt
+
+  implicit none
+
+end module bind_c_mod_yt87c8qkmjvt
@@ -0,0 +1,22 @@
+module bind_c_mod_yylbo96zxv2q
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_yylbo96zxv2q
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_omp_sections() bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+
+    Out_0001 = omp_sections()
+
+  end function bind_c_omp_sections
+  !........................................
+
+end module bind_c_mod_yylbo96zxv2q
@@ -0,0 +1,23 @@
+module bind_c_mod_z2d3hgmwtdev
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_z2d3hgmwtdev
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f19(a) bind(c) result(b)
+
+    implicit none
+
+    integer(i64) :: b
+    integer(i64), value :: a
+
+    b = f19(a = a)
+
+  end function bind_c_f19
+  !........................................
+
+end module bind_c_mod_z2d3hgmwtdev
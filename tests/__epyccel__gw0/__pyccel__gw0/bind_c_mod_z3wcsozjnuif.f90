@@ -0,0 +1,27 @@
+module bind_c_mod_z3wcsozjnuif
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use mod_z3wcsozjnuif
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine bind_c_arrs_2d_negative_index(Out_0001, Out_0002, Out_0003 &
+        ) bind(c)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+
+    call arrs_2d_negative_index(Out_0001 = Out_0001, Out_0002 = Out_0002 &
+          , Out_0003 = Out_0003)
+
+  end subroutine bind_c_arrs_2d_negative_index
+  !........................................
+
+end module bind_c_mod_z3wcsozjnuif
@@ -0,0 +1,23 @@
+module bind_c_mod_zd1yb70nlifr
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use mod_zd1yb70nlifr
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_omp_range_sum_critical(x) bind(c) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    integer(i64), value :: x
+
+    func_result = omp_range_sum_critical(x = x)
+
+  end function bind_c_omp_range_sum_critical
+  !........................................
+
+end module bind_c_mod_zd1yb70nlifr
@@ -0,0 +1,29 @@
+module bind_c_mod_zdoc7q4rah1o
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i16 => &
+        C_INT16_T , i32 => C_INT32_T , i8 => C_INT8_T , i64 => &
+        C_INT64_T
+  use mod_zdoc7q4rah1o
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f15(a, b, c, d, e) bind(c) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    logical(b1), value :: a
+    integer(i8), value :: b
+    integer(i16), value :: c
+    integer(i32), value :: d
+    integer(i64), value :: e
+
+    Out_0001 = f15(a = a, b = b, c = c, d = d, e = e)
+
+  end function bind_c_f15
+  !........................................
+
+end module bind_c_mod_zdoc7q4rah1o
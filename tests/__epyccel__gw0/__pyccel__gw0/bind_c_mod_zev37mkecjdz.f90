@@ -0,0 +1,23 @@
+module bind_c_mod_zev37mkecjdz
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+  use mod_zev37mkecjdz
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_test_omp_get_max_task_priority() bind(c) result( &
+        max_task_priority_var)
+
+    implicit none
+
+    integer(i32) :: max_task_priority_var
+
+    max_task_priority_var = test_omp_get_max_task_priority()
+
+  end function bind_c_test_omp_get_max_task_priority
+  !........................................
+
+end module bind_c_mod_zev37mkecjdz
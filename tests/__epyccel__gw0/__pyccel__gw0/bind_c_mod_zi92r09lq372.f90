@@ -0,0 +1,47 @@
+module bind_c_mod_zi92r09lq372
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , c64 => &
+        C_DOUBLE_COMPLEX , i64 => C_INT64_T , C_F_Pointer , c_ptr
+  use mod_zi92r09lq372
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_my_sum_0000(bound_v, bound_v_shape_1, bound_v_stride_1 &
+        ) bind(c) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    type(c_ptr), value :: bound_v
+    integer(i64), value :: bound_v_shape_1
+    integer(i64), value :: bound_v_stride_1
+    real(f64), pointer :: v(:)
+
+    call C_F_Pointer(bound_v, v, [bound_v_shape_1 * bound_v_stride_1])
+    Out_0001 = my_sum_0000(v = v(1_i64::bound_v_stride_1))
+
+  end function bind_c_my_sum_0000
+  !........................................
+
+  !........................................
+  function bind_c_my_sum_0001(bound_v, bound_v_shape_1, bound_v_stride_1 &
+        ) bind(c) result(Out_0001)
+
+    implicit none
+
+    complex(c64) :: Out_0001
+    type(c_ptr), value :: bound_v
+    integer(i64), value :: bound_v_shape_1
+    integer(i64), value :: bound_v_stride_1
+    complex(c64), pointer :: v(:)
+
+    call C_F_Pointer(bound_v, v, [bound_v_shape_1 * bound_v_stride_1])
+    Out_0001 = my_sum_0001(v = v(1_i64::bound_v_stride_1))
+
+  end function bind_c_my_sum_0001
+  !........................................
+
+end module bind_c_mod_zi92r09lq372
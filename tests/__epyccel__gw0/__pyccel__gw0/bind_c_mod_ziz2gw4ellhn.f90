@@ -0,0 +1,23 @@
+module bind_c_mod_ziz2gw4ellhn
+
+  use, intrinsic :: ISO_C_Binding, only : c64 => C_DOUBLE_COMPLEX
+  use mod_ziz2gw4ellhn
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f20(a) bind(c) result(b)
+
+    implicit none
+
+    complex(c64) :: b
+    complex(c64), value :: a
+
+    b = f20(a = a)
+
+  end function bind_c_f20
+  !........................................
+
+end module bind_c_mod_ziz2gw4ellhn
@@ -0,0 +1,29 @@
+module bind_c_mod_znhgapzh2euu
+
+  use, intrinsic :: ISO_C_Binding, only : c_ptr , C_F_Pointer , i64 => &
+        C_INT64_T
+  use mod_znhgapzh2euu
+
+  implicit none
+
+  contains
+
+  !........................................
+  function bind_c_f2(bound_x, bound_x_shape_1, bound_x_stride_1) bind(c &
+        ) result(y)
+
+    implicit none
+
+    integer(i64) :: y
+    type(c_ptr), value :: bound_x
+    integer(i64), value :: bound_x_shape_1
+    integer(i64), value :: bound_x_stride_1
+    integer(i64), pointer :: x(:)
+
+    call C_F_Pointer(bound_x, x, [bound_x_shape_1 * bound_x_stride_1])
+    y = f2(x = x(1_i64::bound_x_stride_1))
+
+  end function bind_c_f2
+  !........................................
+
+end module bind_c_mod_znhgapzh2euu
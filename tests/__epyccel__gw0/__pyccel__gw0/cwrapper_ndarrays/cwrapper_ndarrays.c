@@ -0,0 +1,517 @@
+/* -------------------------------------------------------------------------------------- */
+/* This file is part of Pyccel which is released under MIT License. See the LICENSE file  */
+/* or go to https://github.com/pyccel/pyccel/blob/devel/LICENSE for full license details. */
+/* -------------------------------------------------------------------------------------- */
+
+#include <string.h>
+#include "cwrapper_ndarrays.h"
+
+/*
+ * Function : _numpy_to_ndarray_strides
+ * --------------------
+ * Convert numpy strides to nd_array strides, and save them in the provided
+ * array, to avoid the problem of different implementations of strides in
+ * numpy and ndarray.
+ * Parameters :
+ *     np_strides : npy_intp array
+ *     type_size  : data type enum
+ *     nd : size of the array
+ *     ndarray_strides : the array where the new strides values are saved
+ */
+static void	_numpy_to_ndarray_strides(npy_intp  *np_strides, int type_size, int nd, int64_t *ndarray_strides)
+{
+    for (int i = 0; i < nd; i++)
+        ndarray_strides[i] = (int64_t) np_strides[i] / type_size;
+}
+
+static void	_ndarray_to_numpy_strides(int64_t  *nd_strides, int32_t type_size, int nd, npy_intp *numpy_strides)
+{
+    for (int i = 0; i < nd; i++)
+        numpy_strides[i] = (npy_intp) nd_strides[i] * type_size;
+}
+
+
+/*
+ * Function : _numpy_to_ndarray_shape
+ * --------------------
+ * Copy numpy shape to nd_array shape, and save it in the provided array, to
+ * avoid the problem of variation of system architecture because numpy shape
+ * is not saved in fixed length type.
+ * Parameters :
+ *     np_shape : npy_intp array
+ *     nd : size of the array
+ *     nd_shape : the array where the shape is saved
+*/
+static void	_numpy_to_ndarray_shape(npy_intp  *np_shape, int nd, int64_t *nd_shape)
+{
+    for (int i = 0; i < nd; i++)
+        nd_shape[i] = (int64_t) np_shape[i];
+}
+
+static void	_ndarray_to_numpy_shape(int64_t *nd_shape, int nd, npy_intp *np_shape)
+{
+    for (int i = 0; i < nd; i++)
+        np_shape[i] = (npy_intp) nd_shape[i];
+}
+
+/*
+ * Function: _check_pyarray_dtype
+ * --------------------
+ * Check Python Object DataType:
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ *      dtype : desired data type enum
+ * 	Returns		:
+ *		return NULL if no error occurred otherwise it will return the
+ *      message to be reported in a TypeError exception
+ * reference of the used c/python api function
+ * -------------------------------------------
+ * https://numpy.org/doc/stable/reference/c-api/array.html#c.PyArray_TYPE
+ */
+static char*	_check_pyarray_dtype(PyArrayObject *a, int dtype)
+{
+	int current_dtype;
+
+	if (dtype == NO_TYPE_CHECK)
+		return NULL;
+
+	current_dtype = PyArray_TYPE(a);
+	if (current_dtype != dtype)
+	{
+        PyObject* current_type_name = PyObject_Str(PyArray_DESCR(a)->typeobj);
+        PyObject* expected_type_name = PyObject_Str(PyArray_TypeObjectFromType(dtype));
+        Py_ssize_t c_size;
+        const char* current_name = PyUnicode_AsUTF8AndSize(current_type_name, &c_size);
+        const char* expected_name = PyUnicode_AsUTF8AndSize(expected_type_name, &c_size);
+        char* error = (char *)malloc(200);
+        sprintf(error, "argument dtype must be %s, not %s",
+			expected_name,
+			current_name);
+		return error;
+	}
+
+	return NULL;
+}
+
+/*
+ * Function: _check_pyarray_rank
+ * --------------------
+ * Check Python Object Rank:
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ *      rank  : desired rank
+ * 	Returns		:
+ *		return NULL if no error occurred otherwise it will return the
+ *      message to be reported in a TypeError exception
+ * reference of the used c/python api function
+ * -------------------------------------------
+ * https://numpy.org/doc/stable/reference/c-api/array.html#c.PyArray_NDIM
+ */
+static char* _check_pyarray_rank(PyArrayObject *a, int rank)
+{
+	int	current_rank;
+
+	current_rank = PyArray_NDIM(a);
+	if (current_rank != rank)
+	{
+        char* error = (char *)malloc(200);
+        sprintf(error, "argument rank must be %d, not %d",
+			rank,
+			current_rank);
+		return error;
+	}
+
+	return NULL;
+}
+
+/*
+ * Function: _has_pyarray_order
+ * --------------------
+ * Check if the memory layout of a Python array matches the desired order:
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ *      flag  : desired order (a NumPy flag or STRIDED_C_ORDER/STRIDED_F_ORDER)
+ * 	Returns		:
+ *		true if the array has the desired order, false otherwise
+ */
+static bool _has_pyarray_order(PyArrayObject *a, int flag)
+{
+    if (flag == STRIDED_C_ORDER || flag == STRIDED_F_ORDER) {
+        int64_t shape[NPY_MAXDIMS];
+        int64_t strides[NPY_MAXDIMS];
+        return get_fortran_array_layout(a, shape, strides, flag == STRIDED_C_ORDER);
+    }
+    return PyArray_CHKFLAGS(a, flag);
+}
+
+/*
+ * Function: _check_pyarray_order
+ * --------------------
+ * Check Python Object Order:
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ *      flag  : desired order
+ * 	Returns		:
+ *		return NULL if no error occurred otherwise it will return the
+ *      message to be reported in a TypeError exception
+ * reference of the used c/python api function
+ * -------------------------------------------
+ * https://numpy.org/doc/stable/reference/c-api/array.html#c.PyArray_CHKFLAGS
+ */
+static char* _check_pyarray_order(PyArrayObject *a, int flag)
+{
+
+	if (flag == NO_ORDER_CHECK)
+		return NULL;
+
+	if (!_has_pyarray_order(a, flag))
+	{
+		char order = (flag == NPY_ARRAY_C_CONTIGUOUS || flag == STRIDED_C_ORDER ? 'C' :
+                     (flag == NPY_ARRAY_F_CONTIGUOUS || flag == STRIDED_F_ORDER ? 'F' : '?'));
+        char* error = (char *)malloc(200);
+		if ((flag == STRIDED_C_ORDER || flag == STRIDED_F_ORDER) && PyArray_NDIM(a) == 1)
+			sprintf(error, "argument cannot be passed without a copy (the step must be positive)");
+		else if (flag == STRIDED_C_ORDER || flag == STRIDED_F_ORDER)
+			sprintf(error, "argument cannot be passed without a copy (the steps must be positive and the ordering must be %c)", order);
+		else
+			sprintf(error, "argument does not have the expected ordering (%c)", order);
+		return error;
+	}
+
+	return NULL;
+}
+
+
+/*
+ * Function: _check_pyarray_type
+ * --------------------
+ * Check if Python Object is ArrayType:
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ *
+ * 	Returns		:
+ *		return NULL if no error occurred otherwise it will return the
+ *      message to be reported in a TypeError exception
+ * reference of the used c/python api function
+ * -------------------------------------------
+ * https://numpy.org/doc/stable/reference/c-api/array.html#c.PyArray_Check
+ */
+static char* _check_pyarray_type(PyObject *a)
+{
+	if (!PyArray_Check(a))
+	{
+        char* error = (char *)malloc(200);
+        sprintf(error, "argument must be numpy.ndarray, not %s",
+			 a == Py_None ? "None" : Py_TYPE(a)->tp_name);
+        return error;
+	}
+
+	return NULL;
+}
+
+enum NPY_TYPES get_numpy_type(t_ndarray o)
+{
+    enum e_types nd_type = o.type;
+    enum NPY_TYPES npy_type;
+    switch (nd_type)
+    {
+        case nd_bool:
+            npy_type = NPY_BOOL;
+            break;
+        case nd_int8:
+            npy_type = NPY_INT8;
+            break;
+        case nd_int16:
+            npy_type = NPY_INT16;
+            break;
+        case nd_int32:
+            npy_type = NPY_INT32;
+            break;
+        case nd_int64:
+            npy_type = NPY_INT64;
+            break;
+        case nd_float:
+            npy_type = NPY_FLOAT;
+            break;
+        case nd_double:
+            npy_type = NPY_DOUBLE;
+            break;
+        case nd_cfloat:
+            npy_type = NPY_CFLOAT;
+            break;
+        case nd_cdouble:
+            npy_type = NPY_CDOUBLE;
+            break;
+        default:
+            printf("Unknown data type\n");
+            exit(1);
+    }
+    return npy_type;
+}
+
+enum e_types get_ndarray_type(PyArrayObject *a)
+{
+    enum NPY_TYPES npy_type = PyArray_TYPE(a);
+    enum e_types nd_type;
+    switch (npy_type)
+    {
+        case NPY_BOOL:
+            nd_type = nd_bool;
+            break;
+        case NPY_INT8:
+            nd_type = nd_int8;
+            break;
+        case NPY_INT16:
+            nd_type = nd_int16;
+            break;
+        case NPY_INT32:
+            nd_type = nd_int32;
+            break;
+        case NPY_INT64:
+            nd_type = nd_int64;
+            break;
+        case NPY_FLOAT:
+            nd_type = nd_float;
+            break;
+        case NPY_DOUBLE:
+            nd_type = nd_double;
+            break;
+        case NPY_CFLOAT:
+            nd_type = nd_cfloat;
+            break;
+        case NPY_CDOUBLE:
+            nd_type = nd_cdouble;
+            break;
+        default:
+            printf("Unknown data type\n");
+            exit(1);
+    }
+    return nd_type;
+}
+
+/* converting numpy array to c nd array*/
+t_ndarray	pyarray_to_ndarray(PyObject *o)
+{
+    PyArrayObject* a = (PyArrayObject*) o;
+	t_ndarray		array;
+
+	array.nd          = PyArray_NDIM(a);
+	array.raw_data    = PyArray_DATA(a);
+	array.type_size   = PyArray_ITEMSIZE(a);
+	array.type        = get_ndarray_type(a);
+	array.length      = PyArray_SIZE(a);
+	array.buffer_size = PyArray_NBYTES(a);
+	_numpy_to_ndarray_shape(PyArray_SHAPE(a), array.nd, array.shape);
+	_numpy_to_ndarray_strides(PyArray_STRIDES(a), array.type_size, array.nd, array.strides);
+	array.order       = PyArray_CHKFLAGS(a, NPY_ARRAY_C_CONTIGUOUS) ? order_c : order_f;
+
+	array.is_view     = 1;
+
+	return array;
+}
+
+PyObject* ndarray_to_pyarray(t_ndarray o)
+{
+    int FLAGS;
+    if (o.nd == 1) {
+        FLAGS = NPY_ARRAY_F_CONTIGUOUS | NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_WRITEABLE;
+    }
+    else if (o.order == order_c) {
+        FLAGS = NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_WRITEABLE;
+    }
+    else if (o.order == order_f) {
+        FLAGS = NPY_ARRAY_C_CONTIGUOUS | NPY_ARRAY_WRITEABLE;
+    }
+    else {
+        FLAGS = NPY_ARRAY_WRITEABLE;
+    }
+
+    enum NPY_TYPES npy_type = get_numpy_type(o);
+
+    npy_intp shape[MAX_NDIM];
+    npy_intp strides[MAX_NDIM];
+    _ndarray_to_numpy_shape(o.shape, o.nd, shape);
+    _ndarray_to_numpy_strides(o.strides, o.type_size, o.nd, strides);
+
+    return PyArray_NewFromDescr(&PyArray_Type, PyArray_DescrFromType(npy_type),
+            o.nd, shape, strides, o.raw_data, FLAGS, NULL);
+}
+
+/*
+ * Function: pyarray_check
+ * --------------------
+ * Check Python Object (DataType, Rank, Order):
+ *
+ * 	Parameters	:
+ * 	    name  : the name of the argument (used for error output)
+ *		a 	  : python array object
+ *      dtype : desired data type enum
+ *		rank  : desired rank
+ *		flag  : desired order flag
+ * 	Returns		:
+ *		return true if no error occurred otherwise it will return false
+ */
+bool	pyarray_check(char* name, PyObject *o, int dtype, int rank, int flag)
+{
+    char* array_type = _check_pyarray_type(o);
+	if (array_type != NULL) {
+		PyErr_Format(PyExc_TypeError, array_type);
+        free(array_type);
+        return false;
+    }
+
+    PyArrayObject* a = (PyArrayObject*)o;
+
+    bool correct_type = true;
+    char error[800];
+    sprintf(error, "Wrong argument type for argument %s : ", name);
+
+	// check array element type / rank / order
+    char* array_dtype = _check_pyarray_dtype(a, dtype);
+    if (array_dtype != NULL) {
+        strcat(error, array_dtype);
+        free(array_dtype);
+        correct_type = false;
+    }
+
+    char* array_rank = _check_pyarray_rank(a, rank);
+    if (array_rank != NULL) {
+        if (!correct_type)
+            strcat(error, ", ");
+        strcat(error, array_rank);
+        free(array_rank);
+        correct_type = false;
+    }
+
+    if (rank > 1 || flag != NO_ORDER_CHECK) {
+        char* array_order = _check_pyarray_order(a, flag);
+        if (array_order != NULL) {
+            if (!correct_type)
+                strcat(error, ", ");
+            strcat(error, array_order);
+            free(array_order);
+            correct_type = false;
+        }
+    }
+
+    if (!correct_type) {
+		PyErr_SetString(PyExc_TypeError, error);
+    }
+    return correct_type;
+}
+
+bool	is_numpy_array(PyObject *o, int dtype, int rank, int flag)
+{
+    // No error messages are built here as this function is called for each
+    // candidate type when choosing the specialisation of an interface
+    if (!PyArray_Check(o))
+        return false;
+
+    PyArrayObject* a = (PyArrayObject*)o;
+
+    // check array element type / rank / order
+    if (dtype != NO_TYPE_CHECK && PyArray_TYPE(a) != dtype)
+        return false;
+
+    if (PyArray_NDIM(a) != rank)
+        return false;
+
+    if (flag != NO_ORDER_CHECK && !_has_pyarray_order(a, flag))
+        return false;
+
+    return true;
+}
+
+/*
+ * Function: nd_ndim
+ * --------------------
+ * Return the shape in the n dimension.
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ *      index : dimension index
+ * 	Returns		:
+ *		return 0 if object is NULL or shape at indexed dimension
+ * reference of the used c/numpy api function
+ * -------------------------------------------
+ * https://numpy.org/doc/1.17/reference/c-api.array.html#c.PyArray_DIM
+ */
+int64_t nd_ndim(t_ndarray *a, int n)
+{
+	if (a == NULL)
+		return 0;
+
+	return a->shape[n];
+}
+
+
+/*
+ * Function: nd_data
+ * --------------------
+ * Return data pointed by array
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ * 	Returns		:
+ *		return NULL if object is NULL or the data of the array
+ * reference of the used c/numpy api function
+ * -------------------------------------------
+ * https://numpy.org/doc/1.17/reference/c-api.array.html#c.PyArray_DIM
+ */
+void    *nd_data(t_ndarray *a)
+{
+	if (a == NULL)
+		return NULL;
+
+	return a->raw_data;
+}
+
+/*
+ * Function: nd_step_C
+ * --------------------
+ * Return the step in the nth dimension for a C-ordered array (decreasing strides)
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ * 		index	  : dimension index
+ * 	Returns		:
+ *		return 1 if object is NULL or the step along the indexed dimension
+ */
+int64_t nd_nstep_C(t_ndarray *a, int n)
+{
+	if (a == NULL || a->length == 0)
+		return 1;
+
+	int64_t step = a->strides[n];
+	for (int i = n+1; i<a->nd; ++i) {
+		step /= a->shape[i];
+	}
+	return step > 0 ? step : 1;
+}
+/*
+ * Function: nd_step_F
+ * --------------------
+ * Return the step in the nth dimension for a F-ordered array (increasing strides)
+ *
+ * 	Parameters	:
+ *		a 	  : python array object
+ * 		index	  : dimension index
+ * 	Returns		:
+ *		return 1 if object is NULL or the step along the indexed dimension
+ */
+int64_t nd_nstep_F(t_ndarray *a, int n)
+{
+	if (a == NULL || a->length == 0)
+		return 1;
+
+	int64_t step = a->strides[n];
+	for (int i = 0; i<n; ++i) {
+		step /= a->shape[i];
+	}
+	return step > 0 ? step : 1;
+}
@@ -0,0 +1,10 @@
+#ifndef MOD_005DPZ0FSQSO_H
+#define MOD_005DPZ0FSQSO_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t get_min(int64_t a, int64_t b);
+#endif // mod_005dpz0fsqso_H
@@ -0,0 +1,11 @@
+#ifndef MOD_01349TA7XT85_H
+#define MOD_01349TA7XT85_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_2(t_ndarray a);
+#endif // mod_01349ta7xt85_H
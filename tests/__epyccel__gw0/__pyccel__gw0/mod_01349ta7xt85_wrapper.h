@@ -0,0 +1,42 @@
+#ifndef MOD_01349TA7XT85_WRAPPER_H
+#define MOD_01349TA7XT85_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_01349ta7xt85.h"
+
+
+#ifdef MOD_01349TA7XT85_WRAPPER
+
+
+#else
+
+static void** Pymod_01349ta7xt85_API;
+
+
+/*........................................*/
+static int mod_01349ta7xt85_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_01349ta7xt85_API = (void**)PyCapsule_Import("mod_01349ta7xt85._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_01349ta7xt85_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_01349TA7XT85_WRAPPER_H
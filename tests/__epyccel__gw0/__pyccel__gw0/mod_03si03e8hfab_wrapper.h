@@ -0,0 +1,42 @@
+#ifndef MOD_03SI03E8HFAB_WRAPPER_H
+#define MOD_03SI03E8HFAB_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_03si03e8hfab.h"
+
+
+#ifdef MOD_03SI03E8HFAB_WRAPPER
+
+
+#else
+
+static void** Pymod_03si03e8hfab_API;
+
+
+/*........................................*/
+static int mod_03si03e8hfab_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_03si03e8hfab_API = (void**)PyCapsule_Import("mod_03si03e8hfab._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_03si03e8hfab_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_03SI03E8HFAB_WRAPPER_H
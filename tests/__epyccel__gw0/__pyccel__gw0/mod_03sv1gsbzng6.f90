@@ -0,0 +1,37 @@
+module mod_03sv1gsbzng6
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function combined_for_simd() result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    integer(i64) :: x(0_i64:7_i64)
+    integer(i64) :: y(0_i64:7_i64)
+    integer(i64) :: z(0_i64:7_i64)
+    integer(i64) :: i
+
+    x = [1_i64, 2_i64, 1_i64, 2_i64, 1_i64, 2_i64, 1_i64, 2_i64]
+    y = [2_i64, 1_i64, 2_i64, 1_i64, 2_i64, 1_i64, 2_i64, 1_i64]
+    z = 0_i64
+    func_result = 0_i64
+    !$omp parallel do simd
+    do i = 0_i64, 7_i64
+      z(i) = x(i) + y(i)
+    end do
+    !$omp end parallel do simd
+    do i = 0_i64, 7_i64
+      func_result = func_result + z(i)
+    end do
+    return
+
+  end function combined_for_simd
+  !........................................
+
+end module mod_03sv1gsbzng6
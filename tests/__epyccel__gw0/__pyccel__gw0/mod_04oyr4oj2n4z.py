@@ -0,0 +1,6 @@
+
+def set_With_list():
+    a = [1.6, 6.3, 7.2]
+    b = set(a)
+    return b
+
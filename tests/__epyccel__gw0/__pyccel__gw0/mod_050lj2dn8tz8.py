@@ -0,0 +1,4 @@
+
+def array_float_2d_F_scalar_mul(x : 'float[::,::](order=F)', a : 'float'):
+    x[::,::] *= a
+
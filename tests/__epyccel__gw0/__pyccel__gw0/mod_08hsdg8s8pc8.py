@@ -0,0 +1,10 @@
+from pyccel.decorators import allow_negative_index
+
+@allow_negative_index('a')
+def var_negative_index(n : 'int', idx : 'int'):
+    from numpy import empty
+    a = empty((n), dtype = int)
+    for i in range(0, n, 1):
+        a[i] = i
+    return a[idx]
+
@@ -0,0 +1,17 @@
+#include "mod_08s2quya7rz4.h"
+
+
+/*........................................*/
+bool non_negative(int64_t i)
+{
+    if (i < INT64_C(0))
+    {
+        return 0;
+    }
+    else
+    {
+        return 1;
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_08S2QUYA7RZ4_H
+#define MOD_08S2QUYA7RZ4_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+bool non_negative(int64_t i);
+#endif // mod_08s2quya7rz4_H
@@ -0,0 +1,19 @@
+#include "mod_0al1ewo1tka9.h"
+
+
+/*........................................*/
+int64_t omp_master(void)
+{
+    int64_t func_result;
+    func_result = INT64_C(30);
+    #pragma omp parallel num_threads(3) reduction(+: func_result)
+    {
+        #pragma omp master
+        {
+            func_result += INT64_C(1);
+        }
+    }
+    return func_result;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_0AL1EWO1TKA9_H
+#define MOD_0AL1EWO1TKA9_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_master(void);
+#endif // mod_0al1ewo1tka9_H
@@ -0,0 +1,11 @@
+#ifndef MOD_0CPWAL3IB0UK_H
+#define MOD_0CPWAL3IB0UK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_mul_homogeneous4(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_0cpwal3ib0uk_H
@@ -0,0 +1,12 @@
+#include "mod_0d3fvfuv27i9.h"
+
+
+/*........................................*/
+int32_t test_omp_get_proc_bind(void)
+{
+    int32_t bind_var;
+    bind_var = omp_get_proc_bind();
+    return bind_var;
+}
+/*........................................*/
+
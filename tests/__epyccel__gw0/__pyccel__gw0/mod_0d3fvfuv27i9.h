@@ -0,0 +1,11 @@
+#ifndef MOD_0D3FVFUV27I9_H
+#define MOD_0D3FVFUV27I9_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_proc_bind(void);
+#endif // mod_0d3fvfuv27i9_H
@@ -0,0 +1,15 @@
+#include "mod_0e4rgej0e0z3.h"
+
+
+/*........................................*/
+bool pop_last_element(void)
+{
+    vec_bool a = {0};
+    bool Out_0001;
+    a = c_init(vec_bool, {1, 0, 1});
+    Out_0001 = vec_bool_pull(&a);
+    vec_bool_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,31 @@
+#ifndef MOD_0E4RGEJ0E0Z3_H
+#define MOD_0E4RGEJ0E0Z3_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_BOOL
+#define _TOOLS_LIST_VEC_BOOL
+#define i_type vec_bool
+#define i_key bool
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_BOOL
+
+#ifndef _TOOLS_LIST_VEC_BOOL
+#define _TOOLS_LIST_VEC_BOOL
+#define i_type vec_bool
+#define i_key bool
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_BOOL
+
+
+
+
+bool pop_last_element(void);
+#endif // mod_0e4rgej0e0z3_H
@@ -0,0 +1,20 @@
+#include "mod_0hbih67iq3bv.h"
+
+
+/*........................................*/
+int64_t add_element_range(void)
+{
+    hset_int64_t a = {0};
+    int64_t i;
+    int64_t Out_0001;
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3)});
+    for (i = INT64_C(50); i < INT64_C(100); i += INT64_C(1))
+    {
+        hset_int64_t_push(&a, i);
+    }
+    Out_0001 = hset_int64_t_size(&a);
+    hset_int64_t_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
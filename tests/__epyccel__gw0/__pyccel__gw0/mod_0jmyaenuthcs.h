@@ -0,0 +1,11 @@
+#ifndef MOD_0JMYAENUTHCS_H
+#define MOD_0JMYAENUTHCS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_div(t_ndarray x, int32_t a);
+#endif // mod_0jmyaenuthcs_H
@@ -0,0 +1,5 @@
+
+def f(a : 'float[::,::,::,::]'):
+    Dummy_0000 = min(sum(min(max(a[i,k,o,l] * l for i in range(0, 5, 1)) for k in range(0, 5, 1)) for o in range(0, 5, 1)) for l in range(0, 5, 1))
+    return min((Dummy_0000, 0.0))
+
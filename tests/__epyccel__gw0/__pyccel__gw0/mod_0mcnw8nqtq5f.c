@@ -0,0 +1,60 @@
+#include "mod_0mcnw8nqtq5f.h"
+
+
+/*........................................*/
+void array_int_2d_scalar_add_0000(t_ndarray x, int8_t a, int64_t d1, int64_t d2)
+{
+    int64_t i;
+    int64_t j;
+    for (i = INT64_C(0); i < d1; i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < d2; j += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_int8, i, j) += a;
+        }
+    }
+}
+/*........................................*/
+/*........................................*/
+void array_int_2d_scalar_add_0001(t_ndarray x, int16_t a, int64_t d1, int64_t d2)
+{
+    int64_t i;
+    int64_t j;
+    for (i = INT64_C(0); i < d1; i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < d2; j += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_int16, i, j) += a;
+        }
+    }
+}
+/*........................................*/
+/*........................................*/
+void array_int_2d_scalar_add_0002(t_ndarray x, int32_t a, int64_t d1, int64_t d2)
+{
+    int64_t i;
+    int64_t j;
+    for (i = INT64_C(0); i < d1; i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < d2; j += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_int32, i, j) += a;
+        }
+    }
+}
+/*........................................*/
+/*........................................*/
+void array_int_2d_scalar_add_0003(t_ndarray x, int64_t a, int64_t d1, int64_t d2)
+{
+    int64_t i;
+    int64_t j;
+    for (i = INT64_C(0); i < d1; i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < d2; j += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_int64, i, j) += a;
+        }
+    }
+}
+/*........................................*/
+
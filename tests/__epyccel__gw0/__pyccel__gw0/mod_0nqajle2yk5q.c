@@ -0,0 +1,12 @@
+#include "mod_0nqajle2yk5q.h"
+
+
+/*........................................*/
+double f1(void)
+{
+    double value;
+    value = pow((INT64_C(2) * M_PI), (3.0 / 2.0));
+    return value;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_0NQAJLE2YK5Q_H
+#define MOD_0NQAJLE2YK5Q_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f1(void);
+#endif // mod_0nqajle2yk5q_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_0NQAJLE2YK5Q_WRAPPER
+
+#include "mod_0nqajle2yk5q_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double value;
+    PyObject* value_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    value = f1();
+    value_obj = Double_to_PyDouble(&value);
+    return value_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_0nqajle2yk5q_methods[] = {
+    {
+        "f1",
+        (PyCFunction)f1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_0nqajle2yk5q_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_0nqajle2yk5q",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_0nqajle2yk5q_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_0nqajle2yk5q(void)
+{
+    PyObject* mod;
+    static void* Pymod_0nqajle2yk5q_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_0nqajle2yk5q_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_0nqajle2yk5q_API, "mod_0nqajle2yk5q._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_0O5GZYS44IUS_H
+#define MOD_0O5GZYS44IUS_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_in_bool_out_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri);
+#endif // mod_0o5gzys44ius_H
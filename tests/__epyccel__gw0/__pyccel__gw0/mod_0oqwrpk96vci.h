@@ -0,0 +1,11 @@
+#ifndef MOD_0OQWRPK96VCI_H
+#define MOD_0OQWRPK96VCI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t expr_negative_index(int64_t n, int64_t idx_1, int64_t idx_2);
+#endif // mod_0oqwrpk96vci_H
@@ -0,0 +1,115 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_0OQWRPK96VCI_WRAPPER
+
+#include "mod_0oqwrpk96vci_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* expr_negative_index_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* n_obj;
+    PyObject* idx_1_obj;
+    PyObject* idx_2_obj;
+    int64_t n;
+    int64_t idx_1;
+    int64_t idx_2;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "n",
+        "idx_1",
+        "idx_2",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &n_obj, &idx_1_obj, &idx_2_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    if (PyIs_NativeInt(idx_1_obj))
+    {
+        idx_1 = PyInt64_to_Int64(idx_1_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument idx_1");
+        return NULL;
+    }
+    if (PyIs_NativeInt(idx_2_obj))
+    {
+        idx_2 = PyInt64_to_Int64(idx_2_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument idx_2");
+        return NULL;
+    }
+    Out_0001 = expr_negative_index(n, idx_1, idx_2);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_0oqwrpk96vci_methods[] = {
+    {
+        "expr_negative_index",
+        (PyCFunction)expr_negative_index_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_0oqwrpk96vci_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_0oqwrpk96vci",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_0oqwrpk96vci_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_0oqwrpk96vci(void)
+{
+    PyObject* mod;
+    static void* Pymod_0oqwrpk96vci_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_0oqwrpk96vci_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_0oqwrpk96vci_API, "mod_0oqwrpk96vci._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
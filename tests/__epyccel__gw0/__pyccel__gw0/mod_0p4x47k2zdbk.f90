@@ -0,0 +1,26 @@
+module mod_0p4x47k2zdbk
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use Set_real8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine Discard_int(se) 
+
+    implicit none
+
+    type(Set_real8), intent(out) :: se
+    integer(i64) :: Dummy_0000
+
+    se = Set_real8([2.7_f64, 4.3_f64, 9.2_f64])
+    Dummy_0000 = se % erase_value(4.3_f64)
+    return
+
+  end subroutine Discard_int
+  !........................................
+
+end module mod_0p4x47k2zdbk
@@ -0,0 +1,40 @@
+#include "mod_0s9ovfqkd7gx.h"
+
+
+/*........................................*/
+int64_t arrs_1d_negative_index_2(int64_t* Out_0001, double* Out_0002)
+{
+    double array_dummy[INT64_C(10)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(10)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    double array_dummy_0001[INT64_C(8)];
+    t_ndarray b = (t_ndarray){
+        .nd_double=array_dummy_0001,
+        .shape={INT64_C(8)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    int64_t i;
+    array_fill((double)1.0, a);
+    {
+        double* restrict a_data = a.nd_double;
+        double* restrict b_data = b.nd_double;
+        for (i = INT64_C(0); i < INT64_C(8); i += INT64_C(1))
+        {
+            b_data[i] = a_data[i + INT64_C(1)] + a_data[i + INT64_C(2)];
+        }
+    }
+    (*Out_0001) = INT64_C(8);
+    (*Out_0002) = numpy_sum_float64(b);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_0S9OVFQKD7GX_H
+#define MOD_0S9OVFQKD7GX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_1d_negative_index_2(int64_t* Out_0001, double* Out_0002);
+#endif // mod_0s9ovfqkd7gx_H
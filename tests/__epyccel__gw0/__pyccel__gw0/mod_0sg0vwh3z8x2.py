@@ -0,0 +1,6 @@
+
+def f():
+    a = [True, False, False, True, False]
+    a.sort()
+    return a
+
@@ -0,0 +1,10 @@
+#include "mod_0sxkfyye96bj.h"
+
+
+/*........................................*/
+double f1(void)
+{
+    return M_PI;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_0SXKFYYE96BJ_H
+#define MOD_0SXKFYYE96BJ_H
+
+#include <math.h>
+#include <stdlib.h>
+
+
+
+double f1(void);
+#endif // mod_0sxkfyye96bj_H
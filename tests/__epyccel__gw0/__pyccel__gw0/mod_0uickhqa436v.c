@@ -0,0 +1,54 @@
+#include "mod_0uickhqa436v.h"
+
+
+/*........................................*/
+int64_t combined_for_simd(void)
+{
+    int64_t array_dummy[INT64_C(8)];
+    t_ndarray x = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(8)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t array_dummy_0001[INT64_C(8)];
+    t_ndarray y = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(8)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t array_dummy_0002[INT64_C(8)];
+    t_ndarray z = (t_ndarray){
+        .nd_int64=array_dummy_0002,
+        .shape={INT64_C(8)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&z);
+    int64_t i;
+    int64_t func_result;
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2)};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 8 * x.type_size);
+    int64_t Dummy_0001[] = {INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1), INT64_C(2), INT64_C(1)};
+    memcpy(&y.nd_int64[INT64_C(0)], Dummy_0001, 8 * y.type_size);
+    array_fill((int64_t)INT64_C(0), z);
+    func_result = INT64_C(0);
+    #pragma omp parallel for simd
+    for (i = INT64_C(0); i < INT64_C(8); i += INT64_C(1))
+    {
+        z.nd_int64[i] = x.nd_int64[i] + y.nd_int64[i];
+    }
+    for (i = INT64_C(0); i < INT64_C(8); i += INT64_C(1))
+    {
+        func_result = func_result + z.nd_int64[i];
+    }
+    return func_result;
+}
+/*........................................*/
+
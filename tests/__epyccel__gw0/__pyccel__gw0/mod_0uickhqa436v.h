@@ -0,0 +1,12 @@
+#ifndef MOD_0UICKHQA436V_H
+#define MOD_0UICKHQA436V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t combined_for_simd(void);
+#endif // mod_0uickhqa436v_H
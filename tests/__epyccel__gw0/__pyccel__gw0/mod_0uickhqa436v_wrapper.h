@@ -0,0 +1,40 @@
+#ifndef MOD_0UICKHQA436V_WRAPPER_H
+#define MOD_0UICKHQA436V_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_0uickhqa436v.h"
+
+
+#ifdef MOD_0UICKHQA436V_WRAPPER
+
+
+#else
+
+static void** Pymod_0uickhqa436v_API;
+
+
+/*........................................*/
+static int mod_0uickhqa436v_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_0uickhqa436v_API = (void**)PyCapsule_Import("mod_0uickhqa436v._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_0uickhqa436v_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_0UICKHQA436V_WRAPPER_H
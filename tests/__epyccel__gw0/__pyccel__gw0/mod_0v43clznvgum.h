@@ -0,0 +1,11 @@
+#ifndef MOD_0V43CLZNVGUM_H
+#define MOD_0V43CLZNVGUM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_sum_stack_array(void);
+#endif // mod_0v43clznvgum_H
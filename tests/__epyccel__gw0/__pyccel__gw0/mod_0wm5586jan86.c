@@ -0,0 +1,27 @@
+#include "mod_0wm5586jan86.h"
+
+
+/*........................................*/
+double set_iter_prod(void)
+{
+    hset_int64_t a = {0};
+    hset_double b = {0};
+    int64_t ai;
+    double bi;
+    double assemble;
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6), INT64_C(7), INT64_C(8), INT64_C(9), INT64_C(12)});
+    b = c_init(hset_double, {2.0, 4.0, 9.0, 2.5, 8.3});
+    assemble = 0.0;
+    c_foreach (Dummy_0000, hset_int64_t, a){
+        ai = (*Dummy_0000.ref);
+        c_foreach (Dummy_0001, hset_double, b){
+            bi = (*Dummy_0001.ref);
+            assemble += ai * bi;
+        }
+    }
+    hset_double_drop(&b);
+    hset_int64_t_drop(&a);
+    return assemble;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_0X6EL21CE6MZ_H
+#define MOD_0X6EL21CE6MZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f3(t_ndarray x, int64_t* n, int64_t* m, int64_t* p, double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_0x6el21ce6mz_H
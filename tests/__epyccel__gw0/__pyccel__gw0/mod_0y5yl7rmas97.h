@@ -0,0 +1,11 @@
+#ifndef MOD_0Y5YL7RMAS97_H
+#define MOD_0Y5YL7RMAS97_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_0y5yl7rmas97_H
@@ -0,0 +1,21 @@
+module mod_0ybsmfl44osz
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine p_func(x) 
+
+    implicit none
+
+    integer(i64), value :: x
+
+    x = x * 2_i64
+
+  end subroutine p_func
+  !........................................
+
+end module mod_0ybsmfl44osz
@@ -0,0 +1,11 @@
+#ifndef MOD_0Z2YLLS135T0_H
+#define MOD_0Z2YLLS135T0_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_add_inhomogeneous_variables(int64_t* Out_0001, int64_t* Out_0002, bool* Out_0003, int64_t* Out_0004, int64_t* Out_0005, bool* Out_0006);
+#endif // mod_0z2ylls135t0_H
@@ -0,0 +1,13 @@
+from numpy import shape
+
+def omp_matmul(A : 'float[::,::]', x : 'float[::,::]', out : 'float[::,::]'):
+    #$omp parallel shared(A, x, out) private(i, j, k)
+    #$omp for
+    for i in range(0, shape(A)[0], 1):
+        for j in range(0, shape(x)[1], 1):
+            for k in range(0, shape(x)[0], 1):
+                out[i,j] += A[i,k] * x[k,j]
+    #$omp end parallel
+    # to let the function compile using epyccel issue #468 
+    """bypass issue #468"""
+
@@ -0,0 +1,12 @@
+#ifndef MOD_121BHHRV1X8R_H
+#define MOD_121BHHRV1X8R_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_4(t_ndarray a, t_ndarray b);
+#endif // mod_121bhhrv1x8r_H
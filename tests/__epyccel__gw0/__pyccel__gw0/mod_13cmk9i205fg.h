@@ -0,0 +1,11 @@
+#ifndef MOD_13CMK9I205FG_H
+#define MOD_13CMK9I205FG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_add(t_ndarray x, double a);
+#endif // mod_13cmk9i205fg_H
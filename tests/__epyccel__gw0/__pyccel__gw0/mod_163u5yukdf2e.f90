@@ -0,0 +1,38 @@
+module mod_163u5yukdf2e
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function directive_in_else(x) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: x
+    integer(i64) :: func_result
+    integer(i64) :: i
+
+    func_result = 0_i64
+    if (x < 30_i64) then
+      Out_0001 = x
+      return
+    else
+      !$omp parallel
+      !$omp do reduction(+: func_result)
+      do i = 0_i64, x - 1_i64
+        func_result = func_result + i
+      end do
+      !$omp end do
+      !$omp end parallel
+    end if
+    Out_0001 = func_result
+    return
+
+  end function directive_in_else
+  !........................................
+
+end module mod_163u5yukdf2e
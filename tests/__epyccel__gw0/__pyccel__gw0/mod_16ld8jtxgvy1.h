@@ -0,0 +1,12 @@
+#ifndef MOD_16LD8JTXGVY1_H
+#define MOD_16LD8JTXGVY1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_2d_C_array_initialization(t_ndarray a);
+#endif // mod_16ld8jtxgvy1_H
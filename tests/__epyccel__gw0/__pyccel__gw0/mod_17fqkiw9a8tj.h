@@ -0,0 +1,11 @@
+#ifndef MOD_17FQKIW9A8TJ_H
+#define MOD_17FQKIW9A8TJ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_17fqkiw9a8tj_H
@@ -0,0 +1,16 @@
+#include "mod_1azw3aakrv0j.h"
+
+
+/*........................................*/
+int64_t Pop_int(int64_t* el1, int64_t* el2, int64_t* el3)
+{
+    hset_int64_t se = {0};
+    se = c_init(hset_int64_t, {INT64_C(2), INT64_C(4), INT64_C(9)});
+    (*el1) = hset_int64_t_pop(&se);
+    (*el2) = hset_int64_t_pop(&se);
+    (*el3) = hset_int64_t_pop(&se);
+    hset_int64_t_drop(&se);
+    return 0;
+}
+/*........................................*/
+
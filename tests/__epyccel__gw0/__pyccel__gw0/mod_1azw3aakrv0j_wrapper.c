@@ -0,0 +1,90 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_1AZW3AAKRV0J_WRAPPER
+
+#include "mod_1azw3aakrv0j_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* Pop_int_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* el1_obj;
+    int64_t el1;
+    PyObject* el2_obj;
+    int64_t el2;
+    PyObject* el3_obj;
+    int64_t el3;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Pop_int(&el1, &el2, &el3);
+    el1_obj = Int64_to_PyLong(&el1);
+    el2_obj = Int64_to_PyLong(&el2);
+    el3_obj = Int64_to_PyLong(&el3);
+    Out_obj = Py_BuildValue("OOO", el1_obj, el2_obj, el3_obj);
+    Py_DECREF(el1_obj);
+    Py_DECREF(el2_obj);
+    Py_DECREF(el3_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_1azw3aakrv0j_methods[] = {
+    {
+        "Pop_int",
+        (PyCFunction)Pop_int_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_1azw3aakrv0j_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_1azw3aakrv0j",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_1azw3aakrv0j_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_1azw3aakrv0j(void)
+{
+    PyObject* mod;
+    static void* Pymod_1azw3aakrv0j_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_1azw3aakrv0j_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_1azw3aakrv0j_API, "mod_1azw3aakrv0j._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
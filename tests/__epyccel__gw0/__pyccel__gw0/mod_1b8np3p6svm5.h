@@ -0,0 +1,11 @@
+#ifndef MOD_1B8NP3P6SVM5_H
+#define MOD_1B8NP3P6SVM5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double first(t_ndarray x);
+#endif // mod_1b8np3p6svm5_H
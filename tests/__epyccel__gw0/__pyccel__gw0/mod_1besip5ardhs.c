@@ -0,0 +1,24 @@
+#include "mod_1besip5ardhs.h"
+
+
+/*........................................*/
+void array_float_1d_complex_3d_expr(t_ndarray x, t_ndarray y)
+{
+    int64_t array_dummy[INT64_C(3)];
+    t_ndarray z = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(3)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&z);
+    int64_t i;
+    array_fill((int64_t)INT64_C(5), z);
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_double, i) = floor(GET_ELEMENT(x, nd_double, i) / GET_ELEMENT(y, nd_double, i)) * GET_ELEMENT(x, nd_double, i) + GET_ELEMENT(z, nd_int64, i);
+    }
+}
+/*........................................*/
+
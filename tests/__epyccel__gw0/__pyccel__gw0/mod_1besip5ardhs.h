@@ -0,0 +1,12 @@
+#ifndef MOD_1BESIP5ARDHS_H
+#define MOD_1BESIP5ARDHS_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_1d_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_1besip5ardhs_H
@@ -0,0 +1,7 @@
+from numpy import shape
+
+def f(a0 : 'int[::]'):
+    v = sum(a0[i] for i in range(0, shape(a0)[0], 1))
+    v = sum(a0[i] for i in range(0, shape(a0)[0], 1))
+    return v
+
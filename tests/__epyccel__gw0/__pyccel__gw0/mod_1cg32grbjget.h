@@ -0,0 +1,11 @@
+#ifndef MOD_1CG32GRBJGET_H
+#define MOD_1CG32GRBJGET_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int32_index(void);
+#endif // mod_1cg32grbjget_H
@@ -0,0 +1,58 @@
+module mod_1cr1mcing3zf
+
+  use, intrinsic :: ISO_C_Binding, only : c64 => C_DOUBLE_COMPLEX , f64 &
+        => C_DOUBLE , i64 => C_INT64_T
+  use pyc_tools_f90
+  use Set_complex8_mod
+  use Set_complex8_extensions_mod
+  use Vector_complex8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine update_complex_list(Out_0001, Out_0002, Out_0003, Out_0004, &
+        Out_0005, Out_0006, Out_0007)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    complex(c64), intent(out) :: Out_0002
+    complex(c64), intent(out) :: Out_0003
+    complex(c64), intent(out) :: Out_0004
+    complex(c64), intent(out) :: Out_0005
+    complex(c64), intent(out) :: Out_0006
+    complex(c64), intent(out) :: Out_0007
+    type(Set_complex8) :: a
+    type(Vector_complex8) :: b
+    complex(c64) :: Dummy_0000
+    integer(i64) :: Dummy_0001
+
+    a = Set_complex8([cmplx(0,1, kind = c64), (2.0_f64, 3.0_f64), ( &
+          0.0_f64, 0.0_f64)])
+    b = Vector_complex8([(0.0_f64, 4.0_f64), (0.0_f64, 5.0_f64), ( &
+          1.0_f64, 6.0_f64)])
+    do Dummy_0001 = 0_i64, b % size() - 1_i64
+      Dummy_0000 = b%of(Dummy_0001 + 1_i64)
+      call a % insert( Dummy_0000 )
+    end do
+    Out_0001 = a % size()
+    Out_0002 = Set_complex8_pop(a)
+
+    Out_0003 = Set_complex8_pop(a)
+
+    Out_0004 = Set_complex8_pop(a)
+
+    Out_0005 = Set_complex8_pop(a)
+
+    Out_0006 = Set_complex8_pop(a)
+
+    Out_0007 = Set_complex8_pop(a)
+
+    return
+
+  end subroutine update_complex_list
+  !........................................
+
+end module mod_1cr1mcing3zf
@@ -0,0 +1,13 @@
+#include "mod_1fzo5m8h4ptg.h"
+
+
+/*........................................*/
+hset_int64_t remove_int(void)
+{
+    hset_int64_t se = {0};
+    se = c_init(hset_int64_t, {INT64_C(2), INT64_C(4), INT64_C(9)});
+    hset_int64_t_erase(&se, INT64_C(4));
+    return se;
+}
+/*........................................*/
+
@@ -0,0 +1,9 @@
+from numpy import float64, int32
+
+def arrs_1d_int32_index():
+    from numpy import ones, int32
+    i = int32(1)
+    a = ones((10), dtype = float64)
+    b = a[i] + a[i + 2]
+    return b
+
@@ -0,0 +1,18 @@
+#include "mod_1id71tk1uyto.h"
+
+
+/*........................................*/
+int64_t list_ptr(int64_t* Out_0001, int64_t* Out_0002)
+{
+    vec_int64_t a = {0};
+    vec_int64_t* b = {0};
+    a = c_init(vec_int64_t, {INT64_C(1), INT64_C(3), INT64_C(4), INT64_C(7), INT64_C(10), INT64_C(3)});
+    b = &a;
+    vec_int64_t_push(b, INT64_C(22));
+    (*Out_0001) = vec_int64_t_size(&a);
+    (*Out_0002) = vec_int64_t_size(b);
+    vec_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,7 @@
+from numpy import shape
+
+def array_2d_C_slice_stride_4(a : 'int[::,::]'):
+    from numpy import sum
+    b = a[::,::2]
+    return sum(b),b[0,0],b[-1,-1],shape(b)[0],shape(b)[1]
+
@@ -0,0 +1,8 @@
+from pyccel.decorators import template
+
+@template('T', ['int', 'float', 'complex'])
+def set_arg(arg : 'const set[T]', my_sum : 'T'):
+    for ai in arg:
+        my_sum += ai
+    return my_sum
+
@@ -0,0 +1,11 @@
+#ifndef MOD_1OKV5TVSJ3CN_H
+#define MOD_1OKV5TVSJ3CN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void arr_arange_7(t_ndarray arr);
+#endif // mod_1okv5tvsj3cn_H
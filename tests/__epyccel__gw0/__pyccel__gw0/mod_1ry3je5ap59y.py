@@ -0,0 +1,6 @@
+
+def array_float_2d_1d_matmul_creation(A : 'float[::,::]', x : 'float[::]'):
+    from numpy import sum, matmul
+    out = matmul(A, x)
+    return sum(out)
+
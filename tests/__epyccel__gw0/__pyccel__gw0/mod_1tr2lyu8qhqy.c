@@ -0,0 +1,41 @@
+#include "mod_1tr2lyu8qhqy.h"
+
+
+/*........................................*/
+void product_loop(t_ndarray z, int64_t m, int64_t n)
+{
+    int64_t i;
+    vec_int64_t x = {0};
+    int64_t Dummy_0000;
+    int64_t j;
+    vec_int64_t y = {0};
+    int64_t Dummy_0001;
+    int64_t k;
+    vec_int64_t_resize(&x, m, 0);
+    Dummy_0000 = INT64_C(0);
+    for (i = INT64_C(0); i < m; i += INT64_C(1))
+    {
+        (*vec_int64_t_at_mut(&x,Dummy_0000)) = i * INT64_C(3) + INT64_C(2);
+        Dummy_0000 = Dummy_0000 + INT64_C(1);
+    }
+    vec_int64_t_resize(&y, n, 0);
+    Dummy_0001 = INT64_C(0);
+    for (j = INT64_C(0); j < n; j += INT64_C(1))
+    {
+        (*vec_int64_t_at_mut(&y,Dummy_0001)) = j * INT64_C(7) + INT64_C(6);
+        Dummy_0001 = Dummy_0001 + INT64_C(1);
+    }
+    k = INT64_C(0);
+    c_foreach (Dummy_0002, vec_int64_t, x){
+        i = (*Dummy_0002.ref);
+        c_foreach (Dummy_0003, vec_int64_t, y){
+            j = (*Dummy_0003.ref);
+            GET_ELEMENT(z, nd_double, k) = i - j;
+            k += INT64_C(1);
+        }
+    }
+    vec_int64_t_drop(&y);
+    vec_int64_t_drop(&x);
+}
+/*........................................*/
+
@@ -0,0 +1,21 @@
+#ifndef MOD_1TR2LYU8QHQY_H
+#define MOD_1TR2LYU8QHQY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_INT64_T
+#define _TOOLS_LIST_VEC_INT64_T
+#define i_type vec_int64_t
+#define i_key int64_t
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_INT64_T
+
+
+
+
+void product_loop(t_ndarray z, int64_t m, int64_t n);
+#endif // mod_1tr2lyu8qhqy_H
@@ -0,0 +1,114 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_1TR2LYU8QHQY_WRAPPER
+
+#include "mod_1tr2lyu8qhqy_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* product_loop_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* z_obj;
+    PyObject* m_obj;
+    PyObject* n_obj;
+    t_ndarray z = {.raw_data = NULL};
+    int64_t m;
+    int64_t n;
+    static const char* const kwlist[] = {
+        "z",
+        "m",
+        "n",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &z_obj, &m_obj, &n_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("z", z_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        z = pyarray_to_ndarray(z_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(m_obj))
+    {
+        m = PyInt64_to_Int64(m_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument m");
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    product_loop(z, m, n);
+    free_pointer(&z);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_1tr2lyu8qhqy_methods[] = {
+    {
+        "product_loop",
+        (PyCFunction)product_loop_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_1tr2lyu8qhqy_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_1tr2lyu8qhqy",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_1tr2lyu8qhqy_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_1tr2lyu8qhqy(void)
+{
+    PyObject* mod;
+    static void* Pymod_1tr2lyu8qhqy_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_1tr2lyu8qhqy_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_1tr2lyu8qhqy_API, "mod_1tr2lyu8qhqy._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,7 @@
+
+def inhomogeneous_tuple_3():
+    ai_0 = 0
+    ai_1 = 1.0
+    ai_2 = 3
+    return ai_0,ai_1,ai_2
+
@@ -0,0 +1,43 @@
+module mod_1vvfmfbfz5tc
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  interface square
+    module procedure square_0000
+    module procedure square_0001
+  end interface
+
+  contains
+
+  !........................................
+  function square_0000(a) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: a
+
+    Out_0001 = a * a
+    return
+
+  end function square_0000
+  !........................................
+
+  !........................................
+  function square_0001(a) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: a
+
+    Out_0001 = a * a
+    return
+
+  end function square_0001
+  !........................................
+
+end module mod_1vvfmfbfz5tc
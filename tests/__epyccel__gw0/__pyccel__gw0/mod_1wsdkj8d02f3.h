@@ -0,0 +1,11 @@
+#ifndef MOD_1WSDKJ8D02F3_H
+#define MOD_1WSDKJ8D02F3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_1wsdkj8d02f3_H
@@ -0,0 +1,42 @@
+#ifndef MOD_1Z7I57I3XVYO_WRAPPER_H
+#define MOD_1Z7I57I3XVYO_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_1z7i57i3xvyo.h"
+
+
+#ifdef MOD_1Z7I57I3XVYO_WRAPPER
+
+
+#else
+
+static void** Pymod_1z7i57i3xvyo_API;
+
+
+/*........................................*/
+static int mod_1z7i57i3xvyo_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_1z7i57i3xvyo_API = (void**)PyCapsule_Import("mod_1z7i57i3xvyo._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_1z7i57i3xvyo_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_1Z7I57I3XVYO_WRAPPER_H
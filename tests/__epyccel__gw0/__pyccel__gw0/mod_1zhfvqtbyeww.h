@@ -0,0 +1,11 @@
+#ifndef MOD_1ZHFVQTBYEWW_H
+#define MOD_1ZHFVQTBYEWW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_2(t_ndarray a);
+#endif // mod_1zhfvqtbyeww_H
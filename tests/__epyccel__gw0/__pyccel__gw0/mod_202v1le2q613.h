@@ -0,0 +1,12 @@
+#ifndef MOD_202V1LE2Q613_H
+#define MOD_202V1LE2Q613_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_2(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_202v1le2q613_H
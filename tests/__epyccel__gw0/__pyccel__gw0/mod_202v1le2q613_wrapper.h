@@ -0,0 +1,40 @@
+#ifndef MOD_202V1LE2Q613_WRAPPER_H
+#define MOD_202V1LE2Q613_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_202v1le2q613.h"
+
+
+#ifdef MOD_202V1LE2Q613_WRAPPER
+
+
+#else
+
+static void** Pymod_202v1le2q613_API;
+
+
+/*........................................*/
+static int mod_202v1le2q613_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_202v1le2q613_API = (void**)PyCapsule_Import("mod_202v1le2q613._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_202v1le2q613_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_202V1LE2Q613_WRAPPER_H
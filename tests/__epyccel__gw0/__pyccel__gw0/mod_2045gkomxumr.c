@@ -0,0 +1,16 @@
+#include "mod_2045gkomxumr.h"
+
+
+/*........................................*/
+int64_t list_contains(bool* Out_0001, bool* Out_0002, bool* Out_0003)
+{
+    vec_int64_t a = {0};
+    a = c_init(vec_int64_t, {INT64_C(1), INT64_C(3), INT64_C(4), INT64_C(7), INT64_C(10), INT64_C(3)});
+    (*Out_0001) = vec_int64_t_find(&a, INT64_C(1)).ref != vec_int64_t_end(&a).ref;
+    (*Out_0002) = vec_int64_t_find(&a, INT64_C(5)).ref != vec_int64_t_end(&a).ref;
+    (*Out_0003) = vec_int64_t_find(&a, INT64_C(3)).ref != vec_int64_t_end(&a).ref;
+    vec_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
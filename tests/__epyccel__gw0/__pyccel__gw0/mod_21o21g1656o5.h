@@ -0,0 +1,11 @@
+#ifndef MOD_21O21G1656O5_H
+#define MOD_21O21G1656O5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_1d_matmul_transpose(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_21o21g1656o5_H
@@ -0,0 +1,10 @@
+#include "mod_22c5ds3abxbb.h"
+
+
+/*........................................*/
+void f(void)
+{
+    printf("hidden\n");
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_22C5DS3ABXBB_H
+#define MOD_22C5DS3ABXBB_H
+
+#include <inttypes.h>
+#include <stdio.h>
+#include <stdlib.h>
+
+
+
+void f(void);
+#endif // mod_22c5ds3abxbb_H
@@ -0,0 +1,11 @@
+#ifndef MOD_236QZRAOGJ6E_H
+#define MOD_236QZRAOGJ6E_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t constant_negative_index(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_236qzraogj6e_H
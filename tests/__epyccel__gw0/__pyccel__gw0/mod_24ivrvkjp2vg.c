@@ -0,0 +1,194 @@
+#include "mod_24ivrvkjp2vg.h"
+
+
+/*........................................*/
+int64_t array_return_first_element_0000(int64_t a, int64_t b)
+{
+    int64_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t Out_0001;
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int64[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int8_t array_return_first_element_0001(int8_t a, int8_t b)
+{
+    int8_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int8=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int8,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int8_t Out_0001;
+    int8_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int8[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int8[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int16_t array_return_first_element_0002(int16_t a, int16_t b)
+{
+    int16_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int16=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int16,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int16_t Out_0001;
+    int16_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int16[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int16[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int32_t array_return_first_element_0003(int32_t a, int32_t b)
+{
+    int32_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int32=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int32,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int32_t Out_0001;
+    int32_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int32[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int32[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+int64_t array_return_first_element_0004(int64_t a, int64_t b)
+{
+    int64_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t Out_0001;
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_int64[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double array_return_first_element_0005(double a, double b)
+{
+    double array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double Out_0001;
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_double[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+float array_return_first_element_0006(float a, float b)
+{
+    float array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_float=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_float,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    float Out_0001;
+    float Dummy_0000[] = {a, b};
+    memcpy(&x.nd_float[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_float[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double array_return_first_element_0007(double a, double b)
+{
+    double array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double Out_0001;
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_double[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+float complex array_return_first_element_0008(float complex a, float complex b)
+{
+    float complex array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_cfloat=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_cfloat,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    float complex Out_0001;
+    float complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cfloat[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_cfloat[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double complex array_return_first_element_0009(double complex a, double complex b)
+{
+    double complex array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_cdouble=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_cdouble,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double complex Out_0001;
+    double complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cdouble[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    Out_0001 = x.nd_cdouble[INT64_C(0)];
+    return Out_0001;
+}
+/*........................................*/
+
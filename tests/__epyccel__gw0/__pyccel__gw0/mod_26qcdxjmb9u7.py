@@ -0,0 +1,4 @@
+
+def homogeneous_list_int_tuple():
+    return [1, 2, 3, 4]
+
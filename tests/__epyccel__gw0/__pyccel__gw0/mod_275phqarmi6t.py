@@ -0,0 +1,11 @@
+from numpy import shape, array
+
+def arrs_2d_similar_shapes_0():
+    from numpy import shape, array
+    from numpy import shape
+    dy = 4
+    dx = 2
+    pn = array([[1, 2, 3], [1, 2, 3], [1, 2, 3], [1, 2, 3]], order='C')
+    x = (dy * dy * (pn[1:4 - 1:,2::] + pn[1:4 - 1:,0:3 - 2:]) + dx * dx * (pn[2::,1:3 - 1:] + pn[0:4 - 2:,1:3 - 1:])) / (2 * (dx * dx + dy * dy))
+    return shape(x)[0],1
+
@@ -0,0 +1,4 @@
+
+def array_int32_2d_F_scalar_mul(x : 'int32[::,::](order=F)', a : 'int32'):
+    x[::,::] *= a
+
@@ -0,0 +1,18 @@
+#include "mod_28umved4x3s4.h"
+
+
+/*........................................*/
+void copy_to_slice_2(t_ndarray a, t_ndarray b)
+{
+    int64_t i;
+    int64_t i_0001;
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)] - INT64_C(1) - INT64_C(1); i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(a, nd_double, i, i_0001 + INT64_C(1)) = GET_ELEMENT(b, nd_double, i_0001);
+        }
+    }
+}
+/*........................................*/
+
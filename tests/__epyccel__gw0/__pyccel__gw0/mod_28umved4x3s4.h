@@ -0,0 +1,11 @@
+#ifndef MOD_28UMVED4X3S4_H
+#define MOD_28UMVED4X3S4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_2(t_ndarray a, t_ndarray b);
+#endif // mod_28umved4x3s4_H
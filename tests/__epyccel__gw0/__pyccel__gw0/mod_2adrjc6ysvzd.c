@@ -0,0 +1,23 @@
+#include "mod_2adrjc6ysvzd.h"
+
+
+/*........................................*/
+int64_t copy_float(int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005, int64_t* Out_0006)
+{
+    hset_double se = {0};
+    hset_double cop = {0};
+    se = c_init(hset_double, {5.7, 6.2, 4.3, 9.8});
+    hset_double_reserve(&cop, hset_double_size(&se));
+    cop = hset_double_clone(se);
+    (*Out_0001) = hset_double_size(&cop);
+    (*Out_0002) = hset_double_pop(&cop);
+    (*Out_0003) = hset_double_pop(&cop);
+    (*Out_0004) = hset_double_pop(&cop);
+    (*Out_0005) = hset_double_pop(&cop);
+    (*Out_0006) = hset_double_size(&se);
+    hset_double_drop(&cop);
+    hset_double_drop(&se);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,28 @@
+#ifndef MOD_2ADRJC6YSVZD_H
+#define MOD_2ADRJC6YSVZD_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+
+
+
+int64_t copy_float(int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005, int64_t* Out_0006);
+#endif // mod_2adrjc6ysvzd_H
@@ -0,0 +1,11 @@
+#ifndef MOD_2AMGPXXU5LTZ_H
+#define MOD_2AMGPXXU5LTZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f1(t_ndarray x, t_ndarray y);
+#endif // mod_2amgpxxu5ltz_H
@@ -0,0 +1,11 @@
+#ifndef MOD_2BQ9L9C1RWKD_H
+#define MOD_2BQ9L9C1RWKD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f2(t_ndarray x, int64_t* n, int64_t* m, int64_t* p, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_2bq9l9c1rwkd_H
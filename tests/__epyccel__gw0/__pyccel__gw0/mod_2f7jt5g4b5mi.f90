@@ -0,0 +1,30 @@
+module mod_2f7jt5g4b5mi
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f(a, b, c, d) 
+
+    implicit none
+
+    integer(i64), intent(out) :: a
+    integer(i64), intent(out) :: b
+    integer(i64), intent(out) :: c
+    integer(i64), intent(out) :: d
+
+    a = 3_i64 * 3_i64 * 3_i64
+    b = (8_i64 + 3_i64) * (8_i64 + 3_i64) * (8_i64 + 3_i64)
+    c = (FLOOR((b - a)/20.0_f64,i64)) * (FLOOR((b - a)/20.0_f64,i64)) * &
+          (FLOOR((b - a)/20.0_f64,i64))
+    d = a * a * a
+    return
+
+  end subroutine f
+  !........................................
+
+end module mod_2f7jt5g4b5mi
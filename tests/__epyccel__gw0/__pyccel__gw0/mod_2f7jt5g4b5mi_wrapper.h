@@ -0,0 +1,40 @@
+#ifndef MOD_2F7JT5G4B5MI_WRAPPER_H
+#define MOD_2F7JT5G4B5MI_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_2F7JT5G4B5MI_WRAPPER
+
+int64_t bind_c_f(int64_t*, int64_t*, int64_t*, int64_t*);
+
+#else
+
+static void** Pymod_2f7jt5g4b5mi_API;
+
+
+/*........................................*/
+static int mod_2f7jt5g4b5mi_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_2f7jt5g4b5mi_API = (void**)PyCapsule_Import("mod_2f7jt5g4b5mi._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_2f7jt5g4b5mi_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_2F7JT5G4B5MI_WRAPPER_H
@@ -0,0 +1,33 @@
+module mod_2h6eq3apyum6
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine fused_temporary_used_later(a, b) 
+
+    implicit none
+
+    real(f64), intent(inout) :: a(0_i64:)
+    real(f64), intent(inout) :: b(0_i64:)
+    real(f64), allocatable :: t(:)
+    integer(i64) :: i
+
+    allocate(t(0:size(a, kind=i64) - 1_i64))
+    do i = 0_i64, size(t, kind=i64) - 1_i64
+      t(i) = a(i) + b(i)
+      b(i) = t(i) * 2.0_f64
+    end do
+    a(1_i64:) = t(:size(t, kind=i64) - 1_i64 - 1_i64)
+    if (allocated(t)) then
+      deallocate(t)
+    end if
+
+  end subroutine fused_temporary_used_later
+  !........................................
+
+end module mod_2h6eq3apyum6
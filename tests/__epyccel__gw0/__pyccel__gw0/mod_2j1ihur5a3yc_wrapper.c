@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_2J1IHUR5A3YC_WRAPPER
+
+#include "mod_2j1ihur5a3yc_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_test_omp_get_thread_limit_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t maximum_threads_available;
+    PyObject* maximum_threads_available_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    maximum_threads_available = bind_c_test_omp_get_thread_limit();
+    maximum_threads_available_obj = Int32_to_NumpyLong(&maximum_threads_available);
+    return maximum_threads_available_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_2j1ihur5a3yc_methods[] = {
+    {
+        "test_omp_get_thread_limit",
+        (PyCFunction)bind_c_test_omp_get_thread_limit_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_2j1ihur5a3yc_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_2j1ihur5a3yc",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_2j1ihur5a3yc_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_2j1ihur5a3yc(void)
+{
+    PyObject* mod;
+    static void* Pymod_2j1ihur5a3yc_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_2j1ihur5a3yc_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_2j1ihur5a3yc_API, "mod_2j1ihur5a3yc._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
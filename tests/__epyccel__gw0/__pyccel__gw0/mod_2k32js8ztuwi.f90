@@ -0,0 +1,43 @@
+module mod_2k32js8ztuwi
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_random_size(Out_0001, Out_0002) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    real(f64), allocatable :: a(:)
+    real(f64), allocatable :: c(:)
+    real(f64) :: Dummy_0000
+    real(f64) :: Dummy_0001
+
+    call random_number(Dummy_0000)
+
+    call random_number(Dummy_0001)
+
+    allocate(a(0:floor(23_i64 * Dummy_0001, kind=i64) - 1_i64))
+    a = 0.0_f64
+    allocate(c(0:size(a, kind=i64) - 1_i64))
+    c = 0.0_f64
+    Out_0001 = size(a, kind=i64)
+    Out_0002 = size(c, kind=i64)
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine array_random_size
+  !........................................
+
+end module mod_2k32js8ztuwi
@@ -0,0 +1,22 @@
+module mod_2kpwb12i1w7b
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine p_func() 
+
+    implicit none
+
+    integer(i64) :: x
+
+    x = 2_i64
+    x = x * 2_i64
+
+  end subroutine p_func
+  !........................................
+
+end module mod_2kpwb12i1w7b
@@ -0,0 +1,40 @@
+#ifndef MOD_2KPWB12I1W7B_WRAPPER_H
+#define MOD_2KPWB12I1W7B_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_2KPWB12I1W7B_WRAPPER
+
+void bind_c_p_func(void);
+
+#else
+
+static void** Pymod_2kpwb12i1w7b_API;
+
+
+/*........................................*/
+static int mod_2kpwb12i1w7b_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_2kpwb12i1w7b_API = (void**)PyCapsule_Import("mod_2kpwb12i1w7b._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_2kpwb12i1w7b_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_2KPWB12I1W7B_WRAPPER_H
@@ -0,0 +1,39 @@
+module mod_2lteon2h127t
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function iterate_slice(i) result(res)
+
+    implicit none
+
+    integer(i64) :: res
+    integer(i64), value :: i
+    integer(i64), allocatable :: a(:)
+    integer(i64) :: ai
+    integer(i64) :: Dummy_0001
+    integer(i64) :: Dummy_0000
+
+    allocate(a(0:ceiling(Real((15_i64 - 0_i64), kind = f64) / 1.0_f64) - &
+          1_i64))
+    a = [(0_i64 + 1_i64 * Dummy_0001, Dummy_0001 = 0_i64, ceiling(Real(( &
+          15_i64 - 0_i64), kind = f64) / 1.0_f64) - 1_i64, 1_i64)]
+    res = 0_i64
+    do Dummy_0000 = 0_i64, i - 1_i64
+      ai = a(Dummy_0000)
+      res = res + ai
+    end do
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end function iterate_slice
+  !........................................
+
+end module mod_2lteon2h127t
@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_2LTEON2H127T_WRAPPER
+
+#include "mod_2lteon2h127t_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_iterate_slice_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* i_obj;
+    int64_t i;
+    int64_t res;
+    PyObject* res_obj;
+    static const char* const kwlist[] = {
+        "i",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &i_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(i_obj))
+    {
+        i = PyInt64_to_Int64(i_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument i");
+        return NULL;
+    }
+    res = bind_c_iterate_slice(i);
+    res_obj = Int64_to_PyLong(&res);
+    return res_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_2lteon2h127t_methods[] = {
+    {
+        "iterate_slice",
+        (PyCFunction)bind_c_iterate_slice_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_2lteon2h127t_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_2lteon2h127t",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_2lteon2h127t_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_2lteon2h127t(void)
+{
+    PyObject* mod;
+    static void* Pymod_2lteon2h127t_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_2lteon2h127t_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_2lteon2h127t_API, "mod_2lteon2h127t._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,13 @@
+#include "mod_2nyt78thnaq7.h"
+
+
+/*........................................*/
+hset_double_complex Discard_complex(void)
+{
+    hset_double_complex se = {0};
+    se = c_init(hset_double_complex, {(2.0 * _Complex_I), (5.0 * _Complex_I), (3.0 * _Complex_I), (7.0 * _Complex_I)});
+    hset_double_complex_erase(&se, (5.0 * _Complex_I));
+    return se;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_2PWGERMKWN3B_H
+#define MOD_2PWGERMKWN3B_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t arrs_2d_similar_shapes_0(int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_2pwgermkwn3b_H
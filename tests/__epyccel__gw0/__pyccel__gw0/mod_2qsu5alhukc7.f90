@@ -0,0 +1,49 @@
+module mod_2qsu5alhukc7
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use Set_integer8_mod
+  use Set_real8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function set_iter_prod() result(assemble)
+
+    implicit none
+
+    real(f64) :: assemble
+    type(Set_integer8) :: a
+    type(Set_real8) :: b
+    integer(i64) :: ai
+    real(f64) :: bi
+    type(Set_integer8_Iterator) :: a_iter
+    type(Set_integer8_Iterator) :: a_last
+    type(Set_real8_Iterator) :: b_iter
+    type(Set_real8_Iterator) :: b_last
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64, 4_i64, 5_i64, 6_i64, 7_i64, &
+          8_i64, 9_i64, 12_i64])
+    b = Set_real8([2.0_f64, 4.0_f64, 9.0_f64, 2.5_f64, 8.3_f64])
+    assemble = 0.0_f64
+    a_iter = a % begin()
+    a_last = a % end()
+    do while (a_iter /= a_last)
+      ai = a_iter % of()
+      b_iter = b % begin()
+      b_last = b % end()
+      do while (b_iter /= b_last)
+        bi = b_iter % of()
+        assemble = assemble + ai * bi
+        call b_iter % next()
+      end do
+      call a_iter % next()
+    end do
+    return
+
+  end function set_iter_prod
+  !........................................
+
+end module mod_2qsu5alhukc7
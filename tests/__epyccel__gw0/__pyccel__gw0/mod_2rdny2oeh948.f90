@@ -0,0 +1,26 @@
+module mod_2rdny2oeh948
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f4(x, y) 
+
+    implicit none
+
+    real(f64), allocatable, intent(out) :: y(:, :)
+    real(f64), intent(in) :: x(0_i64:, 0_i64:)
+
+    allocate(y(0:size(x, 1_i64, i64) - 1_i64, 0:size(x, 2_i64, i64) - &
+          1_i64))
+    y(:, :) = x - 1.0_f64
+    return
+
+  end subroutine f4
+  !........................................
+
+end module mod_2rdny2oeh948
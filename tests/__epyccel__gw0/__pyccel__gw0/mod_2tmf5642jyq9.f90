@@ -0,0 +1,23 @@
+module mod_2tmf5642jyq9
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f18(a) result(b)
+
+    implicit none
+
+    integer(i32) :: b
+    integer(i32), value :: a
+
+    b = a
+    return
+
+  end function f18
+  !........................................
+
+end module mod_2tmf5642jyq9
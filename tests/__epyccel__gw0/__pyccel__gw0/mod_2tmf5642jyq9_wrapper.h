@@ -0,0 +1,40 @@
+#ifndef MOD_2TMF5642JYQ9_WRAPPER_H
+#define MOD_2TMF5642JYQ9_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_2TMF5642JYQ9_WRAPPER
+
+int32_t bind_c_f18(int32_t);
+
+#else
+
+static void** Pymod_2tmf5642jyq9_API;
+
+
+/*........................................*/
+static int mod_2tmf5642jyq9_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_2tmf5642jyq9_API = (void**)PyCapsule_Import("mod_2tmf5642jyq9._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_2tmf5642jyq9_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_2TMF5642JYQ9_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_2U2R61VJ4P1Z_H
+#define MOD_2U2R61VJ4P1Z_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_1d_matmul_order_F(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_2u2r61vj4p1z_H
@@ -0,0 +1,42 @@
+#ifndef MOD_2U2R61VJ4P1Z_WRAPPER_H
+#define MOD_2U2R61VJ4P1Z_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_2u2r61vj4p1z.h"
+
+
+#ifdef MOD_2U2R61VJ4P1Z_WRAPPER
+
+
+#else
+
+static void** Pymod_2u2r61vj4p1z_API;
+
+
+/*........................................*/
+static int mod_2u2r61vj4p1z_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_2u2r61vj4p1z_API = (void**)PyCapsule_Import("mod_2u2r61vj4p1z._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_2u2r61vj4p1z_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_2U2R61VJ4P1Z_WRAPPER_H
@@ -0,0 +1,20 @@
+#include "mod_2upyoym7kpyh.h"
+
+
+/*........................................*/
+int64_t f(int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004)
+{
+    vec_bool a = {0};
+    a = c_init(vec_bool, {1, 1, 1});
+    vec_bool_push(&a, 0);
+    vec_bool_push(&a, 0);
+    vec_bool_push(&a, 1);
+    (*Out_0001) = vec_bool_size(&a);
+    (*Out_0002) = (*vec_bool_at(&a,INT64_C(3)));
+    (*Out_0003) = (*vec_bool_at(&a,INT64_C(4)));
+    (*Out_0004) = (*vec_bool_at(&a,INT64_C(5)));
+    vec_bool_drop(&a);
+    return 0;
+}
+/*........................................*/
+
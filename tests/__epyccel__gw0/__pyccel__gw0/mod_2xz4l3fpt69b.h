@@ -0,0 +1,10 @@
+#ifndef MOD_2XZ4L3FPT69B_H
+#define MOD_2XZ4L3FPT69B_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t factorial_while(int64_t n);
+#endif // mod_2xz4l3fpt69b_H
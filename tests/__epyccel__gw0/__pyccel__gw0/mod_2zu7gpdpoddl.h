@@ -0,0 +1,11 @@
+#ifndef MOD_2ZU7GPDPODDL_H
+#define MOD_2ZU7GPDPODDL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_1D_1(t_ndarray a);
+#endif // mod_2zu7gpdpoddl_H
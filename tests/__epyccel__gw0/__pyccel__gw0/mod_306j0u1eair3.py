@@ -0,0 +1,10 @@
+from numpy import float64, array
+
+def unpack_array_of_known_size():
+    from numpy import array
+    arr = array([1, 2, 3], dtype = float64)
+    x = arr[0]
+    y = arr[1]
+    z = arr[2]
+    return x,y,z
+
@@ -0,0 +1,4 @@
+
+def homogeneous_list_float():
+    return [1.0, 2.0, 3.0, 4.0]
+
@@ -0,0 +1,23 @@
+#include "mod_37rmt12fplsk.h"
+
+
+/*........................................*/
+void matvec(t_ndarray a, t_ndarray x, t_ndarray y)
+{
+    int64_t n;
+    int64_t m;
+    int64_t i;
+    int64_t j;
+    n = a.shape[INT64_C(0)];
+    m = a.shape[INT64_C(1)];
+    for (i = INT64_C(0); i < n; i += INT64_C(1))
+    {
+        y.nd_double[i] = 0.0;
+        for (j = INT64_C(0); j < m; j += INT64_C(1))
+        {
+            y.nd_double[i] += a.nd_double[j * a.shape[INT64_C(0)] + i] * x.nd_double[j];
+        }
+    }
+}
+/*........................................*/
+
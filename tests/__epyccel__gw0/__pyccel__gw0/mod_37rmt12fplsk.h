@@ -0,0 +1,11 @@
+#ifndef MOD_37RMT12FPLSK_H
+#define MOD_37RMT12FPLSK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void matvec(t_ndarray a, t_ndarray x, t_ndarray y);
+#endif // mod_37rmt12fplsk_H
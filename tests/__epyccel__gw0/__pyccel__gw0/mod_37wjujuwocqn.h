@@ -0,0 +1,12 @@
+#ifndef MOD_37WJUJUWOCQN_H
+#define MOD_37WJUJUWOCQN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_3d_F_array_initialization_2(t_ndarray a);
+#endif // mod_37wjujuwocqn_H
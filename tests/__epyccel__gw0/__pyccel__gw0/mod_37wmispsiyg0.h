@@ -0,0 +1,11 @@
+#ifndef MOD_37WMISPSIYG0_H
+#define MOD_37WMISPSIYG0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_37wmispsiyg0_H
@@ -0,0 +1,58 @@
+#include "mod_3887nawaa4s3.h"
+
+
+/*........................................*/
+int64_t tuples_mul_inhomogeneous_2d(int64_t* Out_0001, bool* Out_0002, double* Out_0003, bool* Out_0004, bool* Out_0005, int64_t* Out_0006, int64_t* Out_0007, bool* Out_0008, double* Out_0009, bool* Out_0010, bool* Out_0011, int64_t* Out_0012)
+{
+    int64_t a_0_0;
+    bool a_0_1;
+    double a_1_0;
+    bool a_1_1;
+    bool a_2_0;
+    int64_t a_2_1;
+    int64_t b_0_0;
+    bool b_0_1;
+    double b_1_0;
+    bool b_1_1;
+    bool b_2_0;
+    int64_t b_2_1;
+    int64_t b_3_0;
+    bool b_3_1;
+    double b_4_0;
+    bool b_4_1;
+    bool b_5_0;
+    int64_t b_5_1;
+    a_0_0 = INT64_C(1);
+    a_0_1 = 0;
+    a_1_0 = 3.0;
+    a_1_1 = 0;
+    a_2_0 = 1;
+    a_2_1 = INT64_C(6);
+    b_0_0 = a_0_0;
+    b_0_1 = a_0_1;
+    b_1_0 = a_1_0;
+    b_1_1 = a_1_1;
+    b_2_0 = a_2_0;
+    b_2_1 = a_2_1;
+    b_3_0 = a_0_0;
+    b_3_1 = a_0_1;
+    b_4_0 = a_1_0;
+    b_4_1 = a_1_1;
+    b_5_0 = a_2_0;
+    b_5_1 = a_2_1;
+    (*Out_0001) = b_0_0;
+    (*Out_0002) = b_0_1;
+    (*Out_0003) = b_1_0;
+    (*Out_0004) = b_1_1;
+    (*Out_0005) = b_2_0;
+    (*Out_0006) = b_2_1;
+    (*Out_0007) = b_3_0;
+    (*Out_0008) = b_3_1;
+    (*Out_0009) = b_4_0;
+    (*Out_0010) = b_4_1;
+    (*Out_0011) = b_5_0;
+    (*Out_0012) = b_5_1;
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,127 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_3887NAWAA4S3_WRAPPER
+
+#include "mod_3887nawaa4s3_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tuples_mul_inhomogeneous_2d_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    bool Out_0002;
+    PyObject* Out_0003_obj;
+    double Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    int64_t Out_0006;
+    PyObject* Out_0007_obj;
+    int64_t Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    double Out_0009;
+    PyObject* Out_0010_obj;
+    bool Out_0010;
+    PyObject* Out_0011_obj;
+    bool Out_0011;
+    PyObject* Out_0012_obj;
+    int64_t Out_0012;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    tuples_mul_inhomogeneous_2d(&Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009, &Out_0010, &Out_0011, &Out_0012);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Bool_to_PyBool(&Out_0002);
+    Out_0003_obj = Double_to_PyDouble(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Int64_to_PyLong(&Out_0006);
+    Out_0007_obj = Int64_to_PyLong(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Double_to_PyDouble(&Out_0009);
+    Out_0010_obj = Bool_to_PyBool(&Out_0010);
+    Out_0011_obj = Bool_to_PyBool(&Out_0011);
+    Out_0012_obj = Int64_to_PyLong(&Out_0012);
+    Out_obj = Py_BuildValue("OOOOOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj, Out_0010_obj, Out_0011_obj, Out_0012_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    Py_DECREF(Out_0010_obj);
+    Py_DECREF(Out_0011_obj);
+    Py_DECREF(Out_0012_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_3887nawaa4s3_methods[] = {
+    {
+        "tuples_mul_inhomogeneous_2d",
+        (PyCFunction)tuples_mul_inhomogeneous_2d_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_3887nawaa4s3_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_3887nawaa4s3",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_3887nawaa4s3_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_3887nawaa4s3(void)
+{
+    PyObject* mod;
+    static void* Pymod_3887nawaa4s3_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_3887nawaa4s3_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_3887nawaa4s3_API, "mod_3887nawaa4s3._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_392LI70WCQ2I_H
+#define MOD_392LI70WCQ2I_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_sum_stack_array(void);
+#endif // mod_392li70wcq2i_H
@@ -0,0 +1,30 @@
+module mod_3a7kjhbk35f6
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine arrs_1d_negative_index_1(Out_0001, Out_0002) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64) :: a(0_i64:9_i64)
+    real(f64) :: b(0_i64:8_i64)
+
+    a = 0.0_f64
+    b = a(:size(a, kind=i64) - 1_i64 - 1_i64) + a(size(a, kind=i64) - &
+          9_i64:)
+    Out_0001 = 9_i64
+    Out_0002 = sum(b)
+    return
+
+  end subroutine arrs_1d_negative_index_1
+  !........................................
+
+end module mod_3a7kjhbk35f6
@@ -0,0 +1,38 @@
+module mod_3c3nsc0iyv0l
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function test_omp_get_set_schedule() result(func_result)
+
+    use omp_lib, only: omp_get_schedule
+    use omp_lib, only: omp_set_schedule
+
+    implicit none
+
+    integer(i32) :: func_result
+    integer(i32) :: Dummy_0000
+    integer(i32) :: chunk_size
+    integer(i64) :: i
+
+    func_result = 0_i32
+    !$omp parallel private(i)
+    call omp_set_schedule(2_i32, 3_i32)
+    call omp_get_schedule(Dummy_0000, chunk_size)
+    !$omp do schedule(runtime) reduction(+: func_result)
+    do i = 0_i64, 15_i64
+      func_result = func_result + chunk_size
+    end do
+    !$omp end do nowait
+    !$omp end parallel
+    return
+
+  end function test_omp_get_set_schedule
+  !........................................
+
+end module mod_3c3nsc0iyv0l
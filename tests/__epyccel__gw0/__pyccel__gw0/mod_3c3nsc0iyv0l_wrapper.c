@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_3C3NSC0IYV0L_WRAPPER
+
+#include "mod_3c3nsc0iyv0l_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_test_omp_get_set_schedule_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t func_result;
+    PyObject* func_result_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    func_result = bind_c_test_omp_get_set_schedule();
+    func_result_obj = Int32_to_NumpyLong(&func_result);
+    return func_result_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_3c3nsc0iyv0l_methods[] = {
+    {
+        "test_omp_get_set_schedule",
+        (PyCFunction)bind_c_test_omp_get_set_schedule_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_3c3nsc0iyv0l_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_3c3nsc0iyv0l",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_3c3nsc0iyv0l_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_3c3nsc0iyv0l(void)
+{
+    PyObject* mod;
+    static void* Pymod_3c3nsc0iyv0l_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_3c3nsc0iyv0l_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_3c3nsc0iyv0l_API, "mod_3c3nsc0iyv0l._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
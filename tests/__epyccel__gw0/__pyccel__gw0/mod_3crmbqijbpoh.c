@@ -0,0 +1,12 @@
+#include "mod_3crmbqijbpoh.h"
+
+
+/*........................................*/
+int16_t f16(int16_t a)
+{
+    int16_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
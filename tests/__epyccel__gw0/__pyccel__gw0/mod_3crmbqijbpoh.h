@@ -0,0 +1,10 @@
+#ifndef MOD_3CRMBQIJBPOH_H
+#define MOD_3CRMBQIJBPOH_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int16_t f16(int16_t a);
+#endif // mod_3crmbqijbpoh_H
@@ -0,0 +1,15 @@
+#include "mod_3dq0ix2dcq2l.h"
+
+
+/*........................................*/
+int64_t g(int64_t x, int64_t y, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    (*Out_0001) = x;
+    (*Out_0002) = y;
+    (*Out_0003) = y;
+    (*Out_0004) = y;
+    (*Out_0005) = x;
+    return 0;
+}
+/*........................................*/
+
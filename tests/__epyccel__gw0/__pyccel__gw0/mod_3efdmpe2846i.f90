@@ -0,0 +1,26 @@
+module mod_3efdmpe2846i
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function clear_int() result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    type(Set_integer8) :: se
+
+    se = Set_integer8([1_i64, 2_i64, 4_i64, 5_i64])
+    call se % clear()
+    Out_0001 = se % size()
+    return
+
+  end function clear_int
+  !........................................
+
+end module mod_3efdmpe2846i
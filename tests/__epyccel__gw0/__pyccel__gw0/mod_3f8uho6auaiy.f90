@@ -0,0 +1,27 @@
+module mod_3f8uho6auaiy
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use Set_real8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function clear_float() result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    type(Set_real8) :: se
+
+    se = Set_real8([7.2_f64, 2.1_f64, 9.8_f64, 6.4_f64])
+    call se % clear()
+    Out_0001 = se % size()
+    return
+
+  end function clear_float
+  !........................................
+
+end module mod_3f8uho6auaiy
@@ -0,0 +1,40 @@
+#ifndef MOD_3F8UHO6AUAIY_WRAPPER_H
+#define MOD_3F8UHO6AUAIY_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_3F8UHO6AUAIY_WRAPPER
+
+int64_t bind_c_clear_float(void);
+
+#else
+
+static void** Pymod_3f8uho6auaiy_API;
+
+
+/*........................................*/
+static int mod_3f8uho6auaiy_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_3f8uho6auaiy_API = (void**)PyCapsule_Import("mod_3f8uho6auaiy._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_3f8uho6auaiy_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_3F8UHO6AUAIY_WRAPPER_H
@@ -0,0 +1,10 @@
+#ifndef MOD_3NRR2EVGE02U_H
+#define MOD_3NRR2EVGE02U_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t sum_natural_numbers(int64_t n);
+#endif // mod_3nrr2evge02u_H
@@ -0,0 +1,6 @@
+
+def f():
+    lst = [[True, False, True], [False, True]]
+    lst.remove([False, True])
+    return lst
+
@@ -0,0 +1,42 @@
+#ifndef MOD_3PNN77PMNI7K_WRAPPER_H
+#define MOD_3PNN77PMNI7K_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_3pnn77pmni7k.h"
+
+
+#ifdef MOD_3PNN77PMNI7K_WRAPPER
+
+
+#else
+
+static void** Pymod_3pnn77pmni7k_API;
+
+
+/*........................................*/
+static int mod_3pnn77pmni7k_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_3pnn77pmni7k_API = (void**)PyCapsule_Import("mod_3pnn77pmni7k._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_3pnn77pmni7k_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_3PNN77PMNI7K_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_3Q91HMIFC3UI_H
+#define MOD_3Q91HMIFC3UI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_4d_F_array_initialization(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_3q91hmifc3ui_H
@@ -0,0 +1,5 @@
+
+def f(a : 'int[::,::]'):
+    Out_0001 = sum(aii for ai in a for aii in ai)
+    return Out_0001
+
@@ -0,0 +1,7 @@
+from numpy import float64, array
+
+def array_float_nested_C_array_initialization(x : 'float[::,::,::]', y : 'float[::,::]', z : 'float[::,::]', a : 'float[::,::,::,::]'):
+    from numpy import array
+    tmp = array((x, (y, z, z), x), dtype = float64, order='C')
+    a[::,::,::,::] = tmp[::,::,::,::]
+
@@ -0,0 +1,23 @@
+#include "mod_3sumeffltnoe.h"
+
+
+/*........................................*/
+int64_t copy_int(int64_t* size, int64_t* Out_0001, int64_t* a, int64_t* b, int64_t* c, int64_t* d)
+{
+    hset_int64_t se = {0};
+    hset_int64_t cop = {0};
+    se = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(4), INT64_C(5)});
+    hset_int64_t_reserve(&cop, hset_int64_t_size(&se));
+    cop = hset_int64_t_clone(se);
+    (*size) = hset_int64_t_size(&cop);
+    (*a) = hset_int64_t_pop(&cop);
+    (*b) = hset_int64_t_pop(&cop);
+    (*c) = hset_int64_t_pop(&cop);
+    (*d) = hset_int64_t_pop(&cop);
+    (*Out_0001) = hset_int64_t_size(&se);
+    hset_int64_t_drop(&se);
+    hset_int64_t_drop(&cop);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_3VTY2TGYGWAZ_H
+#define MOD_3VTY2TGYGWAZ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t double_loop(int64_t n);
+#endif // mod_3vty2tgygwaz_H
@@ -0,0 +1,5 @@
+
+def f2(x : 'int[::,::]', y : 'int[::,::,::,::,::]'):
+    from numpy import transpose
+    y[0,::,0,::,0] = transpose(x)
+
@@ -0,0 +1,11 @@
+#ifndef MOD_3YB2T3Q26253_H
+#define MOD_3YB2T3Q26253_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_simd(int64_t n);
+#endif // mod_3yb2t3q26253_H
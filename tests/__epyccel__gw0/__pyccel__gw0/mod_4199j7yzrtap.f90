@@ -0,0 +1,23 @@
+module mod_4199j7yzrtap
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int32_1d_add(x, y) 
+
+    implicit none
+
+    integer(i32), intent(inout) :: x(0_i64:)
+    integer(i32), intent(in) :: y(0_i64:)
+
+    x(:) = x(:) + y
+
+  end subroutine array_int32_1d_add
+  !........................................
+
+end module mod_4199j7yzrtap
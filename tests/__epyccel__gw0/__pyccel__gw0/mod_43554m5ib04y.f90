@@ -0,0 +1,33 @@
+module mod_43554m5ib04y
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+  use Set_real8_mod
+  use Set_real8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine Pop_float(el1, el2, el3) 
+
+    implicit none
+
+    real(f64), intent(out) :: el1
+    real(f64), intent(out) :: el2
+    real(f64), intent(out) :: el3
+    type(Set_real8) :: se
+
+    se = Set_real8([2.3_f64, 4.1_f64, 9.5_f64])
+    el1 = Set_real8_pop(se)
+
+    el2 = Set_real8_pop(se)
+
+    el3 = Set_real8_pop(se)
+
+    return
+
+  end subroutine Pop_float
+  !........................................
+
+end module mod_43554m5ib04y
@@ -0,0 +1,22 @@
+module mod_443ecdm87p3m
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int_1d_scalar_add(x, a) 
+
+    implicit none
+
+    integer(i64), intent(inout) :: x(0_i64:)
+    integer(i64), value :: a
+
+    x(:) = x(:) + a
+
+  end subroutine array_int_1d_scalar_add
+  !........................................
+
+end module mod_443ecdm87p3m
@@ -0,0 +1,10 @@
+from pyccel.decorators import parallel_arrays
+
+@parallel_arrays(threshold = 100)
+def parallel_array_reductions(a : 'float[::,::]', b : 'int32[::]', c : 'float[::,::](order=F)'):
+    from numpy import max as amax, sum, min as amin
+    s = sum(a)
+    m = amax(b)
+    n = amin(c[1::,::])
+    return s,m,n
+
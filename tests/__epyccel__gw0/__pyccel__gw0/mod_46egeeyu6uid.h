@@ -0,0 +1,11 @@
+#ifndef MOD_46EGEEYU6UID_H
+#define MOD_46EGEEYU6UID_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(t_ndarray x, int64_t* n, int64_t* m, double* Out_0001, double* Out_0002);
+#endif // mod_46egeeyu6uid_H
@@ -0,0 +1,107 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_46EGEEYU6UID_WRAPPER
+
+#include "mod_46egeeyu6uid_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* n_obj;
+    int64_t n;
+    PyObject* m_obj;
+    int64_t m;
+    PyObject* Out_0001_obj;
+    double Out_0001;
+    PyObject* Out_0002_obj;
+    double Out_0002;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    f1(x, &n, &m, &Out_0001, &Out_0002);
+    free_pointer(&x);
+    n_obj = Int64_to_PyLong(&n);
+    m_obj = Int64_to_PyLong(&m);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    Out_0002_obj = Double_to_NumpyDouble(&Out_0002);
+    Out_obj = Py_BuildValue("OOOO", n_obj, m_obj, Out_0001_obj, Out_0002_obj);
+    Py_DECREF(n_obj);
+    Py_DECREF(m_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_46egeeyu6uid_methods[] = {
+    {
+        "f1",
+        (PyCFunction)f1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_46egeeyu6uid_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_46egeeyu6uid",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_46egeeyu6uid_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_46egeeyu6uid(void)
+{
+    PyObject* mod;
+    static void* Pymod_46egeeyu6uid_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_46egeeyu6uid_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_46egeeyu6uid_API, "mod_46egeeyu6uid._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
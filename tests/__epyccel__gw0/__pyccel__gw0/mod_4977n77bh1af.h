@@ -0,0 +1,12 @@
+#ifndef MOD_4977N77BH1AF_H
+#define MOD_4977N77BH1AF_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t temp_array_in_loop(t_ndarray a, t_ndarray b, t_ndarray* d1, t_ndarray* d2);
+#endif // mod_4977n77bh1af_H
@@ -0,0 +1,113 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4977N77BH1AF_WRAPPER
+
+#include "mod_4977n77bh1af_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* temp_array_in_loop_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* d1_obj;
+    t_ndarray d1 = {.raw_data = NULL};
+    PyObject* d2_obj;
+    t_ndarray d2 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &a_obj, &b_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("b", b_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        b = pyarray_to_ndarray(b_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    temp_array_in_loop(a, b, &d1, &d2);
+    free_pointer(&a);
+    free_pointer(&b);
+    d1_obj = ndarray_to_pyarray(d1);
+    free_pointer(&d1);
+    d2_obj = ndarray_to_pyarray(d2);
+    free_pointer(&d2);
+    Out_obj = Py_BuildValue("OO", d1_obj, d2_obj);
+    Py_DECREF(d1_obj);
+    Py_DECREF(d2_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4977n77bh1af_methods[] = {
+    {
+        "temp_array_in_loop",
+        (PyCFunction)temp_array_in_loop_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4977n77bh1af_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4977n77bh1af",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4977n77bh1af_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4977n77bh1af(void)
+{
+    PyObject* mod;
+    static void* Pymod_4977n77bh1af_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4977n77bh1af_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4977n77bh1af_API, "mod_4977n77bh1af._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,51 @@
+#include "mod_49mex86met1p.h"
+
+
+/*........................................*/
+void array_float_2d_2d_matmul_expression(t_ndarray A, t_ndarray B, t_ndarray C, t_ndarray out)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray Dummy_0001 = {.raw_data = NULL};
+    t_ndarray Dummy_0002 = {.raw_data = NULL};
+    t_ndarray Dummy_0003 = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    t_ndarray Dummy_0004 = {.raw_data = NULL};
+    t_ndarray Dummy_0005 = {.raw_data = NULL};
+    Dummy_0000 = array_create(2, (int64_t[]){A.shape[INT64_C(1)], B.shape[INT64_C(1)]}, nd_double, false, order_c);
+    transpose_alias_assign(&Dummy_0004, A);
+    numpy_matmul_float64(Dummy_0000, Dummy_0004, B);
+    for (i = INT64_C(0); i < out.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < out.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(out, nd_double, i, i_0001) = 2.0 * GET_ELEMENT(Dummy_0000, nd_double, i, i_0001) + GET_ELEMENT(C, nd_double, i, i_0001);
+        }
+    }
+    free_array(&Dummy_0000);
+    Dummy_0002 = array_create(2, (int64_t[]){A.shape[INT64_C(1)], B.shape[INT64_C(1)]}, nd_double, false, order_c);
+    Dummy_0001 = array_create(2, (int64_t[]){A.shape[INT64_C(1)], C.shape[INT64_C(1)]}, nd_double, false, order_c);
+    transpose_alias_assign(&Dummy_0005, A);
+    numpy_matmul_float64(Dummy_0002, Dummy_0005, B);
+    Dummy_0003 = array_create(2, (int64_t[]){C.shape[INT64_C(0)], C.shape[INT64_C(1)]}, nd_double, false, order_c);
+    for (i = INT64_C(0); i < Dummy_0003.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < Dummy_0003.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(Dummy_0003, nd_double, i, i_0001) = GET_ELEMENT(C, nd_double, i, i_0001) + 1.0;
+        }
+    }
+    numpy_matmul_float64(Dummy_0001, Dummy_0002, Dummy_0003);
+    free_array(&Dummy_0003);
+    free_array(&Dummy_0002);
+    for (i = INT64_C(0); i < out.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < out.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(out, nd_double, i, i_0001) += GET_ELEMENT(Dummy_0001, nd_double, i, i_0001);
+        }
+    }
+    free_array(&Dummy_0001);
+}
+/*........................................*/
+
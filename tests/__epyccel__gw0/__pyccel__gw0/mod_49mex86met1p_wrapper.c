@@ -0,0 +1,126 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_49MEX86MET1P_WRAPPER
+
+#include "mod_49mex86met1p_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_2d_2d_matmul_expression_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* A_obj;
+    PyObject* B_obj;
+    PyObject* C_obj;
+    PyObject* out_obj;
+    t_ndarray A = {.raw_data = NULL};
+    t_ndarray B = {.raw_data = NULL};
+    t_ndarray C = {.raw_data = NULL};
+    t_ndarray out = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "A",
+        "B",
+        "C",
+        "out",
+        NULL
+    };
+    static PyObject* kwlist_interned[5] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 4, 4, &A_obj, &B_obj, &C_obj, &out_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("A", A_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        A = pyarray_to_ndarray(A_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("B", B_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        B = pyarray_to_ndarray(B_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("C", C_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        C = pyarray_to_ndarray(C_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out", out_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        out = pyarray_to_ndarray(out_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    array_float_2d_2d_matmul_expression(A, B, C, out);
+    free_pointer(&A);
+    free_pointer(&B);
+    free_pointer(&C);
+    free_pointer(&out);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_49mex86met1p_methods[] = {
+    {
+        "array_float_2d_2d_matmul_expression",
+        (PyCFunction)array_float_2d_2d_matmul_expression_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_49mex86met1p_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_49mex86met1p",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_49mex86met1p_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_49mex86met1p(void)
+{
+    PyObject* mod;
+    static void* Pymod_49mex86met1p_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_49mex86met1p_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_49mex86met1p_API, "mod_49mex86met1p._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,7 @@
+
+def fused_temporaries(a : 'float[::]', b : 'float[::]', c : 'float[::]', v : 'float[::]'):
+    from numpy import sqrt
+    t = a * b
+    u = t + c
+    v[::] = sqrt(u)
+
@@ -0,0 +1,23 @@
+module mod_4c7mcuwbheen
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int32_1d_scalar_add(x, a) 
+
+    implicit none
+
+    integer(i32), intent(inout) :: x(0_i64:)
+    integer(i32), value :: a
+
+    x(:) = x(:) + a
+
+  end subroutine array_int32_1d_scalar_add
+  !........................................
+
+end module mod_4c7mcuwbheen
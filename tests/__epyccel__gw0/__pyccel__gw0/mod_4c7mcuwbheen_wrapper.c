@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4C7MCUWBHEEN_WRAPPER
+
+#include "mod_4c7mcuwbheen_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_int32_1d_scalar_add_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* a_obj;
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    int64_t x_strides[1];
+    int32_t a;
+    static const char* const kwlist[] = {
+        "x",
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &a_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT32, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_Int32(a_obj))
+    {
+        a = PyInt32_to_Int32(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.int32 for argument a");
+        return NULL;
+    }
+    bind_c_array_int32_1d_scalar_add(x_data, x_shape[INT64_C(0)], x_strides[INT64_C(0)], a);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4c7mcuwbheen_methods[] = {
+    {
+        "array_int32_1d_scalar_add",
+        (PyCFunction)bind_c_array_int32_1d_scalar_add_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4c7mcuwbheen_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4c7mcuwbheen",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4c7mcuwbheen_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4c7mcuwbheen(void)
+{
+    PyObject* mod;
+    static void* Pymod_4c7mcuwbheen_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4c7mcuwbheen_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4c7mcuwbheen_API, "mod_4c7mcuwbheen._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
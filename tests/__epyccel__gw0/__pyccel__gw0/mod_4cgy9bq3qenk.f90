@@ -0,0 +1,47 @@
+module mod_4cgy9bq3qenk
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use Set_real8_mod
+  use Set_real8_extensions_mod
+  use Vector_real8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine union_list(Out_0001, Out_0002, Out_0003, Out_0004) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+    real(f64), intent(out) :: Out_0004
+    type(Set_real8) :: a
+    type(Vector_real8) :: b
+    type(Set_real8) :: d
+    real(f64) :: Dummy_0000
+    integer(i64) :: Dummy_0001
+
+    a = Set_real8([1.2_f64, 2.3_f64])
+    b = Vector_real8([1.2_f64, 5.0_f64])
+    d = Set_real8(a)
+    do Dummy_0001 = 0_i64, b % size() - 1_i64
+      Dummy_0000 = b%of(Dummy_0001 + 1_i64)
+      call d % insert( Dummy_0000 )
+    end do
+    Out_0001 = d % size()
+    Out_0002 = Set_real8_pop(d)
+
+    Out_0003 = Set_real8_pop(d)
+
+    Out_0004 = Set_real8_pop(d)
+
+    return
+
+  end subroutine union_list
+  !........................................
+
+end module mod_4cgy9bq3qenk
@@ -0,0 +1,12 @@
+#ifndef MOD_4CTBFTUDXVY5_H
+#define MOD_4CTBFTUDXVY5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_2d_F_array_initialization(t_ndarray a);
+#endif // mod_4ctbftudxvy5_H
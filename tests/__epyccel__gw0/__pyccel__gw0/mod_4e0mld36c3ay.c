@@ -0,0 +1,22 @@
+#include "mod_4e0mld36c3ay.h"
+
+
+/*........................................*/
+void array_int32_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y)
+{
+    t_ndarray z = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    z = array_create(2, (int64_t[]){INT64_C(2), INT64_C(3)}, nd_int32, false, order_f);
+    array_fill((int32_t)5, z);
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < x.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_int32, i, i_0001) = (int32_t)floor((double)(GET_ELEMENT(x, nd_int32, i, i_0001)) / (double)(GET_ELEMENT(y, nd_int32, i, i_0001))) * GET_ELEMENT(x, nd_int32, i, i_0001) + z.nd_int32[i_0001 * z.shape[INT64_C(0)] + i];
+        }
+    }
+    free_array(&z);
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_4E0MLD36C3AY_H
+#define MOD_4E0MLD36C3AY_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_4e0mld36c3ay_H
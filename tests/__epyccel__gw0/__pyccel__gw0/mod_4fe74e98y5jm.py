@@ -0,0 +1,7 @@
+from pyccel.decorators import template
+
+@template('T', ['float32', 'float'])
+def array_float_1d_scalar_add(x : 'T[::]', a : 'T', x_len : 'int'):
+    for i in range(0, x_len, 1):
+        x[i] += a
+
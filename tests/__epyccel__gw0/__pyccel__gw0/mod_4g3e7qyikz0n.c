@@ -0,0 +1,43 @@
+#include "mod_4g3e7qyikz0n.h"
+
+
+/*........................................*/
+void array_float_nested_C_array_initialization(t_ndarray x, t_ndarray y, t_ndarray z, t_ndarray a)
+{
+    t_ndarray tmp = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    int64_t i_0003;
+    int64_t offset;
+    tmp = array_create(4, (int64_t[]){INT64_C(3), x.shape[INT64_C(0)], x.shape[INT64_C(1)], x.shape[INT64_C(2)]}, nd_double, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&tmp, x, offset);
+    offset += x.length;
+    array_copy_data(&tmp, y, offset);
+    offset += y.length;
+    array_copy_data(&tmp, z, offset);
+    offset += z.length;
+    array_copy_data(&tmp, z, offset);
+    offset += z.length;
+    array_copy_data(&tmp, x, offset);
+    {
+        double* restrict tmp_data = tmp.nd_double;
+        for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+            {
+                for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+                {
+                    for (i_0003 = INT64_C(0); i_0003 < a.shape[INT64_C(3)]; i_0003 += INT64_C(1))
+                    {
+                        GET_ELEMENT(a, nd_double, i, i_0001, i_0002, i_0003) = tmp_data[((i * tmp.shape[INT64_C(1)] + i_0001) * tmp.shape[INT64_C(2)] + i_0002) * tmp.shape[INT64_C(3)] + i_0003];
+                    }
+                }
+            }
+        }
+    }
+    free_array(&tmp);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_4G3E7QYIKZ0N_H
+#define MOD_4G3E7QYIKZ0N_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_C_array_initialization(t_ndarray x, t_ndarray y, t_ndarray z, t_ndarray a);
+#endif // mod_4g3e7qyikz0n_H
@@ -0,0 +1,42 @@
+module mod_4gozq6ldz4ud
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function omp_barrier() result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    integer(i64), allocatable :: arr(:)
+    integer(i64) :: i
+
+    allocate(arr(0:999_i64))
+    arr = 0_i64
+    func_result = 0_i64
+    !$omp parallel num_threads(3)
+    !$omp do
+    do i = 0_i64, 999_i64
+      arr(i) = i * 2_i64
+    end do
+    !$omp end do
+    !$omp barrier
+    !$omp do reduction(+: func_result)
+    do i = 0_i64, 999_i64
+      func_result = func_result + arr(i)
+    end do
+    !$omp end do
+    !$omp end parallel
+    if (allocated(arr)) then
+      deallocate(arr)
+    end if
+    return
+
+  end function omp_barrier
+  !........................................
+
+end module mod_4gozq6ldz4ud
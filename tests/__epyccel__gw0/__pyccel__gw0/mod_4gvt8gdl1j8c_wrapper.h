@@ -0,0 +1,41 @@
+#ifndef MOD_4GVT8GDL1J8C_WRAPPER_H
+#define MOD_4GVT8GDL1J8C_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_4GVT8GDL1J8C_WRAPPER
+
+int64_t bind_c_square_0000(int64_t);
+double bind_c_square_0001(double);
+
+#else
+
+static void** Pymod_4gvt8gdl1j8c_API;
+
+
+/*........................................*/
+static int mod_4gvt8gdl1j8c_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_4gvt8gdl1j8c_API = (void**)PyCapsule_Import("mod_4gvt8gdl1j8c._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_4gvt8gdl1j8c_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_4GVT8GDL1J8C_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_4H9V66JPNV7P_H
+#define MOD_4H9V66JPNV7P_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_num_threads(void);
+#endif // mod_4h9v66jpnv7p_H
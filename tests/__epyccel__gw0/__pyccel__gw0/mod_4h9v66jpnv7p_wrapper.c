@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4H9V66JPNV7P_WRAPPER
+
+#include "mod_4h9v66jpnv7p_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_num_threads_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t n;
+    PyObject* n_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    n = get_num_threads();
+    n_obj = Int32_to_NumpyLong(&n);
+    return n_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4h9v66jpnv7p_methods[] = {
+    {
+        "get_num_threads",
+        (PyCFunction)get_num_threads_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4h9v66jpnv7p_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4h9v66jpnv7p",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4h9v66jpnv7p_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4h9v66jpnv7p(void)
+{
+    PyObject* mod;
+    static void* Pymod_4h9v66jpnv7p_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4h9v66jpnv7p_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4h9v66jpnv7p_API, "mod_4h9v66jpnv7p._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,34 @@
+module mod_4hio56qdohoz
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i32 => &
+        C_INT32_T , i16 => C_INT16_T , i64 => C_INT64_T , i8 => &
+        C_INT8_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f15(a, b, c, d, e) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    logical(b1), value :: a
+    integer(i8), value :: b
+    integer(i16), value :: c
+    integer(i32), value :: d
+    integer(i64), value :: e
+
+    if (a) then
+      Out_0001 = Int(b + c, kind = i64)
+      return
+    else
+      Out_0001 = d + e
+      return
+    end if
+
+  end function f15
+  !........................................
+
+end module mod_4hio56qdohoz
@@ -0,0 +1,29 @@
+module mod_4iywz0dwkq8n
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function test_omp_get_team_size() result(team_size)
+
+    use omp_lib, only: omp_get_team_size
+    use omp_lib, only: omp_get_active_level
+
+    implicit none
+
+    integer(i32) :: team_size
+    integer(i32) :: active_level
+
+    !$omp parallel
+    active_level = omp_get_active_level()
+    team_size = omp_get_team_size(active_level)
+    !$omp end parallel
+    return
+
+  end function test_omp_get_team_size
+  !........................................
+
+end module mod_4iywz0dwkq8n
@@ -0,0 +1,55 @@
+module mod_4jvabtrbcu7a
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine update_range(Out_0001, Out_0002, Out_0003, Out_0004, &
+        Out_0005, Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    integer(i64), intent(out) :: Out_0006
+    integer(i64), intent(out) :: Out_0007
+    integer(i64), intent(out) :: Out_0008
+    integer(i64), intent(out) :: Out_0009
+    type(Set_integer8) :: a
+    integer(i64) :: Dummy_0000
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64])
+    do Dummy_0000 = 4_i64, 8_i64
+      call a % insert( Dummy_0000 )
+    end do
+    Out_0001 = a % size()
+    Out_0002 = Set_integer8_pop(a)
+
+    Out_0003 = Set_integer8_pop(a)
+
+    Out_0004 = Set_integer8_pop(a)
+
+    Out_0005 = Set_integer8_pop(a)
+
+    Out_0006 = Set_integer8_pop(a)
+
+    Out_0007 = Set_integer8_pop(a)
+
+    Out_0008 = Set_integer8_pop(a)
+
+    Out_0009 = Set_integer8_pop(a)
+
+    return
+
+  end subroutine update_range
+  !........................................
+
+end module mod_4jvabtrbcu7a
@@ -0,0 +1,11 @@
+#ifndef MOD_4K6N1IS3OE1W_H
+#define MOD_4K6N1IS3OE1W_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_4k6n1is3oe1w_H
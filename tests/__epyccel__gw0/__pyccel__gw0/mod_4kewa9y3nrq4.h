@@ -0,0 +1,11 @@
+#ifndef MOD_4KEWA9Y3NRQ4_H
+#define MOD_4KEWA9Y3NRQ4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_4d_F_array_initialization(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_4kewa9y3nrq4_H
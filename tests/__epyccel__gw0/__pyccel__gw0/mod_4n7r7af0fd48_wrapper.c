@@ -0,0 +1,510 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4N7R7AF0FD48_WRAPPER
+
+#include "mod_4n7r7af0fd48_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0000_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    bool a;
+    bool b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyBool_to_Bool(a_obj);
+    b = PyBool_to_Bool(b_obj);
+    return_array_0000(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0001_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t a;
+    int64_t b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = PyInt64_to_Int64(b_obj);
+    return_array_0001(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0002_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int8_t a;
+    int8_t b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt8_to_Int8(a_obj);
+    b = PyInt8_to_Int8(b_obj);
+    return_array_0002(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0003_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int16_t a;
+    int16_t b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt16_to_Int16(a_obj);
+    b = PyInt16_to_Int16(b_obj);
+    return_array_0003(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0004_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int32_t a;
+    int32_t b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt32_to_Int32(a_obj);
+    b = PyInt32_to_Int32(b_obj);
+    return_array_0004(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0005_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t a;
+    int64_t b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = PyInt64_to_Int64(b_obj);
+    return_array_0005(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0006_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    double a;
+    double b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = PyDouble_to_Double(b_obj);
+    return_array_0006(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0007_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    float a;
+    float b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyFloat_to_Float(a_obj);
+    b = PyFloat_to_Float(b_obj);
+    return_array_0007(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0008_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    double a;
+    double b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = PyDouble_to_Double(b_obj);
+    return_array_0008(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0009_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    float complex a;
+    float complex b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyComplex_to_Complex64(a_obj);
+    b = PyComplex_to_Complex64(b_obj);
+    return_array_0009(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0010_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    double complex a;
+    double complex b;
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* y_obj;
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyComplex_to_Complex128(a_obj);
+    b = PyComplex_to_Complex128(b_obj);
+    return_array_0010(a, b, &x, &y);
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    Out_obj = Py_BuildValue("OO", x_obj, y_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t return_array_type_check(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_Bool(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeInt(a_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Int8(a_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Int16(a_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Int32(a_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_Int64(a_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (PyIs_NativeFloat(a_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Float(a_obj))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (PyIs_Double(a_obj))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else if (PyIs_Complex64(a_obj))
+    {
+        type_indicator += INT64_C(9);
+    }
+    else if (PyIs_Complex128(a_obj))
+    {
+        type_indicator += INT64_C(10);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    if (PyIs_Bool(b_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeInt(b_obj))
+    {
+        type_indicator += INT64_C(11);
+    }
+    else if (PyIs_Int8(b_obj))
+    {
+        type_indicator += INT64_C(22);
+    }
+    else if (PyIs_Int16(b_obj))
+    {
+        type_indicator += INT64_C(33);
+    }
+    else if (PyIs_Int32(b_obj))
+    {
+        type_indicator += INT64_C(44);
+    }
+    else if (PyIs_Int64(b_obj))
+    {
+        type_indicator += INT64_C(55);
+    }
+    else if (PyIs_NativeFloat(b_obj))
+    {
+        type_indicator += INT64_C(66);
+    }
+    else if (PyIs_Float(b_obj))
+    {
+        type_indicator += INT64_C(77);
+    }
+    else if (PyIs_Double(b_obj))
+    {
+        type_indicator += INT64_C(88);
+    }
+    else if (PyIs_Complex64(b_obj))
+    {
+        type_indicator += INT64_C(99);
+    }
+    else if (PyIs_Complex128(b_obj))
+    {
+        type_indicator += INT64_C(110);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument b");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* return_array_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &a_obj, &b_obj))
+    {
+        return NULL;
+    }
+    type_indicator = return_array_type_check(a_obj, b_obj);
+    switch (type_indicator)
+    {
+        case INT64_C(0):
+        {
+            return return_array_0000_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(12):
+        {
+            return return_array_0001_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(24):
+        {
+            return return_array_0002_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(36):
+        {
+            return return_array_0003_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(48):
+        {
+            return return_array_0004_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(60):
+        {
+            return return_array_0005_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(72):
+        {
+            return return_array_0006_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(84):
+        {
+            return return_array_0007_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(96):
+        {
+            return return_array_0008_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(108):
+        {
+            return return_array_0009_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(120):
+        {
+            return return_array_0010_wrapper(a_obj, b_obj);
+        }
+        default:
+        {
+            PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+            return NULL;
+        }
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4n7r7af0fd48_methods[] = {
+    {
+        "return_array",
+        (PyCFunction)return_array_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4n7r7af0fd48_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4n7r7af0fd48",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4n7r7af0fd48_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4n7r7af0fd48(void)
+{
+    PyObject* mod;
+    static void* Pymod_4n7r7af0fd48_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4n7r7af0fd48_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4n7r7af0fd48_API, "mod_4n7r7af0fd48._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_4OYN9P40QRWJ_H
+#define MOD_4OYN9P40QRWJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul(t_ndarray A, t_ndarray B, t_ndarray out);
+#endif // mod_4oyn9p40qrwj_H
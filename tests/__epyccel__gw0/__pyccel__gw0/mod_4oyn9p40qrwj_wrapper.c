@@ -0,0 +1,114 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4OYN9P40QRWJ_WRAPPER
+
+#include "mod_4oyn9p40qrwj_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_2d_2d_matmul_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* A_obj;
+    PyObject* B_obj;
+    PyObject* out_obj;
+    t_ndarray A = {.raw_data = NULL};
+    t_ndarray B = {.raw_data = NULL};
+    t_ndarray out = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "A",
+        "B",
+        "out",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &A_obj, &B_obj, &out_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("A", A_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        A = pyarray_to_ndarray(A_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("B", B_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        B = pyarray_to_ndarray(B_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out", out_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        out = pyarray_to_ndarray(out_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    array_float_2d_2d_matmul(A, B, out);
+    free_pointer(&A);
+    free_pointer(&B);
+    free_pointer(&out);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4oyn9p40qrwj_methods[] = {
+    {
+        "array_float_2d_2d_matmul",
+        (PyCFunction)array_float_2d_2d_matmul_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4oyn9p40qrwj_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4oyn9p40qrwj",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4oyn9p40qrwj_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4oyn9p40qrwj(void)
+{
+    PyObject* mod;
+    static void* Pymod_4oyn9p40qrwj_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4oyn9p40qrwj_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4oyn9p40qrwj_API, "mod_4oyn9p40qrwj._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,26 @@
+module mod_4qltanfj80fz
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function test_omp_get_thread_limit() result(maximum_threads_available)
+
+    use omp_lib, only: omp_get_thread_limit
+
+    implicit none
+
+    integer(i32) :: maximum_threads_available
+
+    !$omp parallel
+    maximum_threads_available = omp_get_thread_limit()
+    !$omp end parallel
+    return
+
+  end function test_omp_get_thread_limit
+  !........................................
+
+end module mod_4qltanfj80fz
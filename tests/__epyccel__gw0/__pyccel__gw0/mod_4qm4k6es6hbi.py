@@ -0,0 +1,6 @@
+
+def clear_2():
+    a = []
+    a.clear()
+    return a
+
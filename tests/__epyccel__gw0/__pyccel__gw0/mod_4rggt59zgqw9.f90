@@ -0,0 +1,88 @@
+module mod_4rggt59zgqw9
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function omp_long_line(long_variable_1_oiwed423rnoij21d4kojklm, &
+        long_variable_2_oiwedqwrnoij2asxaxnjkna, &
+        long_variable_3_oiweqxhnoijaqed34023423, &
+        long_variable_4_oiweaxaijaqedqd34023423, &
+        long_variable_5_oiwed423rnoic3242ewdx35) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    integer(i64), intent(in) :: long_variable_1_oiwed423rnoij21d4kojklm( &
+          0_i64:)
+    integer(i64), intent(in) :: long_variable_2_oiwedqwrnoij2asxaxnjkna( &
+          0_i64:)
+    integer(i64), intent(in) :: long_variable_3_oiweqxhnoijaqed34023423( &
+          0_i64:)
+    integer(i64), intent(in) :: long_variable_4_oiweaxaijaqedqd34023423( &
+          0_i64:)
+    integer(i64), intent(in) :: long_variable_5_oiwed423rnoic3242ewdx35( &
+          0_i64:)
+    integer(i64) :: n1
+    integer(i64) :: n2
+    integer(i64) :: n3
+    integer(i64) :: n4
+    integer(i64) :: n5
+    integer(i64) :: i1
+    integer(i64) :: i2
+    integer(i64) :: i3
+    integer(i64) :: i4
+    integer(i64) :: i5
+
+    func_result = 0_i64
+    n1 = size(long_variable_1_oiwed423rnoij21d4kojklm, kind=i64)
+    n2 = size(long_variable_2_oiwedqwrnoij2asxaxnjkna, kind=i64)
+    n3 = size(long_variable_3_oiweqxhnoijaqed34023423, kind=i64)
+    n4 = size(long_variable_4_oiweaxaijaqedqd34023423, kind=i64)
+    n5 = size(long_variable_5_oiwed423rnoic3242ewdx35, kind=i64)
+    !$omp parallel private(i1, i2, i3, i4, i5) shared( &
+    !$omp &long_variable_1_oiwed423rnoij21d4kojklm, &
+    !$omp &long_variable_2_oiwedqwrnoij2asxaxnjkna, &
+    !$omp &long_variable_3_oiweqxhnoijaqed34023423, &
+    !$omp &long_variable_4_oiweaxaijaqedqd34023423, &
+    !$omp &long_variable_5_oiwed423rnoic3242ewdx35, n1, n2, n3, n4, n5)
+    !$omp do reduction(+: func_result)
+    do i1 = 0_i64, n1 - 1_i64
+      func_result = func_result + &
+            long_variable_1_oiwed423rnoij21d4kojklm(i1)
+    end do
+    !$omp end do
+    !$omp do reduction(+: func_result)
+    do i2 = 0_i64, n2 - 1_i64
+      func_result = func_result + &
+            long_variable_2_oiwedqwrnoij2asxaxnjkna(i2)
+    end do
+    !$omp end do
+    !$omp do reduction(+: func_result)
+    do i3 = 0_i64, n3 - 1_i64
+      func_result = func_result + &
+            long_variable_3_oiweqxhnoijaqed34023423(i3)
+    end do
+    !$omp end do
+    !$omp do reduction(+: func_result)
+    do i4 = 0_i64, n4 - 1_i64
+      func_result = func_result + &
+            long_variable_4_oiweaxaijaqedqd34023423(i4)
+    end do
+    !$omp end do
+    !$omp do reduction(+: func_result)
+    do i5 = 0_i64, n5 - 1_i64
+      func_result = func_result + &
+            long_variable_5_oiwed423rnoic3242ewdx35(i5)
+    end do
+    !$omp end do
+    !$omp end parallel
+    return
+
+  end function omp_long_line
+  !........................................
+
+end module mod_4rggt59zgqw9
@@ -0,0 +1,149 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4RGGT59ZGQW9_WRAPPER
+
+#include "mod_4rggt59zgqw9_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_omp_long_line_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* long_variable_1_oiwed423rnoij21d4kojklm_obj;
+    PyObject* long_variable_2_oiwedqwrnoij2asxaxnjkna_obj;
+    PyObject* long_variable_3_oiweqxhnoijaqed34023423_obj;
+    PyObject* long_variable_4_oiweaxaijaqedqd34023423_obj;
+    PyObject* long_variable_5_oiwed423rnoic3242ewdx35_obj;
+    void* long_variable_1_oiwed423rnoij21d4kojklm_data = NULL;
+    int64_t long_variable_1_oiwed423rnoij21d4kojklm_shape[1];
+    int64_t long_variable_1_oiwed423rnoij21d4kojklm_strides[1];
+    void* long_variable_2_oiwedqwrnoij2asxaxnjkna_data = NULL;
+    int64_t long_variable_2_oiwedqwrnoij2asxaxnjkna_shape[1];
+    int64_t long_variable_2_oiwedqwrnoij2asxaxnjkna_strides[1];
+    void* long_variable_3_oiweqxhnoijaqed34023423_data = NULL;
+    int64_t long_variable_3_oiweqxhnoijaqed34023423_shape[1];
+    int64_t long_variable_3_oiweqxhnoijaqed34023423_strides[1];
+    void* long_variable_4_oiweaxaijaqedqd34023423_data = NULL;
+    int64_t long_variable_4_oiweaxaijaqedqd34023423_shape[1];
+    int64_t long_variable_4_oiweaxaijaqedqd34023423_strides[1];
+    void* long_variable_5_oiwed423rnoic3242ewdx35_data = NULL;
+    int64_t long_variable_5_oiwed423rnoic3242ewdx35_shape[1];
+    int64_t long_variable_5_oiwed423rnoic3242ewdx35_strides[1];
+    int64_t func_result;
+    PyObject* func_result_obj;
+    static const char* const kwlist[] = {
+        "long_variable_1_oiwed423rnoij21d4kojklm",
+        "long_variable_2_oiwedqwrnoij2asxaxnjkna",
+        "long_variable_3_oiweqxhnoijaqed34023423",
+        "long_variable_4_oiweaxaijaqedqd34023423",
+        "long_variable_5_oiwed423rnoic3242ewdx35",
+        NULL
+    };
+    static PyObject* kwlist_interned[6] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 5, 5, &long_variable_1_oiwed423rnoij21d4kojklm_obj, &long_variable_2_oiwedqwrnoij2asxaxnjkna_obj, &long_variable_3_oiweqxhnoijaqed34023423_obj, &long_variable_4_oiweaxaijaqedqd34023423_obj, &long_variable_5_oiwed423rnoic3242ewdx35_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_1_oiwed423rnoij21d4kojklm", long_variable_1_oiwed423rnoij21d4kojklm_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_1_oiwed423rnoij21d4kojklm_data = PyArray_DATA((PyArrayObject*)(long_variable_1_oiwed423rnoij21d4kojklm_obj));
+        get_strides_and_shape_from_numpy_array(long_variable_1_oiwed423rnoij21d4kojklm_obj, long_variable_1_oiwed423rnoij21d4kojklm_shape, long_variable_1_oiwed423rnoij21d4kojklm_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_2_oiwedqwrnoij2asxaxnjkna", long_variable_2_oiwedqwrnoij2asxaxnjkna_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_2_oiwedqwrnoij2asxaxnjkna_data = PyArray_DATA((PyArrayObject*)(long_variable_2_oiwedqwrnoij2asxaxnjkna_obj));
+        get_strides_and_shape_from_numpy_array(long_variable_2_oiwedqwrnoij2asxaxnjkna_obj, long_variable_2_oiwedqwrnoij2asxaxnjkna_shape, long_variable_2_oiwedqwrnoij2asxaxnjkna_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_3_oiweqxhnoijaqed34023423", long_variable_3_oiweqxhnoijaqed34023423_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_3_oiweqxhnoijaqed34023423_data = PyArray_DATA((PyArrayObject*)(long_variable_3_oiweqxhnoijaqed34023423_obj));
+        get_strides_and_shape_from_numpy_array(long_variable_3_oiweqxhnoijaqed34023423_obj, long_variable_3_oiweqxhnoijaqed34023423_shape, long_variable_3_oiweqxhnoijaqed34023423_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_4_oiweaxaijaqedqd34023423", long_variable_4_oiweaxaijaqedqd34023423_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_4_oiweaxaijaqedqd34023423_data = PyArray_DATA((PyArrayObject*)(long_variable_4_oiweaxaijaqedqd34023423_obj));
+        get_strides_and_shape_from_numpy_array(long_variable_4_oiweaxaijaqedqd34023423_obj, long_variable_4_oiweaxaijaqedqd34023423_shape, long_variable_4_oiweaxaijaqedqd34023423_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_5_oiwed423rnoic3242ewdx35", long_variable_5_oiwed423rnoic3242ewdx35_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_5_oiwed423rnoic3242ewdx35_data = PyArray_DATA((PyArrayObject*)(long_variable_5_oiwed423rnoic3242ewdx35_obj));
+        get_strides_and_shape_from_numpy_array(long_variable_5_oiwed423rnoic3242ewdx35_obj, long_variable_5_oiwed423rnoic3242ewdx35_shape, long_variable_5_oiwed423rnoic3242ewdx35_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    func_result = bind_c_omp_long_line(long_variable_1_oiwed423rnoij21d4kojklm_data, long_variable_1_oiwed423rnoij21d4kojklm_shape[INT64_C(0)], long_variable_1_oiwed423rnoij21d4kojklm_strides[INT64_C(0)], long_variable_2_oiwedqwrnoij2asxaxnjkna_data, long_variable_2_oiwedqwrnoij2asxaxnjkna_shape[INT64_C(0)], long_variable_2_oiwedqwrnoij2asxaxnjkna_strides[INT64_C(0)], long_variable_3_oiweqxhnoijaqed34023423_data, long_variable_3_oiweqxhnoijaqed34023423_shape[INT64_C(0)], long_variable_3_oiweqxhnoijaqed34023423_strides[INT64_C(0)], long_variable_4_oiweaxaijaqedqd34023423_data, long_variable_4_oiweaxaijaqedqd34023423_shape[INT64_C(0)], long_variable_4_oiweaxaijaqedqd34023423_strides[INT64_C(0)], long_variable_5_oiwed423rnoic3242ewdx35_data, long_variable_5_oiwed423rnoic3242ewdx35_shape[INT64_C(0)], long_variable_5_oiwed423rnoic3242ewdx35_strides[INT64_C(0)]);
+    func_result_obj = Int64_to_PyLong(&func_result);
+    return func_result_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4rggt59zgqw9_methods[] = {
+    {
+        "omp_long_line",
+        (PyCFunction)bind_c_omp_long_line_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4rggt59zgqw9_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4rggt59zgqw9",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4rggt59zgqw9_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4rggt59zgqw9(void)
+{
+    PyObject* mod;
+    static void* Pymod_4rggt59zgqw9_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4rggt59zgqw9_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4rggt59zgqw9_API, "mod_4rggt59zgqw9._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
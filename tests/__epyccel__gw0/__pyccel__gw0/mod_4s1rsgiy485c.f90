@@ -0,0 +1,35 @@
+module mod_4s1rsgiy485c
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_2d_C_slice_stride_13(a, Out_0001, Out_0002, Out_0003, &
+        Out_0004, Out_0005)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    integer(i64), target, intent(in) :: a(0_i64:, 0_i64:)
+    integer(i64), pointer :: b(:, :)
+
+    b(0:, 0:) => a(5_i64:14_i64, 15_i64:6_i64:-2_i64)
+    Out_0001 = sum(b)
+    Out_0002 = b(0_i64, 0_i64)
+    Out_0003 = b(size(b, 1_i64, i64) - 1_i64, size(b, 2_i64, i64) - &
+          1_i64)
+    Out_0004 = size(b, 2_i64, i64)
+    Out_0005 = size(b, 1_i64, i64)
+    return
+
+  end subroutine array_2d_C_slice_stride_13
+  !........................................
+
+end module mod_4s1rsgiy485c
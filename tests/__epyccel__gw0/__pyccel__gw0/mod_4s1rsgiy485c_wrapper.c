@@ -0,0 +1,112 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4S1RSGIY485C_WRAPPER
+
+#include "mod_4s1rsgiy485c_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_2d_c_slice_stride_13_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    void* a_data = NULL;
+    int64_t a_shape[2];
+    int64_t a_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    int64_t Out_0004;
+    PyObject* Out_0005_obj;
+    int64_t Out_0005;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_INT64, INT64_C(2), STRIDED_C_ORDER))
+    {
+        a_data = PyArray_DATA((PyArrayObject*)(a_obj));
+        get_strides_and_shape_from_numpy_array(a_obj, a_shape, a_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_array_2d_c_slice_stride_13(a_data, a_shape[INT64_C(0)], a_shape[INT64_C(1)], a_strides[INT64_C(0)], a_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    Out_0002_obj = Int64_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int64_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int64_to_PyLong(&Out_0004);
+    Out_0005_obj = Int64_to_PyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4s1rsgiy485c_methods[] = {
+    {
+        "array_2d_C_slice_stride_13",
+        (PyCFunction)bind_c_array_2d_c_slice_stride_13_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4s1rsgiy485c_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4s1rsgiy485c",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4s1rsgiy485c_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4s1rsgiy485c(void)
+{
+    PyObject* mod;
+    static void* Pymod_4s1rsgiy485c_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4s1rsgiy485c_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4s1rsgiy485c_API, "mod_4s1rsgiy485c._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,32 @@
+#include "mod_4t2fh0bf8bb2.h"
+
+
+/*........................................*/
+int64_t f2(t_ndarray x, int64_t* n, int64_t* m, int64_t* p, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    y = array_create(3, (int64_t[]){x.shape[INT64_C(2)], x.shape[INT64_C(1)], x.shape[INT64_C(0)]}, nd_int64, false, order_f);
+    for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < y.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            for (i_0002 = INT64_C(0); i_0002 < y.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+            {
+                y.nd_int64[(i_0002 * y.shape[INT64_C(1)] + i_0001) * y.shape[INT64_C(0)] + i] = GET_ELEMENT(x, nd_int64, i_0002, i_0001, i) * INT64_C(2) * INT64_C(3);
+            }
+        }
+    }
+    (*n) = y.shape[INT64_C(0)];
+    (*m) = y.shape[INT64_C(1)];
+    (*p) = y.shape[INT64_C(2)];
+    (*Out_0001) = y.nd_int64[(y.shape[INT64_C(1)] - INT64_C(1)) * y.shape[INT64_C(0)]];
+    (*Out_0002) = y.nd_int64[(y.shape[INT64_C(2)] - INT64_C(1)) * y.shape[INT64_C(1)] * y.shape[INT64_C(0)]];
+    (*Out_0003) = y.nd_int64[(y.shape[INT64_C(1)] - INT64_C(1)) * y.shape[INT64_C(0)] + (y.shape[INT64_C(0)] - INT64_C(1))];
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_4T2FH0BF8BB2_H
+#define MOD_4T2FH0BF8BB2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f2(t_ndarray x, int64_t* n, int64_t* m, int64_t* p, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003);
+#endif // mod_4t2fh0bf8bb2_H
@@ -0,0 +1,115 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_4T2FH0BF8BB2_WRAPPER
+
+#include "mod_4t2fh0bf8bb2_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* n_obj;
+    int64_t n;
+    PyObject* m_obj;
+    int64_t m;
+    PyObject* p_obj;
+    int64_t p;
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT64, INT64_C(3), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    f2(x, &n, &m, &p, &Out_0001, &Out_0002, &Out_0003);
+    free_pointer(&x);
+    n_obj = Int64_to_PyLong(&n);
+    m_obj = Int64_to_PyLong(&m);
+    p_obj = Int64_to_PyLong(&p);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    Out_0002_obj = Int64_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int64_to_NumpyLong(&Out_0003);
+    Out_obj = Py_BuildValue("OOOOOO", n_obj, m_obj, p_obj, Out_0001_obj, Out_0002_obj, Out_0003_obj);
+    Py_DECREF(n_obj);
+    Py_DECREF(m_obj);
+    Py_DECREF(p_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_4t2fh0bf8bb2_methods[] = {
+    {
+        "f2",
+        (PyCFunction)f2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_4t2fh0bf8bb2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_4t2fh0bf8bb2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_4t2fh0bf8bb2_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_4t2fh0bf8bb2(void)
+{
+    PyObject* mod;
+    static void* Pymod_4t2fh0bf8bb2_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_4t2fh0bf8bb2_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_4t2fh0bf8bb2_API, "mod_4t2fh0bf8bb2._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
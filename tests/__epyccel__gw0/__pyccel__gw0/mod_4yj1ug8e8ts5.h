@@ -0,0 +1,11 @@
+#ifndef MOD_4YJ1UG8E8TS5_H
+#define MOD_4YJ1UG8E8TS5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_4yj1ug8e8ts5_H
@@ -0,0 +1,57 @@
+#include "mod_4ytv0lm6knsw.h"
+
+
+/*........................................*/
+int64_t arrs_2d_different_shapes_0(int64_t* Out_0001, int64_t* Out_0002)
+{
+    int64_t array_dummy[INT64_C(12)];
+    t_ndarray pn = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(4), INT64_C(3)},
+        .nd=2,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&pn);
+    int64_t array_dummy_0001[INT64_C(3)];
+    t_ndarray pm = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(1), INT64_C(3)},
+        .nd=2,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&pm);
+    int64_t array_dummy_0002[INT64_C(12)];
+    t_ndarray x = (t_ndarray){
+        .nd_int64=array_dummy_0002,
+        .shape={INT64_C(4), INT64_C(3)},
+        .nd=2,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    int64_t i_0001;
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&pn.nd_int64[INT64_C(0)], Dummy_0000, 12 * pn.type_size);
+    int64_t Dummy_0001[] = {INT64_C(1), INT64_C(1), INT64_C(1)};
+    memcpy(&pm.nd_int64[INT64_C(0)], Dummy_0001, 3 * pm.type_size);
+    {
+        int64_t* restrict pm_data = pm.nd_int64;
+        int64_t* restrict pn_data = pn.nd_int64;
+        int64_t* restrict x_data = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(4); i += INT64_C(1))
+        {
+            for (i_0001 = INT64_C(0); i_0001 < INT64_C(3); i_0001 += INT64_C(1))
+            {
+                x_data[i * x.shape[INT64_C(1)] + i_0001] = pn_data[i * pn.shape[INT64_C(1)] + i_0001] + pm_data[i_0001];
+            }
+        }
+    }
+    (*Out_0001) = INT64_C(4);
+    (*Out_0002) = INT64_C(3);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_4YTV0LM6KNSW_H
+#define MOD_4YTV0LM6KNSW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t arrs_2d_different_shapes_0(int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_4ytv0lm6knsw_H
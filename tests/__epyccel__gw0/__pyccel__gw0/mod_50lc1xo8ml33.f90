@@ -0,0 +1,24 @@
+module mod_50lc1xo8ml33
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine set_num_threads(n) 
+
+    use omp_lib, only: omp_set_num_threads
+
+    implicit none
+
+    integer(i64), value :: n
+
+    call omp_set_num_threads(Int(n, kind = i32))
+
+  end subroutine set_num_threads
+  !........................................
+
+end module mod_50lc1xo8ml33
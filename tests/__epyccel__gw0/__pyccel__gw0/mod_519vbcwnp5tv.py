@@ -0,0 +1,10 @@
+from pyccel.decorators import pure
+
+def tuple_arg_unpacking():
+    @pure
+    def add2(x : 'int', y : 'int'):
+        return x + y
+    args = (3, 4)
+    z = add2(args[0], args[1])
+    return z
+
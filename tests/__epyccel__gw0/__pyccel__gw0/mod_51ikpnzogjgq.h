@@ -0,0 +1,15 @@
+#ifndef MOD_51IKPNZOGJGQ_H
+#define MOD_51IKPNZOGJGQ_H
+
+#include <stdbool.h>
+#include <stdlib.h>
+
+
+struct A {
+    bool is_freed;
+};
+
+void A__init__(struct A* self);
+void A__del__(struct A* self);
+
+#endif // mod_51ikpnzogjgq_H
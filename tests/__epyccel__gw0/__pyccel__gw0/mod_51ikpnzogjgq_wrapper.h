@@ -0,0 +1,51 @@
+#ifndef MOD_51IKPNZOGJGQ_WRAPPER_H
+#define MOD_51IKPNZOGJGQ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_51ikpnzogjgq.h"
+
+struct PyAObject {
+    PyObject_HEAD
+    void* instance;
+    PyObject* referenced_objects;
+    bool is_alias;
+};
+
+#ifdef MOD_51IKPNZOGJGQ_WRAPPER
+
+
+static int A__init___wrapper(struct PyAObject* self_0001, PyObject* args, PyObject* kwargs);
+static void A__del___wrapper(struct PyAObject* self_0001);
+static PyObject* A__new___wrapper(PyTypeObject* self, PyObject* args, PyObject* kwargs);
+
+#else
+
+static void** Pymod_51ikpnzogjgq_API;
+
+#define PyAType (*(PyTypeObject*)Pymod_51ikpnzogjgq_API[0])
+
+/*........................................*/
+static int mod_51ikpnzogjgq_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_51ikpnzogjgq_API = (void**)PyCapsule_Import("mod_51ikpnzogjgq._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_51ikpnzogjgq_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_51IKPNZOGJGQ_WRAPPER_H
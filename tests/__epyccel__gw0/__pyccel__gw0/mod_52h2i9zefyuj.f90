@@ -0,0 +1,60 @@
+module mod_52h2i9zefyuj
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine union_int(Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    integer(i64), intent(out) :: Out_0006
+    integer(i64), intent(out) :: Out_0007
+    integer(i64), intent(out) :: Out_0008
+    type(Set_integer8) :: a
+    type(Set_integer8) :: b
+    integer(i64) :: Dummy_0000
+    type(Set_integer8_Iterator) :: b_iter
+    type(Set_integer8_Iterator) :: b_last
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64, 4_i64])
+    b = Set_integer8([5_i64, 6_i64, 7_i64, 2_i64])
+    b_iter = b % begin()
+    b_last = b % end()
+    do while (b_iter /= b_last)
+      Dummy_0000 = b_iter % of()
+      call a % insert( Dummy_0000 )
+      call b_iter % next()
+    end do
+    Out_0001 = a % size()
+    Out_0002 = Set_integer8_pop(a)
+
+    Out_0003 = Set_integer8_pop(a)
+
+    Out_0004 = Set_integer8_pop(a)
+
+    Out_0005 = Set_integer8_pop(a)
+
+    Out_0006 = Set_integer8_pop(a)
+
+    Out_0007 = Set_integer8_pop(a)
+
+    Out_0008 = Set_integer8_pop(a)
+
+    return
+
+  end subroutine union_int
+  !........................................
+
+end module mod_52h2i9zefyuj
@@ -0,0 +1,15 @@
+#ifndef MOD_53AIILKP76BD_H
+#define MOD_53AIILKP76BD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_ndmin_2_order_0000(t_ndarray x);
+t_ndarray array_ndmin_2_order_0001(t_ndarray x);
+t_ndarray array_ndmin_2_order_0002(t_ndarray x);
+t_ndarray array_ndmin_2_order_0003(t_ndarray x);
+t_ndarray array_ndmin_2_order_0004(t_ndarray x);
+#endif // mod_53aiilkp76bd_H
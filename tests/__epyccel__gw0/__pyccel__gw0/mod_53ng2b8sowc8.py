@@ -0,0 +1,5 @@
+
+def copy_from_arg2(a : 'set[float]'):
+    b = set(a)
+    return b
+
@@ -0,0 +1,11 @@
+#ifndef MOD_53R94WAQW3FC_H
+#define MOD_53R94WAQW3FC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_uncertain_shape_1(void);
+#endif // mod_53r94waqw3fc_H
@@ -0,0 +1,11 @@
+#ifndef MOD_542H67LS9C4Z_H
+#define MOD_542H67LS9C4Z_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray f4(t_ndarray x);
+#endif // mod_542h67ls9c4z_H
@@ -0,0 +1,93 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_542H67LS9C4Z_WRAPPER
+
+#include "mod_542h67ls9c4z_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f4_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    PyObject* y_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    y = f4(x);
+    free_pointer(&x);
+    y_obj = ndarray_to_pyarray(y);
+    free_pointer(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_542h67ls9c4z_methods[] = {
+    {
+        "f4",
+        (PyCFunction)f4_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_542h67ls9c4z_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_542h67ls9c4z",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_542h67ls9c4z_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_542h67ls9c4z(void)
+{
+    PyObject* mod;
+    static void* Pymod_542h67ls9c4z_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_542h67ls9c4z_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_542h67ls9c4z_API, "mod_542h67ls9c4z._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
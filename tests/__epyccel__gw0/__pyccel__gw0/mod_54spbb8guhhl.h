@@ -0,0 +1,11 @@
+#ifndef MOD_54SPBB8GUHHL_H
+#define MOD_54SPBB8GUHHL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_mul(t_ndarray x, double a);
+#endif // mod_54spbb8guhhl_H
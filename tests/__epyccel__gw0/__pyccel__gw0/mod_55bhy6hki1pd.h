@@ -0,0 +1,11 @@
+#ifndef MOD_55BHY6HKI1PD_H
+#define MOD_55BHY6HKI1PD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray copy_to_slice_issue_1218(int64_t n);
+#endif // mod_55bhy6hki1pd_H
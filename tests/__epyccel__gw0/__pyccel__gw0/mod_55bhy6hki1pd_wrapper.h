@@ -0,0 +1,42 @@
+#ifndef MOD_55BHY6HKI1PD_WRAPPER_H
+#define MOD_55BHY6HKI1PD_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_55bhy6hki1pd.h"
+
+
+#ifdef MOD_55BHY6HKI1PD_WRAPPER
+
+
+#else
+
+static void** Pymod_55bhy6hki1pd_API;
+
+
+/*........................................*/
+static int mod_55bhy6hki1pd_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_55bhy6hki1pd_API = (void**)PyCapsule_Import("mod_55bhy6hki1pd._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_55bhy6hki1pd_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_55BHY6HKI1PD_WRAPPER_H
@@ -0,0 +1,23 @@
+module mod_56mbx427jcd5
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , i32 => &
+        C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int32_1d_scalar_sub(x, a) 
+
+    implicit none
+
+    integer(i32), intent(inout) :: x(0_i64:)
+    integer(i32), value :: a
+
+    x(:) = x(:) - a
+
+  end subroutine array_int32_1d_scalar_sub
+  !........................................
+
+end module mod_56mbx427jcd5
@@ -0,0 +1,40 @@
+#ifndef MOD_56Q2F05ND4QG_WRAPPER_H
+#define MOD_56Q2F05ND4QG_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_56Q2F05ND4QG_WRAPPER
+
+int64_t bind_c_directive_in_else(int64_t);
+
+#else
+
+static void** Pymod_56q2f05nd4qg_API;
+
+
+/*........................................*/
+static int mod_56q2f05nd4qg_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_56q2f05nd4qg_API = (void**)PyCapsule_Import("mod_56q2f05nd4qg._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_56q2f05nd4qg_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_56Q2F05ND4QG_WRAPPER_H
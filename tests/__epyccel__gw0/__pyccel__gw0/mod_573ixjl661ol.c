@@ -0,0 +1,34 @@
+#include "mod_573ixjl661ol.h"
+
+
+/*........................................*/
+int64_t arrs_similar_shapes_0(void)
+{
+    double array_dummy[INT64_C(10)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(10)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    double array_dummy_0001[INT64_C(2)];
+    t_ndarray b = (t_ndarray){
+        .nd_double=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    int64_t i;
+    array_fill((double)0.0, a);
+    for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+    {
+        b.nd_double[i] = a.nd_double[i + INT64_C(2)] + a.nd_double[i + INT64_C(4)];
+    }
+    return INT64_C(2);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_573IXJL661OL_H
+#define MOD_573IXJL661OL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_0(void);
+#endif // mod_573ixjl661ol_H
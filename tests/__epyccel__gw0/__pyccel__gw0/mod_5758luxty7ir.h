@@ -0,0 +1,11 @@
+#ifndef MOD_5758LUXTY7IR_H
+#define MOD_5758LUXTY7IR_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_5758luxty7ir_H
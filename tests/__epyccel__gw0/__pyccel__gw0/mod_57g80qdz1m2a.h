@@ -0,0 +1,10 @@
+#ifndef MOD_57G80QDZ1M2A_H
+#define MOD_57G80QDZ1M2A_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t double_while_sum(int64_t n, int64_t m);
+#endif // mod_57g80qdz1m2a_H
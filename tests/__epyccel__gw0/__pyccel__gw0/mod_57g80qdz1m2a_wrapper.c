@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_57G80QDZ1M2A_WRAPPER
+
+#include "mod_57g80qdz1m2a_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* double_while_sum_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* n_obj;
+    PyObject* m_obj;
+    int64_t n;
+    int64_t m;
+    int64_t i;
+    PyObject* i_obj;
+    static const char* const kwlist[] = {
+        "n",
+        "m",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &n_obj, &m_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    if (PyIs_NativeInt(m_obj))
+    {
+        m = PyInt64_to_Int64(m_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument m");
+        return NULL;
+    }
+    i = double_while_sum(n, m);
+    i_obj = Int64_to_PyLong(&i);
+    return i_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_57g80qdz1m2a_methods[] = {
+    {
+        "double_while_sum",
+        (PyCFunction)double_while_sum_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_57g80qdz1m2a_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_57g80qdz1m2a",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_57g80qdz1m2a_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_57g80qdz1m2a(void)
+{
+    PyObject* mod;
+    static void* Pymod_57g80qdz1m2a_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_57g80qdz1m2a_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_57g80qdz1m2a_API, "mod_57g80qdz1m2a._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
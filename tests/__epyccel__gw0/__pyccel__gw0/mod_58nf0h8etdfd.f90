@@ -0,0 +1,50 @@
+module mod_58nf0h8etdfd
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use Map_integer8__real8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine dict_iter_local(keys, vals) 
+
+    implicit none
+
+    integer(i64), intent(out) :: keys
+    real(f64), intent(out) :: vals
+    type(Map_integer8__real8) :: a
+    integer(i64) :: key
+    real(f64) :: val
+    type(Map_integer8__real8_Iterator) :: a_iter
+    type(Map_integer8__real8_Iterator) :: a_last
+    type(Map_integer8__real8_Iterator) :: a_iter_0001
+    type(Map_integer8__real8_Iterator) :: a_last_0001
+
+    a = Map_integer8__real8([Pair_integer8__real8(1_i64, 1.5_f64), &
+          Pair_integer8__real8(2_i64, 2.5_f64), Pair_integer8__real8( &
+          7_i64, 7.5_f64)])
+    keys = 0_i64
+    a_iter = a % begin()
+    a_last = a % end()
+    do while (a_iter /= a_last)
+      key = a_iter % first()
+      keys = keys + key
+      call a_iter % next()
+    end do
+    vals = 0.0_f64
+    a_iter_0001 = a % begin()
+    a_last_0001 = a % end()
+    do while (a_iter_0001 /= a_last_0001)
+      val = a_iter_0001 % second()
+      vals = vals + val
+      call a_iter_0001 % next()
+    end do
+    return
+
+  end subroutine dict_iter_local
+  !........................................
+
+end module mod_58nf0h8etdfd
@@ -0,0 +1,12 @@
+#ifndef MOD_58VJFEJTIABC_H
+#define MOD_58VJFEJTIABC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double tuples_as_indexing_var(void);
+#endif // mod_58vjfejtiabc_H
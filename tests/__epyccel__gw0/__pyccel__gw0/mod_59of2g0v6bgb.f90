@@ -0,0 +1,35 @@
+module mod_59of2g0v6bgb
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine arrs_1d_negative_index_negative_step(Out_0001, Out_0002) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64) :: a(0_i64:9_i64)
+    real(f64), allocatable :: b(:)
+
+    a = 1.0_f64
+    allocate(b(0:ceiling(8.0_f64 / Real((-(-2_i64)), kind = f64)) - &
+          1_i64))
+    b = a(size(a, kind=i64) - 1_i64:2_i64:-2_i64) + a(size(a, kind=i64) &
+          - 1_i64:3_i64:-2_i64)
+    Out_0001 = size(b, kind=i64)
+    Out_0002 = sum(b)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    return
+
+  end subroutine arrs_1d_negative_index_negative_step
+  !........................................
+
+end module mod_59of2g0v6bgb
@@ -0,0 +1,40 @@
+#ifndef MOD_59OF2G0V6BGB_WRAPPER_H
+#define MOD_59OF2G0V6BGB_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_59OF2G0V6BGB_WRAPPER
+
+int64_t bind_c_arrs_1d_negative_index_negative_step(int64_t*, double*);
+
+#else
+
+static void** Pymod_59of2g0v6bgb_API;
+
+
+/*........................................*/
+static int mod_59of2g0v6bgb_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_59of2g0v6bgb_API = (void**)PyCapsule_Import("mod_59of2g0v6bgb._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_59of2g0v6bgb_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_59OF2G0V6BGB_WRAPPER_H
@@ -0,0 +1,23 @@
+#include "mod_5ap6umxpmzne.h"
+
+
+/*........................................*/
+int64_t dict_items(int64_t* key_sum, double* val_sum)
+{
+    hmap_int64_t_double a = {0};
+    int64_t key;
+    double val;
+    a = c_init(hmap_int64_t_double, {{INT64_C(1), 1.0}, {INT64_C(2), 2.0}, {INT64_C(3), 3.0}, {INT64_C(5), 4.7}});
+    (*key_sum) = INT64_C(0);
+    (*val_sum) = 0.0;
+    c_foreach (Dummy_0000, hmap_int64_t_double, a){
+        key = Dummy_0000.ref->first;
+        val = Dummy_0000.ref->second;
+        (*key_sum) += key;
+        (*val_sum) += val;
+    }
+    hmap_int64_t_double_drop(&a);
+    return 0;
+}
+/*........................................*/
+
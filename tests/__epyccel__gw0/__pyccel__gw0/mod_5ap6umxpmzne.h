@@ -0,0 +1,20 @@
+#ifndef MOD_5AP6UMXPMZNE_H
+#define MOD_5AP6UMXPMZNE_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define i_type hmap_int64_t_double
+#define i_key int64_t
+#define i_val double
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+
+
+
+
+int64_t dict_items(int64_t* key_sum, double* val_sum);
+#endif // mod_5ap6umxpmzne_H
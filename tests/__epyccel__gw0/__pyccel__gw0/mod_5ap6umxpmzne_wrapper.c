@@ -0,0 +1,86 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_5AP6UMXPMZNE_WRAPPER
+
+#include "mod_5ap6umxpmzne_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* dict_items_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* key_sum_obj;
+    int64_t key_sum;
+    PyObject* val_sum_obj;
+    double val_sum;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    dict_items(&key_sum, &val_sum);
+    key_sum_obj = Int64_to_PyLong(&key_sum);
+    val_sum_obj = Double_to_PyDouble(&val_sum);
+    Out_obj = Py_BuildValue("OO", key_sum_obj, val_sum_obj);
+    Py_DECREF(key_sum_obj);
+    Py_DECREF(val_sum_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_5ap6umxpmzne_methods[] = {
+    {
+        "dict_items",
+        (PyCFunction)dict_items_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_5ap6umxpmzne_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_5ap6umxpmzne",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_5ap6umxpmzne_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_5ap6umxpmzne(void)
+{
+    PyObject* mod;
+    static void* Pymod_5ap6umxpmzne_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_5ap6umxpmzne_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_5ap6umxpmzne_API, "mod_5ap6umxpmzne._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
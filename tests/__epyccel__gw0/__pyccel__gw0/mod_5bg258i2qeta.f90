@@ -0,0 +1,66 @@
+module mod_5bg258i2qeta
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine union_int(Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009, Out_0010, Out_0011)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    integer(i64), intent(out) :: Out_0006
+    integer(i64), intent(out) :: Out_0007
+    integer(i64), intent(out) :: Out_0008
+    integer(i64), intent(out) :: Out_0009
+    integer(i64), intent(out) :: Out_0010
+    integer(i64), intent(out) :: Out_0011
+    type(Set_integer8) :: a
+    type(Set_integer8) :: b
+    type(Set_integer8) :: c
+    type(Set_integer8) :: d
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64, 4_i64])
+    b = Set_integer8([5_i64, 6_i64, 7_i64])
+    c = Set_integer8([8_i64, 9_i64, 10_i64, 4_i64])
+    d = Set_integer8(a)
+    call d % merge(a)
+    call d % merge(b)
+    call d % merge(c)
+    Out_0001 = d % size()
+    Out_0002 = Set_integer8_pop(d)
+
+    Out_0003 = Set_integer8_pop(d)
+
+    Out_0004 = Set_integer8_pop(d)
+
+    Out_0005 = Set_integer8_pop(d)
+
+    Out_0006 = Set_integer8_pop(d)
+
+    Out_0007 = Set_integer8_pop(d)
+
+    Out_0008 = Set_integer8_pop(d)
+
+    Out_0009 = Set_integer8_pop(d)
+
+    Out_0010 = Set_integer8_pop(d)
+
+    Out_0011 = Set_integer8_pop(d)
+
+    return
+
+  end subroutine union_int
+  !........................................
+
+end module mod_5bg258i2qeta
@@ -0,0 +1,28 @@
+#include "mod_5br4mf2gonto.h"
+
+
+/*........................................*/
+void array_int32_in_bool_out_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri)
+{
+    int32_t array_dummy[INT64_C(6)];
+    t_ndarray z = (t_ndarray){
+        .nd_int32=array_dummy,
+        .shape={INT64_C(2), INT64_C(3)},
+        .nd=2,
+        .type=nd_int32,
+        .is_view=false
+    };
+    stack_array_init(&z);
+    int64_t i;
+    int64_t i_0001;
+    array_fill((int32_t)5, z);
+    for (i = INT64_C(0); i < ri.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < ri.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(ri, nd_bool, i, i_0001) = (int32_t)floor((double)(GET_ELEMENT(x, nd_int32, i, i_0001)) / (double)(GET_ELEMENT(y, nd_int32, i, i_0001))) * GET_ELEMENT(x, nd_int32, i, i_0001) > z.nd_int32[i * z.shape[INT64_C(1)] + i_0001];
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_5BR4MF2GONTO_H
+#define MOD_5BR4MF2GONTO_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_in_bool_out_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri);
+#endif // mod_5br4mf2gonto_H
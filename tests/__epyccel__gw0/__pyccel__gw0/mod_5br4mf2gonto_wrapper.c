@@ -0,0 +1,114 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_5BR4MF2GONTO_WRAPPER
+
+#include "mod_5br4mf2gonto_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_int32_in_bool_out_2d_C_complex_3d_expr_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    PyObject* ri_obj;
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    t_ndarray ri = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        "ri",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &x_obj, &y_obj, &ri_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT32, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("y", y_obj, NPY_INT32, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        y = pyarray_to_ndarray(y_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("ri", ri_obj, NPY_BOOL, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        ri = pyarray_to_ndarray(ri_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    array_int32_in_bool_out_2d_C_complex_3d_expr(x, y, ri);
+    free_pointer(&x);
+    free_pointer(&y);
+    free_pointer(&ri);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_5br4mf2gonto_methods[] = {
+    {
+        "array_int32_in_bool_out_2d_C_complex_3d_expr",
+        (PyCFunction)array_int32_in_bool_out_2d_C_complex_3d_expr_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_5br4mf2gonto_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_5br4mf2gonto",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_5br4mf2gonto_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_5br4mf2gonto(void)
+{
+    PyObject* mod;
+    static void* Pymod_5br4mf2gonto_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_5br4mf2gonto_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_5br4mf2gonto_API, "mod_5br4mf2gonto._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,20 @@
+#ifndef MOD_5BT9WVT876S4_H
+#define MOD_5BT9WVT876S4_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_INT64_T
+#define _TOOLS_LIST_VEC_INT64_T
+#define i_type vec_int64_t
+#define i_key int64_t
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_INT64_T
+
+
+
+
+int64_t zip_prod(int64_t m);
+#endif // mod_5bt9wvt876s4_H
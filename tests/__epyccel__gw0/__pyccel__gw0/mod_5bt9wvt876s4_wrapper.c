@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_5BT9WVT876S4_WRAPPER
+
+#include "mod_5bt9wvt876s4_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* zip_prod_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* m_obj;
+    int64_t m;
+    int64_t res;
+    PyObject* res_obj;
+    static const char* const kwlist[] = {
+        "m",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &m_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(m_obj))
+    {
+        m = PyInt64_to_Int64(m_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument m");
+        return NULL;
+    }
+    res = zip_prod(m);
+    res_obj = Int64_to_PyLong(&res);
+    return res_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_5bt9wvt876s4_methods[] = {
+    {
+        "zip_prod",
+        (PyCFunction)zip_prod_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_5bt9wvt876s4_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_5bt9wvt876s4",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_5bt9wvt876s4_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_5bt9wvt876s4(void)
+{
+    PyObject* mod;
+    static void* Pymod_5bt9wvt876s4_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_5bt9wvt876s4_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_5bt9wvt876s4_API, "mod_5bt9wvt876s4._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
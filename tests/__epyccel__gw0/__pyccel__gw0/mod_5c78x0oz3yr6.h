@@ -0,0 +1,11 @@
+#ifndef MOD_5C78X0OZ3YR6_H
+#define MOD_5C78X0OZ3YR6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_3(t_ndarray a);
+#endif // mod_5c78x0oz3yr6_H
@@ -0,0 +1,93 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_5C78X0OZ3YR6_WRAPPER
+
+#include "mod_5c78x0oz3yr6_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_view_steps_F_2D_3_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    PyObject* b_obj;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    b = array_view_steps_F_2D_3(a);
+    free_pointer(&a);
+    b_obj = ndarray_to_pyarray(b);
+    free_pointer(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_5c78x0oz3yr6_methods[] = {
+    {
+        "array_view_steps_F_2D_3",
+        (PyCFunction)array_view_steps_F_2D_3_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_5c78x0oz3yr6_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_5c78x0oz3yr6",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_5c78x0oz3yr6_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_5c78x0oz3yr6(void)
+{
+    PyObject* mod;
+    static void* Pymod_5c78x0oz3yr6_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_5c78x0oz3yr6_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_5c78x0oz3yr6_API, "mod_5c78x0oz3yr6._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,28 @@
+#ifndef MOD_5CNUQHY3QB02_H
+#define MOD_5CNUQHY3QB02_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_INT64_T
+#define _TOOLS_SET_HSET_INT64_T
+#define i_type hset_int64_t
+#define i_key int64_t
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_INT64_T
+
+#ifndef _TOOLS_SET_HSET_INT64_T
+#define _TOOLS_SET_HSET_INT64_T
+#define i_type hset_int64_t
+#define i_key int64_t
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_INT64_T
+
+
+
+
+int64_t add_int(void);
+#endif // mod_5cnuqhy3qb02_H
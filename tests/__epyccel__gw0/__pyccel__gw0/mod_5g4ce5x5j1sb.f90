@@ -0,0 +1,48 @@
+module mod_5g4ce5x5j1sb
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine update_set_as_arg(Out_0001, Out_0002, Out_0003, Out_0004, &
+        Out_0005, Out_0006, Out_0007)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    integer(i64), intent(out) :: Out_0006
+    integer(i64), intent(out) :: Out_0007
+    type(Set_integer8) :: a
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64])
+    call a % insert( 4_i64 )
+    call a % insert( 5_i64 )
+    call a % insert( 6_i64 )
+    Out_0001 = a % size()
+    Out_0002 = Set_integer8_pop(a)
+
+    Out_0003 = Set_integer8_pop(a)
+
+    Out_0004 = Set_integer8_pop(a)
+
+    Out_0005 = Set_integer8_pop(a)
+
+    Out_0006 = Set_integer8_pop(a)
+
+    Out_0007 = Set_integer8_pop(a)
+
+    return
+
+  end subroutine update_set_as_arg
+  !........................................
+
+end module mod_5g4ce5x5j1sb
@@ -0,0 +1,4 @@
+
+def copy_to_slice_1(a : 'float[::]', b : 'float[::]'):
+    a[1:-1:] = b
+
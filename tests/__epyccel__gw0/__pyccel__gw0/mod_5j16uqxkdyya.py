@@ -0,0 +1,8 @@
+from numpy import array
+
+def array_int_1d_initialization_1():
+    from numpy import array, sum
+    a = array([1, 2, 4, 8, 16])
+    b = array(a)
+    return sum(b),b[0],b[-1]
+
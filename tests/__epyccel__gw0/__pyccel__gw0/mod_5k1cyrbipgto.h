@@ -0,0 +1,11 @@
+#ifndef MOD_5K1CYRBIPGTO_H
+#define MOD_5K1CYRBIPGTO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_sub(t_ndarray x, t_ndarray y);
+#endif // mod_5k1cyrbipgto_H
@@ -0,0 +1,4 @@
+
+def array_float_2d_F_add(x : 'float[::,::](order=F)', y : 'float[::,::](order=F)'):
+    x[::,::] += y
+
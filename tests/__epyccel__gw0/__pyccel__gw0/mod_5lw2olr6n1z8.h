@@ -0,0 +1,13 @@
+#ifndef MOD_5LW2OLR6N1Z8_H
+#define MOD_5LW2OLR6N1Z8_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_mod(t_ndarray x, double a);
+#endif // mod_5lw2olr6n1z8_H
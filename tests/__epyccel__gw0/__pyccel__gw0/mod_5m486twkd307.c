@@ -0,0 +1,12 @@
+#include "mod_5m486twkd307.h"
+
+
+/*........................................*/
+hset_int64_t set_return(void)
+{
+    hset_int64_t a = {0};
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5)});
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,29 @@
+module mod_5nrzl5wb75qt
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function get_min(a, b) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: a
+    integer(i64), value :: b
+
+    if (a < b) then
+      Out_0001 = a
+      return
+    else
+      Out_0001 = b
+      return
+    end if
+
+  end function get_min
+  !........................................
+
+end module mod_5nrzl5wb75qt
@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_5NRZL5WB75QT_WRAPPER
+
+#include "mod_5nrzl5wb75qt_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_get_min_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    int64_t a;
+    int64_t b;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &a_obj, &b_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(a_obj))
+    {
+        a = PyInt64_to_Int64(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument a");
+        return NULL;
+    }
+    if (PyIs_NativeInt(b_obj))
+    {
+        b = PyInt64_to_Int64(b_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument b");
+        return NULL;
+    }
+    Out_0001 = bind_c_get_min(a, b);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_5nrzl5wb75qt_methods[] = {
+    {
+        "get_min",
+        (PyCFunction)bind_c_get_min_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_5nrzl5wb75qt_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_5nrzl5wb75qt",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_5nrzl5wb75qt_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_5nrzl5wb75qt(void)
+{
+    PyObject* mod;
+    static void* Pymod_5nrzl5wb75qt_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_5nrzl5wb75qt_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_5nrzl5wb75qt_API, "mod_5nrzl5wb75qt._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
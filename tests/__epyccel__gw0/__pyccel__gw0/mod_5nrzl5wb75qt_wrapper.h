@@ -0,0 +1,40 @@
+#ifndef MOD_5NRZL5WB75QT_WRAPPER_H
+#define MOD_5NRZL5WB75QT_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_5NRZL5WB75QT_WRAPPER
+
+int64_t bind_c_get_min(int64_t, int64_t);
+
+#else
+
+static void** Pymod_5nrzl5wb75qt_API;
+
+
+/*........................................*/
+static int mod_5nrzl5wb75qt_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_5nrzl5wb75qt_API = (void**)PyCapsule_Import("mod_5nrzl5wb75qt._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_5nrzl5wb75qt_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_5NRZL5WB75QT_WRAPPER_H
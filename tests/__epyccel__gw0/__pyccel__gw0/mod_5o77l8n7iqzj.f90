@@ -0,0 +1,27 @@
+module mod_5o77l8n7iqzj
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function omp_master() result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+
+    func_result = 30_i64
+    !$omp parallel num_threads(3) reduction(+: func_result)
+    !$omp master
+    func_result = func_result + 1_i64
+    !$omp end master
+    !$omp end parallel
+    return
+
+  end function omp_master
+  !........................................
+
+end module mod_5o77l8n7iqzj
@@ -0,0 +1,40 @@
+#ifndef MOD_5O77L8N7IQZJ_WRAPPER_H
+#define MOD_5O77L8N7IQZJ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_5O77L8N7IQZJ_WRAPPER
+
+int64_t bind_c_omp_master(void);
+
+#else
+
+static void** Pymod_5o77l8n7iqzj_API;
+
+
+/*........................................*/
+static int mod_5o77l8n7iqzj_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_5o77l8n7iqzj_API = (void**)PyCapsule_Import("mod_5o77l8n7iqzj._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_5o77l8n7iqzj_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_5O77L8N7IQZJ_WRAPPER_H
@@ -0,0 +1,20 @@
+#ifndef MOD_5P28EEUP6SZS_H
+#define MOD_5P28EEUP6SZS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t dtype_convert_to_int32_0000(t_ndarray arr, int64_t* Out_0001, int32_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005);
+int64_t dtype_convert_to_int32_0001(t_ndarray arr, int64_t* Out_0001, int32_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005);
+int64_t dtype_convert_to_int32_0002(t_ndarray arr, int64_t* Out_0001, int32_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005);
+int64_t dtype_convert_to_int32_0003(t_ndarray arr, int64_t* Out_0001, int32_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005);
+int64_t dtype_convert_to_int32_0004(t_ndarray arr, int64_t* Out_0001, int32_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005);
+int64_t dtype_convert_to_int32_0005(t_ndarray arr, int64_t* Out_0001, int32_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005);
+int64_t dtype_convert_to_int32_0006(t_ndarray arr, int64_t* Out_0001, int32_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005);
+int64_t dtype_convert_to_int32_0007(t_ndarray arr, int64_t* Out_0001, int32_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005);
+int64_t dtype_convert_to_int32_0008(t_ndarray arr, int64_t* Out_0001, int32_t* Out_0002, int32_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005);
+#endif // mod_5p28eeup6szs_H
@@ -0,0 +1,7 @@
+
+def inhomogeneous_tuple_1():
+    ai_0 = 0
+    ai_1 = False
+    ai_2 = (3+1j)
+    return ai_0,ai_1,ai_2
+
@@ -0,0 +1,11 @@
+#ifndef MOD_5PKAJAGQXGQV_H
+#define MOD_5PKAJAGQXGQV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_5pkajagqxgqv_H
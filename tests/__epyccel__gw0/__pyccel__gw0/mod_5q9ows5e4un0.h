@@ -0,0 +1,31 @@
+#ifndef MOD_5Q9OWS5E4UN0_H
+#define MOD_5Q9OWS5E4UN0_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_INT64_T
+#define _TOOLS_LIST_VEC_INT64_T
+#define i_type vec_int64_t
+#define i_key int64_t
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_INT64_T
+
+#ifndef _TOOLS_LIST_VEC_INT64_T
+#define _TOOLS_LIST_VEC_INT64_T
+#define i_type vec_int64_t
+#define i_key int64_t
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_INT64_T
+
+
+
+
+int64_t list_contains(bool* Out_0001, bool* Out_0002, bool* Out_0003);
+#endif // mod_5q9ows5e4un0_H
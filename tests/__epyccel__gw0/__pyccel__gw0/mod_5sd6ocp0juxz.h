@@ -0,0 +1,11 @@
+#ifndef MOD_5SD6OCP0JUXZ_H
+#define MOD_5SD6OCP0JUXZ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_mul(t_ndarray x, int32_t a);
+#endif // mod_5sd6ocp0juxz_H
@@ -0,0 +1,5 @@
+
+def pop_element():
+    a = {1: 1.0, 2: 2.0}
+    return a.pop(1)
+
@@ -0,0 +1,11 @@
+#ifndef MOD_5TMI6V3LPAV6_H
+#define MOD_5TMI6V3LPAV6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_1d_negative_index_2(int64_t* Out_0001, double* Out_0002);
+#endif // mod_5tmi6v3lpav6_H
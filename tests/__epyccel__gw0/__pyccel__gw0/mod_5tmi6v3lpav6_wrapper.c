@@ -0,0 +1,86 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_5TMI6V3LPAV6_WRAPPER
+
+#include "mod_5tmi6v3lpav6_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* arrs_1d_negative_index_2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    double Out_0002;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    arrs_1d_negative_index_2(&Out_0001, &Out_0002);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Double_to_NumpyDouble(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_5tmi6v3lpav6_methods[] = {
+    {
+        "arrs_1d_negative_index_2",
+        (PyCFunction)arrs_1d_negative_index_2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_5tmi6v3lpav6_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_5tmi6v3lpav6",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_5tmi6v3lpav6_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_5tmi6v3lpav6(void)
+{
+    PyObject* mod;
+    static void* Pymod_5tmi6v3lpav6_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_5tmi6v3lpav6_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_5tmi6v3lpav6_API, "mod_5tmi6v3lpav6._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,32 @@
+#include "mod_5twcwla5ipl8.h"
+
+
+/*........................................*/
+void array_float_2d_scalar_add_0000(t_ndarray x, float a, int64_t d1, int64_t d2)
+{
+    int64_t i;
+    int64_t j;
+    for (i = INT64_C(0); i < d1; i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < d2; j += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_float, i, j) += a;
+        }
+    }
+}
+/*........................................*/
+/*........................................*/
+void array_float_2d_scalar_add_0001(t_ndarray x, double a, int64_t d1, int64_t d2)
+{
+    int64_t i;
+    int64_t j;
+    for (i = INT64_C(0); i < d1; i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < d2; j += INT64_C(1))
+        {
+            GET_ELEMENT(x, nd_double, i, j) += a;
+        }
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,176 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_5TWCWLA5IPL8_WRAPPER
+
+#include "mod_5twcwla5ipl8_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_2d_scalar_add_0000_wrapper(PyObject* x_obj, PyObject* a_obj, PyObject* d1_obj, PyObject* d2_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    float a;
+    int64_t d1;
+    int64_t d2;
+    x = pyarray_to_ndarray(x_obj);
+    a = PyFloat_to_Float(a_obj);
+    d1 = PyInt64_to_Int64(d1_obj);
+    d2 = PyInt64_to_Int64(d2_obj);
+    array_float_2d_scalar_add_0000(x, a, d1, d2);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_2d_scalar_add_0001_wrapper(PyObject* x_obj, PyObject* a_obj, PyObject* d1_obj, PyObject* d2_obj)
+{
+    t_ndarray x = {.raw_data = NULL};
+    double a;
+    int64_t d1;
+    int64_t d2;
+    x = pyarray_to_ndarray(x_obj);
+    a = PyDouble_to_Double(a_obj);
+    d1 = PyInt64_to_Int64(d1_obj);
+    d2 = PyInt64_to_Int64(d2_obj);
+    array_float_2d_scalar_add_0001(x, a, d1, d2);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t array_float_2d_scalar_add_type_check(PyObject* x_obj, PyObject* a_obj, PyObject* d1_obj, PyObject* d2_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(x_obj, NPY_FLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(x_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument x");
+        return -INT64_C(1);
+    }
+    if (PyIs_Float(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_NativeFloat(a_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* array_float_2d_scalar_add_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* a_obj;
+    PyObject* d1_obj;
+    PyObject* d2_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "x",
+        "a",
+        "d1",
+        "d2",
+        NULL
+    };
+    static PyObject* kwlist_interned[5] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 4, 4, &x_obj, &a_obj, &d1_obj, &d2_obj))
+    {
+        return NULL;
+    }
+    type_indicator = array_float_2d_scalar_add_type_check(x_obj, a_obj, d1_obj, d2_obj);
+    switch (type_indicator)
+    {
+        case INT64_C(0):
+        {
+            return array_float_2d_scalar_add_0000_wrapper(x_obj, a_obj, d1_obj, d2_obj);
+        }
+        case INT64_C(3):
+        {
+            return array_float_2d_scalar_add_0001_wrapper(x_obj, a_obj, d1_obj, d2_obj);
+        }
+        default:
+        {
+            PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+            return NULL;
+        }
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_5twcwla5ipl8_methods[] = {
+    {
+        "array_float_2d_scalar_add",
+        (PyCFunction)array_float_2d_scalar_add_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_5twcwla5ipl8_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_5twcwla5ipl8",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_5twcwla5ipl8_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_5twcwla5ipl8(void)
+{
+    PyObject* mod;
+    static void* Pymod_5twcwla5ipl8_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_5twcwla5ipl8_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_5twcwla5ipl8_API, "mod_5twcwla5ipl8._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
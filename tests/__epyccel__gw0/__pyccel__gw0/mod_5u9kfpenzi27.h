@@ -0,0 +1,11 @@
+#ifndef MOD_5U9KFPENZI27_H
+#define MOD_5U9KFPENZI27_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_sum_stack_array(void);
+#endif // mod_5u9kfpenzi27_H
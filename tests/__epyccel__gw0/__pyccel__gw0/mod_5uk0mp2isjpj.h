@@ -0,0 +1,11 @@
+#ifndef MOD_5UK0MP2ISJPJ_H
+#define MOD_5UK0MP2ISJPJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_5uk0mp2isjpj_H
@@ -0,0 +1,4 @@
+
+def f9(x : 'int64[::]'):
+    x += 1
+
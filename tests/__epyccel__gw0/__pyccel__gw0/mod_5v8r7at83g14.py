@@ -0,0 +1,7 @@
+from numpy import shape
+
+def arr_arange_3():
+    from numpy import shape, arange
+    a = arange(0, 10, 0.3)
+    return shape(a)[0],a[0],a[-1]
+
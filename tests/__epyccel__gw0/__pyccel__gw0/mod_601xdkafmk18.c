@@ -0,0 +1,40 @@
+#include "mod_601xdkafmk18.h"
+
+
+/*........................................*/
+double tuples_as_indexing_basic(void)
+{
+    double array_dummy[INT64_C(12)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(2), INT64_C(3), INT64_C(2)},
+        .nd=3,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t z;
+    int64_t y;
+    int64_t w;
+    t_ndarray idx = {.raw_data = NULL};
+    double Out_0001;
+    array_fill((double)1.0, x);
+    for (z = INT64_C(0); z < INT64_C(2); z += INT64_C(1))
+    {
+        for (y = INT64_C(0); y < INT64_C(3); y += INT64_C(1))
+        {
+            for (w = INT64_C(0); w < INT64_C(2); w += INT64_C(1))
+            {
+                GET_ELEMENT(x, nd_double, z, y, w) = w + y * INT64_C(2) + z * INT64_C(6);
+            }
+        }
+    }
+    idx = array_create(1, (int64_t[]){INT64_C(3)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(1), INT64_C(0)};
+    memcpy(&idx.nd_int64[INT64_C(0)], Dummy_0000, 3 * idx.type_size);
+    Out_0001 = GET_ELEMENT(x, nd_double, GET_ELEMENT(idx, nd_int64, INT64_C(0)), GET_ELEMENT(idx, nd_int64, INT64_C(1)), GET_ELEMENT(idx, nd_int64, INT64_C(2)));
+    free_array(&idx);
+    return Out_0001;
+}
+/*........................................*/
+
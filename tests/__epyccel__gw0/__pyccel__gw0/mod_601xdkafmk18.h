@@ -0,0 +1,12 @@
+#ifndef MOD_601XDKAFMK18_H
+#define MOD_601XDKAFMK18_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double tuples_as_indexing_basic(void);
+#endif // mod_601xdkafmk18_H
@@ -0,0 +1,23 @@
+module mod_60duq2yuwbuq
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T , i32 => C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int32_1d_scalar_idiv(x, a) 
+
+    implicit none
+
+    integer(i32), intent(inout) :: x(0_i64:)
+    integer(i32), value :: a
+
+    x(:) = FLOOR(x/Real(a, kind = f64),i32)
+
+  end subroutine array_int32_1d_scalar_idiv
+  !........................................
+
+end module mod_60duq2yuwbuq
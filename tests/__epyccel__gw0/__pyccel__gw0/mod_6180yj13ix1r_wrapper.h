@@ -0,0 +1,42 @@
+#ifndef MOD_6180YJ13IX1R_WRAPPER_H
+#define MOD_6180YJ13IX1R_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_6180YJ13IX1R_WRAPPER
+
+void bind_c_array_int32_1d_scalar_sub(void*, int64_t, int64_t, int32_t);
+
+#else
+
+static void** Pymod_6180yj13ix1r_API;
+
+
+/*........................................*/
+static int mod_6180yj13ix1r_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_6180yj13ix1r_API = (void**)PyCapsule_Import("mod_6180yj13ix1r._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_6180yj13ix1r_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_6180YJ13IX1R_WRAPPER_H
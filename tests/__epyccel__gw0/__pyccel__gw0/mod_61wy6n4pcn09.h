@@ -0,0 +1,28 @@
+#ifndef MOD_61WY6N4PCN09_H
+#define MOD_61WY6N4PCN09_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_INT64_T
+#define _TOOLS_SET_HSET_INT64_T
+#define i_type hset_int64_t
+#define i_key int64_t
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_INT64_T
+
+#ifndef _TOOLS_SET_HSET_INT64_T
+#define _TOOLS_SET_HSET_INT64_T
+#define i_type hset_int64_t
+#define i_key int64_t
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_INT64_T
+
+
+
+
+int64_t set_ptr(int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_61wy6n4pcn09_H
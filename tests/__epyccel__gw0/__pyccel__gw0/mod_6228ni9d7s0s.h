@@ -0,0 +1,11 @@
+#ifndef MOD_6228NI9D7S0S_H
+#define MOD_6228NI9D7S0S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f2(t_ndarray x, t_ndarray y);
+#endif // mod_6228ni9d7s0s_H
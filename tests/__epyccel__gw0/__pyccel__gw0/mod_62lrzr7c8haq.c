@@ -0,0 +1,17 @@
+#include "mod_62lrzr7c8haq.h"
+
+
+/*........................................*/
+double pop_2(void)
+{
+    vec_double a = {0};
+    double Dummy_0000;
+    double Out_0001;
+    a = c_init(vec_double, {1.7, 2.7, 45.0});
+    Dummy_0000 = vec_double_pull(&a);
+    Out_0001 = vec_double_pull_elem(&a, vec_double_size(&a) - INT64_C(1));
+    vec_double_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,29 @@
+#ifndef MOD_669D1XPQJTKY_H
+#define MOD_669D1XPQJTKY_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define i_type hset_double_complex
+#define i_key double complex
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE_COMPLEX
+
+#ifndef _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define i_type hset_double_complex
+#define i_key double complex
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE_COMPLEX
+
+
+
+
+int64_t copy_complex(int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004);
+#endif // mod_669d1xpqjtky_H
@@ -0,0 +1,11 @@
+#ifndef MOD_684EBNVUQE6U_H
+#define MOD_684EBNVUQE6U_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_div(t_ndarray x, t_ndarray y);
+#endif // mod_684ebnvuqe6u_H
@@ -0,0 +1,11 @@
+#ifndef MOD_68KWE9VGF66T_H
+#define MOD_68KWE9VGF66T_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_68kwe9vgf66t_H
@@ -0,0 +1,26 @@
+module mod_6ab2dp84o2cv
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use Set_real8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine remove_float(se) 
+
+    implicit none
+
+    type(Set_real8), intent(out) :: se
+    integer(i64) :: Dummy_0000
+
+    se = Set_real8([5.7_f64, 2.4_f64, 8.1_f64])
+    Dummy_0000 = se % erase_value(8.1_f64)
+    return
+
+  end subroutine remove_float
+  !........................................
+
+end module mod_6ab2dp84o2cv
@@ -0,0 +1,7 @@
+
+def f7(m1 : 'int', m2 : 'int', x : 'float[::,::](order=F)'):
+    x[::,::] = 0.0
+    for i in range(0, m1, 1):
+        for j in range(0, m2, 1):
+            x[i,j] = (2 * i + j) * 1.0
+
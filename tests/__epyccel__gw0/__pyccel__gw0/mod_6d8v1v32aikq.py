@@ -0,0 +1,7 @@
+
+def f():
+    a = [[1, 2, 3]]
+    for i in range(4, 1000, 1):
+        a.insert(i, [i, i + 1])
+    return a
+
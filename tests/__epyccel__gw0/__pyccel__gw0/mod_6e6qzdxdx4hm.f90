@@ -0,0 +1,32 @@
+module mod_6e6qzdxdx4hm
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_1d_slice_stride_20(a, Out_0001, Out_0002, Out_0003, &
+        Out_0004)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), target, intent(in) :: a(0_i64:)
+    integer(i64), pointer :: b(:)
+
+    b(0:) => a(size(a, kind=i64) - 5_i64:6_i64:-5_i64)
+    Out_0001 = sum(b)
+    Out_0002 = b(0_i64)
+    Out_0003 = b(size(b, kind=i64) - 1_i64)
+    Out_0004 = size(b, kind=i64)
+    return
+
+  end subroutine array_1d_slice_stride_20
+  !........................................
+
+end module mod_6e6qzdxdx4hm
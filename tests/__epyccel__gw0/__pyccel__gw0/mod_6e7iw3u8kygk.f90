@@ -0,0 +1,40 @@
+module mod_6e7iw3u8kygk
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , c64 => &
+        C_DOUBLE_COMPLEX , i64 => C_INT64_T
+  use pyc_tools_f90
+  use Set_complex8_mod
+  use Set_complex8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine copy_complex(Out_0001, Out_0002, Out_0003, Out_0004) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    complex(c64), intent(out) :: Out_0002
+    complex(c64), intent(out) :: Out_0003
+    complex(c64), intent(out) :: Out_0004
+    type(Set_complex8) :: se
+    type(Set_complex8) :: cop
+
+    se = Set_complex8([(0.0_f64, 7.0_f64), (0.0_f64, 6.0_f64), (0.0_f64, &
+          9.0_f64)])
+    cop = Set_complex8(se)
+    Out_0001 = cop % size()
+    Out_0002 = Set_complex8_pop(cop)
+
+    Out_0003 = Set_complex8_pop(cop)
+
+    Out_0004 = Set_complex8_pop(cop)
+
+    return
+
+  end subroutine copy_complex
+  !........................................
+
+end module mod_6e7iw3u8kygk
@@ -0,0 +1,6 @@
+
+def f():
+    a = [3.4, 1.0, -4.5, 0.0, 2.1]
+    a.sort()
+    return a
+
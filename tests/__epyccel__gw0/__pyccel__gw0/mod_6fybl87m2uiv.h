@@ -0,0 +1,11 @@
+#ifndef MOD_6FYBL87M2UIV_H
+#define MOD_6FYBL87M2UIV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray arr_tuple_slice_index(t_ndarray a);
+#endif // mod_6fybl87m2uiv_H
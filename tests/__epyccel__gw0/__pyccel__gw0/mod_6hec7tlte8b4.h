@@ -0,0 +1,11 @@
+#ifndef MOD_6HEC7TLTE8B4_H
+#define MOD_6HEC7TLTE8B4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_C_slice_8(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_6hec7tlte8b4_H
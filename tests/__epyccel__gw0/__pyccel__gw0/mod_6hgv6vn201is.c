@@ -0,0 +1,27 @@
+#include "mod_6hgv6vn201is.h"
+
+
+/*........................................*/
+double array_float_1d_div_stack_array(void)
+{
+    double array_dummy[INT64_C(10)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(10)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t i;
+    double s;
+    array_fill((double)1.0, a);
+    s = 0.0;
+    for (i = INT64_C(0); i < INT64_C(10); i += INT64_C(1))
+    {
+        s += 1.0 / a.nd_double[i];
+    }
+    return s;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_6HGV6VN201IS_H
+#define MOD_6HGV6VN201IS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_div_stack_array(void);
+#endif // mod_6hgv6vn201is_H
@@ -0,0 +1,40 @@
+#ifndef MOD_6HGV6VN201IS_WRAPPER_H
+#define MOD_6HGV6VN201IS_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_6hgv6vn201is.h"
+
+
+#ifdef MOD_6HGV6VN201IS_WRAPPER
+
+
+#else
+
+static void** Pymod_6hgv6vn201is_API;
+
+
+/*........................................*/
+static int mod_6hgv6vn201is_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_6hgv6vn201is_API = (void**)PyCapsule_Import("mod_6hgv6vn201is._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_6hgv6vn201is_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_6HGV6VN201IS_WRAPPER_H
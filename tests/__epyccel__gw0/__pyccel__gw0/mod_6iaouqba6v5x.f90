@@ -0,0 +1,23 @@
+module mod_6iaouqba6v5x
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , i32 => &
+        C_INT32_T , f64 => C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int32_1d_idiv(x, y) 
+
+    implicit none
+
+    integer(i32), intent(inout) :: x(0_i64:)
+    integer(i32), intent(in) :: y(0_i64:)
+
+    x(:) = FLOOR(x/Real(y, kind = f64),i32)
+
+  end subroutine array_int32_1d_idiv
+  !........................................
+
+end module mod_6iaouqba6v5x
@@ -0,0 +1,105 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_6IAOUQBA6V5X_WRAPPER
+
+#include "mod_6iaouqba6v5x_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_int32_1d_idiv_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    int64_t x_strides[1];
+    void* y_data = NULL;
+    int64_t y_shape[1];
+    int64_t y_strides[1];
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &y_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT32, INT64_C(1), STRIDED_C_ORDER))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("y", y_obj, NPY_INT32, INT64_C(1), STRIDED_C_ORDER))
+    {
+        y_data = PyArray_DATA((PyArrayObject*)(y_obj));
+        get_strides_and_shape_from_numpy_array(y_obj, y_shape, y_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_array_int32_1d_idiv(x_data, x_shape[INT64_C(0)], x_strides[INT64_C(0)], y_data, y_shape[INT64_C(0)], y_strides[INT64_C(0)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_6iaouqba6v5x_methods[] = {
+    {
+        "array_int32_1d_idiv",
+        (PyCFunction)bind_c_array_int32_1d_idiv_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_6iaouqba6v5x_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_6iaouqba6v5x",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_6iaouqba6v5x_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_6iaouqba6v5x(void)
+{
+    PyObject* mod;
+    static void* Pymod_6iaouqba6v5x_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_6iaouqba6v5x_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_6iaouqba6v5x_API, "mod_6iaouqba6v5x._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
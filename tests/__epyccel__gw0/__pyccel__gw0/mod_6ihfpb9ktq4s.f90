@@ -0,0 +1,40 @@
+module mod_6ihfpb9ktq4s
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function omp_simd(n) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    integer(i64), value :: n
+    integer(i64), allocatable :: arr(:)
+    integer(i64) :: i
+
+    func_result = 0_i64
+    allocate(arr(0:n - 1_i64))
+    arr = 0_i64
+    !$omp parallel num_threads(4)
+    !$omp simd
+    do i = 0_i64, n - 1_i64
+      arr(i) = i
+    end do
+    !$omp end simd
+    !$omp end parallel
+    do i = 0_i64, n - 1_i64
+      func_result = func_result + arr(i)
+    end do
+    if (allocated(arr)) then
+      deallocate(arr)
+    end if
+    return
+
+  end function omp_simd
+  !........................................
+
+end module mod_6ihfpb9ktq4s
@@ -0,0 +1,28 @@
+module mod_6j8jjo62eb5l
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use pyc_tools_f90
+  use Set_complex8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine Discard_complex(se) 
+
+    implicit none
+
+    type(Set_complex8), intent(out) :: se
+    integer(i64) :: Dummy_0000
+
+    se = Set_complex8([(0.0_f64, 2.0_f64), (0.0_f64, 5.0_f64), (0.0_f64, &
+          3.0_f64), (0.0_f64, 7.0_f64)])
+    Dummy_0000 = se % erase_value((0.0_f64, 5.0_f64))
+    return
+
+  end subroutine Discard_complex
+  !........................................
+
+end module mod_6j8jjo62eb5l
@@ -0,0 +1,94 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_6J8JJO62EB5L_WRAPPER
+
+#include "mod_6j8jjo62eb5l_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_discard_complex_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double complex* bound_se;
+    int64_t se_shape_1;
+    int64_t Dummy_0000;
+    PyObject* tmp_obj;
+    double complex tmp;
+    PyObject* se_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    bind_c_discard_complex(&bound_se, &se_shape_1);
+    se_obj = PySet_New(NULL);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < se_shape_1; Dummy_0000 += INT64_C(1))
+    {
+        tmp = bound_se[Dummy_0000];
+        tmp_obj = Complex128_to_PyComplex(&tmp);
+        if (PySet_Add(se_obj, tmp_obj) == -INT64_C(1))
+        {
+            return NULL;
+        }
+    }
+    free(bound_se);
+    return se_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_6j8jjo62eb5l_methods[] = {
+    {
+        "Discard_complex",
+        (PyCFunction)bind_c_discard_complex_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_6j8jjo62eb5l_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_6j8jjo62eb5l",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_6j8jjo62eb5l_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_6j8jjo62eb5l(void)
+{
+    PyObject* mod;
+    static void* Pymod_6j8jjo62eb5l_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_6j8jjo62eb5l_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_6j8jjo62eb5l_API, "mod_6j8jjo62eb5l._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,127 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_6OWWKWZEP1D7_WRAPPER
+
+#include "mod_6owwkwzep1d7_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* parallel_array_reductions_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    PyObject* c_obj;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    PyObject* s_obj;
+    double s;
+    PyObject* m_obj;
+    int32_t m;
+    PyObject* n_obj;
+    double n;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        "c",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &a_obj, &b_obj, &c_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("b", b_obj, NPY_INT32, INT64_C(1), NO_ORDER_CHECK))
+    {
+        b = pyarray_to_ndarray(b_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("c", c_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        c = pyarray_to_ndarray(c_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    parallel_array_reductions(a, b, c, &s, &m, &n);
+    free_pointer(&a);
+    free_pointer(&b);
+    free_pointer(&c);
+    s_obj = Double_to_NumpyDouble(&s);
+    m_obj = Int32_to_NumpyLong(&m);
+    n_obj = Double_to_NumpyDouble(&n);
+    Out_obj = Py_BuildValue("OOO", s_obj, m_obj, n_obj);
+    Py_DECREF(s_obj);
+    Py_DECREF(m_obj);
+    Py_DECREF(n_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_6owwkwzep1d7_methods[] = {
+    {
+        "parallel_array_reductions",
+        (PyCFunction)parallel_array_reductions_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_6owwkwzep1d7_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_6owwkwzep1d7",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_6owwkwzep1d7_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_6owwkwzep1d7(void)
+{
+    PyObject* mod;
+    static void* Pymod_6owwkwzep1d7_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_6owwkwzep1d7_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_6owwkwzep1d7_API, "mod_6owwkwzep1d7._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
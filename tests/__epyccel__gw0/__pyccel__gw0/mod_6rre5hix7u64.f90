@@ -0,0 +1,29 @@
+module mod_6rre5hix7u64
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use pyc_tools_f90
+  use Set_complex8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function add_complex() result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    type(Set_complex8) :: a
+
+    a = Set_complex8([(0.0_f64, 6.0_f64), (0.0_f64, 7.0_f64), (0.0_f64, &
+          8.0_f64)])
+    call a % insert( (0.0_f64, 9.0_f64) )
+    Out_0001 = a % size()
+    return
+
+  end function add_complex
+  !........................................
+
+end module mod_6rre5hix7u64
@@ -0,0 +1,15 @@
+#include "mod_6u3lfab15r8h.h"
+
+
+/*........................................*/
+double pop_last_element(void)
+{
+    vec_double a = {0};
+    double Out_0001;
+    a = c_init(vec_double, {1.5, 3.1, 4.5});
+    Out_0001 = vec_double_pull(&a);
+    vec_double_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
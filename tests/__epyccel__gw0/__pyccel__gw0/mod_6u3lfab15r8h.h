@@ -0,0 +1,30 @@
+#ifndef MOD_6U3LFAB15R8H_H
+#define MOD_6U3LFAB15R8H_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_DOUBLE
+#define _TOOLS_LIST_VEC_DOUBLE
+#define i_type vec_double
+#define i_key double
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_DOUBLE
+
+#ifndef _TOOLS_LIST_VEC_DOUBLE
+#define _TOOLS_LIST_VEC_DOUBLE
+#define i_type vec_double
+#define i_key double
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_DOUBLE
+
+
+
+
+double pop_last_element(void);
+#endif // mod_6u3lfab15r8h_H
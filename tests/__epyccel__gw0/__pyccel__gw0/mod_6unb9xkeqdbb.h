@@ -0,0 +1,10 @@
+#ifndef MOD_6UNB9XKEQDBB_H
+#define MOD_6UNB9XKEQDBB_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int16_t f16(int16_t a);
+#endif // mod_6unb9xkeqdbb_H
@@ -0,0 +1,16 @@
+#include "mod_6vnndq635xn4.h"
+
+
+/*........................................*/
+int64_t clear_complex(void)
+{
+    hset_double_complex se = {0};
+    int64_t Out_0001;
+    se = c_init(hset_double_complex, {(3.0 * _Complex_I), (6.0 * _Complex_I), (2.0 * _Complex_I)});
+    hset_double_complex_clear(&se);
+    Out_0001 = hset_double_complex_size(&se);
+    hset_double_complex_drop(&se);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,42 @@
+#ifndef MOD_6WCXGT61GPAK_WRAPPER_H
+#define MOD_6WCXGT61GPAK_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_6wcxgt61gpak.h"
+
+
+#ifdef MOD_6WCXGT61GPAK_WRAPPER
+
+
+#else
+
+static void** Pymod_6wcxgt61gpak_API;
+
+
+/*........................................*/
+static int mod_6wcxgt61gpak_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_6wcxgt61gpak_API = (void**)PyCapsule_Import("mod_6wcxgt61gpak._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_6wcxgt61gpak_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_6WCXGT61GPAK_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_6XYGMLLWMK1W_H
+#define MOD_6XYGMLLWMK1W_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_6(int64_t* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_6xygmllwmk1w_H
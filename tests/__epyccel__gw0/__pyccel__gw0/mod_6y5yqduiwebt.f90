@@ -0,0 +1,40 @@
+module mod_6y5yqduiwebt
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine intersection_int(Out_0001, Out_0002, Out_0003, Out_0004) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    type(Set_integer8) :: a
+    type(Set_integer8) :: b
+    type(Set_integer8) :: c
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64, 4_i64, 8_i64])
+    b = Set_integer8([5_i64, 2_i64, 3_i64, 7_i64, 8_i64])
+    c = Set_integer8(a)
+    call Set_integer8_intersection_update(c, b)
+    Out_0001 = c % size()
+    Out_0002 = Set_integer8_pop(c)
+
+    Out_0003 = Set_integer8_pop(c)
+
+    Out_0004 = Set_integer8_pop(c)
+
+    return
+
+  end subroutine intersection_int
+  !........................................
+
+end module mod_6y5yqduiwebt
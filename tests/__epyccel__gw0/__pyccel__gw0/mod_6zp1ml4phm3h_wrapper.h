@@ -0,0 +1,42 @@
+#ifndef MOD_6ZP1ML4PHM3H_WRAPPER_H
+#define MOD_6ZP1ML4PHM3H_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_6ZP1ML4PHM3H_WRAPPER
+
+int64_t bind_c_array_1d_slice_stride_18(void*, int64_t, int64_t, int64_t*, int64_t*, int64_t*, int64_t*);
+
+#else
+
+static void** Pymod_6zp1ml4phm3h_API;
+
+
+/*........................................*/
+static int mod_6zp1ml4phm3h_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_6zp1ml4phm3h_API = (void**)PyCapsule_Import("mod_6zp1ml4phm3h._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_6zp1ml4phm3h_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_6ZP1ML4PHM3H_WRAPPER_H
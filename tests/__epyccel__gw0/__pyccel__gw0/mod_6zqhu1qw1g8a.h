@@ -0,0 +1,12 @@
+#ifndef MOD_6ZQHU1QW1G8A_H
+#define MOD_6ZQHU1QW1G8A_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_6zqhu1qw1g8a_H
@@ -0,0 +1,6 @@
+
+def test_omp_get_cancellation():
+    from pyccel.stdlib.internal.openmp import omp_get_cancellation
+    cancel_var = omp_get_cancellation()
+    return cancel_var
+
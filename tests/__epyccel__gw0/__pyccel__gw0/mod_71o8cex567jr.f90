@@ -0,0 +1,42 @@
+module mod_71o8cex567jr
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine copy_int(size, Out_0001, a, b, c, d) 
+
+    implicit none
+
+    integer(i64), intent(out) :: size
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: a
+    integer(i64), intent(out) :: b
+    integer(i64), intent(out) :: c
+    integer(i64), intent(out) :: d
+    type(Set_integer8) :: se
+    type(Set_integer8) :: cop
+
+    se = Set_integer8([1_i64, 2_i64, 4_i64, 5_i64])
+    cop = Set_integer8(se)
+    size = cop % size()
+    a = Set_integer8_pop(cop)
+
+    b = Set_integer8_pop(cop)
+
+    c = Set_integer8_pop(cop)
+
+    d = Set_integer8_pop(cop)
+
+    Out_0001 = se % size()
+    return
+
+  end subroutine copy_int
+  !........................................
+
+end module mod_71o8cex567jr
@@ -0,0 +1,11 @@
+#ifndef MOD_72L26Z7S9RA8_H
+#define MOD_72L26Z7S9RA8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f2(t_ndarray x);
+#endif // mod_72l26z7s9ra8_H
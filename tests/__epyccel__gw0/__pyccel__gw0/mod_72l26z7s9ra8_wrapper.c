@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_72L26Z7S9RA8_WRAPPER
+
+#include "mod_72l26z7s9ra8_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    t_ndarray x = {.raw_data = NULL};
+    int64_t y;
+    PyObject* y_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    y = f2(x);
+    free_pointer(&x);
+    y_obj = Int64_to_NumpyLong(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_72l26z7s9ra8_methods[] = {
+    {
+        "f2",
+        (PyCFunction)f2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_72l26z7s9ra8_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_72l26z7s9ra8",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_72l26z7s9ra8_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_72l26z7s9ra8(void)
+{
+    PyObject* mod;
+    static void* Pymod_72l26z7s9ra8_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_72l26z7s9ra8_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_72l26z7s9ra8_API, "mod_72l26z7s9ra8._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
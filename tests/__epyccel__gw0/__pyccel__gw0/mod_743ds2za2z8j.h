@@ -0,0 +1,11 @@
+#ifndef MOD_743DS2ZA2Z8J_H
+#define MOD_743DS2ZA2Z8J_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_2(t_ndarray a);
+#endif // mod_743ds2za2z8j_H
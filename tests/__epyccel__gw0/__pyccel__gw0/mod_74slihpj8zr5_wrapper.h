@@ -0,0 +1,40 @@
+#ifndef MOD_74SLIHPJ8ZR5_WRAPPER_H
+#define MOD_74SLIHPJ8ZR5_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_74slihpj8zr5.h"
+
+
+#ifdef MOD_74SLIHPJ8ZR5_WRAPPER
+
+
+#else
+
+static void** Pymod_74slihpj8zr5_API;
+
+
+/*........................................*/
+static int mod_74slihpj8zr5_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_74slihpj8zr5_API = (void**)PyCapsule_Import("mod_74slihpj8zr5._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_74slihpj8zr5_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_74SLIHPJ8ZR5_WRAPPER_H
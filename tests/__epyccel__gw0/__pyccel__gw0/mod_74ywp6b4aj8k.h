@@ -0,0 +1,30 @@
+#ifndef MOD_74YWP6B4AJ8K_H
+#define MOD_74YWP6B4AJ8K_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_DOUBLE
+#define _TOOLS_LIST_VEC_DOUBLE
+#define i_type vec_double
+#define i_key double
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_DOUBLE
+
+#ifndef _TOOLS_LIST_VEC_DOUBLE
+#define _TOOLS_LIST_VEC_DOUBLE
+#define i_type vec_double
+#define i_key double
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_DOUBLE
+
+
+
+
+double pop_2(void);
+#endif // mod_74ywp6b4aj8k_H
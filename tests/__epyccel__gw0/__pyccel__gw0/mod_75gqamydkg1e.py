@@ -0,0 +1,6 @@
+from numpy import array
+
+def arr_tuple_slice_index(a : 'int[::,::]'):
+    r = array((a[0,1::], a[1,1::], a[3,1::]), order='C')
+    return r
+
@@ -0,0 +1,12 @@
+#ifndef MOD_75PUZ6KD0VY6_H
+#define MOD_75PUZ6KD0VY6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_2(void);
+#endif // mod_75puz6kd0vy6_H
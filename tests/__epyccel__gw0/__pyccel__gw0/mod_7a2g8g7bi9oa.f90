@@ -0,0 +1,29 @@
+module mod_7a2g8g7bi9oa
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function add_element_range() result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    type(Set_integer8) :: a
+    integer(i64) :: i
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64])
+    do i = 50_i64, 99_i64
+      call a % insert( i )
+    end do
+    Out_0001 = a % size()
+    return
+
+  end function add_element_range
+  !........................................
+
+end module mod_7a2g8g7bi9oa
@@ -0,0 +1,42 @@
+#ifndef MOD_7AB1FZX75ND8_WRAPPER_H
+#define MOD_7AB1FZX75ND8_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_7AB1FZX75ND8_WRAPPER
+
+int64_t bind_c_array_2d_c_slice_21(void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, int64_t*, int64_t*);
+
+#else
+
+static void** Pymod_7ab1fzx75nd8_API;
+
+
+/*........................................*/
+static int mod_7ab1fzx75nd8_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_7ab1fzx75nd8_API = (void**)PyCapsule_Import("mod_7ab1fzx75nd8._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_7ab1fzx75nd8_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_7AB1FZX75ND8_WRAPPER_H
@@ -0,0 +1,22 @@
+#include "mod_7ay6132ao8c6.h"
+
+
+/*........................................*/
+int64_t union_int(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    hset_int64_t a = {0};
+    hset_int64_t c = {0};
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4)});
+    c = hset_int64_t_union(&a, 1, &a);
+    hset_int64_t_push(&a, INT64_C(5));
+    (*Out_0001) = hset_int64_t_size(&c);
+    (*Out_0002) = hset_int64_t_pop(&c);
+    (*Out_0003) = hset_int64_t_pop(&c);
+    (*Out_0004) = hset_int64_t_pop(&c);
+    (*Out_0005) = hset_int64_t_pop(&c);
+    hset_int64_t_drop(&a);
+    hset_int64_t_drop(&c);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,28 @@
+#ifndef MOD_7AY6132AO8C6_H
+#define MOD_7AY6132AO8C6_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_INT64_T
+#define _TOOLS_SET_HSET_INT64_T
+#define i_type hset_int64_t
+#define i_key int64_t
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_INT64_T
+
+#ifndef _TOOLS_SET_HSET_INT64_T
+#define _TOOLS_SET_HSET_INT64_T
+#define i_type hset_int64_t
+#define i_key int64_t
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_INT64_T
+
+
+
+
+int64_t union_int(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_7ay6132ao8c6_H
@@ -0,0 +1,11 @@
+#ifndef MOD_7BBR2FNHHOGW_H
+#define MOD_7BBR2FNHHOGW_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_mul(t_ndarray x, t_ndarray y);
+#endif // mod_7bbr2fnhhogw_H
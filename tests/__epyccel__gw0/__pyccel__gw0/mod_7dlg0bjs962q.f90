@@ -0,0 +1,39 @@
+module mod_7dlg0bjs962q
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_2d_C_slice_23(a, Out_0001, Out_0002, Out_0003, &
+        Out_0004, Out_0005)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    integer(i64), target, intent(in) :: a(0_i64:, 0_i64:)
+    integer(i64) :: c
+    integer(i64), pointer :: b(:, :)
+
+    c = -5_i64
+    b(0:, 0:) => a(:(merge(size(a, 1_i64, i64) + c, c, c < 0_i64)) - &
+          1_i64, :(merge(size(a, 2_i64, i64) + c, c, c < 0_i64)) - &
+          1_i64)
+    Out_0001 = sum(b)
+    Out_0002 = b(0_i64, 0_i64)
+    Out_0003 = b(size(b, 1_i64, i64) - 1_i64, size(b, 2_i64, i64) - &
+          1_i64)
+    Out_0004 = size(b, 2_i64, i64)
+    Out_0005 = size(b, 1_i64, i64)
+    return
+
+  end subroutine array_2d_C_slice_23
+  !........................................
+
+end module mod_7dlg0bjs962q
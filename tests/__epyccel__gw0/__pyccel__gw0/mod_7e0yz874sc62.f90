@@ -0,0 +1,54 @@
+module mod_7e0yz874sc62
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine parallel_array_constructors(a, Out_0001, Out_0002, Out_0003 &
+        )
+
+    implicit none
+
+    real(f64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+    real(f64), intent(in) :: a(0_i64:)
+    real(f64), allocatable :: c(:)
+    real(f64), allocatable :: d(:)
+    integer(i64) :: i
+    integer(i64) :: linspace_index
+
+    allocate(c(0:size(a, kind=i64) - 1_i64))
+    c = [((0.0_f64 + linspace_index*(1.0_f64 - 0.0_f64) / (size(a, kind= &
+          i64) - 1_i64)), linspace_index = 0_i64,size(a, kind=i64) - &
+          1_i64)]
+    c(size(a, kind=i64) - 1_i64) = 1.0_f64
+    allocate(d(0:ceiling(Real((size(a, kind=i64) - 0_i64), kind = f64) / &
+          1.0_f64) - 1_i64))
+    !$omp parallel do simd if(parallel: size(d, kind=i64) >= 100)
+    do i = 0_i64, size(d, kind=i64) - 1_i64
+      d(i) = i + a(i)
+    end do
+    !$omp parallel do simd if(parallel: size(c, kind=i64) >= 100)
+    do i = 0_i64, size(c, kind=i64) - 1_i64
+      c(i) = c(i) + a(i) * 2.0_f64
+    end do
+    Out_0001 = c(0_i64)
+    Out_0002 = c(size(a, kind=i64) - 1_i64)
+    Out_0003 = d(size(a, kind=i64) - 1_i64)
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    return
+
+  end subroutine parallel_array_constructors
+  !........................................
+
+end module mod_7e0yz874sc62
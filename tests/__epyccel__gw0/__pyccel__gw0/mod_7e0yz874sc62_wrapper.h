@@ -0,0 +1,42 @@
+#ifndef MOD_7E0YZ874SC62_WRAPPER_H
+#define MOD_7E0YZ874SC62_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_7E0YZ874SC62_WRAPPER
+
+int64_t bind_c_parallel_array_constructors(void*, int64_t, int64_t, double*, double*, double*);
+
+#else
+
+static void** Pymod_7e0yz874sc62_API;
+
+
+/*........................................*/
+static int mod_7e0yz874sc62_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_7e0yz874sc62_API = (void**)PyCapsule_Import("mod_7e0yz874sc62._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_7e0yz874sc62_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_7E0YZ874SC62_WRAPPER_H
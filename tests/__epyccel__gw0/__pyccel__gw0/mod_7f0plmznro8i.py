@@ -0,0 +1,11 @@
+
+def inhomogeneous_tuple_2_levels_1():
+    # TODO [EB 15.06.21] Put back original test when strings are supported in C 
+    # ai = ((1,2), (4,False), (3.0, 'boo')) 
+    ai_0 = (1, 2)
+    ai_1_0 = 4
+    ai_1_1 = False
+    ai_2_0 = 3.0
+    ai_2_1 = True
+    return ai_0[0],ai_0[1],ai_1_0,ai_1_1,ai_2_0
+
@@ -0,0 +1,6 @@
+
+def clear_3():
+    a = [[1, 2, 3]]
+    a.clear()
+    return a
+
@@ -0,0 +1,15 @@
+#include "mod_7h25yii0ux8r.h"
+
+
+/*........................................*/
+double complex pop_negative_index(void)
+{
+    vec_double_complex a = {0};
+    double complex Out_0001;
+    a = c_init(vec_double_complex, {_Complex_I, (3.0 * _Complex_I), (45.0 * _Complex_I)});
+    Out_0001 = vec_double_complex_pull_elem(&a, vec_double_complex_size(&a) - INT64_C(1));
+    vec_double_complex_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_7HAWE6WO2JH0_H
+#define MOD_7HAWE6WO2JH0_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_num_threads(void);
+#endif // mod_7hawe6wo2jh0_H
@@ -0,0 +1,23 @@
+module mod_7mf03ziebksz
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f19(a) result(b)
+
+    implicit none
+
+    integer(i64) :: b
+    integer(i64), value :: a
+
+    b = a
+    return
+
+  end function f19
+  !........................................
+
+end module mod_7mf03ziebksz
@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_7MF03ZIEBKSZ_WRAPPER
+
+#include "mod_7mf03ziebksz_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f19_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t a;
+    int64_t b;
+    PyObject* b_obj;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Int64(a_obj))
+    {
+        a = PyInt64_to_Int64(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.int64 for argument a");
+        return NULL;
+    }
+    b = bind_c_f19(a);
+    b_obj = Int64_to_NumpyLong(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_7mf03ziebksz_methods[] = {
+    {
+        "f19",
+        (PyCFunction)bind_c_f19_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_7mf03ziebksz_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_7mf03ziebksz",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_7mf03ziebksz_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_7mf03ziebksz(void)
+{
+    PyObject* mod;
+    static void* Pymod_7mf03ziebksz_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_7mf03ziebksz_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_7mf03ziebksz_API, "mod_7mf03ziebksz._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,24 @@
+module mod_7ngxcwph8jwn
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_float_2d_1d_matmul(A, x, out) 
+
+    implicit none
+
+    real(f64), intent(in) :: A(0_i64:, 0_i64:)
+    real(f64), intent(in) :: x(0_i64:)
+    real(f64), intent(inout) :: out(0_i64:)
+
+    out(:) = matmul(x,A)
+
+  end subroutine array_float_2d_1d_matmul
+  !........................................
+
+end module mod_7ngxcwph8jwn
@@ -0,0 +1,28 @@
+module mod_7niu15ord048
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function test_omp_get_level() result(nested_parallel_regions)
+
+    use omp_lib, only: omp_get_level
+
+    implicit none
+
+    integer(i32) :: nested_parallel_regions
+
+    !$omp parallel
+    !$omp parallel
+    nested_parallel_regions = omp_get_level()
+    !$omp end parallel
+    !$omp end parallel
+    return
+
+  end function test_omp_get_level
+  !........................................
+
+end module mod_7niu15ord048
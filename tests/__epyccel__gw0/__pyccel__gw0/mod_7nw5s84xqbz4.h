@@ -0,0 +1,11 @@
+#ifndef MOD_7NW5S84XQBZ4_H
+#define MOD_7NW5S84XQBZ4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_7nw5s84xqbz4_H
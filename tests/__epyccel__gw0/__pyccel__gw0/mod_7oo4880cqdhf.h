@@ -0,0 +1,29 @@
+#ifndef MOD_7OO4880CQDHF_H
+#define MOD_7OO4880CQDHF_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define i_type hset_double_complex
+#define i_key double complex
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE_COMPLEX
+
+#ifndef _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define i_type hset_double_complex
+#define i_key double complex
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE_COMPLEX
+
+
+
+
+int64_t Pop_complex(double complex* el1, double complex* el2, double complex* el3);
+#endif // mod_7oo4880cqdhf_H
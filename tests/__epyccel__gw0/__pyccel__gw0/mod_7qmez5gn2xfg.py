@@ -0,0 +1,4 @@
+
+def array_float_2d_C_scalar_add(x : 'float[::,::]', a : 'float'):
+    x[::,::] += a
+
@@ -0,0 +1,37 @@
+module mod_7sr66brb7jdh
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_1d_slice_12(a, Out_0001, Out_0002, Out_0003, Out_0004 &
+        )
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), target, intent(in) :: a(0_i64:)
+    integer(i64) :: c
+    integer(i64) :: d
+    integer(i64), pointer :: b(:)
+
+    c = -15_i64
+    d = -5_i64
+    b(0:) => a(merge(size(a, kind=i64) + c, c, c < 0_i64):(merge(size(a, &
+          kind=i64) + d, d, d < 0_i64)) - 1_i64)
+    Out_0001 = sum(b)
+    Out_0002 = b(0_i64)
+    Out_0003 = b(size(b, kind=i64) - 1_i64)
+    Out_0004 = size(b, kind=i64)
+    return
+
+  end subroutine array_1d_slice_12
+  !........................................
+
+end module mod_7sr66brb7jdh
@@ -0,0 +1,107 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_7SVHYS47Z7FH_WRAPPER
+
+#include "mod_7svhys47z7fh_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_float_2d_1d_matmul_creation_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* A_obj;
+    PyObject* x_obj;
+    void* A_data = NULL;
+    int64_t A_shape[2];
+    int64_t A_strides[2];
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    int64_t x_strides[1];
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "A",
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &A_obj, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("A", A_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        A_data = PyArray_DATA((PyArrayObject*)(A_obj));
+        get_strides_and_shape_from_numpy_array(A_obj, A_shape, A_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    Out_0001 = bind_c_array_float_2d_1d_matmul_creation(A_data, A_shape[INT64_C(0)], A_shape[INT64_C(1)], A_strides[INT64_C(0)], A_strides[INT64_C(1)], x_data, x_shape[INT64_C(0)], x_strides[INT64_C(0)]);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_7svhys47z7fh_methods[] = {
+    {
+        "array_float_2d_1d_matmul_creation",
+        (PyCFunction)bind_c_array_float_2d_1d_matmul_creation_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_7svhys47z7fh_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_7svhys47z7fh",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_7svhys47z7fh_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_7svhys47z7fh(void)
+{
+    PyObject* mod;
+    static void* Pymod_7svhys47z7fh_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_7svhys47z7fh_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_7svhys47z7fh_API, "mod_7svhys47z7fh._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
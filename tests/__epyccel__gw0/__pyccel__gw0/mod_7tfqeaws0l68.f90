@@ -0,0 +1,25 @@
+module mod_7tfqeaws0l68
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , b1 => &
+        C_BOOL
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f8(x, b) result(a)
+
+    implicit none
+
+    integer(i64) :: a
+    integer(i64), value :: x
+    logical(b1), value :: b
+
+    a = merge(x, 2_i64, b)
+    return
+
+  end function f8
+  !........................................
+
+end module mod_7tfqeaws0l68
@@ -0,0 +1,104 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_7TFQEAWS0L68_WRAPPER
+
+#include "mod_7tfqeaws0l68_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f8_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* b_obj;
+    int64_t x;
+    bool b;
+    int64_t a;
+    PyObject* a_obj;
+    static const char* const kwlist[] = {
+        "x",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &x_obj, &b_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(x_obj))
+    {
+        x = PyInt64_to_Int64(x_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument x");
+        return NULL;
+    }
+    if (PyIs_Bool(b_obj))
+    {
+        b = PyBool_to_Bool(b_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type bool for argument b");
+        return NULL;
+    }
+    a = bind_c_f8(x, b);
+    a_obj = Int64_to_PyLong(&a);
+    return a_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_7tfqeaws0l68_methods[] = {
+    {
+        "f8",
+        (PyCFunction)bind_c_f8_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_7tfqeaws0l68_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_7tfqeaws0l68",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_7tfqeaws0l68_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_7tfqeaws0l68(void)
+{
+    PyObject* mod;
+    static void* Pymod_7tfqeaws0l68_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_7tfqeaws0l68_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_7tfqeaws0l68_API, "mod_7tfqeaws0l68._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
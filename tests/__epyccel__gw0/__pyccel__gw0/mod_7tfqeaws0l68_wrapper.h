@@ -0,0 +1,40 @@
+#ifndef MOD_7TFQEAWS0L68_WRAPPER_H
+#define MOD_7TFQEAWS0L68_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_7TFQEAWS0L68_WRAPPER
+
+int64_t bind_c_f8(int64_t, bool);
+
+#else
+
+static void** Pymod_7tfqeaws0l68_API;
+
+
+/*........................................*/
+static int mod_7tfqeaws0l68_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_7tfqeaws0l68_API = (void**)PyCapsule_Import("mod_7tfqeaws0l68._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_7tfqeaws0l68_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_7TFQEAWS0L68_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_7VUL89ZK1ONR_H
+#define MOD_7VUL89ZK1ONR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_1(t_ndarray a);
+#endif // mod_7vul89zk1onr_H
@@ -0,0 +1,40 @@
+#ifndef MOD_7WPV8BQS7HVV_WRAPPER_H
+#define MOD_7WPV8BQS7HVV_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_7WPV8BQS7HVV_WRAPPER
+
+double complex bind_c_f22(double complex);
+
+#else
+
+static void** Pymod_7wpv8bqs7hvv_API;
+
+
+/*........................................*/
+static int mod_7wpv8bqs7hvv_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_7wpv8bqs7hvv_API = (void**)PyCapsule_Import("mod_7wpv8bqs7hvv._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_7wpv8bqs7hvv_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_7WPV8BQS7HVV_WRAPPER_H
@@ -0,0 +1,10 @@
+#ifndef MOD_7XJ6OZL7XYOS_H
+#define MOD_7XJ6OZL7XYOS_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(int64_t* a, int64_t* b, int64_t* c, int64_t* d);
+#endif // mod_7xj6ozl7xyos_H
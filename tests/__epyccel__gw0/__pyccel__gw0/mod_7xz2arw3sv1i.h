@@ -0,0 +1,11 @@
+#ifndef MOD_7XZ2ARW3SV1I_H
+#define MOD_7XZ2ARW3SV1I_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t square_0000(int64_t a);
+double square_0001(double a);
+#endif // mod_7xz2arw3sv1i_H
@@ -0,0 +1,6 @@
+
+def f():
+    lst = [1j, 3j, 8j]
+    lst.remove(3j)
+    return lst
+
@@ -0,0 +1,42 @@
+#ifndef MOD_80U4ODDONDWR_WRAPPER_H
+#define MOD_80U4ODDONDWR_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_80u4oddondwr.h"
+
+
+#ifdef MOD_80U4ODDONDWR_WRAPPER
+
+
+#else
+
+static void** Pymod_80u4oddondwr_API;
+
+
+/*........................................*/
+static int mod_80u4oddondwr_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_80u4oddondwr_API = (void**)PyCapsule_Import("mod_80u4oddondwr._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_80u4oddondwr_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_80U4ODDONDWR_WRAPPER_H
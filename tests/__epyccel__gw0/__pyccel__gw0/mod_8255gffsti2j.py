@@ -0,0 +1,9 @@
+from numpy import float64, int64
+
+def arrs_1d_int64_index():
+    from numpy import ones, int64
+    i = int64(1)
+    a = ones((10), dtype = float64)
+    b = a[i] + a[i + 2]
+    return b
+
@@ -0,0 +1,21 @@
+#ifndef MOD_829BLOW87934_H
+#define MOD_829BLOW87934_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t dtype_convert_to_cdouble_0000(t_ndarray arr, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+int64_t dtype_convert_to_cdouble_0001(t_ndarray arr, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+int64_t dtype_convert_to_cdouble_0002(t_ndarray arr, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+int64_t dtype_convert_to_cdouble_0003(t_ndarray arr, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+int64_t dtype_convert_to_cdouble_0004(t_ndarray arr, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+int64_t dtype_convert_to_cdouble_0005(t_ndarray arr, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+int64_t dtype_convert_to_cdouble_0006(t_ndarray arr, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+int64_t dtype_convert_to_cdouble_0007(t_ndarray arr, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+int64_t dtype_convert_to_cdouble_0008(t_ndarray arr, int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004, double complex* Out_0005);
+#endif // mod_829blow87934_H
@@ -0,0 +1,11 @@
+#ifndef MOD_83CVY8T9336F_H
+#define MOD_83CVY8T9336F_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void arr_arange_7(t_ndarray arr);
+#endif // mod_83cvy8t9336f_H
@@ -0,0 +1,13 @@
+from numpy import shape, array
+from pyccel.decorators import template
+
+@template('T1', ['bool[:,:]', 'int[:,:]', 'int8[:,:]', 'int16[:,:]', 'int32[:,:]', 'int64[:,:]', 'float[:,:]', 'float32[:,:]', 'float64[:,:]', 'complex64[:,:]', 'complex128[:,:]'])
+def src_dest_diff_sizes_dtype_convert_to_bool(arr1 : 'T1', arr2 : 'T1', arr3 : 'T1'):
+    from numpy import shape, array
+    a = array(arr1, order='C')
+    b = array(arr2, order='C')
+    c = array(arr3, order='C')
+    d = array([a, c, b], dtype = bool, order='C')
+    s = (3, shape(d)[1], shape(d)[2])
+    return s[0],s[1],s[2],d[0,0,0],d[0,0,1],d[1,0,0],d[1,0,1],d[2,0,0],d[2,0,1]
+
@@ -0,0 +1,11 @@
+#ifndef MOD_8854FWGMAIYB_H
+#define MOD_8854FWGMAIYB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_1d_negative_index_2(int64_t* Out_0001, double* Out_0002);
+#endif // mod_8854fwgmaiyb_H
@@ -0,0 +1,6 @@
+
+def set_With_tuple():
+    a = (1j, 6j, 7j)
+    b = set(a)
+    return b
+
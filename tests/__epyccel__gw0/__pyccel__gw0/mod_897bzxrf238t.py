@@ -0,0 +1,8 @@
+from pyccel.decorators import allow_negative_index
+
+@allow_negative_index('a')
+def test_argument_negative_index_1(a : 'int[::]'):
+    c = -2
+    d = 5
+    return a[c],a[d]
+
@@ -0,0 +1,45 @@
+module mod_8b74hj95jinj
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i64 => &
+        C_INT64_T
+  use Set_logical_mod
+  use Set_logical_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine update_boolean_tuple(Out_0001, Out_0002, Out_0003) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    logical(b1), intent(out) :: Out_0002
+    logical(b1), intent(out) :: Out_0003
+    type(Set_logical) :: a
+    logical(b1), allocatable :: b(:)
+    logical(b1) :: Dummy_0000
+    integer(i64) :: Dummy_0001
+
+    a = Set_logical([.True._b1])
+    allocate(b(0:2_i64))
+    b = [.False._b1, .True._b1, .False._b1]
+    do Dummy_0001 = 0_i64, 2_i64
+      Dummy_0000 = b(Dummy_0001)
+      call a % insert( Dummy_0000 )
+    end do
+    Out_0001 = a % size()
+    Out_0002 = Set_logical_pop(a)
+
+    Out_0003 = Set_logical_pop(a)
+
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    return
+
+  end subroutine update_boolean_tuple
+  !........................................
+
+end module mod_8b74hj95jinj
@@ -0,0 +1,12 @@
+#ifndef MOD_8E0FTY7F2Y85_H
+#define MOD_8E0FTY7F2Y85_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_multi_indexing_2(double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_8e0fty7f2y85_H
@@ -0,0 +1,12 @@
+from numpy import array
+from pyccel.decorators import allow_negative_index
+
+@allow_negative_index('a', 'b')
+def test_multiple_negative_index_2(c : 'int', d : 'int'):
+    from numpy import array
+    a = array([1.2, 2.2, 3.2, 4.2])
+    b = array([1, 5, 9, 13])
+    x = a[c] * d
+    y = b[d] * c
+    return x,y
+
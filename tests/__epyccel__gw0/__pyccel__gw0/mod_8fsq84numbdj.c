@@ -0,0 +1,19 @@
+#include "mod_8fsq84numbdj.h"
+
+
+/*........................................*/
+t_ndarray arr_tuple_slice_index(t_ndarray a)
+{
+    int64_t offset;
+    t_ndarray r = {.raw_data = NULL};
+    r = array_create(2, (int64_t[]){INT64_C(3), a.shape[INT64_C(1)] - INT64_C(1)}, nd_int64, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&r, array_slicing(a, 1, new_slice(INT64_C(0), INT64_C(1), INT64_C(1), ELEMENT), new_slice(INT64_C(1), a.shape[INT64_C(1)], INT64_C(1), RANGE)), offset);
+    offset += array_slicing(a, 1, new_slice(INT64_C(0), INT64_C(1), INT64_C(1), ELEMENT), new_slice(INT64_C(1), a.shape[INT64_C(1)], INT64_C(1), RANGE)).length;
+    array_copy_data(&r, array_slicing(a, 1, new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT), new_slice(INT64_C(1), a.shape[INT64_C(1)], INT64_C(1), RANGE)), offset);
+    offset += array_slicing(a, 1, new_slice(INT64_C(1), INT64_C(2), INT64_C(1), ELEMENT), new_slice(INT64_C(1), a.shape[INT64_C(1)], INT64_C(1), RANGE)).length;
+    array_copy_data(&r, array_slicing(a, 1, new_slice(INT64_C(3), INT64_C(4), INT64_C(1), ELEMENT), new_slice(INT64_C(1), a.shape[INT64_C(1)], INT64_C(1), RANGE)), offset);
+    return r;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_8FSQ84NUMBDJ_H
+#define MOD_8FSQ84NUMBDJ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray arr_tuple_slice_index(t_ndarray a);
+#endif // mod_8fsq84numbdj_H
@@ -0,0 +1,7 @@
+
+def union_int():
+    a = {1, 2}
+    b = {2}
+    d = a.union(a, b).pop()
+    return d
+
@@ -0,0 +1,382 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_8GLXLD8SKI1E_WRAPPER
+
+#include "mod_8glxld8ski1e_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0000_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t a;
+    int64_t b;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = PyInt64_to_Int64(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0000(a, b);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0001_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int8_t a;
+    int8_t b;
+    int8_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyInt8_to_Int8(a_obj);
+    b = PyInt8_to_Int8(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0001(a, b);
+    Out_0001_obj = Int8_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0002_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int16_t a;
+    int16_t b;
+    int16_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyInt16_to_Int16(a_obj);
+    b = PyInt16_to_Int16(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0002(a, b);
+    Out_0001_obj = Int16_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0003_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int32_t a;
+    int32_t b;
+    int32_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyInt32_to_Int32(a_obj);
+    b = PyInt32_to_Int32(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0003(a, b);
+    Out_0001_obj = Int32_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0004_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t a;
+    int64_t b;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = PyInt64_to_Int64(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0004(a, b);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0005_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    double a;
+    double b;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = PyDouble_to_Double(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0005(a, b);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0006_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    float a;
+    float b;
+    float Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyFloat_to_Float(a_obj);
+    b = PyFloat_to_Float(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0006(a, b);
+    Out_0001_obj = Float_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0007_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    double a;
+    double b;
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = PyDouble_to_Double(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0007(a, b);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0008_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    float complex a;
+    float complex b;
+    float complex Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyComplex_to_Complex64(a_obj);
+    b = PyComplex_to_Complex64(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0008(a, b);
+    Out_0001_obj = Complex64_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_return_first_element_0009_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    double complex a;
+    double complex b;
+    double complex Out_0001;
+    PyObject* Out_0001_obj;
+    a = PyComplex_to_Complex128(a_obj);
+    b = PyComplex_to_Complex128(b_obj);
+    Out_0001 = bind_c_array_return_first_element_0009(a, b);
+    Out_0001_obj = Complex128_to_NumpyComplex(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t array_return_first_element_type_check(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeInt(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int8(a_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Int16(a_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Int32(a_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Int64(a_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_NativeFloat(a_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (PyIs_Float(a_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Double(a_obj))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (PyIs_Complex64(a_obj))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else if (PyIs_Complex128(a_obj))
+    {
+        type_indicator += INT64_C(9);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    if (PyIs_NativeInt(b_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int8(b_obj))
+    {
+        type_indicator += INT64_C(10);
+    }
+    else if (PyIs_Int16(b_obj))
+    {
+        type_indicator += INT64_C(20);
+    }
+    else if (PyIs_Int32(b_obj))
+    {
+        type_indicator += INT64_C(30);
+    }
+    else if (PyIs_Int64(b_obj))
+    {
+        type_indicator += INT64_C(40);
+    }
+    else if (PyIs_NativeFloat(b_obj))
+    {
+        type_indicator += INT64_C(50);
+    }
+    else if (PyIs_Float(b_obj))
+    {
+        type_indicator += INT64_C(60);
+    }
+    else if (PyIs_Double(b_obj))
+    {
+        type_indicator += INT64_C(70);
+    }
+    else if (PyIs_Complex64(b_obj))
+    {
+        type_indicator += INT64_C(80);
+    }
+    else if (PyIs_Complex128(b_obj))
+    {
+        type_indicator += INT64_C(90);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument b");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* array_return_first_element_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &a_obj, &b_obj))
+    {
+        return NULL;
+    }
+    type_indicator = array_return_first_element_type_check(a_obj, b_obj);
+    switch (type_indicator)
+    {
+        case INT64_C(0):
+        {
+            return bind_c_array_return_first_element_0000_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(11):
+        {
+            return bind_c_array_return_first_element_0001_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(22):
+        {
+            return bind_c_array_return_first_element_0002_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(33):
+        {
+            return bind_c_array_return_first_element_0003_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(44):
+        {
+            return bind_c_array_return_first_element_0004_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(55):
+        {
+            return bind_c_array_return_first_element_0005_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(66):
+        {
+            return bind_c_array_return_first_element_0006_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(77):
+        {
+            return bind_c_array_return_first_element_0007_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(88):
+        {
+            return bind_c_array_return_first_element_0008_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(99):
+        {
+            return bind_c_array_return_first_element_0009_wrapper(a_obj, b_obj);
+        }
+        default:
+        {
+            PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+            return NULL;
+        }
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_8glxld8ski1e_methods[] = {
+    {
+        "array_return_first_element",
+        (PyCFunction)array_return_first_element_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_8glxld8ski1e_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_8glxld8ski1e",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_8glxld8ski1e_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_8glxld8ski1e(void)
+{
+    PyObject* mod;
+    static void* Pymod_8glxld8ski1e_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_8glxld8ski1e_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_8glxld8ski1e_API, "mod_8glxld8ski1e._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
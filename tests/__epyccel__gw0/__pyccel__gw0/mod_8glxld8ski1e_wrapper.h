@@ -0,0 +1,49 @@
+#ifndef MOD_8GLXLD8SKI1E_WRAPPER_H
+#define MOD_8GLXLD8SKI1E_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_8GLXLD8SKI1E_WRAPPER
+
+int64_t bind_c_array_return_first_element_0000(int64_t, int64_t);
+int8_t bind_c_array_return_first_element_0001(int8_t, int8_t);
+int16_t bind_c_array_return_first_element_0002(int16_t, int16_t);
+int32_t bind_c_array_return_first_element_0003(int32_t, int32_t);
+int64_t bind_c_array_return_first_element_0004(int64_t, int64_t);
+double bind_c_array_return_first_element_0005(double, double);
+float bind_c_array_return_first_element_0006(float, float);
+double bind_c_array_return_first_element_0007(double, double);
+float complex bind_c_array_return_first_element_0008(float complex, float complex);
+double complex bind_c_array_return_first_element_0009(double complex, double complex);
+
+#else
+
+static void** Pymod_8glxld8ski1e_API;
+
+
+/*........................................*/
+static int mod_8glxld8ski1e_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_8glxld8ski1e_API = (void**)PyCapsule_Import("mod_8glxld8ski1e._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_8glxld8ski1e_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_8GLXLD8SKI1E_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_8HROW8JAFQWJ_H
+#define MOD_8HROW8JAFQWJ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_8hrow8jafqwj_H
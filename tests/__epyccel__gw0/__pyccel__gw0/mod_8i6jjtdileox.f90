@@ -0,0 +1,26 @@
+module mod_8i6jjtdileox
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function add_int() result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    type(Set_integer8) :: a
+
+    a = Set_integer8([1_i64, 3_i64, 45_i64])
+    call a % insert( 4_i64 )
+    Out_0001 = a % size()
+    return
+
+  end function add_int
+  !........................................
+
+end module mod_8i6jjtdileox
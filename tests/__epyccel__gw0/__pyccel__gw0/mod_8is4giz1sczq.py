@@ -0,0 +1,5 @@
+
+def p_lose():
+    lose = -10
+    return lose
+
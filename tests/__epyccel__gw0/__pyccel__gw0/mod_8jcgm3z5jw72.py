@@ -0,0 +1,4 @@
+
+def array_int32_2d_C_scalar_add(x : 'int32[::,::]', a : 'int32'):
+    x[::,::] += a
+
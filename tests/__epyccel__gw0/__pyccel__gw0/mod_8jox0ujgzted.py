@@ -0,0 +1,10 @@
+from numpy import shape
+
+def arr_arange_7(arr : 'int[::,::]'):
+    from numpy import arange
+    from numpy import shape
+    n = shape(arr)[0]
+    m = shape(arr)[1]
+    for i in range(0, n, 1):
+        arr[i,::] = arange(i, i + m, 1)
+
@@ -0,0 +1,5 @@
+
+def pop_last_element():
+    a = [1, 3, 45]
+    return a.pop()
+
@@ -0,0 +1,220 @@
+#include "mod_8k7snpmid8c4.h"
+
+
+/*........................................*/
+t_ndarray return_array_arg_array_op_0000(t_ndarray a)
+{
+    double array_dummy[INT64_C(7)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(7)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_int8, i);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0001(t_ndarray a)
+{
+    double array_dummy[INT64_C(7)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(7)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_int16, i);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0002(t_ndarray a)
+{
+    double array_dummy[INT64_C(7)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(7)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_int32, i);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0003(t_ndarray a)
+{
+    double array_dummy[INT64_C(7)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(7)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_int64, i);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0004(t_ndarray a)
+{
+    double array_dummy[INT64_C(7)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(7)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_float, i);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0005(t_ndarray a)
+{
+    double array_dummy[INT64_C(7)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(7)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_double, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_double, i);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0006(t_ndarray a)
+{
+    double array_dummy[INT64_C(7)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(7)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_cdouble, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double complex* restrict Out_0001_data = Out_0001.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_cfloat, i);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_arg_array_op_0007(t_ndarray a)
+{
+    double array_dummy[INT64_C(7)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(7)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    array_fill((double)1.0, x);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(7)}, nd_cdouble, false, order_c);
+    {
+        double* restrict x_data = x.nd_double;
+        double complex* restrict Out_0001_data = Out_0001.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(7); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] * GET_ELEMENT(a, nd_cdouble, i);
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,289 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_8K7SNPMID8C4_WRAPPER
+
+#include "mod_8k7snpmid8c4_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_arg_array_op_0000_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = return_array_arg_array_op_0000(a);
+    free_pointer(&a);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_arg_array_op_0001_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = return_array_arg_array_op_0001(a);
+    free_pointer(&a);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_arg_array_op_0002_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = return_array_arg_array_op_0002(a);
+    free_pointer(&a);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_arg_array_op_0003_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = return_array_arg_array_op_0003(a);
+    free_pointer(&a);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_arg_array_op_0004_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = return_array_arg_array_op_0004(a);
+    free_pointer(&a);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_arg_array_op_0005_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = return_array_arg_array_op_0005(a);
+    free_pointer(&a);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_arg_array_op_0006_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = return_array_arg_array_op_0006(a);
+    free_pointer(&a);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_arg_array_op_0007_wrapper(PyObject* a_obj)
+{
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = pyarray_to_ndarray(a_obj);
+    Out_0001 = return_array_arg_array_op_0007(a);
+    free_pointer(&a);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t return_array_arg_array_op_type_check(PyObject* a_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(a_obj, NPY_BYTE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(a_obj, NPY_SHORT, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(a_obj, NPY_INT32, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (is_numpy_array(a_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (is_numpy_array(a_obj, NPY_FLOAT, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (is_numpy_array(a_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (is_numpy_array(a_obj, NPY_CFLOAT, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (is_numpy_array(a_obj, NPY_CDOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* return_array_arg_array_op_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    type_indicator = return_array_arg_array_op_type_check(a_obj);
+    switch (type_indicator)
+    {
+        case INT64_C(0):
+        {
+            return return_array_arg_array_op_0000_wrapper(a_obj);
+        }
+        case INT64_C(1):
+        {
+            return return_array_arg_array_op_0001_wrapper(a_obj);
+        }
+        case INT64_C(2):
+        {
+            return return_array_arg_array_op_0002_wrapper(a_obj);
+        }
+        case INT64_C(3):
+        {
+            return return_array_arg_array_op_0003_wrapper(a_obj);
+        }
+        case INT64_C(4):
+        {
+            return return_array_arg_array_op_0004_wrapper(a_obj);
+        }
+        case INT64_C(5):
+        {
+            return return_array_arg_array_op_0005_wrapper(a_obj);
+        }
+        case INT64_C(6):
+        {
+            return return_array_arg_array_op_0006_wrapper(a_obj);
+        }
+        case INT64_C(7):
+        {
+            return return_array_arg_array_op_0007_wrapper(a_obj);
+        }
+        default:
+        {
+            PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+            return NULL;
+        }
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_8k7snpmid8c4_methods[] = {
+    {
+        "return_array_arg_array_op",
+        (PyCFunction)return_array_arg_array_op_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_8k7snpmid8c4_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_8k7snpmid8c4",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_8k7snpmid8c4_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_8k7snpmid8c4(void)
+{
+    PyObject* mod;
+    static void* Pymod_8k7snpmid8c4_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_8k7snpmid8c4_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_8k7snpmid8c4_API, "mod_8k7snpmid8c4._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,7 @@
+from numpy import shape
+
+def arr_arange_5():
+    from numpy import shape, arange
+    a = arange(20, 2.2, -2)
+    return shape(a)[0],a[0],a[-1]
+
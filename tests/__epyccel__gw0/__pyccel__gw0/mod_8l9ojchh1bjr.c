@@ -0,0 +1,40 @@
+#include "mod_8l9ojchh1bjr.h"
+
+
+/*........................................*/
+int64_t arrs_2d_similar_shapes_0(int64_t* Out_0001, int64_t* Out_0002)
+{
+    int64_t dy;
+    int64_t dx;
+    int64_t array_dummy[INT64_C(12)];
+    t_ndarray pn = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(4), INT64_C(3)},
+        .nd=2,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&pn);
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    dy = INT64_C(4);
+    dx = INT64_C(2);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(1), INT64_C(2), INT64_C(3)};
+    memcpy(&pn.nd_int64[INT64_C(0)], Dummy_0000, 12 * pn.type_size);
+    x = array_create(2, (int64_t[]){INT64_C(4) - INT64_C(1) - INT64_C(1), INT64_C(1)}, nd_double, false, order_c);
+    {
+        int64_t* restrict pn_data = pn.nd_int64;
+        double* restrict x_data = x.nd_double;
+        for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            x_data[i * x.shape[INT64_C(1)]] = (double)((dy * dy * (pn_data[(i + INT64_C(1)) * pn.shape[INT64_C(1)] + (i_0001 + INT64_C(2))] + pn_data[(i + INT64_C(1)) * pn.shape[INT64_C(1)] + i_0001]) + dx * dx * (pn_data[(i + INT64_C(2)) * pn.shape[INT64_C(1)] + (i_0001 + INT64_C(1))] + pn_data[i * pn.shape[INT64_C(1)] + (i_0001 + INT64_C(1))]))) / (double)((INT64_C(2) * (dx * dx + dy * dy)));
+        }
+    }
+    (*Out_0001) = x.shape[INT64_C(0)];
+    (*Out_0002) = INT64_C(1);
+    free_array(&x);
+    return 0;
+}
+/*........................................*/
+
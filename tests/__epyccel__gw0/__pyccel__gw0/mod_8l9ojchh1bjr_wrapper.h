@@ -0,0 +1,40 @@
+#ifndef MOD_8L9OJCHH1BJR_WRAPPER_H
+#define MOD_8L9OJCHH1BJR_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_8l9ojchh1bjr.h"
+
+
+#ifdef MOD_8L9OJCHH1BJR_WRAPPER
+
+
+#else
+
+static void** Pymod_8l9ojchh1bjr_API;
+
+
+/*........................................*/
+static int mod_8l9ojchh1bjr_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_8l9ojchh1bjr_API = (void**)PyCapsule_Import("mod_8l9ojchh1bjr._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_8l9ojchh1bjr_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_8L9OJCHH1BJR_WRAPPER_H
@@ -0,0 +1,16 @@
+#include "mod_8ld2fsf56o2f.h"
+
+
+/*........................................*/
+int64_t Pop_float(double* el1, double* el2, double* el3)
+{
+    hset_double se = {0};
+    se = c_init(hset_double, {2.3, 4.1, 9.5});
+    (*el1) = hset_double_pop(&se);
+    (*el2) = hset_double_pop(&se);
+    (*el3) = hset_double_pop(&se);
+    hset_double_drop(&se);
+    return 0;
+}
+/*........................................*/
+
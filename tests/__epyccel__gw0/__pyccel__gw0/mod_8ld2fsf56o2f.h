@@ -0,0 +1,28 @@
+#ifndef MOD_8LD2FSF56O2F_H
+#define MOD_8LD2FSF56O2F_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+
+
+
+int64_t Pop_float(double* el1, double* el2, double* el3);
+#endif // mod_8ld2fsf56o2f_H
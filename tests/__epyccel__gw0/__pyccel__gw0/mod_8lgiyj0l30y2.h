@@ -0,0 +1,11 @@
+#ifndef MOD_8LGIYJ0L30Y2_H
+#define MOD_8LGIYJ0L30Y2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_mul(t_ndarray x, double a);
+#endif // mod_8lgiyj0l30y2_H
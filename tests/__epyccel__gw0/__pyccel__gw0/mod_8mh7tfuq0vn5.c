@@ -0,0 +1,13 @@
+#include "mod_8mh7tfuq0vn5.h"
+
+
+/*........................................*/
+hset_double Discard_int(void)
+{
+    hset_double se = {0};
+    se = c_init(hset_double, {2.7, 4.3, 9.2});
+    hset_double_erase(&se, 4.3);
+    return se;
+}
+/*........................................*/
+
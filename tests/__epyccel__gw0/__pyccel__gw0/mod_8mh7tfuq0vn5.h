@@ -0,0 +1,28 @@
+#ifndef MOD_8MH7TFUQ0VN5_H
+#define MOD_8MH7TFUQ0VN5_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+
+
+
+hset_double Discard_int(void);
+#endif // mod_8mh7tfuq0vn5_H
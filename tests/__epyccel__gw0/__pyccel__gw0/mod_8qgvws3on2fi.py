@@ -0,0 +1,7 @@
+
+def f():
+    a = [1, 2, 3]
+    for index in range(4, 9, 1):
+        a.append(index)
+    return a
+
@@ -0,0 +1,41 @@
+module mod_8r6ftk41zckx
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine unpack_array_2D_of_known_size(Out_0001, Out_0002, Out_0003 &
+        )
+
+    implicit none
+
+    real(f64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+    real(f64), allocatable, target :: arr(:, :)
+    real(f64), pointer :: x(:)
+    real(f64), pointer :: y(:)
+    real(f64), pointer :: z(:)
+
+    allocate(arr(0:2_i64, 0:2_i64))
+    arr = reshape([[1.0_f64, 2.0_f64, 3.0_f64], [4.0_f64, 5.0_f64, &
+          6.0_f64], [7.0_f64, 8.0_f64, 9.0_f64]], [3_i64, 3_i64])
+    x(0:) => arr(:, 0_i64)
+    y(0:) => arr(:, 1_i64)
+    z(0:) => arr(:, 2_i64)
+    Out_0001 = sum(x)
+    Out_0002 = sum(y)
+    Out_0003 = sum(z)
+    if (allocated(arr)) then
+      deallocate(arr)
+    end if
+    return
+
+  end subroutine unpack_array_2D_of_known_size
+  !........................................
+
+end module mod_8r6ftk41zckx
@@ -0,0 +1,11 @@
+#ifndef MOD_8RZU7UP7RB5E_H
+#define MOD_8RZU7UP7RB5E_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_8rzu7up7rb5e_H
@@ -0,0 +1,36 @@
+#include "mod_8srtjbfsgcfk.h"
+
+
+/*........................................*/
+int64_t f1(t_ndarray x, int64_t* n, int64_t* m, int64_t* Out_0001, int64_t* Out_0002)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray y = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    Dummy_0000 = array_create(2, (int64_t[]){x.shape[INT64_C(0)], x.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    y = array_create(2, (int64_t[]){Dummy_0000.shape[INT64_C(1)], Dummy_0000.shape[INT64_C(0)]}, nd_int64, false, order_f);
+    for (i = INT64_C(0); i < Dummy_0000.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < Dummy_0000.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            Dummy_0000.nd_int64[i * Dummy_0000.shape[INT64_C(1)] + i_0001] = GET_ELEMENT(x, nd_int64, i, i_0001) * INT64_C(2);
+        }
+    }
+    for (i = INT64_C(0); i < y.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < y.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            y.nd_int64[i_0001 * y.shape[INT64_C(0)] + i] = Dummy_0000.nd_int64[i_0001 * Dummy_0000.shape[INT64_C(1)] + i] + INT64_C(3);
+        }
+    }
+    (*n) = y.shape[INT64_C(0)];
+    (*m) = y.shape[INT64_C(1)];
+    (*Out_0001) = y.nd_int64[y.shape[INT64_C(0)] - INT64_C(1)];
+    (*Out_0002) = y.nd_int64[(y.shape[INT64_C(1)] - INT64_C(1)) * y.shape[INT64_C(0)]];
+    free_array(&Dummy_0000);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+
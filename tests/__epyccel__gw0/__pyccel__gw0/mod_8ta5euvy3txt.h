@@ -0,0 +1,10 @@
+#ifndef MOD_8TA5EUVY3TXT_H
+#define MOD_8TA5EUVY3TXT_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_master(void);
+#endif // mod_8ta5euvy3txt_H
@@ -0,0 +1,5 @@
+
+def fused_shifted_slices(a : 'float[::]', b : 'float[::]'):
+    a[:-1:] = a[1::] + b[:-1:]
+    b[1::] = a[:-1:] * 2.0
+
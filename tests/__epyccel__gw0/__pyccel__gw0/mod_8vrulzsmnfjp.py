@@ -0,0 +1,7 @@
+
+def homogeneous_tuple_containing_var():
+    elem = 4
+    ai = (1, elem, 5)
+    i = 1
+    return ai[0],ai[i],ai[2]
+
@@ -0,0 +1,11 @@
+#ifndef MOD_8Z6027NI0DS0_H
+#define MOD_8Z6027NI0DS0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_8(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_8z6027ni0ds0_H
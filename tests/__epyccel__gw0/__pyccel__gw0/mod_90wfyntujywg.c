@@ -0,0 +1,16 @@
+#include "mod_90wfyntujywg.h"
+
+
+/*........................................*/
+void product_loop_on_real_array(t_ndarray z, t_ndarray out)
+{
+    int64_t n;
+    int64_t i;
+    n = z.shape[INT64_C(0)];
+    for (i = INT64_C(0); i < n; i += INT64_C(1))
+    {
+        GET_ELEMENT(out, nd_double, i) = pow(GET_ELEMENT(z, nd_double, i), 2.0);
+    }
+}
+/*........................................*/
+
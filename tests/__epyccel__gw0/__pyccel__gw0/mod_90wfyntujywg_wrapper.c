@@ -0,0 +1,102 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_90WFYNTUJYWG_WRAPPER
+
+#include "mod_90wfyntujywg_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* product_loop_on_real_array_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* z_obj;
+    PyObject* out_obj;
+    t_ndarray z = {.raw_data = NULL};
+    t_ndarray out = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "z",
+        "out",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &z_obj, &out_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("z", z_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        z = pyarray_to_ndarray(z_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out", out_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        out = pyarray_to_ndarray(out_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    product_loop_on_real_array(z, out);
+    free_pointer(&z);
+    free_pointer(&out);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_90wfyntujywg_methods[] = {
+    {
+        "product_loop_on_real_array",
+        (PyCFunction)product_loop_on_real_array_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_90wfyntujywg_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_90wfyntujywg",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_90wfyntujywg_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_90wfyntujywg(void)
+{
+    PyObject* mod;
+    static void* Pymod_90wfyntujywg_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_90wfyntujywg_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_90wfyntujywg_API, "mod_90wfyntujywg._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,24 @@
+module mod_93ksp1kzdaf9
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_float_2d_2d_matmul_operator(A, B, out) 
+
+    implicit none
+
+    real(f64), intent(in) :: A(0_i64:, 0_i64:)
+    real(f64), intent(in) :: B(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: out(0_i64:, 0_i64:)
+
+    out(:, :) = matmul(B,A)
+
+  end subroutine array_float_2d_2d_matmul_operator
+  !........................................
+
+end module mod_93ksp1kzdaf9
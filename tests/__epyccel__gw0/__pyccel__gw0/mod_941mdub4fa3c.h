@@ -0,0 +1,20 @@
+#ifndef MOD_941MDUB4FA3C_H
+#define MOD_941MDUB4FA3C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_float32_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006, float* Out_0007, float* Out_0008, float* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float32_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006, float* Out_0007, float* Out_0008, float* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float32_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006, float* Out_0007, float* Out_0008, float* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float32_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006, float* Out_0007, float* Out_0008, float* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float32_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006, float* Out_0007, float* Out_0008, float* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float32_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006, float* Out_0007, float* Out_0008, float* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float32_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006, float* Out_0007, float* Out_0008, float* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float32_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006, float* Out_0007, float* Out_0008, float* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_float32_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, float* Out_0004, float* Out_0005, float* Out_0006, float* Out_0007, float* Out_0008, float* Out_0009);
+#endif // mod_941mdub4fa3c_H
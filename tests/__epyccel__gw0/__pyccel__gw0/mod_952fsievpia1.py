@@ -0,0 +1,4 @@
+
+def array_int32_1d_sub_augassign(x : 'int32[::]', y : 'int32[::]'):
+    x -= y
+
@@ -0,0 +1,20 @@
+#ifndef MOD_95F0ACGGG9OF_H
+#define MOD_95F0ACGGG9OF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_int16_orderF_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006, int16_t* Out_0007, int16_t* Out_0008, int16_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int16_orderF_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006, int16_t* Out_0007, int16_t* Out_0008, int16_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int16_orderF_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006, int16_t* Out_0007, int16_t* Out_0008, int16_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int16_orderF_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006, int16_t* Out_0007, int16_t* Out_0008, int16_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int16_orderF_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006, int16_t* Out_0007, int16_t* Out_0008, int16_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int16_orderF_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006, int16_t* Out_0007, int16_t* Out_0008, int16_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int16_orderF_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006, int16_t* Out_0007, int16_t* Out_0008, int16_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int16_orderF_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006, int16_t* Out_0007, int16_t* Out_0008, int16_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int16_orderF_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int16_t* Out_0004, int16_t* Out_0005, int16_t* Out_0006, int16_t* Out_0007, int16_t* Out_0008, int16_t* Out_0009);
+#endif // mod_95f0acggg9of_H
@@ -0,0 +1,11 @@
+#ifndef MOD_96GMXZS9HHGO_H
+#define MOD_96GMXZS9HHGO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_simd(int64_t n);
+#endif // mod_96gmxzs9hhgo_H
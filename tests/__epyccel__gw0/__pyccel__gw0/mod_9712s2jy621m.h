@@ -0,0 +1,11 @@
+#ifndef MOD_9712S2JY621M_H
+#define MOD_9712S2JY621M_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_9712s2jy621m_H
@@ -0,0 +1,12 @@
+#ifndef MOD_97G1IU0IC7DW_H
+#define MOD_97G1IU0IC7DW_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_in_bool_out_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri);
+#endif // mod_97g1iu0ic7dw_H
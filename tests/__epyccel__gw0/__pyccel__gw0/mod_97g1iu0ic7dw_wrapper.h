@@ -0,0 +1,42 @@
+#ifndef MOD_97G1IU0IC7DW_WRAPPER_H
+#define MOD_97G1IU0IC7DW_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_97g1iu0ic7dw.h"
+
+
+#ifdef MOD_97G1IU0IC7DW_WRAPPER
+
+
+#else
+
+static void** Pymod_97g1iu0ic7dw_API;
+
+
+/*........................................*/
+static int mod_97g1iu0ic7dw_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_97g1iu0ic7dw_API = (void**)PyCapsule_Import("mod_97g1iu0ic7dw._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_97g1iu0ic7dw_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_97G1IU0IC7DW_WRAPPER_H
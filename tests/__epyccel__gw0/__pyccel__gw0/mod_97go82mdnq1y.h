@@ -0,0 +1,12 @@
+#ifndef MOD_97GO82MDNQ1Y_H
+#define MOD_97GO82MDNQ1Y_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_4(t_ndarray a, t_ndarray b);
+#endif // mod_97go82mdnq1y_H
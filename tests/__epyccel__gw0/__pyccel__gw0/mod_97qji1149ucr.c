@@ -0,0 +1,40 @@
+#include "mod_97qji1149ucr.h"
+
+
+/*........................................*/
+void array_float_nested_C_array_initialization_3(t_ndarray a, t_ndarray e, t_ndarray x)
+{
+    t_ndarray tmp = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    int64_t i_0003;
+    int64_t offset;
+    tmp = array_create(4, (int64_t[]){INT64_C(3), INT64_C(2), e.shape[INT64_C(0)], e.shape[INT64_C(1)]}, nd_double, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&tmp, e, offset);
+    offset += e.length;
+    double Dummy_0000[] = {1.0, 2.0, 3.0, 1.0, 2.0, 3.0};
+    memcpy(&tmp.nd_double[offset], Dummy_0000, 6 * tmp.type_size);
+    offset += INT64_C(6);
+    array_copy_data(&tmp, a, offset);
+    offset += a.length;
+    double Dummy_0001[] = {1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0, 1.0, 2.0, 3.0};
+    memcpy(&tmp.nd_double[offset], Dummy_0001, 12 * tmp.type_size);
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < x.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            for (i_0002 = INT64_C(0); i_0002 < x.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+            {
+                for (i_0003 = INT64_C(0); i_0003 < x.shape[INT64_C(3)]; i_0003 += INT64_C(1))
+                {
+                    GET_ELEMENT(x, nd_double, i, i_0001, i_0002, i_0003) = tmp.nd_double[((i * tmp.shape[INT64_C(1)] + i_0001) * tmp.shape[INT64_C(2)] + i_0002) * tmp.shape[INT64_C(3)] + i_0003];
+                }
+            }
+        }
+    }
+    free_array(&tmp);
+}
+/*........................................*/
+
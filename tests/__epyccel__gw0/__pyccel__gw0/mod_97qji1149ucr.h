@@ -0,0 +1,12 @@
+#ifndef MOD_97QJI1149UCR_H
+#define MOD_97QJI1149UCR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_nested_C_array_initialization_3(t_ndarray a, t_ndarray e, t_ndarray x);
+#endif // mod_97qji1149ucr_H
@@ -0,0 +1,23 @@
+#include "mod_9bawtftus1ox.h"
+
+
+/*........................................*/
+int64_t array_variable_size(int64_t n, int64_t m, int64_t* Out_0001, int64_t* Out_0002)
+{
+    int64_t s;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    s = n;
+    a = array_create(1, (int64_t[]){s}, nd_double, false, order_c);
+    array_fill((double)0.0, a);
+    s = m;
+    c = array_create(1, (int64_t[]){a.shape[INT64_C(0)]}, nd_double, false, order_c);
+    array_fill((double)0.0, c);
+    (*Out_0001) = a.shape[INT64_C(0)];
+    (*Out_0002) = c.shape[INT64_C(0)];
+    free_array(&c);
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
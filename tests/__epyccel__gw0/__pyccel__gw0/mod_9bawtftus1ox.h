@@ -0,0 +1,11 @@
+#ifndef MOD_9BAWTFTUS1OX_H
+#define MOD_9BAWTFTUS1OX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_variable_size(int64_t n, int64_t m, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_9bawtftus1ox_H
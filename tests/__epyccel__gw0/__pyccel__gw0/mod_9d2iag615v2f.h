@@ -0,0 +1,11 @@
+#ifndef MOD_9D2IAG615V2F_H
+#define MOD_9D2IAG615V2F_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f(t_ndarray x);
+#endif // mod_9d2iag615v2f_H
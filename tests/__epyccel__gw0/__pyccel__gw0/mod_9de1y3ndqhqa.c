@@ -0,0 +1,25 @@
+#include "mod_9de1y3ndqhqa.h"
+
+
+/*........................................*/
+int64_t dict_iter_local(int64_t* keys, double* vals)
+{
+    hmap_int64_t_double a = {0};
+    int64_t key;
+    double val;
+    a = c_init(hmap_int64_t_double, {{INT64_C(1), 1.5}, {INT64_C(2), 2.5}, {INT64_C(7), 7.5}});
+    (*keys) = INT64_C(0);
+    c_foreach (Dummy_0000, hmap_int64_t_double, a){
+        key = Dummy_0000.ref->first;
+        (*keys) += key;
+    }
+    (*vals) = 0.0;
+    c_foreach (Dummy_0001, hmap_int64_t_double, a){
+        val = Dummy_0001.ref->second;
+        (*vals) += val;
+    }
+    hmap_int64_t_double_drop(&a);
+    return 0;
+}
+/*........................................*/
+
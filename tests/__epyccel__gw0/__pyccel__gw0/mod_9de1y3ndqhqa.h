@@ -0,0 +1,20 @@
+#ifndef MOD_9DE1Y3NDQHQA_H
+#define MOD_9DE1Y3NDQHQA_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define i_type hmap_int64_t_double
+#define i_key int64_t
+#define i_val double
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+
+
+
+
+int64_t dict_iter_local(int64_t* keys, double* vals);
+#endif // mod_9de1y3ndqhqa_H
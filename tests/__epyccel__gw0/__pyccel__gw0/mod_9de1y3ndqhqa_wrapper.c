@@ -0,0 +1,86 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9DE1Y3NDQHQA_WRAPPER
+
+#include "mod_9de1y3ndqhqa_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* dict_iter_local_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* keys_obj;
+    int64_t keys;
+    PyObject* vals_obj;
+    double vals;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    dict_iter_local(&keys, &vals);
+    keys_obj = Int64_to_PyLong(&keys);
+    vals_obj = Double_to_PyDouble(&vals);
+    Out_obj = Py_BuildValue("OO", keys_obj, vals_obj);
+    Py_DECREF(keys_obj);
+    Py_DECREF(vals_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9de1y3ndqhqa_methods[] = {
+    {
+        "dict_iter_local",
+        (PyCFunction)dict_iter_local_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9de1y3ndqhqa_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9de1y3ndqhqa",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9de1y3ndqhqa_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9de1y3ndqhqa(void)
+{
+    PyObject* mod;
+    static void* Pymod_9de1y3ndqhqa_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9de1y3ndqhqa_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9de1y3ndqhqa_API, "mod_9de1y3ndqhqa._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
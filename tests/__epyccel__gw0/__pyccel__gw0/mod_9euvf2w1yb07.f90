@@ -0,0 +1,23 @@
+module mod_9euvf2w1yb07
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , i32 => &
+        C_INT32_T , f64 => C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int32_2d_C_idiv(x, y) 
+
+    implicit none
+
+    integer(i32), intent(inout) :: x(0_i64:, 0_i64:)
+    integer(i32), intent(in) :: y(0_i64:, 0_i64:)
+
+    x(:, :) = FLOOR(x/Real(y, kind = f64),i32)
+
+  end subroutine array_int32_2d_C_idiv
+  !........................................
+
+end module mod_9euvf2w1yb07
@@ -0,0 +1,24 @@
+module mod_9ey5bxmbqahf
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f3(x, y) 
+
+    implicit none
+
+    integer(i64), allocatable, intent(out) :: y(:)
+    integer(i64), intent(in) :: x(0_i64:)
+
+    allocate(y(0:size(x, kind=i64) - 1_i64))
+    y(:) = x - 1_i64
+    return
+
+  end subroutine f3
+  !........................................
+
+end module mod_9ey5bxmbqahf
@@ -0,0 +1,94 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9EY5BXMBQAHF_WRAPPER
+
+#include "mod_9ey5bxmbqahf_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f3_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    int64_t x_strides[1];
+    void* y_data = NULL;
+    int64_t y_shape[1];
+    PyObject* y_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_f3(x_data, x_shape[INT64_C(0)], x_strides[INT64_C(0)], &y_data, &y_shape[INT64_C(0)]);
+    y_obj = to_pyarray(INT64_C(1), NPY_INT64, y_data, y_shape, 1, 1);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9ey5bxmbqahf_methods[] = {
+    {
+        "f3",
+        (PyCFunction)bind_c_f3_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9ey5bxmbqahf_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9ey5bxmbqahf",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9ey5bxmbqahf_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9ey5bxmbqahf(void)
+{
+    PyObject* mod;
+    static void* Pymod_9ey5bxmbqahf_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9ey5bxmbqahf_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9ey5bxmbqahf_API, "mod_9ey5bxmbqahf._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,10 @@
+from numpy import shape, float64
+
+def arrs_uncertain_shape_1():
+    from numpy import shape, zeros
+    i = 4
+    j = 6
+    a = zeros((10), dtype = float64)
+    b = a[2:i:] + a[4:j:]
+    return shape(b)[0]
+
@@ -0,0 +1,8 @@
+from numpy import float64
+
+def arrs_1d_negative_index_2():
+    from numpy import shape, ones, sum
+    a = ones((10), dtype = float64)
+    b = a[1:-1:] + a[2::]
+    return 8,sum(b)
+
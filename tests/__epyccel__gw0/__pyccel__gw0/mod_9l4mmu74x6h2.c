@@ -0,0 +1,39 @@
+#include "mod_9l4mmu74x6h2.h"
+
+
+/*........................................*/
+int64_t temp_array_in_loop(t_ndarray a, t_ndarray b, t_ndarray* d1, t_ndarray* d2)
+{
+    t_ndarray c = {.raw_data = NULL};
+    int64_t Dummy_0000;
+    int64_t Dummy_0001;
+    int64_t d;
+    t_ndarray Dummy_0002 = {.raw_data = NULL};
+    int64_t i;
+    int64_t Dummy_0002_0001;
+    c = array_create(1, (int64_t[]){a.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), c);
+    (*d1) = array_create(1, (int64_t[]){a.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), (*d1));
+    (*d2) = array_create(1, (int64_t[]){a.shape[INT64_C(0)]}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), (*d2));
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < INT64_C(1); Dummy_0000 += INT64_C(1))
+    {
+        for (d = INT64_C(0); d < INT64_C(2); d += INT64_C(1))
+        {
+            GET_ELEMENT(b, nd_int64, d) += d;
+        }
+        for (i = INT64_C(0); i < c.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            c.nd_int64[i] = GET_ELEMENT(b, nd_int64, i) - GET_ELEMENT(a, nd_int64, i);
+            (*d1).nd_int64[i] = fabs((double)(c.nd_int64[i]));
+            Dummy_0002_0001 = GET_ELEMENT(b, nd_int64, i) - GET_ELEMENT(a, nd_int64, i);
+            (*d2).nd_int64[i] = fabs((double)(Dummy_0002_0001));
+        }
+    }
+    free_array(&c);
+    free_array(&Dummy_0002);
+    return 0;
+}
+/*........................................*/
+
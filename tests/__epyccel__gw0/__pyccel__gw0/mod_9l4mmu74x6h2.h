@@ -0,0 +1,12 @@
+#ifndef MOD_9L4MMU74X6H2_H
+#define MOD_9L4MMU74X6H2_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t temp_array_in_loop(t_ndarray a, t_ndarray b, t_ndarray* d1, t_ndarray* d2);
+#endif // mod_9l4mmu74x6h2_H
@@ -0,0 +1,23 @@
+module mod_9m0exfenmpar
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , i32 => &
+        C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int32_2d_C_scalar_mul(x, a) 
+
+    implicit none
+
+    integer(i32), intent(inout) :: x(0_i64:, 0_i64:)
+    integer(i32), value :: a
+
+    x(:, :) = x(:, :) * a
+
+  end subroutine array_int32_2d_C_scalar_mul
+  !........................................
+
+end module mod_9m0exfenmpar
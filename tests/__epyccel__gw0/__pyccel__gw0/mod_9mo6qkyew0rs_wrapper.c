@@ -0,0 +1,114 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9MO6QKYEW0RS_WRAPPER
+
+#include "mod_9mo6qkyew0rs_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_2d_1d_matmul_transpose_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* A_obj;
+    PyObject* x_obj;
+    PyObject* out_obj;
+    t_ndarray A = {.raw_data = NULL};
+    t_ndarray x = {.raw_data = NULL};
+    t_ndarray out = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "A",
+        "x",
+        "out",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &A_obj, &x_obj, &out_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("A", A_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        A = pyarray_to_ndarray(A_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out", out_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        out = pyarray_to_ndarray(out_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    array_float_2d_1d_matmul_transpose(A, x, out);
+    free_pointer(&A);
+    free_pointer(&x);
+    free_pointer(&out);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9mo6qkyew0rs_methods[] = {
+    {
+        "array_float_2d_1d_matmul_transpose",
+        (PyCFunction)array_float_2d_1d_matmul_transpose_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9mo6qkyew0rs_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9mo6qkyew0rs",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9mo6qkyew0rs_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9mo6qkyew0rs(void)
+{
+    PyObject* mod;
+    static void* Pymod_9mo6qkyew0rs_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9mo6qkyew0rs_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9mo6qkyew0rs_API, "mod_9mo6qkyew0rs._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
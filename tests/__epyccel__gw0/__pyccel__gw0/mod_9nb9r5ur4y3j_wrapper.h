@@ -0,0 +1,40 @@
+#ifndef MOD_9NB9R5UR4Y3J_WRAPPER_H
+#define MOD_9NB9R5UR4Y3J_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_9NB9R5UR4Y3J_WRAPPER
+
+void bind_c_set_num_threads(int64_t);
+
+#else
+
+static void** Pymod_9nb9r5ur4y3j_API;
+
+
+/*........................................*/
+static int mod_9nb9r5ur4y3j_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_9nb9r5ur4y3j_API = (void**)PyCapsule_Import("mod_9nb9r5ur4y3j._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_9nb9r5ur4y3j_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_9NB9R5UR4Y3J_WRAPPER_H
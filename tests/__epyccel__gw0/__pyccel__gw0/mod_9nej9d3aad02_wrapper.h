@@ -0,0 +1,50 @@
+#ifndef MOD_9NEJ9D3AAD02_WRAPPER_H
+#define MOD_9NEJ9D3AAD02_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_9NEJ9D3AAD02_WRAPPER
+
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float64_0000(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, double*, double*, double*, double*, double*, double*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float64_0001(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, double*, double*, double*, double*, double*, double*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float64_0002(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, double*, double*, double*, double*, double*, double*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float64_0003(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, double*, double*, double*, double*, double*, double*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float64_0004(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, double*, double*, double*, double*, double*, double*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float64_0005(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, double*, double*, double*, double*, double*, double*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float64_0006(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, double*, double*, double*, double*, double*, double*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float64_0007(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, double*, double*, double*, double*, double*, double*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float64_0008(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, double*, double*, double*, double*, double*, double*);
+
+#else
+
+static void** Pymod_9nej9d3aad02_API;
+
+
+/*........................................*/
+static int mod_9nej9d3aad02_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_9nej9d3aad02_API = (void**)PyCapsule_Import("mod_9nej9d3aad02._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_9nej9d3aad02_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_9NEJ9D3AAD02_WRAPPER_H
@@ -0,0 +1,6 @@
+
+def f():
+    a = [[1, 2, 3]]
+    a.append([4, 5, 6])
+    return len(a)
+
@@ -0,0 +1,11 @@
+#ifndef MOD_9ONQ1B84NZG9_H
+#define MOD_9ONQ1B84NZG9_H
+
+#include <math.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double f1(void);
+#endif // mod_9onq1b84nzg9_H
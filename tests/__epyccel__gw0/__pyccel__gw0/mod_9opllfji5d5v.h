@@ -0,0 +1,11 @@
+#ifndef MOD_9OPLLFJI5D5V_H
+#define MOD_9OPLLFJI5D5V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_F_slice_9(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_9opllfji5d5v_H
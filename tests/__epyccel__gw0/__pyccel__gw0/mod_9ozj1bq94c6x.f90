@@ -0,0 +1,27 @@
+module mod_9ozj1bq94c6x
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_float_2d_2d_matmul_transpose(A, B, C, out1, out2) 
+
+    implicit none
+
+    real(f64), intent(in) :: A(0_i64:, 0_i64:)
+    real(f64), intent(in) :: B(0_i64:, 0_i64:)
+    real(f64), intent(in) :: C(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: out1(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: out2(0_i64:, 0_i64:)
+
+    out1(:, :) = matmul(B,transpose(A))
+    out2(:, :) = matmul(transpose(A),transpose(C))
+
+  end subroutine array_float_2d_2d_matmul_transpose
+  !........................................
+
+end module mod_9ozj1bq94c6x
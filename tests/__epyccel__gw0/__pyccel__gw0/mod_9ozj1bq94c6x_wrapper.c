@@ -0,0 +1,147 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9OZJ1BQ94C6X_WRAPPER
+
+#include "mod_9ozj1bq94c6x_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_float_2d_2d_matmul_transpose_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* A_obj;
+    PyObject* B_obj;
+    PyObject* C_obj;
+    PyObject* out1_obj;
+    PyObject* out2_obj;
+    void* A_data = NULL;
+    int64_t A_shape[2];
+    int64_t A_strides[2];
+    void* B_data = NULL;
+    int64_t B_shape[2];
+    int64_t B_strides[2];
+    void* C_data = NULL;
+    int64_t C_shape[2];
+    int64_t C_strides[2];
+    void* out1_data = NULL;
+    int64_t out1_shape[2];
+    int64_t out1_strides[2];
+    void* out2_data = NULL;
+    int64_t out2_shape[2];
+    int64_t out2_strides[2];
+    static const char* const kwlist[] = {
+        "A",
+        "B",
+        "C",
+        "out1",
+        "out2",
+        NULL
+    };
+    static PyObject* kwlist_interned[6] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 5, 5, &A_obj, &B_obj, &C_obj, &out1_obj, &out2_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("A", A_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        A_data = PyArray_DATA((PyArrayObject*)(A_obj));
+        get_strides_and_shape_from_numpy_array(A_obj, A_shape, A_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("B", B_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        B_data = PyArray_DATA((PyArrayObject*)(B_obj));
+        get_strides_and_shape_from_numpy_array(B_obj, B_shape, B_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("C", C_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        C_data = PyArray_DATA((PyArrayObject*)(C_obj));
+        get_strides_and_shape_from_numpy_array(C_obj, C_shape, C_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out1", out1_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        out1_data = PyArray_DATA((PyArrayObject*)(out1_obj));
+        get_strides_and_shape_from_numpy_array(out1_obj, out1_shape, out1_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out2", out2_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        out2_data = PyArray_DATA((PyArrayObject*)(out2_obj));
+        get_strides_and_shape_from_numpy_array(out2_obj, out2_shape, out2_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_array_float_2d_2d_matmul_transpose(A_data, A_shape[INT64_C(0)], A_shape[INT64_C(1)], A_strides[INT64_C(0)], A_strides[INT64_C(1)], B_data, B_shape[INT64_C(0)], B_shape[INT64_C(1)], B_strides[INT64_C(0)], B_strides[INT64_C(1)], C_data, C_shape[INT64_C(0)], C_shape[INT64_C(1)], C_strides[INT64_C(0)], C_strides[INT64_C(1)], out1_data, out1_shape[INT64_C(0)], out1_shape[INT64_C(1)], out1_strides[INT64_C(0)], out1_strides[INT64_C(1)], out2_data, out2_shape[INT64_C(0)], out2_shape[INT64_C(1)], out2_strides[INT64_C(0)], out2_strides[INT64_C(1)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9ozj1bq94c6x_methods[] = {
+    {
+        "array_float_2d_2d_matmul_transpose",
+        (PyCFunction)bind_c_array_float_2d_2d_matmul_transpose_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9ozj1bq94c6x_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9ozj1bq94c6x",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9ozj1bq94c6x_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9ozj1bq94c6x(void)
+{
+    PyObject* mod;
+    static void* Pymod_9ozj1bq94c6x_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9ozj1bq94c6x_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9ozj1bq94c6x_API, "mod_9ozj1bq94c6x._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,4 @@
+
+def copy_to_slice_3(a : 'float[::,::]', b : 'float[::]'):
+    a[::,0] = b
+
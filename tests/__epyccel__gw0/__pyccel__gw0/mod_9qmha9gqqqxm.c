@@ -0,0 +1,10 @@
+#include "mod_9qmha9gqqqxm.h"
+
+
+/*........................................*/
+void p_func(int64_t x)
+{
+    x *= INT64_C(2);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_9QMHA9GQQQXM_H
+#define MOD_9QMHA9GQQQXM_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void p_func(int64_t x);
+#endif // mod_9qmha9gqqqxm_H
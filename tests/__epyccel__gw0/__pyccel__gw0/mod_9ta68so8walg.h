@@ -0,0 +1,11 @@
+#ifndef MOD_9TA68SO8WALG_H
+#define MOD_9TA68SO8WALG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_3(t_ndarray a, t_ndarray b);
+#endif // mod_9ta68so8walg_H
@@ -0,0 +1,42 @@
+#ifndef MOD_9UXEWDBU5KII_WRAPPER_H
+#define MOD_9UXEWDBU5KII_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_9UXEWDBU5KII_WRAPPER
+
+void bind_c_array_int32_1d_scalar_sub(void*, int64_t, int64_t, int32_t);
+
+#else
+
+static void** Pymod_9uxewdbu5kii_API;
+
+
+/*........................................*/
+static int mod_9uxewdbu5kii_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_9uxewdbu5kii_API = (void**)PyCapsule_Import("mod_9uxewdbu5kii._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_9uxewdbu5kii_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_9UXEWDBU5KII_WRAPPER_H
@@ -0,0 +1,8 @@
+from pyccel.decorators import template
+
+@template('T', ['int8', 'int16', 'int32', 'int64'])
+def array_int_2d_scalar_add(x : 'T[::,::]', a : 'T', d1 : 'int', d2 : 'int'):
+    for i in range(0, d1, 1):
+        for j in range(0, d2, 1):
+            x[i,j] += a
+
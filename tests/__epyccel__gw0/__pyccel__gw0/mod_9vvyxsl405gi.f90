@@ -0,0 +1,23 @@
+module mod_9vvyxsl405gi
+
+  use, intrinsic :: ISO_C_Binding, only : i16 => C_INT16_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f16(a) result(b)
+
+    implicit none
+
+    integer(i16) :: b
+    integer(i16), value :: a
+
+    b = a
+    return
+
+  end function f16
+  !........................................
+
+end module mod_9vvyxsl405gi
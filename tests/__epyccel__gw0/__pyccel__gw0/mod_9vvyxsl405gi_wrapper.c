@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9VVYXSL405GI_WRAPPER
+
+#include "mod_9vvyxsl405gi_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f16_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int16_t a;
+    int16_t b;
+    PyObject* b_obj;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Int16(a_obj))
+    {
+        a = PyInt16_to_Int16(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.int16 for argument a");
+        return NULL;
+    }
+    b = bind_c_f16(a);
+    b_obj = Int16_to_NumpyLong(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9vvyxsl405gi_methods[] = {
+    {
+        "f16",
+        (PyCFunction)bind_c_f16_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9vvyxsl405gi_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9vvyxsl405gi",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9vvyxsl405gi_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9vvyxsl405gi(void)
+{
+    PyObject* mod;
+    static void* Pymod_9vvyxsl405gi_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9vvyxsl405gi_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9vvyxsl405gi_API, "mod_9vvyxsl405gi._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,73 @@
+module mod_9w9gd6x9wxlv
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i32 => &
+        C_INT32_T , i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine test_nowait_schedule(n, Out_0001, Out_0002, Out_0003, &
+        Out_0004, Out_0005, Out_0006, Out_0007, Out_0008)
+
+    use omp_lib, only: omp_get_thread_num
+    use omp_lib, only: omp_get_num_threads
+
+    implicit none
+
+    real(f64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+    real(f64), intent(out) :: Out_0004
+    real(f64), intent(out) :: Out_0005
+    real(f64), intent(out) :: Out_0006
+    real(f64), intent(out) :: Out_0007
+    real(f64), intent(out) :: Out_0008
+    integer(i64), value :: n
+    real(f64), allocatable :: a(:)
+    real(f64) :: imin_res(0_i64:3_i64)
+    real(f64) :: imax_res(0_i64:3_i64)
+    integer(i32) :: rank
+    integer(i32) :: nb_tasks
+    integer(i64) :: i_min
+    integer(i64) :: i_max
+    integer(i64) :: schedule_size
+    integer(i64) :: i
+
+    allocate(a(0:n - 1_i64))
+    a = 0.0_f64
+    !$omp parallel private(rank, nb_tasks, i_min, i_max)
+    rank = omp_get_thread_num()
+    nb_tasks = omp_get_num_threads()
+    i_min = n
+    i_max = 0_i64
+    schedule_size = Int(Real(n, kind = f64) / Real(nb_tasks, kind = f64) &
+          , kind = i64)
+    !$omp do schedule(static, schedule_size)
+    do i = 0_i64, n - 1_i64
+      a(i) = 92290.0_f64 + i
+      i_min = minval([i_min, i])
+      i_max = maxval([i_min, i])
+    end do
+    !$omp end do nowait
+    imin_res(rank) = i_min
+    imax_res(rank) = i_max
+    !$omp end parallel
+    Out_0001 = imin_res(0_i64)
+    Out_0002 = imin_res(1_i64)
+    Out_0003 = imin_res(2_i64)
+    Out_0004 = imin_res(3_i64)
+    Out_0005 = imax_res(0_i64)
+    Out_0006 = imax_res(1_i64)
+    Out_0007 = imax_res(2_i64)
+    Out_0008 = imax_res(3_i64)
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine test_nowait_schedule
+  !........................................
+
+end module mod_9w9gd6x9wxlv
@@ -0,0 +1,122 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_9W9GD6X9WXLV_WRAPPER
+
+#include "mod_9w9gd6x9wxlv_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_test_nowait_schedule_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* n_obj;
+    int64_t n;
+    PyObject* Out_0001_obj;
+    double Out_0001;
+    PyObject* Out_0002_obj;
+    double Out_0002;
+    PyObject* Out_0003_obj;
+    double Out_0003;
+    PyObject* Out_0004_obj;
+    double Out_0004;
+    PyObject* Out_0005_obj;
+    double Out_0005;
+    PyObject* Out_0006_obj;
+    double Out_0006;
+    PyObject* Out_0007_obj;
+    double Out_0007;
+    PyObject* Out_0008_obj;
+    double Out_0008;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "n",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &n_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    bind_c_test_nowait_schedule(n, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    Out_0002_obj = Double_to_NumpyDouble(&Out_0002);
+    Out_0003_obj = Double_to_NumpyDouble(&Out_0003);
+    Out_0004_obj = Double_to_NumpyDouble(&Out_0004);
+    Out_0005_obj = Double_to_NumpyDouble(&Out_0005);
+    Out_0006_obj = Double_to_NumpyDouble(&Out_0006);
+    Out_0007_obj = Double_to_NumpyDouble(&Out_0007);
+    Out_0008_obj = Double_to_NumpyDouble(&Out_0008);
+    Out_obj = Py_BuildValue("OOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_9w9gd6x9wxlv_methods[] = {
+    {
+        "test_nowait_schedule",
+        (PyCFunction)bind_c_test_nowait_schedule_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_9w9gd6x9wxlv_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_9w9gd6x9wxlv",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_9w9gd6x9wxlv_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_9w9gd6x9wxlv(void)
+{
+    PyObject* mod;
+    static void* Pymod_9w9gd6x9wxlv_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_9w9gd6x9wxlv_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_9w9gd6x9wxlv_API, "mod_9w9gd6x9wxlv._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_9WB5EIBU1QJK_H
+#define MOD_9WB5EIBU1QJK_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_9wb5eibu1qjk_H
@@ -0,0 +1,12 @@
+#ifndef MOD_9XQ4ZZBEZE91_H
+#define MOD_9XQ4ZZBEZE91_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuples_mul_homogeneous_2d(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009, int64_t* Out_0010, int64_t* Out_0011, int64_t* Out_0012);
+#endif // mod_9xq4zzbeze91_H
@@ -0,0 +1,11 @@
+#ifndef MOD_9YDSPX2K5HY4_H
+#define MOD_9YDSPX2K5HY4_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_div(t_ndarray x, double a);
+#endif // mod_9ydspx2k5hy4_H
@@ -0,0 +1,42 @@
+#ifndef MOD_9YDSPX2K5HY4_WRAPPER_H
+#define MOD_9YDSPX2K5HY4_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_9ydspx2k5hy4.h"
+
+
+#ifdef MOD_9YDSPX2K5HY4_WRAPPER
+
+
+#else
+
+static void** Pymod_9ydspx2k5hy4_API;
+
+
+/*........................................*/
+static int mod_9ydspx2k5hy4_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_9ydspx2k5hy4_API = (void**)PyCapsule_Import("mod_9ydspx2k5hy4._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_9ydspx2k5hy4_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_9YDSPX2K5HY4_WRAPPER_H
@@ -0,0 +1,9 @@
+
+def multiple_np_linspace():
+    from numpy import linspace
+    linspace_index = 5
+    x = linspace(0, 2, num = 128, endpoint = True)
+    y = linspace(0, 4, num = 128, endpoint = True)
+    z = linspace(0, 8, num = 128, endpoint = True)
+    return x[0] + y[1] + z[2] + linspace_index
+
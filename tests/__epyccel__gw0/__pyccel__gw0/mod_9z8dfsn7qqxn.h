@@ -0,0 +1,10 @@
+#ifndef MOD_9Z8DFSN7QQXN_H
+#define MOD_9Z8DFSN7QQXN_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t f18(int32_t a);
+#endif // mod_9z8dfsn7qqxn_H
@@ -0,0 +1,31 @@
+#ifndef MOD_A29XN3OD4LBH_H
+#define MOD_A29XN3OD4LBH_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define i_type hmap_int64_t_double
+#define i_key int64_t
+#define i_val double
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+
+#ifndef _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define i_type hmap_int64_t_double
+#define i_key int64_t
+#define i_val double
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+
+
+
+
+int64_t dict_contains(bool* Out_0001, bool* Out_0002, bool* Out_0003);
+#endif // mod_a29xn3od4lbh_H
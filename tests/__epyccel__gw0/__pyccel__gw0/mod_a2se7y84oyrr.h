@@ -0,0 +1,11 @@
+#ifndef MOD_A2SE7Y84OYRR_H
+#define MOD_A2SE7Y84OYRR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f6_1(int64_t m1, int64_t m2, t_ndarray x);
+#endif // mod_a2se7y84oyrr_H
@@ -0,0 +1,20 @@
+#include "mod_a4v3y80czhuv.h"
+
+
+/*........................................*/
+void omp_matmul_single(t_ndarray A, t_ndarray x, t_ndarray out)
+{
+    #pragma omp parallel
+    {
+        #pragma omp single
+        {
+            numpy_matmul_float64(array_slicing(out, 2, new_slice(INT64_C(0), out.shape[INT64_C(0)], INT64_C(1), RANGE), new_slice(INT64_C(0), out.shape[INT64_C(1)], INT64_C(1), RANGE)), A, x);
+        }
+    }
+    /*to let the function compile using epyccel issue #468*/
+    /*____CommentBlock____*/
+    /*bypass issue #468    */
+    /*_____________________*/
+}
+/*........................................*/
+
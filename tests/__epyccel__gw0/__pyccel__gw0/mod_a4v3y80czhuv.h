@@ -0,0 +1,11 @@
+#ifndef MOD_A4V3Y80CZHUV_H
+#define MOD_A4V3Y80CZHUV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul_single(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_a4v3y80czhuv_H
@@ -0,0 +1,12 @@
+from numpy import shape, float64
+
+def f1(x : 'int[::,::]'):
+    from numpy import shape, empty, transpose
+    n = shape(x)[0]
+    m = shape(x)[1]
+    y = empty((m, n), dtype = float64, order='C')
+    y[::,::] = transpose(x)
+    n = shape(y)[0]
+    m = shape(y)[1]
+    return n,m,y[-1,0],y[0,-1]
+
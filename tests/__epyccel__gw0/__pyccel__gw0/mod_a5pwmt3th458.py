@@ -0,0 +1,11 @@
+
+def tuples_add_mixed_homogeneous_with_variables():
+    a = (1, 2, 3)
+    c_0 = a[0]
+    c_1 = a[1]
+    c_2 = a[2]
+    c_3 = 4
+    c_4 = False
+    c_5 = 6
+    return c_0,c_1,c_2,c_3,c_4,c_5
+
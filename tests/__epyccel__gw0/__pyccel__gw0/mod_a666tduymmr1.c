@@ -0,0 +1,30 @@
+#include "mod_a666tduymmr1.h"
+
+
+/*........................................*/
+void fill(int64_t seed, t_ndarray a, t_ndarray b, t_ndarray c)
+{
+    t_philox rng;
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    int64_t i_0003;
+    rng = pyc_philox_init(seed, INT64_C(1));
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            GET_ELEMENT(a, nd_double, i, i_0001) = pyc_philox_random(&rng);
+        }
+    }
+    for (i_0002 = INT64_C(0); i_0002 < b.shape[INT64_C(0)]; i_0002 += INT64_C(1))
+    {
+        GET_ELEMENT(b, nd_int32, i_0002) = pyc_philox_integers(&rng, -INT64_C(100), INT64_C(100));
+    }
+    for (i_0003 = INT64_C(0); i_0003 < c.shape[INT64_C(0)]; i_0003 += INT64_C(1))
+    {
+        GET_ELEMENT(c, nd_double, i_0003) = pyc_philox_normal(&rng, 2.0, 3.0);
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_A666TDUYMMR1_H
+#define MOD_A666TDUYMMR1_H
+
+#include "ndarrays.h"
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void fill(int64_t seed, t_ndarray a, t_ndarray b, t_ndarray c);
+#endif // mod_a666tduymmr1_H
@@ -0,0 +1,126 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_A666TDUYMMR1_WRAPPER
+
+#include "mod_a666tduymmr1_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* fill_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* seed_obj;
+    PyObject* a_obj;
+    PyObject* b_obj;
+    PyObject* c_obj;
+    int64_t seed;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    t_ndarray c = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "seed",
+        "a",
+        "b",
+        "c",
+        NULL
+    };
+    static PyObject* kwlist_interned[5] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 4, 4, &seed_obj, &a_obj, &b_obj, &c_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(seed_obj))
+    {
+        seed = PyInt64_to_Int64(seed_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument seed");
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("b", b_obj, NPY_INT32, INT64_C(1), NO_ORDER_CHECK))
+    {
+        b = pyarray_to_ndarray(b_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("c", c_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        c = pyarray_to_ndarray(c_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    fill(seed, a, b, c);
+    free_pointer(&a);
+    free_pointer(&b);
+    free_pointer(&c);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_a666tduymmr1_methods[] = {
+    {
+        "fill",
+        (PyCFunction)fill_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_a666tduymmr1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_a666tduymmr1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_a666tduymmr1_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_a666tduymmr1(void)
+{
+    PyObject* mod;
+    static void* Pymod_a666tduymmr1_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_a666tduymmr1_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_a666tduymmr1_API, "mod_a666tduymmr1._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
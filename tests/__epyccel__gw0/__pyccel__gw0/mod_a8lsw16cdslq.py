@@ -0,0 +1,7 @@
+from numpy import int32
+
+def array_int32_in_bool_out_2d_C_complex_3d_expr(x : 'int32[::,::]', y : 'int32[::,::]', ri : 'bool[::,::]'):
+    from numpy import full, int32
+    z = full((2, 3), int32(5), dtype = int32, order='C')
+    ri[::,::] = x//y * x > z
+
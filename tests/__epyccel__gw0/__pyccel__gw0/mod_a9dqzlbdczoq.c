@@ -0,0 +1,12 @@
+#include "mod_a9dqzlbdczoq.h"
+
+
+/*........................................*/
+vec_int64_t list_return(void)
+{
+    vec_int64_t a = {0};
+    a = c_init(vec_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5)});
+    return a;
+}
+/*........................................*/
+
@@ -0,0 +1,30 @@
+#ifndef MOD_A9DQZLBDCZOQ_H
+#define MOD_A9DQZLBDCZOQ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_INT64_T
+#define _TOOLS_LIST_VEC_INT64_T
+#define i_type vec_int64_t
+#define i_key int64_t
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_INT64_T
+
+#ifndef _TOOLS_LIST_VEC_INT64_T
+#define _TOOLS_LIST_VEC_INT64_T
+#define i_type vec_int64_t
+#define i_key int64_t
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_INT64_T
+
+
+
+
+vec_int64_t list_return(void);
+#endif // mod_a9dqzlbdczoq_H
@@ -0,0 +1,11 @@
+#ifndef MOD_AA30RPF1OD9V_H
+#define MOD_AA30RPF1OD9V_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_aa30rpf1od9v_H
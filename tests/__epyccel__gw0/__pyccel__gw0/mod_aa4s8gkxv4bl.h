@@ -0,0 +1,11 @@
+#ifndef MOD_AA4S8GKXV4BL_H
+#define MOD_AA4S8GKXV4BL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_aa4s8gkxv4bl_H
@@ -0,0 +1,42 @@
+#ifndef MOD_AA4S8GKXV4BL_WRAPPER_H
+#define MOD_AA4S8GKXV4BL_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_aa4s8gkxv4bl.h"
+
+
+#ifdef MOD_AA4S8GKXV4BL_WRAPPER
+
+
+#else
+
+static void** Pymod_aa4s8gkxv4bl_API;
+
+
+/*........................................*/
+static int mod_aa4s8gkxv4bl_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_aa4s8gkxv4bl_API = (void**)PyCapsule_Import("mod_aa4s8gkxv4bl._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_aa4s8gkxv4bl_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_AA4S8GKXV4BL_WRAPPER_H
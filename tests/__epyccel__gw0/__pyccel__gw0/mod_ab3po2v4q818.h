@@ -0,0 +1,11 @@
+#ifndef MOD_AB3PO2V4Q818_H
+#define MOD_AB3PO2V4Q818_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_div(t_ndarray x, t_ndarray y);
+#endif // mod_ab3po2v4q818_H
@@ -0,0 +1,11 @@
+#ifndef MOD_ABIKQ2ZZR19C_H
+#define MOD_ABIKQ2ZZR19C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_homogeneous_have_pointers(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004);
+#endif // mod_abikq2zzr19c_H
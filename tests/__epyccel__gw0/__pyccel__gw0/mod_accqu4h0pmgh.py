@@ -0,0 +1,4 @@
+
+def dict_read_arg(a : 'dict[int,int]', k : 'int'):
+    return a.get(k, 0)
+
@@ -0,0 +1,6 @@
+
+def pop_item():
+    a = {1: 1.0, 2: 2.0}
+    (b_0, b_1) = a.popitem()
+    return b_0,b_1
+
@@ -0,0 +1,29 @@
+module mod_ae8uedv59yjn
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function omp_arraysum_combined(x) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    integer(i64), intent(in) :: x(0_i64:)
+    integer(i64) :: i
+
+    func_result = 0_i64
+    !$omp parallel do reduction(+: func_result)
+    do i = 0_i64, 4_i64
+      func_result = func_result + x(i)
+    end do
+    !$omp end parallel do
+    return
+
+  end function omp_arraysum_combined
+  !........................................
+
+end module mod_ae8uedv59yjn
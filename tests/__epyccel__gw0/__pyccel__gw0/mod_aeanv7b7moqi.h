@@ -0,0 +1,11 @@
+#ifndef MOD_AEANV7B7MOQI_H
+#define MOD_AEANV7B7MOQI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_1d_add(t_ndarray x, t_ndarray y);
+#endif // mod_aeanv7b7moqi_H
@@ -0,0 +1,7 @@
+
+def non_negative(i : 'int'):
+    if i < 0:
+        return False
+    else:
+        return True
+
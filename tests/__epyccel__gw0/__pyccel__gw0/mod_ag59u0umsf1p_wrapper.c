@@ -0,0 +1,474 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_AG59U0UMSF1P_WRAPPER
+
+#include "mod_ag59u0umsf1p_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* dtype_convert_to_int16_0000_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int16_t Out_0002;
+    PyObject* Out_0003_obj;
+    int16_t Out_0003;
+    PyObject* Out_0004_obj;
+    int16_t Out_0004;
+    PyObject* Out_0005_obj;
+    int16_t Out_0005;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    dtype_convert_to_int16_0000(arr, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    free_pointer(&arr);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int16_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int16_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int16_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int16_to_NumpyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* dtype_convert_to_int16_0001_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int16_t Out_0002;
+    PyObject* Out_0003_obj;
+    int16_t Out_0003;
+    PyObject* Out_0004_obj;
+    int16_t Out_0004;
+    PyObject* Out_0005_obj;
+    int16_t Out_0005;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    dtype_convert_to_int16_0001(arr, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    free_pointer(&arr);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int16_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int16_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int16_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int16_to_NumpyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* dtype_convert_to_int16_0002_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int16_t Out_0002;
+    PyObject* Out_0003_obj;
+    int16_t Out_0003;
+    PyObject* Out_0004_obj;
+    int16_t Out_0004;
+    PyObject* Out_0005_obj;
+    int16_t Out_0005;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    dtype_convert_to_int16_0002(arr, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    free_pointer(&arr);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int16_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int16_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int16_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int16_to_NumpyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* dtype_convert_to_int16_0003_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int16_t Out_0002;
+    PyObject* Out_0003_obj;
+    int16_t Out_0003;
+    PyObject* Out_0004_obj;
+    int16_t Out_0004;
+    PyObject* Out_0005_obj;
+    int16_t Out_0005;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    dtype_convert_to_int16_0003(arr, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    free_pointer(&arr);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int16_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int16_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int16_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int16_to_NumpyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* dtype_convert_to_int16_0004_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int16_t Out_0002;
+    PyObject* Out_0003_obj;
+    int16_t Out_0003;
+    PyObject* Out_0004_obj;
+    int16_t Out_0004;
+    PyObject* Out_0005_obj;
+    int16_t Out_0005;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    dtype_convert_to_int16_0004(arr, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    free_pointer(&arr);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int16_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int16_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int16_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int16_to_NumpyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* dtype_convert_to_int16_0005_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int16_t Out_0002;
+    PyObject* Out_0003_obj;
+    int16_t Out_0003;
+    PyObject* Out_0004_obj;
+    int16_t Out_0004;
+    PyObject* Out_0005_obj;
+    int16_t Out_0005;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    dtype_convert_to_int16_0005(arr, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    free_pointer(&arr);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int16_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int16_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int16_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int16_to_NumpyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* dtype_convert_to_int16_0006_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int16_t Out_0002;
+    PyObject* Out_0003_obj;
+    int16_t Out_0003;
+    PyObject* Out_0004_obj;
+    int16_t Out_0004;
+    PyObject* Out_0005_obj;
+    int16_t Out_0005;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    dtype_convert_to_int16_0006(arr, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    free_pointer(&arr);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int16_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int16_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int16_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int16_to_NumpyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* dtype_convert_to_int16_0007_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int16_t Out_0002;
+    PyObject* Out_0003_obj;
+    int16_t Out_0003;
+    PyObject* Out_0004_obj;
+    int16_t Out_0004;
+    PyObject* Out_0005_obj;
+    int16_t Out_0005;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    dtype_convert_to_int16_0007(arr, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    free_pointer(&arr);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int16_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int16_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int16_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int16_to_NumpyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* dtype_convert_to_int16_0008_wrapper(PyObject* arr_obj)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int16_t Out_0002;
+    PyObject* Out_0003_obj;
+    int16_t Out_0003;
+    PyObject* Out_0004_obj;
+    int16_t Out_0004;
+    PyObject* Out_0005_obj;
+    int16_t Out_0005;
+    PyObject* Out_obj;
+    arr = pyarray_to_ndarray(arr_obj);
+    dtype_convert_to_int16_0008(arr, &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005);
+    free_pointer(&arr);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int16_to_NumpyLong(&Out_0002);
+    Out_0003_obj = Int16_to_NumpyLong(&Out_0003);
+    Out_0004_obj = Int16_to_NumpyLong(&Out_0004);
+    Out_0005_obj = Int16_to_NumpyLong(&Out_0005);
+    Out_obj = Py_BuildValue("OOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t dtype_convert_to_int16_type_check(PyObject* arr_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(arr_obj, NPY_BOOL, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(arr_obj, NPY_BYTE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (is_numpy_array(arr_obj, NPY_SHORT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (is_numpy_array(arr_obj, NPY_INT32, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (is_numpy_array(arr_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (is_numpy_array(arr_obj, NPY_FLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (is_numpy_array(arr_obj, NPY_CFLOAT, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (is_numpy_array(arr_obj, NPY_CDOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* dtype_convert_to_int16_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* arr_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "arr",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &arr_obj))
+    {
+        return NULL;
+    }
+    type_indicator = dtype_convert_to_int16_type_check(arr_obj);
+    switch (type_indicator)
+    {
+        case INT64_C(0):
+        {
+            return dtype_convert_to_int16_0000_wrapper(arr_obj);
+        }
+        case INT64_C(1):
+        {
+            return dtype_convert_to_int16_0001_wrapper(arr_obj);
+        }
+        case INT64_C(2):
+        {
+            return dtype_convert_to_int16_0002_wrapper(arr_obj);
+        }
+        case INT64_C(3):
+        {
+            return dtype_convert_to_int16_0003_wrapper(arr_obj);
+        }
+        case INT64_C(4):
+        {
+            return dtype_convert_to_int16_0004_wrapper(arr_obj);
+        }
+        case INT64_C(5):
+        {
+            return dtype_convert_to_int16_0005_wrapper(arr_obj);
+        }
+        case INT64_C(6):
+        {
+            return dtype_convert_to_int16_0006_wrapper(arr_obj);
+        }
+        case INT64_C(7):
+        {
+            return dtype_convert_to_int16_0007_wrapper(arr_obj);
+        }
+        case INT64_C(8):
+        {
+            return dtype_convert_to_int16_0008_wrapper(arr_obj);
+        }
+        default:
+        {
+            PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+            return NULL;
+        }
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ag59u0umsf1p_methods[] = {
+    {
+        "dtype_convert_to_int16",
+        (PyCFunction)dtype_convert_to_int16_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ag59u0umsf1p_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ag59u0umsf1p",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ag59u0umsf1p_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ag59u0umsf1p(void)
+{
+    PyObject* mod;
+    static void* Pymod_ag59u0umsf1p_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ag59u0umsf1p_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ag59u0umsf1p_API, "mod_ag59u0umsf1p._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,42 @@
+#ifndef MOD_AG59U0UMSF1P_WRAPPER_H
+#define MOD_AG59U0UMSF1P_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_ag59u0umsf1p.h"
+
+
+#ifdef MOD_AG59U0UMSF1P_WRAPPER
+
+
+#else
+
+static void** Pymod_ag59u0umsf1p_API;
+
+
+/*........................................*/
+static int mod_ag59u0umsf1p_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ag59u0umsf1p_API = (void**)PyCapsule_Import("mod_ag59u0umsf1p._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ag59u0umsf1p_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_AG59U0UMSF1P_WRAPPER_H
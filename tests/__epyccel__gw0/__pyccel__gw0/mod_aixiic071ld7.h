@@ -0,0 +1,11 @@
+#ifndef MOD_AIXIIC071LD7_H
+#define MOD_AIXIIC071LD7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_loopdiff(t_ndarray x, t_ndarray y, t_ndarray out);
+#endif // mod_aixiic071ld7_H
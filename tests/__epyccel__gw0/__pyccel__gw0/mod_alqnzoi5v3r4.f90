@@ -0,0 +1,22 @@
+module mod_alqnzoi5v3r4
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function p_lose() result(lose)
+
+    implicit none
+
+    integer(i64) :: lose
+
+    lose = -10_i64
+    return
+
+  end function p_lose
+  !........................................
+
+end module mod_alqnzoi5v3r4
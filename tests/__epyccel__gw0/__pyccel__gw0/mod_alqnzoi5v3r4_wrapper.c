@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_ALQNZOI5V3R4_WRAPPER
+
+#include "mod_alqnzoi5v3r4_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_p_lose_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int64_t lose;
+    PyObject* lose_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    lose = bind_c_p_lose();
+    lose_obj = Int64_to_PyLong(&lose);
+    return lose_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_alqnzoi5v3r4_methods[] = {
+    {
+        "p_lose",
+        (PyCFunction)bind_c_p_lose_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_alqnzoi5v3r4_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_alqnzoi5v3r4",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_alqnzoi5v3r4_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_alqnzoi5v3r4(void)
+{
+    PyObject* mod;
+    static void* Pymod_alqnzoi5v3r4_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_alqnzoi5v3r4_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_alqnzoi5v3r4_API, "mod_alqnzoi5v3r4._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
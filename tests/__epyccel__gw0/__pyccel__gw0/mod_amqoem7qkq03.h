@@ -0,0 +1,21 @@
+#ifndef MOD_AMQOEM7QKQ03_H
+#define MOD_AMQOEM7QKQ03_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#include "stc/cstr.h"
+#ifndef _TOOLS_DICT_HMAP_CSTR_INT64_T
+#define _TOOLS_DICT_HMAP_CSTR_INT64_T
+#define i_type hmap_cstr_int64_t
+#define i_keypro cstr
+#define i_val int64_t
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_CSTR_INT64_T
+
+
+
+
+int64_t get_default_str_keys(void);
+#endif // mod_amqoem7qkq03_H
@@ -0,0 +1,11 @@
+#ifndef MOD_AN4RHORV4XC9_H
+#define MOD_AN4RHORV4XC9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_1d_matmul_order_F(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_an4rhorv4xc9_H
@@ -0,0 +1,42 @@
+#ifndef MOD_APF0QBGY5IKZ_WRAPPER_H
+#define MOD_APF0QBGY5IKZ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_apf0qbgy5ikz.h"
+
+
+#ifdef MOD_APF0QBGY5IKZ_WRAPPER
+
+
+#else
+
+static void** Pymod_apf0qbgy5ikz_API;
+
+
+/*........................................*/
+static int mod_apf0qbgy5ikz_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_apf0qbgy5ikz_API = (void**)PyCapsule_Import("mod_apf0qbgy5ikz._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_apf0qbgy5ikz_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_APF0QBGY5IKZ_WRAPPER_H
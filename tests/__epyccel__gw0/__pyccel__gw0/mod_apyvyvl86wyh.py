@@ -0,0 +1,8 @@
+
+def f():
+    a = [1, 2, 3]
+    a.insert(4, 4)
+    a.insert(2, 5)
+    a.insert(1, 6)
+    return a
+
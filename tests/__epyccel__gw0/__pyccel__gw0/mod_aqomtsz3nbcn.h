@@ -0,0 +1,11 @@
+#ifndef MOD_AQOMTSZ3NBCN_H
+#define MOD_AQOMTSZ3NBCN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void parallel_array_expressions(t_ndarray c, t_ndarray a, t_ndarray b, double d);
+#endif // mod_aqomtsz3nbcn_H
@@ -0,0 +1,126 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_AQOMTSZ3NBCN_WRAPPER
+
+#include "mod_aqomtsz3nbcn_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* parallel_array_expressions_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* c_obj;
+    PyObject* a_obj;
+    PyObject* b_obj;
+    PyObject* d_obj;
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    double d;
+    static const char* const kwlist[] = {
+        "c",
+        "a",
+        "b",
+        "d",
+        NULL
+    };
+    static PyObject* kwlist_interned[5] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 4, 4, &c_obj, &a_obj, &b_obj, &d_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("c", c_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        c = pyarray_to_ndarray(c_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("b", b_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        b = pyarray_to_ndarray(b_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(d_obj))
+    {
+        d = PyDouble_to_Double(d_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument d");
+        return NULL;
+    }
+    parallel_array_expressions(c, a, b, d);
+    free_pointer(&c);
+    free_pointer(&a);
+    free_pointer(&b);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_aqomtsz3nbcn_methods[] = {
+    {
+        "parallel_array_expressions",
+        (PyCFunction)parallel_array_expressions_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_aqomtsz3nbcn_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_aqomtsz3nbcn",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_aqomtsz3nbcn_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_aqomtsz3nbcn(void)
+{
+    PyObject* mod;
+    static void* Pymod_aqomtsz3nbcn_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_aqomtsz3nbcn_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_aqomtsz3nbcn_API, "mod_aqomtsz3nbcn._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,6 @@
+
+def array_float_2d_2d_matmul_transpose(A : 'float[::,::]', B : 'float[::,::]', C : 'float[::,::]', out1 : 'float[::,::]', out2 : 'float[::,::]'):
+    from numpy import matmul, transpose
+    out1[::,::] = matmul(transpose(A), B)
+    out2[::,::] = matmul(transpose(C), transpose(A))
+
@@ -0,0 +1,20 @@
+#include "mod_aultvo4zze0j.h"
+
+
+/*........................................*/
+int64_t constant_negative_index(int64_t n, int64_t* Out_0001, int64_t* Out_0002)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    a = array_create(1, (int64_t[]){n}, nd_int64, false, order_c);
+    for (i = INT64_C(0); i < n; i += INT64_C(1))
+    {
+        GET_ELEMENT(a, nd_int64, i) = i;
+    }
+    (*Out_0001) = GET_ELEMENT(a, nd_int64, a.shape[INT64_C(0)] - INT64_C(1));
+    (*Out_0002) = GET_ELEMENT(a, nd_int64, a.shape[INT64_C(0)] - INT64_C(2));
+    free_array(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_AXSY5IXOEGLD_H
+#define MOD_AXSY5IXOEGLD_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t for_loop2(void);
+#endif // mod_axsy5ixoegld_H
@@ -0,0 +1,6 @@
+
+def tuple_homogeneous_float():
+    a = (1.5, 4.3, 5.2, 7.2, 9.999)
+    i = 1
+    return a[0],a[i],a[2],a[3],a[4],5
+
@@ -0,0 +1,10 @@
+from numpy import float64
+
+def f():
+    from numpy import float64, ones
+    a = [float64(1.0), float64(2.0), float64(3.0)]
+    b = ones((3), dtype = float64)
+    for index in b:
+        a.append(index)
+    return a
+
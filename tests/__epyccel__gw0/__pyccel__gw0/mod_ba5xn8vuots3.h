@@ -0,0 +1,12 @@
+#ifndef MOD_BA5XN8VUOTS3_H
+#define MOD_BA5XN8VUOTS3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t arrs_2d_different_shapes_0(int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_ba5xn8vuots3_H
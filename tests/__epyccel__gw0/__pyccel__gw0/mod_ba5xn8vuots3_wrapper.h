@@ -0,0 +1,40 @@
+#ifndef MOD_BA5XN8VUOTS3_WRAPPER_H
+#define MOD_BA5XN8VUOTS3_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ba5xn8vuots3.h"
+
+
+#ifdef MOD_BA5XN8VUOTS3_WRAPPER
+
+
+#else
+
+static void** Pymod_ba5xn8vuots3_API;
+
+
+/*........................................*/
+static int mod_ba5xn8vuots3_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ba5xn8vuots3_API = (void**)PyCapsule_Import("mod_ba5xn8vuots3._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ba5xn8vuots3_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BA5XN8VUOTS3_WRAPPER_H
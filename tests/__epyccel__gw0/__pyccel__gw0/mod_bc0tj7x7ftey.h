@@ -0,0 +1,11 @@
+#ifndef MOD_BC0TJ7X7FTEY_H
+#define MOD_BC0TJ7X7FTEY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_9(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_bc0tj7x7ftey_H
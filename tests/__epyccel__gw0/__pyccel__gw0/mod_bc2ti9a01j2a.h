@@ -0,0 +1,11 @@
+#ifndef MOD_BC2TI9A01J2A_H
+#define MOD_BC2TI9A01J2A_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_C_slice_5(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_bc2ti9a01j2a_H
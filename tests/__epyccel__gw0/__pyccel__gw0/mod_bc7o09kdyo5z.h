@@ -0,0 +1,11 @@
+#ifndef MOD_BC7O09KDYO5Z_H
+#define MOD_BC7O09KDYO5Z_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_inhomogeneous_have_pointers(double* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004, double* Out_0005);
+#endif // mod_bc7o09kdyo5z_H
@@ -0,0 +1,6 @@
+
+def array_float_2d_2d_matmul_expression(A : 'float[::,::]', B : 'float[::,::]', C : 'float[::,::]', out : 'float[::,::]'):
+    from numpy import matmul, transpose
+    out[::,::] = 2.0 * matmul(transpose(A), B) + C
+    out[::,::] += matmul(matmul(transpose(A), B), C + 1.0)
+
@@ -0,0 +1,11 @@
+#ifndef MOD_BDGOGGZRS3M8_H
+#define MOD_BDGOGGZRS3M8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f6_1(int64_t m1, int64_t m2, t_ndarray x);
+#endif // mod_bdgoggzrs3m8_H
@@ -0,0 +1,12 @@
+#include "mod_bdt4t0v433i9.h"
+
+
+/*........................................*/
+float complex f21(float complex a)
+{
+    float complex b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_BDT4T0V433I9_H
+#define MOD_BDT4T0V433I9_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+float complex f21(float complex a);
+#endif // mod_bdt4t0v433i9_H
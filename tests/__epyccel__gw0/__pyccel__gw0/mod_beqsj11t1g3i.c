@@ -0,0 +1,15 @@
+#include "mod_beqsj11t1g3i.h"
+
+
+/*........................................*/
+int64_t pop_last_element(void)
+{
+    vec_int64_t a = {0};
+    int64_t Out_0001;
+    a = c_init(vec_int64_t, {INT64_C(1), INT64_C(3), INT64_C(45)});
+    Out_0001 = vec_int64_t_pull(&a) + INT64_C(3);
+    vec_int64_t_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,8 @@
+
+def f():
+    a = [1, 2, 3]
+    a.append(4)
+    a.append(5)
+    a.append(6)
+    return a
+
@@ -0,0 +1,11 @@
+#ifndef MOD_BI2UTIJEL23T_H
+#define MOD_BI2UTIJEL23T_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(double c);
+#endif // mod_bi2utijel23t_H
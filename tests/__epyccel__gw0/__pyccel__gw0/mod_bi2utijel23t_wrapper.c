@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_BI2UTIJEL23T_WRAPPER
+
+#include "mod_bi2utijel23t_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* c_obj;
+    double c;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "c",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &c_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeFloat(c_obj))
+    {
+        c = PyDouble_to_Double(c_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument c");
+        return NULL;
+    }
+    Out_0001 = f(c);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_bi2utijel23t_methods[] = {
+    {
+        "f",
+        (PyCFunction)f_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_bi2utijel23t_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_bi2utijel23t",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_bi2utijel23t_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_bi2utijel23t(void)
+{
+    PyObject* mod;
+    static void* Pymod_bi2utijel23t_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_bi2utijel23t_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_bi2utijel23t_API, "mod_bi2utijel23t._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
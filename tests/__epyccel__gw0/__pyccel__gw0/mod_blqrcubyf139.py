@@ -0,0 +1,5 @@
+
+def copy_from_arg1(a : 'list[float]'):
+    b = set(a)
+    return b
+
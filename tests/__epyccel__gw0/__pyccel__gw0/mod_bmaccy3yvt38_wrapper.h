@@ -0,0 +1,42 @@
+#ifndef MOD_BMACCY3YVT38_WRAPPER_H
+#define MOD_BMACCY3YVT38_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_bmaccy3yvt38.h"
+
+
+#ifdef MOD_BMACCY3YVT38_WRAPPER
+
+
+#else
+
+static void** Pymod_bmaccy3yvt38_API;
+
+
+/*........................................*/
+static int mod_bmaccy3yvt38_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_bmaccy3yvt38_API = (void**)PyCapsule_Import("mod_bmaccy3yvt38._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_bmaccy3yvt38_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BMACCY3YVT38_WRAPPER_H
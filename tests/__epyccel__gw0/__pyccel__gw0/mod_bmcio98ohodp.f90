@@ -0,0 +1,33 @@
+module mod_bmcio98ohodp
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine Pop_int(el1, el2, el3) 
+
+    implicit none
+
+    integer(i64), intent(out) :: el1
+    integer(i64), intent(out) :: el2
+    integer(i64), intent(out) :: el3
+    type(Set_integer8) :: se
+
+    se = Set_integer8([2_i64, 4_i64, 9_i64])
+    el1 = Set_integer8_pop(se)
+
+    el2 = Set_integer8_pop(se)
+
+    el3 = Set_integer8_pop(se)
+
+    return
+
+  end subroutine Pop_int
+  !........................................
+
+end module mod_bmcio98ohodp
@@ -0,0 +1,50 @@
+#ifndef MOD_BNWDUZ8NTA0B_WRAPPER_H
+#define MOD_BNWDUZ8NTA0B_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_BNWDUZ8NTA0B_WRAPPER
+
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float32_orderf_0000(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, float*, float*, float*, float*, float*, float*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float32_orderf_0001(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, float*, float*, float*, float*, float*, float*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float32_orderf_0002(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, float*, float*, float*, float*, float*, float*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float32_orderf_0003(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, float*, float*, float*, float*, float*, float*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float32_orderf_0004(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, float*, float*, float*, float*, float*, float*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float32_orderf_0005(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, float*, float*, float*, float*, float*, float*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float32_orderf_0006(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, float*, float*, float*, float*, float*, float*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float32_orderf_0007(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, float*, float*, float*, float*, float*, float*);
+int64_t bind_c_src_dest_diff_sizes_dtype_convert_to_float32_orderf_0008(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, float*, float*, float*, float*, float*, float*);
+
+#else
+
+static void** Pymod_bnwduz8nta0b_API;
+
+
+/*........................................*/
+static int mod_bnwduz8nta0b_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_bnwduz8nta0b_API = (void**)PyCapsule_Import("mod_bnwduz8nta0b._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_bnwduz8nta0b_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BNWDUZ8NTA0B_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_BO872CB068HX_H
+#define MOD_BO872CB068HX_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f7(int64_t m1, int64_t m2, t_ndarray x);
+#endif // mod_bo872cb068hx_H
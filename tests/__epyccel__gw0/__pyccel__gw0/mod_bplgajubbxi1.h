@@ -0,0 +1,19 @@
+#ifndef MOD_BPLGAJUBBXI1_H
+#define MOD_BPLGAJUBBXI1_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_INT64_T
+#define _TOOLS_SET_HSET_INT64_T
+#define i_type hset_int64_t
+#define i_key int64_t
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_INT64_T
+
+
+
+
+void set_arg(hset_int64_t* arg, int64_t n);
+#endif // mod_bplgajubbxi1_H
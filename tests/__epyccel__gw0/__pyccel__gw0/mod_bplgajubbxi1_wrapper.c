@@ -0,0 +1,158 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_BPLGAJUBBXI1_WRAPPER
+
+#include "mod_bplgajubbxi1_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#ifndef _TOOLS_SET_HSET_INT64_T
+#define _TOOLS_SET_HSET_INT64_T
+#define i_type hset_int64_t
+#define i_key int64_t
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_INT64_T
+
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* set_arg_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* arg_obj;
+    PyObject* n_obj;
+    int64_t arg_size_0001;
+    hset_int64_t arg = {0};
+    int Dummy_0000;
+    int64_t Dummy_0001;
+    PyObject* Dummy_0002;
+    PyObject* iter;
+    PyObject* tmp_obj;
+    int64_t tmp;
+    bool is_homog_set;
+    int64_t size;
+    int Dummy_0003;
+    PyObject* Dummy_0004;
+    PyObject* iter_0001;
+    int64_t n;
+    static const char* const kwlist[] = {
+        "arg",
+        "n",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &arg_obj, &n_obj))
+    {
+        return NULL;
+    }
+    if (PySet_Check(arg_obj))
+    {
+        size = PySet_Size(arg_obj);
+        iter_0001 = PyObject_GetIter(arg_obj);
+        is_homog_set = 1;
+        for (Dummy_0003 = INT64_C(0); Dummy_0003 < size; Dummy_0003 += INT64_C(1))
+        {
+            Dummy_0004 = PyIter_Next(iter_0001);
+            is_homog_set = is_homog_set && PyIs_NativeInt(Dummy_0004);
+        }
+    }
+    else
+    {
+        is_homog_set = 0;
+    }
+    if (is_homog_set)
+    {
+        arg = c_init(hset_int64_t, {});
+        arg_size_0001 = PySet_Size(arg_obj);
+        iter = PyObject_GetIter(arg_obj);
+        for (Dummy_0000 = INT64_C(0); Dummy_0000 < arg_size_0001; Dummy_0000 += INT64_C(1))
+        {
+            Dummy_0002 = PyIter_Next(iter);
+            Dummy_0001 = PyInt64_to_Int64(Dummy_0002);
+            hset_int64_t_push(&arg, Dummy_0001);
+        }
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type set[int] for argument arg");
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    set_arg(&arg, n);
+    if (PySet_Clear(arg_obj) == -INT64_C(1))
+    {
+        return NULL;
+    }
+    c_foreach (Dummy_0000, hset_int64_t, arg){
+        tmp = (*Dummy_0000.ref);
+        tmp_obj = Int64_to_PyLong(&tmp);
+        if (PySet_Add(arg_obj, tmp_obj) == -INT64_C(1))
+        {
+            return NULL;
+        }
+    }
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_bplgajubbxi1_methods[] = {
+    {
+        "set_arg",
+        (PyCFunction)set_arg_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_bplgajubbxi1_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_bplgajubbxi1",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_bplgajubbxi1_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_bplgajubbxi1(void)
+{
+    PyObject* mod;
+    static void* Pymod_bplgajubbxi1_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_bplgajubbxi1_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_bplgajubbxi1_API, "mod_bplgajubbxi1._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
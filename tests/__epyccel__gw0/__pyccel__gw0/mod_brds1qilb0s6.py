@@ -0,0 +1,8 @@
+
+def f():
+    a = [1, 2, 3]
+    b = [4, 5, 6]
+    for index in b:
+        a.append(index)
+    return a
+
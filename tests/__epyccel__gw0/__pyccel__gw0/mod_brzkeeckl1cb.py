@@ -0,0 +1,12 @@
+from numpy import float64
+
+def tuples_as_indexing_basic():
+    from numpy import ones
+    x = ones((2, 3, 2), dtype = float64, order='C')
+    for z in range(0, 2, 1):
+        for y in range(0, 3, 1):
+            for w in range(0, 2, 1):
+                x[z,y,w] = w + y * 2 + z * 6
+    idx = (1, 1, 0)
+    return x[idx[0],idx[1],idx[2]]
+
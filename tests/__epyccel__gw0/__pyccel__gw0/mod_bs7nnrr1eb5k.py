@@ -0,0 +1,8 @@
+
+def tuple_indexing_basic():
+    ai = (1, 2, 3, 4)
+    z = 0
+    for i in range(0, 4, 1):
+        z += ai[i]
+    return z
+
@@ -0,0 +1,31 @@
+#include "mod_bsguqfb9luv5.h"
+
+
+/*........................................*/
+int64_t update_multiple(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009, int64_t* Out_0010, int64_t* Out_0011)
+{
+    hset_int64_t a = {0};
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3)});
+    hset_int64_t_push(&a, INT64_C(4));
+    hset_int64_t_push(&a, INT64_C(5));
+    hset_int64_t_push(&a, INT64_C(6));
+    hset_int64_t_push(&a, INT64_C(7));
+    hset_int64_t_push(&a, INT64_C(8));
+    hset_int64_t_push(&a, INT64_C(9));
+    hset_int64_t_push(&a, INT64_C(10));
+    (*Out_0001) = hset_int64_t_size(&a);
+    (*Out_0002) = hset_int64_t_pop(&a);
+    (*Out_0003) = hset_int64_t_pop(&a);
+    (*Out_0004) = hset_int64_t_pop(&a);
+    (*Out_0005) = hset_int64_t_pop(&a);
+    (*Out_0006) = hset_int64_t_pop(&a);
+    (*Out_0007) = hset_int64_t_pop(&a);
+    (*Out_0008) = hset_int64_t_pop(&a);
+    (*Out_0009) = hset_int64_t_pop(&a);
+    (*Out_0010) = hset_int64_t_pop(&a);
+    (*Out_0011) = hset_int64_t_pop(&a);
+    hset_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#include "mod_btkzpemsb2q3.h"
+
+
+/*........................................*/
+void p_func(void)
+{
+    int64_t x;
+    x = INT64_C(2);
+    x *= INT64_C(2);
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_BTKZPEMSB2Q3_H
+#define MOD_BTKZPEMSB2Q3_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void p_func(void);
+#endif // mod_btkzpemsb2q3_H
@@ -0,0 +1,77 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_BTKZPEMSB2Q3_WRAPPER
+
+#include "mod_btkzpemsb2q3_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* p_func_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    p_func();
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_btkzpemsb2q3_methods[] = {
+    {
+        "p_func",
+        (PyCFunction)p_func_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_btkzpemsb2q3_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_btkzpemsb2q3",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_btkzpemsb2q3_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_btkzpemsb2q3(void)
+{
+    PyObject* mod;
+    static void* Pymod_btkzpemsb2q3_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_btkzpemsb2q3_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_btkzpemsb2q3_API, "mod_btkzpemsb2q3._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,31 @@
+#include "mod_bujtb5z3weya.h"
+
+
+/*........................................*/
+int64_t omp_barrier(void)
+{
+    t_ndarray arr = {.raw_data = NULL};
+    int64_t i;
+    int64_t func_result;
+    arr = array_create(1, (int64_t[]){INT64_C(1000)}, nd_int64, false, order_c);
+    array_fill((int64_t)INT64_C(0), arr);
+    func_result = INT64_C(0);
+    #pragma omp parallel num_threads(3)
+    {
+        #pragma omp for
+        for (i = INT64_C(0); i < INT64_C(1000); i += INT64_C(1))
+        {
+            arr.nd_int64[i] = i * INT64_C(2);
+        }
+        #pragma omp barrier
+        #pragma omp for reduction(+: func_result)
+        for (i = INT64_C(0); i < INT64_C(1000); i += INT64_C(1))
+        {
+            func_result = func_result + arr.nd_int64[i];
+        }
+    }
+    free_array(&arr);
+    return func_result;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_BUJTB5Z3WEYA_H
+#define MOD_BUJTB5Z3WEYA_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_barrier(void);
+#endif // mod_bujtb5z3weya_H
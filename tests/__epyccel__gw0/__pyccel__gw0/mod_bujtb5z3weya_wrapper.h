@@ -0,0 +1,40 @@
+#ifndef MOD_BUJTB5Z3WEYA_WRAPPER_H
+#define MOD_BUJTB5Z3WEYA_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_bujtb5z3weya.h"
+
+
+#ifdef MOD_BUJTB5Z3WEYA_WRAPPER
+
+
+#else
+
+static void** Pymod_bujtb5z3weya_API;
+
+
+/*........................................*/
+static int mod_bujtb5z3weya_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_bujtb5z3weya_API = (void**)PyCapsule_Import("mod_bujtb5z3weya._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_bujtb5z3weya_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BUJTB5Z3WEYA_WRAPPER_H
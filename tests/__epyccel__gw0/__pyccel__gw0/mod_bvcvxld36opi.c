@@ -0,0 +1,27 @@
+#include "mod_bvcvxld36opi.h"
+
+
+/*........................................*/
+void omp_nowait(t_ndarray x, t_ndarray y, t_ndarray z)
+{
+    int64_t i;
+    int64_t j;
+    #pragma omp parallel
+    {
+        #pragma omp for nowait
+        for (i = INT64_C(0); i < INT64_C(1000); i += INT64_C(1))
+        {
+            GET_ELEMENT(y, nd_int64, i) = GET_ELEMENT(x, nd_int64, i) * INT64_C(2);
+        }
+        #pragma omp for nowait
+        for (j = INT64_C(0); j < INT64_C(1000); j += INT64_C(1))
+        {
+            GET_ELEMENT(z, nd_double, j) = (double)(GET_ELEMENT(x, nd_int64, j)) / 2.0;
+        }
+    }
+    /*____CommentBlock____*/
+    /*bypass issue #468    */
+    /*_____________________*/
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_BVCVXLD36OPI_H
+#define MOD_BVCVXLD36OPI_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_nowait(t_ndarray x, t_ndarray y, t_ndarray z);
+#endif // mod_bvcvxld36opi_H
@@ -0,0 +1,12 @@
+
+def f():
+    a = [1, 2, 3]
+    a.append(4)
+    a.append(5)
+    a.append(6)
+    a.append(7)
+    a.append(8)
+    a.append(9)
+    a.append(10)
+    return a
+
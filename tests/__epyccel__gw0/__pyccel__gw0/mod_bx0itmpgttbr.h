@@ -0,0 +1,11 @@
+#ifndef MOD_BX0ITMPGTTBR_H
+#define MOD_BX0ITMPGTTBR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f3(t_ndarray x, t_ndarray y);
+#endif // mod_bx0itmpgttbr_H
@@ -0,0 +1,12 @@
+#include "mod_bxtym0be5oug.h"
+
+
+/*........................................*/
+int32_t f18(int32_t a)
+{
+    int32_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_BXTYM0BE5OUG_H
+#define MOD_BXTYM0BE5OUG_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t f18(int32_t a);
+#endif // mod_bxtym0be5oug_H
@@ -0,0 +1,40 @@
+#ifndef MOD_BXTYM0BE5OUG_WRAPPER_H
+#define MOD_BXTYM0BE5OUG_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_bxtym0be5oug.h"
+
+
+#ifdef MOD_BXTYM0BE5OUG_WRAPPER
+
+
+#else
+
+static void** Pymod_bxtym0be5oug_API;
+
+
+/*........................................*/
+static int mod_bxtym0be5oug_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_bxtym0be5oug_API = (void**)PyCapsule_Import("mod_bxtym0be5oug._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_bxtym0be5oug_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BXTYM0BE5OUG_WRAPPER_H
@@ -0,0 +1,8 @@
+
+def fused_temporaries_2d(x : 'float[::,::]', y : 'float[::,::]', z : 'float[::,::]'):
+    from numpy import sum
+    t = x * y
+    u = t - 1.0
+    z[::,::] = u * t
+    return sum(u)
+
@@ -0,0 +1,42 @@
+#ifndef MOD_BY6WU9U37DCY_WRAPPER_H
+#define MOD_BY6WU9U37DCY_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_BY6WU9U37DCY_WRAPPER
+
+int64_t bind_c_parallel_array_reductions(void*, int64_t, int64_t, int64_t, int64_t, void*, int64_t, int64_t, void*, int64_t, int64_t, int64_t, int64_t, double*, int32_t*, double*);
+
+#else
+
+static void** Pymod_by6wu9u37dcy_API;
+
+
+/*........................................*/
+static int mod_by6wu9u37dcy_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_by6wu9u37dcy_API = (void**)PyCapsule_Import("mod_by6wu9u37dcy._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_by6wu9u37dcy_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_BY6WU9U37DCY_WRAPPER_H
@@ -0,0 +1,6 @@
+
+def array_float_1d_complex_3d_expr(x : 'float[::]', y : 'float[::]'):
+    from numpy import full
+    z = full((3), 5)
+    x[::] = x//y * x + z
+
@@ -0,0 +1,24 @@
+#include "mod_byt8ldybekvm.h"
+
+
+/*........................................*/
+void array_int32_in_bool_out_1d_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri)
+{
+    int32_t array_dummy[INT64_C(3)];
+    t_ndarray z = (t_ndarray){
+        .nd_int32=array_dummy,
+        .shape={INT64_C(3)},
+        .nd=1,
+        .type=nd_int32,
+        .is_view=false
+    };
+    stack_array_init(&z);
+    int64_t i;
+    array_fill((int32_t)5, z);
+    for (i = INT64_C(0); i < ri.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(ri, nd_bool, i) = (int32_t)floor((double)(GET_ELEMENT(x, nd_int32, i)) / (double)(GET_ELEMENT(y, nd_int32, i))) * GET_ELEMENT(x, nd_int32, i) > GET_ELEMENT(z, nd_int32, i);
+    }
+}
+/*........................................*/
+
@@ -0,0 +1,7 @@
+from numpy import array
+
+def array_int_1d_initialization_4():
+    import numpy
+    b = array([i * 2 for i in range(0, 10, 1)])
+    return b
+
@@ -0,0 +1,12 @@
+#ifndef MOD_BYYXWOT3UTK6_H
+#define MOD_BYYXWOT3UTK6_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_byyxwot3utk6_H
@@ -0,0 +1,5 @@
+
+def f(a : 'bool[::]'):
+    Out_0001 = sum(ai for ai in a)
+    return Out_0001
+
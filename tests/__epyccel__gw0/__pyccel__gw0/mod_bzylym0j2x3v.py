@@ -0,0 +1,6 @@
+
+def f():
+    lst = [1, 2, 3, 4]
+    lst.remove(3)
+    return lst
+
@@ -0,0 +1,42 @@
+#ifndef MOD_C1H3VEO65TRM_WRAPPER_H
+#define MOD_C1H3VEO65TRM_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_C1H3VEO65TRM_WRAPPER
+
+void bind_c_fused_temporaries(void*, int64_t, int64_t, void*, int64_t, int64_t, void*, int64_t, int64_t, void*, int64_t, int64_t);
+
+#else
+
+static void** Pymod_c1h3veo65trm_API;
+
+
+/*........................................*/
+static int mod_c1h3veo65trm_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_c1h3veo65trm_API = (void**)PyCapsule_Import("mod_c1h3veo65trm._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_c1h3veo65trm_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_C1H3VEO65TRM_WRAPPER_H
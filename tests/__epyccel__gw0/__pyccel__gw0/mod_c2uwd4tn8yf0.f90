@@ -0,0 +1,34 @@
+module mod_c2uwd4tn8yf0
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine set_ptr(Out_0001, Out_0002) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    type(Set_integer8), target :: a
+    type(Set_integer8), pointer :: b
+    integer(i64) :: Dummy_0000
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64, 4_i64, 5_i64, 6_i64, 7_i64, &
+          8_i64])
+    b => a
+    Dummy_0000 = Set_integer8_pop(b)
+
+    Out_0001 = a % size()
+    Out_0002 = b % size()
+    return
+
+  end subroutine set_ptr
+  !........................................
+
+end module mod_c2uwd4tn8yf0
@@ -0,0 +1,12 @@
+
+def f():
+    a = [0.0, 3.6, 0.5]
+    a.insert(0, 6.4)
+    a.insert(-100, 25.12)
+    a.insert(1000, 13.04)
+    a.insert(0, 19.99)
+    a.insert(666, 20.0)
+    a.insert(-1, 3.01)
+    a.insert(-25, 2.5)
+    return a
+
@@ -0,0 +1,12 @@
+#ifndef MOD_C4ZWHK3Q1N6N_H
+#define MOD_C4ZWHK3Q1N6N_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double complex array_kwargs_ones(void);
+#endif // mod_c4zwhk3q1n6n_H
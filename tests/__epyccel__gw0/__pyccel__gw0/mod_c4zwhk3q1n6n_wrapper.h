@@ -0,0 +1,40 @@
+#ifndef MOD_C4ZWHK3Q1N6N_WRAPPER_H
+#define MOD_C4ZWHK3Q1N6N_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_c4zwhk3q1n6n.h"
+
+
+#ifdef MOD_C4ZWHK3Q1N6N_WRAPPER
+
+
+#else
+
+static void** Pymod_c4zwhk3q1n6n_API;
+
+
+/*........................................*/
+static int mod_c4zwhk3q1n6n_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_c4zwhk3q1n6n_API = (void**)PyCapsule_Import("mod_c4zwhk3q1n6n._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_c4zwhk3q1n6n_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_C4ZWHK3Q1N6N_WRAPPER_H
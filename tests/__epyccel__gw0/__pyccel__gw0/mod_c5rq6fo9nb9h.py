@@ -0,0 +1,7 @@
+from numpy import shape
+
+def arr_arange_4():
+    from numpy import arange, shape
+    a = arange(1, 28, 3, dtype = float)
+    return shape(a)[0],a[0],a[-1]
+
@@ -0,0 +1,15 @@
+#include "mod_c6mb1okzxo3s.h"
+
+
+/*........................................*/
+int64_t draw_normal(int64_t seed, double loc, double scale, double* x, double* y, double* z)
+{
+    t_philox rng;
+    rng = pyc_philox_init(seed, INT64_C(0));
+    (*x) = pyc_philox_normal(&rng, 0.0, 1.0);
+    (*y) = pyc_philox_normal(&rng, loc, scale);
+    (*z) = pyc_philox_normal(&rng, loc, scale);
+    return 0;
+}
+/*........................................*/
+
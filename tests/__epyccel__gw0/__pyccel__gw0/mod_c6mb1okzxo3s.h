@@ -0,0 +1,11 @@
+#ifndef MOD_C6MB1OKZXO3S_H
+#define MOD_C6MB1OKZXO3S_H
+
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t draw_normal(int64_t seed, double loc, double scale, double* x, double* y, double* z);
+#endif // mod_c6mb1okzxo3s_H
@@ -0,0 +1,126 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_C6MB1OKZXO3S_WRAPPER
+
+#include "mod_c6mb1okzxo3s_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* draw_normal_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* seed_obj;
+    PyObject* loc_obj;
+    PyObject* scale_obj;
+    int64_t seed;
+    double loc;
+    double scale;
+    PyObject* x_obj;
+    double x;
+    PyObject* y_obj;
+    double y;
+    PyObject* z_obj;
+    double z;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "seed",
+        "loc",
+        "scale",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &seed_obj, &loc_obj, &scale_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(seed_obj))
+    {
+        seed = PyInt64_to_Int64(seed_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument seed");
+        return NULL;
+    }
+    if (PyIs_NativeFloat(loc_obj))
+    {
+        loc = PyDouble_to_Double(loc_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument loc");
+        return NULL;
+    }
+    if (PyIs_NativeFloat(scale_obj))
+    {
+        scale = PyDouble_to_Double(scale_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type float for argument scale");
+        return NULL;
+    }
+    draw_normal(seed, loc, scale, &x, &y, &z);
+    x_obj = Double_to_PyDouble(&x);
+    y_obj = Double_to_PyDouble(&y);
+    z_obj = Double_to_PyDouble(&z);
+    Out_obj = Py_BuildValue("OOO", x_obj, y_obj, z_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    Py_DECREF(z_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_c6mb1okzxo3s_methods[] = {
+    {
+        "draw_normal",
+        (PyCFunction)draw_normal_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_c6mb1okzxo3s_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_c6mb1okzxo3s",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_c6mb1okzxo3s_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_c6mb1okzxo3s(void)
+{
+    PyObject* mod;
+    static void* Pymod_c6mb1okzxo3s_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_c6mb1okzxo3s_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_c6mb1okzxo3s_API, "mod_c6mb1okzxo3s._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,28 @@
+#ifndef MOD_C6U6WXIG6HK7_H
+#define MOD_C6U6WXIG6HK7_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+
+
+
+hset_double remove_float(void);
+#endif // mod_c6u6wxig6hk7_H
@@ -0,0 +1,6 @@
+
+def homogeneous_tuple_float():
+    ai = (1.5, 4.3, 5.2, 7.2, 9.999)
+    i = 1
+    return ai[0],ai[i],ai[2],ai[3],ai[4]
+
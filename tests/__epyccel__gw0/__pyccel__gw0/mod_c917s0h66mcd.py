@@ -0,0 +1,10 @@
+from numpy import float64
+
+def return_arrays_in_expression2(n : 'int'):
+    def single_return(n_0001 : 'int'):
+        from numpy import ones
+        return ones((n_0001), dtype = float64)
+    Dummy_0000 = single_return(n)
+    b = Dummy_0000 + 1
+    return b
+
@@ -0,0 +1,29 @@
+#include "mod_ca4bgfxfvh6b.h"
+
+
+/*........................................*/
+int64_t union_list(int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004)
+{
+    hset_double a = {0};
+    vec_double b = {0};
+    hset_double d = {0};
+    double Dummy_0000;
+    a = c_init(hset_double, {1.2, 2.3});
+    b = c_init(vec_double, {1.2, 5.0});
+    hset_double_reserve(&d, hset_double_size(&a));
+    d = hset_double_clone(a);
+    c_foreach (Dummy_0001, vec_double, b){
+        Dummy_0000 = (*Dummy_0001.ref);
+        hset_double_push(&d, Dummy_0000);
+    }
+    (*Out_0001) = hset_double_size(&d);
+    (*Out_0002) = hset_double_pop(&d);
+    (*Out_0003) = hset_double_pop(&d);
+    (*Out_0004) = hset_double_pop(&d);
+    hset_double_drop(&d);
+    vec_double_drop(&b);
+    hset_double_drop(&a);
+    return 0;
+}
+/*........................................*/
+
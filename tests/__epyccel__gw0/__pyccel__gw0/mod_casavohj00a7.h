@@ -0,0 +1,11 @@
+#ifndef MOD_CASAVOHJ00A7_H
+#define MOD_CASAVOHJ00A7_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_max_task_priority(void);
+#endif // mod_casavohj00a7_H
@@ -0,0 +1,34 @@
+#include "mod_cd4bjwcsc36r.h"
+
+
+/*........................................*/
+void array_float_3d_F_array_initialization_1(t_ndarray x, t_ndarray y, t_ndarray a)
+{
+    t_ndarray tmp = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    int64_t offset;
+    tmp = array_create(3, (int64_t[]){INT64_C(2), x.shape[INT64_C(0)], x.shape[INT64_C(1)]}, nd_double, false, order_f);
+    Dummy_0000 = array_create(3, (int64_t[]){INT64_C(2), tmp.shape[INT64_C(1)], tmp.shape[INT64_C(2)]}, nd_double, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&Dummy_0000, x, offset);
+    offset += x.length;
+    array_copy_data(&Dummy_0000, y, offset);
+    array_copy_data(&tmp, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+            {
+                GET_ELEMENT(a, nd_double, i, i_0001, i_0002) = GET_ELEMENT(tmp, nd_double, i, i_0001, i_0002);
+            }
+        }
+    }
+    free_array(&tmp);
+}
+/*........................................*/
+
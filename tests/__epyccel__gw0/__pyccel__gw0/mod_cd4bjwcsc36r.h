@@ -0,0 +1,11 @@
+#ifndef MOD_CD4BJWCSC36R_H
+#define MOD_CD4BJWCSC36R_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_3d_F_array_initialization_1(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_cd4bjwcsc36r_H
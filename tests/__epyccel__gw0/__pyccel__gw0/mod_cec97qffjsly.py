@@ -0,0 +1,8 @@
+
+def get_num_threads():
+    from pyccel.stdlib.internal.openmp import omp_get_num_threads
+    #$omp parallel
+    n = omp_get_num_threads()
+    #$omp end parallel
+    return n
+
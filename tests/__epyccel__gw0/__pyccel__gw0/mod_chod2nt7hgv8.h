@@ -0,0 +1,20 @@
+#ifndef MOD_CHOD2NT7HGV8_H
+#define MOD_CHOD2NT7HGV8_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_int32_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006, int32_t* Out_0007, int32_t* Out_0008, int32_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int32_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006, int32_t* Out_0007, int32_t* Out_0008, int32_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int32_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006, int32_t* Out_0007, int32_t* Out_0008, int32_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int32_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006, int32_t* Out_0007, int32_t* Out_0008, int32_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int32_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006, int32_t* Out_0007, int32_t* Out_0008, int32_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int32_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006, int32_t* Out_0007, int32_t* Out_0008, int32_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int32_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006, int32_t* Out_0007, int32_t* Out_0008, int32_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int32_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006, int32_t* Out_0007, int32_t* Out_0008, int32_t* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_int32_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int32_t* Out_0004, int32_t* Out_0005, int32_t* Out_0006, int32_t* Out_0007, int32_t* Out_0008, int32_t* Out_0009);
+#endif // mod_chod2nt7hgv8_H
@@ -0,0 +1,24 @@
+module mod_cibf4cmxojh0
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function get_max_threads() result(max_threads)
+
+    use omp_lib, only: omp_get_max_threads
+
+    implicit none
+
+    integer(i32) :: max_threads
+
+    max_threads = omp_get_max_threads()
+    return
+
+  end function get_max_threads
+  !........................................
+
+end module mod_cibf4cmxojh0
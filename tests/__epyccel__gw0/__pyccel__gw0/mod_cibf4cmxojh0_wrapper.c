@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_CIBF4CMXOJH0_WRAPPER
+
+#include "mod_cibf4cmxojh0_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_get_max_threads_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t max_threads;
+    PyObject* max_threads_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    max_threads = bind_c_get_max_threads();
+    max_threads_obj = Int32_to_NumpyLong(&max_threads);
+    return max_threads_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_cibf4cmxojh0_methods[] = {
+    {
+        "get_max_threads",
+        (PyCFunction)bind_c_get_max_threads_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_cibf4cmxojh0_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_cibf4cmxojh0",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_cibf4cmxojh0_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_cibf4cmxojh0(void)
+{
+    PyObject* mod;
+    static void* Pymod_cibf4cmxojh0_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_cibf4cmxojh0_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_cibf4cmxojh0_API, "mod_cibf4cmxojh0._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
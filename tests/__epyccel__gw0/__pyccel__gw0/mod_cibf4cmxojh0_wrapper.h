@@ -0,0 +1,40 @@
+#ifndef MOD_CIBF4CMXOJH0_WRAPPER_H
+#define MOD_CIBF4CMXOJH0_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_CIBF4CMXOJH0_WRAPPER
+
+int32_t bind_c_get_max_threads(void);
+
+#else
+
+static void** Pymod_cibf4cmxojh0_API;
+
+
+/*........................................*/
+static int mod_cibf4cmxojh0_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_cibf4cmxojh0_API = (void**)PyCapsule_Import("mod_cibf4cmxojh0._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_cibf4cmxojh0_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_CIBF4CMXOJH0_WRAPPER_H
@@ -0,0 +1,31 @@
+module mod_cibso7sx4an1
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int_1d_initialization_1(Out_0001, Out_0002, Out_0003 &
+        )
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64) :: a(0_i64:4_i64)
+    integer(i64) :: b(0_i64:4_i64)
+
+    a = [1_i64, 2_i64, 4_i64, 8_i64, 16_i64]
+    b = Int(a, kind = i64)
+    Out_0001 = sum(b)
+    Out_0002 = b(0_i64)
+    Out_0003 = b(size(b, kind=i64) - 1_i64)
+    return
+
+  end subroutine array_int_1d_initialization_1
+  !........................................
+
+end module mod_cibso7sx4an1
@@ -0,0 +1,12 @@
+#ifndef MOD_CLBWA16KHIVN_H
+#define MOD_CLBWA16KHIVN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_1(void);
+#endif // mod_clbwa16khivn_H
@@ -0,0 +1,11 @@
+#ifndef MOD_CLM0N2O8U49Y_H
+#define MOD_CLM0N2O8U49Y_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_1D_1(t_ndarray a);
+#endif // mod_clm0n2o8u49y_H
@@ -0,0 +1,46 @@
+module mod_cm808hj71rlu
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function fused_temporaries_2d(x, y, z) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), intent(in) :: x(0_i64:, 0_i64:)
+    real(f64), intent(in) :: y(0_i64:, 0_i64:)
+    real(f64), intent(inout) :: z(0_i64:, 0_i64:)
+    real(f64), allocatable :: t(:, :)
+    real(f64), allocatable :: u(:, :)
+    integer(i64) :: i
+    integer(i64) :: i_0001
+    real(f64) :: t_0001
+
+    allocate(u(0:size(x, 1_i64, i64) - 1_i64, 0:size(x, 2_i64, i64) - &
+          1_i64))
+    do i = 0_i64, size(x, 2_i64, i64) - 1_i64
+      do i_0001 = 0_i64, size(x, 1_i64, i64) - 1_i64
+        t_0001 = x(i_0001, i) * y(i_0001, i)
+        u(i_0001, i) = t_0001 - 1.0_f64
+        z(i_0001, i) = u(i_0001, i) * t_0001
+      end do
+    end do
+    Out_0001 = sum(u)
+    if (allocated(u)) then
+      deallocate(u)
+    end if
+    if (allocated(t)) then
+      deallocate(t)
+    end if
+    return
+
+  end function fused_temporaries_2d
+  !........................................
+
+end module mod_cm808hj71rlu
@@ -0,0 +1,7 @@
+from numpy import shape
+
+def arr_arange_1():
+    from numpy import arange, shape
+    a = arange(0, 6, 1)
+    return shape(a)[0],a[0],a[-1]
+
@@ -0,0 +1,16 @@
+#include "mod_cp1p39k8rq7r.h"
+
+
+/*........................................*/
+int64_t Pop_complex(double complex* el1, double complex* el2, double complex* el3)
+{
+    hset_double_complex se = {0};
+    se = c_init(hset_double_complex, {(4.0 * _Complex_I), _Complex_I, (7.0 * _Complex_I)});
+    (*el1) = hset_double_complex_pop(&se);
+    (*el2) = hset_double_complex_pop(&se);
+    (*el3) = hset_double_complex_pop(&se);
+    hset_double_complex_drop(&se);
+    return 0;
+}
+/*........................................*/
+
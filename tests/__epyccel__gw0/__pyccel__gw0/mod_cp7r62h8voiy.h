@@ -0,0 +1,11 @@
+#ifndef MOD_CP7R62H8VOIY_H
+#define MOD_CP7R62H8VOIY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_1d_div_stack_array(void);
+#endif // mod_cp7r62h8voiy_H
@@ -0,0 +1,16 @@
+#include "mod_cps85qi2d3dc.h"
+
+
+/*........................................*/
+int64_t add_complex(void)
+{
+    hset_double_complex a = {0};
+    int64_t Out_0001;
+    a = c_init(hset_double_complex, {(6.0 * _Complex_I), (7.0 * _Complex_I), (8.0 * _Complex_I)});
+    hset_double_complex_push(&a, (9.0 * _Complex_I));
+    Out_0001 = hset_double_complex_size(&a);
+    hset_double_complex_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,29 @@
+#ifndef MOD_CPS85QI2D3DC_H
+#define MOD_CPS85QI2D3DC_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define i_type hset_double_complex
+#define i_key double complex
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE_COMPLEX
+
+#ifndef _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define _TOOLS_SET_HSET_DOUBLE_COMPLEX
+#define i_type hset_double_complex
+#define i_key double complex
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE_COMPLEX
+
+
+
+
+int64_t add_complex(void);
+#endif // mod_cps85qi2d3dc_H
@@ -0,0 +1,11 @@
+#ifndef MOD_CS3BWJ99JPBW_H
+#define MOD_CS3BWJ99JPBW_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_cs3bwj99jpbw_H
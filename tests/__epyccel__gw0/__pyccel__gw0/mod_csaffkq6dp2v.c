@@ -0,0 +1,20 @@
+#include "mod_csaffkq6dp2v.h"
+
+
+/*........................................*/
+double my_sum_0000(t_ndarray v)
+{
+    double Out_0001;
+    Out_0001 = numpy_sum_float64(v);
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+double complex my_sum_0001(t_ndarray v)
+{
+    double complex Out_0001;
+    Out_0001 = numpy_sum_complex128(v);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_CSAFFKQ6DP2V_H
+#define MOD_CSAFFKQ6DP2V_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdlib.h>
+
+
+
+double my_sum_0000(t_ndarray v);
+double complex my_sum_0001(t_ndarray v);
+#endif // mod_csaffkq6dp2v_H
@@ -0,0 +1,5 @@
+
+def f3(x : 'int[::,::,::]', y : 'int[::,::,::,::,::]'):
+    from numpy import transpose
+    y[0,::,::,::,0] = transpose(x)
+
@@ -0,0 +1,31 @@
+module mod_cti9s5tb7o57
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function omp_arraysum_single(x) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    integer(i64), intent(in) :: x(0_i64:)
+    integer(i64) :: i
+
+    func_result = 0_i64
+    !$omp parallel
+    !$omp single
+    do i = 0_i64, 9_i64
+      func_result = func_result + x(i)
+    end do
+    !$omp end single
+    !$omp end parallel
+    return
+
+  end function omp_arraysum_single
+  !........................................
+
+end module mod_cti9s5tb7o57
@@ -0,0 +1,66 @@
+#include "mod_cvb1wtsmsq0y.h"
+
+
+/*........................................*/
+double multiple_np_linspace(void)
+{
+    int64_t linspace_index;
+    double array_dummy[INT64_C(128)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(128)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double array_dummy_0001[INT64_C(128)];
+    t_ndarray y = (t_ndarray){
+        .nd_double=array_dummy_0001,
+        .shape={INT64_C(128)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    double array_dummy_0002[INT64_C(128)];
+    t_ndarray z = (t_ndarray){
+        .nd_double=array_dummy_0002,
+        .shape={INT64_C(128)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&z);
+    int64_t i;
+    double Out_0001;
+    linspace_index = INT64_C(5);
+    {
+        double* restrict x_data = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(128); i += INT64_C(1))
+        {
+            x_data[i] = (INT64_C(0) + i*(double)((INT64_C(2) - INT64_C(0))) / 127.0);
+            x_data[INT64_C(127)] = (double)INT64_C(2);
+        }
+    }
+    {
+        double* restrict y_data = y.nd_double;
+        for (i = INT64_C(0); i < INT64_C(128); i += INT64_C(1))
+        {
+            y_data[i] = (INT64_C(0) + i*(double)((INT64_C(4) - INT64_C(0))) / 127.0);
+            y_data[INT64_C(127)] = (double)INT64_C(4);
+        }
+    }
+    {
+        double* restrict z_data = z.nd_double;
+        for (i = INT64_C(0); i < INT64_C(128); i += INT64_C(1))
+        {
+            z_data[i] = (INT64_C(0) + i*(double)((INT64_C(8) - INT64_C(0))) / 127.0);
+            z_data[INT64_C(127)] = (double)INT64_C(8);
+        }
+    }
+    Out_0001 = x.nd_double[INT64_C(0)] + y.nd_double[INT64_C(1)] + z.nd_double[INT64_C(2)] + linspace_index;
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_CVB1WTSMSQ0Y_H
+#define MOD_CVB1WTSMSQ0Y_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double multiple_np_linspace(void);
+#endif // mod_cvb1wtsmsq0y_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_CVB1WTSMSQ0Y_WRAPPER
+
+#include "mod_cvb1wtsmsq0y_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* multiple_np_linspace_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = multiple_np_linspace();
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_cvb1wtsmsq0y_methods[] = {
+    {
+        "multiple_np_linspace",
+        (PyCFunction)multiple_np_linspace_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_cvb1wtsmsq0y_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_cvb1wtsmsq0y",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_cvb1wtsmsq0y_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_cvb1wtsmsq0y(void)
+{
+    PyObject* mod;
+    static void* Pymod_cvb1wtsmsq0y_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_cvb1wtsmsq0y_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_cvb1wtsmsq0y_API, "mod_cvb1wtsmsq0y._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
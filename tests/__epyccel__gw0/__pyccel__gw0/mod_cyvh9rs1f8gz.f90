@@ -0,0 +1,44 @@
+module mod_cyvh9rs1f8gz
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine tuples_func(Out_0001, Out_0002) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), allocatable :: c(:)
+
+    allocate(c(0:1_i64))
+    call my_tup(Out_0001 = c(0_i64), Out_0002 = c(1_i64))
+    Out_0001 = c(0_i64)
+    Out_0002 = c(1_i64)
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    return
+
+    contains
+    subroutine my_tup(Out_0001, Out_0002) 
+
+      implicit none
+
+      integer(i64), intent(out) :: Out_0001
+      integer(i64), intent(out) :: Out_0002
+
+      Out_0001 = 1_i64
+      Out_0002 = 2_i64
+      return
+
+    end subroutine my_tup
+
+  end subroutine tuples_func
+  !........................................
+
+end module mod_cyvh9rs1f8gz
@@ -0,0 +1,40 @@
+#ifndef MOD_CYVH9RS1F8GZ_WRAPPER_H
+#define MOD_CYVH9RS1F8GZ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_CYVH9RS1F8GZ_WRAPPER
+
+int64_t bind_c_tuples_func(int64_t*, int64_t*);
+
+#else
+
+static void** Pymod_cyvh9rs1f8gz_API;
+
+
+/*........................................*/
+static int mod_cyvh9rs1f8gz_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_cyvh9rs1f8gz_API = (void**)PyCapsule_Import("mod_cyvh9rs1f8gz._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_cyvh9rs1f8gz_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_CYVH9RS1F8GZ_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_CZQWP2CP2J92_H
+#define MOD_CZQWP2CP2J92_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_czqwp2cp2j92_H
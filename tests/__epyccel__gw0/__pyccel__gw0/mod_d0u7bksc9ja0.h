@@ -0,0 +1,12 @@
+#ifndef MOD_D0U7BKSC9JA0_H
+#define MOD_D0U7BKSC9JA0_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_d0u7bksc9ja0_H
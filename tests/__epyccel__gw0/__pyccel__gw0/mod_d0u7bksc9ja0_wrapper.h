@@ -0,0 +1,42 @@
+#ifndef MOD_D0U7BKSC9JA0_WRAPPER_H
+#define MOD_D0U7BKSC9JA0_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_d0u7bksc9ja0.h"
+
+
+#ifdef MOD_D0U7BKSC9JA0_WRAPPER
+
+
+#else
+
+static void** Pymod_d0u7bksc9ja0_API;
+
+
+/*........................................*/
+static int mod_d0u7bksc9ja0_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_d0u7bksc9ja0_API = (void**)PyCapsule_Import("mod_d0u7bksc9ja0._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_d0u7bksc9ja0_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_D0U7BKSC9JA0_WRAPPER_H
@@ -0,0 +1,4 @@
+
+def array_int32_1d_scalar_div(x : 'int32[::]', a : 'int32'):
+    x[::] = x / a
+
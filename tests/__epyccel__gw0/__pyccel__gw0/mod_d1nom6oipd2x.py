@@ -0,0 +1,24 @@
+from numpy import float64
+
+def test_nowait_schedule(n : 'int'):
+    from numpy import empty, zeros
+    from pyccel.stdlib.internal.openmp import omp_get_thread_num, omp_get_num_threads
+    a = zeros((n), dtype = float64)
+    imin_res = empty((4), dtype = float64)
+    imax_res = empty((4), dtype = float64)
+    #$omp parallel private(rank, nb_tasks, i_min, i_max)
+    rank = omp_get_thread_num()
+    nb_tasks = omp_get_num_threads()
+    i_min = n
+    i_max = 0
+    schedule_size = int(n / nb_tasks)
+    #$omp for schedule(static, schedule_size)
+    for i in range(0, n, 1):
+        a[i] = 92290.0 + i
+        i_min = min((i_min, i))
+        i_max = max((i_min, i))
+    imin_res[rank] = i_min
+    imax_res[rank] = i_max
+    #$omp end parallel
+    return imin_res[0],imin_res[1],imin_res[2],imin_res[3],imax_res[0],imax_res[1],imax_res[2],imax_res[3]
+
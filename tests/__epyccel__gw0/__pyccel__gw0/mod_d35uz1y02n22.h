@@ -0,0 +1,12 @@
+#ifndef MOD_D35UZ1Y02N22_H
+#define MOD_D35UZ1Y02N22_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_d35uz1y02n22_H
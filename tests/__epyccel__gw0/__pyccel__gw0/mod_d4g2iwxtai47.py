@@ -0,0 +1,5 @@
+
+def dict_contains():
+    a = {1: 1.0, 2: 2.0, 3: 3.0}
+    return 1 in a,5 in a,False
+
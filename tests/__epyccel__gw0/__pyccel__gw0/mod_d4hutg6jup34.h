@@ -0,0 +1,11 @@
+#ifndef MOD_D4HUTG6JUP34_H
+#define MOD_D4HUTG6JUP34_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_expression(t_ndarray A, t_ndarray B, t_ndarray C, t_ndarray out);
+#endif // mod_d4hutg6jup34_H
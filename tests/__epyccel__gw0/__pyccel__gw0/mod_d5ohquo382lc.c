@@ -0,0 +1,16 @@
+#include "mod_d5ohquo382lc.h"
+
+
+/*........................................*/
+int64_t union_int(bool* b, bool* Out_0001, bool* Out_0002)
+{
+    hset_int64_t a = {0};
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6), INT64_C(7), INT64_C(8)});
+    (*b) = hset_int64_t_contains(&a, INT64_C(2));
+    (*Out_0001) = hset_int64_t_contains(&a, INT64_C(4));
+    (*Out_0002) = hset_int64_t_contains(&a, INT64_C(9));
+    hset_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
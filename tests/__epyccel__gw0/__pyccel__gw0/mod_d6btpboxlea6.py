@@ -0,0 +1,6 @@
+
+def f():
+    a = [4, 0, 1, -1]
+    a.sort()
+    return a
+
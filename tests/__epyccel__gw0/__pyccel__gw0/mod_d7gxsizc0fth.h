@@ -0,0 +1,12 @@
+#ifndef MOD_D7GXSIZC0FTH_H
+#define MOD_D7GXSIZC0FTH_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t parallel_array_constructors(t_ndarray a, double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_d7gxsizc0fth_H
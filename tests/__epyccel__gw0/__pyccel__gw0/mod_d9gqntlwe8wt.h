@@ -0,0 +1,12 @@
+#ifndef MOD_D9GQNTLWE8WT_H
+#define MOD_D9GQNTLWE8WT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_3d_C_array_initialization_2(t_ndarray a);
+#endif // mod_d9gqntlwe8wt_H
@@ -0,0 +1,21 @@
+#include "mod_da8bxvvlfeeo.h"
+
+
+/*........................................*/
+int64_t copy_complex(int64_t* Out_0001, double complex* Out_0002, double complex* Out_0003, double complex* Out_0004)
+{
+    hset_double_complex se = {0};
+    hset_double_complex cop = {0};
+    se = c_init(hset_double_complex, {(7.0 * _Complex_I), (6.0 * _Complex_I), (9.0 * _Complex_I)});
+    hset_double_complex_reserve(&cop, hset_double_complex_size(&se));
+    cop = hset_double_complex_clone(se);
+    (*Out_0001) = hset_double_complex_size(&cop);
+    (*Out_0002) = hset_double_complex_pop(&cop);
+    (*Out_0003) = hset_double_complex_pop(&cop);
+    (*Out_0004) = hset_double_complex_pop(&cop);
+    hset_double_complex_drop(&se);
+    hset_double_complex_drop(&cop);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,13 @@
+
+def directive_in_else(x : 'int'):
+    func_result = 0
+    if x < 30:
+        return x
+    else:
+        #$omp parallel
+        #$omp for reduction(+: func_result)
+        for i in range(0, x, 1):
+            func_result = func_result + i
+        #$omp end parallel
+    return func_result
+
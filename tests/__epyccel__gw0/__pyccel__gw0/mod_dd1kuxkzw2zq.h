@@ -0,0 +1,11 @@
+#ifndef MOD_DD1KUXKZW2ZQ_H
+#define MOD_DD1KUXKZW2ZQ_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_dd1kuxkzw2zq_H
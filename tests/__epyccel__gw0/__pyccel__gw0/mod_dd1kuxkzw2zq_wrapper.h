@@ -0,0 +1,40 @@
+#ifndef MOD_DD1KUXKZW2ZQ_WRAPPER_H
+#define MOD_DD1KUXKZW2ZQ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_dd1kuxkzw2zq.h"
+
+
+#ifdef MOD_DD1KUXKZW2ZQ_WRAPPER
+
+
+#else
+
+static void** Pymod_dd1kuxkzw2zq_API;
+
+
+/*........................................*/
+static int mod_dd1kuxkzw2zq_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_dd1kuxkzw2zq_API = (void**)PyCapsule_Import("mod_dd1kuxkzw2zq._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_dd1kuxkzw2zq_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_DD1KUXKZW2ZQ_WRAPPER_H
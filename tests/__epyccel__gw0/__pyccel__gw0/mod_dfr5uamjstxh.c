@@ -0,0 +1,31 @@
+#include "mod_dfr5uamjstxh.h"
+
+
+/*........................................*/
+void array_float_3d_F_array_initialization_2(t_ndarray a)
+{
+    t_ndarray x = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    x = array_create(3, (int64_t[]){INT64_C(2), INT64_C(3), INT64_C(4)}, nd_double, false, order_f);
+    Dummy_0000 = array_create(3, (int64_t[]){INT64_C(2), INT64_C(3), INT64_C(4)}, nd_double, false, order_c);
+    double Dummy_0001[] = {0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0, 18.0, 19.0, 20.0, 21.0, 22.0, 23.0};
+    memcpy(&Dummy_0000.nd_double[INT64_C(0)], Dummy_0001, 24 * Dummy_0000.type_size);
+    array_copy_data(&x, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+            {
+                GET_ELEMENT(a, nd_double, i, i_0001, i_0002) = x.nd_double[(i_0002 * x.shape[INT64_C(1)] + i_0001) * x.shape[INT64_C(0)] + i];
+            }
+        }
+    }
+    free_array(&x);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_DGNKJCMMSFN3_H
+#define MOD_DGNKJCMMSFN3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_f_order_argument_negative_index(t_ndarray a, t_ndarray b, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_dgnkjcmmsfn3_H
@@ -0,0 +1,11 @@
+#ifndef MOD_DI5VX2DKSU9C_H
+#define MOD_DI5VX2DKSU9C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_1d_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_di5vx2dksu9c_H
@@ -0,0 +1,7 @@
+from numpy import float64, array
+
+def array_float_nested_C_array_initialization_2(a : 'float[::,::,::]', e : 'float[::,::]', f : 'float[::]', x : 'float[::,::,::,::]'):
+    from numpy import array
+    tmp = array(((e, (f, f)), a, ((f, f), (f, f))), dtype = float64, order='C')
+    x[::,::,::,::] = tmp[::,::,::,::]
+
@@ -0,0 +1,812 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_DIOH2TDY660U_WRAPPER
+
+#include "mod_dioh2tdy660u_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0000_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    void* arr1_data = NULL;
+    int64_t arr1_shape[2];
+    int64_t arr1_strides[2];
+    void* arr2_data = NULL;
+    int64_t arr2_shape[2];
+    int64_t arr2_strides[2];
+    void* arr3_data = NULL;
+    int64_t arr3_shape[2];
+    int64_t arr3_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_0007_obj;
+    bool Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    bool Out_0009;
+    PyObject* Out_obj;
+    arr1_data = PyArray_DATA((PyArrayObject*)(arr1_obj));
+    get_strides_and_shape_from_numpy_array(arr1_obj, arr1_shape, arr1_strides, 1);
+    arr2_data = PyArray_DATA((PyArrayObject*)(arr2_obj));
+    get_strides_and_shape_from_numpy_array(arr2_obj, arr2_shape, arr2_strides, 1);
+    arr3_data = PyArray_DATA((PyArrayObject*)(arr3_obj));
+    get_strides_and_shape_from_numpy_array(arr3_obj, arr3_shape, arr3_strides, 1);
+    bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0000(arr1_data, arr1_shape[INT64_C(0)], arr1_shape[INT64_C(1)], arr1_strides[INT64_C(0)], arr1_strides[INT64_C(1)], arr2_data, arr2_shape[INT64_C(0)], arr2_shape[INT64_C(1)], arr2_strides[INT64_C(0)], arr2_strides[INT64_C(1)], arr3_data, arr3_shape[INT64_C(0)], arr3_shape[INT64_C(1)], arr3_strides[INT64_C(0)], arr3_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_0007_obj = Bool_to_PyBool(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Bool_to_PyBool(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0001_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    void* arr1_data = NULL;
+    int64_t arr1_shape[2];
+    int64_t arr1_strides[2];
+    void* arr2_data = NULL;
+    int64_t arr2_shape[2];
+    int64_t arr2_strides[2];
+    void* arr3_data = NULL;
+    int64_t arr3_shape[2];
+    int64_t arr3_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_0007_obj;
+    bool Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    bool Out_0009;
+    PyObject* Out_obj;
+    arr1_data = PyArray_DATA((PyArrayObject*)(arr1_obj));
+    get_strides_and_shape_from_numpy_array(arr1_obj, arr1_shape, arr1_strides, 1);
+    arr2_data = PyArray_DATA((PyArrayObject*)(arr2_obj));
+    get_strides_and_shape_from_numpy_array(arr2_obj, arr2_shape, arr2_strides, 1);
+    arr3_data = PyArray_DATA((PyArrayObject*)(arr3_obj));
+    get_strides_and_shape_from_numpy_array(arr3_obj, arr3_shape, arr3_strides, 1);
+    bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0001(arr1_data, arr1_shape[INT64_C(0)], arr1_shape[INT64_C(1)], arr1_strides[INT64_C(0)], arr1_strides[INT64_C(1)], arr2_data, arr2_shape[INT64_C(0)], arr2_shape[INT64_C(1)], arr2_strides[INT64_C(0)], arr2_strides[INT64_C(1)], arr3_data, arr3_shape[INT64_C(0)], arr3_shape[INT64_C(1)], arr3_strides[INT64_C(0)], arr3_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_0007_obj = Bool_to_PyBool(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Bool_to_PyBool(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0002_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    void* arr1_data = NULL;
+    int64_t arr1_shape[2];
+    int64_t arr1_strides[2];
+    void* arr2_data = NULL;
+    int64_t arr2_shape[2];
+    int64_t arr2_strides[2];
+    void* arr3_data = NULL;
+    int64_t arr3_shape[2];
+    int64_t arr3_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_0007_obj;
+    bool Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    bool Out_0009;
+    PyObject* Out_obj;
+    arr1_data = PyArray_DATA((PyArrayObject*)(arr1_obj));
+    get_strides_and_shape_from_numpy_array(arr1_obj, arr1_shape, arr1_strides, 1);
+    arr2_data = PyArray_DATA((PyArrayObject*)(arr2_obj));
+    get_strides_and_shape_from_numpy_array(arr2_obj, arr2_shape, arr2_strides, 1);
+    arr3_data = PyArray_DATA((PyArrayObject*)(arr3_obj));
+    get_strides_and_shape_from_numpy_array(arr3_obj, arr3_shape, arr3_strides, 1);
+    bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0002(arr1_data, arr1_shape[INT64_C(0)], arr1_shape[INT64_C(1)], arr1_strides[INT64_C(0)], arr1_strides[INT64_C(1)], arr2_data, arr2_shape[INT64_C(0)], arr2_shape[INT64_C(1)], arr2_strides[INT64_C(0)], arr2_strides[INT64_C(1)], arr3_data, arr3_shape[INT64_C(0)], arr3_shape[INT64_C(1)], arr3_strides[INT64_C(0)], arr3_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_0007_obj = Bool_to_PyBool(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Bool_to_PyBool(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0003_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    void* arr1_data = NULL;
+    int64_t arr1_shape[2];
+    int64_t arr1_strides[2];
+    void* arr2_data = NULL;
+    int64_t arr2_shape[2];
+    int64_t arr2_strides[2];
+    void* arr3_data = NULL;
+    int64_t arr3_shape[2];
+    int64_t arr3_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_0007_obj;
+    bool Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    bool Out_0009;
+    PyObject* Out_obj;
+    arr1_data = PyArray_DATA((PyArrayObject*)(arr1_obj));
+    get_strides_and_shape_from_numpy_array(arr1_obj, arr1_shape, arr1_strides, 1);
+    arr2_data = PyArray_DATA((PyArrayObject*)(arr2_obj));
+    get_strides_and_shape_from_numpy_array(arr2_obj, arr2_shape, arr2_strides, 1);
+    arr3_data = PyArray_DATA((PyArrayObject*)(arr3_obj));
+    get_strides_and_shape_from_numpy_array(arr3_obj, arr3_shape, arr3_strides, 1);
+    bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0003(arr1_data, arr1_shape[INT64_C(0)], arr1_shape[INT64_C(1)], arr1_strides[INT64_C(0)], arr1_strides[INT64_C(1)], arr2_data, arr2_shape[INT64_C(0)], arr2_shape[INT64_C(1)], arr2_strides[INT64_C(0)], arr2_strides[INT64_C(1)], arr3_data, arr3_shape[INT64_C(0)], arr3_shape[INT64_C(1)], arr3_strides[INT64_C(0)], arr3_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_0007_obj = Bool_to_PyBool(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Bool_to_PyBool(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0004_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    void* arr1_data = NULL;
+    int64_t arr1_shape[2];
+    int64_t arr1_strides[2];
+    void* arr2_data = NULL;
+    int64_t arr2_shape[2];
+    int64_t arr2_strides[2];
+    void* arr3_data = NULL;
+    int64_t arr3_shape[2];
+    int64_t arr3_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_0007_obj;
+    bool Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    bool Out_0009;
+    PyObject* Out_obj;
+    arr1_data = PyArray_DATA((PyArrayObject*)(arr1_obj));
+    get_strides_and_shape_from_numpy_array(arr1_obj, arr1_shape, arr1_strides, 1);
+    arr2_data = PyArray_DATA((PyArrayObject*)(arr2_obj));
+    get_strides_and_shape_from_numpy_array(arr2_obj, arr2_shape, arr2_strides, 1);
+    arr3_data = PyArray_DATA((PyArrayObject*)(arr3_obj));
+    get_strides_and_shape_from_numpy_array(arr3_obj, arr3_shape, arr3_strides, 1);
+    bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0004(arr1_data, arr1_shape[INT64_C(0)], arr1_shape[INT64_C(1)], arr1_strides[INT64_C(0)], arr1_strides[INT64_C(1)], arr2_data, arr2_shape[INT64_C(0)], arr2_shape[INT64_C(1)], arr2_strides[INT64_C(0)], arr2_strides[INT64_C(1)], arr3_data, arr3_shape[INT64_C(0)], arr3_shape[INT64_C(1)], arr3_strides[INT64_C(0)], arr3_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_0007_obj = Bool_to_PyBool(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Bool_to_PyBool(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0005_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    void* arr1_data = NULL;
+    int64_t arr1_shape[2];
+    int64_t arr1_strides[2];
+    void* arr2_data = NULL;
+    int64_t arr2_shape[2];
+    int64_t arr2_strides[2];
+    void* arr3_data = NULL;
+    int64_t arr3_shape[2];
+    int64_t arr3_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_0007_obj;
+    bool Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    bool Out_0009;
+    PyObject* Out_obj;
+    arr1_data = PyArray_DATA((PyArrayObject*)(arr1_obj));
+    get_strides_and_shape_from_numpy_array(arr1_obj, arr1_shape, arr1_strides, 1);
+    arr2_data = PyArray_DATA((PyArrayObject*)(arr2_obj));
+    get_strides_and_shape_from_numpy_array(arr2_obj, arr2_shape, arr2_strides, 1);
+    arr3_data = PyArray_DATA((PyArrayObject*)(arr3_obj));
+    get_strides_and_shape_from_numpy_array(arr3_obj, arr3_shape, arr3_strides, 1);
+    bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0005(arr1_data, arr1_shape[INT64_C(0)], arr1_shape[INT64_C(1)], arr1_strides[INT64_C(0)], arr1_strides[INT64_C(1)], arr2_data, arr2_shape[INT64_C(0)], arr2_shape[INT64_C(1)], arr2_strides[INT64_C(0)], arr2_strides[INT64_C(1)], arr3_data, arr3_shape[INT64_C(0)], arr3_shape[INT64_C(1)], arr3_strides[INT64_C(0)], arr3_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_0007_obj = Bool_to_PyBool(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Bool_to_PyBool(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0006_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    void* arr1_data = NULL;
+    int64_t arr1_shape[2];
+    int64_t arr1_strides[2];
+    void* arr2_data = NULL;
+    int64_t arr2_shape[2];
+    int64_t arr2_strides[2];
+    void* arr3_data = NULL;
+    int64_t arr3_shape[2];
+    int64_t arr3_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_0007_obj;
+    bool Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    bool Out_0009;
+    PyObject* Out_obj;
+    arr1_data = PyArray_DATA((PyArrayObject*)(arr1_obj));
+    get_strides_and_shape_from_numpy_array(arr1_obj, arr1_shape, arr1_strides, 1);
+    arr2_data = PyArray_DATA((PyArrayObject*)(arr2_obj));
+    get_strides_and_shape_from_numpy_array(arr2_obj, arr2_shape, arr2_strides, 1);
+    arr3_data = PyArray_DATA((PyArrayObject*)(arr3_obj));
+    get_strides_and_shape_from_numpy_array(arr3_obj, arr3_shape, arr3_strides, 1);
+    bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0006(arr1_data, arr1_shape[INT64_C(0)], arr1_shape[INT64_C(1)], arr1_strides[INT64_C(0)], arr1_strides[INT64_C(1)], arr2_data, arr2_shape[INT64_C(0)], arr2_shape[INT64_C(1)], arr2_strides[INT64_C(0)], arr2_strides[INT64_C(1)], arr3_data, arr3_shape[INT64_C(0)], arr3_shape[INT64_C(1)], arr3_strides[INT64_C(0)], arr3_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_0007_obj = Bool_to_PyBool(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Bool_to_PyBool(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0007_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    void* arr1_data = NULL;
+    int64_t arr1_shape[2];
+    int64_t arr1_strides[2];
+    void* arr2_data = NULL;
+    int64_t arr2_shape[2];
+    int64_t arr2_strides[2];
+    void* arr3_data = NULL;
+    int64_t arr3_shape[2];
+    int64_t arr3_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_0007_obj;
+    bool Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    bool Out_0009;
+    PyObject* Out_obj;
+    arr1_data = PyArray_DATA((PyArrayObject*)(arr1_obj));
+    get_strides_and_shape_from_numpy_array(arr1_obj, arr1_shape, arr1_strides, 1);
+    arr2_data = PyArray_DATA((PyArrayObject*)(arr2_obj));
+    get_strides_and_shape_from_numpy_array(arr2_obj, arr2_shape, arr2_strides, 1);
+    arr3_data = PyArray_DATA((PyArrayObject*)(arr3_obj));
+    get_strides_and_shape_from_numpy_array(arr3_obj, arr3_shape, arr3_strides, 1);
+    bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0007(arr1_data, arr1_shape[INT64_C(0)], arr1_shape[INT64_C(1)], arr1_strides[INT64_C(0)], arr1_strides[INT64_C(1)], arr2_data, arr2_shape[INT64_C(0)], arr2_shape[INT64_C(1)], arr2_strides[INT64_C(0)], arr2_strides[INT64_C(1)], arr3_data, arr3_shape[INT64_C(0)], arr3_shape[INT64_C(1)], arr3_strides[INT64_C(0)], arr3_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_0007_obj = Bool_to_PyBool(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Bool_to_PyBool(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0008_wrapper(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    void* arr1_data = NULL;
+    int64_t arr1_shape[2];
+    int64_t arr1_strides[2];
+    void* arr2_data = NULL;
+    int64_t arr2_shape[2];
+    int64_t arr2_strides[2];
+    void* arr3_data = NULL;
+    int64_t arr3_shape[2];
+    int64_t arr3_strides[2];
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* Out_0002_obj;
+    int64_t Out_0002;
+    PyObject* Out_0003_obj;
+    int64_t Out_0003;
+    PyObject* Out_0004_obj;
+    bool Out_0004;
+    PyObject* Out_0005_obj;
+    bool Out_0005;
+    PyObject* Out_0006_obj;
+    bool Out_0006;
+    PyObject* Out_0007_obj;
+    bool Out_0007;
+    PyObject* Out_0008_obj;
+    bool Out_0008;
+    PyObject* Out_0009_obj;
+    bool Out_0009;
+    PyObject* Out_obj;
+    arr1_data = PyArray_DATA((PyArrayObject*)(arr1_obj));
+    get_strides_and_shape_from_numpy_array(arr1_obj, arr1_shape, arr1_strides, 1);
+    arr2_data = PyArray_DATA((PyArrayObject*)(arr2_obj));
+    get_strides_and_shape_from_numpy_array(arr2_obj, arr2_shape, arr2_strides, 1);
+    arr3_data = PyArray_DATA((PyArrayObject*)(arr3_obj));
+    get_strides_and_shape_from_numpy_array(arr3_obj, arr3_shape, arr3_strides, 1);
+    bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0008(arr1_data, arr1_shape[INT64_C(0)], arr1_shape[INT64_C(1)], arr1_strides[INT64_C(0)], arr1_strides[INT64_C(1)], arr2_data, arr2_shape[INT64_C(0)], arr2_shape[INT64_C(1)], arr2_strides[INT64_C(0)], arr2_strides[INT64_C(1)], arr3_data, arr3_shape[INT64_C(0)], arr3_shape[INT64_C(1)], arr3_strides[INT64_C(0)], arr3_strides[INT64_C(1)], &Out_0001, &Out_0002, &Out_0003, &Out_0004, &Out_0005, &Out_0006, &Out_0007, &Out_0008, &Out_0009);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    Out_0002_obj = Int64_to_PyLong(&Out_0002);
+    Out_0003_obj = Int64_to_PyLong(&Out_0003);
+    Out_0004_obj = Bool_to_PyBool(&Out_0004);
+    Out_0005_obj = Bool_to_PyBool(&Out_0005);
+    Out_0006_obj = Bool_to_PyBool(&Out_0006);
+    Out_0007_obj = Bool_to_PyBool(&Out_0007);
+    Out_0008_obj = Bool_to_PyBool(&Out_0008);
+    Out_0009_obj = Bool_to_PyBool(&Out_0009);
+    Out_obj = Py_BuildValue("OOOOOOOOO", Out_0001_obj, Out_0002_obj, Out_0003_obj, Out_0004_obj, Out_0005_obj, Out_0006_obj, Out_0007_obj, Out_0008_obj, Out_0009_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    Py_DECREF(Out_0004_obj);
+    Py_DECREF(Out_0005_obj);
+    Py_DECREF(Out_0006_obj);
+    Py_DECREF(Out_0007_obj);
+    Py_DECREF(Out_0008_obj);
+    Py_DECREF(Out_0009_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_orderF_type_check(PyObject* arr1_obj, PyObject* arr2_obj, PyObject* arr3_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (is_numpy_array(arr1_obj, NPY_BOOL, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_INT64, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_BYTE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_SHORT, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_INT32, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_FLOAT, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_CFLOAT, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (is_numpy_array(arr1_obj, NPY_CDOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr1");
+        return -INT64_C(1);
+    }
+    if (is_numpy_array(arr2_obj, NPY_BOOL, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_INT64, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(9);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_BYTE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(18);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_SHORT, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(27);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_INT32, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(36);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(45);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_FLOAT, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(54);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_CFLOAT, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(63);
+    }
+    else if (is_numpy_array(arr2_obj, NPY_CDOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(72);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr2");
+        return -INT64_C(1);
+    }
+    if (is_numpy_array(arr3_obj, NPY_BOOL, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_INT64, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(81);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_BYTE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(162);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_SHORT, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(243);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_INT32, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(324);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(405);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_FLOAT, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(486);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_CFLOAT, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(567);
+    }
+    else if (is_numpy_array(arr3_obj, NPY_CDOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        type_indicator += INT64_C(648);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument arr3");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* src_dest_diff_sizes_dtype_convert_to_bool_orderF_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* arr1_obj;
+    PyObject* arr2_obj;
+    PyObject* arr3_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "arr1",
+        "arr2",
+        "arr3",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &arr1_obj, &arr2_obj, &arr3_obj))
+    {
+        return NULL;
+    }
+    type_indicator = src_dest_diff_sizes_dtype_convert_to_bool_orderF_type_check(arr1_obj, arr2_obj, arr3_obj);
+    switch (type_indicator)
+    {
+        case INT64_C(0):
+        {
+            return bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0000_wrapper(arr1_obj, arr2_obj, arr3_obj);
+        }
+        case INT64_C(91):
+        {
+            return bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0001_wrapper(arr1_obj, arr2_obj, arr3_obj);
+        }
+        case INT64_C(182):
+        {
+            return bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0002_wrapper(arr1_obj, arr2_obj, arr3_obj);
+        }
+        case INT64_C(273):
+        {
+            return bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0003_wrapper(arr1_obj, arr2_obj, arr3_obj);
+        }
+        case INT64_C(364):
+        {
+            return bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0004_wrapper(arr1_obj, arr2_obj, arr3_obj);
+        }
+        case INT64_C(455):
+        {
+            return bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0005_wrapper(arr1_obj, arr2_obj, arr3_obj);
+        }
+        case INT64_C(546):
+        {
+            return bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0006_wrapper(arr1_obj, arr2_obj, arr3_obj);
+        }
+        case INT64_C(637):
+        {
+            return bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0007_wrapper(arr1_obj, arr2_obj, arr3_obj);
+        }
+        case INT64_C(728):
+        {
+            return bind_c_src_dest_diff_sizes_dtype_convert_to_bool_orderf_0008_wrapper(arr1_obj, arr2_obj, arr3_obj);
+        }
+        default:
+        {
+            PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+            return NULL;
+        }
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_dioh2tdy660u_methods[] = {
+    {
+        "src_dest_diff_sizes_dtype_convert_to_bool_orderF",
+        (PyCFunction)src_dest_diff_sizes_dtype_convert_to_bool_orderF_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_dioh2tdy660u_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_dioh2tdy660u",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_dioh2tdy660u_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_dioh2tdy660u(void)
+{
+    PyObject* mod;
+    static void* Pymod_dioh2tdy660u_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_dioh2tdy660u_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_dioh2tdy660u_API, "mod_dioh2tdy660u._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
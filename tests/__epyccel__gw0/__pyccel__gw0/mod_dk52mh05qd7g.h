@@ -0,0 +1,11 @@
+#ifndef MOD_DK52MH05QD7G_H
+#define MOD_DK52MH05QD7G_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_dk52mh05qd7g_H
@@ -0,0 +1,17 @@
+#include "mod_dm9mmrpq49gc.h"
+
+
+/*........................................*/
+int64_t init_with_list(int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004)
+{
+    hset_double b = {0};
+    b = c_init(hset_double, {4.6, 7.9, 2.5});
+    (*Out_0001) = hset_double_size(&b);
+    (*Out_0002) = hset_double_pop(&b);
+    (*Out_0003) = hset_double_pop(&b);
+    (*Out_0004) = hset_double_pop(&b);
+    hset_double_drop(&b);
+    return 0;
+}
+/*........................................*/
+
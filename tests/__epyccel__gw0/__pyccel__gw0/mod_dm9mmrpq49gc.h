@@ -0,0 +1,28 @@
+#ifndef MOD_DM9MMRPQ49GC_H
+#define MOD_DM9MMRPQ49GC_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+
+
+
+int64_t init_with_list(int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004);
+#endif // mod_dm9mmrpq49gc_H
@@ -0,0 +1,11 @@
+#ifndef MOD_DNZO9P32GUB8_H
+#define MOD_DNZO9P32GUB8_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_max_threads(void);
+#endif // mod_dnzo9p32gub8_H
@@ -0,0 +1,40 @@
+#ifndef MOD_DNZO9P32GUB8_WRAPPER_H
+#define MOD_DNZO9P32GUB8_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_dnzo9p32gub8.h"
+
+
+#ifdef MOD_DNZO9P32GUB8_WRAPPER
+
+
+#else
+
+static void** Pymod_dnzo9p32gub8_API;
+
+
+/*........................................*/
+static int mod_dnzo9p32gub8_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_dnzo9p32gub8_API = (void**)PyCapsule_Import("mod_dnzo9p32gub8._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_dnzo9p32gub8_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_DNZO9P32GUB8_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_DO27QDO8KFQN_H
+#define MOD_DO27QDO8KFQN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int_2d_C_add(t_ndarray x, t_ndarray y);
+#endif // mod_do27qdo8kfqn_H
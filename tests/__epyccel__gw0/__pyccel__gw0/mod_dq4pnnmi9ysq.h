@@ -0,0 +1,48 @@
+#ifndef MOD_DQ4PNNMI9YSQ_H
+#define MOD_DQ4PNNMI9YSQ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+#ifndef _TOOLS_LIST_VEC_DOUBLE
+#define _TOOLS_LIST_VEC_DOUBLE
+#define i_type vec_double
+#define i_key double
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_DOUBLE
+
+#ifndef _TOOLS_SET_HSET_DOUBLE
+#define _TOOLS_SET_HSET_DOUBLE
+#define i_type hset_double
+#define i_key double
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_DOUBLE
+
+#ifndef _TOOLS_LIST_VEC_DOUBLE
+#define _TOOLS_LIST_VEC_DOUBLE
+#define i_type vec_double
+#define i_key double
+#define i_use_cmp
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_DOUBLE
+
+
+
+
+int64_t union_list(int64_t* Out_0001, double* Out_0002, double* Out_0003, double* Out_0004);
+#endif // mod_dq4pnnmi9ysq_H
@@ -0,0 +1,8 @@
+from numpy import shape, result_type
+
+def f3(x : 'int[::]'):
+    from numpy import empty
+    y = empty((shape(x)[0]), dtype = result_type(x))
+    y[::] = x - 1
+    return y
+
@@ -0,0 +1,18 @@
+#include "mod_dt6l4vqbtrsv.h"
+
+
+/*........................................*/
+int64_t test_argument_negative_index_2(t_ndarray a, t_ndarray b, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    int64_t c;
+    int64_t d;
+    c = -INT64_C(2);
+    d = INT64_C(3);
+    (*Out_0001) = GET_ELEMENT(a, nd_int64, c < INT64_C(0) ? a.shape[INT64_C(0)] + c : c);
+    (*Out_0002) = GET_ELEMENT(a, nd_int64, d < INT64_C(0) ? a.shape[INT64_C(0)] + d : d);
+    (*Out_0003) = GET_ELEMENT(b, nd_int64, c < INT64_C(0) ? b.shape[INT64_C(0)] + c : c);
+    (*Out_0004) = GET_ELEMENT(b, nd_int64, d < INT64_C(0) ? b.shape[INT64_C(0)] + d : d);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_DT6L4VQBTRSV_H
+#define MOD_DT6L4VQBTRSV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t test_argument_negative_index_2(t_ndarray a, t_ndarray b, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_dt6l4vqbtrsv_H
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_DV40SNBK3QA5_WRAPPER
+
+#include "mod_dv40snbk3qa5_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_test_omp_get_thread_limit_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t maximum_threads_available;
+    PyObject* maximum_threads_available_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    maximum_threads_available = bind_c_test_omp_get_thread_limit();
+    maximum_threads_available_obj = Int32_to_NumpyLong(&maximum_threads_available);
+    return maximum_threads_available_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_dv40snbk3qa5_methods[] = {
+    {
+        "test_omp_get_thread_limit",
+        (PyCFunction)bind_c_test_omp_get_thread_limit_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_dv40snbk3qa5_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_dv40snbk3qa5",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_dv40snbk3qa5_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_dv40snbk3qa5(void)
+{
+    PyObject* mod;
+    static void* Pymod_dv40snbk3qa5_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_dv40snbk3qa5_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_dv40snbk3qa5_API, "mod_dv40snbk3qa5._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
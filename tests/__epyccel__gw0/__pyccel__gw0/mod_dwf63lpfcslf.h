@@ -0,0 +1,29 @@
+#ifndef MOD_DWF63LPFCSLF_H
+#define MOD_DWF63LPFCSLF_H
+
+#include <complex.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_LIST_VEC_DOUBLE_COMPLEX
+#define _TOOLS_LIST_VEC_DOUBLE_COMPLEX
+#define i_type vec_double_complex
+#define i_key double complex
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_DOUBLE_COMPLEX
+
+#ifndef _TOOLS_LIST_VEC_DOUBLE_COMPLEX
+#define _TOOLS_LIST_VEC_DOUBLE_COMPLEX
+#define i_type vec_double_complex
+#define i_key double complex
+#define i_more
+#include <stc/vec.h>
+#include <List_extensions.h>
+#endif // _TOOLS_LIST_VEC_DOUBLE_COMPLEX
+
+
+
+
+double complex pop_specific_index(void);
+#endif // mod_dwf63lpfcslf_H
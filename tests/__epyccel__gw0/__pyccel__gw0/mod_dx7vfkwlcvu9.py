@@ -0,0 +1,9 @@
+from numpy import array
+
+def arrs_2d_different_shapes_0():
+    from numpy import shape, array
+    pn = array([[1, 2, 3], [1, 2, 3], [1, 2, 3], [1, 2, 3]], order='C')
+    pm = array([[1, 1, 1]], order='C')
+    x = pn + pm
+    return 4,3
+
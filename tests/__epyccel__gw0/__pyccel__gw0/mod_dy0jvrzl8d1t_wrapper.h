@@ -0,0 +1,40 @@
+#ifndef MOD_DY0JVRZL8D1T_WRAPPER_H
+#define MOD_DY0JVRZL8D1T_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_DY0JVRZL8D1T_WRAPPER
+
+int64_t bind_c_draw_random(int64_t, int64_t, double*, double*, double*);
+
+#else
+
+static void** Pymod_dy0jvrzl8d1t_API;
+
+
+/*........................................*/
+static int mod_dy0jvrzl8d1t_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_dy0jvrzl8d1t_API = (void**)PyCapsule_Import("mod_dy0jvrzl8d1t._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_dy0jvrzl8d1t_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_DY0JVRZL8D1T_WRAPPER_H
@@ -0,0 +1,30 @@
+#include "mod_dz2u0vjaxxch.h"
+
+
+/*........................................*/
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out)
+{
+    int64_t i;
+    int64_t j;
+    int64_t k;
+    #pragma omp parallel shared(A, x, out) private(i, j, k)
+    {
+        #pragma omp for
+        for (i = INT64_C(0); i < A.shape[INT64_C(0)]; i += INT64_C(1))
+        {
+            for (j = INT64_C(0); j < x.shape[INT64_C(1)]; j += INT64_C(1))
+            {
+                for (k = INT64_C(0); k < x.shape[INT64_C(0)]; k += INT64_C(1))
+                {
+                    GET_ELEMENT(out, nd_double, i, j) += GET_ELEMENT(A, nd_double, i, k) * GET_ELEMENT(x, nd_double, k, j);
+                }
+            }
+        }
+    }
+    /*to let the function compile using epyccel issue #468*/
+    /*____CommentBlock____*/
+    /*bypass issue #468    */
+    /*_____________________*/
+}
+/*........................................*/
+
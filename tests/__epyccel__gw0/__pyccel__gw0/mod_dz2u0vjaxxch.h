@@ -0,0 +1,11 @@
+#ifndef MOD_DZ2U0VJAXXCH_H
+#define MOD_DZ2U0VJAXXCH_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_dz2u0vjaxxch_H
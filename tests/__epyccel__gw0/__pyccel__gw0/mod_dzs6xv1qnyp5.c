@@ -0,0 +1,12 @@
+#include "mod_dzs6xv1qnyp5.h"
+
+
+/*........................................*/
+int64_t f19(int64_t a)
+{
+    int64_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
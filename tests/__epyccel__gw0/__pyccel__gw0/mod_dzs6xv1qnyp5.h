@@ -0,0 +1,10 @@
+#ifndef MOD_DZS6XV1QNYP5_H
+#define MOD_DZS6XV1QNYP5_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f19(int64_t a);
+#endif // mod_dzs6xv1qnyp5_H
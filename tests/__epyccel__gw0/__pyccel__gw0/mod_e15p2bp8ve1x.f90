@@ -0,0 +1,35 @@
+module mod_e15p2bp8ve1x
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_1d_slice_stride_21(a, Out_0001, Out_0002, Out_0003, &
+        Out_0004)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), target, intent(in) :: a(0_i64:)
+    integer(i64) :: c
+    integer(i64), pointer :: b(:)
+
+    c = -5_i64
+    b(0:) => a(size(a, kind=i64) - 5_i64:merge(5_i64, 6_i64, c > 0_i64): &
+          c)
+    Out_0001 = sum(b)
+    Out_0002 = b(0_i64)
+    Out_0003 = b(size(b, kind=i64) - 1_i64)
+    Out_0004 = size(b, kind=i64)
+    return
+
+  end subroutine array_1d_slice_stride_21
+  !........................................
+
+end module mod_e15p2bp8ve1x
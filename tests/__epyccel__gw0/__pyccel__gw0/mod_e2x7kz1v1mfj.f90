@@ -0,0 +1,29 @@
+module mod_e2x7kz1v1mfj
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_float_3d_C_array_initialization_2(a) 
+
+    implicit none
+
+    real(f64), intent(inout) :: a(0_i64:, 0_i64:, 0_i64:)
+    real(f64) :: x(0_i64:3_i64, 0_i64:2_i64, 0_i64:1_i64)
+
+    x = reshape([reshape([[0.0_f64, 1.0_f64, 2.0_f64, 3.0_f64], [4.0_f64 &
+          , 5.0_f64, 6.0_f64, 7.0_f64], [8.0_f64, 9.0_f64, 10.0_f64, &
+          11.0_f64]], [4_i64, 3_i64]) ,reshape([[12.0_f64, 13.0_f64, &
+          14.0_f64, 15.0_f64], [16.0_f64, 17.0_f64, 18.0_f64, 19.0_f64 &
+          ], [20.0_f64, 21.0_f64, 22.0_f64, 23.0_f64]], [4_i64, 3_i64]) &
+          ], [4_i64, 3_i64, 2_i64])
+    a(:, :, :) = x(:, :, :)
+
+  end subroutine array_float_3d_C_array_initialization_2
+  !........................................
+
+end module mod_e2x7kz1v1mfj
@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_E2X7KZ1V1MFJ_WRAPPER
+
+#include "mod_e2x7kz1v1mfj_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_float_3d_c_array_initialization_2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    void* a_data = NULL;
+    int64_t a_shape[3];
+    int64_t a_strides[3];
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(3), STRIDED_C_ORDER))
+    {
+        a_data = PyArray_DATA((PyArrayObject*)(a_obj));
+        get_strides_and_shape_from_numpy_array(a_obj, a_shape, a_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_array_float_3d_c_array_initialization_2(a_data, a_shape[INT64_C(0)], a_shape[INT64_C(1)], a_shape[INT64_C(2)], a_strides[INT64_C(0)], a_strides[INT64_C(1)], a_strides[INT64_C(2)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_e2x7kz1v1mfj_methods[] = {
+    {
+        "array_float_3d_C_array_initialization_2",
+        (PyCFunction)bind_c_array_float_3d_c_array_initialization_2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_e2x7kz1v1mfj_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_e2x7kz1v1mfj",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_e2x7kz1v1mfj_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_e2x7kz1v1mfj(void)
+{
+    PyObject* mod;
+    static void* Pymod_e2x7kz1v1mfj_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_e2x7kz1v1mfj_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_e2x7kz1v1mfj_API, "mod_e2x7kz1v1mfj._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,29 @@
+module mod_e4544t3vabhb
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int_1d_initialization_4(b) 
+
+    implicit none
+
+    integer(i64), allocatable, intent(out) :: b(:)
+    integer(i64) :: i
+    integer(i64) :: Dummy_0000
+
+    allocate(b(0:9_i64))
+    Dummy_0000 = 0_i64
+    do i = 0_i64, 9_i64
+      b(Dummy_0000) = i * 2_i64
+      Dummy_0000 = Dummy_0000 + 1_i64
+    end do
+    return
+
+  end subroutine array_int_1d_initialization_4
+  !........................................
+
+end module mod_e4544t3vabhb
@@ -0,0 +1,80 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_E4544T3VABHB_WRAPPER
+
+#include "mod_e4544t3vabhb_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_int_1d_initialization_4_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    void* b_data = NULL;
+    int64_t b_shape[1];
+    PyObject* b_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    bind_c_array_int_1d_initialization_4(&b_data, &b_shape[INT64_C(0)]);
+    b_obj = to_pyarray(INT64_C(1), NPY_INT64, b_data, b_shape, 1, 1);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_e4544t3vabhb_methods[] = {
+    {
+        "array_int_1d_initialization_4",
+        (PyCFunction)bind_c_array_int_1d_initialization_4_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_e4544t3vabhb_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_e4544t3vabhb",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_e4544t3vabhb_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_e4544t3vabhb(void)
+{
+    PyObject* mod;
+    static void* Pymod_e4544t3vabhb_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_e4544t3vabhb_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_e4544t3vabhb_API, "mod_e4544t3vabhb._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,119 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_E4O5XMMO1RBZ_WRAPPER
+
+#include "mod_e4o5xmmo1rbz_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_array_float_2d_2d_matmul_operator_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* A_obj;
+    PyObject* B_obj;
+    PyObject* out_obj;
+    void* A_data = NULL;
+    int64_t A_shape[2];
+    int64_t A_strides[2];
+    void* B_data = NULL;
+    int64_t B_shape[2];
+    int64_t B_strides[2];
+    void* out_data = NULL;
+    int64_t out_shape[2];
+    int64_t out_strides[2];
+    static const char* const kwlist[] = {
+        "A",
+        "B",
+        "out",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &A_obj, &B_obj, &out_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("A", A_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        A_data = PyArray_DATA((PyArrayObject*)(A_obj));
+        get_strides_and_shape_from_numpy_array(A_obj, A_shape, A_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("B", B_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        B_data = PyArray_DATA((PyArrayObject*)(B_obj));
+        get_strides_and_shape_from_numpy_array(B_obj, B_shape, B_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out", out_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        out_data = PyArray_DATA((PyArrayObject*)(out_obj));
+        get_strides_and_shape_from_numpy_array(out_obj, out_shape, out_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_array_float_2d_2d_matmul_operator(A_data, A_shape[INT64_C(0)], A_shape[INT64_C(1)], A_strides[INT64_C(0)], A_strides[INT64_C(1)], B_data, B_shape[INT64_C(0)], B_shape[INT64_C(1)], B_strides[INT64_C(0)], B_strides[INT64_C(1)], out_data, out_shape[INT64_C(0)], out_shape[INT64_C(1)], out_strides[INT64_C(0)], out_strides[INT64_C(1)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_e4o5xmmo1rbz_methods[] = {
+    {
+        "array_float_2d_2d_matmul_operator",
+        (PyCFunction)bind_c_array_float_2d_2d_matmul_operator_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_e4o5xmmo1rbz_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_e4o5xmmo1rbz",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_e4o5xmmo1rbz_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_e4o5xmmo1rbz(void)
+{
+    PyObject* mod;
+    static void* Pymod_e4o5xmmo1rbz_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_e4o5xmmo1rbz_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_e4o5xmmo1rbz_API, "mod_e4o5xmmo1rbz._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,4 @@
+
+def array_int32_2d_C_idiv(x : 'int32[::,::]', y : 'int32[::,::]'):
+    x[::,::] = x//y
+
@@ -0,0 +1,13 @@
+#include "mod_e5qbvw4fx59l.h"
+
+
+/*........................................*/
+hset_double remove_float(void)
+{
+    hset_double se = {0};
+    se = c_init(hset_double, {5.7, 2.4, 8.1});
+    hset_double_erase(&se, 8.1);
+    return se;
+}
+/*........................................*/
+
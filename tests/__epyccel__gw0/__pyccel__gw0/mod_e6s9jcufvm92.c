@@ -0,0 +1,38 @@
+#include "mod_e6s9jcufvm92.h"
+
+
+/*........................................*/
+double multiple_stack_array_1(void)
+{
+    double array_dummy[INT64_C(5)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t array_dummy_0001[INT64_C(5)];
+    t_ndarray b = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    int64_t i;
+    double s;
+    array_fill((double)1.0, a);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(3), INT64_C(5), INT64_C(7), INT64_C(9)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0000, 5 * b.type_size);
+    s = 0.0;
+    for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+    {
+        s += GET_ELEMENT(a, nd_double, i) / GET_ELEMENT(b, nd_int64, i);
+    }
+    return s;
+}
+/*........................................*/
+
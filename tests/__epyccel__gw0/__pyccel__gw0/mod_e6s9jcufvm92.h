@@ -0,0 +1,12 @@
+#ifndef MOD_E6S9JCUFVM92_H
+#define MOD_E6S9JCUFVM92_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_1(void);
+#endif // mod_e6s9jcufvm92_H
@@ -0,0 +1,42 @@
+#ifndef MOD_E908OQER6IE6_WRAPPER_H
+#define MOD_E908OQER6IE6_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_E908OQER6IE6_WRAPPER
+
+int64_t bind_c_array_2d_c_slice_stride_3(void*, int64_t, int64_t, int64_t, int64_t, int64_t*, int64_t*, int64_t*, int64_t*, int64_t*);
+
+#else
+
+static void** Pymod_e908oqer6ie6_API;
+
+
+/*........................................*/
+static int mod_e908oqer6ie6_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_e908oqer6ie6_API = (void**)PyCapsule_Import("mod_e908oqer6ie6._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_e908oqer6ie6_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_E908OQER6IE6_WRAPPER_H
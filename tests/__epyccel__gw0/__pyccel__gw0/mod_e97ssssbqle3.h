@@ -0,0 +1,11 @@
+#ifndef MOD_E97SSSSBQLE3_H
+#define MOD_E97SSSSBQLE3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_div(t_ndarray x, double a);
+#endif // mod_e97ssssbqle3_H
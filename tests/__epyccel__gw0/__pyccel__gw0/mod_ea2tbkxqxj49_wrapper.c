@@ -0,0 +1,115 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_EA2TBKXQXJ49_WRAPPER
+
+#include "mod_ea2tbkxqxj49_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f7_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* m1_obj;
+    PyObject* m2_obj;
+    PyObject* x_obj;
+    int64_t m1;
+    int64_t m2;
+    void* x_data = NULL;
+    int64_t x_shape[2];
+    int64_t x_strides[2];
+    static const char* const kwlist[] = {
+        "m1",
+        "m2",
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &m1_obj, &m2_obj, &x_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(m1_obj))
+    {
+        m1 = PyInt64_to_Int64(m1_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument m1");
+        return NULL;
+    }
+    if (PyIs_NativeInt(m2_obj))
+    {
+        m2 = PyInt64_to_Int64(m2_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument m2");
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(2), STRIDED_F_ORDER))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 0);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_f7(m1, m2, x_data, x_shape[INT64_C(0)], x_shape[INT64_C(1)], x_strides[INT64_C(0)], x_strides[INT64_C(1)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ea2tbkxqxj49_methods[] = {
+    {
+        "f7",
+        (PyCFunction)bind_c_f7_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ea2tbkxqxj49_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ea2tbkxqxj49",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ea2tbkxqxj49_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ea2tbkxqxj49(void)
+{
+    PyObject* mod;
+    static void* Pymod_ea2tbkxqxj49_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ea2tbkxqxj49_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ea2tbkxqxj49_API, "mod_ea2tbkxqxj49._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,10 @@
+from numpy import float64, shape
+
+def arrs_uncertain_shape_1():
+    from numpy import zeros, shape
+    i = 4
+    j = 6
+    a = zeros((10), dtype = float64)
+    b = a[2:i:] + a[4:j:]
+    return shape(b)[0]
+
@@ -0,0 +1,43 @@
+#include "mod_ee9xd7qqty4q.h"
+
+
+/*........................................*/
+double multiple_2d_stack_array_1(void)
+{
+    double array_dummy[INT64_C(10)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(2), INT64_C(5)},
+        .nd=2,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t array_dummy_0001[INT64_C(10)];
+    t_ndarray b = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(2), INT64_C(5)},
+        .nd=2,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    int64_t j;
+    int64_t i;
+    double s;
+    array_fill((double)1.0, a);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(3), INT64_C(5), INT64_C(7), INT64_C(9), INT64_C(11), INT64_C(13), INT64_C(17), INT64_C(19), INT64_C(23)};
+    memcpy(&b.nd_int64[INT64_C(0)], Dummy_0000, 10 * b.type_size);
+    s = 0.0;
+    j = INT64_C(0);
+    for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < INT64_C(5); j += INT64_C(1))
+        {
+            s += a.nd_double[i * a.shape[INT64_C(1)] + j] / b.nd_int64[i * b.shape[INT64_C(1)] + j];
+        }
+    }
+    return s;
+}
+/*........................................*/
+
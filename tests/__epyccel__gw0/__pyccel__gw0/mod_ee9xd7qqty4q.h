@@ -0,0 +1,12 @@
+#ifndef MOD_EE9XD7QQTY4Q_H
+#define MOD_EE9XD7QQTY4Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_2d_stack_array_1(void);
+#endif // mod_ee9xd7qqty4q_H
@@ -0,0 +1,11 @@
+#ifndef MOD_EEONV274W0SY_H
+#define MOD_EEONV274W0SY_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_F_array_initialization(t_ndarray x, t_ndarray y, t_ndarray z, t_ndarray a);
+#endif // mod_eeonv274w0sy_H
@@ -0,0 +1,11 @@
+#ifndef MOD_EESYJ3CBVIIO_H
+#define MOD_EESYJ3CBVIIO_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_eesyj3cbviio_H
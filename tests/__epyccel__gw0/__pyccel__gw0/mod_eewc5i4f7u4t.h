@@ -0,0 +1,12 @@
+#ifndef MOD_EEWC5I4F7U4T_H
+#define MOD_EEWC5I4F7U4T_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_eewc5i4f7u4t_H
@@ -0,0 +1,42 @@
+#ifndef MOD_EH2NHB5Q6UQV_WRAPPER_H
+#define MOD_EH2NHB5Q6UQV_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_eh2nhb5q6uqv.h"
+
+
+#ifdef MOD_EH2NHB5Q6UQV_WRAPPER
+
+
+#else
+
+static void** Pymod_eh2nhb5q6uqv_API;
+
+
+/*........................................*/
+static int mod_eh2nhb5q6uqv_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_eh2nhb5q6uqv_API = (void**)PyCapsule_Import("mod_eh2nhb5q6uqv._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_eh2nhb5q6uqv_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_EH2NHB5Q6UQV_WRAPPER_H
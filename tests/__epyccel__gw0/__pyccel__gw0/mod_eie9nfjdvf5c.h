@@ -0,0 +1,11 @@
+#ifndef MOD_EIE9NFJDVF5C_H
+#define MOD_EIE9NFJDVF5C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int32_index(void);
+#endif // mod_eie9nfjdvf5c_H
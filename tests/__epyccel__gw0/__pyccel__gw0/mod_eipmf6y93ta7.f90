@@ -0,0 +1,24 @@
+module mod_eipmf6y93ta7
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL
+
+  implicit none
+
+  contains
+
+  !........................................
+  function test_omp_get_cancellation() result(cancel_var)
+
+    use omp_lib, only: omp_get_cancellation
+
+    implicit none
+
+    logical(b1) :: cancel_var
+
+    cancel_var = omp_get_cancellation()
+    return
+
+  end function test_omp_get_cancellation
+  !........................................
+
+end module mod_eipmf6y93ta7
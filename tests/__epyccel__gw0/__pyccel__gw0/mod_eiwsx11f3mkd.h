@@ -0,0 +1,11 @@
+#ifndef MOD_EIWSX11F3MKD_H
+#define MOD_EIWSX11F3MKD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_7(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_eiwsx11f3mkd_H
@@ -0,0 +1,32 @@
+module mod_ejfz3vwvigc5
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function intersection_int() result(d)
+
+    implicit none
+
+    integer(i64) :: d
+    type(Set_integer8) :: a
+    type(Set_integer8) :: b
+    type(Set_integer8) :: Dummy_0000
+
+    a = Set_integer8([1_i64, 2_i64])
+    b = Set_integer8([2_i64])
+    Dummy_0000 = Set_integer8(a)
+    call Set_integer8_intersection_update(Dummy_0000, b)
+    d = Set_integer8_pop(Dummy_0000)
+
+    return
+
+  end function intersection_int
+  !........................................
+
+end module mod_ejfz3vwvigc5
@@ -0,0 +1,5 @@
+
+def pop_default_element():
+    a = {1: True, 2: False}
+    return a.pop(3, True)
+
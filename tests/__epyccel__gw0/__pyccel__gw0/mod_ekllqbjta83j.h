@@ -0,0 +1,10 @@
+#ifndef MOD_EKLLQBJTA83J_H
+#define MOD_EKLLQBJTA83J_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_sections(void);
+#endif // mod_ekllqbjta83j_H
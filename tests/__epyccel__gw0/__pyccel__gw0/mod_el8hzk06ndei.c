@@ -0,0 +1,28 @@
+#include "mod_el8hzk06ndei.h"
+
+
+/*........................................*/
+int64_t update_basic(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007)
+{
+    hset_int64_t a = {0};
+    hset_int64_t b = {0};
+    int64_t Dummy_0000;
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3)});
+    b = c_init(hset_int64_t, {INT64_C(4), INT64_C(5), INT64_C(6)});
+    c_foreach (Dummy_0001, hset_int64_t, b){
+        Dummy_0000 = (*Dummy_0001.ref);
+        hset_int64_t_push(&a, Dummy_0000);
+    }
+    (*Out_0001) = hset_int64_t_size(&a);
+    (*Out_0002) = hset_int64_t_pop(&a);
+    (*Out_0003) = hset_int64_t_pop(&a);
+    (*Out_0004) = hset_int64_t_pop(&a);
+    (*Out_0005) = hset_int64_t_pop(&a);
+    (*Out_0006) = hset_int64_t_pop(&a);
+    (*Out_0007) = hset_int64_t_pop(&a);
+    hset_int64_t_drop(&b);
+    hset_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
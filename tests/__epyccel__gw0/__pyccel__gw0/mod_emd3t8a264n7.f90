@@ -0,0 +1,32 @@
+module mod_emd3t8a264n7
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function test_omp_get_max_task_priority() result(max_task_priority_var &
+        )
+
+    use omp_lib, only: omp_get_max_task_priority
+
+    implicit none
+
+    integer(i32) :: max_task_priority_var
+
+    max_task_priority_var = 0_i32
+    !$omp parallel
+    !$omp single
+    !$omp task
+    max_task_priority_var = omp_get_max_task_priority()
+    !$omp end task
+    !$omp end single
+    !$omp end parallel
+    return
+
+  end function test_omp_get_max_task_priority
+  !........................................
+
+end module mod_emd3t8a264n7
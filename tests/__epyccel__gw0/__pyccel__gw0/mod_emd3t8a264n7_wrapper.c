@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_EMD3T8A264N7_WRAPPER
+
+#include "mod_emd3t8a264n7_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_test_omp_get_max_task_priority_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t max_task_priority_var;
+    PyObject* max_task_priority_var_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    max_task_priority_var = bind_c_test_omp_get_max_task_priority();
+    max_task_priority_var_obj = Int32_to_NumpyLong(&max_task_priority_var);
+    return max_task_priority_var_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_emd3t8a264n7_methods[] = {
+    {
+        "test_omp_get_max_task_priority",
+        (PyCFunction)bind_c_test_omp_get_max_task_priority_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_emd3t8a264n7_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_emd3t8a264n7",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_emd3t8a264n7_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_emd3t8a264n7(void)
+{
+    PyObject* mod;
+    static void* Pymod_emd3t8a264n7_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_emd3t8a264n7_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_emd3t8a264n7_API, "mod_emd3t8a264n7._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,15 @@
+from numpy import int32
+
+def test_omp_get_set_schedule():
+    from numpy import int32
+    from pyccel.stdlib.internal.openmp import omp_set_schedule, omp_get_schedule
+    func_result = int32(0)
+    #$omp parallel private(i)
+    omp_set_schedule(int32(2), int32(3))
+    (Dummy_0000, chunk_size) = omp_get_schedule()
+    #$omp for schedule(runtime) reduction(+: func_result)
+    for i in range(0, 16, 1):
+        func_result = func_result + chunk_size
+    #$omp end parallel
+    return func_result
+
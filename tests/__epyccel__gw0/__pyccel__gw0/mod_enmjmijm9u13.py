@@ -0,0 +1,11 @@
+from numpy import shape
+from pyccel.decorators import parallel_arrays
+
+@parallel_arrays(threshold = 100)
+def parallel_array_constructors(a : 'float[::]'):
+    from numpy import linspace, arange
+    c = linspace(0.0, 1.0, num = shape(a)[0], endpoint = True)
+    d = arange(0, shape(a)[0], 1) + a
+    c[::] = c + a * 2.0
+    return c[0],c[shape(a)[0] - 1],d[shape(a)[0] - 1]
+
@@ -0,0 +1,13 @@
+from numpy import float64
+
+def array_kwargs_ones():
+    """ ones(shape, dtype=float, order='C')
+        """
+    from numpy import sum as np_sum, ones
+    n = 4
+    a = ones((n, n - 1), dtype = float64, order='C')
+    b = ones((n + 1, 2 * n), dtype = float, order='F')
+    c = ones((1, n), dtype = complex, order='C')
+    d = ones((2 + n), dtype = int)
+    return np_sum(a) + np_sum(b) + np_sum(c) + np_sum(d)
+
@@ -0,0 +1,5 @@
+
+def f8(x : 'int', b : 'bool'):
+    a = x if b else 2
+    return a
+
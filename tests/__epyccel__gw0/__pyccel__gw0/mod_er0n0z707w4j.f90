@@ -0,0 +1,23 @@
+module mod_er0n0z707w4j
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_float_1d_1d_prod(x, out) 
+
+    implicit none
+
+    real(f64), intent(in) :: x(0_i64:)
+    real(f64), intent(inout) :: out(0_i64:)
+
+    out(:) = product(x)
+
+  end subroutine array_float_1d_1d_prod
+  !........................................
+
+end module mod_er0n0z707w4j
@@ -0,0 +1,14 @@
+#include "mod_ermosb81bnap.h"
+
+
+/*........................................*/
+void array_int32_1d_scalar_add(t_ndarray x, int32_t a)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < x.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(x, nd_int32, i) += a;
+    }
+}
+/*........................................*/
+
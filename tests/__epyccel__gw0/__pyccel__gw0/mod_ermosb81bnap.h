@@ -0,0 +1,11 @@
+#ifndef MOD_ERMOSB81BNAP_H
+#define MOD_ERMOSB81BNAP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_add(t_ndarray x, int32_t a);
+#endif // mod_ermosb81bnap_H
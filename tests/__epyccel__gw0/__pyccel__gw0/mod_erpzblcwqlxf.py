@@ -0,0 +1,7 @@
+from numpy import shape
+
+def arr_arange_2():
+    from numpy import arange, shape
+    a = arange(1, 7, 1)
+    return shape(a)[0],a[0],a[-1]
+
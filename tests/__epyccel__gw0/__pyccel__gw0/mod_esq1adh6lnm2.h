@@ -0,0 +1,11 @@
+#ifndef MOD_ESQ1ADH6LNM2_H
+#define MOD_ESQ1ADH6LNM2_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+bool less_than_100(int64_t n);
+#endif // mod_esq1adh6lnm2_H
@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_ESQ1ADH6LNM2_WRAPPER
+
+#include "mod_esq1adh6lnm2_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* less_than_100_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* n_obj;
+    int64_t n;
+    bool Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "n",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &n_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    Out_0001 = less_than_100(n);
+    Out_0001_obj = Bool_to_PyBool(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_esq1adh6lnm2_methods[] = {
+    {
+        "less_than_100",
+        (PyCFunction)less_than_100_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_esq1adh6lnm2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_esq1adh6lnm2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_esq1adh6lnm2_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_esq1adh6lnm2(void)
+{
+    PyObject* mod;
+    static void* Pymod_esq1adh6lnm2_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_esq1adh6lnm2_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_esq1adh6lnm2_API, "mod_esq1adh6lnm2._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,6 @@
+
+def f():
+    a = [1, 2, 3]
+    b = a.copy()
+    return b
+
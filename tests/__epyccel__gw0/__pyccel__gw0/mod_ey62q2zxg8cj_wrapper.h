@@ -0,0 +1,40 @@
+#ifndef MOD_EY62Q2ZXG8CJ_WRAPPER_H
+#define MOD_EY62Q2ZXG8CJ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_EY62Q2ZXG8CJ_WRAPPER
+
+int8_t bind_c_f17(int8_t);
+
+#else
+
+static void** Pymod_ey62q2zxg8cj_API;
+
+
+/*........................................*/
+static int mod_ey62q2zxg8cj_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ey62q2zxg8cj_API = (void**)PyCapsule_Import("mod_ey62q2zxg8cj._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ey62q2zxg8cj_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_EY62Q2ZXG8CJ_WRAPPER_H
@@ -0,0 +1,44 @@
+#include "mod_ey9id2gc3y5z.h"
+
+
+/*........................................*/
+void array_float_nested_F_array_initialization_mixed(t_ndarray x, t_ndarray y, t_ndarray z, t_ndarray a)
+{
+    t_ndarray tmp = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    int64_t i_0002;
+    int64_t i_0003;
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    int64_t offset;
+    tmp = array_create(4, (int64_t[]){INT64_C(3), x.shape[INT64_C(0)], x.shape[INT64_C(1)], x.shape[INT64_C(2)]}, nd_double, false, order_f);
+    Dummy_0000 = array_create(4, (int64_t[]){INT64_C(3), tmp.shape[INT64_C(1)], tmp.shape[INT64_C(2)], tmp.shape[INT64_C(3)]}, nd_double, false, order_c);
+    offset = INT64_C(0);
+    array_copy_data(&Dummy_0000, x, offset);
+    offset += x.length;
+    array_copy_data(&Dummy_0000, y, offset);
+    offset += y.length;
+    array_copy_data(&Dummy_0000, z, offset);
+    offset += z.length;
+    array_copy_data(&Dummy_0000, z, offset);
+    offset += z.length;
+    array_copy_data(&Dummy_0000, x, offset);
+    array_copy_data(&tmp, Dummy_0000, 0);
+    free_array(&Dummy_0000);
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < a.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            for (i_0002 = INT64_C(0); i_0002 < a.shape[INT64_C(2)]; i_0002 += INT64_C(1))
+            {
+                for (i_0003 = INT64_C(0); i_0003 < a.shape[INT64_C(3)]; i_0003 += INT64_C(1))
+                {
+                    GET_ELEMENT(a, nd_double, i, i_0001, i_0002, i_0003) = tmp.nd_double[((i_0003 * tmp.shape[INT64_C(2)] + i_0002) * tmp.shape[INT64_C(1)] + i_0001) * tmp.shape[INT64_C(0)] + i];
+                }
+            }
+        }
+    }
+    free_array(&tmp);
+}
+/*........................................*/
+
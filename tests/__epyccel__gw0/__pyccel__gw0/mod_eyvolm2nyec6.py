@@ -0,0 +1,5 @@
+
+def kwarg_init():
+    b = {'a': 1, 'b': 2}
+    return b
+
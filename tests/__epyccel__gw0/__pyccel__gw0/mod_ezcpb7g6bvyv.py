@@ -0,0 +1,5 @@
+
+def array_float_1d_1d_prod(x : 'float[::]', out : 'float[::]'):
+    from numpy import prod as product
+    out[::] = product(x)
+
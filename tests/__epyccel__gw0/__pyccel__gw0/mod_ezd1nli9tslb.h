@@ -0,0 +1,11 @@
+#ifndef MOD_EZD1NLI9TSLB_H
+#define MOD_EZD1NLI9TSLB_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_2(t_ndarray a, t_ndarray b);
+#endif // mod_ezd1nli9tslb_H
@@ -0,0 +1,24 @@
+#include "mod_f00ib32b1ngs.h"
+
+
+/*........................................*/
+double arrs_1d_int64_index(void)
+{
+    int64_t i;
+    double array_dummy[INT64_C(10)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(10)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    double b;
+    i = INT64_C(1);
+    array_fill((double)1.0, a);
+    b = a.nd_double[i] + a.nd_double[i + INT64_C(2)];
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_F00IB32B1NGS_H
+#define MOD_F00IB32B1NGS_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int64_index(void);
+#endif // mod_f00ib32b1ngs_H
@@ -0,0 +1,11 @@
+#ifndef MOD_F1GINRD5RQD3_H
+#define MOD_F1GINRD5RQD3_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(int64_t i);
+#endif // mod_f1ginrd5rqd3_H
@@ -0,0 +1,11 @@
+#ifndef MOD_F1RZ9M7CXDQL_H
+#define MOD_F1RZ9M7CXDQL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t constant_negative_index(int64_t n, int64_t* Out_0001, int64_t* Out_0002);
+#endif // mod_f1rz9m7cxdql_H
@@ -0,0 +1,11 @@
+#ifndef MOD_F21OWFARUZY2_H
+#define MOD_F21OWFARUZY2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void double_loop_on_2d_array_F(t_ndarray z);
+#endif // mod_f21owfaruzy2_H
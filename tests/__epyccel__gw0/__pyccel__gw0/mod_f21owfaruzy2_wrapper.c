@@ -0,0 +1,90 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_F21OWFARUZY2_WRAPPER
+
+#include "mod_f21owfaruzy2_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* double_loop_on_2d_array_F_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* z_obj;
+    t_ndarray z = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "z",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &z_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("z", z_obj, NPY_INT64, INT64_C(2), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        z = pyarray_to_ndarray(z_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    double_loop_on_2d_array_F(z);
+    free_pointer(&z);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_f21owfaruzy2_methods[] = {
+    {
+        "double_loop_on_2d_array_F",
+        (PyCFunction)double_loop_on_2d_array_F_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_f21owfaruzy2_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_f21owfaruzy2",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_f21owfaruzy2_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_f21owfaruzy2(void)
+{
+    PyObject* mod;
+    static void* Pymod_f21owfaruzy2_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_f21owfaruzy2_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_f21owfaruzy2_API, "mod_f21owfaruzy2._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
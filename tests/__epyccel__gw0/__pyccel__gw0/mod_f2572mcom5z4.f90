@@ -0,0 +1,27 @@
+module mod_f2572mcom5z4
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i64 => &
+        C_INT64_T
+  use Vector_logical_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function pop_last_element() result(Out_0001)
+
+    implicit none
+
+    logical(b1) :: Out_0001
+    type(Vector_logical) :: a
+
+    a = Vector_logical([.True._b1, .False._b1, .True._b1])
+    Out_0001 = a%of(a % size() - 1_i64 + 1_i64)
+    call a % pop_back()
+    return
+
+  end function pop_last_element
+  !........................................
+
+end module mod_f2572mcom5z4
@@ -0,0 +1,14 @@
+from numpy import float64, array
+
+def tuple_multi_indexing_2():
+    from numpy import ones
+    x = ones((2, 3, 2), dtype = float64, order='C')
+    for z in range(0, 2, 1):
+        for y in range(0, 3, 1):
+            for w in range(0, 2, 1):
+                x[z,y,w] = w + y * 2 + z * 6
+    idx = (1, 1, 0)
+    idx_2 = (0, 1, 2)
+    ai = array((x[idx[0],idx_2[0],1], x[idx[1],idx_2[1],1], x[idx[2],idx_2[2],1]))
+    return ai[0],ai[1],ai[2]
+
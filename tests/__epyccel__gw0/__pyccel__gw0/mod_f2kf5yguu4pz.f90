@@ -0,0 +1,22 @@
+module mod_f2kf5yguu4pz
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f1() result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+
+    Out_0001 = 3.141592653589793_f64
+    return
+
+  end function f1
+  !........................................
+
+end module mod_f2kf5yguu4pz
@@ -0,0 +1,40 @@
+#ifndef MOD_F2KF5YGUU4PZ_WRAPPER_H
+#define MOD_F2KF5YGUU4PZ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_F2KF5YGUU4PZ_WRAPPER
+
+double bind_c_f1(void);
+
+#else
+
+static void** Pymod_f2kf5yguu4pz_API;
+
+
+/*........................................*/
+static int mod_f2kf5yguu4pz_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_f2kf5yguu4pz_API = (void**)PyCapsule_Import("mod_f2kf5yguu4pz._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_f2kf5yguu4pz_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_F2KF5YGUU4PZ_WRAPPER_H
@@ -0,0 +1,31 @@
+module mod_f458f96a2nrw
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function omp_range_sum_critical(x) result(func_result)
+
+    implicit none
+
+    integer(i64) :: func_result
+    integer(i64), value :: x
+    integer(i64) :: i
+
+    func_result = 0_i64
+    !$omp parallel do num_threads(4) shared(func_result)
+    do i = 0_i64, x - 1_i64
+      !$omp critical
+      func_result = func_result + i
+      !$omp end critical
+    end do
+    !$omp end parallel do
+    return
+
+  end function omp_range_sum_critical
+  !........................................
+
+end module mod_f458f96a2nrw
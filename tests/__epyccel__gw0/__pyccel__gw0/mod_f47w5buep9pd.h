@@ -0,0 +1,11 @@
+#ifndef MOD_F47W5BUEP9PD_H
+#define MOD_F47W5BUEP9PD_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_1(t_ndarray a, t_ndarray b);
+#endif // mod_f47w5buep9pd_H
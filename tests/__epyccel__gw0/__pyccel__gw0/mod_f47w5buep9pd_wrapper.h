@@ -0,0 +1,42 @@
+#ifndef MOD_F47W5BUEP9PD_WRAPPER_H
+#define MOD_F47W5BUEP9PD_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_f47w5buep9pd.h"
+
+
+#ifdef MOD_F47W5BUEP9PD_WRAPPER
+
+
+#else
+
+static void** Pymod_f47w5buep9pd_API;
+
+
+/*........................................*/
+static int mod_f47w5buep9pd_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_f47w5buep9pd_API = (void**)PyCapsule_Import("mod_f47w5buep9pd._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_f47w5buep9pd_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_F47W5BUEP9PD_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_F4B1FUKRWKAV_H
+#define MOD_F4B1FUKRWKAV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int64_index(void);
+#endif // mod_f4b1fukrwkav_H
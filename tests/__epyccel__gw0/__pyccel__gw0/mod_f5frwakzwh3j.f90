@@ -0,0 +1,28 @@
+module mod_f5frwakzwh3j
+
+  use, intrinsic :: ISO_C_Binding, only : c64 => C_DOUBLE_COMPLEX , f64 &
+        => C_DOUBLE , i64 => C_INT64_T
+  use pyc_tools_f90
+  use Set_complex8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine remove_complex(se) 
+
+    implicit none
+
+    type(Set_complex8), intent(out) :: se
+    integer(i64) :: Dummy_0000
+
+    se = Set_complex8([cmplx(0,1, kind = c64), (0.0_f64, 3.0_f64), ( &
+          0.0_f64, 8.0_f64)])
+    Dummy_0000 = se % erase_value((0.0_f64, 3.0_f64))
+    return
+
+  end subroutine remove_complex
+  !........................................
+
+end module mod_f5frwakzwh3j
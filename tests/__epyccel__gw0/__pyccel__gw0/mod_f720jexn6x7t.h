@@ -0,0 +1,11 @@
+#ifndef MOD_F720JEXN6X7T_H
+#define MOD_F720JEXN6X7T_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double arrs_1d_int64_index(void);
+#endif // mod_f720jexn6x7t_H
@@ -0,0 +1,11 @@
+#ifndef MOD_F7MLO4H0Z45V_H
+#define MOD_F7MLO4H0Z45V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_F_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_f7mlo4h0z45v_H
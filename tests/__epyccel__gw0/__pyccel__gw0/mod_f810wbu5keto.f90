@@ -0,0 +1,27 @@
+module mod_f810wbu5keto
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f5(m1, x) 
+
+    implicit none
+
+    integer(i64), value :: m1
+    real(f64), intent(inout) :: x(0_i64:)
+    integer(i64) :: i
+
+    x(:) = 0.0_f64
+    do i = 0_i64, m1 - 1_i64
+      x(i) = i * 1.0_f64
+    end do
+
+  end subroutine f5
+  !........................................
+
+end module mod_f810wbu5keto
@@ -0,0 +1,5 @@
+
+def f2(x : 'int[::]'):
+    y = x[0] - 1
+    return y
+
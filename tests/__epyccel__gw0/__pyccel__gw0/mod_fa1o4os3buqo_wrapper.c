@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_FA1O4OS3BUQO_WRAPPER
+
+#include "mod_fa1o4os3buqo_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_omp_barrier_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int64_t func_result;
+    PyObject* func_result_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    func_result = bind_c_omp_barrier();
+    func_result_obj = Int64_to_PyLong(&func_result);
+    return func_result_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_fa1o4os3buqo_methods[] = {
+    {
+        "omp_barrier",
+        (PyCFunction)bind_c_omp_barrier_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_fa1o4os3buqo_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_fa1o4os3buqo",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_fa1o4os3buqo_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_fa1o4os3buqo(void)
+{
+    PyObject* mod;
+    static void* Pymod_fa1o4os3buqo_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_fa1o4os3buqo_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_fa1o4os3buqo_API, "mod_fa1o4os3buqo._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
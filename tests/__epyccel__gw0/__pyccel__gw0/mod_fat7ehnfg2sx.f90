@@ -0,0 +1,42 @@
+module mod_fat7ehnfg2sx
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function tuple_arg_unpacking() result(z)
+
+    implicit none
+
+    integer(i64) :: z
+    integer(i64), allocatable :: args(:)
+
+    allocate(args(0:1_i64))
+    args = [3_i64, 4_i64]
+    z = add2(args(0_i64), args(1_i64))
+    if (allocated(args)) then
+      deallocate(args)
+    end if
+    return
+
+    contains
+    pure function add2(x, y) result(Out_0001)
+
+      implicit none
+
+      integer(i64) :: Out_0001
+      integer(i64), value :: x
+      integer(i64), value :: y
+
+      Out_0001 = x + y
+      return
+
+    end function add2
+
+  end function tuple_arg_unpacking
+  !........................................
+
+end module mod_fat7ehnfg2sx
@@ -0,0 +1,14 @@
+#include "mod_fcju7h4y7pou.h"
+
+
+/*........................................*/
+void copy_to_slice_3(t_ndarray a, t_ndarray b)
+{
+    int64_t i;
+    for (i = INT64_C(0); i < a.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        GET_ELEMENT(a, nd_double, i, INT64_C(0)) = GET_ELEMENT(b, nd_double, i);
+    }
+}
+/*........................................*/
+
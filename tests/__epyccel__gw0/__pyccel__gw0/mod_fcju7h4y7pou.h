@@ -0,0 +1,11 @@
+#ifndef MOD_FCJU7H4Y7POU_H
+#define MOD_FCJU7H4Y7POU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_3(t_ndarray a, t_ndarray b);
+#endif // mod_fcju7h4y7pou_H
@@ -0,0 +1,10 @@
+from numpy import shape, int32, array
+from pyccel.decorators import template
+
+@template('T1', ['bool[:,:]', 'int[:,:]', 'int8[:,:]', 'int16[:,:]', 'int32[:,:]', 'int64[:,:]', 'float[:,:]', 'float32[:,:]', 'float64[:,:]', 'complex64[:,:]', 'complex128[:,:]'])
+def dtype_convert_to_int32(arr : 'T1'):
+    from numpy import shape, array
+    c = array(arr, dtype = int32, order='C')
+    s = (shape(c)[0], shape(c)[1])
+    return 2,c[0,0],c[0,1],c[1,0],c[1,1]
+
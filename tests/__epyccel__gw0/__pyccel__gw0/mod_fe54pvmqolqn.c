@@ -0,0 +1,16 @@
+#include "mod_fe54pvmqolqn.h"
+
+
+/*........................................*/
+t_ndarray array_view_steps_C_2D_1(t_ndarray a)
+{
+    t_ndarray tmp = {.raw_data = NULL};
+    t_ndarray b = {.raw_data = NULL};
+    tmp = array_slicing(a, 2, new_slice(INT64_C(0), a.shape[INT64_C(0)], INT64_C(2), RANGE), new_slice(INT64_C(0), a.shape[INT64_C(1)], INT64_C(1), RANGE));
+    b = array_create(2, (int64_t[]){tmp.shape[INT64_C(0)], tmp.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&b, tmp, 0);
+    free_pointer(&tmp);
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_FE54PVMQOLQN_H
+#define MOD_FE54PVMQOLQN_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_1(t_ndarray a);
+#endif // mod_fe54pvmqolqn_H
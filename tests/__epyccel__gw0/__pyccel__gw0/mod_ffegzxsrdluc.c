@@ -0,0 +1,21 @@
+#include "mod_ffegzxsrdluc.h"
+
+
+/*........................................*/
+int64_t intersection_int(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    hset_int64_t a = {0};
+    hset_int64_t b = {0};
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4)});
+    b = c_init(hset_int64_t, {INT64_C(2), INT64_C(3), INT64_C(4)});
+    hset_int64_t_intersection_update(&a, &b);
+    (*Out_0001) = hset_int64_t_size(&a);
+    (*Out_0002) = hset_int64_t_pop(&a);
+    (*Out_0003) = hset_int64_t_pop(&a);
+    (*Out_0004) = hset_int64_t_pop(&a);
+    hset_int64_t_drop(&b);
+    hset_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_FFF6KLBNCGHK_H
+#define MOD_FFF6KLBNCGHK_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_div_stack_array(void);
+#endif // mod_fff6klbncghk_H
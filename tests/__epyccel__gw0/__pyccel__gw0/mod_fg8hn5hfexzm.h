@@ -0,0 +1,10 @@
+#ifndef MOD_FG8HN5HFEXZM_H
+#define MOD_FG8HN5HFEXZM_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int8_t f17(int8_t a);
+#endif // mod_fg8hn5hfexzm_H
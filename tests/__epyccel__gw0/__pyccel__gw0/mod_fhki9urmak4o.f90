@@ -0,0 +1,32 @@
+module mod_fhki9urmak4o
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use pyc_random_f90
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine draw_random(seed, stream, x, y, z) 
+
+    implicit none
+
+    real(f64), intent(out) :: x
+    real(f64), intent(out) :: y
+    real(f64), intent(out) :: z
+    integer(i64), value :: seed
+    integer(i64), value :: stream
+    type(pyc_philox) :: rng
+
+    rng = pyc_philox_init(seed, stream)
+    x = pyc_philox_random(rng)
+    y = pyc_philox_random(rng)
+    z = pyc_philox_random(rng)
+    return
+
+  end subroutine draw_random
+  !........................................
+
+end module mod_fhki9urmak4o
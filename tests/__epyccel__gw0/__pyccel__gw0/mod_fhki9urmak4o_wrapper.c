@@ -0,0 +1,114 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_FHKI9URMAK4O_WRAPPER
+
+#include "mod_fhki9urmak4o_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_draw_random_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* seed_obj;
+    PyObject* stream_obj;
+    int64_t seed;
+    int64_t stream;
+    PyObject* x_obj;
+    double x;
+    PyObject* y_obj;
+    double y;
+    PyObject* z_obj;
+    double z;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "seed",
+        "stream",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &seed_obj, &stream_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(seed_obj))
+    {
+        seed = PyInt64_to_Int64(seed_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument seed");
+        return NULL;
+    }
+    if (PyIs_NativeInt(stream_obj))
+    {
+        stream = PyInt64_to_Int64(stream_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument stream");
+        return NULL;
+    }
+    bind_c_draw_random(seed, stream, &x, &y, &z);
+    x_obj = Double_to_PyDouble(&x);
+    y_obj = Double_to_PyDouble(&y);
+    z_obj = Double_to_PyDouble(&z);
+    Out_obj = Py_BuildValue("OOO", x_obj, y_obj, z_obj);
+    Py_DECREF(x_obj);
+    Py_DECREF(y_obj);
+    Py_DECREF(z_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_fhki9urmak4o_methods[] = {
+    {
+        "draw_random",
+        (PyCFunction)bind_c_draw_random_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_fhki9urmak4o_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_fhki9urmak4o",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_fhki9urmak4o_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_fhki9urmak4o(void)
+{
+    PyObject* mod;
+    static void* Pymod_fhki9urmak4o_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_fhki9urmak4o_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_fhki9urmak4o_API, "mod_fhki9urmak4o._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,5 @@
+
+def pop_specific_index():
+    a = [1j, 3j, 45j]
+    return a.pop(1)
+
@@ -0,0 +1,5 @@
+
+def array_float_2d_1d_matmul_transpose(A : 'float[::,::]', x : 'float[::]', out : 'float[::]'):
+    from numpy import matmul, transpose
+    out[::] = matmul(transpose(A), x)
+
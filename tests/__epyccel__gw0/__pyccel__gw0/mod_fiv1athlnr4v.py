@@ -0,0 +1,14 @@
+from numpy import shape, float64
+
+def f2(x : 'int[::,::,::]'):
+    from numpy import shape, empty, transpose
+    n = shape(x)[0]
+    m = shape(x)[1]
+    p = shape(x)[2]
+    y = empty((p, m, n), dtype = float64, order='C')
+    y[::,::,::] = transpose(x)
+    n = shape(y)[0]
+    m = shape(y)[1]
+    p = shape(y)[2]
+    return n,m,p,y[0,-1,0],y[0,0,-1],y[-1,-1,0]
+
@@ -0,0 +1,21 @@
+module mod_fkem3l968lav
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f9(x) 
+
+    implicit none
+
+    integer(i64), intent(inout) :: x(0_i64:)
+
+    x = x + 1_i64
+
+  end subroutine f9
+  !........................................
+
+end module mod_fkem3l968lav
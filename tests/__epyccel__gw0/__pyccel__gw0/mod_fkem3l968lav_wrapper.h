@@ -0,0 +1,42 @@
+#ifndef MOD_FKEM3L968LAV_WRAPPER_H
+#define MOD_FKEM3L968LAV_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_FKEM3L968LAV_WRAPPER
+
+void bind_c_f9(void*, int64_t, int64_t);
+
+#else
+
+static void** Pymod_fkem3l968lav_API;
+
+
+/*........................................*/
+static int mod_fkem3l968lav_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_fkem3l968lav_API = (void**)PyCapsule_Import("mod_fkem3l968lav._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_fkem3l968lav_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_FKEM3L968LAV_WRAPPER_H
@@ -0,0 +1,8 @@
+from numpy import float64, shape
+
+def arrs_1d_negative_step_positive_step():
+    from numpy import sum, ones, shape
+    a = ones((10), dtype = float64)
+    b = a[1:-1:3] + a[2::3]
+    return shape(b)[0],sum(b)
+
@@ -0,0 +1,6 @@
+
+def f1():
+    from numpy import pi
+    value = (2 * pi) ** (3 / 2)
+    return value
+
@@ -0,0 +1,36 @@
+module mod_fmlr9o8j6ryg
+
+  use, intrinsic :: ISO_C_Binding, only : c64 => C_DOUBLE_COMPLEX , f64 &
+        => C_DOUBLE
+  use pyc_tools_f90
+  use Set_complex8_mod
+  use Set_complex8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine Pop_complex(el1, el2, el3) 
+
+    implicit none
+
+    complex(c64), intent(out) :: el1
+    complex(c64), intent(out) :: el2
+    complex(c64), intent(out) :: el3
+    type(Set_complex8) :: se
+
+    se = Set_complex8([(0.0_f64, 4.0_f64), cmplx(0,1, kind = c64), ( &
+          0.0_f64, 7.0_f64)])
+    el1 = Set_complex8_pop(se)
+
+    el2 = Set_complex8_pop(se)
+
+    el3 = Set_complex8_pop(se)
+
+    return
+
+  end subroutine Pop_complex
+  !........................................
+
+end module mod_fmlr9o8j6ryg
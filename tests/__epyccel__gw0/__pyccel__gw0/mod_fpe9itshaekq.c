@@ -0,0 +1,17 @@
+#include "mod_fpe9itshaekq.h"
+
+
+/*........................................*/
+int64_t allow_negative_index_annotation(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    vec_int64_t a = {0};
+    a = c_init(vec_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4)});
+    (*Out_0001) = (*vec_int64_t_at(&a,vec_int64_t_size(&a) - INT64_C(1)));
+    (*Out_0002) = (*vec_int64_t_at(&a,vec_int64_t_size(&a) - INT64_C(2)));
+    (*Out_0003) = (*vec_int64_t_at(&a,vec_int64_t_size(&a) - INT64_C(3)));
+    (*Out_0004) = (*vec_int64_t_at(&a,INT64_C(0)));
+    vec_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,193 @@
+module mod_fpzl4d576wrh
+
+  use, intrinsic :: ISO_C_Binding, only : f32 => C_FLOAT , i64 => &
+        C_INT64_T , i16 => C_INT16_T , i32 => C_INT32_T , i8 => &
+        C_INT8_T , f64 => C_DOUBLE , c32 => C_FLOAT_COMPLEX , c64 => &
+        C_DOUBLE_COMPLEX
+
+  implicit none
+
+  interface array_return_first_element
+    module procedure array_return_first_element_0000
+    module procedure array_return_first_element_0001
+    module procedure array_return_first_element_0002
+    module procedure array_return_first_element_0003
+    module procedure array_return_first_element_0005
+    module procedure array_return_first_element_0006
+    module procedure array_return_first_element_0008
+    module procedure array_return_first_element_0009
+  end interface
+
+  contains
+
+  !........................................
+  function array_return_first_element_0000(a, b) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: a
+    integer(i64), value :: b
+    integer(i64) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0000
+  !........................................
+
+  !........................................
+  function array_return_first_element_0001(a, b) result(Out_0001)
+
+    implicit none
+
+    integer(i8) :: Out_0001
+    integer(i8), value :: a
+    integer(i8), value :: b
+    integer(i8) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0001
+  !........................................
+
+  !........................................
+  function array_return_first_element_0002(a, b) result(Out_0001)
+
+    implicit none
+
+    integer(i16) :: Out_0001
+    integer(i16), value :: a
+    integer(i16), value :: b
+    integer(i16) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0002
+  !........................................
+
+  !........................................
+  function array_return_first_element_0003(a, b) result(Out_0001)
+
+    implicit none
+
+    integer(i32) :: Out_0001
+    integer(i32), value :: a
+    integer(i32), value :: b
+    integer(i32) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0003
+  !........................................
+
+  !........................................
+  function array_return_first_element_0004(a, b) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: a
+    integer(i64), value :: b
+    integer(i64) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0004
+  !........................................
+
+  !........................................
+  function array_return_first_element_0005(a, b) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: a
+    real(f64), value :: b
+    real(f64) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0005
+  !........................................
+
+  !........................................
+  function array_return_first_element_0006(a, b) result(Out_0001)
+
+    implicit none
+
+    real(f32) :: Out_0001
+    real(f32), value :: a
+    real(f32), value :: b
+    real(f32) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0006
+  !........................................
+
+  !........................................
+  function array_return_first_element_0007(a, b) result(Out_0001)
+
+    implicit none
+
+    real(f64) :: Out_0001
+    real(f64), value :: a
+    real(f64), value :: b
+    real(f64) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0007
+  !........................................
+
+  !........................................
+  function array_return_first_element_0008(a, b) result(Out_0001)
+
+    implicit none
+
+    complex(c32) :: Out_0001
+    complex(c32), value :: a
+    complex(c32), value :: b
+    complex(c32) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0008
+  !........................................
+
+  !........................................
+  function array_return_first_element_0009(a, b) result(Out_0001)
+
+    implicit none
+
+    complex(c64) :: Out_0001
+    complex(c64), value :: a
+    complex(c64), value :: b
+    complex(c64) :: x(0_i64:1_i64)
+
+    x = [a, b]
+    Out_0001 = x(0_i64)
+    return
+
+  end function array_return_first_element_0009
+  !........................................
+
+end module mod_fpzl4d576wrh
@@ -0,0 +1,21 @@
+#ifndef MOD_FR0TL2SBSREK_H
+#define MOD_FR0TL2SBSREK_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_cdouble_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double complex* Out_0004, double complex* Out_0005, double complex* Out_0006, double complex* Out_0007, double complex* Out_0008, double complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cdouble_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double complex* Out_0004, double complex* Out_0005, double complex* Out_0006, double complex* Out_0007, double complex* Out_0008, double complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cdouble_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double complex* Out_0004, double complex* Out_0005, double complex* Out_0006, double complex* Out_0007, double complex* Out_0008, double complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cdouble_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double complex* Out_0004, double complex* Out_0005, double complex* Out_0006, double complex* Out_0007, double complex* Out_0008, double complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cdouble_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double complex* Out_0004, double complex* Out_0005, double complex* Out_0006, double complex* Out_0007, double complex* Out_0008, double complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cdouble_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double complex* Out_0004, double complex* Out_0005, double complex* Out_0006, double complex* Out_0007, double complex* Out_0008, double complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cdouble_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double complex* Out_0004, double complex* Out_0005, double complex* Out_0006, double complex* Out_0007, double complex* Out_0008, double complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cdouble_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double complex* Out_0004, double complex* Out_0005, double complex* Out_0006, double complex* Out_0007, double complex* Out_0008, double complex* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_cdouble_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, double complex* Out_0004, double complex* Out_0005, double complex* Out_0006, double complex* Out_0007, double complex* Out_0008, double complex* Out_0009);
+#endif // mod_fr0tl2sbsrek_H
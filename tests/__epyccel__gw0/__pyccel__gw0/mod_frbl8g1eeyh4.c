@@ -0,0 +1,15 @@
+#include "mod_frbl8g1eeyh4.h"
+
+
+/*........................................*/
+bool pop_default_element(void)
+{
+    hmap_int64_t_bool a = {0};
+    bool Out_0001;
+    a = c_init(hmap_int64_t_bool, {{INT64_C(1), 1}, {INT64_C(2), 0}});
+    Out_0001 = hmap_int64_t_bool_pop_with_default(&a, INT64_C(3), 1);
+    hmap_int64_t_bool_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
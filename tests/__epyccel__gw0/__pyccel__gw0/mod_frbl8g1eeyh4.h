@@ -0,0 +1,21 @@
+#ifndef MOD_FRBL8G1EEYH4_H
+#define MOD_FRBL8G1EEYH4_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_DICT_HMAP_INT64_T_BOOL
+#define _TOOLS_DICT_HMAP_INT64_T_BOOL
+#define i_type hmap_int64_t_bool
+#define i_key int64_t
+#define i_val bool
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_BOOL
+
+
+
+
+bool pop_default_element(void);
+#endif // mod_frbl8g1eeyh4_H
@@ -0,0 +1,80 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_FRBL8G1EEYH4_WRAPPER
+
+#include "mod_frbl8g1eeyh4_wrapper.h"
+#include <stdlib.h>
+#include <stdbool.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* pop_default_element_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    bool Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = pop_default_element();
+    Out_0001_obj = Bool_to_PyBool(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_frbl8g1eeyh4_methods[] = {
+    {
+        "pop_default_element",
+        (PyCFunction)pop_default_element_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_frbl8g1eeyh4_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_frbl8g1eeyh4",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_frbl8g1eeyh4_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_frbl8g1eeyh4(void)
+{
+    PyObject* mod;
+    static void* Pymod_frbl8g1eeyh4_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_frbl8g1eeyh4_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_frbl8g1eeyh4_API, "mod_frbl8g1eeyh4._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,40 @@
+#ifndef MOD_FRBL8G1EEYH4_WRAPPER_H
+#define MOD_FRBL8G1EEYH4_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_frbl8g1eeyh4.h"
+
+
+#ifdef MOD_FRBL8G1EEYH4_WRAPPER
+
+
+#else
+
+static void** Pymod_frbl8g1eeyh4_API;
+
+
+/*........................................*/
+static int mod_frbl8g1eeyh4_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_frbl8g1eeyh4_API = (void**)PyCapsule_Import("mod_frbl8g1eeyh4._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_frbl8g1eeyh4_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_FRBL8G1EEYH4_WRAPPER_H
@@ -0,0 +1,21 @@
+#ifndef MOD_FRMPSJ5QFE08_H
+#define MOD_FRMPSJ5QFE08_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_0000(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006, bool* Out_0007, bool* Out_0008, bool* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_0001(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006, bool* Out_0007, bool* Out_0008, bool* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_0002(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006, bool* Out_0007, bool* Out_0008, bool* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_0003(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006, bool* Out_0007, bool* Out_0008, bool* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_0004(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006, bool* Out_0007, bool* Out_0008, bool* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_0005(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006, bool* Out_0007, bool* Out_0008, bool* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_0006(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006, bool* Out_0007, bool* Out_0008, bool* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_0007(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006, bool* Out_0007, bool* Out_0008, bool* Out_0009);
+int64_t src_dest_diff_sizes_dtype_convert_to_bool_0008(t_ndarray arr1, t_ndarray arr2, t_ndarray arr3, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, bool* Out_0004, bool* Out_0005, bool* Out_0006, bool* Out_0007, bool* Out_0008, bool* Out_0009);
+#endif // mod_frmpsj5qfe08_H
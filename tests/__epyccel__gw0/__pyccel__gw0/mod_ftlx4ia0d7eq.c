@@ -0,0 +1,32 @@
+#include "mod_ftlx4ia0d7eq.h"
+
+
+/*........................................*/
+int64_t f1(t_ndarray x, int64_t* n, int64_t* m, double* Out_0001, double* Out_0002)
+{
+    t_ndarray y = {.raw_data = NULL};
+    t_ndarray z = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    (*n) = x.shape[INT64_C(0)];
+    (*m) = x.shape[INT64_C(1)];
+    y = array_create(2, (int64_t[]){(*m), (*n)}, nd_double, false, order_f);
+    array_fill((double)1.0, y);
+    z = array_create(2, (int64_t[]){x.shape[INT64_C(0)], x.shape[INT64_C(1)]}, nd_double, false, order_c);
+    for (i = INT64_C(0); i < z.shape[INT64_C(0)]; i += INT64_C(1))
+    {
+        for (i_0001 = INT64_C(0); i_0001 < z.shape[INT64_C(1)]; i_0001 += INT64_C(1))
+        {
+            z.nd_double[i * z.shape[INT64_C(1)] + i_0001] = GET_ELEMENT(x, nd_int64, i, i_0001) + y.nd_double[i * y.shape[INT64_C(0)] + i_0001];
+        }
+    }
+    (*n) = z.shape[INT64_C(0)];
+    (*m) = z.shape[INT64_C(1)];
+    (*Out_0001) = z.nd_double[(z.shape[INT64_C(0)] - INT64_C(1)) * z.shape[INT64_C(1)]];
+    (*Out_0002) = z.nd_double[z.shape[INT64_C(1)] - INT64_C(1)];
+    free_array(&z);
+    free_array(&y);
+    return 0;
+}
+/*........................................*/
+
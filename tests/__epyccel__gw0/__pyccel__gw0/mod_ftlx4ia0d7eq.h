@@ -0,0 +1,11 @@
+#ifndef MOD_FTLX4IA0D7EQ_H
+#define MOD_FTLX4IA0D7EQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(t_ndarray x, int64_t* n, int64_t* m, double* Out_0001, double* Out_0002);
+#endif // mod_ftlx4ia0d7eq_H
@@ -0,0 +1,42 @@
+#ifndef MOD_FWD1YAFSL2WS_WRAPPER_H
+#define MOD_FWD1YAFSL2WS_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_fwd1yafsl2ws.h"
+
+
+#ifdef MOD_FWD1YAFSL2WS_WRAPPER
+
+
+#else
+
+static void** Pymod_fwd1yafsl2ws_API;
+
+
+/*........................................*/
+static int mod_fwd1yafsl2ws_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_fwd1yafsl2ws_API = (void**)PyCapsule_Import("mod_fwd1yafsl2ws._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_fwd1yafsl2ws_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_FWD1YAFSL2WS_WRAPPER_H
@@ -0,0 +1,12 @@
+#ifndef MOD_FXPHUXN6PNYM_H
+#define MOD_FXPHUXN6PNYM_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_nested_F_array_initialization_3(t_ndarray a, t_ndarray e, t_ndarray x);
+#endif // mod_fxphuxn6pnym_H
@@ -0,0 +1,12 @@
+#include "mod_fyj4sdcn610g.h"
+
+
+/*........................................*/
+int32_t get_max_threads(void)
+{
+    int32_t max_threads;
+    max_threads = omp_get_max_threads();
+    return max_threads;
+}
+/*........................................*/
+
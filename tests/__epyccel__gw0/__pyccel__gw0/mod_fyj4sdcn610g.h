@@ -0,0 +1,11 @@
+#ifndef MOD_FYJ4SDCN610G_H
+#define MOD_FYJ4SDCN610G_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_max_threads(void);
+#endif // mod_fyj4sdcn610g_H
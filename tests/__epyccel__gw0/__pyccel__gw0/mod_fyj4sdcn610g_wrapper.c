@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_FYJ4SDCN610G_WRAPPER
+
+#include "mod_fyj4sdcn610g_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_max_threads_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t max_threads;
+    PyObject* max_threads_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    max_threads = get_max_threads();
+    max_threads_obj = Int32_to_NumpyLong(&max_threads);
+    return max_threads_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_fyj4sdcn610g_methods[] = {
+    {
+        "get_max_threads",
+        (PyCFunction)get_max_threads_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_fyj4sdcn610g_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_fyj4sdcn610g",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_fyj4sdcn610g_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_fyj4sdcn610g(void)
+{
+    PyObject* mod;
+    static void* Pymod_fyj4sdcn610g_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_fyj4sdcn610g_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_fyj4sdcn610g_API, "mod_fyj4sdcn610g._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_FYP7NACLKREF_H
+#define MOD_FYP7NACLKREF_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_C_complex_3d_expr(t_ndarray x, t_ndarray y);
+#endif // mod_fyp7naclkref_H
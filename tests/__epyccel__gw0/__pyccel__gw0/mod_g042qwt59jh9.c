@@ -0,0 +1,20 @@
+#include "mod_g042qwt59jh9.h"
+
+
+/*........................................*/
+int64_t var_negative_index(int64_t n, int64_t idx)
+{
+    t_ndarray a = {.raw_data = NULL};
+    int64_t i;
+    int64_t Out_0001;
+    a = array_create(1, (int64_t[]){n}, nd_int64, false, order_c);
+    for (i = INT64_C(0); i < n; i += INT64_C(1))
+    {
+        GET_ELEMENT(a, nd_int64, i < INT64_C(0) ? a.shape[INT64_C(0)] + i : i) = i;
+    }
+    Out_0001 = GET_ELEMENT(a, nd_int64, idx < INT64_C(0) ? a.shape[INT64_C(0)] + idx : idx);
+    free_array(&a);
+    return Out_0001;
+}
+/*........................................*/
+
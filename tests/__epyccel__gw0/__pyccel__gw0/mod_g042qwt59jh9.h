@@ -0,0 +1,11 @@
+#ifndef MOD_G042QWT59JH9_H
+#define MOD_G042QWT59JH9_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t var_negative_index(int64_t n, int64_t idx);
+#endif // mod_g042qwt59jh9_H
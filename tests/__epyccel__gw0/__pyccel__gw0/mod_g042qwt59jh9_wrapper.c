@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_G042QWT59JH9_WRAPPER
+
+#include "mod_g042qwt59jh9_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* var_negative_index_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* n_obj;
+    PyObject* idx_obj;
+    int64_t n;
+    int64_t idx;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "n",
+        "idx",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &n_obj, &idx_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    if (PyIs_NativeInt(idx_obj))
+    {
+        idx = PyInt64_to_Int64(idx_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument idx");
+        return NULL;
+    }
+    Out_0001 = var_negative_index(n, idx);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_g042qwt59jh9_methods[] = {
+    {
+        "var_negative_index",
+        (PyCFunction)var_negative_index_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_g042qwt59jh9_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_g042qwt59jh9",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_g042qwt59jh9_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_g042qwt59jh9(void)
+{
+    PyObject* mod;
+    static void* Pymod_g042qwt59jh9_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_g042qwt59jh9_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_g042qwt59jh9_API, "mod_g042qwt59jh9._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_G1M0S38E8CJ3_H
+#define MOD_G1M0S38E8CJ3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_1(t_ndarray a);
+#endif // mod_g1m0s38e8cj3_H
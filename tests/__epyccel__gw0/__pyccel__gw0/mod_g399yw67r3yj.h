@@ -0,0 +1,10 @@
+#ifndef MOD_G399YW67R3YJ_H
+#define MOD_G399YW67R3YJ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_range_sum_critical(int64_t x);
+#endif // mod_g399yw67r3yj_H
@@ -0,0 +1,11 @@
+#ifndef MOD_G415D9PD12ED_H
+#define MOD_G415D9PD12ED_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_barrier(void);
+#endif // mod_g415d9pd12ed_H
@@ -0,0 +1,47 @@
+module mod_g5fizluy111u
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i64 => &
+        C_INT64_T
+  use Set_logical_mod
+  use Set_logical_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine union_tuple(Out_0001, Out_0002, Out_0003) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    logical(b1), intent(out) :: Out_0002
+    logical(b1), intent(out) :: Out_0003
+    type(Set_logical) :: a
+    logical(b1), allocatable :: b(:)
+    type(Set_logical) :: d
+    logical(b1) :: Dummy_0000
+    integer(i64) :: Dummy_0001
+
+    a = Set_logical([.True._b1])
+    allocate(b(0:0_i64))
+    b = [.False._b1]
+    d = Set_logical(a)
+    do Dummy_0001 = 0_i64, 0_i64
+      Dummy_0000 = b(Dummy_0001)
+      call d % insert( Dummy_0000 )
+    end do
+    Out_0001 = d % size()
+    Out_0002 = Set_logical_pop(d)
+
+    Out_0003 = Set_logical_pop(d)
+
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    return
+
+  end subroutine union_tuple
+  !........................................
+
+end module mod_g5fizluy111u
@@ -0,0 +1,11 @@
+#ifndef MOD_G6XYLH8M6PZ7_H
+#define MOD_G6XYLH8M6PZ7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_C_array_initialization_2(t_ndarray a, t_ndarray e, t_ndarray f, t_ndarray x);
+#endif // mod_g6xylh8m6pz7_H
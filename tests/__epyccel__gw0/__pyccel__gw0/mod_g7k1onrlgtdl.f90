@@ -0,0 +1,23 @@
+module mod_g7k1onrlgtdl
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f2(x) result(y)
+
+    implicit none
+
+    integer(i64) :: y
+    integer(i64), intent(in) :: x(0_i64:)
+
+    y = x(0_i64) - 1_i64
+    return
+
+  end function f2
+  !........................................
+
+end module mod_g7k1onrlgtdl
@@ -0,0 +1,93 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_G7K1ONRLGTDL_WRAPPER
+
+#include "mod_g7k1onrlgtdl_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    int64_t x_strides[1];
+    int64_t y;
+    PyObject* y_obj;
+    static const char* const kwlist[] = {
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT64, INT64_C(1), STRIDED_C_ORDER))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    y = bind_c_f2(x_data, x_shape[INT64_C(0)], x_strides[INT64_C(0)]);
+    y_obj = Int64_to_NumpyLong(&y);
+    return y_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_g7k1onrlgtdl_methods[] = {
+    {
+        "f2",
+        (PyCFunction)bind_c_f2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_g7k1onrlgtdl_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_g7k1onrlgtdl",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_g7k1onrlgtdl_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_g7k1onrlgtdl(void)
+{
+    PyObject* mod;
+    static void* Pymod_g7k1onrlgtdl_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_g7k1onrlgtdl_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_g7k1onrlgtdl_API, "mod_g7k1onrlgtdl._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
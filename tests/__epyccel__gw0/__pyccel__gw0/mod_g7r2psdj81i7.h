@@ -0,0 +1,11 @@
+#ifndef MOD_G7R2PSDJ81I7_H
+#define MOD_G7R2PSDJ81I7_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_barrier(void);
+#endif // mod_g7r2psdj81i7_H
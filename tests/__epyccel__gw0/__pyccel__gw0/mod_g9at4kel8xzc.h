@@ -0,0 +1,12 @@
+#ifndef MOD_G9AT4KEL8XZC_H
+#define MOD_G9AT4KEL8XZC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t test_multiple_negative_index_2(int64_t c, int64_t d, double* x, int64_t* y);
+#endif // mod_g9at4kel8xzc_H
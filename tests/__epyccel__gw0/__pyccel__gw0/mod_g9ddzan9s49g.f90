@@ -0,0 +1,29 @@
+module mod_g9ddzan9s49g
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , b1 => &
+        C_BOOL
+
+  implicit none
+
+  contains
+
+  !........................................
+  function non_negative(i) result(Out_0001)
+
+    implicit none
+
+    logical(b1) :: Out_0001
+    integer(i64), value :: i
+
+    if (i < 0_i64) then
+      Out_0001 = .False._b1
+      return
+    else
+      Out_0001 = .True._b1
+      return
+    end if
+
+  end function non_negative
+  !........................................
+
+end module mod_g9ddzan9s49g
@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_G9DDZAN9S49G_WRAPPER
+
+#include "mod_g9ddzan9s49g_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_non_negative_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* i_obj;
+    int64_t i;
+    bool Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "i",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &i_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(i_obj))
+    {
+        i = PyInt64_to_Int64(i_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument i");
+        return NULL;
+    }
+    Out_0001 = bind_c_non_negative(i);
+    Out_0001_obj = Bool_to_PyBool(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_g9ddzan9s49g_methods[] = {
+    {
+        "non_negative",
+        (PyCFunction)bind_c_non_negative_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_g9ddzan9s49g_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_g9ddzan9s49g",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_g9ddzan9s49g_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_g9ddzan9s49g(void)
+{
+    PyObject* mod;
+    static void* Pymod_g9ddzan9s49g_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_g9ddzan9s49g_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_g9ddzan9s49g_API, "mod_g9ddzan9s49g._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,8 @@
+
+def skip_ahead(seed : 'int', n_blocks : 'int'):
+    from pyccel.random import Generator
+    rng = Generator(seed, 0)
+    Dummy_0000 = rng.random()
+    rng.advance(n_blocks)
+    return rng.integers(0, 1000000)
+
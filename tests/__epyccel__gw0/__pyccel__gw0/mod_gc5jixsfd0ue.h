@@ -0,0 +1,11 @@
+#ifndef MOD_GC5JIXSFD0UE_H
+#define MOD_GC5JIXSFD0UE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_1(t_ndarray a);
+#endif // mod_gc5jixsfd0ue_H
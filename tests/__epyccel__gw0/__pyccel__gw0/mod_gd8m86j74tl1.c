@@ -0,0 +1,17 @@
+#include "mod_gd8m86j74tl1.h"
+
+
+/*........................................*/
+int64_t for_loop1(int64_t start, int64_t stop, int64_t step)
+{
+    int64_t i;
+    int64_t x;
+    x = INT64_C(0);
+    for (i = start; (step > 0) ? (i < stop) : (i > stop); i += step)
+    {
+        x += i;
+    }
+    return x;
+}
+/*........................................*/
+
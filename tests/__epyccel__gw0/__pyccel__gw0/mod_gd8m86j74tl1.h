@@ -0,0 +1,10 @@
+#ifndef MOD_GD8M86J74TL1_H
+#define MOD_GD8M86J74TL1_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t for_loop1(int64_t start, int64_t stop, int64_t step);
+#endif // mod_gd8m86j74tl1_H
@@ -0,0 +1,23 @@
+module mod_gdvv9v2ptlq6
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f1() result(value_0001)
+
+    implicit none
+
+    real(f64) :: value_0001
+
+    value_0001 = (2_i64 * 3.141592653589793_f64) ** (3.0_f64 / 2.0_f64)
+    return
+
+  end function f1
+  !........................................
+
+end module mod_gdvv9v2ptlq6
@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_GDVV9V2PTLQ6_WRAPPER
+
+#include "mod_gdvv9v2ptlq6_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double value_0001;
+    PyObject* value_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    value_0001 = bind_c_f1();
+    value_0001_obj = Double_to_PyDouble(&value_0001);
+    return value_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_gdvv9v2ptlq6_methods[] = {
+    {
+        "f1",
+        (PyCFunction)bind_c_f1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_gdvv9v2ptlq6_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_gdvv9v2ptlq6",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_gdvv9v2ptlq6_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_gdvv9v2ptlq6(void)
+{
+    PyObject* mod;
+    static void* Pymod_gdvv9v2ptlq6_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_gdvv9v2ptlq6_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_gdvv9v2ptlq6_API, "mod_gdvv9v2ptlq6._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,132 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_GHEWW88URVCR_WRAPPER
+
+#include "mod_gheww88urvcr_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_parallel_array_reductions_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    PyObject* c_obj;
+    void* a_data = NULL;
+    int64_t a_shape[2];
+    int64_t a_strides[2];
+    void* b_data = NULL;
+    int64_t b_shape[1];
+    int64_t b_strides[1];
+    void* c_data = NULL;
+    int64_t c_shape[2];
+    int64_t c_strides[2];
+    PyObject* s_obj;
+    double s;
+    PyObject* m_obj;
+    int32_t m;
+    PyObject* n_obj;
+    double n;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        "c",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &a_obj, &b_obj, &c_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        a_data = PyArray_DATA((PyArrayObject*)(a_obj));
+        get_strides_and_shape_from_numpy_array(a_obj, a_shape, a_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("b", b_obj, NPY_INT32, INT64_C(1), NO_ORDER_CHECK))
+    {
+        b_data = PyArray_DATA((PyArrayObject*)(b_obj));
+        get_strides_and_shape_from_numpy_array(b_obj, b_shape, b_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("c", c_obj, NPY_DOUBLE, INT64_C(2), STRIDED_F_ORDER))
+    {
+        c_data = PyArray_DATA((PyArrayObject*)(c_obj));
+        get_strides_and_shape_from_numpy_array(c_obj, c_shape, c_strides, 0);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_parallel_array_reductions(a_data, a_shape[INT64_C(0)], a_shape[INT64_C(1)], a_strides[INT64_C(0)], a_strides[INT64_C(1)], b_data, b_shape[INT64_C(0)], b_strides[INT64_C(0)], c_data, c_shape[INT64_C(0)], c_shape[INT64_C(1)], c_strides[INT64_C(0)], c_strides[INT64_C(1)], &s, &m, &n);
+    s_obj = Double_to_NumpyDouble(&s);
+    m_obj = Int32_to_NumpyLong(&m);
+    n_obj = Double_to_NumpyDouble(&n);
+    Out_obj = Py_BuildValue("OOO", s_obj, m_obj, n_obj);
+    Py_DECREF(s_obj);
+    Py_DECREF(m_obj);
+    Py_DECREF(n_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_gheww88urvcr_methods[] = {
+    {
+        "parallel_array_reductions",
+        (PyCFunction)bind_c_parallel_array_reductions_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_gheww88urvcr_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_gheww88urvcr",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_gheww88urvcr_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_gheww88urvcr(void)
+{
+    PyObject* mod;
+    static void* Pymod_gheww88urvcr_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_gheww88urvcr_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_gheww88urvcr_API, "mod_gheww88urvcr._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_GHK9IR8LLDY2_H
+#define MOD_GHK9IR8LLDY2_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void copy_to_slice_1(t_ndarray a, t_ndarray b);
+#endif // mod_ghk9ir8lldy2_H
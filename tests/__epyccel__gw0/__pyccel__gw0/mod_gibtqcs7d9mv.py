@@ -0,0 +1,8 @@
+from numpy import array
+
+def array_int_1d_initialization_2():
+    from numpy import sum, array
+    a = [1, 2, 4, 8, 16]
+    b = array(a)
+    return sum(b),b[0],b[-1]
+
@@ -0,0 +1,384 @@
+#include "mod_gidqu5wsdakn.h"
+
+
+/*........................................*/
+int64_t return_multi_array_scalar_op_0000(int8_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    int8_t array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_int8=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int8,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int8_t array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_int8=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int8,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((int8_t)1, x);
+    array_fill((int8_t)1, y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int8, false, order_c);
+    {
+        int8_t* restrict y_data = y.nd_int8;
+        int8_t* restrict x_data = x.nd_int8;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int8[i] = x_data[i] * a;
+            (*Out_0002).nd_int8[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0001(int16_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    int16_t array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_int16=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int16,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int16_t array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_int16=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int16,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((int16_t)1, x);
+    array_fill((int16_t)1, y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int16, false, order_c);
+    {
+        int16_t* restrict y_data = y.nd_int16;
+        int16_t* restrict x_data = x.nd_int16;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int16[i] = x_data[i] * a;
+            (*Out_0002).nd_int16[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0002(int32_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    int32_t array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_int32=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int32,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int32_t array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_int32=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int32,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((int32_t)1, x);
+    array_fill((int32_t)1, y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int32, false, order_c);
+    {
+        int32_t* restrict y_data = y.nd_int32;
+        int32_t* restrict x_data = x.nd_int32;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int32[i] = x_data[i] * a;
+            (*Out_0002).nd_int32[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0003(int64_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    int64_t array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((int64_t)INT64_C(1), x);
+    array_fill((int64_t)INT64_C(1), y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data = y.nd_int64;
+        int64_t* restrict x_data = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int64[i] = x_data[i] * a;
+            (*Out_0002).nd_int64[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0004(int64_t a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    int64_t array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((int64_t)INT64_C(1), x);
+    array_fill((int64_t)INT64_C(1), y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data = y.nd_int64;
+        int64_t* restrict x_data = x.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_int64[i] = x_data[i] * a;
+            (*Out_0002).nd_int64[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0005(float a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    float array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_float=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_float,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    float array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_float=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_float,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((float)1.0f, x);
+    array_fill((float)1.0f, y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_float, false, order_c);
+    {
+        float* restrict y_data = y.nd_float;
+        float* restrict x_data = x.nd_float;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_float[i] = x_data[i] * a;
+            (*Out_0002).nd_float[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0006(double a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    double array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_double=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((double)1.0, x);
+    array_fill((double)1.0, y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        double* restrict x_data = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_double[i] = x_data[i] * a;
+            (*Out_0002).nd_double[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0007(double a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    double array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_double=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((double)1.0, x);
+    array_fill((double)1.0, y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        double* restrict x_data = x.nd_double;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_double[i] = x_data[i] * a;
+            (*Out_0002).nd_double[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0008(float complex a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    float complex array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_cfloat=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_cfloat,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    float complex array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_cfloat=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_cfloat,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((float complex)(1.0f + 0.0f * _Complex_I), x);
+    array_fill((float complex)(1.0f + 0.0f * _Complex_I), y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict y_data = y.nd_cfloat;
+        float complex* restrict x_data = x.nd_cfloat;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_cfloat[i] = x_data[i] * a;
+            (*Out_0002).nd_cfloat[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t return_multi_array_scalar_op_0009(double complex a, t_ndarray* Out_0001, t_ndarray* Out_0002)
+{
+    double complex array_dummy[INT64_C(5)];
+    t_ndarray x = (t_ndarray){
+        .nd_cdouble=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_cdouble,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double complex array_dummy_0001[INT64_C(5)];
+    t_ndarray y = (t_ndarray){
+        .nd_cdouble=array_dummy_0001,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_cdouble,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    array_fill((double complex)(1.0 + 0.0 * _Complex_I), x);
+    array_fill((double complex)(1.0 + 0.0 * _Complex_I), y);
+    (*Out_0002) = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    (*Out_0001) = array_create(1, (int64_t[]){INT64_C(5)}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict y_data = y.nd_cdouble;
+        double complex* restrict x_data = x.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(5); i += INT64_C(1))
+        {
+            (*Out_0001).nd_cdouble[i] = x_data[i] * a;
+            (*Out_0002).nd_cdouble[i] = y_data[i] * a;
+        }
+    }
+    return 0;
+}
+/*........................................*/
+
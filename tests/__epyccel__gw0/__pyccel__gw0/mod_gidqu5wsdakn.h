@@ -0,0 +1,21 @@
+#ifndef MOD_GIDQU5WSDAKN_H
+#define MOD_GIDQU5WSDAKN_H
+
+#include <complex.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t return_multi_array_scalar_op_0000(int8_t a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+int64_t return_multi_array_scalar_op_0001(int16_t a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+int64_t return_multi_array_scalar_op_0002(int32_t a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+int64_t return_multi_array_scalar_op_0003(int64_t a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+int64_t return_multi_array_scalar_op_0004(int64_t a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+int64_t return_multi_array_scalar_op_0005(float a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+int64_t return_multi_array_scalar_op_0006(double a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+int64_t return_multi_array_scalar_op_0007(double a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+int64_t return_multi_array_scalar_op_0008(float complex a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+int64_t return_multi_array_scalar_op_0009(double complex a, t_ndarray* Out_0001, t_ndarray* Out_0002);
+#endif // mod_gidqu5wsdakn_H
@@ -0,0 +1,406 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_GIDQU5WSDAKN_WRAPPER
+
+#include "mod_gidqu5wsdakn_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0000_wrapper(PyObject* a_obj)
+{
+    int8_t a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt8_to_Int8(a_obj);
+    return_multi_array_scalar_op_0000(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0001_wrapper(PyObject* a_obj)
+{
+    int16_t a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt16_to_Int16(a_obj);
+    return_multi_array_scalar_op_0001(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0002_wrapper(PyObject* a_obj)
+{
+    int32_t a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt32_to_Int32(a_obj);
+    return_multi_array_scalar_op_0002(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0003_wrapper(PyObject* a_obj)
+{
+    int64_t a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt64_to_Int64(a_obj);
+    return_multi_array_scalar_op_0003(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0004_wrapper(PyObject* a_obj)
+{
+    int64_t a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyInt64_to_Int64(a_obj);
+    return_multi_array_scalar_op_0004(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0005_wrapper(PyObject* a_obj)
+{
+    float a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyFloat_to_Float(a_obj);
+    return_multi_array_scalar_op_0005(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0006_wrapper(PyObject* a_obj)
+{
+    double a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyDouble_to_Double(a_obj);
+    return_multi_array_scalar_op_0006(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0007_wrapper(PyObject* a_obj)
+{
+    double a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyDouble_to_Double(a_obj);
+    return_multi_array_scalar_op_0007(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0008_wrapper(PyObject* a_obj)
+{
+    float complex a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyComplex_to_Complex64(a_obj);
+    return_multi_array_scalar_op_0008(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_multi_array_scalar_op_0009_wrapper(PyObject* a_obj)
+{
+    double complex a;
+    PyObject* Out_0001_obj;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0002_obj;
+    t_ndarray Out_0002 = {.raw_data = NULL};
+    PyObject* Out_obj;
+    a = PyComplex_to_Complex128(a_obj);
+    return_multi_array_scalar_op_0009(a, &Out_0001, &Out_0002);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    Out_0002_obj = ndarray_to_pyarray(Out_0002);
+    free_pointer(&Out_0002);
+    Out_obj = Py_BuildValue("OO", Out_0001_obj, Out_0002_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t return_multi_array_scalar_op_type_check(PyObject* a_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_Int8(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int16(a_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Int32(a_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Int64(a_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_NativeInt(a_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_Float(a_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (PyIs_Double(a_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_NativeFloat(a_obj))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (PyIs_Complex64(a_obj))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else if (PyIs_Complex128(a_obj))
+    {
+        type_indicator += INT64_C(9);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* return_multi_array_scalar_op_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    type_indicator = return_multi_array_scalar_op_type_check(a_obj);
+    switch (type_indicator)
+    {
+        case INT64_C(0):
+        {
+            return return_multi_array_scalar_op_0000_wrapper(a_obj);
+        }
+        case INT64_C(1):
+        {
+            return return_multi_array_scalar_op_0001_wrapper(a_obj);
+        }
+        case INT64_C(2):
+        {
+            return return_multi_array_scalar_op_0002_wrapper(a_obj);
+        }
+        case INT64_C(3):
+        {
+            return return_multi_array_scalar_op_0003_wrapper(a_obj);
+        }
+        case INT64_C(4):
+        {
+            return return_multi_array_scalar_op_0004_wrapper(a_obj);
+        }
+        case INT64_C(5):
+        {
+            return return_multi_array_scalar_op_0005_wrapper(a_obj);
+        }
+        case INT64_C(6):
+        {
+            return return_multi_array_scalar_op_0006_wrapper(a_obj);
+        }
+        case INT64_C(7):
+        {
+            return return_multi_array_scalar_op_0007_wrapper(a_obj);
+        }
+        case INT64_C(8):
+        {
+            return return_multi_array_scalar_op_0008_wrapper(a_obj);
+        }
+        case INT64_C(9):
+        {
+            return return_multi_array_scalar_op_0009_wrapper(a_obj);
+        }
+        default:
+        {
+            PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+            return NULL;
+        }
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_gidqu5wsdakn_methods[] = {
+    {
+        "return_multi_array_scalar_op",
+        (PyCFunction)return_multi_array_scalar_op_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_gidqu5wsdakn_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_gidqu5wsdakn",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_gidqu5wsdakn_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_gidqu5wsdakn(void)
+{
+    PyObject* mod;
+    static void* Pymod_gidqu5wsdakn_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_gidqu5wsdakn_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_gidqu5wsdakn_API, "mod_gidqu5wsdakn._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,42 @@
+#ifndef MOD_GIDQU5WSDAKN_WRAPPER_H
+#define MOD_GIDQU5WSDAKN_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_gidqu5wsdakn.h"
+
+
+#ifdef MOD_GIDQU5WSDAKN_WRAPPER
+
+
+#else
+
+static void** Pymod_gidqu5wsdakn_API;
+
+
+/*........................................*/
+static int mod_gidqu5wsdakn_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_gidqu5wsdakn_API = (void**)PyCapsule_Import("mod_gidqu5wsdakn._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_gidqu5wsdakn_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_GIDQU5WSDAKN_WRAPPER_H
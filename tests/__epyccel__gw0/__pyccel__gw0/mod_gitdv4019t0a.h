@@ -0,0 +1,11 @@
+#ifndef MOD_GITDV4019T0A_H
+#define MOD_GITDV4019T0A_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_mul(t_ndarray x, t_ndarray y);
+#endif // mod_gitdv4019t0a_H
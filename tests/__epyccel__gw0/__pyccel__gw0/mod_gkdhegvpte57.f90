@@ -0,0 +1,54 @@
+module mod_gkdhegvpte57
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine union_int(Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    integer(i64), intent(out) :: Out_0006
+    integer(i64), intent(out) :: Out_0007
+    integer(i64), intent(out) :: Out_0008
+    type(Set_integer8) :: a
+    type(Set_integer8) :: b
+    type(Set_integer8) :: c
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64, 4_i64])
+    b = Set_integer8([5_i64, 6_i64, 7_i64, 2_i64])
+    c = Set_integer8(a)
+    call c % merge(a)
+    call c % merge(b)
+    Out_0001 = c % size()
+    Out_0002 = Set_integer8_pop(c)
+
+    Out_0003 = Set_integer8_pop(c)
+
+    Out_0004 = Set_integer8_pop(c)
+
+    Out_0005 = Set_integer8_pop(c)
+
+    Out_0006 = Set_integer8_pop(c)
+
+    Out_0007 = Set_integer8_pop(c)
+
+    Out_0008 = Set_integer8_pop(c)
+
+    return
+
+  end subroutine union_int
+  !........................................
+
+end module mod_gkdhegvpte57
@@ -0,0 +1,40 @@
+#ifndef MOD_GN2J95PUXO1D_WRAPPER_H
+#define MOD_GN2J95PUXO1D_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_gn2j95puxo1d.h"
+
+
+#ifdef MOD_GN2J95PUXO1D_WRAPPER
+
+
+#else
+
+static void** Pymod_gn2j95puxo1d_API;
+
+
+/*........................................*/
+static int mod_gn2j95puxo1d_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_gn2j95puxo1d_API = (void**)PyCapsule_Import("mod_gn2j95puxo1d._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_gn2j95puxo1d_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_GN2J95PUXO1D_WRAPPER_H
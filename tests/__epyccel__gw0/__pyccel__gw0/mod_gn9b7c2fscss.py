@@ -0,0 +1,7 @@
+from numpy import shape
+
+def array_1d_slice_stride_1(a : 'int[::]'):
+    from numpy import sum
+    b = a[::1]
+    return sum(b),b[0],b[-1],shape(b)[0]
+
@@ -0,0 +1,12 @@
+#ifndef MOD_GNXL7ZHKDMZ8_H
+#define MOD_GNXL7ZHKDMZ8_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_4(int64_t* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_gnxl7zhkdmz8_H
@@ -0,0 +1,31 @@
+module mod_go4e643qxqui
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f6_1(m1, m2, x) 
+
+    implicit none
+
+    integer(i64), value :: m1
+    integer(i64), value :: m2
+    real(f64), intent(inout) :: x(0_i64:, 0_i64:)
+    integer(i64) :: i
+    integer(i64) :: j
+
+    x(:, :) = 0.0_f64
+    do i = 0_i64, m1 - 1_i64
+      do j = 0_i64, m2 - 1_i64
+        x(j, i) = (2_i64 * i + j) * 1.0_f64
+      end do
+    end do
+
+  end subroutine f6_1
+  !........................................
+
+end module mod_go4e643qxqui
@@ -0,0 +1,11 @@
+#ifndef MOD_GOBRIATSFD6M_H
+#define MOD_GOBRIATSFD6M_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_expression(t_ndarray A, t_ndarray B, t_ndarray C, t_ndarray out);
+#endif // mod_gobriatsfd6m_H
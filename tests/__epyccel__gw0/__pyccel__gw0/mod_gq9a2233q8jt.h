@@ -0,0 +1,11 @@
+#ifndef MOD_GQ9A2233Q8JT_H
+#define MOD_GQ9A2233Q8JT_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_C_slice_15(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_gq9a2233q8jt_H
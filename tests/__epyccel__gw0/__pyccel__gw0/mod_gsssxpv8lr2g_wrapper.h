@@ -0,0 +1,40 @@
+#ifndef MOD_GSSSXPV8LR2G_WRAPPER_H
+#define MOD_GSSSXPV8LR2G_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_GSSSXPV8LR2G_WRAPPER
+
+double complex bind_c_f22(double complex);
+
+#else
+
+static void** Pymod_gsssxpv8lr2g_API;
+
+
+/*........................................*/
+static int mod_gsssxpv8lr2g_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_gsssxpv8lr2g_API = (void**)PyCapsule_Import("mod_gsssxpv8lr2g._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_gsssxpv8lr2g_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_GSSSXPV8LR2G_WRAPPER_H
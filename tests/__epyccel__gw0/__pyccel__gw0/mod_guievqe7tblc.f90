@@ -0,0 +1,23 @@
+module mod_guievqe7tblc
+
+  use, intrinsic :: ISO_C_Binding, only : c64 => C_DOUBLE_COMPLEX
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f20(a) result(b)
+
+    implicit none
+
+    complex(c64) :: b
+    complex(c64), value :: a
+
+    b = a
+    return
+
+  end function f20
+  !........................................
+
+end module mod_guievqe7tblc
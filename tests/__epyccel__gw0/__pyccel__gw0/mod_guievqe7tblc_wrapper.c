@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_GUIEVQE7TBLC_WRAPPER
+
+#include "mod_guievqe7tblc_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f20_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    double complex a;
+    double complex b;
+    PyObject* b_obj;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeComplex(a_obj))
+    {
+        a = PyComplex_to_Complex128(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type complex for argument a");
+        return NULL;
+    }
+    b = bind_c_f20(a);
+    b_obj = Complex128_to_PyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_guievqe7tblc_methods[] = {
+    {
+        "f20",
+        (PyCFunction)bind_c_f20_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_guievqe7tblc_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_guievqe7tblc",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_guievqe7tblc_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_guievqe7tblc(void)
+{
+    PyObject* mod;
+    static void* Pymod_guievqe7tblc_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_guievqe7tblc_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_guievqe7tblc_API, "mod_guievqe7tblc._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,12 @@
+#ifndef MOD_GYMA67CNUTOP_H
+#define MOD_GYMA67CNUTOP_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_2d_C_scalar_idiv(t_ndarray x, int32_t a);
+#endif // mod_gyma67cnutop_H
@@ -0,0 +1,11 @@
+#ifndef MOD_H0A4U5TLRHQV_H
+#define MOD_H0A4U5TLRHQV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_3d_F_array_initialization_1(t_ndarray x, t_ndarray y, t_ndarray a);
+#endif // mod_h0a4u5tlrhqv_H
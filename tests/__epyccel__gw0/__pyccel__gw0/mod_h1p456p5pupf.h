@@ -0,0 +1,11 @@
+#ifndef MOD_H1P456P5PUPF_H
+#define MOD_H1P456P5PUPF_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray arr_tuple_slice_index(t_ndarray a);
+#endif // mod_h1p456p5pupf_H
@@ -0,0 +1,17 @@
+#include "mod_h2sxjnw12lll.h"
+
+
+/*........................................*/
+int64_t factorial(int64_t n)
+{
+    int64_t i;
+    int64_t x;
+    x = INT64_C(1);
+    for (i = INT64_C(2); i < n + INT64_C(1); i += INT64_C(1))
+    {
+        x *= i;
+    }
+    return x;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_H2SXJNW12LLL_H
+#define MOD_H2SXJNW12LLL_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t factorial(int64_t n);
+#endif // mod_h2sxjnw12lll_H
@@ -0,0 +1,40 @@
+#ifndef MOD_H2SXJNW12LLL_WRAPPER_H
+#define MOD_H2SXJNW12LLL_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_h2sxjnw12lll.h"
+
+
+#ifdef MOD_H2SXJNW12LLL_WRAPPER
+
+
+#else
+
+static void** Pymod_h2sxjnw12lll_API;
+
+
+/*........................................*/
+static int mod_h2sxjnw12lll_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_h2sxjnw12lll_API = (void**)PyCapsule_Import("mod_h2sxjnw12lll._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_h2sxjnw12lll_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_H2SXJNW12LLL_WRAPPER_H
@@ -0,0 +1,13 @@
+#ifndef MOD_H4U8RHWNJ9S2_H
+#define MOD_H4U8RHWNJ9S2_H
+
+#include "ndarrays.h"
+#include "omp.h"
+#include "pyc_random_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void thread_sums(int64_t seed, t_ndarray sums);
+#endif // mod_h4u8rhwnj9s2_H
@@ -0,0 +1,6 @@
+
+def homogeneous_tuple_string():
+    ai = ('hello', 'tuple', 'world', '!!')
+    i = 1
+    return ai[0],ai[i],ai[2],ai[3]
+
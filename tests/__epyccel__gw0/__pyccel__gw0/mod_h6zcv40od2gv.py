@@ -0,0 +1,10 @@
+
+def f():
+    def g():
+        a = [4, 5]
+        return a
+    lst = [1, 2, 3]
+    Dummy_0000 = g()
+    for index in Dummy_0000:
+        lst.append(index)
+
@@ -0,0 +1,12 @@
+#ifndef MOD_H814WJNXY7Y3_H
+#define MOD_H814WJNXY7Y3_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+void array_float_2d_F_array_initialization(t_ndarray a);
+#endif // mod_h814wjnxy7y3_H
@@ -0,0 +1,11 @@
+#ifndef MOD_H8W6E1K6BEMS_H
+#define MOD_H8W6E1K6BEMS_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_h8w6e1k6bems_H
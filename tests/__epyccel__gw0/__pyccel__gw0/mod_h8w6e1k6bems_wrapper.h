@@ -0,0 +1,40 @@
+#ifndef MOD_H8W6E1K6BEMS_WRAPPER_H
+#define MOD_H8W6E1K6BEMS_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_h8w6e1k6bems.h"
+
+
+#ifdef MOD_H8W6E1K6BEMS_WRAPPER
+
+
+#else
+
+static void** Pymod_h8w6e1k6bems_API;
+
+
+/*........................................*/
+static int mod_h8w6e1k6bems_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_h8w6e1k6bems_API = (void**)PyCapsule_Import("mod_h8w6e1k6bems._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_h8w6e1k6bems_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_H8W6E1K6BEMS_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_H9RD5E0AYQ82_H
+#define MOD_H9RD5E0AYQ82_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_scalar_sub(t_ndarray x, double a);
+#endif // mod_h9rd5e0ayq82_H
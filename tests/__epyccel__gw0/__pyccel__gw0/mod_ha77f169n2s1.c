@@ -0,0 +1,19 @@
+#include "mod_ha77f169n2s1.h"
+
+
+/*........................................*/
+int64_t array_1d_slice_stride_23(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004)
+{
+    int64_t c;
+    t_ndarray b = {.raw_data = NULL};
+    c = -INT64_C(5);
+    b = array_slicing(a, 1, new_slice(c > INT64_C(0) ? INT64_C(0) : a.shape[INT64_C(0)] - INT64_C(1), c > INT64_C(0) ? a.shape[INT64_C(0)] : INT64_C(0), c, RANGE));
+    (*Out_0001) = numpy_sum_int64(b);
+    (*Out_0002) = GET_ELEMENT(b, nd_int64, INT64_C(0));
+    (*Out_0003) = GET_ELEMENT(b, nd_int64, b.shape[INT64_C(0)] - INT64_C(1));
+    (*Out_0004) = b.shape[INT64_C(0)];
+    free_pointer(&b);
+    return 0;
+}
+/*........................................*/
+
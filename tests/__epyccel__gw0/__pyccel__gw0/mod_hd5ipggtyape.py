@@ -0,0 +1,10 @@
+from numpy import float64, array
+
+def unpack_array_2D_of_known_size():
+    from numpy import sum, array
+    arr = array([[1, 2, 3], [4, 5, 6], [7, 8, 9]], dtype = float64, order='C')
+    x = arr[0,::]
+    y = arr[1,::]
+    z = arr[2,::]
+    return sum(x),sum(y),sum(z)
+
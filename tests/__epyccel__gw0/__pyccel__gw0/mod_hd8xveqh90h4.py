@@ -0,0 +1,5 @@
+
+def pop_last_element():
+    a = [1.5, 3.1, 4.5]
+    return a.pop()
+
@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_HDSGW9L5KNFU_WRAPPER
+
+#include "mod_hdsgw9l5knfu_wrapper.h"
+#include <stdlib.h>
+#include <complex.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f21_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    float complex a;
+    float complex b;
+    PyObject* b_obj;
+    static const char* const kwlist[] = {
+        "a",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &a_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_Complex64(a_obj))
+    {
+        a = PyComplex_to_Complex64(a_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type numpy.complex64 for argument a");
+        return NULL;
+    }
+    b = bind_c_f21(a);
+    b_obj = Complex64_to_NumpyComplex(&b);
+    return b_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_hdsgw9l5knfu_methods[] = {
+    {
+        "f21",
+        (PyCFunction)bind_c_f21_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_hdsgw9l5knfu_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_hdsgw9l5knfu",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_hdsgw9l5knfu_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_hdsgw9l5knfu(void)
+{
+    PyObject* mod;
+    static void* Pymod_hdsgw9l5knfu_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_hdsgw9l5knfu_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_hdsgw9l5knfu_API, "mod_hdsgw9l5knfu._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
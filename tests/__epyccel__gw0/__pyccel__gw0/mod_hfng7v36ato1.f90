@@ -0,0 +1,23 @@
+module mod_hfng7v36ato1
+
+  use, intrinsic :: ISO_C_Binding, only : c32 => C_FLOAT_COMPLEX
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f21(a) result(b)
+
+    implicit none
+
+    complex(c32) :: b
+    complex(c32), value :: a
+
+    b = a
+    return
+
+  end function f21
+  !........................................
+
+end module mod_hfng7v36ato1
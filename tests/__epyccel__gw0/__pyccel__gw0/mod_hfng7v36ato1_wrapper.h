@@ -0,0 +1,40 @@
+#ifndef MOD_HFNG7V36ATO1_WRAPPER_H
+#define MOD_HFNG7V36ATO1_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_HFNG7V36ATO1_WRAPPER
+
+float complex bind_c_f21(float complex);
+
+#else
+
+static void** Pymod_hfng7v36ato1_API;
+
+
+/*........................................*/
+static int mod_hfng7v36ato1_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_hfng7v36ato1_API = (void**)PyCapsule_Import("mod_hfng7v36ato1._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_hfng7v36ato1_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_HFNG7V36ATO1_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_HG99IAI498WA_H
+#define MOD_HG99IAI498WA_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t get_max_threads(void);
+#endif // mod_hg99iai498wa_H
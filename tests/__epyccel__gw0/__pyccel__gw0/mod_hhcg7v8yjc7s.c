@@ -0,0 +1,40 @@
+#include "mod_hhcg7v8yjc7s.h"
+
+
+/*........................................*/
+int64_t tuples_mul_homogeneous5(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006)
+{
+    int64_t s;
+    double array_dummy[INT64_C(5)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(5)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    t_ndarray b = {.raw_data = NULL};
+    int64_t i;
+    int64_t i_0001;
+    s = INT64_C(2);
+    array_fill((double)1.0, a);
+    b = array_create(1, (int64_t[]){INT64_C(3) * (INT64_C(5) * s)}, nd_int64, false, order_c);
+    for (i_0001 = INT64_C(0); i_0001 < (INT64_C(5) * s); i_0001 += INT64_C(1))
+    {
+        GET_ELEMENT(b, nd_int64, INT64_C(3) * i_0001) = INT64_C(1);
+        GET_ELEMENT(b, nd_int64, INT64_C(1) + INT64_C(3) * i_0001) = INT64_C(2);
+        GET_ELEMENT(b, nd_int64, INT64_C(2) + INT64_C(3) * i_0001) = INT64_C(3);
+    }
+    i = INT64_C(1);
+    (*Out_0001) = GET_ELEMENT(b, nd_int64, INT64_C(0));
+    (*Out_0002) = GET_ELEMENT(b, nd_int64, i);
+    (*Out_0003) = GET_ELEMENT(b, nd_int64, INT64_C(2));
+    (*Out_0004) = GET_ELEMENT(b, nd_int64, INT64_C(3));
+    (*Out_0005) = GET_ELEMENT(b, nd_int64, INT64_C(4));
+    (*Out_0006) = GET_ELEMENT(b, nd_int64, INT64_C(5));
+    free_array(&b);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_HHCG7V8YJC7S_H
+#define MOD_HHCG7V8YJC7S_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuples_mul_homogeneous5(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_hhcg7v8yjc7s_H
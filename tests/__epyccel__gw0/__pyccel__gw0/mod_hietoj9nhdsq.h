@@ -0,0 +1,11 @@
+#ifndef MOD_HIETOJ9NHDSQ_H
+#define MOD_HIETOJ9NHDSQ_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_1(void);
+#endif // mod_hietoj9nhdsq_H
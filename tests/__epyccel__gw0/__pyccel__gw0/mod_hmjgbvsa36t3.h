@@ -0,0 +1,11 @@
+#ifndef MOD_HMJGBVSA36T3_H
+#define MOD_HMJGBVSA36T3_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_hmjgbvsa36t3_H
@@ -0,0 +1,42 @@
+#ifndef MOD_HMO3IX7SGYJ0_WRAPPER_H
+#define MOD_HMO3IX7SGYJ0_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_hmo3ix7sgyj0.h"
+
+
+#ifdef MOD_HMO3IX7SGYJ0_WRAPPER
+
+
+#else
+
+static void** Pymod_hmo3ix7sgyj0_API;
+
+
+/*........................................*/
+static int mod_hmo3ix7sgyj0_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_hmo3ix7sgyj0_API = (void**)PyCapsule_Import("mod_hmo3ix7sgyj0._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_hmo3ix7sgyj0_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_HMO3IX7SGYJ0_WRAPPER_H
@@ -0,0 +1,33 @@
+#include "mod_hn3jb5l81cm8.h"
+
+
+/*........................................*/
+int64_t union_int(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007, int64_t* Out_0008, int64_t* Out_0009, int64_t* Out_0010, int64_t* Out_0011)
+{
+    hset_int64_t a = {0};
+    hset_int64_t b = {0};
+    hset_int64_t c = {0};
+    hset_int64_t d = {0};
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4)});
+    b = c_init(hset_int64_t, {INT64_C(5), INT64_C(6), INT64_C(7)});
+    c = c_init(hset_int64_t, {INT64_C(8), INT64_C(9), INT64_C(10), INT64_C(4)});
+    d = hset_int64_t_union(&a, 3, &a, &b, &c);
+    (*Out_0001) = hset_int64_t_size(&d);
+    (*Out_0002) = hset_int64_t_pop(&d);
+    (*Out_0003) = hset_int64_t_pop(&d);
+    (*Out_0004) = hset_int64_t_pop(&d);
+    (*Out_0005) = hset_int64_t_pop(&d);
+    (*Out_0006) = hset_int64_t_pop(&d);
+    (*Out_0007) = hset_int64_t_pop(&d);
+    (*Out_0008) = hset_int64_t_pop(&d);
+    (*Out_0009) = hset_int64_t_pop(&d);
+    (*Out_0010) = hset_int64_t_pop(&d);
+    (*Out_0011) = hset_int64_t_pop(&d);
+    hset_int64_t_drop(&d);
+    hset_int64_t_drop(&c);
+    hset_int64_t_drop(&b);
+    hset_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,9 @@
+from numpy import shape, float64
+
+def arrs_similar_shapes_1():
+    from numpy import shape, zeros
+    i = 4
+    a = zeros((10), dtype = float64)
+    b = a[2:i:] + a[4:i + 2:]
+    return shape(b)[0]
+
@@ -0,0 +1,4 @@
+
+def p_func(x : 'int'):
+    x *= 2
+
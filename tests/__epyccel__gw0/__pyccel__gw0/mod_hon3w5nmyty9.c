@@ -0,0 +1,404 @@
+#include "mod_hon3w5nmyty9.h"
+
+
+/*........................................*/
+t_ndarray return_array_0000(int64_t a, int64_t b)
+{
+    int64_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    int64_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int64[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data = y.nd_int64;
+        int64_t* restrict x_data = x.nd_int64;
+        int64_t* restrict Out_0001_data = Out_0001.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0001(int8_t a, int8_t b)
+{
+    int8_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int8=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int8,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int8_t array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_int8=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int8,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    int8_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int8[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    int8_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int8[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int8, false, order_c);
+    {
+        int8_t* restrict y_data = y.nd_int8;
+        int8_t* restrict x_data = x.nd_int8;
+        int8_t* restrict Out_0001_data = Out_0001.nd_int8;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0002(int16_t a, int16_t b)
+{
+    int16_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int16=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int16,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int16_t array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_int16=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int16,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    int16_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int16[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    int16_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int16[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int16, false, order_c);
+    {
+        int16_t* restrict y_data = y.nd_int16;
+        int16_t* restrict x_data = x.nd_int16;
+        int16_t* restrict Out_0001_data = Out_0001.nd_int16;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0003(int32_t a, int32_t b)
+{
+    int32_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int32=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int32,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int32_t array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_int32=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int32,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    int32_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int32[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    int32_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int32[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int32, false, order_c);
+    {
+        int32_t* restrict y_data = y.nd_int32;
+        int32_t* restrict x_data = x.nd_int32;
+        int32_t* restrict Out_0001_data = Out_0001.nd_int32;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0004(int64_t a, int64_t b)
+{
+    int64_t array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_int64=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    int64_t array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_int64=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_int64,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    int64_t Dummy_0000[] = {a, b};
+    memcpy(&x.nd_int64[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    int64_t Dummy_0001[] = {a, b};
+    memcpy(&y.nd_int64[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    {
+        int64_t* restrict y_data = y.nd_int64;
+        int64_t* restrict x_data = x.nd_int64;
+        int64_t* restrict Out_0001_data = Out_0001.nd_int64;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0005(double a, double b)
+{
+    double array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_double=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    double Dummy_0001[] = {a, b};
+    memcpy(&y.nd_double[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0006(float a, float b)
+{
+    float array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_float=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_float,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    float array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_float=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_float,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    float Dummy_0000[] = {a, b};
+    memcpy(&x.nd_float[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    float Dummy_0001[] = {a, b};
+    memcpy(&y.nd_float[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_float, false, order_c);
+    {
+        float* restrict y_data = y.nd_float;
+        float* restrict x_data = x.nd_float;
+        float* restrict Out_0001_data = Out_0001.nd_float;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0007(double a, double b)
+{
+    double array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_double=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    double Dummy_0000[] = {a, b};
+    memcpy(&x.nd_double[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    double Dummy_0001[] = {a, b};
+    memcpy(&y.nd_double[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_double, false, order_c);
+    {
+        double* restrict y_data = y.nd_double;
+        double* restrict x_data = x.nd_double;
+        double* restrict Out_0001_data = Out_0001.nd_double;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0008(float complex a, float complex b)
+{
+    float complex array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_cfloat=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_cfloat,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    float complex array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_cfloat=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_cfloat,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    float complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cfloat[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    float complex Dummy_0001[] = {a, b};
+    memcpy(&y.nd_cfloat[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_cfloat, false, order_c);
+    {
+        float complex* restrict y_data = y.nd_cfloat;
+        float complex* restrict x_data = x.nd_cfloat;
+        float complex* restrict Out_0001_data = Out_0001.nd_cfloat;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+/*........................................*/
+t_ndarray return_array_0009(double complex a, double complex b)
+{
+    double complex array_dummy[INT64_C(2)];
+    t_ndarray x = (t_ndarray){
+        .nd_cdouble=array_dummy,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_cdouble,
+        .is_view=false
+    };
+    stack_array_init(&x);
+    double complex array_dummy_0001[INT64_C(2)];
+    t_ndarray y = (t_ndarray){
+        .nd_cdouble=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_cdouble,
+        .is_view=false
+    };
+    stack_array_init(&y);
+    int64_t i;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    double complex Dummy_0000[] = {a, b};
+    memcpy(&x.nd_cdouble[INT64_C(0)], Dummy_0000, 2 * x.type_size);
+    double complex Dummy_0001[] = {a, b};
+    memcpy(&y.nd_cdouble[INT64_C(0)], Dummy_0001, 2 * y.type_size);
+    Out_0001 = array_create(1, (int64_t[]){INT64_C(2)}, nd_cdouble, false, order_c);
+    {
+        double complex* restrict y_data = y.nd_cdouble;
+        double complex* restrict x_data = x.nd_cdouble;
+        double complex* restrict Out_0001_data = Out_0001.nd_cdouble;
+        for (i = INT64_C(0); i < INT64_C(2); i += INT64_C(1))
+        {
+            Out_0001_data[i] = x_data[i] + y_data[i];
+        }
+    }
+    return Out_0001;
+}
+/*........................................*/
+
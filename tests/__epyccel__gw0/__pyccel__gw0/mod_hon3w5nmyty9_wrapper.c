@@ -0,0 +1,393 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_HON3W5NMYTY9_WRAPPER
+
+#include "mod_hon3w5nmyty9_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+#include <complex.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0000_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t a;
+    int64_t b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = PyInt64_to_Int64(b_obj);
+    Out_0001 = return_array_0000(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0001_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int8_t a;
+    int8_t b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyInt8_to_Int8(a_obj);
+    b = PyInt8_to_Int8(b_obj);
+    Out_0001 = return_array_0001(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0002_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int16_t a;
+    int16_t b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyInt16_to_Int16(a_obj);
+    b = PyInt16_to_Int16(b_obj);
+    Out_0001 = return_array_0002(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0003_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int32_t a;
+    int32_t b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyInt32_to_Int32(a_obj);
+    b = PyInt32_to_Int32(b_obj);
+    Out_0001 = return_array_0003(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0004_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t a;
+    int64_t b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyInt64_to_Int64(a_obj);
+    b = PyInt64_to_Int64(b_obj);
+    Out_0001 = return_array_0004(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0005_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    double a;
+    double b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = PyDouble_to_Double(b_obj);
+    Out_0001 = return_array_0005(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0006_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    float a;
+    float b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyFloat_to_Float(a_obj);
+    b = PyFloat_to_Float(b_obj);
+    Out_0001 = return_array_0006(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0007_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    double a;
+    double b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyDouble_to_Double(a_obj);
+    b = PyDouble_to_Double(b_obj);
+    Out_0001 = return_array_0007(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0008_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    float complex a;
+    float complex b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyComplex_to_Complex64(a_obj);
+    b = PyComplex_to_Complex64(b_obj);
+    Out_0001 = return_array_0008(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+static PyObject* return_array_0009_wrapper(PyObject* a_obj, PyObject* b_obj)
+{
+    double complex a;
+    double complex b;
+    t_ndarray Out_0001 = {.raw_data = NULL};
+    PyObject* Out_0001_obj;
+    a = PyComplex_to_Complex128(a_obj);
+    b = PyComplex_to_Complex128(b_obj);
+    Out_0001 = return_array_0009(a, b);
+    Out_0001_obj = ndarray_to_pyarray(Out_0001);
+    free_pointer(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+/*_________________________________CommentBlock_________________________________*/
+/*Assess the types. Raise an error for unexpected types and calculate an integer */
+/*which indicates which function should be called.                               */
+/*_______________________________________________________________________________*/
+int64_t return_array_type_check(PyObject* a_obj, PyObject* b_obj)
+{
+    int64_t type_indicator;
+    type_indicator = INT64_C(0);
+    if (PyIs_NativeInt(a_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int8(a_obj))
+    {
+        type_indicator += INT64_C(1);
+    }
+    else if (PyIs_Int16(a_obj))
+    {
+        type_indicator += INT64_C(2);
+    }
+    else if (PyIs_Int32(a_obj))
+    {
+        type_indicator += INT64_C(3);
+    }
+    else if (PyIs_Int64(a_obj))
+    {
+        type_indicator += INT64_C(4);
+    }
+    else if (PyIs_NativeFloat(a_obj))
+    {
+        type_indicator += INT64_C(5);
+    }
+    else if (PyIs_Float(a_obj))
+    {
+        type_indicator += INT64_C(6);
+    }
+    else if (PyIs_Double(a_obj))
+    {
+        type_indicator += INT64_C(7);
+    }
+    else if (PyIs_Complex64(a_obj))
+    {
+        type_indicator += INT64_C(8);
+    }
+    else if (PyIs_Complex128(a_obj))
+    {
+        type_indicator += INT64_C(9);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument a");
+        return -INT64_C(1);
+    }
+    if (PyIs_NativeInt(b_obj))
+    {
+        type_indicator += INT64_C(0);
+    }
+    else if (PyIs_Int8(b_obj))
+    {
+        type_indicator += INT64_C(10);
+    }
+    else if (PyIs_Int16(b_obj))
+    {
+        type_indicator += INT64_C(20);
+    }
+    else if (PyIs_Int32(b_obj))
+    {
+        type_indicator += INT64_C(30);
+    }
+    else if (PyIs_Int64(b_obj))
+    {
+        type_indicator += INT64_C(40);
+    }
+    else if (PyIs_NativeFloat(b_obj))
+    {
+        type_indicator += INT64_C(50);
+    }
+    else if (PyIs_Float(b_obj))
+    {
+        type_indicator += INT64_C(60);
+    }
+    else if (PyIs_Double(b_obj))
+    {
+        type_indicator += INT64_C(70);
+    }
+    else if (PyIs_Complex64(b_obj))
+    {
+        type_indicator += INT64_C(80);
+    }
+    else if (PyIs_Complex128(b_obj))
+    {
+        type_indicator += INT64_C(90);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Unexpected type for argument b");
+        return -INT64_C(1);
+    }
+    return type_indicator;
+}
+/*........................................*/
+
+/*........................................*/
+PyObject* return_array_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    int64_t type_indicator;
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &a_obj, &b_obj))
+    {
+        return NULL;
+    }
+    type_indicator = return_array_type_check(a_obj, b_obj);
+    switch (type_indicator)
+    {
+        case INT64_C(0):
+        {
+            return return_array_0000_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(11):
+        {
+            return return_array_0001_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(22):
+        {
+            return return_array_0002_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(33):
+        {
+            return return_array_0003_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(44):
+        {
+            return return_array_0004_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(55):
+        {
+            return return_array_0005_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(66):
+        {
+            return return_array_0006_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(77):
+        {
+            return return_array_0007_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(88):
+        {
+            return return_array_0008_wrapper(a_obj, b_obj);
+        }
+        case INT64_C(99):
+        {
+            return return_array_0009_wrapper(a_obj, b_obj);
+        }
+        default:
+        {
+            PyErr_SetString(PyExc_TypeError, "Unexpected type combination");
+            return NULL;
+        }
+    }
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_hon3w5nmyty9_methods[] = {
+    {
+        "return_array",
+        (PyCFunction)return_array_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_hon3w5nmyty9_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_hon3w5nmyty9",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_hon3w5nmyty9_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_hon3w5nmyty9(void)
+{
+    PyObject* mod;
+    static void* Pymod_hon3w5nmyty9_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_hon3w5nmyty9_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_hon3w5nmyty9_API, "mod_hon3w5nmyty9._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
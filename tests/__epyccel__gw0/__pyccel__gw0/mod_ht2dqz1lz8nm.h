@@ -0,0 +1,11 @@
+#ifndef MOD_HT2DQZ1LZ8NM_H
+#define MOD_HT2DQZ1LZ8NM_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_ht2dqz1lz8nm_H
@@ -0,0 +1,40 @@
+#ifndef MOD_HT2DQZ1LZ8NM_WRAPPER_H
+#define MOD_HT2DQZ1LZ8NM_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ht2dqz1lz8nm.h"
+
+
+#ifdef MOD_HT2DQZ1LZ8NM_WRAPPER
+
+
+#else
+
+static void** Pymod_ht2dqz1lz8nm_API;
+
+
+/*........................................*/
+static int mod_ht2dqz1lz8nm_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ht2dqz1lz8nm_API = (void**)PyCapsule_Import("mod_ht2dqz1lz8nm._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ht2dqz1lz8nm_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_HT2DQZ1LZ8NM_WRAPPER_H
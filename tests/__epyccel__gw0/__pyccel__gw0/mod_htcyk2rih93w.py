@@ -0,0 +1,4 @@
+
+def array_int_2d_C_add(x : 'int[::,::]', y : 'int[::,::]'):
+    x[::,::] += y
+
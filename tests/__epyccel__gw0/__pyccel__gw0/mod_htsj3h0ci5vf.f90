@@ -0,0 +1,32 @@
+module mod_htsj3h0ci5vf
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , b1 => C_BOOL &
+        , i64 => C_INT64_T
+  use Map_integer8__real8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine dict_contains(Out_0001, Out_0002, Out_0003) 
+
+    implicit none
+
+    logical(b1), intent(out) :: Out_0001
+    logical(b1), intent(out) :: Out_0002
+    logical(b1), intent(out) :: Out_0003
+    type(Map_integer8__real8) :: a
+
+    a = Map_integer8__real8([Pair_integer8__real8(1_i64, 1.0_f64), &
+          Pair_integer8__real8(2_i64, 2.0_f64), Pair_integer8__real8( &
+          3_i64, 3.0_f64)])
+    Out_0001 = a % count(1_i64) /= 0
+    Out_0002 = a % count(5_i64) /= 0
+    Out_0003 = .False._b1
+    return
+
+  end subroutine dict_contains
+  !........................................
+
+end module mod_htsj3h0ci5vf
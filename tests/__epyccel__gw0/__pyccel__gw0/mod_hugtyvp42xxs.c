@@ -0,0 +1,16 @@
+#include "mod_hugtyvp42xxs.h"
+
+
+/*........................................*/
+int64_t clear_int(void)
+{
+    hset_int64_t se = {0};
+    int64_t Out_0001;
+    se = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(4), INT64_C(5)});
+    hset_int64_t_clear(&se);
+    Out_0001 = hset_int64_t_size(&se);
+    hset_int64_t_drop(&se);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,14 @@
+#include "mod_hvgdreyr16mt.h"
+
+
+/*........................................*/
+void set_arg(hset_int64_t* arg, int64_t n)
+{
+    int64_t Dummy_0000;
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < n; Dummy_0000 += INT64_C(1))
+    {
+        hset_int64_t_push(arg, Dummy_0000);
+    }
+}
+/*........................................*/
+
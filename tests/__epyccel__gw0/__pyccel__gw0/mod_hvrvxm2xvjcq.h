@@ -0,0 +1,10 @@
+#ifndef MOD_HVRVXM2XVJCQ_H
+#define MOD_HVRVXM2XVJCQ_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t ackermann(int64_t m, int64_t n);
+#endif // mod_hvrvxm2xvjcq_H
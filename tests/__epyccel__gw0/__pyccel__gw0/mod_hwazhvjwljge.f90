@@ -0,0 +1,32 @@
+module mod_hwazhvjwljge
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  recursive function ackermann(m, n) result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), value :: m
+    integer(i64), value :: n
+
+    if (m == 0_i64) then
+      Out_0001 = n + 1_i64
+      return
+    else if (n == 0_i64) then
+      Out_0001 = ackermann(m - 1_i64, 1_i64)
+      return
+    else
+      Out_0001 = ackermann(m - 1_i64, ackermann(m, n - 1_i64))
+      return
+    end if
+
+  end function ackermann
+  !........................................
+
+end module mod_hwazhvjwljge
@@ -0,0 +1,103 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_HWAZHVJWLJGE_WRAPPER
+
+#include "mod_hwazhvjwljge_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_ackermann_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* m_obj;
+    PyObject* n_obj;
+    int64_t m;
+    int64_t n;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "m",
+        "n",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &m_obj, &n_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(m_obj))
+    {
+        m = PyInt64_to_Int64(m_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument m");
+        return NULL;
+    }
+    if (PyIs_NativeInt(n_obj))
+    {
+        n = PyInt64_to_Int64(n_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument n");
+        return NULL;
+    }
+    Out_0001 = bind_c_ackermann(m, n);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_hwazhvjwljge_methods[] = {
+    {
+        "ackermann",
+        (PyCFunction)bind_c_ackermann_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_hwazhvjwljge_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_hwazhvjwljge",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_hwazhvjwljge_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_hwazhvjwljge(void)
+{
+    PyObject* mod;
+    static void* Pymod_hwazhvjwljge_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_hwazhvjwljge_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_hwazhvjwljge_API, "mod_hwazhvjwljge._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
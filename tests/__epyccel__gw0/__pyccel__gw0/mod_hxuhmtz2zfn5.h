@@ -0,0 +1,11 @@
+#ifndef MOD_HXUHMTZ2ZFN5_H
+#define MOD_HXUHMTZ2ZFN5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_1(void);
+#endif // mod_hxuhmtz2zfn5_H
@@ -0,0 +1,12 @@
+#ifndef MOD_HYNL0V7BU791_H
+#define MOD_HYNL0V7BU791_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_multi_indexing_1(double* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_hynl0v7bu791_H
@@ -0,0 +1,40 @@
+#ifndef MOD_HYNL0V7BU791_WRAPPER_H
+#define MOD_HYNL0V7BU791_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_hynl0v7bu791.h"
+
+
+#ifdef MOD_HYNL0V7BU791_WRAPPER
+
+
+#else
+
+static void** Pymod_hynl0v7bu791_API;
+
+
+/*........................................*/
+static int mod_hynl0v7bu791_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_hynl0v7bu791_API = (void**)PyCapsule_Import("mod_hynl0v7bu791._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_hynl0v7bu791_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_HYNL0V7BU791_WRAPPER_H
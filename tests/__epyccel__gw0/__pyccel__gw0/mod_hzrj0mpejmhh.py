@@ -0,0 +1,9 @@
+from numpy import float64
+
+def arrs_different_shapes_0():
+    from numpy import shape, zeros
+    i = 5
+    a = zeros((10), dtype = float64)
+    b = a[2:4:] + a[4:i:]
+    return 2
+
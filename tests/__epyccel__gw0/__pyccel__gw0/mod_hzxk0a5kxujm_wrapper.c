@@ -0,0 +1,121 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_HZXK0A5KXUJM_WRAPPER
+
+#include "mod_hzxk0a5kxujm_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_fused_temporaries_2d_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* y_obj;
+    PyObject* z_obj;
+    void* x_data = NULL;
+    int64_t x_shape[2];
+    int64_t x_strides[2];
+    void* y_data = NULL;
+    int64_t y_shape[2];
+    int64_t y_strides[2];
+    void* z_data = NULL;
+    int64_t z_shape[2];
+    int64_t z_strides[2];
+    double Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        "y",
+        "z",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &x_obj, &y_obj, &z_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("y", y_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        y_data = PyArray_DATA((PyArrayObject*)(y_obj));
+        get_strides_and_shape_from_numpy_array(y_obj, y_shape, y_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("z", z_obj, NPY_DOUBLE, INT64_C(2), STRIDED_C_ORDER))
+    {
+        z_data = PyArray_DATA((PyArrayObject*)(z_obj));
+        get_strides_and_shape_from_numpy_array(z_obj, z_shape, z_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    Out_0001 = bind_c_fused_temporaries_2d(x_data, x_shape[INT64_C(0)], x_shape[INT64_C(1)], x_strides[INT64_C(0)], x_strides[INT64_C(1)], y_data, y_shape[INT64_C(0)], y_shape[INT64_C(1)], y_strides[INT64_C(0)], y_strides[INT64_C(1)], z_data, z_shape[INT64_C(0)], z_shape[INT64_C(1)], z_strides[INT64_C(0)], z_strides[INT64_C(1)]);
+    Out_0001_obj = Double_to_NumpyDouble(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_hzxk0a5kxujm_methods[] = {
+    {
+        "fused_temporaries_2d",
+        (PyCFunction)bind_c_fused_temporaries_2d_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_hzxk0a5kxujm_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_hzxk0a5kxujm",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_hzxk0a5kxujm_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_hzxk0a5kxujm(void)
+{
+    PyObject* mod;
+    static void* Pymod_hzxk0a5kxujm_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_hzxk0a5kxujm_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_hzxk0a5kxujm_API, "mod_hzxk0a5kxujm._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,20 @@
+#ifndef MOD_I1O3VVIWUQ46_H
+#define MOD_I1O3VVIWUQ46_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t dtype_convert_to_pyint_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+int64_t dtype_convert_to_pyint_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+int64_t dtype_convert_to_pyint_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+int64_t dtype_convert_to_pyint_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+int64_t dtype_convert_to_pyint_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+int64_t dtype_convert_to_pyint_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+int64_t dtype_convert_to_pyint_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+int64_t dtype_convert_to_pyint_0007(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+int64_t dtype_convert_to_pyint_0008(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_i1o3vviwuq46_H
@@ -0,0 +1,31 @@
+module mod_i21zqom47su5
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i64 => &
+        C_INT64_T
+  use Set_integer8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine union_int(b, Out_0001, Out_0002) 
+
+    implicit none
+
+    logical(b1), intent(out) :: b
+    logical(b1), intent(out) :: Out_0001
+    logical(b1), intent(out) :: Out_0002
+    type(Set_integer8) :: a
+
+    a = Set_integer8([1_i64, 2_i64, 3_i64, 4_i64, 5_i64, 6_i64, 7_i64, &
+          8_i64])
+    b = a % count(2_i64) /= 0
+    Out_0001 = a % count(4_i64) /= 0
+    Out_0002 = a % count(9_i64) /= 0
+    return
+
+  end subroutine union_int
+  !........................................
+
+end module mod_i21zqom47su5
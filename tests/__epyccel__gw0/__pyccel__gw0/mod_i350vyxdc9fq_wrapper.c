@@ -0,0 +1,93 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_I350VYXDC9FQ_WRAPPER
+
+#include "mod_i350vyxdc9fq_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_discard_int_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    double* bound_se;
+    int64_t se_shape_1;
+    int64_t Dummy_0000;
+    PyObject* tmp_obj;
+    double tmp;
+    PyObject* se_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    bind_c_discard_int(&bound_se, &se_shape_1);
+    se_obj = PySet_New(NULL);
+    for (Dummy_0000 = INT64_C(0); Dummy_0000 < se_shape_1; Dummy_0000 += INT64_C(1))
+    {
+        tmp = bound_se[Dummy_0000];
+        tmp_obj = Double_to_PyDouble(&tmp);
+        if (PySet_Add(se_obj, tmp_obj) == -INT64_C(1))
+        {
+            return NULL;
+        }
+    }
+    free(bound_se);
+    return se_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_i350vyxdc9fq_methods[] = {
+    {
+        "Discard_int",
+        (PyCFunction)bind_c_discard_int_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_i350vyxdc9fq_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_i350vyxdc9fq",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_i350vyxdc9fq_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_i350vyxdc9fq(void)
+{
+    PyObject* mod;
+    static void* Pymod_i350vyxdc9fq_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_i350vyxdc9fq_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_i350vyxdc9fq_API, "mod_i350vyxdc9fq._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
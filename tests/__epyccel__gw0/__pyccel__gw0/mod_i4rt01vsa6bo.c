@@ -0,0 +1,12 @@
+#include "mod_i4rt01vsa6bo.h"
+
+
+/*........................................*/
+int8_t f17(int8_t a)
+{
+    int8_t b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_I4RT01VSA6BO_H
+#define MOD_I4RT01VSA6BO_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int8_t f17(int8_t a);
+#endif // mod_i4rt01vsa6bo_H
@@ -0,0 +1,28 @@
+#include "mod_i7hkod3x9psp.h"
+
+
+/*........................................*/
+int64_t update_boolean_tuple(int64_t* Out_0001, bool* Out_0002, bool* Out_0003)
+{
+    hset_bool a = {0};
+    t_ndarray b = {.raw_data = NULL};
+    bool Dummy_0000;
+    int64_t Dummy_0001;
+    a = c_init(hset_bool, {1});
+    b = array_create(1, (int64_t[]){INT64_C(3)}, nd_bool, false, order_c);
+    bool Dummy_0002[] = {0, 1, 0};
+    memcpy(&b.nd_bool[INT64_C(0)], Dummy_0002, 3 * b.type_size);
+    for (Dummy_0001 = INT64_C(0); Dummy_0001 < INT64_C(3); Dummy_0001 += INT64_C(1))
+    {
+        Dummy_0000 = GET_ELEMENT(b, nd_bool, Dummy_0001);
+        hset_bool_push(&a, Dummy_0000);
+    }
+    (*Out_0001) = hset_bool_size(&a);
+    (*Out_0002) = hset_bool_pop(&a);
+    (*Out_0003) = hset_bool_pop(&a);
+    free_array(&b);
+    hset_bool_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,31 @@
+#ifndef MOD_I7HKOD3X9PSP_H
+#define MOD_I7HKOD3X9PSP_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#ifndef _TOOLS_SET_HSET_BOOL
+#define _TOOLS_SET_HSET_BOOL
+#define i_type hset_bool
+#define i_key bool
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_BOOL
+
+#ifndef _TOOLS_SET_HSET_BOOL
+#define _TOOLS_SET_HSET_BOOL
+#define i_type hset_bool
+#define i_key bool
+#define i_more
+#include <stc/hset.h>
+#include <Set_extensions.h>
+#endif // _TOOLS_SET_HSET_BOOL
+
+
+
+
+int64_t update_boolean_tuple(int64_t* Out_0001, bool* Out_0002, bool* Out_0003);
+#endif // mod_i7hkod3x9psp_H
@@ -0,0 +1,13 @@
+#include "mod_i870oc1dxv3q.h"
+
+
+/*........................................*/
+hset_double Discard_wrong_arg(void)
+{
+    hset_double se = {0};
+    se = c_init(hset_double, {4.7, 1.3, 8.2});
+    hset_double_erase(&se, 8.6);
+    return se;
+}
+/*........................................*/
+
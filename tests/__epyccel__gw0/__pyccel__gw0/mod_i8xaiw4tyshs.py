@@ -0,0 +1,6 @@
+
+def f():
+    a = [[1, 2, 3]]
+    a.insert(1, [4, 5, 6])
+    return a
+
@@ -0,0 +1,11 @@
+#ifndef MOD_I9RZSOG6E81A_H
+#define MOD_I9RZSOG6E81A_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void omp_matmul(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_i9rzsog6e81a_H
@@ -0,0 +1,40 @@
+#include "mod_iakmi1qa6vav.h"
+
+
+/*........................................*/
+int64_t arrs_different_shapes_0(void)
+{
+    int64_t i;
+    double array_dummy[INT64_C(10)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(10)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    double array_dummy_0001[INT64_C(2)];
+    t_ndarray b = (t_ndarray){
+        .nd_double=array_dummy_0001,
+        .shape={INT64_C(2)},
+        .nd=1,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&b);
+    int64_t i_0001;
+    i = INT64_C(5);
+    array_fill((double)0.0, a);
+    {
+        double* restrict a_data = a.nd_double;
+        double* restrict b_data = b.nd_double;
+        for (i_0001 = INT64_C(0); i_0001 < INT64_C(2); i_0001 += INT64_C(1))
+        {
+            b_data[i_0001] = a_data[i_0001 + INT64_C(2)] + a_data[i_0001 + INT64_C(4)];
+        }
+    }
+    return INT64_C(2);
+}
+/*........................................*/
+
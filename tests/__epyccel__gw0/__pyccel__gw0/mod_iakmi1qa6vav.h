@@ -0,0 +1,11 @@
+#ifndef MOD_IAKMI1QA6VAV_H
+#define MOD_IAKMI1QA6VAV_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_different_shapes_0(void);
+#endif // mod_iakmi1qa6vav_H
@@ -0,0 +1,11 @@
+#ifndef MOD_IAT20EI6ZJQ0_H
+#define MOD_IAT20EI6ZJQ0_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_different_shapes_0(void);
+#endif // mod_iat20ei6zjq0_H
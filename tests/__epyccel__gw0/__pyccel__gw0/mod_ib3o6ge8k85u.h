@@ -0,0 +1,11 @@
+#ifndef MOD_IB3O6GE8K85U_H
+#define MOD_IB3O6GE8K85U_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_C_slice_19(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_ib3o6ge8k85u_H
@@ -0,0 +1,42 @@
+#ifndef MOD_IB3O6GE8K85U_WRAPPER_H
+#define MOD_IB3O6GE8K85U_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_ib3o6ge8k85u.h"
+
+
+#ifdef MOD_IB3O6GE8K85U_WRAPPER
+
+
+#else
+
+static void** Pymod_ib3o6ge8k85u_API;
+
+
+/*........................................*/
+static int mod_ib3o6ge8k85u_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ib3o6ge8k85u_API = (void**)PyCapsule_Import("mod_ib3o6ge8k85u._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ib3o6ge8k85u_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_IB3O6GE8K85U_WRAPPER_H
@@ -0,0 +1,17 @@
+#include "mod_id2i536gjc9c.h"
+
+
+/*........................................*/
+int64_t tuple_sum(void)
+{
+    t_ndarray t = {.raw_data = NULL};
+    int64_t Out_0001;
+    t = array_create(1, (int64_t[]){INT64_C(6)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(5), INT64_C(8), INT64_C(13)};
+    memcpy(&t.nd_int64[INT64_C(0)], Dummy_0000, 6 * t.type_size);
+    Out_0001 = numpy_sum_int64(t);
+    free_array(&t);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_ID2I536GJC9C_H
+#define MOD_ID2I536GJC9C_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuple_sum(void);
+#endif // mod_id2i536gjc9c_H
@@ -0,0 +1,23 @@
+module mod_idx3hs58n2zz
+
+  use, intrinsic :: ISO_C_Binding, only : i8 => C_INT8_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f17(a) result(b)
+
+    implicit none
+
+    integer(i8) :: b
+    integer(i8), value :: a
+
+    b = a
+    return
+
+  end function f17
+  !........................................
+
+end module mod_idx3hs58n2zz
@@ -0,0 +1,40 @@
+#ifndef MOD_IDX3HS58N2ZZ_WRAPPER_H
+#define MOD_IDX3HS58N2ZZ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_IDX3HS58N2ZZ_WRAPPER
+
+int8_t bind_c_f17(int8_t);
+
+#else
+
+static void** Pymod_idx3hs58n2zz_API;
+
+
+/*........................................*/
+static int mod_idx3hs58n2zz_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_idx3hs58n2zz_API = (void**)PyCapsule_Import("mod_idx3hs58n2zz._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_idx3hs58n2zz_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_IDX3HS58N2ZZ_WRAPPER_H
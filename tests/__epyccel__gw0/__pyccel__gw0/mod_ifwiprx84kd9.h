@@ -0,0 +1,10 @@
+#ifndef MOD_IFWIPRX84KD9_H
+#define MOD_IFWIPRX84KD9_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(int64_t x);
+#endif // mod_ifwiprx84kd9_H
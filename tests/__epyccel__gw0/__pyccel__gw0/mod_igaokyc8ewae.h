@@ -0,0 +1,12 @@
+#ifndef MOD_IGAOKYC8EWAE_H
+#define MOD_IGAOKYC8EWAE_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+double multiple_stack_array_1(void);
+#endif // mod_igaokyc8ewae_H
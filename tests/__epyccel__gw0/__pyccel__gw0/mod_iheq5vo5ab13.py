@@ -0,0 +1,7 @@
+
+def tuple_unpacking_2():
+    a = 1
+    b = False
+    c = 3.5
+    return a,b,c
+
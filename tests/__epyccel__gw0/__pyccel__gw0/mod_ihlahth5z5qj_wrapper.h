@@ -0,0 +1,40 @@
+#ifndef MOD_IHLAHTH5Z5QJ_WRAPPER_H
+#define MOD_IHLAHTH5Z5QJ_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_ihlahth5z5qj.h"
+
+
+#ifdef MOD_IHLAHTH5Z5QJ_WRAPPER
+
+
+#else
+
+static void** Pymod_ihlahth5z5qj_API;
+
+
+/*........................................*/
+static int mod_ihlahth5z5qj_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_ihlahth5z5qj_API = (void**)PyCapsule_Import("mod_ihlahth5z5qj._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_ihlahth5z5qj_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_IHLAHTH5Z5QJ_WRAPPER_H
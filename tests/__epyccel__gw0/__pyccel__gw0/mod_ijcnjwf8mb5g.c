@@ -0,0 +1,42 @@
+#include "mod_ijcnjwf8mb5g.h"
+
+
+/*........................................*/
+void product_loop_on_2d_array_C(t_ndarray z)
+{
+    int64_t m;
+    int64_t n;
+    int64_t i;
+    vec_int64_t x = {0};
+    int64_t Dummy_0000;
+    int64_t j;
+    vec_int64_t y = {0};
+    int64_t Dummy_0001;
+    m = z.shape[INT64_C(0)];
+    n = z.shape[INT64_C(1)];
+    vec_int64_t_resize(&x, m, 0);
+    Dummy_0000 = INT64_C(0);
+    for (i = INT64_C(0); i < m; i += INT64_C(1))
+    {
+        (*vec_int64_t_at_mut(&x,Dummy_0000)) = i;
+        Dummy_0000 = Dummy_0000 + INT64_C(1);
+    }
+    vec_int64_t_resize(&y, n, 0);
+    Dummy_0001 = INT64_C(0);
+    for (j = INT64_C(0); j < n; j += INT64_C(1))
+    {
+        (*vec_int64_t_at_mut(&y,Dummy_0001)) = j;
+        Dummy_0001 = Dummy_0001 + INT64_C(1);
+    }
+    c_foreach (Dummy_0002, vec_int64_t, x){
+        i = (*Dummy_0002.ref);
+        c_foreach (Dummy_0003, vec_int64_t, y){
+            j = (*Dummy_0003.ref);
+            GET_ELEMENT(z, nd_int64, i, j) = i - j;
+        }
+    }
+    vec_int64_t_drop(&y);
+    vec_int64_t_drop(&x);
+}
+/*........................................*/
+
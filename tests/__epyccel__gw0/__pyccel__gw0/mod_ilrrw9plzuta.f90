@@ -0,0 +1,33 @@
+module mod_ilrrw9plzuta
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f1(i) result(out)
+
+    use omp_lib, only: omp_get_thread_num
+
+    implicit none
+
+    integer(i64) :: out
+    integer(i64), value :: i
+    integer(i32) :: idx
+
+    out = -1_i64
+    !$omp parallel private(idx)
+    idx = omp_get_thread_num()
+    if (idx == i) then
+      out = Int(idx, kind = i64)
+    end if
+    !$omp end parallel
+    return
+
+  end function f1
+  !........................................
+
+end module mod_ilrrw9plzuta
@@ -0,0 +1,6 @@
+
+def set_With_set():
+    a = {True, False, True}
+    b = set(a)
+    return b
+
@@ -0,0 +1,11 @@
+from numpy import array
+from pyccel.decorators import allow_negative_index
+
+@allow_negative_index('a', 'b', 'c')
+def test_multiple_negative_index_3(d : 'int', e : 'int', f : 'int'):
+    from numpy import array
+    a = array([1.2, 2.2, 3.2, 4.2])
+    b = array([1])
+    c = array([1, 2, 3])
+    return a[d],b[e],c[f]
+
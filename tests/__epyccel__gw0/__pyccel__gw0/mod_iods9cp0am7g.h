@@ -0,0 +1,11 @@
+#ifndef MOD_IODS9CP0AM7G_H
+#define MOD_IODS9CP0AM7G_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_F_array_initialization_2(t_ndarray a, t_ndarray e, t_ndarray f, t_ndarray x);
+#endif // mod_iods9cp0am7g_H
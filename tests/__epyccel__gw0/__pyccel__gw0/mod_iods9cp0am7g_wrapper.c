@@ -0,0 +1,126 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_IODS9CP0AM7G_WRAPPER
+
+#include "mod_iods9cp0am7g_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_nested_F_array_initialization_2_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* e_obj;
+    PyObject* f_obj;
+    PyObject* x_obj;
+    t_ndarray a = {.raw_data = NULL};
+    t_ndarray e = {.raw_data = NULL};
+    t_ndarray f = {.raw_data = NULL};
+    t_ndarray x = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "a",
+        "e",
+        "f",
+        "x",
+        NULL
+    };
+    static PyObject* kwlist_interned[5] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 4, 4, &a_obj, &e_obj, &f_obj, &x_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(3), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        a = pyarray_to_ndarray(a_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("e", e_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        e = pyarray_to_ndarray(e_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("f", f_obj, NPY_DOUBLE, INT64_C(1), NO_ORDER_CHECK))
+    {
+        f = pyarray_to_ndarray(f_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_DOUBLE, INT64_C(4), NPY_ARRAY_F_CONTIGUOUS))
+    {
+        x = pyarray_to_ndarray(x_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    array_float_nested_F_array_initialization_2(a, e, f, x);
+    free_pointer(&a);
+    free_pointer(&e);
+    free_pointer(&f);
+    free_pointer(&x);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_iods9cp0am7g_methods[] = {
+    {
+        "array_float_nested_F_array_initialization_2",
+        (PyCFunction)array_float_nested_F_array_initialization_2_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_iods9cp0am7g_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_iods9cp0am7g",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_iods9cp0am7g_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_iods9cp0am7g(void)
+{
+    PyObject* mod;
+    static void* Pymod_iods9cp0am7g_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_iods9cp0am7g_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_iods9cp0am7g_API, "mod_iods9cp0am7g._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
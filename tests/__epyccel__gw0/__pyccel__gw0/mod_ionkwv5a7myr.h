@@ -0,0 +1,11 @@
+#ifndef MOD_IONKWV5A7MYR_H
+#define MOD_IONKWV5A7MYR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_div(t_ndarray x, t_ndarray y);
+#endif // mod_ionkwv5a7myr_H
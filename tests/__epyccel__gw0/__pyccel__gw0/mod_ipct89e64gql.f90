@@ -0,0 +1,25 @@
+module mod_ipct89e64gql
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine fused_shifted_slices(a, b) 
+
+    implicit none
+
+    real(f64), intent(inout) :: a(0_i64:)
+    real(f64), intent(inout) :: b(0_i64:)
+
+    a(:size(a, kind=i64) - 1_i64 - 1_i64) = a(1_i64:) + b(:size(b, kind= &
+          i64) - 1_i64 - 1_i64)
+    b(1_i64:) = a(:size(a, kind=i64) - 1_i64 - 1_i64) * 2.0_f64
+
+  end subroutine fused_shifted_slices
+  !........................................
+
+end module mod_ipct89e64gql
@@ -0,0 +1,105 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_IPCT89E64GQL_WRAPPER
+
+#include "mod_ipct89e64gql_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_fused_shifted_slices_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    PyObject* b_obj;
+    void* a_data = NULL;
+    int64_t a_shape[1];
+    int64_t a_strides[1];
+    void* b_data = NULL;
+    int64_t b_shape[1];
+    int64_t b_strides[1];
+    static const char* const kwlist[] = {
+        "a",
+        "b",
+        NULL
+    };
+    static PyObject* kwlist_interned[3] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 2, 2, &a_obj, &b_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("a", a_obj, NPY_DOUBLE, INT64_C(1), STRIDED_C_ORDER))
+    {
+        a_data = PyArray_DATA((PyArrayObject*)(a_obj));
+        get_strides_and_shape_from_numpy_array(a_obj, a_shape, a_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("b", b_obj, NPY_DOUBLE, INT64_C(1), STRIDED_C_ORDER))
+    {
+        b_data = PyArray_DATA((PyArrayObject*)(b_obj));
+        get_strides_and_shape_from_numpy_array(b_obj, b_shape, b_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    bind_c_fused_shifted_slices(a_data, a_shape[INT64_C(0)], a_strides[INT64_C(0)], b_data, b_shape[INT64_C(0)], b_strides[INT64_C(0)]);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ipct89e64gql_methods[] = {
+    {
+        "fused_shifted_slices",
+        (PyCFunction)bind_c_fused_shifted_slices_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ipct89e64gql_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ipct89e64gql",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ipct89e64gql_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ipct89e64gql(void)
+{
+    PyObject* mod;
+    static void* Pymod_ipct89e64gql_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ipct89e64gql_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ipct89e64gql_API, "mod_ipct89e64gql._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
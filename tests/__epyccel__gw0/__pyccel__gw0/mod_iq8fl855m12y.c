@@ -0,0 +1,14 @@
+#include "mod_iq8fl855m12y.h"
+
+
+/*........................................*/
+int64_t while_not_0(int64_t n)
+{
+    while((n != 0))
+    {
+        n -= INT64_C(1);
+    }
+    return n;
+}
+/*........................................*/
+
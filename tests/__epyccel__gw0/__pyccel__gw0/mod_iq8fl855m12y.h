@@ -0,0 +1,10 @@
+#ifndef MOD_IQ8FL855M12Y_H
+#define MOD_IQ8FL855M12Y_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t while_not_0(int64_t n);
+#endif // mod_iq8fl855m12y_H
@@ -0,0 +1,12 @@
+#ifndef MOD_IQXCWUIHZ5XP_H
+#define MOD_IQXCWUIHZ5XP_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_in_bool_out_2d_F_complex_3d_expr(t_ndarray x, t_ndarray y, t_ndarray ri);
+#endif // mod_iqxcwuihz5xp_H
@@ -0,0 +1,699 @@
+module mod_irfnunpgpqz1
+
+  use, intrinsic :: ISO_C_Binding, only : b1 => C_BOOL , i16 => &
+        C_INT16_T , i32 => C_INT32_T , f64 => C_DOUBLE , i8 => C_INT8_T &
+        , f32 => C_FLOAT , i64 => C_INT64_T , c32 => C_FLOAT_COMPLEX , &
+        c64 => C_DOUBLE_COMPLEX
+
+  implicit none
+
+  interface src_dest_diff_sizes_dtype_convert_to_int32_orderF
+    module procedure &
+          src_dest_diff_sizes_dtype_convert_to_int32_orderF_0000
+    module procedure &
+          src_dest_diff_sizes_dtype_convert_to_int32_orderF_0001
+    module procedure &
+          src_dest_diff_sizes_dtype_convert_to_int32_orderF_0002
+    module procedure &
+          src_dest_diff_sizes_dtype_convert_to_int32_orderF_0003
+    module procedure &
+          src_dest_diff_sizes_dtype_convert_to_int32_orderF_0004
+    module procedure &
+          src_dest_diff_sizes_dtype_convert_to_int32_orderF_0005
+    module procedure &
+          src_dest_diff_sizes_dtype_convert_to_int32_orderF_0006
+    module procedure &
+          src_dest_diff_sizes_dtype_convert_to_int32_orderF_0007
+    module procedure &
+          src_dest_diff_sizes_dtype_convert_to_int32_orderF_0008
+  end interface
+
+  contains
+
+  !........................................
+  subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0000(arr1 &
+        , arr2, arr3, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i32), intent(out) :: Out_0004
+    integer(i32), intent(out) :: Out_0005
+    integer(i32), intent(out) :: Out_0006
+    integer(i32), intent(out) :: Out_0007
+    integer(i32), intent(out) :: Out_0008
+    integer(i32), intent(out) :: Out_0009
+    logical(b1), intent(in) :: arr1(0_i64:, 0_i64:)
+    logical(b1), intent(in) :: arr2(0_i64:, 0_i64:)
+    logical(b1), intent(in) :: arr3(0_i64:, 0_i64:)
+    logical(b1), allocatable :: a(:, :)
+    logical(b1), allocatable :: b(:, :)
+    logical(b1), allocatable :: c(:, :)
+    integer(i32), allocatable :: d(:, :, :)
+    integer(i64), allocatable :: s(:)
+
+    allocate(a(0:size(arr1, 1_i64, i64) - 1_i64, 0:size(arr1, 2_i64, i64 &
+          ) - 1_i64))
+    a = logical(arr1, kind = b1)
+    allocate(b(0:size(arr2, 1_i64, i64) - 1_i64, 0:size(arr2, 2_i64, i64 &
+          ) - 1_i64))
+    b = logical(arr2, kind = b1)
+    allocate(c(0:size(arr3, 1_i64, i64) - 1_i64, 0:size(arr3, 2_i64, i64 &
+          ) - 1_i64))
+    c = logical(arr3, kind = b1)
+    allocate(d(0:2_i64, 0:size(a, 2_i64, i64) - 1_i64, 0:size(a, 1_i64, &
+          i64) - 1_i64))
+    d = reshape([reshape(MERGE(1_i32, 0_i32, a), [size(a, 2_i64, i64), &
+          size(a, 1_i64, i64)], order=[2_i64, 1_i64]) ,reshape(MERGE( &
+          1_i32, 0_i32, c), [size(c, 2_i64, i64), size(c, 1_i64, i64)], &
+          order=[2_i64, 1_i64]) ,reshape(MERGE(1_i32, 0_i32, b), [size( &
+          b, 2_i64, i64), size(b, 1_i64, i64)], order=[2_i64, 1_i64])], &
+          [3_i64, size(a, 2_i64, i64), size(a, 1_i64, i64)], order=[ &
+          2_i64, 3_i64, 1_i64])
+    allocate(s(0:2_i64))
+    s = [3_i64, size(d, 2_i64, i64), size(d, 3_i64, i64)]
+    Out_0001 = s(0_i64)
+    Out_0002 = s(1_i64)
+    Out_0003 = s(2_i64)
+    Out_0004 = d(0_i64, 0_i64, 0_i64)
+    Out_0005 = d(0_i64, 0_i64, 1_i64)
+    Out_0006 = d(1_i64, 0_i64, 0_i64)
+    Out_0007 = d(1_i64, 0_i64, 1_i64)
+    Out_0008 = d(2_i64, 0_i64, 0_i64)
+    Out_0009 = d(2_i64, 0_i64, 1_i64)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(s)) then
+      deallocate(s)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0000
+  !........................................
+
+  !........................................
+  subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0001(arr1 &
+        , arr2, arr3, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i32), intent(out) :: Out_0004
+    integer(i32), intent(out) :: Out_0005
+    integer(i32), intent(out) :: Out_0006
+    integer(i32), intent(out) :: Out_0007
+    integer(i32), intent(out) :: Out_0008
+    integer(i32), intent(out) :: Out_0009
+    integer(i64), intent(in) :: arr1(0_i64:, 0_i64:)
+    integer(i64), intent(in) :: arr2(0_i64:, 0_i64:)
+    integer(i64), intent(in) :: arr3(0_i64:, 0_i64:)
+    integer(i64), allocatable :: a(:, :)
+    integer(i64), allocatable :: b(:, :)
+    integer(i64), allocatable :: c(:, :)
+    integer(i32), allocatable :: d(:, :, :)
+    integer(i64), allocatable :: s(:)
+
+    allocate(a(0:size(arr1, 1_i64, i64) - 1_i64, 0:size(arr1, 2_i64, i64 &
+          ) - 1_i64))
+    a = Int(arr1, kind = i64)
+    allocate(b(0:size(arr2, 1_i64, i64) - 1_i64, 0:size(arr2, 2_i64, i64 &
+          ) - 1_i64))
+    b = Int(arr2, kind = i64)
+    allocate(c(0:size(arr3, 1_i64, i64) - 1_i64, 0:size(arr3, 2_i64, i64 &
+          ) - 1_i64))
+    c = Int(arr3, kind = i64)
+    allocate(d(0:2_i64, 0:size(a, 2_i64, i64) - 1_i64, 0:size(a, 1_i64, &
+          i64) - 1_i64))
+    d = reshape([reshape(Int(a, kind = i32), [size(a, 2_i64, i64), size( &
+          a, 1_i64, i64)], order=[2_i64, 1_i64]) ,reshape(Int(c, kind = &
+          i32), [size(c, 2_i64, i64), size(c, 1_i64, i64)], order=[ &
+          2_i64, 1_i64]) ,reshape(Int(b, kind = i32), [size(b, 2_i64, &
+          i64), size(b, 1_i64, i64)], order=[2_i64, 1_i64])], [3_i64, &
+          size(a, 2_i64, i64), size(a, 1_i64, i64)], order=[2_i64, &
+          3_i64, 1_i64])
+    allocate(s(0:2_i64))
+    s = [3_i64, size(d, 2_i64, i64), size(d, 3_i64, i64)]
+    Out_0001 = s(0_i64)
+    Out_0002 = s(1_i64)
+    Out_0003 = s(2_i64)
+    Out_0004 = d(0_i64, 0_i64, 0_i64)
+    Out_0005 = d(0_i64, 0_i64, 1_i64)
+    Out_0006 = d(1_i64, 0_i64, 0_i64)
+    Out_0007 = d(1_i64, 0_i64, 1_i64)
+    Out_0008 = d(2_i64, 0_i64, 0_i64)
+    Out_0009 = d(2_i64, 0_i64, 1_i64)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(s)) then
+      deallocate(s)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0001
+  !........................................
+
+  !........................................
+  subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0002(arr1 &
+        , arr2, arr3, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i32), intent(out) :: Out_0004
+    integer(i32), intent(out) :: Out_0005
+    integer(i32), intent(out) :: Out_0006
+    integer(i32), intent(out) :: Out_0007
+    integer(i32), intent(out) :: Out_0008
+    integer(i32), intent(out) :: Out_0009
+    integer(i8), intent(in) :: arr1(0_i64:, 0_i64:)
+    integer(i8), intent(in) :: arr2(0_i64:, 0_i64:)
+    integer(i8), intent(in) :: arr3(0_i64:, 0_i64:)
+    integer(i8), allocatable :: a(:, :)
+    integer(i8), allocatable :: b(:, :)
+    integer(i8), allocatable :: c(:, :)
+    integer(i32), allocatable :: d(:, :, :)
+    integer(i64), allocatable :: s(:)
+
+    allocate(a(0:size(arr1, 1_i64, i64) - 1_i64, 0:size(arr1, 2_i64, i64 &
+          ) - 1_i64))
+    a = Int(arr1, kind = i8)
+    allocate(b(0:size(arr2, 1_i64, i64) - 1_i64, 0:size(arr2, 2_i64, i64 &
+          ) - 1_i64))
+    b = Int(arr2, kind = i8)
+    allocate(c(0:size(arr3, 1_i64, i64) - 1_i64, 0:size(arr3, 2_i64, i64 &
+          ) - 1_i64))
+    c = Int(arr3, kind = i8)
+    allocate(d(0:2_i64, 0:size(a, 2_i64, i64) - 1_i64, 0:size(a, 1_i64, &
+          i64) - 1_i64))
+    d = reshape([reshape(Int(a, kind = i32), [size(a, 2_i64, i64), size( &
+          a, 1_i64, i64)], order=[2_i64, 1_i64]) ,reshape(Int(c, kind = &
+          i32), [size(c, 2_i64, i64), size(c, 1_i64, i64)], order=[ &
+          2_i64, 1_i64]) ,reshape(Int(b, kind = i32), [size(b, 2_i64, &
+          i64), size(b, 1_i64, i64)], order=[2_i64, 1_i64])], [3_i64, &
+          size(a, 2_i64, i64), size(a, 1_i64, i64)], order=[2_i64, &
+          3_i64, 1_i64])
+    allocate(s(0:2_i64))
+    s = [3_i64, size(d, 2_i64, i64), size(d, 3_i64, i64)]
+    Out_0001 = s(0_i64)
+    Out_0002 = s(1_i64)
+    Out_0003 = s(2_i64)
+    Out_0004 = d(0_i64, 0_i64, 0_i64)
+    Out_0005 = d(0_i64, 0_i64, 1_i64)
+    Out_0006 = d(1_i64, 0_i64, 0_i64)
+    Out_0007 = d(1_i64, 0_i64, 1_i64)
+    Out_0008 = d(2_i64, 0_i64, 0_i64)
+    Out_0009 = d(2_i64, 0_i64, 1_i64)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(s)) then
+      deallocate(s)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0002
+  !........................................
+
+  !........................................
+  subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0003(arr1 &
+        , arr2, arr3, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i32), intent(out) :: Out_0004
+    integer(i32), intent(out) :: Out_0005
+    integer(i32), intent(out) :: Out_0006
+    integer(i32), intent(out) :: Out_0007
+    integer(i32), intent(out) :: Out_0008
+    integer(i32), intent(out) :: Out_0009
+    integer(i16), intent(in) :: arr1(0_i64:, 0_i64:)
+    integer(i16), intent(in) :: arr2(0_i64:, 0_i64:)
+    integer(i16), intent(in) :: arr3(0_i64:, 0_i64:)
+    integer(i16), allocatable :: a(:, :)
+    integer(i16), allocatable :: b(:, :)
+    integer(i16), allocatable :: c(:, :)
+    integer(i32), allocatable :: d(:, :, :)
+    integer(i64), allocatable :: s(:)
+
+    allocate(a(0:size(arr1, 1_i64, i64) - 1_i64, 0:size(arr1, 2_i64, i64 &
+          ) - 1_i64))
+    a = Int(arr1, kind = i16)
+    allocate(b(0:size(arr2, 1_i64, i64) - 1_i64, 0:size(arr2, 2_i64, i64 &
+          ) - 1_i64))
+    b = Int(arr2, kind = i16)
+    allocate(c(0:size(arr3, 1_i64, i64) - 1_i64, 0:size(arr3, 2_i64, i64 &
+          ) - 1_i64))
+    c = Int(arr3, kind = i16)
+    allocate(d(0:2_i64, 0:size(a, 2_i64, i64) - 1_i64, 0:size(a, 1_i64, &
+          i64) - 1_i64))
+    d = reshape([reshape(Int(a, kind = i32), [size(a, 2_i64, i64), size( &
+          a, 1_i64, i64)], order=[2_i64, 1_i64]) ,reshape(Int(c, kind = &
+          i32), [size(c, 2_i64, i64), size(c, 1_i64, i64)], order=[ &
+          2_i64, 1_i64]) ,reshape(Int(b, kind = i32), [size(b, 2_i64, &
+          i64), size(b, 1_i64, i64)], order=[2_i64, 1_i64])], [3_i64, &
+          size(a, 2_i64, i64), size(a, 1_i64, i64)], order=[2_i64, &
+          3_i64, 1_i64])
+    allocate(s(0:2_i64))
+    s = [3_i64, size(d, 2_i64, i64), size(d, 3_i64, i64)]
+    Out_0001 = s(0_i64)
+    Out_0002 = s(1_i64)
+    Out_0003 = s(2_i64)
+    Out_0004 = d(0_i64, 0_i64, 0_i64)
+    Out_0005 = d(0_i64, 0_i64, 1_i64)
+    Out_0006 = d(1_i64, 0_i64, 0_i64)
+    Out_0007 = d(1_i64, 0_i64, 1_i64)
+    Out_0008 = d(2_i64, 0_i64, 0_i64)
+    Out_0009 = d(2_i64, 0_i64, 1_i64)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(s)) then
+      deallocate(s)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0003
+  !........................................
+
+  !........................................
+  subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0004(arr1 &
+        , arr2, arr3, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i32), intent(out) :: Out_0004
+    integer(i32), intent(out) :: Out_0005
+    integer(i32), intent(out) :: Out_0006
+    integer(i32), intent(out) :: Out_0007
+    integer(i32), intent(out) :: Out_0008
+    integer(i32), intent(out) :: Out_0009
+    integer(i32), intent(in) :: arr1(0_i64:, 0_i64:)
+    integer(i32), intent(in) :: arr2(0_i64:, 0_i64:)
+    integer(i32), intent(in) :: arr3(0_i64:, 0_i64:)
+    integer(i32), allocatable :: a(:, :)
+    integer(i32), allocatable :: b(:, :)
+    integer(i32), allocatable :: c(:, :)
+    integer(i32), allocatable :: d(:, :, :)
+    integer(i64), allocatable :: s(:)
+
+    allocate(a(0:size(arr1, 1_i64, i64) - 1_i64, 0:size(arr1, 2_i64, i64 &
+          ) - 1_i64))
+    a = Int(arr1, kind = i32)
+    allocate(b(0:size(arr2, 1_i64, i64) - 1_i64, 0:size(arr2, 2_i64, i64 &
+          ) - 1_i64))
+    b = Int(arr2, kind = i32)
+    allocate(c(0:size(arr3, 1_i64, i64) - 1_i64, 0:size(arr3, 2_i64, i64 &
+          ) - 1_i64))
+    c = Int(arr3, kind = i32)
+    allocate(d(0:2_i64, 0:size(a, 2_i64, i64) - 1_i64, 0:size(a, 1_i64, &
+          i64) - 1_i64))
+    d = reshape([reshape(Int(a, kind = i32), [size(a, 2_i64, i64), size( &
+          a, 1_i64, i64)], order=[2_i64, 1_i64]) ,reshape(Int(c, kind = &
+          i32), [size(c, 2_i64, i64), size(c, 1_i64, i64)], order=[ &
+          2_i64, 1_i64]) ,reshape(Int(b, kind = i32), [size(b, 2_i64, &
+          i64), size(b, 1_i64, i64)], order=[2_i64, 1_i64])], [3_i64, &
+          size(a, 2_i64, i64), size(a, 1_i64, i64)], order=[2_i64, &
+          3_i64, 1_i64])
+    allocate(s(0:2_i64))
+    s = [3_i64, size(d, 2_i64, i64), size(d, 3_i64, i64)]
+    Out_0001 = s(0_i64)
+    Out_0002 = s(1_i64)
+    Out_0003 = s(2_i64)
+    Out_0004 = d(0_i64, 0_i64, 0_i64)
+    Out_0005 = d(0_i64, 0_i64, 1_i64)
+    Out_0006 = d(1_i64, 0_i64, 0_i64)
+    Out_0007 = d(1_i64, 0_i64, 1_i64)
+    Out_0008 = d(2_i64, 0_i64, 0_i64)
+    Out_0009 = d(2_i64, 0_i64, 1_i64)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(s)) then
+      deallocate(s)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0004
+  !........................................
+
+  !........................................
+  subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0005(arr1 &
+        , arr2, arr3, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i32), intent(out) :: Out_0004
+    integer(i32), intent(out) :: Out_0005
+    integer(i32), intent(out) :: Out_0006
+    integer(i32), intent(out) :: Out_0007
+    integer(i32), intent(out) :: Out_0008
+    integer(i32), intent(out) :: Out_0009
+    real(f64), intent(in) :: arr1(0_i64:, 0_i64:)
+    real(f64), intent(in) :: arr2(0_i64:, 0_i64:)
+    real(f64), intent(in) :: arr3(0_i64:, 0_i64:)
+    real(f64), allocatable :: a(:, :)
+    real(f64), allocatable :: b(:, :)
+    real(f64), allocatable :: c(:, :)
+    integer(i32), allocatable :: d(:, :, :)
+    integer(i64), allocatable :: s(:)
+
+    allocate(a(0:size(arr1, 1_i64, i64) - 1_i64, 0:size(arr1, 2_i64, i64 &
+          ) - 1_i64))
+    a = Real(arr1, kind = f64)
+    allocate(b(0:size(arr2, 1_i64, i64) - 1_i64, 0:size(arr2, 2_i64, i64 &
+          ) - 1_i64))
+    b = Real(arr2, kind = f64)
+    allocate(c(0:size(arr3, 1_i64, i64) - 1_i64, 0:size(arr3, 2_i64, i64 &
+          ) - 1_i64))
+    c = Real(arr3, kind = f64)
+    allocate(d(0:2_i64, 0:size(a, 2_i64, i64) - 1_i64, 0:size(a, 1_i64, &
+          i64) - 1_i64))
+    d = reshape([reshape(Int(a, kind = i32), [size(a, 2_i64, i64), size( &
+          a, 1_i64, i64)], order=[2_i64, 1_i64]) ,reshape(Int(c, kind = &
+          i32), [size(c, 2_i64, i64), size(c, 1_i64, i64)], order=[ &
+          2_i64, 1_i64]) ,reshape(Int(b, kind = i32), [size(b, 2_i64, &
+          i64), size(b, 1_i64, i64)], order=[2_i64, 1_i64])], [3_i64, &
+          size(a, 2_i64, i64), size(a, 1_i64, i64)], order=[2_i64, &
+          3_i64, 1_i64])
+    allocate(s(0:2_i64))
+    s = [3_i64, size(d, 2_i64, i64), size(d, 3_i64, i64)]
+    Out_0001 = s(0_i64)
+    Out_0002 = s(1_i64)
+    Out_0003 = s(2_i64)
+    Out_0004 = d(0_i64, 0_i64, 0_i64)
+    Out_0005 = d(0_i64, 0_i64, 1_i64)
+    Out_0006 = d(1_i64, 0_i64, 0_i64)
+    Out_0007 = d(1_i64, 0_i64, 1_i64)
+    Out_0008 = d(2_i64, 0_i64, 0_i64)
+    Out_0009 = d(2_i64, 0_i64, 1_i64)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(s)) then
+      deallocate(s)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0005
+  !........................................
+
+  !........................................
+  subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0006(arr1 &
+        , arr2, arr3, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i32), intent(out) :: Out_0004
+    integer(i32), intent(out) :: Out_0005
+    integer(i32), intent(out) :: Out_0006
+    integer(i32), intent(out) :: Out_0007
+    integer(i32), intent(out) :: Out_0008
+    integer(i32), intent(out) :: Out_0009
+    real(f32), intent(in) :: arr1(0_i64:, 0_i64:)
+    real(f32), intent(in) :: arr2(0_i64:, 0_i64:)
+    real(f32), intent(in) :: arr3(0_i64:, 0_i64:)
+    real(f32), allocatable :: a(:, :)
+    real(f32), allocatable :: b(:, :)
+    real(f32), allocatable :: c(:, :)
+    integer(i32), allocatable :: d(:, :, :)
+    integer(i64), allocatable :: s(:)
+
+    allocate(a(0:size(arr1, 1_i64, i64) - 1_i64, 0:size(arr1, 2_i64, i64 &
+          ) - 1_i64))
+    a = Real(arr1, kind = f32)
+    allocate(b(0:size(arr2, 1_i64, i64) - 1_i64, 0:size(arr2, 2_i64, i64 &
+          ) - 1_i64))
+    b = Real(arr2, kind = f32)
+    allocate(c(0:size(arr3, 1_i64, i64) - 1_i64, 0:size(arr3, 2_i64, i64 &
+          ) - 1_i64))
+    c = Real(arr3, kind = f32)
+    allocate(d(0:2_i64, 0:size(a, 2_i64, i64) - 1_i64, 0:size(a, 1_i64, &
+          i64) - 1_i64))
+    d = reshape([reshape(Int(a, kind = i32), [size(a, 2_i64, i64), size( &
+          a, 1_i64, i64)], order=[2_i64, 1_i64]) ,reshape(Int(c, kind = &
+          i32), [size(c, 2_i64, i64), size(c, 1_i64, i64)], order=[ &
+          2_i64, 1_i64]) ,reshape(Int(b, kind = i32), [size(b, 2_i64, &
+          i64), size(b, 1_i64, i64)], order=[2_i64, 1_i64])], [3_i64, &
+          size(a, 2_i64, i64), size(a, 1_i64, i64)], order=[2_i64, &
+          3_i64, 1_i64])
+    allocate(s(0:2_i64))
+    s = [3_i64, size(d, 2_i64, i64), size(d, 3_i64, i64)]
+    Out_0001 = s(0_i64)
+    Out_0002 = s(1_i64)
+    Out_0003 = s(2_i64)
+    Out_0004 = d(0_i64, 0_i64, 0_i64)
+    Out_0005 = d(0_i64, 0_i64, 1_i64)
+    Out_0006 = d(1_i64, 0_i64, 0_i64)
+    Out_0007 = d(1_i64, 0_i64, 1_i64)
+    Out_0008 = d(2_i64, 0_i64, 0_i64)
+    Out_0009 = d(2_i64, 0_i64, 1_i64)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(s)) then
+      deallocate(s)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0006
+  !........................................
+
+  !........................................
+  subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0007(arr1 &
+        , arr2, arr3, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i32), intent(out) :: Out_0004
+    integer(i32), intent(out) :: Out_0005
+    integer(i32), intent(out) :: Out_0006
+    integer(i32), intent(out) :: Out_0007
+    integer(i32), intent(out) :: Out_0008
+    integer(i32), intent(out) :: Out_0009
+    complex(c32), intent(in) :: arr1(0_i64:, 0_i64:)
+    complex(c32), intent(in) :: arr2(0_i64:, 0_i64:)
+    complex(c32), intent(in) :: arr3(0_i64:, 0_i64:)
+    complex(c32), allocatable :: a(:, :)
+    complex(c32), allocatable :: b(:, :)
+    complex(c32), allocatable :: c(:, :)
+    integer(i32), allocatable :: d(:, :, :)
+    integer(i64), allocatable :: s(:)
+
+    allocate(a(0:size(arr1, 1_i64, i64) - 1_i64, 0:size(arr1, 2_i64, i64 &
+          ) - 1_i64))
+    a = cmplx(arr1, kind = c32)
+    allocate(b(0:size(arr2, 1_i64, i64) - 1_i64, 0:size(arr2, 2_i64, i64 &
+          ) - 1_i64))
+    b = cmplx(arr2, kind = c32)
+    allocate(c(0:size(arr3, 1_i64, i64) - 1_i64, 0:size(arr3, 2_i64, i64 &
+          ) - 1_i64))
+    c = cmplx(arr3, kind = c32)
+    allocate(d(0:2_i64, 0:size(a, 2_i64, i64) - 1_i64, 0:size(a, 1_i64, &
+          i64) - 1_i64))
+    d = reshape([reshape(Int(a, kind = i32), [size(a, 2_i64, i64), size( &
+          a, 1_i64, i64)], order=[2_i64, 1_i64]) ,reshape(Int(c, kind = &
+          i32), [size(c, 2_i64, i64), size(c, 1_i64, i64)], order=[ &
+          2_i64, 1_i64]) ,reshape(Int(b, kind = i32), [size(b, 2_i64, &
+          i64), size(b, 1_i64, i64)], order=[2_i64, 1_i64])], [3_i64, &
+          size(a, 2_i64, i64), size(a, 1_i64, i64)], order=[2_i64, &
+          3_i64, 1_i64])
+    allocate(s(0:2_i64))
+    s = [3_i64, size(d, 2_i64, i64), size(d, 3_i64, i64)]
+    Out_0001 = s(0_i64)
+    Out_0002 = s(1_i64)
+    Out_0003 = s(2_i64)
+    Out_0004 = d(0_i64, 0_i64, 0_i64)
+    Out_0005 = d(0_i64, 0_i64, 1_i64)
+    Out_0006 = d(1_i64, 0_i64, 0_i64)
+    Out_0007 = d(1_i64, 0_i64, 1_i64)
+    Out_0008 = d(2_i64, 0_i64, 0_i64)
+    Out_0009 = d(2_i64, 0_i64, 1_i64)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(s)) then
+      deallocate(s)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0007
+  !........................................
+
+  !........................................
+  subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0008(arr1 &
+        , arr2, arr3, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005, &
+        Out_0006, Out_0007, Out_0008, Out_0009)
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i32), intent(out) :: Out_0004
+    integer(i32), intent(out) :: Out_0005
+    integer(i32), intent(out) :: Out_0006
+    integer(i32), intent(out) :: Out_0007
+    integer(i32), intent(out) :: Out_0008
+    integer(i32), intent(out) :: Out_0009
+    complex(c64), intent(in) :: arr1(0_i64:, 0_i64:)
+    complex(c64), intent(in) :: arr2(0_i64:, 0_i64:)
+    complex(c64), intent(in) :: arr3(0_i64:, 0_i64:)
+    complex(c64), allocatable :: a(:, :)
+    complex(c64), allocatable :: b(:, :)
+    complex(c64), allocatable :: c(:, :)
+    integer(i32), allocatable :: d(:, :, :)
+    integer(i64), allocatable :: s(:)
+
+    allocate(a(0:size(arr1, 1_i64, i64) - 1_i64, 0:size(arr1, 2_i64, i64 &
+          ) - 1_i64))
+    a = cmplx(arr1, kind = c64)
+    allocate(b(0:size(arr2, 1_i64, i64) - 1_i64, 0:size(arr2, 2_i64, i64 &
+          ) - 1_i64))
+    b = cmplx(arr2, kind = c64)
+    allocate(c(0:size(arr3, 1_i64, i64) - 1_i64, 0:size(arr3, 2_i64, i64 &
+          ) - 1_i64))
+    c = cmplx(arr3, kind = c64)
+    allocate(d(0:2_i64, 0:size(a, 2_i64, i64) - 1_i64, 0:size(a, 1_i64, &
+          i64) - 1_i64))
+    d = reshape([reshape(Int(a, kind = i32), [size(a, 2_i64, i64), size( &
+          a, 1_i64, i64)], order=[2_i64, 1_i64]) ,reshape(Int(c, kind = &
+          i32), [size(c, 2_i64, i64), size(c, 1_i64, i64)], order=[ &
+          2_i64, 1_i64]) ,reshape(Int(b, kind = i32), [size(b, 2_i64, &
+          i64), size(b, 1_i64, i64)], order=[2_i64, 1_i64])], [3_i64, &
+          size(a, 2_i64, i64), size(a, 1_i64, i64)], order=[2_i64, &
+          3_i64, 1_i64])
+    allocate(s(0:2_i64))
+    s = [3_i64, size(d, 2_i64, i64), size(d, 3_i64, i64)]
+    Out_0001 = s(0_i64)
+    Out_0002 = s(1_i64)
+    Out_0003 = s(2_i64)
+    Out_0004 = d(0_i64, 0_i64, 0_i64)
+    Out_0005 = d(0_i64, 0_i64, 1_i64)
+    Out_0006 = d(1_i64, 0_i64, 0_i64)
+    Out_0007 = d(1_i64, 0_i64, 1_i64)
+    Out_0008 = d(2_i64, 0_i64, 0_i64)
+    Out_0009 = d(2_i64, 0_i64, 1_i64)
+    if (allocated(b)) then
+      deallocate(b)
+    end if
+    if (allocated(d)) then
+      deallocate(d)
+    end if
+    if (allocated(c)) then
+      deallocate(c)
+    end if
+    if (allocated(s)) then
+      deallocate(s)
+    end if
+    if (allocated(a)) then
+      deallocate(a)
+    end if
+    return
+
+  end subroutine src_dest_diff_sizes_dtype_convert_to_int32_orderF_0008
+  !........................................
+
+end module mod_irfnunpgpqz1
@@ -0,0 +1,11 @@
+#ifndef MOD_ITJSIVU4DEVL_H
+#define MOD_ITJSIVU4DEVL_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_nested_C_array_initialization(t_ndarray x, t_ndarray y, t_ndarray z, t_ndarray a);
+#endif // mod_itjsivu4devl_H
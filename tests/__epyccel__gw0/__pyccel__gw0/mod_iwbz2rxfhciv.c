@@ -0,0 +1,184 @@
+#include "mod_iwbz2rxfhciv.h"
+
+
+/*........................................*/
+int64_t dtype_convert_to_int64_0000(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    c = array_create(2, (int64_t[]){arr.shape[INT64_C(0)], arr.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr, 0);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {c.shape[INT64_C(0)], c.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = c.nd_int64[INT64_C(0)];
+    (*Out_0003) = c.nd_int64[INT64_C(1)];
+    (*Out_0004) = c.nd_int64[c.shape[INT64_C(1)]];
+    (*Out_0005) = c.nd_int64[c.shape[INT64_C(1)] + INT64_C(1)];
+    free_array(&s);
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t dtype_convert_to_int64_0001(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    c = array_create(2, (int64_t[]){arr.shape[INT64_C(0)], arr.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr, 0);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {c.shape[INT64_C(0)], c.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = c.nd_int64[INT64_C(0)];
+    (*Out_0003) = c.nd_int64[INT64_C(1)];
+    (*Out_0004) = c.nd_int64[c.shape[INT64_C(1)]];
+    (*Out_0005) = c.nd_int64[c.shape[INT64_C(1)] + INT64_C(1)];
+    free_array(&s);
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t dtype_convert_to_int64_0002(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    c = array_create(2, (int64_t[]){arr.shape[INT64_C(0)], arr.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr, 0);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {c.shape[INT64_C(0)], c.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = c.nd_int64[INT64_C(0)];
+    (*Out_0003) = c.nd_int64[INT64_C(1)];
+    (*Out_0004) = c.nd_int64[c.shape[INT64_C(1)]];
+    (*Out_0005) = c.nd_int64[c.shape[INT64_C(1)] + INT64_C(1)];
+    free_array(&s);
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t dtype_convert_to_int64_0003(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    c = array_create(2, (int64_t[]){arr.shape[INT64_C(0)], arr.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr, 0);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {c.shape[INT64_C(0)], c.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = c.nd_int64[INT64_C(0)];
+    (*Out_0003) = c.nd_int64[INT64_C(1)];
+    (*Out_0004) = c.nd_int64[c.shape[INT64_C(1)]];
+    (*Out_0005) = c.nd_int64[c.shape[INT64_C(1)] + INT64_C(1)];
+    free_array(&s);
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t dtype_convert_to_int64_0004(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    c = array_create(2, (int64_t[]){arr.shape[INT64_C(0)], arr.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr, 0);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {c.shape[INT64_C(0)], c.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = c.nd_int64[INT64_C(0)];
+    (*Out_0003) = c.nd_int64[INT64_C(1)];
+    (*Out_0004) = c.nd_int64[c.shape[INT64_C(1)]];
+    (*Out_0005) = c.nd_int64[c.shape[INT64_C(1)] + INT64_C(1)];
+    free_array(&s);
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t dtype_convert_to_int64_0005(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    c = array_create(2, (int64_t[]){arr.shape[INT64_C(0)], arr.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr, 0);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {c.shape[INT64_C(0)], c.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = c.nd_int64[INT64_C(0)];
+    (*Out_0003) = c.nd_int64[INT64_C(1)];
+    (*Out_0004) = c.nd_int64[c.shape[INT64_C(1)]];
+    (*Out_0005) = c.nd_int64[c.shape[INT64_C(1)] + INT64_C(1)];
+    free_array(&s);
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t dtype_convert_to_int64_0006(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    c = array_create(2, (int64_t[]){arr.shape[INT64_C(0)], arr.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr, 0);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {c.shape[INT64_C(0)], c.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = c.nd_int64[INT64_C(0)];
+    (*Out_0003) = c.nd_int64[INT64_C(1)];
+    (*Out_0004) = c.nd_int64[c.shape[INT64_C(1)]];
+    (*Out_0005) = c.nd_int64[c.shape[INT64_C(1)] + INT64_C(1)];
+    free_array(&s);
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t dtype_convert_to_int64_0007(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    c = array_create(2, (int64_t[]){arr.shape[INT64_C(0)], arr.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr, 0);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {c.shape[INT64_C(0)], c.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = c.nd_int64[INT64_C(0)];
+    (*Out_0003) = c.nd_int64[INT64_C(1)];
+    (*Out_0004) = c.nd_int64[c.shape[INT64_C(1)]];
+    (*Out_0005) = c.nd_int64[c.shape[INT64_C(1)] + INT64_C(1)];
+    free_array(&s);
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+/*........................................*/
+int64_t dtype_convert_to_int64_0008(t_ndarray arr, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005)
+{
+    t_ndarray c = {.raw_data = NULL};
+    t_ndarray s = {.raw_data = NULL};
+    c = array_create(2, (int64_t[]){arr.shape[INT64_C(0)], arr.shape[INT64_C(1)]}, nd_int64, false, order_c);
+    array_copy_data(&c, arr, 0);
+    s = array_create(1, (int64_t[]){INT64_C(2)}, nd_int64, false, order_c);
+    int64_t Dummy_0000[] = {c.shape[INT64_C(0)], c.shape[INT64_C(1)]};
+    memcpy(&s.nd_int64[INT64_C(0)], Dummy_0000, 2 * s.type_size);
+    (*Out_0001) = INT64_C(2);
+    (*Out_0002) = c.nd_int64[INT64_C(0)];
+    (*Out_0003) = c.nd_int64[INT64_C(1)];
+    (*Out_0004) = c.nd_int64[c.shape[INT64_C(1)]];
+    (*Out_0005) = c.nd_int64[c.shape[INT64_C(1)] + INT64_C(1)];
+    free_array(&s);
+    free_array(&c);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,7 @@
+from numpy import array
+
+def array_float_3d_C_array_initialization_2(a : 'float[::,::,::]'):
+    from numpy import array
+    x = array([[[0.0, 1.0, 2.0, 3.0], [4.0, 5.0, 6.0, 7.0], [8.0, 9.0, 10.0, 11.0]], [[12.0, 13.0, 14.0, 15.0], [16.0, 17.0, 18.0, 19.0], [20.0, 21.0, 22.0, 23.0]]], order='C')
+    a[::,::,::] = x[::,::,::]
+
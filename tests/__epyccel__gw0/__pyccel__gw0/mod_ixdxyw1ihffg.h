@@ -0,0 +1,11 @@
+#ifndef MOD_IXDXYW1IHFFG_H
+#define MOD_IXDXYW1IHFFG_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_2D_3(t_ndarray a);
+#endif // mod_ixdxyw1ihffg_H
@@ -0,0 +1,17 @@
+#include "mod_ixyywozfp20x.h"
+
+
+/*........................................*/
+void array_float_2d_2d_matmul_transpose(t_ndarray A, t_ndarray B, t_ndarray C, t_ndarray out1, t_ndarray out2)
+{
+    t_ndarray Dummy_0000 = {.raw_data = NULL};
+    t_ndarray Dummy_0001 = {.raw_data = NULL};
+    t_ndarray Dummy_0002 = {.raw_data = NULL};
+    transpose_alias_assign(&Dummy_0000, A);
+    numpy_matmul_float64(array_slicing(out1, 2, new_slice(INT64_C(0), out1.shape[INT64_C(0)], INT64_C(1), RANGE), new_slice(INT64_C(0), out1.shape[INT64_C(1)], INT64_C(1), RANGE)), Dummy_0000, B);
+    transpose_alias_assign(&Dummy_0001, C);
+    transpose_alias_assign(&Dummy_0002, A);
+    numpy_matmul_float64(array_slicing(out2, 2, new_slice(INT64_C(0), out2.shape[INT64_C(0)], INT64_C(1), RANGE), new_slice(INT64_C(0), out2.shape[INT64_C(1)], INT64_C(1), RANGE)), Dummy_0001, Dummy_0002);
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_IXYYWOZFP20X_H
+#define MOD_IXYYWOZFP20X_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_transpose(t_ndarray A, t_ndarray B, t_ndarray C, t_ndarray out1, t_ndarray out2);
+#endif // mod_ixyywozfp20x_H
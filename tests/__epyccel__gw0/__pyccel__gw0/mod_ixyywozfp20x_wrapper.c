@@ -0,0 +1,138 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_IXYYWOZFP20X_WRAPPER
+
+#include "mod_ixyywozfp20x_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* array_float_2d_2d_matmul_transpose_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* A_obj;
+    PyObject* B_obj;
+    PyObject* C_obj;
+    PyObject* out1_obj;
+    PyObject* out2_obj;
+    t_ndarray A = {.raw_data = NULL};
+    t_ndarray B = {.raw_data = NULL};
+    t_ndarray C = {.raw_data = NULL};
+    t_ndarray out1 = {.raw_data = NULL};
+    t_ndarray out2 = {.raw_data = NULL};
+    static const char* const kwlist[] = {
+        "A",
+        "B",
+        "C",
+        "out1",
+        "out2",
+        NULL
+    };
+    static PyObject* kwlist_interned[6] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 5, 5, &A_obj, &B_obj, &C_obj, &out1_obj, &out2_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("A", A_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        A = pyarray_to_ndarray(A_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("B", B_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        B = pyarray_to_ndarray(B_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("C", C_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        C = pyarray_to_ndarray(C_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out1", out1_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        out1 = pyarray_to_ndarray(out1_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("out2", out2_obj, NPY_DOUBLE, INT64_C(2), NPY_ARRAY_C_CONTIGUOUS))
+    {
+        out2 = pyarray_to_ndarray(out2_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    array_float_2d_2d_matmul_transpose(A, B, C, out1, out2);
+    free_pointer(&A);
+    free_pointer(&B);
+    free_pointer(&C);
+    free_pointer(&out1);
+    free_pointer(&out2);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_ixyywozfp20x_methods[] = {
+    {
+        "array_float_2d_2d_matmul_transpose",
+        (PyCFunction)array_float_2d_2d_matmul_transpose_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_ixyywozfp20x_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_ixyywozfp20x",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_ixyywozfp20x_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_ixyywozfp20x(void)
+{
+    PyObject* mod;
+    static void* Pymod_ixyywozfp20x_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_ixyywozfp20x_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_ixyywozfp20x_API, "mod_ixyywozfp20x._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_IY4VKCAMOFPR_H
+#define MOD_IY4VKCAMOFPR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f2(t_ndarray x);
+#endif // mod_iy4vkcamofpr_H
@@ -0,0 +1,23 @@
+#include "mod_j0tlelsyq2qw.h"
+
+
+/*........................................*/
+int64_t f(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006, int64_t* Out_0007)
+{
+    vec_int64_t a = {0};
+    a = c_init(vec_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3)});
+    vec_int64_t_push(&a, INT64_C(4));
+    vec_int64_t_push(&a, INT64_C(5));
+    vec_int64_t_push(&a, INT64_C(6));
+    (*Out_0001) = vec_int64_t_size(&a);
+    (*Out_0002) = (*vec_int64_t_at(&a,INT64_C(0)));
+    (*Out_0003) = (*vec_int64_t_at(&a,INT64_C(1)));
+    (*Out_0004) = (*vec_int64_t_at(&a,INT64_C(2)));
+    (*Out_0005) = (*vec_int64_t_at(&a,INT64_C(3)));
+    (*Out_0006) = (*vec_int64_t_at(&a,INT64_C(4)));
+    (*Out_0007) = (*vec_int64_t_at(&a,INT64_C(5)));
+    vec_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,23 @@
+module mod_j0vz4kutaqgk
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i32 => &
+        C_INT32_T , i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int32_1d_scalar_div(x, a) 
+
+    implicit none
+
+    integer(i32), intent(inout) :: x(0_i64:)
+    integer(i32), value :: a
+
+    x(:) = Real(x, kind = f64) / Real(a, kind = f64)
+
+  end subroutine array_int32_1d_scalar_div
+  !........................................
+
+end module mod_j0vz4kutaqgk
@@ -0,0 +1,6 @@
+
+def fused_temporary_used_later(a : 'float[::]', b : 'float[::]'):
+    t = a + b
+    b[::] = t * 2.0
+    a[1::] = t[:-1:]
+
@@ -0,0 +1,12 @@
+#ifndef MOD_J1P53NN44I8U_H
+#define MOD_J1P53NN44I8U_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t tuples_add_homogeneous_variables(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005, int64_t* Out_0006);
+#endif // mod_j1p53nn44i8u_H
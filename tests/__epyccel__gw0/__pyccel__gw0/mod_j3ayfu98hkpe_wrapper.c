@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_J3AYFU98HKPE_WRAPPER
+
+#include "mod_j3ayfu98hkpe_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* get_default_str_keys_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    Out_0001 = get_default_str_keys();
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_j3ayfu98hkpe_methods[] = {
+    {
+        "get_default_str_keys",
+        (PyCFunction)get_default_str_keys_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_j3ayfu98hkpe_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_j3ayfu98hkpe",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_j3ayfu98hkpe_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_j3ayfu98hkpe(void)
+{
+    PyObject* mod;
+    static void* Pymod_j3ayfu98hkpe_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_j3ayfu98hkpe_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_j3ayfu98hkpe_API, "mod_j3ayfu98hkpe._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
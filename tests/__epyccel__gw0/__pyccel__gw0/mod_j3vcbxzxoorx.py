@@ -0,0 +1,7 @@
+from numpy import int32
+
+def array_int32_in_bool_out_1d_complex_3d_expr(x : 'int32[::]', y : 'int32[::]', ri : 'bool[::]'):
+    from numpy import int32, empty, full
+    z = full((3), int32(5), dtype = int32)
+    ri[::] = x//y * x > z
+
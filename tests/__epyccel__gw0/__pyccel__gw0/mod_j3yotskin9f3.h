@@ -0,0 +1,12 @@
+#ifndef MOD_J3YOTSKIN9F3_H
+#define MOD_J3YOTSKIN9F3_H
+
+#include <math.h>
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arr_arange_6(int64_t* Out_0001, double* Out_0002, double* Out_0003);
+#endif // mod_j3yotskin9f3_H
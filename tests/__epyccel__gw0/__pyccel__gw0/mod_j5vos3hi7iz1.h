@@ -0,0 +1,11 @@
+#ifndef MOD_J5VOS3HI7IZ1_H
+#define MOD_J5VOS3HI7IZ1_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f2(t_ndarray x, int64_t* n, int64_t* m, double* Out_0001, double* Out_0002);
+#endif // mod_j5vos3hi7iz1_H
@@ -0,0 +1,40 @@
+#ifndef MOD_J6TOAIO8TVTT_WRAPPER_H
+#define MOD_J6TOAIO8TVTT_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_J6TOAIO8TVTT_WRAPPER
+
+void bind_c_set_num_threads(int64_t);
+
+#else
+
+static void** Pymod_j6toaio8tvtt_API;
+
+
+/*........................................*/
+static int mod_j6toaio8tvtt_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_j6toaio8tvtt_API = (void**)PyCapsule_Import("mod_j6toaio8tvtt._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_j6toaio8tvtt_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_J6TOAIO8TVTT_WRAPPER_H
@@ -0,0 +1,40 @@
+module mod_j71rkz3239jq
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine omp_nowait(x, y, z) 
+
+    implicit none
+
+    integer(i64), intent(in) :: x(0_i64:)
+    integer(i64), intent(inout) :: y(0_i64:)
+    real(f64), intent(inout) :: z(0_i64:)
+    integer(i64) :: i
+    integer(i64) :: j
+
+    !$omp parallel
+    !$omp do
+    do i = 0_i64, 999_i64
+      y(i) = x(i) * 2_i64
+    end do
+    !$omp end do nowait
+    !$omp do
+    do j = 0_i64, 999_i64
+      z(j) = Real(x(j), kind = f64) / 2.0_f64
+    end do
+    !$omp end do nowait
+    !$omp end parallel
+    !____CommentBlock____!
+    !bypass issue #468   !
+    !____________________!
+
+  end subroutine omp_nowait
+  !........................................
+
+end module mod_j71rkz3239jq
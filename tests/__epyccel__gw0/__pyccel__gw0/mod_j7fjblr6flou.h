@@ -0,0 +1,11 @@
+#ifndef MOD_J7FJBLR6FLOU_H
+#define MOD_J7FJBLR6FLOU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_1d_matmul_transpose(t_ndarray A, t_ndarray x, t_ndarray out);
+#endif // mod_j7fjblr6flou_H
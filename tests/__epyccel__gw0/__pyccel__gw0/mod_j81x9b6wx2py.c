@@ -0,0 +1,25 @@
+#include "mod_j81x9b6wx2py.h"
+
+
+/*........................................*/
+int64_t fizzbuzz_sum_with_continue(int64_t fizz, int64_t buzz, int64_t max_val)
+{
+    int64_t i;
+    int64_t fizzbuzz_sum;
+    fizzbuzz_sum = INT64_C(0);
+    for (i = INT64_C(1); i < max_val + INT64_C(1); i += INT64_C(1))
+    {
+        if (pyc_modulo(i, fizz) != INT64_C(0))
+        {
+            continue;
+        }
+        if (pyc_modulo(i, buzz) != INT64_C(0))
+        {
+            continue;
+        }
+        fizzbuzz_sum += i;
+    }
+    return fizzbuzz_sum;
+}
+/*........................................*/
+
@@ -0,0 +1,12 @@
+#ifndef MOD_J81X9B6WX2PY_H
+#define MOD_J81X9B6WX2PY_H
+
+#include <math.h>
+#include "pyc_math_c.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t fizzbuzz_sum_with_continue(int64_t fizz, int64_t buzz, int64_t max_val);
+#endif // mod_j81x9b6wx2py_H
@@ -0,0 +1,115 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_J81X9B6WX2PY_WRAPPER
+
+#include "mod_j81x9b6wx2py_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* fizzbuzz_sum_with_continue_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* fizz_obj;
+    PyObject* buzz_obj;
+    PyObject* max_val_obj;
+    int64_t fizz;
+    int64_t buzz;
+    int64_t max_val;
+    int64_t fizzbuzz_sum;
+    PyObject* fizzbuzz_sum_obj;
+    static const char* const kwlist[] = {
+        "fizz",
+        "buzz",
+        "max_val",
+        NULL
+    };
+    static PyObject* kwlist_interned[4] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 3, 3, &fizz_obj, &buzz_obj, &max_val_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(fizz_obj))
+    {
+        fizz = PyInt64_to_Int64(fizz_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument fizz");
+        return NULL;
+    }
+    if (PyIs_NativeInt(buzz_obj))
+    {
+        buzz = PyInt64_to_Int64(buzz_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument buzz");
+        return NULL;
+    }
+    if (PyIs_NativeInt(max_val_obj))
+    {
+        max_val = PyInt64_to_Int64(max_val_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument max_val");
+        return NULL;
+    }
+    fizzbuzz_sum = fizzbuzz_sum_with_continue(fizz, buzz, max_val);
+    fizzbuzz_sum_obj = Int64_to_PyLong(&fizzbuzz_sum);
+    return fizzbuzz_sum_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_j81x9b6wx2py_methods[] = {
+    {
+        "fizzbuzz_sum_with_continue",
+        (PyCFunction)fizzbuzz_sum_with_continue_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_j81x9b6wx2py_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_j81x9b6wx2py",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_j81x9b6wx2py_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_j81x9b6wx2py(void)
+{
+    PyObject* mod;
+    static void* Pymod_j81x9b6wx2py_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_j81x9b6wx2py_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_j81x9b6wx2py_API, "mod_j81x9b6wx2py._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
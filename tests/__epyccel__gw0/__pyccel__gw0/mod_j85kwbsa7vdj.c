@@ -0,0 +1,15 @@
+#include "mod_j85kwbsa7vdj.h"
+
+
+/*........................................*/
+int64_t pop_as_arg(void)
+{
+    vec_int64_t a = {0};
+    int64_t Out_0001;
+    a = c_init(vec_int64_t, {INT64_C(1), INT64_C(3), INT64_C(45)});
+    Out_0001 = vec_int64_t_pull_elem(&a, vec_int64_t_pull_elem(&a, INT64_C(0)));
+    vec_int64_t_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
@@ -0,0 +1,7 @@
+
+def tuple_variable_index():
+    a = 1
+    Dummy_0000 = (1, 2, 3)
+    b = Dummy_0000[a]
+    return b
+
@@ -0,0 +1,102 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_J8DC1ESF0OUR_WRAPPER
+
+#include "mod_j8dc1esf0our_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_copy_int_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* size_obj;
+    int64_t size;
+    PyObject* Out_0001_obj;
+    int64_t Out_0001;
+    PyObject* a_obj;
+    int64_t a;
+    PyObject* b_obj;
+    int64_t b;
+    PyObject* c_obj;
+    int64_t c;
+    PyObject* d_obj;
+    int64_t d;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    bind_c_copy_int(&size, &Out_0001, &a, &b, &c, &d);
+    size_obj = Int64_to_PyLong(&size);
+    Out_0001_obj = Int64_to_PyLong(&Out_0001);
+    a_obj = Int64_to_PyLong(&a);
+    b_obj = Int64_to_PyLong(&b);
+    c_obj = Int64_to_PyLong(&c);
+    d_obj = Int64_to_PyLong(&d);
+    Out_obj = Py_BuildValue("OOOOOO", size_obj, Out_0001_obj, a_obj, b_obj, c_obj, d_obj);
+    Py_DECREF(size_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(a_obj);
+    Py_DECREF(b_obj);
+    Py_DECREF(c_obj);
+    Py_DECREF(d_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_j8dc1esf0our_methods[] = {
+    {
+        "copy_int",
+        (PyCFunction)bind_c_copy_int_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_j8dc1esf0our_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_j8dc1esf0our",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_j8dc1esf0our_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_j8dc1esf0our(void)
+{
+    PyObject* mod;
+    static void* Pymod_j8dc1esf0our_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_j8dc1esf0our_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_j8dc1esf0our_API, "mod_j8dc1esf0our._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,11 @@
+#ifndef MOD_JAB32QGB6SSC_H
+#define MOD_JAB32QGB6SSC_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void f9(t_ndarray x);
+#endif // mod_jab32qgb6ssc_H
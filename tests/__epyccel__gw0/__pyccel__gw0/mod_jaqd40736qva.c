@@ -0,0 +1,16 @@
+#include "mod_jaqd40736qva.h"
+
+
+/*........................................*/
+int64_t add_int(void)
+{
+    hset_int64_t a = {0};
+    int64_t Out_0001;
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(3), INT64_C(45)});
+    hset_int64_t_push(&a, INT64_C(4));
+    Out_0001 = hset_int64_t_size(&a);
+    hset_int64_t_drop(&a);
+    return Out_0001;
+}
+/*........................................*/
+
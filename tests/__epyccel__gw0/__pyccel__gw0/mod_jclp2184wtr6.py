@@ -0,0 +1,14 @@
+
+def str_values():
+    a = {'alpha': 'a string value which is longer than the small string buffer', 'beta': 'another string value which does not fit in the small string buffer'}
+    b = a.pop('alpha')
+    c = a.pop('gamma', 'a default string value which is also longer than the buffer')
+    d = a.get('beta')
+    e = a.get('delta', 'yet another default string value longer than the buffer')
+    f = a.setdefault('beta', 'an unused default value which is long enough to be allocated')
+    g = a.setdefault('epsilon', 'a new value which is inserted into the dictionary by setdefault')
+    h = a.copy()
+    a.clear()
+    i = h.pop('epsilon')
+    return len(b),len(c),len(d),len(e),len(f),len(g),len(h),len(i)
+
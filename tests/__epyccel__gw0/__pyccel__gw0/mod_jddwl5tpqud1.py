@@ -0,0 +1,8 @@
+from numpy import float64
+
+def arrs_similar_shapes_0():
+    from numpy import zeros, shape
+    a = zeros((10), dtype = float64)
+    b = a[2:4:] + a[4:6:]
+    return 2
+
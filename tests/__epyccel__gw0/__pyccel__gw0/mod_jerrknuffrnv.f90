@@ -0,0 +1,26 @@
+module mod_jerrknuffrnv
+
+  use, intrinsic :: ISO_C_Binding, only : i32 => C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function get_num_threads() result(n)
+
+    use omp_lib, only: omp_get_num_threads
+
+    implicit none
+
+    integer(i32) :: n
+
+    !$omp parallel
+    n = omp_get_num_threads()
+    !$omp end parallel
+    return
+
+  end function get_num_threads
+  !........................................
+
+end module mod_jerrknuffrnv
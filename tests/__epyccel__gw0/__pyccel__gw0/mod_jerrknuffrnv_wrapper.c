@@ -0,0 +1,79 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_JERRKNUFFRNV_WRAPPER
+
+#include "mod_jerrknuffrnv_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_get_num_threads_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    int32_t n;
+    PyObject* n_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    n = bind_c_get_num_threads();
+    n_obj = Int32_to_NumpyLong(&n);
+    return n_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_jerrknuffrnv_methods[] = {
+    {
+        "get_num_threads",
+        (PyCFunction)bind_c_get_num_threads_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_jerrknuffrnv_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_jerrknuffrnv",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_jerrknuffrnv_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_jerrknuffrnv(void)
+{
+    PyObject* mod;
+    static void* Pymod_jerrknuffrnv_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_jerrknuffrnv_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_jerrknuffrnv_API, "mod_jerrknuffrnv._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
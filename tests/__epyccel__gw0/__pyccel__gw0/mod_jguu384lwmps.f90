@@ -0,0 +1,26 @@
+module mod_jguu384lwmps
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use Set_real8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine Discard_wrong_arg(se) 
+
+    implicit none
+
+    type(Set_real8), intent(out) :: se
+    integer(i64) :: Dummy_0000
+
+    se = Set_real8([4.7_f64, 1.3_f64, 8.2_f64])
+    Dummy_0000 = se % erase_value(8.6_f64)
+    return
+
+  end subroutine Discard_wrong_arg
+  !........................................
+
+end module mod_jguu384lwmps
@@ -0,0 +1,11 @@
+#ifndef MOD_JH4FC4C9FY4Q_H
+#define MOD_JH4FC4C9FY4Q_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t arrs_similar_shapes_0(void);
+#endif // mod_jh4fc4c9fy4q_H
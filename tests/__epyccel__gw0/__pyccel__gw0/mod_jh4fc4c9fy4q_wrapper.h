@@ -0,0 +1,40 @@
+#ifndef MOD_JH4FC4C9FY4Q_WRAPPER_H
+#define MOD_JH4FC4C9FY4Q_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_jh4fc4c9fy4q.h"
+
+
+#ifdef MOD_JH4FC4C9FY4Q_WRAPPER
+
+
+#else
+
+static void** Pymod_jh4fc4c9fy4q_API;
+
+
+/*........................................*/
+static int mod_jh4fc4c9fy4q_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_jh4fc4c9fy4q_API = (void**)PyCapsule_Import("mod_jh4fc4c9fy4q._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_jh4fc4c9fy4q_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_JH4FC4C9FY4Q_WRAPPER_H
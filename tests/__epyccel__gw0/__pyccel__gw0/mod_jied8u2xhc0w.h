@@ -0,0 +1,11 @@
+#ifndef MOD_JIED8U2XHC0W_H
+#define MOD_JIED8U2XHC0W_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f(void);
+#endif // mod_jied8u2xhc0w_H
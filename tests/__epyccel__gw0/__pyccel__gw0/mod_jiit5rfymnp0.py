@@ -0,0 +1,5 @@
+
+def f():
+    x = sum(i - j for i in range(0, 10, 1) for j in range(0, 7, 1))
+    return x
+
@@ -0,0 +1,10 @@
+from numpy import array
+
+def pop_last_element():
+    from numpy import array
+    array1 = array([[1, 2, 3], [4, 5, 6]], order='C')
+    array2 = array([[7, 8, 9], [10, 11, 12]], order='C')
+    array3 = array([[13, 14, 15], [16, 17, 18]], order='C')
+    a = [array1, array2, array3]
+    return a.pop()
+
@@ -0,0 +1,23 @@
+module mod_jlp8ht5bax1f
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , i32 => &
+        C_INT32_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine array_int32_1d_mul(x, y) 
+
+    implicit none
+
+    integer(i32), intent(inout) :: x(0_i64:)
+    integer(i32), intent(in) :: y(0_i64:)
+
+    x(:) = x(:) * y
+
+  end subroutine array_int32_1d_mul
+  !........................................
+
+end module mod_jlp8ht5bax1f
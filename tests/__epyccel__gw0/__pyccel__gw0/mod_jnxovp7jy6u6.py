@@ -0,0 +1,5 @@
+
+def f1():
+    from numpy import pi
+    return pi
+
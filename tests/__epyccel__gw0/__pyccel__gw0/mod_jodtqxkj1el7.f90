@@ -0,0 +1,32 @@
+module mod_jodtqxkj1el7
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine g(x, y, Out_0001, Out_0002, Out_0003, Out_0004, Out_0005) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    integer(i64), intent(out) :: Out_0002
+    integer(i64), intent(out) :: Out_0003
+    integer(i64), intent(out) :: Out_0004
+    integer(i64), intent(out) :: Out_0005
+    integer(i64), value :: x
+    integer(i64), value :: y
+
+    Out_0001 = x
+    Out_0002 = y
+    Out_0003 = y
+    Out_0004 = y
+    Out_0005 = x
+    return
+
+  end subroutine g
+  !........................................
+
+end module mod_jodtqxkj1el7
@@ -0,0 +1,33 @@
+module mod_jpvavi2osb09
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function f() result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), allocatable :: x(:, :)
+
+    allocate(x(0:6_i64, 0:2_i64))
+    x = 0_i64
+    if (any(size(x) /= [5_i64, 4_i64])) then
+      deallocate(x)
+      allocate(x(0:4_i64, 0:3_i64))
+    end if
+    x = 1_i64
+    Out_0001 = sum(x)
+    if (allocated(x)) then
+      deallocate(x)
+    end if
+    return
+
+  end function f
+  !........................................
+
+end module mod_jpvavi2osb09
@@ -0,0 +1,77 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_JQEIKW8F938W_WRAPPER
+
+#include "mod_jqeikw8f938w_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_p_func_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    bind_c_p_func();
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_jqeikw8f938w_methods[] = {
+    {
+        "p_func",
+        (PyCFunction)bind_c_p_func_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_jqeikw8f938w_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_jqeikw8f938w",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_jqeikw8f938w_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_jqeikw8f938w(void)
+{
+    PyObject* mod;
+    static void* Pymod_jqeikw8f938w_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_jqeikw8f938w_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_jqeikw8f938w_API, "mod_jqeikw8f938w._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
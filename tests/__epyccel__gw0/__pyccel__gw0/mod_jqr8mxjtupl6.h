@@ -0,0 +1,20 @@
+#ifndef MOD_JQR8MXJTUPL6_H
+#define MOD_JQR8MXJTUPL6_H
+
+#include <stdint.h>
+#include <stdlib.h>
+#ifndef _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+#define i_type hmap_int64_t_double
+#define i_key int64_t
+#define i_val double
+#define i_more
+#include <stc/hmap.h>
+#include <Dict_extensions.h>
+#endif // _TOOLS_DICT_HMAP_INT64_T_DOUBLE
+
+
+
+
+double pop_element(void);
+#endif // mod_jqr8mxjtupl6_H
@@ -0,0 +1,22 @@
+#include "mod_jrm8bs0imd5r.h"
+
+
+/*........................................*/
+int64_t f(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    vec_int64_t a = {0};
+    int64_t i;
+    a = c_init(vec_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3)});
+    for (i = INT64_C(0); i < INT64_C(1000); i += INT64_C(1))
+    {
+        vec_int64_t_push(&a, i);
+    }
+    vec_int64_t_push(&a, INT64_C(1000));
+    (*Out_0001) = vec_int64_t_size(&a);
+    (*Out_0002) = (*vec_int64_t_at(&a,vec_int64_t_size(&a) - INT64_C(1)));
+    (*Out_0003) = (*vec_int64_t_at(&a,vec_int64_t_size(&a) - INT64_C(2)));
+    vec_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_JVNCSVWT5IXP_H
+#define MOD_JVNCSVWT5IXP_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void set_num_threads(int64_t n);
+#endif // mod_jvncsvwt5ixp_H
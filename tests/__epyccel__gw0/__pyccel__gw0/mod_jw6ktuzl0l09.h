@@ -0,0 +1,11 @@
+#ifndef MOD_JW6KTUZL0L09_H
+#define MOD_JW6KTUZL0L09_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_1d_slice_6(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004);
+#endif // mod_jw6ktuzl0l09_H
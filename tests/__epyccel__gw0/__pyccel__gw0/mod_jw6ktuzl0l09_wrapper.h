@@ -0,0 +1,42 @@
+#ifndef MOD_JW6KTUZL0L09_WRAPPER_H
+#define MOD_JW6KTUZL0L09_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_jw6ktuzl0l09.h"
+
+
+#ifdef MOD_JW6KTUZL0L09_WRAPPER
+
+
+#else
+
+static void** Pymod_jw6ktuzl0l09_API;
+
+
+/*........................................*/
+static int mod_jw6ktuzl0l09_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_jw6ktuzl0l09_API = (void**)PyCapsule_Import("mod_jw6ktuzl0l09._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_jw6ktuzl0l09_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_JW6KTUZL0L09_WRAPPER_H
@@ -0,0 +1,29 @@
+module mod_k0zeeqgjiwzs
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+  use pyc_tools_f90
+  use Set_complex8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function clear_complex() result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    type(Set_complex8) :: se
+
+    se = Set_complex8([(0.0_f64, 3.0_f64), (0.0_f64, 6.0_f64), (0.0_f64, &
+          2.0_f64)])
+    call se % clear()
+    Out_0001 = se % size()
+    return
+
+  end function clear_complex
+  !........................................
+
+end module mod_k0zeeqgjiwzs
@@ -0,0 +1,20 @@
+#include "mod_k1vqwctdrv9p.h"
+
+
+/*........................................*/
+int64_t tuple_name_clash(int64_t* ai_0, double complex* Out_0001, bool* Out_0002, double* Out_0003)
+{
+    double complex ai_0_0001;
+    bool ai_1;
+    double ai_2;
+    ai_0_0001 = (1.0 + 2.0 * _Complex_I);
+    ai_1 = 0;
+    ai_2 = 10.4;
+    (*ai_0) = INT64_C(44);
+    (*Out_0001) = ai_0_0001;
+    (*Out_0002) = ai_1;
+    (*Out_0003) = ai_2;
+    return 0;
+}
+/*........................................*/
+
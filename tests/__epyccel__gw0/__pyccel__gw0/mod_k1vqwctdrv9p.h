@@ -0,0 +1,12 @@
+#ifndef MOD_K1VQWCTDRV9P_H
+#define MOD_K1VQWCTDRV9P_H
+
+#include <complex.h>
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t tuple_name_clash(int64_t* ai_0, double complex* Out_0001, bool* Out_0002, double* Out_0003);
+#endif // mod_k1vqwctdrv9p_H
@@ -0,0 +1,96 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_K1VQWCTDRV9P_WRAPPER
+
+#include "mod_k1vqwctdrv9p_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include <complex.h>
+#include <stdbool.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* tuple_name_clash_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* ai_0_obj;
+    int64_t ai_0;
+    PyObject* Out_0001_obj;
+    double complex Out_0001;
+    PyObject* Out_0002_obj;
+    bool Out_0002;
+    PyObject* Out_0003_obj;
+    double Out_0003;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    tuple_name_clash(&ai_0, &Out_0001, &Out_0002, &Out_0003);
+    ai_0_obj = Int64_to_PyLong(&ai_0);
+    Out_0001_obj = Complex128_to_PyComplex(&Out_0001);
+    Out_0002_obj = Bool_to_PyBool(&Out_0002);
+    Out_0003_obj = Double_to_PyDouble(&Out_0003);
+    Out_obj = Py_BuildValue("OOOO", ai_0_obj, Out_0001_obj, Out_0002_obj, Out_0003_obj);
+    Py_DECREF(ai_0_obj);
+    Py_DECREF(Out_0001_obj);
+    Py_DECREF(Out_0002_obj);
+    Py_DECREF(Out_0003_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_k1vqwctdrv9p_methods[] = {
+    {
+        "tuple_name_clash",
+        (PyCFunction)tuple_name_clash_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_k1vqwctdrv9p_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_k1vqwctdrv9p",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_k1vqwctdrv9p_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_k1vqwctdrv9p(void)
+{
+    PyObject* mod;
+    static void* Pymod_k1vqwctdrv9p_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_k1vqwctdrv9p_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_k1vqwctdrv9p_API, "mod_k1vqwctdrv9p._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
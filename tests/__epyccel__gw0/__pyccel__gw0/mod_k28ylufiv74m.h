@@ -0,0 +1,11 @@
+#ifndef MOD_K28YLUFIV74M_H
+#define MOD_K28YLUFIV74M_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_int32_1d_scalar_sub(t_ndarray x, int32_t a);
+#endif // mod_k28ylufiv74m_H
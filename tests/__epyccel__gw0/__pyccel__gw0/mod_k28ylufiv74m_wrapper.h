@@ -0,0 +1,42 @@
+#ifndef MOD_K28YLUFIV74M_WRAPPER_H
+#define MOD_K28YLUFIV74M_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+#include "mod_k28ylufiv74m.h"
+
+
+#ifdef MOD_K28YLUFIV74M_WRAPPER
+
+
+#else
+
+static void** Pymod_k28ylufiv74m_API;
+
+
+/*........................................*/
+static int mod_k28ylufiv74m_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_k28ylufiv74m_API = (void**)PyCapsule_Import("mod_k28ylufiv74m._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_k28ylufiv74m_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_K28YLUFIV74M_WRAPPER_H
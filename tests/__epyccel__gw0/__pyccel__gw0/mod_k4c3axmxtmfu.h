@@ -0,0 +1,11 @@
+#ifndef MOD_K4C3AXMXTMFU_H
+#define MOD_K4C3AXMXTMFU_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t enumerate_on_1d_array_with_tuple(t_ndarray z);
+#endif // mod_k4c3axmxtmfu_H
@@ -0,0 +1,92 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_K4C3AXMXTMFU_WRAPPER
+
+#include "mod_k4c3axmxtmfu_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* enumerate_on_1d_array_with_tuple_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* z_obj;
+    t_ndarray z = {.raw_data = NULL};
+    int64_t res;
+    PyObject* res_obj;
+    static const char* const kwlist[] = {
+        "z",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &z_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("z", z_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        z = pyarray_to_ndarray(z_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    res = enumerate_on_1d_array_with_tuple(z);
+    free_pointer(&z);
+    res_obj = Int64_to_PyLong(&res);
+    return res_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_k4c3axmxtmfu_methods[] = {
+    {
+        "enumerate_on_1d_array_with_tuple",
+        (PyCFunction)enumerate_on_1d_array_with_tuple_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_k4c3axmxtmfu_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_k4c3axmxtmfu",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_k4c3axmxtmfu_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_k4c3axmxtmfu(void)
+{
+    PyObject* mod;
+    static void* Pymod_k4c3axmxtmfu_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_k4c3axmxtmfu_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_k4c3axmxtmfu_API, "mod_k4c3axmxtmfu._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,42 @@
+#ifndef MOD_K4R4TSU7TO4Q_WRAPPER_H
+#define MOD_K4R4TSU7TO4Q_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "cwrapper_ndarrays.h"
+#include "ndarrays.h"
+
+
+#ifdef MOD_K4R4TSU7TO4Q_WRAPPER
+
+void bind_c_fused_shifted_slices(void*, int64_t, int64_t, void*, int64_t, int64_t);
+
+#else
+
+static void** Pymod_k4r4tsu7to4q_API;
+
+
+/*........................................*/
+static int mod_k4r4tsu7to4q_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_k4r4tsu7to4q_API = (void**)PyCapsule_Import("mod_k4r4tsu7to4q._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_k4r4tsu7to4q_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_K4R4TSU7TO4Q_WRAPPER_H
@@ -0,0 +1,11 @@
+#ifndef MOD_K4VU73TJI3AP_H
+#define MOD_K4VU73TJI3AP_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_loopdiff(t_ndarray x, t_ndarray y, t_ndarray out);
+#endif // mod_k4vu73tji3ap_H
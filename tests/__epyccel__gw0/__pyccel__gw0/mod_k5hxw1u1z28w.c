@@ -0,0 +1,18 @@
+#include "mod_k5hxw1u1z28w.h"
+
+
+/*........................................*/
+int32_t test_omp_get_active_level(void)
+{
+    int32_t active_level_vars;
+    #pragma omp parallel
+    {
+        #pragma omp parallel
+        {
+            active_level_vars = omp_get_active_level();
+        }
+    }
+    return active_level_vars;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_K5HXW1U1Z28W_H
+#define MOD_K5HXW1U1Z28W_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int32_t test_omp_get_active_level(void);
+#endif // mod_k5hxw1u1z28w_H
@@ -0,0 +1,17 @@
+from numpy import array
+
+def f():
+    from numpy import array
+    array1 = array([[1, 2, 3], [4, 5, 6]], order='C')
+    array2 = array([[7, 8, 9], [10, 11, 12]], order='C')
+    array3 = array([[13, 14, 15], [16, 17, 18]], order='C')
+    array4 = array([[5, 4, 66], [69, 2, 180]], order='C')
+    array5 = array([[13, 14, 15], [6, 27, 0]], order='C')
+    array6 = array([[13, 1, 5], [16, 17, 18]], order='C')
+    a = [array1, array2]
+    a.insert(-100, array3)
+    a.insert(0, array4)
+    a.insert(100, array5)
+    a.insert(-3, array6)
+    return a
+
@@ -0,0 +1,12 @@
+#include "mod_k6e7pau6toz7.h"
+
+
+/*........................................*/
+double complex f22(double complex a)
+{
+    double complex b;
+    b = a;
+    return b;
+}
+/*........................................*/
+
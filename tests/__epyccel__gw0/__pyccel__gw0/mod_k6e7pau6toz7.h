@@ -0,0 +1,10 @@
+#ifndef MOD_K6E7PAU6TOZ7_H
+#define MOD_K6E7PAU6TOZ7_H
+
+#include <complex.h>
+#include <stdlib.h>
+
+
+
+double complex f22(double complex a);
+#endif // mod_k6e7pau6toz7_H
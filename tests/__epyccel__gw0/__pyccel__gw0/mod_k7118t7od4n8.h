@@ -0,0 +1,11 @@
+#ifndef MOD_K7118T7OD4N8_H
+#define MOD_K7118T7OD4N8_H
+
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f15(bool a, int8_t b, int16_t c, int32_t d, int64_t e);
+#endif // mod_k7118t7od4n8_H
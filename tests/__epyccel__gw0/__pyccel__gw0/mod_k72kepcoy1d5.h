@@ -0,0 +1,11 @@
+#ifndef MOD_K72KEPCOY1D5_H
+#define MOD_K72KEPCOY1D5_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_F_2D_2(t_ndarray a);
+#endif // mod_k72kepcoy1d5_H
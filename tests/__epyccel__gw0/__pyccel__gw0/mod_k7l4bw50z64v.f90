@@ -0,0 +1,33 @@
+module mod_k7l4bw50z64v
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Set_integer8_mod
+  use Set_integer8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function union_int() result(d)
+
+    implicit none
+
+    integer(i64) :: d
+    type(Set_integer8) :: a
+    type(Set_integer8) :: b
+    type(Set_integer8) :: Dummy_0000
+
+    a = Set_integer8([1_i64, 2_i64])
+    b = Set_integer8([2_i64])
+    Dummy_0000 = Set_integer8(a)
+    call Dummy_0000 % merge(a)
+    call Dummy_0000 % merge(b)
+    d = Set_integer8_pop(Dummy_0000)
+
+    return
+
+  end function union_int
+  !........................................
+
+end module mod_k7l4bw50z64v
@@ -0,0 +1,4 @@
+
+def array_int32_2d_F_sub(x : 'int32[::,::](order=F)', y : 'int32[::,::](order=F)'):
+    x[::,::] -= y
+
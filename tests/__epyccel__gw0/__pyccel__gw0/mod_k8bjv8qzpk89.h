@@ -0,0 +1,11 @@
+#ifndef MOD_K8BJV8QZPK89_H
+#define MOD_K8BJV8QZPK89_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t array_2d_C_slice_11(t_ndarray a, int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003, int64_t* Out_0004, int64_t* Out_0005);
+#endif // mod_k8bjv8qzpk89_H
@@ -0,0 +1,11 @@
+#ifndef MOD_K8TNNFPCUH1Y_H
+#define MOD_K8TNNFPCUH1Y_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_F_add(t_ndarray x, t_ndarray y);
+#endif // mod_k8tnnfpcuh1y_H
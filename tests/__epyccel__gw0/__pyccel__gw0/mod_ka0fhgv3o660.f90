@@ -0,0 +1,26 @@
+module mod_ka0fhgv3o660
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+  use Vector_integer8_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  function pop_last_element() result(Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    type(Vector_integer8) :: a
+
+    a = Vector_integer8([1_i64, 3_i64, 45_i64])
+    Out_0001 = a%of(a % size() - 1_i64 + 1_i64)
+    call a % pop_back()
+    return
+
+  end function pop_last_element
+  !........................................
+
+end module mod_ka0fhgv3o660
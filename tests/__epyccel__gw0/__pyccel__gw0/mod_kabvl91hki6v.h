@@ -0,0 +1,11 @@
+#ifndef MOD_KABVL91HKI6V_H
+#define MOD_KABVL91HKI6V_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+void array_float_2d_2d_matmul_operator(t_ndarray A, t_ndarray B, t_ndarray out);
+#endif // mod_kabvl91hki6v_H
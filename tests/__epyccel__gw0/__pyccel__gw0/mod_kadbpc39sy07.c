@@ -0,0 +1,19 @@
+#include "mod_kadbpc39sy07.h"
+
+
+/*........................................*/
+int64_t set_ptr(int64_t* Out_0001, int64_t* Out_0002)
+{
+    hset_int64_t a = {0};
+    hset_int64_t* b = {0};
+    int64_t Dummy_0000;
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3), INT64_C(4), INT64_C(5), INT64_C(6), INT64_C(7), INT64_C(8)});
+    b = &a;
+    Dummy_0000 = hset_int64_t_pop(b);
+    (*Out_0001) = hset_int64_t_size(&a);
+    (*Out_0002) = hset_int64_t_size(b);
+    hset_int64_t_drop(&a);
+    return 0;
+}
+/*........................................*/
+
@@ -0,0 +1,28 @@
+module mod_kae9y1w14xw0
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  function multi_layer_index(x, start, stop_0001, step, idx) result( &
+        Out_0001)
+
+    implicit none
+
+    integer(i64) :: Out_0001
+    integer(i64), intent(in) :: x(0_i64:)
+    integer(i64), value :: start
+    integer(i64), value :: stop_0001
+    integer(i64), value :: step
+    integer(i64), value :: idx
+
+    Out_0001 = x(start + step * idx)
+    return
+
+  end function multi_layer_index
+  !........................................
+
+end module mod_kae9y1w14xw0
@@ -0,0 +1,141 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_KAE9Y1W14XW0_WRAPPER
+
+#include "mod_kae9y1w14xw0_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_multi_layer_index_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* x_obj;
+    PyObject* start_obj;
+    PyObject* stop_0001_obj;
+    PyObject* step_obj;
+    PyObject* idx_obj;
+    void* x_data = NULL;
+    int64_t x_shape[1];
+    int64_t x_strides[1];
+    int64_t start;
+    int64_t stop_0001;
+    int64_t step;
+    int64_t idx;
+    int64_t Out_0001;
+    PyObject* Out_0001_obj;
+    static const char* const kwlist[] = {
+        "x",
+        "start",
+        "stop_0001",
+        "step",
+        "idx",
+        NULL
+    };
+    static PyObject* kwlist_interned[6] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 5, 5, &x_obj, &start_obj, &stop_0001_obj, &step_obj, &idx_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("x", x_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        x_data = PyArray_DATA((PyArrayObject*)(x_obj));
+        get_strides_and_shape_from_numpy_array(x_obj, x_shape, x_strides, 1);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(start_obj))
+    {
+        start = PyInt64_to_Int64(start_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument start");
+        return NULL;
+    }
+    if (PyIs_NativeInt(stop_0001_obj))
+    {
+        stop_0001 = PyInt64_to_Int64(stop_0001_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument stop_0001");
+        return NULL;
+    }
+    if (PyIs_NativeInt(step_obj))
+    {
+        step = PyInt64_to_Int64(step_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument step");
+        return NULL;
+    }
+    if (PyIs_NativeInt(idx_obj))
+    {
+        idx = PyInt64_to_Int64(idx_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument idx");
+        return NULL;
+    }
+    Out_0001 = bind_c_multi_layer_index(x_data, x_shape[INT64_C(0)], x_strides[INT64_C(0)], start, stop_0001, step, idx);
+    Out_0001_obj = Int64_to_NumpyLong(&Out_0001);
+    return Out_0001_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_kae9y1w14xw0_methods[] = {
+    {
+        "multi_layer_index",
+        (PyCFunction)bind_c_multi_layer_index_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_kae9y1w14xw0_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_kae9y1w14xw0",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_kae9y1w14xw0_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_kae9y1w14xw0(void)
+{
+    PyObject* mod;
+    static void* Pymod_kae9y1w14xw0_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_kae9y1w14xw0_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_kae9y1w14xw0_API, "mod_kae9y1w14xw0._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
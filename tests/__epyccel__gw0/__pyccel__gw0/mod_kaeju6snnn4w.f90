@@ -0,0 +1,44 @@
+module mod_kaeju6snnn4w
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f(a, b, c, d) 
+
+    implicit none
+
+    integer(i64), intent(out) :: a
+    integer(i64), intent(out) :: b
+    integer(i64), intent(out) :: c
+    integer(i64), intent(out) :: d
+    integer(i64) :: a_0001
+    integer(i64) :: b_0001
+    integer(i64) :: a_0002
+    integer(i64) :: b_0002
+    integer(i64) :: a_0003
+    integer(i64) :: b_0003
+    integer(i64) :: a_0004
+    integer(i64) :: b_0004
+
+    a_0001 = 2_i64
+    b_0001 = 4_i64
+    a = a_0001 + b_0001
+    a_0002 = 3_i64
+    b_0002 = 5_i64
+    b = a_0002 + b_0002
+    a_0003 = 6_i64
+    b_0003 = 5_i64
+    c = a_0003 + b_0003
+    a_0004 = 3_i64
+    b_0004 = 4_i64
+    d = a_0004 + b_0004
+    return
+
+  end subroutine f
+  !........................................
+
+end module mod_kaeju6snnn4w
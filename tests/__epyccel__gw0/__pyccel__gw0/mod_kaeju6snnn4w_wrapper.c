@@ -0,0 +1,94 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_KAEJU6SNNN4W_WRAPPER
+
+#include "mod_kaeju6snnn4w_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* bind_c_f_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* a_obj;
+    int64_t a;
+    PyObject* b_obj;
+    int64_t b;
+    PyObject* c_obj;
+    int64_t c;
+    PyObject* d_obj;
+    int64_t d;
+    PyObject* Out_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    bind_c_f(&a, &b, &c, &d);
+    a_obj = Int64_to_PyLong(&a);
+    b_obj = Int64_to_PyLong(&b);
+    c_obj = Int64_to_PyLong(&c);
+    d_obj = Int64_to_PyLong(&d);
+    Out_obj = Py_BuildValue("OOOO", a_obj, b_obj, c_obj, d_obj);
+    Py_DECREF(a_obj);
+    Py_DECREF(b_obj);
+    Py_DECREF(c_obj);
+    Py_DECREF(d_obj);
+    return Out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_kaeju6snnn4w_methods[] = {
+    {
+        "f",
+        (PyCFunction)bind_c_f_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_kaeju6snnn4w_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_kaeju6snnn4w",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_kaeju6snnn4w_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_kaeju6snnn4w(void)
+{
+    PyObject* mod;
+    static void* Pymod_kaeju6snnn4w_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_kaeju6snnn4w_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_kaeju6snnn4w_API, "mod_kaeju6snnn4w._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,40 @@
+#ifndef MOD_KAEJU6SNNN4W_WRAPPER_H
+#define MOD_KAEJU6SNNN4W_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_KAEJU6SNNN4W_WRAPPER
+
+int64_t bind_c_f(int64_t*, int64_t*, int64_t*, int64_t*);
+
+#else
+
+static void** Pymod_kaeju6snnn4w_API;
+
+
+/*........................................*/
+static int mod_kaeju6snnn4w_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_kaeju6snnn4w_API = (void**)PyCapsule_Import("mod_kaeju6snnn4w._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_kaeju6snnn4w_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_KAEJU6SNNN4W_WRAPPER_H
@@ -0,0 +1,31 @@
+#include "mod_kbth4541662f.h"
+
+
+/*........................................*/
+double array_float_2d_sum_stack_array(void)
+{
+    double array_dummy[INT64_C(100)];
+    t_ndarray a = (t_ndarray){
+        .nd_double=array_dummy,
+        .shape={INT64_C(10), INT64_C(10)},
+        .nd=2,
+        .type=nd_double,
+        .is_view=false
+    };
+    stack_array_init(&a);
+    int64_t i;
+    int64_t j;
+    double s;
+    array_fill((double)0.0, a);
+    s = 0.0;
+    for (i = INT64_C(0); i < INT64_C(10); i += INT64_C(1))
+    {
+        for (j = INT64_C(0); j < INT64_C(10); j += INT64_C(1))
+        {
+            s += a.nd_double[i * a.shape[INT64_C(1)] + j];
+        }
+    }
+    return s;
+}
+/*........................................*/
+
@@ -0,0 +1,11 @@
+#ifndef MOD_KBTH4541662F_H
+#define MOD_KBTH4541662F_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+double array_float_2d_sum_stack_array(void);
+#endif // mod_kbth4541662f_H
@@ -0,0 +1,40 @@
+#ifndef MOD_KBTH4541662F_WRAPPER_H
+#define MOD_KBTH4541662F_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+#include "mod_kbth4541662f.h"
+
+
+#ifdef MOD_KBTH4541662F_WRAPPER
+
+
+#else
+
+static void** Pymod_kbth4541662f_API;
+
+
+/*........................................*/
+static int mod_kbth4541662f_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_kbth4541662f_API = (void**)PyCapsule_Import("mod_kbth4541662f._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_kbth4541662f_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_KBTH4541662F_WRAPPER_H
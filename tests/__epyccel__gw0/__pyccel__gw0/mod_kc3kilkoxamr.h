@@ -0,0 +1,11 @@
+#ifndef MOD_KC3KILKOXAMR_H
+#define MOD_KC3KILKOXAMR_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray f(void);
+#endif // mod_kc3kilkoxamr_H
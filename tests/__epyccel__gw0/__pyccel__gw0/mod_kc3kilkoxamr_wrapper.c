@@ -0,0 +1,81 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_KC3KILKOXAMR_WRAPPER
+
+#include "mod_kc3kilkoxamr_wrapper.h"
+#include <stdlib.h>
+#include "ndarrays.h"
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    t_ndarray x = {.raw_data = NULL};
+    PyObject* x_obj;
+    static const char* const kwlist[] = {
+        NULL
+    };
+    static PyObject* kwlist_interned[1] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 0, 0))
+    {
+        return NULL;
+    }
+    x = f();
+    x_obj = ndarray_to_pyarray(x);
+    free_pointer(&x);
+    return x_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_kc3kilkoxamr_methods[] = {
+    {
+        "f",
+        (PyCFunction)f_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_kc3kilkoxamr_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_kc3kilkoxamr",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_kc3kilkoxamr_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_kc3kilkoxamr(void)
+{
+    PyObject* mod;
+    static void* Pymod_kc3kilkoxamr_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_kc3kilkoxamr_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_kc3kilkoxamr_API, "mod_kc3kilkoxamr._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
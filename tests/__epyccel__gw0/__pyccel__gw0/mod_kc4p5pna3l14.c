@@ -0,0 +1,12 @@
+#include "mod_kc4p5pna3l14.h"
+
+
+/*........................................*/
+int64_t p_lose(void)
+{
+    int64_t lose;
+    lose = -INT64_C(10);
+    return lose;
+}
+/*........................................*/
+
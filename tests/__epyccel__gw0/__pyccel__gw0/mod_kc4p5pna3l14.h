@@ -0,0 +1,10 @@
+#ifndef MOD_KC4P5PNA3L14_H
+#define MOD_KC4P5PNA3L14_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t p_lose(void);
+#endif // mod_kc4p5pna3l14_H
@@ -0,0 +1,36 @@
+module mod_kdnggbnbezv3
+
+  use, intrinsic :: ISO_C_Binding, only : f64 => C_DOUBLE , i64 => &
+        C_INT64_T
+  use Set_real8_mod
+  use Set_real8_extensions_mod
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine init_with_set(Out_0001, Out_0002, Out_0003, Out_0004) 
+
+    implicit none
+
+    integer(i64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64), intent(out) :: Out_0003
+    real(f64), intent(out) :: Out_0004
+    type(Set_real8) :: b
+
+    b = Set_real8([4.6_f64, 7.9_f64, 2.5_f64])
+    Out_0001 = b % size()
+    Out_0002 = Set_real8_pop(b)
+
+    Out_0003 = Set_real8_pop(b)
+
+    Out_0004 = Set_real8_pop(b)
+
+    return
+
+  end subroutine init_with_set
+  !........................................
+
+end module mod_kdnggbnbezv3
@@ -0,0 +1,22 @@
+#include "mod_kel8twunwzc3.h"
+
+
+/*........................................*/
+int64_t fibonacci(int64_t n)
+{
+    int64_t y;
+    int64_t i;
+    int64_t z;
+    int64_t x;
+    x = INT64_C(0);
+    y = INT64_C(1);
+    for (i = INT64_C(0); i < n; i += INT64_C(1))
+    {
+        z = x + y;
+        x = y;
+        y = z;
+    }
+    return x;
+}
+/*........................................*/
+
@@ -0,0 +1,10 @@
+#ifndef MOD_KEL8TWUNWZC3_H
+#define MOD_KEL8TWUNWZC3_H
+
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t fibonacci(int64_t n);
+#endif // mod_kel8twunwzc3_H
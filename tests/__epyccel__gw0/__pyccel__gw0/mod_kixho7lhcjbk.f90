@@ -0,0 +1,30 @@
+module mod_kixho7lhcjbk
+
+  use, intrinsic :: ISO_C_Binding, only : i64 => C_INT64_T , f64 => &
+        C_DOUBLE
+
+  implicit none
+
+  contains
+
+  !........................................
+  subroutine f(Out_0001, Out_0002) 
+
+    implicit none
+
+    real(f64), intent(out) :: Out_0001
+    real(f64), intent(out) :: Out_0002
+    real(f64) :: arr(0_i64:3_i64)
+    integer(i64) :: i
+
+    do i = 0_i64, size(arr, kind=i64) - 1_i64
+      arr(i) = 3.14_f64
+    end do
+    Out_0001 = arr(0_i64)
+    Out_0002 = arr(size(arr, kind=i64) - 1_i64)
+    return
+
+  end subroutine f
+  !........................................
+
+end module mod_kixho7lhcjbk
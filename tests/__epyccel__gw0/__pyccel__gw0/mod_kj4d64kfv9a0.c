@@ -0,0 +1,24 @@
+#include "mod_kj4d64kfv9a0.h"
+
+
+/*........................................*/
+int64_t intersection_int(int64_t* Out_0001, int64_t* Out_0002, int64_t* Out_0003)
+{
+    hset_int64_t a = {0};
+    hset_int64_t b = {0};
+    hset_int64_t c = {0};
+    a = c_init(hset_int64_t, {INT64_C(1), INT64_C(2), INT64_C(3)});
+    b = c_init(hset_int64_t, {INT64_C(2), INT64_C(3), INT64_C(4)});
+    hset_int64_t_reserve(&c, hset_int64_t_size(&a));
+    c = hset_int64_t_clone(a);
+    hset_int64_t_intersection_update(&c, &b);
+    (*Out_0001) = hset_int64_t_size(&c);
+    (*Out_0002) = hset_int64_t_pop(&c);
+    (*Out_0003) = hset_int64_t_pop(&c);
+    hset_int64_t_drop(&b);
+    hset_int64_t_drop(&a);
+    hset_int64_t_drop(&c);
+    return 0;
+}
+/*........................................*/
+
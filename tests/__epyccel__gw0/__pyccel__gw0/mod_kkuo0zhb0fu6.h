@@ -0,0 +1,11 @@
+#ifndef MOD_KKUO0ZHB0FU6_H
+#define MOD_KKUO0ZHB0FU6_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+t_ndarray array_view_steps_C_1D_2(t_ndarray a);
+#endif // mod_kkuo0zhb0fu6_H
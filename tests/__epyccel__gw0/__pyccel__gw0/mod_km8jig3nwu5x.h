@@ -0,0 +1,11 @@
+#ifndef MOD_KM8JIG3NWU5X_H
+#define MOD_KM8JIG3NWU5X_H
+
+#include "ndarrays.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t omp_long_line(t_ndarray long_variable_1_oiwed423rnoij21d4kojklm, t_ndarray long_variable_2_oiwedqwrnoij2asxaxnjkna, t_ndarray long_variable_3_oiweqxhnoijaqed34023423, t_ndarray long_variable_4_oiweaxaijaqedqd34023423, t_ndarray long_variable_5_oiwed423rnoic3242ewdx35);
+#endif // mod_km8jig3nwu5x_H
@@ -0,0 +1,140 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_KM8JIG3NWU5X_WRAPPER
+
+#include "mod_km8jig3nwu5x_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+#include "ndarrays.h"
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* omp_long_line_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* long_variable_1_oiwed423rnoij21d4kojklm_obj;
+    PyObject* long_variable_2_oiwedqwrnoij2asxaxnjkna_obj;
+    PyObject* long_variable_3_oiweqxhnoijaqed34023423_obj;
+    PyObject* long_variable_4_oiweaxaijaqedqd34023423_obj;
+    PyObject* long_variable_5_oiwed423rnoic3242ewdx35_obj;
+    t_ndarray long_variable_1_oiwed423rnoij21d4kojklm = {.raw_data = NULL};
+    t_ndarray long_variable_2_oiwedqwrnoij2asxaxnjkna = {.raw_data = NULL};
+    t_ndarray long_variable_3_oiweqxhnoijaqed34023423 = {.raw_data = NULL};
+    t_ndarray long_variable_4_oiweaxaijaqedqd34023423 = {.raw_data = NULL};
+    t_ndarray long_variable_5_oiwed423rnoic3242ewdx35 = {.raw_data = NULL};
+    int64_t func_result;
+    PyObject* func_result_obj;
+    static const char* const kwlist[] = {
+        "long_variable_1_oiwed423rnoij21d4kojklm",
+        "long_variable_2_oiwedqwrnoij2asxaxnjkna",
+        "long_variable_3_oiweqxhnoijaqed34023423",
+        "long_variable_4_oiweaxaijaqedqd34023423",
+        "long_variable_5_oiwed423rnoic3242ewdx35",
+        NULL
+    };
+    static PyObject* kwlist_interned[6] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 5, 5, &long_variable_1_oiwed423rnoij21d4kojklm_obj, &long_variable_2_oiwedqwrnoij2asxaxnjkna_obj, &long_variable_3_oiweqxhnoijaqed34023423_obj, &long_variable_4_oiweaxaijaqedqd34023423_obj, &long_variable_5_oiwed423rnoic3242ewdx35_obj))
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_1_oiwed423rnoij21d4kojklm", long_variable_1_oiwed423rnoij21d4kojklm_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_1_oiwed423rnoij21d4kojklm = pyarray_to_ndarray(long_variable_1_oiwed423rnoij21d4kojklm_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_2_oiwedqwrnoij2asxaxnjkna", long_variable_2_oiwedqwrnoij2asxaxnjkna_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_2_oiwedqwrnoij2asxaxnjkna = pyarray_to_ndarray(long_variable_2_oiwedqwrnoij2asxaxnjkna_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_3_oiweqxhnoijaqed34023423", long_variable_3_oiweqxhnoijaqed34023423_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_3_oiweqxhnoijaqed34023423 = pyarray_to_ndarray(long_variable_3_oiweqxhnoijaqed34023423_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_4_oiweaxaijaqedqd34023423", long_variable_4_oiweaxaijaqedqd34023423_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_4_oiweaxaijaqedqd34023423 = pyarray_to_ndarray(long_variable_4_oiweaxaijaqedqd34023423_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    if (pyarray_check("long_variable_5_oiwed423rnoic3242ewdx35", long_variable_5_oiwed423rnoic3242ewdx35_obj, NPY_INT64, INT64_C(1), NO_ORDER_CHECK))
+    {
+        long_variable_5_oiwed423rnoic3242ewdx35 = pyarray_to_ndarray(long_variable_5_oiwed423rnoic3242ewdx35_obj);
+    }
+    else
+    {
+        return NULL;
+    }
+    func_result = omp_long_line(long_variable_1_oiwed423rnoij21d4kojklm, long_variable_2_oiwedqwrnoij2asxaxnjkna, long_variable_3_oiweqxhnoijaqed34023423, long_variable_4_oiweaxaijaqedqd34023423, long_variable_5_oiwed423rnoic3242ewdx35);
+    free_pointer(&long_variable_1_oiwed423rnoij21d4kojklm);
+    free_pointer(&long_variable_2_oiwedqwrnoij2asxaxnjkna);
+    free_pointer(&long_variable_3_oiweqxhnoijaqed34023423);
+    free_pointer(&long_variable_4_oiweaxaijaqedqd34023423);
+    free_pointer(&long_variable_5_oiwed423rnoic3242ewdx35);
+    func_result_obj = Int64_to_PyLong(&func_result);
+    return func_result_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_km8jig3nwu5x_methods[] = {
+    {
+        "omp_long_line",
+        (PyCFunction)omp_long_line_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_km8jig3nwu5x_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_km8jig3nwu5x",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_km8jig3nwu5x_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_km8jig3nwu5x(void)
+{
+    PyObject* mod;
+    static void* Pymod_km8jig3nwu5x_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_km8jig3nwu5x_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_km8jig3nwu5x_API, "mod_km8jig3nwu5x._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
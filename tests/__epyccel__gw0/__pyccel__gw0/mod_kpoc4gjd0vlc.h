@@ -0,0 +1,11 @@
+#ifndef MOD_KPOC4GJD0VLC_H
+#define MOD_KPOC4GJD0VLC_H
+
+#include "omp.h"
+#include <stdint.h>
+#include <stdlib.h>
+
+
+
+int64_t f1(int64_t i);
+#endif // mod_kpoc4gjd0vlc_H
@@ -0,0 +1,91 @@
+#define PY_ARRAY_UNIQUE_SYMBOL CWRAPPER_ARRAY_API
+#define MOD_KPOC4GJD0VLC_WRAPPER
+
+#include "mod_kpoc4gjd0vlc_wrapper.h"
+#include <stdlib.h>
+#include <stdint.h>
+
+
+/*........................................*/
+
+
+/*........................................*/
+
+/*........................................*/
+static PyObject* f1_wrapper(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* i_obj;
+    int64_t i;
+    int64_t out;
+    PyObject* out_obj;
+    static const char* const kwlist[] = {
+        "i",
+        NULL
+    };
+    static PyObject* kwlist_interned[2] = {NULL};
+    if (!pyccel_parse_fastcall(args, nargs, kwnames, kwlist, kwlist_interned, 1, 1, &i_obj))
+    {
+        return NULL;
+    }
+    if (PyIs_NativeInt(i_obj))
+    {
+        i = PyInt64_to_Int64(i_obj);
+    }
+    else
+    {
+        PyErr_SetString(PyExc_TypeError, "Expected an argument of type int for argument i");
+        return NULL;
+    }
+    out = f1(i);
+    out_obj = Int64_to_PyLong(&out);
+    return out_obj;
+}
+/*........................................*/
+
+/*........................................*/
+
+static PyMethodDef mod_kpoc4gjd0vlc_methods[] = {
+    {
+        "f1",
+        (PyCFunction)f1_wrapper,
+        METH_FASTCALL | METH_KEYWORDS,
+        ""
+    },
+    { NULL, NULL, 0, NULL}
+};
+
+/*........................................*/
+
+static struct PyModuleDef mod_kpoc4gjd0vlc_module = {
+    PyModuleDef_HEAD_INIT,
+    /* name of module */
+    "mod_kpoc4gjd0vlc",
+    /* module documentation, may be NULL */
+    NULL,
+    /* size of per-interpreter state of the module, or -1 if the module keeps state in global variables. */
+    0,
+    mod_kpoc4gjd0vlc_methods,
+};
+
+/*........................................*/
+
+PyMODINIT_FUNC PyInit_mod_kpoc4gjd0vlc(void)
+{
+    PyObject* mod;
+    static void* Pymod_kpoc4gjd0vlc_API[0];
+    PyObject* c_api_object_0001;
+    mod = PyModule_Create(&mod_kpoc4gjd0vlc_module);
+    if (mod == NULL)
+    {
+        return NULL;
+    }
+    c_api_object_0001 = PyCapsule_New((void *)Pymod_kpoc4gjd0vlc_API, "mod_kpoc4gjd0vlc._C_API", NULL);
+    if (PyModule_AddObject(mod, "_C_API", c_api_object_0001) < INT64_C(0))
+    {
+        Py_DECREF(mod);
+        return NULL;
+    }
+    Py_INCREF(c_api_object_0001);
+    import_array();
+    return mod;
+}
@@ -0,0 +1,40 @@
+#ifndef MOD_KQMY46AVI3CE_WRAPPER_H
+#define MOD_KQMY46AVI3CE_WRAPPER_H
+
+#include "numpy_version.h"
+#include "numpy/arrayobject.h"
+#include "cwrapper.h"
+
+
+#ifdef MOD_KQMY46AVI3CE_WRAPPER
+
+void bind_c_set_num_threads(int64_t);
+
+#else
+
+static void** Pymod_kqmy46avi3ce_API;
+
+
+/*........................................*/
+static int mod_kqmy46avi3ce_import(void)
+{
+    PyObject* current_path;
+    PyObject* stash_path;
+    current_path = PySys_GetObject("path");
+    stash_path = PyList_GetItem(current_path, 0);
+    Py_INCREF(stash_path);
+    if (PyList_SetItem(current_path, 0, PyUnicode_FromString("/root/package/tests/__epyccel__gw0")) == -INT64_C(1))
+    {
+        return -1;
+    }
+    Pymod_kqmy46avi3ce_API = (void**)PyCapsule_Import("mod_kqmy46avi3ce._C_API", 0);
+    if (PyList_SetItem(current_path, 0, stash_path) == -INT64_C(1))
+    {
+        return -1;
+    }
+    return Pymod_kqmy46avi3ce_API != NULL ? 0 : -1;
+}
+/*........................................*/
+
+#endif
+#endif // MOD_KQMY46AVI3CE_WRAPPER_H
@@ -0,0 +1,21 @@
+#ifndef MOD_KR12IESTVGP5_H
+#define MOD_KR12IESTVGP5_H
+
+#include "ndarrays.h"
+#include <stdbool.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+
+
+int64_t dtype_convert_to_bool_0000(t_ndarray arr, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005);
+int64_t dtype_convert_to_bool_0001(t_ndarray arr, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005);
+int64_t dtype_convert_to_bool_0002(t_ndarray arr, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005);
+int64_t dtype_convert_to_bool_0003(t_ndarray arr, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005);
+int64_t dtype_convert_to_bool_0004(t_ndarray arr, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005);
+int64_t dtype_convert_to_bool_0005(t_ndarray arr, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005);
+int64_t dtype_convert_to_bool_0006(t_ndarray arr, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005);
+int64_t dtype_convert_to_bool_0007(t_ndarray arr, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005);
+int64_t dtype_convert_to_bool_0008(t_ndarray arr, int64_t* Out_0001, bool* Out_0002, bool* Out_0003, bool* Out_0004, bool* Out_0005);
+#endif // mod_kr12iestvgp5_H